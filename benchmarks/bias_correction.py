@@ -0,0 +1,88 @@
+"""Cost of moving a preintegrated window to a new bias
+
+Re-integrating the window with the preintegrate kernel costs O(window), the
+first order correction with the jacobians carried by preintegrate_jac costs one
+preintegrate_correct call whatever the window. The error is that of the
+correction against re-integration, for bias changes of increasing size.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.integration import preintegrate, preintegrate_jac, preintegrate_correct
+from se23.pose23_array import Pose23_SE23Array
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ImuPreint, ImuPreintJac, Cov99
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+preintegrate_jac = FuncWrapper.wrap(preintegrate_jac, carry="preint_prev")
+preintegrate_correct = FuncWrapper.wrap(preintegrate_correct)
+
+EPS = 1e-12
+DT = 1e-3
+noise = np.array(
+    ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2)).to_storage()
+)
+preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+carry = np.array(preint.to_storage())
+carry_jac = np.array(ImuPreintJac.from_preint(preint).to_storage())
+
+
+def main():
+    FuncWrapper.compile_and_import()
+    rng = np.random.default_rng(0)
+    z_imu_raw = np.tile([0.5, -0.3, 0.8, 1.0, 0.5, 9.81], (10000, 1))
+    z_imu_raw += rng.normal(scale=0.1, size=z_imu_raw.shape)
+
+    print(f"{'kernel':<22} {'ops':>6}")
+    for func in (preintegrate, preintegrate_jac, preintegrate_correct):
+        print(f"{func.name:<22} {func.op_count:>6}")
+
+    print(f"\n{'window':>7} {'reintegrate us':>15} {'correct us':>11} {'speedup':>8}")
+    bias_delta = np.full((1, 6), 1e-3)
+    for n in (10, 100, 1000, 10000):
+        z_imu_est, dt = z_imu_raw[:n], np.full(n, DT)
+        out = preintegrate_jac.call_c_scan(noise, carry_jac, z_imu_est, dt)[None]
+        t_scan = timeit(
+            lambda: preintegrate.call_c_scan(noise, carry, z_imu_est - bias_delta, dt),
+            number=20,
+        )
+        t_correct = timeit(
+            lambda: preintegrate_correct.call_c_batch(out, bias_delta), number=20
+        )
+        print(
+            f"{n:>7} {t_scan / 20 * 1e6:>15.2f} {t_correct / 20 * 1e6:>11.2f}"
+            f" {t_scan / t_correct:>8.1f}"
+        )
+
+    n = 1000
+    z_imu_est, dt = z_imu_raw[:n], np.full(n, DT)
+    out = preintegrate_jac.call_c_scan(noise, carry_jac, z_imu_est, dt)
+    upsilon = Pose23_SE23Array.from_storage(out[None, :10])
+    print(f"\n{n} samples, error of the correction against re-integration")
+    print(f"{'|bias delta|':>12} {'corrected':>10} {'uncorrected':>12}")
+    for scale in (1e-4, 1e-3, 1e-2, 1e-1):
+        bias_delta = rng.normal(size=6)
+        bias_delta *= scale / np.linalg.norm(bias_delta)
+        expected = preintegrate.call_c_scan(noise, carry, z_imu_est - bias_delta, dt)
+        expected = Pose23_SE23Array.from_storage(expected[None, :10])
+        corrected = preintegrate_correct.call_c_batch(out[None], bias_delta[None])
+        corrected = Pose23_SE23Array.from_storage(corrected["upsilon"])
+        errors = [
+            np.linalg.norm(pose.local_coordinates(expected, EPS))
+            for pose in (corrected, upsilon)
+        ]
+        print(f"{scale:>12.0e} {errors[0]:>10.1e} {errors[1]:>12.1e}")
+
+
+if __name__ == "__main__":
+    main()
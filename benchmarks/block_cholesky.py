@@ -0,0 +1,64 @@
+"""BlockCholesky against a dense numpy.linalg.solve of the normal equations
+
+The Hessian of a window of n keyframes is block tridiagonal with 9x9 blocks of
+Pose23_SE23, or 15x15 with the bias. symbolic is the one time analysis in the
+constructor, factor and solve is what every Gauss-Newton iteration pays.
+Dense solves of more than DENSE_MAX rows are skipped, their matrix alone would
+take gigabytes.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from se23.block_cholesky import BlockCholesky, to_dense
+
+NS = (10, 30, 100, 300, 1000)
+BLOCKS = (9, 15)
+DENSE_MAX = 9000
+
+
+def tridiagonal(n: int, b: int, rng: np.random.Generator):
+    cholesky = BlockCholesky.banded(n, b, 1)
+    J = rng.normal(size=(len(cholesky.pairs), b, b))
+    blocks = 0.1 * J @ J.transpose(0, 2, 1)
+    blocks[0::2] += n * b * np.eye(b)
+    return cholesky, blocks, rng.normal(size=n * b)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(
+        f"{'b':>3} {'n':>5} {'symbolic':>9} {'factor':>9} {'solve':>9}"
+        f" {'dense':>9} {'speedup':>8}  ms"
+    )
+    for b in BLOCKS:
+        for n in NS:
+            cholesky, blocks, g = tridiagonal(n, b, rng)
+            number = max(1, 300 // n)
+            symbolic = timeit(lambda: BlockCholesky.banded(n, b, 1), number=number)
+            factor = timeit(lambda: cholesky.factor(blocks), number=number)
+            solve = timeit(lambda: cholesky.solve(g), number=number)
+            symbolic, factor, solve = (t / number for t in (symbolic, factor, solve))
+            x = cholesky.solve(g).ravel()
+            if n * b <= DENSE_MAX:
+                H = to_dense(n, b, cholesky.pairs, blocks)
+                dense = timeit(lambda: np.linalg.solve(H, g), number=1)
+                assert np.allclose(x, np.linalg.solve(H, g), atol=1e-10)
+                dense_str = f"{dense * 1e3:>9.1f} {dense / (factor + solve):>8.1f}"
+                del H
+            else:
+                dense_str = f"{'-':>9} {'-':>8}"
+            print(
+                f"{b:>3} {n:>5} {symbolic * 1e3:>9.2f} {factor * 1e3:>9.2f}"
+                f" {solve * 1e3:>9.2f} {dense_str}"
+            )
+
+
+if __name__ == "__main__":
+    main()
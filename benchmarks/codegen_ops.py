@@ -0,0 +1,69 @@
+"""Ops of the generated kernels without and with common subexpression elimination
+
+preintegrate and preintegrate_sqrt propagate the covariance through the sparse
+factors of the transition matrix A. The _dense variants multiply A out first,
+like the kernels did before, to show what the sparsity is worth.
+"""
+
+import functools
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+import symforce.symbolic as sf
+from symforce.geo import Matrix
+
+from codegen.get_code import FuncWrapper
+from se23 import pose23_kernels
+from se23.integration import preintegrate, preintegrate_sqrt, preintegrate_terms
+from states import ImuNoise, ImuPreint, ImuPreintSqrt, ZImuEst, CovSqrt99
+
+
+def preintegrate_dense(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreint,
+    z_imu_est: ZImuEst,
+    dt: sf.Scalar,
+) -> ImuPreint:
+    """preintegrate with A multiplied out"""
+    upsilon_new, A, G = preintegrate_terms(preint_prev.upsilon, z_imu_est, dt)
+    A = functools.reduce(Matrix.__mul__, A)
+    Q_i = (imu_noise.cov * dt).congruence(G)
+    return ImuPreint(upsilon_new, preint_prev.cov.congruence(A) + Q_i)
+
+
+def preintegrate_sqrt_dense(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreintSqrt,
+    z_imu_est: ZImuEst,
+    dt: sf.Scalar,
+) -> ImuPreintSqrt:
+    """preintegrate_sqrt with A multiplied out"""
+    upsilon_new, A, G = preintegrate_terms(preint_prev.upsilon, z_imu_est, dt)
+    A = functools.reduce(Matrix.__mul__, A)
+    S = imu_noise.cov_sqrt.mat * sf.sqrt(dt)
+    cov_sqrt = CovSqrt99.qr_update(A * preint_prev.cov_sqrt.mat, G * S)
+    return ImuPreintSqrt(upsilon_new, cov_sqrt)
+
+
+def main():
+    for func in (
+        preintegrate,
+        preintegrate_dense,
+        preintegrate_sqrt,
+        preintegrate_sqrt_dense,
+        pose23_kernels.pose23_compose,
+        pose23_kernels.pose23_inverse,
+        pose23_kernels.pose23_exp,
+        pose23_kernels.pose23_log,
+        pose23_kernels.pose23_retract,
+        pose23_kernels.pose23_local_coordinates,
+    ):
+        FuncWrapper.wrap(func)
+    print(FuncWrapper.ops_report())
+
+
+if __name__ == "__main__":
+    main()
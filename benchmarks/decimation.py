@@ -0,0 +1,117 @@
+"""Accuracy and throughput of coalescing K samples in front of preintegrate
+
+The accuracy is the difference between preintegrate_decimated and the full rate
+preintegrate_batch over one second of 4 kHz samples, for smooth motion and for
+white gyro and accl samples (the worst case for the coning and sculling terms).
+The throughput compares the full rate preintegrate kernel scan with the
+ImuDecimator, in numpy and with the coalesce kernels, followed by the
+preintegrate_delta kernel scan. ops is the op count per sample of the coalesce
+kernel and the share of preintegrate_delta.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.batch_integration import preintegrate_batch
+from se23.decimation import ImuDecimator, preintegrate_decimated
+from se23.integration import preintegrate, preintegrate_delta, coalesce_kernel
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ImuBias, ImuPreint, Cov99
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+preintegrate_delta = FuncWrapper.wrap(preintegrate_delta, carry="preint_prev")
+KERNEL_KS = (4, 8, 16, 32)
+coalesce_kernels = {k: FuncWrapper.wrap(coalesce_kernel(k)) for k in KERNEL_KS}
+
+EPS = 1e-12
+RATE = 4000
+KS = (1, 2, 4, 8, 16, 32)
+imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+imu_bias = ImuBias(Vector3(0, 0, 0), Vector3(0, 0, 0))
+preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+
+
+def profiles(n: int):
+    rng = np.random.default_rng(0)
+    time = np.arange(n) / RATE
+    smooth_gyro = np.stack([np.sin(2 * np.pi * f * time + f) for f in (1, 2, 3)], 1)
+    smooth_accl = smooth_gyro[:, ::-1] * 2 + [0, 0, 9.81]
+    yield "smooth", smooth_gyro, smooth_accl
+    yield "white", rng.normal(size=(n, 3)), rng.normal(scale=3.0, size=(n, 3))
+
+
+def accuracy():
+    print(f"one second at {RATE} Hz, error against the full rate")
+    print(f"{'motion':>8} {'k':>3} {'rot':>9} {'v':>9} {'t':>9} {'cov rel':>9}")
+    for name, gyro, accl in profiles(RATE):
+        args = (imu_noise, preint, gyro, accl, 1 / RATE)
+        expected = preintegrate_batch(*args, EPS)
+        for k in KS:
+            result = preintegrate_decimated(*args, k, EPS)
+            xi = np.array(
+                result.upsilon.local_coordinates(expected.upsilon, EPS), float
+            )
+            cov, cov_expected = result.cov.to_numpy(), expected.cov.to_numpy()
+            cov_error = np.linalg.norm(cov - cov_expected) / np.linalg.norm(
+                cov_expected
+            )
+            errors = [np.linalg.norm(xi[i : i + 3]) for i in (0, 3, 6)]
+            print(
+                f"{name:>8} {k:>3}"
+                + "".join(f" {e:>9.1e}" for e in (*errors, cov_error))
+            )
+
+
+def throughput(n: int = 400000):
+    FuncWrapper.compile_and_import()
+    noise = np.array(imu_noise.to_storage(), dtype=np.float64)
+    carry = np.array(preint.to_storage(), dtype=np.float64)
+    _, gyro, accl = next(profiles(n))
+    z_imu = np.hstack([gyro, accl])
+    dt = 1 / RATE
+
+    t_full = timeit(lambda: preintegrate.call_c_scan(noise, carry, z_imu, dt), number=3)
+    t_full /= 3
+    print(f"\nns/sample over {n} samples, full rate scan {t_full * 1e9 / n:.1f}")
+    print(
+        f"{'k':>3} {'ops':>6} {'numpy':>8} {'kernel':>8} {'scan':>8} {'total':>8}"
+        f" {'speedup':>8}"
+    )
+    for k in KERNEL_KS:
+        kernel = coalesce_kernels[k]
+        decimators = [
+            ImuDecimator(k, imu_noise, imu_bias, EPS, kernel=kernel_or_none)
+            for kernel_or_none in (None, kernel)
+        ]
+        storage, tau = decimators[1].push(z_imu, dt)
+        t_numpy, t_kernel = (
+            timeit(lambda: decimator.push(z_imu, dt), number=3) / 3
+            for decimator in decimators
+        )
+        t_scan = (
+            timeit(
+                lambda: preintegrate_delta.call_c_scan(carry, storage, tau), number=3
+            )
+            / 3
+        )
+        total = t_kernel + t_scan
+        ops = kernel.op_count / k + preintegrate_delta.op_count / k
+        print(
+            f"{k:>3} {ops:>6.0f} {t_numpy * 1e9 / n:>8.1f} {t_kernel * 1e9 / n:>8.1f}"
+            f" {t_scan * 1e9 / n:>8.1f} {total * 1e9 / n:>8.1f}"
+            f" {t_full / total:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    accuracy()
+    throughput()
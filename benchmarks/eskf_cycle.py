@@ -0,0 +1,86 @@
+"""Cost of the error state filter kernels
+
+The scans fold N steps in one call, so their time per step is the cost of the
+kernel itself; the single calls go through ErrorStateFilter one step at a time
+and add the Python and binding overhead of a call. The target is a propagate
+and update cycle under 5 us.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23 import eskf
+from se23.eskf import ErrorStateFilter
+from se23.pose23_SE23 import Pose23_SE23
+from states import Cov99, ImuBias, ImuNoise, State
+
+eskf_propagate = FuncWrapper.wrap(eskf.propagate_kernel(), carry="state")
+eskf_update_position = FuncWrapper.wrap(
+    eskf.update_kernel(eskf.position), carry="state"
+)
+eskf_cycle_position = FuncWrapper.wrap(eskf.cycle_kernel(eskf.position), carry="state")
+
+N = 100000
+DT = 1 / 400
+
+
+def main():
+    FuncWrapper.compile_and_import()
+    imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+    state = State(Pose23_SE23.identity(), Cov99.diag([1e-2] * 9), ImuBias())
+    rng = np.random.default_rng(0)
+    z_imu_raw = rng.normal(scale=0.1, size=(N, 6)) + [0, 0, 0, 0, 0, 9.81]
+    z = rng.normal(scale=0.1, size=(N, 3))
+    R = np.eye(3) * 0.1
+    R_packed = R[np.tril_indices(3)]
+    carry = state.to_numeric()
+    noise = np.array(imu_noise.to_storage())
+    gravity = np.array([0, 0, -9.81])
+
+    print(f"{'kernel':<22} {'ops':>6} {'scan ns/step':>13}")
+    scans = (
+        (eskf_propagate, (carry, noise, z_imu_raw, np.full(N, DT), gravity)),
+        (eskf_update_position, (carry, z, R_packed)),
+        (
+            eskf_cycle_position,
+            (carry, noise, z_imu_raw, np.full(N, DT), gravity, z, R_packed),
+        ),
+    )
+    for func, args in scans:
+        t = timeit(lambda: func.call_c_scan(*args), number=3) / 3
+        print(f"{func.name:<22} {func.op_count:>6} {t * 1e9 / N:>13.0f}")
+
+    esf = ErrorStateFilter(
+        state,
+        imu_noise,
+        propagate=eskf_propagate,
+        updates={"position": eskf_update_position},
+        cycles={"position": eskf_cycle_position},
+    )
+    number = 20000
+    calls = (
+        ("propagate", lambda: esf.propagate(z_imu_raw[0], DT)),
+        ("update", lambda: esf.update("position", z[0], R)),
+        (
+            "propagate + update",
+            lambda: (esf.propagate(z_imu_raw[0], DT), esf.update("position", z[0], R)),
+        ),
+        ("cycle", lambda: esf.cycle("position", z_imu_raw[0], DT, z[0], R)),
+    )
+    print(f"\n{'ErrorStateFilter call':<22} {'us/call':>8}")
+    for name, func in calls:
+        t = timeit(func, number=number) / number
+        print(f"{name:<22} {t * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Scaling of a bank of M error state filters with the number of filters
+
+Every filter has its own ImuNoise and imu sample, a step is the propagate or
+the position update of all of them in one batch kernel call. The bank runs in
+this process, the sharded bank in worker processes that advance a shard each.
+us/step is the wall time of a step and ns/filter that time over M.
+"""
+
+import os
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from codegen.get_code import FuncWrapper
+from se23 import eskf
+from se23.filter_bank import FilterBank, ShardedFilterBank, kernel_step
+from se23.pose23_SE23 import Pose23_SE23
+from states import Cov99, ImuBias, State
+
+eskf_propagate = FuncWrapper.wrap(eskf.propagate_kernel(), carry="state")
+eskf_update_position = FuncWrapper.wrap(
+    eskf.update_kernel(eskf.position), carry="state"
+)
+
+MS = (1, 10, 100, 1000, 10000, 100000)
+WORKERS = (2, 4)
+DT = 1 / 400
+
+
+def bank_args(m: int, rng: np.random.Generator, parallel: bool):
+    state = State(Pose23_SE23.identity(), Cov99.diag([1e-2] * 9), ImuBias())
+    states = State.numeric()(np.tile(state.to_storage(), (m, 1)).astype(float))
+    steps = {
+        "propagate": kernel_step(eskf_propagate, parallel),
+        "update": kernel_step(eskf_update_position, parallel),
+    }
+    return states, steps, np.abs(rng.normal(scale=1e-2, size=(m, 6)))
+
+
+def time_steps(bank: FilterBank, rng: np.random.Generator) -> list:
+    m = len(bank)
+    z_imu_raw = rng.normal(scale=0.1, size=(m, 6)) + [0, 0, 0, 0, 0, 9.81]
+    z = rng.normal(scale=0.1, size=(m, 3))
+    R = (np.eye(3) * 0.1)[np.tril_indices(3)]
+    gravity = np.array([0, 0, -9.81])
+    steps = (
+        lambda: bank.step("propagate", z_imu_raw=z_imu_raw, dt=DT, gravity=gravity),
+        lambda: bank.step("update", z=z, R=R),
+    )
+    number = max(100000 // m, 3)
+    return [timeit(step, number=number) / number for step in steps]
+
+
+def main():
+    FuncWrapper.compile_and_import()
+    rng = np.random.default_rng(0)
+    rows = []
+    # the workers are forked before this process uses OpenMP
+    for m in MS[2:]:
+        for workers in WORKERS:
+            states, steps, noise = bank_args(m, rng, parallel=False)
+            with ShardedFilterBank(states, steps, workers, imu_noise=noise) as bank:
+                rows.append((m, f"{workers} workers", time_steps(bank, rng)))
+    for m in MS:
+        states, steps, noise = bank_args(m, rng, parallel=True)
+        bank = FilterBank(states, steps, imu_noise=noise)
+        rows.append((m, "in process", time_steps(bank, rng)))
+
+    print(f"{os.cpu_count()} cores")
+    print(f"{'':>7} {'':<11} {'us/step':>21} {'ns/filter':>21}")
+    print(f"{'M':>7} {'bank':<11}" + f" {'propagate':>10} {'update':>10}" * 2)
+    for m, name, times in sorted(rows, key=lambda row: row[0]):
+        print(
+            f"{m:>7} {name:<11}"
+            + "".join(f" {t * 1e6:>10.1f}" for t in times)
+            + "".join(f" {t * 1e9 / m:>10.0f}" for t in times)
+        )
+
+
+if __name__ == "__main__":
+    main()
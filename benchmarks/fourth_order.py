@@ -0,0 +1,104 @@
+"""Cost and accuracy of preintegrate with order=4 against order=2
+
+The cost is the op count and the scan speed of the generated kernels. The
+accuracy is the relative error of the preintegrated covariance against the
+covariance of the right perturbation over Monte Carlo runs with noisy samples,
+for increasing gyro noise and for the same one second interval sampled at
+several rates.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.batch_integration import imu_increments
+from se23.integration import preintegrate, preintegrate_fourth_order
+from se23.pose23_array import Pose23_SE23Array
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ImuPreint, Cov99
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+preintegrate_fourth_order = FuncWrapper.wrap(
+    preintegrate_fourth_order, carry="preint_prev"
+)
+
+EPS = 1e-12
+SAMPLES = 100000
+carry = np.array(ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9)).to_storage())
+
+
+def monte_carlo(noise: np.ndarray, z_imu_est: np.ndarray, dt: float) -> np.ndarray:
+    """Covariance of xi with upsilon_noisy = upsilon * Exp(xi)"""
+    rng = np.random.default_rng(0)
+    n = len(z_imu_est)
+    upsilon = Pose23_SE23Array.identity(SAMPLES)
+    for z_i in z_imu_est:
+        z = z_i + np.sqrt(noise * dt) * rng.normal(size=(SAMPLES, 6))
+        delta = imu_increments(z[:, :3], z[:, 3:], np.full(SAMPLES, dt), EPS)
+        upsilon = Pose23_SE23Array(
+            upsilon.R, upsilon.v, upsilon.t + dt * upsilon.v
+        ).compose(Pose23_SE23Array(*delta))
+
+    mean = preintegrate.call_c_scan(noise, carry, z_imu_est, np.full(n, dt))
+    xi = Pose23_SE23Array.from_storage(mean[:10]).local_coordinates(upsilon, EPS)
+    return np.cov(xi.T)
+
+
+def relative_errors(noise: np.ndarray, z_imu_est: np.ndarray, dt: float):
+    expected = monte_carlo(noise, z_imu_est, dt)
+    errors = []
+    for func in (preintegrate, preintegrate_fourth_order):
+        out = func.call_c_scan(noise, carry, z_imu_est, np.full(len(z_imu_est), dt))
+        cov = Cov99.from_storage(out[10:]).to_numpy()
+        errors.append(np.linalg.norm(cov - expected) / np.linalg.norm(expected))
+    return expected, errors
+
+
+def main():
+    FuncWrapper.compile_and_import()
+    rng = np.random.default_rng(1)
+    z_imu_est = np.tile([0.5, -0.3, 0.8, 1.0, 0.5, 9.81], (100000, 1))
+    z_imu_est += rng.normal(scale=0.1, size=z_imu_est.shape)
+    noise = np.array(
+        ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2)).to_storage()
+    )
+
+    print(f"{'kernel':<28} {'ops':>6} {'ns/sample':>10}")
+    for func in (preintegrate, preintegrate_fourth_order):
+        args = (noise, carry, z_imu_est, np.full(len(z_imu_est), 1e-3))
+        t = timeit(lambda: func.call_c_scan(*args), number=3) / 3
+        print(f"{func.name:<28} {func.op_count:>6} {t * 1e9 / len(z_imu_est):>10.1f}")
+
+    print(f"\n100 samples of 0.01 s, {SAMPLES} Monte Carlo runs")
+    print(f"{'gyro noise':>10} {'rot std':>8} {'order 2':>8} {'order 4':>8}")
+    for gyro_noise in (10.0, 100.0, 300.0, 1000.0):
+        noise = np.array([gyro_noise] * 3 + [1e-2] * 3)
+        expected, errors = relative_errors(noise, z_imu_est[:100], 0.01)
+        rot_std = np.sqrt(np.trace(expected[:3, :3]) / 3)
+        print(
+            f"{gyro_noise:>10.0f} {rot_std:>8.3f} {errors[0]:>8.4f} {errors[1]:>8.4f}"
+        )
+
+    print(
+        f"\none second at several rates, same rotation std, {SAMPLES} Monte Carlo runs"
+    )
+    print(f"{'dt':>10} {'rot std':>8} {'order 2':>8} {'order 4':>8}")
+    for dt in (0.001, 0.01, 0.1):
+        # noise * dt**3 per sample, so the variance after one second stays put
+        noise = np.array([0.1 / dt**2] * 3 + [0.01 / dt**2] * 3)
+        n = round(1 / dt)
+        expected, errors = relative_errors(noise, z_imu_est[:n], dt)
+        rot_std = np.sqrt(np.trace(expected[:3, :3]) / 3)
+        print(f"{dt:>10.3f} {rot_std:>8.3f} {errors[0]:>8.4f} {errors[1]:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
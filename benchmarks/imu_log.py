@@ -0,0 +1,103 @@
+"""Replay throughput of a memory mapped imu log
+
+A 1 kHz log is replayed in 10 Hz keyframe intervals. The interval slices are
+compared with the bandwidth of reading the file and with building one ZImuRaw
+per sample, and fed to the preintegrate kernel scan with the bias subtracted.
+The first pass after writing reads from the page cache, so the numbers are a
+bound on what the format adds on top of the disk.
+"""
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.imu_log import ImuLog, write_imu_log
+from se23.integration import preintegrate
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ImuPreint, ZImuRaw, Cov99
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+
+RATE = 1000
+KEYFRAME_RATE = 10
+MINUTES = 10
+
+
+def timed(func) -> float:
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+
+def main():
+    FuncWrapper.compile_and_import()
+    n = MINUTES * 60 * RATE
+    rng = np.random.default_rng(0)
+    time = np.arange(n) / RATE + rng.uniform(0, 1e-5, n)
+    z_imu = rng.normal(size=(n, 6)) + [0, 0, 0, 0, 0, 9.81]
+    noise = np.array(
+        ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2)).to_storage()
+    )
+    carry = np.array(
+        ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9)).to_storage()
+    )
+    bias = np.full(6, 1e-3)
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / "imu.log"
+        t_write = timed(lambda: write_imu_log(path, time, z_imu))
+        size = path.stat().st_size
+        log = ImuLog(path)
+        keyframe_times = np.arange(time[0], time[-1], 1 / KEYFRAME_RATE)
+
+        def touch():
+            for interval in log.intervals(keyframe_times):
+                interval.z_imu.sum()
+
+        def scan():
+            for interval in log.intervals(keyframe_times):
+                preintegrate.call_c_scan(
+                    noise, carry, interval.z_imu - bias, interval.dt
+                )
+
+        t_read = timed(path.read_bytes)
+        t_search = timed(lambda: log.search(keyframe_times))
+        t_touch = timed(touch)
+        t_scan = timed(scan)
+
+        objects = 20000
+        t_objects = (
+            timed(
+                lambda: [
+                    ZImuRaw(Vector3(row[:3]), Vector3(row[3:]))
+                    for row in log.z_imu[:objects]
+                ]
+            )
+            * n
+            / objects
+        )
+
+    print(f"{n} samples, {MINUTES} min at {RATE} Hz, {size / 1e6:.0f} MB")
+    print(f"{'':<28} {'s':>8} {'ns/sample':>10} {'MB/s':>8}")
+    for name, t in (
+        ("write", t_write),
+        ("read the file", t_read),
+        ("search keyframes", t_search),
+        ("interval slices, touched", t_touch),
+        ("interval slices, scan", t_scan),
+        ("ZImuRaw per sample", t_objects),
+    ):
+        print(f"{name:<28} {t:>8.3f} {t * 1e9 / n:>10.1f} {size / t / 1e6:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark the batched C++ entry points against one call per evaluation"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.pose23_SE23 import Pose23_SE23
+from se23.integration import preintegrate
+from states import ImuNoise, ImuPreint, Cov99
+
+preintegrate = FuncWrapper.wrap(preintegrate)
+
+rng = np.random.default_rng(0)
+imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+
+
+if __name__ == "__main__":
+    FuncWrapper.compile_and_import()
+    noise_storage = np.array(imu_noise.to_storage(), dtype=np.float64)
+    preint_storage = np.array(preint.to_storage(), dtype=np.float64)
+
+    z_imu_est = rng.normal(size=(1000, 6))
+    out = preintegrate.output_buffers()
+    number = len(z_imu_est)
+    t_single = timeit(
+        lambda: [
+            preintegrate.cfunc(noise_storage, preint_storage, z, 1e-3, *out.values())
+            for z in z_imu_est
+        ],
+        number=1,
+    )
+    print(f"single calls     {t_single * 1e9 / number:8.1f} ns/eval")
+
+    for n in (1000, 100000, 1000000):
+        z_imu_est = rng.normal(size=(n, 6))
+        dt = np.full(n, 1e-3)
+        out = preintegrate.batch_output_buffers(n)
+        for parallel in (False, True):
+            t_batch = timeit(
+                lambda: preintegrate.call_c_batch(
+                    noise_storage,
+                    preint_storage,
+                    z_imu_est,
+                    dt,
+                    out=out,
+                    parallel=parallel,
+                ),
+                number=3,
+            )
+            print(
+                f"batch n={n:7d} parallel={parallel!s:5}"
+                f" {t_batch * 1e9 / (3 * n):8.1f} ns/eval"
+                f" {3 * n / t_batch / 1e6:6.2f} M evals/s"
+            )
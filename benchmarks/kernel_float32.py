@@ -0,0 +1,113 @@
+"""Accuracy and speed of the float32 kernels against the float64 ones
+
+Runs the scan kernels over every keyframe interval of an imu log, in float32
+and float64, and reports the error of the float32 preintegration. The log is a
+.npz file with gyro (N, 3), accl (N, 3) and dt (N,) arrays, bias corrected,
+given as the first argument. Without it a simulated log is used.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.pose23_SE23 import Pose23_SE23
+from se23.integration import preintegrate, preintegrate_sqrt
+from se23.batch_integration import quat_multiply
+from states import ImuNoise, ImuPreint, ImuPreintSqrt, Cov99, CovSqrt99
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+preintegrate_sqrt = FuncWrapper.wrap(preintegrate_sqrt, carry="preint_prev")
+
+imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+preint_sqrt = ImuPreintSqrt(Pose23_SE23.identity(), CovSqrt99.diag([0.0] * 9))
+
+
+def simulated_log(n: int = 200000, rate: float = 1000.0, seed: int = 0):
+    """Smooth motion with sensor noise, gravity on the z axis"""
+    rng = np.random.default_rng(seed)
+    time = np.arange(n) / rate
+    freqs = rng.uniform(0.1, 2.0, (2, 3))
+    gyro = np.sin(2 * np.pi * freqs[0] * time[:, None]) + rng.normal(0, 1e-2, (n, 3))
+    accl = 2 * np.cos(2 * np.pi * freqs[1] * time[:, None]) + [0, 0, 9.81]
+    accl += rng.normal(0, 1e-1, (n, 3))
+    return gyro, accl, np.full(n, 1 / rate)
+
+
+def cov_from_storage(func: FuncWrapper, storage: np.ndarray) -> np.ndarray:
+    if func is preintegrate_sqrt:
+        L = CovSqrt99.from_storage(storage[10:]).to_numpy()
+        return L @ L.T
+    return Cov99.from_storage(storage[10:]).to_numpy()
+
+
+def rotation_error(quat_a: np.ndarray, quat_b: np.ndarray) -> float:
+    quat = quat_multiply(quat_a * [-1, -1, -1, 1], quat_b)
+    return 2 * np.arctan2(np.linalg.norm(quat[:3]), abs(quat[3]))
+
+
+def report(func: FuncWrapper, carry, gyro, accl, dt, interval: int):
+    z_imu_est = np.hstack([gyro, accl])
+    carry = np.array(carry.to_storage())
+    noise = np.array(imu_noise.to_storage())
+    errors = []
+    not_pd = 0
+    for start in range(0, len(dt) - interval + 1, interval):
+        part = slice(start, start + interval)
+        out64 = func.call_c_scan(noise, carry, z_imu_est[part], dt[part])
+        out32 = func.call_c_scan(
+            noise.astype(np.float32),
+            carry.astype(np.float32),
+            z_imu_est[part].astype(np.float32),
+            dt[part].astype(np.float32),
+        ).astype(np.float64)
+        cov64, cov32 = cov_from_storage(func, out64), cov_from_storage(func, out32)
+        not_pd += np.linalg.eigvalsh(cov32).min() <= 0
+        errors.append(
+            (
+                rotation_error(out64[:4], out32[:4]),
+                np.linalg.norm(out64[4:7] - out32[4:7]),
+                np.linalg.norm(out64[7:10] - out32[7:10]),
+                np.linalg.norm(cov64 - cov32) / np.linalg.norm(cov64),
+            )
+        )
+    errors = np.array(errors)
+    print(f"{func.name}, {len(errors)} intervals of {interval} samples")
+    for name, column in zip(("rot [rad]", "v [m/s]", "t [m]", "cov [rel]"), errors.T):
+        print(
+            f"  {name:10s} median {np.median(column):9.2e}"
+            f"  p99 {np.percentile(column, 99):9.2e}  max {column.max():9.2e}"
+        )
+    print(f"  float32 covariances not positive definite: {not_pd}")
+
+    n = min(len(dt), 100000)
+    for dtype in (np.float64, np.float32):
+        args = (
+            noise.astype(dtype),
+            carry.astype(dtype),
+            z_imu_est[:n].astype(dtype),
+            dt[:n].astype(dtype),
+        )
+        t = timeit(lambda: func.call_c_scan(*args), number=3) / 3
+        print(f"  {np.dtype(dtype).name} scan {t * 1e9 / n:8.1f} ns/sample")
+
+
+if __name__ == "__main__":
+    FuncWrapper.compile_and_import()
+    if len(sys.argv) > 1:
+        log = np.load(sys.argv[1])
+        gyro, accl, dt = log["gyro"], log["accl"], log["dt"]
+    else:
+        gyro, accl, dt = simulated_log()
+
+    for interval in (100, 1000):
+        report(preintegrate, preint, gyro, accl, dt, interval)
+        report(preintegrate_sqrt, preint_sqrt, gyro, accl, dt, interval)
@@ -0,0 +1,80 @@
+"""Benchmark the fused C++ preintegrate loop against per sample kernel calls"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.pose23_SE23 import Pose23_SE23
+from se23.integration import preintegrate
+from se23.batch_integration import preintegrate_batch
+from states import ImuNoise, ImuPreint, Cov99
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+
+rng = np.random.default_rng(0)
+imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+
+
+def kernel_loop(noise, carry, z_imu_est, dt):
+    out = preintegrate.output_buffers()
+    carry = carry.copy()
+    for z in z_imu_est:
+        preintegrate.cfunc(noise, carry, z, dt, out["upsilon"], out["cov"])
+        carry[:10] = out["upsilon"]
+        carry[10:] = out["cov"]
+    return carry
+
+
+if __name__ == "__main__":
+    FuncWrapper.compile_and_import()
+    noise_storage = np.array(imu_noise.to_storage(), dtype=np.float64)
+    preint_storage = np.array(preint.to_storage(), dtype=np.float64)
+    dt = 1e-3
+
+    for n in (1000, 10000, 100000):
+        z_imu_est = rng.normal(size=(n, 6))
+        out = np.empty_like(preint_storage)
+        states = np.empty((n, len(preint_storage)))
+        t_numpy = timeit(
+            lambda: preintegrate_batch(
+                imu_noise, preint, z_imu_est[:, :3], z_imu_est[:, 3:], dt
+            ),
+            number=1,
+        )
+        t_loop = timeit(
+            lambda: kernel_loop(noise_storage, preint_storage, z_imu_est, dt),
+            number=1,
+        )
+        t_scan = (
+            timeit(
+                lambda: preintegrate.call_c_scan(
+                    noise_storage, preint_storage, z_imu_est, dt, out=out
+                ),
+                number=3,
+            )
+            / 3
+        )
+        t_states = (
+            timeit(
+                lambda: preintegrate.call_c_scan(
+                    noise_storage, preint_storage, z_imu_est, dt, out=out, states=states
+                ),
+                number=3,
+            )
+            / 3
+        )
+        print(
+            f"n={n:6d}  numpy {t_numpy * 1e9 / n:8.1f} ns/sample"
+            f"  kernel loop {t_loop * 1e9 / n:8.1f} ns/sample"
+            f"  scan {t_scan * 1e9 / n:8.1f} ns/sample"
+            f"  scan+states {t_states * 1e9 / n:8.1f} ns/sample"
+        )
@@ -0,0 +1,72 @@
+"""Cost of a single preintegrate kernel call by how the states are held
+
+SymState inputs are converted with to_storage on every call and the outputs
+come back as a dict of buffers. NumericState inputs are handed over as their
+buffer and the outputs are written into the buffer of a NumericState, so
+reading them back is a view. Serialization compares to_storage with the bytes
+of the buffer.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.integration import preintegrate
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ImuPreint, ZImuEst, Cov99
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+
+NUMBER = 20000
+
+
+def report(name: str, func) -> None:
+    print(f"{name:<36} {timeit(func, number=NUMBER) / NUMBER * 1e6:>8.2f}")
+
+
+def main():
+    FuncWrapper.compile_and_import()
+    imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+    preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([1e-3] * 9))
+    z_imu_est = ZImuEst(Vector3(0.1, 0.2, 0.3), Vector3(1.0, 2.0, 9.81))
+    symbolic = (imu_noise, preint, z_imu_est, 1e-3)
+    numeric = tuple(arg.to_numeric() for arg in symbolic[:3]) + (1e-3,)
+    storage = tuple(arg.buffer for arg in numeric[:3]) + (1e-3,)
+    buffers = preintegrate.output_buffers()
+    out = preintegrate.output_state()
+
+    print(f"{'us per call':<36} {'us':>8}")
+    report("SymState inputs", lambda: preintegrate.call_c(*symbolic))
+    report("storage inputs, dict out", lambda: preintegrate.call_c(*storage))
+    report(
+        "storage inputs, reused dict out",
+        lambda: preintegrate.call_c(*storage, out=buffers),
+    )
+    report(
+        "NumericState inputs and out", lambda: preintegrate.call_c(*numeric, out=out)
+    )
+    report(
+        "cpp_inputs of SymStates",
+        lambda: FuncWrapper.to_cpp_inputs(dict(zip("abc", symbolic[:3]))),
+    )
+    report(
+        "cpp_inputs of NumericStates",
+        lambda: FuncWrapper.to_cpp_inputs(dict(zip("abc", numeric[:3]))),
+    )
+    print()
+    report("ImuPreint to_storage", preint.to_storage)
+    report("NumericImuPreint to_bytes", out.to_bytes)
+    report(
+        "NumericImuPreint bytes round trip",
+        lambda: type(out).from_bytes(out.to_bytes()),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Soak test of the imu pipeline with a simulated 4 kHz imu
+
+The realtime run delivers samples with the wall clock in 1 ms chunks and
+reports the latency histograms of every stage, the flat out run produces
+chunks as fast as the pipeline takes them and reports the throughput.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from codegen.get_code import FuncWrapper
+from se23.integration import preintegrate
+from se23.pipeline import ImuPipeline, KeyframeTrigger, SimulatedImu, kernel_scan
+from states import ImuNoise, ImuBias
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+
+RATE = 4000
+DURATION = 30.0
+
+
+async def soak(pipeline: ImuPipeline) -> int:
+    keyframes = 0
+
+    async def consume():
+        nonlocal keyframes
+        async for _ in pipeline.keyframes():
+            keyframes += 1
+
+    await asyncio.gather(pipeline.run(), consume())
+    return keyframes
+
+
+def main():
+    FuncWrapper.compile_and_import()
+    imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+    scan = kernel_scan(preintegrate, imu_noise)
+    imu_bias = ImuBias(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+
+    for realtime, duration in ((True, DURATION), (False, DURATION * 4)):
+        source = SimulatedImu(RATE, duration, chunk_period=1e-3, realtime=realtime)
+        pipeline = ImuPipeline(source, scan, imu_bias, KeyframeTrigger(period=0.1))
+        start = perf_counter()
+        keyframes = asyncio.run(soak(pipeline))
+        elapsed = perf_counter() - start
+        mode = "realtime" if realtime else "flat out"
+        print(
+            f"\n{mode}, {duration:.0f} s of {RATE} Hz in {elapsed:.1f} s,"
+            f" {pipeline.samples / elapsed:.0f} samples/s, {keyframes} keyframes"
+        )
+        print(pipeline.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark the vectorized Pose23_SE23Array against the symbolic class"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from se23.pose23_array import Pose23_SE23Array
+
+rng = np.random.default_rng(0)
+
+
+if __name__ == "__main__":
+    n_sym = 100
+    for n in (1000, 1000000):
+        a = Pose23_SE23Array.from_tangent(rng.normal(size=(n, 9)))
+        b = Pose23_SE23Array.from_tangent(rng.normal(size=(n, 9)))
+        vecs = rng.normal(size=(n, 9))
+        a_sym, b_sym = a[:n_sym].to_poses(), b[:n_sym].to_poses()
+
+        ops = dict(
+            compose=(lambda: a.compose(b), lambda p, q: p.compose(q)),
+            inverse=(a.inverse, lambda p, q: p.inverse()),
+            adjoint=(a.adjoint, lambda p, q: p.adjoint()),
+            exp=(
+                lambda: Pose23_SE23Array.from_tangent(vecs),
+                lambda p, q: p.from_tangent(vecs[0].tolist()),
+            ),
+            log=(a.to_tangent, lambda p, q: p.to_tangent()),
+        )
+        for name, (vectorized, symbolic) in ops.items():
+            t_vec = timeit(vectorized, number=3) / 3
+            t_sym = timeit(
+                lambda: [symbolic(p, q) for p, q in zip(a_sym, b_sym)], number=1
+            )
+            print(
+                f"n={n:7d}  {name:8s} array {t_vec * 1e9 / n:8.1f} ns/pose"
+                f"  symbolic {t_sym * 1e9 / n_sym:10.1f} ns/pose"
+            )
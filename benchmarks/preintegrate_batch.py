@@ -0,0 +1,67 @@
+"""Benchmark preintegrate_batch against a per sample loop"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from se23.pose23_SE23 import Pose23_SE23
+from se23.integration import preintegrate
+from se23.batch_integration import preintegrate_batch
+from states import ImuNoise, ZImuEst, ImuPreint, Cov99
+
+rng = np.random.default_rng(0)
+imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+
+
+def symbolic_loop(gyro, accl, dt):
+    out = preint
+    for gyro_i, accl_i in zip(gyro, accl):
+        out = preintegrate(
+            imu_noise, out, ZImuEst(Vector3(gyro_i), Vector3(accl_i)), dt
+        )
+    return out
+
+
+def numeric_loop(gyro, accl, dt):
+    out = preint
+    for gyro_i, accl_i in zip(gyro, accl):
+        out = preintegrate_batch(imu_noise, out, gyro_i, accl_i, dt)
+    return out
+
+
+if __name__ == "__main__":
+    dt = 1e-3
+    for n in (10, 100, 1000, 10000):
+        gyro = rng.normal(size=(n, 3))
+        accl = rng.normal(size=(n, 3))
+        number = max(1, 1000 // n)
+        t_batch = (
+            timeit(
+                lambda: preintegrate_batch(imu_noise, preint, gyro, accl, dt),
+                number=number,
+            )
+            / number
+        )
+        t_numeric = (
+            timeit(lambda: numeric_loop(gyro, accl, dt), number=1)
+            if n <= 1000
+            else float("nan")
+        )
+        t_symbolic = (
+            timeit(lambda: symbolic_loop(gyro, accl, dt), number=1)
+            if n <= 100
+            else float("nan")
+        )
+        print(
+            f"n={n:6d}  batch {t_batch * 1e6 / n:8.2f} us/sample"
+            f"  numeric loop {t_numeric * 1e6 / n:8.2f} us/sample"
+            f"  symbolic loop {t_symbolic * 1e6 / n:8.2f} us/sample"
+        )
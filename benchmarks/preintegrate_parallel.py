@@ -0,0 +1,43 @@
+"""Benchmark preintegrate_parallel against preintegrate_batch on long windows"""
+
+import os
+import sys
+from pathlib import Path
+from timeit import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from se23.pose23_SE23 import Pose23_SE23
+from se23.batch_integration import preintegrate_batch
+from se23.parallel_integration import preintegrate_parallel
+from states import ImuNoise, ImuPreint, Cov99
+
+rng = np.random.default_rng(0)
+imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+
+
+if __name__ == "__main__":
+    dt = 1e-3
+    workers = sorted({1, 2, 4, os.cpu_count()})
+    for n in (1000, 10000, 100000):
+        gyro = rng.normal(size=(n, 3))
+        accl = rng.normal(size=(n, 3))
+        t_batch = timeit(
+            lambda: preintegrate_batch(imu_noise, preint, gyro, accl, dt), number=1
+        )
+        line = f"n={n:6d}  batch {t_batch * 1e3:8.1f} ms"
+        for w in workers:
+            t_parallel = timeit(
+                lambda: preintegrate_parallel(
+                    imu_noise, preint, gyro, accl, dt, max_workers=w
+                ),
+                number=1,
+            )
+            line += f"  parallel({w}) {t_parallel * 1e3:8.1f} ms"
+        print(line)
@@ -0,0 +1,164 @@
+"""Small angle handling of SO3_ljac_inv, op count, speed and accuracy
+
+Generates the preintegrate kernel with the small angle threshold of FuncWrapper
+set to 0 (closed form only), SMALL_ANGLE (branch free blend of closed form and
+Taylor series) and math.inf (series only), and times each of them in a
+standalone C++ loop over samples with gyro * dt around 1e-3 rad. The accuracy
+sweep compiles the generated kernel of the (1 - theta / 2 * cot(theta / 2)) /
+theta**2 coefficient of SO3_ljac_inv in each mode and compares it against an
+mpmath reference for theta from 1e-8 to pi, together with the old closed form
+with theta = sqrt(|phi|**2 + epsilon).
+"""
+
+import math
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import mpmath
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+import symforce.symbolic as sf
+from symforce.geo import Matrix
+
+from codegen.get_code import FuncWrapper, CPP_DIR
+from se23.pose23_SE23 import SMALL_ANGLE, SO3_ljac_inv_coefficient
+from se23.integration import preintegrate
+
+MODES = {"exact": 0, "blend": SMALL_ANGLE, "series": math.inf}
+SAMPLES = 1000000
+EIGEN_DIRS = (CPP_DIR / "include/eigen", Path("/usr/include/eigen3"))
+
+TIMING_MAIN = """
+#include <chrono>
+#include <cstdio>
+#include "kernel.h"
+
+int main() {
+  Eigen::Matrix<SCALAR, 6, 1> imu_noise = Eigen::Matrix<SCALAR, 6, 1>::Constant(1e-4);
+  Eigen::Matrix<SCALAR, 55, 1> preint = Eigen::Matrix<SCALAR, 55, 1>::Zero();
+  preint(3) = 1;
+  Eigen::Matrix<SCALAR, 6, 1> z_imu_est;
+  z_imu_est << 0.3, -0.2, 0.5, 0.1, 0.2, 9.81;
+  Eigen::Matrix<SCALAR, 10, 1> upsilon;
+  Eigen::Matrix<SCALAR, 45, 1> cov;
+  const SCALAR dt = 1e-3;
+
+  const auto start = std::chrono::steady_clock::now();
+  for (int i = 0; i < SAMPLES; i++) {
+    z_imu_est(i % 3) = -z_imu_est(i % 3);
+    KERNEL(imu_noise, preint, z_imu_est, dt, &upsilon, &cov);
+    preint << upsilon, cov;
+  }
+  const auto stop = std::chrono::steady_clock::now();
+  const double ns = std::chrono::duration<double, std::nano>(stop - start).count();
+  std::printf("%f %f\\n", ns / SAMPLES, static_cast<double>(preint(0)));
+}
+"""
+
+COEFFICIENT_MAIN = """
+#include <cstdio>
+#include "kernel.h"
+
+int main() {
+  double theta;
+  Eigen::Matrix<SCALAR, 1, 1> output;
+  while (std::scanf("%lf", &theta) == 1) {
+    KERNEL(static_cast<SCALAR>(theta), &output);
+    std::printf("%.17g\\n", static_cast<double>(output(0)));
+  }
+}
+"""
+
+
+def ljac_inv_coefficient(theta: sf.Scalar) -> Matrix:
+    """The coefficient as evaluated by SO3_ljac_inv"""
+    return Matrix([SO3_ljac_inv_coefficient(sf.sqrt(theta**2 + sf.epsilon() ** 2))])
+
+
+def old_ljac_inv_coefficient(theta: sf.Scalar) -> Matrix:
+    """The coefficient as evaluated before the small angle handling, generate
+    it with a threshold of 0"""
+    return Matrix([SO3_ljac_inv_coefficient(sf.sqrt(theta**2 + sf.epsilon()))])
+
+
+COEFFICIENTS = {
+    "old": FuncWrapper(old_ljac_inv_coefficient, small_angle=0),
+    **{
+        mode: FuncWrapper(ljac_inv_coefficient, small_angle=small_angle)
+        for mode, small_angle in MODES.items()
+    },
+}
+
+
+def run_main(func: FuncWrapper, main: str, scalar: str, stdin: str = "") -> str:
+    """stdout of main compiled with -O2 against the header of func"""
+    with TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        (tmpdir / "kernel.h").write_text(func.header)
+        (tmpdir / "main.cpp").write_text(main)
+        subprocess.run(
+            [
+                "g++",
+                "-O2",
+                "-std=c++17",
+                f"-DSCALAR={scalar}",
+                f"-DSAMPLES={SAMPLES}",
+                f"-DKERNEL=sym::{func.name_cpp}",
+                *(f"-I{path}" for path in EIGEN_DIRS if path.is_dir()),
+                str(tmpdir / "main.cpp"),
+                "-o",
+                str(tmpdir / "main"),
+            ],
+            check=True,
+        )
+        output = subprocess.run(
+            [tmpdir / "main"], input=stdin, check=True, capture_output=True, text=True
+        )
+    return output.stdout
+
+
+def time_kernel(func: FuncWrapper, scalar: str) -> float:
+    """ns per call of the preintegrate kernel"""
+    return float(run_main(func, TIMING_MAIN, scalar).split()[0])
+
+
+def coefficient(theta: np.ndarray, mode: str, scalar: str) -> np.ndarray:
+    """The SO3_ljac_inv coefficient as evaluated by the kernel of mode"""
+    stdin = "\n".join(f"{value:.17g}" for value in theta)
+    stdout = run_main(COEFFICIENTS[mode], COEFFICIENT_MAIN, scalar, stdin)
+    return np.array(stdout.split(), dtype=np.float64)
+
+
+def reference(theta: float) -> float:
+    with mpmath.workdps(50):
+        theta = mpmath.mpf(theta)
+        return float((1 - theta / 2 * mpmath.cot(theta / 2)) / theta**2)
+
+
+def main():
+    print(f"{'mode':>8} {'ops':>6} {'double ns':>10} {'float ns':>10}")
+    for mode, small_angle in MODES.items():
+        func = FuncWrapper(preintegrate, small_angle=small_angle)
+        times = [time_kernel(func, scalar) for scalar in ("double", "float")]
+        print(f"{mode:>8} {func.op_count:>6} {times[0]:>10.1f} {times[1]:>10.1f}")
+
+    thetas = np.logspace(-8, np.log10(np.pi), 18)
+    ref = np.array([reference(theta) for theta in thetas])
+    for scalar in ("double", "float"):
+        print(f"\nrelative error of the coefficient, {scalar}")
+        print(f"{'theta':>9}" + "".join(f"{mode:>10}" for mode in COEFFICIENTS))
+        errors = [
+            np.abs(coefficient(thetas, mode, scalar) - ref) / ref
+            for mode in COEFFICIENTS
+        ]
+        for i, theta in enumerate(thetas):
+            print(f"{theta:>9.1e}" + "".join(f"{e[i]:>10.1e}" for e in errors))
+
+
+if __name__ == "__main__":
+    main()
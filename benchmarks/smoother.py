@@ -0,0 +1,89 @@
+"""Solve time of the fixed lag smoother against the window length
+
+Keyframes are 0.1 s of 100 Hz imu samples apart and have a noisy position
+each. Once the window is full every add_keyframe marginalizes the oldest
+keyframe and optimizes, the table shows the time per keyframe, the
+Gauss-Newton solves and the imu factors evaluated per keyframe, for plain
+Gauss-Newton (threshold 0) and with relinearization above a threshold.
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from symforce.geo import Vector3
+
+from se23.batch_integration import preintegrate_batch
+from se23.pose23_SE23 import Pose23_SE23
+from se23.pose23_array import Pose23_SE23Array
+from se23.smoother import FixedLagSmoother, predict
+from states import Cov99, ImuNoise, ImuPreint
+
+EPS = 1e-12
+RATE = 100
+PERIOD = 0.1
+GRAVITY = np.array([0, 0, -9.81])
+LAGS = (5, 10, 20, 50, 100, 200)
+THRESHOLDS = (0.0, 1e-3, 1e-2)
+MEASURED = 20
+
+
+def simulate(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    imu_noise = ImuNoise(Vector3(1e-4, 1e-4, 1e-4), Vector3(1e-3, 1e-3, 1e-3))
+    std = np.sqrt(np.array(imu_noise.to_storage(), dtype=float) * RATE)
+    zero = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+    nom, preints, positions = Pose23_SE23Array.identity(), [], []
+    samples = int(PERIOD * RATE)
+    for k in range(n):
+        time = (k * samples + np.arange(samples)) / RATE
+        gyro = np.stack([np.sin(time + f) for f in (0, 1, 2)], 1) * 0.5
+        accl = np.stack([np.cos(time + f) for f in (0, 1, 2)], 1) + [0, 0, 9.81]
+        exact = preintegrate_batch(imu_noise, zero, gyro, accl, 1 / RATE, EPS)
+        upsilon = Pose23_SE23Array.from_storage(exact.upsilon.to_storage())
+        nom = predict(nom, upsilon, PERIOD, GRAVITY)
+        gyro = gyro + std[:3] * rng.normal(size=gyro.shape)
+        accl = accl + std[3:] * rng.normal(size=accl.shape)
+        preint = preintegrate_batch(imu_noise, zero, gyro, accl, 1 / RATE, EPS)
+        preints.append(preint.to_numeric())
+        positions.append(nom.t[0] + rng.normal(scale=0.1, size=3))
+    return preints, positions
+
+
+def main():
+    preints, positions = simulate(max(LAGS) + MEASURED)
+    print(f"per keyframe over {MEASURED} keyframes with a full window")
+    print(f"{'lag':>5} {'threshold':>9} {'ms':>8} {'solves':>7} {'factors':>8}")
+    for lag in LAGS:
+        for threshold in THRESHOLDS:
+            smoother = FixedLagSmoother(
+                Pose23_SE23Array.identity(),
+                np.eye(9) * 1e-2,
+                lag=lag,
+                gravity=GRAVITY,
+                threshold=threshold,
+                epsilon=EPS,
+            )
+            keyframes = list(zip(preints, positions))[: lag + MEASURED]
+            for preint, position in keyframes[:lag]:
+                smoother.add_keyframe(preint, PERIOD, position, np.eye(3) * 1e-2)
+            evaluated, solves, start = smoother.evaluated, 0, perf_counter()
+            for preint, position in keyframes[lag:]:
+                solves += smoother.add_keyframe(
+                    preint, PERIOD, position, np.eye(3) * 1e-2
+                )
+            elapsed = perf_counter() - start
+            print(
+                f"{lag:>5} {threshold:>9.0e} {elapsed * 1e3 / MEASURED:>8.2f}"
+                f" {solves / MEASURED:>7.1f}"
+                f" {(smoother.evaluated - evaluated) / MEASURED:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Attribute access and construction of SymState and NumericState
+
+field scan is the lookup SymState.__getattr__ did before the per class field
+index, a scan over dataclasses.fields on every access, for reference.
+"""
+
+import sys
+from dataclasses import fields
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+import config  # pylint: disable=unused-import
+
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuPreint, State, Cov99
+
+NUMBER = 100000
+
+
+def field_scan(state, item):
+    if item in (f.name for f in fields(state)):
+        return state[item]
+    raise AttributeError(item)
+
+
+def report(name: str, func) -> None:
+    print(f"{name:<32} {timeit(func, number=NUMBER) / NUMBER * 1e9:>8.0f}")
+
+
+def main():
+    preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+    numeric = preint.to_numeric()
+    storage = numeric.buffer.copy()
+    numeric_state = State.numeric()()
+    state = numeric_state.to_state()
+    NumericImuPreint = ImuPreint.numeric()
+
+    print(f"{'ns per call':<32} {'ns':>8}")
+    report("field scan preint.upsilon", lambda: field_scan(preint, "upsilon"))
+    report("preint['upsilon']", lambda: preint["upsilon"])
+    report("preint.upsilon", lambda: preint.upsilon)
+    report("numeric.upsilon", lambda: numeric.upsilon)
+    report("field scan state.imu_bias", lambda: field_scan(state, "imu_bias"))
+    report("state.imu_bias", lambda: state.imu_bias)
+    report("numeric_state.imu_bias", lambda: numeric_state.imu_bias)
+    report("preint.cov = cov", lambda: setattr(preint, "cov", preint.cov))
+    report("numeric.cov[:] = storage", lambda: setattr(numeric, "cov", storage[10:]))
+    print()
+    report("ImuPreint(upsilon, cov)", lambda: ImuPreint(preint.upsilon, preint.cov))
+    report("NumericImuPreint(storage)", lambda: NumericImuPreint(storage))
+    report("NumericImuPreint()", NumericImuPreint)
+    report("preint.to_numeric()", preint.to_numeric)
+    report("numeric.to_state()", numeric.to_state)
+
+
+if __name__ == "__main__":
+    main()
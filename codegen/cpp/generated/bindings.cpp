@@ -1,27 +1,1048 @@
+// numpy buffers are not guaranteed to be aligned, they are used in place
+#define EIGEN_MAX_STATIC_ALIGN_BYTES 0
+
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
+
 
 #include <pybind11/eigen.h>
-#include "preintegrate.h"
+#include "coalesce_16.h"
+#include "coalesce_32.h"
+#include "coalesce_4.h"
+#include "coalesce_8.h"
+#include "eskf_cycle_position.h"
+#include "eskf_propagate.h"
+#include "eskf_update_position.h"
+#include "eskf_update_velocity.h"
 #include "myfunc.h"
+#include "pose23_compose.h"
+#include "pose23_exp.h"
+#include "pose23_inverse.h"
+#include "pose23_local_coordinates.h"
+#include "pose23_log.h"
+#include "pose23_retract.h"
+#include "preintegrate.h"
+#include "preintegrate_correct.h"
+#include "preintegrate_delta.h"
+#include "preintegrate_fourth_order.h"
+#include "preintegrate_jac.h"
+#include "preintegrate_sqrt.h"
+#include "so3_ljac_inv_coefficient.h"
 namespace py = pybind11;
 
 template <typename Scalar>
-void Preintegrate_binding(
-    Eigen::Matrix<Scalar, 6, 1> *imu_noise, Eigen::Matrix<Scalar, 55, 1> *preint_prev, Eigen::Matrix<Scalar, 6, 1> *z_imu_est, Scalar dt, Eigen::Matrix<Scalar, 10, 1> *upsilon, Eigen::Matrix<Scalar, 9, 9> *cov)
+using Buffer = py::array_t<Scalar, py::array::f_style>;
+
+template <typename Matrix>
+void check_size(const Buffer<typename Matrix::Scalar>& buffer)
+{
+    if (buffer.size() != Matrix::SizeAtCompileTime)
+    {
+        throw std::invalid_argument("expected a buffer of size " + std::to_string(Matrix::SizeAtCompileTime) + ", got " + std::to_string(buffer.size()));
+    }
+}
+
+template <typename Matrix>
+const Matrix &as_input(const Buffer<typename Matrix::Scalar>& buffer)
+{
+    check_size<Matrix>(buffer);
+    return *reinterpret_cast<const Matrix *>(buffer.data());
+}
+
+template <typename Matrix>
+Matrix *as_output(Buffer<typename Matrix::Scalar>& buffer)
+{
+    check_size<Matrix>(buffer);
+    return reinterpret_cast<Matrix *>(buffer.mutable_data());
+}
+
+template <typename Scalar>
+using BatchBuffer = py::array_t<Scalar>;
+
+// Items of a batch are stored in the column major layout of the kernel, either
+// as (N,) for scalars, (N, rows * cols) or (N, rows, cols). The stride between
+// items is arbitrary, and a single item, (1, ...) or (rows * cols,), is
+// broadcast over the batch.
+template <typename Matrix>
+class BatchView
+{
+public:
+    BatchView(const BatchBuffer<typename Matrix::Scalar>& buffer, py::ssize_t n, bool output)
+    {
+        using Scalar = typename Matrix::Scalar;
+        const py::ssize_t size = Matrix::SizeAtCompileTime;
+        const py::ssize_t s = sizeof(Scalar);
+        bool single = buffer.ndim() == 1 && size > 1;
+        py::ssize_t items = single ? 1 : buffer.shape(0);
+        bool layout = false;
+        if (single)
+            layout = buffer.shape(0) == size && buffer.strides(0) == s;
+        else if (buffer.ndim() == 1)
+            layout = true;
+        else if (buffer.ndim() == 2)
+            layout = buffer.shape(1) == size && buffer.strides(1) == s;
+        else if (buffer.ndim() == 3)
+            layout = buffer.shape(1) == Matrix::RowsAtCompileTime && buffer.shape(2) == Matrix::ColsAtCompileTime && buffer.strides(1) == s && buffer.strides(2) == Matrix::RowsAtCompileTime * s;
+        if (!layout)
+            throw std::invalid_argument("items must be contiguous and column major with " + std::to_string(size) + " entries");
+        if (items != n && (items != 1 || output))
+            throw std::invalid_argument("expected " + std::to_string(n) + " items, got " + std::to_string(items));
+        stride = items == 1 ? 0 : buffer.strides(0);
+        data = reinterpret_cast<char *>(output ? const_cast<BatchBuffer<Scalar>&>(buffer).mutable_data() : const_cast<Scalar *>(buffer.data()));
+    }
+
+    Matrix &operator[](py::ssize_t i) const
+    {
+        return *reinterpret_cast<Matrix *>(data + i * stride);
+    }
+
+private:
+    char *data;
+    py::ssize_t stride;
+};
+
+template <typename Scalar>
+void Coalesce16_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& samples, const Buffer<Scalar>& dt, Buffer<Scalar>& delta, Buffer<Scalar>& cov
+    )
+{
+    sym::Coalesce16<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 6, 16>>(samples), as_input<Eigen::Matrix<Scalar, 16, 1>>(dt), as_output<Eigen::Matrix<Scalar, 10, 1>>(delta), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void Coalesce16_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& samples, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& delta, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = delta.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 16>> samples_(samples, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 16, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> delta_(delta, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Coalesce16<Scalar>(imu_noise_[i], samples_[i], dt_[i], &delta_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void Coalesce32_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& samples, const Buffer<Scalar>& dt, Buffer<Scalar>& delta, Buffer<Scalar>& cov
+    )
+{
+    sym::Coalesce32<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 6, 32>>(samples), as_input<Eigen::Matrix<Scalar, 32, 1>>(dt), as_output<Eigen::Matrix<Scalar, 10, 1>>(delta), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void Coalesce32_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& samples, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& delta, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = delta.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 32>> samples_(samples, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 32, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> delta_(delta, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Coalesce32<Scalar>(imu_noise_[i], samples_[i], dt_[i], &delta_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void Coalesce4_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& samples, const Buffer<Scalar>& dt, Buffer<Scalar>& delta, Buffer<Scalar>& cov
+    )
+{
+    sym::Coalesce4<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 6, 4>>(samples), as_input<Eigen::Matrix<Scalar, 4, 1>>(dt), as_output<Eigen::Matrix<Scalar, 10, 1>>(delta), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void Coalesce4_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& samples, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& delta, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = delta.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 4>> samples_(samples, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 4, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> delta_(delta, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Coalesce4<Scalar>(imu_noise_[i], samples_[i], dt_[i], &delta_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void Coalesce8_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& samples, const Buffer<Scalar>& dt, Buffer<Scalar>& delta, Buffer<Scalar>& cov
+    )
+{
+    sym::Coalesce8<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 6, 8>>(samples), as_input<Eigen::Matrix<Scalar, 8, 1>>(dt), as_output<Eigen::Matrix<Scalar, 10, 1>>(delta), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void Coalesce8_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& samples, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& delta, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = delta.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 8>> samples_(samples, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 8, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> delta_(delta, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Coalesce8<Scalar>(imu_noise_[i], samples_[i], dt_[i], &delta_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void EskfCyclePosition_binding(
+    const Buffer<Scalar>& state, const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& z_imu_raw, Scalar dt, const Buffer<Scalar>& gravity, const Buffer<Scalar>& z, const Buffer<Scalar>& R, Buffer<Scalar>& nom, Buffer<Scalar>& err_cov, Buffer<Scalar>& imu_bias
+    )
+{
+    sym::EskfCyclePosition<Scalar>(as_input<Eigen::Matrix<Scalar, 61, 1>>(state), as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 6, 1>>(z_imu_raw), dt, as_input<Eigen::Matrix<Scalar, 3, 1>>(gravity), as_input<Eigen::Matrix<Scalar, 3, 1>>(z), as_input<Eigen::Matrix<Scalar, 6, 1>>(R), as_output<Eigen::Matrix<Scalar, 10, 1>>(nom), as_output<Eigen::Matrix<Scalar, 45, 1>>(err_cov), as_output<Eigen::Matrix<Scalar, 6, 1>>(imu_bias));
+}
+
+template <typename Scalar>
+void EskfCyclePosition_batch_binding(
+    const BatchBuffer<Scalar>& state, const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& z_imu_raw, const BatchBuffer<Scalar>& dt, const BatchBuffer<Scalar>& gravity, const BatchBuffer<Scalar>& z, const BatchBuffer<Scalar>& R, BatchBuffer<Scalar>& nom, BatchBuffer<Scalar>& err_cov, BatchBuffer<Scalar>& imu_bias, bool parallel
+    )
 {
-    sym::Preintegrate<Scalar>(*reinterpret_cast<Eigen::Matrix<Scalar, 6, 1> *>(imu_noise), *reinterpret_cast<Eigen::Matrix<Scalar, 55, 1> *>(preint_prev), *reinterpret_cast<Eigen::Matrix<Scalar, 6, 1> *>(z_imu_est), dt, upsilon, cov);
+    const py::ssize_t n = nom.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 61, 1>> state_(state, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_raw_(z_imu_raw, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> gravity_(gravity, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> z_(z, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> R_(R, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> nom_(nom, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> err_cov_(err_cov, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_bias_(imu_bias, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfCyclePosition<Scalar>(state_[i], imu_noise_[i], z_imu_raw_[i], dt_[i](0, 0), gravity_[i], z_[i], R_[i], &nom_[i], &err_cov_[i], &imu_bias_[i]);
+    }
+}
+
+template <typename Scalar>
+void EskfCyclePosition_scan_binding(
+    const Buffer<Scalar>& state, const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& z_imu_raw, const BatchBuffer<Scalar>& dt, const BatchBuffer<Scalar>& gravity, const BatchBuffer<Scalar>& z, const BatchBuffer<Scalar>& R, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 61, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_raw_(z_imu_raw, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> gravity_(gravity, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> z_(z, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> R_(R, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(state);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfCyclePosition<Scalar>(carry, imu_noise_[i], z_imu_raw_[i], dt_[i](0, 0), gravity_[i], z_[i], R_[i], reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10), reinterpret_cast<Eigen::Matrix<Scalar, 6, 1>*>(next.data() + 55));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void EskfPropagate_binding(
+    const Buffer<Scalar>& state, const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& z_imu_raw, Scalar dt, const Buffer<Scalar>& gravity, Buffer<Scalar>& nom, Buffer<Scalar>& err_cov, Buffer<Scalar>& imu_bias
+    )
+{
+    sym::EskfPropagate<Scalar>(as_input<Eigen::Matrix<Scalar, 61, 1>>(state), as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 6, 1>>(z_imu_raw), dt, as_input<Eigen::Matrix<Scalar, 3, 1>>(gravity), as_output<Eigen::Matrix<Scalar, 10, 1>>(nom), as_output<Eigen::Matrix<Scalar, 45, 1>>(err_cov), as_output<Eigen::Matrix<Scalar, 6, 1>>(imu_bias));
+}
+
+template <typename Scalar>
+void EskfPropagate_batch_binding(
+    const BatchBuffer<Scalar>& state, const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& z_imu_raw, const BatchBuffer<Scalar>& dt, const BatchBuffer<Scalar>& gravity, BatchBuffer<Scalar>& nom, BatchBuffer<Scalar>& err_cov, BatchBuffer<Scalar>& imu_bias, bool parallel
+    )
+{
+    const py::ssize_t n = nom.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 61, 1>> state_(state, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_raw_(z_imu_raw, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> gravity_(gravity, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> nom_(nom, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> err_cov_(err_cov, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_bias_(imu_bias, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfPropagate<Scalar>(state_[i], imu_noise_[i], z_imu_raw_[i], dt_[i](0, 0), gravity_[i], &nom_[i], &err_cov_[i], &imu_bias_[i]);
+    }
+}
+
+template <typename Scalar>
+void EskfPropagate_scan_binding(
+    const Buffer<Scalar>& state, const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& z_imu_raw, const BatchBuffer<Scalar>& dt, const BatchBuffer<Scalar>& gravity, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 61, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_raw_(z_imu_raw, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> gravity_(gravity, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(state);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfPropagate<Scalar>(carry, imu_noise_[i], z_imu_raw_[i], dt_[i](0, 0), gravity_[i], reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10), reinterpret_cast<Eigen::Matrix<Scalar, 6, 1>*>(next.data() + 55));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void EskfUpdatePosition_binding(
+    const Buffer<Scalar>& state, const Buffer<Scalar>& z, const Buffer<Scalar>& R, Buffer<Scalar>& nom, Buffer<Scalar>& err_cov, Buffer<Scalar>& imu_bias
+    )
+{
+    sym::EskfUpdatePosition<Scalar>(as_input<Eigen::Matrix<Scalar, 61, 1>>(state), as_input<Eigen::Matrix<Scalar, 3, 1>>(z), as_input<Eigen::Matrix<Scalar, 6, 1>>(R), as_output<Eigen::Matrix<Scalar, 10, 1>>(nom), as_output<Eigen::Matrix<Scalar, 45, 1>>(err_cov), as_output<Eigen::Matrix<Scalar, 6, 1>>(imu_bias));
+}
+
+template <typename Scalar>
+void EskfUpdatePosition_batch_binding(
+    const BatchBuffer<Scalar>& state, const BatchBuffer<Scalar>& z, const BatchBuffer<Scalar>& R, BatchBuffer<Scalar>& nom, BatchBuffer<Scalar>& err_cov, BatchBuffer<Scalar>& imu_bias, bool parallel
+    )
+{
+    const py::ssize_t n = nom.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 61, 1>> state_(state, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> z_(z, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> R_(R, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> nom_(nom, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> err_cov_(err_cov, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_bias_(imu_bias, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfUpdatePosition<Scalar>(state_[i], z_[i], R_[i], &nom_[i], &err_cov_[i], &imu_bias_[i]);
+    }
+}
+
+template <typename Scalar>
+void EskfUpdatePosition_scan_binding(
+    const Buffer<Scalar>& state, const BatchBuffer<Scalar>& z, const BatchBuffer<Scalar>& R, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 61, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> z_(z, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> R_(R, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(state);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfUpdatePosition<Scalar>(carry, z_[i], R_[i], reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10), reinterpret_cast<Eigen::Matrix<Scalar, 6, 1>*>(next.data() + 55));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void EskfUpdateVelocity_binding(
+    const Buffer<Scalar>& state, const Buffer<Scalar>& z, const Buffer<Scalar>& R, Buffer<Scalar>& nom, Buffer<Scalar>& err_cov, Buffer<Scalar>& imu_bias
+    )
+{
+    sym::EskfUpdateVelocity<Scalar>(as_input<Eigen::Matrix<Scalar, 61, 1>>(state), as_input<Eigen::Matrix<Scalar, 3, 1>>(z), as_input<Eigen::Matrix<Scalar, 6, 1>>(R), as_output<Eigen::Matrix<Scalar, 10, 1>>(nom), as_output<Eigen::Matrix<Scalar, 45, 1>>(err_cov), as_output<Eigen::Matrix<Scalar, 6, 1>>(imu_bias));
+}
+
+template <typename Scalar>
+void EskfUpdateVelocity_batch_binding(
+    const BatchBuffer<Scalar>& state, const BatchBuffer<Scalar>& z, const BatchBuffer<Scalar>& R, BatchBuffer<Scalar>& nom, BatchBuffer<Scalar>& err_cov, BatchBuffer<Scalar>& imu_bias, bool parallel
+    )
+{
+    const py::ssize_t n = nom.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 61, 1>> state_(state, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> z_(z, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> R_(R, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> nom_(nom, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> err_cov_(err_cov, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_bias_(imu_bias, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfUpdateVelocity<Scalar>(state_[i], z_[i], R_[i], &nom_[i], &err_cov_[i], &imu_bias_[i]);
+    }
+}
+
+template <typename Scalar>
+void EskfUpdateVelocity_scan_binding(
+    const Buffer<Scalar>& state, const BatchBuffer<Scalar>& z, const BatchBuffer<Scalar>& R, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 61, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> z_(z, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> R_(R, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(state);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::EskfUpdateVelocity<Scalar>(carry, z_[i], R_[i], reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10), reinterpret_cast<Eigen::Matrix<Scalar, 6, 1>*>(next.data() + 55));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
 }
 
 template <typename Scalar>
 void Myfunc_binding(
-    Eigen::Matrix<Scalar, 10, 1> *inputs, Eigen::Matrix<Scalar, 9, 1> *output)
+    const Buffer<Scalar>& inputs, Buffer<Scalar>& output
+    )
 {
-    sym::Myfunc<Scalar>(*reinterpret_cast<Eigen::Matrix<Scalar, 10, 1> *>(inputs), output);
+    sym::Myfunc<Scalar>(as_input<Eigen::Matrix<Scalar, 10, 1>>(inputs), as_output<Eigen::Matrix<Scalar, 9, 1>>(output));
 }
 
-PYBIND11_MODULE(mylib, m)
+template <typename Scalar>
+void Myfunc_batch_binding(
+    const BatchBuffer<Scalar>& inputs, BatchBuffer<Scalar>& output, bool parallel
+    )
+{
+    const py::ssize_t n = output.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> inputs_(inputs, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 9, 1>> output_(output, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Myfunc<Scalar>(inputs_[i], &output_[i]);
+    }
+}
+
+template <typename Scalar>
+void Pose23Compose_binding(
+    const Buffer<Scalar>& a, const Buffer<Scalar>& b, Buffer<Scalar>& pose, Buffer<Scalar>& D_a, Buffer<Scalar>& D_b
+    )
+{
+    sym::Pose23Compose<Scalar>(as_input<Eigen::Matrix<Scalar, 10, 1>>(a), as_input<Eigen::Matrix<Scalar, 10, 1>>(b), as_output<Eigen::Matrix<Scalar, 10, 1>>(pose), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_a), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_b));
+}
+
+template <typename Scalar>
+void Pose23Compose_batch_binding(
+    const BatchBuffer<Scalar>& a, const BatchBuffer<Scalar>& b, BatchBuffer<Scalar>& pose, BatchBuffer<Scalar>& D_a, BatchBuffer<Scalar>& D_b, bool parallel
+    )
 {
-    m.def("preintegrate", &Preintegrate_binding<double>);
-    m.def("myfunc", &Myfunc_binding<double>);
+    const py::ssize_t n = pose.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> a_(a, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> b_(b, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> pose_(pose, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_a_(D_a, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_b_(D_b, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Pose23Compose<Scalar>(a_[i], b_[i], &pose_[i], &D_a_[i], &D_b_[i]);
+    }
 }
+
+template <typename Scalar>
+void Pose23Exp_binding(
+    const Buffer<Scalar>& vec, Buffer<Scalar>& pose, Buffer<Scalar>& D_a
+    )
+{
+    sym::Pose23Exp<Scalar>(as_input<Eigen::Matrix<Scalar, 9, 1>>(vec), as_output<Eigen::Matrix<Scalar, 10, 1>>(pose), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_a));
+}
+
+template <typename Scalar>
+void Pose23Exp_batch_binding(
+    const BatchBuffer<Scalar>& vec, BatchBuffer<Scalar>& pose, BatchBuffer<Scalar>& D_a, bool parallel
+    )
+{
+    const py::ssize_t n = pose.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 9, 1>> vec_(vec, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> pose_(pose, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_a_(D_a, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Pose23Exp<Scalar>(vec_[i], &pose_[i], &D_a_[i]);
+    }
+}
+
+template <typename Scalar>
+void Pose23Inverse_binding(
+    const Buffer<Scalar>& a, Buffer<Scalar>& pose, Buffer<Scalar>& D_a
+    )
+{
+    sym::Pose23Inverse<Scalar>(as_input<Eigen::Matrix<Scalar, 10, 1>>(a), as_output<Eigen::Matrix<Scalar, 10, 1>>(pose), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_a));
+}
+
+template <typename Scalar>
+void Pose23Inverse_batch_binding(
+    const BatchBuffer<Scalar>& a, BatchBuffer<Scalar>& pose, BatchBuffer<Scalar>& D_a, bool parallel
+    )
+{
+    const py::ssize_t n = pose.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> a_(a, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> pose_(pose, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_a_(D_a, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Pose23Inverse<Scalar>(a_[i], &pose_[i], &D_a_[i]);
+    }
+}
+
+template <typename Scalar>
+void Pose23LocalCoordinates_binding(
+    const Buffer<Scalar>& a, const Buffer<Scalar>& b, Buffer<Scalar>& tangent, Buffer<Scalar>& D_a, Buffer<Scalar>& D_b
+    )
+{
+    sym::Pose23LocalCoordinates<Scalar>(as_input<Eigen::Matrix<Scalar, 10, 1>>(a), as_input<Eigen::Matrix<Scalar, 10, 1>>(b), as_output<Eigen::Matrix<Scalar, 9, 1>>(tangent), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_a), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_b));
+}
+
+template <typename Scalar>
+void Pose23LocalCoordinates_batch_binding(
+    const BatchBuffer<Scalar>& a, const BatchBuffer<Scalar>& b, BatchBuffer<Scalar>& tangent, BatchBuffer<Scalar>& D_a, BatchBuffer<Scalar>& D_b, bool parallel
+    )
+{
+    const py::ssize_t n = tangent.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> a_(a, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> b_(b, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 9, 1>> tangent_(tangent, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_a_(D_a, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_b_(D_b, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Pose23LocalCoordinates<Scalar>(a_[i], b_[i], &tangent_[i], &D_a_[i], &D_b_[i]);
+    }
+}
+
+template <typename Scalar>
+void Pose23Log_binding(
+    const Buffer<Scalar>& a, Buffer<Scalar>& tangent, Buffer<Scalar>& D_a
+    )
+{
+    sym::Pose23Log<Scalar>(as_input<Eigen::Matrix<Scalar, 10, 1>>(a), as_output<Eigen::Matrix<Scalar, 9, 1>>(tangent), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_a));
+}
+
+template <typename Scalar>
+void Pose23Log_batch_binding(
+    const BatchBuffer<Scalar>& a, BatchBuffer<Scalar>& tangent, BatchBuffer<Scalar>& D_a, bool parallel
+    )
+{
+    const py::ssize_t n = tangent.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> a_(a, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 9, 1>> tangent_(tangent, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_a_(D_a, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Pose23Log<Scalar>(a_[i], &tangent_[i], &D_a_[i]);
+    }
+}
+
+template <typename Scalar>
+void Pose23Retract_binding(
+    const Buffer<Scalar>& a, const Buffer<Scalar>& vec, Buffer<Scalar>& pose, Buffer<Scalar>& D_a, Buffer<Scalar>& D_b
+    )
+{
+    sym::Pose23Retract<Scalar>(as_input<Eigen::Matrix<Scalar, 10, 1>>(a), as_input<Eigen::Matrix<Scalar, 9, 1>>(vec), as_output<Eigen::Matrix<Scalar, 10, 1>>(pose), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_a), as_output<Eigen::Matrix<Scalar, 9, 9>>(D_b));
+}
+
+template <typename Scalar>
+void Pose23Retract_batch_binding(
+    const BatchBuffer<Scalar>& a, const BatchBuffer<Scalar>& vec, BatchBuffer<Scalar>& pose, BatchBuffer<Scalar>& D_a, BatchBuffer<Scalar>& D_b, bool parallel
+    )
+{
+    const py::ssize_t n = pose.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> a_(a, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 9, 1>> vec_(vec, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> pose_(pose, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_a_(D_a, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 9>> D_b_(D_b, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Pose23Retract<Scalar>(a_[i], vec_[i], &pose_[i], &D_a_[i], &D_b_[i]);
+    }
+}
+
+template <typename Scalar>
+void Preintegrate_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const Buffer<Scalar>& z_imu_est, Scalar dt, Buffer<Scalar>& upsilon, Buffer<Scalar>& cov
+    )
+{
+    sym::Preintegrate<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 55, 1>>(preint_prev), as_input<Eigen::Matrix<Scalar, 6, 1>>(z_imu_est), dt, as_output<Eigen::Matrix<Scalar, 10, 1>>(upsilon), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void Preintegrate_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& upsilon, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = upsilon.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 55, 1>> preint_prev_(preint_prev, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> upsilon_(upsilon, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Preintegrate<Scalar>(imu_noise_[i], preint_prev_[i], z_imu_est_[i], dt_[i](0, 0), &upsilon_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void Preintegrate_scan_binding(
+    const BatchBuffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 55, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(preint_prev);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::Preintegrate<Scalar>(imu_noise_[i], carry, z_imu_est_[i], dt_[i](0, 0), reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void PreintegrateCorrect_binding(
+    const Buffer<Scalar>& preint, const Buffer<Scalar>& bias_delta, Buffer<Scalar>& upsilon, Buffer<Scalar>& cov
+    )
+{
+    sym::PreintegrateCorrect<Scalar>(as_input<Eigen::Matrix<Scalar, 109, 1>>(preint), as_input<Eigen::Matrix<Scalar, 6, 1>>(bias_delta), as_output<Eigen::Matrix<Scalar, 10, 1>>(upsilon), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void PreintegrateCorrect_batch_binding(
+    const BatchBuffer<Scalar>& preint, const BatchBuffer<Scalar>& bias_delta, BatchBuffer<Scalar>& upsilon, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = upsilon.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 109, 1>> preint_(preint, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> bias_delta_(bias_delta, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> upsilon_(upsilon, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateCorrect<Scalar>(preint_[i], bias_delta_[i], &upsilon_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void PreintegrateDelta_binding(
+    const Buffer<Scalar>& preint_prev, const Buffer<Scalar>& z_imu_delta, Scalar dt, Buffer<Scalar>& upsilon, Buffer<Scalar>& cov
+    )
+{
+    sym::PreintegrateDelta<Scalar>(as_input<Eigen::Matrix<Scalar, 55, 1>>(preint_prev), as_input<Eigen::Matrix<Scalar, 55, 1>>(z_imu_delta), dt, as_output<Eigen::Matrix<Scalar, 10, 1>>(upsilon), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void PreintegrateDelta_batch_binding(
+    const BatchBuffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_delta, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& upsilon, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = upsilon.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 55, 1>> preint_prev_(preint_prev, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 55, 1>> z_imu_delta_(z_imu_delta, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> upsilon_(upsilon, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateDelta<Scalar>(preint_prev_[i], z_imu_delta_[i], dt_[i](0, 0), &upsilon_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void PreintegrateDelta_scan_binding(
+    const Buffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_delta, const BatchBuffer<Scalar>& dt, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 55, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 55, 1>> z_imu_delta_(z_imu_delta, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(preint_prev);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateDelta<Scalar>(carry, z_imu_delta_[i], dt_[i](0, 0), reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void PreintegrateFourthOrder_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const Buffer<Scalar>& z_imu_est, Scalar dt, Buffer<Scalar>& upsilon, Buffer<Scalar>& cov
+    )
+{
+    sym::PreintegrateFourthOrder<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 55, 1>>(preint_prev), as_input<Eigen::Matrix<Scalar, 6, 1>>(z_imu_est), dt, as_output<Eigen::Matrix<Scalar, 10, 1>>(upsilon), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov));
+}
+
+template <typename Scalar>
+void PreintegrateFourthOrder_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& upsilon, BatchBuffer<Scalar>& cov, bool parallel
+    )
+{
+    const py::ssize_t n = upsilon.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 55, 1>> preint_prev_(preint_prev, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> upsilon_(upsilon, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateFourthOrder<Scalar>(imu_noise_[i], preint_prev_[i], z_imu_est_[i], dt_[i](0, 0), &upsilon_[i], &cov_[i]);
+    }
+}
+
+template <typename Scalar>
+void PreintegrateFourthOrder_scan_binding(
+    const BatchBuffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 55, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(preint_prev);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateFourthOrder<Scalar>(imu_noise_[i], carry, z_imu_est_[i], dt_[i](0, 0), reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void PreintegrateJac_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const Buffer<Scalar>& z_imu_est, Scalar dt, Buffer<Scalar>& upsilon, Buffer<Scalar>& cov, Buffer<Scalar>& jac_gyro, Buffer<Scalar>& jac_accl
+    )
+{
+    sym::PreintegrateJac<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 109, 1>>(preint_prev), as_input<Eigen::Matrix<Scalar, 6, 1>>(z_imu_est), dt, as_output<Eigen::Matrix<Scalar, 10, 1>>(upsilon), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov), as_output<Eigen::Matrix<Scalar, 9, 3>>(jac_gyro), as_output<Eigen::Matrix<Scalar, 9, 3>>(jac_accl));
+}
+
+template <typename Scalar>
+void PreintegrateJac_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& upsilon, BatchBuffer<Scalar>& cov, BatchBuffer<Scalar>& jac_gyro, BatchBuffer<Scalar>& jac_accl, bool parallel
+    )
+{
+    const py::ssize_t n = upsilon.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 109, 1>> preint_prev_(preint_prev, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> upsilon_(upsilon, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_(cov, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 3>> jac_gyro_(jac_gyro, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 9, 3>> jac_accl_(jac_accl, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateJac<Scalar>(imu_noise_[i], preint_prev_[i], z_imu_est_[i], dt_[i](0, 0), &upsilon_[i], &cov_[i], &jac_gyro_[i], &jac_accl_[i]);
+    }
+}
+
+template <typename Scalar>
+void PreintegrateJac_scan_binding(
+    const BatchBuffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 109, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(preint_prev);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateJac<Scalar>(imu_noise_[i], carry, z_imu_est_[i], dt_[i](0, 0), reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10), reinterpret_cast<Eigen::Matrix<Scalar, 9, 3>*>(next.data() + 55), reinterpret_cast<Eigen::Matrix<Scalar, 9, 3>*>(next.data() + 82));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void PreintegrateSqrt_binding(
+    const Buffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const Buffer<Scalar>& z_imu_est, Scalar dt, Buffer<Scalar>& upsilon, Buffer<Scalar>& cov_sqrt
+    )
+{
+    sym::PreintegrateSqrt<Scalar>(as_input<Eigen::Matrix<Scalar, 6, 1>>(imu_noise), as_input<Eigen::Matrix<Scalar, 55, 1>>(preint_prev), as_input<Eigen::Matrix<Scalar, 6, 1>>(z_imu_est), dt, as_output<Eigen::Matrix<Scalar, 10, 1>>(upsilon), as_output<Eigen::Matrix<Scalar, 45, 1>>(cov_sqrt));
+}
+
+template <typename Scalar>
+void PreintegrateSqrt_batch_binding(
+    const BatchBuffer<Scalar>& imu_noise, const BatchBuffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, BatchBuffer<Scalar>& upsilon, BatchBuffer<Scalar>& cov_sqrt, bool parallel
+    )
+{
+    const py::ssize_t n = upsilon.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 55, 1>> preint_prev_(preint_prev, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 10, 1>> upsilon_(upsilon, n, true);
+    const BatchView<Eigen::Matrix<Scalar, 45, 1>> cov_sqrt_(cov_sqrt, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateSqrt<Scalar>(imu_noise_[i], preint_prev_[i], z_imu_est_[i], dt_[i](0, 0), &upsilon_[i], &cov_sqrt_[i]);
+    }
+}
+
+template <typename Scalar>
+void PreintegrateSqrt_scan_binding(
+    const BatchBuffer<Scalar>& imu_noise, const Buffer<Scalar>& preint_prev, const BatchBuffer<Scalar>& z_imu_est, const BatchBuffer<Scalar>& dt, py::ssize_t n, Buffer<Scalar>& out, std::optional<BatchBuffer<Scalar>> states
+    )
+{
+    using Carry = Eigen::Matrix<Scalar, 55, 1>;
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> imu_noise_(imu_noise, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 6, 1>> z_imu_est_(z_imu_est, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> dt_(dt, n, false);
+    std::optional<BatchView<Carry>> states_;
+    if (states)
+        states_.emplace(*states, n, true);
+    Carry *result = as_output<Carry>(out);
+    Carry carry = as_input<Carry>(preint_prev);
+    Carry next;
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::PreintegrateSqrt<Scalar>(imu_noise_[i], carry, z_imu_est_[i], dt_[i](0, 0), reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10));
+        carry = next;
+        if (states_)
+            (*states_)[i] = carry;
+    }
+    *result = carry;
+}
+
+template <typename Scalar>
+void So3LjacInvCoefficient_binding(
+    const Buffer<Scalar>& phi, Buffer<Scalar>& output
+    )
+{
+    sym::So3LjacInvCoefficient<Scalar>(as_input<Eigen::Matrix<Scalar, 3, 1>>(phi), as_output<Eigen::Matrix<Scalar, 1, 1>>(output)->data());
+}
+
+template <typename Scalar>
+void So3LjacInvCoefficient_batch_binding(
+    const BatchBuffer<Scalar>& phi, BatchBuffer<Scalar>& output, bool parallel
+    )
+{
+    const py::ssize_t n = output.shape(0);
+    const BatchView<Eigen::Matrix<Scalar, 3, 1>> phi_(phi, n, false);
+    const BatchView<Eigen::Matrix<Scalar, 1, 1>> output_(output, n, true);
+    py::gil_scoped_release release;
+    #pragma omp parallel for if (parallel)
+    for (py::ssize_t i = 0; i < n; ++i)
+    {
+        sym::So3LjacInvCoefficient<Scalar>(phi_[i], output_[i].data());
+    }
+}
+
+
+PYBIND11_MODULE(mylib, m)
+{
+    // overloads are tried in order, double comes first so inputs of mixed or
+    // other dtypes are converted to double
+    m.def("coalesce_16", &Coalesce16_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_16_batch", &Coalesce16_batch_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("coalesce_16", &Coalesce16_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_16_batch", &Coalesce16_batch_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("coalesce_32", &Coalesce32_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_32_batch", &Coalesce32_batch_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("coalesce_32", &Coalesce32_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_32_batch", &Coalesce32_batch_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("coalesce_4", &Coalesce4_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_4_batch", &Coalesce4_batch_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("coalesce_4", &Coalesce4_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_4_batch", &Coalesce4_batch_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("coalesce_8", &Coalesce8_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_8_batch", &Coalesce8_batch_binding<double>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("coalesce_8", &Coalesce8_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert());
+    m.def("coalesce_8_batch", &Coalesce8_batch_binding<float>, py::arg("imu_noise"), py::arg("samples"), py::arg("dt"), py::arg("delta").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_cycle_position", &EskfCyclePosition_binding<double>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_cycle_position_batch", &EskfCyclePosition_batch_binding<double>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_cycle_position_scan", &EskfCyclePosition_scan_binding<double>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("z"), py::arg("R"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("eskf_cycle_position", &EskfCyclePosition_binding<float>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_cycle_position_batch", &EskfCyclePosition_batch_binding<float>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_cycle_position_scan", &EskfCyclePosition_scan_binding<float>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("z"), py::arg("R"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("eskf_propagate", &EskfPropagate_binding<double>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_propagate_batch", &EskfPropagate_batch_binding<double>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_propagate_scan", &EskfPropagate_scan_binding<double>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("eskf_propagate", &EskfPropagate_binding<float>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_propagate_batch", &EskfPropagate_batch_binding<float>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_propagate_scan", &EskfPropagate_scan_binding<float>, py::arg("state"), py::arg("imu_noise"), py::arg("z_imu_raw"), py::arg("dt"), py::arg("gravity"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("eskf_update_position", &EskfUpdatePosition_binding<double>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_update_position_batch", &EskfUpdatePosition_batch_binding<double>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_update_position_scan", &EskfUpdatePosition_scan_binding<double>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("eskf_update_position", &EskfUpdatePosition_binding<float>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_update_position_batch", &EskfUpdatePosition_batch_binding<float>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_update_position_scan", &EskfUpdatePosition_scan_binding<float>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("eskf_update_velocity", &EskfUpdateVelocity_binding<double>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_update_velocity_batch", &EskfUpdateVelocity_batch_binding<double>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_update_velocity_scan", &EskfUpdateVelocity_scan_binding<double>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("eskf_update_velocity", &EskfUpdateVelocity_binding<float>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert());
+    m.def("eskf_update_velocity_batch", &EskfUpdateVelocity_batch_binding<float>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("nom").noconvert(), py::arg("err_cov").noconvert(), py::arg("imu_bias").noconvert(), py::arg("parallel") = true);
+    m.def("eskf_update_velocity_scan", &EskfUpdateVelocity_scan_binding<float>, py::arg("state"), py::arg("z"), py::arg("R"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("myfunc", &Myfunc_binding<double>, py::arg("inputs"), py::arg("output").noconvert());
+    m.def("myfunc_batch", &Myfunc_batch_binding<double>, py::arg("inputs"), py::arg("output").noconvert(), py::arg("parallel") = true);
+    m.def("myfunc", &Myfunc_binding<float>, py::arg("inputs"), py::arg("output").noconvert());
+    m.def("myfunc_batch", &Myfunc_batch_binding<float>, py::arg("inputs"), py::arg("output").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_compose", &Pose23Compose_binding<double>, py::arg("a"), py::arg("b"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert());
+    m.def("pose23_compose_batch", &Pose23Compose_batch_binding<double>, py::arg("a"), py::arg("b"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_compose", &Pose23Compose_binding<float>, py::arg("a"), py::arg("b"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert());
+    m.def("pose23_compose_batch", &Pose23Compose_batch_binding<float>, py::arg("a"), py::arg("b"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_exp", &Pose23Exp_binding<double>, py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert());
+    m.def("pose23_exp_batch", &Pose23Exp_batch_binding<double>, py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_exp", &Pose23Exp_binding<float>, py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert());
+    m.def("pose23_exp_batch", &Pose23Exp_batch_binding<float>, py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_inverse", &Pose23Inverse_binding<double>, py::arg("a"), py::arg("pose").noconvert(), py::arg("D_a").noconvert());
+    m.def("pose23_inverse_batch", &Pose23Inverse_batch_binding<double>, py::arg("a"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_inverse", &Pose23Inverse_binding<float>, py::arg("a"), py::arg("pose").noconvert(), py::arg("D_a").noconvert());
+    m.def("pose23_inverse_batch", &Pose23Inverse_batch_binding<float>, py::arg("a"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_local_coordinates", &Pose23LocalCoordinates_binding<double>, py::arg("a"), py::arg("b"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert());
+    m.def("pose23_local_coordinates_batch", &Pose23LocalCoordinates_batch_binding<double>, py::arg("a"), py::arg("b"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_local_coordinates", &Pose23LocalCoordinates_binding<float>, py::arg("a"), py::arg("b"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert());
+    m.def("pose23_local_coordinates_batch", &Pose23LocalCoordinates_batch_binding<float>, py::arg("a"), py::arg("b"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_log", &Pose23Log_binding<double>, py::arg("a"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert());
+    m.def("pose23_log_batch", &Pose23Log_batch_binding<double>, py::arg("a"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_log", &Pose23Log_binding<float>, py::arg("a"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert());
+    m.def("pose23_log_batch", &Pose23Log_batch_binding<float>, py::arg("a"), py::arg("tangent").noconvert(), py::arg("D_a").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_retract", &Pose23Retract_binding<double>, py::arg("a"), py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert());
+    m.def("pose23_retract_batch", &Pose23Retract_batch_binding<double>, py::arg("a"), py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert(), py::arg("parallel") = true);
+    m.def("pose23_retract", &Pose23Retract_binding<float>, py::arg("a"), py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert());
+    m.def("pose23_retract_batch", &Pose23Retract_batch_binding<float>, py::arg("a"), py::arg("vec"), py::arg("pose").noconvert(), py::arg("D_a").noconvert(), py::arg("D_b").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate", &Preintegrate_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_batch", &Preintegrate_batch_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_scan", &Preintegrate_scan_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate", &Preintegrate_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_batch", &Preintegrate_batch_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_scan", &Preintegrate_scan_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_correct", &PreintegrateCorrect_binding<double>, py::arg("preint"), py::arg("bias_delta"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_correct_batch", &PreintegrateCorrect_batch_binding<double>, py::arg("preint"), py::arg("bias_delta"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_correct", &PreintegrateCorrect_binding<float>, py::arg("preint"), py::arg("bias_delta"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_correct_batch", &PreintegrateCorrect_batch_binding<float>, py::arg("preint"), py::arg("bias_delta"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_delta", &PreintegrateDelta_binding<double>, py::arg("preint_prev"), py::arg("z_imu_delta"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_delta_batch", &PreintegrateDelta_batch_binding<double>, py::arg("preint_prev"), py::arg("z_imu_delta"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_delta_scan", &PreintegrateDelta_scan_binding<double>, py::arg("preint_prev"), py::arg("z_imu_delta"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_delta", &PreintegrateDelta_binding<float>, py::arg("preint_prev"), py::arg("z_imu_delta"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_delta_batch", &PreintegrateDelta_batch_binding<float>, py::arg("preint_prev"), py::arg("z_imu_delta"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_delta_scan", &PreintegrateDelta_scan_binding<float>, py::arg("preint_prev"), py::arg("z_imu_delta"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_fourth_order", &PreintegrateFourthOrder_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_fourth_order_batch", &PreintegrateFourthOrder_batch_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_fourth_order_scan", &PreintegrateFourthOrder_scan_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_fourth_order", &PreintegrateFourthOrder_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert());
+    m.def("preintegrate_fourth_order_batch", &PreintegrateFourthOrder_batch_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_fourth_order_scan", &PreintegrateFourthOrder_scan_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_jac", &PreintegrateJac_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("jac_gyro").noconvert(), py::arg("jac_accl").noconvert());
+    m.def("preintegrate_jac_batch", &PreintegrateJac_batch_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("jac_gyro").noconvert(), py::arg("jac_accl").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_jac_scan", &PreintegrateJac_scan_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_jac", &PreintegrateJac_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("jac_gyro").noconvert(), py::arg("jac_accl").noconvert());
+    m.def("preintegrate_jac_batch", &PreintegrateJac_batch_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov").noconvert(), py::arg("jac_gyro").noconvert(), py::arg("jac_accl").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_jac_scan", &PreintegrateJac_scan_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_sqrt", &PreintegrateSqrt_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov_sqrt").noconvert());
+    m.def("preintegrate_sqrt_batch", &PreintegrateSqrt_batch_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov_sqrt").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_sqrt_scan", &PreintegrateSqrt_scan_binding<double>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("preintegrate_sqrt", &PreintegrateSqrt_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov_sqrt").noconvert());
+    m.def("preintegrate_sqrt_batch", &PreintegrateSqrt_batch_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("upsilon").noconvert(), py::arg("cov_sqrt").noconvert(), py::arg("parallel") = true);
+    m.def("preintegrate_sqrt_scan", &PreintegrateSqrt_scan_binding<float>, py::arg("imu_noise"), py::arg("preint_prev"), py::arg("z_imu_est"), py::arg("dt"), py::arg("n"), py::arg("out").noconvert(), py::arg("states").noconvert() = py::none());
+    m.def("so3_ljac_inv_coefficient", &So3LjacInvCoefficient_binding<double>, py::arg("phi"), py::arg("output").noconvert());
+    m.def("so3_ljac_inv_coefficient_batch", &So3LjacInvCoefficient_batch_binding<double>, py::arg("phi"), py::arg("output").noconvert(), py::arg("parallel") = true);
+    m.def("so3_ljac_inv_coefficient", &So3LjacInvCoefficient_binding<float>, py::arg("phi"), py::arg("output").noconvert());
+    m.def("so3_ljac_inv_coefficient_batch", &So3LjacInvCoefficient_batch_binding<float>, py::arg("phi"), py::arg("output").noconvert(), py::arg("parallel") = true);
+}
\ No newline at end of file
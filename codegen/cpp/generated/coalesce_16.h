@@ -0,0 +1,1577 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     imu_noise: Matrix61
+ *     samples: Matrix6_16
+ *     dt: Matrix16_1
+ *
+ * Outputs:
+ *     delta: Matrix10_1
+ *     cov: Matrix45_1
+ */
+template <typename Scalar>
+void Coalesce16(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+                const Eigen::Matrix<Scalar, 6, 16>& samples, const Eigen::Matrix<Scalar, 16, 1>& dt,
+                Eigen::Matrix<Scalar, 10, 1>* const delta = nullptr,
+                Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 4216
+
+  // Input arrays
+
+  // Intermediate terms (1102)
+  const Scalar _tmp0 = dt(14, 0) * samples(1, 14);
+  const Scalar _tmp1 = dt(13, 0) * samples(1, 13);
+  const Scalar _tmp2 = dt(12, 0) * samples(1, 12);
+  const Scalar _tmp3 = dt(11, 0) * samples(1, 11);
+  const Scalar _tmp4 = dt(10, 0) * samples(1, 10);
+  const Scalar _tmp5 = dt(9, 0) * samples(1, 9);
+  const Scalar _tmp6 = dt(8, 0) * samples(1, 8);
+  const Scalar _tmp7 = dt(7, 0) * samples(1, 7);
+  const Scalar _tmp8 = dt(6, 0) * samples(1, 6);
+  const Scalar _tmp9 = dt(5, 0) * samples(1, 5);
+  const Scalar _tmp10 = dt(4, 0) * samples(1, 4);
+  const Scalar _tmp11 = dt(3, 0) * samples(1, 3);
+  const Scalar _tmp12 = dt(2, 0) * samples(1, 2);
+  const Scalar _tmp13 = dt(1, 0) * samples(1, 1);
+  const Scalar _tmp14 = dt(0, 0) * samples(1, 0);
+  const Scalar _tmp15 = _tmp13 + _tmp14;
+  const Scalar _tmp16 = _tmp12 + _tmp15;
+  const Scalar _tmp17 = _tmp11 + _tmp16;
+  const Scalar _tmp18 = _tmp10 + _tmp17;
+  const Scalar _tmp19 = _tmp18 + _tmp9;
+  const Scalar _tmp20 = _tmp19 + _tmp8;
+  const Scalar _tmp21 = _tmp20 + _tmp7;
+  const Scalar _tmp22 = _tmp21 + _tmp6;
+  const Scalar _tmp23 = _tmp22 + _tmp5;
+  const Scalar _tmp24 = _tmp23 + _tmp4;
+  const Scalar _tmp25 = _tmp24 + _tmp3;
+  const Scalar _tmp26 = _tmp2 + _tmp25;
+  const Scalar _tmp27 = _tmp1 + _tmp26;
+  const Scalar _tmp28 = _tmp0 + _tmp27;
+  const Scalar _tmp29 = dt(15, 0) * samples(2, 15);
+  const Scalar _tmp30 = dt(14, 0) * samples(2, 14);
+  const Scalar _tmp31 = dt(13, 0) * samples(2, 13);
+  const Scalar _tmp32 = dt(12, 0) * samples(2, 12);
+  const Scalar _tmp33 = dt(11, 0) * samples(2, 11);
+  const Scalar _tmp34 = dt(10, 0) * samples(2, 10);
+  const Scalar _tmp35 = dt(9, 0) * samples(2, 9);
+  const Scalar _tmp36 = dt(8, 0) * samples(2, 8);
+  const Scalar _tmp37 = dt(7, 0) * samples(2, 7);
+  const Scalar _tmp38 = dt(6, 0) * samples(2, 6);
+  const Scalar _tmp39 = dt(5, 0) * samples(2, 5);
+  const Scalar _tmp40 = dt(4, 0) * samples(2, 4);
+  const Scalar _tmp41 = dt(3, 0) * samples(2, 3);
+  const Scalar _tmp42 = dt(2, 0) * samples(2, 2);
+  const Scalar _tmp43 = dt(0, 0) * samples(2, 0);
+  const Scalar _tmp44 = dt(1, 0) * samples(2, 1);
+  const Scalar _tmp45 = _tmp43 + _tmp44;
+  const Scalar _tmp46 = _tmp42 + _tmp45;
+  const Scalar _tmp47 = _tmp41 + _tmp46;
+  const Scalar _tmp48 = _tmp40 + _tmp47;
+  const Scalar _tmp49 = _tmp39 + _tmp48;
+  const Scalar _tmp50 = _tmp38 + _tmp49;
+  const Scalar _tmp51 = _tmp37 + _tmp50;
+  const Scalar _tmp52 = _tmp36 + _tmp51;
+  const Scalar _tmp53 = _tmp35 + _tmp52;
+  const Scalar _tmp54 = _tmp34 + _tmp53;
+  const Scalar _tmp55 = _tmp33 + _tmp54;
+  const Scalar _tmp56 = _tmp32 + _tmp55;
+  const Scalar _tmp57 = _tmp31 + _tmp56;
+  const Scalar _tmp58 = _tmp30 + _tmp57;
+  const Scalar _tmp59 = dt(15, 0) * samples(1, 15);
+  const Scalar _tmp60 = dt(15, 0) * samples(0, 15);
+  const Scalar _tmp61 = dt(14, 0) * samples(0, 14);
+  const Scalar _tmp62 = dt(13, 0) * samples(0, 13);
+  const Scalar _tmp63 = dt(12, 0) * samples(0, 12);
+  const Scalar _tmp64 = dt(11, 0) * samples(0, 11);
+  const Scalar _tmp65 = dt(10, 0) * samples(0, 10);
+  const Scalar _tmp66 = dt(9, 0) * samples(0, 9);
+  const Scalar _tmp67 = dt(8, 0) * samples(0, 8);
+  const Scalar _tmp68 = dt(7, 0) * samples(0, 7);
+  const Scalar _tmp69 = dt(6, 0) * samples(0, 6);
+  const Scalar _tmp70 = dt(5, 0) * samples(0, 5);
+  const Scalar _tmp71 = dt(4, 0) * samples(0, 4);
+  const Scalar _tmp72 = dt(3, 0) * samples(0, 3);
+  const Scalar _tmp73 = dt(2, 0) * samples(0, 2);
+  const Scalar _tmp74 = dt(0, 0) * samples(0, 0);
+  const Scalar _tmp75 = dt(1, 0) * samples(0, 1);
+  const Scalar _tmp76 = _tmp74 + _tmp75;
+  const Scalar _tmp77 =
+      -Scalar(1) / Scalar(2) * _tmp13 * _tmp43 + (Scalar(1) / Scalar(2)) * _tmp14 * _tmp44 + _tmp76;
+  const Scalar _tmp78 = -Scalar(1) / Scalar(2) * _tmp12 * _tmp45 +
+                        (Scalar(1) / Scalar(2)) * _tmp15 * _tmp42 + _tmp73 + _tmp77;
+  const Scalar _tmp79 = -Scalar(1) / Scalar(2) * _tmp11 * _tmp46 +
+                        (Scalar(1) / Scalar(2)) * _tmp16 * _tmp41 + _tmp72 + _tmp78;
+  const Scalar _tmp80 = -Scalar(1) / Scalar(2) * _tmp10 * _tmp47 +
+                        (Scalar(1) / Scalar(2)) * _tmp17 * _tmp40 + _tmp71 + _tmp79;
+  const Scalar _tmp81 = (Scalar(1) / Scalar(2)) * _tmp18 * _tmp39 -
+                        Scalar(1) / Scalar(2) * _tmp48 * _tmp9 + _tmp70 + _tmp80;
+  const Scalar _tmp82 = (Scalar(1) / Scalar(2)) * _tmp19 * _tmp38 -
+                        Scalar(1) / Scalar(2) * _tmp49 * _tmp8 + _tmp69 + _tmp81;
+  const Scalar _tmp83 = (Scalar(1) / Scalar(2)) * _tmp20 * _tmp37 -
+                        Scalar(1) / Scalar(2) * _tmp50 * _tmp7 + _tmp68 + _tmp82;
+  const Scalar _tmp84 = (Scalar(1) / Scalar(2)) * _tmp21 * _tmp36 -
+                        Scalar(1) / Scalar(2) * _tmp51 * _tmp6 + _tmp67 + _tmp83;
+  const Scalar _tmp85 = (Scalar(1) / Scalar(2)) * _tmp22 * _tmp35 -
+                        Scalar(1) / Scalar(2) * _tmp5 * _tmp52 + _tmp66 + _tmp84;
+  const Scalar _tmp86 = (Scalar(1) / Scalar(2)) * _tmp23 * _tmp34 -
+                        Scalar(1) / Scalar(2) * _tmp4 * _tmp53 + _tmp65 + _tmp85;
+  const Scalar _tmp87 = (Scalar(1) / Scalar(2)) * _tmp24 * _tmp33 -
+                        Scalar(1) / Scalar(2) * _tmp3 * _tmp54 + _tmp64 + _tmp86;
+  const Scalar _tmp88 = -Scalar(1) / Scalar(2) * _tmp2 * _tmp55 +
+                        (Scalar(1) / Scalar(2)) * _tmp25 * _tmp32 + _tmp63 + _tmp87;
+  const Scalar _tmp89 = -Scalar(1) / Scalar(2) * _tmp1 * _tmp56 +
+                        (Scalar(1) / Scalar(2)) * _tmp26 * _tmp31 + _tmp62 + _tmp88;
+  const Scalar _tmp90 = -Scalar(1) / Scalar(2) * _tmp0 * _tmp57 +
+                        (Scalar(1) / Scalar(2)) * _tmp27 * _tmp30 + _tmp61 + _tmp89;
+  const Scalar _tmp91 = (Scalar(1) / Scalar(2)) * _tmp28 * _tmp29 -
+                        Scalar(1) / Scalar(2) * _tmp58 * _tmp59 + _tmp60 + _tmp90;
+  const Scalar _tmp92 = std::pow(_tmp91, Scalar(2));
+  const Scalar _tmp93 = _tmp73 + _tmp76;
+  const Scalar _tmp94 = _tmp72 + _tmp93;
+  const Scalar _tmp95 = _tmp71 + _tmp94;
+  const Scalar _tmp96 = _tmp70 + _tmp95;
+  const Scalar _tmp97 = _tmp69 + _tmp96;
+  const Scalar _tmp98 = _tmp68 + _tmp97;
+  const Scalar _tmp99 = _tmp67 + _tmp98;
+  const Scalar _tmp100 = _tmp66 + _tmp99;
+  const Scalar _tmp101 = _tmp100 + _tmp65;
+  const Scalar _tmp102 = _tmp101 + _tmp64;
+  const Scalar _tmp103 = _tmp102 + _tmp63;
+  const Scalar _tmp104 = _tmp103 + _tmp62;
+  const Scalar _tmp105 = _tmp104 + _tmp61;
+  const Scalar _tmp106 =
+      _tmp15 + (Scalar(1) / Scalar(2)) * _tmp43 * _tmp75 - Scalar(1) / Scalar(2) * _tmp44 * _tmp74;
+  const Scalar _tmp107 = _tmp106 + _tmp12 - Scalar(1) / Scalar(2) * _tmp42 * _tmp76 +
+                         (Scalar(1) / Scalar(2)) * _tmp45 * _tmp73;
+  const Scalar _tmp108 = _tmp107 + _tmp11 - Scalar(1) / Scalar(2) * _tmp41 * _tmp93 +
+                         (Scalar(1) / Scalar(2)) * _tmp46 * _tmp72;
+  const Scalar _tmp109 = _tmp10 + _tmp108 - Scalar(1) / Scalar(2) * _tmp40 * _tmp94 +
+                         (Scalar(1) / Scalar(2)) * _tmp47 * _tmp71;
+  const Scalar _tmp110 = _tmp109 - Scalar(1) / Scalar(2) * _tmp39 * _tmp95 +
+                         (Scalar(1) / Scalar(2)) * _tmp48 * _tmp70 + _tmp9;
+  const Scalar _tmp111 = _tmp110 - Scalar(1) / Scalar(2) * _tmp38 * _tmp96 +
+                         (Scalar(1) / Scalar(2)) * _tmp49 * _tmp69 + _tmp8;
+  const Scalar _tmp112 = _tmp111 - Scalar(1) / Scalar(2) * _tmp37 * _tmp97 +
+                         (Scalar(1) / Scalar(2)) * _tmp50 * _tmp68 + _tmp7;
+  const Scalar _tmp113 = _tmp112 - Scalar(1) / Scalar(2) * _tmp36 * _tmp98 +
+                         (Scalar(1) / Scalar(2)) * _tmp51 * _tmp67 + _tmp6;
+  const Scalar _tmp114 = _tmp113 - Scalar(1) / Scalar(2) * _tmp35 * _tmp99 + _tmp5 +
+                         (Scalar(1) / Scalar(2)) * _tmp52 * _tmp66;
+  const Scalar _tmp115 = -Scalar(1) / Scalar(2) * _tmp100 * _tmp34 + _tmp114 + _tmp4 +
+                         (Scalar(1) / Scalar(2)) * _tmp53 * _tmp65;
+  const Scalar _tmp116 = -Scalar(1) / Scalar(2) * _tmp101 * _tmp33 + _tmp115 + _tmp3 +
+                         (Scalar(1) / Scalar(2)) * _tmp54 * _tmp64;
+  const Scalar _tmp117 = -Scalar(1) / Scalar(2) * _tmp102 * _tmp32 + _tmp116 + _tmp2 +
+                         (Scalar(1) / Scalar(2)) * _tmp55 * _tmp63;
+  const Scalar _tmp118 = _tmp1 - Scalar(1) / Scalar(2) * _tmp103 * _tmp31 + _tmp117 +
+                         (Scalar(1) / Scalar(2)) * _tmp56 * _tmp62;
+  const Scalar _tmp119 = _tmp0 - Scalar(1) / Scalar(2) * _tmp104 * _tmp30 + _tmp118 +
+                         (Scalar(1) / Scalar(2)) * _tmp57 * _tmp61;
+  const Scalar _tmp120 = -Scalar(1) / Scalar(2) * _tmp105 * _tmp29 + _tmp119 +
+                         (Scalar(1) / Scalar(2)) * _tmp58 * _tmp60 + _tmp59;
+  const Scalar _tmp121 = std::pow(_tmp120, Scalar(2));
+  const Scalar _tmp122 =
+      (Scalar(1) / Scalar(2)) * _tmp13 * _tmp74 - Scalar(1) / Scalar(2) * _tmp14 * _tmp75 + _tmp45;
+  const Scalar _tmp123 = (Scalar(1) / Scalar(2)) * _tmp12 * _tmp76 + _tmp122 -
+                         Scalar(1) / Scalar(2) * _tmp15 * _tmp73 + _tmp42;
+  const Scalar _tmp124 = (Scalar(1) / Scalar(2)) * _tmp11 * _tmp93 + _tmp123 -
+                         Scalar(1) / Scalar(2) * _tmp16 * _tmp72 + _tmp41;
+  const Scalar _tmp125 = (Scalar(1) / Scalar(2)) * _tmp10 * _tmp94 + _tmp124 -
+                         Scalar(1) / Scalar(2) * _tmp17 * _tmp71 + _tmp40;
+  const Scalar _tmp126 = _tmp125 - Scalar(1) / Scalar(2) * _tmp18 * _tmp70 + _tmp39 +
+                         (Scalar(1) / Scalar(2)) * _tmp9 * _tmp95;
+  const Scalar _tmp127 = _tmp126 - Scalar(1) / Scalar(2) * _tmp19 * _tmp69 + _tmp38 +
+                         (Scalar(1) / Scalar(2)) * _tmp8 * _tmp96;
+  const Scalar _tmp128 = _tmp127 - Scalar(1) / Scalar(2) * _tmp20 * _tmp68 + _tmp37 +
+                         (Scalar(1) / Scalar(2)) * _tmp7 * _tmp97;
+  const Scalar _tmp129 = _tmp128 - Scalar(1) / Scalar(2) * _tmp21 * _tmp67 + _tmp36 +
+                         (Scalar(1) / Scalar(2)) * _tmp6 * _tmp98;
+  const Scalar _tmp130 = _tmp129 - Scalar(1) / Scalar(2) * _tmp22 * _tmp66 + _tmp35 +
+                         (Scalar(1) / Scalar(2)) * _tmp5 * _tmp99;
+  const Scalar _tmp131 = (Scalar(1) / Scalar(2)) * _tmp100 * _tmp4 + _tmp130 -
+                         Scalar(1) / Scalar(2) * _tmp23 * _tmp65 + _tmp34;
+  const Scalar _tmp132 = (Scalar(1) / Scalar(2)) * _tmp101 * _tmp3 + _tmp131 -
+                         Scalar(1) / Scalar(2) * _tmp24 * _tmp64 + _tmp33;
+  const Scalar _tmp133 = (Scalar(1) / Scalar(2)) * _tmp102 * _tmp2 + _tmp132 -
+                         Scalar(1) / Scalar(2) * _tmp25 * _tmp63 + _tmp32;
+  const Scalar _tmp134 = (Scalar(1) / Scalar(2)) * _tmp1 * _tmp103 + _tmp133 -
+                         Scalar(1) / Scalar(2) * _tmp26 * _tmp62 + _tmp31;
+  const Scalar _tmp135 = (Scalar(1) / Scalar(2)) * _tmp0 * _tmp104 + _tmp134 -
+                         Scalar(1) / Scalar(2) * _tmp27 * _tmp61 + _tmp30;
+  const Scalar _tmp136 = (Scalar(1) / Scalar(2)) * _tmp105 * _tmp59 + _tmp135 -
+                         Scalar(1) / Scalar(2) * _tmp28 * _tmp60 + _tmp29;
+  const Scalar _tmp137 = std::pow(_tmp136, Scalar(2));
+  const Scalar _tmp138 = _tmp121 + _tmp137 + _tmp92 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp139 = std::sqrt(_tmp138);
+  const Scalar _tmp140 = (Scalar(1) / Scalar(2)) * _tmp139;
+  const Scalar _tmp141 = std::sin(_tmp140);
+  const Scalar _tmp142 = _tmp141 / _tmp139;
+  const Scalar _tmp143 = _tmp142 * _tmp91;
+  const Scalar _tmp144 = _tmp120 * _tmp142;
+  const Scalar _tmp145 = _tmp136 * _tmp142;
+  const Scalar _tmp146 = std::cos(_tmp140);
+  const Scalar _tmp147 = std::pow(dt(15, 0), Scalar(2));
+  const Scalar _tmp148 = _tmp147 * samples(0, 15);
+  const Scalar _tmp149 = _tmp147 * samples(2, 15);
+  const Scalar _tmp150 = -_tmp148 * samples(5, 15) + _tmp149 * samples(3, 15);
+  const Scalar _tmp151 = _tmp147 * samples(1, 15);
+  const Scalar _tmp152 = -_tmp149 * samples(4, 15) + _tmp151 * samples(5, 15);
+  const Scalar _tmp153 = _tmp148 * samples(4, 15) - _tmp151 * samples(3, 15);
+  const Scalar _tmp154 = (Scalar(1) / Scalar(2)) * _tmp150 * _tmp60 -
+                         Scalar(1) / Scalar(2) * _tmp152 * _tmp59 + _tmp153;
+  const Scalar _tmp155 = (Scalar(1) / Scalar(2)) * dt(15, 0);
+  const Scalar _tmp156 = _tmp154 * _tmp155 + dt(15, 0) * samples(5, 15);
+  const Scalar _tmp157 = (Scalar(1) / Scalar(2)) * _tmp135 * _tmp90;
+  const Scalar _tmp158 = _tmp119 + _tmp157;
+  const Scalar _tmp159 = (Scalar(1) / Scalar(2)) * _tmp119;
+  const Scalar _tmp160 = _tmp159 * _tmp90;
+  const Scalar _tmp161 = -_tmp135 + _tmp160;
+  const Scalar _tmp162 = _tmp150 + (Scalar(1) / Scalar(2)) * _tmp152 * _tmp29 -
+                         Scalar(1) / Scalar(2) * _tmp153 * _tmp60;
+  const Scalar _tmp163 = _tmp155 * _tmp162 + dt(15, 0) * samples(4, 15);
+  const Scalar _tmp164 = -std::pow(_tmp119, Scalar(2));
+  const Scalar _tmp165 = -std::pow(_tmp135, Scalar(2));
+  const Scalar _tmp166 = (Scalar(1) / Scalar(2)) * _tmp164 + (Scalar(1) / Scalar(2)) * _tmp165 + 1;
+  const Scalar _tmp167 = -Scalar(1) / Scalar(2) * _tmp150 * _tmp29 + _tmp152 +
+                         (Scalar(1) / Scalar(2)) * _tmp153 * _tmp59;
+  const Scalar _tmp168 = _tmp155 * _tmp167 + dt(15, 0) * samples(3, 15);
+  const Scalar _tmp169 = -std::pow(_tmp118, Scalar(2));
+  const Scalar _tmp170 = -std::pow(_tmp134, Scalar(2));
+  const Scalar _tmp171 = (Scalar(1) / Scalar(2)) * _tmp169 + (Scalar(1) / Scalar(2)) * _tmp170 + 1;
+  const Scalar _tmp172 = std::pow(dt(14, 0), Scalar(2));
+  const Scalar _tmp173 = _tmp172 * samples(0, 14);
+  const Scalar _tmp174 = _tmp172 * samples(3, 14);
+  const Scalar _tmp175 = -_tmp173 * samples(5, 14) + _tmp174 * samples(2, 14);
+  const Scalar _tmp176 = _tmp173 * samples(4, 14) - _tmp174 * samples(1, 14);
+  const Scalar _tmp177 =
+      _tmp172 * samples(1, 14) * samples(5, 14) - _tmp172 * samples(2, 14) * samples(4, 14);
+  const Scalar _tmp178 = (Scalar(1) / Scalar(2)) * _tmp0 * _tmp176 -
+                         Scalar(1) / Scalar(2) * _tmp175 * _tmp30 + _tmp177;
+  const Scalar _tmp179 = (Scalar(1) / Scalar(2)) * dt(14, 0);
+  const Scalar _tmp180 = _tmp178 * _tmp179 + dt(14, 0) * samples(3, 14);
+  const Scalar _tmp181 = (Scalar(1) / Scalar(2)) * _tmp118 * _tmp89;
+  const Scalar _tmp182 = -_tmp134 + _tmp181;
+  const Scalar _tmp183 = _tmp175 - Scalar(1) / Scalar(2) * _tmp176 * _tmp61 +
+                         (Scalar(1) / Scalar(2)) * _tmp177 * _tmp30;
+  const Scalar _tmp184 = _tmp179 * _tmp183 + dt(14, 0) * samples(4, 14);
+  const Scalar _tmp185 = (Scalar(1) / Scalar(2)) * _tmp134;
+  const Scalar _tmp186 = _tmp185 * _tmp89;
+  const Scalar _tmp187 = _tmp118 + _tmp186;
+  const Scalar _tmp188 = -Scalar(1) / Scalar(2) * _tmp0 * _tmp177 +
+                         (Scalar(1) / Scalar(2)) * _tmp175 * _tmp61 + _tmp176;
+  const Scalar _tmp189 = _tmp179 * _tmp188 + dt(14, 0) * samples(5, 14);
+  const Scalar _tmp190 = std::pow(dt(13, 0), Scalar(2));
+  const Scalar _tmp191 = _tmp190 * samples(0, 13);
+  const Scalar _tmp192 = _tmp190 * samples(1, 13);
+  const Scalar _tmp193 = _tmp191 * samples(4, 13) - _tmp192 * samples(3, 13);
+  const Scalar _tmp194 = _tmp190 * samples(2, 13);
+  const Scalar _tmp195 = _tmp192 * samples(5, 13) - _tmp194 * samples(4, 13);
+  const Scalar _tmp196 = -_tmp191 * samples(5, 13) + _tmp194 * samples(3, 13);
+  const Scalar _tmp197 = -Scalar(1) / Scalar(2) * _tmp193 * _tmp62 +
+                         (Scalar(1) / Scalar(2)) * _tmp195 * _tmp31 + _tmp196;
+  const Scalar _tmp198 = (Scalar(1) / Scalar(2)) * dt(13, 0);
+  const Scalar _tmp199 = _tmp197 * _tmp198 + dt(13, 0) * samples(4, 13);
+  const Scalar _tmp200 = (Scalar(1) / Scalar(2)) * _tmp88;
+  const Scalar _tmp201 = _tmp117 * _tmp200;
+  const Scalar _tmp202 = -_tmp133 + _tmp201;
+  const Scalar _tmp203 = -std::pow(_tmp117, Scalar(2));
+  const Scalar _tmp204 = -std::pow(_tmp133, Scalar(2));
+  const Scalar _tmp205 = (Scalar(1) / Scalar(2)) * _tmp203 + (Scalar(1) / Scalar(2)) * _tmp204 + 1;
+  const Scalar _tmp206 = (Scalar(1) / Scalar(2)) * _tmp1 * _tmp193 + _tmp195 -
+                         Scalar(1) / Scalar(2) * _tmp196 * _tmp31;
+  const Scalar _tmp207 = _tmp198 * _tmp206 + dt(13, 0) * samples(3, 13);
+  const Scalar _tmp208 = _tmp133 * _tmp200;
+  const Scalar _tmp209 = _tmp117 + _tmp208;
+  const Scalar _tmp210 = -Scalar(1) / Scalar(2) * _tmp1 * _tmp195 + _tmp193 +
+                         (Scalar(1) / Scalar(2)) * _tmp196 * _tmp62;
+  const Scalar _tmp211 = _tmp198 * _tmp210 + dt(13, 0) * samples(5, 13);
+  const Scalar _tmp212 = std::pow(dt(12, 0), Scalar(2));
+  const Scalar _tmp213 = _tmp212 * samples(2, 12);
+  const Scalar _tmp214 = _tmp212 * samples(1, 12);
+  const Scalar _tmp215 = -_tmp213 * samples(4, 12) + _tmp214 * samples(5, 12);
+  const Scalar _tmp216 = _tmp212 * samples(0, 12);
+  const Scalar _tmp217 = -_tmp214 * samples(3, 12) + _tmp216 * samples(4, 12);
+  const Scalar _tmp218 = _tmp213 * samples(3, 12) - _tmp216 * samples(5, 12);
+  const Scalar _tmp219 = (Scalar(1) / Scalar(2)) * _tmp215 * _tmp32 -
+                         Scalar(1) / Scalar(2) * _tmp217 * _tmp63 + _tmp218;
+  const Scalar _tmp220 = (Scalar(1) / Scalar(2)) * dt(12, 0);
+  const Scalar _tmp221 = _tmp219 * _tmp220 + dt(12, 0) * samples(4, 12);
+  const Scalar _tmp222 = (Scalar(1) / Scalar(2)) * _tmp116;
+  const Scalar _tmp223 = _tmp222 * _tmp87;
+  const Scalar _tmp224 = -_tmp132 + _tmp223;
+  const Scalar _tmp225 = (Scalar(1) / Scalar(2)) * _tmp2 * _tmp217 + _tmp215 -
+                         Scalar(1) / Scalar(2) * _tmp218 * _tmp32;
+  const Scalar _tmp226 = _tmp220 * _tmp225 + dt(12, 0) * samples(3, 12);
+  const Scalar _tmp227 = -std::pow(_tmp132, Scalar(2));
+  const Scalar _tmp228 = -std::pow(_tmp116, Scalar(2));
+  const Scalar _tmp229 = (Scalar(1) / Scalar(2)) * _tmp227 + (Scalar(1) / Scalar(2)) * _tmp228 + 1;
+  const Scalar _tmp230 = (Scalar(1) / Scalar(2)) * _tmp132 * _tmp87;
+  const Scalar _tmp231 = _tmp116 + _tmp230;
+  const Scalar _tmp232 = -Scalar(1) / Scalar(2) * _tmp2 * _tmp215 + _tmp217 +
+                         (Scalar(1) / Scalar(2)) * _tmp218 * _tmp63;
+  const Scalar _tmp233 = _tmp220 * _tmp232 + dt(12, 0) * samples(5, 12);
+  const Scalar _tmp234 = (Scalar(1) / Scalar(2)) * _tmp115;
+  const Scalar _tmp235 = _tmp234 * _tmp86;
+  const Scalar _tmp236 = -_tmp131 + _tmp235;
+  const Scalar _tmp237 = std::pow(dt(11, 0), Scalar(2));
+  const Scalar _tmp238 = _tmp237 * samples(4, 11);
+  const Scalar _tmp239 = _tmp237 * samples(3, 11);
+  const Scalar _tmp240 = _tmp238 * samples(0, 11) - _tmp239 * samples(1, 11);
+  const Scalar _tmp241 = _tmp237 * samples(5, 11);
+  const Scalar _tmp242 = -_tmp238 * samples(2, 11) + _tmp241 * samples(1, 11);
+  const Scalar _tmp243 = _tmp239 * samples(2, 11) - _tmp241 * samples(0, 11);
+  const Scalar _tmp244 = -Scalar(1) / Scalar(2) * _tmp240 * _tmp64 +
+                         (Scalar(1) / Scalar(2)) * _tmp242 * _tmp33 + _tmp243;
+  const Scalar _tmp245 = (Scalar(1) / Scalar(2)) * dt(11, 0);
+  const Scalar _tmp246 = _tmp244 * _tmp245 + dt(11, 0) * samples(4, 11);
+  const Scalar _tmp247 = _tmp240 - Scalar(1) / Scalar(2) * _tmp242 * _tmp3 +
+                         (Scalar(1) / Scalar(2)) * _tmp243 * _tmp64;
+  const Scalar _tmp248 = _tmp245 * _tmp247 + dt(11, 0) * samples(5, 11);
+  const Scalar _tmp249 = (Scalar(1) / Scalar(2)) * _tmp131 * _tmp86;
+  const Scalar _tmp250 = _tmp115 + _tmp249;
+  const Scalar _tmp251 = -std::pow(_tmp115, Scalar(2));
+  const Scalar _tmp252 = -std::pow(_tmp131, Scalar(2));
+  const Scalar _tmp253 = (Scalar(1) / Scalar(2)) * _tmp251 + (Scalar(1) / Scalar(2)) * _tmp252 + 1;
+  const Scalar _tmp254 = (Scalar(1) / Scalar(2)) * _tmp240 * _tmp3 + _tmp242 -
+                         Scalar(1) / Scalar(2) * _tmp243 * _tmp33;
+  const Scalar _tmp255 = _tmp245 * _tmp254 + dt(11, 0) * samples(3, 11);
+  const Scalar _tmp256 = std::pow(dt(10, 0), Scalar(2));
+  const Scalar _tmp257 = _tmp256 * samples(0, 10);
+  const Scalar _tmp258 = _tmp256 * samples(1, 10);
+  const Scalar _tmp259 = _tmp257 * samples(4, 10) - _tmp258 * samples(3, 10);
+  const Scalar _tmp260 = _tmp256 * samples(2, 10);
+  const Scalar _tmp261 = -_tmp257 * samples(5, 10) + _tmp260 * samples(3, 10);
+  const Scalar _tmp262 = _tmp258 * samples(5, 10) - _tmp260 * samples(4, 10);
+  const Scalar _tmp263 = (Scalar(1) / Scalar(2)) * _tmp259 * _tmp4 -
+                         Scalar(1) / Scalar(2) * _tmp261 * _tmp34 + _tmp262;
+  const Scalar _tmp264 = (Scalar(1) / Scalar(2)) * dt(10, 0);
+  const Scalar _tmp265 = _tmp263 * _tmp264 + dt(10, 0) * samples(3, 10);
+  const Scalar _tmp266 = -std::pow(_tmp130, Scalar(2));
+  const Scalar _tmp267 = -std::pow(_tmp114, Scalar(2));
+  const Scalar _tmp268 = (Scalar(1) / Scalar(2)) * _tmp266 + (Scalar(1) / Scalar(2)) * _tmp267 + 1;
+  const Scalar _tmp269 = -Scalar(1) / Scalar(2) * _tmp259 * _tmp65 + _tmp261 +
+                         (Scalar(1) / Scalar(2)) * _tmp262 * _tmp34;
+  const Scalar _tmp270 = _tmp264 * _tmp269 + dt(10, 0) * samples(4, 10);
+  const Scalar _tmp271 = (Scalar(1) / Scalar(2)) * _tmp85;
+  const Scalar _tmp272 = _tmp114 * _tmp271;
+  const Scalar _tmp273 = -_tmp130 + _tmp272;
+  const Scalar _tmp274 = _tmp130 * _tmp271;
+  const Scalar _tmp275 = _tmp114 + _tmp274;
+  const Scalar _tmp276 = _tmp259 + (Scalar(1) / Scalar(2)) * _tmp261 * _tmp65 -
+                         Scalar(1) / Scalar(2) * _tmp262 * _tmp4;
+  const Scalar _tmp277 = _tmp264 * _tmp276 + dt(10, 0) * samples(5, 10);
+  const Scalar _tmp278 = -std::pow(_tmp113, Scalar(2));
+  const Scalar _tmp279 = -std::pow(_tmp129, Scalar(2));
+  const Scalar _tmp280 = (Scalar(1) / Scalar(2)) * _tmp278 + (Scalar(1) / Scalar(2)) * _tmp279 + 1;
+  const Scalar _tmp281 = std::pow(dt(9, 0), Scalar(2));
+  const Scalar _tmp282 = _tmp281 * samples(1, 9);
+  const Scalar _tmp283 = _tmp281 * samples(0, 9);
+  const Scalar _tmp284 = -_tmp282 * samples(3, 9) + _tmp283 * samples(4, 9);
+  const Scalar _tmp285 = _tmp281 * samples(2, 9);
+  const Scalar _tmp286 = -_tmp283 * samples(5, 9) + _tmp285 * samples(3, 9);
+  const Scalar _tmp287 = _tmp282 * samples(5, 9) - _tmp285 * samples(4, 9);
+  const Scalar _tmp288 = (Scalar(1) / Scalar(2)) * _tmp284 * _tmp5 -
+                         Scalar(1) / Scalar(2) * _tmp286 * _tmp35 + _tmp287;
+  const Scalar _tmp289 = (Scalar(1) / Scalar(2)) * dt(9, 0);
+  const Scalar _tmp290 = _tmp288 * _tmp289 + dt(9, 0) * samples(3, 9);
+  const Scalar _tmp291 = _tmp284 + (Scalar(1) / Scalar(2)) * _tmp286 * _tmp66 -
+                         Scalar(1) / Scalar(2) * _tmp287 * _tmp5;
+  const Scalar _tmp292 = _tmp289 * _tmp291 + dt(9, 0) * samples(5, 9);
+  const Scalar _tmp293 = (Scalar(1) / Scalar(2)) * _tmp129 * _tmp84;
+  const Scalar _tmp294 = _tmp113 + _tmp293;
+  const Scalar _tmp295 = (Scalar(1) / Scalar(2)) * _tmp113;
+  const Scalar _tmp296 = _tmp295 * _tmp84;
+  const Scalar _tmp297 = -_tmp129 + _tmp296;
+  const Scalar _tmp298 = -Scalar(1) / Scalar(2) * _tmp284 * _tmp66 + _tmp286 +
+                         (Scalar(1) / Scalar(2)) * _tmp287 * _tmp35;
+  const Scalar _tmp299 = _tmp289 * _tmp298 + dt(9, 0) * samples(4, 9);
+  const Scalar _tmp300 = (Scalar(1) / Scalar(2)) * _tmp83;
+  const Scalar _tmp301 = _tmp128 * _tmp300;
+  const Scalar _tmp302 = _tmp112 + _tmp301;
+  const Scalar _tmp303 = std::pow(dt(8, 0), Scalar(2));
+  const Scalar _tmp304 = _tmp303 * samples(2, 8);
+  const Scalar _tmp305 = _tmp303 * samples(0, 8);
+  const Scalar _tmp306 = _tmp304 * samples(3, 8) - _tmp305 * samples(5, 8);
+  const Scalar _tmp307 = _tmp303 * samples(1, 8);
+  const Scalar _tmp308 = -_tmp304 * samples(4, 8) + _tmp307 * samples(5, 8);
+  const Scalar _tmp309 = _tmp305 * samples(4, 8) - _tmp307 * samples(3, 8);
+  const Scalar _tmp310 = (Scalar(1) / Scalar(2)) * _tmp306 * _tmp67 -
+                         Scalar(1) / Scalar(2) * _tmp308 * _tmp6 + _tmp309;
+  const Scalar _tmp311 = (Scalar(1) / Scalar(2)) * dt(8, 0);
+  const Scalar _tmp312 = _tmp310 * _tmp311 + dt(8, 0) * samples(5, 8);
+  const Scalar _tmp313 = -std::pow(_tmp128, Scalar(2));
+  const Scalar _tmp314 = -std::pow(_tmp112, Scalar(2));
+  const Scalar _tmp315 = (Scalar(1) / Scalar(2)) * _tmp313 + (Scalar(1) / Scalar(2)) * _tmp314 + 1;
+  const Scalar _tmp316 = -Scalar(1) / Scalar(2) * _tmp306 * _tmp36 + _tmp308 +
+                         (Scalar(1) / Scalar(2)) * _tmp309 * _tmp6;
+  const Scalar _tmp317 = _tmp311 * _tmp316 + dt(8, 0) * samples(3, 8);
+  const Scalar _tmp318 = _tmp306 + (Scalar(1) / Scalar(2)) * _tmp308 * _tmp36 -
+                         Scalar(1) / Scalar(2) * _tmp309 * _tmp67;
+  const Scalar _tmp319 = _tmp311 * _tmp318 + dt(8, 0) * samples(4, 8);
+  const Scalar _tmp320 = _tmp112 * _tmp300;
+  const Scalar _tmp321 = -_tmp128 + _tmp320;
+  const Scalar _tmp322 = std::pow(dt(7, 0), Scalar(2));
+  const Scalar _tmp323 = _tmp322 * samples(3, 7);
+  const Scalar _tmp324 = _tmp322 * samples(0, 7);
+  const Scalar _tmp325 = _tmp323 * samples(2, 7) - _tmp324 * samples(5, 7);
+  const Scalar _tmp326 = -_tmp323 * samples(1, 7) + _tmp324 * samples(4, 7);
+  const Scalar _tmp327 =
+      _tmp322 * samples(1, 7) * samples(5, 7) - _tmp322 * samples(2, 7) * samples(4, 7);
+  const Scalar _tmp328 = -Scalar(1) / Scalar(2) * _tmp325 * _tmp37 +
+                         (Scalar(1) / Scalar(2)) * _tmp326 * _tmp7 + _tmp327;
+  const Scalar _tmp329 = (Scalar(1) / Scalar(2)) * dt(7, 0);
+  const Scalar _tmp330 = _tmp328 * _tmp329 + dt(7, 0) * samples(3, 7);
+  const Scalar _tmp331 = -std::pow(_tmp127, Scalar(2));
+  const Scalar _tmp332 = -std::pow(_tmp111, Scalar(2));
+  const Scalar _tmp333 = (Scalar(1) / Scalar(2)) * _tmp331 + (Scalar(1) / Scalar(2)) * _tmp332 + 1;
+  const Scalar _tmp334 = (Scalar(1) / Scalar(2)) * _tmp82;
+  const Scalar _tmp335 = _tmp127 * _tmp334;
+  const Scalar _tmp336 = _tmp111 + _tmp335;
+  const Scalar _tmp337 = (Scalar(1) / Scalar(2)) * _tmp325 * _tmp68 + _tmp326 -
+                         Scalar(1) / Scalar(2) * _tmp327 * _tmp7;
+  const Scalar _tmp338 = _tmp329 * _tmp337 + dt(7, 0) * samples(5, 7);
+  const Scalar _tmp339 = _tmp325 - Scalar(1) / Scalar(2) * _tmp326 * _tmp68 +
+                         (Scalar(1) / Scalar(2)) * _tmp327 * _tmp37;
+  const Scalar _tmp340 = _tmp329 * _tmp339 + dt(7, 0) * samples(4, 7);
+  const Scalar _tmp341 = _tmp111 * _tmp334;
+  const Scalar _tmp342 = -_tmp127 + _tmp341;
+  const Scalar _tmp343 = std::pow(dt(6, 0), Scalar(2));
+  const Scalar _tmp344 = _tmp343 * samples(5, 6);
+  const Scalar _tmp345 = _tmp343 * samples(4, 6);
+  const Scalar _tmp346 = _tmp344 * samples(1, 6) - _tmp345 * samples(2, 6);
+  const Scalar _tmp347 = _tmp343 * samples(3, 6);
+  const Scalar _tmp348 = -_tmp344 * samples(0, 6) + _tmp347 * samples(2, 6);
+  const Scalar _tmp349 = _tmp345 * samples(0, 6) - _tmp347 * samples(1, 6);
+  const Scalar _tmp350 = -Scalar(1) / Scalar(2) * _tmp346 * _tmp8 +
+                         (Scalar(1) / Scalar(2)) * _tmp348 * _tmp69 + _tmp349;
+  const Scalar _tmp351 = (Scalar(1) / Scalar(2)) * dt(6, 0);
+  const Scalar _tmp352 = _tmp350 * _tmp351 + dt(6, 0) * samples(5, 6);
+  const Scalar _tmp353 = (Scalar(1) / Scalar(2)) * _tmp126;
+  const Scalar _tmp354 = _tmp353 * _tmp81;
+  const Scalar _tmp355 = _tmp110 + _tmp354;
+  const Scalar _tmp356 = (Scalar(1) / Scalar(2)) * _tmp346 * _tmp38 + _tmp348 -
+                         Scalar(1) / Scalar(2) * _tmp349 * _tmp69;
+  const Scalar _tmp357 = _tmp351 * _tmp356 + dt(6, 0) * samples(4, 6);
+  const Scalar _tmp358 = (Scalar(1) / Scalar(2)) * _tmp110 * _tmp81;
+  const Scalar _tmp359 = -_tmp126 + _tmp358;
+  const Scalar _tmp360 = _tmp346 - Scalar(1) / Scalar(2) * _tmp348 * _tmp38 +
+                         (Scalar(1) / Scalar(2)) * _tmp349 * _tmp8;
+  const Scalar _tmp361 = _tmp351 * _tmp360 + dt(6, 0) * samples(3, 6);
+  const Scalar _tmp362 = -std::pow(_tmp110, Scalar(2));
+  const Scalar _tmp363 = -std::pow(_tmp126, Scalar(2));
+  const Scalar _tmp364 = (Scalar(1) / Scalar(2)) * _tmp362 + (Scalar(1) / Scalar(2)) * _tmp363 + 1;
+  const Scalar _tmp365 = std::pow(dt(5, 0), Scalar(2));
+  const Scalar _tmp366 = _tmp365 * samples(5, 5);
+  const Scalar _tmp367 = _tmp365 * samples(4, 5);
+  const Scalar _tmp368 = _tmp366 * samples(1, 5) - _tmp367 * samples(2, 5);
+  const Scalar _tmp369 = _tmp365 * samples(3, 5);
+  const Scalar _tmp370 = -_tmp366 * samples(0, 5) + _tmp369 * samples(2, 5);
+  const Scalar _tmp371 = _tmp367 * samples(0, 5) - _tmp369 * samples(1, 5);
+  const Scalar _tmp372 = -Scalar(1) / Scalar(2) * _tmp368 * _tmp9 +
+                         (Scalar(1) / Scalar(2)) * _tmp370 * _tmp70 + _tmp371;
+  const Scalar _tmp373 = (Scalar(1) / Scalar(2)) * dt(5, 0);
+  const Scalar _tmp374 = _tmp372 * _tmp373 + dt(5, 0) * samples(5, 5);
+  const Scalar _tmp375 = (Scalar(1) / Scalar(2)) * _tmp80;
+  const Scalar _tmp376 = _tmp125 * _tmp375;
+  const Scalar _tmp377 = _tmp109 + _tmp376;
+  const Scalar _tmp378 = (Scalar(1) / Scalar(2)) * _tmp368 * _tmp39 + _tmp370 -
+                         Scalar(1) / Scalar(2) * _tmp371 * _tmp70;
+  const Scalar _tmp379 = _tmp373 * _tmp378 + dt(5, 0) * samples(4, 5);
+  const Scalar _tmp380 = _tmp109 * _tmp375;
+  const Scalar _tmp381 = -_tmp125 + _tmp380;
+  const Scalar _tmp382 = -std::pow(_tmp125, Scalar(2));
+  const Scalar _tmp383 = -std::pow(_tmp109, Scalar(2));
+  const Scalar _tmp384 = (Scalar(1) / Scalar(2)) * _tmp382 + (Scalar(1) / Scalar(2)) * _tmp383 + 1;
+  const Scalar _tmp385 = _tmp368 - Scalar(1) / Scalar(2) * _tmp370 * _tmp39 +
+                         (Scalar(1) / Scalar(2)) * _tmp371 * _tmp9;
+  const Scalar _tmp386 = _tmp373 * _tmp385 + dt(5, 0) * samples(3, 5);
+  const Scalar _tmp387 = -std::pow(_tmp124, Scalar(2));
+  const Scalar _tmp388 = -std::pow(_tmp108, Scalar(2));
+  const Scalar _tmp389 = (Scalar(1) / Scalar(2)) * _tmp387 + (Scalar(1) / Scalar(2)) * _tmp388 + 1;
+  const Scalar _tmp390 = std::pow(dt(4, 0), Scalar(2));
+  const Scalar _tmp391 = _tmp390 * samples(4, 4);
+  const Scalar _tmp392 = _tmp390 * samples(3, 4);
+  const Scalar _tmp393 = _tmp391 * samples(0, 4) - _tmp392 * samples(1, 4);
+  const Scalar _tmp394 = _tmp390 * samples(5, 4);
+  const Scalar _tmp395 = _tmp392 * samples(2, 4) - _tmp394 * samples(0, 4);
+  const Scalar _tmp396 = -_tmp391 * samples(2, 4) + _tmp394 * samples(1, 4);
+  const Scalar _tmp397 = (Scalar(1) / Scalar(2)) * _tmp10 * _tmp393 -
+                         Scalar(1) / Scalar(2) * _tmp395 * _tmp40 + _tmp396;
+  const Scalar _tmp398 = (Scalar(1) / Scalar(2)) * dt(4, 0);
+  const Scalar _tmp399 = _tmp397 * _tmp398 + dt(4, 0) * samples(3, 4);
+  const Scalar _tmp400 = (Scalar(1) / Scalar(2)) * _tmp108;
+  const Scalar _tmp401 = _tmp400 * _tmp79;
+  const Scalar _tmp402 = -_tmp124 + _tmp401;
+  const Scalar _tmp403 = -Scalar(1) / Scalar(2) * _tmp393 * _tmp71 + _tmp395 +
+                         (Scalar(1) / Scalar(2)) * _tmp396 * _tmp40;
+  const Scalar _tmp404 = _tmp398 * _tmp403 + dt(4, 0) * samples(4, 4);
+  const Scalar _tmp405 = -Scalar(1) / Scalar(2) * _tmp10 * _tmp396 + _tmp393 +
+                         (Scalar(1) / Scalar(2)) * _tmp395 * _tmp71;
+  const Scalar _tmp406 = _tmp398 * _tmp405 + dt(4, 0) * samples(5, 4);
+  const Scalar _tmp407 = (Scalar(1) / Scalar(2)) * _tmp124 * _tmp79;
+  const Scalar _tmp408 = _tmp108 + _tmp407;
+  const Scalar _tmp409 = (Scalar(1) / Scalar(2)) * _tmp107;
+  const Scalar _tmp410 = _tmp409 * _tmp78;
+  const Scalar _tmp411 = -_tmp123 + _tmp410;
+  const Scalar _tmp412 = std::pow(dt(3, 0), Scalar(2));
+  const Scalar _tmp413 = _tmp412 * samples(5, 3);
+  const Scalar _tmp414 = _tmp412 * samples(4, 3);
+  const Scalar _tmp415 = _tmp413 * samples(1, 3) - _tmp414 * samples(2, 3);
+  const Scalar _tmp416 = _tmp412 * samples(3, 3);
+  const Scalar _tmp417 = _tmp414 * samples(0, 3) - _tmp416 * samples(1, 3);
+  const Scalar _tmp418 = -_tmp413 * samples(0, 3) + _tmp416 * samples(2, 3);
+  const Scalar _tmp419 = (Scalar(1) / Scalar(2)) * _tmp41 * _tmp415 -
+                         Scalar(1) / Scalar(2) * _tmp417 * _tmp72 + _tmp418;
+  const Scalar _tmp420 = (Scalar(1) / Scalar(2)) * dt(3, 0);
+  const Scalar _tmp421 = _tmp419 * _tmp420 + dt(3, 0) * samples(4, 3);
+  const Scalar _tmp422 = (Scalar(1) / Scalar(2)) * _tmp11 * _tmp417 -
+                         Scalar(1) / Scalar(2) * _tmp41 * _tmp418 + _tmp415;
+  const Scalar _tmp423 = _tmp420 * _tmp422 + dt(3, 0) * samples(3, 3);
+  const Scalar _tmp424 = -std::pow(_tmp107, Scalar(2));
+  const Scalar _tmp425 = -std::pow(_tmp123, Scalar(2));
+  const Scalar _tmp426 = (Scalar(1) / Scalar(2)) * _tmp424 + (Scalar(1) / Scalar(2)) * _tmp425 + 1;
+  const Scalar _tmp427 = (Scalar(1) / Scalar(2)) * _tmp123 * _tmp78;
+  const Scalar _tmp428 = _tmp107 + _tmp427;
+  const Scalar _tmp429 = -Scalar(1) / Scalar(2) * _tmp11 * _tmp415 + _tmp417 +
+                         (Scalar(1) / Scalar(2)) * _tmp418 * _tmp72;
+  const Scalar _tmp430 = _tmp420 * _tmp429 + dt(3, 0) * samples(5, 3);
+  const Scalar _tmp431 = std::pow(dt(2, 0), Scalar(2));
+  const Scalar _tmp432 = _tmp431 * samples(4, 2);
+  const Scalar _tmp433 = _tmp431 * samples(3, 2);
+  const Scalar _tmp434 = _tmp432 * samples(0, 2) - _tmp433 * samples(1, 2);
+  const Scalar _tmp435 = _tmp431 * samples(5, 2);
+  const Scalar _tmp436 = _tmp433 * samples(2, 2) - _tmp435 * samples(0, 2);
+  const Scalar _tmp437 = -_tmp432 * samples(2, 2) + _tmp435 * samples(1, 2);
+  const Scalar _tmp438 = (Scalar(1) / Scalar(2)) * _tmp12 * _tmp434 -
+                         Scalar(1) / Scalar(2) * _tmp42 * _tmp436 + _tmp437;
+  const Scalar _tmp439 = (Scalar(1) / Scalar(2)) * dt(2, 0);
+  const Scalar _tmp440 = _tmp438 * _tmp439 + dt(2, 0) * samples(3, 2);
+  const Scalar _tmp441 = -std::pow(_tmp122, Scalar(2));
+  const Scalar _tmp442 = -std::pow(_tmp106, Scalar(2));
+  const Scalar _tmp443 = (Scalar(1) / Scalar(2)) * _tmp441 + (Scalar(1) / Scalar(2)) * _tmp442 + 1;
+  const Scalar _tmp444 = (Scalar(1) / Scalar(2)) * _tmp42 * _tmp437 -
+                         Scalar(1) / Scalar(2) * _tmp434 * _tmp73 + _tmp436;
+  const Scalar _tmp445 = _tmp439 * _tmp444 + dt(2, 0) * samples(4, 2);
+  const Scalar _tmp446 = (Scalar(1) / Scalar(2)) * _tmp106 * _tmp77;
+  const Scalar _tmp447 = -_tmp122 + _tmp446;
+  const Scalar _tmp448 = -Scalar(1) / Scalar(2) * _tmp12 * _tmp437 + _tmp434 +
+                         (Scalar(1) / Scalar(2)) * _tmp436 * _tmp73;
+  const Scalar _tmp449 = _tmp439 * _tmp448 + dt(2, 0) * samples(5, 2);
+  const Scalar _tmp450 = (Scalar(1) / Scalar(2)) * _tmp122;
+  const Scalar _tmp451 = _tmp450 * _tmp77;
+  const Scalar _tmp452 = _tmp106 + _tmp451;
+  const Scalar _tmp453 = std::pow(dt(0, 0), Scalar(2));
+  const Scalar _tmp454 = (Scalar(1) / Scalar(2)) * _tmp453;
+  const Scalar _tmp455 = _tmp454 * samples(2, 0);
+  const Scalar _tmp456 = _tmp455 * samples(0, 0);
+  const Scalar _tmp457 = _tmp14 + _tmp456;
+  const Scalar _tmp458 = std::pow(dt(1, 0), Scalar(2));
+  const Scalar _tmp459 = _tmp458 * samples(4, 1);
+  const Scalar _tmp460 = _tmp458 * samples(5, 1);
+  const Scalar _tmp461 = -_tmp459 * samples(2, 1) + _tmp460 * samples(1, 1);
+  const Scalar _tmp462 = _tmp458 * samples(3, 1);
+  const Scalar _tmp463 = -_tmp460 * samples(0, 1) + _tmp462 * samples(2, 1);
+  const Scalar _tmp464 = _tmp459 * samples(0, 1) - _tmp462 * samples(1, 1);
+  const Scalar _tmp465 = -Scalar(1) / Scalar(2) * _tmp13 * _tmp461 +
+                         (Scalar(1) / Scalar(2)) * _tmp463 * _tmp75 + _tmp464;
+  const Scalar _tmp466 = (Scalar(1) / Scalar(2)) * dt(1, 0);
+  const Scalar _tmp467 = _tmp465 * _tmp466 + dt(1, 0) * samples(5, 1);
+  const Scalar _tmp468 = -_tmp453 * std::pow(samples(2, 0), Scalar(2));
+  const Scalar _tmp469 = -_tmp453 * std::pow(samples(1, 0), Scalar(2));
+  const Scalar _tmp470 = (Scalar(1) / Scalar(2)) * _tmp468 + (Scalar(1) / Scalar(2)) * _tmp469 + 1;
+  const Scalar _tmp471 = (Scalar(1) / Scalar(2)) * _tmp13 * _tmp464 -
+                         Scalar(1) / Scalar(2) * _tmp44 * _tmp463 + _tmp461;
+  const Scalar _tmp472 = _tmp466 * _tmp471 + dt(1, 0) * samples(3, 1);
+  const Scalar _tmp473 = _tmp454 * samples(0, 0) * samples(1, 0);
+  const Scalar _tmp474 = -_tmp43 + _tmp473;
+  const Scalar _tmp475 = (Scalar(1) / Scalar(2)) * _tmp44 * _tmp461 + _tmp463 -
+                         Scalar(1) / Scalar(2) * _tmp464 * _tmp75;
+  const Scalar _tmp476 = _tmp466 * _tmp475 + dt(1, 0) * samples(4, 1);
+  const Scalar _tmp477 = _tmp453 * samples(4, 0);
+  const Scalar _tmp478 = _tmp453 * samples(3, 0);
+  const Scalar _tmp479 = _tmp477 * samples(0, 0) - _tmp478 * samples(1, 0);
+  const Scalar _tmp480 = _tmp453 * samples(5, 0);
+  const Scalar _tmp481 = _tmp478 * samples(2, 0) - _tmp480 * samples(0, 0);
+  const Scalar _tmp482 = -_tmp477 * samples(2, 0) + _tmp480 * samples(1, 0);
+  const Scalar _tmp483 = (Scalar(1) / Scalar(2)) * _tmp14 * _tmp479 -
+                         Scalar(1) / Scalar(2) * _tmp43 * _tmp481 + _tmp482;
+  const Scalar _tmp484 = (Scalar(1) / Scalar(2)) * dt(0, 0);
+  const Scalar _tmp485 = _tmp483 * _tmp484 + dt(0, 0) * samples(3, 0);
+  const Scalar _tmp486 = _tmp457 * _tmp467 + _tmp470 * _tmp472 + _tmp474 * _tmp476 + _tmp485;
+  const Scalar _tmp487 = _tmp440 * _tmp443 + _tmp445 * _tmp447 + _tmp449 * _tmp452 + _tmp486;
+  const Scalar _tmp488 = _tmp411 * _tmp421 + _tmp423 * _tmp426 + _tmp428 * _tmp430 + _tmp487;
+  const Scalar _tmp489 = _tmp389 * _tmp399 + _tmp402 * _tmp404 + _tmp406 * _tmp408 + _tmp488;
+  const Scalar _tmp490 = _tmp374 * _tmp377 + _tmp379 * _tmp381 + _tmp384 * _tmp386 + _tmp489;
+  const Scalar _tmp491 = _tmp352 * _tmp355 + _tmp357 * _tmp359 + _tmp361 * _tmp364 + _tmp490;
+  const Scalar _tmp492 = _tmp330 * _tmp333 + _tmp336 * _tmp338 + _tmp340 * _tmp342 + _tmp491;
+  const Scalar _tmp493 = _tmp302 * _tmp312 + _tmp315 * _tmp317 + _tmp319 * _tmp321 + _tmp492;
+  const Scalar _tmp494 = _tmp280 * _tmp290 + _tmp292 * _tmp294 + _tmp297 * _tmp299 + _tmp493;
+  const Scalar _tmp495 = _tmp265 * _tmp268 + _tmp270 * _tmp273 + _tmp275 * _tmp277 + _tmp494;
+  const Scalar _tmp496 = _tmp236 * _tmp246 + _tmp248 * _tmp250 + _tmp253 * _tmp255 + _tmp495;
+  const Scalar _tmp497 = _tmp221 * _tmp224 + _tmp226 * _tmp229 + _tmp231 * _tmp233 + _tmp496;
+  const Scalar _tmp498 = _tmp199 * _tmp202 + _tmp205 * _tmp207 + _tmp209 * _tmp211 + _tmp497;
+  const Scalar _tmp499 = _tmp171 * _tmp180 + _tmp182 * _tmp184 + _tmp187 * _tmp189 + _tmp498;
+  const Scalar _tmp500 = _tmp156 * _tmp158 + _tmp161 * _tmp163 + _tmp166 * _tmp168 + _tmp499;
+  const Scalar _tmp501 = _tmp135 + _tmp160;
+  const Scalar _tmp502 = -std::pow(_tmp90, Scalar(2));
+  const Scalar _tmp503 = (Scalar(1) / Scalar(2)) * _tmp165 + (Scalar(1) / Scalar(2)) * _tmp502 + 1;
+  const Scalar _tmp504 = _tmp135 * _tmp159;
+  const Scalar _tmp505 = _tmp504 - _tmp90;
+  const Scalar _tmp506 = -std::pow(_tmp89, Scalar(2));
+  const Scalar _tmp507 = (Scalar(1) / Scalar(2)) * _tmp170 + (Scalar(1) / Scalar(2)) * _tmp506 + 1;
+  const Scalar _tmp508 = _tmp134 + _tmp181;
+  const Scalar _tmp509 = _tmp118 * _tmp185;
+  const Scalar _tmp510 = _tmp509 - _tmp89;
+  const Scalar _tmp511 = (Scalar(1) / Scalar(2)) * _tmp117 * _tmp133;
+  const Scalar _tmp512 = _tmp511 - _tmp88;
+  const Scalar _tmp513 = -std::pow(_tmp88, Scalar(2));
+  const Scalar _tmp514 = (Scalar(1) / Scalar(2)) * _tmp204 + (Scalar(1) / Scalar(2)) * _tmp513 + 1;
+  const Scalar _tmp515 = _tmp133 + _tmp201;
+  const Scalar _tmp516 = _tmp132 + _tmp223;
+  const Scalar _tmp517 = -std::pow(_tmp87, Scalar(2));
+  const Scalar _tmp518 = (Scalar(1) / Scalar(2)) * _tmp227 + (Scalar(1) / Scalar(2)) * _tmp517 + 1;
+  const Scalar _tmp519 = _tmp132 * _tmp222;
+  const Scalar _tmp520 = _tmp519 - _tmp87;
+  const Scalar _tmp521 = _tmp131 + _tmp235;
+  const Scalar _tmp522 = -std::pow(_tmp86, Scalar(2));
+  const Scalar _tmp523 = (Scalar(1) / Scalar(2)) * _tmp252 + (Scalar(1) / Scalar(2)) * _tmp522 + 1;
+  const Scalar _tmp524 = _tmp131 * _tmp234;
+  const Scalar _tmp525 = _tmp524 - _tmp86;
+  const Scalar _tmp526 = (Scalar(1) / Scalar(2)) * _tmp114 * _tmp130;
+  const Scalar _tmp527 = _tmp526 - _tmp85;
+  const Scalar _tmp528 = _tmp130 + _tmp272;
+  const Scalar _tmp529 = -std::pow(_tmp85, Scalar(2));
+  const Scalar _tmp530 = (Scalar(1) / Scalar(2)) * _tmp266 + (Scalar(1) / Scalar(2)) * _tmp529 + 1;
+  const Scalar _tmp531 = -std::pow(_tmp84, Scalar(2));
+  const Scalar _tmp532 = (Scalar(1) / Scalar(2)) * _tmp279 + (Scalar(1) / Scalar(2)) * _tmp531 + 1;
+  const Scalar _tmp533 = _tmp129 + _tmp296;
+  const Scalar _tmp534 = _tmp129 * _tmp295;
+  const Scalar _tmp535 = _tmp534 - _tmp84;
+  const Scalar _tmp536 = (Scalar(1) / Scalar(2)) * _tmp112 * _tmp128;
+  const Scalar _tmp537 = _tmp536 - _tmp83;
+  const Scalar _tmp538 = -std::pow(_tmp83, Scalar(2));
+  const Scalar _tmp539 = (Scalar(1) / Scalar(2)) * _tmp313 + (Scalar(1) / Scalar(2)) * _tmp538 + 1;
+  const Scalar _tmp540 = _tmp128 + _tmp320;
+  const Scalar _tmp541 = (Scalar(1) / Scalar(2)) * _tmp111 * _tmp127;
+  const Scalar _tmp542 = _tmp541 - _tmp82;
+  const Scalar _tmp543 = _tmp127 + _tmp341;
+  const Scalar _tmp544 = -std::pow(_tmp82, Scalar(2));
+  const Scalar _tmp545 = (Scalar(1) / Scalar(2)) * _tmp331 + (Scalar(1) / Scalar(2)) * _tmp544 + 1;
+  const Scalar _tmp546 = _tmp126 + _tmp358;
+  const Scalar _tmp547 = -std::pow(_tmp81, Scalar(2));
+  const Scalar _tmp548 = (Scalar(1) / Scalar(2)) * _tmp363 + (Scalar(1) / Scalar(2)) * _tmp547 + 1;
+  const Scalar _tmp549 = _tmp110 * _tmp353;
+  const Scalar _tmp550 = _tmp549 - _tmp81;
+  const Scalar _tmp551 = -std::pow(_tmp80, Scalar(2));
+  const Scalar _tmp552 = (Scalar(1) / Scalar(2)) * _tmp382 + (Scalar(1) / Scalar(2)) * _tmp551 + 1;
+  const Scalar _tmp553 = (Scalar(1) / Scalar(2)) * _tmp109 * _tmp125;
+  const Scalar _tmp554 = _tmp553 - _tmp80;
+  const Scalar _tmp555 = _tmp125 + _tmp380;
+  const Scalar _tmp556 = _tmp124 * _tmp400;
+  const Scalar _tmp557 = _tmp556 - _tmp79;
+  const Scalar _tmp558 = _tmp124 + _tmp401;
+  const Scalar _tmp559 = -std::pow(_tmp79, Scalar(2));
+  const Scalar _tmp560 = (Scalar(1) / Scalar(2)) * _tmp387 + (Scalar(1) / Scalar(2)) * _tmp559 + 1;
+  const Scalar _tmp561 = _tmp123 * _tmp409;
+  const Scalar _tmp562 = _tmp561 - _tmp78;
+  const Scalar _tmp563 = -std::pow(_tmp78, Scalar(2));
+  const Scalar _tmp564 = (Scalar(1) / Scalar(2)) * _tmp425 + (Scalar(1) / Scalar(2)) * _tmp563 + 1;
+  const Scalar _tmp565 = _tmp123 + _tmp410;
+  const Scalar _tmp566 = _tmp106 * _tmp450;
+  const Scalar _tmp567 = _tmp566 - _tmp77;
+  const Scalar _tmp568 = -std::pow(_tmp77, Scalar(2));
+  const Scalar _tmp569 = (Scalar(1) / Scalar(2)) * _tmp441 + (Scalar(1) / Scalar(2)) * _tmp568 + 1;
+  const Scalar _tmp570 = _tmp122 + _tmp446;
+  const Scalar _tmp571 = _tmp43 + _tmp473;
+  const Scalar _tmp572 = _tmp455 * samples(1, 0);
+  const Scalar _tmp573 = _tmp572 - _tmp74;
+  const Scalar _tmp574 = -_tmp453 * std::pow(samples(0, 0), Scalar(2));
+  const Scalar _tmp575 = (Scalar(1) / Scalar(2)) * _tmp468 + (Scalar(1) / Scalar(2)) * _tmp574 + 1;
+  const Scalar _tmp576 = (Scalar(1) / Scalar(2)) * _tmp43 * _tmp482 -
+                         Scalar(1) / Scalar(2) * _tmp479 * _tmp74 + _tmp481;
+  const Scalar _tmp577 = _tmp484 * _tmp576 + dt(0, 0) * samples(4, 0);
+  const Scalar _tmp578 = _tmp467 * _tmp573 + _tmp472 * _tmp571 + _tmp476 * _tmp575 + _tmp577;
+  const Scalar _tmp579 = _tmp440 * _tmp570 + _tmp445 * _tmp569 + _tmp449 * _tmp567 + _tmp578;
+  const Scalar _tmp580 = _tmp421 * _tmp564 + _tmp423 * _tmp565 + _tmp430 * _tmp562 + _tmp579;
+  const Scalar _tmp581 = _tmp399 * _tmp558 + _tmp404 * _tmp560 + _tmp406 * _tmp557 + _tmp580;
+  const Scalar _tmp582 = _tmp374 * _tmp554 + _tmp379 * _tmp552 + _tmp386 * _tmp555 + _tmp581;
+  const Scalar _tmp583 = _tmp352 * _tmp550 + _tmp357 * _tmp548 + _tmp361 * _tmp546 + _tmp582;
+  const Scalar _tmp584 = _tmp330 * _tmp543 + _tmp338 * _tmp542 + _tmp340 * _tmp545 + _tmp583;
+  const Scalar _tmp585 = _tmp312 * _tmp537 + _tmp317 * _tmp540 + _tmp319 * _tmp539 + _tmp584;
+  const Scalar _tmp586 = _tmp290 * _tmp533 + _tmp292 * _tmp535 + _tmp299 * _tmp532 + _tmp585;
+  const Scalar _tmp587 = _tmp265 * _tmp528 + _tmp270 * _tmp530 + _tmp277 * _tmp527 + _tmp586;
+  const Scalar _tmp588 = _tmp246 * _tmp523 + _tmp248 * _tmp525 + _tmp255 * _tmp521 + _tmp587;
+  const Scalar _tmp589 = _tmp221 * _tmp518 + _tmp226 * _tmp516 + _tmp233 * _tmp520 + _tmp588;
+  const Scalar _tmp590 = _tmp199 * _tmp514 + _tmp207 * _tmp515 + _tmp211 * _tmp512 + _tmp589;
+  const Scalar _tmp591 = _tmp180 * _tmp508 + _tmp184 * _tmp507 + _tmp189 * _tmp510 + _tmp590;
+  const Scalar _tmp592 = _tmp156 * _tmp505 + _tmp163 * _tmp503 + _tmp168 * _tmp501 + _tmp591;
+  const Scalar _tmp593 = -_tmp119 + _tmp157;
+  const Scalar _tmp594 = (Scalar(1) / Scalar(2)) * _tmp164 + (Scalar(1) / Scalar(2)) * _tmp502 + 1;
+  const Scalar _tmp595 = _tmp504 + _tmp90;
+  const Scalar _tmp596 = _tmp509 + _tmp89;
+  const Scalar _tmp597 = -_tmp118 + _tmp186;
+  const Scalar _tmp598 = (Scalar(1) / Scalar(2)) * _tmp169 + (Scalar(1) / Scalar(2)) * _tmp506 + 1;
+  const Scalar _tmp599 = _tmp511 + _tmp88;
+  const Scalar _tmp600 = (Scalar(1) / Scalar(2)) * _tmp203 + (Scalar(1) / Scalar(2)) * _tmp513 + 1;
+  const Scalar _tmp601 = -_tmp117 + _tmp208;
+  const Scalar _tmp602 = _tmp519 + _tmp87;
+  const Scalar _tmp603 = (Scalar(1) / Scalar(2)) * _tmp228 + (Scalar(1) / Scalar(2)) * _tmp517 + 1;
+  const Scalar _tmp604 = -_tmp116 + _tmp230;
+  const Scalar _tmp605 = -_tmp115 + _tmp249;
+  const Scalar _tmp606 = _tmp524 + _tmp86;
+  const Scalar _tmp607 = (Scalar(1) / Scalar(2)) * _tmp251 + (Scalar(1) / Scalar(2)) * _tmp522 + 1;
+  const Scalar _tmp608 = (Scalar(1) / Scalar(2)) * _tmp267 + (Scalar(1) / Scalar(2)) * _tmp529 + 1;
+  const Scalar _tmp609 = _tmp526 + _tmp85;
+  const Scalar _tmp610 = -_tmp114 + _tmp274;
+  const Scalar _tmp611 = -_tmp113 + _tmp293;
+  const Scalar _tmp612 = _tmp534 + _tmp84;
+  const Scalar _tmp613 = (Scalar(1) / Scalar(2)) * _tmp278 + (Scalar(1) / Scalar(2)) * _tmp531 + 1;
+  const Scalar _tmp614 = (Scalar(1) / Scalar(2)) * _tmp314 + (Scalar(1) / Scalar(2)) * _tmp538 + 1;
+  const Scalar _tmp615 = _tmp536 + _tmp83;
+  const Scalar _tmp616 = -_tmp112 + _tmp301;
+  const Scalar _tmp617 = _tmp541 + _tmp82;
+  const Scalar _tmp618 = (Scalar(1) / Scalar(2)) * _tmp332 + (Scalar(1) / Scalar(2)) * _tmp544 + 1;
+  const Scalar _tmp619 = -_tmp111 + _tmp335;
+  const Scalar _tmp620 = (Scalar(1) / Scalar(2)) * _tmp362 + (Scalar(1) / Scalar(2)) * _tmp547 + 1;
+  const Scalar _tmp621 = -_tmp110 + _tmp354;
+  const Scalar _tmp622 = _tmp549 + _tmp81;
+  const Scalar _tmp623 = -_tmp109 + _tmp376;
+  const Scalar _tmp624 = _tmp553 + _tmp80;
+  const Scalar _tmp625 = (Scalar(1) / Scalar(2)) * _tmp383 + (Scalar(1) / Scalar(2)) * _tmp551 + 1;
+  const Scalar _tmp626 = -_tmp108 + _tmp407;
+  const Scalar _tmp627 = _tmp556 + _tmp79;
+  const Scalar _tmp628 = (Scalar(1) / Scalar(2)) * _tmp388 + (Scalar(1) / Scalar(2)) * _tmp559 + 1;
+  const Scalar _tmp629 = -_tmp107 + _tmp427;
+  const Scalar _tmp630 = (Scalar(1) / Scalar(2)) * _tmp424 + (Scalar(1) / Scalar(2)) * _tmp563 + 1;
+  const Scalar _tmp631 = _tmp561 + _tmp78;
+  const Scalar _tmp632 = _tmp566 + _tmp77;
+  const Scalar _tmp633 = (Scalar(1) / Scalar(2)) * _tmp442 + (Scalar(1) / Scalar(2)) * _tmp568 + 1;
+  const Scalar _tmp634 = -_tmp106 + _tmp451;
+  const Scalar _tmp635 = -_tmp14 + _tmp456;
+  const Scalar _tmp636 = (Scalar(1) / Scalar(2)) * _tmp469 + (Scalar(1) / Scalar(2)) * _tmp574 + 1;
+  const Scalar _tmp637 = _tmp572 + _tmp74;
+  const Scalar _tmp638 = -Scalar(1) / Scalar(2) * _tmp14 * _tmp482 + _tmp479 +
+                         (Scalar(1) / Scalar(2)) * _tmp481 * _tmp74;
+  const Scalar _tmp639 = _tmp484 * _tmp638 + dt(0, 0) * samples(5, 0);
+  const Scalar _tmp640 = _tmp467 * _tmp636 + _tmp472 * _tmp635 + _tmp476 * _tmp637 + _tmp639;
+  const Scalar _tmp641 = _tmp440 * _tmp634 + _tmp445 * _tmp632 + _tmp449 * _tmp633 + _tmp640;
+  const Scalar _tmp642 = _tmp421 * _tmp631 + _tmp423 * _tmp629 + _tmp430 * _tmp630 + _tmp641;
+  const Scalar _tmp643 = _tmp399 * _tmp626 + _tmp404 * _tmp627 + _tmp406 * _tmp628 + _tmp642;
+  const Scalar _tmp644 = _tmp374 * _tmp625 + _tmp379 * _tmp624 + _tmp386 * _tmp623 + _tmp643;
+  const Scalar _tmp645 = _tmp352 * _tmp620 + _tmp357 * _tmp622 + _tmp361 * _tmp621 + _tmp644;
+  const Scalar _tmp646 = _tmp330 * _tmp619 + _tmp338 * _tmp618 + _tmp340 * _tmp617 + _tmp645;
+  const Scalar _tmp647 = _tmp312 * _tmp614 + _tmp317 * _tmp616 + _tmp319 * _tmp615 + _tmp646;
+  const Scalar _tmp648 = _tmp290 * _tmp611 + _tmp292 * _tmp613 + _tmp299 * _tmp612 + _tmp647;
+  const Scalar _tmp649 = _tmp265 * _tmp610 + _tmp270 * _tmp609 + _tmp277 * _tmp608 + _tmp648;
+  const Scalar _tmp650 = _tmp246 * _tmp606 + _tmp248 * _tmp607 + _tmp255 * _tmp605 + _tmp649;
+  const Scalar _tmp651 = _tmp221 * _tmp602 + _tmp226 * _tmp604 + _tmp233 * _tmp603 + _tmp650;
+  const Scalar _tmp652 = _tmp199 * _tmp599 + _tmp207 * _tmp601 + _tmp211 * _tmp600 + _tmp651;
+  const Scalar _tmp653 = _tmp180 * _tmp597 + _tmp184 * _tmp596 + _tmp189 * _tmp598 + _tmp652;
+  const Scalar _tmp654 = _tmp156 * _tmp594 + _tmp163 * _tmp595 + _tmp168 * _tmp593 + _tmp653;
+  const Scalar _tmp655 = (Scalar(1) / Scalar(2)) * _tmp147;
+  const Scalar _tmp656 = (Scalar(1) / Scalar(6)) * _tmp147;
+  const Scalar _tmp657 = _tmp154 * _tmp656 + _tmp655 * samples(5, 15);
+  const Scalar _tmp658 = _tmp162 * _tmp656 + _tmp655 * samples(4, 15);
+  const Scalar _tmp659 = _tmp167 * _tmp656 + _tmp655 * samples(3, 15);
+  const Scalar _tmp660 = (Scalar(1) / Scalar(2)) * _tmp172;
+  const Scalar _tmp661 = (Scalar(1) / Scalar(6)) * _tmp172;
+  const Scalar _tmp662 = _tmp178 * _tmp661 + _tmp660 * samples(3, 14);
+  const Scalar _tmp663 = _tmp183 * _tmp661 + _tmp660 * samples(4, 14);
+  const Scalar _tmp664 = _tmp188 * _tmp661 + _tmp660 * samples(5, 14);
+  const Scalar _tmp665 = (Scalar(1) / Scalar(2)) * _tmp190;
+  const Scalar _tmp666 = (Scalar(1) / Scalar(6)) * _tmp190;
+  const Scalar _tmp667 = _tmp197 * _tmp666 + _tmp665 * samples(4, 13);
+  const Scalar _tmp668 = _tmp206 * _tmp666 + _tmp665 * samples(3, 13);
+  const Scalar _tmp669 = _tmp210 * _tmp666 + _tmp665 * samples(5, 13);
+  const Scalar _tmp670 = (Scalar(1) / Scalar(2)) * _tmp212;
+  const Scalar _tmp671 = (Scalar(1) / Scalar(6)) * _tmp212;
+  const Scalar _tmp672 = _tmp219 * _tmp671 + _tmp670 * samples(4, 12);
+  const Scalar _tmp673 = _tmp225 * _tmp671 + _tmp670 * samples(3, 12);
+  const Scalar _tmp674 = _tmp232 * _tmp671 + _tmp670 * samples(5, 12);
+  const Scalar _tmp675 = (Scalar(1) / Scalar(6)) * _tmp237;
+  const Scalar _tmp676 = (Scalar(1) / Scalar(2)) * _tmp238 + _tmp244 * _tmp675;
+  const Scalar _tmp677 = (Scalar(1) / Scalar(2)) * _tmp241 + _tmp247 * _tmp675;
+  const Scalar _tmp678 = (Scalar(1) / Scalar(2)) * _tmp239 + _tmp254 * _tmp675;
+  const Scalar _tmp679 = (Scalar(1) / Scalar(2)) * _tmp256;
+  const Scalar _tmp680 = (Scalar(1) / Scalar(6)) * _tmp256;
+  const Scalar _tmp681 = _tmp263 * _tmp680 + _tmp679 * samples(3, 10);
+  const Scalar _tmp682 = _tmp269 * _tmp680 + _tmp679 * samples(4, 10);
+  const Scalar _tmp683 = _tmp276 * _tmp680 + _tmp679 * samples(5, 10);
+  const Scalar _tmp684 = (Scalar(1) / Scalar(6)) * _tmp281;
+  const Scalar _tmp685 = (Scalar(1) / Scalar(2)) * _tmp281;
+  const Scalar _tmp686 = _tmp288 * _tmp684 + _tmp685 * samples(3, 9);
+  const Scalar _tmp687 = _tmp291 * _tmp684 + _tmp685 * samples(5, 9);
+  const Scalar _tmp688 = _tmp298 * _tmp684 + _tmp685 * samples(4, 9);
+  const Scalar _tmp689 = (Scalar(1) / Scalar(6)) * _tmp303;
+  const Scalar _tmp690 = (Scalar(1) / Scalar(2)) * _tmp303;
+  const Scalar _tmp691 = _tmp310 * _tmp689 + _tmp690 * samples(5, 8);
+  const Scalar _tmp692 = _tmp316 * _tmp689 + _tmp690 * samples(3, 8);
+  const Scalar _tmp693 = _tmp318 * _tmp689 + _tmp690 * samples(4, 8);
+  const Scalar _tmp694 = (Scalar(1) / Scalar(6)) * _tmp322;
+  const Scalar _tmp695 = (Scalar(1) / Scalar(2)) * _tmp322;
+  const Scalar _tmp696 = _tmp328 * _tmp694 + _tmp695 * samples(3, 7);
+  const Scalar _tmp697 = _tmp337 * _tmp694 + _tmp695 * samples(5, 7);
+  const Scalar _tmp698 = _tmp339 * _tmp694 + _tmp695 * samples(4, 7);
+  const Scalar _tmp699 = (Scalar(1) / Scalar(6)) * _tmp343;
+  const Scalar _tmp700 = (Scalar(1) / Scalar(2)) * _tmp343;
+  const Scalar _tmp701 = _tmp350 * _tmp699 + _tmp700 * samples(5, 6);
+  const Scalar _tmp702 = _tmp356 * _tmp699 + _tmp700 * samples(4, 6);
+  const Scalar _tmp703 = _tmp360 * _tmp699 + _tmp700 * samples(3, 6);
+  const Scalar _tmp704 = (Scalar(1) / Scalar(6)) * _tmp365;
+  const Scalar _tmp705 = (Scalar(1) / Scalar(2)) * _tmp365;
+  const Scalar _tmp706 = _tmp372 * _tmp704 + _tmp705 * samples(5, 5);
+  const Scalar _tmp707 = _tmp378 * _tmp704 + _tmp705 * samples(4, 5);
+  const Scalar _tmp708 = _tmp385 * _tmp704 + _tmp705 * samples(3, 5);
+  const Scalar _tmp709 = (Scalar(1) / Scalar(6)) * _tmp390;
+  const Scalar _tmp710 = (Scalar(1) / Scalar(2)) * _tmp390;
+  const Scalar _tmp711 = _tmp397 * _tmp709 + _tmp710 * samples(3, 4);
+  const Scalar _tmp712 = _tmp403 * _tmp709 + _tmp710 * samples(4, 4);
+  const Scalar _tmp713 = _tmp405 * _tmp709 + _tmp710 * samples(5, 4);
+  const Scalar _tmp714 = (Scalar(1) / Scalar(6)) * _tmp412;
+  const Scalar _tmp715 = (Scalar(1) / Scalar(2)) * _tmp412;
+  const Scalar _tmp716 = _tmp419 * _tmp714 + _tmp715 * samples(4, 3);
+  const Scalar _tmp717 = _tmp422 * _tmp714 + _tmp715 * samples(3, 3);
+  const Scalar _tmp718 = _tmp429 * _tmp714 + _tmp715 * samples(5, 3);
+  const Scalar _tmp719 = (Scalar(1) / Scalar(6)) * _tmp431;
+  const Scalar _tmp720 = (Scalar(1) / Scalar(2)) * _tmp431;
+  const Scalar _tmp721 = _tmp438 * _tmp719 + _tmp720 * samples(3, 2);
+  const Scalar _tmp722 = _tmp444 * _tmp719 + _tmp720 * samples(4, 2);
+  const Scalar _tmp723 = _tmp448 * _tmp719 + _tmp720 * samples(5, 2);
+  const Scalar _tmp724 = (Scalar(1) / Scalar(6)) * _tmp458;
+  const Scalar _tmp725 = (Scalar(1) / Scalar(2)) * _tmp458;
+  const Scalar _tmp726 = _tmp465 * _tmp724 + _tmp725 * samples(5, 1);
+  const Scalar _tmp727 = _tmp471 * _tmp724 + _tmp725 * samples(3, 1);
+  const Scalar _tmp728 = _tmp475 * _tmp724 + _tmp725 * samples(4, 1);
+  const Scalar _tmp729 = (Scalar(1) / Scalar(6)) * _tmp453;
+  const Scalar _tmp730 = _tmp454 * samples(3, 0) + _tmp483 * _tmp729;
+  const Scalar _tmp731 =
+      _tmp457 * _tmp726 + _tmp470 * _tmp727 + _tmp474 * _tmp728 + _tmp485 * dt(1, 0) + _tmp730;
+  const Scalar _tmp732 =
+      _tmp443 * _tmp721 + _tmp447 * _tmp722 + _tmp452 * _tmp723 + _tmp486 * dt(2, 0) + _tmp731;
+  const Scalar _tmp733 =
+      _tmp411 * _tmp716 + _tmp426 * _tmp717 + _tmp428 * _tmp718 + _tmp487 * dt(3, 0) + _tmp732;
+  const Scalar _tmp734 =
+      _tmp389 * _tmp711 + _tmp402 * _tmp712 + _tmp408 * _tmp713 + _tmp488 * dt(4, 0) + _tmp733;
+  const Scalar _tmp735 =
+      _tmp377 * _tmp706 + _tmp381 * _tmp707 + _tmp384 * _tmp708 + _tmp489 * dt(5, 0) + _tmp734;
+  const Scalar _tmp736 =
+      _tmp355 * _tmp701 + _tmp359 * _tmp702 + _tmp364 * _tmp703 + _tmp490 * dt(6, 0) + _tmp735;
+  const Scalar _tmp737 =
+      _tmp333 * _tmp696 + _tmp336 * _tmp697 + _tmp342 * _tmp698 + _tmp491 * dt(7, 0) + _tmp736;
+  const Scalar _tmp738 =
+      _tmp302 * _tmp691 + _tmp315 * _tmp692 + _tmp321 * _tmp693 + _tmp492 * dt(8, 0) + _tmp737;
+  const Scalar _tmp739 =
+      _tmp280 * _tmp686 + _tmp294 * _tmp687 + _tmp297 * _tmp688 + _tmp493 * dt(9, 0) + _tmp738;
+  const Scalar _tmp740 =
+      _tmp268 * _tmp681 + _tmp273 * _tmp682 + _tmp275 * _tmp683 + _tmp494 * dt(10, 0) + _tmp739;
+  const Scalar _tmp741 =
+      _tmp236 * _tmp676 + _tmp250 * _tmp677 + _tmp253 * _tmp678 + _tmp495 * dt(11, 0) + _tmp740;
+  const Scalar _tmp742 =
+      _tmp224 * _tmp672 + _tmp229 * _tmp673 + _tmp231 * _tmp674 + _tmp496 * dt(12, 0) + _tmp741;
+  const Scalar _tmp743 =
+      _tmp202 * _tmp667 + _tmp205 * _tmp668 + _tmp209 * _tmp669 + _tmp497 * dt(13, 0) + _tmp742;
+  const Scalar _tmp744 =
+      _tmp171 * _tmp662 + _tmp182 * _tmp663 + _tmp187 * _tmp664 + _tmp498 * dt(14, 0) + _tmp743;
+  const Scalar _tmp745 =
+      _tmp158 * _tmp657 + _tmp161 * _tmp658 + _tmp166 * _tmp659 + _tmp499 * dt(15, 0) + _tmp744;
+  const Scalar _tmp746 = _tmp454 * samples(4, 0) + _tmp576 * _tmp729;
+  const Scalar _tmp747 =
+      _tmp571 * _tmp727 + _tmp573 * _tmp726 + _tmp575 * _tmp728 + _tmp577 * dt(1, 0) + _tmp746;
+  const Scalar _tmp748 =
+      _tmp567 * _tmp723 + _tmp569 * _tmp722 + _tmp570 * _tmp721 + _tmp578 * dt(2, 0) + _tmp747;
+  const Scalar _tmp749 =
+      _tmp562 * _tmp718 + _tmp564 * _tmp716 + _tmp565 * _tmp717 + _tmp579 * dt(3, 0) + _tmp748;
+  const Scalar _tmp750 =
+      _tmp557 * _tmp713 + _tmp558 * _tmp711 + _tmp560 * _tmp712 + _tmp580 * dt(4, 0) + _tmp749;
+  const Scalar _tmp751 =
+      _tmp552 * _tmp707 + _tmp554 * _tmp706 + _tmp555 * _tmp708 + _tmp581 * dt(5, 0) + _tmp750;
+  const Scalar _tmp752 =
+      _tmp546 * _tmp703 + _tmp548 * _tmp702 + _tmp550 * _tmp701 + _tmp582 * dt(6, 0) + _tmp751;
+  const Scalar _tmp753 =
+      _tmp542 * _tmp697 + _tmp543 * _tmp696 + _tmp545 * _tmp698 + _tmp583 * dt(7, 0) + _tmp752;
+  const Scalar _tmp754 =
+      _tmp537 * _tmp691 + _tmp539 * _tmp693 + _tmp540 * _tmp692 + _tmp584 * dt(8, 0) + _tmp753;
+  const Scalar _tmp755 =
+      _tmp532 * _tmp688 + _tmp533 * _tmp686 + _tmp535 * _tmp687 + _tmp585 * dt(9, 0) + _tmp754;
+  const Scalar _tmp756 =
+      _tmp527 * _tmp683 + _tmp528 * _tmp681 + _tmp530 * _tmp682 + _tmp586 * dt(10, 0) + _tmp755;
+  const Scalar _tmp757 =
+      _tmp521 * _tmp678 + _tmp523 * _tmp676 + _tmp525 * _tmp677 + _tmp587 * dt(11, 0) + _tmp756;
+  const Scalar _tmp758 =
+      _tmp516 * _tmp673 + _tmp518 * _tmp672 + _tmp520 * _tmp674 + _tmp588 * dt(12, 0) + _tmp757;
+  const Scalar _tmp759 =
+      _tmp512 * _tmp669 + _tmp514 * _tmp667 + _tmp515 * _tmp668 + _tmp589 * dt(13, 0) + _tmp758;
+  const Scalar _tmp760 =
+      _tmp507 * _tmp663 + _tmp508 * _tmp662 + _tmp510 * _tmp664 + _tmp590 * dt(14, 0) + _tmp759;
+  const Scalar _tmp761 =
+      _tmp501 * _tmp659 + _tmp503 * _tmp658 + _tmp505 * _tmp657 + _tmp591 * dt(15, 0) + _tmp760;
+  const Scalar _tmp762 = _tmp454 * samples(5, 0) + _tmp638 * _tmp729;
+  const Scalar _tmp763 =
+      _tmp635 * _tmp727 + _tmp636 * _tmp726 + _tmp637 * _tmp728 + _tmp639 * dt(1, 0) + _tmp762;
+  const Scalar _tmp764 =
+      _tmp632 * _tmp722 + _tmp633 * _tmp723 + _tmp634 * _tmp721 + _tmp640 * dt(2, 0) + _tmp763;
+  const Scalar _tmp765 =
+      _tmp629 * _tmp717 + _tmp630 * _tmp718 + _tmp631 * _tmp716 + _tmp641 * dt(3, 0) + _tmp764;
+  const Scalar _tmp766 =
+      _tmp626 * _tmp711 + _tmp627 * _tmp712 + _tmp628 * _tmp713 + _tmp642 * dt(4, 0) + _tmp765;
+  const Scalar _tmp767 =
+      _tmp623 * _tmp708 + _tmp624 * _tmp707 + _tmp625 * _tmp706 + _tmp643 * dt(5, 0) + _tmp766;
+  const Scalar _tmp768 =
+      _tmp620 * _tmp701 + _tmp621 * _tmp703 + _tmp622 * _tmp702 + _tmp644 * dt(6, 0) + _tmp767;
+  const Scalar _tmp769 =
+      _tmp617 * _tmp698 + _tmp618 * _tmp697 + _tmp619 * _tmp696 + _tmp645 * dt(7, 0) + _tmp768;
+  const Scalar _tmp770 =
+      _tmp614 * _tmp691 + _tmp615 * _tmp693 + _tmp616 * _tmp692 + _tmp646 * dt(8, 0) + _tmp769;
+  const Scalar _tmp771 =
+      _tmp611 * _tmp686 + _tmp612 * _tmp688 + _tmp613 * _tmp687 + _tmp647 * dt(9, 0) + _tmp770;
+  const Scalar _tmp772 =
+      _tmp608 * _tmp683 + _tmp609 * _tmp682 + _tmp610 * _tmp681 + _tmp648 * dt(10, 0) + _tmp771;
+  const Scalar _tmp773 =
+      _tmp605 * _tmp678 + _tmp606 * _tmp676 + _tmp607 * _tmp677 + _tmp649 * dt(11, 0) + _tmp772;
+  const Scalar _tmp774 =
+      _tmp602 * _tmp672 + _tmp603 * _tmp674 + _tmp604 * _tmp673 + _tmp650 * dt(12, 0) + _tmp773;
+  const Scalar _tmp775 =
+      _tmp599 * _tmp667 + _tmp600 * _tmp669 + _tmp601 * _tmp668 + _tmp651 * dt(13, 0) + _tmp774;
+  const Scalar _tmp776 =
+      _tmp596 * _tmp663 + _tmp597 * _tmp662 + _tmp598 * _tmp664 + _tmp652 * dt(14, 0) + _tmp775;
+  const Scalar _tmp777 =
+      _tmp593 * _tmp659 + _tmp594 * _tmp657 + _tmp595 * _tmp658 + _tmp653 * dt(15, 0) + _tmp776;
+  const Scalar _tmp778 = 2 * std::pow(_tmp141, Scalar(2)) / _tmp138;
+  const Scalar _tmp779 = -_tmp137 * _tmp778;
+  const Scalar _tmp780 = -_tmp121 * _tmp778;
+  const Scalar _tmp781 = _tmp779 + _tmp780 + 1;
+  const Scalar _tmp782 = [&]() {
+    const Scalar base = dt(0, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp783 = [&]() {
+    const Scalar base = dt(2, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp784 = [&]() {
+    const Scalar base = dt(1, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp785 = [&]() {
+    const Scalar base = dt(4, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp786 = [&]() {
+    const Scalar base = dt(3, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp787 = [&]() {
+    const Scalar base = dt(8, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp788 = [&]() {
+    const Scalar base = dt(5, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp789 = [&]() {
+    const Scalar base = dt(7, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp790 = [&]() {
+    const Scalar base = dt(9, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp791 = [&]() {
+    const Scalar base = dt(6, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp792 = [&]() {
+    const Scalar base = dt(11, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp793 = [&]() {
+    const Scalar base = dt(10, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp794 = [&]() {
+    const Scalar base = dt(15, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp795 = [&]() {
+    const Scalar base = dt(12, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp796 = [&]() {
+    const Scalar base = dt(14, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp797 = [&]() {
+    const Scalar base = dt(13, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp798 = _tmp782 + _tmp783 + _tmp784 + _tmp785 + _tmp786 + _tmp787 + _tmp788 +
+                         _tmp789 + _tmp790 + _tmp791 + _tmp792 + _tmp793 + _tmp794 + _tmp795 +
+                         _tmp796 + _tmp797;
+  const Scalar _tmp799 = _tmp798 * imu_noise(0, 0);
+  const Scalar _tmp800 = 2 * _tmp146;
+  const Scalar _tmp801 = _tmp144 * _tmp800;
+  const Scalar _tmp802 = _tmp778 * _tmp91;
+  const Scalar _tmp803 = _tmp136 * _tmp802;
+  const Scalar _tmp804 = -_tmp801 + _tmp803;
+  const Scalar _tmp805 = _tmp798 * imu_noise(2, 0);
+  const Scalar _tmp806 = _tmp145 * _tmp800;
+  const Scalar _tmp807 = _tmp120 * _tmp802;
+  const Scalar _tmp808 = _tmp806 + _tmp807;
+  const Scalar _tmp809 = _tmp798 * imu_noise(1, 0);
+  const Scalar _tmp810 = -_tmp778 * _tmp92 + 1;
+  const Scalar _tmp811 = _tmp779 + _tmp810;
+  const Scalar _tmp812 = _tmp808 * _tmp809;
+  const Scalar _tmp813 = -_tmp806 + _tmp807;
+  const Scalar _tmp814 = _tmp120 * _tmp136 * _tmp778;
+  const Scalar _tmp815 = _tmp143 * _tmp800;
+  const Scalar _tmp816 = _tmp814 + _tmp815;
+  const Scalar _tmp817 = _tmp805 * _tmp816;
+  const Scalar _tmp818 = _tmp801 + _tmp803;
+  const Scalar _tmp819 = _tmp799 * _tmp818;
+  const Scalar _tmp820 = _tmp780 + _tmp810;
+  const Scalar _tmp821 = _tmp814 - _tmp815;
+  const Scalar _tmp822 = _tmp646 * _tmp789;
+  const Scalar _tmp823 = _tmp649 * _tmp793;
+  const Scalar _tmp824 = _tmp647 * _tmp787;
+  const Scalar _tmp825 = _tmp648 * _tmp790;
+  const Scalar _tmp826 = _tmp643 * _tmp785;
+  const Scalar _tmp827 = _tmp639 * _tmp782;
+  const Scalar _tmp828 = _tmp651 * _tmp795;
+  const Scalar _tmp829 = _tmp642 * _tmp786;
+  const Scalar _tmp830 = _tmp640 * _tmp784;
+  const Scalar _tmp831 = _tmp650 * _tmp792;
+  const Scalar _tmp832 = _tmp645 * _tmp791;
+  const Scalar _tmp833 = _tmp644 * _tmp788;
+  const Scalar _tmp834 = _tmp641 * _tmp783;
+  const Scalar _tmp835 = _tmp653 * _tmp796;
+  const Scalar _tmp836 = _tmp652 * _tmp797;
+  const Scalar _tmp837 = _tmp654 * _tmp794 + _tmp822 + _tmp823 + _tmp824 + _tmp825 + _tmp826 +
+                         _tmp827 + _tmp828 + _tmp829 + _tmp830 + _tmp831 + _tmp832 + _tmp833 +
+                         _tmp834 + _tmp835 + _tmp836;
+  const Scalar _tmp838 = _tmp837 * imu_noise(1, 0);
+  const Scalar _tmp839 = _tmp654 * _tmp809 - _tmp838;
+  const Scalar _tmp840 = _tmp497 * _tmp795;
+  const Scalar _tmp841 = _tmp498 * _tmp797;
+  const Scalar _tmp842 = _tmp492 * _tmp789;
+  const Scalar _tmp843 = _tmp487 * _tmp783;
+  const Scalar _tmp844 = _tmp493 * _tmp787;
+  const Scalar _tmp845 = _tmp485 * _tmp782;
+  const Scalar _tmp846 = _tmp490 * _tmp788;
+  const Scalar _tmp847 = _tmp488 * _tmp786;
+  const Scalar _tmp848 = _tmp500 * _tmp794;
+  const Scalar _tmp849 = _tmp489 * _tmp785;
+  const Scalar _tmp850 = _tmp496 * _tmp792;
+  const Scalar _tmp851 = _tmp499 * _tmp796;
+  const Scalar _tmp852 = _tmp486 * _tmp784 + _tmp491 * _tmp791 + _tmp494 * _tmp790 +
+                         _tmp495 * _tmp793 + _tmp840 + _tmp841 + _tmp842 + _tmp843 + _tmp844 +
+                         _tmp845 + _tmp846 + _tmp847 + _tmp848 + _tmp849 + _tmp850 + _tmp851;
+  const Scalar _tmp853 = _tmp852 * imu_noise(1, 0);
+  const Scalar _tmp854 = -_tmp500 * _tmp809 + _tmp853;
+  const Scalar _tmp855 = _tmp781 * _tmp839 + _tmp804 * _tmp854;
+  const Scalar _tmp856 = _tmp852 * imu_noise(2, 0);
+  const Scalar _tmp857 = _tmp500 * _tmp805 - _tmp856;
+  const Scalar _tmp858 = _tmp586 * _tmp790;
+  const Scalar _tmp859 = _tmp590 * _tmp797;
+  const Scalar _tmp860 = _tmp579 * _tmp783;
+  const Scalar _tmp861 = _tmp589 * _tmp795;
+  const Scalar _tmp862 = _tmp591 * _tmp796;
+  const Scalar _tmp863 = _tmp578 * _tmp784;
+  const Scalar _tmp864 = _tmp585 * _tmp787;
+  const Scalar _tmp865 = _tmp583 * _tmp791;
+  const Scalar _tmp866 = _tmp577 * _tmp782;
+  const Scalar _tmp867 = _tmp587 * _tmp793;
+  const Scalar _tmp868 = _tmp592 * _tmp794;
+  const Scalar _tmp869 = _tmp581 * _tmp785;
+  const Scalar _tmp870 = _tmp580 * _tmp786 + _tmp582 * _tmp788 + _tmp584 * _tmp789 +
+                         _tmp588 * _tmp792 + _tmp858 + _tmp859 + _tmp860 + _tmp861 + _tmp862 +
+                         _tmp863 + _tmp864 + _tmp865 + _tmp866 + _tmp867 + _tmp868 + _tmp869;
+  const Scalar _tmp871 = _tmp870 * imu_noise(2, 0);
+  const Scalar _tmp872 = -_tmp592 * _tmp805 + _tmp871;
+  const Scalar _tmp873 = _tmp781 * _tmp872 + _tmp808 * _tmp857;
+  const Scalar _tmp874 = _tmp837 * imu_noise(0, 0);
+  const Scalar _tmp875 = -_tmp654 * _tmp799 + _tmp874;
+  const Scalar _tmp876 = _tmp870 * imu_noise(0, 0);
+  const Scalar _tmp877 = _tmp592 * _tmp799 - _tmp876;
+  const Scalar _tmp878 = _tmp804 * _tmp877 + _tmp808 * _tmp875;
+  const Scalar _tmp879 =
+      imu_noise(1, 0) *
+      (_tmp485 * _tmp827 + _tmp486 * _tmp830 + _tmp487 * _tmp834 + _tmp491 * _tmp832 +
+       _tmp492 * _tmp822 + _tmp493 * _tmp824 + _tmp494 * _tmp825 + _tmp495 * _tmp823 +
+       _tmp497 * _tmp828 + _tmp498 * _tmp836 + _tmp642 * _tmp847 + _tmp643 * _tmp849 +
+       _tmp644 * _tmp846 + _tmp650 * _tmp850 + _tmp653 * _tmp851 + _tmp654 * _tmp848);
+  const Scalar _tmp880 = _tmp500 * _tmp838 + _tmp654 * _tmp854 - _tmp879;
+  const Scalar _tmp881 =
+      std::pow(_tmp639, Scalar(2)) * _tmp782 + std::pow(_tmp640, Scalar(2)) * _tmp784 +
+      std::pow(_tmp641, Scalar(2)) * _tmp783 + std::pow(_tmp642, Scalar(2)) * _tmp786 +
+      std::pow(_tmp643, Scalar(2)) * _tmp785 + std::pow(_tmp644, Scalar(2)) * _tmp788 +
+      std::pow(_tmp645, Scalar(2)) * _tmp791 + std::pow(_tmp646, Scalar(2)) * _tmp789 +
+      std::pow(_tmp647, Scalar(2)) * _tmp787 + std::pow(_tmp648, Scalar(2)) * _tmp790 +
+      std::pow(_tmp649, Scalar(2)) * _tmp793 + std::pow(_tmp650, Scalar(2)) * _tmp792 +
+      std::pow(_tmp651, Scalar(2)) * _tmp795 + std::pow(_tmp652, Scalar(2)) * _tmp797 +
+      std::pow(_tmp653, Scalar(2)) * _tmp796 + std::pow(_tmp654, Scalar(2)) * _tmp794;
+  const Scalar _tmp882 =
+      std::pow(_tmp577, Scalar(2)) * _tmp782 + std::pow(_tmp578, Scalar(2)) * _tmp784 +
+      std::pow(_tmp579, Scalar(2)) * _tmp783 + std::pow(_tmp580, Scalar(2)) * _tmp786 +
+      std::pow(_tmp581, Scalar(2)) * _tmp785 + std::pow(_tmp582, Scalar(2)) * _tmp788 +
+      std::pow(_tmp583, Scalar(2)) * _tmp791 + std::pow(_tmp584, Scalar(2)) * _tmp789 +
+      std::pow(_tmp585, Scalar(2)) * _tmp787 + std::pow(_tmp586, Scalar(2)) * _tmp790 +
+      std::pow(_tmp587, Scalar(2)) * _tmp793 + std::pow(_tmp588, Scalar(2)) * _tmp792 +
+      std::pow(_tmp589, Scalar(2)) * _tmp795 + std::pow(_tmp590, Scalar(2)) * _tmp797 +
+      std::pow(_tmp591, Scalar(2)) * _tmp796 + std::pow(_tmp592, Scalar(2)) * _tmp794;
+  const Scalar _tmp883 =
+      _tmp798 * imu_noise(3, 0) + _tmp881 * imu_noise(1, 0) + _tmp882 * imu_noise(2, 0);
+  const Scalar _tmp884 =
+      -_tmp592 * _tmp871 - _tmp592 * _tmp872 - _tmp654 * _tmp838 + _tmp654 * _tmp839 + _tmp883;
+  const Scalar _tmp885 =
+      imu_noise(2, 0) *
+      (_tmp485 * _tmp866 + _tmp486 * _tmp863 + _tmp487 * _tmp860 + _tmp491 * _tmp865 +
+       _tmp493 * _tmp864 + _tmp494 * _tmp858 + _tmp495 * _tmp867 + _tmp499 * _tmp862 +
+       _tmp580 * _tmp847 + _tmp581 * _tmp849 + _tmp582 * _tmp846 + _tmp584 * _tmp842 +
+       _tmp588 * _tmp850 + _tmp589 * _tmp840 + _tmp590 * _tmp841 + _tmp592 * _tmp848);
+  const Scalar _tmp886 = _tmp500 * _tmp871 - _tmp592 * _tmp857 - _tmp885;
+  const Scalar _tmp887 =
+      imu_noise(0, 0) *
+      (_tmp577 * _tmp827 + _tmp579 * _tmp834 + _tmp580 * _tmp829 + _tmp581 * _tmp826 +
+       _tmp582 * _tmp833 + _tmp584 * _tmp822 + _tmp586 * _tmp825 + _tmp588 * _tmp831 +
+       _tmp589 * _tmp828 + _tmp590 * _tmp836 + _tmp640 * _tmp863 + _tmp645 * _tmp865 +
+       _tmp647 * _tmp864 + _tmp649 * _tmp867 + _tmp653 * _tmp862 + _tmp654 * _tmp868);
+  const Scalar _tmp888 = _tmp592 * _tmp874 - _tmp654 * _tmp877 - _tmp887;
+  const Scalar _tmp889 =
+      std::pow(_tmp485, Scalar(2)) * _tmp782 + std::pow(_tmp486, Scalar(2)) * _tmp784 +
+      std::pow(_tmp487, Scalar(2)) * _tmp783 + std::pow(_tmp488, Scalar(2)) * _tmp786 +
+      std::pow(_tmp489, Scalar(2)) * _tmp785 + std::pow(_tmp490, Scalar(2)) * _tmp788 +
+      std::pow(_tmp491, Scalar(2)) * _tmp791 + std::pow(_tmp492, Scalar(2)) * _tmp789 +
+      std::pow(_tmp493, Scalar(2)) * _tmp787 + std::pow(_tmp494, Scalar(2)) * _tmp790 +
+      std::pow(_tmp495, Scalar(2)) * _tmp793 + std::pow(_tmp496, Scalar(2)) * _tmp792 +
+      std::pow(_tmp497, Scalar(2)) * _tmp795 + std::pow(_tmp498, Scalar(2)) * _tmp797 +
+      std::pow(_tmp499, Scalar(2)) * _tmp796 + std::pow(_tmp500, Scalar(2)) * _tmp794;
+  const Scalar _tmp890 =
+      _tmp798 * imu_noise(4, 0) + _tmp881 * imu_noise(0, 0) + _tmp889 * imu_noise(2, 0);
+  const Scalar _tmp891 =
+      -_tmp500 * _tmp856 + _tmp500 * _tmp857 - _tmp654 * _tmp874 - _tmp654 * _tmp875 + _tmp890;
+  const Scalar _tmp892 =
+      _tmp798 * imu_noise(5, 0) + _tmp882 * imu_noise(0, 0) + _tmp889 * imu_noise(1, 0);
+  const Scalar _tmp893 =
+      -_tmp500 * _tmp853 - _tmp500 * _tmp854 - _tmp592 * _tmp876 + _tmp592 * _tmp877 + _tmp892;
+  const Scalar _tmp894 = _tmp813 * _tmp839 + _tmp816 * _tmp854;
+  const Scalar _tmp895 = _tmp811 * _tmp857 + _tmp813 * _tmp872;
+  const Scalar _tmp896 = _tmp811 * _tmp875 + _tmp816 * _tmp877;
+  const Scalar _tmp897 = _tmp811 * _tmp891 + _tmp813 * _tmp886 + _tmp816 * _tmp888;
+  const Scalar _tmp898 = _tmp811 * _tmp886 + _tmp813 * _tmp884 + _tmp816 * _tmp880;
+  const Scalar _tmp899 = _tmp811 * _tmp888 + _tmp813 * _tmp880 + _tmp816 * _tmp893;
+  const Scalar _tmp900 = _tmp818 * _tmp872 + _tmp821 * _tmp857;
+  const Scalar _tmp901 = _tmp820 * _tmp877 + _tmp821 * _tmp875;
+  const Scalar _tmp902 = _tmp818 * _tmp839 + _tmp820 * _tmp854;
+  const Scalar _tmp903 = _tmp818 * _tmp884 + _tmp820 * _tmp880 + _tmp821 * _tmp886;
+  const Scalar _tmp904 = _tmp818 * _tmp880 + _tmp820 * _tmp893 + _tmp821 * _tmp888;
+  const Scalar _tmp905 = _tmp818 * _tmp886 + _tmp820 * _tmp888 + _tmp821 * _tmp891;
+  const Scalar _tmp906 = dt(0, 0) + dt(1, 0);
+  const Scalar _tmp907 = _tmp906 + dt(2, 0);
+  const Scalar _tmp908 = _tmp907 + dt(3, 0);
+  const Scalar _tmp909 = _tmp908 + dt(4, 0);
+  const Scalar _tmp910 = _tmp909 + dt(5, 0);
+  const Scalar _tmp911 = _tmp910 + dt(6, 0);
+  const Scalar _tmp912 = _tmp911 + dt(7, 0);
+  const Scalar _tmp913 = _tmp912 + dt(8, 0);
+  const Scalar _tmp914 = -_tmp493 * _tmp913 + _tmp738;
+  const Scalar _tmp915 = _tmp913 + dt(9, 0);
+  const Scalar _tmp916 = -_tmp494 * _tmp915 + _tmp739;
+  const Scalar _tmp917 = _tmp790 * _tmp916;
+  const Scalar _tmp918 = -_tmp486 * _tmp906 + _tmp731;
+  const Scalar _tmp919 = _tmp784 * _tmp918;
+  const Scalar _tmp920 = -_tmp485 * dt(0, 0) + _tmp730;
+  const Scalar _tmp921 = _tmp782 * _tmp920;
+  const Scalar _tmp922 = -_tmp487 * _tmp907 + _tmp732;
+  const Scalar _tmp923 = _tmp783 * _tmp922;
+  const Scalar _tmp924 = -_tmp488 * _tmp908 + _tmp733;
+  const Scalar _tmp925 = _tmp786 * _tmp924;
+  const Scalar _tmp926 = _tmp915 + dt(10, 0);
+  const Scalar _tmp927 = _tmp926 + dt(11, 0);
+  const Scalar _tmp928 = _tmp927 + dt(12, 0);
+  const Scalar _tmp929 = _tmp928 + dt(13, 0);
+  const Scalar _tmp930 = -_tmp498 * _tmp929 + _tmp743;
+  const Scalar _tmp931 = _tmp797 * _tmp930;
+  const Scalar _tmp932 = -_tmp491 * _tmp911 + _tmp736;
+  const Scalar _tmp933 = _tmp791 * _tmp932;
+  const Scalar _tmp934 = -_tmp497 * _tmp928 + _tmp742;
+  const Scalar _tmp935 = _tmp795 * _tmp934;
+  const Scalar _tmp936 = -_tmp496 * _tmp927 + _tmp741;
+  const Scalar _tmp937 = _tmp792 * _tmp936;
+  const Scalar _tmp938 = -_tmp490 * _tmp910 + _tmp735;
+  const Scalar _tmp939 = _tmp788 * _tmp938;
+  const Scalar _tmp940 = -_tmp495 * _tmp926 + _tmp740;
+  const Scalar _tmp941 = _tmp793 * _tmp940;
+  const Scalar _tmp942 = _tmp929 + dt(14, 0);
+  const Scalar _tmp943 = -_tmp499 * _tmp942 + _tmp744;
+  const Scalar _tmp944 = _tmp796 * _tmp943;
+  const Scalar _tmp945 = -_tmp489 * _tmp909 + _tmp734;
+  const Scalar _tmp946 = _tmp785 * _tmp945;
+  const Scalar _tmp947 = -_tmp492 * _tmp912 + _tmp737;
+  const Scalar _tmp948 = _tmp789 * _tmp947;
+  const Scalar _tmp949 = _tmp942 + dt(15, 0);
+  const Scalar _tmp950 = -_tmp500 * _tmp949 + _tmp745;
+  const Scalar _tmp951 = _tmp794 * _tmp950;
+  const Scalar _tmp952 = _tmp787 * _tmp914 + _tmp917 + _tmp919 + _tmp921 + _tmp923 + _tmp925 +
+                         _tmp931 + _tmp933 + _tmp935 + _tmp937 + _tmp939 + _tmp941 + _tmp944 +
+                         _tmp946 + _tmp948 + _tmp951;
+  const Scalar _tmp953 = -_tmp856 * _tmp949 - _tmp952 * imu_noise(2, 0);
+  const Scalar _tmp954 = _tmp745 * _tmp805 + _tmp953;
+  const Scalar _tmp955 = -_tmp579 * _tmp907 + _tmp748;
+  const Scalar _tmp956 = _tmp783 * _tmp955;
+  const Scalar _tmp957 = -_tmp585 * _tmp913 + _tmp754;
+  const Scalar _tmp958 = _tmp787 * _tmp957;
+  const Scalar _tmp959 = -_tmp592 * _tmp949 + _tmp761;
+  const Scalar _tmp960 = _tmp794 * _tmp959;
+  const Scalar _tmp961 = -_tmp590 * _tmp929 + _tmp759;
+  const Scalar _tmp962 = -_tmp584 * _tmp912 + _tmp753;
+  const Scalar _tmp963 = _tmp789 * _tmp962;
+  const Scalar _tmp964 = -_tmp577 * dt(0, 0) + _tmp746;
+  const Scalar _tmp965 = -_tmp587 * _tmp926 + _tmp756;
+  const Scalar _tmp966 = _tmp793 * _tmp965;
+  const Scalar _tmp967 = -_tmp583 * _tmp911 + _tmp752;
+  const Scalar _tmp968 = _tmp791 * _tmp967;
+  const Scalar _tmp969 = -_tmp581 * _tmp909 + _tmp750;
+  const Scalar _tmp970 = _tmp785 * _tmp969;
+  const Scalar _tmp971 = -_tmp578 * _tmp906 + _tmp747;
+  const Scalar _tmp972 = _tmp784 * _tmp971;
+  const Scalar _tmp973 = -_tmp582 * _tmp910 + _tmp751;
+  const Scalar _tmp974 = _tmp788 * _tmp973;
+  const Scalar _tmp975 = -_tmp588 * _tmp927 + _tmp757;
+  const Scalar _tmp976 = _tmp792 * _tmp975;
+  const Scalar _tmp977 = -_tmp580 * _tmp908 + _tmp749;
+  const Scalar _tmp978 = _tmp786 * _tmp977;
+  const Scalar _tmp979 = -_tmp591 * _tmp942 + _tmp760;
+  const Scalar _tmp980 = _tmp796 * _tmp979;
+  const Scalar _tmp981 = -_tmp586 * _tmp915 + _tmp755;
+  const Scalar _tmp982 = _tmp790 * _tmp981;
+  const Scalar _tmp983 = -_tmp589 * _tmp928 + _tmp758;
+  const Scalar _tmp984 = _tmp795 * _tmp983;
+  const Scalar _tmp985 = _tmp782 * _tmp964 + _tmp797 * _tmp961 + _tmp956 + _tmp958 + _tmp960 +
+                         _tmp963 + _tmp966 + _tmp968 + _tmp970 + _tmp972 + _tmp974 + _tmp976 +
+                         _tmp978 + _tmp980 + _tmp982 + _tmp984;
+  const Scalar _tmp986 = _tmp871 * _tmp949 + _tmp985 * imu_noise(2, 0);
+  const Scalar _tmp987 = -_tmp761 * _tmp805 + _tmp986;
+  const Scalar _tmp988 = _tmp781 * _tmp987 + _tmp808 * _tmp954;
+  const Scalar _tmp989 = _tmp853 * _tmp949 + _tmp952 * imu_noise(1, 0);
+  const Scalar _tmp990 = -_tmp745 * _tmp809 + _tmp989;
+  const Scalar _tmp991 = -_tmp654 * _tmp949 + _tmp777;
+  const Scalar _tmp992 = _tmp794 * _tmp991;
+  const Scalar _tmp993 = -_tmp641 * _tmp907 + _tmp764;
+  const Scalar _tmp994 = -_tmp649 * _tmp926 + _tmp772;
+  const Scalar _tmp995 = _tmp793 * _tmp994;
+  const Scalar _tmp996 = -_tmp646 * _tmp912 + _tmp769;
+  const Scalar _tmp997 = _tmp789 * _tmp996;
+  const Scalar _tmp998 = -_tmp653 * _tmp942 + _tmp776;
+  const Scalar _tmp999 = -_tmp639 * dt(0, 0) + _tmp762;
+  const Scalar _tmp1000 = _tmp782 * _tmp999;
+  const Scalar _tmp1001 = -_tmp642 * _tmp908 + _tmp765;
+  const Scalar _tmp1002 = _tmp1001 * _tmp786;
+  const Scalar _tmp1003 = -_tmp640 * _tmp906 + _tmp763;
+  const Scalar _tmp1004 = _tmp1003 * _tmp784;
+  const Scalar _tmp1005 = -_tmp651 * _tmp928 + _tmp774;
+  const Scalar _tmp1006 = -_tmp645 * _tmp911 + _tmp768;
+  const Scalar _tmp1007 = _tmp1006 * _tmp791;
+  const Scalar _tmp1008 = -_tmp644 * _tmp910 + _tmp767;
+  const Scalar _tmp1009 = _tmp1008 * _tmp788;
+  const Scalar _tmp1010 = -_tmp650 * _tmp927 + _tmp773;
+  const Scalar _tmp1011 = _tmp1010 * _tmp792;
+  const Scalar _tmp1012 = -_tmp647 * _tmp913 + _tmp770;
+  const Scalar _tmp1013 = _tmp1012 * _tmp787;
+  const Scalar _tmp1014 = -_tmp643 * _tmp909 + _tmp766;
+  const Scalar _tmp1015 = -_tmp652 * _tmp929 + _tmp775;
+  const Scalar _tmp1016 = _tmp1015 * _tmp797;
+  const Scalar _tmp1017 = -_tmp648 * _tmp915 + _tmp771;
+  const Scalar _tmp1018 = _tmp1017 * _tmp790;
+  const Scalar _tmp1019 = _tmp1000 + _tmp1002 + _tmp1004 + _tmp1005 * _tmp795 + _tmp1007 +
+                          _tmp1009 + _tmp1011 + _tmp1013 + _tmp1014 * _tmp785 + _tmp1016 +
+                          _tmp1018 + _tmp783 * _tmp993 + _tmp796 * _tmp998 + _tmp992 + _tmp995 +
+                          _tmp997;
+  const Scalar _tmp1020 = -_tmp1019 * imu_noise(1, 0) - _tmp838 * _tmp949;
+  const Scalar _tmp1021 = _tmp1020 + _tmp777 * _tmp809;
+  const Scalar _tmp1022 = _tmp1021 * _tmp781 + _tmp804 * _tmp990;
+  const Scalar _tmp1023 = -_tmp876 * _tmp949 - _tmp985 * imu_noise(0, 0);
+  const Scalar _tmp1024 = _tmp1023 + _tmp761 * _tmp799;
+  const Scalar _tmp1025 = _tmp1019 * imu_noise(0, 0) + _tmp874 * _tmp949;
+  const Scalar _tmp1026 = _tmp1025 - _tmp777 * _tmp799;
+  const Scalar _tmp1027 = _tmp1024 * _tmp804 + _tmp1026 * _tmp808;
+  const Scalar _tmp1028 =
+      _tmp578 * _tmp972 + _tmp580 * _tmp978 + _tmp581 * _tmp970 + _tmp582 * _tmp974 +
+      _tmp584 * _tmp963 + _tmp586 * _tmp982 + _tmp588 * _tmp976 + _tmp589 * _tmp984 +
+      _tmp859 * _tmp961 + _tmp860 * _tmp955 + _tmp862 * _tmp979 + _tmp864 * _tmp957 +
+      _tmp865 * _tmp967 + _tmp866 * _tmp964 + _tmp867 * _tmp965 + _tmp868 * _tmp959;
+  const Scalar _tmp1029 = _tmp220 - _tmp928;
+  const Scalar _tmp1030 = _tmp179 - _tmp942;
+  const Scalar _tmp1031 = _tmp264 - _tmp926;
+  const Scalar _tmp1032 = _tmp245 - _tmp927;
+  const Scalar _tmp1033 = _tmp198 - _tmp929;
+  const Scalar _tmp1034 = _tmp155 - _tmp949;
+  const Scalar _tmp1035 = _tmp398 - _tmp909;
+  const Scalar _tmp1036 = _tmp439 - _tmp907;
+  const Scalar _tmp1037 = _tmp311 - _tmp913;
+  const Scalar _tmp1038 = _tmp351 - _tmp911;
+  const Scalar _tmp1039 = _tmp373 - _tmp910;
+  const Scalar _tmp1040 = _tmp329 - _tmp912;
+  const Scalar _tmp1041 = _tmp289 - _tmp915;
+  const Scalar _tmp1042 = _tmp466 - _tmp906;
+  const Scalar _tmp1043 = _tmp420 - _tmp908;
+  const Scalar _tmp1044 = _tmp1029 * _tmp795 + _tmp1030 * _tmp796 + _tmp1031 * _tmp793 +
+                          _tmp1032 * _tmp792 + _tmp1033 * _tmp797 + _tmp1034 * _tmp794 +
+                          _tmp1035 * _tmp785 + _tmp1036 * _tmp783 + _tmp1037 * _tmp787 +
+                          _tmp1038 * _tmp791 + _tmp1039 * _tmp788 + _tmp1040 * _tmp789 +
+                          _tmp1041 * _tmp790 + _tmp1042 * _tmp784 + _tmp1043 * _tmp786 -
+                          Scalar(1) / Scalar(2) * std::pow(dt(0, 0), Scalar(4));
+  const Scalar _tmp1045 =
+      _tmp485 * _tmp921 + _tmp486 * _tmp919 + _tmp487 * _tmp923 + _tmp491 * _tmp933 +
+      _tmp492 * _tmp948 + _tmp494 * _tmp917 + _tmp495 * _tmp941 + _tmp496 * _tmp937 +
+      _tmp497 * _tmp935 + _tmp498 * _tmp931 + _tmp844 * _tmp914 + _tmp846 * _tmp938 +
+      _tmp847 * _tmp924 + _tmp848 * _tmp950 + _tmp849 * _tmp945 + _tmp851 * _tmp943;
+  const Scalar _tmp1046 =
+      _tmp1028 * imu_noise(0, 0) + _tmp1044 * imu_noise(5, 0) + _tmp1045 * imu_noise(1, 0);
+  const Scalar _tmp1047 = _tmp1046 + _tmp892 * _tmp949;
+  const Scalar _tmp1048 =
+      _tmp1024 * _tmp592 + _tmp1047 - _tmp500 * _tmp990 - _tmp745 * _tmp853 - _tmp761 * _tmp876;
+  const Scalar _tmp1049 = -_tmp887 * _tmp949;
+  const Scalar _tmp1050 =
+      imu_noise(0, 0) *
+      (_tmp1002 * _tmp580 + _tmp1003 * _tmp863 + _tmp1005 * _tmp861 + _tmp1006 * _tmp865 +
+       _tmp1009 * _tmp582 + _tmp1011 * _tmp588 + _tmp1012 * _tmp864 + _tmp1014 * _tmp869 +
+       _tmp1016 * _tmp590 + _tmp1018 * _tmp586 + _tmp584 * _tmp997 + _tmp860 * _tmp993 +
+       _tmp862 * _tmp998 + _tmp866 * _tmp999 + _tmp867 * _tmp994 + _tmp868 * _tmp991);
+  const Scalar _tmp1051 = _tmp1026 * _tmp592 + _tmp1049 - _tmp1050 + _tmp777 * _tmp876;
+  const Scalar _tmp1052 =
+      imu_noise(1, 0) *
+      (_tmp1000 * _tmp485 + _tmp1001 * _tmp847 + _tmp1004 * _tmp486 + _tmp1005 * _tmp840 +
+       _tmp1007 * _tmp491 + _tmp1009 * _tmp490 + _tmp1011 * _tmp496 + _tmp1013 * _tmp493 +
+       _tmp1014 * _tmp849 + _tmp1016 * _tmp498 + _tmp1018 * _tmp494 + _tmp492 * _tmp997 +
+       _tmp495 * _tmp995 + _tmp843 * _tmp993 + _tmp848 * _tmp991 + _tmp851 * _tmp998);
+  const Scalar _tmp1053 = -_tmp879 * _tmp949;
+  const Scalar _tmp1054 = -_tmp1021 * _tmp500 - _tmp1052 + _tmp1053 + _tmp777 * _tmp853;
+  const Scalar _tmp1055 = _tmp1048 * _tmp804 + _tmp1051 * _tmp808 + _tmp1054 * _tmp781;
+  const Scalar _tmp1056 =
+      _tmp1001 * _tmp829 + _tmp1003 * _tmp830 + _tmp1005 * _tmp828 + _tmp1007 * _tmp645 +
+      _tmp1009 * _tmp644 + _tmp1011 * _tmp650 + _tmp1013 * _tmp647 + _tmp1014 * _tmp826 +
+      _tmp1016 * _tmp652 + _tmp1018 * _tmp648 + _tmp646 * _tmp997 + _tmp654 * _tmp992 +
+      _tmp823 * _tmp994 + _tmp827 * _tmp999 + _tmp834 * _tmp993 + _tmp835 * _tmp998;
+  const Scalar _tmp1057 =
+      _tmp1028 * imu_noise(2, 0) + _tmp1044 * imu_noise(3, 0) + _tmp1056 * imu_noise(1, 0);
+  const Scalar _tmp1058 = _tmp1057 + _tmp883 * _tmp949;
+  const Scalar _tmp1059 =
+      _tmp1021 * _tmp654 + _tmp1058 - _tmp592 * _tmp987 - _tmp761 * _tmp871 - _tmp777 * _tmp838;
+  const Scalar _tmp1060 = -_tmp885 * _tmp949;
+  const Scalar _tmp1061 =
+      _tmp1060 -
+      imu_noise(2, 0) *
+          (_tmp579 * _tmp923 + _tmp580 * _tmp925 + _tmp582 * _tmp939 + _tmp584 * _tmp948 +
+           _tmp586 * _tmp917 + _tmp588 * _tmp937 + _tmp589 * _tmp935 + _tmp590 * _tmp931 +
+           _tmp592 * _tmp951 + _tmp862 * _tmp943 + _tmp863 * _tmp918 + _tmp864 * _tmp914 +
+           _tmp865 * _tmp932 + _tmp866 * _tmp920 + _tmp867 * _tmp940 + _tmp869 * _tmp945);
+  const Scalar _tmp1062 = _tmp1061 - _tmp592 * _tmp954 + _tmp745 * _tmp871;
+  const Scalar _tmp1063 =
+      _tmp1053 -
+      imu_noise(1, 0) *
+          (_tmp645 * _tmp933 + _tmp646 * _tmp948 + _tmp649 * _tmp941 + _tmp650 * _tmp937 +
+           _tmp652 * _tmp931 + _tmp654 * _tmp951 + _tmp824 * _tmp914 + _tmp825 * _tmp916 +
+           _tmp826 * _tmp945 + _tmp827 * _tmp920 + _tmp828 * _tmp934 + _tmp829 * _tmp924 +
+           _tmp830 * _tmp918 + _tmp833 * _tmp938 + _tmp834 * _tmp922 + _tmp835 * _tmp943);
+  const Scalar _tmp1064 = _tmp1063 + _tmp654 * _tmp990 + _tmp745 * _tmp838;
+  const Scalar _tmp1065 = _tmp1059 * _tmp781 + _tmp1062 * _tmp808 + _tmp1064 * _tmp804;
+  const Scalar _tmp1066 =
+      _tmp1049 -
+      imu_noise(0, 0) *
+          (_tmp640 * _tmp972 + _tmp643 * _tmp970 + _tmp645 * _tmp968 + _tmp647 * _tmp958 +
+           _tmp648 * _tmp982 + _tmp649 * _tmp966 + _tmp654 * _tmp960 + _tmp822 * _tmp962 +
+           _tmp827 * _tmp964 + _tmp828 * _tmp983 + _tmp829 * _tmp977 + _tmp831 * _tmp975 +
+           _tmp833 * _tmp973 + _tmp834 * _tmp955 + _tmp835 * _tmp979 + _tmp836 * _tmp961);
+  const Scalar _tmp1067 = -_tmp1024 * _tmp654 + _tmp1066 + _tmp761 * _tmp874;
+  const Scalar _tmp1068 =
+      _tmp1044 * imu_noise(4, 0) + _tmp1045 * imu_noise(2, 0) + _tmp1056 * imu_noise(0, 0);
+  const Scalar _tmp1069 = _tmp1068 + _tmp890 * _tmp949;
+  const Scalar _tmp1070 =
+      -_tmp1026 * _tmp654 + _tmp1069 + _tmp500 * _tmp954 - _tmp745 * _tmp856 - _tmp777 * _tmp874;
+  const Scalar _tmp1071 =
+      imu_noise(2, 0) *
+      (_tmp486 * _tmp972 + _tmp487 * _tmp956 + _tmp489 * _tmp970 + _tmp491 * _tmp968 +
+       _tmp493 * _tmp958 + _tmp494 * _tmp982 + _tmp495 * _tmp966 + _tmp497 * _tmp984 +
+       _tmp841 * _tmp961 + _tmp842 * _tmp962 + _tmp845 * _tmp964 + _tmp846 * _tmp973 +
+       _tmp847 * _tmp977 + _tmp848 * _tmp959 + _tmp850 * _tmp975 + _tmp851 * _tmp979);
+  const Scalar _tmp1072 = _tmp1060 - _tmp1071 + _tmp500 * _tmp987 + _tmp761 * _tmp856;
+  const Scalar _tmp1073 = _tmp1067 * _tmp804 + _tmp1070 * _tmp808 + _tmp1072 * _tmp781;
+  const Scalar _tmp1074 =
+      std::pow(_tmp1029, Scalar(2)) * _tmp795 + std::pow(_tmp1030, Scalar(2)) * _tmp796 +
+      std::pow(_tmp1031, Scalar(2)) * _tmp793 + std::pow(_tmp1032, Scalar(2)) * _tmp792 +
+      std::pow(_tmp1033, Scalar(2)) * _tmp797 + std::pow(_tmp1034, Scalar(2)) * _tmp794 +
+      std::pow(_tmp1035, Scalar(2)) * _tmp785 + std::pow(_tmp1036, Scalar(2)) * _tmp783 +
+      std::pow(_tmp1037, Scalar(2)) * _tmp787 + std::pow(_tmp1038, Scalar(2)) * _tmp791 +
+      std::pow(_tmp1039, Scalar(2)) * _tmp788 + std::pow(_tmp1040, Scalar(2)) * _tmp789 +
+      std::pow(_tmp1041, Scalar(2)) * _tmp790 + std::pow(_tmp1042, Scalar(2)) * _tmp784 +
+      std::pow(_tmp1043, Scalar(2)) * _tmp786 +
+      (Scalar(1) / Scalar(4)) * std::pow(dt(0, 0), Scalar(5));
+  const Scalar _tmp1075 =
+      _tmp782 * std::pow(_tmp964, Scalar(2)) + _tmp783 * std::pow(_tmp955, Scalar(2)) +
+      _tmp784 * std::pow(_tmp971, Scalar(2)) + _tmp785 * std::pow(_tmp969, Scalar(2)) +
+      _tmp786 * std::pow(_tmp977, Scalar(2)) + _tmp787 * std::pow(_tmp957, Scalar(2)) +
+      _tmp788 * std::pow(_tmp973, Scalar(2)) + _tmp789 * std::pow(_tmp962, Scalar(2)) +
+      _tmp790 * std::pow(_tmp981, Scalar(2)) + _tmp791 * std::pow(_tmp967, Scalar(2)) +
+      _tmp792 * std::pow(_tmp975, Scalar(2)) + _tmp793 * std::pow(_tmp965, Scalar(2)) +
+      _tmp794 * std::pow(_tmp959, Scalar(2)) + _tmp795 * std::pow(_tmp983, Scalar(2)) +
+      _tmp796 * std::pow(_tmp979, Scalar(2)) + _tmp797 * std::pow(_tmp961, Scalar(2));
+  const Scalar _tmp1076 =
+      _tmp782 * std::pow(_tmp920, Scalar(2)) + _tmp783 * std::pow(_tmp922, Scalar(2)) +
+      _tmp784 * std::pow(_tmp918, Scalar(2)) + _tmp785 * std::pow(_tmp945, Scalar(2)) +
+      _tmp786 * std::pow(_tmp924, Scalar(2)) + _tmp787 * std::pow(_tmp914, Scalar(2)) +
+      _tmp788 * std::pow(_tmp938, Scalar(2)) + _tmp789 * std::pow(_tmp947, Scalar(2)) +
+      _tmp790 * std::pow(_tmp916, Scalar(2)) + _tmp791 * std::pow(_tmp932, Scalar(2)) +
+      _tmp792 * std::pow(_tmp936, Scalar(2)) + _tmp793 * std::pow(_tmp940, Scalar(2)) +
+      _tmp794 * std::pow(_tmp950, Scalar(2)) + _tmp795 * std::pow(_tmp934, Scalar(2)) +
+      _tmp796 * std::pow(_tmp943, Scalar(2)) + _tmp797 * std::pow(_tmp930, Scalar(2));
+  const Scalar _tmp1077 = _tmp1023 * _tmp761 + _tmp1024 * _tmp761 + _tmp1046 * _tmp949 +
+                          _tmp1047 * _tmp949 + _tmp1074 * imu_noise(5, 0) +
+                          _tmp1075 * imu_noise(0, 0) + _tmp1076 * imu_noise(1, 0) -
+                          _tmp745 * _tmp989 - _tmp745 * _tmp990;
+  const Scalar _tmp1078 =
+      -_tmp1020 * _tmp745 - _tmp1052 * _tmp949 + _tmp1063 * _tmp949 + _tmp777 * _tmp990 -
+      imu_noise(1, 0) *
+          (_tmp1002 * _tmp924 + _tmp1003 * _tmp919 + _tmp1005 * _tmp935 + _tmp1007 * _tmp932 +
+           _tmp1009 * _tmp938 + _tmp1010 * _tmp937 + _tmp1013 * _tmp914 + _tmp1014 * _tmp946 +
+           _tmp1015 * _tmp931 + _tmp1018 * _tmp916 + _tmp921 * _tmp999 + _tmp923 * _tmp993 +
+           _tmp941 * _tmp994 + _tmp944 * _tmp998 + _tmp948 * _tmp996 + _tmp951 * _tmp991);
+  const Scalar _tmp1079 =
+      -_tmp1024 * _tmp777 + _tmp1025 * _tmp761 - _tmp1050 * _tmp949 + _tmp1066 * _tmp949 -
+      imu_noise(0, 0) *
+          (_tmp1000 * _tmp964 + _tmp1001 * _tmp978 + _tmp1003 * _tmp972 + _tmp1005 * _tmp984 +
+           _tmp1007 * _tmp967 + _tmp1009 * _tmp973 + _tmp1011 * _tmp975 + _tmp1013 * _tmp957 +
+           _tmp1014 * _tmp970 + _tmp1016 * _tmp961 + _tmp1018 * _tmp981 + _tmp956 * _tmp993 +
+           _tmp960 * _tmp991 + _tmp962 * _tmp997 + _tmp966 * _tmp994 + _tmp980 * _tmp998);
+  const Scalar _tmp1080 =
+      _tmp1061 * _tmp949 - _tmp1071 * _tmp949 + _tmp745 * _tmp986 - _tmp761 * _tmp954 -
+      imu_noise(2, 0) *
+          (_tmp914 * _tmp958 + _tmp916 * _tmp982 + _tmp918 * _tmp972 + _tmp921 * _tmp964 +
+           _tmp923 * _tmp955 + _tmp924 * _tmp978 + _tmp931 * _tmp961 + _tmp932 * _tmp968 +
+           _tmp935 * _tmp983 + _tmp937 * _tmp975 + _tmp939 * _tmp973 + _tmp940 * _tmp966 +
+           _tmp943 * _tmp980 + _tmp945 * _tmp970 + _tmp948 * _tmp962 + _tmp951 * _tmp959);
+  const Scalar _tmp1081 =
+      std::pow(_tmp1001, Scalar(2)) * _tmp786 + std::pow(_tmp1003, Scalar(2)) * _tmp784 +
+      std::pow(_tmp1005, Scalar(2)) * _tmp795 + std::pow(_tmp1006, Scalar(2)) * _tmp791 +
+      std::pow(_tmp1008, Scalar(2)) * _tmp788 + std::pow(_tmp1010, Scalar(2)) * _tmp792 +
+      std::pow(_tmp1012, Scalar(2)) * _tmp787 + std::pow(_tmp1014, Scalar(2)) * _tmp785 +
+      std::pow(_tmp1015, Scalar(2)) * _tmp797 + std::pow(_tmp1017, Scalar(2)) * _tmp790 +
+      _tmp782 * std::pow(_tmp999, Scalar(2)) + _tmp783 * std::pow(_tmp993, Scalar(2)) +
+      _tmp789 * std::pow(_tmp996, Scalar(2)) + _tmp793 * std::pow(_tmp994, Scalar(2)) +
+      _tmp794 * std::pow(_tmp991, Scalar(2)) + _tmp796 * std::pow(_tmp998, Scalar(2));
+  const Scalar _tmp1082 = -_tmp1025 * _tmp777 - _tmp1026 * _tmp777 + _tmp1068 * _tmp949 +
+                          _tmp1069 * _tmp949 + _tmp1074 * imu_noise(4, 0) +
+                          _tmp1076 * imu_noise(2, 0) + _tmp1081 * imu_noise(0, 0) +
+                          _tmp745 * _tmp953 + _tmp745 * _tmp954;
+  const Scalar _tmp1083 = _tmp1020 * _tmp777 + _tmp1021 * _tmp777 + _tmp1057 * _tmp949 +
+                          _tmp1058 * _tmp949 + _tmp1074 * imu_noise(3, 0) +
+                          _tmp1075 * imu_noise(2, 0) + _tmp1081 * imu_noise(1, 0) -
+                          _tmp761 * _tmp986 - _tmp761 * _tmp987;
+  const Scalar _tmp1084 = _tmp811 * _tmp954 + _tmp813 * _tmp987;
+  const Scalar _tmp1085 = _tmp1021 * _tmp813 + _tmp816 * _tmp990;
+  const Scalar _tmp1086 = _tmp1024 * _tmp816 + _tmp1026 * _tmp811;
+  const Scalar _tmp1087 = _tmp1048 * _tmp816 + _tmp1051 * _tmp811 + _tmp1054 * _tmp813;
+  const Scalar _tmp1088 = _tmp1067 * _tmp816 + _tmp1070 * _tmp811 + _tmp1072 * _tmp813;
+  const Scalar _tmp1089 = _tmp1059 * _tmp813 + _tmp1062 * _tmp811 + _tmp1064 * _tmp816;
+  const Scalar _tmp1090 = _tmp1078 * _tmp816 + _tmp1080 * _tmp811 + _tmp1083 * _tmp813;
+  const Scalar _tmp1091 = _tmp1077 * _tmp816 + _tmp1078 * _tmp813 + _tmp1079 * _tmp811;
+  const Scalar _tmp1092 = _tmp1079 * _tmp816 + _tmp1080 * _tmp813 + _tmp1082 * _tmp811;
+  const Scalar _tmp1093 = _tmp1024 * _tmp820 + _tmp1026 * _tmp821;
+  const Scalar _tmp1094 = _tmp1021 * _tmp818 + _tmp820 * _tmp990;
+  const Scalar _tmp1095 = _tmp818 * _tmp987 + _tmp821 * _tmp954;
+  const Scalar _tmp1096 = _tmp1059 * _tmp818 + _tmp1062 * _tmp821 + _tmp1064 * _tmp820;
+  const Scalar _tmp1097 = _tmp1048 * _tmp820 + _tmp1051 * _tmp821 + _tmp1054 * _tmp818;
+  const Scalar _tmp1098 = _tmp1067 * _tmp820 + _tmp1070 * _tmp821 + _tmp1072 * _tmp818;
+  const Scalar _tmp1099 = _tmp1078 * _tmp820 + _tmp1080 * _tmp821 + _tmp1083 * _tmp818;
+  const Scalar _tmp1100 = _tmp1077 * _tmp820 + _tmp1078 * _tmp818 + _tmp1079 * _tmp821;
+  const Scalar _tmp1101 = _tmp1079 * _tmp820 + _tmp1080 * _tmp818 + _tmp1082 * _tmp821;
+
+  // Output terms (2)
+  if (delta != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _delta = (*delta);
+
+    _delta(0, 0) = _tmp143;
+    _delta(1, 0) = _tmp144;
+    _delta(2, 0) = _tmp145;
+    _delta(3, 0) = _tmp146;
+    _delta(4, 0) = _tmp500;
+    _delta(5, 0) = _tmp592;
+    _delta(6, 0) = _tmp654;
+    _delta(7, 0) = _tmp745;
+    _delta(8, 0) = _tmp761;
+    _delta(9, 0) = _tmp777;
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = std::pow(_tmp781, Scalar(2)) * _tmp799 + std::pow(_tmp804, Scalar(2)) * _tmp805 +
+                 std::pow(_tmp808, Scalar(2)) * _tmp809;
+    _cov(1, 0) = _tmp781 * _tmp799 * _tmp813 + _tmp804 * _tmp817 + _tmp811 * _tmp812;
+    _cov(2, 0) = _tmp799 * std::pow(_tmp813, Scalar(2)) + _tmp805 * std::pow(_tmp816, Scalar(2)) +
+                 _tmp809 * std::pow(_tmp811, Scalar(2));
+    _cov(3, 0) = _tmp781 * _tmp819 + _tmp804 * _tmp805 * _tmp820 + _tmp812 * _tmp821;
+    _cov(4, 0) = _tmp809 * _tmp811 * _tmp821 + _tmp813 * _tmp819 + _tmp817 * _tmp820;
+    _cov(5, 0) = _tmp799 * std::pow(_tmp818, Scalar(2)) + _tmp805 * std::pow(_tmp820, Scalar(2)) +
+                 _tmp809 * std::pow(_tmp821, Scalar(2));
+    _cov(6, 0) = _tmp781 * _tmp878 + _tmp804 * _tmp873 + _tmp808 * _tmp855;
+    _cov(7, 0) = _tmp811 * _tmp855 + _tmp813 * _tmp878 + _tmp816 * _tmp873;
+    _cov(8, 0) = _tmp818 * _tmp878 + _tmp820 * _tmp873 + _tmp821 * _tmp855;
+    _cov(9, 0) = _tmp781 * (_tmp781 * _tmp884 + _tmp804 * _tmp880 + _tmp808 * _tmp886) +
+                 _tmp804 * (_tmp781 * _tmp880 + _tmp804 * _tmp893 + _tmp808 * _tmp888) +
+                 _tmp808 * (_tmp781 * _tmp886 + _tmp804 * _tmp888 + _tmp808 * _tmp891);
+    _cov(10, 0) = _tmp781 * _tmp896 + _tmp804 * _tmp895 + _tmp808 * _tmp894;
+    _cov(11, 0) = _tmp811 * _tmp894 + _tmp813 * _tmp896 + _tmp816 * _tmp895;
+    _cov(12, 0) = _tmp818 * _tmp896 + _tmp820 * _tmp895 + _tmp821 * _tmp894;
+    _cov(13, 0) = _tmp781 * _tmp898 + _tmp804 * _tmp899 + _tmp808 * _tmp897;
+    _cov(14, 0) = _tmp811 * _tmp897 + _tmp813 * _tmp898 + _tmp816 * _tmp899;
+    _cov(15, 0) = _tmp781 * _tmp901 + _tmp804 * _tmp900 + _tmp808 * _tmp902;
+    _cov(16, 0) = _tmp811 * _tmp902 + _tmp813 * _tmp901 + _tmp816 * _tmp900;
+    _cov(17, 0) = _tmp818 * _tmp901 + _tmp820 * _tmp900 + _tmp821 * _tmp902;
+    _cov(18, 0) = _tmp781 * _tmp903 + _tmp804 * _tmp904 + _tmp808 * _tmp905;
+    _cov(19, 0) = _tmp811 * _tmp905 + _tmp813 * _tmp903 + _tmp816 * _tmp904;
+    _cov(20, 0) = _tmp818 * _tmp903 + _tmp820 * _tmp904 + _tmp821 * _tmp905;
+    _cov(21, 0) = _tmp1022 * _tmp808 + _tmp1027 * _tmp781 + _tmp804 * _tmp988;
+    _cov(22, 0) = _tmp1022 * _tmp811 + _tmp1027 * _tmp813 + _tmp816 * _tmp988;
+    _cov(23, 0) = _tmp1022 * _tmp821 + _tmp1027 * _tmp818 + _tmp820 * _tmp988;
+    _cov(24, 0) = _tmp1055 * _tmp804 + _tmp1065 * _tmp781 + _tmp1073 * _tmp808;
+    _cov(25, 0) = _tmp1055 * _tmp816 + _tmp1065 * _tmp813 + _tmp1073 * _tmp811;
+    _cov(26, 0) = _tmp1055 * _tmp820 + _tmp1065 * _tmp818 + _tmp1073 * _tmp821;
+    _cov(27, 0) = _tmp781 * (_tmp1078 * _tmp804 + _tmp1080 * _tmp808 + _tmp1083 * _tmp781) +
+                  _tmp804 * (_tmp1077 * _tmp804 + _tmp1078 * _tmp781 + _tmp1079 * _tmp808) +
+                  _tmp808 * (_tmp1079 * _tmp804 + _tmp1080 * _tmp781 + _tmp1082 * _tmp808);
+    _cov(28, 0) = _tmp1084 * _tmp804 + _tmp1085 * _tmp808 + _tmp1086 * _tmp781;
+    _cov(29, 0) = _tmp1084 * _tmp816 + _tmp1085 * _tmp811 + _tmp1086 * _tmp813;
+    _cov(30, 0) = _tmp1084 * _tmp820 + _tmp1085 * _tmp821 + _tmp1086 * _tmp818;
+    _cov(31, 0) = _tmp1087 * _tmp804 + _tmp1088 * _tmp808 + _tmp1089 * _tmp781;
+    _cov(32, 0) = _tmp1087 * _tmp816 + _tmp1088 * _tmp811 + _tmp1089 * _tmp813;
+    _cov(33, 0) = _tmp1087 * _tmp820 + _tmp1088 * _tmp821 + _tmp1089 * _tmp818;
+    _cov(34, 0) = _tmp1090 * _tmp781 + _tmp1091 * _tmp804 + _tmp1092 * _tmp808;
+    _cov(35, 0) = _tmp1090 * _tmp813 + _tmp1091 * _tmp816 + _tmp1092 * _tmp811;
+    _cov(36, 0) = _tmp1093 * _tmp781 + _tmp1094 * _tmp808 + _tmp1095 * _tmp804;
+    _cov(37, 0) = _tmp1093 * _tmp813 + _tmp1094 * _tmp811 + _tmp1095 * _tmp816;
+    _cov(38, 0) = _tmp1093 * _tmp818 + _tmp1094 * _tmp821 + _tmp1095 * _tmp820;
+    _cov(39, 0) = _tmp1096 * _tmp781 + _tmp1097 * _tmp804 + _tmp1098 * _tmp808;
+    _cov(40, 0) = _tmp1096 * _tmp813 + _tmp1097 * _tmp816 + _tmp1098 * _tmp811;
+    _cov(41, 0) = _tmp1096 * _tmp818 + _tmp1097 * _tmp820 + _tmp1098 * _tmp821;
+    _cov(42, 0) = _tmp1099 * _tmp781 + _tmp1100 * _tmp804 + _tmp1101 * _tmp808;
+    _cov(43, 0) = _tmp1099 * _tmp813 + _tmp1100 * _tmp816 + _tmp1101 * _tmp811;
+    _cov(44, 0) = _tmp1099 * _tmp818 + _tmp1100 * _tmp820 + _tmp1101 * _tmp821;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
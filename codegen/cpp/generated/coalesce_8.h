@@ -0,0 +1,917 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     imu_noise: Matrix61
+ *     samples: Matrix68
+ *     dt: Matrix81
+ *
+ * Outputs:
+ *     delta: Matrix10_1
+ *     cov: Matrix45_1
+ */
+template <typename Scalar>
+void Coalesce8(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+               const Eigen::Matrix<Scalar, 6, 8>& samples, const Eigen::Matrix<Scalar, 8, 1>& dt,
+               Eigen::Matrix<Scalar, 10, 1>* const delta = nullptr,
+               Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 2412
+
+  // Input arrays
+
+  // Intermediate terms (612)
+  const Scalar _tmp0 = dt(6, 0) * samples(2, 6);
+  const Scalar _tmp1 = dt(5, 0) * samples(2, 5);
+  const Scalar _tmp2 = dt(4, 0) * samples(2, 4);
+  const Scalar _tmp3 = dt(3, 0) * samples(2, 3);
+  const Scalar _tmp4 = dt(2, 0) * samples(2, 2);
+  const Scalar _tmp5 = dt(0, 0) * samples(2, 0);
+  const Scalar _tmp6 = dt(1, 0) * samples(2, 1);
+  const Scalar _tmp7 = _tmp5 + _tmp6;
+  const Scalar _tmp8 = _tmp4 + _tmp7;
+  const Scalar _tmp9 = _tmp3 + _tmp8;
+  const Scalar _tmp10 = _tmp2 + _tmp9;
+  const Scalar _tmp11 = _tmp1 + _tmp10;
+  const Scalar _tmp12 = _tmp0 + _tmp11;
+  const Scalar _tmp13 = dt(7, 0) * samples(1, 7);
+  const Scalar _tmp14 = dt(6, 0) * samples(1, 6);
+  const Scalar _tmp15 = dt(5, 0) * samples(1, 5);
+  const Scalar _tmp16 = dt(4, 0) * samples(1, 4);
+  const Scalar _tmp17 = dt(3, 0) * samples(1, 3);
+  const Scalar _tmp18 = dt(2, 0) * samples(1, 2);
+  const Scalar _tmp19 = dt(1, 0) * samples(1, 1);
+  const Scalar _tmp20 = dt(0, 0) * samples(1, 0);
+  const Scalar _tmp21 = _tmp19 + _tmp20;
+  const Scalar _tmp22 = _tmp18 + _tmp21;
+  const Scalar _tmp23 = _tmp17 + _tmp22;
+  const Scalar _tmp24 = _tmp16 + _tmp23;
+  const Scalar _tmp25 = _tmp15 + _tmp24;
+  const Scalar _tmp26 = _tmp14 + _tmp25;
+  const Scalar _tmp27 = dt(7, 0) * samples(2, 7);
+  const Scalar _tmp28 = dt(7, 0) * samples(0, 7);
+  const Scalar _tmp29 = dt(6, 0) * samples(0, 6);
+  const Scalar _tmp30 = dt(5, 0) * samples(0, 5);
+  const Scalar _tmp31 = dt(4, 0) * samples(0, 4);
+  const Scalar _tmp32 = dt(3, 0) * samples(0, 3);
+  const Scalar _tmp33 = dt(2, 0) * samples(0, 2);
+  const Scalar _tmp34 = dt(0, 0) * samples(0, 0);
+  const Scalar _tmp35 = dt(1, 0) * samples(0, 1);
+  const Scalar _tmp36 = _tmp34 + _tmp35;
+  const Scalar _tmp37 =
+      -Scalar(1) / Scalar(2) * _tmp19 * _tmp5 + (Scalar(1) / Scalar(2)) * _tmp20 * _tmp6 + _tmp36;
+  const Scalar _tmp38 = -Scalar(1) / Scalar(2) * _tmp18 * _tmp7 +
+                        (Scalar(1) / Scalar(2)) * _tmp21 * _tmp4 + _tmp33 + _tmp37;
+  const Scalar _tmp39 = -Scalar(1) / Scalar(2) * _tmp17 * _tmp8 +
+                        (Scalar(1) / Scalar(2)) * _tmp22 * _tmp3 + _tmp32 + _tmp38;
+  const Scalar _tmp40 = -Scalar(1) / Scalar(2) * _tmp16 * _tmp9 +
+                        (Scalar(1) / Scalar(2)) * _tmp2 * _tmp23 + _tmp31 + _tmp39;
+  const Scalar _tmp41 = (Scalar(1) / Scalar(2)) * _tmp1 * _tmp24 -
+                        Scalar(1) / Scalar(2) * _tmp10 * _tmp15 + _tmp30 + _tmp40;
+  const Scalar _tmp42 = (Scalar(1) / Scalar(2)) * _tmp0 * _tmp25 -
+                        Scalar(1) / Scalar(2) * _tmp11 * _tmp14 + _tmp29 + _tmp41;
+  const Scalar _tmp43 = -Scalar(1) / Scalar(2) * _tmp12 * _tmp13 +
+                        (Scalar(1) / Scalar(2)) * _tmp26 * _tmp27 + _tmp28 + _tmp42;
+  const Scalar _tmp44 = _tmp33 + _tmp36;
+  const Scalar _tmp45 = _tmp32 + _tmp44;
+  const Scalar _tmp46 = _tmp31 + _tmp45;
+  const Scalar _tmp47 = _tmp30 + _tmp46;
+  const Scalar _tmp48 = _tmp29 + _tmp47;
+  const Scalar _tmp49 =
+      (Scalar(1) / Scalar(2)) * _tmp19 * _tmp34 - Scalar(1) / Scalar(2) * _tmp20 * _tmp35 + _tmp7;
+  const Scalar _tmp50 = (Scalar(1) / Scalar(2)) * _tmp18 * _tmp36 -
+                        Scalar(1) / Scalar(2) * _tmp21 * _tmp33 + _tmp4 + _tmp49;
+  const Scalar _tmp51 = (Scalar(1) / Scalar(2)) * _tmp17 * _tmp44 -
+                        Scalar(1) / Scalar(2) * _tmp22 * _tmp32 + _tmp3 + _tmp50;
+  const Scalar _tmp52 = (Scalar(1) / Scalar(2)) * _tmp16 * _tmp45 + _tmp2 -
+                        Scalar(1) / Scalar(2) * _tmp23 * _tmp31 + _tmp51;
+  const Scalar _tmp53 = _tmp1 + (Scalar(1) / Scalar(2)) * _tmp15 * _tmp46 -
+                        Scalar(1) / Scalar(2) * _tmp24 * _tmp30 + _tmp52;
+  const Scalar _tmp54 = _tmp0 + (Scalar(1) / Scalar(2)) * _tmp14 * _tmp47 -
+                        Scalar(1) / Scalar(2) * _tmp25 * _tmp29 + _tmp53;
+  const Scalar _tmp55 = (Scalar(1) / Scalar(2)) * _tmp13 * _tmp48 -
+                        Scalar(1) / Scalar(2) * _tmp26 * _tmp28 + _tmp27 + _tmp54;
+  const Scalar _tmp56 = std::pow(_tmp55, Scalar(2));
+  const Scalar _tmp57 = std::pow(_tmp43, Scalar(2));
+  const Scalar _tmp58 =
+      _tmp21 - Scalar(1) / Scalar(2) * _tmp34 * _tmp6 + (Scalar(1) / Scalar(2)) * _tmp35 * _tmp5;
+  const Scalar _tmp59 = _tmp18 + (Scalar(1) / Scalar(2)) * _tmp33 * _tmp7 -
+                        Scalar(1) / Scalar(2) * _tmp36 * _tmp4 + _tmp58;
+  const Scalar _tmp60 = _tmp17 - Scalar(1) / Scalar(2) * _tmp3 * _tmp44 +
+                        (Scalar(1) / Scalar(2)) * _tmp32 * _tmp8 + _tmp59;
+  const Scalar _tmp61 = _tmp16 - Scalar(1) / Scalar(2) * _tmp2 * _tmp45 +
+                        (Scalar(1) / Scalar(2)) * _tmp31 * _tmp9 + _tmp60;
+  const Scalar _tmp62 = -Scalar(1) / Scalar(2) * _tmp1 * _tmp46 +
+                        (Scalar(1) / Scalar(2)) * _tmp10 * _tmp30 + _tmp15 + _tmp61;
+  const Scalar _tmp63 = -Scalar(1) / Scalar(2) * _tmp0 * _tmp47 +
+                        (Scalar(1) / Scalar(2)) * _tmp11 * _tmp29 + _tmp14 + _tmp62;
+  const Scalar _tmp64 = (Scalar(1) / Scalar(2)) * _tmp12 * _tmp28 + _tmp13 -
+                        Scalar(1) / Scalar(2) * _tmp27 * _tmp48 + _tmp63;
+  const Scalar _tmp65 = std::pow(_tmp64, Scalar(2));
+  const Scalar _tmp66 = _tmp56 + _tmp57 + _tmp65 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp67 = std::sqrt(_tmp66);
+  const Scalar _tmp68 = (Scalar(1) / Scalar(2)) * _tmp67;
+  const Scalar _tmp69 = std::sin(_tmp68);
+  const Scalar _tmp70 = _tmp69 / _tmp67;
+  const Scalar _tmp71 = _tmp43 * _tmp70;
+  const Scalar _tmp72 = _tmp64 * _tmp70;
+  const Scalar _tmp73 = _tmp55 * _tmp70;
+  const Scalar _tmp74 = std::cos(_tmp68);
+  const Scalar _tmp75 = std::pow(dt(7, 0), Scalar(2));
+  const Scalar _tmp76 = _tmp75 * samples(3, 7);
+  const Scalar _tmp77 = _tmp75 * samples(0, 7);
+  const Scalar _tmp78 = _tmp76 * samples(2, 7) - _tmp77 * samples(5, 7);
+  const Scalar _tmp79 = -_tmp76 * samples(1, 7) + _tmp77 * samples(4, 7);
+  const Scalar _tmp80 = _tmp75 * samples(5, 7);
+  const Scalar _tmp81 = _tmp75 * samples(4, 7);
+  const Scalar _tmp82 = _tmp80 * samples(1, 7) - _tmp81 * samples(2, 7);
+  const Scalar _tmp83 =
+      (Scalar(1) / Scalar(2)) * _tmp13 * _tmp79 - Scalar(1) / Scalar(2) * _tmp27 * _tmp78 + _tmp82;
+  const Scalar _tmp84 = (Scalar(1) / Scalar(2)) * dt(7, 0);
+  const Scalar _tmp85 = _tmp83 * _tmp84 + dt(7, 0) * samples(3, 7);
+  const Scalar _tmp86 = -std::pow(_tmp54, Scalar(2));
+  const Scalar _tmp87 = -std::pow(_tmp63, Scalar(2));
+  const Scalar _tmp88 = (Scalar(1) / Scalar(2)) * _tmp86 + (Scalar(1) / Scalar(2)) * _tmp87 + 1;
+  const Scalar _tmp89 = (Scalar(1) / Scalar(2)) * _tmp42;
+  const Scalar _tmp90 = _tmp54 * _tmp89;
+  const Scalar _tmp91 = _tmp63 + _tmp90;
+  const Scalar _tmp92 =
+      -Scalar(1) / Scalar(2) * _tmp13 * _tmp82 + (Scalar(1) / Scalar(2)) * _tmp28 * _tmp78 + _tmp79;
+  const Scalar _tmp93 = _tmp84 * _tmp92 + dt(7, 0) * samples(5, 7);
+  const Scalar _tmp94 =
+      (Scalar(1) / Scalar(2)) * _tmp27 * _tmp82 - Scalar(1) / Scalar(2) * _tmp28 * _tmp79 + _tmp78;
+  const Scalar _tmp95 = _tmp84 * _tmp94 + dt(7, 0) * samples(4, 7);
+  const Scalar _tmp96 = _tmp63 * _tmp89;
+  const Scalar _tmp97 = -_tmp54 + _tmp96;
+  const Scalar _tmp98 = std::pow(dt(6, 0), Scalar(2));
+  const Scalar _tmp99 = _tmp98 * samples(5, 6);
+  const Scalar _tmp100 = _tmp98 * samples(4, 6);
+  const Scalar _tmp101 = -_tmp100 * samples(2, 6) + _tmp99 * samples(1, 6);
+  const Scalar _tmp102 = _tmp98 * samples(3, 6);
+  const Scalar _tmp103 = _tmp102 * samples(2, 6) - _tmp99 * samples(0, 6);
+  const Scalar _tmp104 = _tmp100 * samples(0, 6) - _tmp102 * samples(1, 6);
+  const Scalar _tmp105 = -Scalar(1) / Scalar(2) * _tmp101 * _tmp14 +
+                         (Scalar(1) / Scalar(2)) * _tmp103 * _tmp29 + _tmp104;
+  const Scalar _tmp106 = (Scalar(1) / Scalar(2)) * dt(6, 0);
+  const Scalar _tmp107 = _tmp105 * _tmp106 + dt(6, 0) * samples(5, 6);
+  const Scalar _tmp108 = (Scalar(1) / Scalar(2)) * _tmp41 * _tmp53;
+  const Scalar _tmp109 = _tmp108 + _tmp62;
+  const Scalar _tmp110 = (Scalar(1) / Scalar(2)) * _tmp0 * _tmp101 + _tmp103 -
+                         Scalar(1) / Scalar(2) * _tmp104 * _tmp29;
+  const Scalar _tmp111 = _tmp106 * _tmp110 + dt(6, 0) * samples(4, 6);
+  const Scalar _tmp112 = (Scalar(1) / Scalar(2)) * _tmp62;
+  const Scalar _tmp113 = _tmp112 * _tmp41;
+  const Scalar _tmp114 = _tmp113 - _tmp53;
+  const Scalar _tmp115 = -Scalar(1) / Scalar(2) * _tmp0 * _tmp103 + _tmp101 +
+                         (Scalar(1) / Scalar(2)) * _tmp104 * _tmp14;
+  const Scalar _tmp116 = _tmp106 * _tmp115 + dt(6, 0) * samples(3, 6);
+  const Scalar _tmp117 = -std::pow(_tmp62, Scalar(2));
+  const Scalar _tmp118 = -std::pow(_tmp53, Scalar(2));
+  const Scalar _tmp119 = (Scalar(1) / Scalar(2)) * _tmp117 + (Scalar(1) / Scalar(2)) * _tmp118 + 1;
+  const Scalar _tmp120 = std::pow(dt(5, 0), Scalar(2));
+  const Scalar _tmp121 = _tmp120 * samples(5, 5);
+  const Scalar _tmp122 = _tmp120 * samples(4, 5);
+  const Scalar _tmp123 = _tmp121 * samples(1, 5) - _tmp122 * samples(2, 5);
+  const Scalar _tmp124 = _tmp120 * samples(3, 5);
+  const Scalar _tmp125 = -_tmp121 * samples(0, 5) + _tmp124 * samples(2, 5);
+  const Scalar _tmp126 = _tmp122 * samples(0, 5) - _tmp124 * samples(1, 5);
+  const Scalar _tmp127 = -Scalar(1) / Scalar(2) * _tmp123 * _tmp15 +
+                         (Scalar(1) / Scalar(2)) * _tmp125 * _tmp30 + _tmp126;
+  const Scalar _tmp128 = (Scalar(1) / Scalar(2)) * dt(5, 0);
+  const Scalar _tmp129 = _tmp127 * _tmp128 + dt(5, 0) * samples(5, 5);
+  const Scalar _tmp130 = (Scalar(1) / Scalar(2)) * _tmp52;
+  const Scalar _tmp131 = _tmp130 * _tmp40;
+  const Scalar _tmp132 = _tmp131 + _tmp61;
+  const Scalar _tmp133 = (Scalar(1) / Scalar(2)) * _tmp1 * _tmp123 + _tmp125 -
+                         Scalar(1) / Scalar(2) * _tmp126 * _tmp30;
+  const Scalar _tmp134 = _tmp128 * _tmp133 + dt(5, 0) * samples(4, 5);
+  const Scalar _tmp135 = (Scalar(1) / Scalar(2)) * _tmp40 * _tmp61;
+  const Scalar _tmp136 = _tmp135 - _tmp52;
+  const Scalar _tmp137 = -std::pow(_tmp52, Scalar(2));
+  const Scalar _tmp138 = -std::pow(_tmp61, Scalar(2));
+  const Scalar _tmp139 = (Scalar(1) / Scalar(2)) * _tmp137 + (Scalar(1) / Scalar(2)) * _tmp138 + 1;
+  const Scalar _tmp140 = -Scalar(1) / Scalar(2) * _tmp1 * _tmp125 + _tmp123 +
+                         (Scalar(1) / Scalar(2)) * _tmp126 * _tmp15;
+  const Scalar _tmp141 = _tmp128 * _tmp140 + dt(5, 0) * samples(3, 5);
+  const Scalar _tmp142 = -std::pow(_tmp51, Scalar(2));
+  const Scalar _tmp143 = -std::pow(_tmp60, Scalar(2));
+  const Scalar _tmp144 = (Scalar(1) / Scalar(2)) * _tmp142 + (Scalar(1) / Scalar(2)) * _tmp143 + 1;
+  const Scalar _tmp145 = std::pow(dt(4, 0), Scalar(2));
+  const Scalar _tmp146 = _tmp145 * samples(4, 4);
+  const Scalar _tmp147 = _tmp145 * samples(3, 4);
+  const Scalar _tmp148 = _tmp146 * samples(0, 4) - _tmp147 * samples(1, 4);
+  const Scalar _tmp149 = _tmp145 * samples(5, 4);
+  const Scalar _tmp150 = _tmp147 * samples(2, 4) - _tmp149 * samples(0, 4);
+  const Scalar _tmp151 = -_tmp146 * samples(2, 4) + _tmp149 * samples(1, 4);
+  const Scalar _tmp152 = (Scalar(1) / Scalar(2)) * _tmp148 * _tmp16 -
+                         Scalar(1) / Scalar(2) * _tmp150 * _tmp2 + _tmp151;
+  const Scalar _tmp153 = (Scalar(1) / Scalar(2)) * dt(4, 0);
+  const Scalar _tmp154 = _tmp152 * _tmp153 + dt(4, 0) * samples(3, 4);
+  const Scalar _tmp155 = (Scalar(1) / Scalar(2)) * _tmp60;
+  const Scalar _tmp156 = _tmp155 * _tmp39;
+  const Scalar _tmp157 = _tmp156 - _tmp51;
+  const Scalar _tmp158 = -Scalar(1) / Scalar(2) * _tmp148 * _tmp31 + _tmp150 +
+                         (Scalar(1) / Scalar(2)) * _tmp151 * _tmp2;
+  const Scalar _tmp159 = _tmp153 * _tmp158 + dt(4, 0) * samples(4, 4);
+  const Scalar _tmp160 = _tmp148 + (Scalar(1) / Scalar(2)) * _tmp150 * _tmp31 -
+                         Scalar(1) / Scalar(2) * _tmp151 * _tmp16;
+  const Scalar _tmp161 = _tmp153 * _tmp160 + dt(4, 0) * samples(5, 4);
+  const Scalar _tmp162 = (Scalar(1) / Scalar(2)) * _tmp39 * _tmp51;
+  const Scalar _tmp163 = _tmp162 + _tmp60;
+  const Scalar _tmp164 = (Scalar(1) / Scalar(2)) * _tmp59;
+  const Scalar _tmp165 = _tmp164 * _tmp38;
+  const Scalar _tmp166 = _tmp165 - _tmp50;
+  const Scalar _tmp167 = std::pow(dt(3, 0), Scalar(2));
+  const Scalar _tmp168 = _tmp167 * samples(5, 3);
+  const Scalar _tmp169 = _tmp167 * samples(4, 3);
+  const Scalar _tmp170 = _tmp168 * samples(1, 3) - _tmp169 * samples(2, 3);
+  const Scalar _tmp171 = _tmp167 * samples(3, 3);
+  const Scalar _tmp172 = _tmp169 * samples(0, 3) - _tmp171 * samples(1, 3);
+  const Scalar _tmp173 = -_tmp168 * samples(0, 3) + _tmp171 * samples(2, 3);
+  const Scalar _tmp174 = (Scalar(1) / Scalar(2)) * _tmp170 * _tmp3 -
+                         Scalar(1) / Scalar(2) * _tmp172 * _tmp32 + _tmp173;
+  const Scalar _tmp175 = (Scalar(1) / Scalar(2)) * dt(3, 0);
+  const Scalar _tmp176 = _tmp174 * _tmp175 + dt(3, 0) * samples(4, 3);
+  const Scalar _tmp177 = (Scalar(1) / Scalar(2)) * _tmp17 * _tmp172 + _tmp170 -
+                         Scalar(1) / Scalar(2) * _tmp173 * _tmp3;
+  const Scalar _tmp178 = _tmp175 * _tmp177 + dt(3, 0) * samples(3, 3);
+  const Scalar _tmp179 = -std::pow(_tmp59, Scalar(2));
+  const Scalar _tmp180 = -std::pow(_tmp50, Scalar(2));
+  const Scalar _tmp181 = (Scalar(1) / Scalar(2)) * _tmp179 + (Scalar(1) / Scalar(2)) * _tmp180 + 1;
+  const Scalar _tmp182 = (Scalar(1) / Scalar(2)) * _tmp38 * _tmp50;
+  const Scalar _tmp183 = _tmp182 + _tmp59;
+  const Scalar _tmp184 = -Scalar(1) / Scalar(2) * _tmp17 * _tmp170 + _tmp172 +
+                         (Scalar(1) / Scalar(2)) * _tmp173 * _tmp32;
+  const Scalar _tmp185 = _tmp175 * _tmp184 + dt(3, 0) * samples(5, 3);
+  const Scalar _tmp186 = std::pow(dt(2, 0), Scalar(2));
+  const Scalar _tmp187 = _tmp186 * samples(4, 2);
+  const Scalar _tmp188 = _tmp186 * samples(3, 2);
+  const Scalar _tmp189 = _tmp187 * samples(0, 2) - _tmp188 * samples(1, 2);
+  const Scalar _tmp190 = _tmp186 * samples(5, 2);
+  const Scalar _tmp191 = _tmp188 * samples(2, 2) - _tmp190 * samples(0, 2);
+  const Scalar _tmp192 = -_tmp187 * samples(2, 2) + _tmp190 * samples(1, 2);
+  const Scalar _tmp193 = (Scalar(1) / Scalar(2)) * _tmp18 * _tmp189 -
+                         Scalar(1) / Scalar(2) * _tmp191 * _tmp4 + _tmp192;
+  const Scalar _tmp194 = (Scalar(1) / Scalar(2)) * dt(2, 0);
+  const Scalar _tmp195 = _tmp193 * _tmp194 + dt(2, 0) * samples(3, 2);
+  const Scalar _tmp196 = -std::pow(_tmp49, Scalar(2));
+  const Scalar _tmp197 = -std::pow(_tmp58, Scalar(2));
+  const Scalar _tmp198 = (Scalar(1) / Scalar(2)) * _tmp196 + (Scalar(1) / Scalar(2)) * _tmp197 + 1;
+  const Scalar _tmp199 = -Scalar(1) / Scalar(2) * _tmp189 * _tmp33 + _tmp191 +
+                         (Scalar(1) / Scalar(2)) * _tmp192 * _tmp4;
+  const Scalar _tmp200 = _tmp194 * _tmp199 + dt(2, 0) * samples(4, 2);
+  const Scalar _tmp201 = (Scalar(1) / Scalar(2)) * _tmp37 * _tmp58;
+  const Scalar _tmp202 = _tmp201 - _tmp49;
+  const Scalar _tmp203 = -Scalar(1) / Scalar(2) * _tmp18 * _tmp192 + _tmp189 +
+                         (Scalar(1) / Scalar(2)) * _tmp191 * _tmp33;
+  const Scalar _tmp204 = _tmp194 * _tmp203 + dt(2, 0) * samples(5, 2);
+  const Scalar _tmp205 = (Scalar(1) / Scalar(2)) * _tmp49;
+  const Scalar _tmp206 = _tmp205 * _tmp37;
+  const Scalar _tmp207 = _tmp206 + _tmp58;
+  const Scalar _tmp208 = std::pow(dt(0, 0), Scalar(2));
+  const Scalar _tmp209 = (Scalar(1) / Scalar(2)) * _tmp208 * samples(2, 0);
+  const Scalar _tmp210 = _tmp209 * samples(0, 0);
+  const Scalar _tmp211 = _tmp20 + _tmp210;
+  const Scalar _tmp212 = std::pow(dt(1, 0), Scalar(2));
+  const Scalar _tmp213 = _tmp212 * samples(4, 1);
+  const Scalar _tmp214 = _tmp212 * samples(5, 1);
+  const Scalar _tmp215 = -_tmp213 * samples(2, 1) + _tmp214 * samples(1, 1);
+  const Scalar _tmp216 = _tmp212 * samples(0, 1);
+  const Scalar _tmp217 = _tmp212 * samples(3, 1);
+  const Scalar _tmp218 = -_tmp216 * samples(5, 1) + _tmp217 * samples(2, 1);
+  const Scalar _tmp219 = _tmp216 * samples(4, 1) - _tmp217 * samples(1, 1);
+  const Scalar _tmp220 = -Scalar(1) / Scalar(2) * _tmp19 * _tmp215 +
+                         (Scalar(1) / Scalar(2)) * _tmp218 * _tmp35 + _tmp219;
+  const Scalar _tmp221 = (Scalar(1) / Scalar(2)) * dt(1, 0);
+  const Scalar _tmp222 = _tmp220 * _tmp221 + dt(1, 0) * samples(5, 1);
+  const Scalar _tmp223 = -_tmp208 * std::pow(samples(2, 0), Scalar(2));
+  const Scalar _tmp224 = -_tmp208 * std::pow(samples(1, 0), Scalar(2));
+  const Scalar _tmp225 = (Scalar(1) / Scalar(2)) * _tmp223 + (Scalar(1) / Scalar(2)) * _tmp224 + 1;
+  const Scalar _tmp226 = (Scalar(1) / Scalar(2)) * _tmp19 * _tmp219 + _tmp215 -
+                         Scalar(1) / Scalar(2) * _tmp218 * _tmp6;
+  const Scalar _tmp227 = _tmp221 * _tmp226 + dt(1, 0) * samples(3, 1);
+  const Scalar _tmp228 = (Scalar(1) / Scalar(2)) * _tmp208 * samples(0, 0) * samples(1, 0);
+  const Scalar _tmp229 = _tmp228 - _tmp5;
+  const Scalar _tmp230 = (Scalar(1) / Scalar(2)) * _tmp215 * _tmp6 + _tmp218 -
+                         Scalar(1) / Scalar(2) * _tmp219 * _tmp35;
+  const Scalar _tmp231 = _tmp221 * _tmp230 + dt(1, 0) * samples(4, 1);
+  const Scalar _tmp232 = _tmp208 * samples(4, 0);
+  const Scalar _tmp233 = _tmp208 * samples(3, 0);
+  const Scalar _tmp234 = _tmp232 * samples(0, 0) - _tmp233 * samples(1, 0);
+  const Scalar _tmp235 = _tmp208 * samples(5, 0);
+  const Scalar _tmp236 = _tmp233 * samples(2, 0) - _tmp235 * samples(0, 0);
+  const Scalar _tmp237 = -_tmp232 * samples(2, 0) + _tmp235 * samples(1, 0);
+  const Scalar _tmp238 = (Scalar(1) / Scalar(2)) * _tmp20 * _tmp234 -
+                         Scalar(1) / Scalar(2) * _tmp236 * _tmp5 + _tmp237;
+  const Scalar _tmp239 = (Scalar(1) / Scalar(2)) * dt(0, 0);
+  const Scalar _tmp240 = _tmp238 * _tmp239 + dt(0, 0) * samples(3, 0);
+  const Scalar _tmp241 = _tmp211 * _tmp222 + _tmp225 * _tmp227 + _tmp229 * _tmp231 + _tmp240;
+  const Scalar _tmp242 = _tmp195 * _tmp198 + _tmp200 * _tmp202 + _tmp204 * _tmp207 + _tmp241;
+  const Scalar _tmp243 = _tmp166 * _tmp176 + _tmp178 * _tmp181 + _tmp183 * _tmp185 + _tmp242;
+  const Scalar _tmp244 = _tmp144 * _tmp154 + _tmp157 * _tmp159 + _tmp161 * _tmp163 + _tmp243;
+  const Scalar _tmp245 = _tmp129 * _tmp132 + _tmp134 * _tmp136 + _tmp139 * _tmp141 + _tmp244;
+  const Scalar _tmp246 = _tmp107 * _tmp109 + _tmp111 * _tmp114 + _tmp116 * _tmp119 + _tmp245;
+  const Scalar _tmp247 = _tmp246 + _tmp85 * _tmp88 + _tmp91 * _tmp93 + _tmp95 * _tmp97;
+  const Scalar _tmp248 = (Scalar(1) / Scalar(2)) * _tmp54 * _tmp63;
+  const Scalar _tmp249 = _tmp248 - _tmp42;
+  const Scalar _tmp250 = _tmp54 + _tmp96;
+  const Scalar _tmp251 = -std::pow(_tmp42, Scalar(2));
+  const Scalar _tmp252 = (Scalar(1) / Scalar(2)) * _tmp251 + (Scalar(1) / Scalar(2)) * _tmp86 + 1;
+  const Scalar _tmp253 = _tmp113 + _tmp53;
+  const Scalar _tmp254 = -std::pow(_tmp41, Scalar(2));
+  const Scalar _tmp255 = (Scalar(1) / Scalar(2)) * _tmp118 + (Scalar(1) / Scalar(2)) * _tmp254 + 1;
+  const Scalar _tmp256 = _tmp112 * _tmp53;
+  const Scalar _tmp257 = _tmp256 - _tmp41;
+  const Scalar _tmp258 = -std::pow(_tmp40, Scalar(2));
+  const Scalar _tmp259 = (Scalar(1) / Scalar(2)) * _tmp137 + (Scalar(1) / Scalar(2)) * _tmp258 + 1;
+  const Scalar _tmp260 = _tmp130 * _tmp61;
+  const Scalar _tmp261 = _tmp260 - _tmp40;
+  const Scalar _tmp262 = _tmp135 + _tmp52;
+  const Scalar _tmp263 = _tmp155 * _tmp51;
+  const Scalar _tmp264 = _tmp263 - _tmp39;
+  const Scalar _tmp265 = _tmp156 + _tmp51;
+  const Scalar _tmp266 = -std::pow(_tmp39, Scalar(2));
+  const Scalar _tmp267 = (Scalar(1) / Scalar(2)) * _tmp142 + (Scalar(1) / Scalar(2)) * _tmp266 + 1;
+  const Scalar _tmp268 = _tmp164 * _tmp50;
+  const Scalar _tmp269 = _tmp268 - _tmp38;
+  const Scalar _tmp270 = -std::pow(_tmp38, Scalar(2));
+  const Scalar _tmp271 = (Scalar(1) / Scalar(2)) * _tmp180 + (Scalar(1) / Scalar(2)) * _tmp270 + 1;
+  const Scalar _tmp272 = _tmp165 + _tmp50;
+  const Scalar _tmp273 = _tmp205 * _tmp58;
+  const Scalar _tmp274 = _tmp273 - _tmp37;
+  const Scalar _tmp275 = -std::pow(_tmp37, Scalar(2));
+  const Scalar _tmp276 = (Scalar(1) / Scalar(2)) * _tmp196 + (Scalar(1) / Scalar(2)) * _tmp275 + 1;
+  const Scalar _tmp277 = _tmp201 + _tmp49;
+  const Scalar _tmp278 = _tmp228 + _tmp5;
+  const Scalar _tmp279 = _tmp209 * samples(1, 0);
+  const Scalar _tmp280 = _tmp279 - _tmp34;
+  const Scalar _tmp281 = -_tmp208 * std::pow(samples(0, 0), Scalar(2));
+  const Scalar _tmp282 = (Scalar(1) / Scalar(2)) * _tmp223 + (Scalar(1) / Scalar(2)) * _tmp281 + 1;
+  const Scalar _tmp283 = -Scalar(1) / Scalar(2) * _tmp234 * _tmp34 + _tmp236 +
+                         (Scalar(1) / Scalar(2)) * _tmp237 * _tmp5;
+  const Scalar _tmp284 = _tmp239 * _tmp283 + dt(0, 0) * samples(4, 0);
+  const Scalar _tmp285 = _tmp222 * _tmp280 + _tmp227 * _tmp278 + _tmp231 * _tmp282 + _tmp284;
+  const Scalar _tmp286 = _tmp195 * _tmp277 + _tmp200 * _tmp276 + _tmp204 * _tmp274 + _tmp285;
+  const Scalar _tmp287 = _tmp176 * _tmp271 + _tmp178 * _tmp272 + _tmp185 * _tmp269 + _tmp286;
+  const Scalar _tmp288 = _tmp154 * _tmp265 + _tmp159 * _tmp267 + _tmp161 * _tmp264 + _tmp287;
+  const Scalar _tmp289 = _tmp129 * _tmp261 + _tmp134 * _tmp259 + _tmp141 * _tmp262 + _tmp288;
+  const Scalar _tmp290 = _tmp107 * _tmp257 + _tmp111 * _tmp255 + _tmp116 * _tmp253 + _tmp289;
+  const Scalar _tmp291 = _tmp249 * _tmp93 + _tmp250 * _tmp85 + _tmp252 * _tmp95 + _tmp290;
+  const Scalar _tmp292 = _tmp248 + _tmp42;
+  const Scalar _tmp293 = (Scalar(1) / Scalar(2)) * _tmp251 + (Scalar(1) / Scalar(2)) * _tmp87 + 1;
+  const Scalar _tmp294 = -_tmp63 + _tmp90;
+  const Scalar _tmp295 = (Scalar(1) / Scalar(2)) * _tmp117 + (Scalar(1) / Scalar(2)) * _tmp254 + 1;
+  const Scalar _tmp296 = _tmp108 - _tmp62;
+  const Scalar _tmp297 = _tmp256 + _tmp41;
+  const Scalar _tmp298 = _tmp131 - _tmp61;
+  const Scalar _tmp299 = _tmp260 + _tmp40;
+  const Scalar _tmp300 = (Scalar(1) / Scalar(2)) * _tmp138 + (Scalar(1) / Scalar(2)) * _tmp258 + 1;
+  const Scalar _tmp301 = _tmp162 - _tmp60;
+  const Scalar _tmp302 = _tmp263 + _tmp39;
+  const Scalar _tmp303 = (Scalar(1) / Scalar(2)) * _tmp143 + (Scalar(1) / Scalar(2)) * _tmp266 + 1;
+  const Scalar _tmp304 = _tmp182 - _tmp59;
+  const Scalar _tmp305 = (Scalar(1) / Scalar(2)) * _tmp179 + (Scalar(1) / Scalar(2)) * _tmp270 + 1;
+  const Scalar _tmp306 = _tmp268 + _tmp38;
+  const Scalar _tmp307 = _tmp273 + _tmp37;
+  const Scalar _tmp308 = (Scalar(1) / Scalar(2)) * _tmp197 + (Scalar(1) / Scalar(2)) * _tmp275 + 1;
+  const Scalar _tmp309 = _tmp206 - _tmp58;
+  const Scalar _tmp310 = -_tmp20 + _tmp210;
+  const Scalar _tmp311 = (Scalar(1) / Scalar(2)) * _tmp224 + (Scalar(1) / Scalar(2)) * _tmp281 + 1;
+  const Scalar _tmp312 = _tmp279 + _tmp34;
+  const Scalar _tmp313 = -Scalar(1) / Scalar(2) * _tmp20 * _tmp237 + _tmp234 +
+                         (Scalar(1) / Scalar(2)) * _tmp236 * _tmp34;
+  const Scalar _tmp314 = _tmp239 * _tmp313 + dt(0, 0) * samples(5, 0);
+  const Scalar _tmp315 = _tmp222 * _tmp311 + _tmp227 * _tmp310 + _tmp231 * _tmp312 + _tmp314;
+  const Scalar _tmp316 = _tmp195 * _tmp309 + _tmp200 * _tmp307 + _tmp204 * _tmp308 + _tmp315;
+  const Scalar _tmp317 = _tmp176 * _tmp306 + _tmp178 * _tmp304 + _tmp185 * _tmp305 + _tmp316;
+  const Scalar _tmp318 = _tmp154 * _tmp301 + _tmp159 * _tmp302 + _tmp161 * _tmp303 + _tmp317;
+  const Scalar _tmp319 = _tmp129 * _tmp300 + _tmp134 * _tmp299 + _tmp141 * _tmp298 + _tmp318;
+  const Scalar _tmp320 = _tmp107 * _tmp295 + _tmp111 * _tmp297 + _tmp116 * _tmp296 + _tmp319;
+  const Scalar _tmp321 = _tmp292 * _tmp95 + _tmp293 * _tmp93 + _tmp294 * _tmp85 + _tmp320;
+  const Scalar _tmp322 = (Scalar(1) / Scalar(6)) * _tmp75;
+  const Scalar _tmp323 = _tmp322 * _tmp83 + (Scalar(1) / Scalar(2)) * _tmp76;
+  const Scalar _tmp324 = _tmp322 * _tmp92 + (Scalar(1) / Scalar(2)) * _tmp80;
+  const Scalar _tmp325 = _tmp322 * _tmp94 + (Scalar(1) / Scalar(2)) * _tmp81;
+  const Scalar _tmp326 = (Scalar(1) / Scalar(6)) * _tmp98;
+  const Scalar _tmp327 = _tmp105 * _tmp326 + (Scalar(1) / Scalar(2)) * _tmp99;
+  const Scalar _tmp328 = (Scalar(1) / Scalar(2)) * _tmp100 + _tmp110 * _tmp326;
+  const Scalar _tmp329 = (Scalar(1) / Scalar(2)) * _tmp102 + _tmp115 * _tmp326;
+  const Scalar _tmp330 = (Scalar(1) / Scalar(6)) * _tmp120;
+  const Scalar _tmp331 = (Scalar(1) / Scalar(2)) * _tmp121 + _tmp127 * _tmp330;
+  const Scalar _tmp332 = (Scalar(1) / Scalar(2)) * _tmp122 + _tmp133 * _tmp330;
+  const Scalar _tmp333 = (Scalar(1) / Scalar(2)) * _tmp124 + _tmp140 * _tmp330;
+  const Scalar _tmp334 = (Scalar(1) / Scalar(6)) * _tmp145;
+  const Scalar _tmp335 = (Scalar(1) / Scalar(2)) * _tmp147 + _tmp152 * _tmp334;
+  const Scalar _tmp336 = (Scalar(1) / Scalar(2)) * _tmp146 + _tmp158 * _tmp334;
+  const Scalar _tmp337 = (Scalar(1) / Scalar(2)) * _tmp149 + _tmp160 * _tmp334;
+  const Scalar _tmp338 = (Scalar(1) / Scalar(6)) * _tmp167;
+  const Scalar _tmp339 = (Scalar(1) / Scalar(2)) * _tmp169 + _tmp174 * _tmp338;
+  const Scalar _tmp340 = (Scalar(1) / Scalar(2)) * _tmp171 + _tmp177 * _tmp338;
+  const Scalar _tmp341 = (Scalar(1) / Scalar(2)) * _tmp168 + _tmp184 * _tmp338;
+  const Scalar _tmp342 = (Scalar(1) / Scalar(6)) * _tmp186;
+  const Scalar _tmp343 = (Scalar(1) / Scalar(2)) * _tmp188 + _tmp193 * _tmp342;
+  const Scalar _tmp344 = (Scalar(1) / Scalar(2)) * _tmp187 + _tmp199 * _tmp342;
+  const Scalar _tmp345 = (Scalar(1) / Scalar(2)) * _tmp190 + _tmp203 * _tmp342;
+  const Scalar _tmp346 = (Scalar(1) / Scalar(6)) * _tmp212;
+  const Scalar _tmp347 = (Scalar(1) / Scalar(2)) * _tmp214 + _tmp220 * _tmp346;
+  const Scalar _tmp348 = (Scalar(1) / Scalar(2)) * _tmp217 + _tmp226 * _tmp346;
+  const Scalar _tmp349 = (Scalar(1) / Scalar(2)) * _tmp213 + _tmp230 * _tmp346;
+  const Scalar _tmp350 = (Scalar(1) / Scalar(6)) * _tmp208;
+  const Scalar _tmp351 = (Scalar(1) / Scalar(2)) * _tmp233 + _tmp238 * _tmp350;
+  const Scalar _tmp352 =
+      _tmp211 * _tmp347 + _tmp225 * _tmp348 + _tmp229 * _tmp349 + _tmp240 * dt(1, 0) + _tmp351;
+  const Scalar _tmp353 =
+      _tmp198 * _tmp343 + _tmp202 * _tmp344 + _tmp207 * _tmp345 + _tmp241 * dt(2, 0) + _tmp352;
+  const Scalar _tmp354 =
+      _tmp166 * _tmp339 + _tmp181 * _tmp340 + _tmp183 * _tmp341 + _tmp242 * dt(3, 0) + _tmp353;
+  const Scalar _tmp355 =
+      _tmp144 * _tmp335 + _tmp157 * _tmp336 + _tmp163 * _tmp337 + _tmp243 * dt(4, 0) + _tmp354;
+  const Scalar _tmp356 =
+      _tmp132 * _tmp331 + _tmp136 * _tmp332 + _tmp139 * _tmp333 + _tmp244 * dt(5, 0) + _tmp355;
+  const Scalar _tmp357 =
+      _tmp109 * _tmp327 + _tmp114 * _tmp328 + _tmp119 * _tmp329 + _tmp245 * dt(6, 0) + _tmp356;
+  const Scalar _tmp358 =
+      _tmp246 * dt(7, 0) + _tmp323 * _tmp88 + _tmp324 * _tmp91 + _tmp325 * _tmp97 + _tmp357;
+  const Scalar _tmp359 = (Scalar(1) / Scalar(2)) * _tmp232 + _tmp283 * _tmp350;
+  const Scalar _tmp360 =
+      _tmp278 * _tmp348 + _tmp280 * _tmp347 + _tmp282 * _tmp349 + _tmp284 * dt(1, 0) + _tmp359;
+  const Scalar _tmp361 =
+      _tmp274 * _tmp345 + _tmp276 * _tmp344 + _tmp277 * _tmp343 + _tmp285 * dt(2, 0) + _tmp360;
+  const Scalar _tmp362 =
+      _tmp269 * _tmp341 + _tmp271 * _tmp339 + _tmp272 * _tmp340 + _tmp286 * dt(3, 0) + _tmp361;
+  const Scalar _tmp363 =
+      _tmp264 * _tmp337 + _tmp265 * _tmp335 + _tmp267 * _tmp336 + _tmp287 * dt(4, 0) + _tmp362;
+  const Scalar _tmp364 =
+      _tmp259 * _tmp332 + _tmp261 * _tmp331 + _tmp262 * _tmp333 + _tmp288 * dt(5, 0) + _tmp363;
+  const Scalar _tmp365 =
+      _tmp253 * _tmp329 + _tmp255 * _tmp328 + _tmp257 * _tmp327 + _tmp289 * dt(6, 0) + _tmp364;
+  const Scalar _tmp366 =
+      _tmp249 * _tmp324 + _tmp250 * _tmp323 + _tmp252 * _tmp325 + _tmp290 * dt(7, 0) + _tmp365;
+  const Scalar _tmp367 = (Scalar(1) / Scalar(2)) * _tmp235 + _tmp313 * _tmp350;
+  const Scalar _tmp368 =
+      _tmp310 * _tmp348 + _tmp311 * _tmp347 + _tmp312 * _tmp349 + _tmp314 * dt(1, 0) + _tmp367;
+  const Scalar _tmp369 =
+      _tmp307 * _tmp344 + _tmp308 * _tmp345 + _tmp309 * _tmp343 + _tmp315 * dt(2, 0) + _tmp368;
+  const Scalar _tmp370 =
+      _tmp304 * _tmp340 + _tmp305 * _tmp341 + _tmp306 * _tmp339 + _tmp316 * dt(3, 0) + _tmp369;
+  const Scalar _tmp371 =
+      _tmp301 * _tmp335 + _tmp302 * _tmp336 + _tmp303 * _tmp337 + _tmp317 * dt(4, 0) + _tmp370;
+  const Scalar _tmp372 =
+      _tmp298 * _tmp333 + _tmp299 * _tmp332 + _tmp300 * _tmp331 + _tmp318 * dt(5, 0) + _tmp371;
+  const Scalar _tmp373 =
+      _tmp295 * _tmp327 + _tmp296 * _tmp329 + _tmp297 * _tmp328 + _tmp319 * dt(6, 0) + _tmp372;
+  const Scalar _tmp374 =
+      _tmp292 * _tmp325 + _tmp293 * _tmp324 + _tmp294 * _tmp323 + _tmp320 * dt(7, 0) + _tmp373;
+  const Scalar _tmp375 = 2 * std::pow(_tmp69, Scalar(2)) / _tmp66;
+  const Scalar _tmp376 = _tmp375 * _tmp43;
+  const Scalar _tmp377 = _tmp376 * _tmp55;
+  const Scalar _tmp378 = 2 * _tmp74;
+  const Scalar _tmp379 = _tmp378 * _tmp72;
+  const Scalar _tmp380 = _tmp377 - _tmp379;
+  const Scalar _tmp381 = [&]() {
+    const Scalar base = dt(0, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp382 = [&]() {
+    const Scalar base = dt(2, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp383 = [&]() {
+    const Scalar base = dt(1, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp384 = [&]() {
+    const Scalar base = dt(4, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp385 = [&]() {
+    const Scalar base = dt(3, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp386 = [&]() {
+    const Scalar base = dt(5, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp387 = [&]() {
+    const Scalar base = dt(7, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp388 = [&]() {
+    const Scalar base = dt(6, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp389 =
+      _tmp381 + _tmp382 + _tmp383 + _tmp384 + _tmp385 + _tmp386 + _tmp387 + _tmp388;
+  const Scalar _tmp390 = _tmp389 * imu_noise(2, 0);
+  const Scalar _tmp391 = _tmp378 * _tmp73;
+  const Scalar _tmp392 = _tmp376 * _tmp64;
+  const Scalar _tmp393 = _tmp391 + _tmp392;
+  const Scalar _tmp394 = _tmp389 * imu_noise(1, 0);
+  const Scalar _tmp395 = -_tmp375 * _tmp56;
+  const Scalar _tmp396 = -_tmp375 * _tmp65;
+  const Scalar _tmp397 = _tmp395 + _tmp396 + 1;
+  const Scalar _tmp398 = _tmp389 * imu_noise(0, 0);
+  const Scalar _tmp399 = -_tmp391 + _tmp392;
+  const Scalar _tmp400 = _tmp378 * _tmp71;
+  const Scalar _tmp401 = _tmp375 * _tmp55 * _tmp64;
+  const Scalar _tmp402 = _tmp400 + _tmp401;
+  const Scalar _tmp403 = _tmp380 * _tmp390;
+  const Scalar _tmp404 = -_tmp375 * _tmp57 + 1;
+  const Scalar _tmp405 = _tmp395 + _tmp404;
+  const Scalar _tmp406 = _tmp393 * _tmp394;
+  const Scalar _tmp407 = _tmp396 + _tmp404;
+  const Scalar _tmp408 = _tmp377 + _tmp379;
+  const Scalar _tmp409 = _tmp398 * _tmp408;
+  const Scalar _tmp410 = -_tmp400 + _tmp401;
+  const Scalar _tmp411 = _tmp247 * _tmp387;
+  const Scalar _tmp412 = _tmp242 * _tmp382;
+  const Scalar _tmp413 = _tmp246 * _tmp388;
+  const Scalar _tmp414 = _tmp241 * _tmp383;
+  const Scalar _tmp415 = _tmp240 * _tmp381;
+  const Scalar _tmp416 = _tmp243 * _tmp385;
+  const Scalar _tmp417 = _tmp244 * _tmp384;
+  const Scalar _tmp418 =
+      _tmp245 * _tmp386 + _tmp411 + _tmp412 + _tmp413 + _tmp414 + _tmp415 + _tmp416 + _tmp417;
+  const Scalar _tmp419 = _tmp418 * imu_noise(2, 0);
+  const Scalar _tmp420 = _tmp247 * _tmp390 - _tmp419;
+  const Scalar _tmp421 = _tmp291 * _tmp389;
+  const Scalar _tmp422 = _tmp289 * _tmp386;
+  const Scalar _tmp423 = _tmp286 * _tmp382;
+  const Scalar _tmp424 = _tmp291 * _tmp387;
+  const Scalar _tmp425 = _tmp287 * _tmp385;
+  const Scalar _tmp426 = _tmp285 * _tmp383;
+  const Scalar _tmp427 = _tmp290 * _tmp388;
+  const Scalar _tmp428 = _tmp284 * _tmp381;
+  const Scalar _tmp429 = _tmp288 * _tmp384;
+  const Scalar _tmp430 =
+      _tmp422 + _tmp423 + _tmp424 + _tmp425 + _tmp426 + _tmp427 + _tmp428 + _tmp429;
+  const Scalar _tmp431 = _tmp430 * imu_noise(2, 0);
+  const Scalar _tmp432 = -_tmp421 * imu_noise(2, 0) + _tmp431;
+  const Scalar _tmp433 = _tmp393 * _tmp420 + _tmp397 * _tmp432;
+  const Scalar _tmp434 = _tmp418 * imu_noise(1, 0);
+  const Scalar _tmp435 = -_tmp247 * _tmp394 + _tmp434;
+  const Scalar _tmp436 = _tmp321 * _tmp387;
+  const Scalar _tmp437 = _tmp318 * _tmp384;
+  const Scalar _tmp438 = _tmp314 * _tmp381;
+  const Scalar _tmp439 = _tmp317 * _tmp385;
+  const Scalar _tmp440 = _tmp315 * _tmp383;
+  const Scalar _tmp441 = _tmp320 * _tmp388;
+  const Scalar _tmp442 = _tmp319 * _tmp386;
+  const Scalar _tmp443 = _tmp316 * _tmp382;
+  const Scalar _tmp444 =
+      _tmp436 + _tmp437 + _tmp438 + _tmp439 + _tmp440 + _tmp441 + _tmp442 + _tmp443;
+  const Scalar _tmp445 = _tmp444 * imu_noise(1, 0);
+  const Scalar _tmp446 = _tmp321 * _tmp394 - _tmp445;
+  const Scalar _tmp447 = _tmp380 * _tmp435 + _tmp397 * _tmp446;
+  const Scalar _tmp448 = _tmp444 * imu_noise(0, 0);
+  const Scalar _tmp449 = -_tmp321 * _tmp398 + _tmp448;
+  const Scalar _tmp450 = _tmp430 * imu_noise(0, 0);
+  const Scalar _tmp451 = _tmp421 * imu_noise(0, 0) - _tmp450;
+  const Scalar _tmp452 = _tmp380 * _tmp451 + _tmp393 * _tmp449;
+  const Scalar _tmp453 =
+      std::pow(_tmp284, Scalar(2)) * _tmp381 + std::pow(_tmp285, Scalar(2)) * _tmp383 +
+      std::pow(_tmp286, Scalar(2)) * _tmp382 + std::pow(_tmp287, Scalar(2)) * _tmp385 +
+      std::pow(_tmp288, Scalar(2)) * _tmp384 + std::pow(_tmp289, Scalar(2)) * _tmp386 +
+      std::pow(_tmp290, Scalar(2)) * _tmp388 + std::pow(_tmp291, Scalar(2)) * _tmp387;
+  const Scalar _tmp454 =
+      std::pow(_tmp240, Scalar(2)) * _tmp381 + std::pow(_tmp241, Scalar(2)) * _tmp383 +
+      std::pow(_tmp242, Scalar(2)) * _tmp382 + std::pow(_tmp243, Scalar(2)) * _tmp385 +
+      std::pow(_tmp244, Scalar(2)) * _tmp384 + std::pow(_tmp245, Scalar(2)) * _tmp386 +
+      std::pow(_tmp246, Scalar(2)) * _tmp388 + std::pow(_tmp247, Scalar(2)) * _tmp387;
+  const Scalar _tmp455 =
+      _tmp389 * imu_noise(5, 0) + _tmp453 * imu_noise(0, 0) + _tmp454 * imu_noise(1, 0);
+  const Scalar _tmp456 =
+      -_tmp247 * _tmp434 - _tmp247 * _tmp435 - _tmp291 * _tmp450 + _tmp291 * _tmp451 + _tmp455;
+  const Scalar _tmp457 =
+      imu_noise(1, 0) *
+      (_tmp240 * _tmp438 + _tmp241 * _tmp440 + _tmp242 * _tmp443 + _tmp243 * _tmp439 +
+       _tmp245 * _tmp442 + _tmp246 * _tmp441 + _tmp247 * _tmp436 + _tmp318 * _tmp417);
+  const Scalar _tmp458 = _tmp247 * _tmp445 + _tmp321 * _tmp435 - _tmp457;
+  const Scalar _tmp459 =
+      imu_noise(0, 0) *
+      (_tmp286 * _tmp443 + _tmp287 * _tmp439 + _tmp288 * _tmp437 + _tmp289 * _tmp442 +
+       _tmp314 * _tmp428 + _tmp315 * _tmp426 + _tmp320 * _tmp427 + _tmp321 * _tmp424);
+  const Scalar _tmp460 = _tmp291 * _tmp448 - _tmp321 * _tmp451 - _tmp459;
+  const Scalar _tmp461 =
+      std::pow(_tmp314, Scalar(2)) * _tmp381 + std::pow(_tmp315, Scalar(2)) * _tmp383 +
+      std::pow(_tmp316, Scalar(2)) * _tmp382 + std::pow(_tmp317, Scalar(2)) * _tmp385 +
+      std::pow(_tmp318, Scalar(2)) * _tmp384 + std::pow(_tmp319, Scalar(2)) * _tmp386 +
+      std::pow(_tmp320, Scalar(2)) * _tmp388 + std::pow(_tmp321, Scalar(2)) * _tmp387;
+  const Scalar _tmp462 =
+      _tmp389 * imu_noise(4, 0) + _tmp454 * imu_noise(2, 0) + _tmp461 * imu_noise(0, 0);
+  const Scalar _tmp463 =
+      -_tmp247 * _tmp419 + _tmp247 * _tmp420 - _tmp321 * _tmp448 - _tmp321 * _tmp449 + _tmp462;
+  const Scalar _tmp464 =
+      imu_noise(2, 0) *
+      (_tmp240 * _tmp428 + _tmp241 * _tmp426 + _tmp242 * _tmp423 + _tmp245 * _tmp422 +
+       _tmp246 * _tmp427 + _tmp247 * _tmp424 + _tmp287 * _tmp416 + _tmp288 * _tmp417);
+  const Scalar _tmp465 = _tmp247 * _tmp431 - _tmp291 * _tmp420 - _tmp464;
+  const Scalar _tmp466 =
+      _tmp389 * imu_noise(3, 0) + _tmp453 * imu_noise(2, 0) + _tmp461 * imu_noise(1, 0);
+  const Scalar _tmp467 =
+      -_tmp291 * _tmp431 - _tmp291 * _tmp432 - _tmp321 * _tmp445 + _tmp321 * _tmp446 + _tmp466;
+  const Scalar _tmp468 = _tmp399 * _tmp446 + _tmp402 * _tmp435;
+  const Scalar _tmp469 = _tmp402 * _tmp451 + _tmp405 * _tmp449;
+  const Scalar _tmp470 = _tmp399 * _tmp432 + _tmp405 * _tmp420;
+  const Scalar _tmp471 = _tmp399 * _tmp465 + _tmp402 * _tmp460 + _tmp405 * _tmp463;
+  const Scalar _tmp472 = _tmp399 * _tmp458 + _tmp402 * _tmp456 + _tmp405 * _tmp460;
+  const Scalar _tmp473 = _tmp399 * _tmp467 + _tmp402 * _tmp458 + _tmp405 * _tmp465;
+  const Scalar _tmp474 = _tmp407 * _tmp451 + _tmp410 * _tmp449;
+  const Scalar _tmp475 = _tmp408 * _tmp432 + _tmp410 * _tmp420;
+  const Scalar _tmp476 = _tmp407 * _tmp435 + _tmp408 * _tmp446;
+  const Scalar _tmp477 = _tmp407 * _tmp456 + _tmp408 * _tmp458 + _tmp410 * _tmp460;
+  const Scalar _tmp478 = _tmp407 * _tmp458 + _tmp408 * _tmp467 + _tmp410 * _tmp465;
+  const Scalar _tmp479 = _tmp407 * _tmp460 + _tmp408 * _tmp465 + _tmp410 * _tmp463;
+  const Scalar _tmp480 = dt(0, 0) + dt(1, 0);
+  const Scalar _tmp481 = _tmp480 + dt(2, 0);
+  const Scalar _tmp482 = _tmp481 + dt(3, 0);
+  const Scalar _tmp483 = _tmp482 + dt(4, 0);
+  const Scalar _tmp484 = _tmp483 + dt(5, 0);
+  const Scalar _tmp485 = _tmp484 + dt(6, 0);
+  const Scalar _tmp486 = _tmp485 + dt(7, 0);
+  const Scalar _tmp487 = -_tmp241 * _tmp480 + _tmp352;
+  const Scalar _tmp488 = _tmp383 * _tmp487;
+  const Scalar _tmp489 = -_tmp240 * dt(0, 0) + _tmp351;
+  const Scalar _tmp490 = _tmp381 * _tmp489;
+  const Scalar _tmp491 = -_tmp242 * _tmp481 + _tmp353;
+  const Scalar _tmp492 = _tmp382 * _tmp491;
+  const Scalar _tmp493 = -_tmp243 * _tmp482 + _tmp354;
+  const Scalar _tmp494 = -_tmp246 * _tmp485 + _tmp357;
+  const Scalar _tmp495 = _tmp388 * _tmp494;
+  const Scalar _tmp496 = -_tmp245 * _tmp484 + _tmp356;
+  const Scalar _tmp497 = _tmp386 * _tmp496;
+  const Scalar _tmp498 = -_tmp244 * _tmp483 + _tmp355;
+  const Scalar _tmp499 = _tmp384 * _tmp498;
+  const Scalar _tmp500 = -_tmp247 * _tmp486 + _tmp358;
+  const Scalar _tmp501 = _tmp387 * _tmp500;
+  const Scalar _tmp502 =
+      _tmp385 * _tmp493 + _tmp488 + _tmp490 + _tmp492 + _tmp495 + _tmp497 + _tmp499 + _tmp501;
+  const Scalar _tmp503 = _tmp434 * _tmp486 + _tmp502 * imu_noise(1, 0);
+  const Scalar _tmp504 = -_tmp358 * _tmp394 + _tmp503;
+  const Scalar _tmp505 = -_tmp316 * _tmp481 + _tmp369;
+  const Scalar _tmp506 = -_tmp321 * _tmp486 + _tmp374;
+  const Scalar _tmp507 = _tmp387 * _tmp506;
+  const Scalar _tmp508 = -_tmp314 * dt(0, 0) + _tmp367;
+  const Scalar _tmp509 = _tmp381 * _tmp508;
+  const Scalar _tmp510 = -_tmp317 * _tmp482 + _tmp370;
+  const Scalar _tmp511 = _tmp385 * _tmp510;
+  const Scalar _tmp512 = -_tmp315 * _tmp480 + _tmp368;
+  const Scalar _tmp513 = -_tmp320 * _tmp485 + _tmp373;
+  const Scalar _tmp514 = -_tmp319 * _tmp484 + _tmp372;
+  const Scalar _tmp515 = _tmp386 * _tmp514;
+  const Scalar _tmp516 = -_tmp318 * _tmp483 + _tmp371;
+  const Scalar _tmp517 = _tmp382 * _tmp505 + _tmp383 * _tmp512 + _tmp384 * _tmp516 +
+                         _tmp388 * _tmp513 + _tmp507 + _tmp509 + _tmp511 + _tmp515;
+  const Scalar _tmp518 = -_tmp445 * _tmp486 - _tmp517 * imu_noise(1, 0);
+  const Scalar _tmp519 = _tmp374 * _tmp394 + _tmp518;
+  const Scalar _tmp520 = _tmp380 * _tmp504 + _tmp397 * _tmp519;
+  const Scalar _tmp521 = _tmp448 * _tmp486 + _tmp517 * imu_noise(0, 0);
+  const Scalar _tmp522 = -_tmp374 * _tmp398 + _tmp521;
+  const Scalar _tmp523 = -_tmp286 * _tmp481 + _tmp361;
+  const Scalar _tmp524 = _tmp382 * _tmp523;
+  const Scalar _tmp525 = -_tmp291 * _tmp486 + _tmp366;
+  const Scalar _tmp526 = -_tmp284 * dt(0, 0) + _tmp359;
+  const Scalar _tmp527 = -_tmp290 * _tmp485 + _tmp365;
+  const Scalar _tmp528 = _tmp388 * _tmp527;
+  const Scalar _tmp529 = -_tmp288 * _tmp483 + _tmp363;
+  const Scalar _tmp530 = _tmp384 * _tmp529;
+  const Scalar _tmp531 = -_tmp285 * _tmp480 + _tmp360;
+  const Scalar _tmp532 = _tmp383 * _tmp531;
+  const Scalar _tmp533 = -_tmp289 * _tmp484 + _tmp364;
+  const Scalar _tmp534 = _tmp386 * _tmp533;
+  const Scalar _tmp535 = -_tmp287 * _tmp482 + _tmp362;
+  const Scalar _tmp536 = _tmp385 * _tmp535;
+  const Scalar _tmp537 = _tmp381 * _tmp526 + _tmp387 * _tmp525 + _tmp524 + _tmp528 + _tmp530 +
+                         _tmp532 + _tmp534 + _tmp536;
+  const Scalar _tmp538 = -_tmp450 * _tmp486 - _tmp537 * imu_noise(0, 0);
+  const Scalar _tmp539 = _tmp366 * _tmp398 + _tmp538;
+  const Scalar _tmp540 = _tmp380 * _tmp539 + _tmp393 * _tmp522;
+  const Scalar _tmp541 = -_tmp419 * _tmp486 - _tmp502 * imu_noise(2, 0);
+  const Scalar _tmp542 = _tmp358 * _tmp390 + _tmp541;
+  const Scalar _tmp543 = _tmp431 * _tmp486 + _tmp537 * imu_noise(2, 0);
+  const Scalar _tmp544 = -_tmp366 * _tmp390 + _tmp543;
+  const Scalar _tmp545 = _tmp393 * _tmp542 + _tmp397 * _tmp544;
+  const Scalar _tmp546 = -_tmp457 * _tmp486;
+  const Scalar _tmp547 =
+      _tmp546 - imu_noise(1, 0) *
+                    (_tmp319 * _tmp497 + _tmp320 * _tmp495 + _tmp321 * _tmp501 + _tmp437 * _tmp498 +
+                     _tmp438 * _tmp489 + _tmp439 * _tmp493 + _tmp440 * _tmp487 + _tmp443 * _tmp491);
+  const Scalar _tmp548 = _tmp321 * _tmp504 + _tmp358 * _tmp445 + _tmp547;
+  const Scalar _tmp549 = -_tmp464 * _tmp486;
+  const Scalar _tmp550 =
+      _tmp549 - imu_noise(2, 0) *
+                    (_tmp286 * _tmp492 + _tmp288 * _tmp499 + _tmp289 * _tmp497 + _tmp291 * _tmp501 +
+                     _tmp425 * _tmp493 + _tmp426 * _tmp487 + _tmp427 * _tmp494 + _tmp428 * _tmp489);
+  const Scalar _tmp551 = -_tmp291 * _tmp542 + _tmp358 * _tmp431 + _tmp550;
+  const Scalar _tmp552 = _tmp287 * _tmp536 + _tmp288 * _tmp530 + _tmp289 * _tmp534 +
+                         _tmp423 * _tmp523 + _tmp424 * _tmp525 + _tmp426 * _tmp531 +
+                         _tmp427 * _tmp527 + _tmp428 * _tmp526;
+  const Scalar _tmp553 = _tmp319 * _tmp515 + _tmp321 * _tmp507 + _tmp437 * _tmp516 +
+                         _tmp438 * _tmp508 + _tmp439 * _tmp510 + _tmp440 * _tmp512 +
+                         _tmp441 * _tmp513 + _tmp443 * _tmp505;
+  const Scalar _tmp554 = _tmp153 - _tmp483;
+  const Scalar _tmp555 = _tmp194 - _tmp481;
+  const Scalar _tmp556 = _tmp106 - _tmp485;
+  const Scalar _tmp557 = _tmp128 - _tmp484;
+  const Scalar _tmp558 = -_tmp486 + _tmp84;
+  const Scalar _tmp559 = _tmp221 - _tmp480;
+  const Scalar _tmp560 = _tmp175 - _tmp482;
+  const Scalar _tmp561 = _tmp382 * _tmp555 + _tmp383 * _tmp559 + _tmp384 * _tmp554 +
+                         _tmp385 * _tmp560 + _tmp386 * _tmp557 + _tmp387 * _tmp558 +
+                         _tmp388 * _tmp556 - Scalar(1) / Scalar(2) * std::pow(dt(0, 0), Scalar(4));
+  const Scalar _tmp562 =
+      _tmp552 * imu_noise(2, 0) + _tmp553 * imu_noise(1, 0) + _tmp561 * imu_noise(3, 0);
+  const Scalar _tmp563 = _tmp466 * _tmp486 + _tmp562;
+  const Scalar _tmp564 =
+      -_tmp291 * _tmp544 + _tmp321 * _tmp519 - _tmp366 * _tmp431 - _tmp374 * _tmp445 + _tmp563;
+  const Scalar _tmp565 = _tmp380 * _tmp548 + _tmp393 * _tmp551 + _tmp397 * _tmp564;
+  const Scalar _tmp566 = -_tmp459 * _tmp486;
+  const Scalar _tmp567 =
+      _tmp566 - imu_noise(0, 0) *
+                    (_tmp319 * _tmp534 + _tmp320 * _tmp528 + _tmp436 * _tmp525 + _tmp437 * _tmp529 +
+                     _tmp438 * _tmp526 + _tmp439 * _tmp535 + _tmp440 * _tmp531 + _tmp443 * _tmp523);
+  const Scalar _tmp568 = -_tmp321 * _tmp539 + _tmp366 * _tmp448 + _tmp567;
+  const Scalar _tmp569 = _tmp240 * _tmp490 + _tmp241 * _tmp488 + _tmp242 * _tmp492 +
+                         _tmp245 * _tmp497 + _tmp246 * _tmp495 + _tmp247 * _tmp501 +
+                         _tmp416 * _tmp493 + _tmp417 * _tmp498;
+  const Scalar _tmp570 =
+      _tmp553 * imu_noise(0, 0) + _tmp561 * imu_noise(4, 0) + _tmp569 * imu_noise(2, 0);
+  const Scalar _tmp571 = _tmp462 * _tmp486 + _tmp570;
+  const Scalar _tmp572 =
+      _tmp247 * _tmp542 - _tmp321 * _tmp522 - _tmp358 * _tmp419 - _tmp374 * _tmp448 + _tmp571;
+  const Scalar _tmp573 =
+      imu_noise(2, 0) *
+      (_tmp241 * _tmp532 + _tmp242 * _tmp524 + _tmp245 * _tmp534 + _tmp246 * _tmp528 +
+       _tmp411 * _tmp525 + _tmp415 * _tmp526 + _tmp416 * _tmp535 + _tmp417 * _tmp529);
+  const Scalar _tmp574 = _tmp247 * _tmp544 + _tmp366 * _tmp419 + _tmp549 - _tmp573;
+  const Scalar _tmp575 = _tmp380 * _tmp568 + _tmp393 * _tmp572 + _tmp397 * _tmp574;
+  const Scalar _tmp576 =
+      _tmp552 * imu_noise(0, 0) + _tmp561 * imu_noise(5, 0) + _tmp569 * imu_noise(1, 0);
+  const Scalar _tmp577 = _tmp455 * _tmp486 + _tmp576;
+  const Scalar _tmp578 =
+      -_tmp247 * _tmp504 + _tmp291 * _tmp539 - _tmp358 * _tmp434 - _tmp366 * _tmp450 + _tmp577;
+  const Scalar _tmp579 =
+      imu_noise(0, 0) *
+      (_tmp287 * _tmp511 + _tmp289 * _tmp515 + _tmp291 * _tmp507 + _tmp423 * _tmp505 +
+       _tmp426 * _tmp512 + _tmp427 * _tmp513 + _tmp428 * _tmp508 + _tmp429 * _tmp516);
+  const Scalar _tmp580 = _tmp291 * _tmp522 + _tmp374 * _tmp450 + _tmp566 - _tmp579;
+  const Scalar _tmp581 =
+      imu_noise(1, 0) *
+      (_tmp240 * _tmp509 + _tmp245 * _tmp515 + _tmp247 * _tmp507 + _tmp412 * _tmp505 +
+       _tmp413 * _tmp513 + _tmp414 * _tmp512 + _tmp416 * _tmp510 + _tmp417 * _tmp516);
+  const Scalar _tmp582 = -_tmp247 * _tmp519 + _tmp374 * _tmp434 + _tmp546 - _tmp581;
+  const Scalar _tmp583 = _tmp380 * _tmp578 + _tmp393 * _tmp580 + _tmp397 * _tmp582;
+  const Scalar _tmp584 =
+      _tmp381 * std::pow(_tmp526, Scalar(2)) + _tmp382 * std::pow(_tmp523, Scalar(2)) +
+      _tmp383 * std::pow(_tmp531, Scalar(2)) + _tmp384 * std::pow(_tmp529, Scalar(2)) +
+      _tmp385 * std::pow(_tmp535, Scalar(2)) + _tmp386 * std::pow(_tmp533, Scalar(2)) +
+      _tmp387 * std::pow(_tmp525, Scalar(2)) + _tmp388 * std::pow(_tmp527, Scalar(2));
+  const Scalar _tmp585 =
+      _tmp381 * std::pow(_tmp508, Scalar(2)) + _tmp382 * std::pow(_tmp505, Scalar(2)) +
+      _tmp383 * std::pow(_tmp512, Scalar(2)) + _tmp384 * std::pow(_tmp516, Scalar(2)) +
+      _tmp385 * std::pow(_tmp510, Scalar(2)) + _tmp386 * std::pow(_tmp514, Scalar(2)) +
+      _tmp387 * std::pow(_tmp506, Scalar(2)) + _tmp388 * std::pow(_tmp513, Scalar(2));
+  const Scalar _tmp586 =
+      _tmp382 * std::pow(_tmp555, Scalar(2)) + _tmp383 * std::pow(_tmp559, Scalar(2)) +
+      _tmp384 * std::pow(_tmp554, Scalar(2)) + _tmp385 * std::pow(_tmp560, Scalar(2)) +
+      _tmp386 * std::pow(_tmp557, Scalar(2)) + _tmp387 * std::pow(_tmp558, Scalar(2)) +
+      _tmp388 * std::pow(_tmp556, Scalar(2)) +
+      (Scalar(1) / Scalar(4)) * std::pow(dt(0, 0), Scalar(5));
+  const Scalar _tmp587 = -_tmp366 * _tmp543 - _tmp366 * _tmp544 + _tmp374 * _tmp518 +
+                         _tmp374 * _tmp519 + _tmp486 * _tmp562 + _tmp486 * _tmp563 +
+                         _tmp584 * imu_noise(2, 0) + _tmp585 * imu_noise(1, 0) +
+                         _tmp586 * imu_noise(3, 0);
+  const Scalar _tmp588 =
+      _tmp358 * _tmp543 - _tmp366 * _tmp542 + _tmp486 * _tmp550 - _tmp486 * _tmp573 -
+      imu_noise(2, 0) *
+          (_tmp487 * _tmp532 + _tmp490 * _tmp526 + _tmp492 * _tmp523 + _tmp493 * _tmp536 +
+           _tmp495 * _tmp527 + _tmp496 * _tmp534 + _tmp498 * _tmp530 + _tmp501 * _tmp525);
+  const Scalar _tmp589 =
+      -_tmp358 * _tmp518 + _tmp374 * _tmp504 + _tmp486 * _tmp547 - _tmp486 * _tmp581 -
+      imu_noise(1, 0) *
+          (_tmp488 * _tmp512 + _tmp490 * _tmp508 + _tmp492 * _tmp505 + _tmp493 * _tmp511 +
+           _tmp495 * _tmp513 + _tmp497 * _tmp514 + _tmp499 * _tmp516 + _tmp501 * _tmp506);
+  const Scalar _tmp590 =
+      _tmp366 * _tmp521 - _tmp374 * _tmp539 + _tmp486 * _tmp567 - _tmp486 * _tmp579 -
+      imu_noise(0, 0) *
+          (_tmp505 * _tmp524 + _tmp507 * _tmp525 + _tmp509 * _tmp526 + _tmp510 * _tmp536 +
+           _tmp512 * _tmp532 + _tmp513 * _tmp528 + _tmp514 * _tmp534 + _tmp516 * _tmp530);
+  const Scalar _tmp591 =
+      _tmp381 * std::pow(_tmp489, Scalar(2)) + _tmp382 * std::pow(_tmp491, Scalar(2)) +
+      _tmp383 * std::pow(_tmp487, Scalar(2)) + _tmp384 * std::pow(_tmp498, Scalar(2)) +
+      _tmp385 * std::pow(_tmp493, Scalar(2)) + _tmp386 * std::pow(_tmp496, Scalar(2)) +
+      _tmp387 * std::pow(_tmp500, Scalar(2)) + _tmp388 * std::pow(_tmp494, Scalar(2));
+  const Scalar _tmp592 = _tmp358 * _tmp541 + _tmp358 * _tmp542 - _tmp374 * _tmp521 -
+                         _tmp374 * _tmp522 + _tmp486 * _tmp570 + _tmp486 * _tmp571 +
+                         _tmp585 * imu_noise(0, 0) + _tmp586 * imu_noise(4, 0) +
+                         _tmp591 * imu_noise(2, 0);
+  const Scalar _tmp593 = -_tmp358 * _tmp503 - _tmp358 * _tmp504 + _tmp366 * _tmp538 +
+                         _tmp366 * _tmp539 + _tmp486 * _tmp576 + _tmp486 * _tmp577 +
+                         _tmp584 * imu_noise(0, 0) + _tmp586 * imu_noise(5, 0) +
+                         _tmp591 * imu_noise(1, 0);
+  const Scalar _tmp594 = _tmp402 * _tmp539 + _tmp405 * _tmp522;
+  const Scalar _tmp595 = _tmp399 * _tmp519 + _tmp402 * _tmp504;
+  const Scalar _tmp596 = _tmp399 * _tmp544 + _tmp405 * _tmp542;
+  const Scalar _tmp597 = _tmp399 * _tmp564 + _tmp402 * _tmp548 + _tmp405 * _tmp551;
+  const Scalar _tmp598 = _tmp399 * _tmp582 + _tmp402 * _tmp578 + _tmp405 * _tmp580;
+  const Scalar _tmp599 = _tmp399 * _tmp574 + _tmp402 * _tmp568 + _tmp405 * _tmp572;
+  const Scalar _tmp600 = _tmp399 * _tmp589 + _tmp402 * _tmp593 + _tmp405 * _tmp590;
+  const Scalar _tmp601 = _tmp399 * _tmp588 + _tmp402 * _tmp590 + _tmp405 * _tmp592;
+  const Scalar _tmp602 = _tmp399 * _tmp587 + _tmp402 * _tmp589 + _tmp405 * _tmp588;
+  const Scalar _tmp603 = _tmp408 * _tmp544 + _tmp410 * _tmp542;
+  const Scalar _tmp604 = _tmp407 * _tmp504 + _tmp408 * _tmp519;
+  const Scalar _tmp605 = _tmp407 * _tmp539 + _tmp410 * _tmp522;
+  const Scalar _tmp606 = _tmp407 * _tmp568 + _tmp408 * _tmp574 + _tmp410 * _tmp572;
+  const Scalar _tmp607 = _tmp407 * _tmp578 + _tmp408 * _tmp582 + _tmp410 * _tmp580;
+  const Scalar _tmp608 = _tmp407 * _tmp548 + _tmp408 * _tmp564 + _tmp410 * _tmp551;
+  const Scalar _tmp609 = _tmp407 * _tmp590 + _tmp408 * _tmp588 + _tmp410 * _tmp592;
+  const Scalar _tmp610 = _tmp407 * _tmp589 + _tmp408 * _tmp587 + _tmp410 * _tmp588;
+  const Scalar _tmp611 = _tmp407 * _tmp593 + _tmp408 * _tmp589 + _tmp410 * _tmp590;
+
+  // Output terms (2)
+  if (delta != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _delta = (*delta);
+
+    _delta(0, 0) = _tmp71;
+    _delta(1, 0) = _tmp72;
+    _delta(2, 0) = _tmp73;
+    _delta(3, 0) = _tmp74;
+    _delta(4, 0) = _tmp247;
+    _delta(5, 0) = _tmp291;
+    _delta(6, 0) = _tmp321;
+    _delta(7, 0) = _tmp358;
+    _delta(8, 0) = _tmp366;
+    _delta(9, 0) = _tmp374;
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = std::pow(_tmp380, Scalar(2)) * _tmp390 + std::pow(_tmp393, Scalar(2)) * _tmp394 +
+                 std::pow(_tmp397, Scalar(2)) * _tmp398;
+    _cov(1, 0) = _tmp397 * _tmp398 * _tmp399 + _tmp402 * _tmp403 + _tmp405 * _tmp406;
+    _cov(2, 0) = _tmp390 * std::pow(_tmp402, Scalar(2)) + _tmp394 * std::pow(_tmp405, Scalar(2)) +
+                 _tmp398 * std::pow(_tmp399, Scalar(2));
+    _cov(3, 0) = _tmp397 * _tmp409 + _tmp403 * _tmp407 + _tmp406 * _tmp410;
+    _cov(4, 0) = _tmp390 * _tmp402 * _tmp407 + _tmp394 * _tmp405 * _tmp410 + _tmp399 * _tmp409;
+    _cov(5, 0) = _tmp390 * std::pow(_tmp407, Scalar(2)) + _tmp394 * std::pow(_tmp410, Scalar(2)) +
+                 _tmp398 * std::pow(_tmp408, Scalar(2));
+    _cov(6, 0) = _tmp380 * _tmp433 + _tmp393 * _tmp447 + _tmp397 * _tmp452;
+    _cov(7, 0) = _tmp399 * _tmp452 + _tmp402 * _tmp433 + _tmp405 * _tmp447;
+    _cov(8, 0) = _tmp407 * _tmp433 + _tmp408 * _tmp452 + _tmp410 * _tmp447;
+    _cov(9, 0) = _tmp380 * (_tmp380 * _tmp456 + _tmp393 * _tmp460 + _tmp397 * _tmp458) +
+                 _tmp393 * (_tmp380 * _tmp460 + _tmp393 * _tmp463 + _tmp397 * _tmp465) +
+                 _tmp397 * (_tmp380 * _tmp458 + _tmp393 * _tmp465 + _tmp397 * _tmp467);
+    _cov(10, 0) = _tmp380 * _tmp470 + _tmp393 * _tmp468 + _tmp397 * _tmp469;
+    _cov(11, 0) = _tmp399 * _tmp469 + _tmp402 * _tmp470 + _tmp405 * _tmp468;
+    _cov(12, 0) = _tmp407 * _tmp470 + _tmp408 * _tmp469 + _tmp410 * _tmp468;
+    _cov(13, 0) = _tmp380 * _tmp472 + _tmp393 * _tmp471 + _tmp397 * _tmp473;
+    _cov(14, 0) = _tmp399 * _tmp473 + _tmp402 * _tmp472 + _tmp405 * _tmp471;
+    _cov(15, 0) = _tmp380 * _tmp475 + _tmp393 * _tmp476 + _tmp397 * _tmp474;
+    _cov(16, 0) = _tmp399 * _tmp474 + _tmp402 * _tmp475 + _tmp405 * _tmp476;
+    _cov(17, 0) = _tmp407 * _tmp475 + _tmp408 * _tmp474 + _tmp410 * _tmp476;
+    _cov(18, 0) = _tmp380 * _tmp477 + _tmp393 * _tmp479 + _tmp397 * _tmp478;
+    _cov(19, 0) = _tmp399 * _tmp478 + _tmp402 * _tmp477 + _tmp405 * _tmp479;
+    _cov(20, 0) = _tmp407 * _tmp477 + _tmp408 * _tmp478 + _tmp410 * _tmp479;
+    _cov(21, 0) = _tmp380 * _tmp545 + _tmp393 * _tmp520 + _tmp397 * _tmp540;
+    _cov(22, 0) = _tmp399 * _tmp540 + _tmp402 * _tmp545 + _tmp405 * _tmp520;
+    _cov(23, 0) = _tmp407 * _tmp545 + _tmp408 * _tmp540 + _tmp410 * _tmp520;
+    _cov(24, 0) = _tmp380 * _tmp583 + _tmp393 * _tmp575 + _tmp397 * _tmp565;
+    _cov(25, 0) = _tmp399 * _tmp565 + _tmp402 * _tmp583 + _tmp405 * _tmp575;
+    _cov(26, 0) = _tmp407 * _tmp583 + _tmp408 * _tmp565 + _tmp410 * _tmp575;
+    _cov(27, 0) = _tmp380 * (_tmp380 * _tmp593 + _tmp393 * _tmp590 + _tmp397 * _tmp589) +
+                  _tmp393 * (_tmp380 * _tmp590 + _tmp393 * _tmp592 + _tmp397 * _tmp588) +
+                  _tmp397 * (_tmp380 * _tmp589 + _tmp393 * _tmp588 + _tmp397 * _tmp587);
+    _cov(28, 0) = _tmp380 * _tmp596 + _tmp393 * _tmp595 + _tmp397 * _tmp594;
+    _cov(29, 0) = _tmp399 * _tmp594 + _tmp402 * _tmp596 + _tmp405 * _tmp595;
+    _cov(30, 0) = _tmp407 * _tmp596 + _tmp408 * _tmp594 + _tmp410 * _tmp595;
+    _cov(31, 0) = _tmp380 * _tmp598 + _tmp393 * _tmp599 + _tmp397 * _tmp597;
+    _cov(32, 0) = _tmp399 * _tmp597 + _tmp402 * _tmp598 + _tmp405 * _tmp599;
+    _cov(33, 0) = _tmp407 * _tmp598 + _tmp408 * _tmp597 + _tmp410 * _tmp599;
+    _cov(34, 0) = _tmp380 * _tmp600 + _tmp393 * _tmp601 + _tmp397 * _tmp602;
+    _cov(35, 0) = _tmp399 * _tmp602 + _tmp402 * _tmp600 + _tmp405 * _tmp601;
+    _cov(36, 0) = _tmp380 * _tmp603 + _tmp393 * _tmp604 + _tmp397 * _tmp605;
+    _cov(37, 0) = _tmp399 * _tmp605 + _tmp402 * _tmp603 + _tmp405 * _tmp604;
+    _cov(38, 0) = _tmp407 * _tmp603 + _tmp408 * _tmp605 + _tmp410 * _tmp604;
+    _cov(39, 0) = _tmp380 * _tmp607 + _tmp393 * _tmp606 + _tmp397 * _tmp608;
+    _cov(40, 0) = _tmp399 * _tmp608 + _tmp402 * _tmp607 + _tmp405 * _tmp606;
+    _cov(41, 0) = _tmp407 * _tmp607 + _tmp408 * _tmp608 + _tmp410 * _tmp606;
+    _cov(42, 0) = _tmp380 * _tmp611 + _tmp393 * _tmp609 + _tmp397 * _tmp610;
+    _cov(43, 0) = _tmp399 * _tmp610 + _tmp402 * _tmp611 + _tmp405 * _tmp609;
+    _cov(44, 0) = _tmp407 * _tmp611 + _tmp408 * _tmp610 + _tmp410 * _tmp609;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
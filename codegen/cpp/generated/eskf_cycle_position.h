@@ -0,0 +1,832 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     state: Matrix61_1
+ *     imu_noise: Matrix61
+ *     z_imu_raw: Matrix61
+ *     dt: Scalar
+ *     gravity: Matrix31
+ *     z: Matrix31
+ *     R: Matrix61
+ *
+ * Outputs:
+ *     nom: Matrix10_1
+ *     err_cov: Matrix45_1
+ *     imu_bias: Matrix61
+ */
+template <typename Scalar>
+void EskfCyclePosition(const Eigen::Matrix<Scalar, 61, 1>& state,
+                       const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+                       const Eigen::Matrix<Scalar, 6, 1>& z_imu_raw, const Scalar dt,
+                       const Eigen::Matrix<Scalar, 3, 1>& gravity,
+                       const Eigen::Matrix<Scalar, 3, 1>& z, const Eigen::Matrix<Scalar, 6, 1>& R,
+                       Eigen::Matrix<Scalar, 10, 1>* const nom = nullptr,
+                       Eigen::Matrix<Scalar, 45, 1>* const err_cov = nullptr,
+                       Eigen::Matrix<Scalar, 6, 1>* const imu_bias = nullptr) {
+  // Total ops: 3018
+
+  // Input arrays
+
+  // Intermediate terms (514)
+  const Scalar _tmp0 = -state(55, 0) + z_imu_raw(0, 0);
+  const Scalar _tmp1 = std::pow(dt, Scalar(2));
+  const Scalar _tmp2 = -state(57, 0) + z_imu_raw(2, 0);
+  const Scalar _tmp3 = _tmp1 * std::pow(_tmp2, Scalar(2));
+  const Scalar _tmp4 = -state(56, 0) + z_imu_raw(1, 0);
+  const Scalar _tmp5 = _tmp1 * std::pow(_tmp4, Scalar(2));
+  const Scalar _tmp6 = std::pow(_tmp0, Scalar(2)) * _tmp1;
+  const Scalar _tmp7 = _tmp3 + _tmp5 + _tmp6 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp8 = std::sqrt(_tmp7);
+  const Scalar _tmp9 = (Scalar(1) / Scalar(2)) * _tmp8;
+  const Scalar _tmp10 = std::sin(_tmp9);
+  const Scalar _tmp11 = _tmp10 * dt / _tmp8;
+  const Scalar _tmp12 = _tmp0 * _tmp11;
+  const Scalar _tmp13 = _tmp11 * _tmp4;
+  const Scalar _tmp14 = _tmp11 * _tmp2;
+  const Scalar _tmp15 = std::cos(_tmp9);
+  const Scalar _tmp16 =
+      -_tmp12 * state(1, 0) + _tmp13 * state(0, 0) + _tmp14 * state(3, 0) + _tmp15 * state(2, 0);
+  const Scalar _tmp17 = -2 * std::pow(state(2, 0), Scalar(2));
+  const Scalar _tmp18 = 1 - 2 * std::pow(state(0, 0), Scalar(2));
+  const Scalar _tmp19 = _tmp17 + _tmp18;
+  const Scalar _tmp20 = -state(59, 0) + z_imu_raw(4, 0);
+  const Scalar _tmp21 = -state(58, 0) + z_imu_raw(3, 0);
+  const Scalar _tmp22 = 2 * _tmp15;
+  const Scalar _tmp23 = _tmp14 * _tmp22;
+  const Scalar _tmp24 = _tmp0 * _tmp1 * _tmp4;
+  const Scalar _tmp25 = 2 * std::pow(_tmp10, Scalar(2)) / _tmp7;
+  const Scalar _tmp26 = _tmp24 * _tmp25;
+  const Scalar _tmp27 = _tmp23 + _tmp26;
+  const Scalar _tmp28 = -state(60, 0) + z_imu_raw(5, 0);
+  const Scalar _tmp29 = _tmp1 * _tmp2;
+  const Scalar _tmp30 = _tmp25 * _tmp29;
+  const Scalar _tmp31 = _tmp30 * _tmp4;
+  const Scalar _tmp32 = _tmp12 * _tmp22;
+  const Scalar _tmp33 = _tmp31 - _tmp32;
+  const Scalar _tmp34 = -_tmp25 * _tmp6;
+  const Scalar _tmp35 = -_tmp25 * _tmp3 + 1;
+  const Scalar _tmp36 = _tmp34 + _tmp35;
+  const Scalar _tmp37 = _tmp20 * _tmp36 - _tmp20 + _tmp21 * _tmp27 + _tmp28 * _tmp33;
+  const Scalar _tmp38 = [&]() {
+    const Scalar base = dt;
+    return base * base * base;
+  }();
+  const Scalar _tmp39 = (Scalar(1) / Scalar(6)) * _tmp38;
+  const Scalar _tmp40 = (Scalar(1) / Scalar(2)) * _tmp1;
+  const Scalar _tmp41 = _tmp20 * _tmp40 + _tmp37 * _tmp39;
+  const Scalar _tmp42 = 2 * state(2, 0);
+  const Scalar _tmp43 = _tmp42 * state(1, 0);
+  const Scalar _tmp44 = 2 * state(3, 0);
+  const Scalar _tmp45 = _tmp44 * state(0, 0);
+  const Scalar _tmp46 = _tmp43 - _tmp45;
+  const Scalar _tmp47 = -_tmp25 * _tmp5;
+  const Scalar _tmp48 = _tmp34 + _tmp47 + 1;
+  const Scalar _tmp49 = _tmp31 + _tmp32;
+  const Scalar _tmp50 = _tmp0 * _tmp30;
+  const Scalar _tmp51 = _tmp13 * _tmp22;
+  const Scalar _tmp52 = _tmp50 - _tmp51;
+  const Scalar _tmp53 = _tmp20 * _tmp49 + _tmp21 * _tmp52 + _tmp28 * _tmp48 - _tmp28;
+  const Scalar _tmp54 = _tmp28 * _tmp40 + _tmp39 * _tmp53;
+  const Scalar _tmp55 = 2 * state(0, 0) * state(1, 0);
+  const Scalar _tmp56 = _tmp44 * state(2, 0);
+  const Scalar _tmp57 = _tmp55 + _tmp56;
+  const Scalar _tmp58 = -_tmp23 + _tmp26;
+  const Scalar _tmp59 = _tmp50 + _tmp51;
+  const Scalar _tmp60 = _tmp35 + _tmp47;
+  const Scalar _tmp61 = _tmp20 * _tmp58 + _tmp21 * _tmp60 - _tmp21 + _tmp28 * _tmp59;
+  const Scalar _tmp62 = _tmp21 * _tmp40 + _tmp39 * _tmp61;
+  const Scalar _tmp63 = _tmp19 * _tmp41 + _tmp40 * gravity(1, 0) + _tmp46 * _tmp54 +
+                        _tmp57 * _tmp62 + dt * state(5, 0) + state(8, 0);
+  const Scalar _tmp64 = -_tmp63 + z(1, 0);
+  const Scalar _tmp65 = dt * state(22, 0) + state(40, 0);
+  const Scalar _tmp66 = -_tmp54 * state(13, 0) + _tmp62 * state(15, 0) + _tmp65;
+  const Scalar _tmp67 = dt * state(18, 0) + state(33, 0);
+  const Scalar _tmp68 = -_tmp41 * state(15, 0) + _tmp54 * state(14, 0) + _tmp67;
+  const Scalar _tmp69 = _tmp62 * state(14, 0);
+  const Scalar _tmp70 = _tmp41 * state(13, 0);
+  const Scalar _tmp71 = -_tmp69 + _tmp70 + dt * state(27, 0) + state(48, 0);
+  const Scalar _tmp72 = _tmp33 * _tmp66 + _tmp48 * _tmp71 + _tmp59 * _tmp68;
+  const Scalar _tmp73 = _tmp54 * state(11, 0);
+  const Scalar _tmp74 = dt * state(21, 0) + state(39, 0);
+  const Scalar _tmp75 = _tmp69 - _tmp73 + _tmp74;
+  const Scalar _tmp76 = dt * state(17, 0) + state(32, 0);
+  const Scalar _tmp77 = -_tmp41 * state(14, 0) + _tmp54 * state(12, 0) + _tmp76;
+  const Scalar _tmp78 = dt * state(26, 0) + state(47, 0);
+  const Scalar _tmp79 = _tmp41 * state(11, 0) - _tmp62 * state(12, 0) + _tmp78;
+  const Scalar _tmp80 = _tmp33 * _tmp75 + _tmp48 * _tmp79 + _tmp59 * _tmp77;
+  const Scalar _tmp81 = dt * state(20, 0) + state(38, 0);
+  const Scalar _tmp82 = -_tmp54 * state(10, 0) + _tmp62 * state(13, 0) + _tmp81;
+  const Scalar _tmp83 = dt * state(16, 0) + state(31, 0);
+  const Scalar _tmp84 = -_tmp70 + _tmp73 + _tmp83;
+  const Scalar _tmp85 = dt * state(25, 0) + state(46, 0);
+  const Scalar _tmp86 = _tmp41 * state(10, 0) - _tmp62 * state(11, 0) + _tmp85;
+  const Scalar _tmp87 = _tmp33 * _tmp82 + _tmp48 * _tmp86 + _tmp59 * _tmp84;
+  const Scalar _tmp88 = _tmp36 * _tmp80 + _tmp49 * _tmp72 + _tmp58 * _tmp87;
+  const Scalar _tmp89 = _tmp11 * state(2, 0);
+  const Scalar _tmp90 =
+      _tmp12 * state(3, 0) + _tmp14 * state(1, 0) + _tmp15 * state(0, 0) - _tmp4 * _tmp89;
+  const Scalar _tmp91 = 2 * _tmp16 * _tmp90;
+  const Scalar _tmp92 =
+      _tmp0 * _tmp89 + _tmp13 * state(3, 0) - _tmp14 * state(0, 0) + _tmp15 * state(1, 0);
+  const Scalar _tmp93 =
+      -_tmp12 * state(0, 0) - _tmp13 * state(1, 0) - _tmp14 * state(2, 0) + _tmp15 * state(3, 0);
+  const Scalar _tmp94 = 2 * _tmp93;
+  const Scalar _tmp95 = _tmp92 * _tmp94;
+  const Scalar _tmp96 = _tmp91 + _tmp95;
+  const Scalar _tmp97 = 2 * _tmp92;
+  const Scalar _tmp98 = _tmp90 * _tmp97;
+  const Scalar _tmp99 = _tmp16 * _tmp94;
+  const Scalar _tmp100 = _tmp98 - _tmp99;
+  const Scalar _tmp101 = _tmp36 * _tmp82 + _tmp49 * _tmp86 + _tmp58 * _tmp84;
+  const Scalar _tmp102 = _tmp36 * _tmp75 + _tmp49 * _tmp79 + _tmp58 * _tmp77;
+  const Scalar _tmp103 = _tmp36 * _tmp66 + _tmp49 * _tmp71 + _tmp58 * _tmp68;
+  const Scalar _tmp104 = _tmp101 * _tmp58 + _tmp102 * _tmp36 + _tmp103 * _tmp49;
+  const Scalar _tmp105 = -2 * std::pow(_tmp16, Scalar(2));
+  const Scalar _tmp106 = -2 * std::pow(_tmp92, Scalar(2));
+  const Scalar _tmp107 = _tmp105 + _tmp106 + 1;
+  const Scalar _tmp108 = _tmp27 * _tmp66 + _tmp52 * _tmp71 + _tmp60 * _tmp68;
+  const Scalar _tmp109 = _tmp27 * _tmp75 + _tmp52 * _tmp79 + _tmp60 * _tmp77;
+  const Scalar _tmp110 = _tmp27 * _tmp82 + _tmp52 * _tmp86 + _tmp60 * _tmp84;
+  const Scalar _tmp111 = _tmp108 * _tmp49 + _tmp109 * _tmp36 + _tmp110 * _tmp58;
+  const Scalar _tmp112 = _tmp100 * _tmp104 + _tmp107 * _tmp111 + _tmp88 * _tmp96;
+  const Scalar _tmp113 = _tmp27 * _tmp33;
+  const Scalar _tmp114 = (Scalar(1) / Scalar(4)) * std::pow(dt, Scalar(5));
+  const Scalar _tmp115 = _tmp114 * imu_noise(4, 0);
+  const Scalar _tmp116 = _tmp114 * imu_noise(3, 0);
+  const Scalar _tmp117 = _tmp116 * _tmp60;
+  const Scalar _tmp118 = dt * state(28, 0);
+  const Scalar _tmp119 = _tmp118 + state(49, 0);
+  const Scalar _tmp120 = _tmp119 * dt - _tmp41 * _tmp71 + _tmp41 * _tmp83 + _tmp54 * _tmp79 -
+                         _tmp62 * _tmp76 + dt * state(36, 0) + state(52, 0);
+  const Scalar _tmp121 = dt * state(29, 0);
+  const Scalar _tmp122 = _tmp121 + state(50, 0);
+  const Scalar _tmp123 = _tmp122 * dt + _tmp41 * _tmp81 - _tmp54 * _tmp86 + _tmp62 * _tmp71 -
+                         _tmp62 * _tmp74 + dt * state(43, 0) + state(53, 0);
+  const Scalar _tmp124 = dt * state(30, 0) + state(51, 0);
+  const Scalar _tmp125 = _tmp124 * dt + _tmp41 * _tmp85 + _tmp41 * _tmp86 - _tmp62 * _tmp78 -
+                         _tmp62 * _tmp79 + dt * state(51, 0) + state(54, 0);
+  const Scalar _tmp126 = _tmp120 * _tmp59 + _tmp123 * _tmp33 + _tmp125 * _tmp48;
+  const Scalar _tmp127 = dt * state(23, 0);
+  const Scalar _tmp128 = _tmp127 + state(41, 0);
+  const Scalar _tmp129 = _tmp128 * dt - _tmp41 * _tmp66 + _tmp54 * _tmp75 - _tmp54 * _tmp83 +
+                         _tmp62 * _tmp67 + dt * state(35, 0) + state(44, 0);
+  const Scalar _tmp130 = dt * state(19, 0) + state(34, 0);
+  const Scalar _tmp131 = _tmp130 * dt - _tmp41 * _tmp67 - _tmp41 * _tmp68 + _tmp54 * _tmp76 +
+                         _tmp54 * _tmp77 + dt * state(34, 0) + state(37, 0);
+  const Scalar _tmp132 = _tmp120 * _tmp48 + _tmp129 * _tmp33 + _tmp131 * _tmp59;
+  const Scalar _tmp133 = dt * state(24, 0) + state(42, 0);
+  const Scalar _tmp134 = _tmp133 * dt - _tmp54 * _tmp81 - _tmp54 * _tmp82 + _tmp62 * _tmp65 +
+                         _tmp62 * _tmp66 + dt * state(42, 0) + state(45, 0);
+  const Scalar _tmp135 = _tmp123 * _tmp48 + _tmp129 * _tmp59 + _tmp134 * _tmp33;
+  const Scalar _tmp136 = _tmp114 * imu_noise(5, 0);
+  const Scalar _tmp137 = _tmp48 * _tmp52;
+  const Scalar _tmp138 = _tmp113 * _tmp115 + _tmp117 * _tmp59 + _tmp126 * _tmp52 +
+                         _tmp132 * _tmp60 + _tmp135 * _tmp27 + _tmp136 * _tmp137;
+  const Scalar _tmp139 = _tmp120 * _tmp58 + _tmp123 * _tmp36 + _tmp125 * _tmp49;
+  const Scalar _tmp140 = _tmp120 * _tmp49 + _tmp129 * _tmp36 + _tmp131 * _tmp58;
+  const Scalar _tmp141 = _tmp123 * _tmp49 + _tmp129 * _tmp58 + _tmp134 * _tmp36;
+  const Scalar _tmp142 = _tmp49 * _tmp52;
+  const Scalar _tmp143 = _tmp27 * _tmp36;
+  const Scalar _tmp144 = _tmp115 * _tmp143 + _tmp117 * _tmp58 + _tmp136 * _tmp142 +
+                         _tmp139 * _tmp52 + _tmp140 * _tmp60 + _tmp141 * _tmp27;
+  const Scalar _tmp145 = std::pow(_tmp27, Scalar(2));
+  const Scalar _tmp146 = _tmp145 * imu_noise(4, 0);
+  const Scalar _tmp147 = std::pow(_tmp52, Scalar(2));
+  const Scalar _tmp148 = std::pow(_tmp60, Scalar(2));
+  const Scalar _tmp149 = _tmp148 * imu_noise(3, 0);
+  const Scalar _tmp150 = _tmp114 * _tmp146 + _tmp114 * _tmp149 + _tmp136 * _tmp147 +
+                         _tmp27 * (_tmp123 * _tmp52 + _tmp129 * _tmp60 + _tmp134 * _tmp27) +
+                         _tmp52 * (_tmp120 * _tmp60 + _tmp123 * _tmp27 + _tmp125 * _tmp52) +
+                         _tmp60 * (_tmp120 * _tmp52 + _tmp129 * _tmp27 + _tmp131 * _tmp60);
+  const Scalar _tmp151 = _tmp100 * _tmp144 + _tmp107 * _tmp150 + _tmp138 * _tmp96;
+  const Scalar _tmp152 = std::pow(_tmp58, Scalar(2));
+  const Scalar _tmp153 = _tmp152 * imu_noise(3, 0);
+  const Scalar _tmp154 = std::pow(_tmp36, Scalar(2));
+  const Scalar _tmp155 = _tmp154 * imu_noise(4, 0);
+  const Scalar _tmp156 = std::pow(_tmp49, Scalar(2));
+  const Scalar _tmp157 = _tmp114 * _tmp153 + _tmp114 * _tmp155 + _tmp136 * _tmp156 +
+                         _tmp139 * _tmp49 + _tmp140 * _tmp58 + _tmp141 * _tmp36;
+  const Scalar _tmp158 = _tmp58 * _tmp59;
+  const Scalar _tmp159 = _tmp33 * _tmp36;
+  const Scalar _tmp160 = _tmp48 * _tmp49;
+  const Scalar _tmp161 = _tmp115 * _tmp159 + _tmp116 * _tmp158 + _tmp126 * _tmp49 +
+                         _tmp132 * _tmp58 + _tmp135 * _tmp36 + _tmp136 * _tmp160;
+  const Scalar _tmp162 = _tmp100 * _tmp157 + _tmp107 * _tmp144 + _tmp161 * _tmp96;
+  const Scalar _tmp163 = std::pow(_tmp48, Scalar(2));
+  const Scalar _tmp164 = _tmp163 * imu_noise(5, 0);
+  const Scalar _tmp165 = std::pow(_tmp59, Scalar(2));
+  const Scalar _tmp166 = _tmp165 * imu_noise(3, 0);
+  const Scalar _tmp167 = std::pow(_tmp33, Scalar(2));
+  const Scalar _tmp168 = _tmp167 * imu_noise(4, 0);
+  const Scalar _tmp169 = _tmp114 * _tmp164 + _tmp114 * _tmp166 + _tmp114 * _tmp168 +
+                         _tmp126 * _tmp48 + _tmp132 * _tmp59 + _tmp135 * _tmp33;
+  const Scalar _tmp170 = _tmp100 * _tmp161 + _tmp107 * _tmp138 + _tmp169 * _tmp96;
+  const Scalar _tmp171 =
+      Scalar(1.0) / (R(0, 0) + _tmp100 * _tmp162 + _tmp107 * _tmp151 + _tmp170 * _tmp96);
+  const Scalar _tmp172 = _tmp16 * _tmp97;
+  const Scalar _tmp173 = _tmp90 * _tmp94;
+  const Scalar _tmp174 = _tmp172 + _tmp173;
+  const Scalar _tmp175 = _tmp91 - _tmp95;
+  const Scalar _tmp176 = 1 - 2 * std::pow(_tmp90, Scalar(2));
+  const Scalar _tmp177 = _tmp106 + _tmp176;
+  const Scalar _tmp178 = _tmp144 * _tmp175 + _tmp157 * _tmp174 + _tmp161 * _tmp177;
+  const Scalar _tmp179 = _tmp138 * _tmp177 + _tmp144 * _tmp174 + _tmp150 * _tmp175;
+  const Scalar _tmp180 = _tmp138 * _tmp175 + _tmp161 * _tmp174 + _tmp169 * _tmp177;
+  const Scalar _tmp181 = R(3, 0) + _tmp100 * _tmp178 + _tmp107 * _tmp179 + _tmp180 * _tmp96;
+  const Scalar _tmp182 =
+      _tmp171 * (R(3, 0) + _tmp151 * _tmp175 + _tmp162 * _tmp174 + _tmp170 * _tmp177);
+  const Scalar _tmp183 = _tmp105 + _tmp176;
+  const Scalar _tmp184 = _tmp98 + _tmp99;
+  const Scalar _tmp185 = _tmp172 - _tmp173;
+  const Scalar _tmp186 =
+      _tmp171 * (R(1, 0) + _tmp151 * _tmp184 + _tmp162 * _tmp183 + _tmp170 * _tmp185);
+  const Scalar _tmp187 =
+      R(4, 0) + _tmp178 * _tmp183 + _tmp179 * _tmp184 + _tmp180 * _tmp185 - _tmp181 * _tmp186;
+  const Scalar _tmp188 = _tmp144 * _tmp184 + _tmp157 * _tmp183 + _tmp161 * _tmp185;
+  const Scalar _tmp189 = _tmp138 * _tmp184 + _tmp161 * _tmp183 + _tmp169 * _tmp185;
+  const Scalar _tmp190 = _tmp138 * _tmp185 + _tmp144 * _tmp183 + _tmp150 * _tmp184;
+  const Scalar _tmp191 = R(1, 0) + _tmp100 * _tmp188 + _tmp107 * _tmp190 + _tmp189 * _tmp96;
+  const Scalar _tmp192 = Scalar(1.0) / (R(2, 0) + _tmp183 * _tmp188 + _tmp184 * _tmp190 +
+                                        _tmp185 * _tmp189 - _tmp186 * _tmp191);
+  const Scalar _tmp193 = _tmp192 * (R(4, 0) + _tmp174 * _tmp188 + _tmp175 * _tmp190 +
+                                    _tmp177 * _tmp189 - _tmp182 * _tmp191);
+  const Scalar _tmp194 = _tmp187 * _tmp193;
+  const Scalar _tmp195 = Scalar(1.0) / (R(5, 0) + _tmp174 * _tmp178 + _tmp175 * _tmp179 +
+                                        _tmp177 * _tmp180 - _tmp181 * _tmp182 - _tmp194);
+  const Scalar _tmp196 = _tmp181 * _tmp195;
+  const Scalar _tmp197 = _tmp192 * (_tmp194 * _tmp195 + 1);
+  const Scalar _tmp198 = _tmp171 * (-_tmp191 * _tmp197 + _tmp193 * _tmp196);
+  const Scalar _tmp199 = _tmp104 * _tmp183 + _tmp111 * _tmp184 + _tmp185 * _tmp88;
+  const Scalar _tmp200 = _tmp195 * (_tmp104 * _tmp174 + _tmp111 * _tmp175 + _tmp177 * _tmp88);
+  const Scalar _tmp201 = _tmp112 * _tmp198 - _tmp193 * _tmp200 + _tmp197 * _tmp199;
+  const Scalar _tmp202 = -_tmp182 + _tmp186 * _tmp193;
+  const Scalar _tmp203 = _tmp187 * _tmp195;
+  const Scalar _tmp204 = _tmp192 * (-_tmp186 - _tmp202 * _tmp203);
+  const Scalar _tmp205 = _tmp171 * (-_tmp191 * _tmp204 - _tmp196 * _tmp202 + 1);
+  const Scalar _tmp206 = _tmp112 * _tmp205 + _tmp199 * _tmp204 + _tmp200 * _tmp202;
+  const Scalar _tmp207 = _tmp55 - _tmp56;
+  const Scalar _tmp208 = _tmp44 * state(1, 0);
+  const Scalar _tmp209 = _tmp42 * state(0, 0);
+  const Scalar _tmp210 = _tmp208 + _tmp209;
+  const Scalar _tmp211 = -2 * std::pow(state(1, 0), Scalar(2));
+  const Scalar _tmp212 = _tmp17 + _tmp211 + 1;
+  const Scalar _tmp213 = _tmp207 * _tmp41 + _tmp210 * _tmp54 + _tmp212 * _tmp62 +
+                         _tmp40 * gravity(0, 0) + dt * state(4, 0) + state(7, 0);
+  const Scalar _tmp214 = -_tmp213 + z(0, 0);
+  const Scalar _tmp215 = _tmp43 + _tmp45;
+  const Scalar _tmp216 = _tmp18 + _tmp211;
+  const Scalar _tmp217 = -_tmp208 + _tmp209;
+  const Scalar _tmp218 = _tmp215 * _tmp41 + _tmp216 * _tmp54 + _tmp217 * _tmp62 +
+                         _tmp40 * gravity(2, 0) + dt * state(6, 0) + state(9, 0);
+  const Scalar _tmp219 = -_tmp218 + z(2, 0);
+  const Scalar _tmp220 = _tmp192 * _tmp203;
+  const Scalar _tmp221 = _tmp171 * (_tmp191 * _tmp220 - _tmp196);
+  const Scalar _tmp222 = _tmp112 * _tmp221 - _tmp199 * _tmp220 + _tmp200;
+  const Scalar _tmp223 = _tmp201 * _tmp64 + _tmp206 * _tmp214 + _tmp219 * _tmp222;
+  const Scalar _tmp224 = std::pow(_tmp223, Scalar(2));
+  const Scalar _tmp225 = _tmp27 * _tmp80 + _tmp52 * _tmp72 + _tmp60 * _tmp87;
+  const Scalar _tmp226 = _tmp108 * _tmp52 + _tmp109 * _tmp27 + _tmp110 * _tmp60;
+  const Scalar _tmp227 = _tmp101 * _tmp60 + _tmp102 * _tmp27 + _tmp103 * _tmp52;
+  const Scalar _tmp228 = _tmp183 * _tmp227 + _tmp184 * _tmp226 + _tmp185 * _tmp225;
+  const Scalar _tmp229 = _tmp100 * _tmp227 + _tmp107 * _tmp226 + _tmp225 * _tmp96;
+  const Scalar _tmp230 = _tmp195 * (_tmp174 * _tmp227 + _tmp175 * _tmp226 + _tmp177 * _tmp225);
+  const Scalar _tmp231 = -_tmp193 * _tmp230 + _tmp197 * _tmp228 + _tmp198 * _tmp229;
+  const Scalar _tmp232 = _tmp202 * _tmp230 + _tmp204 * _tmp228 + _tmp205 * _tmp229;
+  const Scalar _tmp233 = -_tmp220 * _tmp228 + _tmp221 * _tmp229 + _tmp230;
+  const Scalar _tmp234 = _tmp214 * _tmp232 + _tmp219 * _tmp233 + _tmp231 * _tmp64;
+  const Scalar _tmp235 = std::pow(_tmp234, Scalar(2));
+  const Scalar _tmp236 = _tmp108 * _tmp48 + _tmp109 * _tmp33 + _tmp110 * _tmp59;
+  const Scalar _tmp237 = _tmp33 * _tmp80 + _tmp48 * _tmp72 + _tmp59 * _tmp87;
+  const Scalar _tmp238 = _tmp101 * _tmp59 + _tmp102 * _tmp33 + _tmp103 * _tmp48;
+  const Scalar _tmp239 = _tmp183 * _tmp238 + _tmp184 * _tmp236 + _tmp185 * _tmp237;
+  const Scalar _tmp240 = _tmp195 * (_tmp174 * _tmp238 + _tmp175 * _tmp236 + _tmp177 * _tmp237);
+  const Scalar _tmp241 = _tmp100 * _tmp238 + _tmp107 * _tmp236 + _tmp237 * _tmp96;
+  const Scalar _tmp242 = _tmp202 * _tmp240 + _tmp204 * _tmp239 + _tmp205 * _tmp241;
+  const Scalar _tmp243 = -_tmp193 * _tmp240 + _tmp197 * _tmp239 + _tmp198 * _tmp241;
+  const Scalar _tmp244 = -_tmp220 * _tmp239 + _tmp221 * _tmp241 + _tmp240;
+  const Scalar _tmp245 = _tmp214 * _tmp242 + _tmp219 * _tmp244 + _tmp243 * _tmp64;
+  const Scalar _tmp246 = std::pow(_tmp245, Scalar(2));
+  const Scalar _tmp247 = _tmp224 + _tmp235 + _tmp246 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp248 = std::sqrt(_tmp247);
+  const Scalar _tmp249 = (Scalar(1) / Scalar(2)) * _tmp248;
+  const Scalar _tmp250 = std::sin(_tmp249) / _tmp248;
+  const Scalar _tmp251 = _tmp223 * _tmp250;
+  const Scalar _tmp252 = std::cos(_tmp249);
+  const Scalar _tmp253 = _tmp234 * _tmp250;
+  const Scalar _tmp254 = _tmp245 * _tmp250;
+  const Scalar _tmp255 = Scalar(0.050000000000000003) - _tmp248;
+  const Scalar _tmp256 = std::max<Scalar>(0, (((_tmp255) > 0) - ((_tmp255) < 0)));
+  const Scalar _tmp257 = _tmp248 + _tmp255 * _tmp256;
+  const Scalar _tmp258 = (_tmp257 - std::sin(_tmp257)) / [&]() {
+    const Scalar base = _tmp257;
+    return base * base * base;
+  }();
+  const Scalar _tmp259 = std::pow(_tmp247, Scalar(2));
+  const Scalar _tmp260 =
+      _tmp256 * (-Scalar(0.0083333333333333332) * _tmp247 - _tmp258 +
+                 Scalar(0.00019841269841269841) * _tmp259 + Scalar(0.16666666666666666)) +
+      _tmp258;
+  const Scalar _tmp261 = _tmp223 * _tmp234 * _tmp260;
+  const Scalar _tmp262 = (1 - std::cos(_tmp257)) / std::pow(_tmp257, Scalar(2));
+  const Scalar _tmp263 =
+      _tmp256 * (-Scalar(0.041666666666666664) * _tmp247 + Scalar(0.0013888888888888889) * _tmp259 -
+                 _tmp262 + Scalar(0.5)) +
+      _tmp262;
+  const Scalar _tmp264 = _tmp245 * _tmp263;
+  const Scalar _tmp265 = _tmp261 + _tmp264;
+  const Scalar _tmp266 = _tmp28 * dt + _tmp40 * _tmp53;
+  const Scalar _tmp267 = _tmp21 * dt + _tmp40 * _tmp61;
+  const Scalar _tmp268 = _tmp127 - _tmp266 * _tmp84 + _tmp267 * _tmp68 - _tmp41 * state(22, 0) +
+                         _tmp54 * state(21, 0) + state(35, 0);
+  const Scalar _tmp269 =
+      _tmp133 - _tmp266 * _tmp82 + _tmp267 * _tmp66 - _tmp54 * state(20, 0) + _tmp62 * state(22, 0);
+  const Scalar _tmp270 =
+      _tmp122 - _tmp266 * _tmp86 + _tmp267 * _tmp71 + _tmp41 * state(20, 0) - _tmp62 * state(21, 0);
+  const Scalar _tmp271 = _tmp268 * _tmp58 + _tmp269 * _tmp36 + _tmp270 * _tmp49;
+  const Scalar _tmp272 = _tmp20 * dt + _tmp37 * _tmp40;
+  const Scalar _tmp273 =
+      _tmp119 + _tmp266 * _tmp79 - _tmp272 * _tmp71 + _tmp41 * state(16, 0) - _tmp62 * state(17, 0);
+  const Scalar _tmp274 =
+      _tmp130 + _tmp266 * _tmp77 - _tmp272 * _tmp68 - _tmp41 * state(18, 0) + _tmp54 * state(17, 0);
+  const Scalar _tmp275 =
+      _tmp128 + _tmp266 * _tmp75 - _tmp272 * _tmp66 - _tmp54 * state(16, 0) + _tmp62 * state(18, 0);
+  const Scalar _tmp276 = _tmp273 * _tmp49 + _tmp274 * _tmp58 + _tmp275 * _tmp36;
+  const Scalar _tmp277 =
+      _tmp124 - _tmp267 * _tmp79 + _tmp272 * _tmp86 + _tmp41 * state(25, 0) - _tmp62 * state(26, 0);
+  const Scalar _tmp278 = _tmp121 - _tmp267 * _tmp75 + _tmp272 * _tmp82 - _tmp54 * state(25, 0) +
+                         _tmp62 * state(27, 0) + state(43, 0);
+  const Scalar _tmp279 = _tmp118 - _tmp267 * _tmp77 + _tmp272 * _tmp84 - _tmp41 * state(27, 0) +
+                         _tmp54 * state(26, 0) + state(36, 0);
+  const Scalar _tmp280 = _tmp277 * _tmp49 + _tmp278 * _tmp36 + _tmp279 * _tmp58;
+  const Scalar _tmp281 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(4));
+  const Scalar _tmp282 = _tmp281 * imu_noise(5, 0);
+  const Scalar _tmp283 = _tmp281 * imu_noise(3, 0);
+  const Scalar _tmp284 = _tmp283 * _tmp60;
+  const Scalar _tmp285 = _tmp281 * imu_noise(4, 0);
+  const Scalar _tmp286 = _tmp142 * _tmp282 + _tmp143 * _tmp285 + _tmp284 * _tmp58;
+  const Scalar _tmp287 = _tmp27 * _tmp271 + _tmp276 * _tmp60 + _tmp280 * _tmp52 + _tmp286;
+  const Scalar _tmp288 = _tmp27 * _tmp275 + _tmp273 * _tmp52 + _tmp274 * _tmp60;
+  const Scalar _tmp289 = _tmp268 * _tmp60 + _tmp269 * _tmp27 + _tmp270 * _tmp52;
+  const Scalar _tmp290 = _tmp27 * _tmp278 + _tmp277 * _tmp52 + _tmp279 * _tmp60;
+  const Scalar _tmp291 = _tmp146 * _tmp281 + _tmp147 * _tmp282 + _tmp149 * _tmp281 +
+                         _tmp27 * _tmp289 + _tmp288 * _tmp60 + _tmp290 * _tmp52;
+  const Scalar _tmp292 = _tmp273 * _tmp48 + _tmp274 * _tmp59 + _tmp275 * _tmp33;
+  const Scalar _tmp293 = _tmp268 * _tmp59 + _tmp269 * _tmp33 + _tmp270 * _tmp48;
+  const Scalar _tmp294 = _tmp277 * _tmp48 + _tmp278 * _tmp33 + _tmp279 * _tmp59;
+  const Scalar _tmp295 = _tmp113 * _tmp285 + _tmp137 * _tmp282 + _tmp284 * _tmp59;
+  const Scalar _tmp296 = _tmp27 * _tmp293 + _tmp292 * _tmp60 + _tmp294 * _tmp52 + _tmp295;
+  const Scalar _tmp297 = _tmp195 * (_tmp174 * _tmp287 + _tmp175 * _tmp291 + _tmp177 * _tmp296);
+  const Scalar _tmp298 = _tmp100 * _tmp287 + _tmp107 * _tmp291 + _tmp296 * _tmp96;
+  const Scalar _tmp299 = _tmp183 * _tmp287 + _tmp184 * _tmp291 + _tmp185 * _tmp296;
+  const Scalar _tmp300 = _tmp202 * _tmp297 + _tmp204 * _tmp299 + _tmp205 * _tmp298;
+  const Scalar _tmp301 = -_tmp193 * _tmp297 + _tmp197 * _tmp299 + _tmp198 * _tmp298;
+  const Scalar _tmp302 = -_tmp220 * _tmp299 + _tmp221 * _tmp298 + _tmp297;
+  const Scalar _tmp303 = _tmp214 * _tmp300 + _tmp219 * _tmp302 + _tmp301 * _tmp64;
+  const Scalar _tmp304 = -_tmp235 * _tmp260;
+  const Scalar _tmp305 = -_tmp246 * _tmp260 + 1;
+  const Scalar _tmp306 = _tmp304 + _tmp305;
+  const Scalar _tmp307 = _tmp153 * _tmp281 + _tmp155 * _tmp281 + _tmp156 * _tmp282 +
+                         _tmp271 * _tmp36 + _tmp276 * _tmp58 + _tmp280 * _tmp49;
+  const Scalar _tmp308 = _tmp286 + _tmp288 * _tmp58 + _tmp289 * _tmp36 + _tmp290 * _tmp49;
+  const Scalar _tmp309 = _tmp158 * _tmp283 + _tmp159 * _tmp285 + _tmp160 * _tmp282;
+  const Scalar _tmp310 = _tmp292 * _tmp58 + _tmp293 * _tmp36 + _tmp294 * _tmp49 + _tmp309;
+  const Scalar _tmp311 = _tmp183 * _tmp307 + _tmp184 * _tmp308 + _tmp185 * _tmp310;
+  const Scalar _tmp312 = _tmp100 * _tmp307 + _tmp107 * _tmp308 + _tmp310 * _tmp96;
+  const Scalar _tmp313 = _tmp195 * (_tmp174 * _tmp307 + _tmp175 * _tmp308 + _tmp177 * _tmp310);
+  const Scalar _tmp314 = _tmp202 * _tmp313 + _tmp204 * _tmp311 + _tmp205 * _tmp312;
+  const Scalar _tmp315 = -_tmp193 * _tmp313 + _tmp197 * _tmp311 + _tmp198 * _tmp312;
+  const Scalar _tmp316 = -_tmp220 * _tmp311 + _tmp221 * _tmp312 + _tmp313;
+  const Scalar _tmp317 = _tmp214 * _tmp314 + _tmp219 * _tmp316 + _tmp315 * _tmp64;
+  const Scalar _tmp318 = _tmp288 * _tmp59 + _tmp289 * _tmp33 + _tmp290 * _tmp48 + _tmp295;
+  const Scalar _tmp319 = _tmp164 * _tmp281 + _tmp166 * _tmp281 + _tmp168 * _tmp281 +
+                         _tmp292 * _tmp59 + _tmp293 * _tmp33 + _tmp294 * _tmp48;
+  const Scalar _tmp320 = _tmp271 * _tmp33 + _tmp276 * _tmp59 + _tmp280 * _tmp48 + _tmp309;
+  const Scalar _tmp321 = _tmp100 * _tmp320 + _tmp107 * _tmp318 + _tmp319 * _tmp96;
+  const Scalar _tmp322 = _tmp195 * (_tmp174 * _tmp320 + _tmp175 * _tmp318 + _tmp177 * _tmp319);
+  const Scalar _tmp323 = _tmp183 * _tmp320 + _tmp184 * _tmp318 + _tmp185 * _tmp319;
+  const Scalar _tmp324 = -_tmp193 * _tmp322 + _tmp197 * _tmp323 + _tmp198 * _tmp321;
+  const Scalar _tmp325 = _tmp202 * _tmp322 + _tmp204 * _tmp323 + _tmp205 * _tmp321;
+  const Scalar _tmp326 = -_tmp220 * _tmp323 + _tmp221 * _tmp321 + _tmp322;
+  const Scalar _tmp327 = _tmp214 * _tmp325 + _tmp219 * _tmp326 + _tmp324 * _tmp64;
+  const Scalar _tmp328 = _tmp245 * _tmp260;
+  const Scalar _tmp329 = _tmp223 * _tmp328;
+  const Scalar _tmp330 = _tmp234 * _tmp263;
+  const Scalar _tmp331 = _tmp329 - _tmp330;
+  const Scalar _tmp332 = _tmp265 * _tmp303 + _tmp306 * _tmp317 + _tmp327 * _tmp331;
+  const Scalar _tmp333 = _tmp261 - _tmp264;
+  const Scalar _tmp334 = _tmp234 * _tmp328;
+  const Scalar _tmp335 = _tmp223 * _tmp263;
+  const Scalar _tmp336 = _tmp334 + _tmp335;
+  const Scalar _tmp337 = -_tmp224 * _tmp260;
+  const Scalar _tmp338 = _tmp305 + _tmp337;
+  const Scalar _tmp339 = _tmp303 * _tmp338 + _tmp317 * _tmp333 + _tmp327 * _tmp336;
+  const Scalar _tmp340 = _tmp329 + _tmp330;
+  const Scalar _tmp341 = _tmp334 - _tmp335;
+  const Scalar _tmp342 = _tmp304 + _tmp337 + 1;
+  const Scalar _tmp343 = _tmp303 * _tmp341 + _tmp317 * _tmp340 + _tmp327 * _tmp342;
+  const Scalar _tmp344 = _tmp179 * _tmp195;
+  const Scalar _tmp345 = _tmp151 * _tmp198 + _tmp190 * _tmp197 - _tmp193 * _tmp344;
+  const Scalar _tmp346 = _tmp151 * _tmp205 + _tmp190 * _tmp204 + _tmp202 * _tmp344;
+  const Scalar _tmp347 = _tmp151 * _tmp221 - _tmp190 * _tmp220 + _tmp344;
+  const Scalar _tmp348 = _tmp214 * _tmp346 + _tmp219 * _tmp347 + _tmp345 * _tmp64;
+  const Scalar _tmp349 = _tmp178 * _tmp195;
+  const Scalar _tmp350 = _tmp162 * _tmp198 + _tmp188 * _tmp197 - _tmp193 * _tmp349;
+  const Scalar _tmp351 = _tmp162 * _tmp205 + _tmp188 * _tmp204 + _tmp202 * _tmp349;
+  const Scalar _tmp352 = _tmp162 * _tmp221 - _tmp188 * _tmp220 + _tmp349;
+  const Scalar _tmp353 = _tmp214 * _tmp351 + _tmp219 * _tmp352 + _tmp350 * _tmp64;
+  const Scalar _tmp354 = _tmp180 * _tmp195;
+  const Scalar _tmp355 = _tmp170 * _tmp205 + _tmp189 * _tmp204 + _tmp202 * _tmp354;
+  const Scalar _tmp356 = _tmp170 * _tmp221 - _tmp189 * _tmp220 + _tmp354;
+  const Scalar _tmp357 = _tmp170 * _tmp198 + _tmp189 * _tmp197 - _tmp193 * _tmp354;
+  const Scalar _tmp358 = _tmp214 * _tmp355 + _tmp219 * _tmp356 + _tmp357 * _tmp64;
+  const Scalar _tmp359 = _tmp265 * _tmp348 + _tmp306 * _tmp353 + _tmp331 * _tmp358;
+  const Scalar _tmp360 = _tmp340 * _tmp353 + _tmp341 * _tmp348 + _tmp342 * _tmp358;
+  const Scalar _tmp361 = _tmp333 * _tmp353 + _tmp336 * _tmp358 + _tmp338 * _tmp348;
+  const Scalar _tmp362 = _tmp107 * _tmp232 + _tmp175 * _tmp233 + _tmp184 * _tmp231;
+  const Scalar _tmp363 = (Scalar(1) / Scalar(2)) * dt;
+  const Scalar _tmp364 = _tmp363 * _tmp4;
+  const Scalar _tmp365 = Scalar(0.050000000000000003) - _tmp8;
+  const Scalar _tmp366 = std::max<Scalar>(0, (((_tmp365) > 0) - ((_tmp365) < 0)));
+  const Scalar _tmp367 = _tmp365 * _tmp366 + _tmp8;
+  const Scalar _tmp368 = (Scalar(1) / Scalar(2)) * _tmp367;
+  const Scalar _tmp369 =
+      (-_tmp368 * std::cos(_tmp368) / std::sin(_tmp368) + 1) / std::pow(_tmp367, Scalar(2));
+  const Scalar _tmp370 =
+      _tmp366 * (-_tmp369 + Scalar(3.3068783068783071e-5) * std::pow(_tmp7, Scalar(2)) +
+                 Scalar(0.0013888888888888889) * _tmp7 + Scalar(0.083333333333333329)) +
+      _tmp369;
+  const Scalar _tmp371 = _tmp29 * _tmp370;
+  const Scalar _tmp372 = _tmp0 * _tmp371;
+  const Scalar _tmp373 = -_tmp364 + _tmp372;
+  const Scalar _tmp374 = _tmp38 * imu_noise(2, 0);
+  const Scalar _tmp375 = _tmp100 * _tmp232 + _tmp174 * _tmp233 + _tmp183 * _tmp231;
+  const Scalar _tmp376 = _tmp177 * _tmp233 + _tmp185 * _tmp231 + _tmp232 * _tmp96;
+  const Scalar _tmp377 = -_tmp3 * _tmp370;
+  const Scalar _tmp378 = -_tmp370 * _tmp5 + 1;
+  const Scalar _tmp379 = _tmp377 + _tmp378;
+  const Scalar _tmp380 = _tmp38 * imu_noise(0, 0);
+  const Scalar _tmp381 = _tmp2 * _tmp363;
+  const Scalar _tmp382 = _tmp24 * _tmp370;
+  const Scalar _tmp383 = _tmp381 + _tmp382;
+  const Scalar _tmp384 = _tmp38 * imu_noise(1, 0);
+  const Scalar _tmp385 = R(0, 0) * _tmp206 + R(1, 0) * _tmp201 + R(3, 0) * _tmp222;
+  const Scalar _tmp386 = _tmp36 * state(11, 0) + _tmp49 * state(13, 0) + _tmp58 * state(10, 0);
+  const Scalar _tmp387 = _tmp177 * _tmp222 + _tmp185 * _tmp201 + _tmp206 * _tmp96;
+  const Scalar _tmp388 = R(1, 0) * _tmp206 + R(2, 0) * _tmp201 + R(4, 0) * _tmp222;
+  const Scalar _tmp389 = _tmp36 * state(14, 0) + _tmp49 * state(15, 0) + _tmp58 * state(13, 0);
+  const Scalar _tmp390 = _tmp0 * _tmp363;
+  const Scalar _tmp391 = _tmp371 * _tmp4;
+  const Scalar _tmp392 = _tmp390 + _tmp391;
+  const Scalar _tmp393 = R(3, 0) * _tmp206 + R(4, 0) * _tmp201 + R(5, 0) * _tmp222;
+  const Scalar _tmp394 = -_tmp381 + _tmp382;
+  const Scalar _tmp395 = _tmp380 * _tmp394;
+  const Scalar _tmp396 = -_tmp370 * _tmp6;
+  const Scalar _tmp397 = _tmp377 + _tmp396 + 1;
+  const Scalar _tmp398 = _tmp383 * _tmp384;
+  const Scalar _tmp399 = _tmp107 * _tmp206 + _tmp175 * _tmp222 + _tmp184 * _tmp201;
+  const Scalar _tmp400 = _tmp100 * _tmp206 + _tmp174 * _tmp222 + _tmp183 * _tmp201;
+  const Scalar _tmp401 = -_tmp138 * _tmp399 - _tmp161 * _tmp400 - _tmp169 * _tmp387 + _tmp88;
+  const Scalar _tmp402 = _tmp111 - _tmp138 * _tmp387 - _tmp144 * _tmp400 - _tmp150 * _tmp399;
+  const Scalar _tmp403 = _tmp104 - _tmp144 * _tmp399 - _tmp157 * _tmp400 - _tmp161 * _tmp387;
+  const Scalar _tmp404 = _tmp36 * state(12, 0) + _tmp49 * state(14, 0) + _tmp58 * state(11, 0);
+  const Scalar _tmp405 = _tmp177 * _tmp244 + _tmp185 * _tmp243 + _tmp242 * _tmp96;
+  const Scalar _tmp406 = _tmp107 * _tmp242 + _tmp175 * _tmp244 + _tmp184 * _tmp243;
+  const Scalar _tmp407 = _tmp100 * _tmp242 + _tmp174 * _tmp244 + _tmp183 * _tmp243;
+  const Scalar _tmp408 = -_tmp138 * _tmp406 - _tmp161 * _tmp407 - _tmp169 * _tmp405 + _tmp237;
+  const Scalar _tmp409 = -_tmp138 * _tmp405 - _tmp144 * _tmp407 - _tmp150 * _tmp406 + _tmp236;
+  const Scalar _tmp410 = R(0, 0) * _tmp242 + R(1, 0) * _tmp243 + R(3, 0) * _tmp244;
+  const Scalar _tmp411 = R(1, 0) * _tmp242 + R(2, 0) * _tmp243 + R(4, 0) * _tmp244;
+  const Scalar _tmp412 = -_tmp144 * _tmp406 - _tmp157 * _tmp407 - _tmp161 * _tmp405 + _tmp238;
+  const Scalar _tmp413 = _tmp364 + _tmp372;
+  const Scalar _tmp414 = -_tmp390 + _tmp391;
+  const Scalar _tmp415 = R(3, 0) * _tmp242 + R(4, 0) * _tmp243 + R(5, 0) * _tmp244;
+  const Scalar _tmp416 = _tmp33 * state(11, 0) + _tmp48 * state(13, 0) + _tmp59 * state(10, 0);
+  const Scalar _tmp417 = _tmp33 * state(12, 0) + _tmp48 * state(14, 0) + _tmp59 * state(11, 0);
+  const Scalar _tmp418 = _tmp33 * state(14, 0) + _tmp48 * state(15, 0) + _tmp59 * state(13, 0);
+  const Scalar _tmp419 = _tmp378 + _tmp396;
+  const Scalar _tmp420 = _tmp374 * _tmp419;
+  const Scalar _tmp421 = R(0, 0) * _tmp300 + R(1, 0) * _tmp301 + R(3, 0) * _tmp302;
+  const Scalar _tmp422 = _tmp266 * state(11, 0);
+  const Scalar _tmp423 = _tmp272 * state(13, 0);
+  const Scalar _tmp424 = _tmp422 - _tmp423 + state(16, 0);
+  const Scalar _tmp425 = -_tmp267 * state(11, 0) + _tmp272 * state(10, 0) + state(25, 0);
+  const Scalar _tmp426 = -_tmp266 * state(10, 0) + _tmp267 * state(13, 0) + state(20, 0);
+  const Scalar _tmp427 = _tmp27 * _tmp426 + _tmp424 * _tmp60 + _tmp425 * _tmp52;
+  const Scalar _tmp428 = _tmp177 * _tmp302 + _tmp185 * _tmp301 + _tmp300 * _tmp96;
+  const Scalar _tmp429 = _tmp100 * _tmp300 + _tmp174 * _tmp302 + _tmp183 * _tmp301;
+  const Scalar _tmp430 = _tmp107 * _tmp300 + _tmp175 * _tmp302 + _tmp184 * _tmp301;
+  const Scalar _tmp431 = -_tmp144 * _tmp430 - _tmp157 * _tmp429 - _tmp161 * _tmp428 + _tmp287;
+  const Scalar _tmp432 = R(3, 0) * _tmp300 + R(4, 0) * _tmp301 + R(5, 0) * _tmp302;
+  const Scalar _tmp433 = -_tmp138 * _tmp428 - _tmp144 * _tmp429 - _tmp150 * _tmp430 + _tmp291;
+  const Scalar _tmp434 = -_tmp138 * _tmp430 - _tmp161 * _tmp429 - _tmp169 * _tmp428 + _tmp296;
+  const Scalar _tmp435 = -_tmp267 * state(12, 0) + _tmp272 * state(11, 0) + state(26, 0);
+  const Scalar _tmp436 = _tmp267 * state(14, 0);
+  const Scalar _tmp437 = -_tmp422 + _tmp436 + state(21, 0);
+  const Scalar _tmp438 = _tmp266 * state(12, 0) - _tmp272 * state(14, 0) + state(17, 0);
+  const Scalar _tmp439 = _tmp27 * _tmp437 + _tmp435 * _tmp52 + _tmp438 * _tmp60;
+  const Scalar _tmp440 = R(1, 0) * _tmp300 + R(2, 0) * _tmp301 + R(4, 0) * _tmp302;
+  const Scalar _tmp441 = _tmp266 * state(14, 0) - _tmp272 * state(15, 0) + state(18, 0);
+  const Scalar _tmp442 = -_tmp266 * state(13, 0) + _tmp267 * state(15, 0) + state(22, 0);
+  const Scalar _tmp443 = _tmp423 - _tmp436 + state(27, 0);
+  const Scalar _tmp444 = _tmp27 * _tmp442 + _tmp441 * _tmp60 + _tmp443 * _tmp52;
+  const Scalar _tmp445 = _tmp38 * imu_noise(4, 0);
+  const Scalar _tmp446 = -_tmp266 * _tmp426 - _tmp266 * state(20, 0) + _tmp267 * _tmp442 +
+                         _tmp267 * state(22, 0) + state(24, 0);
+  const Scalar _tmp447 = _tmp266 * _tmp437 - _tmp266 * state(16, 0) + _tmp267 * state(18, 0) -
+                         _tmp272 * _tmp442 + state(23, 0);
+  const Scalar _tmp448 = -_tmp266 * _tmp425 + _tmp267 * _tmp443 - _tmp267 * state(21, 0) +
+                         _tmp272 * state(20, 0) + state(29, 0);
+  const Scalar _tmp449 = _tmp38 * imu_noise(5, 0);
+  const Scalar _tmp450 = _tmp266 * _tmp435 - _tmp267 * state(17, 0) - _tmp272 * _tmp443 +
+                         _tmp272 * state(16, 0) + state(28, 0);
+  const Scalar _tmp451 = -_tmp267 * _tmp435 - _tmp267 * state(26, 0) + _tmp272 * _tmp425 +
+                         _tmp272 * state(25, 0) + state(30, 0);
+  const Scalar _tmp452 = _tmp38 * imu_noise(3, 0);
+  const Scalar _tmp453 = _tmp266 * _tmp438 + _tmp266 * state(17, 0) - _tmp272 * _tmp441 -
+                         _tmp272 * state(18, 0) + state(19, 0);
+  const Scalar _tmp454 = _tmp107 * _tmp314 + _tmp175 * _tmp316 + _tmp184 * _tmp315;
+  const Scalar _tmp455 = _tmp177 * _tmp316 + _tmp185 * _tmp315 + _tmp314 * _tmp96;
+  const Scalar _tmp456 = _tmp100 * _tmp314 + _tmp174 * _tmp316 + _tmp183 * _tmp315;
+  const Scalar _tmp457 = -_tmp144 * _tmp454 - _tmp157 * _tmp456 - _tmp161 * _tmp455 + _tmp307;
+  const Scalar _tmp458 = -_tmp138 * _tmp455 - _tmp144 * _tmp456 - _tmp150 * _tmp454 + _tmp308;
+  const Scalar _tmp459 = R(3, 0) * _tmp314 + R(4, 0) * _tmp315 + R(5, 0) * _tmp316;
+  const Scalar _tmp460 = R(0, 0) * _tmp314 + R(1, 0) * _tmp315 + R(3, 0) * _tmp316;
+  const Scalar _tmp461 = _tmp36 * _tmp442 + _tmp441 * _tmp58 + _tmp443 * _tmp49;
+  const Scalar _tmp462 = _tmp36 * _tmp437 + _tmp435 * _tmp49 + _tmp438 * _tmp58;
+  const Scalar _tmp463 = R(1, 0) * _tmp314 + R(2, 0) * _tmp315 + R(4, 0) * _tmp316;
+  const Scalar _tmp464 = _tmp36 * _tmp426 + _tmp424 * _tmp58 + _tmp425 * _tmp49;
+  const Scalar _tmp465 = -_tmp138 * _tmp454 - _tmp161 * _tmp456 - _tmp169 * _tmp455 + _tmp310;
+  const Scalar _tmp466 = _tmp36 * _tmp448 + _tmp450 * _tmp58 + _tmp451 * _tmp49;
+  const Scalar _tmp467 = _tmp36 * _tmp446 + _tmp447 * _tmp58 + _tmp448 * _tmp49;
+  const Scalar _tmp468 = _tmp36 * _tmp447 + _tmp450 * _tmp49 + _tmp453 * _tmp58;
+  const Scalar _tmp469 = _tmp449 * _tmp49;
+  const Scalar _tmp470 = _tmp452 * _tmp60;
+  const Scalar _tmp471 = _tmp33 * _tmp442 + _tmp441 * _tmp59 + _tmp443 * _tmp48;
+  const Scalar _tmp472 = _tmp33 * _tmp437 + _tmp435 * _tmp48 + _tmp438 * _tmp59;
+  const Scalar _tmp473 = _tmp33 * _tmp426 + _tmp424 * _tmp59 + _tmp425 * _tmp48;
+  const Scalar _tmp474 = _tmp107 * _tmp325 + _tmp175 * _tmp326 + _tmp184 * _tmp324;
+  const Scalar _tmp475 = _tmp100 * _tmp325 + _tmp174 * _tmp326 + _tmp183 * _tmp324;
+  const Scalar _tmp476 = _tmp177 * _tmp326 + _tmp185 * _tmp324 + _tmp325 * _tmp96;
+  const Scalar _tmp477 = -_tmp144 * _tmp474 - _tmp157 * _tmp475 - _tmp161 * _tmp476 + _tmp320;
+  const Scalar _tmp478 = -_tmp138 * _tmp474 - _tmp161 * _tmp475 - _tmp169 * _tmp476 + _tmp319;
+  const Scalar _tmp479 = -_tmp138 * _tmp476 - _tmp144 * _tmp475 - _tmp150 * _tmp474 + _tmp318;
+  const Scalar _tmp480 = R(1, 0) * _tmp325 + R(2, 0) * _tmp324 + R(4, 0) * _tmp326;
+  const Scalar _tmp481 = R(3, 0) * _tmp325 + R(4, 0) * _tmp324 + R(5, 0) * _tmp326;
+  const Scalar _tmp482 = R(0, 0) * _tmp325 + R(1, 0) * _tmp324 + R(3, 0) * _tmp326;
+  const Scalar _tmp483 = _tmp33 * _tmp445;
+  const Scalar _tmp484 = _tmp33 * _tmp446 + _tmp447 * _tmp59 + _tmp448 * _tmp48;
+  const Scalar _tmp485 = _tmp33 * _tmp447 + _tmp450 * _tmp48 + _tmp453 * _tmp59;
+  const Scalar _tmp486 = _tmp33 * _tmp448 + _tmp450 * _tmp59 + _tmp451 * _tmp48;
+  const Scalar _tmp487 = -_tmp107 * _tmp346 - _tmp175 * _tmp347 - _tmp184 * _tmp345 + 1;
+  const Scalar _tmp488 = _tmp100 * _tmp346 + _tmp174 * _tmp347 + _tmp183 * _tmp345;
+  const Scalar _tmp489 = _tmp177 * _tmp347 + _tmp185 * _tmp345 + _tmp346 * _tmp96;
+  const Scalar _tmp490 = _tmp138 * _tmp487 - _tmp161 * _tmp488 - _tmp169 * _tmp489;
+  const Scalar _tmp491 = R(3, 0) * _tmp346 + R(4, 0) * _tmp345 + R(5, 0) * _tmp347;
+  const Scalar _tmp492 = -_tmp138 * _tmp489 - _tmp144 * _tmp488 + _tmp150 * _tmp487;
+  const Scalar _tmp493 = R(0, 0) * _tmp346 + R(1, 0) * _tmp345 + R(3, 0) * _tmp347;
+  const Scalar _tmp494 = R(1, 0) * _tmp346 + R(2, 0) * _tmp345 + R(4, 0) * _tmp347;
+  const Scalar _tmp495 = _tmp144 * _tmp487 - _tmp157 * _tmp488 - _tmp161 * _tmp489;
+  const Scalar _tmp496 = -_tmp100 * _tmp351 - _tmp174 * _tmp352 - _tmp183 * _tmp350 + 1;
+  const Scalar _tmp497 = _tmp177 * _tmp352 + _tmp185 * _tmp350 + _tmp351 * _tmp96;
+  const Scalar _tmp498 = _tmp107 * _tmp351 + _tmp175 * _tmp352 + _tmp184 * _tmp350;
+  const Scalar _tmp499 = -_tmp138 * _tmp497 + _tmp144 * _tmp496 - _tmp150 * _tmp498;
+  const Scalar _tmp500 = R(0, 0) * _tmp351 + R(1, 0) * _tmp350 + R(3, 0) * _tmp352;
+  const Scalar _tmp501 = -_tmp138 * _tmp498 + _tmp161 * _tmp496 - _tmp169 * _tmp497;
+  const Scalar _tmp502 = R(3, 0) * _tmp351 + R(4, 0) * _tmp350 + R(5, 0) * _tmp352;
+  const Scalar _tmp503 = -_tmp144 * _tmp498 + _tmp157 * _tmp496 - _tmp161 * _tmp497;
+  const Scalar _tmp504 = R(1, 0) * _tmp351 + R(2, 0) * _tmp350 + R(4, 0) * _tmp352;
+  const Scalar _tmp505 = R(0, 0) * _tmp355 + R(1, 0) * _tmp357 + R(3, 0) * _tmp356;
+  const Scalar _tmp506 = R(3, 0) * _tmp355 + R(4, 0) * _tmp357 + R(5, 0) * _tmp356;
+  const Scalar _tmp507 = -_tmp177 * _tmp356 - _tmp185 * _tmp357 - _tmp355 * _tmp96 + 1;
+  const Scalar _tmp508 = _tmp100 * _tmp355 + _tmp174 * _tmp356 + _tmp183 * _tmp357;
+  const Scalar _tmp509 = _tmp107 * _tmp355 + _tmp175 * _tmp356 + _tmp184 * _tmp357;
+  const Scalar _tmp510 = _tmp138 * _tmp507 - _tmp144 * _tmp508 - _tmp150 * _tmp509;
+  const Scalar _tmp511 = -_tmp138 * _tmp509 - _tmp161 * _tmp508 + _tmp169 * _tmp507;
+  const Scalar _tmp512 = R(1, 0) * _tmp355 + R(2, 0) * _tmp357 + R(4, 0) * _tmp356;
+  const Scalar _tmp513 = -_tmp144 * _tmp509 - _tmp157 * _tmp508 + _tmp161 * _tmp507;
+
+  // Output terms (3)
+  if (nom != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _nom = (*nom);
+
+    _nom(0, 0) = -_tmp16 * _tmp251 + _tmp252 * _tmp90 + _tmp253 * _tmp93 + _tmp254 * _tmp92;
+    _nom(1, 0) = _tmp16 * _tmp253 + _tmp251 * _tmp93 + _tmp252 * _tmp92 - _tmp254 * _tmp90;
+    _nom(2, 0) = _tmp16 * _tmp252 + _tmp251 * _tmp90 - _tmp253 * _tmp92 + _tmp254 * _tmp93;
+    _nom(3, 0) = -_tmp16 * _tmp254 - _tmp251 * _tmp92 + _tmp252 * _tmp93 - _tmp253 * _tmp90;
+    _nom(4, 0) = _tmp100 * _tmp332 + _tmp107 * _tmp339 + _tmp207 * _tmp272 + _tmp210 * _tmp266 +
+                 _tmp212 * _tmp267 + _tmp343 * _tmp96 + dt * gravity(0, 0) + state(4, 0);
+    _nom(5, 0) = _tmp183 * _tmp332 + _tmp184 * _tmp339 + _tmp185 * _tmp343 + _tmp19 * _tmp272 +
+                 _tmp266 * _tmp46 + _tmp267 * _tmp57 + dt * gravity(1, 0) + state(5, 0);
+    _nom(6, 0) = _tmp174 * _tmp332 + _tmp175 * _tmp339 + _tmp177 * _tmp343 + _tmp215 * _tmp272 +
+                 _tmp216 * _tmp266 + _tmp217 * _tmp267 + dt * gravity(2, 0) + state(6, 0);
+    _nom(7, 0) = _tmp100 * _tmp359 + _tmp107 * _tmp361 + _tmp213 + _tmp360 * _tmp96;
+    _nom(8, 0) = _tmp183 * _tmp359 + _tmp184 * _tmp361 + _tmp185 * _tmp360 + _tmp63;
+    _nom(9, 0) = _tmp174 * _tmp359 + _tmp175 * _tmp361 + _tmp177 * _tmp360 + _tmp218;
+  }
+
+  if (err_cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _err_cov = (*err_cov);
+
+    _err_cov(0, 0) =
+        -_tmp225 * _tmp376 - _tmp226 * _tmp362 - _tmp227 * _tmp375 +
+        _tmp231 * (R(1, 0) * _tmp232 + R(2, 0) * _tmp231 + R(4, 0) * _tmp233) +
+        _tmp232 * (R(0, 0) * _tmp232 + R(1, 0) * _tmp231 + R(3, 0) * _tmp233) +
+        _tmp233 * (R(3, 0) * _tmp232 + R(4, 0) * _tmp231 + R(5, 0) * _tmp233) +
+        _tmp27 * (_tmp27 * state(12, 0) + _tmp52 * state(14, 0) + _tmp60 * state(11, 0)) -
+        _tmp362 * (-_tmp138 * _tmp376 - _tmp144 * _tmp375 - _tmp150 * _tmp362 + _tmp226) +
+        std::pow(_tmp373, Scalar(2)) * _tmp374 -
+        _tmp375 * (-_tmp144 * _tmp362 - _tmp157 * _tmp375 - _tmp161 * _tmp376 + _tmp227) -
+        _tmp376 * (-_tmp138 * _tmp362 - _tmp161 * _tmp375 - _tmp169 * _tmp376 + _tmp225) +
+        std::pow(_tmp379, Scalar(2)) * _tmp380 + std::pow(_tmp383, Scalar(2)) * _tmp384 +
+        _tmp52 * (_tmp27 * state(14, 0) + _tmp52 * state(15, 0) + _tmp60 * state(13, 0)) +
+        _tmp60 * (_tmp27 * state(11, 0) + _tmp52 * state(13, 0) + _tmp60 * state(10, 0));
+    _err_cov(1, 0) = -_tmp225 * _tmp387 - _tmp226 * _tmp399 - _tmp227 * _tmp400 +
+                     _tmp231 * _tmp388 + _tmp232 * _tmp385 + _tmp233 * _tmp393 + _tmp27 * _tmp404 -
+                     _tmp362 * _tmp402 + _tmp373 * _tmp374 * _tmp392 - _tmp375 * _tmp403 -
+                     _tmp376 * _tmp401 + _tmp379 * _tmp395 + _tmp386 * _tmp60 + _tmp389 * _tmp52 +
+                     _tmp397 * _tmp398;
+    _err_cov(2, 0) = -_tmp104 * _tmp400 - _tmp111 * _tmp399 + _tmp201 * _tmp388 +
+                     _tmp206 * _tmp385 + _tmp222 * _tmp393 + _tmp36 * _tmp404 +
+                     _tmp374 * std::pow(_tmp392, Scalar(2)) +
+                     _tmp380 * std::pow(_tmp394, Scalar(2)) +
+                     _tmp384 * std::pow(_tmp397, Scalar(2)) + _tmp386 * _tmp58 - _tmp387 * _tmp401 -
+                     _tmp387 * _tmp88 + _tmp389 * _tmp49 - _tmp399 * _tmp402 - _tmp400 * _tmp403;
+    _err_cov(3, 0) = -_tmp225 * _tmp405 - _tmp226 * _tmp406 - _tmp227 * _tmp407 +
+                     _tmp231 * _tmp411 + _tmp232 * _tmp410 + _tmp233 * _tmp415 + _tmp27 * _tmp417 -
+                     _tmp362 * _tmp409 + _tmp373 * _tmp420 - _tmp375 * _tmp412 - _tmp376 * _tmp408 +
+                     _tmp379 * _tmp380 * _tmp413 + _tmp398 * _tmp414 + _tmp416 * _tmp60 +
+                     _tmp418 * _tmp52;
+    _err_cov(4, 0) = -_tmp104 * _tmp407 - _tmp111 * _tmp406 + _tmp201 * _tmp411 +
+                     _tmp206 * _tmp410 + _tmp222 * _tmp415 + _tmp36 * _tmp417 +
+                     _tmp384 * _tmp397 * _tmp414 - _tmp387 * _tmp408 + _tmp392 * _tmp420 +
+                     _tmp395 * _tmp413 - _tmp399 * _tmp409 - _tmp400 * _tmp412 - _tmp405 * _tmp88 +
+                     _tmp416 * _tmp58 + _tmp418 * _tmp49;
+    _err_cov(5, 0) = -_tmp236 * _tmp406 - _tmp237 * _tmp405 - _tmp238 * _tmp407 +
+                     _tmp242 * _tmp410 + _tmp243 * _tmp411 + _tmp244 * _tmp415 + _tmp33 * _tmp417 +
+                     _tmp374 * std::pow(_tmp419, Scalar(2)) +
+                     _tmp380 * std::pow(_tmp413, Scalar(2)) +
+                     _tmp384 * std::pow(_tmp414, Scalar(2)) - _tmp405 * _tmp408 -
+                     _tmp406 * _tmp409 - _tmp407 * _tmp412 + _tmp416 * _tmp59 + _tmp418 * _tmp48;
+    _err_cov(6, 0) = -_tmp225 * _tmp428 - _tmp226 * _tmp430 - _tmp227 * _tmp429 +
+                     _tmp231 * _tmp440 + _tmp232 * _tmp421 + _tmp233 * _tmp432 + _tmp27 * _tmp439 -
+                     _tmp362 * _tmp433 - _tmp375 * _tmp431 - _tmp376 * _tmp434 + _tmp427 * _tmp60 +
+                     _tmp444 * _tmp52;
+    _err_cov(7, 0) = -_tmp104 * _tmp429 - _tmp111 * _tmp430 + _tmp201 * _tmp440 +
+                     _tmp206 * _tmp421 + _tmp222 * _tmp432 + _tmp36 * _tmp439 - _tmp387 * _tmp434 -
+                     _tmp399 * _tmp433 - _tmp400 * _tmp431 + _tmp427 * _tmp58 - _tmp428 * _tmp88 +
+                     _tmp444 * _tmp49;
+    _err_cov(8, 0) = -_tmp236 * _tmp430 - _tmp237 * _tmp428 - _tmp238 * _tmp429 +
+                     _tmp242 * _tmp421 + _tmp243 * _tmp440 + _tmp244 * _tmp432 + _tmp33 * _tmp439 -
+                     _tmp405 * _tmp434 - _tmp406 * _tmp433 - _tmp407 * _tmp431 + _tmp427 * _tmp59 +
+                     _tmp444 * _tmp48;
+    _err_cov(9, 0) = _tmp145 * _tmp445 + _tmp147 * _tmp449 + _tmp148 * _tmp452 +
+                     _tmp27 * (_tmp27 * _tmp446 + _tmp447 * _tmp60 + _tmp448 * _tmp52) -
+                     _tmp287 * _tmp429 - _tmp291 * _tmp430 - _tmp296 * _tmp428 + _tmp300 * _tmp421 +
+                     _tmp301 * _tmp440 + _tmp302 * _tmp432 - _tmp428 * _tmp434 - _tmp429 * _tmp431 -
+                     _tmp430 * _tmp433 +
+                     _tmp52 * (_tmp27 * _tmp448 + _tmp450 * _tmp60 + _tmp451 * _tmp52) +
+                     _tmp60 * (_tmp27 * _tmp447 + _tmp450 * _tmp52 + _tmp453 * _tmp60);
+    _err_cov(10, 0) = -_tmp225 * _tmp455 - _tmp226 * _tmp454 - _tmp227 * _tmp456 +
+                      _tmp231 * _tmp463 + _tmp232 * _tmp460 + _tmp233 * _tmp459 + _tmp27 * _tmp462 -
+                      _tmp362 * _tmp458 - _tmp375 * _tmp457 - _tmp376 * _tmp465 + _tmp461 * _tmp52 +
+                      _tmp464 * _tmp60;
+    _err_cov(11, 0) = -_tmp104 * _tmp456 - _tmp111 * _tmp454 + _tmp201 * _tmp463 +
+                      _tmp206 * _tmp460 + _tmp222 * _tmp459 + _tmp36 * _tmp462 - _tmp387 * _tmp465 -
+                      _tmp399 * _tmp458 - _tmp400 * _tmp457 - _tmp455 * _tmp88 + _tmp461 * _tmp49 +
+                      _tmp464 * _tmp58;
+    _err_cov(12, 0) = -_tmp236 * _tmp454 - _tmp237 * _tmp455 - _tmp238 * _tmp456 +
+                      _tmp242 * _tmp460 + _tmp243 * _tmp463 + _tmp244 * _tmp459 + _tmp33 * _tmp462 -
+                      _tmp405 * _tmp465 - _tmp406 * _tmp458 - _tmp407 * _tmp457 + _tmp461 * _tmp48 +
+                      _tmp464 * _tmp59;
+    _err_cov(13, 0) = _tmp143 * _tmp445 + _tmp27 * _tmp467 - _tmp287 * _tmp456 - _tmp291 * _tmp454 -
+                      _tmp296 * _tmp455 + _tmp300 * _tmp460 + _tmp301 * _tmp463 +
+                      _tmp302 * _tmp459 - _tmp428 * _tmp465 - _tmp429 * _tmp457 -
+                      _tmp430 * _tmp458 + _tmp466 * _tmp52 + _tmp468 * _tmp60 + _tmp469 * _tmp52 +
+                      _tmp470 * _tmp58;
+    _err_cov(14, 0) = _tmp152 * _tmp452 + _tmp154 * _tmp445 + _tmp156 * _tmp449 -
+                      _tmp307 * _tmp456 - _tmp308 * _tmp454 - _tmp310 * _tmp455 +
+                      _tmp314 * _tmp460 + _tmp315 * _tmp463 + _tmp316 * _tmp459 + _tmp36 * _tmp467 -
+                      _tmp454 * _tmp458 - _tmp455 * _tmp465 - _tmp456 * _tmp457 + _tmp466 * _tmp49 +
+                      _tmp468 * _tmp58;
+    _err_cov(15, 0) = -_tmp225 * _tmp476 - _tmp226 * _tmp474 - _tmp227 * _tmp475 +
+                      _tmp231 * _tmp480 + _tmp232 * _tmp482 + _tmp233 * _tmp481 + _tmp27 * _tmp472 -
+                      _tmp362 * _tmp479 - _tmp375 * _tmp477 - _tmp376 * _tmp478 + _tmp471 * _tmp52 +
+                      _tmp473 * _tmp60;
+    _err_cov(16, 0) = -_tmp104 * _tmp475 - _tmp111 * _tmp474 + _tmp201 * _tmp480 +
+                      _tmp206 * _tmp482 + _tmp222 * _tmp481 + _tmp36 * _tmp472 - _tmp387 * _tmp478 -
+                      _tmp399 * _tmp479 - _tmp400 * _tmp477 + _tmp471 * _tmp49 + _tmp473 * _tmp58 -
+                      _tmp476 * _tmp88;
+    _err_cov(17, 0) = -_tmp236 * _tmp474 - _tmp237 * _tmp476 - _tmp238 * _tmp475 +
+                      _tmp242 * _tmp482 + _tmp243 * _tmp480 + _tmp244 * _tmp481 + _tmp33 * _tmp472 -
+                      _tmp405 * _tmp478 - _tmp406 * _tmp479 - _tmp407 * _tmp477 + _tmp471 * _tmp48 +
+                      _tmp473 * _tmp59;
+    _err_cov(18, 0) = _tmp137 * _tmp449 + _tmp27 * _tmp483 + _tmp27 * _tmp484 - _tmp287 * _tmp475 -
+                      _tmp291 * _tmp474 - _tmp296 * _tmp476 + _tmp300 * _tmp482 +
+                      _tmp301 * _tmp480 + _tmp302 * _tmp481 - _tmp428 * _tmp478 -
+                      _tmp429 * _tmp477 - _tmp430 * _tmp479 + _tmp470 * _tmp59 + _tmp485 * _tmp60 +
+                      _tmp486 * _tmp52;
+    _err_cov(19, 0) = _tmp158 * _tmp452 - _tmp307 * _tmp475 - _tmp308 * _tmp474 -
+                      _tmp310 * _tmp476 + _tmp314 * _tmp482 + _tmp315 * _tmp480 +
+                      _tmp316 * _tmp481 + _tmp36 * _tmp483 + _tmp36 * _tmp484 - _tmp454 * _tmp479 -
+                      _tmp455 * _tmp478 - _tmp456 * _tmp477 + _tmp469 * _tmp48 + _tmp485 * _tmp58 +
+                      _tmp486 * _tmp49;
+    _err_cov(20, 0) = _tmp163 * _tmp449 + _tmp165 * _tmp452 + _tmp167 * _tmp445 -
+                      _tmp318 * _tmp474 - _tmp319 * _tmp476 - _tmp320 * _tmp475 +
+                      _tmp324 * _tmp480 + _tmp325 * _tmp482 + _tmp326 * _tmp481 + _tmp33 * _tmp484 -
+                      _tmp474 * _tmp479 - _tmp475 * _tmp477 - _tmp476 * _tmp478 + _tmp48 * _tmp486 +
+                      _tmp485 * _tmp59;
+    _err_cov(21, 0) = -_tmp225 * _tmp489 + _tmp226 * _tmp487 - _tmp227 * _tmp488 +
+                      _tmp231 * _tmp494 + _tmp232 * _tmp493 + _tmp233 * _tmp491 -
+                      _tmp362 * _tmp492 - _tmp375 * _tmp495 - _tmp376 * _tmp490;
+    _err_cov(22, 0) = -_tmp104 * _tmp488 + _tmp111 * _tmp487 + _tmp201 * _tmp494 +
+                      _tmp206 * _tmp493 + _tmp222 * _tmp491 - _tmp387 * _tmp490 -
+                      _tmp399 * _tmp492 - _tmp400 * _tmp495 - _tmp489 * _tmp88;
+    _err_cov(23, 0) = _tmp236 * _tmp487 - _tmp237 * _tmp489 - _tmp238 * _tmp488 +
+                      _tmp242 * _tmp493 + _tmp243 * _tmp494 + _tmp244 * _tmp491 -
+                      _tmp405 * _tmp490 - _tmp406 * _tmp492 - _tmp407 * _tmp495;
+    _err_cov(24, 0) = -_tmp287 * _tmp488 + _tmp291 * _tmp487 - _tmp296 * _tmp489 +
+                      _tmp300 * _tmp493 + _tmp301 * _tmp494 + _tmp302 * _tmp491 -
+                      _tmp428 * _tmp490 - _tmp429 * _tmp495 - _tmp430 * _tmp492;
+    _err_cov(25, 0) = -_tmp307 * _tmp488 + _tmp308 * _tmp487 - _tmp310 * _tmp489 +
+                      _tmp314 * _tmp493 + _tmp315 * _tmp494 + _tmp316 * _tmp491 -
+                      _tmp454 * _tmp492 - _tmp455 * _tmp490 - _tmp456 * _tmp495;
+    _err_cov(26, 0) = _tmp318 * _tmp487 - _tmp319 * _tmp489 - _tmp320 * _tmp488 +
+                      _tmp324 * _tmp494 + _tmp325 * _tmp493 + _tmp326 * _tmp491 -
+                      _tmp474 * _tmp492 - _tmp475 * _tmp495 - _tmp476 * _tmp490;
+    _err_cov(27, 0) = _tmp345 * _tmp494 + _tmp346 * _tmp493 + _tmp347 * _tmp491 +
+                      _tmp487 * _tmp492 - _tmp488 * _tmp495 - _tmp489 * _tmp490;
+    _err_cov(28, 0) = -_tmp225 * _tmp497 - _tmp226 * _tmp498 + _tmp227 * _tmp496 +
+                      _tmp231 * _tmp504 + _tmp232 * _tmp500 + _tmp233 * _tmp502 -
+                      _tmp362 * _tmp499 - _tmp375 * _tmp503 - _tmp376 * _tmp501;
+    _err_cov(29, 0) = _tmp104 * _tmp496 - _tmp111 * _tmp498 + _tmp201 * _tmp504 +
+                      _tmp206 * _tmp500 + _tmp222 * _tmp502 - _tmp387 * _tmp501 -
+                      _tmp399 * _tmp499 - _tmp400 * _tmp503 - _tmp497 * _tmp88;
+    _err_cov(30, 0) = -_tmp236 * _tmp498 - _tmp237 * _tmp497 + _tmp238 * _tmp496 +
+                      _tmp242 * _tmp500 + _tmp243 * _tmp504 + _tmp244 * _tmp502 -
+                      _tmp405 * _tmp501 - _tmp406 * _tmp499 - _tmp407 * _tmp503;
+    _err_cov(31, 0) = _tmp287 * _tmp496 - _tmp291 * _tmp498 - _tmp296 * _tmp497 +
+                      _tmp300 * _tmp500 + _tmp301 * _tmp504 + _tmp302 * _tmp502 -
+                      _tmp428 * _tmp501 - _tmp429 * _tmp503 - _tmp430 * _tmp499;
+    _err_cov(32, 0) = _tmp307 * _tmp496 - _tmp308 * _tmp498 - _tmp310 * _tmp497 +
+                      _tmp314 * _tmp500 + _tmp315 * _tmp504 + _tmp316 * _tmp502 -
+                      _tmp454 * _tmp499 - _tmp455 * _tmp501 - _tmp456 * _tmp503;
+    _err_cov(33, 0) = -_tmp318 * _tmp498 - _tmp319 * _tmp497 + _tmp320 * _tmp496 +
+                      _tmp324 * _tmp504 + _tmp325 * _tmp500 + _tmp326 * _tmp502 -
+                      _tmp474 * _tmp499 - _tmp475 * _tmp503 - _tmp476 * _tmp501;
+    _err_cov(34, 0) = _tmp345 * _tmp504 + _tmp346 * _tmp500 + _tmp347 * _tmp502 +
+                      _tmp487 * _tmp499 - _tmp488 * _tmp503 - _tmp489 * _tmp501;
+    _err_cov(35, 0) = _tmp350 * _tmp504 + _tmp351 * _tmp500 + _tmp352 * _tmp502 +
+                      _tmp496 * _tmp503 - _tmp497 * _tmp501 - _tmp498 * _tmp499;
+    _err_cov(36, 0) = _tmp225 * _tmp507 - _tmp226 * _tmp509 - _tmp227 * _tmp508 +
+                      _tmp231 * _tmp512 + _tmp232 * _tmp505 + _tmp233 * _tmp506 -
+                      _tmp362 * _tmp510 - _tmp375 * _tmp513 - _tmp376 * _tmp511;
+    _err_cov(37, 0) = -_tmp104 * _tmp508 - _tmp111 * _tmp509 + _tmp201 * _tmp512 +
+                      _tmp206 * _tmp505 + _tmp222 * _tmp506 - _tmp387 * _tmp511 -
+                      _tmp399 * _tmp510 - _tmp400 * _tmp513 + _tmp507 * _tmp88;
+    _err_cov(38, 0) = -_tmp236 * _tmp509 + _tmp237 * _tmp507 - _tmp238 * _tmp508 +
+                      _tmp242 * _tmp505 + _tmp243 * _tmp512 + _tmp244 * _tmp506 -
+                      _tmp405 * _tmp511 - _tmp406 * _tmp510 - _tmp407 * _tmp513;
+    _err_cov(39, 0) = -_tmp287 * _tmp508 - _tmp291 * _tmp509 + _tmp296 * _tmp507 +
+                      _tmp300 * _tmp505 + _tmp301 * _tmp512 + _tmp302 * _tmp506 -
+                      _tmp428 * _tmp511 - _tmp429 * _tmp513 - _tmp430 * _tmp510;
+    _err_cov(40, 0) = -_tmp307 * _tmp508 - _tmp308 * _tmp509 + _tmp310 * _tmp507 +
+                      _tmp314 * _tmp505 + _tmp315 * _tmp512 + _tmp316 * _tmp506 -
+                      _tmp454 * _tmp510 - _tmp455 * _tmp511 - _tmp456 * _tmp513;
+    _err_cov(41, 0) = -_tmp318 * _tmp509 + _tmp319 * _tmp507 - _tmp320 * _tmp508 +
+                      _tmp324 * _tmp512 + _tmp325 * _tmp505 + _tmp326 * _tmp506 -
+                      _tmp474 * _tmp510 - _tmp475 * _tmp513 - _tmp476 * _tmp511;
+    _err_cov(42, 0) = _tmp345 * _tmp512 + _tmp346 * _tmp505 + _tmp347 * _tmp506 +
+                      _tmp487 * _tmp510 - _tmp488 * _tmp513 - _tmp489 * _tmp511;
+    _err_cov(43, 0) = _tmp350 * _tmp512 + _tmp351 * _tmp505 + _tmp352 * _tmp506 +
+                      _tmp496 * _tmp513 - _tmp497 * _tmp511 - _tmp498 * _tmp510;
+    _err_cov(44, 0) = _tmp355 * _tmp505 + _tmp356 * _tmp506 + _tmp357 * _tmp512 +
+                      _tmp507 * _tmp511 - _tmp508 * _tmp513 - _tmp509 * _tmp510;
+  }
+
+  if (imu_bias != nullptr) {
+    Eigen::Matrix<Scalar, 6, 1>& _imu_bias = (*imu_bias);
+
+    _imu_bias(0, 0) = state(55, 0);
+    _imu_bias(1, 0) = state(56, 0);
+    _imu_bias(2, 0) = state(57, 0);
+    _imu_bias(3, 0) = state(58, 0);
+    _imu_bias(4, 0) = state(59, 0);
+    _imu_bias(5, 0) = state(60, 0);
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -0,0 +1,478 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     state: Matrix61_1
+ *     z: Matrix31
+ *     R: Matrix61
+ *
+ * Outputs:
+ *     nom: Matrix10_1
+ *     err_cov: Matrix45_1
+ *     imu_bias: Matrix61
+ */
+template <typename Scalar>
+void EskfUpdatePosition(const Eigen::Matrix<Scalar, 61, 1>& state,
+                        const Eigen::Matrix<Scalar, 3, 1>& z, const Eigen::Matrix<Scalar, 6, 1>& R,
+                        Eigen::Matrix<Scalar, 10, 1>* const nom = nullptr,
+                        Eigen::Matrix<Scalar, 45, 1>* const err_cov = nullptr,
+                        Eigen::Matrix<Scalar, 6, 1>* const imu_bias = nullptr) {
+  // Total ops: 1777
+
+  // Input arrays
+
+  // Intermediate terms (228)
+  const Scalar _tmp0 = -state(7, 0) + z(0, 0);
+  const Scalar _tmp1 = 2 * state(0, 0) * state(1, 0);
+  const Scalar _tmp2 = 2 * state(3, 0);
+  const Scalar _tmp3 = _tmp2 * state(2, 0);
+  const Scalar _tmp4 = _tmp1 - _tmp3;
+  const Scalar _tmp5 = _tmp2 * state(1, 0);
+  const Scalar _tmp6 = 2 * state(2, 0);
+  const Scalar _tmp7 = _tmp6 * state(0, 0);
+  const Scalar _tmp8 = _tmp5 + _tmp7;
+  const Scalar _tmp9 = -2 * std::pow(state(1, 0), Scalar(2));
+  const Scalar _tmp10 = 1 - 2 * std::pow(state(2, 0), Scalar(2));
+  const Scalar _tmp11 = _tmp10 + _tmp9;
+  const Scalar _tmp12 = _tmp11 * state(44, 0) + _tmp4 * state(45, 0) + _tmp8 * state(53, 0);
+  const Scalar _tmp13 = _tmp11 * state(37, 0) + _tmp4 * state(44, 0) + _tmp8 * state(52, 0);
+  const Scalar _tmp14 = _tmp11 * state(52, 0) + _tmp4 * state(53, 0) + _tmp8 * state(54, 0);
+  const Scalar _tmp15 = Scalar(1.0) / (R(0, 0) + _tmp11 * _tmp13 + _tmp12 * _tmp4 + _tmp14 * _tmp8);
+  const Scalar _tmp16 = -2 * std::pow(state(0, 0), Scalar(2));
+  const Scalar _tmp17 = _tmp10 + _tmp16;
+  const Scalar _tmp18 = _tmp1 + _tmp3;
+  const Scalar _tmp19 = _tmp6 * state(1, 0);
+  const Scalar _tmp20 = _tmp2 * state(0, 0);
+  const Scalar _tmp21 = _tmp19 - _tmp20;
+  const Scalar _tmp22 = _tmp15 * (R(1, 0) + _tmp12 * _tmp17 + _tmp13 * _tmp18 + _tmp14 * _tmp21);
+  const Scalar _tmp23 = _tmp17 * state(44, 0) + _tmp18 * state(37, 0) + _tmp21 * state(52, 0);
+  const Scalar _tmp24 = _tmp17 * state(53, 0) + _tmp18 * state(52, 0) + _tmp21 * state(54, 0);
+  const Scalar _tmp25 = _tmp17 * state(45, 0) + _tmp18 * state(44, 0) + _tmp21 * state(53, 0);
+  const Scalar _tmp26 = R(1, 0) + _tmp11 * _tmp23 + _tmp24 * _tmp8 + _tmp25 * _tmp4;
+  const Scalar _tmp27 = Scalar(1.0) / (R(2, 0) + _tmp17 * _tmp25 + _tmp18 * _tmp23 +
+                                       _tmp21 * _tmp24 - _tmp22 * _tmp26);
+  const Scalar _tmp28 = _tmp19 + _tmp20;
+  const Scalar _tmp29 = -_tmp5 + _tmp7;
+  const Scalar _tmp30 = _tmp16 + _tmp9 + 1;
+  const Scalar _tmp31 = _tmp15 * (R(3, 0) + _tmp12 * _tmp28 + _tmp13 * _tmp29 + _tmp14 * _tmp30);
+  const Scalar _tmp32 =
+      R(4, 0) + _tmp23 * _tmp29 + _tmp24 * _tmp30 + _tmp25 * _tmp28 - _tmp26 * _tmp31;
+  const Scalar _tmp33 = _tmp27 * _tmp32;
+  const Scalar _tmp34 = _tmp22 * _tmp33 - _tmp31;
+  const Scalar _tmp35 = _tmp28 * state(53, 0) + _tmp29 * state(52, 0) + _tmp30 * state(54, 0);
+  const Scalar _tmp36 = _tmp28 * state(45, 0) + _tmp29 * state(44, 0) + _tmp30 * state(53, 0);
+  const Scalar _tmp37 = _tmp28 * state(44, 0) + _tmp29 * state(37, 0) + _tmp30 * state(52, 0);
+  const Scalar _tmp38 = R(3, 0) + _tmp11 * _tmp37 + _tmp35 * _tmp8 + _tmp36 * _tmp4;
+  const Scalar _tmp39 =
+      R(4, 0) + _tmp17 * _tmp36 + _tmp18 * _tmp37 + _tmp21 * _tmp35 - _tmp22 * _tmp38;
+  const Scalar _tmp40 = _tmp27 * _tmp39;
+  const Scalar _tmp41 = _tmp32 * _tmp40;
+  const Scalar _tmp42 = Scalar(1.0) / (R(5, 0) + _tmp28 * _tmp36 + _tmp29 * _tmp37 +
+                                       _tmp30 * _tmp35 - _tmp31 * _tmp38 - _tmp41);
+  const Scalar _tmp43 =
+      _tmp42 * (_tmp28 * state(40, 0) + _tmp29 * state(33, 0) + _tmp30 * state(48, 0));
+  const Scalar _tmp44 = _tmp17 * state(40, 0) + _tmp18 * state(33, 0) + _tmp21 * state(48, 0);
+  const Scalar _tmp45 = _tmp27 * (-_tmp22 - _tmp34 * _tmp39 * _tmp42);
+  const Scalar _tmp46 = _tmp11 * state(33, 0) + _tmp4 * state(40, 0) + _tmp8 * state(48, 0);
+  const Scalar _tmp47 = _tmp38 * _tmp42;
+  const Scalar _tmp48 = _tmp15 * (-_tmp26 * _tmp45 - _tmp34 * _tmp47 + 1);
+  const Scalar _tmp49 = _tmp34 * _tmp43 + _tmp44 * _tmp45 + _tmp46 * _tmp48;
+  const Scalar _tmp50 = _tmp40 * _tmp42;
+  const Scalar _tmp51 = _tmp15 * (_tmp26 * _tmp50 - _tmp47);
+  const Scalar _tmp52 = _tmp43 - _tmp44 * _tmp50 + _tmp46 * _tmp51;
+  const Scalar _tmp53 = -state(9, 0) + z(2, 0);
+  const Scalar _tmp54 = -state(8, 0) + z(1, 0);
+  const Scalar _tmp55 = _tmp27 * (_tmp41 * _tmp42 + 1);
+  const Scalar _tmp56 = _tmp15 * (-_tmp26 * _tmp55 + _tmp33 * _tmp47);
+  const Scalar _tmp57 = -_tmp33 * _tmp43 + _tmp44 * _tmp55 + _tmp46 * _tmp56;
+  const Scalar _tmp58 = _tmp0 * _tmp49 + _tmp52 * _tmp53 + _tmp54 * _tmp57;
+  const Scalar _tmp59 = std::pow(_tmp58, Scalar(2));
+  const Scalar _tmp60 = _tmp17 * state(38, 0) + _tmp18 * state(31, 0) + _tmp21 * state(46, 0);
+  const Scalar _tmp61 =
+      _tmp42 * (_tmp28 * state(38, 0) + _tmp29 * state(31, 0) + _tmp30 * state(46, 0));
+  const Scalar _tmp62 = _tmp11 * state(31, 0) + _tmp4 * state(38, 0) + _tmp8 * state(46, 0);
+  const Scalar _tmp63 = _tmp34 * _tmp61 + _tmp45 * _tmp60 + _tmp48 * _tmp62;
+  const Scalar _tmp64 = -_tmp33 * _tmp61 + _tmp55 * _tmp60 + _tmp56 * _tmp62;
+  const Scalar _tmp65 = -_tmp50 * _tmp60 + _tmp51 * _tmp62 + _tmp61;
+  const Scalar _tmp66 = _tmp0 * _tmp63 + _tmp53 * _tmp65 + _tmp54 * _tmp64;
+  const Scalar _tmp67 = std::pow(_tmp66, Scalar(2));
+  const Scalar _tmp68 =
+      _tmp42 * (_tmp28 * state(39, 0) + _tmp29 * state(32, 0) + _tmp30 * state(47, 0));
+  const Scalar _tmp69 = _tmp11 * state(32, 0) + _tmp4 * state(39, 0) + _tmp8 * state(47, 0);
+  const Scalar _tmp70 = _tmp17 * state(39, 0) + _tmp18 * state(32, 0) + _tmp21 * state(47, 0);
+  const Scalar _tmp71 = -_tmp33 * _tmp68 + _tmp55 * _tmp70 + _tmp56 * _tmp69;
+  const Scalar _tmp72 = -_tmp50 * _tmp70 + _tmp51 * _tmp69 + _tmp68;
+  const Scalar _tmp73 = _tmp34 * _tmp68 + _tmp45 * _tmp70 + _tmp48 * _tmp69;
+  const Scalar _tmp74 = _tmp0 * _tmp73 + _tmp53 * _tmp72 + _tmp54 * _tmp71;
+  const Scalar _tmp75 = std::pow(_tmp74, Scalar(2));
+  const Scalar _tmp76 = _tmp59 + _tmp67 + _tmp75 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp77 = std::sqrt(_tmp76);
+  const Scalar _tmp78 = (Scalar(1) / Scalar(2)) * _tmp77;
+  const Scalar _tmp79 = std::cos(_tmp78);
+  const Scalar _tmp80 = std::sin(_tmp78) / _tmp77;
+  const Scalar _tmp81 = _tmp66 * _tmp80;
+  const Scalar _tmp82 = _tmp74 * _tmp80;
+  const Scalar _tmp83 = _tmp58 * _tmp80;
+  const Scalar _tmp84 = _tmp11 * state(34, 0) + _tmp4 * state(41, 0) + _tmp8 * state(49, 0);
+  const Scalar _tmp85 =
+      _tmp42 * (_tmp28 * state(41, 0) + _tmp29 * state(34, 0) + _tmp30 * state(49, 0));
+  const Scalar _tmp86 = _tmp17 * state(41, 0) + _tmp18 * state(34, 0) + _tmp21 * state(49, 0);
+  const Scalar _tmp87 = -_tmp33 * _tmp85 + _tmp55 * _tmp86 + _tmp56 * _tmp84;
+  const Scalar _tmp88 = -_tmp50 * _tmp86 + _tmp51 * _tmp84 + _tmp85;
+  const Scalar _tmp89 = _tmp34 * _tmp85 + _tmp45 * _tmp86 + _tmp48 * _tmp84;
+  const Scalar _tmp90 = _tmp0 * _tmp89 + _tmp53 * _tmp88 + _tmp54 * _tmp87;
+  const Scalar _tmp91 = std::pow(_tmp76, Scalar(2));
+  const Scalar _tmp92 = Scalar(0.050000000000000003) - _tmp77;
+  const Scalar _tmp93 = std::max<Scalar>(0, (((_tmp92) > 0) - ((_tmp92) < 0)));
+  const Scalar _tmp94 = _tmp77 + _tmp92 * _tmp93;
+  const Scalar _tmp95 = (_tmp94 - std::sin(_tmp94)) / [&]() {
+    const Scalar base = _tmp94;
+    return base * base * base;
+  }();
+  const Scalar _tmp96 =
+      _tmp93 * (-Scalar(0.0083333333333333332) * _tmp76 + Scalar(0.00019841269841269841) * _tmp91 -
+                _tmp95 + Scalar(0.16666666666666666)) +
+      _tmp95;
+  const Scalar _tmp97 = -_tmp59 * _tmp96;
+  const Scalar _tmp98 = -_tmp75 * _tmp96 + 1;
+  const Scalar _tmp99 = _tmp97 + _tmp98;
+  const Scalar _tmp100 = _tmp11 * state(36, 0) + _tmp4 * state(43, 0) + _tmp8 * state(51, 0);
+  const Scalar _tmp101 =
+      _tmp42 * (_tmp28 * state(43, 0) + _tmp29 * state(36, 0) + _tmp30 * state(51, 0));
+  const Scalar _tmp102 = _tmp17 * state(43, 0) + _tmp18 * state(36, 0) + _tmp21 * state(51, 0);
+  const Scalar _tmp103 = _tmp100 * _tmp56 - _tmp101 * _tmp33 + _tmp102 * _tmp55;
+  const Scalar _tmp104 = _tmp100 * _tmp51 + _tmp101 - _tmp102 * _tmp50;
+  const Scalar _tmp105 = _tmp100 * _tmp48 + _tmp101 * _tmp34 + _tmp102 * _tmp45;
+  const Scalar _tmp106 = _tmp0 * _tmp105 + _tmp103 * _tmp54 + _tmp104 * _tmp53;
+  const Scalar _tmp107 = (1 - std::cos(_tmp94)) / std::pow(_tmp94, Scalar(2));
+  const Scalar _tmp108 = _tmp107 + _tmp93 * (-_tmp107 - Scalar(0.041666666666666664) * _tmp76 +
+                                             Scalar(0.0013888888888888889) * _tmp91 + Scalar(0.5));
+  const Scalar _tmp109 = _tmp108 * _tmp74;
+  const Scalar _tmp110 = _tmp58 * _tmp66 * _tmp96;
+  const Scalar _tmp111 = _tmp109 + _tmp110;
+  const Scalar _tmp112 = _tmp74 * _tmp96;
+  const Scalar _tmp113 = _tmp112 * _tmp66;
+  const Scalar _tmp114 = _tmp108 * _tmp58;
+  const Scalar _tmp115 = _tmp113 - _tmp114;
+  const Scalar _tmp116 = _tmp17 * state(42, 0) + _tmp18 * state(35, 0) + _tmp21 * state(50, 0);
+  const Scalar _tmp117 =
+      _tmp42 * (_tmp28 * state(42, 0) + _tmp29 * state(35, 0) + _tmp30 * state(50, 0));
+  const Scalar _tmp118 = _tmp11 * state(35, 0) + _tmp4 * state(42, 0) + _tmp8 * state(50, 0);
+  const Scalar _tmp119 = -_tmp116 * _tmp50 + _tmp117 + _tmp118 * _tmp51;
+  const Scalar _tmp120 = _tmp116 * _tmp55 - _tmp117 * _tmp33 + _tmp118 * _tmp56;
+  const Scalar _tmp121 = _tmp116 * _tmp45 + _tmp117 * _tmp34 + _tmp118 * _tmp48;
+  const Scalar _tmp122 = _tmp0 * _tmp121 + _tmp119 * _tmp53 + _tmp120 * _tmp54;
+  const Scalar _tmp123 = _tmp106 * _tmp111 + _tmp115 * _tmp122 + _tmp90 * _tmp99;
+  const Scalar _tmp124 = -_tmp109 + _tmp110;
+  const Scalar _tmp125 = -_tmp67 * _tmp96;
+  const Scalar _tmp126 = _tmp125 + _tmp98;
+  const Scalar _tmp127 = _tmp112 * _tmp58;
+  const Scalar _tmp128 = _tmp108 * _tmp66;
+  const Scalar _tmp129 = _tmp127 + _tmp128;
+  const Scalar _tmp130 = _tmp106 * _tmp126 + _tmp122 * _tmp129 + _tmp124 * _tmp90;
+  const Scalar _tmp131 = _tmp113 + _tmp114;
+  const Scalar _tmp132 = _tmp127 - _tmp128;
+  const Scalar _tmp133 = _tmp125 + _tmp97 + 1;
+  const Scalar _tmp134 = _tmp106 * _tmp132 + _tmp122 * _tmp133 + _tmp131 * _tmp90;
+  const Scalar _tmp135 = _tmp35 * _tmp42;
+  const Scalar _tmp136 = -_tmp135 * _tmp33 + _tmp14 * _tmp56 + _tmp24 * _tmp55;
+  const Scalar _tmp137 = _tmp135 * _tmp34 + _tmp14 * _tmp48 + _tmp24 * _tmp45;
+  const Scalar _tmp138 = _tmp135 + _tmp14 * _tmp51 - _tmp24 * _tmp50;
+  const Scalar _tmp139 = _tmp0 * _tmp137 + _tmp136 * _tmp54 + _tmp138 * _tmp53;
+  const Scalar _tmp140 = _tmp37 * _tmp42;
+  const Scalar _tmp141 = _tmp13 * _tmp56 - _tmp140 * _tmp33 + _tmp23 * _tmp55;
+  const Scalar _tmp142 = _tmp13 * _tmp51 + _tmp140 - _tmp23 * _tmp50;
+  const Scalar _tmp143 = _tmp13 * _tmp48 + _tmp140 * _tmp34 + _tmp23 * _tmp45;
+  const Scalar _tmp144 = _tmp0 * _tmp143 + _tmp141 * _tmp54 + _tmp142 * _tmp53;
+  const Scalar _tmp145 = _tmp36 * _tmp42;
+  const Scalar _tmp146 = _tmp12 * _tmp51 + _tmp145 - _tmp25 * _tmp50;
+  const Scalar _tmp147 = _tmp12 * _tmp48 + _tmp145 * _tmp34 + _tmp25 * _tmp45;
+  const Scalar _tmp148 = _tmp12 * _tmp56 - _tmp145 * _tmp33 + _tmp25 * _tmp55;
+  const Scalar _tmp149 = _tmp0 * _tmp147 + _tmp146 * _tmp53 + _tmp148 * _tmp54;
+  const Scalar _tmp150 = _tmp124 * _tmp144 + _tmp126 * _tmp139 + _tmp129 * _tmp149;
+  const Scalar _tmp151 = _tmp111 * _tmp139 + _tmp115 * _tmp149 + _tmp144 * _tmp99;
+  const Scalar _tmp152 = _tmp131 * _tmp144 + _tmp132 * _tmp139 + _tmp133 * _tmp149;
+  const Scalar _tmp153 = _tmp11 * _tmp63 + _tmp18 * _tmp64 + _tmp29 * _tmp65;
+  const Scalar _tmp154 = _tmp17 * _tmp64 + _tmp28 * _tmp65 + _tmp4 * _tmp63;
+  const Scalar _tmp155 = _tmp21 * _tmp64 + _tmp30 * _tmp65 + _tmp63 * _tmp8;
+  const Scalar _tmp156 = _tmp17 * _tmp71 + _tmp28 * _tmp72 + _tmp4 * _tmp73;
+  const Scalar _tmp157 = _tmp11 * _tmp73 + _tmp18 * _tmp71 + _tmp29 * _tmp72;
+  const Scalar _tmp158 = _tmp21 * _tmp71 + _tmp30 * _tmp72 + _tmp73 * _tmp8;
+  const Scalar _tmp159 =
+      -_tmp156 * state(53, 0) - _tmp157 * state(52, 0) - _tmp158 * state(54, 0) + state(47, 0);
+  const Scalar _tmp160 =
+      -_tmp156 * state(44, 0) - _tmp157 * state(37, 0) - _tmp158 * state(52, 0) + state(32, 0);
+  const Scalar _tmp161 = R(0, 0) * _tmp73 + R(1, 0) * _tmp71 + R(3, 0) * _tmp72;
+  const Scalar _tmp162 = R(1, 0) * _tmp73 + R(2, 0) * _tmp71 + R(4, 0) * _tmp72;
+  const Scalar _tmp163 = R(3, 0) * _tmp73 + R(4, 0) * _tmp71 + R(5, 0) * _tmp72;
+  const Scalar _tmp164 =
+      -_tmp156 * state(45, 0) - _tmp157 * state(44, 0) - _tmp158 * state(53, 0) + state(39, 0);
+  const Scalar _tmp165 = R(1, 0) * _tmp49 + R(2, 0) * _tmp57 + R(4, 0) * _tmp52;
+  const Scalar _tmp166 = _tmp21 * _tmp57 + _tmp30 * _tmp52 + _tmp49 * _tmp8;
+  const Scalar _tmp167 = _tmp11 * _tmp49 + _tmp18 * _tmp57 + _tmp29 * _tmp52;
+  const Scalar _tmp168 = _tmp17 * _tmp57 + _tmp28 * _tmp52 + _tmp4 * _tmp49;
+  const Scalar _tmp169 =
+      -_tmp166 * state(52, 0) - _tmp167 * state(37, 0) - _tmp168 * state(44, 0) + state(33, 0);
+  const Scalar _tmp170 =
+      -_tmp166 * state(53, 0) - _tmp167 * state(44, 0) - _tmp168 * state(45, 0) + state(40, 0);
+  const Scalar _tmp171 = R(3, 0) * _tmp49 + R(4, 0) * _tmp57 + R(5, 0) * _tmp52;
+  const Scalar _tmp172 =
+      -_tmp166 * state(54, 0) - _tmp167 * state(52, 0) - _tmp168 * state(53, 0) + state(48, 0);
+  const Scalar _tmp173 = R(0, 0) * _tmp49 + R(1, 0) * _tmp57 + R(3, 0) * _tmp52;
+  const Scalar _tmp174 = R(0, 0) * _tmp89 + R(1, 0) * _tmp87 + R(3, 0) * _tmp88;
+  const Scalar _tmp175 = _tmp21 * _tmp87 + _tmp30 * _tmp88 + _tmp8 * _tmp89;
+  const Scalar _tmp176 = _tmp17 * _tmp87 + _tmp28 * _tmp88 + _tmp4 * _tmp89;
+  const Scalar _tmp177 = _tmp11 * _tmp89 + _tmp18 * _tmp87 + _tmp29 * _tmp88;
+  const Scalar _tmp178 =
+      -_tmp175 * state(53, 0) - _tmp176 * state(45, 0) - _tmp177 * state(44, 0) + state(41, 0);
+  const Scalar _tmp179 =
+      -_tmp175 * state(52, 0) - _tmp176 * state(44, 0) - _tmp177 * state(37, 0) + state(34, 0);
+  const Scalar _tmp180 =
+      -_tmp175 * state(54, 0) - _tmp176 * state(53, 0) - _tmp177 * state(52, 0) + state(49, 0);
+  const Scalar _tmp181 = R(3, 0) * _tmp89 + R(4, 0) * _tmp87 + R(5, 0) * _tmp88;
+  const Scalar _tmp182 = R(1, 0) * _tmp89 + R(2, 0) * _tmp87 + R(4, 0) * _tmp88;
+  const Scalar _tmp183 = _tmp119 * _tmp30 + _tmp120 * _tmp21 + _tmp121 * _tmp8;
+  const Scalar _tmp184 = _tmp119 * _tmp28 + _tmp120 * _tmp17 + _tmp121 * _tmp4;
+  const Scalar _tmp185 = R(0, 0) * _tmp121 + R(1, 0) * _tmp120 + R(3, 0) * _tmp119;
+  const Scalar _tmp186 = _tmp11 * _tmp121 + _tmp119 * _tmp29 + _tmp120 * _tmp18;
+  const Scalar _tmp187 =
+      -_tmp183 * state(52, 0) - _tmp184 * state(44, 0) - _tmp186 * state(37, 0) + state(35, 0);
+  const Scalar _tmp188 = R(3, 0) * _tmp121 + R(4, 0) * _tmp120 + R(5, 0) * _tmp119;
+  const Scalar _tmp189 = R(1, 0) * _tmp121 + R(2, 0) * _tmp120 + R(4, 0) * _tmp119;
+  const Scalar _tmp190 =
+      -_tmp183 * state(54, 0) - _tmp184 * state(53, 0) - _tmp186 * state(52, 0) + state(50, 0);
+  const Scalar _tmp191 =
+      -_tmp183 * state(53, 0) - _tmp184 * state(45, 0) - _tmp186 * state(44, 0) + state(42, 0);
+  const Scalar _tmp192 = R(1, 0) * _tmp105 + R(2, 0) * _tmp103 + R(4, 0) * _tmp104;
+  const Scalar _tmp193 = _tmp103 * _tmp18 + _tmp104 * _tmp29 + _tmp105 * _tmp11;
+  const Scalar _tmp194 = _tmp103 * _tmp17 + _tmp104 * _tmp28 + _tmp105 * _tmp4;
+  const Scalar _tmp195 = _tmp103 * _tmp21 + _tmp104 * _tmp30 + _tmp105 * _tmp8;
+  const Scalar _tmp196 =
+      -_tmp193 * state(44, 0) - _tmp194 * state(45, 0) - _tmp195 * state(53, 0) + state(43, 0);
+  const Scalar _tmp197 = R(3, 0) * _tmp105 + R(4, 0) * _tmp103 + R(5, 0) * _tmp104;
+  const Scalar _tmp198 =
+      -_tmp193 * state(37, 0) - _tmp194 * state(44, 0) - _tmp195 * state(52, 0) + state(36, 0);
+  const Scalar _tmp199 = R(0, 0) * _tmp105 + R(1, 0) * _tmp103 + R(3, 0) * _tmp104;
+  const Scalar _tmp200 =
+      -_tmp193 * state(52, 0) - _tmp194 * state(53, 0) - _tmp195 * state(54, 0) + state(51, 0);
+  const Scalar _tmp201 = -_tmp11 * _tmp143 - _tmp141 * _tmp18 - _tmp142 * _tmp29 + 1;
+  const Scalar _tmp202 = _tmp141 * _tmp21 + _tmp142 * _tmp30 + _tmp143 * _tmp8;
+  const Scalar _tmp203 = _tmp141 * _tmp17 + _tmp142 * _tmp28 + _tmp143 * _tmp4;
+  const Scalar _tmp204 = _tmp201 * state(44, 0) - _tmp202 * state(53, 0) - _tmp203 * state(45, 0);
+  const Scalar _tmp205 = R(0, 0) * _tmp143 + R(1, 0) * _tmp141 + R(3, 0) * _tmp142;
+  const Scalar _tmp206 = R(3, 0) * _tmp143 + R(4, 0) * _tmp141 + R(5, 0) * _tmp142;
+  const Scalar _tmp207 = R(1, 0) * _tmp143 + R(2, 0) * _tmp141 + R(4, 0) * _tmp142;
+  const Scalar _tmp208 = _tmp201 * state(37, 0) - _tmp202 * state(52, 0) - _tmp203 * state(44, 0);
+  const Scalar _tmp209 = _tmp201 * state(52, 0) - _tmp202 * state(54, 0) - _tmp203 * state(53, 0);
+  const Scalar _tmp210 = R(0, 0) * _tmp147 + R(1, 0) * _tmp148 + R(3, 0) * _tmp146;
+  const Scalar _tmp211 = -_tmp146 * _tmp28 - _tmp147 * _tmp4 - _tmp148 * _tmp17 + 1;
+  const Scalar _tmp212 = _tmp146 * _tmp30 + _tmp147 * _tmp8 + _tmp148 * _tmp21;
+  const Scalar _tmp213 = _tmp11 * _tmp147 + _tmp146 * _tmp29 + _tmp148 * _tmp18;
+  const Scalar _tmp214 = _tmp211 * state(44, 0) - _tmp212 * state(52, 0) - _tmp213 * state(37, 0);
+  const Scalar _tmp215 = _tmp211 * state(53, 0) - _tmp212 * state(54, 0) - _tmp213 * state(52, 0);
+  const Scalar _tmp216 = R(3, 0) * _tmp147 + R(4, 0) * _tmp148 + R(5, 0) * _tmp146;
+  const Scalar _tmp217 = _tmp211 * state(45, 0) - _tmp212 * state(53, 0) - _tmp213 * state(44, 0);
+  const Scalar _tmp218 = R(1, 0) * _tmp147 + R(2, 0) * _tmp148 + R(4, 0) * _tmp146;
+  const Scalar _tmp219 = R(3, 0) * _tmp137 + R(4, 0) * _tmp136 + R(5, 0) * _tmp138;
+  const Scalar _tmp220 = R(0, 0) * _tmp137 + R(1, 0) * _tmp136 + R(3, 0) * _tmp138;
+  const Scalar _tmp221 = R(1, 0) * _tmp137 + R(2, 0) * _tmp136 + R(4, 0) * _tmp138;
+  const Scalar _tmp222 = -_tmp136 * _tmp21 - _tmp137 * _tmp8 - _tmp138 * _tmp30 + 1;
+  const Scalar _tmp223 = _tmp11 * _tmp137 + _tmp136 * _tmp18 + _tmp138 * _tmp29;
+  const Scalar _tmp224 = _tmp136 * _tmp17 + _tmp137 * _tmp4 + _tmp138 * _tmp28;
+  const Scalar _tmp225 = _tmp222 * state(53, 0) - _tmp223 * state(44, 0) - _tmp224 * state(45, 0);
+  const Scalar _tmp226 = _tmp222 * state(54, 0) - _tmp223 * state(52, 0) - _tmp224 * state(53, 0);
+  const Scalar _tmp227 = _tmp222 * state(52, 0) - _tmp223 * state(37, 0) - _tmp224 * state(44, 0);
+
+  // Output terms (3)
+  if (nom != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _nom = (*nom);
+
+    _nom(0, 0) =
+        _tmp79 * state(0, 0) + _tmp81 * state(3, 0) - _tmp82 * state(2, 0) + _tmp83 * state(1, 0);
+    _nom(1, 0) =
+        _tmp79 * state(1, 0) + _tmp81 * state(2, 0) + _tmp82 * state(3, 0) - _tmp83 * state(0, 0);
+    _nom(2, 0) =
+        _tmp79 * state(2, 0) - _tmp81 * state(1, 0) + _tmp82 * state(0, 0) + _tmp83 * state(3, 0);
+    _nom(3, 0) =
+        _tmp79 * state(3, 0) - _tmp81 * state(0, 0) - _tmp82 * state(1, 0) - _tmp83 * state(2, 0);
+    _nom(4, 0) = _tmp11 * _tmp123 + _tmp130 * _tmp8 + _tmp134 * _tmp4 + state(4, 0);
+    _nom(5, 0) = _tmp123 * _tmp18 + _tmp130 * _tmp21 + _tmp134 * _tmp17 + state(5, 0);
+    _nom(6, 0) = _tmp123 * _tmp29 + _tmp130 * _tmp30 + _tmp134 * _tmp28 + state(6, 0);
+    _nom(7, 0) = _tmp11 * _tmp151 + _tmp150 * _tmp8 + _tmp152 * _tmp4 + state(7, 0);
+    _nom(8, 0) = _tmp150 * _tmp21 + _tmp151 * _tmp18 + _tmp152 * _tmp17 + state(8, 0);
+    _nom(9, 0) = _tmp150 * _tmp30 + _tmp151 * _tmp29 + _tmp152 * _tmp28 + state(9, 0);
+  }
+
+  if (err_cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _err_cov = (*err_cov);
+
+    _err_cov(0, 0) = -_tmp153 * state(31, 0) -
+                     _tmp153 * (-_tmp153 * state(37, 0) - _tmp154 * state(44, 0) -
+                                _tmp155 * state(52, 0) + state(31, 0)) -
+                     _tmp154 * state(38, 0) -
+                     _tmp154 * (-_tmp153 * state(44, 0) - _tmp154 * state(45, 0) -
+                                _tmp155 * state(53, 0) + state(38, 0)) -
+                     _tmp155 * state(46, 0) -
+                     _tmp155 * (-_tmp153 * state(52, 0) - _tmp154 * state(53, 0) -
+                                _tmp155 * state(54, 0) + state(46, 0)) +
+                     _tmp63 * (R(0, 0) * _tmp63 + R(1, 0) * _tmp64 + R(3, 0) * _tmp65) +
+                     _tmp64 * (R(1, 0) * _tmp63 + R(2, 0) * _tmp64 + R(4, 0) * _tmp65) +
+                     _tmp65 * (R(3, 0) * _tmp63 + R(4, 0) * _tmp64 + R(5, 0) * _tmp65) +
+                     state(10, 0);
+    _err_cov(1, 0) = -_tmp153 * _tmp160 - _tmp154 * _tmp164 - _tmp155 * _tmp159 -
+                     _tmp156 * state(38, 0) - _tmp157 * state(31, 0) - _tmp158 * state(46, 0) +
+                     _tmp161 * _tmp63 + _tmp162 * _tmp64 + _tmp163 * _tmp65 + state(11, 0);
+    _err_cov(2, 0) = -_tmp156 * _tmp164 - _tmp156 * state(39, 0) - _tmp157 * _tmp160 -
+                     _tmp157 * state(32, 0) - _tmp158 * _tmp159 - _tmp158 * state(47, 0) +
+                     _tmp161 * _tmp73 + _tmp162 * _tmp71 + _tmp163 * _tmp72 + state(12, 0);
+    _err_cov(3, 0) = -_tmp153 * _tmp169 - _tmp154 * _tmp170 - _tmp155 * _tmp172 + _tmp165 * _tmp64 -
+                     _tmp166 * state(46, 0) - _tmp167 * state(31, 0) - _tmp168 * state(38, 0) +
+                     _tmp171 * _tmp65 + _tmp173 * _tmp63 + state(13, 0);
+    _err_cov(4, 0) = -_tmp156 * _tmp170 - _tmp157 * _tmp169 - _tmp158 * _tmp172 + _tmp165 * _tmp71 -
+                     _tmp166 * state(47, 0) - _tmp167 * state(32, 0) - _tmp168 * state(39, 0) +
+                     _tmp171 * _tmp72 + _tmp173 * _tmp73 + state(14, 0);
+    _err_cov(5, 0) = _tmp165 * _tmp57 - _tmp166 * _tmp172 - _tmp166 * state(48, 0) -
+                     _tmp167 * _tmp169 - _tmp167 * state(33, 0) - _tmp168 * _tmp170 -
+                     _tmp168 * state(40, 0) + _tmp171 * _tmp52 + _tmp173 * _tmp49 + state(15, 0);
+    _err_cov(6, 0) = -_tmp153 * _tmp179 - _tmp154 * _tmp178 - _tmp155 * _tmp180 + _tmp174 * _tmp63 -
+                     _tmp175 * state(46, 0) - _tmp176 * state(38, 0) - _tmp177 * state(31, 0) +
+                     _tmp181 * _tmp65 + _tmp182 * _tmp64 + state(16, 0);
+    _err_cov(7, 0) = -_tmp156 * _tmp178 - _tmp157 * _tmp179 - _tmp158 * _tmp180 + _tmp174 * _tmp73 -
+                     _tmp175 * state(47, 0) - _tmp176 * state(39, 0) - _tmp177 * state(32, 0) +
+                     _tmp181 * _tmp72 + _tmp182 * _tmp71 + state(17, 0);
+    _err_cov(8, 0) = -_tmp166 * _tmp180 - _tmp167 * _tmp179 - _tmp168 * _tmp178 + _tmp174 * _tmp49 -
+                     _tmp175 * state(48, 0) - _tmp176 * state(40, 0) - _tmp177 * state(33, 0) +
+                     _tmp181 * _tmp52 + _tmp182 * _tmp57 + state(18, 0);
+    _err_cov(9, 0) = _tmp174 * _tmp89 - _tmp175 * _tmp180 - _tmp175 * state(49, 0) -
+                     _tmp176 * _tmp178 - _tmp176 * state(41, 0) - _tmp177 * _tmp179 -
+                     _tmp177 * state(34, 0) + _tmp181 * _tmp88 + _tmp182 * _tmp87 + state(19, 0);
+    _err_cov(10, 0) = -_tmp153 * _tmp187 - _tmp154 * _tmp191 - _tmp155 * _tmp190 -
+                      _tmp183 * state(46, 0) - _tmp184 * state(38, 0) + _tmp185 * _tmp63 -
+                      _tmp186 * state(31, 0) + _tmp188 * _tmp65 + _tmp189 * _tmp64 + state(20, 0);
+    _err_cov(11, 0) = -_tmp156 * _tmp191 - _tmp157 * _tmp187 - _tmp158 * _tmp190 -
+                      _tmp183 * state(47, 0) - _tmp184 * state(39, 0) + _tmp185 * _tmp73 -
+                      _tmp186 * state(32, 0) + _tmp188 * _tmp72 + _tmp189 * _tmp71 + state(21, 0);
+    _err_cov(12, 0) = -_tmp166 * _tmp190 - _tmp167 * _tmp187 - _tmp168 * _tmp191 -
+                      _tmp183 * state(48, 0) - _tmp184 * state(40, 0) + _tmp185 * _tmp49 -
+                      _tmp186 * state(33, 0) + _tmp188 * _tmp52 + _tmp189 * _tmp57 + state(22, 0);
+    _err_cov(13, 0) = -_tmp175 * _tmp190 - _tmp176 * _tmp191 - _tmp177 * _tmp187 -
+                      _tmp183 * state(49, 0) - _tmp184 * state(41, 0) + _tmp185 * _tmp89 -
+                      _tmp186 * state(34, 0) + _tmp188 * _tmp88 + _tmp189 * _tmp87 + state(23, 0);
+    _err_cov(14, 0) = _tmp119 * _tmp188 + _tmp120 * _tmp189 + _tmp121 * _tmp185 -
+                      _tmp183 * _tmp190 - _tmp183 * state(50, 0) - _tmp184 * _tmp191 -
+                      _tmp184 * state(42, 0) - _tmp186 * _tmp187 - _tmp186 * state(35, 0) +
+                      state(24, 0);
+    _err_cov(15, 0) = -_tmp153 * _tmp198 - _tmp154 * _tmp196 - _tmp155 * _tmp200 +
+                      _tmp192 * _tmp64 - _tmp193 * state(31, 0) - _tmp194 * state(38, 0) -
+                      _tmp195 * state(46, 0) + _tmp197 * _tmp65 + _tmp199 * _tmp63 + state(25, 0);
+    _err_cov(16, 0) = -_tmp156 * _tmp196 - _tmp157 * _tmp198 - _tmp158 * _tmp200 +
+                      _tmp192 * _tmp71 - _tmp193 * state(32, 0) - _tmp194 * state(39, 0) -
+                      _tmp195 * state(47, 0) + _tmp197 * _tmp72 + _tmp199 * _tmp73 + state(26, 0);
+    _err_cov(17, 0) = -_tmp166 * _tmp200 - _tmp167 * _tmp198 - _tmp168 * _tmp196 +
+                      _tmp192 * _tmp57 - _tmp193 * state(33, 0) - _tmp194 * state(40, 0) -
+                      _tmp195 * state(48, 0) + _tmp197 * _tmp52 + _tmp199 * _tmp49 + state(27, 0);
+    _err_cov(18, 0) = -_tmp175 * _tmp200 - _tmp176 * _tmp196 - _tmp177 * _tmp198 +
+                      _tmp192 * _tmp87 - _tmp193 * state(34, 0) - _tmp194 * state(41, 0) -
+                      _tmp195 * state(49, 0) + _tmp197 * _tmp88 + _tmp199 * _tmp89 + state(28, 0);
+    _err_cov(19, 0) = _tmp119 * _tmp197 + _tmp120 * _tmp192 + _tmp121 * _tmp199 -
+                      _tmp183 * _tmp200 - _tmp184 * _tmp196 - _tmp186 * _tmp198 -
+                      _tmp193 * state(35, 0) - _tmp194 * state(42, 0) - _tmp195 * state(50, 0) +
+                      state(29, 0);
+    _err_cov(20, 0) = _tmp103 * _tmp192 + _tmp104 * _tmp197 + _tmp105 * _tmp199 -
+                      _tmp193 * _tmp198 - _tmp193 * state(36, 0) - _tmp194 * _tmp196 -
+                      _tmp194 * state(43, 0) - _tmp195 * _tmp200 - _tmp195 * state(51, 0) +
+                      state(30, 0);
+    _err_cov(21, 0) = -_tmp153 * _tmp208 - _tmp154 * _tmp204 - _tmp155 * _tmp209 +
+                      _tmp201 * state(31, 0) - _tmp202 * state(46, 0) - _tmp203 * state(38, 0) +
+                      _tmp205 * _tmp63 + _tmp206 * _tmp65 + _tmp207 * _tmp64;
+    _err_cov(22, 0) = -_tmp156 * _tmp204 - _tmp157 * _tmp208 - _tmp158 * _tmp209 +
+                      _tmp201 * state(32, 0) - _tmp202 * state(47, 0) - _tmp203 * state(39, 0) +
+                      _tmp205 * _tmp73 + _tmp206 * _tmp72 + _tmp207 * _tmp71;
+    _err_cov(23, 0) = -_tmp166 * _tmp209 - _tmp167 * _tmp208 - _tmp168 * _tmp204 +
+                      _tmp201 * state(33, 0) - _tmp202 * state(48, 0) - _tmp203 * state(40, 0) +
+                      _tmp205 * _tmp49 + _tmp206 * _tmp52 + _tmp207 * _tmp57;
+    _err_cov(24, 0) = -_tmp175 * _tmp209 - _tmp176 * _tmp204 - _tmp177 * _tmp208 +
+                      _tmp201 * state(34, 0) - _tmp202 * state(49, 0) - _tmp203 * state(41, 0) +
+                      _tmp205 * _tmp89 + _tmp206 * _tmp88 + _tmp207 * _tmp87;
+    _err_cov(25, 0) = _tmp119 * _tmp206 + _tmp120 * _tmp207 + _tmp121 * _tmp205 -
+                      _tmp183 * _tmp209 - _tmp184 * _tmp204 - _tmp186 * _tmp208 +
+                      _tmp201 * state(35, 0) - _tmp202 * state(50, 0) - _tmp203 * state(42, 0);
+    _err_cov(26, 0) = _tmp103 * _tmp207 + _tmp104 * _tmp206 + _tmp105 * _tmp205 -
+                      _tmp193 * _tmp208 - _tmp194 * _tmp204 - _tmp195 * _tmp209 +
+                      _tmp201 * state(36, 0) - _tmp202 * state(51, 0) - _tmp203 * state(43, 0);
+    _err_cov(27, 0) = _tmp141 * _tmp207 + _tmp142 * _tmp206 + _tmp143 * _tmp205 +
+                      _tmp201 * _tmp208 - _tmp202 * _tmp209 - _tmp203 * _tmp204;
+    _err_cov(28, 0) = -_tmp153 * _tmp214 - _tmp154 * _tmp217 - _tmp155 * _tmp215 +
+                      _tmp210 * _tmp63 + _tmp211 * state(38, 0) - _tmp212 * state(46, 0) -
+                      _tmp213 * state(31, 0) + _tmp216 * _tmp65 + _tmp218 * _tmp64;
+    _err_cov(29, 0) = -_tmp156 * _tmp217 - _tmp157 * _tmp214 - _tmp158 * _tmp215 +
+                      _tmp210 * _tmp73 + _tmp211 * state(39, 0) - _tmp212 * state(47, 0) -
+                      _tmp213 * state(32, 0) + _tmp216 * _tmp72 + _tmp218 * _tmp71;
+    _err_cov(30, 0) = -_tmp166 * _tmp215 - _tmp167 * _tmp214 - _tmp168 * _tmp217 +
+                      _tmp210 * _tmp49 + _tmp211 * state(40, 0) - _tmp212 * state(48, 0) -
+                      _tmp213 * state(33, 0) + _tmp216 * _tmp52 + _tmp218 * _tmp57;
+    _err_cov(31, 0) = -_tmp175 * _tmp215 - _tmp176 * _tmp217 - _tmp177 * _tmp214 +
+                      _tmp210 * _tmp89 + _tmp211 * state(41, 0) - _tmp212 * state(49, 0) -
+                      _tmp213 * state(34, 0) + _tmp216 * _tmp88 + _tmp218 * _tmp87;
+    _err_cov(32, 0) = _tmp119 * _tmp216 + _tmp120 * _tmp218 + _tmp121 * _tmp210 -
+                      _tmp183 * _tmp215 - _tmp184 * _tmp217 - _tmp186 * _tmp214 +
+                      _tmp211 * state(42, 0) - _tmp212 * state(50, 0) - _tmp213 * state(35, 0);
+    _err_cov(33, 0) = _tmp103 * _tmp218 + _tmp104 * _tmp216 + _tmp105 * _tmp210 -
+                      _tmp193 * _tmp214 - _tmp194 * _tmp217 - _tmp195 * _tmp215 +
+                      _tmp211 * state(43, 0) - _tmp212 * state(51, 0) - _tmp213 * state(36, 0);
+    _err_cov(34, 0) = _tmp141 * _tmp218 + _tmp142 * _tmp216 + _tmp143 * _tmp210 +
+                      _tmp201 * _tmp214 - _tmp202 * _tmp215 - _tmp203 * _tmp217;
+    _err_cov(35, 0) = _tmp146 * _tmp216 + _tmp147 * _tmp210 + _tmp148 * _tmp218 +
+                      _tmp211 * _tmp217 - _tmp212 * _tmp215 - _tmp213 * _tmp214;
+    _err_cov(36, 0) = -_tmp153 * _tmp227 - _tmp154 * _tmp225 - _tmp155 * _tmp226 +
+                      _tmp219 * _tmp65 + _tmp220 * _tmp63 + _tmp221 * _tmp64 +
+                      _tmp222 * state(46, 0) - _tmp223 * state(31, 0) - _tmp224 * state(38, 0);
+    _err_cov(37, 0) = -_tmp156 * _tmp225 - _tmp157 * _tmp227 - _tmp158 * _tmp226 +
+                      _tmp219 * _tmp72 + _tmp220 * _tmp73 + _tmp221 * _tmp71 +
+                      _tmp222 * state(47, 0) - _tmp223 * state(32, 0) - _tmp224 * state(39, 0);
+    _err_cov(38, 0) = -_tmp166 * _tmp226 - _tmp167 * _tmp227 - _tmp168 * _tmp225 +
+                      _tmp219 * _tmp52 + _tmp220 * _tmp49 + _tmp221 * _tmp57 +
+                      _tmp222 * state(48, 0) - _tmp223 * state(33, 0) - _tmp224 * state(40, 0);
+    _err_cov(39, 0) = -_tmp175 * _tmp226 - _tmp176 * _tmp225 - _tmp177 * _tmp227 +
+                      _tmp219 * _tmp88 + _tmp220 * _tmp89 + _tmp221 * _tmp87 +
+                      _tmp222 * state(49, 0) - _tmp223 * state(34, 0) - _tmp224 * state(41, 0);
+    _err_cov(40, 0) = _tmp119 * _tmp219 + _tmp120 * _tmp221 + _tmp121 * _tmp220 -
+                      _tmp183 * _tmp226 - _tmp184 * _tmp225 - _tmp186 * _tmp227 +
+                      _tmp222 * state(50, 0) - _tmp223 * state(35, 0) - _tmp224 * state(42, 0);
+    _err_cov(41, 0) = _tmp103 * _tmp221 + _tmp104 * _tmp219 + _tmp105 * _tmp220 -
+                      _tmp193 * _tmp227 - _tmp194 * _tmp225 - _tmp195 * _tmp226 +
+                      _tmp222 * state(51, 0) - _tmp223 * state(36, 0) - _tmp224 * state(43, 0);
+    _err_cov(42, 0) = _tmp141 * _tmp221 + _tmp142 * _tmp219 + _tmp143 * _tmp220 +
+                      _tmp201 * _tmp227 - _tmp202 * _tmp226 - _tmp203 * _tmp225;
+    _err_cov(43, 0) = _tmp146 * _tmp219 + _tmp147 * _tmp220 + _tmp148 * _tmp221 +
+                      _tmp211 * _tmp225 - _tmp212 * _tmp226 - _tmp213 * _tmp227;
+    _err_cov(44, 0) = _tmp136 * _tmp221 + _tmp137 * _tmp220 + _tmp138 * _tmp219 +
+                      _tmp222 * _tmp226 - _tmp223 * _tmp227 - _tmp224 * _tmp225;
+  }
+
+  if (imu_bias != nullptr) {
+    Eigen::Matrix<Scalar, 6, 1>& _imu_bias = (*imu_bias);
+
+    _imu_bias(0, 0) = state(55, 0);
+    _imu_bias(1, 0) = state(56, 0);
+    _imu_bias(2, 0) = state(57, 0);
+    _imu_bias(3, 0) = state(58, 0);
+    _imu_bias(4, 0) = state(59, 0);
+    _imu_bias(5, 0) = state(60, 0);
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
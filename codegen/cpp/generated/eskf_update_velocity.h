@@ -0,0 +1,476 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     state: Matrix61_1
+ *     z: Matrix31
+ *     R: Matrix61
+ *
+ * Outputs:
+ *     nom: Matrix10_1
+ *     err_cov: Matrix45_1
+ *     imu_bias: Matrix61
+ */
+template <typename Scalar>
+void EskfUpdateVelocity(const Eigen::Matrix<Scalar, 61, 1>& state,
+                        const Eigen::Matrix<Scalar, 3, 1>& z, const Eigen::Matrix<Scalar, 6, 1>& R,
+                        Eigen::Matrix<Scalar, 10, 1>* const nom = nullptr,
+                        Eigen::Matrix<Scalar, 45, 1>* const err_cov = nullptr,
+                        Eigen::Matrix<Scalar, 6, 1>* const imu_bias = nullptr) {
+  // Total ops: 1723
+
+  // Input arrays
+
+  // Intermediate terms (227)
+  const Scalar _tmp0 = -state(5, 0) + z(1, 0);
+  const Scalar _tmp1 = 2 * state(0, 0) * state(1, 0);
+  const Scalar _tmp2 = 2 * state(3, 0);
+  const Scalar _tmp3 = _tmp2 * state(2, 0);
+  const Scalar _tmp4 = _tmp1 + _tmp3;
+  const Scalar _tmp5 = 2 * state(2, 0);
+  const Scalar _tmp6 = _tmp5 * state(1, 0);
+  const Scalar _tmp7 = _tmp2 * state(0, 0);
+  const Scalar _tmp8 = _tmp6 - _tmp7;
+  const Scalar _tmp9 = -2 * std::pow(state(0, 0), Scalar(2));
+  const Scalar _tmp10 = -2 * std::pow(state(2, 0), Scalar(2));
+  const Scalar _tmp11 = _tmp10 + _tmp9 + 1;
+  const Scalar _tmp12 = _tmp11 * state(20, 0) + _tmp4 * state(16, 0) + _tmp8 * state(25, 0);
+  const Scalar _tmp13 = 1 - 2 * std::pow(state(1, 0), Scalar(2));
+  const Scalar _tmp14 = _tmp10 + _tmp13;
+  const Scalar _tmp15 = _tmp11 * state(23, 0) + _tmp4 * state(19, 0) + _tmp8 * state(28, 0);
+  const Scalar _tmp16 = _tmp2 * state(1, 0);
+  const Scalar _tmp17 = _tmp5 * state(0, 0);
+  const Scalar _tmp18 = _tmp16 + _tmp17;
+  const Scalar _tmp19 = _tmp11 * state(29, 0) + _tmp4 * state(28, 0) + _tmp8 * state(30, 0);
+  const Scalar _tmp20 = _tmp1 - _tmp3;
+  const Scalar _tmp21 = _tmp11 * state(24, 0) + _tmp4 * state(23, 0) + _tmp8 * state(29, 0);
+  const Scalar _tmp22 = R(1, 0) + _tmp14 * _tmp15 + _tmp18 * _tmp19 + _tmp20 * _tmp21;
+  const Scalar _tmp23 = _tmp14 * state(23, 0) + _tmp18 * state(29, 0) + _tmp20 * state(24, 0);
+  const Scalar _tmp24 = _tmp14 * state(19, 0) + _tmp18 * state(28, 0) + _tmp20 * state(23, 0);
+  const Scalar _tmp25 = _tmp14 * state(28, 0) + _tmp18 * state(30, 0) + _tmp20 * state(29, 0);
+  const Scalar _tmp26 =
+      Scalar(1.0) / (R(0, 0) + _tmp14 * _tmp24 + _tmp18 * _tmp25 + _tmp20 * _tmp23);
+  const Scalar _tmp27 = _tmp26 * (R(1, 0) + _tmp11 * _tmp23 + _tmp24 * _tmp4 + _tmp25 * _tmp8);
+  const Scalar _tmp28 =
+      Scalar(1.0) / (R(2, 0) + _tmp11 * _tmp21 + _tmp15 * _tmp4 + _tmp19 * _tmp8 - _tmp22 * _tmp27);
+  const Scalar _tmp29 = _tmp6 + _tmp7;
+  const Scalar _tmp30 = -_tmp16 + _tmp17;
+  const Scalar _tmp31 = _tmp13 + _tmp9;
+  const Scalar _tmp32 = _tmp29 * state(24, 0) + _tmp30 * state(23, 0) + _tmp31 * state(29, 0);
+  const Scalar _tmp33 = _tmp29 * state(23, 0) + _tmp30 * state(19, 0) + _tmp31 * state(28, 0);
+  const Scalar _tmp34 = _tmp29 * state(29, 0) + _tmp30 * state(28, 0) + _tmp31 * state(30, 0);
+  const Scalar _tmp35 = R(3, 0) + _tmp14 * _tmp33 + _tmp18 * _tmp34 + _tmp20 * _tmp32;
+  const Scalar _tmp36 = _tmp26 * (R(3, 0) + _tmp23 * _tmp29 + _tmp24 * _tmp30 + _tmp25 * _tmp31);
+  const Scalar _tmp37 =
+      R(4, 0) + _tmp11 * _tmp32 - _tmp27 * _tmp35 + _tmp33 * _tmp4 + _tmp34 * _tmp8;
+  const Scalar _tmp38 =
+      _tmp28 * (R(4, 0) + _tmp15 * _tmp30 + _tmp19 * _tmp31 + _tmp21 * _tmp29 - _tmp22 * _tmp36);
+  const Scalar _tmp39 = Scalar(1.0) / (R(5, 0) + _tmp29 * _tmp32 + _tmp30 * _tmp33 +
+                                       _tmp31 * _tmp34 - _tmp35 * _tmp36 - _tmp37 * _tmp38);
+  const Scalar _tmp40 = _tmp37 * _tmp39;
+  const Scalar _tmp41 = _tmp28 * (_tmp38 * _tmp40 + 1);
+  const Scalar _tmp42 = _tmp14 * state(16, 0) + _tmp18 * state(25, 0) + _tmp20 * state(20, 0);
+  const Scalar _tmp43 = _tmp35 * _tmp39;
+  const Scalar _tmp44 = _tmp26 * (-_tmp22 * _tmp41 + _tmp38 * _tmp43);
+  const Scalar _tmp45 =
+      _tmp39 * (_tmp29 * state(20, 0) + _tmp30 * state(16, 0) + _tmp31 * state(25, 0));
+  const Scalar _tmp46 = _tmp12 * _tmp41 - _tmp38 * _tmp45 + _tmp42 * _tmp44;
+  const Scalar _tmp47 = -state(4, 0) + z(0, 0);
+  const Scalar _tmp48 = _tmp27 * _tmp38 - _tmp36;
+  const Scalar _tmp49 = _tmp28 * (-_tmp27 - _tmp40 * _tmp48);
+  const Scalar _tmp50 = _tmp26 * (-_tmp22 * _tmp49 - _tmp43 * _tmp48 + 1);
+  const Scalar _tmp51 = _tmp12 * _tmp49 + _tmp42 * _tmp50 + _tmp45 * _tmp48;
+  const Scalar _tmp52 = -state(6, 0) + z(2, 0);
+  const Scalar _tmp53 = _tmp28 * _tmp40;
+  const Scalar _tmp54 = _tmp26 * (_tmp22 * _tmp53 - _tmp43);
+  const Scalar _tmp55 = -_tmp12 * _tmp53 + _tmp42 * _tmp54 + _tmp45;
+  const Scalar _tmp56 = _tmp0 * _tmp46 + _tmp47 * _tmp51 + _tmp52 * _tmp55;
+  const Scalar _tmp57 = std::pow(_tmp56, Scalar(2));
+  const Scalar _tmp58 = _tmp14 * state(18, 0) + _tmp18 * state(27, 0) + _tmp20 * state(22, 0);
+  const Scalar _tmp59 =
+      _tmp39 * (_tmp29 * state(22, 0) + _tmp30 * state(18, 0) + _tmp31 * state(27, 0));
+  const Scalar _tmp60 = _tmp11 * state(22, 0) + _tmp4 * state(18, 0) + _tmp8 * state(27, 0);
+  const Scalar _tmp61 = -_tmp53 * _tmp60 + _tmp54 * _tmp58 + _tmp59;
+  const Scalar _tmp62 = -_tmp38 * _tmp59 + _tmp41 * _tmp60 + _tmp44 * _tmp58;
+  const Scalar _tmp63 = _tmp48 * _tmp59 + _tmp49 * _tmp60 + _tmp50 * _tmp58;
+  const Scalar _tmp64 = _tmp0 * _tmp62 + _tmp47 * _tmp63 + _tmp52 * _tmp61;
+  const Scalar _tmp65 = std::pow(_tmp64, Scalar(2));
+  const Scalar _tmp66 = _tmp14 * state(17, 0) + _tmp18 * state(26, 0) + _tmp20 * state(21, 0);
+  const Scalar _tmp67 =
+      _tmp39 * (_tmp29 * state(21, 0) + _tmp30 * state(17, 0) + _tmp31 * state(26, 0));
+  const Scalar _tmp68 = _tmp11 * state(21, 0) + _tmp4 * state(17, 0) + _tmp8 * state(26, 0);
+  const Scalar _tmp69 = -_tmp53 * _tmp68 + _tmp54 * _tmp66 + _tmp67;
+  const Scalar _tmp70 = -_tmp38 * _tmp67 + _tmp41 * _tmp68 + _tmp44 * _tmp66;
+  const Scalar _tmp71 = _tmp48 * _tmp67 + _tmp49 * _tmp68 + _tmp50 * _tmp66;
+  const Scalar _tmp72 = _tmp0 * _tmp70 + _tmp47 * _tmp71 + _tmp52 * _tmp69;
+  const Scalar _tmp73 = std::pow(_tmp72, Scalar(2));
+  const Scalar _tmp74 = _tmp57 + _tmp65 + _tmp73 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp75 = std::sqrt(_tmp74);
+  const Scalar _tmp76 = (Scalar(1) / Scalar(2)) * _tmp75;
+  const Scalar _tmp77 = std::cos(_tmp76);
+  const Scalar _tmp78 = std::sin(_tmp76) / _tmp75;
+  const Scalar _tmp79 = _tmp56 * _tmp78;
+  const Scalar _tmp80 = _tmp64 * _tmp78;
+  const Scalar _tmp81 = _tmp78 * state(2, 0);
+  const Scalar _tmp82 = _tmp72 * _tmp78;
+  const Scalar _tmp83 = Scalar(0.050000000000000003) - _tmp75;
+  const Scalar _tmp84 = std::max<Scalar>(0, (((_tmp83) > 0) - ((_tmp83) < 0)));
+  const Scalar _tmp85 = _tmp75 + _tmp83 * _tmp84;
+  const Scalar _tmp86 = (_tmp85 - std::sin(_tmp85)) / [&]() {
+    const Scalar base = _tmp85;
+    return base * base * base;
+  }();
+  const Scalar _tmp87 = std::pow(_tmp74, Scalar(2));
+  const Scalar _tmp88 =
+      _tmp84 * (-Scalar(0.0083333333333333332) * _tmp74 - _tmp86 +
+                Scalar(0.00019841269841269841) * _tmp87 + Scalar(0.16666666666666666)) +
+      _tmp86;
+  const Scalar _tmp89 = _tmp72 * _tmp88;
+  const Scalar _tmp90 = _tmp64 * _tmp89;
+  const Scalar _tmp91 = (1 - std::cos(_tmp85)) / std::pow(_tmp85, Scalar(2));
+  const Scalar _tmp92 = _tmp84 * (-Scalar(0.041666666666666664) * _tmp74 +
+                                  Scalar(0.0013888888888888889) * _tmp87 - _tmp91 + Scalar(0.5)) +
+                        _tmp91;
+  const Scalar _tmp93 = _tmp56 * _tmp92;
+  const Scalar _tmp94 = _tmp90 - _tmp93;
+  const Scalar _tmp95 = _tmp34 * _tmp39;
+  const Scalar _tmp96 = -_tmp19 * _tmp53 + _tmp25 * _tmp54 + _tmp95;
+  const Scalar _tmp97 = _tmp19 * _tmp49 + _tmp25 * _tmp50 + _tmp48 * _tmp95;
+  const Scalar _tmp98 = _tmp19 * _tmp41 + _tmp25 * _tmp44 - _tmp38 * _tmp95;
+  const Scalar _tmp99 = _tmp0 * _tmp98 + _tmp47 * _tmp97 + _tmp52 * _tmp96;
+  const Scalar _tmp100 = _tmp32 * _tmp39;
+  const Scalar _tmp101 = _tmp100 * _tmp48 + _tmp21 * _tmp49 + _tmp23 * _tmp50;
+  const Scalar _tmp102 = -_tmp100 * _tmp38 + _tmp21 * _tmp41 + _tmp23 * _tmp44;
+  const Scalar _tmp103 = _tmp100 - _tmp21 * _tmp53 + _tmp23 * _tmp54;
+  const Scalar _tmp104 = _tmp0 * _tmp102 + _tmp101 * _tmp47 + _tmp103 * _tmp52;
+  const Scalar _tmp105 = -_tmp57 * _tmp88;
+  const Scalar _tmp106 = -_tmp65 * _tmp88 + 1;
+  const Scalar _tmp107 = _tmp105 + _tmp106;
+  const Scalar _tmp108 = _tmp56 * _tmp89;
+  const Scalar _tmp109 = _tmp64 * _tmp92;
+  const Scalar _tmp110 = _tmp108 + _tmp109;
+  const Scalar _tmp111 = _tmp33 * _tmp39;
+  const Scalar _tmp112 = _tmp111 - _tmp15 * _tmp53 + _tmp24 * _tmp54;
+  const Scalar _tmp113 = -_tmp111 * _tmp38 + _tmp15 * _tmp41 + _tmp24 * _tmp44;
+  const Scalar _tmp114 = _tmp111 * _tmp48 + _tmp15 * _tmp49 + _tmp24 * _tmp50;
+  const Scalar _tmp115 = _tmp0 * _tmp113 + _tmp112 * _tmp52 + _tmp114 * _tmp47;
+  const Scalar _tmp116 = _tmp104 * _tmp107 + _tmp110 * _tmp115 + _tmp94 * _tmp99;
+  const Scalar _tmp117 = _tmp56 * _tmp64 * _tmp88;
+  const Scalar _tmp118 = _tmp72 * _tmp92;
+  const Scalar _tmp119 = _tmp117 - _tmp118;
+  const Scalar _tmp120 = _tmp90 + _tmp93;
+  const Scalar _tmp121 = -_tmp73 * _tmp88;
+  const Scalar _tmp122 = _tmp105 + _tmp121 + 1;
+  const Scalar _tmp123 = _tmp104 * _tmp120 + _tmp115 * _tmp119 + _tmp122 * _tmp99;
+  const Scalar _tmp124 = _tmp117 + _tmp118;
+  const Scalar _tmp125 = _tmp108 - _tmp109;
+  const Scalar _tmp126 = _tmp106 + _tmp121;
+  const Scalar _tmp127 = _tmp104 * _tmp125 + _tmp115 * _tmp126 + _tmp124 * _tmp99;
+  const Scalar _tmp128 = _tmp14 * state(49, 0) + _tmp18 * state(51, 0) + _tmp20 * state(50, 0);
+  const Scalar _tmp129 =
+      _tmp39 * (_tmp29 * state(50, 0) + _tmp30 * state(49, 0) + _tmp31 * state(51, 0));
+  const Scalar _tmp130 = _tmp11 * state(50, 0) + _tmp4 * state(49, 0) + _tmp8 * state(51, 0);
+  const Scalar _tmp131 = _tmp128 * _tmp50 + _tmp129 * _tmp48 + _tmp130 * _tmp49;
+  const Scalar _tmp132 = _tmp128 * _tmp44 - _tmp129 * _tmp38 + _tmp130 * _tmp41;
+  const Scalar _tmp133 = _tmp128 * _tmp54 + _tmp129 - _tmp130 * _tmp53;
+  const Scalar _tmp134 = _tmp0 * _tmp132 + _tmp131 * _tmp47 + _tmp133 * _tmp52;
+  const Scalar _tmp135 =
+      _tmp39 * (_tmp29 * state(35, 0) + _tmp30 * state(34, 0) + _tmp31 * state(36, 0));
+  const Scalar _tmp136 = _tmp14 * state(34, 0) + _tmp18 * state(36, 0) + _tmp20 * state(35, 0);
+  const Scalar _tmp137 = _tmp11 * state(35, 0) + _tmp4 * state(34, 0) + _tmp8 * state(36, 0);
+  const Scalar _tmp138 = _tmp135 + _tmp136 * _tmp54 - _tmp137 * _tmp53;
+  const Scalar _tmp139 = _tmp135 * _tmp48 + _tmp136 * _tmp50 + _tmp137 * _tmp49;
+  const Scalar _tmp140 = -_tmp135 * _tmp38 + _tmp136 * _tmp44 + _tmp137 * _tmp41;
+  const Scalar _tmp141 = _tmp0 * _tmp140 + _tmp138 * _tmp52 + _tmp139 * _tmp47;
+  const Scalar _tmp142 = _tmp11 * state(42, 0) + _tmp4 * state(41, 0) + _tmp8 * state(43, 0);
+  const Scalar _tmp143 = _tmp14 * state(41, 0) + _tmp18 * state(43, 0) + _tmp20 * state(42, 0);
+  const Scalar _tmp144 =
+      _tmp39 * (_tmp29 * state(42, 0) + _tmp30 * state(41, 0) + _tmp31 * state(43, 0));
+  const Scalar _tmp145 = _tmp142 * _tmp41 + _tmp143 * _tmp44 - _tmp144 * _tmp38;
+  const Scalar _tmp146 = _tmp142 * _tmp49 + _tmp143 * _tmp50 + _tmp144 * _tmp48;
+  const Scalar _tmp147 = -_tmp142 * _tmp53 + _tmp143 * _tmp54 + _tmp144;
+  const Scalar _tmp148 = _tmp0 * _tmp145 + _tmp146 * _tmp47 + _tmp147 * _tmp52;
+  const Scalar _tmp149 = _tmp107 * _tmp148 + _tmp110 * _tmp141 + _tmp134 * _tmp94;
+  const Scalar _tmp150 = _tmp119 * _tmp141 + _tmp120 * _tmp148 + _tmp122 * _tmp134;
+  const Scalar _tmp151 = _tmp124 * _tmp134 + _tmp125 * _tmp148 + _tmp126 * _tmp141;
+  const Scalar _tmp152 = _tmp14 * _tmp51 + _tmp30 * _tmp55 + _tmp4 * _tmp46;
+  const Scalar _tmp153 = _tmp18 * _tmp51 + _tmp31 * _tmp55 + _tmp46 * _tmp8;
+  const Scalar _tmp154 = _tmp11 * _tmp46 + _tmp20 * _tmp51 + _tmp29 * _tmp55;
+  const Scalar _tmp155 = R(3, 0) * _tmp71 + R(4, 0) * _tmp70 + R(5, 0) * _tmp69;
+  const Scalar _tmp156 = _tmp11 * _tmp70 + _tmp20 * _tmp71 + _tmp29 * _tmp69;
+  const Scalar _tmp157 = _tmp14 * _tmp71 + _tmp30 * _tmp69 + _tmp4 * _tmp70;
+  const Scalar _tmp158 = _tmp18 * _tmp71 + _tmp31 * _tmp69 + _tmp70 * _tmp8;
+  const Scalar _tmp159 =
+      -_tmp156 * state(24, 0) - _tmp157 * state(23, 0) - _tmp158 * state(29, 0) + state(21, 0);
+  const Scalar _tmp160 =
+      -_tmp156 * state(29, 0) - _tmp157 * state(28, 0) - _tmp158 * state(30, 0) + state(26, 0);
+  const Scalar _tmp161 = R(1, 0) * _tmp71 + R(2, 0) * _tmp70 + R(4, 0) * _tmp69;
+  const Scalar _tmp162 =
+      -_tmp156 * state(23, 0) - _tmp157 * state(19, 0) - _tmp158 * state(28, 0) + state(17, 0);
+  const Scalar _tmp163 = R(0, 0) * _tmp71 + R(1, 0) * _tmp70 + R(3, 0) * _tmp69;
+  const Scalar _tmp164 = _tmp11 * _tmp62 + _tmp20 * _tmp63 + _tmp29 * _tmp61;
+  const Scalar _tmp165 = _tmp18 * _tmp63 + _tmp31 * _tmp61 + _tmp62 * _tmp8;
+  const Scalar _tmp166 = _tmp14 * _tmp63 + _tmp30 * _tmp61 + _tmp4 * _tmp62;
+  const Scalar _tmp167 =
+      -_tmp164 * state(24, 0) - _tmp165 * state(29, 0) - _tmp166 * state(23, 0) + state(22, 0);
+  const Scalar _tmp168 = R(3, 0) * _tmp63 + R(4, 0) * _tmp62 + R(5, 0) * _tmp61;
+  const Scalar _tmp169 = R(1, 0) * _tmp63 + R(2, 0) * _tmp62 + R(4, 0) * _tmp61;
+  const Scalar _tmp170 =
+      -_tmp164 * state(23, 0) - _tmp165 * state(28, 0) - _tmp166 * state(19, 0) + state(18, 0);
+  const Scalar _tmp171 = R(0, 0) * _tmp63 + R(1, 0) * _tmp62 + R(3, 0) * _tmp61;
+  const Scalar _tmp172 =
+      -_tmp164 * state(29, 0) - _tmp165 * state(30, 0) - _tmp166 * state(28, 0) + state(27, 0);
+  const Scalar _tmp173 = R(3, 0) * _tmp114 + R(4, 0) * _tmp113 + R(5, 0) * _tmp112;
+  const Scalar _tmp174 = -_tmp112 * _tmp30 - _tmp113 * _tmp4 - _tmp114 * _tmp14 + 1;
+  const Scalar _tmp175 = _tmp112 * _tmp31 + _tmp113 * _tmp8 + _tmp114 * _tmp18;
+  const Scalar _tmp176 = R(0, 0) * _tmp114 + R(1, 0) * _tmp113 + R(3, 0) * _tmp112;
+  const Scalar _tmp177 = _tmp11 * _tmp113 + _tmp112 * _tmp29 + _tmp114 * _tmp20;
+  const Scalar _tmp178 = _tmp174 * state(23, 0) - _tmp175 * state(29, 0) - _tmp177 * state(24, 0);
+  const Scalar _tmp179 = _tmp174 * state(19, 0) - _tmp175 * state(28, 0) - _tmp177 * state(23, 0);
+  const Scalar _tmp180 = R(1, 0) * _tmp114 + R(2, 0) * _tmp113 + R(4, 0) * _tmp112;
+  const Scalar _tmp181 = _tmp174 * state(28, 0) - _tmp175 * state(30, 0) - _tmp177 * state(29, 0);
+  const Scalar _tmp182 = _tmp101 * _tmp14 + _tmp102 * _tmp4 + _tmp103 * _tmp30;
+  const Scalar _tmp183 = R(0, 0) * _tmp101 + R(1, 0) * _tmp102 + R(3, 0) * _tmp103;
+  const Scalar _tmp184 = -_tmp101 * _tmp20 - _tmp102 * _tmp11 - _tmp103 * _tmp29 + 1;
+  const Scalar _tmp185 = _tmp101 * _tmp18 + _tmp102 * _tmp8 + _tmp103 * _tmp31;
+  const Scalar _tmp186 = -_tmp182 * state(23, 0) + _tmp184 * state(24, 0) - _tmp185 * state(29, 0);
+  const Scalar _tmp187 = -_tmp182 * state(28, 0) + _tmp184 * state(29, 0) - _tmp185 * state(30, 0);
+  const Scalar _tmp188 = R(1, 0) * _tmp101 + R(2, 0) * _tmp102 + R(4, 0) * _tmp103;
+  const Scalar _tmp189 = -_tmp182 * state(19, 0) + _tmp184 * state(23, 0) - _tmp185 * state(28, 0);
+  const Scalar _tmp190 = R(3, 0) * _tmp101 + R(4, 0) * _tmp102 + R(5, 0) * _tmp103;
+  const Scalar _tmp191 = -_tmp18 * _tmp97 - _tmp31 * _tmp96 - _tmp8 * _tmp98 + 1;
+  const Scalar _tmp192 = R(3, 0) * _tmp97 + R(4, 0) * _tmp98 + R(5, 0) * _tmp96;
+  const Scalar _tmp193 = R(0, 0) * _tmp97 + R(1, 0) * _tmp98 + R(3, 0) * _tmp96;
+  const Scalar _tmp194 = _tmp14 * _tmp97 + _tmp30 * _tmp96 + _tmp4 * _tmp98;
+  const Scalar _tmp195 = _tmp11 * _tmp98 + _tmp20 * _tmp97 + _tmp29 * _tmp96;
+  const Scalar _tmp196 = _tmp191 * state(30, 0) - _tmp194 * state(28, 0) - _tmp195 * state(29, 0);
+  const Scalar _tmp197 = R(1, 0) * _tmp97 + R(2, 0) * _tmp98 + R(4, 0) * _tmp96;
+  const Scalar _tmp198 = _tmp191 * state(28, 0) - _tmp194 * state(19, 0) - _tmp195 * state(23, 0);
+  const Scalar _tmp199 = _tmp191 * state(29, 0) - _tmp194 * state(23, 0) - _tmp195 * state(24, 0);
+  const Scalar _tmp200 = _tmp138 * _tmp30 + _tmp139 * _tmp14 + _tmp140 * _tmp4;
+  const Scalar _tmp201 = _tmp138 * _tmp31 + _tmp139 * _tmp18 + _tmp140 * _tmp8;
+  const Scalar _tmp202 = _tmp11 * _tmp140 + _tmp138 * _tmp29 + _tmp139 * _tmp20;
+  const Scalar _tmp203 =
+      -_tmp200 * state(23, 0) - _tmp201 * state(29, 0) - _tmp202 * state(24, 0) + state(35, 0);
+  const Scalar _tmp204 =
+      -_tmp200 * state(28, 0) - _tmp201 * state(30, 0) - _tmp202 * state(29, 0) + state(36, 0);
+  const Scalar _tmp205 = R(3, 0) * _tmp139 + R(4, 0) * _tmp140 + R(5, 0) * _tmp138;
+  const Scalar _tmp206 =
+      -_tmp200 * state(19, 0) - _tmp201 * state(28, 0) - _tmp202 * state(23, 0) + state(34, 0);
+  const Scalar _tmp207 = R(0, 0) * _tmp139 + R(1, 0) * _tmp140 + R(3, 0) * _tmp138;
+  const Scalar _tmp208 = R(1, 0) * _tmp139 + R(2, 0) * _tmp140 + R(4, 0) * _tmp138;
+  const Scalar _tmp209 = R(1, 0) * _tmp146 + R(2, 0) * _tmp145 + R(4, 0) * _tmp147;
+  const Scalar _tmp210 = R(3, 0) * _tmp146 + R(4, 0) * _tmp145 + R(5, 0) * _tmp147;
+  const Scalar _tmp211 = _tmp11 * _tmp145 + _tmp146 * _tmp20 + _tmp147 * _tmp29;
+  const Scalar _tmp212 = _tmp14 * _tmp146 + _tmp145 * _tmp4 + _tmp147 * _tmp30;
+  const Scalar _tmp213 = R(0, 0) * _tmp146 + R(1, 0) * _tmp145 + R(3, 0) * _tmp147;
+  const Scalar _tmp214 = _tmp145 * _tmp8 + _tmp146 * _tmp18 + _tmp147 * _tmp31;
+  const Scalar _tmp215 =
+      -_tmp211 * state(23, 0) - _tmp212 * state(19, 0) - _tmp214 * state(28, 0) + state(41, 0);
+  const Scalar _tmp216 =
+      -_tmp211 * state(24, 0) - _tmp212 * state(23, 0) - _tmp214 * state(29, 0) + state(42, 0);
+  const Scalar _tmp217 =
+      -_tmp211 * state(29, 0) - _tmp212 * state(28, 0) - _tmp214 * state(30, 0) + state(43, 0);
+  const Scalar _tmp218 = _tmp11 * _tmp132 + _tmp131 * _tmp20 + _tmp133 * _tmp29;
+  const Scalar _tmp219 = _tmp131 * _tmp14 + _tmp132 * _tmp4 + _tmp133 * _tmp30;
+  const Scalar _tmp220 = R(0, 0) * _tmp131 + R(1, 0) * _tmp132 + R(3, 0) * _tmp133;
+  const Scalar _tmp221 = R(3, 0) * _tmp131 + R(4, 0) * _tmp132 + R(5, 0) * _tmp133;
+  const Scalar _tmp222 = _tmp131 * _tmp18 + _tmp132 * _tmp8 + _tmp133 * _tmp31;
+  const Scalar _tmp223 =
+      -_tmp218 * state(23, 0) - _tmp219 * state(19, 0) - _tmp222 * state(28, 0) + state(49, 0);
+  const Scalar _tmp224 =
+      -_tmp218 * state(29, 0) - _tmp219 * state(28, 0) - _tmp222 * state(30, 0) + state(51, 0);
+  const Scalar _tmp225 =
+      -_tmp218 * state(24, 0) - _tmp219 * state(23, 0) - _tmp222 * state(29, 0) + state(50, 0);
+  const Scalar _tmp226 = R(1, 0) * _tmp131 + R(2, 0) * _tmp132 + R(4, 0) * _tmp133;
+
+  // Output terms (3)
+  if (nom != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _nom = (*nom);
+
+    _nom(0, 0) =
+        -_tmp72 * _tmp81 + _tmp77 * state(0, 0) + _tmp79 * state(3, 0) + _tmp80 * state(1, 0);
+    _nom(1, 0) =
+        _tmp56 * _tmp81 + _tmp77 * state(1, 0) - _tmp80 * state(0, 0) + _tmp82 * state(3, 0);
+    _nom(2, 0) =
+        _tmp77 * state(2, 0) - _tmp79 * state(1, 0) + _tmp80 * state(3, 0) + _tmp82 * state(0, 0);
+    _nom(3, 0) =
+        -_tmp64 * _tmp81 + _tmp77 * state(3, 0) - _tmp79 * state(0, 0) - _tmp82 * state(1, 0);
+    _nom(4, 0) = _tmp116 * _tmp20 + _tmp123 * _tmp18 + _tmp127 * _tmp14 + state(4, 0);
+    _nom(5, 0) = _tmp11 * _tmp116 + _tmp123 * _tmp8 + _tmp127 * _tmp4 + state(5, 0);
+    _nom(6, 0) = _tmp116 * _tmp29 + _tmp123 * _tmp31 + _tmp127 * _tmp30 + state(6, 0);
+    _nom(7, 0) = _tmp14 * _tmp151 + _tmp149 * _tmp20 + _tmp150 * _tmp18 + state(7, 0);
+    _nom(8, 0) = _tmp11 * _tmp149 + _tmp150 * _tmp8 + _tmp151 * _tmp4 + state(8, 0);
+    _nom(9, 0) = _tmp149 * _tmp29 + _tmp150 * _tmp31 + _tmp151 * _tmp30 + state(9, 0);
+  }
+
+  if (err_cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _err_cov = (*err_cov);
+
+    _err_cov(0, 0) = -_tmp152 * state(16, 0) -
+                     _tmp152 * (-_tmp152 * state(19, 0) - _tmp153 * state(28, 0) -
+                                _tmp154 * state(23, 0) + state(16, 0)) -
+                     _tmp153 * state(25, 0) -
+                     _tmp153 * (-_tmp152 * state(28, 0) - _tmp153 * state(30, 0) -
+                                _tmp154 * state(29, 0) + state(25, 0)) -
+                     _tmp154 * state(20, 0) -
+                     _tmp154 * (-_tmp152 * state(23, 0) - _tmp153 * state(29, 0) -
+                                _tmp154 * state(24, 0) + state(20, 0)) +
+                     _tmp46 * (R(1, 0) * _tmp51 + R(2, 0) * _tmp46 + R(4, 0) * _tmp55) +
+                     _tmp51 * (R(0, 0) * _tmp51 + R(1, 0) * _tmp46 + R(3, 0) * _tmp55) +
+                     _tmp55 * (R(3, 0) * _tmp51 + R(4, 0) * _tmp46 + R(5, 0) * _tmp55) +
+                     state(10, 0);
+    _err_cov(1, 0) = -_tmp152 * _tmp162 - _tmp153 * _tmp160 - _tmp154 * _tmp159 + _tmp155 * _tmp55 -
+                     _tmp156 * state(20, 0) - _tmp157 * state(16, 0) - _tmp158 * state(25, 0) +
+                     _tmp161 * _tmp46 + _tmp163 * _tmp51 + state(11, 0);
+    _err_cov(2, 0) = _tmp155 * _tmp69 - _tmp156 * _tmp159 - _tmp156 * state(21, 0) -
+                     _tmp157 * _tmp162 - _tmp157 * state(17, 0) - _tmp158 * _tmp160 -
+                     _tmp158 * state(26, 0) + _tmp161 * _tmp70 + _tmp163 * _tmp71 + state(12, 0);
+    _err_cov(3, 0) = -_tmp152 * _tmp170 - _tmp153 * _tmp172 - _tmp154 * _tmp167 -
+                     _tmp164 * state(20, 0) - _tmp165 * state(25, 0) - _tmp166 * state(16, 0) +
+                     _tmp168 * _tmp55 + _tmp169 * _tmp46 + _tmp171 * _tmp51 + state(13, 0);
+    _err_cov(4, 0) = -_tmp156 * _tmp167 - _tmp157 * _tmp170 - _tmp158 * _tmp172 -
+                     _tmp164 * state(21, 0) - _tmp165 * state(26, 0) - _tmp166 * state(17, 0) +
+                     _tmp168 * _tmp69 + _tmp169 * _tmp70 + _tmp171 * _tmp71 + state(14, 0);
+    _err_cov(5, 0) = -_tmp164 * _tmp167 - _tmp164 * state(22, 0) - _tmp165 * _tmp172 -
+                     _tmp165 * state(27, 0) - _tmp166 * _tmp170 - _tmp166 * state(18, 0) +
+                     _tmp168 * _tmp61 + _tmp169 * _tmp62 + _tmp171 * _tmp63 + state(15, 0);
+    _err_cov(6, 0) = -_tmp152 * _tmp179 - _tmp153 * _tmp181 - _tmp154 * _tmp178 + _tmp173 * _tmp55 +
+                     _tmp174 * state(16, 0) - _tmp175 * state(25, 0) + _tmp176 * _tmp51 -
+                     _tmp177 * state(20, 0) + _tmp180 * _tmp46;
+    _err_cov(7, 0) = -_tmp156 * _tmp178 - _tmp157 * _tmp179 - _tmp158 * _tmp181 + _tmp173 * _tmp69 +
+                     _tmp174 * state(17, 0) - _tmp175 * state(26, 0) + _tmp176 * _tmp71 -
+                     _tmp177 * state(21, 0) + _tmp180 * _tmp70;
+    _err_cov(8, 0) = -_tmp164 * _tmp178 - _tmp165 * _tmp181 - _tmp166 * _tmp179 + _tmp173 * _tmp61 +
+                     _tmp174 * state(18, 0) - _tmp175 * state(27, 0) + _tmp176 * _tmp63 -
+                     _tmp177 * state(22, 0) + _tmp180 * _tmp62;
+    _err_cov(9, 0) = _tmp112 * _tmp173 + _tmp113 * _tmp180 + _tmp114 * _tmp176 + _tmp174 * _tmp179 -
+                     _tmp175 * _tmp181 - _tmp177 * _tmp178;
+    _err_cov(10, 0) = -_tmp152 * _tmp189 - _tmp153 * _tmp187 - _tmp154 * _tmp186 -
+                      _tmp182 * state(16, 0) + _tmp183 * _tmp51 + _tmp184 * state(20, 0) -
+                      _tmp185 * state(25, 0) + _tmp188 * _tmp46 + _tmp190 * _tmp55;
+    _err_cov(11, 0) = -_tmp156 * _tmp186 - _tmp157 * _tmp189 - _tmp158 * _tmp187 -
+                      _tmp182 * state(17, 0) + _tmp183 * _tmp71 + _tmp184 * state(21, 0) -
+                      _tmp185 * state(26, 0) + _tmp188 * _tmp70 + _tmp190 * _tmp69;
+    _err_cov(12, 0) = -_tmp164 * _tmp186 - _tmp165 * _tmp187 - _tmp166 * _tmp189 -
+                      _tmp182 * state(18, 0) + _tmp183 * _tmp63 + _tmp184 * state(22, 0) -
+                      _tmp185 * state(27, 0) + _tmp188 * _tmp62 + _tmp190 * _tmp61;
+    _err_cov(13, 0) = _tmp112 * _tmp190 + _tmp113 * _tmp188 + _tmp114 * _tmp183 +
+                      _tmp174 * _tmp189 - _tmp175 * _tmp187 - _tmp177 * _tmp186;
+    _err_cov(14, 0) = _tmp101 * _tmp183 + _tmp102 * _tmp188 + _tmp103 * _tmp190 -
+                      _tmp182 * _tmp189 + _tmp184 * _tmp186 - _tmp185 * _tmp187;
+    _err_cov(15, 0) = -_tmp152 * _tmp198 - _tmp153 * _tmp196 - _tmp154 * _tmp199 +
+                      _tmp191 * state(25, 0) + _tmp192 * _tmp55 + _tmp193 * _tmp51 -
+                      _tmp194 * state(16, 0) - _tmp195 * state(20, 0) + _tmp197 * _tmp46;
+    _err_cov(16, 0) = -_tmp156 * _tmp199 - _tmp157 * _tmp198 - _tmp158 * _tmp196 +
+                      _tmp191 * state(26, 0) + _tmp192 * _tmp69 + _tmp193 * _tmp71 -
+                      _tmp194 * state(17, 0) - _tmp195 * state(21, 0) + _tmp197 * _tmp70;
+    _err_cov(17, 0) = -_tmp164 * _tmp199 - _tmp165 * _tmp196 - _tmp166 * _tmp198 +
+                      _tmp191 * state(27, 0) + _tmp192 * _tmp61 + _tmp193 * _tmp63 -
+                      _tmp194 * state(18, 0) - _tmp195 * state(22, 0) + _tmp197 * _tmp62;
+    _err_cov(18, 0) = _tmp112 * _tmp192 + _tmp113 * _tmp197 + _tmp114 * _tmp193 +
+                      _tmp174 * _tmp198 - _tmp175 * _tmp196 - _tmp177 * _tmp199;
+    _err_cov(19, 0) = _tmp101 * _tmp193 + _tmp102 * _tmp197 + _tmp103 * _tmp192 -
+                      _tmp182 * _tmp198 + _tmp184 * _tmp199 - _tmp185 * _tmp196;
+    _err_cov(20, 0) = _tmp191 * _tmp196 + _tmp192 * _tmp96 + _tmp193 * _tmp97 - _tmp194 * _tmp198 -
+                      _tmp195 * _tmp199 + _tmp197 * _tmp98;
+    _err_cov(21, 0) = -_tmp152 * _tmp206 - _tmp153 * _tmp204 - _tmp154 * _tmp203 -
+                      _tmp200 * state(16, 0) - _tmp201 * state(25, 0) - _tmp202 * state(20, 0) +
+                      _tmp205 * _tmp55 + _tmp207 * _tmp51 + _tmp208 * _tmp46 + state(31, 0);
+    _err_cov(22, 0) = -_tmp156 * _tmp203 - _tmp157 * _tmp206 - _tmp158 * _tmp204 -
+                      _tmp200 * state(17, 0) - _tmp201 * state(26, 0) - _tmp202 * state(21, 0) +
+                      _tmp205 * _tmp69 + _tmp207 * _tmp71 + _tmp208 * _tmp70 + state(32, 0);
+    _err_cov(23, 0) = -_tmp164 * _tmp203 - _tmp165 * _tmp204 - _tmp166 * _tmp206 -
+                      _tmp200 * state(18, 0) - _tmp201 * state(27, 0) - _tmp202 * state(22, 0) +
+                      _tmp205 * _tmp61 + _tmp207 * _tmp63 + _tmp208 * _tmp62 + state(33, 0);
+    _err_cov(24, 0) = _tmp112 * _tmp205 + _tmp113 * _tmp208 + _tmp114 * _tmp207 +
+                      _tmp174 * _tmp206 - _tmp175 * _tmp204 - _tmp177 * _tmp203;
+    _err_cov(25, 0) = _tmp101 * _tmp207 + _tmp102 * _tmp208 + _tmp103 * _tmp205 -
+                      _tmp182 * _tmp206 + _tmp184 * _tmp203 - _tmp185 * _tmp204;
+    _err_cov(26, 0) = _tmp191 * _tmp204 - _tmp194 * _tmp206 - _tmp195 * _tmp203 + _tmp205 * _tmp96 +
+                      _tmp207 * _tmp97 + _tmp208 * _tmp98;
+    _err_cov(27, 0) = _tmp138 * _tmp205 + _tmp139 * _tmp207 + _tmp140 * _tmp208 -
+                      _tmp200 * _tmp206 - _tmp200 * state(34, 0) - _tmp201 * _tmp204 -
+                      _tmp201 * state(36, 0) - _tmp202 * _tmp203 - _tmp202 * state(35, 0) +
+                      state(37, 0);
+    _err_cov(28, 0) = -_tmp152 * _tmp215 - _tmp153 * _tmp217 - _tmp154 * _tmp216 +
+                      _tmp209 * _tmp46 + _tmp210 * _tmp55 - _tmp211 * state(20, 0) -
+                      _tmp212 * state(16, 0) + _tmp213 * _tmp51 - _tmp214 * state(25, 0) +
+                      state(38, 0);
+    _err_cov(29, 0) = -_tmp156 * _tmp216 - _tmp157 * _tmp215 - _tmp158 * _tmp217 +
+                      _tmp209 * _tmp70 + _tmp210 * _tmp69 - _tmp211 * state(21, 0) -
+                      _tmp212 * state(17, 0) + _tmp213 * _tmp71 - _tmp214 * state(26, 0) +
+                      state(39, 0);
+    _err_cov(30, 0) = -_tmp164 * _tmp216 - _tmp165 * _tmp217 - _tmp166 * _tmp215 +
+                      _tmp209 * _tmp62 + _tmp210 * _tmp61 - _tmp211 * state(22, 0) -
+                      _tmp212 * state(18, 0) + _tmp213 * _tmp63 - _tmp214 * state(27, 0) +
+                      state(40, 0);
+    _err_cov(31, 0) = _tmp112 * _tmp210 + _tmp113 * _tmp209 + _tmp114 * _tmp213 +
+                      _tmp174 * _tmp215 - _tmp175 * _tmp217 - _tmp177 * _tmp216;
+    _err_cov(32, 0) = _tmp101 * _tmp213 + _tmp102 * _tmp209 + _tmp103 * _tmp210 -
+                      _tmp182 * _tmp215 + _tmp184 * _tmp216 - _tmp185 * _tmp217;
+    _err_cov(33, 0) = _tmp191 * _tmp217 - _tmp194 * _tmp215 - _tmp195 * _tmp216 + _tmp209 * _tmp98 +
+                      _tmp210 * _tmp96 + _tmp213 * _tmp97;
+    _err_cov(34, 0) = _tmp138 * _tmp210 + _tmp139 * _tmp213 + _tmp140 * _tmp209 -
+                      _tmp200 * _tmp215 - _tmp201 * _tmp217 - _tmp202 * _tmp216 -
+                      _tmp211 * state(35, 0) - _tmp212 * state(34, 0) - _tmp214 * state(36, 0) +
+                      state(44, 0);
+    _err_cov(35, 0) = _tmp145 * _tmp209 + _tmp146 * _tmp213 + _tmp147 * _tmp210 -
+                      _tmp211 * _tmp216 - _tmp211 * state(42, 0) - _tmp212 * _tmp215 -
+                      _tmp212 * state(41, 0) - _tmp214 * _tmp217 - _tmp214 * state(43, 0) +
+                      state(45, 0);
+    _err_cov(36, 0) = -_tmp152 * _tmp223 - _tmp153 * _tmp224 - _tmp154 * _tmp225 -
+                      _tmp218 * state(20, 0) - _tmp219 * state(16, 0) + _tmp220 * _tmp51 +
+                      _tmp221 * _tmp55 - _tmp222 * state(25, 0) + _tmp226 * _tmp46 + state(46, 0);
+    _err_cov(37, 0) = -_tmp156 * _tmp225 - _tmp157 * _tmp223 - _tmp158 * _tmp224 -
+                      _tmp218 * state(21, 0) - _tmp219 * state(17, 0) + _tmp220 * _tmp71 +
+                      _tmp221 * _tmp69 - _tmp222 * state(26, 0) + _tmp226 * _tmp70 + state(47, 0);
+    _err_cov(38, 0) = -_tmp164 * _tmp225 - _tmp165 * _tmp224 - _tmp166 * _tmp223 -
+                      _tmp218 * state(22, 0) - _tmp219 * state(18, 0) + _tmp220 * _tmp63 +
+                      _tmp221 * _tmp61 - _tmp222 * state(27, 0) + _tmp226 * _tmp62 + state(48, 0);
+    _err_cov(39, 0) = _tmp112 * _tmp221 + _tmp113 * _tmp226 + _tmp114 * _tmp220 +
+                      _tmp174 * _tmp223 - _tmp175 * _tmp224 - _tmp177 * _tmp225;
+    _err_cov(40, 0) = _tmp101 * _tmp220 + _tmp102 * _tmp226 + _tmp103 * _tmp221 -
+                      _tmp182 * _tmp223 + _tmp184 * _tmp225 - _tmp185 * _tmp224;
+    _err_cov(41, 0) = _tmp191 * _tmp224 - _tmp194 * _tmp223 - _tmp195 * _tmp225 + _tmp220 * _tmp97 +
+                      _tmp221 * _tmp96 + _tmp226 * _tmp98;
+    _err_cov(42, 0) = _tmp138 * _tmp221 + _tmp139 * _tmp220 + _tmp140 * _tmp226 -
+                      _tmp200 * _tmp223 - _tmp201 * _tmp224 - _tmp202 * _tmp225 -
+                      _tmp218 * state(35, 0) - _tmp219 * state(34, 0) - _tmp222 * state(36, 0) +
+                      state(52, 0);
+    _err_cov(43, 0) = _tmp145 * _tmp226 + _tmp146 * _tmp220 + _tmp147 * _tmp221 -
+                      _tmp211 * _tmp225 - _tmp212 * _tmp223 - _tmp214 * _tmp224 -
+                      _tmp218 * state(42, 0) - _tmp219 * state(41, 0) - _tmp222 * state(43, 0) +
+                      state(53, 0);
+    _err_cov(44, 0) = _tmp131 * _tmp220 + _tmp132 * _tmp226 + _tmp133 * _tmp221 -
+                      _tmp218 * _tmp225 - _tmp218 * state(50, 0) - _tmp219 * _tmp223 -
+                      _tmp219 * state(49, 0) - _tmp222 * _tmp224 - _tmp222 * state(51, 0) +
+                      state(54, 0);
+  }
+
+  if (imu_bias != nullptr) {
+    Eigen::Matrix<Scalar, 6, 1>& _imu_bias = (*imu_bias);
+
+    _imu_bias(0, 0) = state(55, 0);
+    _imu_bias(1, 0) = state(56, 0);
+    _imu_bias(2, 0) = state(57, 0);
+    _imu_bias(3, 0) = state(58, 0);
+    _imu_bias(4, 0) = state(59, 0);
+    _imu_bias(5, 0) = state(60, 0);
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -0,0 +1,202 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     a: Matrix10_1
+ *     b: Matrix10_1
+ *
+ * Outputs:
+ *     pose: Matrix10_1
+ *     D_a: Matrix99
+ *     D_b: Matrix99
+ */
+template <typename Scalar>
+void Pose23Compose(const Eigen::Matrix<Scalar, 10, 1>& a, const Eigen::Matrix<Scalar, 10, 1>& b,
+                   Eigen::Matrix<Scalar, 10, 1>* const pose = nullptr,
+                   Eigen::Matrix<Scalar, 9, 9>* const D_a = nullptr,
+                   Eigen::Matrix<Scalar, 9, 9>* const D_b = nullptr) {
+  // Total ops: 204
+
+  // Input arrays
+
+  // Intermediate terms (46)
+  const Scalar _tmp0 = 2 * a(0, 0) * a(2, 0);
+  const Scalar _tmp1 = 2 * a(1, 0);
+  const Scalar _tmp2 = _tmp1 * a(3, 0);
+  const Scalar _tmp3 = _tmp0 + _tmp2;
+  const Scalar _tmp4 = _tmp1 * a(0, 0);
+  const Scalar _tmp5 = 2 * a(3, 0);
+  const Scalar _tmp6 = _tmp5 * a(2, 0);
+  const Scalar _tmp7 = _tmp4 - _tmp6;
+  const Scalar _tmp8 = -2 * std::pow(a(2, 0), Scalar(2));
+  const Scalar _tmp9 = 1 - 2 * std::pow(a(1, 0), Scalar(2));
+  const Scalar _tmp10 = _tmp8 + _tmp9;
+  const Scalar _tmp11 = _tmp4 + _tmp6;
+  const Scalar _tmp12 = _tmp1 * a(2, 0);
+  const Scalar _tmp13 = _tmp5 * a(0, 0);
+  const Scalar _tmp14 = _tmp12 - _tmp13;
+  const Scalar _tmp15 = -2 * std::pow(a(0, 0), Scalar(2));
+  const Scalar _tmp16 = _tmp15 + _tmp8 + 1;
+  const Scalar _tmp17 = _tmp0 - _tmp2;
+  const Scalar _tmp18 = _tmp12 + _tmp13;
+  const Scalar _tmp19 = _tmp15 + _tmp9;
+  const Scalar _tmp20 = -2 * std::pow(b(1, 0), Scalar(2));
+  const Scalar _tmp21 = 1 - 2 * std::pow(b(2, 0), Scalar(2));
+  const Scalar _tmp22 = _tmp20 + _tmp21;
+  const Scalar _tmp23 = 2 * b(3, 0);
+  const Scalar _tmp24 = _tmp23 * b(2, 0);
+  const Scalar _tmp25 = 2 * b(0, 0);
+  const Scalar _tmp26 = _tmp25 * b(1, 0);
+  const Scalar _tmp27 = -_tmp24 + _tmp26;
+  const Scalar _tmp28 = _tmp25 * b(2, 0);
+  const Scalar _tmp29 = _tmp23 * b(1, 0);
+  const Scalar _tmp30 = _tmp28 + _tmp29;
+  const Scalar _tmp31 = _tmp25 * b(3, 0);
+  const Scalar _tmp32 = 2 * b(1, 0) * b(2, 0);
+  const Scalar _tmp33 = _tmp31 + _tmp32;
+  const Scalar _tmp34 = -2 * std::pow(b(0, 0), Scalar(2));
+  const Scalar _tmp35 = _tmp21 + _tmp34;
+  const Scalar _tmp36 = _tmp27 * b(4, 0) + _tmp33 * b(6, 0) + _tmp35 * b(5, 0);
+  const Scalar _tmp37 = -_tmp31 + _tmp32;
+  const Scalar _tmp38 = _tmp20 + _tmp34 + 1;
+  const Scalar _tmp39 = _tmp30 * b(4, 0) + _tmp37 * b(5, 0) + _tmp38 * b(6, 0);
+  const Scalar _tmp40 = _tmp28 - _tmp29;
+  const Scalar _tmp41 = _tmp24 + _tmp26;
+  const Scalar _tmp42 = _tmp22 * b(4, 0) + _tmp40 * b(6, 0) + _tmp41 * b(5, 0);
+  const Scalar _tmp43 = _tmp27 * b(7, 0) + _tmp33 * b(9, 0) + _tmp35 * b(8, 0);
+  const Scalar _tmp44 = _tmp30 * b(7, 0) + _tmp37 * b(8, 0) + _tmp38 * b(9, 0);
+  const Scalar _tmp45 = _tmp22 * b(7, 0) + _tmp40 * b(9, 0) + _tmp41 * b(8, 0);
+
+  // Output terms (3)
+  if (pose != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _pose = (*pose);
+
+    _pose(0, 0) = a(0, 0) * b(3, 0) + a(1, 0) * b(2, 0) - a(2, 0) * b(1, 0) + a(3, 0) * b(0, 0);
+    _pose(1, 0) = -a(0, 0) * b(2, 0) + a(1, 0) * b(3, 0) + a(2, 0) * b(0, 0) + a(3, 0) * b(1, 0);
+    _pose(2, 0) = a(0, 0) * b(1, 0) - a(1, 0) * b(0, 0) + a(2, 0) * b(3, 0) + a(3, 0) * b(2, 0);
+    _pose(3, 0) = -a(0, 0) * b(0, 0) - a(1, 0) * b(1, 0) - a(2, 0) * b(2, 0) + a(3, 0) * b(3, 0);
+    _pose(4, 0) = _tmp10 * b(4, 0) + _tmp3 * b(6, 0) + _tmp7 * b(5, 0) + a(4, 0);
+    _pose(5, 0) = _tmp11 * b(4, 0) + _tmp14 * b(6, 0) + _tmp16 * b(5, 0) + a(5, 0);
+    _pose(6, 0) = _tmp17 * b(4, 0) + _tmp18 * b(5, 0) + _tmp19 * b(6, 0) + a(6, 0);
+    _pose(7, 0) = _tmp10 * b(7, 0) + _tmp3 * b(9, 0) + _tmp7 * b(8, 0) + a(7, 0);
+    _pose(8, 0) = _tmp11 * b(7, 0) + _tmp14 * b(9, 0) + _tmp16 * b(8, 0) + a(8, 0);
+    _pose(9, 0) = _tmp17 * b(7, 0) + _tmp18 * b(8, 0) + _tmp19 * b(9, 0) + a(9, 0);
+  }
+
+  if (D_a != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_a = (*D_a);
+
+    _D_a(0, 0) = _tmp22;
+    _D_a(1, 0) = _tmp27;
+    _D_a(2, 0) = _tmp30;
+    _D_a(3, 0) = _tmp27 * _tmp39 - _tmp30 * _tmp36;
+    _D_a(4, 0) = -_tmp22 * _tmp39 + _tmp30 * _tmp42;
+    _D_a(5, 0) = _tmp22 * _tmp36 - _tmp27 * _tmp42;
+    _D_a(6, 0) = _tmp27 * _tmp44 - _tmp30 * _tmp43;
+    _D_a(7, 0) = -_tmp22 * _tmp44 + _tmp30 * _tmp45;
+    _D_a(8, 0) = _tmp22 * _tmp43 - _tmp27 * _tmp45;
+    _D_a(0, 1) = _tmp41;
+    _D_a(1, 1) = _tmp35;
+    _D_a(2, 1) = _tmp37;
+    _D_a(3, 1) = _tmp35 * _tmp39 - _tmp36 * _tmp37;
+    _D_a(4, 1) = _tmp37 * _tmp42 - _tmp39 * _tmp41;
+    _D_a(5, 1) = -_tmp35 * _tmp42 + _tmp36 * _tmp41;
+    _D_a(6, 1) = _tmp35 * _tmp44 - _tmp37 * _tmp43;
+    _D_a(7, 1) = _tmp37 * _tmp45 - _tmp41 * _tmp44;
+    _D_a(8, 1) = -_tmp35 * _tmp45 + _tmp41 * _tmp43;
+    _D_a(0, 2) = _tmp40;
+    _D_a(1, 2) = _tmp33;
+    _D_a(2, 2) = _tmp38;
+    _D_a(3, 2) = _tmp33 * _tmp39 - _tmp36 * _tmp38;
+    _D_a(4, 2) = _tmp38 * _tmp42 - _tmp39 * _tmp40;
+    _D_a(5, 2) = -_tmp33 * _tmp42 + _tmp36 * _tmp40;
+    _D_a(6, 2) = _tmp33 * _tmp44 - _tmp38 * _tmp43;
+    _D_a(7, 2) = _tmp38 * _tmp45 - _tmp40 * _tmp44;
+    _D_a(8, 2) = -_tmp33 * _tmp45 + _tmp40 * _tmp43;
+    _D_a(0, 3) = 0;
+    _D_a(1, 3) = 0;
+    _D_a(2, 3) = 0;
+    _D_a(3, 3) = _tmp22;
+    _D_a(4, 3) = _tmp27;
+    _D_a(5, 3) = _tmp30;
+    _D_a(6, 3) = 0;
+    _D_a(7, 3) = 0;
+    _D_a(8, 3) = 0;
+    _D_a(0, 4) = 0;
+    _D_a(1, 4) = 0;
+    _D_a(2, 4) = 0;
+    _D_a(3, 4) = _tmp41;
+    _D_a(4, 4) = _tmp35;
+    _D_a(5, 4) = _tmp37;
+    _D_a(6, 4) = 0;
+    _D_a(7, 4) = 0;
+    _D_a(8, 4) = 0;
+    _D_a(0, 5) = 0;
+    _D_a(1, 5) = 0;
+    _D_a(2, 5) = 0;
+    _D_a(3, 5) = _tmp40;
+    _D_a(4, 5) = _tmp33;
+    _D_a(5, 5) = _tmp38;
+    _D_a(6, 5) = 0;
+    _D_a(7, 5) = 0;
+    _D_a(8, 5) = 0;
+    _D_a(0, 6) = 0;
+    _D_a(1, 6) = 0;
+    _D_a(2, 6) = 0;
+    _D_a(3, 6) = 0;
+    _D_a(4, 6) = 0;
+    _D_a(5, 6) = 0;
+    _D_a(6, 6) = _tmp22;
+    _D_a(7, 6) = _tmp27;
+    _D_a(8, 6) = _tmp30;
+    _D_a(0, 7) = 0;
+    _D_a(1, 7) = 0;
+    _D_a(2, 7) = 0;
+    _D_a(3, 7) = 0;
+    _D_a(4, 7) = 0;
+    _D_a(5, 7) = 0;
+    _D_a(6, 7) = _tmp41;
+    _D_a(7, 7) = _tmp35;
+    _D_a(8, 7) = _tmp37;
+    _D_a(0, 8) = 0;
+    _D_a(1, 8) = 0;
+    _D_a(2, 8) = 0;
+    _D_a(3, 8) = 0;
+    _D_a(4, 8) = 0;
+    _D_a(5, 8) = 0;
+    _D_a(6, 8) = _tmp40;
+    _D_a(7, 8) = _tmp33;
+    _D_a(8, 8) = _tmp38;
+  }
+
+  if (D_b != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_b = (*D_b);
+
+    _D_b.setZero();
+
+    _D_b(0, 0) = 1;
+    _D_b(1, 1) = 1;
+    _D_b(2, 2) = 1;
+    _D_b(3, 3) = 1;
+    _D_b(4, 4) = 1;
+    _D_b(5, 5) = 1;
+    _D_b(6, 6) = 1;
+    _D_b(7, 7) = 1;
+    _D_b(8, 8) = 1;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -0,0 +1,271 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     vec: Matrix91
+ *
+ * Outputs:
+ *     pose: Matrix10_1
+ *     D_a: Matrix99
+ */
+template <typename Scalar>
+void Pose23Exp(const Eigen::Matrix<Scalar, 9, 1>& vec,
+               Eigen::Matrix<Scalar, 10, 1>* const pose = nullptr,
+               Eigen::Matrix<Scalar, 9, 9>* const D_a = nullptr) {
+  // Total ops: 454
+
+  // Input arrays
+
+  // Intermediate terms (106)
+  const Scalar _tmp0 = std::pow(vec(2, 0), Scalar(2));
+  const Scalar _tmp1 = std::pow(vec(1, 0), Scalar(2));
+  const Scalar _tmp2 = std::pow(vec(0, 0), Scalar(2));
+  const Scalar _tmp3 = _tmp0 + _tmp1 + _tmp2 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp4 = std::sqrt(_tmp3);
+  const Scalar _tmp5 = (Scalar(1) / Scalar(2)) * _tmp4;
+  const Scalar _tmp6 = std::sin(_tmp5) / _tmp4;
+  const Scalar _tmp7 = Scalar(0.050000000000000003) - _tmp4;
+  const Scalar _tmp8 = std::max<Scalar>(0, (((_tmp7) > 0) - ((_tmp7) < 0)));
+  const Scalar _tmp9 = std::pow(_tmp3, Scalar(2));
+  const Scalar _tmp10 = _tmp4 + _tmp7 * _tmp8;
+  const Scalar _tmp11 = std::pow(_tmp10, Scalar(2));
+  const Scalar _tmp12 = std::cos(_tmp10);
+  const Scalar _tmp13 = (1 - _tmp12) / _tmp11;
+  const Scalar _tmp14 = _tmp13 + _tmp8 * (-_tmp13 - Scalar(0.041666666666666664) * _tmp3 +
+                                          Scalar(0.0013888888888888889) * _tmp9 + Scalar(0.5));
+  const Scalar _tmp15 = _tmp14 * vec(2, 0);
+  const Scalar _tmp16 = std::sin(_tmp10);
+  const Scalar _tmp17 = (_tmp10 - _tmp16) / [&]() {
+    const Scalar base = _tmp10;
+    return base * base * base;
+  }();
+  const Scalar _tmp18 =
+      _tmp17 + _tmp8 * (-_tmp17 - Scalar(0.0083333333333333332) * _tmp3 +
+                        Scalar(0.00019841269841269841) * _tmp9 + Scalar(0.16666666666666666));
+  const Scalar _tmp19 = _tmp18 * vec(1, 0);
+  const Scalar _tmp20 = _tmp19 * vec(0, 0);
+  const Scalar _tmp21 = -_tmp15 + _tmp20;
+  const Scalar _tmp22 = _tmp14 * vec(1, 0);
+  const Scalar _tmp23 = _tmp18 * vec(0, 0) * vec(2, 0);
+  const Scalar _tmp24 = _tmp22 + _tmp23;
+  const Scalar _tmp25 = -_tmp1 * _tmp18;
+  const Scalar _tmp26 = -_tmp0 * _tmp18 + 1;
+  const Scalar _tmp27 = _tmp25 + _tmp26;
+  const Scalar _tmp28 = _tmp15 + _tmp20;
+  const Scalar _tmp29 = _tmp14 * vec(0, 0);
+  const Scalar _tmp30 = _tmp19 * vec(2, 0);
+  const Scalar _tmp31 = -_tmp29 + _tmp30;
+  const Scalar _tmp32 = -_tmp18 * _tmp2;
+  const Scalar _tmp33 = _tmp26 + _tmp32;
+  const Scalar _tmp34 = _tmp29 + _tmp30;
+  const Scalar _tmp35 = -_tmp22 + _tmp23;
+  const Scalar _tmp36 = _tmp25 + _tmp32 + 1;
+  const Scalar _tmp37 = vec(1, 0) * vec(4, 0);
+  const Scalar _tmp38 = -2 * _tmp37;
+  const Scalar _tmp39 = vec(2, 0) * vec(5, 0);
+  const Scalar _tmp40 = -2 * _tmp39;
+  const Scalar _tmp41 = (Scalar(1) / Scalar(2)) * (_tmp10 * _tmp12 + 2 * _tmp10 - 3 * _tmp16) /
+                        std::pow(_tmp10, Scalar(5));
+  const Scalar _tmp42 =
+      _tmp41 + _tmp8 * (-Scalar(0.00039682539682539683) * _tmp3 - _tmp41 +
+                        Scalar(8.2671957671957678e-6) * _tmp9 + Scalar(0.0083333333333333332));
+  const Scalar _tmp43 = vec(1, 0) * vec(5, 0);
+  const Scalar _tmp44 = vec(0, 0) * vec(3, 0);
+  const Scalar _tmp45 = -_tmp44;
+  const Scalar _tmp46 = -_tmp37;
+  const Scalar _tmp47 = _tmp45 + _tmp46;
+  const Scalar _tmp48 = -_tmp43 * vec(2, 0) + _tmp47 * vec(1, 0);
+  const Scalar _tmp49 = -_tmp39;
+  const Scalar _tmp50 = _tmp46 + _tmp49;
+  const Scalar _tmp51 = _tmp44 * vec(1, 0) - _tmp50 * vec(1, 0);
+  const Scalar _tmp52 = -_tmp48 * vec(1, 0) + _tmp51 * vec(1, 0);
+  const Scalar _tmp53 = _tmp45 + _tmp49;
+  const Scalar _tmp54 = _tmp37 * vec(2, 0) - _tmp53 * vec(2, 0);
+  const Scalar _tmp55 = -_tmp44 * vec(2, 0) + _tmp50 * vec(2, 0);
+  const Scalar _tmp56 = _tmp54 * vec(2, 0) - _tmp55 * vec(2, 0);
+  const Scalar _tmp57 =
+      (Scalar(1) / Scalar(2)) * (_tmp11 + 2 * _tmp12 - 2) / std::pow(_tmp10, Scalar(4));
+  const Scalar _tmp58 =
+      _tmp57 + _tmp8 * (-Scalar(0.0013888888888888889) * _tmp3 - _tmp57 +
+                        Scalar(2.4801587301587302e-5) * _tmp9 + Scalar(0.041666666666666664));
+  const Scalar _tmp59 = -_tmp0;
+  const Scalar _tmp60 = -_tmp2;
+  const Scalar _tmp61 = _tmp59 + _tmp60;
+  const Scalar _tmp62 = (Scalar(1) / Scalar(2)) * vec(5, 0);
+  const Scalar _tmp63 = vec(0, 0) * vec(4, 0);
+  const Scalar _tmp64 = _tmp53 * vec(0, 0) - _tmp63 * vec(1, 0);
+  const Scalar _tmp65 = _tmp63 + vec(1, 0) * vec(3, 0);
+  const Scalar _tmp66 = (Scalar(1) / Scalar(2)) * vec(4, 0);
+  const Scalar _tmp67 = -_tmp1;
+  const Scalar _tmp68 = _tmp60 + _tmp67;
+  const Scalar _tmp69 = vec(0, 0) * vec(5, 0);
+  const Scalar _tmp70 = _tmp69 + vec(2, 0) * vec(3, 0);
+  const Scalar _tmp71 = -_tmp47 * vec(0, 0) + _tmp69 * vec(2, 0);
+  const Scalar _tmp72 = vec(1, 0) * vec(7, 0);
+  const Scalar _tmp73 = -2 * _tmp72;
+  const Scalar _tmp74 = vec(2, 0) * vec(8, 0);
+  const Scalar _tmp75 = -2 * _tmp74;
+  const Scalar _tmp76 = vec(0, 0) * vec(6, 0);
+  const Scalar _tmp77 = -_tmp76;
+  const Scalar _tmp78 = -_tmp74;
+  const Scalar _tmp79 = _tmp77 + _tmp78;
+  const Scalar _tmp80 = _tmp72 * vec(2, 0) - _tmp79 * vec(2, 0);
+  const Scalar _tmp81 = vec(2, 0) * vec(6, 0);
+  const Scalar _tmp82 = -_tmp72;
+  const Scalar _tmp83 = _tmp78 + _tmp82;
+  const Scalar _tmp84 = -_tmp81 * vec(0, 0) + _tmp83 * vec(2, 0);
+  const Scalar _tmp85 = _tmp80 * vec(2, 0) - _tmp84 * vec(2, 0);
+  const Scalar _tmp86 = _tmp77 + _tmp82;
+  const Scalar _tmp87 = -_tmp74 * vec(1, 0) + _tmp86 * vec(1, 0);
+  const Scalar _tmp88 = vec(1, 0) * vec(6, 0);
+  const Scalar _tmp89 = -_tmp83 * vec(1, 0) + _tmp88 * vec(0, 0);
+  const Scalar _tmp90 = -_tmp87 * vec(1, 0) + _tmp89 * vec(1, 0);
+  const Scalar _tmp91 = (Scalar(1) / Scalar(2)) * vec(8, 0);
+  const Scalar _tmp92 = -_tmp72 * vec(0, 0) + _tmp79 * vec(0, 0);
+  const Scalar _tmp93 = _tmp88 + vec(0, 0) * vec(7, 0);
+  const Scalar _tmp94 = (Scalar(1) / Scalar(2)) * vec(7, 0);
+  const Scalar _tmp95 = _tmp74 * vec(0, 0) - _tmp86 * vec(0, 0);
+  const Scalar _tmp96 = _tmp81 + vec(0, 0) * vec(8, 0);
+  const Scalar _tmp97 = _tmp59 + _tmp67;
+  const Scalar _tmp98 = -2 * _tmp44;
+  const Scalar _tmp99 = -_tmp64 * vec(0, 0) + _tmp71 * vec(0, 0);
+  const Scalar _tmp100 = (Scalar(1) / Scalar(2)) * vec(3, 0);
+  const Scalar _tmp101 = _tmp43 + vec(2, 0) * vec(4, 0);
+  const Scalar _tmp102 = -2 * _tmp76;
+  const Scalar _tmp103 = -_tmp92 * vec(0, 0) + _tmp95 * vec(0, 0);
+  const Scalar _tmp104 = (Scalar(1) / Scalar(2)) * vec(6, 0);
+  const Scalar _tmp105 = vec(1, 0) * vec(8, 0) + vec(2, 0) * vec(7, 0);
+
+  // Output terms (2)
+  if (pose != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _pose = (*pose);
+
+    _pose(0, 0) = _tmp6 * vec(0, 0);
+    _pose(1, 0) = _tmp6 * vec(1, 0);
+    _pose(2, 0) = _tmp6 * vec(2, 0);
+    _pose(3, 0) = std::cos(_tmp5);
+    _pose(4, 0) = _tmp21 * vec(4, 0) + _tmp24 * vec(5, 0) + _tmp27 * vec(3, 0);
+    _pose(5, 0) = _tmp28 * vec(3, 0) + _tmp31 * vec(5, 0) + _tmp33 * vec(4, 0);
+    _pose(6, 0) = _tmp34 * vec(4, 0) + _tmp35 * vec(3, 0) + _tmp36 * vec(5, 0);
+    _pose(7, 0) = _tmp21 * vec(7, 0) + _tmp24 * vec(8, 0) + _tmp27 * vec(6, 0);
+    _pose(8, 0) = _tmp28 * vec(6, 0) + _tmp31 * vec(8, 0) + _tmp33 * vec(7, 0);
+    _pose(9, 0) = _tmp34 * vec(7, 0) + _tmp35 * vec(6, 0) + _tmp36 * vec(8, 0);
+  }
+
+  if (D_a != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_a = (*D_a);
+
+    _D_a(0, 0) = _tmp27;
+    _D_a(1, 0) = _tmp21;
+    _D_a(2, 0) = _tmp24;
+    _D_a(3, 0) = _tmp18 * (_tmp38 + _tmp40) + _tmp42 * (_tmp52 + _tmp56);
+    _D_a(4, 0) = _tmp18 * (_tmp54 + _tmp65) + _tmp42 * (_tmp48 * vec(0, 0) + _tmp64 * vec(1, 0)) +
+                 _tmp58 * (_tmp1 * vec(5, 0) - 2 * _tmp54 - _tmp61 * vec(5, 0)) - _tmp62;
+    _D_a(5, 0) = _tmp18 * (_tmp48 + _tmp70) + _tmp42 * (-_tmp54 * vec(0, 0) - _tmp71 * vec(2, 0)) +
+                 _tmp58 * (-_tmp0 * vec(4, 0) - 2 * _tmp48 + _tmp68 * vec(4, 0)) + _tmp66;
+    _D_a(6, 0) = _tmp18 * (_tmp73 + _tmp75) + _tmp42 * (_tmp85 + _tmp90);
+    _D_a(7, 0) = _tmp18 * (_tmp80 + _tmp93) + _tmp42 * (_tmp87 * vec(0, 0) + _tmp92 * vec(1, 0)) +
+                 _tmp58 * (_tmp1 * vec(8, 0) - _tmp61 * vec(8, 0) - 2 * _tmp80) - _tmp91;
+    _D_a(8, 0) = _tmp18 * (_tmp87 + _tmp96) + _tmp42 * (-_tmp80 * vec(0, 0) - _tmp95 * vec(2, 0)) +
+                 _tmp58 * (-_tmp0 * vec(7, 0) + _tmp68 * vec(7, 0) - 2 * _tmp87) + _tmp94;
+    _D_a(0, 1) = _tmp28;
+    _D_a(1, 1) = _tmp33;
+    _D_a(2, 1) = _tmp31;
+    _D_a(3, 1) = _tmp18 * (_tmp55 + _tmp65) + _tmp42 * (-_tmp51 * vec(0, 0) - _tmp71 * vec(1, 0)) +
+                 _tmp58 * (-_tmp2 * vec(5, 0) - 2 * _tmp55 + _tmp97 * vec(5, 0)) + _tmp62;
+    _D_a(4, 1) = _tmp18 * (_tmp40 + _tmp98) + _tmp42 * (_tmp56 + _tmp99);
+    _D_a(5, 1) = -_tmp100 + _tmp18 * (_tmp101 + _tmp71) +
+                 _tmp42 * (_tmp48 * vec(2, 0) + _tmp55 * vec(1, 0)) +
+                 _tmp58 * (_tmp0 * vec(3, 0) - _tmp68 * vec(3, 0) - 2 * _tmp71);
+    _D_a(6, 1) = _tmp18 * (_tmp84 + _tmp93) + _tmp42 * (-_tmp89 * vec(0, 0) - _tmp95 * vec(1, 0)) +
+                 _tmp58 * (-_tmp2 * vec(8, 0) - 2 * _tmp84 + _tmp97 * vec(8, 0)) + _tmp91;
+    _D_a(7, 1) = _tmp18 * (_tmp102 + _tmp75) + _tmp42 * (_tmp103 + _tmp85);
+    _D_a(8, 1) = -_tmp104 + _tmp18 * (_tmp105 + _tmp95) +
+                 _tmp42 * (_tmp84 * vec(1, 0) + _tmp87 * vec(2, 0)) +
+                 _tmp58 * (_tmp0 * vec(6, 0) - _tmp68 * vec(6, 0) - 2 * _tmp95);
+    _D_a(0, 2) = _tmp35;
+    _D_a(1, 2) = _tmp34;
+    _D_a(2, 2) = _tmp36;
+    _D_a(3, 2) = _tmp18 * (_tmp51 + _tmp70) + _tmp42 * (_tmp55 * vec(0, 0) + _tmp64 * vec(2, 0)) +
+                 _tmp58 * (_tmp2 * vec(4, 0) - 2 * _tmp51 - _tmp97 * vec(4, 0)) - _tmp66;
+    _D_a(4, 2) = _tmp100 + _tmp18 * (_tmp101 + _tmp64) +
+                 _tmp42 * (-_tmp51 * vec(2, 0) - _tmp54 * vec(1, 0)) +
+                 _tmp58 * (-_tmp1 * vec(3, 0) + _tmp61 * vec(3, 0) - 2 * _tmp64);
+    _D_a(5, 2) = _tmp18 * (_tmp38 + _tmp98) + _tmp42 * (_tmp52 + _tmp99);
+    _D_a(6, 2) = _tmp18 * (_tmp89 + _tmp96) + _tmp42 * (_tmp84 * vec(0, 0) + _tmp92 * vec(2, 0)) +
+                 _tmp58 * (_tmp2 * vec(7, 0) - 2 * _tmp89 - _tmp97 * vec(7, 0)) - _tmp94;
+    _D_a(7, 2) = _tmp104 + _tmp18 * (_tmp105 + _tmp92) +
+                 _tmp42 * (-_tmp80 * vec(1, 0) - _tmp89 * vec(2, 0)) +
+                 _tmp58 * (-_tmp1 * vec(6, 0) + _tmp61 * vec(6, 0) - 2 * _tmp92);
+    _D_a(8, 2) = _tmp18 * (_tmp102 + _tmp73) + _tmp42 * (_tmp103 + _tmp90);
+    _D_a(0, 3) = 0;
+    _D_a(1, 3) = 0;
+    _D_a(2, 3) = 0;
+    _D_a(3, 3) = _tmp27;
+    _D_a(4, 3) = _tmp21;
+    _D_a(5, 3) = _tmp24;
+    _D_a(6, 3) = 0;
+    _D_a(7, 3) = 0;
+    _D_a(8, 3) = 0;
+    _D_a(0, 4) = 0;
+    _D_a(1, 4) = 0;
+    _D_a(2, 4) = 0;
+    _D_a(3, 4) = _tmp28;
+    _D_a(4, 4) = _tmp33;
+    _D_a(5, 4) = _tmp31;
+    _D_a(6, 4) = 0;
+    _D_a(7, 4) = 0;
+    _D_a(8, 4) = 0;
+    _D_a(0, 5) = 0;
+    _D_a(1, 5) = 0;
+    _D_a(2, 5) = 0;
+    _D_a(3, 5) = _tmp35;
+    _D_a(4, 5) = _tmp34;
+    _D_a(5, 5) = _tmp36;
+    _D_a(6, 5) = 0;
+    _D_a(7, 5) = 0;
+    _D_a(8, 5) = 0;
+    _D_a(0, 6) = 0;
+    _D_a(1, 6) = 0;
+    _D_a(2, 6) = 0;
+    _D_a(3, 6) = 0;
+    _D_a(4, 6) = 0;
+    _D_a(5, 6) = 0;
+    _D_a(6, 6) = _tmp27;
+    _D_a(7, 6) = _tmp21;
+    _D_a(8, 6) = _tmp24;
+    _D_a(0, 7) = 0;
+    _D_a(1, 7) = 0;
+    _D_a(2, 7) = 0;
+    _D_a(3, 7) = 0;
+    _D_a(4, 7) = 0;
+    _D_a(5, 7) = 0;
+    _D_a(6, 7) = _tmp28;
+    _D_a(7, 7) = _tmp33;
+    _D_a(8, 7) = _tmp31;
+    _D_a(0, 8) = 0;
+    _D_a(1, 8) = 0;
+    _D_a(2, 8) = 0;
+    _D_a(3, 8) = 0;
+    _D_a(4, 8) = 0;
+    _D_a(5, 8) = 0;
+    _D_a(6, 8) = _tmp35;
+    _D_a(7, 8) = _tmp34;
+    _D_a(8, 8) = _tmp36;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
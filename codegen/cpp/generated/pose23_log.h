@@ -0,0 +1,326 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     a: Matrix10_1
+ *
+ * Outputs:
+ *     tangent: Matrix91
+ *     D_a: Matrix99
+ */
+template <typename Scalar>
+void Pose23Log(const Eigen::Matrix<Scalar, 10, 1>& a,
+               Eigen::Matrix<Scalar, 9, 1>* const tangent = nullptr,
+               Eigen::Matrix<Scalar, 9, 9>* const D_a = nullptr) {
+  // Total ops: 677
+
+  // Input arrays
+
+  // Intermediate terms (155)
+  const Scalar _tmp0 = std::copysign(Scalar(1.0), a(3, 0));
+  const Scalar _tmp1 = std::min<Scalar>(Scalar(0.99999899999999997), std::fabs(a(3, 0)));
+  const Scalar _tmp2 = 1 - std::pow(_tmp1, Scalar(2));
+  const Scalar _tmp3 = std::acos(_tmp1);
+  const Scalar _tmp4 = _tmp0 * _tmp3 / std::sqrt(_tmp2);
+  const Scalar _tmp5 = _tmp4 * a(0, 0);
+  const Scalar _tmp6 = 2 * _tmp5;
+  const Scalar _tmp7 = _tmp4 * a(1, 0);
+  const Scalar _tmp8 = 2 * _tmp7;
+  const Scalar _tmp9 = _tmp4 * a(2, 0);
+  const Scalar _tmp10 = 2 * _tmp9;
+  const Scalar _tmp11 = 4 * std::pow(_tmp0, Scalar(2)) * std::pow(_tmp3, Scalar(2)) / _tmp2;
+  const Scalar _tmp12 = _tmp11 * a(1, 0);
+  const Scalar _tmp13 = _tmp11 * std::pow(a(0, 0), Scalar(2));
+  const Scalar _tmp14 = _tmp11 * std::pow(a(2, 0), Scalar(2));
+  const Scalar _tmp15 = _tmp11 * std::pow(a(1, 0), Scalar(2));
+  const Scalar _tmp16 = _tmp13 + _tmp14 + _tmp15 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp17 = std::sqrt(_tmp16);
+  const Scalar _tmp18 = Scalar(0.050000000000000003) - _tmp17;
+  const Scalar _tmp19 = std::max<Scalar>(0, (((_tmp18) > 0) - ((_tmp18) < 0)));
+  const Scalar _tmp20 = _tmp17 + _tmp18 * _tmp19;
+  const Scalar _tmp21 = std::pow(_tmp20, Scalar(2));
+  const Scalar _tmp22 = (Scalar(1) / Scalar(2)) * _tmp20;
+  const Scalar _tmp23 = (-_tmp22 * std::cos(_tmp22) / std::sin(_tmp22) + 1) / _tmp21;
+  const Scalar _tmp24 = Scalar(0.0013888888888888889) * _tmp16;
+  const Scalar _tmp25 = std::pow(_tmp16, Scalar(2));
+  const Scalar _tmp26 = _tmp19 * (-_tmp23 + _tmp24 + Scalar(3.3068783068783071e-5) * _tmp25 +
+                                  Scalar(0.083333333333333329)) +
+                        _tmp23;
+  const Scalar _tmp27 = _tmp26 * a(0, 0);
+  const Scalar _tmp28 = _tmp12 * _tmp27;
+  const Scalar _tmp29 = _tmp28 + _tmp9;
+  const Scalar _tmp30 = _tmp11 * a(2, 0);
+  const Scalar _tmp31 = _tmp27 * _tmp30;
+  const Scalar _tmp32 = _tmp31 - _tmp7;
+  const Scalar _tmp33 = -_tmp14 * _tmp26;
+  const Scalar _tmp34 = -_tmp15 * _tmp26;
+  const Scalar _tmp35 = _tmp33 + _tmp34 + 1;
+  const Scalar _tmp36 = _tmp29 * a(5, 0) + _tmp32 * a(6, 0) + _tmp35 * a(4, 0);
+  const Scalar _tmp37 = _tmp28 - _tmp9;
+  const Scalar _tmp38 = -_tmp13 * _tmp26 + 1;
+  const Scalar _tmp39 = _tmp33 + _tmp38;
+  const Scalar _tmp40 = _tmp12 * a(2, 0);
+  const Scalar _tmp41 = _tmp26 * _tmp40;
+  const Scalar _tmp42 = _tmp41 + _tmp5;
+  const Scalar _tmp43 = _tmp37 * a(4, 0) + _tmp39 * a(5, 0) + _tmp42 * a(6, 0);
+  const Scalar _tmp44 = _tmp34 + _tmp38;
+  const Scalar _tmp45 = _tmp31 + _tmp7;
+  const Scalar _tmp46 = _tmp41 - _tmp5;
+  const Scalar _tmp47 = _tmp44 * a(6, 0) + _tmp45 * a(4, 0) + _tmp46 * a(5, 0);
+  const Scalar _tmp48 = _tmp29 * a(8, 0) + _tmp32 * a(9, 0) + _tmp35 * a(7, 0);
+  const Scalar _tmp49 = _tmp37 * a(7, 0) + _tmp39 * a(8, 0) + _tmp42 * a(9, 0);
+  const Scalar _tmp50 = _tmp44 * a(9, 0) + _tmp45 * a(7, 0) + _tmp46 * a(8, 0);
+  const Scalar _tmp51 = std::sin(_tmp20);
+  const Scalar _tmp52 = std::cos(_tmp20);
+  const Scalar _tmp53 = (Scalar(1) / Scalar(2)) * (_tmp20 * _tmp52 + 2 * _tmp20 - 3 * _tmp51) /
+                        std::pow(_tmp20, Scalar(5));
+  const Scalar _tmp54 =
+      _tmp19 * (-Scalar(0.00039682539682539683) * _tmp16 + Scalar(8.2671957671957678e-6) * _tmp25 -
+                _tmp53 + Scalar(0.0083333333333333332)) +
+      _tmp53;
+  const Scalar _tmp55 = -_tmp43 * _tmp8;
+  const Scalar _tmp56 = -_tmp36 * _tmp6;
+  const Scalar _tmp57 = _tmp55 + _tmp56;
+  const Scalar _tmp58 = -_tmp40 * _tmp47 + _tmp57 * _tmp8;
+  const Scalar _tmp59 = _tmp12 * a(0, 0);
+  const Scalar _tmp60 = -_tmp10 * _tmp47;
+  const Scalar _tmp61 = _tmp56 + _tmp60;
+  const Scalar _tmp62 = -_tmp43 * _tmp59 + _tmp6 * _tmp61;
+  const Scalar _tmp63 = (Scalar(1) / Scalar(2)) * _tmp47;
+  const Scalar _tmp64 = (_tmp20 - _tmp51) / [&]() {
+    const Scalar base = _tmp20;
+    return base * base * base;
+  }();
+  const Scalar _tmp65 =
+      _tmp19 * (-Scalar(0.0083333333333333332) * _tmp16 + Scalar(0.00019841269841269841) * _tmp25 -
+                _tmp64 + Scalar(0.16666666666666666)) +
+      _tmp64;
+  const Scalar _tmp66 = -_tmp10 * _tmp61 + _tmp40 * _tmp43;
+  const Scalar _tmp67 = _tmp36 * _tmp8 + _tmp43 * _tmp6;
+  const Scalar _tmp68 =
+      (Scalar(1) / Scalar(2)) * (_tmp21 + 2 * _tmp52 - 2) / std::pow(_tmp20, Scalar(4));
+  const Scalar _tmp69 = _tmp19 * (-_tmp24 + Scalar(2.4801587301587302e-5) * _tmp25 - _tmp68 +
+                                  Scalar(0.041666666666666664)) +
+                        _tmp68;
+  const Scalar _tmp70 = -_tmp13;
+  const Scalar _tmp71 = -_tmp14;
+  const Scalar _tmp72 = _tmp70 + _tmp71;
+  const Scalar _tmp73 = _tmp54 * (_tmp58 * _tmp6 + _tmp62 * _tmp8) - _tmp63 +
+                        _tmp65 * (_tmp66 + _tmp67) +
+                        _tmp69 * (_tmp15 * _tmp47 - _tmp47 * _tmp72 - 2 * _tmp66);
+  const Scalar _tmp74 = _tmp30 * a(0, 0);
+  const Scalar _tmp75 = _tmp47 * _tmp74 - _tmp57 * _tmp6;
+  const Scalar _tmp76 = _tmp10 * _tmp36 + _tmp47 * _tmp6;
+  const Scalar _tmp77 = (Scalar(1) / Scalar(2)) * _tmp43;
+  const Scalar _tmp78 = -_tmp15;
+  const Scalar _tmp79 = _tmp70 + _tmp78;
+  const Scalar _tmp80 = _tmp54 * (-_tmp10 * _tmp75 - _tmp6 * _tmp66) + _tmp65 * (_tmp58 + _tmp76) +
+                        _tmp69 * (-_tmp14 * _tmp43 + _tmp43 * _tmp79 - 2 * _tmp58) + _tmp77;
+  const Scalar _tmp81 = 4 * _tmp7;
+  const Scalar _tmp82 = -_tmp43 * _tmp81;
+  const Scalar _tmp83 = 4 * _tmp9;
+  const Scalar _tmp84 = -_tmp47 * _tmp83;
+  const Scalar _tmp85 = _tmp55 + _tmp60;
+  const Scalar _tmp86 = _tmp10 * _tmp85 - _tmp36 * _tmp74;
+  const Scalar _tmp87 = _tmp10 * _tmp66 - _tmp10 * _tmp86;
+  const Scalar _tmp88 = _tmp36 * _tmp59 - _tmp8 * _tmp85;
+  const Scalar _tmp89 = -_tmp58 * _tmp8 + _tmp8 * _tmp88;
+  const Scalar _tmp90 = _tmp54 * (_tmp87 + _tmp89) + _tmp65 * (_tmp82 + _tmp84);
+  const Scalar _tmp91 = -_tmp35 * _tmp90 - _tmp37 * _tmp73 - _tmp45 * _tmp80;
+  const Scalar _tmp92 = _tmp71 + _tmp78;
+  const Scalar _tmp93 = _tmp54 * (-_tmp6 * _tmp88 - _tmp75 * _tmp8) + _tmp63 +
+                        _tmp65 * (_tmp67 + _tmp86) +
+                        _tmp69 * (-_tmp13 * _tmp47 + _tmp47 * _tmp92 - 2 * _tmp86);
+  const Scalar _tmp94 = (Scalar(1) / Scalar(2)) * _tmp36;
+  const Scalar _tmp95 = _tmp10 * _tmp43 + _tmp47 * _tmp8;
+  const Scalar _tmp96 = _tmp54 * (_tmp10 * _tmp58 + _tmp8 * _tmp86) + _tmp65 * (_tmp75 + _tmp95) +
+                        _tmp69 * (_tmp14 * _tmp36 - _tmp36 * _tmp79 - 2 * _tmp75) - _tmp94;
+  const Scalar _tmp97 = 4 * _tmp5;
+  const Scalar _tmp98 = -_tmp36 * _tmp97;
+  const Scalar _tmp99 = -_tmp6 * _tmp62 + _tmp6 * _tmp75;
+  const Scalar _tmp100 = _tmp54 * (_tmp87 + _tmp99) + _tmp65 * (_tmp84 + _tmp98);
+  const Scalar _tmp101 = -_tmp100 * _tmp37 - _tmp35 * _tmp93 - _tmp45 * _tmp96;
+  const Scalar _tmp102 = _tmp54 * (_tmp10 * _tmp62 + _tmp6 * _tmp86) + _tmp65 * (_tmp76 + _tmp88) +
+                         _tmp69 * (_tmp13 * _tmp43 - _tmp43 * _tmp92 - 2 * _tmp88) - _tmp77;
+  const Scalar _tmp103 = _tmp54 * (_tmp89 + _tmp99) + _tmp65 * (_tmp82 + _tmp98);
+  const Scalar _tmp104 = _tmp54 * (-_tmp10 * _tmp88 - _tmp66 * _tmp8) + _tmp65 * (_tmp62 + _tmp95) +
+                         _tmp69 * (-_tmp15 * _tmp36 + _tmp36 * _tmp72 - 2 * _tmp62) + _tmp94;
+  const Scalar _tmp105 = -_tmp102 * _tmp35 - _tmp103 * _tmp45 - _tmp104 * _tmp37;
+  const Scalar _tmp106 = -_tmp100 * _tmp39 - _tmp29 * _tmp93 - _tmp46 * _tmp96;
+  const Scalar _tmp107 = -_tmp29 * _tmp90 - _tmp39 * _tmp73 - _tmp46 * _tmp80;
+  const Scalar _tmp108 = -_tmp102 * _tmp29 - _tmp103 * _tmp46 - _tmp104 * _tmp39;
+  const Scalar _tmp109 = -_tmp100 * _tmp42 - _tmp32 * _tmp93 - _tmp44 * _tmp96;
+  const Scalar _tmp110 = -_tmp102 * _tmp32 - _tmp103 * _tmp44 - _tmp104 * _tmp42;
+  const Scalar _tmp111 = -_tmp32 * _tmp90 - _tmp42 * _tmp73 - _tmp44 * _tmp80;
+  const Scalar _tmp112 = -_tmp48 * _tmp6;
+  const Scalar _tmp113 = -_tmp10 * _tmp50;
+  const Scalar _tmp114 = _tmp112 + _tmp113;
+  const Scalar _tmp115 = -_tmp10 * _tmp114 + _tmp40 * _tmp49;
+  const Scalar _tmp116 = (Scalar(1) / Scalar(2)) * _tmp50;
+  const Scalar _tmp117 = -_tmp49 * _tmp8;
+  const Scalar _tmp118 = _tmp112 + _tmp117;
+  const Scalar _tmp119 = _tmp118 * _tmp8 - _tmp40 * _tmp50;
+  const Scalar _tmp120 = _tmp114 * _tmp6 - _tmp49 * _tmp59;
+  const Scalar _tmp121 = _tmp48 * _tmp8 + _tmp49 * _tmp6;
+  const Scalar _tmp122 = -_tmp116 + _tmp54 * (_tmp119 * _tmp6 + _tmp120 * _tmp8) +
+                         _tmp65 * (_tmp115 + _tmp121) +
+                         _tmp69 * (-2 * _tmp115 + _tmp15 * _tmp50 - _tmp50 * _tmp72);
+  const Scalar _tmp123 = (Scalar(1) / Scalar(2)) * _tmp49;
+  const Scalar _tmp124 = -_tmp118 * _tmp6 + _tmp50 * _tmp74;
+  const Scalar _tmp125 = _tmp10 * _tmp48 + _tmp50 * _tmp6;
+  const Scalar _tmp126 = _tmp123 + _tmp54 * (-_tmp10 * _tmp124 - _tmp115 * _tmp6) +
+                         _tmp65 * (_tmp119 + _tmp125) +
+                         _tmp69 * (-2 * _tmp119 - _tmp14 * _tmp49 + _tmp49 * _tmp79);
+  const Scalar _tmp127 = _tmp113 + _tmp117;
+  const Scalar _tmp128 = _tmp48 * a(0, 0);
+  const Scalar _tmp129 = _tmp10 * _tmp127 - _tmp128 * _tmp30;
+  const Scalar _tmp130 = _tmp10 * _tmp115 - _tmp10 * _tmp129;
+  const Scalar _tmp131 = _tmp12 * _tmp128 - _tmp127 * _tmp8;
+  const Scalar _tmp132 = -_tmp119 * _tmp8 + _tmp131 * _tmp8;
+  const Scalar _tmp133 = -_tmp49 * _tmp81;
+  const Scalar _tmp134 = -_tmp50 * _tmp83;
+  const Scalar _tmp135 = _tmp54 * (_tmp130 + _tmp132) + _tmp65 * (_tmp133 + _tmp134);
+  const Scalar _tmp136 = -_tmp122 * _tmp37 - _tmp126 * _tmp45 - _tmp135 * _tmp35;
+  const Scalar _tmp137 = (Scalar(1) / Scalar(2)) * _tmp48;
+  const Scalar _tmp138 = _tmp10 * _tmp49 + _tmp50 * _tmp8;
+  const Scalar _tmp139 = -_tmp137 + _tmp54 * (_tmp10 * _tmp119 + _tmp129 * _tmp8) +
+                         _tmp65 * (_tmp124 + _tmp138) +
+                         _tmp69 * (-2 * _tmp124 + _tmp14 * _tmp48 - _tmp48 * _tmp79);
+  const Scalar _tmp140 = _tmp116 + _tmp54 * (-_tmp124 * _tmp8 - _tmp131 * _tmp6) +
+                         _tmp65 * (_tmp121 + _tmp129) +
+                         _tmp69 * (-2 * _tmp129 - _tmp13 * _tmp50 + _tmp50 * _tmp92);
+  const Scalar _tmp141 = -_tmp120 * _tmp6 + _tmp124 * _tmp6;
+  const Scalar _tmp142 = -_tmp48 * _tmp97;
+  const Scalar _tmp143 = _tmp54 * (_tmp130 + _tmp141) + _tmp65 * (_tmp134 + _tmp142);
+  const Scalar _tmp144 = -_tmp139 * _tmp45 - _tmp140 * _tmp35 - _tmp143 * _tmp37;
+  const Scalar _tmp145 = _tmp137 + _tmp54 * (-_tmp10 * _tmp131 - _tmp115 * _tmp8) +
+                         _tmp65 * (_tmp120 + _tmp138) +
+                         _tmp69 * (-2 * _tmp120 - _tmp15 * _tmp48 + _tmp48 * _tmp72);
+  const Scalar _tmp146 = -_tmp123 + _tmp54 * (_tmp10 * _tmp120 + _tmp129 * _tmp6) +
+                         _tmp65 * (_tmp125 + _tmp131) +
+                         _tmp69 * (_tmp13 * _tmp49 - 2 * _tmp131 - _tmp49 * _tmp92);
+  const Scalar _tmp147 = _tmp54 * (_tmp132 + _tmp141) + _tmp65 * (_tmp133 + _tmp142);
+  const Scalar _tmp148 = -_tmp145 * _tmp37 - _tmp146 * _tmp35 - _tmp147 * _tmp45;
+  const Scalar _tmp149 = -_tmp122 * _tmp39 - _tmp126 * _tmp46 - _tmp135 * _tmp29;
+  const Scalar _tmp150 = -_tmp139 * _tmp46 - _tmp140 * _tmp29 - _tmp143 * _tmp39;
+  const Scalar _tmp151 = -_tmp145 * _tmp39 - _tmp146 * _tmp29 - _tmp147 * _tmp46;
+  const Scalar _tmp152 = -_tmp139 * _tmp44 - _tmp140 * _tmp32 - _tmp143 * _tmp42;
+  const Scalar _tmp153 = -_tmp145 * _tmp42 - _tmp146 * _tmp32 - _tmp147 * _tmp44;
+  const Scalar _tmp154 = -_tmp122 * _tmp42 - _tmp126 * _tmp44 - _tmp135 * _tmp32;
+
+  // Output terms (2)
+  if (tangent != nullptr) {
+    Eigen::Matrix<Scalar, 9, 1>& _tangent = (*tangent);
+
+    _tangent(0, 0) = _tmp6;
+    _tangent(1, 0) = _tmp8;
+    _tangent(2, 0) = _tmp10;
+    _tangent(3, 0) = _tmp36;
+    _tangent(4, 0) = _tmp43;
+    _tangent(5, 0) = _tmp47;
+    _tangent(6, 0) = _tmp48;
+    _tangent(7, 0) = _tmp49;
+    _tangent(8, 0) = _tmp50;
+  }
+
+  if (D_a != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_a = (*D_a);
+
+    _D_a(0, 0) = _tmp35;
+    _D_a(1, 0) = _tmp29;
+    _D_a(2, 0) = _tmp32;
+    _D_a(3, 0) = _tmp101 * _tmp29 + _tmp105 * _tmp32 + _tmp35 * _tmp91;
+    _D_a(4, 0) = _tmp106 * _tmp29 + _tmp107 * _tmp35 + _tmp108 * _tmp32;
+    _D_a(5, 0) = _tmp109 * _tmp29 + _tmp110 * _tmp32 + _tmp111 * _tmp35;
+    _D_a(6, 0) = _tmp136 * _tmp35 + _tmp144 * _tmp29 + _tmp148 * _tmp32;
+    _D_a(7, 0) = _tmp149 * _tmp35 + _tmp150 * _tmp29 + _tmp151 * _tmp32;
+    _D_a(8, 0) = _tmp152 * _tmp29 + _tmp153 * _tmp32 + _tmp154 * _tmp35;
+    _D_a(0, 1) = _tmp37;
+    _D_a(1, 1) = _tmp39;
+    _D_a(2, 1) = _tmp42;
+    _D_a(3, 1) = _tmp101 * _tmp39 + _tmp105 * _tmp42 + _tmp37 * _tmp91;
+    _D_a(4, 1) = _tmp106 * _tmp39 + _tmp107 * _tmp37 + _tmp108 * _tmp42;
+    _D_a(5, 1) = _tmp109 * _tmp39 + _tmp110 * _tmp42 + _tmp111 * _tmp37;
+    _D_a(6, 1) = _tmp136 * _tmp37 + _tmp144 * _tmp39 + _tmp148 * _tmp42;
+    _D_a(7, 1) = _tmp149 * _tmp37 + _tmp150 * _tmp39 + _tmp151 * _tmp42;
+    _D_a(8, 1) = _tmp152 * _tmp39 + _tmp153 * _tmp42 + _tmp154 * _tmp37;
+    _D_a(0, 2) = _tmp45;
+    _D_a(1, 2) = _tmp46;
+    _D_a(2, 2) = _tmp44;
+    _D_a(3, 2) = _tmp101 * _tmp46 + _tmp105 * _tmp44 + _tmp45 * _tmp91;
+    _D_a(4, 2) = _tmp106 * _tmp46 + _tmp107 * _tmp45 + _tmp108 * _tmp44;
+    _D_a(5, 2) = _tmp109 * _tmp46 + _tmp110 * _tmp44 + _tmp111 * _tmp45;
+    _D_a(6, 2) = _tmp136 * _tmp45 + _tmp144 * _tmp46 + _tmp148 * _tmp44;
+    _D_a(7, 2) = _tmp149 * _tmp45 + _tmp150 * _tmp46 + _tmp151 * _tmp44;
+    _D_a(8, 2) = _tmp152 * _tmp46 + _tmp153 * _tmp44 + _tmp154 * _tmp45;
+    _D_a(0, 3) = 0;
+    _D_a(1, 3) = 0;
+    _D_a(2, 3) = 0;
+    _D_a(3, 3) = _tmp35;
+    _D_a(4, 3) = _tmp29;
+    _D_a(5, 3) = _tmp32;
+    _D_a(6, 3) = 0;
+    _D_a(7, 3) = 0;
+    _D_a(8, 3) = 0;
+    _D_a(0, 4) = 0;
+    _D_a(1, 4) = 0;
+    _D_a(2, 4) = 0;
+    _D_a(3, 4) = _tmp37;
+    _D_a(4, 4) = _tmp39;
+    _D_a(5, 4) = _tmp42;
+    _D_a(6, 4) = 0;
+    _D_a(7, 4) = 0;
+    _D_a(8, 4) = 0;
+    _D_a(0, 5) = 0;
+    _D_a(1, 5) = 0;
+    _D_a(2, 5) = 0;
+    _D_a(3, 5) = _tmp45;
+    _D_a(4, 5) = _tmp46;
+    _D_a(5, 5) = _tmp44;
+    _D_a(6, 5) = 0;
+    _D_a(7, 5) = 0;
+    _D_a(8, 5) = 0;
+    _D_a(0, 6) = 0;
+    _D_a(1, 6) = 0;
+    _D_a(2, 6) = 0;
+    _D_a(3, 6) = 0;
+    _D_a(4, 6) = 0;
+    _D_a(5, 6) = 0;
+    _D_a(6, 6) = _tmp35;
+    _D_a(7, 6) = _tmp29;
+    _D_a(8, 6) = _tmp32;
+    _D_a(0, 7) = 0;
+    _D_a(1, 7) = 0;
+    _D_a(2, 7) = 0;
+    _D_a(3, 7) = 0;
+    _D_a(4, 7) = 0;
+    _D_a(5, 7) = 0;
+    _D_a(6, 7) = _tmp37;
+    _D_a(7, 7) = _tmp39;
+    _D_a(8, 7) = _tmp42;
+    _D_a(0, 8) = 0;
+    _D_a(1, 8) = 0;
+    _D_a(2, 8) = 0;
+    _D_a(3, 8) = 0;
+    _D_a(4, 8) = 0;
+    _D_a(5, 8) = 0;
+    _D_a(6, 8) = _tmp45;
+    _D_a(7, 8) = _tmp46;
+    _D_a(8, 8) = _tmp44;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -6,7 +6,7 @@
 
 #pragma once
 
-#include <Eigen/Dense>
+#include <Eigen/Core>
 
 namespace sym {
 
@@ -21,760 +21,419 @@ namespace sym {
  *
  * Outputs:
  *     upsilon: Matrix10_1
- *     cov: Matrix99
+ *     cov: Matrix45_1
  */
 template <typename Scalar>
 void Preintegrate(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
                   const Eigen::Matrix<Scalar, 55, 1>& preint_prev,
                   const Eigen::Matrix<Scalar, 6, 1>& z_imu_est, const Scalar dt,
                   Eigen::Matrix<Scalar, 10, 1>* const upsilon = nullptr,
-                  Eigen::Matrix<Scalar, 9, 9>* const cov = nullptr) {
-  // Total ops: 2284
+                  Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 1221
 
   // Input arrays
 
-  // Intermediate terms (428)
+  // Intermediate terms (246)
   const Scalar _tmp0 = std::pow(dt, Scalar(2));
   const Scalar _tmp1 = _tmp0 * std::pow(z_imu_est(1, 0), Scalar(2));
   const Scalar _tmp2 = _tmp0 * std::pow(z_imu_est(0, 0), Scalar(2));
   const Scalar _tmp3 = _tmp0 * std::pow(z_imu_est(2, 0), Scalar(2));
-  const Scalar _tmp4 = _tmp1 + _tmp2 + _tmp3;
-  const Scalar _tmp5 = _tmp4 + Scalar(9.9999999999999998e-13);
-  const Scalar _tmp6 = std::sqrt(_tmp5);
-  const Scalar _tmp7 = (Scalar(1) / Scalar(2)) * _tmp6;
-  const Scalar _tmp8 = std::sin(_tmp7);
-  const Scalar _tmp9 = _tmp8 * dt / _tmp6;
-  const Scalar _tmp10 = _tmp9 * z_imu_est(0, 0);
-  const Scalar _tmp11 = _tmp9 * z_imu_est(2, 0);
-  const Scalar _tmp12 = _tmp9 * z_imu_est(1, 0);
-  const Scalar _tmp13 = std::cos(_tmp7);
-  const Scalar _tmp14 = -2 * std::pow(preint_prev(2, 0), Scalar(2));
-  const Scalar _tmp15 = 1 - 2 * std::pow(preint_prev(1, 0), Scalar(2));
-  const Scalar _tmp16 = _tmp14 + _tmp15;
-  const Scalar _tmp17 = 2 * std::pow(_tmp8, Scalar(2)) / _tmp5;
-  const Scalar _tmp18 = -_tmp1 * _tmp17;
-  const Scalar _tmp19 = -_tmp17 * _tmp3 + 1;
+  const Scalar _tmp4 = _tmp1 + _tmp2 + _tmp3 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp5 = std::sqrt(_tmp4);
+  const Scalar _tmp6 = (Scalar(1) / Scalar(2)) * _tmp5;
+  const Scalar _tmp7 = std::sin(_tmp6);
+  const Scalar _tmp8 = _tmp7 * dt / _tmp5;
+  const Scalar _tmp9 = _tmp8 * preint_prev(2, 0);
+  const Scalar _tmp10 = _tmp8 * preint_prev(1, 0);
+  const Scalar _tmp11 = _tmp8 * preint_prev(3, 0);
+  const Scalar _tmp12 = std::cos(_tmp6);
+  const Scalar _tmp13 = _tmp8 * preint_prev(0, 0);
+  const Scalar _tmp14 = -2 * std::pow(preint_prev(1, 0), Scalar(2));
+  const Scalar _tmp15 = -2 * std::pow(preint_prev(2, 0), Scalar(2));
+  const Scalar _tmp16 = _tmp14 + _tmp15 + 1;
+  const Scalar _tmp17 = 2 * std::pow(_tmp7, Scalar(2)) / _tmp4;
+  const Scalar _tmp18 = -_tmp17 * _tmp3;
+  const Scalar _tmp19 = -_tmp1 * _tmp17 + 1;
   const Scalar _tmp20 = _tmp18 + _tmp19;
-  const Scalar _tmp21 = 2 * _tmp13;
-  const Scalar _tmp22 = _tmp12 * _tmp21;
-  const Scalar _tmp23 = _tmp0 * z_imu_est(0, 0);
+  const Scalar _tmp21 = 2 * _tmp12 * _tmp8;
+  const Scalar _tmp22 = _tmp21 * z_imu_est(2, 0);
+  const Scalar _tmp23 = _tmp0 * z_imu_est(0, 0) * z_imu_est(1, 0);
   const Scalar _tmp24 = _tmp17 * _tmp23;
-  const Scalar _tmp25 = _tmp24 * z_imu_est(2, 0);
-  const Scalar _tmp26 = _tmp22 + _tmp25;
-  const Scalar _tmp27 = _tmp11 * _tmp21;
-  const Scalar _tmp28 = _tmp24 * z_imu_est(1, 0);
-  const Scalar _tmp29 = -_tmp27 + _tmp28;
-  const Scalar _tmp30 = _tmp20 * z_imu_est(3, 0) + _tmp26 * z_imu_est(5, 0) +
-                        _tmp29 * z_imu_est(4, 0) - z_imu_est(3, 0);
-  const Scalar _tmp31 = (Scalar(1) / Scalar(2)) * _tmp0;
-  const Scalar _tmp32 = _tmp30 * _tmp31 + dt * z_imu_est(3, 0);
-  const Scalar _tmp33 = 2 * preint_prev(3, 0);
-  const Scalar _tmp34 = _tmp33 * preint_prev(2, 0);
-  const Scalar _tmp35 = 2 * preint_prev(1, 0);
-  const Scalar _tmp36 = _tmp35 * preint_prev(0, 0);
-  const Scalar _tmp37 = -_tmp34 + _tmp36;
-  const Scalar _tmp38 = _tmp27 + _tmp28;
-  const Scalar _tmp39 = -_tmp17 * _tmp2;
-  const Scalar _tmp40 = _tmp19 + _tmp39;
-  const Scalar _tmp41 = _tmp10 * _tmp21;
-  const Scalar _tmp42 = _tmp0 * z_imu_est(1, 0) * z_imu_est(2, 0);
-  const Scalar _tmp43 = _tmp17 * _tmp42;
-  const Scalar _tmp44 = -_tmp41 + _tmp43;
-  const Scalar _tmp45 = _tmp38 * z_imu_est(3, 0) + _tmp40 * z_imu_est(4, 0) +
-                        _tmp44 * z_imu_est(5, 0) - z_imu_est(4, 0);
-  const Scalar _tmp46 = _tmp31 * _tmp45 + dt * z_imu_est(4, 0);
-  const Scalar _tmp47 = _tmp33 * preint_prev(1, 0);
-  const Scalar _tmp48 = 2 * preint_prev(0, 0) * preint_prev(2, 0);
-  const Scalar _tmp49 = _tmp47 + _tmp48;
-  const Scalar _tmp50 = -_tmp22 + _tmp25;
-  const Scalar _tmp51 = _tmp41 + _tmp43;
-  const Scalar _tmp52 = _tmp18 + _tmp39 + 1;
-  const Scalar _tmp53 = _tmp50 * z_imu_est(3, 0) + _tmp51 * z_imu_est(4, 0) +
-                        _tmp52 * z_imu_est(5, 0) - z_imu_est(5, 0);
-  const Scalar _tmp54 = _tmp31 * _tmp53 + dt * z_imu_est(5, 0);
-  const Scalar _tmp55 = _tmp34 + _tmp36;
-  const Scalar _tmp56 = -2 * std::pow(preint_prev(0, 0), Scalar(2));
-  const Scalar _tmp57 = _tmp14 + _tmp56 + 1;
-  const Scalar _tmp58 = _tmp33 * preint_prev(0, 0);
-  const Scalar _tmp59 = _tmp35 * preint_prev(2, 0);
-  const Scalar _tmp60 = -_tmp58 + _tmp59;
-  const Scalar _tmp61 = -_tmp47 + _tmp48;
-  const Scalar _tmp62 = _tmp58 + _tmp59;
-  const Scalar _tmp63 = _tmp15 + _tmp56;
+  const Scalar _tmp25 = -_tmp22 + _tmp24;
+  const Scalar _tmp26 = _tmp21 * z_imu_est(1, 0);
+  const Scalar _tmp27 = _tmp0 * z_imu_est(2, 0);
+  const Scalar _tmp28 = _tmp17 * _tmp27;
+  const Scalar _tmp29 = _tmp28 * z_imu_est(0, 0);
+  const Scalar _tmp30 = _tmp26 + _tmp29;
+  const Scalar _tmp31 = _tmp20 * z_imu_est(3, 0) + _tmp25 * z_imu_est(4, 0) +
+                        _tmp30 * z_imu_est(5, 0) - z_imu_est(3, 0);
+  const Scalar _tmp32 = (Scalar(1) / Scalar(2)) * _tmp0;
+  const Scalar _tmp33 = _tmp31 * _tmp32 + dt * z_imu_est(3, 0);
+  const Scalar _tmp34 = 2 * preint_prev(3, 0);
+  const Scalar _tmp35 = _tmp34 * preint_prev(1, 0);
+  const Scalar _tmp36 = 2 * preint_prev(0, 0) * preint_prev(2, 0);
+  const Scalar _tmp37 = _tmp35 + _tmp36;
+  const Scalar _tmp38 = -_tmp17 * _tmp2;
+  const Scalar _tmp39 = _tmp19 + _tmp38;
+  const Scalar _tmp40 = _tmp21 * z_imu_est(0, 0);
+  const Scalar _tmp41 = _tmp28 * z_imu_est(1, 0);
+  const Scalar _tmp42 = _tmp40 + _tmp41;
+  const Scalar _tmp43 = -_tmp26 + _tmp29;
+  const Scalar _tmp44 = _tmp39 * z_imu_est(5, 0) + _tmp42 * z_imu_est(4, 0) +
+                        _tmp43 * z_imu_est(3, 0) - z_imu_est(5, 0);
+  const Scalar _tmp45 = _tmp32 * _tmp44 + dt * z_imu_est(5, 0);
+  const Scalar _tmp46 = _tmp34 * preint_prev(2, 0);
+  const Scalar _tmp47 = 2 * preint_prev(1, 0);
+  const Scalar _tmp48 = _tmp47 * preint_prev(0, 0);
+  const Scalar _tmp49 = -_tmp46 + _tmp48;
+  const Scalar _tmp50 = _tmp18 + _tmp38 + 1;
+  const Scalar _tmp51 = _tmp22 + _tmp24;
+  const Scalar _tmp52 = -_tmp40 + _tmp41;
+  const Scalar _tmp53 = _tmp50 * z_imu_est(4, 0) + _tmp51 * z_imu_est(3, 0) +
+                        _tmp52 * z_imu_est(5, 0) - z_imu_est(4, 0);
+  const Scalar _tmp54 = _tmp32 * _tmp53 + dt * z_imu_est(4, 0);
+  const Scalar _tmp55 = _tmp46 + _tmp48;
+  const Scalar _tmp56 = _tmp34 * preint_prev(0, 0);
+  const Scalar _tmp57 = _tmp47 * preint_prev(2, 0);
+  const Scalar _tmp58 = -_tmp56 + _tmp57;
+  const Scalar _tmp59 = 1 - 2 * std::pow(preint_prev(0, 0), Scalar(2));
+  const Scalar _tmp60 = _tmp15 + _tmp59;
+  const Scalar _tmp61 = -_tmp35 + _tmp36;
+  const Scalar _tmp62 = _tmp14 + _tmp59;
+  const Scalar _tmp63 = _tmp56 + _tmp57;
   const Scalar _tmp64 = [&]() {
     const Scalar base = dt;
     return base * base * base;
   }();
   const Scalar _tmp65 = (Scalar(1) / Scalar(6)) * _tmp64;
-  const Scalar _tmp66 = _tmp30 * _tmp65 + _tmp31 * z_imu_est(3, 0);
-  const Scalar _tmp67 = _tmp31 * z_imu_est(4, 0) + _tmp45 * _tmp65;
-  const Scalar _tmp68 = _tmp31 * z_imu_est(5, 0) + _tmp53 * _tmp65;
-  const Scalar _tmp69 = -_tmp1;
-  const Scalar _tmp70 = -_tmp3;
-  const Scalar _tmp71 = _tmp4 + Scalar(9.9999999999999995e-7);
-  const Scalar _tmp72 = std::sqrt(_tmp71);
-  const Scalar _tmp73 = Scalar(0.5) * _tmp72;
+  const Scalar _tmp66 = _tmp31 * _tmp65 + _tmp32 * z_imu_est(3, 0);
+  const Scalar _tmp67 = _tmp32 * z_imu_est(5, 0) + _tmp44 * _tmp65;
+  const Scalar _tmp68 = _tmp32 * z_imu_est(4, 0) + _tmp53 * _tmp65;
+  const Scalar _tmp69 = Scalar(0.050000000000000003) - _tmp5;
+  const Scalar _tmp70 = std::max<Scalar>(0, (((_tmp69) > 0) - ((_tmp69) < 0)));
+  const Scalar _tmp71 = _tmp5 + _tmp69 * _tmp70;
+  const Scalar _tmp72 = (Scalar(1) / Scalar(2)) * _tmp71;
+  const Scalar _tmp73 =
+      (-_tmp72 * std::cos(_tmp72) / std::sin(_tmp72) + 1) / std::pow(_tmp71, Scalar(2));
   const Scalar _tmp74 =
-      (-Scalar(1) / Scalar(2) * _tmp72 * std::cos(_tmp73) / std::sin(_tmp73) + 1) / _tmp71;
-  const Scalar _tmp75 = _tmp74 * (_tmp69 + _tmp70) + Scalar(1.0);
-  const Scalar _tmp76 = _tmp64 * imu_noise(0, 0);
-  const Scalar _tmp77 = Scalar(0.5) * dt;
-  const Scalar _tmp78 = _tmp77 * z_imu_est(1, 0);
-  const Scalar _tmp79 = _tmp23 * _tmp74;
-  const Scalar _tmp80 = _tmp79 * z_imu_est(2, 0);
-  const Scalar _tmp81 = -_tmp78 + _tmp80;
-  const Scalar _tmp82 = _tmp64 * imu_noise(2, 0);
-  const Scalar _tmp83 =
-      _tmp37 * preint_prev(7, 0) + _tmp57 * preint_prev(8, 0) + _tmp62 * preint_prev(9, 0);
-  const Scalar _tmp84 =
-      _tmp49 * preint_prev(7, 0) + _tmp60 * preint_prev(8, 0) + _tmp63 * preint_prev(9, 0);
-  const Scalar _tmp85 = _tmp57 * _tmp84 - _tmp60 * _tmp83;
-  const Scalar _tmp86 =
-      _tmp37 * preint_prev(4, 0) + _tmp57 * preint_prev(5, 0) + _tmp62 * preint_prev(6, 0);
-  const Scalar _tmp87 =
-      _tmp49 * preint_prev(4, 0) + _tmp60 * preint_prev(5, 0) + _tmp63 * preint_prev(6, 0);
-  const Scalar _tmp88 = _tmp57 * _tmp87 - _tmp60 * _tmp86;
-  const Scalar _tmp89 =
-      _tmp16 * preint_prev(4, 0) + _tmp55 * preint_prev(5, 0) + _tmp61 * preint_prev(6, 0);
-  const Scalar _tmp90 = -_tmp55 * _tmp87 + _tmp60 * _tmp89;
-  const Scalar _tmp91 =
-      _tmp16 * preint_prev(7, 0) + _tmp55 * preint_prev(8, 0) + _tmp61 * preint_prev(9, 0);
-  const Scalar _tmp92 = -_tmp55 * _tmp84 + _tmp60 * _tmp91;
-  const Scalar _tmp93 = _tmp55 * _tmp86 - _tmp57 * _tmp89;
-  const Scalar _tmp94 = _tmp55 * _tmp83 - _tmp57 * _tmp91;
-  const Scalar _tmp95 =
-      _tmp55 * preint_prev(10, 0) + _tmp57 * preint_prev(11, 0) + _tmp60 * preint_prev(13, 0) +
-      _tmp85 * preint_prev(31, 0) + _tmp88 * preint_prev(16, 0) + _tmp90 * preint_prev(20, 0) +
-      _tmp92 * preint_prev(38, 0) + _tmp93 * preint_prev(25, 0) + _tmp94 * preint_prev(46, 0);
-  const Scalar _tmp96 = _tmp16 * _tmp83 - _tmp37 * _tmp91;
-  const Scalar _tmp97 = _tmp16 * _tmp86 - _tmp37 * _tmp89;
-  const Scalar _tmp98 = _tmp37 * _tmp87 - _tmp49 * _tmp86;
-  const Scalar _tmp99 = _tmp37 * _tmp84 - _tmp49 * _tmp83;
-  const Scalar _tmp100 = -_tmp16 * _tmp84 + _tmp49 * _tmp91;
-  const Scalar _tmp101 = -_tmp16 * _tmp87 + _tmp49 * _tmp89;
-  const Scalar _tmp102 =
-      _tmp100 * preint_prev(38, 0) + _tmp101 * preint_prev(20, 0) + _tmp16 * preint_prev(10, 0) +
-      _tmp37 * preint_prev(11, 0) + _tmp49 * preint_prev(13, 0) + _tmp96 * preint_prev(46, 0) +
-      _tmp97 * preint_prev(25, 0) + _tmp98 * preint_prev(16, 0) + _tmp99 * preint_prev(31, 0);
-  const Scalar _tmp103 = _tmp77 * z_imu_est(2, 0);
-  const Scalar _tmp104 = _tmp79 * z_imu_est(1, 0);
-  const Scalar _tmp105 = _tmp103 + _tmp104;
-  const Scalar _tmp106 = _tmp64 * imu_noise(1, 0);
-  const Scalar _tmp107 = _tmp61 * _tmp83 - _tmp62 * _tmp91;
-  const Scalar _tmp108 = _tmp61 * _tmp86 - _tmp62 * _tmp89;
-  const Scalar _tmp109 = -_tmp61 * _tmp84 + _tmp63 * _tmp91;
-  const Scalar _tmp110 = -_tmp61 * _tmp87 + _tmp63 * _tmp89;
-  const Scalar _tmp111 = _tmp62 * _tmp84 - _tmp63 * _tmp83;
-  const Scalar _tmp112 = _tmp62 * _tmp87 - _tmp63 * _tmp86;
+      _tmp70 * (Scalar(3.3068783068783071e-5) * std::pow(_tmp4, Scalar(2)) +
+                Scalar(0.0013888888888888889) * _tmp4 - _tmp73 + Scalar(0.083333333333333329)) +
+      _tmp73;
+  const Scalar _tmp75 = -_tmp3 * _tmp74;
+  const Scalar _tmp76 = -_tmp1 * _tmp74;
+  const Scalar _tmp77 = _tmp75 + _tmp76 + 1;
+  const Scalar _tmp78 = _tmp64 * imu_noise(0, 0);
+  const Scalar _tmp79 = _tmp27 * _tmp74;
+  const Scalar _tmp80 = _tmp79 * z_imu_est(0, 0);
+  const Scalar _tmp81 = (Scalar(1) / Scalar(2)) * dt;
+  const Scalar _tmp82 = _tmp81 * z_imu_est(1, 0);
+  const Scalar _tmp83 = _tmp80 - _tmp82;
+  const Scalar _tmp84 = _tmp64 * imu_noise(2, 0);
+  const Scalar _tmp85 = _tmp23 * _tmp74;
+  const Scalar _tmp86 = _tmp81 * z_imu_est(2, 0);
+  const Scalar _tmp87 = _tmp85 + _tmp86;
+  const Scalar _tmp88 = _tmp64 * imu_noise(1, 0);
+  const Scalar _tmp89 = _tmp79 * z_imu_est(1, 0);
+  const Scalar _tmp90 = _tmp81 * z_imu_est(0, 0);
+  const Scalar _tmp91 = _tmp89 + _tmp90;
+  const Scalar _tmp92 = _tmp83 * _tmp84;
+  const Scalar _tmp93 =
+      _tmp25 * preint_prev(10, 0) + _tmp42 * preint_prev(13, 0) + _tmp50 * preint_prev(11, 0);
+  const Scalar _tmp94 =
+      _tmp25 * preint_prev(11, 0) + _tmp42 * preint_prev(14, 0) + _tmp50 * preint_prev(12, 0);
+  const Scalar _tmp95 = _tmp85 - _tmp86;
+  const Scalar _tmp96 = _tmp77 * _tmp78;
+  const Scalar _tmp97 =
+      _tmp25 * preint_prev(13, 0) + _tmp42 * preint_prev(15, 0) + _tmp50 * preint_prev(14, 0);
+  const Scalar _tmp98 = -_tmp2 * _tmp74 + 1;
+  const Scalar _tmp99 = _tmp75 + _tmp98;
+  const Scalar _tmp100 = _tmp88 * _tmp99;
+  const Scalar _tmp101 =
+      _tmp30 * preint_prev(10, 0) + _tmp39 * preint_prev(13, 0) + _tmp52 * preint_prev(11, 0);
+  const Scalar _tmp102 = _tmp76 + _tmp98;
+  const Scalar _tmp103 = _tmp80 + _tmp82;
+  const Scalar _tmp104 =
+      _tmp30 * preint_prev(13, 0) + _tmp39 * preint_prev(15, 0) + _tmp52 * preint_prev(14, 0);
+  const Scalar _tmp105 =
+      _tmp30 * preint_prev(11, 0) + _tmp39 * preint_prev(14, 0) + _tmp52 * preint_prev(12, 0);
+  const Scalar _tmp106 = _tmp89 - _tmp90;
+  const Scalar _tmp107 =
+      _tmp33 * preint_prev(15, 0) - _tmp45 * preint_prev(13, 0) + preint_prev(22, 0);
+  const Scalar _tmp108 =
+      _tmp45 * preint_prev(14, 0) - _tmp54 * preint_prev(15, 0) + preint_prev(18, 0);
+  const Scalar _tmp109 = _tmp33 * preint_prev(14, 0);
+  const Scalar _tmp110 = _tmp54 * preint_prev(13, 0);
+  const Scalar _tmp111 = -_tmp109 + _tmp110 + preint_prev(27, 0);
+  const Scalar _tmp112 = _tmp107 * _tmp51 + _tmp108 * _tmp20 + _tmp111 * _tmp43;
   const Scalar _tmp113 =
-      _tmp107 * preint_prev(46, 0) + _tmp108 * preint_prev(25, 0) + _tmp109 * preint_prev(38, 0) +
-      _tmp110 * preint_prev(20, 0) + _tmp111 * preint_prev(31, 0) + _tmp112 * preint_prev(16, 0) +
-      _tmp61 * preint_prev(10, 0) + _tmp62 * preint_prev(11, 0) + _tmp63 * preint_prev(13, 0);
-  const Scalar _tmp114 =
-      _tmp55 * preint_prev(11, 0) + _tmp57 * preint_prev(12, 0) + _tmp60 * preint_prev(14, 0) +
-      _tmp85 * preint_prev(32, 0) + _tmp88 * preint_prev(17, 0) + _tmp90 * preint_prev(21, 0) +
-      _tmp92 * preint_prev(39, 0) + _tmp93 * preint_prev(26, 0) + _tmp94 * preint_prev(47, 0);
-  const Scalar _tmp115 =
-      _tmp100 * preint_prev(39, 0) + _tmp101 * preint_prev(21, 0) + _tmp16 * preint_prev(11, 0) +
-      _tmp37 * preint_prev(12, 0) + _tmp49 * preint_prev(14, 0) + _tmp96 * preint_prev(47, 0) +
-      _tmp97 * preint_prev(26, 0) + _tmp98 * preint_prev(17, 0) + _tmp99 * preint_prev(32, 0);
+      _tmp33 * preint_prev(13, 0) - _tmp45 * preint_prev(10, 0) + preint_prev(20, 0);
+  const Scalar _tmp114 = _tmp45 * preint_prev(11, 0);
+  const Scalar _tmp115 = -_tmp110 + _tmp114 + preint_prev(16, 0);
   const Scalar _tmp116 =
-      _tmp107 * preint_prev(47, 0) + _tmp108 * preint_prev(26, 0) + _tmp109 * preint_prev(39, 0) +
-      _tmp110 * preint_prev(21, 0) + _tmp111 * preint_prev(32, 0) + _tmp112 * preint_prev(17, 0) +
-      _tmp61 * preint_prev(11, 0) + _tmp62 * preint_prev(12, 0) + _tmp63 * preint_prev(14, 0);
-  const Scalar _tmp117 = _tmp77 * z_imu_est(0, 0);
-  const Scalar _tmp118 = _tmp42 * _tmp74;
-  const Scalar _tmp119 = _tmp117 + _tmp118;
-  const Scalar _tmp120 = -_tmp2;
-  const Scalar _tmp121 = _tmp74 * (_tmp120 + _tmp70) + Scalar(1.0);
-  const Scalar _tmp122 = _tmp106 * _tmp121;
-  const Scalar _tmp123 = -_tmp103 + _tmp104;
-  const Scalar _tmp124 = _tmp105 * _tmp122 + _tmp119 * _tmp81 * _tmp82 + _tmp123 * _tmp75 * _tmp76;
-  const Scalar _tmp125 =
-      _tmp55 * preint_prev(13, 0) + _tmp57 * preint_prev(14, 0) + _tmp60 * preint_prev(15, 0) +
-      _tmp85 * preint_prev(33, 0) + _tmp88 * preint_prev(18, 0) + _tmp90 * preint_prev(22, 0) +
-      _tmp92 * preint_prev(40, 0) + _tmp93 * preint_prev(27, 0) + _tmp94 * preint_prev(48, 0);
-  const Scalar _tmp126 =
-      _tmp100 * preint_prev(40, 0) + _tmp101 * preint_prev(22, 0) + _tmp16 * preint_prev(13, 0) +
-      _tmp37 * preint_prev(14, 0) + _tmp49 * preint_prev(15, 0) + _tmp96 * preint_prev(48, 0) +
-      _tmp97 * preint_prev(27, 0) + _tmp98 * preint_prev(18, 0) + _tmp99 * preint_prev(33, 0);
-  const Scalar _tmp127 =
-      _tmp107 * preint_prev(48, 0) + _tmp108 * preint_prev(27, 0) + _tmp109 * preint_prev(40, 0) +
-      _tmp110 * preint_prev(22, 0) + _tmp111 * preint_prev(33, 0) + _tmp112 * preint_prev(18, 0) +
-      _tmp61 * preint_prev(13, 0) + _tmp62 * preint_prev(14, 0) + _tmp63 * preint_prev(15, 0);
-  const Scalar _tmp128 = _tmp78 + _tmp80;
-  const Scalar _tmp129 = _tmp128 * _tmp76;
-  const Scalar _tmp130 = _tmp74 * (_tmp120 + _tmp69) + Scalar(1.0);
-  const Scalar _tmp131 = _tmp130 * _tmp82;
-  const Scalar _tmp132 = -_tmp117 + _tmp118;
-  const Scalar _tmp133 = _tmp105 * _tmp106 * _tmp132 + _tmp129 * _tmp75 + _tmp131 * _tmp81;
-  const Scalar _tmp134 = _tmp55 * preint_prev(16, 0);
-  const Scalar _tmp135 = _tmp134 + _tmp57 * preint_prev(17, 0) + _tmp60 * preint_prev(18, 0) +
-                         _tmp85 * preint_prev(34, 0) + _tmp88 * preint_prev(19, 0) +
-                         _tmp90 * preint_prev(23, 0) + _tmp92 * preint_prev(41, 0) +
-                         _tmp93 * preint_prev(28, 0) + _tmp94 * preint_prev(49, 0);
-  const Scalar _tmp136 = _tmp16 * preint_prev(16, 0);
-  const Scalar _tmp137 = _tmp100 * preint_prev(41, 0) + _tmp101 * preint_prev(23, 0) + _tmp136 +
-                         _tmp37 * preint_prev(17, 0) + _tmp49 * preint_prev(18, 0) +
-                         _tmp96 * preint_prev(49, 0) + _tmp97 * preint_prev(28, 0) +
-                         _tmp98 * preint_prev(19, 0) + _tmp99 * preint_prev(34, 0);
-  const Scalar _tmp138 = _tmp61 * preint_prev(16, 0);
-  const Scalar _tmp139 = _tmp107 * preint_prev(49, 0) + _tmp108 * preint_prev(28, 0) +
-                         _tmp109 * preint_prev(41, 0) + _tmp110 * preint_prev(23, 0) +
-                         _tmp111 * preint_prev(34, 0) + _tmp112 * preint_prev(19, 0) + _tmp138 +
-                         _tmp62 * preint_prev(17, 0) + _tmp63 * preint_prev(18, 0);
-  const Scalar _tmp140 = _tmp57 * preint_prev(21, 0);
-  const Scalar _tmp141 = _tmp140 + _tmp55 * preint_prev(20, 0) + _tmp60 * preint_prev(22, 0) +
-                         _tmp85 * preint_prev(35, 0) + _tmp88 * preint_prev(23, 0) +
-                         _tmp90 * preint_prev(24, 0) + _tmp92 * preint_prev(42, 0) +
-                         _tmp93 * preint_prev(29, 0) + _tmp94 * preint_prev(50, 0);
-  const Scalar _tmp142 = _tmp37 * preint_prev(21, 0);
-  const Scalar _tmp143 = _tmp100 * preint_prev(42, 0) + _tmp101 * preint_prev(24, 0) + _tmp142 +
-                         _tmp16 * preint_prev(20, 0) + _tmp49 * preint_prev(22, 0) +
-                         _tmp96 * preint_prev(50, 0) + _tmp97 * preint_prev(29, 0) +
-                         _tmp98 * preint_prev(23, 0) + _tmp99 * preint_prev(35, 0);
-  const Scalar _tmp144 = _tmp62 * preint_prev(21, 0);
-  const Scalar _tmp145 = _tmp107 * preint_prev(50, 0) + _tmp108 * preint_prev(29, 0) +
-                         _tmp109 * preint_prev(42, 0) + _tmp110 * preint_prev(24, 0) +
-                         _tmp111 * preint_prev(35, 0) + _tmp112 * preint_prev(23, 0) + _tmp144 +
-                         _tmp61 * preint_prev(20, 0) + _tmp63 * preint_prev(22, 0);
-  const Scalar _tmp146 = _tmp60 * preint_prev(27, 0);
-  const Scalar _tmp147 = _tmp146 + _tmp55 * preint_prev(25, 0) + _tmp57 * preint_prev(26, 0) +
-                         _tmp85 * preint_prev(36, 0) + _tmp88 * preint_prev(28, 0) +
-                         _tmp90 * preint_prev(29, 0) + _tmp92 * preint_prev(43, 0) +
-                         _tmp93 * preint_prev(30, 0) + _tmp94 * preint_prev(51, 0);
-  const Scalar _tmp148 = _tmp49 * preint_prev(27, 0);
-  const Scalar _tmp149 = _tmp100 * preint_prev(43, 0) + _tmp101 * preint_prev(29, 0) + _tmp148 +
-                         _tmp16 * preint_prev(25, 0) + _tmp37 * preint_prev(26, 0) +
-                         _tmp96 * preint_prev(51, 0) + _tmp97 * preint_prev(30, 0) +
-                         _tmp98 * preint_prev(28, 0) + _tmp99 * preint_prev(36, 0);
-  const Scalar _tmp150 = _tmp63 * preint_prev(27, 0);
-  const Scalar _tmp151 = _tmp107 * preint_prev(51, 0) + _tmp108 * preint_prev(30, 0) +
-                         _tmp109 * preint_prev(43, 0) + _tmp110 * preint_prev(29, 0) +
-                         _tmp111 * preint_prev(36, 0) + _tmp112 * preint_prev(28, 0) + _tmp150 +
-                         _tmp61 * preint_prev(25, 0) + _tmp62 * preint_prev(26, 0);
-  const Scalar _tmp152 = _tmp55 * preint_prev(31, 0);
-  const Scalar _tmp153 = _tmp152 + _tmp57 * preint_prev(32, 0) + _tmp60 * preint_prev(33, 0) +
-                         _tmp85 * preint_prev(37, 0) + _tmp88 * preint_prev(34, 0) +
-                         _tmp90 * preint_prev(35, 0) + _tmp92 * preint_prev(44, 0) +
-                         _tmp93 * preint_prev(36, 0) + _tmp94 * preint_prev(52, 0);
-  const Scalar _tmp154 = _tmp16 * preint_prev(31, 0);
-  const Scalar _tmp155 = _tmp100 * preint_prev(44, 0) + _tmp101 * preint_prev(35, 0) + _tmp154 +
-                         _tmp37 * preint_prev(32, 0) + _tmp49 * preint_prev(33, 0) +
-                         _tmp96 * preint_prev(52, 0) + _tmp97 * preint_prev(36, 0) +
-                         _tmp98 * preint_prev(34, 0) + _tmp99 * preint_prev(37, 0);
-  const Scalar _tmp156 = _tmp61 * preint_prev(31, 0);
-  const Scalar _tmp157 = _tmp107 * preint_prev(52, 0) + _tmp108 * preint_prev(36, 0) +
-                         _tmp109 * preint_prev(44, 0) + _tmp110 * preint_prev(35, 0) +
-                         _tmp111 * preint_prev(37, 0) + _tmp112 * preint_prev(34, 0) + _tmp156 +
-                         _tmp62 * preint_prev(32, 0) + _tmp63 * preint_prev(33, 0);
-  const Scalar _tmp158 = _tmp57 * preint_prev(39, 0);
-  const Scalar _tmp159 = _tmp158 + _tmp55 * preint_prev(38, 0) + _tmp60 * preint_prev(40, 0) +
-                         _tmp85 * preint_prev(44, 0) + _tmp88 * preint_prev(41, 0) +
-                         _tmp90 * preint_prev(42, 0) + _tmp92 * preint_prev(45, 0) +
-                         _tmp93 * preint_prev(43, 0) + _tmp94 * preint_prev(53, 0);
-  const Scalar _tmp160 = _tmp37 * preint_prev(39, 0);
-  const Scalar _tmp161 = _tmp100 * preint_prev(45, 0) + _tmp101 * preint_prev(42, 0) +
-                         _tmp16 * preint_prev(38, 0) + _tmp160 + _tmp49 * preint_prev(40, 0) +
-                         _tmp96 * preint_prev(53, 0) + _tmp97 * preint_prev(43, 0) +
-                         _tmp98 * preint_prev(41, 0) + _tmp99 * preint_prev(44, 0);
-  const Scalar _tmp162 = _tmp62 * preint_prev(39, 0);
-  const Scalar _tmp163 = _tmp107 * preint_prev(53, 0) + _tmp108 * preint_prev(43, 0) +
-                         _tmp109 * preint_prev(45, 0) + _tmp110 * preint_prev(42, 0) +
-                         _tmp111 * preint_prev(44, 0) + _tmp112 * preint_prev(41, 0) + _tmp162 +
-                         _tmp61 * preint_prev(38, 0) + _tmp63 * preint_prev(40, 0);
-  const Scalar _tmp164 = _tmp60 * preint_prev(48, 0);
-  const Scalar _tmp165 = _tmp164 + _tmp55 * preint_prev(46, 0) + _tmp57 * preint_prev(47, 0) +
-                         _tmp85 * preint_prev(52, 0) + _tmp88 * preint_prev(49, 0) +
-                         _tmp90 * preint_prev(50, 0) + _tmp92 * preint_prev(53, 0) +
-                         _tmp93 * preint_prev(51, 0) + _tmp94 * preint_prev(54, 0);
-  const Scalar _tmp166 = _tmp49 * preint_prev(48, 0);
-  const Scalar _tmp167 = _tmp100 * preint_prev(53, 0) + _tmp101 * preint_prev(50, 0) +
-                         _tmp16 * preint_prev(46, 0) + _tmp166 + _tmp37 * preint_prev(47, 0) +
-                         _tmp96 * preint_prev(54, 0) + _tmp97 * preint_prev(51, 0) +
-                         _tmp98 * preint_prev(49, 0) + _tmp99 * preint_prev(52, 0);
-  const Scalar _tmp168 = _tmp63 * preint_prev(48, 0);
-  const Scalar _tmp169 = _tmp107 * preint_prev(54, 0) + _tmp108 * preint_prev(51, 0) +
-                         _tmp109 * preint_prev(53, 0) + _tmp110 * preint_prev(50, 0) +
-                         _tmp111 * preint_prev(52, 0) + _tmp112 * preint_prev(49, 0) + _tmp168 +
-                         _tmp61 * preint_prev(46, 0) + _tmp62 * preint_prev(47, 0);
-  const Scalar _tmp170 = _tmp119 * _tmp131 + _tmp122 * _tmp132 + _tmp123 * _tmp129;
-  const Scalar _tmp171 = _tmp57 * preint_prev(38, 0);
-  const Scalar _tmp172 = _tmp60 * preint_prev(46, 0);
-  const Scalar _tmp173 = _tmp134 + _tmp152 * dt + _tmp171 * dt + _tmp172 * dt +
-                         _tmp57 * preint_prev(20, 0) + _tmp60 * preint_prev(25, 0);
-  const Scalar _tmp174 = _tmp173 * _tmp55;
-  const Scalar _tmp175 = _tmp49 * preint_prev(46, 0);
-  const Scalar _tmp176 = _tmp37 * preint_prev(38, 0);
-  const Scalar _tmp177 = _tmp136 + _tmp154 * dt + _tmp175 * dt + _tmp176 * dt +
-                         _tmp37 * preint_prev(20, 0) + _tmp49 * preint_prev(25, 0);
-  const Scalar _tmp178 = _tmp16 * _tmp177;
-  const Scalar _tmp179 = _tmp62 * preint_prev(38, 0);
-  const Scalar _tmp180 = _tmp63 * preint_prev(46, 0);
-  const Scalar _tmp181 = _tmp138 + _tmp156 * dt + _tmp179 * dt + _tmp180 * dt +
-                         _tmp62 * preint_prev(20, 0) + _tmp63 * preint_prev(25, 0);
-  const Scalar _tmp182 = _tmp181 * _tmp61;
-  const Scalar _tmp183 = _tmp60 * preint_prev(47, 0);
-  const Scalar _tmp184 = _tmp55 * preint_prev(32, 0);
-  const Scalar _tmp185 = _tmp140 + _tmp158 * dt + _tmp183 * dt + _tmp184 * dt +
-                         _tmp55 * preint_prev(17, 0) + _tmp60 * preint_prev(26, 0);
-  const Scalar _tmp186 = _tmp185 * _tmp55;
-  const Scalar _tmp187 = _tmp16 * preint_prev(32, 0);
-  const Scalar _tmp188 = _tmp49 * preint_prev(47, 0);
-  const Scalar _tmp189 = _tmp142 + _tmp16 * preint_prev(17, 0) + _tmp160 * dt + _tmp187 * dt +
-                         _tmp188 * dt + _tmp49 * preint_prev(26, 0);
-  const Scalar _tmp190 = _tmp16 * _tmp189;
-  const Scalar _tmp191 = _tmp61 * preint_prev(32, 0);
-  const Scalar _tmp192 = _tmp63 * preint_prev(47, 0);
-  const Scalar _tmp193 = _tmp144 + _tmp162 * dt + _tmp191 * dt + _tmp192 * dt +
-                         _tmp61 * preint_prev(17, 0) + _tmp63 * preint_prev(26, 0);
-  const Scalar _tmp194 = _tmp193 * _tmp61;
-  const Scalar _tmp195 = _tmp57 * preint_prev(40, 0);
-  const Scalar _tmp196 = _tmp55 * preint_prev(33, 0);
-  const Scalar _tmp197 = _tmp146 + _tmp164 * dt + _tmp195 * dt + _tmp196 * dt +
-                         _tmp55 * preint_prev(18, 0) + _tmp57 * preint_prev(22, 0);
-  const Scalar _tmp198 = _tmp197 * _tmp55;
-  const Scalar _tmp199 = _tmp16 * preint_prev(33, 0);
-  const Scalar _tmp200 = _tmp37 * preint_prev(40, 0);
-  const Scalar _tmp201 = _tmp148 + _tmp16 * preint_prev(18, 0) + _tmp166 * dt + _tmp199 * dt +
-                         _tmp200 * dt + _tmp37 * preint_prev(22, 0);
-  const Scalar _tmp202 = _tmp16 * _tmp201;
-  const Scalar _tmp203 = _tmp61 * preint_prev(33, 0);
-  const Scalar _tmp204 = _tmp62 * preint_prev(40, 0);
-  const Scalar _tmp205 = _tmp150 + _tmp168 * dt + _tmp203 * dt + _tmp204 * dt +
-                         _tmp61 * preint_prev(18, 0) + _tmp62 * preint_prev(22, 0);
-  const Scalar _tmp206 = _tmp205 * _tmp61;
-  const Scalar _tmp207 = std::pow(_tmp20, Scalar(2));
-  const Scalar _tmp208 = _tmp64 * imu_noise(3, 0);
-  const Scalar _tmp209 = std::pow(_tmp38, Scalar(2));
-  const Scalar _tmp210 = _tmp64 * imu_noise(4, 0);
-  const Scalar _tmp211 = _tmp57 * preint_prev(41, 0);
-  const Scalar _tmp212 = _tmp60 * preint_prev(49, 0);
-  const Scalar _tmp213 = _tmp55 * preint_prev(34, 0);
-  const Scalar _tmp214 = _tmp211 * dt + _tmp212 * dt + _tmp213 * dt + _tmp55 * preint_prev(19, 0) +
-                         _tmp57 * preint_prev(23, 0) + _tmp60 * preint_prev(28, 0);
-  const Scalar _tmp215 = _tmp214 * _tmp55;
-  const Scalar _tmp216 = _tmp16 * preint_prev(34, 0);
-  const Scalar _tmp217 = _tmp49 * preint_prev(49, 0);
-  const Scalar _tmp218 = _tmp37 * preint_prev(41, 0);
-  const Scalar _tmp219 = _tmp16 * preint_prev(19, 0) + _tmp216 * dt + _tmp217 * dt + _tmp218 * dt +
-                         _tmp37 * preint_prev(23, 0) + _tmp49 * preint_prev(28, 0);
-  const Scalar _tmp220 = _tmp16 * _tmp219;
-  const Scalar _tmp221 = std::pow(_tmp50, Scalar(2));
-  const Scalar _tmp222 = _tmp64 * imu_noise(5, 0);
-  const Scalar _tmp223 = _tmp61 * preint_prev(34, 0);
-  const Scalar _tmp224 = _tmp62 * preint_prev(41, 0);
-  const Scalar _tmp225 = _tmp63 * preint_prev(49, 0);
-  const Scalar _tmp226 = _tmp223 * dt + _tmp224 * dt + _tmp225 * dt + _tmp61 * preint_prev(19, 0) +
-                         _tmp62 * preint_prev(23, 0) + _tmp63 * preint_prev(28, 0);
-  const Scalar _tmp227 = _tmp226 * _tmp61;
-  const Scalar _tmp228 = _tmp57 * preint_prev(42, 0);
-  const Scalar _tmp229 = _tmp60 * preint_prev(50, 0);
-  const Scalar _tmp230 = _tmp55 * preint_prev(35, 0);
-  const Scalar _tmp231 = _tmp228 * dt + _tmp229 * dt + _tmp230 * dt + _tmp55 * preint_prev(23, 0) +
-                         _tmp57 * preint_prev(24, 0) + _tmp60 * preint_prev(29, 0);
-  const Scalar _tmp232 = _tmp231 * _tmp55;
-  const Scalar _tmp233 = _tmp16 * preint_prev(35, 0);
-  const Scalar _tmp234 = _tmp49 * preint_prev(50, 0);
-  const Scalar _tmp235 = _tmp37 * preint_prev(42, 0);
-  const Scalar _tmp236 = _tmp16 * preint_prev(23, 0) + _tmp233 * dt + _tmp234 * dt + _tmp235 * dt +
-                         _tmp37 * preint_prev(24, 0) + _tmp49 * preint_prev(29, 0);
-  const Scalar _tmp237 = _tmp16 * _tmp236;
-  const Scalar _tmp238 = _tmp61 * preint_prev(35, 0);
-  const Scalar _tmp239 = _tmp62 * preint_prev(42, 0);
-  const Scalar _tmp240 = _tmp63 * preint_prev(50, 0);
-  const Scalar _tmp241 = _tmp238 * dt + _tmp239 * dt + _tmp240 * dt + _tmp61 * preint_prev(23, 0) +
-                         _tmp62 * preint_prev(24, 0) + _tmp63 * preint_prev(29, 0);
-  const Scalar _tmp242 = _tmp241 * _tmp61;
-  const Scalar _tmp243 = _tmp20 * _tmp208;
-  const Scalar _tmp244 = _tmp222 * _tmp51;
-  const Scalar _tmp245 = _tmp38 * _tmp40;
-  const Scalar _tmp246 = _tmp210 * _tmp245 + _tmp243 * _tmp29 + _tmp244 * _tmp50;
-  const Scalar _tmp247 = _tmp57 * preint_prev(43, 0);
-  const Scalar _tmp248 = _tmp60 * preint_prev(51, 0);
-  const Scalar _tmp249 = _tmp55 * preint_prev(36, 0);
-  const Scalar _tmp250 = _tmp247 * dt + _tmp248 * dt + _tmp249 * dt + _tmp55 * preint_prev(28, 0) +
-                         _tmp57 * preint_prev(29, 0) + _tmp60 * preint_prev(30, 0);
-  const Scalar _tmp251 = _tmp250 * _tmp55;
-  const Scalar _tmp252 = _tmp16 * preint_prev(36, 0);
-  const Scalar _tmp253 = _tmp49 * preint_prev(51, 0);
-  const Scalar _tmp254 = _tmp37 * preint_prev(43, 0);
-  const Scalar _tmp255 = _tmp16 * preint_prev(28, 0) + _tmp252 * dt + _tmp253 * dt + _tmp254 * dt +
-                         _tmp37 * preint_prev(29, 0) + _tmp49 * preint_prev(30, 0);
-  const Scalar _tmp256 = _tmp16 * _tmp255;
-  const Scalar _tmp257 = _tmp61 * preint_prev(36, 0);
-  const Scalar _tmp258 = _tmp62 * preint_prev(43, 0);
-  const Scalar _tmp259 = _tmp63 * preint_prev(51, 0);
-  const Scalar _tmp260 = _tmp257 * dt + _tmp258 * dt + _tmp259 * dt + _tmp61 * preint_prev(28, 0) +
-                         _tmp62 * preint_prev(29, 0) + _tmp63 * preint_prev(30, 0);
-  const Scalar _tmp261 = _tmp260 * _tmp61;
-  const Scalar _tmp262 = _tmp50 * _tmp52;
-  const Scalar _tmp263 = _tmp210 * _tmp44;
-  const Scalar _tmp264 = _tmp222 * _tmp262 + _tmp243 * _tmp26 + _tmp263 * _tmp38;
-  const Scalar _tmp265 = _tmp57 * preint_prev(44, 0);
-  const Scalar _tmp266 = _tmp60 * preint_prev(52, 0);
-  const Scalar _tmp267 = _tmp55 * preint_prev(37, 0);
-  const Scalar _tmp268 = _tmp213 + _tmp265 * dt + _tmp266 * dt + _tmp267 * dt +
-                         _tmp57 * preint_prev(35, 0) + _tmp60 * preint_prev(36, 0);
-  const Scalar _tmp269 = _tmp268 * _tmp55;
-  const Scalar _tmp270 = _tmp16 * preint_prev(37, 0);
-  const Scalar _tmp271 = _tmp49 * preint_prev(52, 0);
-  const Scalar _tmp272 = _tmp37 * preint_prev(44, 0);
-  const Scalar _tmp273 = _tmp216 + _tmp270 * dt + _tmp271 * dt + _tmp272 * dt +
-                         _tmp37 * preint_prev(35, 0) + _tmp49 * preint_prev(36, 0);
-  const Scalar _tmp274 = _tmp16 * _tmp273;
-  const Scalar _tmp275 = _tmp61 * preint_prev(37, 0);
-  const Scalar _tmp276 = _tmp62 * preint_prev(44, 0);
-  const Scalar _tmp277 = _tmp63 * preint_prev(52, 0);
-  const Scalar _tmp278 = _tmp223 + _tmp275 * dt + _tmp276 * dt + _tmp277 * dt +
-                         _tmp62 * preint_prev(35, 0) + _tmp63 * preint_prev(36, 0);
-  const Scalar _tmp279 = _tmp278 * _tmp61;
-  const Scalar _tmp280 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(4));
-  const Scalar _tmp281 = _tmp207 * imu_noise(3, 0);
-  const Scalar _tmp282 = _tmp280 * imu_noise(4, 0);
-  const Scalar _tmp283 = _tmp221 * imu_noise(5, 0);
-  const Scalar _tmp284 = _tmp209 * _tmp282 + _tmp280 * _tmp281 + _tmp280 * _tmp283;
-  const Scalar _tmp285 = _tmp57 * preint_prev(45, 0);
-  const Scalar _tmp286 = _tmp60 * preint_prev(53, 0);
-  const Scalar _tmp287 = _tmp55 * preint_prev(44, 0);
-  const Scalar _tmp288 = _tmp228 + _tmp285 * dt + _tmp286 * dt + _tmp287 * dt +
-                         _tmp55 * preint_prev(41, 0) + _tmp60 * preint_prev(43, 0);
-  const Scalar _tmp289 = _tmp288 * _tmp55;
-  const Scalar _tmp290 = _tmp16 * preint_prev(44, 0);
-  const Scalar _tmp291 = _tmp49 * preint_prev(53, 0);
-  const Scalar _tmp292 = _tmp37 * preint_prev(45, 0);
-  const Scalar _tmp293 = _tmp16 * preint_prev(41, 0) + _tmp235 + _tmp290 * dt + _tmp291 * dt +
-                         _tmp292 * dt + _tmp49 * preint_prev(43, 0);
-  const Scalar _tmp294 = _tmp16 * _tmp293;
-  const Scalar _tmp295 = _tmp61 * preint_prev(44, 0);
-  const Scalar _tmp296 = _tmp62 * preint_prev(45, 0);
-  const Scalar _tmp297 = _tmp63 * preint_prev(53, 0);
-  const Scalar _tmp298 = _tmp239 + _tmp295 * dt + _tmp296 * dt + _tmp297 * dt +
-                         _tmp61 * preint_prev(41, 0) + _tmp63 * preint_prev(43, 0);
-  const Scalar _tmp299 = _tmp298 * _tmp61;
-  const Scalar _tmp300 = _tmp20 * imu_noise(3, 0);
-  const Scalar _tmp301 = _tmp280 * _tmp300;
-  const Scalar _tmp302 = _tmp50 * _tmp51;
-  const Scalar _tmp303 = _tmp280 * imu_noise(5, 0);
-  const Scalar _tmp304 = _tmp245 * _tmp282 + _tmp29 * _tmp301 + _tmp302 * _tmp303;
-  const Scalar _tmp305 = _tmp57 * preint_prev(53, 0);
-  const Scalar _tmp306 = _tmp60 * preint_prev(54, 0);
-  const Scalar _tmp307 = _tmp55 * preint_prev(52, 0);
-  const Scalar _tmp308 = _tmp248 + _tmp305 * dt + _tmp306 * dt + _tmp307 * dt +
-                         _tmp55 * preint_prev(49, 0) + _tmp57 * preint_prev(50, 0);
-  const Scalar _tmp309 = _tmp308 * _tmp55;
-  const Scalar _tmp310 = _tmp16 * preint_prev(52, 0);
-  const Scalar _tmp311 = _tmp49 * preint_prev(54, 0);
-  const Scalar _tmp312 = _tmp37 * preint_prev(53, 0);
-  const Scalar _tmp313 = _tmp16 * preint_prev(49, 0) + _tmp253 + _tmp310 * dt + _tmp311 * dt +
-                         _tmp312 * dt + _tmp37 * preint_prev(50, 0);
-  const Scalar _tmp314 = _tmp16 * _tmp313;
-  const Scalar _tmp315 = _tmp61 * preint_prev(52, 0);
-  const Scalar _tmp316 = _tmp62 * preint_prev(53, 0);
-  const Scalar _tmp317 = _tmp63 * preint_prev(54, 0);
-  const Scalar _tmp318 = _tmp259 + _tmp315 * dt + _tmp316 * dt + _tmp317 * dt +
-                         _tmp61 * preint_prev(49, 0) + _tmp62 * preint_prev(50, 0);
-  const Scalar _tmp319 = _tmp318 * _tmp61;
-  const Scalar _tmp320 = _tmp38 * _tmp44;
-  const Scalar _tmp321 = _tmp26 * _tmp301 + _tmp262 * _tmp303 + _tmp282 * _tmp320;
-  const Scalar _tmp322 = _tmp173 * _tmp57;
-  const Scalar _tmp323 = _tmp177 * _tmp37;
-  const Scalar _tmp324 = _tmp181 * _tmp62;
-  const Scalar _tmp325 = _tmp185 * _tmp57;
-  const Scalar _tmp326 = _tmp189 * _tmp37;
-  const Scalar _tmp327 = _tmp193 * _tmp62;
-  const Scalar _tmp328 = _tmp197 * _tmp57;
-  const Scalar _tmp329 = _tmp201 * _tmp37;
-  const Scalar _tmp330 = _tmp205 * _tmp62;
-  const Scalar _tmp331 = _tmp214 * _tmp57;
-  const Scalar _tmp332 = _tmp219 * _tmp37;
-  const Scalar _tmp333 = _tmp226 * _tmp62;
-  const Scalar _tmp334 = std::pow(_tmp29, Scalar(2));
-  const Scalar _tmp335 = _tmp231 * _tmp57;
-  const Scalar _tmp336 = _tmp236 * _tmp37;
-  const Scalar _tmp337 = std::pow(_tmp40, Scalar(2));
-  const Scalar _tmp338 = _tmp241 * _tmp62;
-  const Scalar _tmp339 = std::pow(_tmp51, Scalar(2));
-  const Scalar _tmp340 = _tmp250 * _tmp57;
-  const Scalar _tmp341 = _tmp255 * _tmp37;
-  const Scalar _tmp342 = _tmp260 * _tmp62;
-  const Scalar _tmp343 = _tmp26 * _tmp29;
-  const Scalar _tmp344 = _tmp208 * _tmp343 + _tmp244 * _tmp52 + _tmp263 * _tmp40;
-  const Scalar _tmp345 = _tmp268 * _tmp57;
-  const Scalar _tmp346 = _tmp273 * _tmp37;
-  const Scalar _tmp347 = _tmp278 * _tmp62;
-  const Scalar _tmp348 = _tmp288 * _tmp57;
-  const Scalar _tmp349 = _tmp293 * _tmp37;
-  const Scalar _tmp350 = _tmp298 * _tmp62;
-  const Scalar _tmp351 = _tmp334 * imu_noise(3, 0);
-  const Scalar _tmp352 = _tmp339 * imu_noise(5, 0);
-  const Scalar _tmp353 = _tmp280 * _tmp351 + _tmp280 * _tmp352 + _tmp282 * _tmp337;
-  const Scalar _tmp354 = _tmp308 * _tmp57;
-  const Scalar _tmp355 = _tmp313 * _tmp37;
-  const Scalar _tmp356 = _tmp318 * _tmp62;
-  const Scalar _tmp357 = _tmp40 * _tmp44;
-  const Scalar _tmp358 = _tmp51 * _tmp52;
-  const Scalar _tmp359 = _tmp343 * imu_noise(3, 0);
-  const Scalar _tmp360 = _tmp280 * _tmp359 + _tmp282 * _tmp357 + _tmp303 * _tmp358;
-  const Scalar _tmp361 = _tmp173 * _tmp60;
-  const Scalar _tmp362 = _tmp177 * _tmp49;
-  const Scalar _tmp363 = _tmp181 * _tmp63;
-  const Scalar _tmp364 = _tmp185 * _tmp60;
-  const Scalar _tmp365 = _tmp189 * _tmp49;
-  const Scalar _tmp366 = _tmp193 * _tmp63;
-  const Scalar _tmp367 = _tmp197 * _tmp60;
-  const Scalar _tmp368 = _tmp201 * _tmp49;
-  const Scalar _tmp369 = _tmp205 * _tmp63;
-  const Scalar _tmp370 = _tmp214 * _tmp60;
-  const Scalar _tmp371 = _tmp219 * _tmp49;
-  const Scalar _tmp372 = _tmp226 * _tmp63;
-  const Scalar _tmp373 = _tmp231 * _tmp60;
-  const Scalar _tmp374 = _tmp236 * _tmp49;
-  const Scalar _tmp375 = _tmp241 * _tmp63;
-  const Scalar _tmp376 = _tmp250 * _tmp60;
-  const Scalar _tmp377 = _tmp255 * _tmp49;
-  const Scalar _tmp378 = std::pow(_tmp52, Scalar(2));
-  const Scalar _tmp379 = std::pow(_tmp26, Scalar(2));
-  const Scalar _tmp380 = _tmp260 * _tmp63;
-  const Scalar _tmp381 = std::pow(_tmp44, Scalar(2));
-  const Scalar _tmp382 = _tmp268 * _tmp60;
-  const Scalar _tmp383 = _tmp273 * _tmp49;
-  const Scalar _tmp384 = _tmp278 * _tmp63;
-  const Scalar _tmp385 = _tmp288 * _tmp60;
-  const Scalar _tmp386 = _tmp293 * _tmp49;
-  const Scalar _tmp387 = _tmp298 * _tmp63;
-  const Scalar _tmp388 = _tmp308 * _tmp60;
-  const Scalar _tmp389 = _tmp313 * _tmp49;
-  const Scalar _tmp390 = _tmp318 * _tmp63;
-  const Scalar _tmp391 = _tmp378 * imu_noise(5, 0);
-  const Scalar _tmp392 = _tmp379 * imu_noise(3, 0);
-  const Scalar _tmp393 = _tmp280 * _tmp391 + _tmp280 * _tmp392 + _tmp282 * _tmp381;
-  const Scalar _tmp394 = _tmp154 + _tmp175 + _tmp176;
-  const Scalar _tmp395 = _tmp156 + _tmp179 + _tmp180;
-  const Scalar _tmp396 = _tmp152 + _tmp171 + _tmp172;
-  const Scalar _tmp397 = _tmp160 + _tmp187 + _tmp188;
-  const Scalar _tmp398 = _tmp162 + _tmp191 + _tmp192;
-  const Scalar _tmp399 = _tmp158 + _tmp183 + _tmp184;
-  const Scalar _tmp400 = _tmp166 + _tmp199 + _tmp200;
-  const Scalar _tmp401 = _tmp168 + _tmp203 + _tmp204;
-  const Scalar _tmp402 = _tmp164 + _tmp195 + _tmp196;
-  const Scalar _tmp403 = _tmp216 + _tmp217 + _tmp218;
-  const Scalar _tmp404 = _tmp223 + _tmp224 + _tmp225;
-  const Scalar _tmp405 = _tmp211 + _tmp212 + _tmp213;
-  const Scalar _tmp406 = _tmp233 + _tmp234 + _tmp235;
-  const Scalar _tmp407 = _tmp238 + _tmp239 + _tmp240;
-  const Scalar _tmp408 = _tmp228 + _tmp229 + _tmp230;
-  const Scalar _tmp409 = _tmp252 + _tmp253 + _tmp254;
-  const Scalar _tmp410 = _tmp257 + _tmp258 + _tmp259;
-  const Scalar _tmp411 = _tmp247 + _tmp248 + _tmp249;
-  const Scalar _tmp412 = _tmp270 + _tmp271 + _tmp272;
-  const Scalar _tmp413 = _tmp275 + _tmp276 + _tmp277;
-  const Scalar _tmp414 = (Scalar(1) / Scalar(4)) * std::pow(dt, Scalar(5));
-  const Scalar _tmp415 = _tmp414 * imu_noise(4, 0);
-  const Scalar _tmp416 = _tmp265 + _tmp266 + _tmp267;
-  const Scalar _tmp417 = _tmp290 + _tmp291 + _tmp292;
-  const Scalar _tmp418 = _tmp295 + _tmp296 + _tmp297;
-  const Scalar _tmp419 = _tmp285 + _tmp286 + _tmp287;
-  const Scalar _tmp420 = _tmp300 * _tmp414;
-  const Scalar _tmp421 = _tmp414 * imu_noise(5, 0);
-  const Scalar _tmp422 = _tmp245 * _tmp415 + _tmp29 * _tmp420 + _tmp302 * _tmp421;
-  const Scalar _tmp423 = _tmp310 + _tmp311 + _tmp312;
-  const Scalar _tmp424 = _tmp315 + _tmp316 + _tmp317;
-  const Scalar _tmp425 = _tmp305 + _tmp306 + _tmp307;
-  const Scalar _tmp426 = _tmp26 * _tmp420 + _tmp262 * _tmp421 + _tmp320 * _tmp415;
-  const Scalar _tmp427 = _tmp357 * _tmp415 + _tmp358 * _tmp421 + _tmp359 * _tmp414;
+      -_tmp33 * preint_prev(11, 0) + _tmp54 * preint_prev(10, 0) + preint_prev(25, 0);
+  const Scalar _tmp117 = _tmp113 * _tmp51 + _tmp115 * _tmp20 + _tmp116 * _tmp43;
+  const Scalar _tmp118 =
+      -_tmp33 * preint_prev(12, 0) + _tmp54 * preint_prev(11, 0) + preint_prev(26, 0);
+  const Scalar _tmp119 =
+      _tmp45 * preint_prev(12, 0) - _tmp54 * preint_prev(14, 0) + preint_prev(17, 0);
+  const Scalar _tmp120 = _tmp109 - _tmp114 + preint_prev(21, 0);
+  const Scalar _tmp121 = _tmp118 * _tmp43 + _tmp119 * _tmp20 + _tmp120 * _tmp51;
+  const Scalar _tmp122 = _tmp111 * _tmp33 - _tmp116 * _tmp45 - _tmp33 * preint_prev(21, 0) +
+                         _tmp54 * preint_prev(20, 0) + preint_prev(29, 0);
+  const Scalar _tmp123 = _tmp116 * _tmp54 - _tmp118 * _tmp33 - _tmp33 * preint_prev(26, 0) +
+                         _tmp54 * preint_prev(25, 0) + preint_prev(30, 0);
+  const Scalar _tmp124 = -_tmp111 * _tmp54 + _tmp118 * _tmp45 - _tmp33 * preint_prev(17, 0) +
+                         _tmp54 * preint_prev(16, 0) + preint_prev(28, 0);
+  const Scalar _tmp125 = std::pow(_tmp43, Scalar(2));
+  const Scalar _tmp126 = _tmp64 * imu_noise(5, 0);
+  const Scalar _tmp127 = std::pow(_tmp51, Scalar(2));
+  const Scalar _tmp128 = _tmp64 * imu_noise(4, 0);
+  const Scalar _tmp129 = std::pow(_tmp20, Scalar(2));
+  const Scalar _tmp130 = _tmp64 * imu_noise(3, 0);
+  const Scalar _tmp131 = -_tmp107 * _tmp54 + _tmp120 * _tmp45 + _tmp33 * preint_prev(18, 0) -
+                         _tmp45 * preint_prev(16, 0) + preint_prev(23, 0);
+  const Scalar _tmp132 = -_tmp108 * _tmp54 + _tmp119 * _tmp45 + _tmp45 * preint_prev(17, 0) -
+                         _tmp54 * preint_prev(18, 0) + preint_prev(19, 0);
+  const Scalar _tmp133 = _tmp107 * _tmp33 - _tmp113 * _tmp45 + _tmp33 * preint_prev(22, 0) -
+                         _tmp45 * preint_prev(20, 0) + preint_prev(24, 0);
+  const Scalar _tmp134 = _tmp113 * _tmp50 + _tmp115 * _tmp25 + _tmp116 * _tmp42;
+  const Scalar _tmp135 = _tmp118 * _tmp42 + _tmp119 * _tmp25 + _tmp120 * _tmp50;
+  const Scalar _tmp136 = _tmp107 * _tmp50 + _tmp108 * _tmp25 + _tmp111 * _tmp42;
+  const Scalar _tmp137 = _tmp128 * _tmp50;
+  const Scalar _tmp138 = _tmp124 * _tmp42 + _tmp131 * _tmp50 + _tmp132 * _tmp25;
+  const Scalar _tmp139 = _tmp122 * _tmp50 + _tmp123 * _tmp42 + _tmp124 * _tmp25;
+  const Scalar _tmp140 = _tmp42 * _tmp43;
+  const Scalar _tmp141 = _tmp130 * _tmp20;
+  const Scalar _tmp142 = _tmp122 * _tmp42 + _tmp131 * _tmp25 + _tmp133 * _tmp50;
+  const Scalar _tmp143 = std::pow(_tmp42, Scalar(2));
+  const Scalar _tmp144 = std::pow(_tmp25, Scalar(2));
+  const Scalar _tmp145 = std::pow(_tmp50, Scalar(2));
+  const Scalar _tmp146 = _tmp107 * _tmp52 + _tmp108 * _tmp30 + _tmp111 * _tmp39;
+  const Scalar _tmp147 = _tmp113 * _tmp52 + _tmp115 * _tmp30 + _tmp116 * _tmp39;
+  const Scalar _tmp148 = _tmp118 * _tmp39 + _tmp119 * _tmp30 + _tmp120 * _tmp52;
+  const Scalar _tmp149 = _tmp51 * _tmp52;
+  const Scalar _tmp150 = _tmp126 * _tmp39;
+  const Scalar _tmp151 = _tmp124 * _tmp39 + _tmp131 * _tmp52 + _tmp132 * _tmp30;
+  const Scalar _tmp152 = _tmp122 * _tmp52 + _tmp123 * _tmp39 + _tmp124 * _tmp30;
+  const Scalar _tmp153 = _tmp122 * _tmp39 + _tmp131 * _tmp30 + _tmp133 * _tmp52;
+  const Scalar _tmp154 = _tmp25 * _tmp30;
+  const Scalar _tmp155 = std::pow(_tmp52, Scalar(2));
+  const Scalar _tmp156 = std::pow(_tmp30, Scalar(2));
+  const Scalar _tmp157 = std::pow(_tmp39, Scalar(2));
+  const Scalar _tmp158 = _tmp67 * preint_prev(11, 0);
+  const Scalar _tmp159 = _tmp66 * preint_prev(14, 0);
+  const Scalar _tmp160 = dt * preint_prev(21, 0) + preint_prev(39, 0);
+  const Scalar _tmp161 = -_tmp158 + _tmp159 + _tmp160;
+  const Scalar _tmp162 = dt * preint_prev(26, 0) + preint_prev(47, 0);
+  const Scalar _tmp163 = _tmp162 - _tmp66 * preint_prev(12, 0) + _tmp68 * preint_prev(11, 0);
+  const Scalar _tmp164 = dt * preint_prev(17, 0) + preint_prev(32, 0);
+  const Scalar _tmp165 = _tmp164 + _tmp67 * preint_prev(12, 0) - _tmp68 * preint_prev(14, 0);
+  const Scalar _tmp166 = _tmp161 * _tmp51 + _tmp163 * _tmp43 + _tmp165 * _tmp20;
+  const Scalar _tmp167 = dt * preint_prev(20, 0) + preint_prev(38, 0);
+  const Scalar _tmp168 = _tmp167 + _tmp66 * preint_prev(13, 0) - _tmp67 * preint_prev(10, 0);
+  const Scalar _tmp169 = dt * preint_prev(25, 0) + preint_prev(46, 0);
+  const Scalar _tmp170 = _tmp169 - _tmp66 * preint_prev(11, 0) + _tmp68 * preint_prev(10, 0);
+  const Scalar _tmp171 = _tmp68 * preint_prev(13, 0);
+  const Scalar _tmp172 = dt * preint_prev(16, 0) + preint_prev(31, 0);
+  const Scalar _tmp173 = _tmp158 - _tmp171 + _tmp172;
+  const Scalar _tmp174 = _tmp168 * _tmp51 + _tmp170 * _tmp43 + _tmp173 * _tmp20;
+  const Scalar _tmp175 = dt * preint_prev(22, 0) + preint_prev(40, 0);
+  const Scalar _tmp176 = _tmp175 + _tmp66 * preint_prev(15, 0) - _tmp67 * preint_prev(13, 0);
+  const Scalar _tmp177 = -_tmp159 + _tmp171 + dt * preint_prev(27, 0) + preint_prev(48, 0);
+  const Scalar _tmp178 = dt * preint_prev(18, 0) + preint_prev(33, 0);
+  const Scalar _tmp179 = _tmp178 + _tmp67 * preint_prev(14, 0) - _tmp68 * preint_prev(15, 0);
+  const Scalar _tmp180 = _tmp176 * _tmp51 + _tmp177 * _tmp43 + _tmp179 * _tmp20;
+  const Scalar _tmp181 = dt * preint_prev(28, 0);
+  const Scalar _tmp182 = -_tmp165 * _tmp33 + _tmp173 * _tmp54 + _tmp181 +
+                         _tmp67 * preint_prev(26, 0) - _tmp68 * preint_prev(27, 0) +
+                         preint_prev(36, 0);
+  const Scalar _tmp183 = dt * preint_prev(29, 0);
+  const Scalar _tmp184 = -_tmp161 * _tmp33 + _tmp168 * _tmp54 + _tmp183 +
+                         _tmp66 * preint_prev(27, 0) - _tmp67 * preint_prev(25, 0) +
+                         preint_prev(43, 0);
+  const Scalar _tmp185 = dt * preint_prev(30, 0) + preint_prev(51, 0);
+  const Scalar _tmp186 = -_tmp163 * _tmp33 + _tmp170 * _tmp54 + _tmp185 -
+                         _tmp66 * preint_prev(26, 0) + _tmp68 * preint_prev(25, 0);
+  const Scalar _tmp187 = _tmp182 * _tmp20 + _tmp184 * _tmp51 + _tmp186 * _tmp43;
+  const Scalar _tmp188 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(4));
+  const Scalar _tmp189 = _tmp188 * imu_noise(5, 0);
+  const Scalar _tmp190 = _tmp188 * imu_noise(4, 0);
+  const Scalar _tmp191 = _tmp129 * imu_noise(3, 0);
+  const Scalar _tmp192 = dt * preint_prev(19, 0) + preint_prev(34, 0);
+  const Scalar _tmp193 = _tmp165 * _tmp45 - _tmp179 * _tmp54 + _tmp192 +
+                         _tmp67 * preint_prev(17, 0) - _tmp68 * preint_prev(18, 0);
+  const Scalar _tmp194 = dt * preint_prev(23, 0);
+  const Scalar _tmp195 = _tmp194 + preint_prev(41, 0);
+  const Scalar _tmp196 = _tmp161 * _tmp45 - _tmp176 * _tmp54 + _tmp195 +
+                         _tmp66 * preint_prev(18, 0) - _tmp67 * preint_prev(16, 0);
+  const Scalar _tmp197 = _tmp181 + preint_prev(49, 0);
+  const Scalar _tmp198 = _tmp163 * _tmp45 - _tmp177 * _tmp54 + _tmp197 -
+                         _tmp66 * preint_prev(17, 0) + _tmp68 * preint_prev(16, 0);
+  const Scalar _tmp199 = _tmp193 * _tmp20 + _tmp196 * _tmp51 + _tmp198 * _tmp43;
+  const Scalar _tmp200 = dt * preint_prev(24, 0) + preint_prev(42, 0);
+  const Scalar _tmp201 = -_tmp168 * _tmp45 + _tmp176 * _tmp33 + _tmp200 +
+                         _tmp66 * preint_prev(22, 0) - _tmp67 * preint_prev(20, 0);
+  const Scalar _tmp202 = -_tmp173 * _tmp45 + _tmp179 * _tmp33 + _tmp194 +
+                         _tmp67 * preint_prev(21, 0) - _tmp68 * preint_prev(22, 0) +
+                         preint_prev(35, 0);
+  const Scalar _tmp203 = _tmp183 + preint_prev(50, 0);
+  const Scalar _tmp204 = -_tmp170 * _tmp45 + _tmp177 * _tmp33 + _tmp203 -
+                         _tmp66 * preint_prev(21, 0) + _tmp68 * preint_prev(20, 0);
+  const Scalar _tmp205 = _tmp20 * _tmp202 + _tmp201 * _tmp51 + _tmp204 * _tmp43;
+  const Scalar _tmp206 = _tmp50 * _tmp51;
+  const Scalar _tmp207 = _tmp20 * imu_noise(3, 0);
+  const Scalar _tmp208 = _tmp188 * _tmp207;
+  const Scalar _tmp209 = _tmp140 * _tmp189 + _tmp190 * _tmp206 + _tmp208 * _tmp25;
+  const Scalar _tmp210 = _tmp189 * _tmp39;
+  const Scalar _tmp211 = _tmp149 * _tmp190 + _tmp208 * _tmp30 + _tmp210 * _tmp43;
+  const Scalar _tmp212 = _tmp164 * _tmp67 + _tmp165 * _tmp67 - _tmp178 * _tmp68 - _tmp179 * _tmp68 +
+                         _tmp192 * dt + dt * preint_prev(34, 0) + preint_prev(37, 0);
+  const Scalar _tmp213 = _tmp161 * _tmp67 - _tmp172 * _tmp67 - _tmp176 * _tmp68 + _tmp178 * _tmp66 +
+                         _tmp195 * dt + dt * preint_prev(35, 0) + preint_prev(44, 0);
+  const Scalar _tmp214 = _tmp163 * _tmp67 - _tmp164 * _tmp66 + _tmp172 * _tmp68 - _tmp177 * _tmp68 +
+                         _tmp197 * dt + dt * preint_prev(36, 0) + preint_prev(52, 0);
+  const Scalar _tmp215 = (Scalar(1) / Scalar(4)) * std::pow(dt, Scalar(5));
+  const Scalar _tmp216 = _tmp215 * imu_noise(5, 0);
+  const Scalar _tmp217 = _tmp215 * imu_noise(4, 0);
+  const Scalar _tmp218 = -_tmp162 * _tmp66 - _tmp163 * _tmp66 + _tmp169 * _tmp68 +
+                         _tmp170 * _tmp68 + _tmp185 * dt + dt * preint_prev(51, 0) +
+                         preint_prev(54, 0);
+  const Scalar _tmp219 = -_tmp160 * _tmp66 + _tmp167 * _tmp68 - _tmp170 * _tmp67 +
+                         _tmp177 * _tmp66 + _tmp203 * dt + dt * preint_prev(43, 0) +
+                         preint_prev(53, 0);
+  const Scalar _tmp220 = -_tmp167 * _tmp67 - _tmp168 * _tmp67 + _tmp175 * _tmp66 +
+                         _tmp176 * _tmp66 + _tmp200 * dt + dt * preint_prev(42, 0) +
+                         preint_prev(45, 0);
+  const Scalar _tmp221 = _tmp176 * _tmp50 + _tmp177 * _tmp42 + _tmp179 * _tmp25;
+  const Scalar _tmp222 = _tmp168 * _tmp50 + _tmp170 * _tmp42 + _tmp173 * _tmp25;
+  const Scalar _tmp223 = _tmp161 * _tmp50 + _tmp163 * _tmp42 + _tmp165 * _tmp25;
+  const Scalar _tmp224 = _tmp201 * _tmp50 + _tmp202 * _tmp25 + _tmp204 * _tmp42;
+  const Scalar _tmp225 = _tmp182 * _tmp25 + _tmp184 * _tmp50 + _tmp186 * _tmp42;
+  const Scalar _tmp226 = _tmp193 * _tmp25 + _tmp196 * _tmp50 + _tmp198 * _tmp42;
+  const Scalar _tmp227 = _tmp144 * imu_noise(3, 0);
+  const Scalar _tmp228 = _tmp50 * _tmp52;
+  const Scalar _tmp229 = _tmp154 * imu_noise(3, 0);
+  const Scalar _tmp230 = _tmp188 * _tmp229 + _tmp190 * _tmp228 + _tmp210 * _tmp42;
+  const Scalar _tmp231 = _tmp212 * _tmp25 + _tmp213 * _tmp50 + _tmp214 * _tmp42;
+  const Scalar _tmp232 = _tmp207 * _tmp215;
+  const Scalar _tmp233 = _tmp213 * _tmp25 + _tmp219 * _tmp42 + _tmp220 * _tmp50;
+  const Scalar _tmp234 = _tmp214 * _tmp25 + _tmp218 * _tmp42 + _tmp219 * _tmp50;
+  const Scalar _tmp235 = _tmp161 * _tmp52 + _tmp163 * _tmp39 + _tmp165 * _tmp30;
+  const Scalar _tmp236 = _tmp176 * _tmp52 + _tmp177 * _tmp39 + _tmp179 * _tmp30;
+  const Scalar _tmp237 = _tmp168 * _tmp52 + _tmp170 * _tmp39 + _tmp173 * _tmp30;
+  const Scalar _tmp238 = _tmp182 * _tmp30 + _tmp184 * _tmp52 + _tmp186 * _tmp39;
+  const Scalar _tmp239 = _tmp193 * _tmp30 + _tmp196 * _tmp52 + _tmp198 * _tmp39;
+  const Scalar _tmp240 = _tmp201 * _tmp52 + _tmp202 * _tmp30 + _tmp204 * _tmp39;
+  const Scalar _tmp241 = _tmp156 * imu_noise(3, 0);
+  const Scalar _tmp242 = _tmp214 * _tmp30 + _tmp218 * _tmp39 + _tmp219 * _tmp52;
+  const Scalar _tmp243 = _tmp212 * _tmp30 + _tmp213 * _tmp52 + _tmp214 * _tmp39;
+  const Scalar _tmp244 = _tmp213 * _tmp30 + _tmp219 * _tmp39 + _tmp220 * _tmp52;
+  const Scalar _tmp245 = _tmp216 * _tmp39;
 
   // Output terms (2)
   if (upsilon != nullptr) {
     Eigen::Matrix<Scalar, 10, 1>& _upsilon = (*upsilon);
 
-    _upsilon(0, 0) = _tmp10 * preint_prev(3, 0) + _tmp11 * preint_prev(1, 0) -
-                     _tmp12 * preint_prev(2, 0) + _tmp13 * preint_prev(0, 0);
-    _upsilon(1, 0) = _tmp10 * preint_prev(2, 0) - _tmp11 * preint_prev(0, 0) +
-                     _tmp12 * preint_prev(3, 0) + _tmp13 * preint_prev(1, 0);
-    _upsilon(2, 0) = -_tmp10 * preint_prev(1, 0) + _tmp11 * preint_prev(3, 0) +
-                     _tmp12 * preint_prev(0, 0) + _tmp13 * preint_prev(2, 0);
-    _upsilon(3, 0) = -_tmp10 * preint_prev(0, 0) - _tmp11 * preint_prev(2, 0) -
-                     _tmp12 * preint_prev(1, 0) + _tmp13 * preint_prev(3, 0);
-    _upsilon(4, 0) = _tmp16 * _tmp32 + _tmp37 * _tmp46 + _tmp49 * _tmp54 + preint_prev(4, 0);
-    _upsilon(5, 0) = _tmp32 * _tmp55 + _tmp46 * _tmp57 + _tmp54 * _tmp60 + preint_prev(5, 0);
-    _upsilon(6, 0) = _tmp32 * _tmp61 + _tmp46 * _tmp62 + _tmp54 * _tmp63 + preint_prev(6, 0);
+    _upsilon(0, 0) = _tmp10 * z_imu_est(2, 0) + _tmp11 * z_imu_est(0, 0) +
+                     _tmp12 * preint_prev(0, 0) - _tmp9 * z_imu_est(1, 0);
+    _upsilon(1, 0) = _tmp11 * z_imu_est(1, 0) + _tmp12 * preint_prev(1, 0) -
+                     _tmp13 * z_imu_est(2, 0) + _tmp9 * z_imu_est(0, 0);
+    _upsilon(2, 0) = -_tmp10 * z_imu_est(0, 0) + _tmp11 * z_imu_est(2, 0) +
+                     _tmp12 * preint_prev(2, 0) + _tmp13 * z_imu_est(1, 0);
+    _upsilon(3, 0) = -_tmp10 * z_imu_est(1, 0) + _tmp12 * preint_prev(3, 0) -
+                     _tmp13 * z_imu_est(0, 0) - _tmp9 * z_imu_est(2, 0);
+    _upsilon(4, 0) = _tmp16 * _tmp33 + _tmp37 * _tmp45 + _tmp49 * _tmp54 + preint_prev(4, 0);
+    _upsilon(5, 0) = _tmp33 * _tmp55 + _tmp45 * _tmp58 + _tmp54 * _tmp60 + preint_prev(5, 0);
+    _upsilon(6, 0) = _tmp33 * _tmp61 + _tmp45 * _tmp62 + _tmp54 * _tmp63 + preint_prev(6, 0);
     _upsilon(7, 0) = _tmp16 * _tmp66 + _tmp37 * _tmp67 + _tmp49 * _tmp68 + dt * preint_prev(4, 0) +
                      preint_prev(7, 0);
-    _upsilon(8, 0) = _tmp55 * _tmp66 + _tmp57 * _tmp67 + _tmp60 * _tmp68 + dt * preint_prev(5, 0) +
+    _upsilon(8, 0) = _tmp55 * _tmp66 + _tmp58 * _tmp67 + _tmp60 * _tmp68 + dt * preint_prev(5, 0) +
                      preint_prev(8, 0);
     _upsilon(9, 0) = _tmp61 * _tmp66 + _tmp62 * _tmp67 + _tmp63 * _tmp68 + dt * preint_prev(6, 0) +
                      preint_prev(9, 0);
   }
 
   if (cov != nullptr) {
-    Eigen::Matrix<Scalar, 9, 9>& _cov = (*cov);
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
 
-    _cov(0, 0) = _tmp102 * _tmp16 + std::pow(_tmp105, Scalar(2)) * _tmp106 + _tmp113 * _tmp61 +
-                 _tmp55 * _tmp95 + std::pow(_tmp75, Scalar(2)) * _tmp76 +
-                 std::pow(_tmp81, Scalar(2)) * _tmp82;
-    _cov(1, 0) = _tmp114 * _tmp55 + _tmp115 * _tmp16 + _tmp116 * _tmp61 + _tmp124;
-    _cov(2, 0) = _tmp125 * _tmp55 + _tmp126 * _tmp16 + _tmp127 * _tmp61 + _tmp133;
-    _cov(3, 0) = _tmp135 * _tmp55 + _tmp137 * _tmp16 + _tmp139 * _tmp61;
-    _cov(4, 0) = _tmp141 * _tmp55 + _tmp143 * _tmp16 + _tmp145 * _tmp61;
-    _cov(5, 0) = _tmp147 * _tmp55 + _tmp149 * _tmp16 + _tmp151 * _tmp61;
-    _cov(6, 0) = _tmp153 * _tmp55 + _tmp155 * _tmp16 + _tmp157 * _tmp61;
-    _cov(7, 0) = _tmp159 * _tmp55 + _tmp16 * _tmp161 + _tmp163 * _tmp61;
-    _cov(8, 0) = _tmp16 * _tmp167 + _tmp165 * _tmp55 + _tmp169 * _tmp61;
-    _cov(0, 1) = _tmp102 * _tmp37 + _tmp113 * _tmp62 + _tmp124 + _tmp57 * _tmp95;
-    _cov(1, 1) = _tmp106 * std::pow(_tmp121, Scalar(2)) + _tmp114 * _tmp57 + _tmp115 * _tmp37 +
-                 _tmp116 * _tmp62 + std::pow(_tmp119, Scalar(2)) * _tmp82 +
-                 std::pow(_tmp123, Scalar(2)) * _tmp76;
-    _cov(2, 1) = _tmp125 * _tmp57 + _tmp126 * _tmp37 + _tmp127 * _tmp62 + _tmp170;
-    _cov(3, 1) = _tmp135 * _tmp57 + _tmp137 * _tmp37 + _tmp139 * _tmp62;
-    _cov(4, 1) = _tmp141 * _tmp57 + _tmp143 * _tmp37 + _tmp145 * _tmp62;
-    _cov(5, 1) = _tmp147 * _tmp57 + _tmp149 * _tmp37 + _tmp151 * _tmp62;
-    _cov(6, 1) = _tmp153 * _tmp57 + _tmp155 * _tmp37 + _tmp157 * _tmp62;
-    _cov(7, 1) = _tmp159 * _tmp57 + _tmp161 * _tmp37 + _tmp163 * _tmp62;
-    _cov(8, 1) = _tmp165 * _tmp57 + _tmp167 * _tmp37 + _tmp169 * _tmp62;
-    _cov(0, 2) = _tmp102 * _tmp49 + _tmp113 * _tmp63 + _tmp133 + _tmp60 * _tmp95;
-    _cov(1, 2) = _tmp114 * _tmp60 + _tmp115 * _tmp49 + _tmp116 * _tmp63 + _tmp170;
-    _cov(2, 2) = _tmp106 * std::pow(_tmp132, Scalar(2)) + _tmp125 * _tmp60 + _tmp126 * _tmp49 +
-                 _tmp127 * _tmp63 + std::pow(_tmp128, Scalar(2)) * _tmp76 +
-                 std::pow(_tmp130, Scalar(2)) * _tmp82;
-    _cov(3, 2) = _tmp135 * _tmp60 + _tmp137 * _tmp49 + _tmp139 * _tmp63;
-    _cov(4, 2) = _tmp141 * _tmp60 + _tmp143 * _tmp49 + _tmp145 * _tmp63;
-    _cov(5, 2) = _tmp147 * _tmp60 + _tmp149 * _tmp49 + _tmp151 * _tmp63;
-    _cov(6, 2) = _tmp153 * _tmp60 + _tmp155 * _tmp49 + _tmp157 * _tmp63;
-    _cov(7, 2) = _tmp159 * _tmp60 + _tmp161 * _tmp49 + _tmp163 * _tmp63;
-    _cov(8, 2) = _tmp165 * _tmp60 + _tmp167 * _tmp49 + _tmp169 * _tmp63;
-    _cov(0, 3) =
-        _tmp102 * _tmp98 + _tmp112 * _tmp113 + _tmp174 + _tmp178 + _tmp182 + _tmp88 * _tmp95;
-    _cov(1, 3) =
-        _tmp112 * _tmp116 + _tmp114 * _tmp88 + _tmp115 * _tmp98 + _tmp186 + _tmp190 + _tmp194;
-    _cov(2, 3) =
-        _tmp112 * _tmp127 + _tmp125 * _tmp88 + _tmp126 * _tmp98 + _tmp198 + _tmp202 + _tmp206;
-    _cov(3, 3) = _tmp112 * _tmp139 + _tmp135 * _tmp88 + _tmp137 * _tmp98 + _tmp207 * _tmp208 +
-                 _tmp209 * _tmp210 + _tmp215 + _tmp220 + _tmp221 * _tmp222 + _tmp227;
-    _cov(4, 3) = _tmp112 * _tmp145 + _tmp141 * _tmp88 + _tmp143 * _tmp98 + _tmp232 + _tmp237 +
-                 _tmp242 + _tmp246;
-    _cov(5, 3) = _tmp112 * _tmp151 + _tmp147 * _tmp88 + _tmp149 * _tmp98 + _tmp251 + _tmp256 +
-                 _tmp261 + _tmp264;
-    _cov(6, 3) = _tmp112 * _tmp157 + _tmp153 * _tmp88 + _tmp155 * _tmp98 + _tmp269 + _tmp274 +
-                 _tmp279 + _tmp284;
-    _cov(7, 3) = _tmp112 * _tmp163 + _tmp159 * _tmp88 + _tmp161 * _tmp98 + _tmp289 + _tmp294 +
-                 _tmp299 + _tmp304;
-    _cov(8, 3) = _tmp112 * _tmp169 + _tmp165 * _tmp88 + _tmp167 * _tmp98 + _tmp309 + _tmp314 +
-                 _tmp319 + _tmp321;
-    _cov(0, 4) =
-        _tmp101 * _tmp102 + _tmp110 * _tmp113 + _tmp322 + _tmp323 + _tmp324 + _tmp90 * _tmp95;
-    _cov(1, 4) =
-        _tmp101 * _tmp115 + _tmp110 * _tmp116 + _tmp114 * _tmp90 + _tmp325 + _tmp326 + _tmp327;
-    _cov(2, 4) =
-        _tmp101 * _tmp126 + _tmp110 * _tmp127 + _tmp125 * _tmp90 + _tmp328 + _tmp329 + _tmp330;
-    _cov(3, 4) = _tmp101 * _tmp137 + _tmp110 * _tmp139 + _tmp135 * _tmp90 + _tmp246 + _tmp331 +
-                 _tmp332 + _tmp333;
-    _cov(4, 4) = _tmp101 * _tmp143 + _tmp110 * _tmp145 + _tmp141 * _tmp90 + _tmp208 * _tmp334 +
-                 _tmp210 * _tmp337 + _tmp222 * _tmp339 + _tmp335 + _tmp336 + _tmp338;
-    _cov(5, 4) = _tmp101 * _tmp149 + _tmp110 * _tmp151 + _tmp147 * _tmp90 + _tmp340 + _tmp341 +
-                 _tmp342 + _tmp344;
-    _cov(6, 4) = _tmp101 * _tmp155 + _tmp110 * _tmp157 + _tmp153 * _tmp90 + _tmp304 + _tmp345 +
-                 _tmp346 + _tmp347;
-    _cov(7, 4) = _tmp101 * _tmp161 + _tmp110 * _tmp163 + _tmp159 * _tmp90 + _tmp348 + _tmp349 +
-                 _tmp350 + _tmp353;
-    _cov(8, 4) = _tmp101 * _tmp167 + _tmp110 * _tmp169 + _tmp165 * _tmp90 + _tmp354 + _tmp355 +
-                 _tmp356 + _tmp360;
-    _cov(0, 5) =
-        _tmp102 * _tmp97 + _tmp108 * _tmp113 + _tmp361 + _tmp362 + _tmp363 + _tmp93 * _tmp95;
-    _cov(1, 5) =
-        _tmp108 * _tmp116 + _tmp114 * _tmp93 + _tmp115 * _tmp97 + _tmp364 + _tmp365 + _tmp366;
-    _cov(2, 5) =
-        _tmp108 * _tmp127 + _tmp125 * _tmp93 + _tmp126 * _tmp97 + _tmp367 + _tmp368 + _tmp369;
-    _cov(3, 5) = _tmp108 * _tmp139 + _tmp135 * _tmp93 + _tmp137 * _tmp97 + _tmp264 + _tmp370 +
-                 _tmp371 + _tmp372;
-    _cov(4, 5) = _tmp108 * _tmp145 + _tmp141 * _tmp93 + _tmp143 * _tmp97 + _tmp344 + _tmp373 +
-                 _tmp374 + _tmp375;
-    _cov(5, 5) = _tmp108 * _tmp151 + _tmp147 * _tmp93 + _tmp149 * _tmp97 + _tmp208 * _tmp379 +
-                 _tmp210 * _tmp381 + _tmp222 * _tmp378 + _tmp376 + _tmp377 + _tmp380;
-    _cov(6, 5) = _tmp108 * _tmp157 + _tmp153 * _tmp93 + _tmp155 * _tmp97 + _tmp321 + _tmp382 +
-                 _tmp383 + _tmp384;
-    _cov(7, 5) = _tmp108 * _tmp163 + _tmp159 * _tmp93 + _tmp161 * _tmp97 + _tmp360 + _tmp385 +
-                 _tmp386 + _tmp387;
-    _cov(8, 5) = _tmp108 * _tmp169 + _tmp165 * _tmp93 + _tmp167 * _tmp97 + _tmp388 + _tmp389 +
-                 _tmp390 + _tmp393;
-    _cov(0, 6) = _tmp102 * _tmp99 + _tmp111 * _tmp113 + _tmp16 * _tmp394 + _tmp174 * dt +
-                 _tmp178 * dt + _tmp182 * dt + _tmp395 * _tmp61 + _tmp396 * _tmp55 +
-                 _tmp85 * _tmp95;
-    _cov(1, 6) = _tmp111 * _tmp116 + _tmp114 * _tmp85 + _tmp115 * _tmp99 + _tmp16 * _tmp397 +
-                 _tmp186 * dt + _tmp190 * dt + _tmp194 * dt + _tmp398 * _tmp61 + _tmp399 * _tmp55;
-    _cov(2, 6) = _tmp111 * _tmp127 + _tmp125 * _tmp85 + _tmp126 * _tmp99 + _tmp16 * _tmp400 +
-                 _tmp198 * dt + _tmp202 * dt + _tmp206 * dt + _tmp401 * _tmp61 + _tmp402 * _tmp55;
-    _cov(3, 6) = _tmp111 * _tmp139 + _tmp135 * _tmp85 + _tmp137 * _tmp99 + _tmp16 * _tmp403 +
-                 _tmp215 * dt + _tmp220 * dt + _tmp227 * dt + _tmp284 + _tmp404 * _tmp61 +
-                 _tmp405 * _tmp55;
-    _cov(4, 6) = _tmp111 * _tmp145 + _tmp141 * _tmp85 + _tmp143 * _tmp99 + _tmp16 * _tmp406 +
-                 _tmp232 * dt + _tmp237 * dt + _tmp242 * dt + _tmp304 + _tmp407 * _tmp61 +
-                 _tmp408 * _tmp55;
-    _cov(5, 6) = _tmp111 * _tmp151 + _tmp147 * _tmp85 + _tmp149 * _tmp99 + _tmp16 * _tmp409 +
-                 _tmp251 * dt + _tmp256 * dt + _tmp261 * dt + _tmp321 + _tmp410 * _tmp61 +
-                 _tmp411 * _tmp55;
-    _cov(6, 6) = _tmp111 * _tmp157 + _tmp153 * _tmp85 + _tmp155 * _tmp99 + _tmp16 * _tmp412 +
-                 _tmp209 * _tmp415 + _tmp269 * dt + _tmp274 * dt + _tmp279 * dt +
-                 _tmp281 * _tmp414 + _tmp283 * _tmp414 + _tmp413 * _tmp61 + _tmp416 * _tmp55;
-    _cov(7, 6) = _tmp111 * _tmp163 + _tmp159 * _tmp85 + _tmp16 * _tmp417 + _tmp161 * _tmp99 +
-                 _tmp289 * dt + _tmp294 * dt + _tmp299 * dt + _tmp418 * _tmp61 + _tmp419 * _tmp55 +
-                 _tmp422;
-    _cov(8, 6) = _tmp111 * _tmp169 + _tmp16 * _tmp423 + _tmp165 * _tmp85 + _tmp167 * _tmp99 +
-                 _tmp309 * dt + _tmp314 * dt + _tmp319 * dt + _tmp424 * _tmp61 + _tmp425 * _tmp55 +
-                 _tmp426;
-    _cov(0, 7) = _tmp100 * _tmp102 + _tmp109 * _tmp113 + _tmp322 * dt + _tmp323 * dt +
-                 _tmp324 * dt + _tmp37 * _tmp394 + _tmp395 * _tmp62 + _tmp396 * _tmp57 +
-                 _tmp92 * _tmp95;
-    _cov(1, 7) = _tmp100 * _tmp115 + _tmp109 * _tmp116 + _tmp114 * _tmp92 + _tmp325 * dt +
-                 _tmp326 * dt + _tmp327 * dt + _tmp37 * _tmp397 + _tmp398 * _tmp62 +
-                 _tmp399 * _tmp57;
-    _cov(2, 7) = _tmp100 * _tmp126 + _tmp109 * _tmp127 + _tmp125 * _tmp92 + _tmp328 * dt +
-                 _tmp329 * dt + _tmp330 * dt + _tmp37 * _tmp400 + _tmp401 * _tmp62 +
-                 _tmp402 * _tmp57;
-    _cov(3, 7) = _tmp100 * _tmp137 + _tmp109 * _tmp139 + _tmp135 * _tmp92 + _tmp304 + _tmp331 * dt +
-                 _tmp332 * dt + _tmp333 * dt + _tmp37 * _tmp403 + _tmp404 * _tmp62 +
-                 _tmp405 * _tmp57;
-    _cov(4, 7) = _tmp100 * _tmp143 + _tmp109 * _tmp145 + _tmp141 * _tmp92 + _tmp335 * dt +
-                 _tmp336 * dt + _tmp338 * dt + _tmp353 + _tmp37 * _tmp406 + _tmp407 * _tmp62 +
-                 _tmp408 * _tmp57;
-    _cov(5, 7) = _tmp100 * _tmp149 + _tmp109 * _tmp151 + _tmp147 * _tmp92 + _tmp340 * dt +
-                 _tmp341 * dt + _tmp342 * dt + _tmp360 + _tmp37 * _tmp409 + _tmp410 * _tmp62 +
-                 _tmp411 * _tmp57;
-    _cov(6, 7) = _tmp100 * _tmp155 + _tmp109 * _tmp157 + _tmp153 * _tmp92 + _tmp345 * dt +
-                 _tmp346 * dt + _tmp347 * dt + _tmp37 * _tmp412 + _tmp413 * _tmp62 +
-                 _tmp416 * _tmp57 + _tmp422;
-    _cov(7, 7) = _tmp100 * _tmp161 + _tmp109 * _tmp163 + _tmp159 * _tmp92 + _tmp337 * _tmp415 +
-                 _tmp348 * dt + _tmp349 * dt + _tmp350 * dt + _tmp351 * _tmp414 +
-                 _tmp352 * _tmp414 + _tmp37 * _tmp417 + _tmp418 * _tmp62 + _tmp419 * _tmp57;
-    _cov(8, 7) = _tmp100 * _tmp167 + _tmp109 * _tmp169 + _tmp165 * _tmp92 + _tmp354 * dt +
-                 _tmp355 * dt + _tmp356 * dt + _tmp37 * _tmp423 + _tmp424 * _tmp62 +
-                 _tmp425 * _tmp57 + _tmp427;
-    _cov(0, 8) = _tmp102 * _tmp96 + _tmp107 * _tmp113 + _tmp361 * dt + _tmp362 * dt + _tmp363 * dt +
-                 _tmp394 * _tmp49 + _tmp395 * _tmp63 + _tmp396 * _tmp60 + _tmp94 * _tmp95;
-    _cov(1, 8) = _tmp107 * _tmp116 + _tmp114 * _tmp94 + _tmp115 * _tmp96 + _tmp364 * dt +
-                 _tmp365 * dt + _tmp366 * dt + _tmp397 * _tmp49 + _tmp398 * _tmp63 +
-                 _tmp399 * _tmp60;
-    _cov(2, 8) = _tmp107 * _tmp127 + _tmp125 * _tmp94 + _tmp126 * _tmp96 + _tmp367 * dt +
-                 _tmp368 * dt + _tmp369 * dt + _tmp400 * _tmp49 + _tmp401 * _tmp63 +
-                 _tmp402 * _tmp60;
-    _cov(3, 8) = _tmp107 * _tmp139 + _tmp135 * _tmp94 + _tmp137 * _tmp96 + _tmp321 + _tmp370 * dt +
-                 _tmp371 * dt + _tmp372 * dt + _tmp403 * _tmp49 + _tmp404 * _tmp63 +
-                 _tmp405 * _tmp60;
-    _cov(4, 8) = _tmp107 * _tmp145 + _tmp141 * _tmp94 + _tmp143 * _tmp96 + _tmp360 + _tmp373 * dt +
-                 _tmp374 * dt + _tmp375 * dt + _tmp406 * _tmp49 + _tmp407 * _tmp63 +
-                 _tmp408 * _tmp60;
-    _cov(5, 8) = _tmp107 * _tmp151 + _tmp147 * _tmp94 + _tmp149 * _tmp96 + _tmp376 * dt +
-                 _tmp377 * dt + _tmp380 * dt + _tmp393 + _tmp409 * _tmp49 + _tmp410 * _tmp63 +
-                 _tmp411 * _tmp60;
-    _cov(6, 8) = _tmp107 * _tmp157 + _tmp153 * _tmp94 + _tmp155 * _tmp96 + _tmp382 * dt +
-                 _tmp383 * dt + _tmp384 * dt + _tmp412 * _tmp49 + _tmp413 * _tmp63 +
-                 _tmp416 * _tmp60 + _tmp426;
-    _cov(7, 8) = _tmp107 * _tmp163 + _tmp159 * _tmp94 + _tmp161 * _tmp96 + _tmp385 * dt +
-                 _tmp386 * dt + _tmp387 * dt + _tmp417 * _tmp49 + _tmp418 * _tmp63 +
-                 _tmp419 * _tmp60 + _tmp427;
-    _cov(8, 8) = _tmp107 * _tmp169 + _tmp165 * _tmp94 + _tmp167 * _tmp96 + _tmp381 * _tmp415 +
-                 _tmp388 * dt + _tmp389 * dt + _tmp390 * dt + _tmp391 * _tmp414 +
-                 _tmp392 * _tmp414 + _tmp423 * _tmp49 + _tmp424 * _tmp63 + _tmp425 * _tmp60;
+    _cov(0, 0) = _tmp20 * (_tmp20 * preint_prev(10, 0) + _tmp43 * preint_prev(13, 0) +
+                           _tmp51 * preint_prev(11, 0)) +
+                 _tmp43 * (_tmp20 * preint_prev(13, 0) + _tmp43 * preint_prev(15, 0) +
+                           _tmp51 * preint_prev(14, 0)) +
+                 _tmp51 * (_tmp20 * preint_prev(11, 0) + _tmp43 * preint_prev(14, 0) +
+                           _tmp51 * preint_prev(12, 0)) +
+                 std::pow(_tmp77, Scalar(2)) * _tmp78 + std::pow(_tmp83, Scalar(2)) * _tmp84 +
+                 std::pow(_tmp87, Scalar(2)) * _tmp88;
+    _cov(1, 0) = _tmp100 * _tmp87 + _tmp20 * _tmp93 + _tmp43 * _tmp97 + _tmp51 * _tmp94 +
+                 _tmp91 * _tmp92 + _tmp95 * _tmp96;
+    _cov(2, 0) = _tmp25 * _tmp93 + _tmp42 * _tmp97 + _tmp50 * _tmp94 +
+                 _tmp78 * std::pow(_tmp95, Scalar(2)) + _tmp84 * std::pow(_tmp91, Scalar(2)) +
+                 _tmp88 * std::pow(_tmp99, Scalar(2));
+    _cov(3, 0) = _tmp101 * _tmp20 + _tmp102 * _tmp92 + _tmp103 * _tmp96 + _tmp104 * _tmp43 +
+                 _tmp105 * _tmp51 + _tmp106 * _tmp87 * _tmp88;
+    _cov(4, 0) = _tmp100 * _tmp106 + _tmp101 * _tmp25 + _tmp102 * _tmp84 * _tmp91 +
+                 _tmp103 * _tmp78 * _tmp95 + _tmp104 * _tmp42 + _tmp105 * _tmp50;
+    _cov(5, 0) = _tmp101 * _tmp30 + std::pow(_tmp102, Scalar(2)) * _tmp84 +
+                 std::pow(_tmp103, Scalar(2)) * _tmp78 + _tmp104 * _tmp39 + _tmp105 * _tmp52 +
+                 std::pow(_tmp106, Scalar(2)) * _tmp88;
+    _cov(6, 0) = _tmp112 * _tmp43 + _tmp117 * _tmp20 + _tmp121 * _tmp51;
+    _cov(7, 0) = _tmp112 * _tmp42 + _tmp117 * _tmp25 + _tmp121 * _tmp50;
+    _cov(8, 0) = _tmp112 * _tmp39 + _tmp117 * _tmp30 + _tmp121 * _tmp52;
+    _cov(9, 0) = _tmp125 * _tmp126 + _tmp127 * _tmp128 + _tmp129 * _tmp130 +
+                 _tmp20 * (_tmp124 * _tmp43 + _tmp131 * _tmp51 + _tmp132 * _tmp20) +
+                 _tmp43 * (_tmp122 * _tmp51 + _tmp123 * _tmp43 + _tmp124 * _tmp20) +
+                 _tmp51 * (_tmp122 * _tmp43 + _tmp131 * _tmp20 + _tmp133 * _tmp51);
+    _cov(10, 0) = _tmp134 * _tmp20 + _tmp135 * _tmp51 + _tmp136 * _tmp43;
+    _cov(11, 0) = _tmp134 * _tmp25 + _tmp135 * _tmp50 + _tmp136 * _tmp42;
+    _cov(12, 0) = _tmp134 * _tmp30 + _tmp135 * _tmp52 + _tmp136 * _tmp39;
+    _cov(13, 0) = _tmp126 * _tmp140 + _tmp137 * _tmp51 + _tmp138 * _tmp20 + _tmp139 * _tmp43 +
+                  _tmp141 * _tmp25 + _tmp142 * _tmp51;
+    _cov(14, 0) = _tmp126 * _tmp143 + _tmp128 * _tmp145 + _tmp130 * _tmp144 + _tmp138 * _tmp25 +
+                  _tmp139 * _tmp42 + _tmp142 * _tmp50;
+    _cov(15, 0) = _tmp146 * _tmp43 + _tmp147 * _tmp20 + _tmp148 * _tmp51;
+    _cov(16, 0) = _tmp146 * _tmp42 + _tmp147 * _tmp25 + _tmp148 * _tmp50;
+    _cov(17, 0) = _tmp146 * _tmp39 + _tmp147 * _tmp30 + _tmp148 * _tmp52;
+    _cov(18, 0) = _tmp128 * _tmp149 + _tmp141 * _tmp30 + _tmp150 * _tmp43 + _tmp151 * _tmp20 +
+                  _tmp152 * _tmp43 + _tmp153 * _tmp51;
+    _cov(19, 0) = _tmp130 * _tmp154 + _tmp137 * _tmp52 + _tmp150 * _tmp42 + _tmp151 * _tmp25 +
+                  _tmp152 * _tmp42 + _tmp153 * _tmp50;
+    _cov(20, 0) = _tmp126 * _tmp157 + _tmp128 * _tmp155 + _tmp130 * _tmp156 + _tmp151 * _tmp30 +
+                  _tmp152 * _tmp39 + _tmp153 * _tmp52;
+    _cov(21, 0) = _tmp166 * _tmp51 + _tmp174 * _tmp20 + _tmp180 * _tmp43;
+    _cov(22, 0) = _tmp166 * _tmp50 + _tmp174 * _tmp25 + _tmp180 * _tmp42;
+    _cov(23, 0) = _tmp166 * _tmp52 + _tmp174 * _tmp30 + _tmp180 * _tmp39;
+    _cov(24, 0) = _tmp125 * _tmp189 + _tmp127 * _tmp190 + _tmp187 * _tmp43 + _tmp188 * _tmp191 +
+                  _tmp199 * _tmp20 + _tmp205 * _tmp51;
+    _cov(25, 0) = _tmp187 * _tmp42 + _tmp199 * _tmp25 + _tmp205 * _tmp50 + _tmp209;
+    _cov(26, 0) = _tmp187 * _tmp39 + _tmp199 * _tmp30 + _tmp205 * _tmp52 + _tmp211;
+    _cov(27, 0) = _tmp125 * _tmp216 + _tmp127 * _tmp217 + _tmp191 * _tmp215 +
+                  _tmp20 * (_tmp20 * _tmp212 + _tmp213 * _tmp51 + _tmp214 * _tmp43) +
+                  _tmp43 * (_tmp20 * _tmp214 + _tmp218 * _tmp43 + _tmp219 * _tmp51) +
+                  _tmp51 * (_tmp20 * _tmp213 + _tmp219 * _tmp43 + _tmp220 * _tmp51);
+    _cov(28, 0) = _tmp20 * _tmp222 + _tmp221 * _tmp43 + _tmp223 * _tmp51;
+    _cov(29, 0) = _tmp221 * _tmp42 + _tmp222 * _tmp25 + _tmp223 * _tmp50;
+    _cov(30, 0) = _tmp221 * _tmp39 + _tmp222 * _tmp30 + _tmp223 * _tmp52;
+    _cov(31, 0) = _tmp20 * _tmp226 + _tmp209 + _tmp224 * _tmp51 + _tmp225 * _tmp43;
+    _cov(32, 0) = _tmp143 * _tmp189 + _tmp145 * _tmp190 + _tmp188 * _tmp227 + _tmp224 * _tmp50 +
+                  _tmp225 * _tmp42 + _tmp226 * _tmp25;
+    _cov(33, 0) = _tmp224 * _tmp52 + _tmp225 * _tmp39 + _tmp226 * _tmp30 + _tmp230;
+    _cov(34, 0) = _tmp140 * _tmp216 + _tmp20 * _tmp231 + _tmp206 * _tmp217 + _tmp232 * _tmp25 +
+                  _tmp233 * _tmp51 + _tmp234 * _tmp43;
+    _cov(35, 0) = _tmp143 * _tmp216 + _tmp145 * _tmp217 + _tmp215 * _tmp227 + _tmp231 * _tmp25 +
+                  _tmp233 * _tmp50 + _tmp234 * _tmp42;
+    _cov(36, 0) = _tmp20 * _tmp237 + _tmp235 * _tmp51 + _tmp236 * _tmp43;
+    _cov(37, 0) = _tmp235 * _tmp50 + _tmp236 * _tmp42 + _tmp237 * _tmp25;
+    _cov(38, 0) = _tmp235 * _tmp52 + _tmp236 * _tmp39 + _tmp237 * _tmp30;
+    _cov(39, 0) = _tmp20 * _tmp239 + _tmp211 + _tmp238 * _tmp43 + _tmp240 * _tmp51;
+    _cov(40, 0) = _tmp230 + _tmp238 * _tmp42 + _tmp239 * _tmp25 + _tmp240 * _tmp50;
+    _cov(41, 0) = _tmp155 * _tmp190 + _tmp157 * _tmp189 + _tmp188 * _tmp241 + _tmp238 * _tmp39 +
+                  _tmp239 * _tmp30 + _tmp240 * _tmp52;
+    _cov(42, 0) = _tmp149 * _tmp217 + _tmp20 * _tmp243 + _tmp232 * _tmp30 + _tmp242 * _tmp43 +
+                  _tmp244 * _tmp51 + _tmp245 * _tmp43;
+    _cov(43, 0) = _tmp215 * _tmp229 + _tmp217 * _tmp228 + _tmp242 * _tmp42 + _tmp243 * _tmp25 +
+                  _tmp244 * _tmp50 + _tmp245 * _tmp42;
+    _cov(44, 0) = _tmp155 * _tmp217 + _tmp157 * _tmp216 + _tmp215 * _tmp241 + _tmp242 * _tmp39 +
+                  _tmp243 * _tmp30 + _tmp244 * _tmp52;
   }
 }  // NOLINT(readability/fn_size)
 
@@ -0,0 +1,335 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     preint_prev: Matrix55_1
+ *     z_imu_delta: Matrix55_1
+ *     dt: Scalar
+ *
+ * Outputs:
+ *     upsilon: Matrix10_1
+ *     cov: Matrix45_1
+ */
+template <typename Scalar>
+void PreintegrateDelta(const Eigen::Matrix<Scalar, 55, 1>& preint_prev,
+                       const Eigen::Matrix<Scalar, 55, 1>& z_imu_delta, const Scalar dt,
+                       Eigen::Matrix<Scalar, 10, 1>* const upsilon = nullptr,
+                       Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 957
+
+  // Input arrays
+
+  // Intermediate terms (147)
+  const Scalar _tmp0 = 2 * preint_prev(2, 0);
+  const Scalar _tmp1 = _tmp0 * preint_prev(3, 0);
+  const Scalar _tmp2 = 2 * preint_prev(1, 0);
+  const Scalar _tmp3 = _tmp2 * preint_prev(0, 0);
+  const Scalar _tmp4 = -_tmp1 + _tmp3;
+  const Scalar _tmp5 = -2 * std::pow(preint_prev(1, 0), Scalar(2));
+  const Scalar _tmp6 = 1 - 2 * std::pow(preint_prev(2, 0), Scalar(2));
+  const Scalar _tmp7 = _tmp5 + _tmp6;
+  const Scalar _tmp8 = _tmp2 * preint_prev(3, 0);
+  const Scalar _tmp9 = _tmp0 * preint_prev(0, 0);
+  const Scalar _tmp10 = _tmp8 + _tmp9;
+  const Scalar _tmp11 = 2 * preint_prev(0, 0) * preint_prev(3, 0);
+  const Scalar _tmp12 = _tmp0 * preint_prev(1, 0);
+  const Scalar _tmp13 = -_tmp11 + _tmp12;
+  const Scalar _tmp14 = _tmp1 + _tmp3;
+  const Scalar _tmp15 = -2 * std::pow(preint_prev(0, 0), Scalar(2));
+  const Scalar _tmp16 = _tmp15 + _tmp6;
+  const Scalar _tmp17 = _tmp11 + _tmp12;
+  const Scalar _tmp18 = _tmp15 + _tmp5 + 1;
+  const Scalar _tmp19 = -_tmp8 + _tmp9;
+  const Scalar _tmp20 = -2 * std::pow(z_imu_delta(1, 0), Scalar(2));
+  const Scalar _tmp21 = -2 * std::pow(z_imu_delta(2, 0), Scalar(2));
+  const Scalar _tmp22 = _tmp20 + _tmp21 + 1;
+  const Scalar _tmp23 = 2 * z_imu_delta(3, 0);
+  const Scalar _tmp24 = _tmp23 * z_imu_delta(2, 0);
+  const Scalar _tmp25 = 2 * z_imu_delta(0, 0);
+  const Scalar _tmp26 = _tmp25 * z_imu_delta(1, 0);
+  const Scalar _tmp27 = _tmp24 + _tmp26;
+  const Scalar _tmp28 = _tmp23 * z_imu_delta(1, 0);
+  const Scalar _tmp29 = _tmp25 * z_imu_delta(2, 0);
+  const Scalar _tmp30 = -_tmp28 + _tmp29;
+  const Scalar _tmp31 = -_tmp24 + _tmp26;
+  const Scalar _tmp32 = 1 - 2 * std::pow(z_imu_delta(0, 0), Scalar(2));
+  const Scalar _tmp33 = _tmp21 + _tmp32;
+  const Scalar _tmp34 = _tmp23 * z_imu_delta(0, 0);
+  const Scalar _tmp35 = 2 * z_imu_delta(1, 0) * z_imu_delta(2, 0);
+  const Scalar _tmp36 = _tmp34 + _tmp35;
+  const Scalar _tmp37 =
+      _tmp31 * preint_prev(10, 0) + _tmp33 * preint_prev(11, 0) + _tmp36 * preint_prev(13, 0);
+  const Scalar _tmp38 =
+      _tmp31 * preint_prev(11, 0) + _tmp33 * preint_prev(12, 0) + _tmp36 * preint_prev(14, 0);
+  const Scalar _tmp39 =
+      _tmp31 * preint_prev(13, 0) + _tmp33 * preint_prev(14, 0) + _tmp36 * preint_prev(15, 0);
+  const Scalar _tmp40 = _tmp28 + _tmp29;
+  const Scalar _tmp41 = _tmp20 + _tmp32;
+  const Scalar _tmp42 = -_tmp34 + _tmp35;
+  const Scalar _tmp43 =
+      _tmp40 * preint_prev(11, 0) + _tmp41 * preint_prev(14, 0) + _tmp42 * preint_prev(12, 0);
+  const Scalar _tmp44 =
+      _tmp40 * preint_prev(10, 0) + _tmp41 * preint_prev(13, 0) + _tmp42 * preint_prev(11, 0);
+  const Scalar _tmp45 =
+      _tmp40 * preint_prev(13, 0) + _tmp41 * preint_prev(15, 0) + _tmp42 * preint_prev(14, 0);
+  const Scalar _tmp46 = preint_prev(14, 0) * z_imu_delta(6, 0) -
+                        preint_prev(15, 0) * z_imu_delta(5, 0) + preint_prev(18, 0);
+  const Scalar _tmp47 = -preint_prev(13, 0) * z_imu_delta(6, 0) +
+                        preint_prev(15, 0) * z_imu_delta(4, 0) + preint_prev(22, 0);
+  const Scalar _tmp48 = preint_prev(13, 0) * z_imu_delta(5, 0);
+  const Scalar _tmp49 = preint_prev(14, 0) * z_imu_delta(4, 0);
+  const Scalar _tmp50 = _tmp48 - _tmp49 + preint_prev(27, 0);
+  const Scalar _tmp51 = _tmp22 * _tmp46 + _tmp27 * _tmp47 + _tmp30 * _tmp50;
+  const Scalar _tmp52 = preint_prev(12, 0) * z_imu_delta(6, 0) -
+                        preint_prev(14, 0) * z_imu_delta(5, 0) + preint_prev(17, 0);
+  const Scalar _tmp53 = preint_prev(11, 0) * z_imu_delta(6, 0);
+  const Scalar _tmp54 = _tmp49 - _tmp53 + preint_prev(21, 0);
+  const Scalar _tmp55 = preint_prev(11, 0) * z_imu_delta(5, 0) -
+                        preint_prev(12, 0) * z_imu_delta(4, 0) + preint_prev(26, 0);
+  const Scalar _tmp56 = _tmp22 * _tmp52 + _tmp27 * _tmp54 + _tmp30 * _tmp55;
+  const Scalar _tmp57 = -preint_prev(10, 0) * z_imu_delta(6, 0) +
+                        preint_prev(13, 0) * z_imu_delta(4, 0) + preint_prev(20, 0);
+  const Scalar _tmp58 = -_tmp48 + _tmp53 + preint_prev(16, 0);
+  const Scalar _tmp59 = preint_prev(10, 0) * z_imu_delta(5, 0) -
+                        preint_prev(11, 0) * z_imu_delta(4, 0) + preint_prev(25, 0);
+  const Scalar _tmp60 = _tmp22 * _tmp58 + _tmp27 * _tmp57 + _tmp30 * _tmp59;
+  const Scalar _tmp61 = _tmp50 * z_imu_delta(4, 0) - _tmp59 * z_imu_delta(6, 0) +
+                        preint_prev(20, 0) * z_imu_delta(5, 0) -
+                        preint_prev(21, 0) * z_imu_delta(4, 0) + preint_prev(29, 0);
+  const Scalar _tmp62 = _tmp47 * z_imu_delta(4, 0) - _tmp57 * z_imu_delta(6, 0) -
+                        preint_prev(20, 0) * z_imu_delta(6, 0) +
+                        preint_prev(22, 0) * z_imu_delta(4, 0) + preint_prev(24, 0);
+  const Scalar _tmp63 = -_tmp47 * z_imu_delta(5, 0) + _tmp54 * z_imu_delta(6, 0) -
+                        preint_prev(16, 0) * z_imu_delta(6, 0) +
+                        preint_prev(18, 0) * z_imu_delta(4, 0) + preint_prev(23, 0);
+  const Scalar _tmp64 = -_tmp55 * z_imu_delta(4, 0) + _tmp59 * z_imu_delta(5, 0) +
+                        preint_prev(25, 0) * z_imu_delta(5, 0) -
+                        preint_prev(26, 0) * z_imu_delta(4, 0) + preint_prev(30, 0);
+  const Scalar _tmp65 = -_tmp50 * z_imu_delta(5, 0) + _tmp55 * z_imu_delta(6, 0) +
+                        preint_prev(16, 0) * z_imu_delta(5, 0) -
+                        preint_prev(17, 0) * z_imu_delta(4, 0) + preint_prev(28, 0);
+  const Scalar _tmp66 = -_tmp46 * z_imu_delta(5, 0) + _tmp52 * z_imu_delta(6, 0) +
+                        preint_prev(17, 0) * z_imu_delta(6, 0) -
+                        preint_prev(18, 0) * z_imu_delta(5, 0) + preint_prev(19, 0);
+  const Scalar _tmp67 = _tmp31 * _tmp46 + _tmp33 * _tmp47 + _tmp36 * _tmp50;
+  const Scalar _tmp68 = _tmp31 * _tmp52 + _tmp33 * _tmp54 + _tmp36 * _tmp55;
+  const Scalar _tmp69 = _tmp31 * _tmp58 + _tmp33 * _tmp57 + _tmp36 * _tmp59;
+  const Scalar _tmp70 = _tmp31 * _tmp63 + _tmp33 * _tmp62 + _tmp36 * _tmp61;
+  const Scalar _tmp71 = _tmp31 * _tmp65 + _tmp33 * _tmp61 + _tmp36 * _tmp64;
+  const Scalar _tmp72 = _tmp31 * _tmp66 + _tmp33 * _tmp63 + _tmp36 * _tmp65;
+  const Scalar _tmp73 = _tmp40 * _tmp46 + _tmp41 * _tmp50 + _tmp42 * _tmp47;
+  const Scalar _tmp74 = _tmp40 * _tmp58 + _tmp41 * _tmp59 + _tmp42 * _tmp57;
+  const Scalar _tmp75 = _tmp40 * _tmp52 + _tmp41 * _tmp55 + _tmp42 * _tmp54;
+  const Scalar _tmp76 = _tmp40 * _tmp63 + _tmp41 * _tmp61 + _tmp42 * _tmp62;
+  const Scalar _tmp77 = _tmp40 * _tmp65 + _tmp41 * _tmp64 + _tmp42 * _tmp61;
+  const Scalar _tmp78 = _tmp40 * _tmp66 + _tmp41 * _tmp65 + _tmp42 * _tmp63;
+  const Scalar _tmp79 = dt * preint_prev(26, 0) + preint_prev(47, 0);
+  const Scalar _tmp80 =
+      _tmp79 + preint_prev(11, 0) * z_imu_delta(8, 0) - preint_prev(12, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp81 = dt * preint_prev(17, 0) + preint_prev(32, 0);
+  const Scalar _tmp82 =
+      _tmp81 + preint_prev(12, 0) * z_imu_delta(9, 0) - preint_prev(14, 0) * z_imu_delta(8, 0);
+  const Scalar _tmp83 = preint_prev(11, 0) * z_imu_delta(9, 0);
+  const Scalar _tmp84 = preint_prev(14, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp85 = dt * preint_prev(21, 0) + preint_prev(39, 0);
+  const Scalar _tmp86 = -_tmp83 + _tmp84 + _tmp85;
+  const Scalar _tmp87 = _tmp22 * _tmp82 + _tmp27 * _tmp86 + _tmp30 * _tmp80;
+  const Scalar _tmp88 = dt * preint_prev(22, 0) + preint_prev(40, 0);
+  const Scalar _tmp89 =
+      _tmp88 - preint_prev(13, 0) * z_imu_delta(9, 0) + preint_prev(15, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp90 = preint_prev(13, 0) * z_imu_delta(8, 0);
+  const Scalar _tmp91 = -_tmp84 + _tmp90 + dt * preint_prev(27, 0) + preint_prev(48, 0);
+  const Scalar _tmp92 = dt * preint_prev(18, 0) + preint_prev(33, 0);
+  const Scalar _tmp93 =
+      _tmp92 + preint_prev(14, 0) * z_imu_delta(9, 0) - preint_prev(15, 0) * z_imu_delta(8, 0);
+  const Scalar _tmp94 = _tmp22 * _tmp93 + _tmp27 * _tmp89 + _tmp30 * _tmp91;
+  const Scalar _tmp95 = dt * preint_prev(25, 0) + preint_prev(46, 0);
+  const Scalar _tmp96 =
+      _tmp95 + preint_prev(10, 0) * z_imu_delta(8, 0) - preint_prev(11, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp97 = dt * preint_prev(20, 0) + preint_prev(38, 0);
+  const Scalar _tmp98 =
+      _tmp97 - preint_prev(10, 0) * z_imu_delta(9, 0) + preint_prev(13, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp99 = dt * preint_prev(16, 0) + preint_prev(31, 0);
+  const Scalar _tmp100 = _tmp83 - _tmp90 + _tmp99;
+  const Scalar _tmp101 = _tmp100 * _tmp22 + _tmp27 * _tmp98 + _tmp30 * _tmp96;
+  const Scalar _tmp102 = dt * preint_prev(29, 0);
+  const Scalar _tmp103 = _tmp102 - _tmp86 * z_imu_delta(4, 0) + _tmp98 * z_imu_delta(5, 0) -
+                         preint_prev(25, 0) * z_imu_delta(9, 0) +
+                         preint_prev(27, 0) * z_imu_delta(7, 0) + preint_prev(43, 0);
+  const Scalar _tmp104 = dt * preint_prev(28, 0);
+  const Scalar _tmp105 = _tmp100 * z_imu_delta(5, 0) + _tmp104 - _tmp82 * z_imu_delta(4, 0) +
+                         preint_prev(26, 0) * z_imu_delta(9, 0) -
+                         preint_prev(27, 0) * z_imu_delta(8, 0) + preint_prev(36, 0);
+  const Scalar _tmp106 = dt * preint_prev(30, 0) + preint_prev(51, 0);
+  const Scalar _tmp107 = _tmp106 - _tmp80 * z_imu_delta(4, 0) + _tmp96 * z_imu_delta(5, 0) +
+                         preint_prev(25, 0) * z_imu_delta(8, 0) -
+                         preint_prev(26, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp108 = _tmp103 * _tmp27 + _tmp105 * _tmp22 + _tmp107 * _tmp30;
+  const Scalar _tmp109 = _tmp104 + preint_prev(49, 0);
+  const Scalar _tmp110 = _tmp109 + _tmp80 * z_imu_delta(6, 0) - _tmp91 * z_imu_delta(5, 0) +
+                         preint_prev(16, 0) * z_imu_delta(8, 0) -
+                         preint_prev(17, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp111 = dt * preint_prev(23, 0);
+  const Scalar _tmp112 = _tmp111 + preint_prev(41, 0);
+  const Scalar _tmp113 = _tmp112 + _tmp86 * z_imu_delta(6, 0) - _tmp89 * z_imu_delta(5, 0) -
+                         preint_prev(16, 0) * z_imu_delta(9, 0) +
+                         preint_prev(18, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp114 = dt * preint_prev(19, 0) + preint_prev(34, 0);
+  const Scalar _tmp115 = _tmp114 + _tmp82 * z_imu_delta(6, 0) - _tmp93 * z_imu_delta(5, 0) +
+                         preint_prev(17, 0) * z_imu_delta(9, 0) -
+                         preint_prev(18, 0) * z_imu_delta(8, 0);
+  const Scalar _tmp116 = _tmp110 * _tmp30 + _tmp113 * _tmp27 + _tmp115 * _tmp22;
+  const Scalar _tmp117 = dt * preint_prev(24, 0) + preint_prev(42, 0);
+  const Scalar _tmp118 = _tmp117 + _tmp89 * z_imu_delta(4, 0) - _tmp98 * z_imu_delta(6, 0) -
+                         preint_prev(20, 0) * z_imu_delta(9, 0) +
+                         preint_prev(22, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp119 = _tmp102 + preint_prev(50, 0);
+  const Scalar _tmp120 = _tmp119 + _tmp91 * z_imu_delta(4, 0) - _tmp96 * z_imu_delta(6, 0) +
+                         preint_prev(20, 0) * z_imu_delta(8, 0) -
+                         preint_prev(21, 0) * z_imu_delta(7, 0);
+  const Scalar _tmp121 = -_tmp100 * z_imu_delta(6, 0) + _tmp111 + _tmp93 * z_imu_delta(4, 0) +
+                         preint_prev(21, 0) * z_imu_delta(9, 0) -
+                         preint_prev(22, 0) * z_imu_delta(8, 0) + preint_prev(35, 0);
+  const Scalar _tmp122 = _tmp118 * _tmp27 + _tmp120 * _tmp30 + _tmp121 * _tmp22;
+  const Scalar _tmp123 = _tmp109 * dt + _tmp80 * z_imu_delta(9, 0) - _tmp81 * z_imu_delta(7, 0) -
+                         _tmp91 * z_imu_delta(8, 0) + _tmp99 * z_imu_delta(8, 0) +
+                         dt * preint_prev(36, 0) + preint_prev(52, 0);
+  const Scalar _tmp124 = _tmp112 * dt + _tmp86 * z_imu_delta(9, 0) - _tmp89 * z_imu_delta(8, 0) +
+                         _tmp92 * z_imu_delta(7, 0) - _tmp99 * z_imu_delta(9, 0) +
+                         dt * preint_prev(35, 0) + preint_prev(44, 0);
+  const Scalar _tmp125 = _tmp114 * dt + _tmp81 * z_imu_delta(9, 0) + _tmp82 * z_imu_delta(9, 0) -
+                         _tmp92 * z_imu_delta(8, 0) - _tmp93 * z_imu_delta(8, 0) +
+                         dt * preint_prev(34, 0) + preint_prev(37, 0);
+  const Scalar _tmp126 = _tmp117 * dt + _tmp88 * z_imu_delta(7, 0) + _tmp89 * z_imu_delta(7, 0) -
+                         _tmp97 * z_imu_delta(9, 0) - _tmp98 * z_imu_delta(9, 0) +
+                         dt * preint_prev(42, 0) + preint_prev(45, 0);
+  const Scalar _tmp127 = _tmp119 * dt - _tmp85 * z_imu_delta(7, 0) + _tmp91 * z_imu_delta(7, 0) -
+                         _tmp96 * z_imu_delta(9, 0) + _tmp97 * z_imu_delta(8, 0) +
+                         dt * preint_prev(43, 0) + preint_prev(53, 0);
+  const Scalar _tmp128 = _tmp106 * dt - _tmp79 * z_imu_delta(7, 0) - _tmp80 * z_imu_delta(7, 0) +
+                         _tmp95 * z_imu_delta(8, 0) + _tmp96 * z_imu_delta(8, 0) +
+                         dt * preint_prev(51, 0) + preint_prev(54, 0);
+  const Scalar _tmp129 = _tmp31 * _tmp82 + _tmp33 * _tmp86 + _tmp36 * _tmp80;
+  const Scalar _tmp130 = _tmp31 * _tmp93 + _tmp33 * _tmp89 + _tmp36 * _tmp91;
+  const Scalar _tmp131 = _tmp100 * _tmp31 + _tmp33 * _tmp98 + _tmp36 * _tmp96;
+  const Scalar _tmp132 = _tmp103 * _tmp33 + _tmp105 * _tmp31 + _tmp107 * _tmp36;
+  const Scalar _tmp133 = _tmp118 * _tmp33 + _tmp120 * _tmp36 + _tmp121 * _tmp31;
+  const Scalar _tmp134 = _tmp110 * _tmp36 + _tmp113 * _tmp33 + _tmp115 * _tmp31;
+  const Scalar _tmp135 = _tmp124 * _tmp31 + _tmp126 * _tmp33 + _tmp127 * _tmp36;
+  const Scalar _tmp136 = _tmp123 * _tmp31 + _tmp127 * _tmp33 + _tmp128 * _tmp36;
+  const Scalar _tmp137 = _tmp123 * _tmp36 + _tmp124 * _tmp33 + _tmp125 * _tmp31;
+  const Scalar _tmp138 = _tmp40 * _tmp82 + _tmp41 * _tmp80 + _tmp42 * _tmp86;
+  const Scalar _tmp139 = _tmp40 * _tmp93 + _tmp41 * _tmp91 + _tmp42 * _tmp89;
+  const Scalar _tmp140 = _tmp100 * _tmp40 + _tmp41 * _tmp96 + _tmp42 * _tmp98;
+  const Scalar _tmp141 = _tmp103 * _tmp42 + _tmp105 * _tmp40 + _tmp107 * _tmp41;
+  const Scalar _tmp142 = _tmp118 * _tmp42 + _tmp120 * _tmp41 + _tmp121 * _tmp40;
+  const Scalar _tmp143 = _tmp110 * _tmp41 + _tmp113 * _tmp42 + _tmp115 * _tmp40;
+  const Scalar _tmp144 = _tmp123 * _tmp41 + _tmp124 * _tmp42 + _tmp125 * _tmp40;
+  const Scalar _tmp145 = _tmp123 * _tmp40 + _tmp127 * _tmp42 + _tmp128 * _tmp41;
+  const Scalar _tmp146 = _tmp124 * _tmp40 + _tmp126 * _tmp42 + _tmp127 * _tmp41;
+
+  // Output terms (2)
+  if (upsilon != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _upsilon = (*upsilon);
+
+    _upsilon(0, 0) = preint_prev(0, 0) * z_imu_delta(3, 0) + preint_prev(1, 0) * z_imu_delta(2, 0) -
+                     preint_prev(2, 0) * z_imu_delta(1, 0) + preint_prev(3, 0) * z_imu_delta(0, 0);
+    _upsilon(1, 0) = -preint_prev(0, 0) * z_imu_delta(2, 0) +
+                     preint_prev(1, 0) * z_imu_delta(3, 0) + preint_prev(2, 0) * z_imu_delta(0, 0) +
+                     preint_prev(3, 0) * z_imu_delta(1, 0);
+    _upsilon(2, 0) = preint_prev(0, 0) * z_imu_delta(1, 0) - preint_prev(1, 0) * z_imu_delta(0, 0) +
+                     preint_prev(2, 0) * z_imu_delta(3, 0) + preint_prev(3, 0) * z_imu_delta(2, 0);
+    _upsilon(3, 0) = -preint_prev(0, 0) * z_imu_delta(0, 0) -
+                     preint_prev(1, 0) * z_imu_delta(1, 0) - preint_prev(2, 0) * z_imu_delta(2, 0) +
+                     preint_prev(3, 0) * z_imu_delta(3, 0);
+    _upsilon(4, 0) = _tmp10 * z_imu_delta(6, 0) + _tmp4 * z_imu_delta(5, 0) +
+                     _tmp7 * z_imu_delta(4, 0) + preint_prev(4, 0);
+    _upsilon(5, 0) = _tmp13 * z_imu_delta(6, 0) + _tmp14 * z_imu_delta(4, 0) +
+                     _tmp16 * z_imu_delta(5, 0) + preint_prev(5, 0);
+    _upsilon(6, 0) = _tmp17 * z_imu_delta(5, 0) + _tmp18 * z_imu_delta(6, 0) +
+                     _tmp19 * z_imu_delta(4, 0) + preint_prev(6, 0);
+    _upsilon(7, 0) = _tmp10 * z_imu_delta(9, 0) + _tmp4 * z_imu_delta(8, 0) +
+                     _tmp7 * z_imu_delta(7, 0) + dt * preint_prev(4, 0) + preint_prev(7, 0);
+    _upsilon(8, 0) = _tmp13 * z_imu_delta(9, 0) + _tmp14 * z_imu_delta(7, 0) +
+                     _tmp16 * z_imu_delta(8, 0) + dt * preint_prev(5, 0) + preint_prev(8, 0);
+    _upsilon(9, 0) = _tmp17 * z_imu_delta(8, 0) + _tmp18 * z_imu_delta(9, 0) +
+                     _tmp19 * z_imu_delta(7, 0) + dt * preint_prev(6, 0) + preint_prev(9, 0);
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = _tmp22 * (_tmp22 * preint_prev(10, 0) + _tmp27 * preint_prev(11, 0) +
+                           _tmp30 * preint_prev(13, 0)) +
+                 _tmp27 * (_tmp22 * preint_prev(11, 0) + _tmp27 * preint_prev(12, 0) +
+                           _tmp30 * preint_prev(14, 0)) +
+                 _tmp30 * (_tmp22 * preint_prev(13, 0) + _tmp27 * preint_prev(14, 0) +
+                           _tmp30 * preint_prev(15, 0)) +
+                 z_imu_delta(10, 0);
+    _cov(1, 0) = _tmp22 * _tmp37 + _tmp27 * _tmp38 + _tmp30 * _tmp39 + z_imu_delta(11, 0);
+    _cov(2, 0) = _tmp31 * _tmp37 + _tmp33 * _tmp38 + _tmp36 * _tmp39 + z_imu_delta(12, 0);
+    _cov(3, 0) = _tmp22 * _tmp44 + _tmp27 * _tmp43 + _tmp30 * _tmp45 + z_imu_delta(13, 0);
+    _cov(4, 0) = _tmp31 * _tmp44 + _tmp33 * _tmp43 + _tmp36 * _tmp45 + z_imu_delta(14, 0);
+    _cov(5, 0) = _tmp40 * _tmp44 + _tmp41 * _tmp45 + _tmp42 * _tmp43 + z_imu_delta(15, 0);
+    _cov(6, 0) = _tmp22 * _tmp60 + _tmp27 * _tmp56 + _tmp30 * _tmp51 + z_imu_delta(16, 0);
+    _cov(7, 0) = _tmp31 * _tmp60 + _tmp33 * _tmp56 + _tmp36 * _tmp51 + z_imu_delta(17, 0);
+    _cov(8, 0) = _tmp40 * _tmp60 + _tmp41 * _tmp51 + _tmp42 * _tmp56 + z_imu_delta(18, 0);
+    _cov(9, 0) = _tmp22 * (_tmp22 * _tmp66 + _tmp27 * _tmp63 + _tmp30 * _tmp65) +
+                 _tmp27 * (_tmp22 * _tmp63 + _tmp27 * _tmp62 + _tmp30 * _tmp61) +
+                 _tmp30 * (_tmp22 * _tmp65 + _tmp27 * _tmp61 + _tmp30 * _tmp64) +
+                 z_imu_delta(19, 0);
+    _cov(10, 0) = _tmp22 * _tmp69 + _tmp27 * _tmp68 + _tmp30 * _tmp67 + z_imu_delta(20, 0);
+    _cov(11, 0) = _tmp31 * _tmp69 + _tmp33 * _tmp68 + _tmp36 * _tmp67 + z_imu_delta(21, 0);
+    _cov(12, 0) = _tmp40 * _tmp69 + _tmp41 * _tmp67 + _tmp42 * _tmp68 + z_imu_delta(22, 0);
+    _cov(13, 0) = _tmp22 * _tmp72 + _tmp27 * _tmp70 + _tmp30 * _tmp71 + z_imu_delta(23, 0);
+    _cov(14, 0) = _tmp31 * _tmp72 + _tmp33 * _tmp70 + _tmp36 * _tmp71 + z_imu_delta(24, 0);
+    _cov(15, 0) = _tmp22 * _tmp74 + _tmp27 * _tmp75 + _tmp30 * _tmp73 + z_imu_delta(25, 0);
+    _cov(16, 0) = _tmp31 * _tmp74 + _tmp33 * _tmp75 + _tmp36 * _tmp73 + z_imu_delta(26, 0);
+    _cov(17, 0) = _tmp40 * _tmp74 + _tmp41 * _tmp73 + _tmp42 * _tmp75 + z_imu_delta(27, 0);
+    _cov(18, 0) = _tmp22 * _tmp78 + _tmp27 * _tmp76 + _tmp30 * _tmp77 + z_imu_delta(28, 0);
+    _cov(19, 0) = _tmp31 * _tmp78 + _tmp33 * _tmp76 + _tmp36 * _tmp77 + z_imu_delta(29, 0);
+    _cov(20, 0) = _tmp40 * _tmp78 + _tmp41 * _tmp77 + _tmp42 * _tmp76 + z_imu_delta(30, 0);
+    _cov(21, 0) = _tmp101 * _tmp22 + _tmp27 * _tmp87 + _tmp30 * _tmp94 + z_imu_delta(31, 0);
+    _cov(22, 0) = _tmp101 * _tmp31 + _tmp33 * _tmp87 + _tmp36 * _tmp94 + z_imu_delta(32, 0);
+    _cov(23, 0) = _tmp101 * _tmp40 + _tmp41 * _tmp94 + _tmp42 * _tmp87 + z_imu_delta(33, 0);
+    _cov(24, 0) = _tmp108 * _tmp30 + _tmp116 * _tmp22 + _tmp122 * _tmp27 + z_imu_delta(34, 0);
+    _cov(25, 0) = _tmp108 * _tmp36 + _tmp116 * _tmp31 + _tmp122 * _tmp33 + z_imu_delta(35, 0);
+    _cov(26, 0) = _tmp108 * _tmp41 + _tmp116 * _tmp40 + _tmp122 * _tmp42 + z_imu_delta(36, 0);
+    _cov(27, 0) = _tmp22 * (_tmp123 * _tmp30 + _tmp124 * _tmp27 + _tmp125 * _tmp22) +
+                  _tmp27 * (_tmp124 * _tmp22 + _tmp126 * _tmp27 + _tmp127 * _tmp30) +
+                  _tmp30 * (_tmp123 * _tmp22 + _tmp127 * _tmp27 + _tmp128 * _tmp30) +
+                  z_imu_delta(37, 0);
+    _cov(28, 0) = _tmp129 * _tmp27 + _tmp130 * _tmp30 + _tmp131 * _tmp22 + z_imu_delta(38, 0);
+    _cov(29, 0) = _tmp129 * _tmp33 + _tmp130 * _tmp36 + _tmp131 * _tmp31 + z_imu_delta(39, 0);
+    _cov(30, 0) = _tmp129 * _tmp42 + _tmp130 * _tmp41 + _tmp131 * _tmp40 + z_imu_delta(40, 0);
+    _cov(31, 0) = _tmp132 * _tmp30 + _tmp133 * _tmp27 + _tmp134 * _tmp22 + z_imu_delta(41, 0);
+    _cov(32, 0) = _tmp132 * _tmp36 + _tmp133 * _tmp33 + _tmp134 * _tmp31 + z_imu_delta(42, 0);
+    _cov(33, 0) = _tmp132 * _tmp41 + _tmp133 * _tmp42 + _tmp134 * _tmp40 + z_imu_delta(43, 0);
+    _cov(34, 0) = _tmp135 * _tmp27 + _tmp136 * _tmp30 + _tmp137 * _tmp22 + z_imu_delta(44, 0);
+    _cov(35, 0) = _tmp135 * _tmp33 + _tmp136 * _tmp36 + _tmp137 * _tmp31 + z_imu_delta(45, 0);
+    _cov(36, 0) = _tmp138 * _tmp27 + _tmp139 * _tmp30 + _tmp140 * _tmp22 + z_imu_delta(46, 0);
+    _cov(37, 0) = _tmp138 * _tmp33 + _tmp139 * _tmp36 + _tmp140 * _tmp31 + z_imu_delta(47, 0);
+    _cov(38, 0) = _tmp138 * _tmp42 + _tmp139 * _tmp41 + _tmp140 * _tmp40 + z_imu_delta(48, 0);
+    _cov(39, 0) = _tmp141 * _tmp30 + _tmp142 * _tmp27 + _tmp143 * _tmp22 + z_imu_delta(49, 0);
+    _cov(40, 0) = _tmp141 * _tmp36 + _tmp142 * _tmp33 + _tmp143 * _tmp31 + z_imu_delta(50, 0);
+    _cov(41, 0) = _tmp141 * _tmp41 + _tmp142 * _tmp42 + _tmp143 * _tmp40 + z_imu_delta(51, 0);
+    _cov(42, 0) = _tmp144 * _tmp22 + _tmp145 * _tmp30 + _tmp146 * _tmp27 + z_imu_delta(52, 0);
+    _cov(43, 0) = _tmp144 * _tmp31 + _tmp145 * _tmp36 + _tmp146 * _tmp33 + z_imu_delta(53, 0);
+    _cov(44, 0) = _tmp144 * _tmp40 + _tmp145 * _tmp41 + _tmp146 * _tmp42 + z_imu_delta(54, 0);
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
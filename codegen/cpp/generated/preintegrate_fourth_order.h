@@ -0,0 +1,989 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     imu_noise: Matrix61
+ *     preint_prev: Matrix55_1
+ *     z_imu_est: Matrix61
+ *     dt: Scalar
+ *
+ * Outputs:
+ *     upsilon: Matrix10_1
+ *     cov: Matrix45_1
+ */
+template <typename Scalar>
+void PreintegrateFourthOrder(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+                             const Eigen::Matrix<Scalar, 55, 1>& preint_prev,
+                             const Eigen::Matrix<Scalar, 6, 1>& z_imu_est, const Scalar dt,
+                             Eigen::Matrix<Scalar, 10, 1>* const upsilon = nullptr,
+                             Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 2778
+
+  // Input arrays
+
+  // Intermediate terms (555)
+  const Scalar _tmp0 = std::pow(dt, Scalar(2));
+  const Scalar _tmp1 = _tmp0 * std::pow(z_imu_est(1, 0), Scalar(2));
+  const Scalar _tmp2 = _tmp0 * std::pow(z_imu_est(0, 0), Scalar(2));
+  const Scalar _tmp3 = _tmp0 * std::pow(z_imu_est(2, 0), Scalar(2));
+  const Scalar _tmp4 = _tmp1 + _tmp2 + _tmp3 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp5 = std::sqrt(_tmp4);
+  const Scalar _tmp6 = (Scalar(1) / Scalar(2)) * _tmp5;
+  const Scalar _tmp7 = std::sin(_tmp6);
+  const Scalar _tmp8 = _tmp7 * dt / _tmp5;
+  const Scalar _tmp9 = _tmp8 * preint_prev(2, 0);
+  const Scalar _tmp10 = _tmp8 * z_imu_est(2, 0);
+  const Scalar _tmp11 = _tmp8 * preint_prev(3, 0);
+  const Scalar _tmp12 = std::cos(_tmp6);
+  const Scalar _tmp13 = _tmp8 * preint_prev(1, 0);
+  const Scalar _tmp14 = _tmp8 * preint_prev(0, 0);
+  const Scalar _tmp15 = -2 * std::pow(preint_prev(1, 0), Scalar(2));
+  const Scalar _tmp16 = 1 - 2 * std::pow(preint_prev(2, 0), Scalar(2));
+  const Scalar _tmp17 = _tmp15 + _tmp16;
+  const Scalar _tmp18 = 2 * std::pow(_tmp7, Scalar(2)) / _tmp4;
+  const Scalar _tmp19 = -_tmp1 * _tmp18;
+  const Scalar _tmp20 = -_tmp18 * _tmp3 + 1;
+  const Scalar _tmp21 = _tmp19 + _tmp20;
+  const Scalar _tmp22 = 2 * _tmp12;
+  const Scalar _tmp23 = _tmp10 * _tmp22;
+  const Scalar _tmp24 = _tmp0 * z_imu_est(0, 0);
+  const Scalar _tmp25 = _tmp24 * z_imu_est(1, 0);
+  const Scalar _tmp26 = _tmp18 * _tmp25;
+  const Scalar _tmp27 = -_tmp23 + _tmp26;
+  const Scalar _tmp28 = _tmp22 * _tmp8;
+  const Scalar _tmp29 = _tmp28 * z_imu_est(1, 0);
+  const Scalar _tmp30 = _tmp18 * z_imu_est(2, 0);
+  const Scalar _tmp31 = _tmp24 * _tmp30;
+  const Scalar _tmp32 = _tmp29 + _tmp31;
+  const Scalar _tmp33 = _tmp21 * z_imu_est(3, 0) + _tmp27 * z_imu_est(4, 0) +
+                        _tmp32 * z_imu_est(5, 0) - z_imu_est(3, 0);
+  const Scalar _tmp34 = (Scalar(1) / Scalar(2)) * _tmp0;
+  const Scalar _tmp35 = _tmp33 * _tmp34 + dt * z_imu_est(3, 0);
+  const Scalar _tmp36 = 2 * preint_prev(1, 0) * preint_prev(3, 0);
+  const Scalar _tmp37 = 2 * preint_prev(2, 0);
+  const Scalar _tmp38 = _tmp37 * preint_prev(0, 0);
+  const Scalar _tmp39 = _tmp36 + _tmp38;
+  const Scalar _tmp40 = -_tmp18 * _tmp2;
+  const Scalar _tmp41 = _tmp19 + _tmp40 + 1;
+  const Scalar _tmp42 = _tmp28 * z_imu_est(0, 0);
+  const Scalar _tmp43 = _tmp0 * z_imu_est(1, 0);
+  const Scalar _tmp44 = _tmp30 * _tmp43;
+  const Scalar _tmp45 = _tmp42 + _tmp44;
+  const Scalar _tmp46 = -_tmp29 + _tmp31;
+  const Scalar _tmp47 = _tmp41 * z_imu_est(5, 0) + _tmp45 * z_imu_est(4, 0) +
+                        _tmp46 * z_imu_est(3, 0) - z_imu_est(5, 0);
+  const Scalar _tmp48 = _tmp34 * _tmp47 + dt * z_imu_est(5, 0);
+  const Scalar _tmp49 = _tmp37 * preint_prev(3, 0);
+  const Scalar _tmp50 = 2 * preint_prev(0, 0);
+  const Scalar _tmp51 = _tmp50 * preint_prev(1, 0);
+  const Scalar _tmp52 = -_tmp49 + _tmp51;
+  const Scalar _tmp53 = _tmp20 + _tmp40;
+  const Scalar _tmp54 = _tmp23 + _tmp26;
+  const Scalar _tmp55 = -_tmp42 + _tmp44;
+  const Scalar _tmp56 = _tmp53 * z_imu_est(4, 0) + _tmp54 * z_imu_est(3, 0) +
+                        _tmp55 * z_imu_est(5, 0) - z_imu_est(4, 0);
+  const Scalar _tmp57 = _tmp34 * _tmp56 + dt * z_imu_est(4, 0);
+  const Scalar _tmp58 = _tmp49 + _tmp51;
+  const Scalar _tmp59 = _tmp50 * preint_prev(3, 0);
+  const Scalar _tmp60 = _tmp37 * preint_prev(1, 0);
+  const Scalar _tmp61 = -_tmp59 + _tmp60;
+  const Scalar _tmp62 = -2 * std::pow(preint_prev(0, 0), Scalar(2));
+  const Scalar _tmp63 = _tmp16 + _tmp62;
+  const Scalar _tmp64 = -_tmp36 + _tmp38;
+  const Scalar _tmp65 = _tmp15 + _tmp62 + 1;
+  const Scalar _tmp66 = _tmp59 + _tmp60;
+  const Scalar _tmp67 = [&]() {
+    const Scalar base = dt;
+    return base * base * base;
+  }();
+  const Scalar _tmp68 = (Scalar(1) / Scalar(6)) * _tmp67;
+  const Scalar _tmp69 = _tmp33 * _tmp68 + _tmp34 * z_imu_est(3, 0);
+  const Scalar _tmp70 = _tmp34 * z_imu_est(5, 0) + _tmp47 * _tmp68;
+  const Scalar _tmp71 = _tmp34 * z_imu_est(4, 0) + _tmp56 * _tmp68;
+  const Scalar _tmp72 = Scalar(0.050000000000000003) - _tmp5;
+  const Scalar _tmp73 = std::max<Scalar>(0, (((_tmp72) > 0) - ((_tmp72) < 0)));
+  const Scalar _tmp74 = _tmp5 + _tmp72 * _tmp73;
+  const Scalar _tmp75 = (Scalar(1) / Scalar(2)) * _tmp74;
+  const Scalar _tmp76 =
+      (-_tmp75 * std::cos(_tmp75) / std::sin(_tmp75) + 1) / std::pow(_tmp74, Scalar(2));
+  const Scalar _tmp77 =
+      _tmp73 * (Scalar(3.3068783068783071e-5) * std::pow(_tmp4, Scalar(2)) +
+                Scalar(0.0013888888888888889) * _tmp4 - _tmp76 + Scalar(0.083333333333333329)) +
+      _tmp76;
+  const Scalar _tmp78 = _tmp77 * z_imu_est(2, 0);
+  const Scalar _tmp79 = _tmp43 * _tmp78;
+  const Scalar _tmp80 = (Scalar(1) / Scalar(2)) * dt;
+  const Scalar _tmp81 = _tmp80 * z_imu_est(0, 0);
+  const Scalar _tmp82 = _tmp79 + _tmp81;
+  const Scalar _tmp83 = _tmp24 * _tmp78;
+  const Scalar _tmp84 = _tmp80 * z_imu_est(1, 0);
+  const Scalar _tmp85 = _tmp83 - _tmp84;
+  const Scalar _tmp86 = _tmp67 * imu_noise(2, 0);
+  const Scalar _tmp87 = _tmp85 * _tmp86;
+  const Scalar _tmp88 = -_tmp1 * _tmp77;
+  const Scalar _tmp89 = -_tmp3 * _tmp77 + 1;
+  const Scalar _tmp90 = _tmp88 + _tmp89;
+  const Scalar _tmp91 = _tmp25 * _tmp77;
+  const Scalar _tmp92 = _tmp80 * z_imu_est(2, 0);
+  const Scalar _tmp93 = _tmp91 - _tmp92;
+  const Scalar _tmp94 = _tmp67 * imu_noise(0, 0);
+  const Scalar _tmp95 = _tmp93 * _tmp94;
+  const Scalar _tmp96 = -_tmp2 * _tmp77;
+  const Scalar _tmp97 = _tmp89 + _tmp96;
+  const Scalar _tmp98 = _tmp91 + _tmp92;
+  const Scalar _tmp99 = _tmp67 * imu_noise(1, 0);
+  const Scalar _tmp100 = _tmp82 * _tmp87 + _tmp90 * _tmp95 + _tmp97 * _tmp98 * _tmp99;
+  const Scalar _tmp101 =
+      _tmp27 * preint_prev(10, 0) + _tmp45 * preint_prev(13, 0) + _tmp53 * preint_prev(11, 0);
+  const Scalar _tmp102 =
+      _tmp27 * preint_prev(11, 0) + _tmp45 * preint_prev(14, 0) + _tmp53 * preint_prev(12, 0);
+  const Scalar _tmp103 =
+      _tmp27 * preint_prev(13, 0) + _tmp45 * preint_prev(15, 0) + _tmp53 * preint_prev(14, 0);
+  const Scalar _tmp104 = _tmp101 * _tmp21 + _tmp102 * _tmp54 + _tmp103 * _tmp46;
+  const Scalar _tmp105 = 4 * _tmp100 * _tmp104;
+  const Scalar _tmp106 = _tmp88 + _tmp96 + 1;
+  const Scalar _tmp107 = _tmp83 + _tmp84;
+  const Scalar _tmp108 = _tmp79 - _tmp81;
+  const Scalar _tmp109 = _tmp108 * _tmp99;
+  const Scalar _tmp110 = _tmp106 * _tmp87 + _tmp107 * _tmp90 * _tmp94 + _tmp109 * _tmp98;
+  const Scalar _tmp111 =
+      _tmp32 * preint_prev(10, 0) + _tmp41 * preint_prev(13, 0) + _tmp55 * preint_prev(11, 0);
+  const Scalar _tmp112 =
+      _tmp32 * preint_prev(13, 0) + _tmp41 * preint_prev(15, 0) + _tmp55 * preint_prev(14, 0);
+  const Scalar _tmp113 =
+      _tmp32 * preint_prev(11, 0) + _tmp41 * preint_prev(14, 0) + _tmp55 * preint_prev(12, 0);
+  const Scalar _tmp114 = _tmp111 * _tmp21 + _tmp112 * _tmp46 + _tmp113 * _tmp54;
+  const Scalar _tmp115 = 4 * _tmp110 * _tmp114;
+  const Scalar _tmp116 = _tmp21 * (_tmp21 * preint_prev(10, 0) + _tmp46 * preint_prev(13, 0) +
+                                   _tmp54 * preint_prev(11, 0)) +
+                         _tmp46 * (_tmp21 * preint_prev(13, 0) + _tmp46 * preint_prev(15, 0) +
+                                   _tmp54 * preint_prev(14, 0)) +
+                         _tmp54 * (_tmp21 * preint_prev(11, 0) + _tmp46 * preint_prev(14, 0) +
+                                   _tmp54 * preint_prev(12, 0));
+  const Scalar _tmp117 = std::pow(_tmp85, Scalar(2)) * _tmp86 +
+                         std::pow(_tmp90, Scalar(2)) * _tmp94 +
+                         std::pow(_tmp98, Scalar(2)) * _tmp99;
+  const Scalar _tmp118 = std::pow(_tmp82, Scalar(2)) * _tmp86 +
+                         std::pow(_tmp93, Scalar(2)) * _tmp94 +
+                         std::pow(_tmp97, Scalar(2)) * _tmp99;
+  const Scalar _tmp119 = std::pow(_tmp106, Scalar(2)) * _tmp86 +
+                         std::pow(_tmp107, Scalar(2)) * _tmp94 +
+                         std::pow(_tmp108, Scalar(2)) * _tmp99;
+  const Scalar _tmp120 = -_tmp117 - _tmp118 - _tmp119;
+  const Scalar _tmp121 = _tmp117 + _tmp120;
+  const Scalar _tmp122 = 2 * _tmp121;
+  const Scalar _tmp123 = _tmp101 * _tmp27 + _tmp102 * _tmp53 + _tmp103 * _tmp45;
+  const Scalar _tmp124 = _tmp111 * _tmp32 + _tmp112 * _tmp41 + _tmp113 * _tmp55;
+  const Scalar _tmp125 = -_tmp116 - _tmp123 - _tmp124;
+  const Scalar _tmp126 = _tmp116 + _tmp125;
+  const Scalar _tmp127 = 2 * _tmp126;
+  const Scalar _tmp128 = 2 * _tmp114;
+  const Scalar _tmp129 = _tmp110 * _tmp128;
+  const Scalar _tmp130 = _tmp118 * _tmp123;
+  const Scalar _tmp131 = 2 * _tmp104;
+  const Scalar _tmp132 = _tmp100 * _tmp131;
+  const Scalar _tmp133 = _tmp116 * _tmp117 + _tmp132;
+  const Scalar _tmp134 = _tmp106 * _tmp82 * _tmp86 + _tmp107 * _tmp95 + _tmp109 * _tmp97;
+  const Scalar _tmp135 = _tmp111 * _tmp27 + _tmp112 * _tmp45 + _tmp113 * _tmp53;
+  const Scalar _tmp136 = _tmp134 * _tmp135;
+  const Scalar _tmp137 = 2 * _tmp136;
+  const Scalar _tmp138 = _tmp119 * _tmp124 + _tmp137;
+  const Scalar _tmp139 = -_tmp129 - _tmp130 - _tmp133 - _tmp138;
+  const Scalar _tmp140 = _tmp129 + _tmp139;
+  const Scalar _tmp141 = _tmp110 * _tmp135;
+  const Scalar _tmp142 = _tmp114 * _tmp134;
+  const Scalar _tmp143 = _tmp123 + _tmp125;
+  const Scalar _tmp144 =
+      _tmp100 * _tmp116 + _tmp100 * _tmp143 + _tmp104 * _tmp118 + _tmp104 * _tmp121;
+  const Scalar _tmp145 = _tmp118 + _tmp120;
+  const Scalar _tmp146 = 2 * _tmp143;
+  const Scalar _tmp147 = 2 * _tmp145;
+  const Scalar _tmp148 = 4 * _tmp136;
+  const Scalar _tmp149 = _tmp104 * _tmp134;
+  const Scalar _tmp150 = _tmp100 * _tmp135;
+  const Scalar _tmp151 = _tmp124 + _tmp125;
+  const Scalar _tmp152 =
+      _tmp110 * _tmp116 + _tmp110 * _tmp151 + _tmp114 * _tmp119 + _tmp114 * _tmp121;
+  const Scalar _tmp153 = _tmp119 + _tmp120;
+  const Scalar _tmp154 = _tmp100 * _tmp114;
+  const Scalar _tmp155 = _tmp104 * _tmp110;
+  const Scalar _tmp156 =
+      _tmp119 * _tmp135 + _tmp123 * _tmp134 + _tmp134 * _tmp151 + _tmp135 * _tmp145;
+  const Scalar _tmp157 = 2 * _tmp153;
+  const Scalar _tmp158 = 2 * _tmp151;
+  const Scalar _tmp159 =
+      _tmp35 * preint_prev(13, 0) - _tmp48 * preint_prev(10, 0) + preint_prev(20, 0);
+  const Scalar _tmp160 = _tmp48 * preint_prev(11, 0);
+  const Scalar _tmp161 = _tmp57 * preint_prev(13, 0);
+  const Scalar _tmp162 = _tmp160 - _tmp161 + preint_prev(16, 0);
+  const Scalar _tmp163 =
+      -_tmp35 * preint_prev(11, 0) + _tmp57 * preint_prev(10, 0) + preint_prev(25, 0);
+  const Scalar _tmp164 = _tmp159 * _tmp54 + _tmp162 * _tmp21 + _tmp163 * _tmp46;
+  const Scalar _tmp165 =
+      -_tmp35 * preint_prev(12, 0) + _tmp57 * preint_prev(11, 0) + preint_prev(26, 0);
+  const Scalar _tmp166 =
+      _tmp48 * preint_prev(12, 0) - _tmp57 * preint_prev(14, 0) + preint_prev(17, 0);
+  const Scalar _tmp167 = _tmp35 * preint_prev(14, 0);
+  const Scalar _tmp168 = -_tmp160 + _tmp167 + preint_prev(21, 0);
+  const Scalar _tmp169 = _tmp165 * _tmp46 + _tmp166 * _tmp21 + _tmp168 * _tmp54;
+  const Scalar _tmp170 =
+      _tmp35 * preint_prev(15, 0) - _tmp48 * preint_prev(13, 0) + preint_prev(22, 0);
+  const Scalar _tmp171 =
+      _tmp48 * preint_prev(14, 0) - _tmp57 * preint_prev(15, 0) + preint_prev(18, 0);
+  const Scalar _tmp172 = _tmp161 - _tmp167 + preint_prev(27, 0);
+  const Scalar _tmp173 = _tmp170 * _tmp54 + _tmp171 * _tmp21 + _tmp172 * _tmp46;
+  const Scalar _tmp174 = _tmp164 * _tmp32 + _tmp169 * _tmp55 + _tmp173 * _tmp41;
+  const Scalar _tmp175 = _tmp170 * _tmp55 + _tmp171 * _tmp32 + _tmp172 * _tmp41;
+  const Scalar _tmp176 = _tmp159 * _tmp55 + _tmp162 * _tmp32 + _tmp163 * _tmp41;
+  const Scalar _tmp177 = _tmp165 * _tmp41 + _tmp166 * _tmp32 + _tmp168 * _tmp55;
+  const Scalar _tmp178 = _tmp175 * _tmp46 + _tmp176 * _tmp21 + _tmp177 * _tmp54;
+  const Scalar _tmp179 = _tmp174 + _tmp178;
+  const Scalar _tmp180 = _tmp110 * _tmp179;
+  const Scalar _tmp181 = _tmp159 * _tmp53 + _tmp162 * _tmp27 + _tmp163 * _tmp45;
+  const Scalar _tmp182 = _tmp181 * _tmp27;
+  const Scalar _tmp183 = _tmp165 * _tmp45 + _tmp166 * _tmp27 + _tmp168 * _tmp53;
+  const Scalar _tmp184 = _tmp183 * _tmp53;
+  const Scalar _tmp185 = _tmp170 * _tmp53 + _tmp171 * _tmp27 + _tmp172 * _tmp45;
+  const Scalar _tmp186 = _tmp185 * _tmp45;
+  const Scalar _tmp187 = 2 * _tmp182 + 2 * _tmp184 + 2 * _tmp186;
+  const Scalar _tmp188 = _tmp175 * _tmp41;
+  const Scalar _tmp189 = _tmp177 * _tmp55;
+  const Scalar _tmp190 = _tmp176 * _tmp32;
+  const Scalar _tmp191 = 2 * _tmp188 + 2 * _tmp189 + 2 * _tmp190;
+  const Scalar _tmp192 = _tmp173 * _tmp46;
+  const Scalar _tmp193 = _tmp164 * _tmp21;
+  const Scalar _tmp194 = _tmp169 * _tmp54;
+  const Scalar _tmp195 = 2 * _tmp192 + 2 * _tmp193 + 2 * _tmp194;
+  const Scalar _tmp196 = -_tmp187 - _tmp191 - _tmp195;
+  const Scalar _tmp197 = _tmp195 + _tmp196;
+  const Scalar _tmp198 = _tmp192 + _tmp193 + _tmp194;
+  const Scalar _tmp199 = _tmp110 * _tmp174 + _tmp110 * _tmp178;
+  const Scalar _tmp200 = _tmp181 * _tmp21 + _tmp183 * _tmp54 + _tmp185 * _tmp46;
+  const Scalar _tmp201 = _tmp164 * _tmp27 + _tmp169 * _tmp53 + _tmp173 * _tmp45;
+  const Scalar _tmp202 = _tmp200 + _tmp201;
+  const Scalar _tmp203 = _tmp100 * _tmp200 + _tmp100 * _tmp201;
+  const Scalar _tmp204 = _tmp100 * _tmp202 + _tmp203;
+  const Scalar _tmp205 = _tmp182 + _tmp184 + _tmp186;
+  const Scalar _tmp206 = _tmp188 + _tmp189 + _tmp190;
+  const Scalar _tmp207 = -_tmp198 - _tmp205 - _tmp206;
+  const Scalar _tmp208 = _tmp198 + _tmp207;
+  const Scalar _tmp209 = _tmp119 * _tmp206;
+  const Scalar _tmp210 = _tmp117 * _tmp198 + _tmp199;
+  const Scalar _tmp211 = _tmp181 * _tmp32 + _tmp183 * _tmp55 + _tmp185 * _tmp41;
+  const Scalar _tmp212 = _tmp175 * _tmp45 + _tmp176 * _tmp27 + _tmp177 * _tmp53;
+  const Scalar _tmp213 = _tmp134 * _tmp211 + _tmp134 * _tmp212;
+  const Scalar _tmp214 = _tmp118 * _tmp205 + _tmp213;
+  const Scalar _tmp215 = -_tmp203 - _tmp209 - _tmp210 - _tmp214;
+  const Scalar _tmp216 = _tmp203 + _tmp215;
+  const Scalar _tmp217 = _tmp100 * _tmp205;
+  const Scalar _tmp218 = _tmp100 * _tmp198;
+  const Scalar _tmp219 = _tmp110 * _tmp212 + _tmp121 * _tmp201 + _tmp134 * _tmp174 + _tmp218;
+  const Scalar _tmp220 = _tmp110 * _tmp211 + _tmp134 * _tmp178 + _tmp145 * _tmp200 + _tmp217;
+  const Scalar _tmp221 = _tmp110 * _tmp206;
+  const Scalar _tmp222 = _tmp100 * _tmp212 + _tmp134 * _tmp200 + _tmp153 * _tmp178 + _tmp221;
+  const Scalar _tmp223 = _tmp110 * _tmp198;
+  const Scalar _tmp224 = _tmp100 * _tmp211 + _tmp121 * _tmp174 + _tmp134 * _tmp201 + _tmp223;
+  const Scalar _tmp225 = std::pow(_tmp46, Scalar(2));
+  const Scalar _tmp226 = _tmp67 * imu_noise(5, 0);
+  const Scalar _tmp227 = std::pow(_tmp54, Scalar(2));
+  const Scalar _tmp228 = _tmp67 * imu_noise(4, 0);
+  const Scalar _tmp229 = std::pow(_tmp21, Scalar(2));
+  const Scalar _tmp230 = _tmp67 * imu_noise(3, 0);
+  const Scalar _tmp231 = _tmp225 * _tmp226 + _tmp227 * _tmp228 + _tmp229 * _tmp230;
+  const Scalar _tmp232 = _tmp116 * _tmp231;
+  const Scalar _tmp233 = -_tmp163 * _tmp48 + _tmp172 * _tmp35 - _tmp35 * preint_prev(21, 0) +
+                         _tmp57 * preint_prev(20, 0) + preint_prev(29, 0);
+  const Scalar _tmp234 = _tmp163 * _tmp57 - _tmp165 * _tmp35 - _tmp35 * preint_prev(26, 0) +
+                         _tmp57 * preint_prev(25, 0) + preint_prev(30, 0);
+  const Scalar _tmp235 = _tmp165 * _tmp48 - _tmp172 * _tmp57 - _tmp35 * preint_prev(17, 0) +
+                         _tmp57 * preint_prev(16, 0) + preint_prev(28, 0);
+  const Scalar _tmp236 = _tmp168 * _tmp48 - _tmp170 * _tmp57 + _tmp35 * preint_prev(18, 0) -
+                         _tmp48 * preint_prev(16, 0) + preint_prev(23, 0);
+  const Scalar _tmp237 = _tmp166 * _tmp48 - _tmp171 * _tmp57 + _tmp48 * preint_prev(17, 0) -
+                         _tmp57 * preint_prev(18, 0) + preint_prev(19, 0);
+  const Scalar _tmp238 = -_tmp159 * _tmp48 + _tmp170 * _tmp35 + _tmp35 * preint_prev(22, 0) -
+                         _tmp48 * preint_prev(20, 0) + preint_prev(24, 0);
+  const Scalar _tmp239 = _tmp21 * (_tmp21 * _tmp237 + _tmp235 * _tmp46 + _tmp236 * _tmp54) +
+                         _tmp46 * (_tmp21 * _tmp235 + _tmp233 * _tmp54 + _tmp234 * _tmp46) +
+                         _tmp54 * (_tmp21 * _tmp236 + _tmp233 * _tmp46 + _tmp238 * _tmp54);
+  const Scalar _tmp240 = _tmp117 * _tmp239;
+  const Scalar _tmp241 = std::pow(_tmp55, Scalar(2));
+  const Scalar _tmp242 = std::pow(_tmp32, Scalar(2));
+  const Scalar _tmp243 = std::pow(_tmp41, Scalar(2));
+  const Scalar _tmp244 = _tmp226 * _tmp243 + _tmp228 * _tmp241 + _tmp230 * _tmp242;
+  const Scalar _tmp245 = std::pow(_tmp45, Scalar(2));
+  const Scalar _tmp246 = std::pow(_tmp27, Scalar(2));
+  const Scalar _tmp247 = std::pow(_tmp53, Scalar(2));
+  const Scalar _tmp248 = _tmp226 * _tmp245 + _tmp228 * _tmp247 + _tmp230 * _tmp246;
+  const Scalar _tmp249 = -_tmp231 - _tmp244 - _tmp248;
+  const Scalar _tmp250 = _tmp231 + _tmp249;
+  const Scalar _tmp251 = _tmp235 * _tmp41 + _tmp236 * _tmp55 + _tmp237 * _tmp32;
+  const Scalar _tmp252 = _tmp233 * _tmp55 + _tmp234 * _tmp41 + _tmp235 * _tmp32;
+  const Scalar _tmp253 = _tmp233 * _tmp41 + _tmp236 * _tmp32 + _tmp238 * _tmp55;
+  const Scalar _tmp254 = _tmp251 * _tmp32 + _tmp252 * _tmp41 + _tmp253 * _tmp55;
+  const Scalar _tmp255 = _tmp233 * _tmp45 + _tmp236 * _tmp27 + _tmp238 * _tmp53;
+  const Scalar _tmp256 = _tmp233 * _tmp53 + _tmp234 * _tmp45 + _tmp235 * _tmp27;
+  const Scalar _tmp257 = _tmp235 * _tmp45 + _tmp236 * _tmp53 + _tmp237 * _tmp27;
+  const Scalar _tmp258 = _tmp255 * _tmp53 + _tmp256 * _tmp45 + _tmp257 * _tmp27;
+  const Scalar _tmp259 = -_tmp239 - _tmp254 - _tmp258;
+  const Scalar _tmp260 = _tmp21 * _tmp251 + _tmp252 * _tmp46 + _tmp253 * _tmp54;
+  const Scalar _tmp261 = 2 * _tmp110;
+  const Scalar _tmp262 = _tmp260 * _tmp261;
+  const Scalar _tmp263 = _tmp54 * _tmp55;
+  const Scalar _tmp264 = _tmp21 * _tmp230;
+  const Scalar _tmp265 = _tmp226 * _tmp41;
+  const Scalar _tmp266 = _tmp228 * _tmp263 + _tmp264 * _tmp32 + _tmp265 * _tmp46;
+  const Scalar _tmp267 = _tmp128 * _tmp266;
+  const Scalar _tmp268 = _tmp262 + _tmp267;
+  const Scalar _tmp269 = _tmp21 * _tmp257 + _tmp255 * _tmp54 + _tmp256 * _tmp46;
+  const Scalar _tmp270 = 2 * _tmp100;
+  const Scalar _tmp271 = _tmp269 * _tmp270;
+  const Scalar _tmp272 = _tmp228 * _tmp53;
+  const Scalar _tmp273 = _tmp45 * _tmp46;
+  const Scalar _tmp274 = _tmp226 * _tmp273 + _tmp264 * _tmp27 + _tmp272 * _tmp54;
+  const Scalar _tmp275 = _tmp131 * _tmp274;
+  const Scalar _tmp276 = _tmp271 + _tmp275;
+  const Scalar _tmp277 = _tmp268 + _tmp276;
+  const Scalar _tmp278 = _tmp124 * _tmp244;
+  const Scalar _tmp279 = _tmp27 * _tmp32;
+  const Scalar _tmp280 = _tmp230 * _tmp279 + _tmp265 * _tmp45 + _tmp272 * _tmp55;
+  const Scalar _tmp281 = 2 * _tmp135;
+  const Scalar _tmp282 = _tmp280 * _tmp281;
+  const Scalar _tmp283 = _tmp123 * _tmp248;
+  const Scalar _tmp284 = _tmp251 * _tmp27 + _tmp252 * _tmp45 + _tmp253 * _tmp53;
+  const Scalar _tmp285 = 2 * _tmp134;
+  const Scalar _tmp286 = _tmp284 * _tmp285;
+  const Scalar _tmp287 = _tmp119 * _tmp254;
+  const Scalar _tmp288 = _tmp118 * _tmp258;
+  const Scalar _tmp289 = -_tmp232 - _tmp240 - _tmp262 - _tmp267 - _tmp271 - _tmp275 - _tmp278 -
+                         _tmp282 - _tmp283 - _tmp286 - _tmp287 - _tmp288;
+  const Scalar _tmp290 = _tmp205 + _tmp207;
+  const Scalar _tmp291 = _tmp211 + _tmp212;
+  const Scalar _tmp292 = _tmp187 + _tmp196;
+  const Scalar _tmp293 = _tmp134 * _tmp291;
+  const Scalar _tmp294 = _tmp134 * _tmp206;
+  const Scalar _tmp295 = _tmp134 * _tmp205;
+  const Scalar _tmp296 = _tmp100 * _tmp174 + _tmp110 * _tmp200 + _tmp145 * _tmp211 + _tmp295;
+  const Scalar _tmp297 = _tmp100 * _tmp178 + _tmp110 * _tmp201 + _tmp153 * _tmp212 + _tmp294;
+  const Scalar _tmp298 = _tmp258 + _tmp259;
+  const Scalar _tmp299 = _tmp100 * _tmp239 + _tmp104 * _tmp248 + _tmp110 * _tmp284 +
+                         _tmp114 * _tmp280 + _tmp121 * _tmp269 + _tmp134 * _tmp260 +
+                         _tmp135 * _tmp266 + _tmp143 * _tmp274;
+  const Scalar _tmp300 = _tmp282 + _tmp286;
+  const Scalar _tmp301 = _tmp276 + _tmp300;
+  const Scalar _tmp302 = _tmp248 + _tmp249;
+  const Scalar _tmp303 = _tmp206 + _tmp207;
+  const Scalar _tmp304 = _tmp191 + _tmp196;
+  const Scalar _tmp305 = _tmp199 + _tmp213;
+  const Scalar _tmp306 = _tmp254 + _tmp259;
+  const Scalar _tmp307 = _tmp100 * _tmp284 + _tmp104 * _tmp280 + _tmp110 * _tmp239 +
+                         _tmp114 * _tmp244 + _tmp121 * _tmp260 + _tmp134 * _tmp269 +
+                         _tmp135 * _tmp274 + _tmp151 * _tmp266;
+  const Scalar _tmp308 = _tmp100 * _tmp260 + _tmp104 * _tmp266 + _tmp110 * _tmp269 +
+                         _tmp114 * _tmp274 + _tmp134 * _tmp258 + _tmp135 * _tmp244 +
+                         _tmp145 * _tmp284 + _tmp151 * _tmp280;
+  const Scalar _tmp309 = _tmp268 + _tmp300;
+  const Scalar _tmp310 = dt * preint_prev(18, 0) + preint_prev(33, 0);
+  const Scalar _tmp311 = _tmp310 + _tmp70 * preint_prev(14, 0) - _tmp71 * preint_prev(15, 0);
+  const Scalar _tmp312 = _tmp71 * preint_prev(13, 0);
+  const Scalar _tmp313 = _tmp69 * preint_prev(14, 0);
+  const Scalar _tmp314 = _tmp312 - _tmp313 + dt * preint_prev(27, 0) + preint_prev(48, 0);
+  const Scalar _tmp315 = dt * preint_prev(22, 0) + preint_prev(40, 0);
+  const Scalar _tmp316 = _tmp315 + _tmp69 * preint_prev(15, 0) - _tmp70 * preint_prev(13, 0);
+  const Scalar _tmp317 = _tmp27 * _tmp311 + _tmp314 * _tmp45 + _tmp316 * _tmp53;
+  const Scalar _tmp318 = _tmp317 * _tmp45;
+  const Scalar _tmp319 = _tmp70 * preint_prev(11, 0);
+  const Scalar _tmp320 = dt * preint_prev(16, 0) + preint_prev(31, 0);
+  const Scalar _tmp321 = -_tmp312 + _tmp319 + _tmp320;
+  const Scalar _tmp322 = dt * preint_prev(25, 0) + preint_prev(46, 0);
+  const Scalar _tmp323 = _tmp322 - _tmp69 * preint_prev(11, 0) + _tmp71 * preint_prev(10, 0);
+  const Scalar _tmp324 = dt * preint_prev(20, 0) + preint_prev(38, 0);
+  const Scalar _tmp325 = _tmp324 + _tmp69 * preint_prev(13, 0) - _tmp70 * preint_prev(10, 0);
+  const Scalar _tmp326 = _tmp27 * _tmp321 + _tmp323 * _tmp45 + _tmp325 * _tmp53;
+  const Scalar _tmp327 = _tmp27 * _tmp326;
+  const Scalar _tmp328 = dt * preint_prev(17, 0) + preint_prev(32, 0);
+  const Scalar _tmp329 = _tmp328 + _tmp70 * preint_prev(12, 0) - _tmp71 * preint_prev(14, 0);
+  const Scalar _tmp330 = dt * preint_prev(26, 0) + preint_prev(47, 0);
+  const Scalar _tmp331 = _tmp330 - _tmp69 * preint_prev(12, 0) + _tmp71 * preint_prev(11, 0);
+  const Scalar _tmp332 = dt * preint_prev(21, 0) + preint_prev(39, 0);
+  const Scalar _tmp333 = _tmp313 - _tmp319 + _tmp332;
+  const Scalar _tmp334 = _tmp27 * _tmp329 + _tmp331 * _tmp45 + _tmp333 * _tmp53;
+  const Scalar _tmp335 = _tmp334 * _tmp53;
+  const Scalar _tmp336 = _tmp318 + _tmp327 + _tmp335;
+  const Scalar _tmp337 = _tmp32 * _tmp329 + _tmp331 * _tmp41 + _tmp333 * _tmp55;
+  const Scalar _tmp338 = _tmp337 * _tmp55;
+  const Scalar _tmp339 = _tmp311 * _tmp32 + _tmp314 * _tmp41 + _tmp316 * _tmp55;
+  const Scalar _tmp340 = _tmp339 * _tmp41;
+  const Scalar _tmp341 = _tmp32 * _tmp321 + _tmp323 * _tmp41 + _tmp325 * _tmp55;
+  const Scalar _tmp342 = _tmp32 * _tmp341;
+  const Scalar _tmp343 = _tmp338 + _tmp340 + _tmp342;
+  const Scalar _tmp344 = _tmp21 * _tmp329 + _tmp331 * _tmp46 + _tmp333 * _tmp54;
+  const Scalar _tmp345 = _tmp344 * _tmp54;
+  const Scalar _tmp346 = _tmp21 * _tmp321 + _tmp323 * _tmp46 + _tmp325 * _tmp54;
+  const Scalar _tmp347 = _tmp21 * _tmp346;
+  const Scalar _tmp348 = _tmp21 * _tmp311 + _tmp314 * _tmp46 + _tmp316 * _tmp54;
+  const Scalar _tmp349 = _tmp348 * _tmp46;
+  const Scalar _tmp350 = _tmp345 + _tmp347 + _tmp349;
+  const Scalar _tmp351 = -_tmp336 - _tmp343 - _tmp350;
+  const Scalar _tmp352 = _tmp350 + _tmp351;
+  const Scalar _tmp353 = _tmp119 * _tmp343;
+  const Scalar _tmp354 = _tmp27 * _tmp346 + _tmp344 * _tmp53 + _tmp348 * _tmp45;
+  const Scalar _tmp355 = _tmp21 * _tmp326 + _tmp317 * _tmp46 + _tmp334 * _tmp54;
+  const Scalar _tmp356 = _tmp100 * _tmp354 + _tmp100 * _tmp355;
+  const Scalar _tmp357 = _tmp27 * _tmp341 + _tmp337 * _tmp53 + _tmp339 * _tmp45;
+  const Scalar _tmp358 = _tmp317 * _tmp41 + _tmp32 * _tmp326 + _tmp334 * _tmp55;
+  const Scalar _tmp359 = _tmp134 * _tmp357 + _tmp134 * _tmp358;
+  const Scalar _tmp360 = _tmp118 * _tmp336 + _tmp359;
+  const Scalar _tmp361 = _tmp32 * _tmp346 + _tmp344 * _tmp55 + _tmp348 * _tmp41;
+  const Scalar _tmp362 = _tmp21 * _tmp341 + _tmp337 * _tmp54 + _tmp339 * _tmp46;
+  const Scalar _tmp363 = _tmp110 * _tmp361 + _tmp110 * _tmp362;
+  const Scalar _tmp364 = _tmp117 * _tmp350 + _tmp363;
+  const Scalar _tmp365 = -_tmp353 - _tmp356 - _tmp360 - _tmp364;
+  const Scalar _tmp366 = _tmp356 + _tmp365;
+  const Scalar _tmp367 = 2 * _tmp345 + 2 * _tmp347 + 2 * _tmp349;
+  const Scalar _tmp368 = 2 * _tmp318 + 2 * _tmp327 + 2 * _tmp335;
+  const Scalar _tmp369 = 2 * _tmp338 + 2 * _tmp340 + 2 * _tmp342;
+  const Scalar _tmp370 = -_tmp367 - _tmp368 - _tmp369;
+  const Scalar _tmp371 = _tmp367 + _tmp370;
+  const Scalar _tmp372 = _tmp361 + _tmp362;
+  const Scalar _tmp373 = _tmp110 * _tmp372;
+  const Scalar _tmp374 = _tmp354 + _tmp355;
+  const Scalar _tmp375 = _tmp100 * _tmp374 + _tmp356;
+  const Scalar _tmp376 = _tmp100 * _tmp336;
+  const Scalar _tmp377 = _tmp100 * _tmp350;
+  const Scalar _tmp378 = _tmp110 * _tmp357 + _tmp121 * _tmp354 + _tmp134 * _tmp361 + _tmp377;
+  const Scalar _tmp379 = _tmp110 * _tmp358 + _tmp134 * _tmp362 + _tmp145 * _tmp355 + _tmp376;
+  const Scalar _tmp380 = _tmp110 * _tmp343;
+  const Scalar _tmp381 = _tmp100 * _tmp357 + _tmp134 * _tmp355 + _tmp153 * _tmp362 + _tmp380;
+  const Scalar _tmp382 = _tmp110 * _tmp350;
+  const Scalar _tmp383 = _tmp100 * _tmp358 + _tmp121 * _tmp361 + _tmp134 * _tmp354 + _tmp382;
+  const Scalar _tmp384 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(4));
+  const Scalar _tmp385 = _tmp225 * imu_noise(5, 0);
+  const Scalar _tmp386 = _tmp384 * imu_noise(4, 0);
+  const Scalar _tmp387 = _tmp229 * imu_noise(3, 0);
+  const Scalar _tmp388 = _tmp227 * _tmp386 + _tmp384 * _tmp385 + _tmp384 * _tmp387;
+  const Scalar _tmp389 = _tmp116 * _tmp388;
+  const Scalar _tmp390 = dt * preint_prev(28, 0);
+  const Scalar _tmp391 = _tmp321 * _tmp57 - _tmp329 * _tmp35 + _tmp390 +
+                         _tmp70 * preint_prev(26, 0) - _tmp71 * preint_prev(27, 0) +
+                         preint_prev(36, 0);
+  const Scalar _tmp392 = dt * preint_prev(29, 0);
+  const Scalar _tmp393 = _tmp325 * _tmp57 - _tmp333 * _tmp35 + _tmp392 +
+                         _tmp69 * preint_prev(27, 0) - _tmp70 * preint_prev(25, 0) +
+                         preint_prev(43, 0);
+  const Scalar _tmp394 = dt * preint_prev(30, 0) + preint_prev(51, 0);
+  const Scalar _tmp395 = _tmp323 * _tmp57 - _tmp331 * _tmp35 + _tmp394 -
+                         _tmp69 * preint_prev(26, 0) + _tmp71 * preint_prev(25, 0);
+  const Scalar _tmp396 = _tmp21 * _tmp391 + _tmp393 * _tmp54 + _tmp395 * _tmp46;
+  const Scalar _tmp397 = dt * preint_prev(19, 0) + preint_prev(34, 0);
+  const Scalar _tmp398 = -_tmp311 * _tmp57 + _tmp329 * _tmp48 + _tmp397 +
+                         _tmp70 * preint_prev(17, 0) - _tmp71 * preint_prev(18, 0);
+  const Scalar _tmp399 = dt * preint_prev(23, 0);
+  const Scalar _tmp400 = _tmp399 + preint_prev(41, 0);
+  const Scalar _tmp401 = -_tmp316 * _tmp57 + _tmp333 * _tmp48 + _tmp400 +
+                         _tmp69 * preint_prev(18, 0) - _tmp70 * preint_prev(16, 0);
+  const Scalar _tmp402 = _tmp390 + preint_prev(49, 0);
+  const Scalar _tmp403 = -_tmp314 * _tmp57 + _tmp331 * _tmp48 + _tmp402 -
+                         _tmp69 * preint_prev(17, 0) + _tmp71 * preint_prev(16, 0);
+  const Scalar _tmp404 = _tmp21 * _tmp398 + _tmp401 * _tmp54 + _tmp403 * _tmp46;
+  const Scalar _tmp405 = dt * preint_prev(24, 0) + preint_prev(42, 0);
+  const Scalar _tmp406 = _tmp316 * _tmp35 - _tmp325 * _tmp48 + _tmp405 +
+                         _tmp69 * preint_prev(22, 0) - _tmp70 * preint_prev(20, 0);
+  const Scalar _tmp407 = _tmp311 * _tmp35 - _tmp321 * _tmp48 + _tmp399 +
+                         _tmp70 * preint_prev(21, 0) - _tmp71 * preint_prev(22, 0) +
+                         preint_prev(35, 0);
+  const Scalar _tmp408 = _tmp392 + preint_prev(50, 0);
+  const Scalar _tmp409 = _tmp314 * _tmp35 - _tmp323 * _tmp48 + _tmp408 -
+                         _tmp69 * preint_prev(21, 0) + _tmp71 * preint_prev(20, 0);
+  const Scalar _tmp410 = _tmp21 * _tmp407 + _tmp406 * _tmp54 + _tmp409 * _tmp46;
+  const Scalar _tmp411 = _tmp21 * _tmp404 + _tmp396 * _tmp46 + _tmp410 * _tmp54;
+  const Scalar _tmp412 = _tmp117 * _tmp411;
+  const Scalar _tmp413 = _tmp27 * _tmp398 + _tmp401 * _tmp53 + _tmp403 * _tmp45;
+  const Scalar _tmp414 = _tmp27 * _tmp391 + _tmp393 * _tmp53 + _tmp395 * _tmp45;
+  const Scalar _tmp415 = _tmp27 * _tmp407 + _tmp406 * _tmp53 + _tmp409 * _tmp45;
+  const Scalar _tmp416 = _tmp27 * _tmp413 + _tmp414 * _tmp45 + _tmp415 * _tmp53;
+  const Scalar _tmp417 = _tmp32 * _tmp391 + _tmp393 * _tmp55 + _tmp395 * _tmp41;
+  const Scalar _tmp418 = _tmp32 * _tmp398 + _tmp401 * _tmp55 + _tmp403 * _tmp41;
+  const Scalar _tmp419 = _tmp32 * _tmp407 + _tmp406 * _tmp55 + _tmp409 * _tmp41;
+  const Scalar _tmp420 = _tmp32 * _tmp418 + _tmp41 * _tmp417 + _tmp419 * _tmp55;
+  const Scalar _tmp421 = -_tmp411 - _tmp416 - _tmp420;
+  const Scalar _tmp422 = _tmp411 + _tmp421;
+  const Scalar _tmp423 = _tmp242 * imu_noise(3, 0);
+  const Scalar _tmp424 = _tmp384 * imu_noise(5, 0);
+  const Scalar _tmp425 = _tmp241 * _tmp386 + _tmp243 * _tmp424 + _tmp384 * _tmp423;
+  const Scalar _tmp426 = _tmp246 * imu_noise(3, 0);
+  const Scalar _tmp427 = _tmp247 * imu_noise(4, 0);
+  const Scalar _tmp428 = _tmp245 * _tmp424 + _tmp384 * _tmp426 + _tmp384 * _tmp427;
+  const Scalar _tmp429 = -_tmp388 - _tmp425 - _tmp428;
+  const Scalar _tmp430 = _tmp388 + _tmp429;
+  const Scalar _tmp431 = _tmp386 * _tmp53;
+  const Scalar _tmp432 = _tmp21 * imu_noise(3, 0);
+  const Scalar _tmp433 = _tmp384 * _tmp432;
+  const Scalar _tmp434 = _tmp27 * _tmp433 + _tmp273 * _tmp424 + _tmp431 * _tmp54;
+  const Scalar _tmp435 = _tmp131 * _tmp434;
+  const Scalar _tmp436 = _tmp21 * _tmp413 + _tmp414 * _tmp46 + _tmp415 * _tmp54;
+  const Scalar _tmp437 = _tmp27 * _tmp404 + _tmp396 * _tmp45 + _tmp410 * _tmp53;
+  const Scalar _tmp438 = _tmp100 * _tmp436 + _tmp100 * _tmp437;
+  const Scalar _tmp439 = _tmp41 * _tmp46;
+  const Scalar _tmp440 = _tmp263 * _tmp386 + _tmp32 * _tmp433 + _tmp424 * _tmp439;
+  const Scalar _tmp441 = _tmp128 * _tmp440;
+  const Scalar _tmp442 = _tmp21 * _tmp418 + _tmp417 * _tmp46 + _tmp419 * _tmp54;
+  const Scalar _tmp443 = _tmp32 * _tmp404 + _tmp396 * _tmp41 + _tmp410 * _tmp55;
+  const Scalar _tmp444 = _tmp110 * _tmp442 + _tmp110 * _tmp443;
+  const Scalar _tmp445 = _tmp441 + _tmp444;
+  const Scalar _tmp446 = _tmp435 + _tmp438 + _tmp445;
+  const Scalar _tmp447 = _tmp119 * _tmp420 + _tmp444;
+  const Scalar _tmp448 = _tmp27 * _tmp418 + _tmp417 * _tmp45 + _tmp419 * _tmp53;
+  const Scalar _tmp449 = _tmp32 * _tmp413 + _tmp41 * _tmp414 + _tmp415 * _tmp55;
+  const Scalar _tmp450 = _tmp134 * _tmp448 + _tmp134 * _tmp449;
+  const Scalar _tmp451 = _tmp438 + _tmp450;
+  const Scalar _tmp452 = _tmp118 * _tmp416 + _tmp451;
+  const Scalar _tmp453 = _tmp124 * _tmp425 + _tmp441;
+  const Scalar _tmp454 = _tmp279 * imu_noise(3, 0);
+  const Scalar _tmp455 = _tmp41 * _tmp45;
+  const Scalar _tmp456 = _tmp384 * _tmp454 + _tmp424 * _tmp455 + _tmp431 * _tmp55;
+  const Scalar _tmp457 = _tmp281 * _tmp456;
+  const Scalar _tmp458 = _tmp435 + _tmp457;
+  const Scalar _tmp459 = _tmp123 * _tmp428 + _tmp458;
+  const Scalar _tmp460 = -_tmp389 - _tmp412 - _tmp447 - _tmp452 - _tmp453 - _tmp459;
+  const Scalar _tmp461 = _tmp416 + _tmp421;
+  const Scalar _tmp462 = _tmp135 * _tmp440;
+  const Scalar _tmp463 = _tmp114 * _tmp456;
+  const Scalar _tmp464 =
+      _tmp100 * _tmp411 + _tmp104 * _tmp428 + _tmp143 * _tmp434 + _tmp462 + _tmp463;
+  const Scalar _tmp465 = _tmp110 * _tmp448 + _tmp121 * _tmp437 + _tmp134 * _tmp443 + _tmp464;
+  const Scalar _tmp466 = _tmp104 * _tmp388;
+  const Scalar _tmp467 = _tmp126 * _tmp434;
+  const Scalar _tmp468 = _tmp100 * _tmp416;
+  const Scalar _tmp469 = _tmp110 * _tmp411;
+  const Scalar _tmp470 = _tmp151 * _tmp440;
+  const Scalar _tmp471 = _tmp104 * _tmp456;
+  const Scalar _tmp472 = _tmp114 * _tmp425;
+  const Scalar _tmp473 = _tmp135 * _tmp434;
+  const Scalar _tmp474 = _tmp420 + _tmp421;
+  const Scalar _tmp475 = _tmp100 * _tmp449 + _tmp121 * _tmp443 + _tmp134 * _tmp437;
+  const Scalar _tmp476 =
+      _tmp110 * _tmp420 + _tmp114 * _tmp388 + _tmp126 * _tmp440 + _tmp471 + _tmp473;
+  const Scalar _tmp477 = _tmp469 + _tmp470 + _tmp472 + _tmp476;
+  const Scalar _tmp478 = (Scalar(1) / Scalar(4)) * std::pow(dt, Scalar(5));
+  const Scalar _tmp479 = _tmp478 * imu_noise(4, 0);
+  const Scalar _tmp480 = _tmp478 * imu_noise(5, 0);
+  const Scalar _tmp481 = _tmp241 * _tmp479 + _tmp243 * _tmp480 + _tmp423 * _tmp478;
+  const Scalar _tmp482 = _tmp245 * _tmp480 + _tmp426 * _tmp478 + _tmp427 * _tmp478;
+  const Scalar _tmp483 = _tmp227 * _tmp479 + _tmp385 * _tmp478 + _tmp387 * _tmp478;
+  const Scalar _tmp484 = -_tmp481 - _tmp482 - _tmp483;
+  const Scalar _tmp485 = _tmp483 + _tmp484;
+  const Scalar _tmp486 = -_tmp314 * _tmp71 + _tmp320 * _tmp71 - _tmp328 * _tmp69 +
+                         _tmp331 * _tmp70 + _tmp402 * dt + dt * preint_prev(36, 0) +
+                         preint_prev(52, 0);
+  const Scalar _tmp487 = _tmp310 * _tmp69 - _tmp316 * _tmp71 - _tmp320 * _tmp70 + _tmp333 * _tmp70 +
+                         _tmp400 * dt + dt * preint_prev(35, 0) + preint_prev(44, 0);
+  const Scalar _tmp488 = -_tmp310 * _tmp71 - _tmp311 * _tmp71 + _tmp328 * _tmp70 +
+                         _tmp329 * _tmp70 + _tmp397 * dt + dt * preint_prev(34, 0) +
+                         preint_prev(37, 0);
+  const Scalar _tmp489 = _tmp32 * _tmp488 + _tmp41 * _tmp486 + _tmp487 * _tmp55;
+  const Scalar _tmp490 = _tmp314 * _tmp69 - _tmp323 * _tmp70 + _tmp324 * _tmp71 - _tmp332 * _tmp69 +
+                         _tmp408 * dt + dt * preint_prev(43, 0) + preint_prev(53, 0);
+  const Scalar _tmp491 = _tmp315 * _tmp69 + _tmp316 * _tmp69 - _tmp324 * _tmp70 - _tmp325 * _tmp70 +
+                         _tmp405 * dt + dt * preint_prev(42, 0) + preint_prev(45, 0);
+  const Scalar _tmp492 = _tmp32 * _tmp487 + _tmp41 * _tmp490 + _tmp491 * _tmp55;
+  const Scalar _tmp493 = _tmp322 * _tmp71 + _tmp323 * _tmp71 - _tmp330 * _tmp69 - _tmp331 * _tmp69 +
+                         _tmp394 * dt + dt * preint_prev(51, 0) + preint_prev(54, 0);
+  const Scalar _tmp494 = _tmp32 * _tmp486 + _tmp41 * _tmp493 + _tmp490 * _tmp55;
+  const Scalar _tmp495 = _tmp32 * _tmp489 + _tmp41 * _tmp494 + _tmp492 * _tmp55;
+  const Scalar _tmp496 = _tmp21 * (_tmp21 * _tmp488 + _tmp46 * _tmp486 + _tmp487 * _tmp54) +
+                         _tmp46 * (_tmp21 * _tmp486 + _tmp46 * _tmp493 + _tmp490 * _tmp54) +
+                         _tmp54 * (_tmp21 * _tmp487 + _tmp46 * _tmp490 + _tmp491 * _tmp54);
+  const Scalar _tmp497 = _tmp27 * _tmp488 + _tmp45 * _tmp486 + _tmp487 * _tmp53;
+  const Scalar _tmp498 = _tmp27 * _tmp486 + _tmp45 * _tmp493 + _tmp490 * _tmp53;
+  const Scalar _tmp499 = _tmp27 * _tmp487 + _tmp45 * _tmp490 + _tmp491 * _tmp53;
+  const Scalar _tmp500 = _tmp27 * _tmp497 + _tmp45 * _tmp498 + _tmp499 * _tmp53;
+  const Scalar _tmp501 = -_tmp495 - _tmp496 - _tmp500;
+  const Scalar _tmp502 = _tmp432 * _tmp478;
+  const Scalar _tmp503 = _tmp263 * _tmp479 + _tmp32 * _tmp502 + _tmp439 * _tmp480;
+  const Scalar _tmp504 = _tmp128 * _tmp503;
+  const Scalar _tmp505 = _tmp479 * _tmp53;
+  const Scalar _tmp506 = _tmp27 * _tmp502 + _tmp273 * _tmp480 + _tmp505 * _tmp54;
+  const Scalar _tmp507 = _tmp131 * _tmp506;
+  const Scalar _tmp508 = _tmp504 + _tmp507;
+  const Scalar _tmp509 = _tmp116 * _tmp483 + _tmp508;
+  const Scalar _tmp510 = _tmp21 * _tmp489 + _tmp46 * _tmp494 + _tmp492 * _tmp54;
+  const Scalar _tmp511 = _tmp261 * _tmp510;
+  const Scalar _tmp512 = _tmp21 * _tmp497 + _tmp46 * _tmp498 + _tmp499 * _tmp54;
+  const Scalar _tmp513 = _tmp270 * _tmp512;
+  const Scalar _tmp514 = _tmp511 + _tmp513;
+  const Scalar _tmp515 = _tmp117 * _tmp496 + _tmp514;
+  const Scalar _tmp516 = _tmp123 * _tmp482;
+  const Scalar _tmp517 = _tmp454 * _tmp478 + _tmp455 * _tmp480 + _tmp505 * _tmp55;
+  const Scalar _tmp518 = _tmp281 * _tmp517;
+  const Scalar _tmp519 = _tmp124 * _tmp481 + _tmp518;
+  const Scalar _tmp520 = _tmp118 * _tmp500;
+  const Scalar _tmp521 = _tmp27 * _tmp489 + _tmp45 * _tmp494 + _tmp492 * _tmp53;
+  const Scalar _tmp522 = _tmp285 * _tmp521;
+  const Scalar _tmp523 = _tmp119 * _tmp495 + _tmp522;
+  const Scalar _tmp524 = -_tmp509 - _tmp515 - _tmp516 - _tmp519 - _tmp520 - _tmp523;
+  const Scalar _tmp525 = _tmp368 + _tmp370;
+  const Scalar _tmp526 = _tmp357 + _tmp358;
+  const Scalar _tmp527 = _tmp336 + _tmp351;
+  const Scalar _tmp528 = _tmp134 * _tmp526;
+  const Scalar _tmp529 = _tmp134 * _tmp343;
+  const Scalar _tmp530 = _tmp100 * _tmp362 + _tmp110 * _tmp354 + _tmp153 * _tmp357 + _tmp529;
+  const Scalar _tmp531 = _tmp134 * _tmp336;
+  const Scalar _tmp532 = _tmp100 * _tmp361 + _tmp110 * _tmp355 + _tmp145 * _tmp358 + _tmp531;
+  const Scalar _tmp533 =
+      _tmp110 * _tmp449 + _tmp134 * _tmp442 + _tmp145 * _tmp436 + _tmp466 + _tmp467 + _tmp468;
+  const Scalar _tmp534 = _tmp428 + _tmp429;
+  const Scalar _tmp535 = _tmp104 * _tmp440 + _tmp114 * _tmp434;
+  const Scalar _tmp536 = _tmp134 * _tmp416 + _tmp135 * _tmp425 + _tmp151 * _tmp456 + _tmp535;
+  const Scalar _tmp537 = _tmp100 * _tmp443 + _tmp110 * _tmp436 + _tmp145 * _tmp449 + _tmp536;
+  const Scalar _tmp538 = _tmp134 * _tmp420 + _tmp135 * _tmp428 + _tmp143 * _tmp456;
+  const Scalar _tmp539 = _tmp500 + _tmp501;
+  const Scalar _tmp540 = _tmp100 * _tmp496 + _tmp104 * _tmp482 + _tmp110 * _tmp521 +
+                         _tmp114 * _tmp517 + _tmp121 * _tmp512 + _tmp134 * _tmp510 +
+                         _tmp135 * _tmp503 + _tmp143 * _tmp506;
+  const Scalar _tmp541 = _tmp482 + _tmp484;
+  const Scalar _tmp542 = _tmp518 + _tmp522;
+  const Scalar _tmp543 = _tmp507 + _tmp513 + _tmp542;
+  const Scalar _tmp544 = _tmp343 + _tmp351;
+  const Scalar _tmp545 = _tmp369 + _tmp370;
+  const Scalar _tmp546 = _tmp359 + _tmp363;
+  const Scalar _tmp547 = _tmp100 * _tmp448 + _tmp134 * _tmp436 + _tmp153 * _tmp442;
+  const Scalar _tmp548 = _tmp425 + _tmp429;
+  const Scalar _tmp549 = _tmp100 * _tmp442 + _tmp110 * _tmp437 + _tmp153 * _tmp448 + _tmp538;
+  const Scalar _tmp550 = _tmp450 + _tmp457;
+  const Scalar _tmp551 = _tmp495 + _tmp501;
+  const Scalar _tmp552 = _tmp100 * _tmp521 + _tmp104 * _tmp517 + _tmp110 * _tmp496 +
+                         _tmp114 * _tmp481 + _tmp121 * _tmp510 + _tmp134 * _tmp512 +
+                         _tmp135 * _tmp506 + _tmp151 * _tmp503;
+  const Scalar _tmp553 = _tmp100 * _tmp510 + _tmp104 * _tmp503 + _tmp110 * _tmp512 +
+                         _tmp114 * _tmp506 + _tmp134 * _tmp500 + _tmp135 * _tmp481 +
+                         _tmp145 * _tmp521 + _tmp151 * _tmp517;
+  const Scalar _tmp554 = _tmp504 + _tmp511;
+
+  // Output terms (2)
+  if (upsilon != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _upsilon = (*upsilon);
+
+    _upsilon(0, 0) = _tmp10 * preint_prev(1, 0) + _tmp11 * z_imu_est(0, 0) +
+                     _tmp12 * preint_prev(0, 0) - _tmp9 * z_imu_est(1, 0);
+    _upsilon(1, 0) = -_tmp10 * preint_prev(0, 0) + _tmp11 * z_imu_est(1, 0) +
+                     _tmp12 * preint_prev(1, 0) + _tmp9 * z_imu_est(0, 0);
+    _upsilon(2, 0) = _tmp10 * preint_prev(3, 0) + _tmp12 * preint_prev(2, 0) -
+                     _tmp13 * z_imu_est(0, 0) + _tmp14 * z_imu_est(1, 0);
+    _upsilon(3, 0) = _tmp12 * preint_prev(3, 0) - _tmp13 * z_imu_est(1, 0) -
+                     _tmp14 * z_imu_est(0, 0) - _tmp9 * z_imu_est(2, 0);
+    _upsilon(4, 0) = _tmp17 * _tmp35 + _tmp39 * _tmp48 + _tmp52 * _tmp57 + preint_prev(4, 0);
+    _upsilon(5, 0) = _tmp35 * _tmp58 + _tmp48 * _tmp61 + _tmp57 * _tmp63 + preint_prev(5, 0);
+    _upsilon(6, 0) = _tmp35 * _tmp64 + _tmp48 * _tmp65 + _tmp57 * _tmp66 + preint_prev(6, 0);
+    _upsilon(7, 0) = _tmp17 * _tmp69 + _tmp39 * _tmp70 + _tmp52 * _tmp71 + dt * preint_prev(4, 0) +
+                     preint_prev(7, 0);
+    _upsilon(8, 0) = _tmp58 * _tmp69 + _tmp61 * _tmp70 + _tmp63 * _tmp71 + dt * preint_prev(5, 0) +
+                     preint_prev(8, 0);
+    _upsilon(9, 0) = _tmp64 * _tmp69 + _tmp65 * _tmp70 + _tmp66 * _tmp71 + dt * preint_prev(6, 0) +
+                     preint_prev(9, 0);
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = (Scalar(1) / Scalar(12)) * _tmp105 + (Scalar(1) / Scalar(12)) * _tmp115 +
+                 (Scalar(1) / Scalar(12)) * _tmp116 * _tmp122 + _tmp116 +
+                 (Scalar(1) / Scalar(12)) * _tmp117 * _tmp127 + _tmp117 +
+                 (Scalar(1) / Scalar(4)) * _tmp121 * _tmp126 + (Scalar(1) / Scalar(4)) * _tmp133 +
+                 (Scalar(1) / Scalar(4)) * _tmp140;
+    _cov(1, 0) = (Scalar(1) / Scalar(12)) * _tmp100 * _tmp123 +
+                 (Scalar(1) / Scalar(12)) * _tmp100 * _tmp126 + _tmp100 +
+                 (Scalar(1) / Scalar(12)) * _tmp104 * _tmp117 +
+                 (Scalar(1) / Scalar(12)) * _tmp104 * _tmp145 + _tmp104 +
+                 (Scalar(5) / Scalar(12)) * _tmp141 + (Scalar(5) / Scalar(12)) * _tmp142 +
+                 (Scalar(1) / Scalar(3)) * _tmp144;
+    _cov(2, 0) = (Scalar(1) / Scalar(12)) * _tmp105 + (Scalar(1) / Scalar(12)) * _tmp118 * _tmp146 +
+                 _tmp118 + (Scalar(1) / Scalar(12)) * _tmp123 * _tmp147 + _tmp123 +
+                 (Scalar(1) / Scalar(4)) * _tmp130 + (Scalar(1) / Scalar(4)) * _tmp132 +
+                 (Scalar(1) / Scalar(4)) * _tmp137 + (Scalar(1) / Scalar(4)) * _tmp139 +
+                 (Scalar(1) / Scalar(4)) * _tmp143 * _tmp145 + (Scalar(1) / Scalar(12)) * _tmp148;
+    _cov(3, 0) = (Scalar(1) / Scalar(12)) * _tmp110 * _tmp124 +
+                 (Scalar(1) / Scalar(12)) * _tmp110 * _tmp126 + _tmp110 +
+                 (Scalar(1) / Scalar(12)) * _tmp114 * _tmp117 +
+                 (Scalar(1) / Scalar(12)) * _tmp114 * _tmp153 + _tmp114 +
+                 (Scalar(5) / Scalar(12)) * _tmp149 + (Scalar(5) / Scalar(12)) * _tmp150 +
+                 (Scalar(1) / Scalar(3)) * _tmp152;
+    _cov(4, 0) = (Scalar(1) / Scalar(12)) * _tmp118 * _tmp135 +
+                 (Scalar(1) / Scalar(12)) * _tmp124 * _tmp134 +
+                 (Scalar(1) / Scalar(12)) * _tmp134 * _tmp143 + _tmp134 +
+                 (Scalar(1) / Scalar(12)) * _tmp135 * _tmp153 + _tmp135 +
+                 (Scalar(5) / Scalar(12)) * _tmp154 + (Scalar(5) / Scalar(12)) * _tmp155 +
+                 (Scalar(1) / Scalar(3)) * _tmp156;
+    _cov(5, 0) = (Scalar(1) / Scalar(12)) * _tmp115 + (Scalar(1) / Scalar(12)) * _tmp119 * _tmp158 +
+                 _tmp119 + (Scalar(1) / Scalar(12)) * _tmp124 * _tmp157 + _tmp124 +
+                 (Scalar(1) / Scalar(4)) * _tmp138 + (Scalar(1) / Scalar(4)) * _tmp140 +
+                 (Scalar(1) / Scalar(12)) * _tmp148 + (Scalar(1) / Scalar(4)) * _tmp151 * _tmp153;
+    _cov(6, 0) = (Scalar(1) / Scalar(12)) * _tmp117 * _tmp197 +
+                 (Scalar(1) / Scalar(4)) * _tmp121 * _tmp208 +
+                 (Scalar(1) / Scalar(12)) * _tmp122 * _tmp198 + (Scalar(1) / Scalar(12)) * _tmp180 +
+                 _tmp198 + (Scalar(1) / Scalar(12)) * _tmp199 + (Scalar(1) / Scalar(12)) * _tmp204 +
+                 (Scalar(1) / Scalar(4)) * _tmp210 + (Scalar(1) / Scalar(4)) * _tmp216;
+    _cov(7, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp197 + (Scalar(1) / Scalar(4)) * _tmp100 * _tmp208 +
+        (Scalar(1) / Scalar(4)) * _tmp117 * _tmp200 + (Scalar(1) / Scalar(12)) * _tmp118 * _tmp202 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp179 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp201 + _tmp201 +
+        (Scalar(1) / Scalar(12)) * _tmp217 + (Scalar(1) / Scalar(12)) * _tmp219 +
+        (Scalar(1) / Scalar(4)) * _tmp220;
+    _cov(8, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp197 + (Scalar(1) / Scalar(4)) * _tmp110 * _tmp208 +
+        (Scalar(1) / Scalar(4)) * _tmp117 * _tmp178 + (Scalar(1) / Scalar(12)) * _tmp119 * _tmp179 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp202 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp174 + _tmp174 +
+        (Scalar(1) / Scalar(12)) * _tmp221 + (Scalar(1) / Scalar(4)) * _tmp222 +
+        (Scalar(1) / Scalar(12)) * _tmp224;
+    _cov(9, 0) = (Scalar(1) / Scalar(4)) * _tmp121 * (_tmp239 + _tmp259) +
+                 (Scalar(1) / Scalar(12)) * _tmp122 * _tmp239 +
+                 (Scalar(1) / Scalar(4)) * _tmp126 * _tmp250 +
+                 (Scalar(1) / Scalar(12)) * _tmp127 * _tmp231 + _tmp231 +
+                 (Scalar(1) / Scalar(4)) * _tmp232 + _tmp239 + (Scalar(1) / Scalar(4)) * _tmp240 +
+                 (Scalar(1) / Scalar(3)) * _tmp277 + (Scalar(1) / Scalar(4)) * _tmp289;
+    _cov(10, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp100 * _tmp290 + (Scalar(1) / Scalar(12)) * _tmp100 * _tmp292 +
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp291 +
+        (Scalar(1) / Scalar(12)) * _tmp117 * _tmp202 + (Scalar(1) / Scalar(4)) * _tmp118 * _tmp201 +
+        (Scalar(1) / Scalar(12)) * _tmp121 * _tmp200 + _tmp200 +
+        (Scalar(1) / Scalar(12)) * _tmp218 + (Scalar(1) / Scalar(4)) * _tmp219 +
+        (Scalar(1) / Scalar(12)) * _tmp220;
+    _cov(11, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp118 * _tmp292 + (Scalar(1) / Scalar(4)) * _tmp145 * _tmp290 +
+        (Scalar(1) / Scalar(12)) * _tmp147 * _tmp205 + (Scalar(1) / Scalar(12)) * _tmp204 +
+        _tmp205 + (Scalar(1) / Scalar(12)) * _tmp213 + (Scalar(1) / Scalar(4)) * _tmp214 +
+        (Scalar(1) / Scalar(4)) * _tmp216 + (Scalar(1) / Scalar(12)) * _tmp293;
+    _cov(12, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp202 + (Scalar(1) / Scalar(4)) * _tmp118 * _tmp212 +
+        (Scalar(1) / Scalar(12)) * _tmp119 * _tmp291 + (Scalar(1) / Scalar(4)) * _tmp134 * _tmp290 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp292 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp211 + _tmp211 +
+        (Scalar(1) / Scalar(12)) * _tmp294 + (Scalar(1) / Scalar(12)) * _tmp296 +
+        (Scalar(1) / Scalar(4)) * _tmp297;
+    _cov(13, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp258 + (Scalar(1) / Scalar(4)) * _tmp100 * _tmp298 +
+        (Scalar(1) / Scalar(12)) * _tmp104 * _tmp231 + (Scalar(1) / Scalar(4)) * _tmp104 * _tmp250 +
+        (Scalar(1) / Scalar(4)) * _tmp116 * _tmp274 + (Scalar(1) / Scalar(4)) * _tmp118 * _tmp269 +
+        (Scalar(1) / Scalar(12)) * _tmp126 * _tmp274 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp269 + _tmp269 + _tmp274 +
+        (Scalar(1) / Scalar(3)) * _tmp299;
+    _cov(14, 0) = (Scalar(1) / Scalar(4)) * _tmp143 * _tmp302 +
+                  (Scalar(1) / Scalar(4)) * _tmp145 * _tmp298 +
+                  (Scalar(1) / Scalar(12)) * _tmp146 * _tmp248 +
+                  (Scalar(1) / Scalar(12)) * _tmp147 * _tmp258 + _tmp248 + _tmp258 +
+                  (Scalar(1) / Scalar(4)) * _tmp283 + (Scalar(1) / Scalar(4)) * _tmp288 +
+                  (Scalar(1) / Scalar(4)) * _tmp289 + (Scalar(1) / Scalar(3)) * _tmp301;
+    _cov(15, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp291 + (Scalar(1) / Scalar(4)) * _tmp110 * _tmp303 +
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp304 +
+        (Scalar(1) / Scalar(12)) * _tmp117 * _tmp179 + (Scalar(1) / Scalar(4)) * _tmp119 * _tmp174 +
+        (Scalar(1) / Scalar(12)) * _tmp121 * _tmp178 + _tmp178 +
+        (Scalar(1) / Scalar(12)) * _tmp222 + (Scalar(1) / Scalar(12)) * _tmp223 +
+        (Scalar(1) / Scalar(4)) * _tmp224;
+    _cov(16, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp179 +
+        (Scalar(1) / Scalar(12)) * _tmp118 * _tmp291 + (Scalar(1) / Scalar(4)) * _tmp119 * _tmp211 +
+        (Scalar(1) / Scalar(4)) * _tmp134 * _tmp303 + (Scalar(1) / Scalar(12)) * _tmp134 * _tmp304 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp212 + _tmp212 +
+        (Scalar(1) / Scalar(12)) * _tmp295 + (Scalar(1) / Scalar(4)) * _tmp296 +
+        (Scalar(1) / Scalar(12)) * _tmp297;
+    _cov(17, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp119 * _tmp304 + (Scalar(1) / Scalar(4)) * _tmp153 * _tmp303 +
+        (Scalar(1) / Scalar(12)) * _tmp157 * _tmp206 + (Scalar(1) / Scalar(12)) * _tmp180 +
+        _tmp206 + (Scalar(1) / Scalar(4)) * _tmp209 + (Scalar(1) / Scalar(4)) * _tmp215 +
+        (Scalar(1) / Scalar(12)) * _tmp293 + (Scalar(1) / Scalar(3)) * _tmp305;
+    _cov(18, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp254 + (Scalar(1) / Scalar(4)) * _tmp110 * _tmp306 +
+        (Scalar(1) / Scalar(12)) * _tmp114 * _tmp231 + (Scalar(1) / Scalar(4)) * _tmp114 * _tmp250 +
+        (Scalar(1) / Scalar(4)) * _tmp116 * _tmp266 + (Scalar(1) / Scalar(4)) * _tmp119 * _tmp260 +
+        (Scalar(1) / Scalar(12)) * _tmp126 * _tmp266 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp260 + _tmp260 + _tmp266 +
+        (Scalar(1) / Scalar(3)) * _tmp307;
+    _cov(19, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp119 * _tmp284 + (Scalar(1) / Scalar(4)) * _tmp123 * _tmp280 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp254 + (Scalar(1) / Scalar(4)) * _tmp134 * _tmp306 +
+        (Scalar(1) / Scalar(12)) * _tmp135 * _tmp248 + (Scalar(1) / Scalar(4)) * _tmp135 * _tmp302 +
+        (Scalar(1) / Scalar(12)) * _tmp143 * _tmp280 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp284 + _tmp280 + _tmp284 +
+        (Scalar(1) / Scalar(3)) * _tmp308;
+    _cov(20, 0) = (Scalar(1) / Scalar(4)) * _tmp151 * (_tmp244 + _tmp249) +
+                  (Scalar(1) / Scalar(4)) * _tmp153 * _tmp306 +
+                  (Scalar(1) / Scalar(12)) * _tmp157 * _tmp254 +
+                  (Scalar(1) / Scalar(12)) * _tmp158 * _tmp244 + _tmp244 + _tmp254 +
+                  (Scalar(1) / Scalar(4)) * _tmp278 + (Scalar(1) / Scalar(4)) * _tmp287 +
+                  (Scalar(1) / Scalar(4)) * _tmp289 + (Scalar(1) / Scalar(3)) * _tmp309;
+    _cov(21, 0) = (Scalar(1) / Scalar(12)) * _tmp117 * _tmp371 +
+                  (Scalar(1) / Scalar(4)) * _tmp121 * _tmp352 +
+                  (Scalar(1) / Scalar(12)) * _tmp122 * _tmp350 + _tmp350 +
+                  (Scalar(1) / Scalar(12)) * _tmp363 + (Scalar(1) / Scalar(4)) * _tmp364 +
+                  (Scalar(1) / Scalar(4)) * _tmp366 + (Scalar(1) / Scalar(12)) * _tmp373 +
+                  (Scalar(1) / Scalar(12)) * _tmp375;
+    _cov(22, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp100 * _tmp352 + (Scalar(1) / Scalar(12)) * _tmp100 * _tmp371 +
+        (Scalar(1) / Scalar(4)) * _tmp117 * _tmp355 + (Scalar(1) / Scalar(12)) * _tmp118 * _tmp374 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp372 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp354 + _tmp354 +
+        (Scalar(1) / Scalar(12)) * _tmp376 + (Scalar(1) / Scalar(12)) * _tmp378 +
+        (Scalar(1) / Scalar(4)) * _tmp379;
+    _cov(23, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp110 * _tmp352 + (Scalar(1) / Scalar(12)) * _tmp110 * _tmp371 +
+        (Scalar(1) / Scalar(4)) * _tmp117 * _tmp362 + (Scalar(1) / Scalar(12)) * _tmp119 * _tmp372 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp374 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp361 + _tmp361 +
+        (Scalar(1) / Scalar(12)) * _tmp380 + (Scalar(1) / Scalar(4)) * _tmp381 +
+        (Scalar(1) / Scalar(12)) * _tmp383;
+    _cov(24, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp121 * _tmp422 + (Scalar(1) / Scalar(12)) * _tmp122 * _tmp411 +
+        (Scalar(1) / Scalar(4)) * _tmp126 * _tmp430 + (Scalar(1) / Scalar(12)) * _tmp127 * _tmp388 +
+        _tmp388 + (Scalar(1) / Scalar(4)) * _tmp389 + _tmp411 + (Scalar(1) / Scalar(4)) * _tmp412 +
+        (Scalar(1) / Scalar(3)) * _tmp446 + (Scalar(1) / Scalar(4)) * _tmp460;
+    _cov(25, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp100 * _tmp461 + (Scalar(1) / Scalar(4)) * _tmp104 * _tmp430 +
+        (Scalar(1) / Scalar(4)) * _tmp116 * _tmp434 + (Scalar(1) / Scalar(4)) * _tmp118 * _tmp437 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp437 + _tmp434 + _tmp437 +
+        (Scalar(1) / Scalar(3)) * _tmp465 + (Scalar(1) / Scalar(12)) * _tmp466 +
+        (Scalar(1) / Scalar(12)) * _tmp467 + (Scalar(1) / Scalar(12)) * _tmp468;
+    _cov(26, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp110 * _tmp474 + (Scalar(1) / Scalar(4)) * _tmp114 * _tmp430 +
+        (Scalar(1) / Scalar(4)) * _tmp116 * _tmp440 + (Scalar(1) / Scalar(4)) * _tmp119 * _tmp443 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp443 + _tmp440 + _tmp443 +
+        (Scalar(1) / Scalar(4)) * _tmp469 + (Scalar(1) / Scalar(4)) * _tmp470 +
+        (Scalar(1) / Scalar(4)) * _tmp471 + (Scalar(1) / Scalar(4)) * _tmp472 +
+        (Scalar(1) / Scalar(4)) * _tmp473 + (Scalar(1) / Scalar(3)) * _tmp475 +
+        (Scalar(1) / Scalar(12)) * _tmp477;
+    _cov(27, 0) = (Scalar(1) / Scalar(4)) * _tmp121 * (_tmp496 + _tmp501) +
+                  (Scalar(1) / Scalar(12)) * _tmp122 * _tmp496 +
+                  (Scalar(1) / Scalar(4)) * _tmp126 * _tmp485 +
+                  (Scalar(1) / Scalar(12)) * _tmp127 * _tmp483 + _tmp483 + _tmp496 +
+                  (Scalar(1) / Scalar(12)) * _tmp508 + (Scalar(1) / Scalar(4)) * _tmp509 +
+                  (Scalar(1) / Scalar(12)) * _tmp514 + (Scalar(1) / Scalar(4)) * _tmp515 +
+                  (Scalar(1) / Scalar(4)) * _tmp524;
+    _cov(28, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp525 + (Scalar(1) / Scalar(4)) * _tmp100 * _tmp527 +
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp526 +
+        (Scalar(1) / Scalar(12)) * _tmp117 * _tmp374 + (Scalar(1) / Scalar(4)) * _tmp118 * _tmp354 +
+        (Scalar(1) / Scalar(12)) * _tmp121 * _tmp355 + _tmp355 +
+        (Scalar(1) / Scalar(12)) * _tmp377 + (Scalar(1) / Scalar(4)) * _tmp378 +
+        (Scalar(1) / Scalar(12)) * _tmp379;
+    _cov(29, 0) = (Scalar(1) / Scalar(12)) * _tmp118 * _tmp525 +
+                  (Scalar(1) / Scalar(4)) * _tmp145 * _tmp527 +
+                  (Scalar(1) / Scalar(12)) * _tmp147 * _tmp336 + _tmp336 +
+                  (Scalar(1) / Scalar(12)) * _tmp359 + (Scalar(1) / Scalar(4)) * _tmp360 +
+                  (Scalar(1) / Scalar(4)) * _tmp366 + (Scalar(1) / Scalar(12)) * _tmp375 +
+                  (Scalar(1) / Scalar(12)) * _tmp528;
+    _cov(30, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp374 + (Scalar(1) / Scalar(4)) * _tmp118 * _tmp357 +
+        (Scalar(1) / Scalar(12)) * _tmp119 * _tmp526 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp525 + (Scalar(1) / Scalar(4)) * _tmp134 * _tmp527 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp358 + _tmp358 +
+        (Scalar(1) / Scalar(12)) * _tmp529 + (Scalar(1) / Scalar(4)) * _tmp530 +
+        (Scalar(1) / Scalar(12)) * _tmp532;
+    _cov(31, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp100 * _tmp422 + (Scalar(1) / Scalar(4)) * _tmp104 * _tmp534 +
+        (Scalar(1) / Scalar(4)) * _tmp117 * _tmp436 + (Scalar(1) / Scalar(12)) * _tmp121 * _tmp436 +
+        (Scalar(1) / Scalar(4)) * _tmp123 * _tmp434 + _tmp434 + _tmp436 +
+        (Scalar(1) / Scalar(4)) * _tmp462 + (Scalar(1) / Scalar(4)) * _tmp463 +
+        (Scalar(1) / Scalar(12)) * _tmp464 + (Scalar(1) / Scalar(3)) * _tmp533;
+    _cov(32, 0) = (Scalar(1) / Scalar(4)) * _tmp143 * _tmp534 +
+                  (Scalar(1) / Scalar(4)) * _tmp145 * _tmp461 +
+                  (Scalar(1) / Scalar(12)) * _tmp146 * _tmp428 +
+                  (Scalar(1) / Scalar(12)) * _tmp147 * _tmp416 + _tmp416 + _tmp428 +
+                  (Scalar(1) / Scalar(12)) * _tmp451 + (Scalar(1) / Scalar(4)) * _tmp452 +
+                  (Scalar(1) / Scalar(12)) * _tmp458 + (Scalar(1) / Scalar(4)) * _tmp459 +
+                  (Scalar(1) / Scalar(4)) * _tmp460;
+    _cov(33, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp119 * _tmp449 + (Scalar(1) / Scalar(4)) * _tmp123 * _tmp456 +
+        (Scalar(1) / Scalar(4)) * _tmp134 * _tmp474 + (Scalar(1) / Scalar(4)) * _tmp135 * _tmp534 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp449 + _tmp449 + _tmp456 +
+        (Scalar(1) / Scalar(3)) * _tmp537 + (Scalar(1) / Scalar(12)) * _tmp538;
+    _cov(34, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp500 + (Scalar(1) / Scalar(4)) * _tmp100 * _tmp539 +
+        (Scalar(1) / Scalar(12)) * _tmp104 * _tmp483 + (Scalar(1) / Scalar(4)) * _tmp104 * _tmp485 +
+        (Scalar(1) / Scalar(4)) * _tmp116 * _tmp506 + (Scalar(1) / Scalar(4)) * _tmp118 * _tmp512 +
+        (Scalar(1) / Scalar(12)) * _tmp126 * _tmp506 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp512 + _tmp506 + _tmp512 +
+        (Scalar(1) / Scalar(3)) * _tmp540;
+    _cov(35, 0) = (Scalar(1) / Scalar(4)) * _tmp143 * _tmp541 +
+                  (Scalar(1) / Scalar(4)) * _tmp145 * _tmp539 +
+                  (Scalar(1) / Scalar(12)) * _tmp146 * _tmp482 +
+                  (Scalar(1) / Scalar(12)) * _tmp147 * _tmp500 + _tmp482 + _tmp500 +
+                  (Scalar(1) / Scalar(4)) * _tmp516 + (Scalar(1) / Scalar(4)) * _tmp520 +
+                  (Scalar(1) / Scalar(4)) * _tmp524 + (Scalar(1) / Scalar(3)) * _tmp543;
+    _cov(36, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp526 + (Scalar(1) / Scalar(4)) * _tmp110 * _tmp544 +
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp545 +
+        (Scalar(1) / Scalar(12)) * _tmp117 * _tmp372 + (Scalar(1) / Scalar(4)) * _tmp119 * _tmp361 +
+        (Scalar(1) / Scalar(12)) * _tmp121 * _tmp362 + _tmp362 +
+        (Scalar(1) / Scalar(12)) * _tmp381 + (Scalar(1) / Scalar(12)) * _tmp382 +
+        (Scalar(1) / Scalar(4)) * _tmp383;
+    _cov(37, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp100 * _tmp372 +
+        (Scalar(1) / Scalar(12)) * _tmp118 * _tmp526 + (Scalar(1) / Scalar(4)) * _tmp119 * _tmp358 +
+        (Scalar(1) / Scalar(4)) * _tmp134 * _tmp544 + (Scalar(1) / Scalar(12)) * _tmp134 * _tmp545 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp357 + _tmp357 +
+        (Scalar(1) / Scalar(12)) * _tmp530 + (Scalar(1) / Scalar(12)) * _tmp531 +
+        (Scalar(1) / Scalar(4)) * _tmp532;
+    _cov(38, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp119 * _tmp545 + (Scalar(1) / Scalar(4)) * _tmp153 * _tmp544 +
+        (Scalar(1) / Scalar(12)) * _tmp157 * _tmp343 + _tmp343 + (Scalar(1) / Scalar(4)) * _tmp353 +
+        (Scalar(1) / Scalar(4)) * _tmp365 + (Scalar(1) / Scalar(12)) * _tmp373 +
+        (Scalar(1) / Scalar(12)) * _tmp528 + (Scalar(1) / Scalar(3)) * _tmp546;
+    _cov(39, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp110 * _tmp422 + (Scalar(1) / Scalar(4)) * _tmp114 * _tmp548 +
+        (Scalar(1) / Scalar(4)) * _tmp117 * _tmp442 + (Scalar(1) / Scalar(12)) * _tmp121 * _tmp442 +
+        (Scalar(1) / Scalar(4)) * _tmp124 * _tmp440 + _tmp440 + _tmp442 +
+        (Scalar(1) / Scalar(4)) * _tmp476 + (Scalar(1) / Scalar(12)) * _tmp477 +
+        (Scalar(1) / Scalar(3)) * _tmp547;
+    _cov(40, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp118 * _tmp448 + (Scalar(1) / Scalar(4)) * _tmp124 * _tmp456 +
+        (Scalar(1) / Scalar(4)) * _tmp134 * _tmp461 + (Scalar(1) / Scalar(4)) * _tmp135 * _tmp548 +
+        (Scalar(1) / Scalar(12)) * _tmp145 * _tmp448 + _tmp448 + _tmp456 +
+        (Scalar(1) / Scalar(4)) * _tmp535 + (Scalar(1) / Scalar(12)) * _tmp536 +
+        (Scalar(1) / Scalar(3)) * _tmp549;
+    _cov(41, 0) = (Scalar(1) / Scalar(4)) * _tmp151 * _tmp548 +
+                  (Scalar(1) / Scalar(4)) * _tmp153 * _tmp474 +
+                  (Scalar(1) / Scalar(12)) * _tmp157 * _tmp420 +
+                  (Scalar(1) / Scalar(12)) * _tmp158 * _tmp425 + _tmp420 + _tmp425 +
+                  (Scalar(1) / Scalar(12)) * _tmp445 + (Scalar(1) / Scalar(4)) * _tmp447 +
+                  (Scalar(1) / Scalar(4)) * _tmp453 + (Scalar(1) / Scalar(4)) * _tmp460 +
+                  (Scalar(1) / Scalar(3)) * _tmp550;
+    _cov(42, 0) =
+        (Scalar(1) / Scalar(12)) * _tmp110 * _tmp495 + (Scalar(1) / Scalar(4)) * _tmp110 * _tmp551 +
+        (Scalar(1) / Scalar(12)) * _tmp114 * _tmp483 + (Scalar(1) / Scalar(4)) * _tmp114 * _tmp485 +
+        (Scalar(1) / Scalar(4)) * _tmp116 * _tmp503 + (Scalar(1) / Scalar(4)) * _tmp119 * _tmp510 +
+        (Scalar(1) / Scalar(12)) * _tmp126 * _tmp503 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp510 + _tmp503 + _tmp510 +
+        (Scalar(1) / Scalar(3)) * _tmp552;
+    _cov(43, 0) =
+        (Scalar(1) / Scalar(4)) * _tmp119 * _tmp521 + (Scalar(1) / Scalar(4)) * _tmp123 * _tmp517 +
+        (Scalar(1) / Scalar(12)) * _tmp134 * _tmp495 + (Scalar(1) / Scalar(4)) * _tmp134 * _tmp551 +
+        (Scalar(1) / Scalar(12)) * _tmp135 * _tmp482 + (Scalar(1) / Scalar(4)) * _tmp135 * _tmp541 +
+        (Scalar(1) / Scalar(12)) * _tmp143 * _tmp517 +
+        (Scalar(1) / Scalar(12)) * _tmp153 * _tmp521 + _tmp517 + _tmp521 +
+        (Scalar(1) / Scalar(3)) * _tmp553;
+    _cov(44, 0) = (Scalar(1) / Scalar(4)) * _tmp151 * (_tmp481 + _tmp484) +
+                  (Scalar(1) / Scalar(4)) * _tmp153 * _tmp551 +
+                  (Scalar(1) / Scalar(12)) * _tmp157 * _tmp495 +
+                  (Scalar(1) / Scalar(12)) * _tmp158 * _tmp481 + _tmp481 + _tmp495 +
+                  (Scalar(1) / Scalar(4)) * _tmp519 + (Scalar(1) / Scalar(4)) * _tmp523 +
+                  (Scalar(1) / Scalar(4)) * _tmp524 + (Scalar(1) / Scalar(12)) * _tmp542 +
+                  (Scalar(1) / Scalar(3)) * _tmp554;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
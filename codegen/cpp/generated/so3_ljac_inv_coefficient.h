@@ -0,0 +1,51 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     phi: Matrix31
+ *
+ * Outputs:
+ *     output: Scalar
+ */
+template <typename Scalar>
+void So3LjacInvCoefficient(const Eigen::Matrix<Scalar, 3, 1>& phi, Scalar* const output = nullptr) {
+  // Total ops: 28
+
+  // Input arrays
+
+  // Intermediate terms (7)
+  const Scalar _tmp0 = std::pow(phi(0, 0), Scalar(2)) + std::pow(phi(1, 0), Scalar(2)) +
+                       std::pow(phi(2, 0), Scalar(2)) + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp1 = std::sqrt(_tmp0);
+  const Scalar _tmp2 = Scalar(0.050000000000000003) - _tmp1;
+  const Scalar _tmp3 = std::max<Scalar>(0, (((_tmp2) > 0) - ((_tmp2) < 0)));
+  const Scalar _tmp4 = _tmp1 + _tmp2 * _tmp3;
+  const Scalar _tmp5 = (Scalar(1) / Scalar(2)) * _tmp4;
+  const Scalar _tmp6 =
+      (-_tmp5 * std::cos(_tmp5) / std::sin(_tmp5) + 1) / std::pow(_tmp4, Scalar(2));
+
+  // Output terms (1)
+  if (output != nullptr) {
+    Scalar& _output = (*output);
+
+    _output =
+        _tmp3 * (Scalar(3.3068783068783071e-5) * std::pow(_tmp0, Scalar(2)) +
+                 Scalar(0.0013888888888888889) * _tmp0 - _tmp6 + Scalar(0.083333333333333329)) +
+        _tmp6;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
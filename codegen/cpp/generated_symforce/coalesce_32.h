@@ -0,0 +1,2972 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     imu_noise: Matrix61
+ *     samples: Matrix6_32
+ *     dt: Matrix32_1
+ *
+ * Outputs:
+ *     delta: Matrix10_1
+ *     cov: Matrix45_1
+ */
+template <typename Scalar>
+void Coalesce32(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+                const Eigen::Matrix<Scalar, 6, 32>& samples, const Eigen::Matrix<Scalar, 32, 1>& dt,
+                Eigen::Matrix<Scalar, 10, 1>* const delta = nullptr,
+                Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 7809
+
+  // Input arrays
+
+  // Intermediate terms (2100)
+  const Scalar _tmp0 = dt(31, 0) * samples(0, 31);
+  const Scalar _tmp1 = dt(30, 0) * samples(1, 30);
+  const Scalar _tmp2 = dt(29, 0) * samples(1, 29);
+  const Scalar _tmp3 = dt(28, 0) * samples(1, 28);
+  const Scalar _tmp4 = dt(27, 0) * samples(1, 27);
+  const Scalar _tmp5 = dt(26, 0) * samples(1, 26);
+  const Scalar _tmp6 = dt(25, 0) * samples(1, 25);
+  const Scalar _tmp7 = dt(24, 0) * samples(1, 24);
+  const Scalar _tmp8 = dt(23, 0) * samples(1, 23);
+  const Scalar _tmp9 = dt(22, 0) * samples(1, 22);
+  const Scalar _tmp10 = dt(21, 0) * samples(1, 21);
+  const Scalar _tmp11 = dt(20, 0) * samples(1, 20);
+  const Scalar _tmp12 = dt(19, 0) * samples(1, 19);
+  const Scalar _tmp13 = dt(18, 0) * samples(1, 18);
+  const Scalar _tmp14 = dt(17, 0) * samples(1, 17);
+  const Scalar _tmp15 = dt(16, 0) * samples(1, 16);
+  const Scalar _tmp16 = dt(15, 0) * samples(1, 15);
+  const Scalar _tmp17 = dt(14, 0) * samples(1, 14);
+  const Scalar _tmp18 = dt(13, 0) * samples(1, 13);
+  const Scalar _tmp19 = dt(12, 0) * samples(1, 12);
+  const Scalar _tmp20 = dt(11, 0) * samples(1, 11);
+  const Scalar _tmp21 = dt(10, 0) * samples(1, 10);
+  const Scalar _tmp22 = dt(9, 0) * samples(1, 9);
+  const Scalar _tmp23 = dt(8, 0) * samples(1, 8);
+  const Scalar _tmp24 = dt(7, 0) * samples(1, 7);
+  const Scalar _tmp25 = dt(6, 0) * samples(1, 6);
+  const Scalar _tmp26 = dt(5, 0) * samples(1, 5);
+  const Scalar _tmp27 = dt(4, 0) * samples(1, 4);
+  const Scalar _tmp28 = dt(3, 0) * samples(1, 3);
+  const Scalar _tmp29 = dt(2, 0) * samples(1, 2);
+  const Scalar _tmp30 = dt(1, 0) * samples(1, 1);
+  const Scalar _tmp31 = dt(0, 0) * samples(1, 0);
+  const Scalar _tmp32 = _tmp30 + _tmp31;
+  const Scalar _tmp33 = _tmp29 + _tmp32;
+  const Scalar _tmp34 = _tmp28 + _tmp33;
+  const Scalar _tmp35 = _tmp27 + _tmp34;
+  const Scalar _tmp36 = _tmp26 + _tmp35;
+  const Scalar _tmp37 = _tmp25 + _tmp36;
+  const Scalar _tmp38 = _tmp24 + _tmp37;
+  const Scalar _tmp39 = _tmp23 + _tmp38;
+  const Scalar _tmp40 = _tmp22 + _tmp39;
+  const Scalar _tmp41 = _tmp21 + _tmp40;
+  const Scalar _tmp42 = _tmp20 + _tmp41;
+  const Scalar _tmp43 = _tmp19 + _tmp42;
+  const Scalar _tmp44 = _tmp18 + _tmp43;
+  const Scalar _tmp45 = _tmp17 + _tmp44;
+  const Scalar _tmp46 = _tmp16 + _tmp45;
+  const Scalar _tmp47 = _tmp15 + _tmp46;
+  const Scalar _tmp48 = _tmp14 + _tmp47;
+  const Scalar _tmp49 = _tmp13 + _tmp48;
+  const Scalar _tmp50 = _tmp12 + _tmp49;
+  const Scalar _tmp51 = _tmp11 + _tmp50;
+  const Scalar _tmp52 = _tmp10 + _tmp51;
+  const Scalar _tmp53 = _tmp52 + _tmp9;
+  const Scalar _tmp54 = _tmp53 + _tmp8;
+  const Scalar _tmp55 = _tmp54 + _tmp7;
+  const Scalar _tmp56 = _tmp55 + _tmp6;
+  const Scalar _tmp57 = _tmp5 + _tmp56;
+  const Scalar _tmp58 = _tmp4 + _tmp57;
+  const Scalar _tmp59 = _tmp3 + _tmp58;
+  const Scalar _tmp60 = _tmp2 + _tmp59;
+  const Scalar _tmp61 = _tmp1 + _tmp60;
+  const Scalar _tmp62 = dt(31, 0) * samples(2, 31);
+  const Scalar _tmp63 = dt(30, 0) * samples(2, 30);
+  const Scalar _tmp64 = dt(29, 0) * samples(2, 29);
+  const Scalar _tmp65 = dt(28, 0) * samples(2, 28);
+  const Scalar _tmp66 = dt(27, 0) * samples(2, 27);
+  const Scalar _tmp67 = dt(26, 0) * samples(2, 26);
+  const Scalar _tmp68 = dt(25, 0) * samples(2, 25);
+  const Scalar _tmp69 = dt(24, 0) * samples(2, 24);
+  const Scalar _tmp70 = dt(23, 0) * samples(2, 23);
+  const Scalar _tmp71 = dt(22, 0) * samples(2, 22);
+  const Scalar _tmp72 = dt(21, 0) * samples(2, 21);
+  const Scalar _tmp73 = dt(20, 0) * samples(2, 20);
+  const Scalar _tmp74 = dt(19, 0) * samples(2, 19);
+  const Scalar _tmp75 = dt(18, 0) * samples(2, 18);
+  const Scalar _tmp76 = dt(17, 0) * samples(2, 17);
+  const Scalar _tmp77 = dt(16, 0) * samples(2, 16);
+  const Scalar _tmp78 = dt(15, 0) * samples(2, 15);
+  const Scalar _tmp79 = dt(14, 0) * samples(2, 14);
+  const Scalar _tmp80 = dt(13, 0) * samples(2, 13);
+  const Scalar _tmp81 = dt(12, 0) * samples(2, 12);
+  const Scalar _tmp82 = dt(11, 0) * samples(2, 11);
+  const Scalar _tmp83 = dt(10, 0) * samples(2, 10);
+  const Scalar _tmp84 = dt(9, 0) * samples(2, 9);
+  const Scalar _tmp85 = dt(8, 0) * samples(2, 8);
+  const Scalar _tmp86 = dt(7, 0) * samples(2, 7);
+  const Scalar _tmp87 = dt(6, 0) * samples(2, 6);
+  const Scalar _tmp88 = dt(5, 0) * samples(2, 5);
+  const Scalar _tmp89 = dt(4, 0) * samples(2, 4);
+  const Scalar _tmp90 = dt(3, 0) * samples(2, 3);
+  const Scalar _tmp91 = dt(2, 0) * samples(2, 2);
+  const Scalar _tmp92 = dt(0, 0) * samples(2, 0);
+  const Scalar _tmp93 = dt(1, 0) * samples(2, 1);
+  const Scalar _tmp94 = _tmp92 + _tmp93;
+  const Scalar _tmp95 = _tmp91 + _tmp94;
+  const Scalar _tmp96 = _tmp90 + _tmp95;
+  const Scalar _tmp97 = _tmp89 + _tmp96;
+  const Scalar _tmp98 = _tmp88 + _tmp97;
+  const Scalar _tmp99 = _tmp87 + _tmp98;
+  const Scalar _tmp100 = _tmp86 + _tmp99;
+  const Scalar _tmp101 = _tmp100 + _tmp85;
+  const Scalar _tmp102 = _tmp101 + _tmp84;
+  const Scalar _tmp103 = _tmp102 + _tmp83;
+  const Scalar _tmp104 = _tmp103 + _tmp82;
+  const Scalar _tmp105 = _tmp104 + _tmp81;
+  const Scalar _tmp106 = _tmp105 + _tmp80;
+  const Scalar _tmp107 = _tmp106 + _tmp79;
+  const Scalar _tmp108 = _tmp107 + _tmp78;
+  const Scalar _tmp109 = _tmp108 + _tmp77;
+  const Scalar _tmp110 = _tmp109 + _tmp76;
+  const Scalar _tmp111 = _tmp110 + _tmp75;
+  const Scalar _tmp112 = _tmp111 + _tmp74;
+  const Scalar _tmp113 = _tmp112 + _tmp73;
+  const Scalar _tmp114 = _tmp113 + _tmp72;
+  const Scalar _tmp115 = _tmp114 + _tmp71;
+  const Scalar _tmp116 = _tmp115 + _tmp70;
+  const Scalar _tmp117 = _tmp116 + _tmp69;
+  const Scalar _tmp118 = _tmp117 + _tmp68;
+  const Scalar _tmp119 = _tmp118 + _tmp67;
+  const Scalar _tmp120 = _tmp119 + _tmp66;
+  const Scalar _tmp121 = _tmp120 + _tmp65;
+  const Scalar _tmp122 = _tmp121 + _tmp64;
+  const Scalar _tmp123 = _tmp122 + _tmp63;
+  const Scalar _tmp124 = dt(31, 0) * samples(1, 31);
+  const Scalar _tmp125 = dt(30, 0) * samples(0, 30);
+  const Scalar _tmp126 = dt(29, 0) * samples(0, 29);
+  const Scalar _tmp127 = dt(28, 0) * samples(0, 28);
+  const Scalar _tmp128 = dt(27, 0) * samples(0, 27);
+  const Scalar _tmp129 = dt(26, 0) * samples(0, 26);
+  const Scalar _tmp130 = dt(25, 0) * samples(0, 25);
+  const Scalar _tmp131 = dt(24, 0) * samples(0, 24);
+  const Scalar _tmp132 = dt(23, 0) * samples(0, 23);
+  const Scalar _tmp133 = dt(22, 0) * samples(0, 22);
+  const Scalar _tmp134 = dt(21, 0) * samples(0, 21);
+  const Scalar _tmp135 = dt(20, 0) * samples(0, 20);
+  const Scalar _tmp136 = dt(19, 0) * samples(0, 19);
+  const Scalar _tmp137 = dt(18, 0) * samples(0, 18);
+  const Scalar _tmp138 = dt(17, 0) * samples(0, 17);
+  const Scalar _tmp139 = dt(16, 0) * samples(0, 16);
+  const Scalar _tmp140 = dt(15, 0) * samples(0, 15);
+  const Scalar _tmp141 = dt(14, 0) * samples(0, 14);
+  const Scalar _tmp142 = dt(13, 0) * samples(0, 13);
+  const Scalar _tmp143 = dt(12, 0) * samples(0, 12);
+  const Scalar _tmp144 = dt(11, 0) * samples(0, 11);
+  const Scalar _tmp145 = dt(10, 0) * samples(0, 10);
+  const Scalar _tmp146 = dt(9, 0) * samples(0, 9);
+  const Scalar _tmp147 = dt(8, 0) * samples(0, 8);
+  const Scalar _tmp148 = dt(7, 0) * samples(0, 7);
+  const Scalar _tmp149 = dt(6, 0) * samples(0, 6);
+  const Scalar _tmp150 = dt(5, 0) * samples(0, 5);
+  const Scalar _tmp151 = dt(4, 0) * samples(0, 4);
+  const Scalar _tmp152 = dt(3, 0) * samples(0, 3);
+  const Scalar _tmp153 = dt(2, 0) * samples(0, 2);
+  const Scalar _tmp154 = dt(0, 0) * samples(0, 0);
+  const Scalar _tmp155 = dt(1, 0) * samples(0, 1);
+  const Scalar _tmp156 = _tmp154 + _tmp155;
+  const Scalar _tmp157 =
+      _tmp156 - Scalar(1) / Scalar(2) * _tmp30 * _tmp92 + (Scalar(1) / Scalar(2)) * _tmp31 * _tmp93;
+  const Scalar _tmp158 = _tmp153 + _tmp157 - Scalar(1) / Scalar(2) * _tmp29 * _tmp94 +
+                         (Scalar(1) / Scalar(2)) * _tmp32 * _tmp91;
+  const Scalar _tmp159 = _tmp152 + _tmp158 - Scalar(1) / Scalar(2) * _tmp28 * _tmp95 +
+                         (Scalar(1) / Scalar(2)) * _tmp33 * _tmp90;
+  const Scalar _tmp160 = _tmp151 + _tmp159 - Scalar(1) / Scalar(2) * _tmp27 * _tmp96 +
+                         (Scalar(1) / Scalar(2)) * _tmp34 * _tmp89;
+  const Scalar _tmp161 = _tmp150 + _tmp160 - Scalar(1) / Scalar(2) * _tmp26 * _tmp97 +
+                         (Scalar(1) / Scalar(2)) * _tmp35 * _tmp88;
+  const Scalar _tmp162 = _tmp149 + _tmp161 - Scalar(1) / Scalar(2) * _tmp25 * _tmp98 +
+                         (Scalar(1) / Scalar(2)) * _tmp36 * _tmp87;
+  const Scalar _tmp163 = _tmp148 + _tmp162 - Scalar(1) / Scalar(2) * _tmp24 * _tmp99 +
+                         (Scalar(1) / Scalar(2)) * _tmp37 * _tmp86;
+  const Scalar _tmp164 = -Scalar(1) / Scalar(2) * _tmp100 * _tmp23 + _tmp147 + _tmp163 +
+                         (Scalar(1) / Scalar(2)) * _tmp38 * _tmp85;
+  const Scalar _tmp165 = -Scalar(1) / Scalar(2) * _tmp101 * _tmp22 + _tmp146 + _tmp164 +
+                         (Scalar(1) / Scalar(2)) * _tmp39 * _tmp84;
+  const Scalar _tmp166 = -Scalar(1) / Scalar(2) * _tmp102 * _tmp21 + _tmp145 + _tmp165 +
+                         (Scalar(1) / Scalar(2)) * _tmp40 * _tmp83;
+  const Scalar _tmp167 = -Scalar(1) / Scalar(2) * _tmp103 * _tmp20 + _tmp144 + _tmp166 +
+                         (Scalar(1) / Scalar(2)) * _tmp41 * _tmp82;
+  const Scalar _tmp168 = -Scalar(1) / Scalar(2) * _tmp104 * _tmp19 + _tmp143 + _tmp167 +
+                         (Scalar(1) / Scalar(2)) * _tmp42 * _tmp81;
+  const Scalar _tmp169 = -Scalar(1) / Scalar(2) * _tmp105 * _tmp18 + _tmp142 + _tmp168 +
+                         (Scalar(1) / Scalar(2)) * _tmp43 * _tmp80;
+  const Scalar _tmp170 = -Scalar(1) / Scalar(2) * _tmp106 * _tmp17 + _tmp141 + _tmp169 +
+                         (Scalar(1) / Scalar(2)) * _tmp44 * _tmp79;
+  const Scalar _tmp171 = -Scalar(1) / Scalar(2) * _tmp107 * _tmp16 + _tmp140 + _tmp170 +
+                         (Scalar(1) / Scalar(2)) * _tmp45 * _tmp78;
+  const Scalar _tmp172 = -Scalar(1) / Scalar(2) * _tmp108 * _tmp15 + _tmp139 + _tmp171 +
+                         (Scalar(1) / Scalar(2)) * _tmp46 * _tmp77;
+  const Scalar _tmp173 = -Scalar(1) / Scalar(2) * _tmp109 * _tmp14 + _tmp138 + _tmp172 +
+                         (Scalar(1) / Scalar(2)) * _tmp47 * _tmp76;
+  const Scalar _tmp174 = -Scalar(1) / Scalar(2) * _tmp110 * _tmp13 + _tmp137 + _tmp173 +
+                         (Scalar(1) / Scalar(2)) * _tmp48 * _tmp75;
+  const Scalar _tmp175 = -Scalar(1) / Scalar(2) * _tmp111 * _tmp12 + _tmp136 + _tmp174 +
+                         (Scalar(1) / Scalar(2)) * _tmp49 * _tmp74;
+  const Scalar _tmp176 = -Scalar(1) / Scalar(2) * _tmp11 * _tmp112 + _tmp135 + _tmp175 +
+                         (Scalar(1) / Scalar(2)) * _tmp50 * _tmp73;
+  const Scalar _tmp177 = -Scalar(1) / Scalar(2) * _tmp10 * _tmp113 + _tmp134 + _tmp176 +
+                         (Scalar(1) / Scalar(2)) * _tmp51 * _tmp72;
+  const Scalar _tmp178 = -Scalar(1) / Scalar(2) * _tmp114 * _tmp9 + _tmp133 + _tmp177 +
+                         (Scalar(1) / Scalar(2)) * _tmp52 * _tmp71;
+  const Scalar _tmp179 = -Scalar(1) / Scalar(2) * _tmp115 * _tmp8 + _tmp132 + _tmp178 +
+                         (Scalar(1) / Scalar(2)) * _tmp53 * _tmp70;
+  const Scalar _tmp180 = -Scalar(1) / Scalar(2) * _tmp116 * _tmp7 + _tmp131 + _tmp179 +
+                         (Scalar(1) / Scalar(2)) * _tmp54 * _tmp69;
+  const Scalar _tmp181 = -Scalar(1) / Scalar(2) * _tmp117 * _tmp6 + _tmp130 + _tmp180 +
+                         (Scalar(1) / Scalar(2)) * _tmp55 * _tmp68;
+  const Scalar _tmp182 = -Scalar(1) / Scalar(2) * _tmp118 * _tmp5 + _tmp129 + _tmp181 +
+                         (Scalar(1) / Scalar(2)) * _tmp56 * _tmp67;
+  const Scalar _tmp183 = -Scalar(1) / Scalar(2) * _tmp119 * _tmp4 + _tmp128 + _tmp182 +
+                         (Scalar(1) / Scalar(2)) * _tmp57 * _tmp66;
+  const Scalar _tmp184 = -Scalar(1) / Scalar(2) * _tmp120 * _tmp3 + _tmp127 + _tmp183 +
+                         (Scalar(1) / Scalar(2)) * _tmp58 * _tmp65;
+  const Scalar _tmp185 = -Scalar(1) / Scalar(2) * _tmp121 * _tmp2 + _tmp126 + _tmp184 +
+                         (Scalar(1) / Scalar(2)) * _tmp59 * _tmp64;
+  const Scalar _tmp186 = -Scalar(1) / Scalar(2) * _tmp1 * _tmp122 + _tmp125 + _tmp185 +
+                         (Scalar(1) / Scalar(2)) * _tmp60 * _tmp63;
+  const Scalar _tmp187 = _tmp0 - Scalar(1) / Scalar(2) * _tmp123 * _tmp124 + _tmp186 +
+                         (Scalar(1) / Scalar(2)) * _tmp61 * _tmp62;
+  const Scalar _tmp188 = std::pow(_tmp187, Scalar(2));
+  const Scalar _tmp189 = _tmp153 + _tmp156;
+  const Scalar _tmp190 = _tmp152 + _tmp189;
+  const Scalar _tmp191 = _tmp151 + _tmp190;
+  const Scalar _tmp192 = _tmp150 + _tmp191;
+  const Scalar _tmp193 = _tmp149 + _tmp192;
+  const Scalar _tmp194 = _tmp148 + _tmp193;
+  const Scalar _tmp195 = _tmp147 + _tmp194;
+  const Scalar _tmp196 = _tmp146 + _tmp195;
+  const Scalar _tmp197 = _tmp145 + _tmp196;
+  const Scalar _tmp198 = _tmp144 + _tmp197;
+  const Scalar _tmp199 = _tmp143 + _tmp198;
+  const Scalar _tmp200 = _tmp142 + _tmp199;
+  const Scalar _tmp201 = _tmp141 + _tmp200;
+  const Scalar _tmp202 = _tmp140 + _tmp201;
+  const Scalar _tmp203 = _tmp139 + _tmp202;
+  const Scalar _tmp204 = _tmp138 + _tmp203;
+  const Scalar _tmp205 = _tmp137 + _tmp204;
+  const Scalar _tmp206 = _tmp136 + _tmp205;
+  const Scalar _tmp207 = _tmp135 + _tmp206;
+  const Scalar _tmp208 = _tmp134 + _tmp207;
+  const Scalar _tmp209 = _tmp133 + _tmp208;
+  const Scalar _tmp210 = _tmp132 + _tmp209;
+  const Scalar _tmp211 = _tmp131 + _tmp210;
+  const Scalar _tmp212 = _tmp130 + _tmp211;
+  const Scalar _tmp213 = _tmp129 + _tmp212;
+  const Scalar _tmp214 = _tmp128 + _tmp213;
+  const Scalar _tmp215 = _tmp127 + _tmp214;
+  const Scalar _tmp216 = _tmp126 + _tmp215;
+  const Scalar _tmp217 = _tmp125 + _tmp216;
+  const Scalar _tmp218 =
+      -Scalar(1) / Scalar(2) * _tmp154 * _tmp93 + (Scalar(1) / Scalar(2)) * _tmp155 * _tmp92;
+  const Scalar _tmp219 = (Scalar(1) / Scalar(2)) * _tmp153 * _tmp94 -
+                         Scalar(1) / Scalar(2) * _tmp156 * _tmp91 + _tmp218;
+  const Scalar _tmp220 = (Scalar(1) / Scalar(2)) * _tmp152 * _tmp95 -
+                         Scalar(1) / Scalar(2) * _tmp189 * _tmp90 + _tmp219;
+  const Scalar _tmp221 = (Scalar(1) / Scalar(2)) * _tmp151 * _tmp96 -
+                         Scalar(1) / Scalar(2) * _tmp190 * _tmp89 + _tmp220;
+  const Scalar _tmp222 = (Scalar(1) / Scalar(2)) * _tmp150 * _tmp97 -
+                         Scalar(1) / Scalar(2) * _tmp191 * _tmp88 + _tmp221;
+  const Scalar _tmp223 = (Scalar(1) / Scalar(2)) * _tmp149 * _tmp98 -
+                         Scalar(1) / Scalar(2) * _tmp192 * _tmp87 + _tmp222;
+  const Scalar _tmp224 = (Scalar(1) / Scalar(2)) * _tmp148 * _tmp99 -
+                         Scalar(1) / Scalar(2) * _tmp193 * _tmp86 + _tmp223;
+  const Scalar _tmp225 = (Scalar(1) / Scalar(2)) * _tmp100 * _tmp147 -
+                         Scalar(1) / Scalar(2) * _tmp194 * _tmp85 + _tmp224;
+  const Scalar _tmp226 = (Scalar(1) / Scalar(2)) * _tmp101 * _tmp146 -
+                         Scalar(1) / Scalar(2) * _tmp195 * _tmp84 + _tmp225;
+  const Scalar _tmp227 = (Scalar(1) / Scalar(2)) * _tmp102 * _tmp145 -
+                         Scalar(1) / Scalar(2) * _tmp196 * _tmp83 + _tmp226;
+  const Scalar _tmp228 = (Scalar(1) / Scalar(2)) * _tmp103 * _tmp144 -
+                         Scalar(1) / Scalar(2) * _tmp197 * _tmp82 + _tmp227;
+  const Scalar _tmp229 = (Scalar(1) / Scalar(2)) * _tmp104 * _tmp143 -
+                         Scalar(1) / Scalar(2) * _tmp198 * _tmp81 + _tmp228;
+  const Scalar _tmp230 = (Scalar(1) / Scalar(2)) * _tmp105 * _tmp142 -
+                         Scalar(1) / Scalar(2) * _tmp199 * _tmp80 + _tmp229;
+  const Scalar _tmp231 = (Scalar(1) / Scalar(2)) * _tmp106 * _tmp141 -
+                         Scalar(1) / Scalar(2) * _tmp200 * _tmp79 + _tmp230;
+  const Scalar _tmp232 = (Scalar(1) / Scalar(2)) * _tmp107 * _tmp140 -
+                         Scalar(1) / Scalar(2) * _tmp201 * _tmp78 + _tmp231;
+  const Scalar _tmp233 = (Scalar(1) / Scalar(2)) * _tmp108 * _tmp139 -
+                         Scalar(1) / Scalar(2) * _tmp202 * _tmp77 + _tmp232;
+  const Scalar _tmp234 = (Scalar(1) / Scalar(2)) * _tmp109 * _tmp138 -
+                         Scalar(1) / Scalar(2) * _tmp203 * _tmp76 + _tmp233;
+  const Scalar _tmp235 = (Scalar(1) / Scalar(2)) * _tmp110 * _tmp137 -
+                         Scalar(1) / Scalar(2) * _tmp204 * _tmp75 + _tmp234;
+  const Scalar _tmp236 = (Scalar(1) / Scalar(2)) * _tmp111 * _tmp136 -
+                         Scalar(1) / Scalar(2) * _tmp205 * _tmp74 + _tmp235;
+  const Scalar _tmp237 = (Scalar(1) / Scalar(2)) * _tmp112 * _tmp135 -
+                         Scalar(1) / Scalar(2) * _tmp206 * _tmp73 + _tmp236;
+  const Scalar _tmp238 = (Scalar(1) / Scalar(2)) * _tmp113 * _tmp134 -
+                         Scalar(1) / Scalar(2) * _tmp207 * _tmp72 + _tmp237;
+  const Scalar _tmp239 = (Scalar(1) / Scalar(2)) * _tmp114 * _tmp133 -
+                         Scalar(1) / Scalar(2) * _tmp208 * _tmp71 + _tmp238;
+  const Scalar _tmp240 = (Scalar(1) / Scalar(2)) * _tmp115 * _tmp132 -
+                         Scalar(1) / Scalar(2) * _tmp209 * _tmp70 + _tmp239;
+  const Scalar _tmp241 = (Scalar(1) / Scalar(2)) * _tmp116 * _tmp131 -
+                         Scalar(1) / Scalar(2) * _tmp210 * _tmp69 + _tmp240;
+  const Scalar _tmp242 = (Scalar(1) / Scalar(2)) * _tmp117 * _tmp130 -
+                         Scalar(1) / Scalar(2) * _tmp211 * _tmp68 + _tmp241;
+  const Scalar _tmp243 = (Scalar(1) / Scalar(2)) * _tmp118 * _tmp129 -
+                         Scalar(1) / Scalar(2) * _tmp212 * _tmp67 + _tmp242;
+  const Scalar _tmp244 = (Scalar(1) / Scalar(2)) * _tmp119 * _tmp128 -
+                         Scalar(1) / Scalar(2) * _tmp213 * _tmp66 + _tmp243;
+  const Scalar _tmp245 = (Scalar(1) / Scalar(2)) * _tmp120 * _tmp127 -
+                         Scalar(1) / Scalar(2) * _tmp214 * _tmp65 + _tmp244;
+  const Scalar _tmp246 = (Scalar(1) / Scalar(2)) * _tmp121 * _tmp126 -
+                         Scalar(1) / Scalar(2) * _tmp215 * _tmp64 + _tmp245;
+  const Scalar _tmp247 = (Scalar(1) / Scalar(2)) * _tmp122 * _tmp125 -
+                         Scalar(1) / Scalar(2) * _tmp216 * _tmp63 + _tmp246 + _tmp61;
+  const Scalar _tmp248 = (Scalar(1) / Scalar(2)) * _tmp0 * _tmp123 + _tmp124 -
+                         Scalar(1) / Scalar(2) * _tmp217 * _tmp62 + _tmp247;
+  const Scalar _tmp249 = std::pow(_tmp248, Scalar(2));
+  const Scalar _tmp250 = (Scalar(1) / Scalar(2)) * _tmp154 * _tmp30 -
+                         Scalar(1) / Scalar(2) * _tmp155 * _tmp31 + _tmp94;
+  const Scalar _tmp251 = -Scalar(1) / Scalar(2) * _tmp153 * _tmp32 +
+                         (Scalar(1) / Scalar(2)) * _tmp156 * _tmp29 + _tmp250 + _tmp91;
+  const Scalar _tmp252 = -Scalar(1) / Scalar(2) * _tmp152 * _tmp33 +
+                         (Scalar(1) / Scalar(2)) * _tmp189 * _tmp28 + _tmp251 + _tmp90;
+  const Scalar _tmp253 = -Scalar(1) / Scalar(2) * _tmp151 * _tmp34 +
+                         (Scalar(1) / Scalar(2)) * _tmp190 * _tmp27 + _tmp252 + _tmp89;
+  const Scalar _tmp254 = -Scalar(1) / Scalar(2) * _tmp150 * _tmp35 +
+                         (Scalar(1) / Scalar(2)) * _tmp191 * _tmp26 + _tmp253 + _tmp88;
+  const Scalar _tmp255 = -Scalar(1) / Scalar(2) * _tmp149 * _tmp36 +
+                         (Scalar(1) / Scalar(2)) * _tmp192 * _tmp25 + _tmp254 + _tmp87;
+  const Scalar _tmp256 = -Scalar(1) / Scalar(2) * _tmp148 * _tmp37 +
+                         (Scalar(1) / Scalar(2)) * _tmp193 * _tmp24 + _tmp255 + _tmp86;
+  const Scalar _tmp257 = -Scalar(1) / Scalar(2) * _tmp147 * _tmp38 +
+                         (Scalar(1) / Scalar(2)) * _tmp194 * _tmp23 + _tmp256 + _tmp85;
+  const Scalar _tmp258 = -Scalar(1) / Scalar(2) * _tmp146 * _tmp39 +
+                         (Scalar(1) / Scalar(2)) * _tmp195 * _tmp22 + _tmp257 + _tmp84;
+  const Scalar _tmp259 = -Scalar(1) / Scalar(2) * _tmp145 * _tmp40 +
+                         (Scalar(1) / Scalar(2)) * _tmp196 * _tmp21 + _tmp258 + _tmp83;
+  const Scalar _tmp260 = -Scalar(1) / Scalar(2) * _tmp144 * _tmp41 +
+                         (Scalar(1) / Scalar(2)) * _tmp197 * _tmp20 + _tmp259 + _tmp82;
+  const Scalar _tmp261 = -Scalar(1) / Scalar(2) * _tmp143 * _tmp42 +
+                         (Scalar(1) / Scalar(2)) * _tmp19 * _tmp198 + _tmp260 + _tmp81;
+  const Scalar _tmp262 = -Scalar(1) / Scalar(2) * _tmp142 * _tmp43 +
+                         (Scalar(1) / Scalar(2)) * _tmp18 * _tmp199 + _tmp261 + _tmp80;
+  const Scalar _tmp263 = -Scalar(1) / Scalar(2) * _tmp141 * _tmp44 +
+                         (Scalar(1) / Scalar(2)) * _tmp17 * _tmp200 + _tmp262 + _tmp79;
+  const Scalar _tmp264 = -Scalar(1) / Scalar(2) * _tmp140 * _tmp45 +
+                         (Scalar(1) / Scalar(2)) * _tmp16 * _tmp201 + _tmp263 + _tmp78;
+  const Scalar _tmp265 = -Scalar(1) / Scalar(2) * _tmp139 * _tmp46 +
+                         (Scalar(1) / Scalar(2)) * _tmp15 * _tmp202 + _tmp264 + _tmp77;
+  const Scalar _tmp266 = -Scalar(1) / Scalar(2) * _tmp138 * _tmp47 +
+                         (Scalar(1) / Scalar(2)) * _tmp14 * _tmp203 + _tmp265 + _tmp76;
+  const Scalar _tmp267 = (Scalar(1) / Scalar(2)) * _tmp13 * _tmp204 -
+                         Scalar(1) / Scalar(2) * _tmp137 * _tmp48 + _tmp266 + _tmp75;
+  const Scalar _tmp268 = (Scalar(1) / Scalar(2)) * _tmp12 * _tmp205 -
+                         Scalar(1) / Scalar(2) * _tmp136 * _tmp49 + _tmp267 + _tmp74;
+  const Scalar _tmp269 = (Scalar(1) / Scalar(2)) * _tmp11 * _tmp206 -
+                         Scalar(1) / Scalar(2) * _tmp135 * _tmp50 + _tmp268 + _tmp73;
+  const Scalar _tmp270 = (Scalar(1) / Scalar(2)) * _tmp10 * _tmp207 -
+                         Scalar(1) / Scalar(2) * _tmp134 * _tmp51 + _tmp269 + _tmp72;
+  const Scalar _tmp271 = -Scalar(1) / Scalar(2) * _tmp133 * _tmp52 +
+                         (Scalar(1) / Scalar(2)) * _tmp208 * _tmp9 + _tmp270 + _tmp71;
+  const Scalar _tmp272 = -Scalar(1) / Scalar(2) * _tmp132 * _tmp53 +
+                         (Scalar(1) / Scalar(2)) * _tmp209 * _tmp8 + _tmp271 + _tmp70;
+  const Scalar _tmp273 = -Scalar(1) / Scalar(2) * _tmp131 * _tmp54 +
+                         (Scalar(1) / Scalar(2)) * _tmp210 * _tmp7 + _tmp272 + _tmp69;
+  const Scalar _tmp274 = -Scalar(1) / Scalar(2) * _tmp130 * _tmp55 +
+                         (Scalar(1) / Scalar(2)) * _tmp211 * _tmp6 + _tmp273 + _tmp68;
+  const Scalar _tmp275 = -Scalar(1) / Scalar(2) * _tmp129 * _tmp56 +
+                         (Scalar(1) / Scalar(2)) * _tmp212 * _tmp5 + _tmp274 + _tmp67;
+  const Scalar _tmp276 = -Scalar(1) / Scalar(2) * _tmp128 * _tmp57 +
+                         (Scalar(1) / Scalar(2)) * _tmp213 * _tmp4 + _tmp275 + _tmp66;
+  const Scalar _tmp277 = -Scalar(1) / Scalar(2) * _tmp127 * _tmp58 +
+                         (Scalar(1) / Scalar(2)) * _tmp214 * _tmp3 + _tmp276 + _tmp65;
+  const Scalar _tmp278 = -Scalar(1) / Scalar(2) * _tmp126 * _tmp59 +
+                         (Scalar(1) / Scalar(2)) * _tmp2 * _tmp215 + _tmp277 + _tmp64;
+  const Scalar _tmp279 = (Scalar(1) / Scalar(2)) * _tmp1 * _tmp216 -
+                         Scalar(1) / Scalar(2) * _tmp125 * _tmp60 + _tmp278 + _tmp63;
+  const Scalar _tmp280 = -Scalar(1) / Scalar(2) * _tmp0 * _tmp61 +
+                         (Scalar(1) / Scalar(2)) * _tmp124 * _tmp217 + _tmp279 + _tmp62;
+  const Scalar _tmp281 = std::pow(_tmp280, Scalar(2));
+  const Scalar _tmp282 = _tmp188 + _tmp249 + _tmp281 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp283 = std::sqrt(_tmp282);
+  const Scalar _tmp284 = (Scalar(1) / Scalar(2)) * _tmp283;
+  const Scalar _tmp285 = std::sin(_tmp284);
+  const Scalar _tmp286 = _tmp285 / _tmp283;
+  const Scalar _tmp287 = _tmp187 * _tmp286;
+  const Scalar _tmp288 = _tmp248 * _tmp286;
+  const Scalar _tmp289 = _tmp280 * _tmp286;
+  const Scalar _tmp290 = std::cos(_tmp284);
+  const Scalar _tmp291 = -std::pow(_tmp247, Scalar(2));
+  const Scalar _tmp292 = -std::pow(_tmp279, Scalar(2));
+  const Scalar _tmp293 = (Scalar(1) / Scalar(2)) * _tmp291 + (Scalar(1) / Scalar(2)) * _tmp292 + 1;
+  const Scalar _tmp294 = std::pow(dt(31, 0), Scalar(2));
+  const Scalar _tmp295 = _tmp294 * samples(0, 31);
+  const Scalar _tmp296 = _tmp294 * samples(1, 31);
+  const Scalar _tmp297 = _tmp295 * samples(4, 31) - _tmp296 * samples(3, 31);
+  const Scalar _tmp298 = _tmp294 * samples(2, 31);
+  const Scalar _tmp299 = -_tmp295 * samples(5, 31) + _tmp298 * samples(3, 31);
+  const Scalar _tmp300 = _tmp296 * samples(5, 31) - _tmp298 * samples(4, 31);
+  const Scalar _tmp301 = (Scalar(1) / Scalar(2)) * _tmp124 * _tmp297 -
+                         Scalar(1) / Scalar(2) * _tmp299 * _tmp62 + _tmp300;
+  const Scalar _tmp302 = (Scalar(1) / Scalar(2)) * dt(31, 0);
+  const Scalar _tmp303 = _tmp301 * _tmp302 + dt(31, 0) * samples(3, 31);
+  const Scalar _tmp304 = (Scalar(1) / Scalar(2)) * _tmp186 * _tmp247;
+  const Scalar _tmp305 = -_tmp279 + _tmp304;
+  const Scalar _tmp306 = -Scalar(1) / Scalar(2) * _tmp0 * _tmp297 + _tmp299 +
+                         (Scalar(1) / Scalar(2)) * _tmp300 * _tmp62;
+  const Scalar _tmp307 = _tmp302 * _tmp306 + dt(31, 0) * samples(4, 31);
+  const Scalar _tmp308 = (Scalar(1) / Scalar(2)) * _tmp0 * _tmp299 -
+                         Scalar(1) / Scalar(2) * _tmp124 * _tmp300 + _tmp297;
+  const Scalar _tmp309 = _tmp302 * _tmp308 + dt(31, 0) * samples(5, 31);
+  const Scalar _tmp310 = (Scalar(1) / Scalar(2)) * _tmp279;
+  const Scalar _tmp311 = _tmp186 * _tmp310;
+  const Scalar _tmp312 = _tmp247 + _tmp311;
+  const Scalar _tmp313 = std::pow(dt(30, 0), Scalar(2));
+  const Scalar _tmp314 = _tmp313 * samples(0, 30);
+  const Scalar _tmp315 = _tmp313 * samples(1, 30);
+  const Scalar _tmp316 = _tmp314 * samples(4, 30) - _tmp315 * samples(3, 30);
+  const Scalar _tmp317 = _tmp313 * samples(2, 30);
+  const Scalar _tmp318 = -_tmp314 * samples(5, 30) + _tmp317 * samples(3, 30);
+  const Scalar _tmp319 = _tmp315 * samples(5, 30) - _tmp317 * samples(4, 30);
+  const Scalar _tmp320 = (Scalar(1) / Scalar(2)) * _tmp1 * _tmp316 -
+                         Scalar(1) / Scalar(2) * _tmp318 * _tmp63 + _tmp319;
+  const Scalar _tmp321 = (Scalar(1) / Scalar(2)) * dt(30, 0);
+  const Scalar _tmp322 = _tmp320 * _tmp321 + dt(30, 0) * samples(3, 30);
+  const Scalar _tmp323 = -std::pow(_tmp278, Scalar(2));
+  const Scalar _tmp324 = _tmp246 + _tmp60;
+  const Scalar _tmp325 = -std::pow(_tmp324, Scalar(2));
+  const Scalar _tmp326 = (Scalar(1) / Scalar(2)) * _tmp323 + (Scalar(1) / Scalar(2)) * _tmp325 + 1;
+  const Scalar _tmp327 = -Scalar(1) / Scalar(2) * _tmp1 * _tmp319 +
+                         (Scalar(1) / Scalar(2)) * _tmp125 * _tmp318 + _tmp316;
+  const Scalar _tmp328 = _tmp321 * _tmp327 + dt(30, 0) * samples(5, 30);
+  const Scalar _tmp329 = (Scalar(1) / Scalar(2)) * _tmp185;
+  const Scalar _tmp330 = _tmp278 * _tmp329;
+  const Scalar _tmp331 = _tmp324 + _tmp330;
+  const Scalar _tmp332 = -Scalar(1) / Scalar(2) * _tmp125 * _tmp316 + _tmp318 +
+                         (Scalar(1) / Scalar(2)) * _tmp319 * _tmp63;
+  const Scalar _tmp333 = _tmp321 * _tmp332 + dt(30, 0) * samples(4, 30);
+  const Scalar _tmp334 = _tmp324 * _tmp329;
+  const Scalar _tmp335 = -_tmp278 + _tmp334;
+  const Scalar _tmp336 = _tmp245 + _tmp59;
+  const Scalar _tmp337 = -std::pow(_tmp336, Scalar(2));
+  const Scalar _tmp338 = -std::pow(_tmp277, Scalar(2));
+  const Scalar _tmp339 = (Scalar(1) / Scalar(2)) * _tmp337 + (Scalar(1) / Scalar(2)) * _tmp338 + 1;
+  const Scalar _tmp340 = std::pow(dt(29, 0), Scalar(2));
+  const Scalar _tmp341 = _tmp340 * samples(0, 29);
+  const Scalar _tmp342 = _tmp340 * samples(1, 29);
+  const Scalar _tmp343 = _tmp341 * samples(4, 29) - _tmp342 * samples(3, 29);
+  const Scalar _tmp344 = _tmp340 * samples(2, 29);
+  const Scalar _tmp345 = -_tmp341 * samples(5, 29) + _tmp344 * samples(3, 29);
+  const Scalar _tmp346 = _tmp342 * samples(5, 29) - _tmp344 * samples(4, 29);
+  const Scalar _tmp347 = (Scalar(1) / Scalar(2)) * _tmp2 * _tmp343 -
+                         Scalar(1) / Scalar(2) * _tmp345 * _tmp64 + _tmp346;
+  const Scalar _tmp348 = (Scalar(1) / Scalar(2)) * dt(29, 0);
+  const Scalar _tmp349 = _tmp347 * _tmp348 + dt(29, 0) * samples(3, 29);
+  const Scalar _tmp350 = (Scalar(1) / Scalar(2)) * _tmp184;
+  const Scalar _tmp351 = _tmp277 * _tmp350;
+  const Scalar _tmp352 = _tmp336 + _tmp351;
+  const Scalar _tmp353 = (Scalar(1) / Scalar(2)) * _tmp126 * _tmp345 -
+                         Scalar(1) / Scalar(2) * _tmp2 * _tmp346 + _tmp343;
+  const Scalar _tmp354 = _tmp348 * _tmp353 + dt(29, 0) * samples(5, 29);
+  const Scalar _tmp355 = _tmp336 * _tmp350;
+  const Scalar _tmp356 = -_tmp277 + _tmp355;
+  const Scalar _tmp357 = -Scalar(1) / Scalar(2) * _tmp126 * _tmp343 + _tmp345 +
+                         (Scalar(1) / Scalar(2)) * _tmp346 * _tmp64;
+  const Scalar _tmp358 = _tmp348 * _tmp357 + dt(29, 0) * samples(4, 29);
+  const Scalar _tmp359 = std::pow(dt(28, 0), Scalar(2));
+  const Scalar _tmp360 = _tmp359 * samples(0, 28);
+  const Scalar _tmp361 = _tmp359 * samples(1, 28);
+  const Scalar _tmp362 = _tmp360 * samples(4, 28) - _tmp361 * samples(3, 28);
+  const Scalar _tmp363 = _tmp359 * samples(2, 28);
+  const Scalar _tmp364 = -_tmp360 * samples(5, 28) + _tmp363 * samples(3, 28);
+  const Scalar _tmp365 = _tmp361 * samples(5, 28) - _tmp363 * samples(4, 28);
+  const Scalar _tmp366 = (Scalar(1) / Scalar(2)) * _tmp3 * _tmp362 -
+                         Scalar(1) / Scalar(2) * _tmp364 * _tmp65 + _tmp365;
+  const Scalar _tmp367 = (Scalar(1) / Scalar(2)) * dt(28, 0);
+  const Scalar _tmp368 = _tmp366 * _tmp367 + dt(28, 0) * samples(3, 28);
+  const Scalar _tmp369 = -std::pow(_tmp276, Scalar(2));
+  const Scalar _tmp370 = _tmp244 + _tmp58;
+  const Scalar _tmp371 = -std::pow(_tmp370, Scalar(2));
+  const Scalar _tmp372 = (Scalar(1) / Scalar(2)) * _tmp369 + (Scalar(1) / Scalar(2)) * _tmp371 + 1;
+  const Scalar _tmp373 = -Scalar(1) / Scalar(2) * _tmp127 * _tmp362 + _tmp364 +
+                         (Scalar(1) / Scalar(2)) * _tmp365 * _tmp65;
+  const Scalar _tmp374 = _tmp367 * _tmp373 + dt(28, 0) * samples(4, 28);
+  const Scalar _tmp375 = (Scalar(1) / Scalar(2)) * _tmp183;
+  const Scalar _tmp376 = _tmp370 * _tmp375;
+  const Scalar _tmp377 = -_tmp276 + _tmp376;
+  const Scalar _tmp378 = (Scalar(1) / Scalar(2)) * _tmp127 * _tmp364 -
+                         Scalar(1) / Scalar(2) * _tmp3 * _tmp365 + _tmp362;
+  const Scalar _tmp379 = _tmp367 * _tmp378 + dt(28, 0) * samples(5, 28);
+  const Scalar _tmp380 = _tmp276 * _tmp375;
+  const Scalar _tmp381 = _tmp370 + _tmp380;
+  const Scalar _tmp382 = (Scalar(1) / Scalar(2)) * _tmp182;
+  const Scalar _tmp383 = _tmp275 * _tmp382;
+  const Scalar _tmp384 = _tmp243 + _tmp57;
+  const Scalar _tmp385 = _tmp383 + _tmp384;
+  const Scalar _tmp386 = std::pow(dt(27, 0), Scalar(2));
+  const Scalar _tmp387 = _tmp386 * samples(0, 27);
+  const Scalar _tmp388 = _tmp386 * samples(2, 27);
+  const Scalar _tmp389 = -_tmp387 * samples(5, 27) + _tmp388 * samples(3, 27);
+  const Scalar _tmp390 = _tmp386 * samples(1, 27);
+  const Scalar _tmp391 = -_tmp388 * samples(4, 27) + _tmp390 * samples(5, 27);
+  const Scalar _tmp392 = _tmp387 * samples(4, 27) - _tmp390 * samples(3, 27);
+  const Scalar _tmp393 = (Scalar(1) / Scalar(2)) * _tmp128 * _tmp389 -
+                         Scalar(1) / Scalar(2) * _tmp391 * _tmp4 + _tmp392;
+  const Scalar _tmp394 = (Scalar(1) / Scalar(2)) * dt(27, 0);
+  const Scalar _tmp395 = _tmp393 * _tmp394 + dt(27, 0) * samples(5, 27);
+  const Scalar _tmp396 = -Scalar(1) / Scalar(2) * _tmp128 * _tmp392 + _tmp389 +
+                         (Scalar(1) / Scalar(2)) * _tmp391 * _tmp66;
+  const Scalar _tmp397 = _tmp394 * _tmp396 + dt(27, 0) * samples(4, 27);
+  const Scalar _tmp398 = _tmp382 * _tmp384;
+  const Scalar _tmp399 = -_tmp275 + _tmp398;
+  const Scalar _tmp400 = -std::pow(_tmp384, Scalar(2));
+  const Scalar _tmp401 = -std::pow(_tmp275, Scalar(2));
+  const Scalar _tmp402 = (Scalar(1) / Scalar(2)) * _tmp400 + (Scalar(1) / Scalar(2)) * _tmp401 + 1;
+  const Scalar _tmp403 = -Scalar(1) / Scalar(2) * _tmp389 * _tmp66 + _tmp391 +
+                         (Scalar(1) / Scalar(2)) * _tmp392 * _tmp4;
+  const Scalar _tmp404 = _tmp394 * _tmp403 + dt(27, 0) * samples(3, 27);
+  const Scalar _tmp405 = std::pow(dt(26, 0), Scalar(2));
+  const Scalar _tmp406 = _tmp405 * samples(4, 26);
+  const Scalar _tmp407 = _tmp405 * samples(3, 26);
+  const Scalar _tmp408 = _tmp406 * samples(0, 26) - _tmp407 * samples(1, 26);
+  const Scalar _tmp409 = _tmp405 * samples(5, 26);
+  const Scalar _tmp410 = _tmp407 * samples(2, 26) - _tmp409 * samples(0, 26);
+  const Scalar _tmp411 = -_tmp406 * samples(2, 26) + _tmp409 * samples(1, 26);
+  const Scalar _tmp412 = (Scalar(1) / Scalar(2)) * _tmp408 * _tmp5 -
+                         Scalar(1) / Scalar(2) * _tmp410 * _tmp67 + _tmp411;
+  const Scalar _tmp413 = (Scalar(1) / Scalar(2)) * dt(26, 0);
+  const Scalar _tmp414 = _tmp412 * _tmp413 + dt(26, 0) * samples(3, 26);
+  const Scalar _tmp415 = -std::pow(_tmp274, Scalar(2));
+  const Scalar _tmp416 = _tmp242 + _tmp56;
+  const Scalar _tmp417 = -std::pow(_tmp416, Scalar(2));
+  const Scalar _tmp418 = (Scalar(1) / Scalar(2)) * _tmp415 + (Scalar(1) / Scalar(2)) * _tmp417 + 1;
+  const Scalar _tmp419 = -Scalar(1) / Scalar(2) * _tmp129 * _tmp408 + _tmp410 +
+                         (Scalar(1) / Scalar(2)) * _tmp411 * _tmp67;
+  const Scalar _tmp420 = _tmp413 * _tmp419 + dt(26, 0) * samples(4, 26);
+  const Scalar _tmp421 = (Scalar(1) / Scalar(2)) * _tmp181 * _tmp416;
+  const Scalar _tmp422 = -_tmp274 + _tmp421;
+  const Scalar _tmp423 = (Scalar(1) / Scalar(2)) * _tmp274;
+  const Scalar _tmp424 = _tmp181 * _tmp423;
+  const Scalar _tmp425 = _tmp416 + _tmp424;
+  const Scalar _tmp426 = (Scalar(1) / Scalar(2)) * _tmp129 * _tmp410 + _tmp408 -
+                         Scalar(1) / Scalar(2) * _tmp411 * _tmp5;
+  const Scalar _tmp427 = _tmp413 * _tmp426 + dt(26, 0) * samples(5, 26);
+  const Scalar _tmp428 = _tmp241 + _tmp55;
+  const Scalar _tmp429 = (Scalar(1) / Scalar(2)) * _tmp180 * _tmp428;
+  const Scalar _tmp430 = -_tmp273 + _tmp429;
+  const Scalar _tmp431 = std::pow(dt(25, 0), Scalar(2));
+  const Scalar _tmp432 = _tmp431 * samples(4, 25);
+  const Scalar _tmp433 = _tmp431 * samples(3, 25);
+  const Scalar _tmp434 = _tmp432 * samples(0, 25) - _tmp433 * samples(1, 25);
+  const Scalar _tmp435 = _tmp431 * samples(5, 25);
+  const Scalar _tmp436 = -_tmp432 * samples(2, 25) + _tmp435 * samples(1, 25);
+  const Scalar _tmp437 = _tmp433 * samples(2, 25) - _tmp435 * samples(0, 25);
+  const Scalar _tmp438 = -Scalar(1) / Scalar(2) * _tmp130 * _tmp434 +
+                         (Scalar(1) / Scalar(2)) * _tmp436 * _tmp68 + _tmp437;
+  const Scalar _tmp439 = (Scalar(1) / Scalar(2)) * dt(25, 0);
+  const Scalar _tmp440 = _tmp438 * _tmp439 + dt(25, 0) * samples(4, 25);
+  const Scalar _tmp441 = -std::pow(_tmp273, Scalar(2));
+  const Scalar _tmp442 = -std::pow(_tmp428, Scalar(2));
+  const Scalar _tmp443 = (Scalar(1) / Scalar(2)) * _tmp441 + (Scalar(1) / Scalar(2)) * _tmp442 + 1;
+  const Scalar _tmp444 = (Scalar(1) / Scalar(2)) * _tmp434 * _tmp6 + _tmp436 -
+                         Scalar(1) / Scalar(2) * _tmp437 * _tmp68;
+  const Scalar _tmp445 = _tmp439 * _tmp444 + dt(25, 0) * samples(3, 25);
+  const Scalar _tmp446 = (Scalar(1) / Scalar(2)) * _tmp273;
+  const Scalar _tmp447 = _tmp180 * _tmp446;
+  const Scalar _tmp448 = _tmp428 + _tmp447;
+  const Scalar _tmp449 = (Scalar(1) / Scalar(2)) * _tmp130 * _tmp437 + _tmp434 -
+                         Scalar(1) / Scalar(2) * _tmp436 * _tmp6;
+  const Scalar _tmp450 = _tmp439 * _tmp449 + dt(25, 0) * samples(5, 25);
+  const Scalar _tmp451 = std::pow(dt(24, 0), Scalar(2));
+  const Scalar _tmp452 = _tmp451 * samples(2, 24);
+  const Scalar _tmp453 = _tmp451 * samples(1, 24);
+  const Scalar _tmp454 = -_tmp452 * samples(4, 24) + _tmp453 * samples(5, 24);
+  const Scalar _tmp455 = _tmp451 * samples(0, 24);
+  const Scalar _tmp456 = _tmp452 * samples(3, 24) - _tmp455 * samples(5, 24);
+  const Scalar _tmp457 = -_tmp453 * samples(3, 24) + _tmp455 * samples(4, 24);
+  const Scalar _tmp458 = (Scalar(1) / Scalar(2)) * _tmp131 * _tmp456 -
+                         Scalar(1) / Scalar(2) * _tmp454 * _tmp7 + _tmp457;
+  const Scalar _tmp459 = (Scalar(1) / Scalar(2)) * dt(24, 0);
+  const Scalar _tmp460 = _tmp458 * _tmp459 + dt(24, 0) * samples(5, 24);
+  const Scalar _tmp461 = (Scalar(1) / Scalar(2)) * _tmp179;
+  const Scalar _tmp462 = _tmp272 * _tmp461;
+  const Scalar _tmp463 = _tmp240 + _tmp54;
+  const Scalar _tmp464 = _tmp462 + _tmp463;
+  const Scalar _tmp465 = _tmp454 - Scalar(1) / Scalar(2) * _tmp456 * _tmp69 +
+                         (Scalar(1) / Scalar(2)) * _tmp457 * _tmp7;
+  const Scalar _tmp466 = _tmp459 * _tmp465 + dt(24, 0) * samples(3, 24);
+  const Scalar _tmp467 = -std::pow(_tmp463, Scalar(2));
+  const Scalar _tmp468 = -std::pow(_tmp272, Scalar(2));
+  const Scalar _tmp469 = (Scalar(1) / Scalar(2)) * _tmp467 + (Scalar(1) / Scalar(2)) * _tmp468 + 1;
+  const Scalar _tmp470 = -Scalar(1) / Scalar(2) * _tmp131 * _tmp457 +
+                         (Scalar(1) / Scalar(2)) * _tmp454 * _tmp69 + _tmp456;
+  const Scalar _tmp471 = _tmp459 * _tmp470 + dt(24, 0) * samples(4, 24);
+  const Scalar _tmp472 = _tmp461 * _tmp463;
+  const Scalar _tmp473 = -_tmp272 + _tmp472;
+  const Scalar _tmp474 = std::pow(dt(23, 0), Scalar(2));
+  const Scalar _tmp475 = _tmp474 * samples(4, 23);
+  const Scalar _tmp476 = _tmp474 * samples(1, 23);
+  const Scalar _tmp477 = _tmp475 * samples(0, 23) - _tmp476 * samples(3, 23);
+  const Scalar _tmp478 = -_tmp475 * samples(2, 23) + _tmp476 * samples(5, 23);
+  const Scalar _tmp479 =
+      -_tmp474 * samples(0, 23) * samples(5, 23) + _tmp474 * samples(2, 23) * samples(3, 23);
+  const Scalar _tmp480 = -Scalar(1) / Scalar(2) * _tmp132 * _tmp477 +
+                         (Scalar(1) / Scalar(2)) * _tmp478 * _tmp70 + _tmp479;
+  const Scalar _tmp481 = (Scalar(1) / Scalar(2)) * dt(23, 0);
+  const Scalar _tmp482 = _tmp480 * _tmp481 + dt(23, 0) * samples(4, 23);
+  const Scalar _tmp483 = _tmp239 + _tmp53;
+  const Scalar _tmp484 = (Scalar(1) / Scalar(2)) * _tmp178 * _tmp483;
+  const Scalar _tmp485 = -_tmp271 + _tmp484;
+  const Scalar _tmp486 = (Scalar(1) / Scalar(2)) * _tmp477 * _tmp8 + _tmp478 -
+                         Scalar(1) / Scalar(2) * _tmp479 * _tmp70;
+  const Scalar _tmp487 = _tmp481 * _tmp486 + dt(23, 0) * samples(3, 23);
+  const Scalar _tmp488 = -std::pow(_tmp483, Scalar(2));
+  const Scalar _tmp489 = -std::pow(_tmp271, Scalar(2));
+  const Scalar _tmp490 = (Scalar(1) / Scalar(2)) * _tmp488 + (Scalar(1) / Scalar(2)) * _tmp489 + 1;
+  const Scalar _tmp491 = (Scalar(1) / Scalar(2)) * _tmp271;
+  const Scalar _tmp492 = _tmp178 * _tmp491;
+  const Scalar _tmp493 = _tmp483 + _tmp492;
+  const Scalar _tmp494 = (Scalar(1) / Scalar(2)) * _tmp132 * _tmp479 + _tmp477 -
+                         Scalar(1) / Scalar(2) * _tmp478 * _tmp8;
+  const Scalar _tmp495 = _tmp481 * _tmp494 + dt(23, 0) * samples(5, 23);
+  const Scalar _tmp496 = _tmp238 + _tmp52;
+  const Scalar _tmp497 = (Scalar(1) / Scalar(2)) * _tmp177;
+  const Scalar _tmp498 = _tmp496 * _tmp497;
+  const Scalar _tmp499 = -_tmp270 + _tmp498;
+  const Scalar _tmp500 = std::pow(dt(22, 0), Scalar(2));
+  const Scalar _tmp501 = _tmp500 * samples(0, 22);
+  const Scalar _tmp502 = _tmp500 * samples(1, 22);
+  const Scalar _tmp503 = _tmp501 * samples(4, 22) - _tmp502 * samples(3, 22);
+  const Scalar _tmp504 = _tmp500 * samples(2, 22);
+  const Scalar _tmp505 = _tmp502 * samples(5, 22) - _tmp504 * samples(4, 22);
+  const Scalar _tmp506 = -_tmp501 * samples(5, 22) + _tmp504 * samples(3, 22);
+  const Scalar _tmp507 = -Scalar(1) / Scalar(2) * _tmp133 * _tmp503 +
+                         (Scalar(1) / Scalar(2)) * _tmp505 * _tmp71 + _tmp506;
+  const Scalar _tmp508 = (Scalar(1) / Scalar(2)) * dt(22, 0);
+  const Scalar _tmp509 = _tmp507 * _tmp508 + dt(22, 0) * samples(4, 22);
+  const Scalar _tmp510 = (Scalar(1) / Scalar(2)) * _tmp133 * _tmp506 + _tmp503 -
+                         Scalar(1) / Scalar(2) * _tmp505 * _tmp9;
+  const Scalar _tmp511 = _tmp508 * _tmp510 + dt(22, 0) * samples(5, 22);
+  const Scalar _tmp512 = _tmp270 * _tmp497;
+  const Scalar _tmp513 = _tmp496 + _tmp512;
+  const Scalar _tmp514 = -std::pow(_tmp270, Scalar(2));
+  const Scalar _tmp515 = -std::pow(_tmp496, Scalar(2));
+  const Scalar _tmp516 = (Scalar(1) / Scalar(2)) * _tmp514 + (Scalar(1) / Scalar(2)) * _tmp515 + 1;
+  const Scalar _tmp517 = (Scalar(1) / Scalar(2)) * _tmp503 * _tmp9 + _tmp505 -
+                         Scalar(1) / Scalar(2) * _tmp506 * _tmp71;
+  const Scalar _tmp518 = _tmp508 * _tmp517 + dt(22, 0) * samples(3, 22);
+  const Scalar _tmp519 = std::pow(dt(21, 0), Scalar(2));
+  const Scalar _tmp520 = _tmp519 * samples(4, 21);
+  const Scalar _tmp521 = _tmp519 * samples(1, 21);
+  const Scalar _tmp522 = _tmp520 * samples(0, 21) - _tmp521 * samples(3, 21);
+  const Scalar _tmp523 = -_tmp520 * samples(2, 21) + _tmp521 * samples(5, 21);
+  const Scalar _tmp524 =
+      -_tmp519 * samples(0, 21) * samples(5, 21) + _tmp519 * samples(2, 21) * samples(3, 21);
+  const Scalar _tmp525 = -Scalar(1) / Scalar(2) * _tmp134 * _tmp522 +
+                         (Scalar(1) / Scalar(2)) * _tmp523 * _tmp72 + _tmp524;
+  const Scalar _tmp526 = (Scalar(1) / Scalar(2)) * dt(21, 0);
+  const Scalar _tmp527 = _tmp525 * _tmp526 + dt(21, 0) * samples(4, 21);
+  const Scalar _tmp528 = _tmp237 + _tmp51;
+  const Scalar _tmp529 = (Scalar(1) / Scalar(2)) * _tmp176 * _tmp528;
+  const Scalar _tmp530 = -_tmp269 + _tmp529;
+  const Scalar _tmp531 = -std::pow(_tmp528, Scalar(2));
+  const Scalar _tmp532 = -std::pow(_tmp269, Scalar(2));
+  const Scalar _tmp533 = (Scalar(1) / Scalar(2)) * _tmp531 + (Scalar(1) / Scalar(2)) * _tmp532 + 1;
+  const Scalar _tmp534 = (Scalar(1) / Scalar(2)) * _tmp10 * _tmp522 + _tmp523 -
+                         Scalar(1) / Scalar(2) * _tmp524 * _tmp72;
+  const Scalar _tmp535 = _tmp526 * _tmp534 + dt(21, 0) * samples(3, 21);
+  const Scalar _tmp536 = -Scalar(1) / Scalar(2) * _tmp10 * _tmp523 +
+                         (Scalar(1) / Scalar(2)) * _tmp134 * _tmp524 + _tmp522;
+  const Scalar _tmp537 = _tmp526 * _tmp536 + dt(21, 0) * samples(5, 21);
+  const Scalar _tmp538 = (Scalar(1) / Scalar(2)) * _tmp269;
+  const Scalar _tmp539 = _tmp176 * _tmp538;
+  const Scalar _tmp540 = _tmp528 + _tmp539;
+  const Scalar _tmp541 = std::pow(dt(20, 0), Scalar(2));
+  const Scalar _tmp542 = _tmp541 * samples(0, 20);
+  const Scalar _tmp543 = _tmp541 * samples(1, 20);
+  const Scalar _tmp544 = _tmp542 * samples(4, 20) - _tmp543 * samples(3, 20);
+  const Scalar _tmp545 = _tmp541 * samples(2, 20);
+  const Scalar _tmp546 = -_tmp542 * samples(5, 20) + _tmp545 * samples(3, 20);
+  const Scalar _tmp547 = _tmp543 * samples(5, 20) - _tmp545 * samples(4, 20);
+  const Scalar _tmp548 = (Scalar(1) / Scalar(2)) * _tmp11 * _tmp544 -
+                         Scalar(1) / Scalar(2) * _tmp546 * _tmp73 + _tmp547;
+  const Scalar _tmp549 = (Scalar(1) / Scalar(2)) * dt(20, 0);
+  const Scalar _tmp550 = _tmp548 * _tmp549 + dt(20, 0) * samples(3, 20);
+  const Scalar _tmp551 = -std::pow(_tmp268, Scalar(2));
+  const Scalar _tmp552 = _tmp236 + _tmp50;
+  const Scalar _tmp553 = -std::pow(_tmp552, Scalar(2));
+  const Scalar _tmp554 = (Scalar(1) / Scalar(2)) * _tmp551 + (Scalar(1) / Scalar(2)) * _tmp553 + 1;
+  const Scalar _tmp555 = (Scalar(1) / Scalar(2)) * _tmp175;
+  const Scalar _tmp556 = _tmp552 * _tmp555;
+  const Scalar _tmp557 = -_tmp268 + _tmp556;
+  const Scalar _tmp558 = -Scalar(1) / Scalar(2) * _tmp135 * _tmp544 + _tmp546 +
+                         (Scalar(1) / Scalar(2)) * _tmp547 * _tmp73;
+  const Scalar _tmp559 = _tmp549 * _tmp558 + dt(20, 0) * samples(4, 20);
+  const Scalar _tmp560 = _tmp268 * _tmp555;
+  const Scalar _tmp561 = _tmp552 + _tmp560;
+  const Scalar _tmp562 = -Scalar(1) / Scalar(2) * _tmp11 * _tmp547 +
+                         (Scalar(1) / Scalar(2)) * _tmp135 * _tmp546 + _tmp544;
+  const Scalar _tmp563 = _tmp549 * _tmp562 + dt(20, 0) * samples(5, 20);
+  const Scalar _tmp564 = std::pow(dt(19, 0), Scalar(2));
+  const Scalar _tmp565 = _tmp564 * samples(2, 19);
+  const Scalar _tmp566 = _tmp564 * samples(1, 19);
+  const Scalar _tmp567 = -_tmp565 * samples(4, 19) + _tmp566 * samples(5, 19);
+  const Scalar _tmp568 = _tmp564 * samples(0, 19);
+  const Scalar _tmp569 = _tmp565 * samples(3, 19) - _tmp568 * samples(5, 19);
+  const Scalar _tmp570 = -_tmp566 * samples(3, 19) + _tmp568 * samples(4, 19);
+  const Scalar _tmp571 = -Scalar(1) / Scalar(2) * _tmp12 * _tmp567 +
+                         (Scalar(1) / Scalar(2)) * _tmp136 * _tmp569 + _tmp570;
+  const Scalar _tmp572 = (Scalar(1) / Scalar(2)) * dt(19, 0);
+  const Scalar _tmp573 = _tmp571 * _tmp572 + dt(19, 0) * samples(5, 19);
+  const Scalar _tmp574 = (Scalar(1) / Scalar(2)) * _tmp174;
+  const Scalar _tmp575 = _tmp267 * _tmp574;
+  const Scalar _tmp576 = _tmp235 + _tmp49;
+  const Scalar _tmp577 = _tmp575 + _tmp576;
+  const Scalar _tmp578 = (Scalar(1) / Scalar(2)) * _tmp12 * _tmp570 + _tmp567 -
+                         Scalar(1) / Scalar(2) * _tmp569 * _tmp74;
+  const Scalar _tmp579 = _tmp572 * _tmp578 + dt(19, 0) * samples(3, 19);
+  const Scalar _tmp580 = -std::pow(_tmp267, Scalar(2));
+  const Scalar _tmp581 = -std::pow(_tmp576, Scalar(2));
+  const Scalar _tmp582 = (Scalar(1) / Scalar(2)) * _tmp580 + (Scalar(1) / Scalar(2)) * _tmp581 + 1;
+  const Scalar _tmp583 = _tmp574 * _tmp576;
+  const Scalar _tmp584 = -_tmp267 + _tmp583;
+  const Scalar _tmp585 = -Scalar(1) / Scalar(2) * _tmp136 * _tmp570 +
+                         (Scalar(1) / Scalar(2)) * _tmp567 * _tmp74 + _tmp569;
+  const Scalar _tmp586 = _tmp572 * _tmp585 + dt(19, 0) * samples(4, 19);
+  const Scalar _tmp587 = std::pow(dt(18, 0), Scalar(2));
+  const Scalar _tmp588 = _tmp587 * samples(0, 18);
+  const Scalar _tmp589 = _tmp587 * samples(2, 18);
+  const Scalar _tmp590 = -_tmp588 * samples(5, 18) + _tmp589 * samples(3, 18);
+  const Scalar _tmp591 = _tmp587 * samples(1, 18);
+  const Scalar _tmp592 = _tmp588 * samples(4, 18) - _tmp591 * samples(3, 18);
+  const Scalar _tmp593 = -_tmp589 * samples(4, 18) + _tmp591 * samples(5, 18);
+  const Scalar _tmp594 = (Scalar(1) / Scalar(2)) * _tmp13 * _tmp592 -
+                         Scalar(1) / Scalar(2) * _tmp590 * _tmp75 + _tmp593;
+  const Scalar _tmp595 = (Scalar(1) / Scalar(2)) * dt(18, 0);
+  const Scalar _tmp596 = _tmp594 * _tmp595 + dt(18, 0) * samples(3, 18);
+  const Scalar _tmp597 = -std::pow(_tmp266, Scalar(2));
+  const Scalar _tmp598 = _tmp234 + _tmp48;
+  const Scalar _tmp599 = -std::pow(_tmp598, Scalar(2));
+  const Scalar _tmp600 = (Scalar(1) / Scalar(2)) * _tmp597 + (Scalar(1) / Scalar(2)) * _tmp599 + 1;
+  const Scalar _tmp601 = (Scalar(1) / Scalar(2)) * _tmp598;
+  const Scalar _tmp602 = _tmp173 * _tmp601;
+  const Scalar _tmp603 = -_tmp266 + _tmp602;
+  const Scalar _tmp604 = -Scalar(1) / Scalar(2) * _tmp137 * _tmp592 + _tmp590 +
+                         (Scalar(1) / Scalar(2)) * _tmp593 * _tmp75;
+  const Scalar _tmp605 = _tmp595 * _tmp604 + dt(18, 0) * samples(4, 18);
+  const Scalar _tmp606 = (Scalar(1) / Scalar(2)) * _tmp173 * _tmp266;
+  const Scalar _tmp607 = _tmp598 + _tmp606;
+  const Scalar _tmp608 = -Scalar(1) / Scalar(2) * _tmp13 * _tmp593 +
+                         (Scalar(1) / Scalar(2)) * _tmp137 * _tmp590 + _tmp592;
+  const Scalar _tmp609 = _tmp595 * _tmp608 + dt(18, 0) * samples(5, 18);
+  const Scalar _tmp610 = std::pow(dt(17, 0), Scalar(2));
+  const Scalar _tmp611 = _tmp610 * samples(1, 17);
+  const Scalar _tmp612 = _tmp610 * samples(2, 17);
+  const Scalar _tmp613 = _tmp611 * samples(5, 17) - _tmp612 * samples(4, 17);
+  const Scalar _tmp614 = _tmp610 * samples(0, 17);
+  const Scalar _tmp615 = _tmp612 * samples(3, 17) - _tmp614 * samples(5, 17);
+  const Scalar _tmp616 = -_tmp611 * samples(3, 17) + _tmp614 * samples(4, 17);
+  const Scalar _tmp617 = (Scalar(1) / Scalar(2)) * _tmp138 * _tmp615 -
+                         Scalar(1) / Scalar(2) * _tmp14 * _tmp613 + _tmp616;
+  const Scalar _tmp618 = (Scalar(1) / Scalar(2)) * dt(17, 0);
+  const Scalar _tmp619 = _tmp617 * _tmp618 + dt(17, 0) * samples(5, 17);
+  const Scalar _tmp620 = (Scalar(1) / Scalar(2)) * _tmp172;
+  const Scalar _tmp621 = _tmp265 * _tmp620;
+  const Scalar _tmp622 = _tmp233 + _tmp47;
+  const Scalar _tmp623 = _tmp621 + _tmp622;
+  const Scalar _tmp624 = -Scalar(1) / Scalar(2) * _tmp138 * _tmp616 +
+                         (Scalar(1) / Scalar(2)) * _tmp613 * _tmp76 + _tmp615;
+  const Scalar _tmp625 = _tmp618 * _tmp624 + dt(17, 0) * samples(4, 17);
+  const Scalar _tmp626 = _tmp620 * _tmp622;
+  const Scalar _tmp627 = -_tmp265 + _tmp626;
+  const Scalar _tmp628 = -std::pow(_tmp265, Scalar(2));
+  const Scalar _tmp629 = -std::pow(_tmp622, Scalar(2));
+  const Scalar _tmp630 = (Scalar(1) / Scalar(2)) * _tmp628 + (Scalar(1) / Scalar(2)) * _tmp629 + 1;
+  const Scalar _tmp631 = (Scalar(1) / Scalar(2)) * _tmp14 * _tmp616 + _tmp613 -
+                         Scalar(1) / Scalar(2) * _tmp615 * _tmp76;
+  const Scalar _tmp632 = _tmp618 * _tmp631 + dt(17, 0) * samples(3, 17);
+  const Scalar _tmp633 = _tmp232 + _tmp46;
+  const Scalar _tmp634 = (Scalar(1) / Scalar(2)) * _tmp633;
+  const Scalar _tmp635 = _tmp171 * _tmp634;
+  const Scalar _tmp636 = -_tmp264 + _tmp635;
+  const Scalar _tmp637 = std::pow(dt(16, 0), Scalar(2));
+  const Scalar _tmp638 = _tmp637 * samples(1, 16);
+  const Scalar _tmp639 = _tmp637 * samples(2, 16);
+  const Scalar _tmp640 = _tmp638 * samples(5, 16) - _tmp639 * samples(4, 16);
+  const Scalar _tmp641 = _tmp637 * samples(0, 16);
+  const Scalar _tmp642 = -_tmp638 * samples(3, 16) + _tmp641 * samples(4, 16);
+  const Scalar _tmp643 = _tmp639 * samples(3, 16) - _tmp641 * samples(5, 16);
+  const Scalar _tmp644 = -Scalar(1) / Scalar(2) * _tmp139 * _tmp642 +
+                         (Scalar(1) / Scalar(2)) * _tmp640 * _tmp77 + _tmp643;
+  const Scalar _tmp645 = (Scalar(1) / Scalar(2)) * dt(16, 0);
+  const Scalar _tmp646 = _tmp644 * _tmp645 + dt(16, 0) * samples(4, 16);
+  const Scalar _tmp647 = (Scalar(1) / Scalar(2)) * _tmp171 * _tmp264;
+  const Scalar _tmp648 = _tmp633 + _tmp647;
+  const Scalar _tmp649 = (Scalar(1) / Scalar(2)) * _tmp139 * _tmp643 -
+                         Scalar(1) / Scalar(2) * _tmp15 * _tmp640 + _tmp642;
+  const Scalar _tmp650 = _tmp645 * _tmp649 + dt(16, 0) * samples(5, 16);
+  const Scalar _tmp651 = (Scalar(1) / Scalar(2)) * _tmp15 * _tmp642 + _tmp640 -
+                         Scalar(1) / Scalar(2) * _tmp643 * _tmp77;
+  const Scalar _tmp652 = _tmp645 * _tmp651 + dt(16, 0) * samples(3, 16);
+  const Scalar _tmp653 = -std::pow(_tmp633, Scalar(2));
+  const Scalar _tmp654 = -std::pow(_tmp264, Scalar(2));
+  const Scalar _tmp655 = (Scalar(1) / Scalar(2)) * _tmp653 + (Scalar(1) / Scalar(2)) * _tmp654 + 1;
+  const Scalar _tmp656 = std::pow(dt(15, 0), Scalar(2));
+  const Scalar _tmp657 = _tmp656 * samples(0, 15);
+  const Scalar _tmp658 = _tmp656 * samples(2, 15);
+  const Scalar _tmp659 = -_tmp657 * samples(5, 15) + _tmp658 * samples(3, 15);
+  const Scalar _tmp660 = _tmp656 * samples(1, 15);
+  const Scalar _tmp661 = -_tmp658 * samples(4, 15) + _tmp660 * samples(5, 15);
+  const Scalar _tmp662 = _tmp657 * samples(4, 15) - _tmp660 * samples(3, 15);
+  const Scalar _tmp663 = (Scalar(1) / Scalar(2)) * _tmp140 * _tmp659 -
+                         Scalar(1) / Scalar(2) * _tmp16 * _tmp661 + _tmp662;
+  const Scalar _tmp664 = (Scalar(1) / Scalar(2)) * dt(15, 0);
+  const Scalar _tmp665 = _tmp663 * _tmp664 + dt(15, 0) * samples(5, 15);
+  const Scalar _tmp666 = (Scalar(1) / Scalar(2)) * _tmp170 * _tmp263;
+  const Scalar _tmp667 = _tmp231 + _tmp45;
+  const Scalar _tmp668 = _tmp666 + _tmp667;
+  const Scalar _tmp669 = (Scalar(1) / Scalar(2)) * _tmp667;
+  const Scalar _tmp670 = _tmp170 * _tmp669;
+  const Scalar _tmp671 = -_tmp263 + _tmp670;
+  const Scalar _tmp672 = -Scalar(1) / Scalar(2) * _tmp140 * _tmp662 + _tmp659 +
+                         (Scalar(1) / Scalar(2)) * _tmp661 * _tmp78;
+  const Scalar _tmp673 = _tmp664 * _tmp672 + dt(15, 0) * samples(4, 15);
+  const Scalar _tmp674 = -std::pow(_tmp667, Scalar(2));
+  const Scalar _tmp675 = -std::pow(_tmp263, Scalar(2));
+  const Scalar _tmp676 = (Scalar(1) / Scalar(2)) * _tmp674 + (Scalar(1) / Scalar(2)) * _tmp675 + 1;
+  const Scalar _tmp677 = (Scalar(1) / Scalar(2)) * _tmp16 * _tmp662 -
+                         Scalar(1) / Scalar(2) * _tmp659 * _tmp78 + _tmp661;
+  const Scalar _tmp678 = _tmp664 * _tmp677 + dt(15, 0) * samples(3, 15);
+  const Scalar _tmp679 = _tmp230 + _tmp44;
+  const Scalar _tmp680 = -std::pow(_tmp679, Scalar(2));
+  const Scalar _tmp681 = -std::pow(_tmp262, Scalar(2));
+  const Scalar _tmp682 = (Scalar(1) / Scalar(2)) * _tmp680 + (Scalar(1) / Scalar(2)) * _tmp681 + 1;
+  const Scalar _tmp683 = std::pow(dt(14, 0), Scalar(2));
+  const Scalar _tmp684 = _tmp683 * samples(0, 14);
+  const Scalar _tmp685 = _tmp683 * samples(2, 14);
+  const Scalar _tmp686 = -_tmp684 * samples(5, 14) + _tmp685 * samples(3, 14);
+  const Scalar _tmp687 = _tmp683 * samples(1, 14);
+  const Scalar _tmp688 = _tmp684 * samples(4, 14) - _tmp687 * samples(3, 14);
+  const Scalar _tmp689 = -_tmp685 * samples(4, 14) + _tmp687 * samples(5, 14);
+  const Scalar _tmp690 = (Scalar(1) / Scalar(2)) * _tmp17 * _tmp688 -
+                         Scalar(1) / Scalar(2) * _tmp686 * _tmp79 + _tmp689;
+  const Scalar _tmp691 = (Scalar(1) / Scalar(2)) * dt(14, 0);
+  const Scalar _tmp692 = _tmp690 * _tmp691 + dt(14, 0) * samples(3, 14);
+  const Scalar _tmp693 = (Scalar(1) / Scalar(2)) * _tmp679;
+  const Scalar _tmp694 = _tmp169 * _tmp693;
+  const Scalar _tmp695 = -_tmp262 + _tmp694;
+  const Scalar _tmp696 = -Scalar(1) / Scalar(2) * _tmp141 * _tmp688 + _tmp686 +
+                         (Scalar(1) / Scalar(2)) * _tmp689 * _tmp79;
+  const Scalar _tmp697 = _tmp691 * _tmp696 + dt(14, 0) * samples(4, 14);
+  const Scalar _tmp698 = (Scalar(1) / Scalar(2)) * _tmp169 * _tmp262;
+  const Scalar _tmp699 = _tmp679 + _tmp698;
+  const Scalar _tmp700 = (Scalar(1) / Scalar(2)) * _tmp141 * _tmp686 -
+                         Scalar(1) / Scalar(2) * _tmp17 * _tmp689 + _tmp688;
+  const Scalar _tmp701 = _tmp691 * _tmp700 + dt(14, 0) * samples(5, 14);
+  const Scalar _tmp702 = std::pow(dt(13, 0), Scalar(2));
+  const Scalar _tmp703 = _tmp702 * samples(0, 13);
+  const Scalar _tmp704 = _tmp702 * samples(1, 13);
+  const Scalar _tmp705 = _tmp703 * samples(4, 13) - _tmp704 * samples(3, 13);
+  const Scalar _tmp706 = _tmp702 * samples(2, 13);
+  const Scalar _tmp707 = _tmp704 * samples(5, 13) - _tmp706 * samples(4, 13);
+  const Scalar _tmp708 = -_tmp703 * samples(5, 13) + _tmp706 * samples(3, 13);
+  const Scalar _tmp709 = -Scalar(1) / Scalar(2) * _tmp142 * _tmp705 +
+                         (Scalar(1) / Scalar(2)) * _tmp707 * _tmp80 + _tmp708;
+  const Scalar _tmp710 = (Scalar(1) / Scalar(2)) * dt(13, 0);
+  const Scalar _tmp711 = _tmp709 * _tmp710 + dt(13, 0) * samples(4, 13);
+  const Scalar _tmp712 = _tmp229 + _tmp43;
+  const Scalar _tmp713 = (Scalar(1) / Scalar(2)) * _tmp168;
+  const Scalar _tmp714 = _tmp712 * _tmp713;
+  const Scalar _tmp715 = -_tmp261 + _tmp714;
+  const Scalar _tmp716 = -std::pow(_tmp712, Scalar(2));
+  const Scalar _tmp717 = -std::pow(_tmp261, Scalar(2));
+  const Scalar _tmp718 = (Scalar(1) / Scalar(2)) * _tmp716 + (Scalar(1) / Scalar(2)) * _tmp717 + 1;
+  const Scalar _tmp719 = (Scalar(1) / Scalar(2)) * _tmp18 * _tmp705 + _tmp707 -
+                         Scalar(1) / Scalar(2) * _tmp708 * _tmp80;
+  const Scalar _tmp720 = _tmp710 * _tmp719 + dt(13, 0) * samples(3, 13);
+  const Scalar _tmp721 = _tmp261 * _tmp713;
+  const Scalar _tmp722 = _tmp712 + _tmp721;
+  const Scalar _tmp723 = (Scalar(1) / Scalar(2)) * _tmp142 * _tmp708 -
+                         Scalar(1) / Scalar(2) * _tmp18 * _tmp707 + _tmp705;
+  const Scalar _tmp724 = _tmp710 * _tmp723 + dt(13, 0) * samples(5, 13);
+  const Scalar _tmp725 = std::pow(dt(12, 0), Scalar(2));
+  const Scalar _tmp726 = _tmp725 * samples(4, 12);
+  const Scalar _tmp727 = _tmp725 * samples(5, 12);
+  const Scalar _tmp728 = -_tmp726 * samples(2, 12) + _tmp727 * samples(1, 12);
+  const Scalar _tmp729 = _tmp725 * samples(3, 12);
+  const Scalar _tmp730 = _tmp726 * samples(0, 12) - _tmp729 * samples(1, 12);
+  const Scalar _tmp731 = -_tmp727 * samples(0, 12) + _tmp729 * samples(2, 12);
+  const Scalar _tmp732 = -Scalar(1) / Scalar(2) * _tmp143 * _tmp730 +
+                         (Scalar(1) / Scalar(2)) * _tmp728 * _tmp81 + _tmp731;
+  const Scalar _tmp733 = (Scalar(1) / Scalar(2)) * dt(12, 0);
+  const Scalar _tmp734 = _tmp732 * _tmp733 + dt(12, 0) * samples(4, 12);
+  const Scalar _tmp735 = _tmp228 + _tmp42;
+  const Scalar _tmp736 = (Scalar(1) / Scalar(2)) * _tmp735;
+  const Scalar _tmp737 = _tmp167 * _tmp736;
+  const Scalar _tmp738 = -_tmp260 + _tmp737;
+  const Scalar _tmp739 = (Scalar(1) / Scalar(2)) * _tmp19 * _tmp730 + _tmp728 -
+                         Scalar(1) / Scalar(2) * _tmp731 * _tmp81;
+  const Scalar _tmp740 = _tmp733 * _tmp739 + dt(12, 0) * samples(3, 12);
+  const Scalar _tmp741 = -std::pow(_tmp260, Scalar(2));
+  const Scalar _tmp742 = -std::pow(_tmp735, Scalar(2));
+  const Scalar _tmp743 = (Scalar(1) / Scalar(2)) * _tmp741 + (Scalar(1) / Scalar(2)) * _tmp742 + 1;
+  const Scalar _tmp744 = (Scalar(1) / Scalar(2)) * _tmp167 * _tmp260;
+  const Scalar _tmp745 = _tmp735 + _tmp744;
+  const Scalar _tmp746 = (Scalar(1) / Scalar(2)) * _tmp143 * _tmp731 -
+                         Scalar(1) / Scalar(2) * _tmp19 * _tmp728 + _tmp730;
+  const Scalar _tmp747 = _tmp733 * _tmp746 + dt(12, 0) * samples(5, 12);
+  const Scalar _tmp748 = _tmp227 + _tmp41;
+  const Scalar _tmp749 = (Scalar(1) / Scalar(2)) * _tmp748;
+  const Scalar _tmp750 = _tmp166 * _tmp749;
+  const Scalar _tmp751 = -_tmp259 + _tmp750;
+  const Scalar _tmp752 = std::pow(dt(11, 0), Scalar(2));
+  const Scalar _tmp753 = _tmp752 * samples(0, 11);
+  const Scalar _tmp754 = _tmp752 * samples(1, 11);
+  const Scalar _tmp755 = _tmp753 * samples(4, 11) - _tmp754 * samples(3, 11);
+  const Scalar _tmp756 = _tmp752 * samples(2, 11);
+  const Scalar _tmp757 = _tmp754 * samples(5, 11) - _tmp756 * samples(4, 11);
+  const Scalar _tmp758 = -_tmp753 * samples(5, 11) + _tmp756 * samples(3, 11);
+  const Scalar _tmp759 = -Scalar(1) / Scalar(2) * _tmp144 * _tmp755 +
+                         (Scalar(1) / Scalar(2)) * _tmp757 * _tmp82 + _tmp758;
+  const Scalar _tmp760 = (Scalar(1) / Scalar(2)) * dt(11, 0);
+  const Scalar _tmp761 = _tmp759 * _tmp760 + dt(11, 0) * samples(4, 11);
+  const Scalar _tmp762 = (Scalar(1) / Scalar(2)) * _tmp144 * _tmp758 -
+                         Scalar(1) / Scalar(2) * _tmp20 * _tmp757 + _tmp755;
+  const Scalar _tmp763 = _tmp760 * _tmp762 + dt(11, 0) * samples(5, 11);
+  const Scalar _tmp764 = (Scalar(1) / Scalar(2)) * _tmp166 * _tmp259;
+  const Scalar _tmp765 = _tmp748 + _tmp764;
+  const Scalar _tmp766 = -std::pow(_tmp748, Scalar(2));
+  const Scalar _tmp767 = -std::pow(_tmp259, Scalar(2));
+  const Scalar _tmp768 = (Scalar(1) / Scalar(2)) * _tmp766 + (Scalar(1) / Scalar(2)) * _tmp767 + 1;
+  const Scalar _tmp769 = (Scalar(1) / Scalar(2)) * _tmp20 * _tmp755 + _tmp757 -
+                         Scalar(1) / Scalar(2) * _tmp758 * _tmp82;
+  const Scalar _tmp770 = _tmp760 * _tmp769 + dt(11, 0) * samples(3, 11);
+  const Scalar _tmp771 = std::pow(dt(10, 0), Scalar(2));
+  const Scalar _tmp772 = _tmp771 * samples(0, 10);
+  const Scalar _tmp773 = _tmp771 * samples(1, 10);
+  const Scalar _tmp774 = _tmp772 * samples(4, 10) - _tmp773 * samples(3, 10);
+  const Scalar _tmp775 = _tmp771 * samples(2, 10);
+  const Scalar _tmp776 = -_tmp772 * samples(5, 10) + _tmp775 * samples(3, 10);
+  const Scalar _tmp777 = _tmp773 * samples(5, 10) - _tmp775 * samples(4, 10);
+  const Scalar _tmp778 = (Scalar(1) / Scalar(2)) * _tmp21 * _tmp774 -
+                         Scalar(1) / Scalar(2) * _tmp776 * _tmp83 + _tmp777;
+  const Scalar _tmp779 = (Scalar(1) / Scalar(2)) * dt(10, 0);
+  const Scalar _tmp780 = _tmp778 * _tmp779 + dt(10, 0) * samples(3, 10);
+  const Scalar _tmp781 = -std::pow(_tmp258, Scalar(2));
+  const Scalar _tmp782 = _tmp226 + _tmp40;
+  const Scalar _tmp783 = -std::pow(_tmp782, Scalar(2));
+  const Scalar _tmp784 = (Scalar(1) / Scalar(2)) * _tmp781 + (Scalar(1) / Scalar(2)) * _tmp783 + 1;
+  const Scalar _tmp785 = -Scalar(1) / Scalar(2) * _tmp145 * _tmp774 + _tmp776 +
+                         (Scalar(1) / Scalar(2)) * _tmp777 * _tmp83;
+  const Scalar _tmp786 = _tmp779 * _tmp785 + dt(10, 0) * samples(4, 10);
+  const Scalar _tmp787 = (Scalar(1) / Scalar(2)) * _tmp165;
+  const Scalar _tmp788 = _tmp782 * _tmp787;
+  const Scalar _tmp789 = -_tmp258 + _tmp788;
+  const Scalar _tmp790 = _tmp258 * _tmp787;
+  const Scalar _tmp791 = _tmp782 + _tmp790;
+  const Scalar _tmp792 = (Scalar(1) / Scalar(2)) * _tmp145 * _tmp776 -
+                         Scalar(1) / Scalar(2) * _tmp21 * _tmp777 + _tmp774;
+  const Scalar _tmp793 = _tmp779 * _tmp792 + dt(10, 0) * samples(5, 10);
+  const Scalar _tmp794 = _tmp225 + _tmp39;
+  const Scalar _tmp795 = -std::pow(_tmp794, Scalar(2));
+  const Scalar _tmp796 = -std::pow(_tmp257, Scalar(2));
+  const Scalar _tmp797 = (Scalar(1) / Scalar(2)) * _tmp795 + (Scalar(1) / Scalar(2)) * _tmp796 + 1;
+  const Scalar _tmp798 = std::pow(dt(9, 0), Scalar(2));
+  const Scalar _tmp799 = _tmp798 * samples(3, 9);
+  const Scalar _tmp800 = _tmp798 * samples(4, 9);
+  const Scalar _tmp801 = -_tmp799 * samples(1, 9) + _tmp800 * samples(0, 9);
+  const Scalar _tmp802 = _tmp798 * samples(5, 9);
+  const Scalar _tmp803 = _tmp799 * samples(2, 9) - _tmp802 * samples(0, 9);
+  const Scalar _tmp804 = -_tmp800 * samples(2, 9) + _tmp802 * samples(1, 9);
+  const Scalar _tmp805 = (Scalar(1) / Scalar(2)) * _tmp22 * _tmp801 -
+                         Scalar(1) / Scalar(2) * _tmp803 * _tmp84 + _tmp804;
+  const Scalar _tmp806 = (Scalar(1) / Scalar(2)) * dt(9, 0);
+  const Scalar _tmp807 = _tmp805 * _tmp806 + dt(9, 0) * samples(3, 9);
+  const Scalar _tmp808 = (Scalar(1) / Scalar(2)) * _tmp146 * _tmp803 -
+                         Scalar(1) / Scalar(2) * _tmp22 * _tmp804 + _tmp801;
+  const Scalar _tmp809 = _tmp806 * _tmp808 + dt(9, 0) * samples(5, 9);
+  const Scalar _tmp810 = (Scalar(1) / Scalar(2)) * _tmp257;
+  const Scalar _tmp811 = _tmp164 * _tmp810;
+  const Scalar _tmp812 = _tmp794 + _tmp811;
+  const Scalar _tmp813 = (Scalar(1) / Scalar(2)) * _tmp164 * _tmp794;
+  const Scalar _tmp814 = -_tmp257 + _tmp813;
+  const Scalar _tmp815 = -Scalar(1) / Scalar(2) * _tmp146 * _tmp801 + _tmp803 +
+                         (Scalar(1) / Scalar(2)) * _tmp804 * _tmp84;
+  const Scalar _tmp816 = _tmp806 * _tmp815 + dt(9, 0) * samples(4, 9);
+  const Scalar _tmp817 = (Scalar(1) / Scalar(2)) * _tmp163 * _tmp256;
+  const Scalar _tmp818 = _tmp224 + _tmp38;
+  const Scalar _tmp819 = _tmp817 + _tmp818;
+  const Scalar _tmp820 = std::pow(dt(8, 0), Scalar(2));
+  const Scalar _tmp821 = _tmp820 * samples(3, 8);
+  const Scalar _tmp822 = _tmp820 * samples(0, 8);
+  const Scalar _tmp823 = _tmp821 * samples(2, 8) - _tmp822 * samples(5, 8);
+  const Scalar _tmp824 = _tmp820 * samples(5, 8);
+  const Scalar _tmp825 = _tmp820 * samples(4, 8);
+  const Scalar _tmp826 = _tmp824 * samples(1, 8) - _tmp825 * samples(2, 8);
+  const Scalar _tmp827 = -_tmp821 * samples(1, 8) + _tmp822 * samples(4, 8);
+  const Scalar _tmp828 = (Scalar(1) / Scalar(2)) * _tmp147 * _tmp823 -
+                         Scalar(1) / Scalar(2) * _tmp23 * _tmp826 + _tmp827;
+  const Scalar _tmp829 = (Scalar(1) / Scalar(2)) * dt(8, 0);
+  const Scalar _tmp830 = _tmp828 * _tmp829 + dt(8, 0) * samples(5, 8);
+  const Scalar _tmp831 = -std::pow(_tmp256, Scalar(2));
+  const Scalar _tmp832 = -std::pow(_tmp818, Scalar(2));
+  const Scalar _tmp833 = (Scalar(1) / Scalar(2)) * _tmp831 + (Scalar(1) / Scalar(2)) * _tmp832 + 1;
+  const Scalar _tmp834 = (Scalar(1) / Scalar(2)) * _tmp23 * _tmp827 -
+                         Scalar(1) / Scalar(2) * _tmp823 * _tmp85 + _tmp826;
+  const Scalar _tmp835 = _tmp829 * _tmp834 + dt(8, 0) * samples(3, 8);
+  const Scalar _tmp836 = -Scalar(1) / Scalar(2) * _tmp147 * _tmp827 + _tmp823 +
+                         (Scalar(1) / Scalar(2)) * _tmp826 * _tmp85;
+  const Scalar _tmp837 = _tmp829 * _tmp836 + dt(8, 0) * samples(4, 8);
+  const Scalar _tmp838 = (Scalar(1) / Scalar(2)) * _tmp818;
+  const Scalar _tmp839 = _tmp163 * _tmp838;
+  const Scalar _tmp840 = -_tmp256 + _tmp839;
+  const Scalar _tmp841 = std::pow(dt(7, 0), Scalar(2));
+  const Scalar _tmp842 = _tmp841 * samples(2, 7);
+  const Scalar _tmp843 = _tmp841 * samples(0, 7);
+  const Scalar _tmp844 = _tmp842 * samples(3, 7) - _tmp843 * samples(5, 7);
+  const Scalar _tmp845 = _tmp841 * samples(1, 7);
+  const Scalar _tmp846 = _tmp843 * samples(4, 7) - _tmp845 * samples(3, 7);
+  const Scalar _tmp847 = -_tmp842 * samples(4, 7) + _tmp845 * samples(5, 7);
+  const Scalar _tmp848 = (Scalar(1) / Scalar(2)) * _tmp24 * _tmp846 -
+                         Scalar(1) / Scalar(2) * _tmp844 * _tmp86 + _tmp847;
+  const Scalar _tmp849 = (Scalar(1) / Scalar(2)) * dt(7, 0);
+  const Scalar _tmp850 = _tmp848 * _tmp849 + dt(7, 0) * samples(3, 7);
+  const Scalar _tmp851 = -std::pow(_tmp255, Scalar(2));
+  const Scalar _tmp852 = _tmp223 + _tmp37;
+  const Scalar _tmp853 = -std::pow(_tmp852, Scalar(2));
+  const Scalar _tmp854 = (Scalar(1) / Scalar(2)) * _tmp851 + (Scalar(1) / Scalar(2)) * _tmp853 + 1;
+  const Scalar _tmp855 = (Scalar(1) / Scalar(2)) * _tmp162;
+  const Scalar _tmp856 = _tmp255 * _tmp855;
+  const Scalar _tmp857 = _tmp852 + _tmp856;
+  const Scalar _tmp858 = (Scalar(1) / Scalar(2)) * _tmp148 * _tmp844 -
+                         Scalar(1) / Scalar(2) * _tmp24 * _tmp847 + _tmp846;
+  const Scalar _tmp859 = _tmp849 * _tmp858 + dt(7, 0) * samples(5, 7);
+  const Scalar _tmp860 = -Scalar(1) / Scalar(2) * _tmp148 * _tmp846 + _tmp844 +
+                         (Scalar(1) / Scalar(2)) * _tmp847 * _tmp86;
+  const Scalar _tmp861 = _tmp849 * _tmp860 + dt(7, 0) * samples(4, 7);
+  const Scalar _tmp862 = _tmp852 * _tmp855;
+  const Scalar _tmp863 = -_tmp255 + _tmp862;
+  const Scalar _tmp864 = std::pow(dt(6, 0), Scalar(2));
+  const Scalar _tmp865 = _tmp864 * samples(5, 6);
+  const Scalar _tmp866 = _tmp864 * samples(4, 6);
+  const Scalar _tmp867 = _tmp865 * samples(1, 6) - _tmp866 * samples(2, 6);
+  const Scalar _tmp868 = _tmp864 * samples(3, 6);
+  const Scalar _tmp869 = -_tmp865 * samples(0, 6) + _tmp868 * samples(2, 6);
+  const Scalar _tmp870 = _tmp866 * samples(0, 6) - _tmp868 * samples(1, 6);
+  const Scalar _tmp871 = (Scalar(1) / Scalar(2)) * _tmp149 * _tmp869 -
+                         Scalar(1) / Scalar(2) * _tmp25 * _tmp867 + _tmp870;
+  const Scalar _tmp872 = (Scalar(1) / Scalar(2)) * dt(6, 0);
+  const Scalar _tmp873 = _tmp871 * _tmp872 + dt(6, 0) * samples(5, 6);
+  const Scalar _tmp874 = (Scalar(1) / Scalar(2)) * _tmp161;
+  const Scalar _tmp875 = _tmp254 * _tmp874;
+  const Scalar _tmp876 = _tmp222 + _tmp36;
+  const Scalar _tmp877 = _tmp875 + _tmp876;
+  const Scalar _tmp878 = -Scalar(1) / Scalar(2) * _tmp149 * _tmp870 +
+                         (Scalar(1) / Scalar(2)) * _tmp867 * _tmp87 + _tmp869;
+  const Scalar _tmp879 = _tmp872 * _tmp878 + dt(6, 0) * samples(4, 6);
+  const Scalar _tmp880 = _tmp874 * _tmp876;
+  const Scalar _tmp881 = -_tmp254 + _tmp880;
+  const Scalar _tmp882 = (Scalar(1) / Scalar(2)) * _tmp25 * _tmp870 + _tmp867 -
+                         Scalar(1) / Scalar(2) * _tmp869 * _tmp87;
+  const Scalar _tmp883 = _tmp872 * _tmp882 + dt(6, 0) * samples(3, 6);
+  const Scalar _tmp884 = -std::pow(_tmp876, Scalar(2));
+  const Scalar _tmp885 = -std::pow(_tmp254, Scalar(2));
+  const Scalar _tmp886 = (Scalar(1) / Scalar(2)) * _tmp884 + (Scalar(1) / Scalar(2)) * _tmp885 + 1;
+  const Scalar _tmp887 = std::pow(dt(5, 0), Scalar(2));
+  const Scalar _tmp888 = _tmp887 * samples(1, 5);
+  const Scalar _tmp889 = _tmp887 * samples(4, 5);
+  const Scalar _tmp890 = _tmp888 * samples(5, 5) - _tmp889 * samples(2, 5);
+  const Scalar _tmp891 = _tmp887 * samples(5, 5);
+  const Scalar _tmp892 = _tmp887 * samples(3, 5);
+  const Scalar _tmp893 = -_tmp891 * samples(0, 5) + _tmp892 * samples(2, 5);
+  const Scalar _tmp894 = -_tmp888 * samples(3, 5) + _tmp889 * samples(0, 5);
+  const Scalar _tmp895 = (Scalar(1) / Scalar(2)) * _tmp150 * _tmp893 -
+                         Scalar(1) / Scalar(2) * _tmp26 * _tmp890 + _tmp894;
+  const Scalar _tmp896 = (Scalar(1) / Scalar(2)) * dt(5, 0);
+  const Scalar _tmp897 = _tmp895 * _tmp896 + dt(5, 0) * samples(5, 5);
+  const Scalar _tmp898 = (Scalar(1) / Scalar(2)) * _tmp160;
+  const Scalar _tmp899 = _tmp253 * _tmp898;
+  const Scalar _tmp900 = _tmp221 + _tmp35;
+  const Scalar _tmp901 = _tmp899 + _tmp900;
+  const Scalar _tmp902 = -Scalar(1) / Scalar(2) * _tmp150 * _tmp894 +
+                         (Scalar(1) / Scalar(2)) * _tmp88 * _tmp890 + _tmp893;
+  const Scalar _tmp903 = _tmp896 * _tmp902 + dt(5, 0) * samples(4, 5);
+  const Scalar _tmp904 = _tmp898 * _tmp900;
+  const Scalar _tmp905 = -_tmp253 + _tmp904;
+  const Scalar _tmp906 = -std::pow(_tmp253, Scalar(2));
+  const Scalar _tmp907 = -std::pow(_tmp900, Scalar(2));
+  const Scalar _tmp908 = (Scalar(1) / Scalar(2)) * _tmp906 + (Scalar(1) / Scalar(2)) * _tmp907 + 1;
+  const Scalar _tmp909 = (Scalar(1) / Scalar(2)) * _tmp26 * _tmp894 -
+                         Scalar(1) / Scalar(2) * _tmp88 * _tmp893 + _tmp890;
+  const Scalar _tmp910 = _tmp896 * _tmp909 + dt(5, 0) * samples(3, 5);
+  const Scalar _tmp911 = -std::pow(_tmp252, Scalar(2));
+  const Scalar _tmp912 = _tmp220 + _tmp34;
+  const Scalar _tmp913 = -std::pow(_tmp912, Scalar(2));
+  const Scalar _tmp914 = (Scalar(1) / Scalar(2)) * _tmp911 + (Scalar(1) / Scalar(2)) * _tmp913 + 1;
+  const Scalar _tmp915 = std::pow(dt(4, 0), Scalar(2));
+  const Scalar _tmp916 = _tmp915 * samples(4, 4);
+  const Scalar _tmp917 = _tmp915 * samples(3, 4);
+  const Scalar _tmp918 = _tmp916 * samples(0, 4) - _tmp917 * samples(1, 4);
+  const Scalar _tmp919 = _tmp915 * samples(5, 4);
+  const Scalar _tmp920 = _tmp917 * samples(2, 4) - _tmp919 * samples(0, 4);
+  const Scalar _tmp921 = -_tmp916 * samples(2, 4) + _tmp919 * samples(1, 4);
+  const Scalar _tmp922 = (Scalar(1) / Scalar(2)) * _tmp27 * _tmp918 -
+                         Scalar(1) / Scalar(2) * _tmp89 * _tmp920 + _tmp921;
+  const Scalar _tmp923 = (Scalar(1) / Scalar(2)) * dt(4, 0);
+  const Scalar _tmp924 = _tmp922 * _tmp923 + dt(4, 0) * samples(3, 4);
+  const Scalar _tmp925 = (Scalar(1) / Scalar(2)) * _tmp912;
+  const Scalar _tmp926 = _tmp159 * _tmp925;
+  const Scalar _tmp927 = -_tmp252 + _tmp926;
+  const Scalar _tmp928 = -Scalar(1) / Scalar(2) * _tmp151 * _tmp918 +
+                         (Scalar(1) / Scalar(2)) * _tmp89 * _tmp921 + _tmp920;
+  const Scalar _tmp929 = _tmp923 * _tmp928 + dt(4, 0) * samples(4, 4);
+  const Scalar _tmp930 = (Scalar(1) / Scalar(2)) * _tmp151 * _tmp920 -
+                         Scalar(1) / Scalar(2) * _tmp27 * _tmp921 + _tmp918;
+  const Scalar _tmp931 = _tmp923 * _tmp930 + dt(4, 0) * samples(5, 4);
+  const Scalar _tmp932 = (Scalar(1) / Scalar(2)) * _tmp159 * _tmp252;
+  const Scalar _tmp933 = _tmp912 + _tmp932;
+  const Scalar _tmp934 = _tmp219 + _tmp33;
+  const Scalar _tmp935 = (Scalar(1) / Scalar(2)) * _tmp158 * _tmp934;
+  const Scalar _tmp936 = -_tmp251 + _tmp935;
+  const Scalar _tmp937 = std::pow(dt(3, 0), Scalar(2));
+  const Scalar _tmp938 = _tmp937 * samples(1, 3);
+  const Scalar _tmp939 = _tmp937 * samples(4, 3);
+  const Scalar _tmp940 = _tmp938 * samples(5, 3) - _tmp939 * samples(2, 3);
+  const Scalar _tmp941 = -_tmp938 * samples(3, 3) + _tmp939 * samples(0, 3);
+  const Scalar _tmp942 = _tmp937 * samples(5, 3);
+  const Scalar _tmp943 = _tmp937 * samples(3, 3);
+  const Scalar _tmp944 = -_tmp942 * samples(0, 3) + _tmp943 * samples(2, 3);
+  const Scalar _tmp945 = -Scalar(1) / Scalar(2) * _tmp152 * _tmp941 +
+                         (Scalar(1) / Scalar(2)) * _tmp90 * _tmp940 + _tmp944;
+  const Scalar _tmp946 = (Scalar(1) / Scalar(2)) * dt(3, 0);
+  const Scalar _tmp947 = _tmp945 * _tmp946 + dt(3, 0) * samples(4, 3);
+  const Scalar _tmp948 = (Scalar(1) / Scalar(2)) * _tmp28 * _tmp941 -
+                         Scalar(1) / Scalar(2) * _tmp90 * _tmp944 + _tmp940;
+  const Scalar _tmp949 = _tmp946 * _tmp948 + dt(3, 0) * samples(3, 3);
+  const Scalar _tmp950 = -std::pow(_tmp934, Scalar(2));
+  const Scalar _tmp951 = -std::pow(_tmp251, Scalar(2));
+  const Scalar _tmp952 = (Scalar(1) / Scalar(2)) * _tmp950 + (Scalar(1) / Scalar(2)) * _tmp951 + 1;
+  const Scalar _tmp953 = (Scalar(1) / Scalar(2)) * _tmp251;
+  const Scalar _tmp954 = _tmp158 * _tmp953;
+  const Scalar _tmp955 = _tmp934 + _tmp954;
+  const Scalar _tmp956 = (Scalar(1) / Scalar(2)) * _tmp152 * _tmp944 -
+                         Scalar(1) / Scalar(2) * _tmp28 * _tmp940 + _tmp941;
+  const Scalar _tmp957 = _tmp946 * _tmp956 + dt(3, 0) * samples(5, 3);
+  const Scalar _tmp958 = std::pow(dt(2, 0), Scalar(2));
+  const Scalar _tmp959 = _tmp958 * samples(4, 2);
+  const Scalar _tmp960 = _tmp958 * samples(3, 2);
+  const Scalar _tmp961 = _tmp959 * samples(0, 2) - _tmp960 * samples(1, 2);
+  const Scalar _tmp962 = _tmp958 * samples(5, 2);
+  const Scalar _tmp963 = _tmp960 * samples(2, 2) - _tmp962 * samples(0, 2);
+  const Scalar _tmp964 = -_tmp959 * samples(2, 2) + _tmp962 * samples(1, 2);
+  const Scalar _tmp965 = (Scalar(1) / Scalar(2)) * _tmp29 * _tmp961 -
+                         Scalar(1) / Scalar(2) * _tmp91 * _tmp963 + _tmp964;
+  const Scalar _tmp966 = (Scalar(1) / Scalar(2)) * dt(2, 0);
+  const Scalar _tmp967 = _tmp965 * _tmp966 + dt(2, 0) * samples(3, 2);
+  const Scalar _tmp968 = -std::pow(_tmp250, Scalar(2));
+  const Scalar _tmp969 = _tmp218 + _tmp32;
+  const Scalar _tmp970 = -std::pow(_tmp969, Scalar(2));
+  const Scalar _tmp971 = (Scalar(1) / Scalar(2)) * _tmp968 + (Scalar(1) / Scalar(2)) * _tmp970 + 1;
+  const Scalar _tmp972 = -Scalar(1) / Scalar(2) * _tmp153 * _tmp961 +
+                         (Scalar(1) / Scalar(2)) * _tmp91 * _tmp964 + _tmp963;
+  const Scalar _tmp973 = _tmp966 * _tmp972 + dt(2, 0) * samples(4, 2);
+  const Scalar _tmp974 = (Scalar(1) / Scalar(2)) * _tmp969;
+  const Scalar _tmp975 = _tmp157 * _tmp974;
+  const Scalar _tmp976 = -_tmp250 + _tmp975;
+  const Scalar _tmp977 = (Scalar(1) / Scalar(2)) * _tmp153 * _tmp963 -
+                         Scalar(1) / Scalar(2) * _tmp29 * _tmp964 + _tmp961;
+  const Scalar _tmp978 = _tmp966 * _tmp977 + dt(2, 0) * samples(5, 2);
+  const Scalar _tmp979 = (Scalar(1) / Scalar(2)) * _tmp157 * _tmp250;
+  const Scalar _tmp980 = _tmp969 + _tmp979;
+  const Scalar _tmp981 = std::pow(dt(0, 0), Scalar(2));
+  const Scalar _tmp982 = _tmp981 * samples(2, 0);
+  const Scalar _tmp983 = (Scalar(1) / Scalar(2)) * _tmp982;
+  const Scalar _tmp984 = _tmp983 * samples(0, 0);
+  const Scalar _tmp985 = _tmp31 + _tmp984;
+  const Scalar _tmp986 = std::pow(dt(1, 0), Scalar(2));
+  const Scalar _tmp987 = _tmp986 * samples(4, 1);
+  const Scalar _tmp988 = _tmp986 * samples(5, 1);
+  const Scalar _tmp989 = -_tmp987 * samples(2, 1) + _tmp988 * samples(1, 1);
+  const Scalar _tmp990 = _tmp986 * samples(3, 1);
+  const Scalar _tmp991 = -_tmp988 * samples(0, 1) + _tmp990 * samples(2, 1);
+  const Scalar _tmp992 = _tmp987 * samples(0, 1) - _tmp990 * samples(1, 1);
+  const Scalar _tmp993 = (Scalar(1) / Scalar(2)) * _tmp155 * _tmp991 -
+                         Scalar(1) / Scalar(2) * _tmp30 * _tmp989 + _tmp992;
+  const Scalar _tmp994 = (Scalar(1) / Scalar(2)) * dt(1, 0);
+  const Scalar _tmp995 = _tmp993 * _tmp994 + dt(1, 0) * samples(5, 1);
+  const Scalar _tmp996 = -_tmp981 * std::pow(samples(2, 0), Scalar(2));
+  const Scalar _tmp997 = -_tmp981 * std::pow(samples(1, 0), Scalar(2));
+  const Scalar _tmp998 = (Scalar(1) / Scalar(2)) * _tmp996 + (Scalar(1) / Scalar(2)) * _tmp997 + 1;
+  const Scalar _tmp999 = (Scalar(1) / Scalar(2)) * _tmp30 * _tmp992 -
+                         Scalar(1) / Scalar(2) * _tmp93 * _tmp991 + _tmp989;
+  const Scalar _tmp1000 = _tmp994 * _tmp999 + dt(1, 0) * samples(3, 1);
+  const Scalar _tmp1001 = _tmp981 * samples(1, 0);
+  const Scalar _tmp1002 = (Scalar(1) / Scalar(2)) * _tmp1001 * samples(0, 0);
+  const Scalar _tmp1003 = _tmp1002 - _tmp92;
+  const Scalar _tmp1004 = -Scalar(1) / Scalar(2) * _tmp155 * _tmp992 +
+                          (Scalar(1) / Scalar(2)) * _tmp93 * _tmp989 + _tmp991;
+  const Scalar _tmp1005 = _tmp1004 * _tmp994 + dt(1, 0) * samples(4, 1);
+  const Scalar _tmp1006 = _tmp981 * samples(0, 0);
+  const Scalar _tmp1007 = -_tmp1001 * samples(3, 0) + _tmp1006 * samples(4, 0);
+  const Scalar _tmp1008 = -_tmp1006 * samples(5, 0) + _tmp982 * samples(3, 0);
+  const Scalar _tmp1009 = _tmp1001 * samples(5, 0) - _tmp982 * samples(4, 0);
+  const Scalar _tmp1010 = (Scalar(1) / Scalar(2)) * _tmp1007 * _tmp31 -
+                          Scalar(1) / Scalar(2) * _tmp1008 * _tmp92 + _tmp1009;
+  const Scalar _tmp1011 = (Scalar(1) / Scalar(2)) * dt(0, 0);
+  const Scalar _tmp1012 = _tmp1010 * _tmp1011 + dt(0, 0) * samples(3, 0);
+  const Scalar _tmp1013 = _tmp1000 * _tmp998 + _tmp1003 * _tmp1005 + _tmp1012 + _tmp985 * _tmp995;
+  const Scalar _tmp1014 = _tmp1013 + _tmp967 * _tmp971 + _tmp973 * _tmp976 + _tmp978 * _tmp980;
+  const Scalar _tmp1015 = _tmp1014 + _tmp936 * _tmp947 + _tmp949 * _tmp952 + _tmp955 * _tmp957;
+  const Scalar _tmp1016 = _tmp1015 + _tmp914 * _tmp924 + _tmp927 * _tmp929 + _tmp931 * _tmp933;
+  const Scalar _tmp1017 = _tmp1016 + _tmp897 * _tmp901 + _tmp903 * _tmp905 + _tmp908 * _tmp910;
+  const Scalar _tmp1018 = _tmp1017 + _tmp873 * _tmp877 + _tmp879 * _tmp881 + _tmp883 * _tmp886;
+  const Scalar _tmp1019 = _tmp1018 + _tmp850 * _tmp854 + _tmp857 * _tmp859 + _tmp861 * _tmp863;
+  const Scalar _tmp1020 = _tmp1019 + _tmp819 * _tmp830 + _tmp833 * _tmp835 + _tmp837 * _tmp840;
+  const Scalar _tmp1021 = _tmp1020 + _tmp797 * _tmp807 + _tmp809 * _tmp812 + _tmp814 * _tmp816;
+  const Scalar _tmp1022 = _tmp1021 + _tmp780 * _tmp784 + _tmp786 * _tmp789 + _tmp791 * _tmp793;
+  const Scalar _tmp1023 = _tmp1022 + _tmp751 * _tmp761 + _tmp763 * _tmp765 + _tmp768 * _tmp770;
+  const Scalar _tmp1024 = _tmp1023 + _tmp734 * _tmp738 + _tmp740 * _tmp743 + _tmp745 * _tmp747;
+  const Scalar _tmp1025 = _tmp1024 + _tmp711 * _tmp715 + _tmp718 * _tmp720 + _tmp722 * _tmp724;
+  const Scalar _tmp1026 = _tmp1025 + _tmp682 * _tmp692 + _tmp695 * _tmp697 + _tmp699 * _tmp701;
+  const Scalar _tmp1027 = _tmp1026 + _tmp665 * _tmp668 + _tmp671 * _tmp673 + _tmp676 * _tmp678;
+  const Scalar _tmp1028 = _tmp1027 + _tmp636 * _tmp646 + _tmp648 * _tmp650 + _tmp652 * _tmp655;
+  const Scalar _tmp1029 = _tmp1028 + _tmp619 * _tmp623 + _tmp625 * _tmp627 + _tmp630 * _tmp632;
+  const Scalar _tmp1030 = _tmp1029 + _tmp596 * _tmp600 + _tmp603 * _tmp605 + _tmp607 * _tmp609;
+  const Scalar _tmp1031 = _tmp1030 + _tmp573 * _tmp577 + _tmp579 * _tmp582 + _tmp584 * _tmp586;
+  const Scalar _tmp1032 = _tmp1031 + _tmp550 * _tmp554 + _tmp557 * _tmp559 + _tmp561 * _tmp563;
+  const Scalar _tmp1033 = _tmp1032 + _tmp527 * _tmp530 + _tmp533 * _tmp535 + _tmp537 * _tmp540;
+  const Scalar _tmp1034 = _tmp1033 + _tmp499 * _tmp509 + _tmp511 * _tmp513 + _tmp516 * _tmp518;
+  const Scalar _tmp1035 = _tmp1034 + _tmp482 * _tmp485 + _tmp487 * _tmp490 + _tmp493 * _tmp495;
+  const Scalar _tmp1036 = _tmp1035 + _tmp460 * _tmp464 + _tmp466 * _tmp469 + _tmp471 * _tmp473;
+  const Scalar _tmp1037 = _tmp1036 + _tmp430 * _tmp440 + _tmp443 * _tmp445 + _tmp448 * _tmp450;
+  const Scalar _tmp1038 = _tmp1037 + _tmp414 * _tmp418 + _tmp420 * _tmp422 + _tmp425 * _tmp427;
+  const Scalar _tmp1039 = _tmp1038 + _tmp385 * _tmp395 + _tmp397 * _tmp399 + _tmp402 * _tmp404;
+  const Scalar _tmp1040 = _tmp1039 + _tmp368 * _tmp372 + _tmp374 * _tmp377 + _tmp379 * _tmp381;
+  const Scalar _tmp1041 = _tmp1040 + _tmp339 * _tmp349 + _tmp352 * _tmp354 + _tmp356 * _tmp358;
+  const Scalar _tmp1042 = _tmp1041 + _tmp322 * _tmp326 + _tmp328 * _tmp331 + _tmp333 * _tmp335;
+  const Scalar _tmp1043 = _tmp1042 + _tmp293 * _tmp303 + _tmp305 * _tmp307 + _tmp309 * _tmp312;
+  const Scalar _tmp1044 = _tmp247 * _tmp310;
+  const Scalar _tmp1045 = _tmp1044 - _tmp186;
+  const Scalar _tmp1046 = -std::pow(_tmp186, Scalar(2));
+  const Scalar _tmp1047 =
+      (Scalar(1) / Scalar(2)) * _tmp1046 + (Scalar(1) / Scalar(2)) * _tmp292 + 1;
+  const Scalar _tmp1048 = _tmp279 + _tmp304;
+  const Scalar _tmp1049 = -std::pow(_tmp185, Scalar(2));
+  const Scalar _tmp1050 =
+      (Scalar(1) / Scalar(2)) * _tmp1049 + (Scalar(1) / Scalar(2)) * _tmp323 + 1;
+  const Scalar _tmp1051 = (Scalar(1) / Scalar(2)) * _tmp278 * _tmp324;
+  const Scalar _tmp1052 = _tmp1051 - _tmp185;
+  const Scalar _tmp1053 = _tmp278 + _tmp334;
+  const Scalar _tmp1054 = (Scalar(1) / Scalar(2)) * _tmp277 * _tmp336;
+  const Scalar _tmp1055 = _tmp1054 - _tmp184;
+  const Scalar _tmp1056 = -std::pow(_tmp184, Scalar(2));
+  const Scalar _tmp1057 =
+      (Scalar(1) / Scalar(2)) * _tmp1056 + (Scalar(1) / Scalar(2)) * _tmp338 + 1;
+  const Scalar _tmp1058 = _tmp277 + _tmp355;
+  const Scalar _tmp1059 = _tmp276 + _tmp376;
+  const Scalar _tmp1060 = -std::pow(_tmp183, Scalar(2));
+  const Scalar _tmp1061 =
+      (Scalar(1) / Scalar(2)) * _tmp1060 + (Scalar(1) / Scalar(2)) * _tmp369 + 1;
+  const Scalar _tmp1062 = (Scalar(1) / Scalar(2)) * _tmp276 * _tmp370;
+  const Scalar _tmp1063 = _tmp1062 - _tmp183;
+  const Scalar _tmp1064 = (Scalar(1) / Scalar(2)) * _tmp275 * _tmp384;
+  const Scalar _tmp1065 = _tmp1064 - _tmp182;
+  const Scalar _tmp1066 = _tmp275 + _tmp398;
+  const Scalar _tmp1067 = -std::pow(_tmp182, Scalar(2));
+  const Scalar _tmp1068 =
+      (Scalar(1) / Scalar(2)) * _tmp1067 + (Scalar(1) / Scalar(2)) * _tmp401 + 1;
+  const Scalar _tmp1069 = -std::pow(_tmp181, Scalar(2));
+  const Scalar _tmp1070 =
+      (Scalar(1) / Scalar(2)) * _tmp1069 + (Scalar(1) / Scalar(2)) * _tmp415 + 1;
+  const Scalar _tmp1071 = _tmp274 + _tmp421;
+  const Scalar _tmp1072 = _tmp416 * _tmp423;
+  const Scalar _tmp1073 = _tmp1072 - _tmp181;
+  const Scalar _tmp1074 = _tmp428 * _tmp446;
+  const Scalar _tmp1075 = _tmp1074 - _tmp180;
+  const Scalar _tmp1076 = -std::pow(_tmp180, Scalar(2));
+  const Scalar _tmp1077 =
+      (Scalar(1) / Scalar(2)) * _tmp1076 + (Scalar(1) / Scalar(2)) * _tmp441 + 1;
+  const Scalar _tmp1078 = _tmp273 + _tmp429;
+  const Scalar _tmp1079 = _tmp272 + _tmp472;
+  const Scalar _tmp1080 = -std::pow(_tmp179, Scalar(2));
+  const Scalar _tmp1081 =
+      (Scalar(1) / Scalar(2)) * _tmp1080 + (Scalar(1) / Scalar(2)) * _tmp468 + 1;
+  const Scalar _tmp1082 = (Scalar(1) / Scalar(2)) * _tmp272 * _tmp463;
+  const Scalar _tmp1083 = _tmp1082 - _tmp179;
+  const Scalar _tmp1084 = _tmp483 * _tmp491;
+  const Scalar _tmp1085 = _tmp1084 - _tmp178;
+  const Scalar _tmp1086 = -std::pow(_tmp178, Scalar(2));
+  const Scalar _tmp1087 =
+      (Scalar(1) / Scalar(2)) * _tmp1086 + (Scalar(1) / Scalar(2)) * _tmp489 + 1;
+  const Scalar _tmp1088 = _tmp271 + _tmp484;
+  const Scalar _tmp1089 = (Scalar(1) / Scalar(2)) * _tmp270 * _tmp496;
+  const Scalar _tmp1090 = _tmp1089 - _tmp177;
+  const Scalar _tmp1091 = _tmp270 + _tmp498;
+  const Scalar _tmp1092 = -std::pow(_tmp177, Scalar(2));
+  const Scalar _tmp1093 =
+      (Scalar(1) / Scalar(2)) * _tmp1092 + (Scalar(1) / Scalar(2)) * _tmp514 + 1;
+  const Scalar _tmp1094 = _tmp269 + _tmp529;
+  const Scalar _tmp1095 = _tmp528 * _tmp538;
+  const Scalar _tmp1096 = _tmp1095 - _tmp176;
+  const Scalar _tmp1097 = -std::pow(_tmp176, Scalar(2));
+  const Scalar _tmp1098 =
+      (Scalar(1) / Scalar(2)) * _tmp1097 + (Scalar(1) / Scalar(2)) * _tmp532 + 1;
+  const Scalar _tmp1099 = -std::pow(_tmp175, Scalar(2));
+  const Scalar _tmp1100 =
+      (Scalar(1) / Scalar(2)) * _tmp1099 + (Scalar(1) / Scalar(2)) * _tmp551 + 1;
+  const Scalar _tmp1101 = _tmp268 + _tmp556;
+  const Scalar _tmp1102 = (Scalar(1) / Scalar(2)) * _tmp268 * _tmp552;
+  const Scalar _tmp1103 = _tmp1102 - _tmp175;
+  const Scalar _tmp1104 = -std::pow(_tmp174, Scalar(2));
+  const Scalar _tmp1105 =
+      (Scalar(1) / Scalar(2)) * _tmp1104 + (Scalar(1) / Scalar(2)) * _tmp580 + 1;
+  const Scalar _tmp1106 = (Scalar(1) / Scalar(2)) * _tmp267 * _tmp576;
+  const Scalar _tmp1107 = _tmp1106 - _tmp174;
+  const Scalar _tmp1108 = _tmp267 + _tmp583;
+  const Scalar _tmp1109 = -std::pow(_tmp173, Scalar(2));
+  const Scalar _tmp1110 =
+      (Scalar(1) / Scalar(2)) * _tmp1109 + (Scalar(1) / Scalar(2)) * _tmp597 + 1;
+  const Scalar _tmp1111 = _tmp266 * _tmp601;
+  const Scalar _tmp1112 = _tmp1111 - _tmp173;
+  const Scalar _tmp1113 = _tmp266 + _tmp602;
+  const Scalar _tmp1114 = (Scalar(1) / Scalar(2)) * _tmp265 * _tmp622;
+  const Scalar _tmp1115 = _tmp1114 - _tmp172;
+  const Scalar _tmp1116 = _tmp265 + _tmp626;
+  const Scalar _tmp1117 = -std::pow(_tmp172, Scalar(2));
+  const Scalar _tmp1118 =
+      (Scalar(1) / Scalar(2)) * _tmp1117 + (Scalar(1) / Scalar(2)) * _tmp628 + 1;
+  const Scalar _tmp1119 = _tmp264 * _tmp634;
+  const Scalar _tmp1120 = _tmp1119 - _tmp171;
+  const Scalar _tmp1121 = _tmp264 + _tmp635;
+  const Scalar _tmp1122 = -std::pow(_tmp171, Scalar(2));
+  const Scalar _tmp1123 =
+      (Scalar(1) / Scalar(2)) * _tmp1122 + (Scalar(1) / Scalar(2)) * _tmp654 + 1;
+  const Scalar _tmp1124 = _tmp263 + _tmp670;
+  const Scalar _tmp1125 = -std::pow(_tmp170, Scalar(2));
+  const Scalar _tmp1126 =
+      (Scalar(1) / Scalar(2)) * _tmp1125 + (Scalar(1) / Scalar(2)) * _tmp675 + 1;
+  const Scalar _tmp1127 = _tmp263 * _tmp669;
+  const Scalar _tmp1128 = _tmp1127 - _tmp170;
+  const Scalar _tmp1129 = -std::pow(_tmp169, Scalar(2));
+  const Scalar _tmp1130 =
+      (Scalar(1) / Scalar(2)) * _tmp1129 + (Scalar(1) / Scalar(2)) * _tmp681 + 1;
+  const Scalar _tmp1131 = _tmp262 + _tmp694;
+  const Scalar _tmp1132 = _tmp262 * _tmp693;
+  const Scalar _tmp1133 = _tmp1132 - _tmp169;
+  const Scalar _tmp1134 = (Scalar(1) / Scalar(2)) * _tmp261 * _tmp712;
+  const Scalar _tmp1135 = _tmp1134 - _tmp168;
+  const Scalar _tmp1136 = -std::pow(_tmp168, Scalar(2));
+  const Scalar _tmp1137 =
+      (Scalar(1) / Scalar(2)) * _tmp1136 + (Scalar(1) / Scalar(2)) * _tmp717 + 1;
+  const Scalar _tmp1138 = _tmp261 + _tmp714;
+  const Scalar _tmp1139 = _tmp260 + _tmp737;
+  const Scalar _tmp1140 = -std::pow(_tmp167, Scalar(2));
+  const Scalar _tmp1141 =
+      (Scalar(1) / Scalar(2)) * _tmp1140 + (Scalar(1) / Scalar(2)) * _tmp741 + 1;
+  const Scalar _tmp1142 = _tmp260 * _tmp736;
+  const Scalar _tmp1143 = _tmp1142 - _tmp167;
+  const Scalar _tmp1144 = _tmp259 + _tmp750;
+  const Scalar _tmp1145 = -std::pow(_tmp166, Scalar(2));
+  const Scalar _tmp1146 =
+      (Scalar(1) / Scalar(2)) * _tmp1145 + (Scalar(1) / Scalar(2)) * _tmp767 + 1;
+  const Scalar _tmp1147 = _tmp259 * _tmp749;
+  const Scalar _tmp1148 = _tmp1147 - _tmp166;
+  const Scalar _tmp1149 = (Scalar(1) / Scalar(2)) * _tmp258 * _tmp782;
+  const Scalar _tmp1150 = _tmp1149 - _tmp165;
+  const Scalar _tmp1151 = _tmp258 + _tmp788;
+  const Scalar _tmp1152 = -std::pow(_tmp165, Scalar(2));
+  const Scalar _tmp1153 =
+      (Scalar(1) / Scalar(2)) * _tmp1152 + (Scalar(1) / Scalar(2)) * _tmp781 + 1;
+  const Scalar _tmp1154 = -std::pow(_tmp164, Scalar(2));
+  const Scalar _tmp1155 =
+      (Scalar(1) / Scalar(2)) * _tmp1154 + (Scalar(1) / Scalar(2)) * _tmp796 + 1;
+  const Scalar _tmp1156 = _tmp257 + _tmp813;
+  const Scalar _tmp1157 = _tmp794 * _tmp810;
+  const Scalar _tmp1158 = _tmp1157 - _tmp164;
+  const Scalar _tmp1159 = _tmp256 * _tmp838;
+  const Scalar _tmp1160 = _tmp1159 - _tmp163;
+  const Scalar _tmp1161 = -std::pow(_tmp163, Scalar(2));
+  const Scalar _tmp1162 =
+      (Scalar(1) / Scalar(2)) * _tmp1161 + (Scalar(1) / Scalar(2)) * _tmp831 + 1;
+  const Scalar _tmp1163 = _tmp256 + _tmp839;
+  const Scalar _tmp1164 = (Scalar(1) / Scalar(2)) * _tmp255 * _tmp852;
+  const Scalar _tmp1165 = _tmp1164 - _tmp162;
+  const Scalar _tmp1166 = _tmp255 + _tmp862;
+  const Scalar _tmp1167 = -std::pow(_tmp162, Scalar(2));
+  const Scalar _tmp1168 =
+      (Scalar(1) / Scalar(2)) * _tmp1167 + (Scalar(1) / Scalar(2)) * _tmp851 + 1;
+  const Scalar _tmp1169 = _tmp254 + _tmp880;
+  const Scalar _tmp1170 = -std::pow(_tmp161, Scalar(2));
+  const Scalar _tmp1171 =
+      (Scalar(1) / Scalar(2)) * _tmp1170 + (Scalar(1) / Scalar(2)) * _tmp885 + 1;
+  const Scalar _tmp1172 = (Scalar(1) / Scalar(2)) * _tmp254 * _tmp876;
+  const Scalar _tmp1173 = _tmp1172 - _tmp161;
+  const Scalar _tmp1174 = -std::pow(_tmp160, Scalar(2));
+  const Scalar _tmp1175 =
+      (Scalar(1) / Scalar(2)) * _tmp1174 + (Scalar(1) / Scalar(2)) * _tmp906 + 1;
+  const Scalar _tmp1176 = (Scalar(1) / Scalar(2)) * _tmp253 * _tmp900;
+  const Scalar _tmp1177 = _tmp1176 - _tmp160;
+  const Scalar _tmp1178 = _tmp253 + _tmp904;
+  const Scalar _tmp1179 = _tmp252 * _tmp925;
+  const Scalar _tmp1180 = _tmp1179 - _tmp159;
+  const Scalar _tmp1181 = _tmp252 + _tmp926;
+  const Scalar _tmp1182 = -std::pow(_tmp159, Scalar(2));
+  const Scalar _tmp1183 =
+      (Scalar(1) / Scalar(2)) * _tmp1182 + (Scalar(1) / Scalar(2)) * _tmp911 + 1;
+  const Scalar _tmp1184 = _tmp934 * _tmp953;
+  const Scalar _tmp1185 = _tmp1184 - _tmp158;
+  const Scalar _tmp1186 = -std::pow(_tmp158, Scalar(2));
+  const Scalar _tmp1187 =
+      (Scalar(1) / Scalar(2)) * _tmp1186 + (Scalar(1) / Scalar(2)) * _tmp951 + 1;
+  const Scalar _tmp1188 = _tmp251 + _tmp935;
+  const Scalar _tmp1189 = _tmp250 * _tmp974;
+  const Scalar _tmp1190 = _tmp1189 - _tmp157;
+  const Scalar _tmp1191 = -std::pow(_tmp157, Scalar(2));
+  const Scalar _tmp1192 =
+      (Scalar(1) / Scalar(2)) * _tmp1191 + (Scalar(1) / Scalar(2)) * _tmp968 + 1;
+  const Scalar _tmp1193 = _tmp250 + _tmp975;
+  const Scalar _tmp1194 = _tmp1002 + _tmp92;
+  const Scalar _tmp1195 = _tmp983 * samples(1, 0);
+  const Scalar _tmp1196 = _tmp1195 - _tmp154;
+  const Scalar _tmp1197 = -_tmp981 * std::pow(samples(0, 0), Scalar(2));
+  const Scalar _tmp1198 =
+      (Scalar(1) / Scalar(2)) * _tmp1197 + (Scalar(1) / Scalar(2)) * _tmp996 + 1;
+  const Scalar _tmp1199 = -Scalar(1) / Scalar(2) * _tmp1007 * _tmp154 + _tmp1008 +
+                          (Scalar(1) / Scalar(2)) * _tmp1009 * _tmp92;
+  const Scalar _tmp1200 = _tmp1011 * _tmp1199 + dt(0, 0) * samples(4, 0);
+  const Scalar _tmp1201 = _tmp1000 * _tmp1194 + _tmp1005 * _tmp1198 + _tmp1196 * _tmp995 + _tmp1200;
+  const Scalar _tmp1202 = _tmp1190 * _tmp978 + _tmp1192 * _tmp973 + _tmp1193 * _tmp967 + _tmp1201;
+  const Scalar _tmp1203 = _tmp1185 * _tmp957 + _tmp1187 * _tmp947 + _tmp1188 * _tmp949 + _tmp1202;
+  const Scalar _tmp1204 = _tmp1180 * _tmp931 + _tmp1181 * _tmp924 + _tmp1183 * _tmp929 + _tmp1203;
+  const Scalar _tmp1205 = _tmp1175 * _tmp903 + _tmp1177 * _tmp897 + _tmp1178 * _tmp910 + _tmp1204;
+  const Scalar _tmp1206 = _tmp1169 * _tmp883 + _tmp1171 * _tmp879 + _tmp1173 * _tmp873 + _tmp1205;
+  const Scalar _tmp1207 = _tmp1165 * _tmp859 + _tmp1166 * _tmp850 + _tmp1168 * _tmp861 + _tmp1206;
+  const Scalar _tmp1208 = _tmp1160 * _tmp830 + _tmp1162 * _tmp837 + _tmp1163 * _tmp835 + _tmp1207;
+  const Scalar _tmp1209 = _tmp1155 * _tmp816 + _tmp1156 * _tmp807 + _tmp1158 * _tmp809 + _tmp1208;
+  const Scalar _tmp1210 = _tmp1150 * _tmp793 + _tmp1151 * _tmp780 + _tmp1153 * _tmp786 + _tmp1209;
+  const Scalar _tmp1211 = _tmp1144 * _tmp770 + _tmp1146 * _tmp761 + _tmp1148 * _tmp763 + _tmp1210;
+  const Scalar _tmp1212 = _tmp1139 * _tmp740 + _tmp1141 * _tmp734 + _tmp1143 * _tmp747 + _tmp1211;
+  const Scalar _tmp1213 = _tmp1135 * _tmp724 + _tmp1137 * _tmp711 + _tmp1138 * _tmp720 + _tmp1212;
+  const Scalar _tmp1214 = _tmp1130 * _tmp697 + _tmp1131 * _tmp692 + _tmp1133 * _tmp701 + _tmp1213;
+  const Scalar _tmp1215 = _tmp1124 * _tmp678 + _tmp1126 * _tmp673 + _tmp1128 * _tmp665 + _tmp1214;
+  const Scalar _tmp1216 = _tmp1120 * _tmp650 + _tmp1121 * _tmp652 + _tmp1123 * _tmp646 + _tmp1215;
+  const Scalar _tmp1217 = _tmp1115 * _tmp619 + _tmp1116 * _tmp632 + _tmp1118 * _tmp625 + _tmp1216;
+  const Scalar _tmp1218 = _tmp1110 * _tmp605 + _tmp1112 * _tmp609 + _tmp1113 * _tmp596 + _tmp1217;
+  const Scalar _tmp1219 = _tmp1105 * _tmp586 + _tmp1107 * _tmp573 + _tmp1108 * _tmp579 + _tmp1218;
+  const Scalar _tmp1220 = _tmp1100 * _tmp559 + _tmp1101 * _tmp550 + _tmp1103 * _tmp563 + _tmp1219;
+  const Scalar _tmp1221 = _tmp1094 * _tmp535 + _tmp1096 * _tmp537 + _tmp1098 * _tmp527 + _tmp1220;
+  const Scalar _tmp1222 = _tmp1090 * _tmp511 + _tmp1091 * _tmp518 + _tmp1093 * _tmp509 + _tmp1221;
+  const Scalar _tmp1223 = _tmp1085 * _tmp495 + _tmp1087 * _tmp482 + _tmp1088 * _tmp487 + _tmp1222;
+  const Scalar _tmp1224 = _tmp1079 * _tmp466 + _tmp1081 * _tmp471 + _tmp1083 * _tmp460 + _tmp1223;
+  const Scalar _tmp1225 = _tmp1075 * _tmp450 + _tmp1077 * _tmp440 + _tmp1078 * _tmp445 + _tmp1224;
+  const Scalar _tmp1226 = _tmp1070 * _tmp420 + _tmp1071 * _tmp414 + _tmp1073 * _tmp427 + _tmp1225;
+  const Scalar _tmp1227 = _tmp1065 * _tmp395 + _tmp1066 * _tmp404 + _tmp1068 * _tmp397 + _tmp1226;
+  const Scalar _tmp1228 = _tmp1059 * _tmp368 + _tmp1061 * _tmp374 + _tmp1063 * _tmp379 + _tmp1227;
+  const Scalar _tmp1229 = _tmp1055 * _tmp354 + _tmp1057 * _tmp358 + _tmp1058 * _tmp349 + _tmp1228;
+  const Scalar _tmp1230 = _tmp1050 * _tmp333 + _tmp1052 * _tmp328 + _tmp1053 * _tmp322 + _tmp1229;
+  const Scalar _tmp1231 = _tmp1045 * _tmp309 + _tmp1047 * _tmp307 + _tmp1048 * _tmp303 + _tmp1230;
+  const Scalar _tmp1232 = -_tmp247 + _tmp311;
+  const Scalar _tmp1233 = _tmp1044 + _tmp186;
+  const Scalar _tmp1234 =
+      (Scalar(1) / Scalar(2)) * _tmp1046 + (Scalar(1) / Scalar(2)) * _tmp291 + 1;
+  const Scalar _tmp1235 =
+      (Scalar(1) / Scalar(2)) * _tmp1049 + (Scalar(1) / Scalar(2)) * _tmp325 + 1;
+  const Scalar _tmp1236 = -_tmp324 + _tmp330;
+  const Scalar _tmp1237 = _tmp1051 + _tmp185;
+  const Scalar _tmp1238 = -_tmp336 + _tmp351;
+  const Scalar _tmp1239 =
+      (Scalar(1) / Scalar(2)) * _tmp1056 + (Scalar(1) / Scalar(2)) * _tmp337 + 1;
+  const Scalar _tmp1240 = _tmp1054 + _tmp184;
+  const Scalar _tmp1241 =
+      (Scalar(1) / Scalar(2)) * _tmp1060 + (Scalar(1) / Scalar(2)) * _tmp371 + 1;
+  const Scalar _tmp1242 = _tmp1062 + _tmp183;
+  const Scalar _tmp1243 = -_tmp370 + _tmp380;
+  const Scalar _tmp1244 = _tmp1064 + _tmp182;
+  const Scalar _tmp1245 = _tmp383 - _tmp384;
+  const Scalar _tmp1246 =
+      (Scalar(1) / Scalar(2)) * _tmp1067 + (Scalar(1) / Scalar(2)) * _tmp400 + 1;
+  const Scalar _tmp1247 = -_tmp416 + _tmp424;
+  const Scalar _tmp1248 = _tmp1072 + _tmp181;
+  const Scalar _tmp1249 =
+      (Scalar(1) / Scalar(2)) * _tmp1069 + (Scalar(1) / Scalar(2)) * _tmp417 + 1;
+  const Scalar _tmp1250 = -_tmp428 + _tmp447;
+  const Scalar _tmp1251 = _tmp1074 + _tmp180;
+  const Scalar _tmp1252 =
+      (Scalar(1) / Scalar(2)) * _tmp1076 + (Scalar(1) / Scalar(2)) * _tmp442 + 1;
+  const Scalar _tmp1253 = _tmp1082 + _tmp179;
+  const Scalar _tmp1254 = _tmp462 - _tmp463;
+  const Scalar _tmp1255 =
+      (Scalar(1) / Scalar(2)) * _tmp1080 + (Scalar(1) / Scalar(2)) * _tmp467 + 1;
+  const Scalar _tmp1256 = -_tmp483 + _tmp492;
+  const Scalar _tmp1257 =
+      (Scalar(1) / Scalar(2)) * _tmp1086 + (Scalar(1) / Scalar(2)) * _tmp488 + 1;
+  const Scalar _tmp1258 = _tmp1084 + _tmp178;
+  const Scalar _tmp1259 = -_tmp496 + _tmp512;
+  const Scalar _tmp1260 = _tmp1089 + _tmp177;
+  const Scalar _tmp1261 =
+      (Scalar(1) / Scalar(2)) * _tmp1092 + (Scalar(1) / Scalar(2)) * _tmp515 + 1;
+  const Scalar _tmp1262 = -_tmp528 + _tmp539;
+  const Scalar _tmp1263 =
+      (Scalar(1) / Scalar(2)) * _tmp1097 + (Scalar(1) / Scalar(2)) * _tmp531 + 1;
+  const Scalar _tmp1264 = _tmp1095 + _tmp176;
+  const Scalar _tmp1265 = -_tmp552 + _tmp560;
+  const Scalar _tmp1266 = _tmp1102 + _tmp175;
+  const Scalar _tmp1267 =
+      (Scalar(1) / Scalar(2)) * _tmp1099 + (Scalar(1) / Scalar(2)) * _tmp553 + 1;
+  const Scalar _tmp1268 = _tmp1106 + _tmp174;
+  const Scalar _tmp1269 =
+      (Scalar(1) / Scalar(2)) * _tmp1104 + (Scalar(1) / Scalar(2)) * _tmp581 + 1;
+  const Scalar _tmp1270 = _tmp575 - _tmp576;
+  const Scalar _tmp1271 = -_tmp598 + _tmp606;
+  const Scalar _tmp1272 = _tmp1111 + _tmp173;
+  const Scalar _tmp1273 =
+      (Scalar(1) / Scalar(2)) * _tmp1109 + (Scalar(1) / Scalar(2)) * _tmp599 + 1;
+  const Scalar _tmp1274 = _tmp1114 + _tmp172;
+  const Scalar _tmp1275 =
+      (Scalar(1) / Scalar(2)) * _tmp1117 + (Scalar(1) / Scalar(2)) * _tmp629 + 1;
+  const Scalar _tmp1276 = _tmp621 - _tmp622;
+  const Scalar _tmp1277 =
+      (Scalar(1) / Scalar(2)) * _tmp1122 + (Scalar(1) / Scalar(2)) * _tmp653 + 1;
+  const Scalar _tmp1278 = -_tmp633 + _tmp647;
+  const Scalar _tmp1279 = _tmp1119 + _tmp171;
+  const Scalar _tmp1280 = _tmp666 - _tmp667;
+  const Scalar _tmp1281 =
+      (Scalar(1) / Scalar(2)) * _tmp1125 + (Scalar(1) / Scalar(2)) * _tmp674 + 1;
+  const Scalar _tmp1282 = _tmp1127 + _tmp170;
+  const Scalar _tmp1283 = _tmp1132 + _tmp169;
+  const Scalar _tmp1284 = -_tmp679 + _tmp698;
+  const Scalar _tmp1285 =
+      (Scalar(1) / Scalar(2)) * _tmp1129 + (Scalar(1) / Scalar(2)) * _tmp680 + 1;
+  const Scalar _tmp1286 = _tmp1134 + _tmp168;
+  const Scalar _tmp1287 =
+      (Scalar(1) / Scalar(2)) * _tmp1136 + (Scalar(1) / Scalar(2)) * _tmp716 + 1;
+  const Scalar _tmp1288 = -_tmp712 + _tmp721;
+  const Scalar _tmp1289 = _tmp1142 + _tmp167;
+  const Scalar _tmp1290 =
+      (Scalar(1) / Scalar(2)) * _tmp1140 + (Scalar(1) / Scalar(2)) * _tmp742 + 1;
+  const Scalar _tmp1291 = -_tmp735 + _tmp744;
+  const Scalar _tmp1292 = -_tmp748 + _tmp764;
+  const Scalar _tmp1293 = _tmp1147 + _tmp166;
+  const Scalar _tmp1294 =
+      (Scalar(1) / Scalar(2)) * _tmp1145 + (Scalar(1) / Scalar(2)) * _tmp766 + 1;
+  const Scalar _tmp1295 =
+      (Scalar(1) / Scalar(2)) * _tmp1152 + (Scalar(1) / Scalar(2)) * _tmp783 + 1;
+  const Scalar _tmp1296 = _tmp1149 + _tmp165;
+  const Scalar _tmp1297 = -_tmp782 + _tmp790;
+  const Scalar _tmp1298 = -_tmp794 + _tmp811;
+  const Scalar _tmp1299 = _tmp1157 + _tmp164;
+  const Scalar _tmp1300 =
+      (Scalar(1) / Scalar(2)) * _tmp1154 + (Scalar(1) / Scalar(2)) * _tmp795 + 1;
+  const Scalar _tmp1301 =
+      (Scalar(1) / Scalar(2)) * _tmp1161 + (Scalar(1) / Scalar(2)) * _tmp832 + 1;
+  const Scalar _tmp1302 = _tmp1159 + _tmp163;
+  const Scalar _tmp1303 = _tmp817 - _tmp818;
+  const Scalar _tmp1304 = _tmp1164 + _tmp162;
+  const Scalar _tmp1305 =
+      (Scalar(1) / Scalar(2)) * _tmp1167 + (Scalar(1) / Scalar(2)) * _tmp853 + 1;
+  const Scalar _tmp1306 = -_tmp852 + _tmp856;
+  const Scalar _tmp1307 =
+      (Scalar(1) / Scalar(2)) * _tmp1170 + (Scalar(1) / Scalar(2)) * _tmp884 + 1;
+  const Scalar _tmp1308 = _tmp875 - _tmp876;
+  const Scalar _tmp1309 = _tmp1172 + _tmp161;
+  const Scalar _tmp1310 = _tmp899 - _tmp900;
+  const Scalar _tmp1311 = _tmp1176 + _tmp160;
+  const Scalar _tmp1312 =
+      (Scalar(1) / Scalar(2)) * _tmp1174 + (Scalar(1) / Scalar(2)) * _tmp907 + 1;
+  const Scalar _tmp1313 = -_tmp912 + _tmp932;
+  const Scalar _tmp1314 = _tmp1179 + _tmp159;
+  const Scalar _tmp1315 =
+      (Scalar(1) / Scalar(2)) * _tmp1182 + (Scalar(1) / Scalar(2)) * _tmp913 + 1;
+  const Scalar _tmp1316 = -_tmp934 + _tmp954;
+  const Scalar _tmp1317 =
+      (Scalar(1) / Scalar(2)) * _tmp1186 + (Scalar(1) / Scalar(2)) * _tmp950 + 1;
+  const Scalar _tmp1318 = _tmp1184 + _tmp158;
+  const Scalar _tmp1319 = _tmp1189 + _tmp157;
+  const Scalar _tmp1320 =
+      (Scalar(1) / Scalar(2)) * _tmp1191 + (Scalar(1) / Scalar(2)) * _tmp970 + 1;
+  const Scalar _tmp1321 = -_tmp969 + _tmp979;
+  const Scalar _tmp1322 = -_tmp31 + _tmp984;
+  const Scalar _tmp1323 =
+      (Scalar(1) / Scalar(2)) * _tmp1197 + (Scalar(1) / Scalar(2)) * _tmp997 + 1;
+  const Scalar _tmp1324 = _tmp1195 + _tmp154;
+  const Scalar _tmp1325 = _tmp1007 + (Scalar(1) / Scalar(2)) * _tmp1008 * _tmp154 -
+                          Scalar(1) / Scalar(2) * _tmp1009 * _tmp31;
+  const Scalar _tmp1326 = _tmp1011 * _tmp1325 + dt(0, 0) * samples(5, 0);
+  const Scalar _tmp1327 = _tmp1000 * _tmp1322 + _tmp1005 * _tmp1324 + _tmp1323 * _tmp995 + _tmp1326;
+  const Scalar _tmp1328 = _tmp1319 * _tmp973 + _tmp1320 * _tmp978 + _tmp1321 * _tmp967 + _tmp1327;
+  const Scalar _tmp1329 = _tmp1316 * _tmp949 + _tmp1317 * _tmp957 + _tmp1318 * _tmp947 + _tmp1328;
+  const Scalar _tmp1330 = _tmp1313 * _tmp924 + _tmp1314 * _tmp929 + _tmp1315 * _tmp931 + _tmp1329;
+  const Scalar _tmp1331 = _tmp1310 * _tmp910 + _tmp1311 * _tmp903 + _tmp1312 * _tmp897 + _tmp1330;
+  const Scalar _tmp1332 = _tmp1307 * _tmp873 + _tmp1308 * _tmp883 + _tmp1309 * _tmp879 + _tmp1331;
+  const Scalar _tmp1333 = _tmp1304 * _tmp861 + _tmp1305 * _tmp859 + _tmp1306 * _tmp850 + _tmp1332;
+  const Scalar _tmp1334 = _tmp1301 * _tmp830 + _tmp1302 * _tmp837 + _tmp1303 * _tmp835 + _tmp1333;
+  const Scalar _tmp1335 = _tmp1298 * _tmp807 + _tmp1299 * _tmp816 + _tmp1300 * _tmp809 + _tmp1334;
+  const Scalar _tmp1336 = _tmp1295 * _tmp793 + _tmp1296 * _tmp786 + _tmp1297 * _tmp780 + _tmp1335;
+  const Scalar _tmp1337 = _tmp1292 * _tmp770 + _tmp1293 * _tmp761 + _tmp1294 * _tmp763 + _tmp1336;
+  const Scalar _tmp1338 = _tmp1289 * _tmp734 + _tmp1290 * _tmp747 + _tmp1291 * _tmp740 + _tmp1337;
+  const Scalar _tmp1339 = _tmp1286 * _tmp711 + _tmp1287 * _tmp724 + _tmp1288 * _tmp720 + _tmp1338;
+  const Scalar _tmp1340 = _tmp1283 * _tmp697 + _tmp1284 * _tmp692 + _tmp1285 * _tmp701 + _tmp1339;
+  const Scalar _tmp1341 = _tmp1280 * _tmp678 + _tmp1281 * _tmp665 + _tmp1282 * _tmp673 + _tmp1340;
+  const Scalar _tmp1342 = _tmp1277 * _tmp650 + _tmp1278 * _tmp652 + _tmp1279 * _tmp646 + _tmp1341;
+  const Scalar _tmp1343 = _tmp1274 * _tmp625 + _tmp1275 * _tmp619 + _tmp1276 * _tmp632 + _tmp1342;
+  const Scalar _tmp1344 = _tmp1271 * _tmp596 + _tmp1272 * _tmp605 + _tmp1273 * _tmp609 + _tmp1343;
+  const Scalar _tmp1345 = _tmp1268 * _tmp586 + _tmp1269 * _tmp573 + _tmp1270 * _tmp579 + _tmp1344;
+  const Scalar _tmp1346 = _tmp1265 * _tmp550 + _tmp1266 * _tmp559 + _tmp1267 * _tmp563 + _tmp1345;
+  const Scalar _tmp1347 = _tmp1262 * _tmp535 + _tmp1263 * _tmp537 + _tmp1264 * _tmp527 + _tmp1346;
+  const Scalar _tmp1348 = _tmp1259 * _tmp518 + _tmp1260 * _tmp509 + _tmp1261 * _tmp511 + _tmp1347;
+  const Scalar _tmp1349 = _tmp1256 * _tmp487 + _tmp1257 * _tmp495 + _tmp1258 * _tmp482 + _tmp1348;
+  const Scalar _tmp1350 = _tmp1253 * _tmp471 + _tmp1254 * _tmp466 + _tmp1255 * _tmp460 + _tmp1349;
+  const Scalar _tmp1351 = _tmp1250 * _tmp445 + _tmp1251 * _tmp440 + _tmp1252 * _tmp450 + _tmp1350;
+  const Scalar _tmp1352 = _tmp1247 * _tmp414 + _tmp1248 * _tmp420 + _tmp1249 * _tmp427 + _tmp1351;
+  const Scalar _tmp1353 = _tmp1244 * _tmp397 + _tmp1245 * _tmp404 + _tmp1246 * _tmp395 + _tmp1352;
+  const Scalar _tmp1354 = _tmp1241 * _tmp379 + _tmp1242 * _tmp374 + _tmp1243 * _tmp368 + _tmp1353;
+  const Scalar _tmp1355 = _tmp1238 * _tmp349 + _tmp1239 * _tmp354 + _tmp1240 * _tmp358 + _tmp1354;
+  const Scalar _tmp1356 = _tmp1235 * _tmp328 + _tmp1236 * _tmp322 + _tmp1237 * _tmp333 + _tmp1355;
+  const Scalar _tmp1357 = _tmp1232 * _tmp303 + _tmp1233 * _tmp307 + _tmp1234 * _tmp309 + _tmp1356;
+  const Scalar _tmp1358 = (Scalar(1) / Scalar(6)) * _tmp294;
+  const Scalar _tmp1359 = (Scalar(1) / Scalar(2)) * _tmp294;
+  const Scalar _tmp1360 = _tmp1358 * _tmp301 + _tmp1359 * samples(3, 31);
+  const Scalar _tmp1361 = _tmp1358 * _tmp306 + _tmp1359 * samples(4, 31);
+  const Scalar _tmp1362 = _tmp1358 * _tmp308 + _tmp1359 * samples(5, 31);
+  const Scalar _tmp1363 = (Scalar(1) / Scalar(2)) * _tmp313;
+  const Scalar _tmp1364 = (Scalar(1) / Scalar(6)) * _tmp313;
+  const Scalar _tmp1365 = _tmp1363 * samples(3, 30) + _tmp1364 * _tmp320;
+  const Scalar _tmp1366 = _tmp1363 * samples(5, 30) + _tmp1364 * _tmp327;
+  const Scalar _tmp1367 = _tmp1363 * samples(4, 30) + _tmp1364 * _tmp332;
+  const Scalar _tmp1368 = (Scalar(1) / Scalar(6)) * _tmp340;
+  const Scalar _tmp1369 = (Scalar(1) / Scalar(2)) * _tmp340;
+  const Scalar _tmp1370 = _tmp1368 * _tmp347 + _tmp1369 * samples(3, 29);
+  const Scalar _tmp1371 = _tmp1368 * _tmp353 + _tmp1369 * samples(5, 29);
+  const Scalar _tmp1372 = _tmp1368 * _tmp357 + _tmp1369 * samples(4, 29);
+  const Scalar _tmp1373 = (Scalar(1) / Scalar(2)) * _tmp359;
+  const Scalar _tmp1374 = (Scalar(1) / Scalar(6)) * _tmp359;
+  const Scalar _tmp1375 = _tmp1373 * samples(3, 28) + _tmp1374 * _tmp366;
+  const Scalar _tmp1376 = _tmp1373 * samples(5, 28) + _tmp1374 * _tmp378;
+  const Scalar _tmp1377 = _tmp1373 * samples(4, 28) + _tmp1374 * _tmp373;
+  const Scalar _tmp1378 = (Scalar(1) / Scalar(6)) * _tmp386;
+  const Scalar _tmp1379 = (Scalar(1) / Scalar(2)) * _tmp386;
+  const Scalar _tmp1380 = _tmp1378 * _tmp396 + _tmp1379 * samples(4, 27);
+  const Scalar _tmp1381 = _tmp1378 * _tmp393 + _tmp1379 * samples(5, 27);
+  const Scalar _tmp1382 = _tmp1378 * _tmp403 + _tmp1379 * samples(3, 27);
+  const Scalar _tmp1383 = (Scalar(1) / Scalar(6)) * _tmp405;
+  const Scalar _tmp1384 = _tmp1383 * _tmp412 + (Scalar(1) / Scalar(2)) * _tmp407;
+  const Scalar _tmp1385 = _tmp1383 * _tmp419 + (Scalar(1) / Scalar(2)) * _tmp406;
+  const Scalar _tmp1386 = _tmp1383 * _tmp426 + (Scalar(1) / Scalar(2)) * _tmp409;
+  const Scalar _tmp1387 = (Scalar(1) / Scalar(6)) * _tmp431;
+  const Scalar _tmp1388 = _tmp1387 * _tmp438 + (Scalar(1) / Scalar(2)) * _tmp432;
+  const Scalar _tmp1389 = _tmp1387 * _tmp444 + (Scalar(1) / Scalar(2)) * _tmp433;
+  const Scalar _tmp1390 = _tmp1387 * _tmp449 + (Scalar(1) / Scalar(2)) * _tmp435;
+  const Scalar _tmp1391 = (Scalar(1) / Scalar(2)) * _tmp451;
+  const Scalar _tmp1392 = (Scalar(1) / Scalar(6)) * _tmp451;
+  const Scalar _tmp1393 = _tmp1391 * samples(5, 24) + _tmp1392 * _tmp458;
+  const Scalar _tmp1394 = _tmp1391 * samples(3, 24) + _tmp1392 * _tmp465;
+  const Scalar _tmp1395 = _tmp1391 * samples(4, 24) + _tmp1392 * _tmp470;
+  const Scalar _tmp1396 = (Scalar(1) / Scalar(6)) * _tmp474;
+  const Scalar _tmp1397 = _tmp1396 * _tmp480 + (Scalar(1) / Scalar(2)) * _tmp475;
+  const Scalar _tmp1398 = (Scalar(1) / Scalar(2)) * _tmp474;
+  const Scalar _tmp1399 = _tmp1396 * _tmp486 + _tmp1398 * samples(3, 23);
+  const Scalar _tmp1400 = _tmp1396 * _tmp494 + _tmp1398 * samples(5, 23);
+  const Scalar _tmp1401 = (Scalar(1) / Scalar(6)) * _tmp500;
+  const Scalar _tmp1402 = (Scalar(1) / Scalar(2)) * _tmp500;
+  const Scalar _tmp1403 = _tmp1401 * _tmp507 + _tmp1402 * samples(4, 22);
+  const Scalar _tmp1404 = _tmp1401 * _tmp510 + _tmp1402 * samples(5, 22);
+  const Scalar _tmp1405 = _tmp1401 * _tmp517 + _tmp1402 * samples(3, 22);
+  const Scalar _tmp1406 = (Scalar(1) / Scalar(6)) * _tmp519;
+  const Scalar _tmp1407 = (Scalar(1) / Scalar(2)) * _tmp519;
+  const Scalar _tmp1408 = _tmp1406 * _tmp525 + _tmp1407 * samples(4, 21);
+  const Scalar _tmp1409 = _tmp1406 * _tmp534 + _tmp1407 * samples(3, 21);
+  const Scalar _tmp1410 = _tmp1406 * _tmp536 + _tmp1407 * samples(5, 21);
+  const Scalar _tmp1411 = (Scalar(1) / Scalar(6)) * _tmp541;
+  const Scalar _tmp1412 = (Scalar(1) / Scalar(2)) * _tmp541;
+  const Scalar _tmp1413 = _tmp1411 * _tmp548 + _tmp1412 * samples(3, 20);
+  const Scalar _tmp1414 = _tmp1411 * _tmp558 + _tmp1412 * samples(4, 20);
+  const Scalar _tmp1415 = _tmp1411 * _tmp562 + _tmp1412 * samples(5, 20);
+  const Scalar _tmp1416 = (Scalar(1) / Scalar(2)) * _tmp564;
+  const Scalar _tmp1417 = (Scalar(1) / Scalar(6)) * _tmp564;
+  const Scalar _tmp1418 = _tmp1416 * samples(5, 19) + _tmp1417 * _tmp571;
+  const Scalar _tmp1419 = _tmp1416 * samples(3, 19) + _tmp1417 * _tmp578;
+  const Scalar _tmp1420 = _tmp1416 * samples(4, 19) + _tmp1417 * _tmp585;
+  const Scalar _tmp1421 = (Scalar(1) / Scalar(2)) * _tmp587;
+  const Scalar _tmp1422 = (Scalar(1) / Scalar(6)) * _tmp587;
+  const Scalar _tmp1423 = _tmp1421 * samples(4, 18) + _tmp1422 * _tmp604;
+  const Scalar _tmp1424 = _tmp1421 * samples(3, 18) + _tmp1422 * _tmp594;
+  const Scalar _tmp1425 = _tmp1421 * samples(5, 18) + _tmp1422 * _tmp608;
+  const Scalar _tmp1426 = (Scalar(1) / Scalar(2)) * _tmp610;
+  const Scalar _tmp1427 = (Scalar(1) / Scalar(6)) * _tmp610;
+  const Scalar _tmp1428 = _tmp1426 * samples(5, 17) + _tmp1427 * _tmp617;
+  const Scalar _tmp1429 = _tmp1426 * samples(4, 17) + _tmp1427 * _tmp624;
+  const Scalar _tmp1430 = _tmp1426 * samples(3, 17) + _tmp1427 * _tmp631;
+  const Scalar _tmp1431 = (Scalar(1) / Scalar(6)) * _tmp637;
+  const Scalar _tmp1432 = (Scalar(1) / Scalar(2)) * _tmp637;
+  const Scalar _tmp1433 = _tmp1431 * _tmp644 + _tmp1432 * samples(4, 16);
+  const Scalar _tmp1434 = _tmp1431 * _tmp649 + _tmp1432 * samples(5, 16);
+  const Scalar _tmp1435 = _tmp1431 * _tmp651 + _tmp1432 * samples(3, 16);
+  const Scalar _tmp1436 = (Scalar(1) / Scalar(2)) * _tmp656;
+  const Scalar _tmp1437 = (Scalar(1) / Scalar(6)) * _tmp656;
+  const Scalar _tmp1438 = _tmp1436 * samples(5, 15) + _tmp1437 * _tmp663;
+  const Scalar _tmp1439 = _tmp1436 * samples(4, 15) + _tmp1437 * _tmp672;
+  const Scalar _tmp1440 = _tmp1436 * samples(3, 15) + _tmp1437 * _tmp677;
+  const Scalar _tmp1441 = (Scalar(1) / Scalar(2)) * _tmp683;
+  const Scalar _tmp1442 = (Scalar(1) / Scalar(6)) * _tmp683;
+  const Scalar _tmp1443 = _tmp1441 * samples(3, 14) + _tmp1442 * _tmp690;
+  const Scalar _tmp1444 = _tmp1441 * samples(4, 14) + _tmp1442 * _tmp696;
+  const Scalar _tmp1445 = _tmp1441 * samples(5, 14) + _tmp1442 * _tmp700;
+  const Scalar _tmp1446 = (Scalar(1) / Scalar(2)) * _tmp702;
+  const Scalar _tmp1447 = (Scalar(1) / Scalar(6)) * _tmp702;
+  const Scalar _tmp1448 = _tmp1446 * samples(4, 13) + _tmp1447 * _tmp709;
+  const Scalar _tmp1449 = _tmp1446 * samples(3, 13) + _tmp1447 * _tmp719;
+  const Scalar _tmp1450 = _tmp1446 * samples(5, 13) + _tmp1447 * _tmp723;
+  const Scalar _tmp1451 = (Scalar(1) / Scalar(6)) * _tmp725;
+  const Scalar _tmp1452 = _tmp1451 * _tmp732 + (Scalar(1) / Scalar(2)) * _tmp726;
+  const Scalar _tmp1453 = _tmp1451 * _tmp739 + (Scalar(1) / Scalar(2)) * _tmp729;
+  const Scalar _tmp1454 = _tmp1451 * _tmp746 + (Scalar(1) / Scalar(2)) * _tmp727;
+  const Scalar _tmp1455 = (Scalar(1) / Scalar(2)) * _tmp752;
+  const Scalar _tmp1456 = (Scalar(1) / Scalar(6)) * _tmp752;
+  const Scalar _tmp1457 = _tmp1455 * samples(4, 11) + _tmp1456 * _tmp759;
+  const Scalar _tmp1458 = _tmp1455 * samples(5, 11) + _tmp1456 * _tmp762;
+  const Scalar _tmp1459 = _tmp1455 * samples(3, 11) + _tmp1456 * _tmp769;
+  const Scalar _tmp1460 = (Scalar(1) / Scalar(2)) * _tmp771;
+  const Scalar _tmp1461 = (Scalar(1) / Scalar(6)) * _tmp771;
+  const Scalar _tmp1462 = _tmp1460 * samples(3, 10) + _tmp1461 * _tmp778;
+  const Scalar _tmp1463 = _tmp1460 * samples(4, 10) + _tmp1461 * _tmp785;
+  const Scalar _tmp1464 = _tmp1460 * samples(5, 10) + _tmp1461 * _tmp792;
+  const Scalar _tmp1465 = (Scalar(1) / Scalar(6)) * _tmp798;
+  const Scalar _tmp1466 = _tmp1465 * _tmp805 + (Scalar(1) / Scalar(2)) * _tmp799;
+  const Scalar _tmp1467 = _tmp1465 * _tmp808 + (Scalar(1) / Scalar(2)) * _tmp802;
+  const Scalar _tmp1468 = _tmp1465 * _tmp815 + (Scalar(1) / Scalar(2)) * _tmp800;
+  const Scalar _tmp1469 = (Scalar(1) / Scalar(6)) * _tmp820;
+  const Scalar _tmp1470 = _tmp1469 * _tmp828 + (Scalar(1) / Scalar(2)) * _tmp824;
+  const Scalar _tmp1471 = _tmp1469 * _tmp834 + (Scalar(1) / Scalar(2)) * _tmp821;
+  const Scalar _tmp1472 = _tmp1469 * _tmp836 + (Scalar(1) / Scalar(2)) * _tmp825;
+  const Scalar _tmp1473 = (Scalar(1) / Scalar(6)) * _tmp841;
+  const Scalar _tmp1474 = (Scalar(1) / Scalar(2)) * _tmp841;
+  const Scalar _tmp1475 = _tmp1473 * _tmp848 + _tmp1474 * samples(3, 7);
+  const Scalar _tmp1476 = _tmp1473 * _tmp858 + _tmp1474 * samples(5, 7);
+  const Scalar _tmp1477 = _tmp1473 * _tmp860 + _tmp1474 * samples(4, 7);
+  const Scalar _tmp1478 = (Scalar(1) / Scalar(6)) * _tmp864;
+  const Scalar _tmp1479 = _tmp1478 * _tmp871 + (Scalar(1) / Scalar(2)) * _tmp865;
+  const Scalar _tmp1480 = _tmp1478 * _tmp878 + (Scalar(1) / Scalar(2)) * _tmp866;
+  const Scalar _tmp1481 = _tmp1478 * _tmp882 + (Scalar(1) / Scalar(2)) * _tmp868;
+  const Scalar _tmp1482 = (Scalar(1) / Scalar(6)) * _tmp887;
+  const Scalar _tmp1483 = _tmp1482 * _tmp895 + (Scalar(1) / Scalar(2)) * _tmp891;
+  const Scalar _tmp1484 = _tmp1482 * _tmp902 + (Scalar(1) / Scalar(2)) * _tmp889;
+  const Scalar _tmp1485 = _tmp1482 * _tmp909 + (Scalar(1) / Scalar(2)) * _tmp892;
+  const Scalar _tmp1486 = (Scalar(1) / Scalar(6)) * _tmp915;
+  const Scalar _tmp1487 = _tmp1486 * _tmp922 + (Scalar(1) / Scalar(2)) * _tmp917;
+  const Scalar _tmp1488 = _tmp1486 * _tmp928 + (Scalar(1) / Scalar(2)) * _tmp916;
+  const Scalar _tmp1489 = _tmp1486 * _tmp930 + (Scalar(1) / Scalar(2)) * _tmp919;
+  const Scalar _tmp1490 = (Scalar(1) / Scalar(6)) * _tmp937;
+  const Scalar _tmp1491 = _tmp1490 * _tmp945 + (Scalar(1) / Scalar(2)) * _tmp939;
+  const Scalar _tmp1492 = _tmp1490 * _tmp948 + (Scalar(1) / Scalar(2)) * _tmp943;
+  const Scalar _tmp1493 = _tmp1490 * _tmp956 + (Scalar(1) / Scalar(2)) * _tmp942;
+  const Scalar _tmp1494 = (Scalar(1) / Scalar(6)) * _tmp958;
+  const Scalar _tmp1495 = _tmp1494 * _tmp965 + (Scalar(1) / Scalar(2)) * _tmp960;
+  const Scalar _tmp1496 = _tmp1494 * _tmp972 + (Scalar(1) / Scalar(2)) * _tmp959;
+  const Scalar _tmp1497 = _tmp1494 * _tmp977 + (Scalar(1) / Scalar(2)) * _tmp962;
+  const Scalar _tmp1498 = (Scalar(1) / Scalar(6)) * _tmp986;
+  const Scalar _tmp1499 = _tmp1498 * _tmp993 + (Scalar(1) / Scalar(2)) * _tmp988;
+  const Scalar _tmp1500 = _tmp1498 * _tmp999 + (Scalar(1) / Scalar(2)) * _tmp990;
+  const Scalar _tmp1501 = _tmp1004 * _tmp1498 + (Scalar(1) / Scalar(2)) * _tmp987;
+  const Scalar _tmp1502 = (Scalar(1) / Scalar(2)) * _tmp981;
+  const Scalar _tmp1503 = (Scalar(1) / Scalar(6)) * _tmp981;
+  const Scalar _tmp1504 = _tmp1010 * _tmp1503 + _tmp1502 * samples(3, 0);
+  const Scalar _tmp1505 = _tmp1003 * _tmp1501 + _tmp1012 * dt(1, 0) + _tmp1499 * _tmp985 +
+                          _tmp1500 * _tmp998 + _tmp1504;
+  const Scalar _tmp1506 =
+      _tmp1013 * dt(2, 0) + _tmp1495 * _tmp971 + _tmp1496 * _tmp976 + _tmp1497 * _tmp980 + _tmp1505;
+  const Scalar _tmp1507 =
+      _tmp1014 * dt(3, 0) + _tmp1491 * _tmp936 + _tmp1492 * _tmp952 + _tmp1493 * _tmp955 + _tmp1506;
+  const Scalar _tmp1508 =
+      _tmp1015 * dt(4, 0) + _tmp1487 * _tmp914 + _tmp1488 * _tmp927 + _tmp1489 * _tmp933 + _tmp1507;
+  const Scalar _tmp1509 =
+      _tmp1016 * dt(5, 0) + _tmp1483 * _tmp901 + _tmp1484 * _tmp905 + _tmp1485 * _tmp908 + _tmp1508;
+  const Scalar _tmp1510 =
+      _tmp1017 * dt(6, 0) + _tmp1479 * _tmp877 + _tmp1480 * _tmp881 + _tmp1481 * _tmp886 + _tmp1509;
+  const Scalar _tmp1511 =
+      _tmp1018 * dt(7, 0) + _tmp1475 * _tmp854 + _tmp1476 * _tmp857 + _tmp1477 * _tmp863 + _tmp1510;
+  const Scalar _tmp1512 =
+      _tmp1019 * dt(8, 0) + _tmp1470 * _tmp819 + _tmp1471 * _tmp833 + _tmp1472 * _tmp840 + _tmp1511;
+  const Scalar _tmp1513 =
+      _tmp1020 * dt(9, 0) + _tmp1466 * _tmp797 + _tmp1467 * _tmp812 + _tmp1468 * _tmp814 + _tmp1512;
+  const Scalar _tmp1514 = _tmp1021 * dt(10, 0) + _tmp1462 * _tmp784 + _tmp1463 * _tmp789 +
+                          _tmp1464 * _tmp791 + _tmp1513;
+  const Scalar _tmp1515 = _tmp1022 * dt(11, 0) + _tmp1457 * _tmp751 + _tmp1458 * _tmp765 +
+                          _tmp1459 * _tmp768 + _tmp1514;
+  const Scalar _tmp1516 = _tmp1023 * dt(12, 0) + _tmp1452 * _tmp738 + _tmp1453 * _tmp743 +
+                          _tmp1454 * _tmp745 + _tmp1515;
+  const Scalar _tmp1517 = _tmp1024 * dt(13, 0) + _tmp1448 * _tmp715 + _tmp1449 * _tmp718 +
+                          _tmp1450 * _tmp722 + _tmp1516;
+  const Scalar _tmp1518 = _tmp1025 * dt(14, 0) + _tmp1443 * _tmp682 + _tmp1444 * _tmp695 +
+                          _tmp1445 * _tmp699 + _tmp1517;
+  const Scalar _tmp1519 = _tmp1026 * dt(15, 0) + _tmp1438 * _tmp668 + _tmp1439 * _tmp671 +
+                          _tmp1440 * _tmp676 + _tmp1518;
+  const Scalar _tmp1520 = _tmp1027 * dt(16, 0) + _tmp1433 * _tmp636 + _tmp1434 * _tmp648 +
+                          _tmp1435 * _tmp655 + _tmp1519;
+  const Scalar _tmp1521 = _tmp1028 * dt(17, 0) + _tmp1428 * _tmp623 + _tmp1429 * _tmp627 +
+                          _tmp1430 * _tmp630 + _tmp1520;
+  const Scalar _tmp1522 = _tmp1029 * dt(18, 0) + _tmp1423 * _tmp603 + _tmp1424 * _tmp600 +
+                          _tmp1425 * _tmp607 + _tmp1521;
+  const Scalar _tmp1523 = _tmp1030 * dt(19, 0) + _tmp1418 * _tmp577 + _tmp1419 * _tmp582 +
+                          _tmp1420 * _tmp584 + _tmp1522;
+  const Scalar _tmp1524 = _tmp1031 * dt(20, 0) + _tmp1413 * _tmp554 + _tmp1414 * _tmp557 +
+                          _tmp1415 * _tmp561 + _tmp1523;
+  const Scalar _tmp1525 = _tmp1032 * dt(21, 0) + _tmp1408 * _tmp530 + _tmp1409 * _tmp533 +
+                          _tmp1410 * _tmp540 + _tmp1524;
+  const Scalar _tmp1526 = _tmp1033 * dt(22, 0) + _tmp1403 * _tmp499 + _tmp1404 * _tmp513 +
+                          _tmp1405 * _tmp516 + _tmp1525;
+  const Scalar _tmp1527 = _tmp1034 * dt(23, 0) + _tmp1397 * _tmp485 + _tmp1399 * _tmp490 +
+                          _tmp1400 * _tmp493 + _tmp1526;
+  const Scalar _tmp1528 = _tmp1035 * dt(24, 0) + _tmp1393 * _tmp464 + _tmp1394 * _tmp469 +
+                          _tmp1395 * _tmp473 + _tmp1527;
+  const Scalar _tmp1529 = _tmp1036 * dt(25, 0) + _tmp1388 * _tmp430 + _tmp1389 * _tmp443 +
+                          _tmp1390 * _tmp448 + _tmp1528;
+  const Scalar _tmp1530 = _tmp1037 * dt(26, 0) + _tmp1384 * _tmp418 + _tmp1385 * _tmp422 +
+                          _tmp1386 * _tmp425 + _tmp1529;
+  const Scalar _tmp1531 = _tmp1038 * dt(27, 0) + _tmp1380 * _tmp399 + _tmp1381 * _tmp385 +
+                          _tmp1382 * _tmp402 + _tmp1530;
+  const Scalar _tmp1532 = _tmp1039 * dt(28, 0) + _tmp1375 * _tmp372 + _tmp1376 * _tmp381 +
+                          _tmp1377 * _tmp377 + _tmp1531;
+  const Scalar _tmp1533 = _tmp1040 * dt(29, 0) + _tmp1370 * _tmp339 + _tmp1371 * _tmp352 +
+                          _tmp1372 * _tmp356 + _tmp1532;
+  const Scalar _tmp1534 = _tmp1041 * dt(30, 0) + _tmp1365 * _tmp326 + _tmp1366 * _tmp331 +
+                          _tmp1367 * _tmp335 + _tmp1533;
+  const Scalar _tmp1535 = _tmp1042 * dt(31, 0) + _tmp1360 * _tmp293 + _tmp1361 * _tmp305 +
+                          _tmp1362 * _tmp312 + _tmp1534;
+  const Scalar _tmp1536 = _tmp1199 * _tmp1503 + _tmp1502 * samples(4, 0);
+  const Scalar _tmp1537 = _tmp1194 * _tmp1500 + _tmp1196 * _tmp1499 + _tmp1198 * _tmp1501 +
+                          _tmp1200 * dt(1, 0) + _tmp1536;
+  const Scalar _tmp1538 = _tmp1190 * _tmp1497 + _tmp1192 * _tmp1496 + _tmp1193 * _tmp1495 +
+                          _tmp1201 * dt(2, 0) + _tmp1537;
+  const Scalar _tmp1539 = _tmp1185 * _tmp1493 + _tmp1187 * _tmp1491 + _tmp1188 * _tmp1492 +
+                          _tmp1202 * dt(3, 0) + _tmp1538;
+  const Scalar _tmp1540 = _tmp1180 * _tmp1489 + _tmp1181 * _tmp1487 + _tmp1183 * _tmp1488 +
+                          _tmp1203 * dt(4, 0) + _tmp1539;
+  const Scalar _tmp1541 = _tmp1175 * _tmp1484 + _tmp1177 * _tmp1483 + _tmp1178 * _tmp1485 +
+                          _tmp1204 * dt(5, 0) + _tmp1540;
+  const Scalar _tmp1542 = _tmp1169 * _tmp1481 + _tmp1171 * _tmp1480 + _tmp1173 * _tmp1479 +
+                          _tmp1205 * dt(6, 0) + _tmp1541;
+  const Scalar _tmp1543 = _tmp1165 * _tmp1476 + _tmp1166 * _tmp1475 + _tmp1168 * _tmp1477 +
+                          _tmp1206 * dt(7, 0) + _tmp1542;
+  const Scalar _tmp1544 = _tmp1160 * _tmp1470 + _tmp1162 * _tmp1472 + _tmp1163 * _tmp1471 +
+                          _tmp1207 * dt(8, 0) + _tmp1543;
+  const Scalar _tmp1545 = _tmp1155 * _tmp1468 + _tmp1156 * _tmp1466 + _tmp1158 * _tmp1467 +
+                          _tmp1208 * dt(9, 0) + _tmp1544;
+  const Scalar _tmp1546 = _tmp1150 * _tmp1464 + _tmp1151 * _tmp1462 + _tmp1153 * _tmp1463 +
+                          _tmp1209 * dt(10, 0) + _tmp1545;
+  const Scalar _tmp1547 = _tmp1144 * _tmp1459 + _tmp1146 * _tmp1457 + _tmp1148 * _tmp1458 +
+                          _tmp1210 * dt(11, 0) + _tmp1546;
+  const Scalar _tmp1548 = _tmp1139 * _tmp1453 + _tmp1141 * _tmp1452 + _tmp1143 * _tmp1454 +
+                          _tmp1211 * dt(12, 0) + _tmp1547;
+  const Scalar _tmp1549 = _tmp1135 * _tmp1450 + _tmp1137 * _tmp1448 + _tmp1138 * _tmp1449 +
+                          _tmp1212 * dt(13, 0) + _tmp1548;
+  const Scalar _tmp1550 = _tmp1130 * _tmp1444 + _tmp1131 * _tmp1443 + _tmp1133 * _tmp1445 +
+                          _tmp1213 * dt(14, 0) + _tmp1549;
+  const Scalar _tmp1551 = _tmp1124 * _tmp1440 + _tmp1126 * _tmp1439 + _tmp1128 * _tmp1438 +
+                          _tmp1214 * dt(15, 0) + _tmp1550;
+  const Scalar _tmp1552 = _tmp1120 * _tmp1434 + _tmp1121 * _tmp1435 + _tmp1123 * _tmp1433 +
+                          _tmp1215 * dt(16, 0) + _tmp1551;
+  const Scalar _tmp1553 = _tmp1115 * _tmp1428 + _tmp1116 * _tmp1430 + _tmp1118 * _tmp1429 +
+                          _tmp1216 * dt(17, 0) + _tmp1552;
+  const Scalar _tmp1554 = _tmp1110 * _tmp1423 + _tmp1112 * _tmp1425 + _tmp1113 * _tmp1424 +
+                          _tmp1217 * dt(18, 0) + _tmp1553;
+  const Scalar _tmp1555 = _tmp1105 * _tmp1420 + _tmp1107 * _tmp1418 + _tmp1108 * _tmp1419 +
+                          _tmp1218 * dt(19, 0) + _tmp1554;
+  const Scalar _tmp1556 = _tmp1100 * _tmp1414 + _tmp1101 * _tmp1413 + _tmp1103 * _tmp1415 +
+                          _tmp1219 * dt(20, 0) + _tmp1555;
+  const Scalar _tmp1557 = _tmp1094 * _tmp1409 + _tmp1096 * _tmp1410 + _tmp1098 * _tmp1408 +
+                          _tmp1220 * dt(21, 0) + _tmp1556;
+  const Scalar _tmp1558 = _tmp1090 * _tmp1404 + _tmp1091 * _tmp1405 + _tmp1093 * _tmp1403 +
+                          _tmp1221 * dt(22, 0) + _tmp1557;
+  const Scalar _tmp1559 = _tmp1085 * _tmp1400 + _tmp1087 * _tmp1397 + _tmp1088 * _tmp1399 +
+                          _tmp1222 * dt(23, 0) + _tmp1558;
+  const Scalar _tmp1560 = _tmp1079 * _tmp1394 + _tmp1081 * _tmp1395 + _tmp1083 * _tmp1393 +
+                          _tmp1223 * dt(24, 0) + _tmp1559;
+  const Scalar _tmp1561 = _tmp1075 * _tmp1390 + _tmp1077 * _tmp1388 + _tmp1078 * _tmp1389 +
+                          _tmp1224 * dt(25, 0) + _tmp1560;
+  const Scalar _tmp1562 = _tmp1070 * _tmp1385 + _tmp1071 * _tmp1384 + _tmp1073 * _tmp1386 +
+                          _tmp1225 * dt(26, 0) + _tmp1561;
+  const Scalar _tmp1563 = _tmp1065 * _tmp1381 + _tmp1066 * _tmp1382 + _tmp1068 * _tmp1380 +
+                          _tmp1226 * dt(27, 0) + _tmp1562;
+  const Scalar _tmp1564 = _tmp1059 * _tmp1375 + _tmp1061 * _tmp1377 + _tmp1063 * _tmp1376 +
+                          _tmp1227 * dt(28, 0) + _tmp1563;
+  const Scalar _tmp1565 = _tmp1055 * _tmp1371 + _tmp1057 * _tmp1372 + _tmp1058 * _tmp1370 +
+                          _tmp1228 * dt(29, 0) + _tmp1564;
+  const Scalar _tmp1566 = _tmp1050 * _tmp1367 + _tmp1052 * _tmp1366 + _tmp1053 * _tmp1365 +
+                          _tmp1229 * dt(30, 0) + _tmp1565;
+  const Scalar _tmp1567 = _tmp1045 * _tmp1362 + _tmp1047 * _tmp1361 + _tmp1048 * _tmp1360 +
+                          _tmp1230 * dt(31, 0) + _tmp1566;
+  const Scalar _tmp1568 = _tmp1325 * _tmp1503 + _tmp1502 * samples(5, 0);
+  const Scalar _tmp1569 = _tmp1322 * _tmp1500 + _tmp1323 * _tmp1499 + _tmp1324 * _tmp1501 +
+                          _tmp1326 * dt(1, 0) + _tmp1568;
+  const Scalar _tmp1570 = _tmp1319 * _tmp1496 + _tmp1320 * _tmp1497 + _tmp1321 * _tmp1495 +
+                          _tmp1327 * dt(2, 0) + _tmp1569;
+  const Scalar _tmp1571 = _tmp1316 * _tmp1492 + _tmp1317 * _tmp1493 + _tmp1318 * _tmp1491 +
+                          _tmp1328 * dt(3, 0) + _tmp1570;
+  const Scalar _tmp1572 = _tmp1313 * _tmp1487 + _tmp1314 * _tmp1488 + _tmp1315 * _tmp1489 +
+                          _tmp1329 * dt(4, 0) + _tmp1571;
+  const Scalar _tmp1573 = _tmp1310 * _tmp1485 + _tmp1311 * _tmp1484 + _tmp1312 * _tmp1483 +
+                          _tmp1330 * dt(5, 0) + _tmp1572;
+  const Scalar _tmp1574 = _tmp1307 * _tmp1479 + _tmp1308 * _tmp1481 + _tmp1309 * _tmp1480 +
+                          _tmp1331 * dt(6, 0) + _tmp1573;
+  const Scalar _tmp1575 = _tmp1304 * _tmp1477 + _tmp1305 * _tmp1476 + _tmp1306 * _tmp1475 +
+                          _tmp1332 * dt(7, 0) + _tmp1574;
+  const Scalar _tmp1576 = _tmp1301 * _tmp1470 + _tmp1302 * _tmp1472 + _tmp1303 * _tmp1471 +
+                          _tmp1333 * dt(8, 0) + _tmp1575;
+  const Scalar _tmp1577 = _tmp1298 * _tmp1466 + _tmp1299 * _tmp1468 + _tmp1300 * _tmp1467 +
+                          _tmp1334 * dt(9, 0) + _tmp1576;
+  const Scalar _tmp1578 = _tmp1295 * _tmp1464 + _tmp1296 * _tmp1463 + _tmp1297 * _tmp1462 +
+                          _tmp1335 * dt(10, 0) + _tmp1577;
+  const Scalar _tmp1579 = _tmp1292 * _tmp1459 + _tmp1293 * _tmp1457 + _tmp1294 * _tmp1458 +
+                          _tmp1336 * dt(11, 0) + _tmp1578;
+  const Scalar _tmp1580 = _tmp1289 * _tmp1452 + _tmp1290 * _tmp1454 + _tmp1291 * _tmp1453 +
+                          _tmp1337 * dt(12, 0) + _tmp1579;
+  const Scalar _tmp1581 = _tmp1286 * _tmp1448 + _tmp1287 * _tmp1450 + _tmp1288 * _tmp1449 +
+                          _tmp1338 * dt(13, 0) + _tmp1580;
+  const Scalar _tmp1582 = _tmp1283 * _tmp1444 + _tmp1284 * _tmp1443 + _tmp1285 * _tmp1445 +
+                          _tmp1339 * dt(14, 0) + _tmp1581;
+  const Scalar _tmp1583 = _tmp1280 * _tmp1440 + _tmp1281 * _tmp1438 + _tmp1282 * _tmp1439 +
+                          _tmp1340 * dt(15, 0) + _tmp1582;
+  const Scalar _tmp1584 = _tmp1277 * _tmp1434 + _tmp1278 * _tmp1435 + _tmp1279 * _tmp1433 +
+                          _tmp1341 * dt(16, 0) + _tmp1583;
+  const Scalar _tmp1585 = _tmp1274 * _tmp1429 + _tmp1275 * _tmp1428 + _tmp1276 * _tmp1430 +
+                          _tmp1342 * dt(17, 0) + _tmp1584;
+  const Scalar _tmp1586 = _tmp1271 * _tmp1424 + _tmp1272 * _tmp1423 + _tmp1273 * _tmp1425 +
+                          _tmp1343 * dt(18, 0) + _tmp1585;
+  const Scalar _tmp1587 = _tmp1268 * _tmp1420 + _tmp1269 * _tmp1418 + _tmp1270 * _tmp1419 +
+                          _tmp1344 * dt(19, 0) + _tmp1586;
+  const Scalar _tmp1588 = _tmp1265 * _tmp1413 + _tmp1266 * _tmp1414 + _tmp1267 * _tmp1415 +
+                          _tmp1345 * dt(20, 0) + _tmp1587;
+  const Scalar _tmp1589 = _tmp1262 * _tmp1409 + _tmp1263 * _tmp1410 + _tmp1264 * _tmp1408 +
+                          _tmp1346 * dt(21, 0) + _tmp1588;
+  const Scalar _tmp1590 = _tmp1259 * _tmp1405 + _tmp1260 * _tmp1403 + _tmp1261 * _tmp1404 +
+                          _tmp1347 * dt(22, 0) + _tmp1589;
+  const Scalar _tmp1591 = _tmp1256 * _tmp1399 + _tmp1257 * _tmp1400 + _tmp1258 * _tmp1397 +
+                          _tmp1348 * dt(23, 0) + _tmp1590;
+  const Scalar _tmp1592 = _tmp1253 * _tmp1395 + _tmp1254 * _tmp1394 + _tmp1255 * _tmp1393 +
+                          _tmp1349 * dt(24, 0) + _tmp1591;
+  const Scalar _tmp1593 = _tmp1250 * _tmp1389 + _tmp1251 * _tmp1388 + _tmp1252 * _tmp1390 +
+                          _tmp1350 * dt(25, 0) + _tmp1592;
+  const Scalar _tmp1594 = _tmp1247 * _tmp1384 + _tmp1248 * _tmp1385 + _tmp1249 * _tmp1386 +
+                          _tmp1351 * dt(26, 0) + _tmp1593;
+  const Scalar _tmp1595 = _tmp1244 * _tmp1380 + _tmp1245 * _tmp1382 + _tmp1246 * _tmp1381 +
+                          _tmp1352 * dt(27, 0) + _tmp1594;
+  const Scalar _tmp1596 = _tmp1241 * _tmp1376 + _tmp1242 * _tmp1377 + _tmp1243 * _tmp1375 +
+                          _tmp1353 * dt(28, 0) + _tmp1595;
+  const Scalar _tmp1597 = _tmp1238 * _tmp1370 + _tmp1239 * _tmp1371 + _tmp1240 * _tmp1372 +
+                          _tmp1354 * dt(29, 0) + _tmp1596;
+  const Scalar _tmp1598 = _tmp1235 * _tmp1366 + _tmp1236 * _tmp1365 + _tmp1237 * _tmp1367 +
+                          _tmp1355 * dt(30, 0) + _tmp1597;
+  const Scalar _tmp1599 = _tmp1232 * _tmp1360 + _tmp1233 * _tmp1361 + _tmp1234 * _tmp1362 +
+                          _tmp1356 * dt(31, 0) + _tmp1598;
+  const Scalar _tmp1600 = 2 * std::pow(_tmp285, Scalar(2)) / _tmp282;
+  const Scalar _tmp1601 = -_tmp1600 * _tmp281;
+  const Scalar _tmp1602 = -_tmp1600 * _tmp249 + 1;
+  const Scalar _tmp1603 = _tmp1601 + _tmp1602;
+  const Scalar _tmp1604 = [&]() {
+    const Scalar base = dt(0, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1605 = [&]() {
+    const Scalar base = dt(2, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1606 = [&]() {
+    const Scalar base = dt(1, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1607 = [&]() {
+    const Scalar base = dt(4, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1608 = [&]() {
+    const Scalar base = dt(3, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1609 = [&]() {
+    const Scalar base = dt(8, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1610 = [&]() {
+    const Scalar base = dt(5, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1611 = [&]() {
+    const Scalar base = dt(7, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1612 = [&]() {
+    const Scalar base = dt(9, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1613 = [&]() {
+    const Scalar base = dt(6, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1614 = [&]() {
+    const Scalar base = dt(30, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1615 = [&]() {
+    const Scalar base = dt(31, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1616 = [&]() {
+    const Scalar base = dt(22, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1617 = [&]() {
+    const Scalar base = dt(21, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1618 = [&]() {
+    const Scalar base = dt(20, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1619 = [&]() {
+    const Scalar base = dt(11, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1620 = [&]() {
+    const Scalar base = dt(10, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1621 = [&]() {
+    const Scalar base = dt(28, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1622 = [&]() {
+    const Scalar base = dt(25, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1623 = [&]() {
+    const Scalar base = dt(26, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1624 = [&]() {
+    const Scalar base = dt(29, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1625 = [&]() {
+    const Scalar base = dt(27, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1626 = [&]() {
+    const Scalar base = dt(23, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1627 = [&]() {
+    const Scalar base = dt(24, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1628 = [&]() {
+    const Scalar base = dt(15, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1629 = [&]() {
+    const Scalar base = dt(12, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1630 = [&]() {
+    const Scalar base = dt(19, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1631 = [&]() {
+    const Scalar base = dt(16, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1632 = [&]() {
+    const Scalar base = dt(14, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1633 = [&]() {
+    const Scalar base = dt(13, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1634 = [&]() {
+    const Scalar base = dt(18, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1635 = [&]() {
+    const Scalar base = dt(17, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp1636 =
+      _tmp1604 + _tmp1605 + _tmp1606 + _tmp1607 + _tmp1608 + _tmp1609 + _tmp1610 + _tmp1611 +
+      _tmp1612 + _tmp1613 + _tmp1614 + _tmp1615 + _tmp1616 + _tmp1617 + _tmp1618 + _tmp1619 +
+      _tmp1620 + _tmp1621 + _tmp1622 + _tmp1623 + _tmp1624 + _tmp1625 + _tmp1626 + _tmp1627 +
+      _tmp1628 + _tmp1629 + _tmp1630 + _tmp1631 + _tmp1632 + _tmp1633 + _tmp1634 + _tmp1635;
+  const Scalar _tmp1637 = _tmp1636 * imu_noise(0, 0);
+  const Scalar _tmp1638 = _tmp1600 * _tmp248;
+  const Scalar _tmp1639 = _tmp1638 * _tmp187;
+  const Scalar _tmp1640 = 2 * _tmp290;
+  const Scalar _tmp1641 = _tmp1640 * _tmp289;
+  const Scalar _tmp1642 = _tmp1639 + _tmp1641;
+  const Scalar _tmp1643 = _tmp1636 * imu_noise(1, 0);
+  const Scalar _tmp1644 = _tmp1640 * _tmp288;
+  const Scalar _tmp1645 = _tmp1600 * _tmp187 * _tmp280;
+  const Scalar _tmp1646 = -_tmp1644 + _tmp1645;
+  const Scalar _tmp1647 = _tmp1636 * imu_noise(2, 0);
+  const Scalar _tmp1648 = _tmp1639 - _tmp1641;
+  const Scalar _tmp1649 = _tmp1640 * _tmp287;
+  const Scalar _tmp1650 = _tmp1638 * _tmp280;
+  const Scalar _tmp1651 = _tmp1649 + _tmp1650;
+  const Scalar _tmp1652 = _tmp1647 * _tmp1651;
+  const Scalar _tmp1653 = -_tmp1600 * _tmp188;
+  const Scalar _tmp1654 = _tmp1601 + _tmp1653 + 1;
+  const Scalar _tmp1655 = -_tmp1649 + _tmp1650;
+  const Scalar _tmp1656 = _tmp1643 * _tmp1655;
+  const Scalar _tmp1657 = _tmp1602 + _tmp1653;
+  const Scalar _tmp1658 = _tmp1644 + _tmp1645;
+  const Scalar _tmp1659 = _tmp1637 * _tmp1658;
+  const Scalar _tmp1660 = _tmp1024 * _tmp1629;
+  const Scalar _tmp1661 = _tmp1025 * _tmp1633;
+  const Scalar _tmp1662 = _tmp1019 * _tmp1611;
+  const Scalar _tmp1663 = _tmp1037 * _tmp1622;
+  const Scalar _tmp1664 = _tmp1020 * _tmp1609;
+  const Scalar _tmp1665 = _tmp1032 * _tmp1618;
+  const Scalar _tmp1666 = _tmp1030 * _tmp1634;
+  const Scalar _tmp1667 = _tmp1042 * _tmp1614;
+  const Scalar _tmp1668 = _tmp1022 * _tmp1620;
+  const Scalar _tmp1669 = _tmp1017 * _tmp1610;
+  const Scalar _tmp1670 = _tmp1041 * _tmp1624;
+  const Scalar _tmp1671 = _tmp1040 * _tmp1621;
+  const Scalar _tmp1672 = _tmp1028 * _tmp1631;
+  const Scalar _tmp1673 = _tmp1015 * _tmp1608;
+  const Scalar _tmp1674 = _tmp1027 * _tmp1628;
+  const Scalar _tmp1675 = _tmp1016 * _tmp1607;
+  const Scalar _tmp1676 = _tmp1039 * _tmp1625;
+  const Scalar _tmp1677 = _tmp1033 * _tmp1617;
+  const Scalar _tmp1678 = _tmp1023 * _tmp1619;
+  const Scalar _tmp1679 = _tmp1038 * _tmp1623;
+  const Scalar _tmp1680 = _tmp1034 * _tmp1616;
+  const Scalar _tmp1681 = _tmp1026 * _tmp1632;
+  const Scalar _tmp1682 = _tmp1043 * _tmp1615;
+  const Scalar _tmp1683 = _tmp1029 * _tmp1635;
+  const Scalar _tmp1684 =
+      _tmp1012 * _tmp1604 + _tmp1013 * _tmp1606 + _tmp1014 * _tmp1605 + _tmp1018 * _tmp1613 +
+      _tmp1021 * _tmp1612 + _tmp1031 * _tmp1630 + _tmp1035 * _tmp1626 + _tmp1036 * _tmp1627 +
+      _tmp1660 + _tmp1661 + _tmp1662 + _tmp1663 + _tmp1664 + _tmp1665 + _tmp1666 + _tmp1667 +
+      _tmp1668 + _tmp1669 + _tmp1670 + _tmp1671 + _tmp1672 + _tmp1673 + _tmp1674 + _tmp1675 +
+      _tmp1676 + _tmp1677 + _tmp1678 + _tmp1679 + _tmp1680 + _tmp1681 + _tmp1682 + _tmp1683;
+  const Scalar _tmp1685 = _tmp1684 * imu_noise(2, 0);
+  const Scalar _tmp1686 = _tmp1043 * _tmp1647 - _tmp1685;
+  const Scalar _tmp1687 = _tmp1216 * _tmp1631;
+  const Scalar _tmp1688 = _tmp1209 * _tmp1612;
+  const Scalar _tmp1689 = _tmp1213 * _tmp1633;
+  const Scalar _tmp1690 = _tmp1230 * _tmp1614;
+  const Scalar _tmp1691 = _tmp1222 * _tmp1616;
+  const Scalar _tmp1692 = _tmp1202 * _tmp1605;
+  const Scalar _tmp1693 = _tmp1207 * _tmp1611;
+  const Scalar _tmp1694 = _tmp1203 * _tmp1608;
+  const Scalar _tmp1695 = _tmp1223 * _tmp1626;
+  const Scalar _tmp1696 = _tmp1214 * _tmp1632;
+  const Scalar _tmp1697 = _tmp1219 * _tmp1630;
+  const Scalar _tmp1698 = _tmp1221 * _tmp1617;
+  const Scalar _tmp1699 = _tmp1217 * _tmp1635;
+  const Scalar _tmp1700 = _tmp1201 * _tmp1606;
+  const Scalar _tmp1701 = _tmp1208 * _tmp1609;
+  const Scalar _tmp1702 = _tmp1206 * _tmp1613;
+  const Scalar _tmp1703 = _tmp1231 * _tmp1615;
+  const Scalar _tmp1704 = _tmp1200 * _tmp1604;
+  const Scalar _tmp1705 = _tmp1228 * _tmp1621;
+  const Scalar _tmp1706 = _tmp1210 * _tmp1620;
+  const Scalar _tmp1707 = _tmp1215 * _tmp1628;
+  const Scalar _tmp1708 = _tmp1225 * _tmp1622;
+  const Scalar _tmp1709 = _tmp1229 * _tmp1624;
+  const Scalar _tmp1710 = _tmp1224 * _tmp1627;
+  const Scalar _tmp1711 = _tmp1220 * _tmp1618;
+  const Scalar _tmp1712 =
+      _tmp1204 * _tmp1607 + _tmp1205 * _tmp1610 + _tmp1211 * _tmp1619 + _tmp1212 * _tmp1629 +
+      _tmp1218 * _tmp1634 + _tmp1226 * _tmp1623 + _tmp1227 * _tmp1625 + _tmp1687 + _tmp1688 +
+      _tmp1689 + _tmp1690 + _tmp1691 + _tmp1692 + _tmp1693 + _tmp1694 + _tmp1695 + _tmp1696 +
+      _tmp1697 + _tmp1698 + _tmp1699 + _tmp1700 + _tmp1701 + _tmp1702 + _tmp1703 + _tmp1704 +
+      _tmp1705 + _tmp1706 + _tmp1707 + _tmp1708 + _tmp1709 + _tmp1710 + _tmp1711;
+  const Scalar _tmp1713 = _tmp1712 * imu_noise(2, 0);
+  const Scalar _tmp1714 = -_tmp1231 * _tmp1647 + _tmp1713;
+  const Scalar _tmp1715 = _tmp1603 * _tmp1714 + _tmp1642 * _tmp1686;
+  const Scalar _tmp1716 = _tmp1349 * _tmp1626;
+  const Scalar _tmp1717 = _tmp1343 * _tmp1635;
+  const Scalar _tmp1718 = _tmp1333 * _tmp1611;
+  const Scalar _tmp1719 = _tmp1342 * _tmp1631;
+  const Scalar _tmp1720 = _tmp1353 * _tmp1625;
+  const Scalar _tmp1721 = _tmp1334 * _tmp1609;
+  const Scalar _tmp1722 = _tmp1356 * _tmp1614;
+  const Scalar _tmp1723 = _tmp1335 * _tmp1612;
+  const Scalar _tmp1724 = _tmp1357 * _tmp1615;
+  const Scalar _tmp1725 = _tmp1330 * _tmp1607;
+  const Scalar _tmp1726 = _tmp1326 * _tmp1604;
+  const Scalar _tmp1727 = _tmp1355 * _tmp1624;
+  const Scalar _tmp1728 = _tmp1338 * _tmp1629;
+  const Scalar _tmp1729 = _tmp1329 * _tmp1608;
+  const Scalar _tmp1730 = _tmp1344 * _tmp1634;
+  const Scalar _tmp1731 = _tmp1346 * _tmp1618;
+  const Scalar _tmp1732 = _tmp1327 * _tmp1606;
+  const Scalar _tmp1733 = _tmp1350 * _tmp1627;
+  const Scalar _tmp1734 = _tmp1352 * _tmp1623;
+  const Scalar _tmp1735 = _tmp1337 * _tmp1619;
+  const Scalar _tmp1736 = _tmp1332 * _tmp1613;
+  const Scalar _tmp1737 = _tmp1345 * _tmp1630;
+  const Scalar _tmp1738 = _tmp1331 * _tmp1610;
+  const Scalar _tmp1739 = _tmp1347 * _tmp1617;
+  const Scalar _tmp1740 = _tmp1328 * _tmp1605;
+  const Scalar _tmp1741 = _tmp1340 * _tmp1632;
+  const Scalar _tmp1742 = _tmp1339 * _tmp1633;
+  const Scalar _tmp1743 =
+      _tmp1336 * _tmp1620 + _tmp1341 * _tmp1628 + _tmp1348 * _tmp1616 + _tmp1351 * _tmp1622 +
+      _tmp1354 * _tmp1621 + _tmp1716 + _tmp1717 + _tmp1718 + _tmp1719 + _tmp1720 + _tmp1721 +
+      _tmp1722 + _tmp1723 + _tmp1724 + _tmp1725 + _tmp1726 + _tmp1727 + _tmp1728 + _tmp1729 +
+      _tmp1730 + _tmp1731 + _tmp1732 + _tmp1733 + _tmp1734 + _tmp1735 + _tmp1736 + _tmp1737 +
+      _tmp1738 + _tmp1739 + _tmp1740 + _tmp1741 + _tmp1742;
+  const Scalar _tmp1744 = _tmp1743 * imu_noise(1, 0);
+  const Scalar _tmp1745 = _tmp1357 * _tmp1643 - _tmp1744;
+  const Scalar _tmp1746 = _tmp1684 * imu_noise(1, 0);
+  const Scalar _tmp1747 = -_tmp1043 * _tmp1643 + _tmp1746;
+  const Scalar _tmp1748 = _tmp1603 * _tmp1745 + _tmp1646 * _tmp1747;
+  const Scalar _tmp1749 = _tmp1743 * imu_noise(0, 0);
+  const Scalar _tmp1750 = -_tmp1357 * _tmp1637 + _tmp1749;
+  const Scalar _tmp1751 = _tmp1712 * imu_noise(0, 0);
+  const Scalar _tmp1752 = _tmp1231 * _tmp1637 - _tmp1751;
+  const Scalar _tmp1753 = _tmp1642 * _tmp1750 + _tmp1646 * _tmp1752;
+  const Scalar _tmp1754 =
+      std::pow(_tmp1012, Scalar(2)) * _tmp1604 + std::pow(_tmp1013, Scalar(2)) * _tmp1606 +
+      std::pow(_tmp1014, Scalar(2)) * _tmp1605 + std::pow(_tmp1015, Scalar(2)) * _tmp1608 +
+      std::pow(_tmp1016, Scalar(2)) * _tmp1607 + std::pow(_tmp1017, Scalar(2)) * _tmp1610 +
+      std::pow(_tmp1018, Scalar(2)) * _tmp1613 + std::pow(_tmp1019, Scalar(2)) * _tmp1611 +
+      std::pow(_tmp1020, Scalar(2)) * _tmp1609 + std::pow(_tmp1021, Scalar(2)) * _tmp1612 +
+      std::pow(_tmp1022, Scalar(2)) * _tmp1620 + std::pow(_tmp1023, Scalar(2)) * _tmp1619 +
+      std::pow(_tmp1024, Scalar(2)) * _tmp1629 + std::pow(_tmp1025, Scalar(2)) * _tmp1633 +
+      std::pow(_tmp1026, Scalar(2)) * _tmp1632 + std::pow(_tmp1027, Scalar(2)) * _tmp1628 +
+      std::pow(_tmp1028, Scalar(2)) * _tmp1631 + std::pow(_tmp1029, Scalar(2)) * _tmp1635 +
+      std::pow(_tmp1030, Scalar(2)) * _tmp1634 + std::pow(_tmp1031, Scalar(2)) * _tmp1630 +
+      std::pow(_tmp1032, Scalar(2)) * _tmp1618 + std::pow(_tmp1033, Scalar(2)) * _tmp1617 +
+      std::pow(_tmp1034, Scalar(2)) * _tmp1616 + std::pow(_tmp1035, Scalar(2)) * _tmp1626 +
+      std::pow(_tmp1036, Scalar(2)) * _tmp1627 + std::pow(_tmp1037, Scalar(2)) * _tmp1622 +
+      std::pow(_tmp1038, Scalar(2)) * _tmp1623 + std::pow(_tmp1039, Scalar(2)) * _tmp1625 +
+      std::pow(_tmp1040, Scalar(2)) * _tmp1621 + std::pow(_tmp1041, Scalar(2)) * _tmp1624 +
+      std::pow(_tmp1042, Scalar(2)) * _tmp1614 + std::pow(_tmp1043, Scalar(2)) * _tmp1615;
+  const Scalar _tmp1755 =
+      std::pow(_tmp1326, Scalar(2)) * _tmp1604 + std::pow(_tmp1327, Scalar(2)) * _tmp1606 +
+      std::pow(_tmp1328, Scalar(2)) * _tmp1605 + std::pow(_tmp1329, Scalar(2)) * _tmp1608 +
+      std::pow(_tmp1330, Scalar(2)) * _tmp1607 + std::pow(_tmp1331, Scalar(2)) * _tmp1610 +
+      std::pow(_tmp1332, Scalar(2)) * _tmp1613 + std::pow(_tmp1333, Scalar(2)) * _tmp1611 +
+      std::pow(_tmp1334, Scalar(2)) * _tmp1609 + std::pow(_tmp1335, Scalar(2)) * _tmp1612 +
+      std::pow(_tmp1336, Scalar(2)) * _tmp1620 + std::pow(_tmp1337, Scalar(2)) * _tmp1619 +
+      std::pow(_tmp1338, Scalar(2)) * _tmp1629 + std::pow(_tmp1339, Scalar(2)) * _tmp1633 +
+      std::pow(_tmp1340, Scalar(2)) * _tmp1632 + std::pow(_tmp1341, Scalar(2)) * _tmp1628 +
+      std::pow(_tmp1342, Scalar(2)) * _tmp1631 + std::pow(_tmp1343, Scalar(2)) * _tmp1635 +
+      std::pow(_tmp1344, Scalar(2)) * _tmp1634 + std::pow(_tmp1345, Scalar(2)) * _tmp1630 +
+      std::pow(_tmp1346, Scalar(2)) * _tmp1618 + std::pow(_tmp1347, Scalar(2)) * _tmp1617 +
+      std::pow(_tmp1348, Scalar(2)) * _tmp1616 + std::pow(_tmp1349, Scalar(2)) * _tmp1626 +
+      std::pow(_tmp1350, Scalar(2)) * _tmp1627 + std::pow(_tmp1351, Scalar(2)) * _tmp1622 +
+      std::pow(_tmp1352, Scalar(2)) * _tmp1623 + std::pow(_tmp1353, Scalar(2)) * _tmp1625 +
+      std::pow(_tmp1354, Scalar(2)) * _tmp1621 + std::pow(_tmp1355, Scalar(2)) * _tmp1624 +
+      std::pow(_tmp1356, Scalar(2)) * _tmp1614 + std::pow(_tmp1357, Scalar(2)) * _tmp1615;
+  const Scalar _tmp1756 =
+      _tmp1636 * imu_noise(4, 0) + _tmp1754 * imu_noise(2, 0) + _tmp1755 * imu_noise(0, 0);
+  const Scalar _tmp1757 = -_tmp1043 * _tmp1685 + _tmp1043 * _tmp1686 - _tmp1357 * _tmp1749 -
+                          _tmp1357 * _tmp1750 + _tmp1756;
+  const Scalar _tmp1758 =
+      imu_noise(0, 0) *
+      (_tmp1200 * _tmp1726 + _tmp1202 * _tmp1740 + _tmp1203 * _tmp1729 + _tmp1204 * _tmp1725 +
+       _tmp1205 * _tmp1738 + _tmp1207 * _tmp1718 + _tmp1211 * _tmp1735 + _tmp1212 * _tmp1728 +
+       _tmp1213 * _tmp1742 + _tmp1218 * _tmp1730 + _tmp1220 * _tmp1731 + _tmp1226 * _tmp1734 +
+       _tmp1227 * _tmp1720 + _tmp1229 * _tmp1727 + _tmp1327 * _tmp1700 + _tmp1332 * _tmp1702 +
+       _tmp1334 * _tmp1701 + _tmp1335 * _tmp1688 + _tmp1336 * _tmp1706 + _tmp1340 * _tmp1696 +
+       _tmp1341 * _tmp1707 + _tmp1342 * _tmp1687 + _tmp1343 * _tmp1699 + _tmp1345 * _tmp1697 +
+       _tmp1347 * _tmp1698 + _tmp1348 * _tmp1691 + _tmp1349 * _tmp1695 + _tmp1350 * _tmp1710 +
+       _tmp1351 * _tmp1708 + _tmp1354 * _tmp1705 + _tmp1356 * _tmp1690 + _tmp1357 * _tmp1703);
+  const Scalar _tmp1759 = _tmp1231 * _tmp1749 - _tmp1357 * _tmp1752 - _tmp1758;
+  const Scalar _tmp1760 =
+      imu_noise(2, 0) *
+      (_tmp1012 * _tmp1704 + _tmp1013 * _tmp1700 + _tmp1014 * _tmp1692 + _tmp1018 * _tmp1702 +
+       _tmp1020 * _tmp1701 + _tmp1021 * _tmp1688 + _tmp1025 * _tmp1689 + _tmp1026 * _tmp1696 +
+       _tmp1029 * _tmp1699 + _tmp1031 * _tmp1697 + _tmp1032 * _tmp1711 + _tmp1033 * _tmp1698 +
+       _tmp1035 * _tmp1695 + _tmp1036 * _tmp1710 + _tmp1037 * _tmp1708 + _tmp1042 * _tmp1690 +
+       _tmp1043 * _tmp1703 + _tmp1203 * _tmp1673 + _tmp1204 * _tmp1675 + _tmp1205 * _tmp1669 +
+       _tmp1207 * _tmp1662 + _tmp1210 * _tmp1668 + _tmp1211 * _tmp1678 + _tmp1212 * _tmp1660 +
+       _tmp1215 * _tmp1674 + _tmp1216 * _tmp1672 + _tmp1218 * _tmp1666 + _tmp1222 * _tmp1680 +
+       _tmp1226 * _tmp1679 + _tmp1227 * _tmp1676 + _tmp1228 * _tmp1671 + _tmp1229 * _tmp1670);
+  const Scalar _tmp1761 = _tmp1043 * _tmp1713 - _tmp1231 * _tmp1686 - _tmp1760;
+  const Scalar _tmp1762 =
+      imu_noise(1, 0) *
+      (_tmp1012 * _tmp1726 + _tmp1013 * _tmp1732 + _tmp1014 * _tmp1740 + _tmp1016 * _tmp1725 +
+       _tmp1018 * _tmp1736 + _tmp1019 * _tmp1718 + _tmp1021 * _tmp1723 + _tmp1023 * _tmp1735 +
+       _tmp1024 * _tmp1728 + _tmp1025 * _tmp1742 + _tmp1030 * _tmp1730 + _tmp1031 * _tmp1737 +
+       _tmp1032 * _tmp1731 + _tmp1035 * _tmp1716 + _tmp1036 * _tmp1733 + _tmp1038 * _tmp1734 +
+       _tmp1041 * _tmp1727 + _tmp1042 * _tmp1722 + _tmp1043 * _tmp1724 + _tmp1329 * _tmp1673 +
+       _tmp1331 * _tmp1669 + _tmp1334 * _tmp1664 + _tmp1336 * _tmp1668 + _tmp1340 * _tmp1681 +
+       _tmp1341 * _tmp1674 + _tmp1342 * _tmp1672 + _tmp1343 * _tmp1683 + _tmp1347 * _tmp1677 +
+       _tmp1348 * _tmp1680 + _tmp1351 * _tmp1663 + _tmp1353 * _tmp1676 + _tmp1354 * _tmp1671);
+  const Scalar _tmp1763 = _tmp1043 * _tmp1744 + _tmp1357 * _tmp1747 - _tmp1762;
+  const Scalar _tmp1764 =
+      std::pow(_tmp1200, Scalar(2)) * _tmp1604 + std::pow(_tmp1201, Scalar(2)) * _tmp1606 +
+      std::pow(_tmp1202, Scalar(2)) * _tmp1605 + std::pow(_tmp1203, Scalar(2)) * _tmp1608 +
+      std::pow(_tmp1204, Scalar(2)) * _tmp1607 + std::pow(_tmp1205, Scalar(2)) * _tmp1610 +
+      std::pow(_tmp1206, Scalar(2)) * _tmp1613 + std::pow(_tmp1207, Scalar(2)) * _tmp1611 +
+      std::pow(_tmp1208, Scalar(2)) * _tmp1609 + std::pow(_tmp1209, Scalar(2)) * _tmp1612 +
+      std::pow(_tmp1210, Scalar(2)) * _tmp1620 + std::pow(_tmp1211, Scalar(2)) * _tmp1619 +
+      std::pow(_tmp1212, Scalar(2)) * _tmp1629 + std::pow(_tmp1213, Scalar(2)) * _tmp1633 +
+      std::pow(_tmp1214, Scalar(2)) * _tmp1632 + std::pow(_tmp1215, Scalar(2)) * _tmp1628 +
+      std::pow(_tmp1216, Scalar(2)) * _tmp1631 + std::pow(_tmp1217, Scalar(2)) * _tmp1635 +
+      std::pow(_tmp1218, Scalar(2)) * _tmp1634 + std::pow(_tmp1219, Scalar(2)) * _tmp1630 +
+      std::pow(_tmp1220, Scalar(2)) * _tmp1618 + std::pow(_tmp1221, Scalar(2)) * _tmp1617 +
+      std::pow(_tmp1222, Scalar(2)) * _tmp1616 + std::pow(_tmp1223, Scalar(2)) * _tmp1626 +
+      std::pow(_tmp1224, Scalar(2)) * _tmp1627 + std::pow(_tmp1225, Scalar(2)) * _tmp1622 +
+      std::pow(_tmp1226, Scalar(2)) * _tmp1623 + std::pow(_tmp1227, Scalar(2)) * _tmp1625 +
+      std::pow(_tmp1228, Scalar(2)) * _tmp1621 + std::pow(_tmp1229, Scalar(2)) * _tmp1624 +
+      std::pow(_tmp1230, Scalar(2)) * _tmp1614 + std::pow(_tmp1231, Scalar(2)) * _tmp1615;
+  const Scalar _tmp1765 =
+      _tmp1636 * imu_noise(3, 0) + _tmp1755 * imu_noise(1, 0) + _tmp1764 * imu_noise(2, 0);
+  const Scalar _tmp1766 = -_tmp1231 * _tmp1713 - _tmp1231 * _tmp1714 - _tmp1357 * _tmp1744 +
+                          _tmp1357 * _tmp1745 + _tmp1765;
+  const Scalar _tmp1767 =
+      _tmp1636 * imu_noise(5, 0) + _tmp1754 * imu_noise(1, 0) + _tmp1764 * imu_noise(0, 0);
+  const Scalar _tmp1768 = -_tmp1043 * _tmp1746 - _tmp1043 * _tmp1747 - _tmp1231 * _tmp1751 +
+                          _tmp1231 * _tmp1752 + _tmp1767;
+  const Scalar _tmp1769 = _tmp1648 * _tmp1745 + _tmp1651 * _tmp1747;
+  const Scalar _tmp1770 = _tmp1648 * _tmp1714 + _tmp1654 * _tmp1686;
+  const Scalar _tmp1771 = _tmp1651 * _tmp1752 + _tmp1654 * _tmp1750;
+  const Scalar _tmp1772 = _tmp1648 * _tmp1766 + _tmp1651 * _tmp1763 + _tmp1654 * _tmp1761;
+  const Scalar _tmp1773 = _tmp1648 * _tmp1763 + _tmp1651 * _tmp1768 + _tmp1654 * _tmp1759;
+  const Scalar _tmp1774 = _tmp1648 * _tmp1761 + _tmp1651 * _tmp1759 + _tmp1654 * _tmp1757;
+  const Scalar _tmp1775 = _tmp1657 * _tmp1747 + _tmp1658 * _tmp1745;
+  const Scalar _tmp1776 = _tmp1655 * _tmp1686 + _tmp1658 * _tmp1714;
+  const Scalar _tmp1777 = _tmp1655 * _tmp1750 + _tmp1657 * _tmp1752;
+  const Scalar _tmp1778 = _tmp1655 * _tmp1757 + _tmp1657 * _tmp1759 + _tmp1658 * _tmp1761;
+  const Scalar _tmp1779 = _tmp1655 * _tmp1759 + _tmp1657 * _tmp1768 + _tmp1658 * _tmp1763;
+  const Scalar _tmp1780 = _tmp1655 * _tmp1761 + _tmp1657 * _tmp1763 + _tmp1658 * _tmp1766;
+  const Scalar _tmp1781 = dt(0, 0) + dt(1, 0);
+  const Scalar _tmp1782 = _tmp1781 + dt(2, 0);
+  const Scalar _tmp1783 = _tmp1782 + dt(3, 0);
+  const Scalar _tmp1784 = _tmp1783 + dt(4, 0);
+  const Scalar _tmp1785 = _tmp1784 + dt(5, 0);
+  const Scalar _tmp1786 = _tmp1785 + dt(6, 0);
+  const Scalar _tmp1787 = _tmp1786 + dt(7, 0);
+  const Scalar _tmp1788 = _tmp1787 + dt(8, 0);
+  const Scalar _tmp1789 = -_tmp1020 * _tmp1788 + _tmp1512;
+  const Scalar _tmp1790 = _tmp1788 + dt(9, 0);
+  const Scalar _tmp1791 = -_tmp1021 * _tmp1790 + _tmp1513;
+  const Scalar _tmp1792 = _tmp1612 * _tmp1791;
+  const Scalar _tmp1793 = _tmp1790 + dt(10, 0);
+  const Scalar _tmp1794 = _tmp1793 + dt(11, 0);
+  const Scalar _tmp1795 = _tmp1794 + dt(12, 0);
+  const Scalar _tmp1796 = _tmp1795 + dt(13, 0);
+  const Scalar _tmp1797 = _tmp1796 + dt(14, 0);
+  const Scalar _tmp1798 = _tmp1797 + dt(15, 0);
+  const Scalar _tmp1799 = _tmp1798 + dt(16, 0);
+  const Scalar _tmp1800 = _tmp1799 + dt(17, 0);
+  const Scalar _tmp1801 = _tmp1800 + dt(18, 0);
+  const Scalar _tmp1802 = _tmp1801 + dt(19, 0);
+  const Scalar _tmp1803 = _tmp1802 + dt(20, 0);
+  const Scalar _tmp1804 = _tmp1803 + dt(21, 0);
+  const Scalar _tmp1805 = _tmp1804 + dt(22, 0);
+  const Scalar _tmp1806 = _tmp1805 + dt(23, 0);
+  const Scalar _tmp1807 = _tmp1806 + dt(24, 0);
+  const Scalar _tmp1808 = _tmp1807 + dt(25, 0);
+  const Scalar _tmp1809 = _tmp1808 + dt(26, 0);
+  const Scalar _tmp1810 = _tmp1809 + dt(27, 0);
+  const Scalar _tmp1811 = _tmp1810 + dt(28, 0);
+  const Scalar _tmp1812 = -_tmp1040 * _tmp1811 + _tmp1532;
+  const Scalar _tmp1813 = _tmp1621 * _tmp1812;
+  const Scalar _tmp1814 = -_tmp1013 * _tmp1781 + _tmp1505;
+  const Scalar _tmp1815 = _tmp1606 * _tmp1814;
+  const Scalar _tmp1816 = _tmp1811 + dt(29, 0);
+  const Scalar _tmp1817 = _tmp1816 + dt(30, 0);
+  const Scalar _tmp1818 = _tmp1817 + dt(31, 0);
+  const Scalar _tmp1819 = -_tmp1043 * _tmp1818 + _tmp1535;
+  const Scalar _tmp1820 = _tmp1615 * _tmp1819;
+  const Scalar _tmp1821 = -_tmp1036 * _tmp1807 + _tmp1528;
+  const Scalar _tmp1822 = _tmp1627 * _tmp1821;
+  const Scalar _tmp1823 = -_tmp1012 * dt(0, 0) + _tmp1504;
+  const Scalar _tmp1824 = _tmp1604 * _tmp1823;
+  const Scalar _tmp1825 = -_tmp1014 * _tmp1782 + _tmp1506;
+  const Scalar _tmp1826 = _tmp1605 * _tmp1825;
+  const Scalar _tmp1827 = -_tmp1038 * _tmp1809 + _tmp1530;
+  const Scalar _tmp1828 = _tmp1623 * _tmp1827;
+  const Scalar _tmp1829 = -_tmp1032 * _tmp1803 + _tmp1524;
+  const Scalar _tmp1830 = -_tmp1015 * _tmp1783 + _tmp1507;
+  const Scalar _tmp1831 = _tmp1608 * _tmp1830;
+  const Scalar _tmp1832 = -_tmp1029 * _tmp1800 + _tmp1521;
+  const Scalar _tmp1833 = -_tmp1025 * _tmp1796 + _tmp1517;
+  const Scalar _tmp1834 = _tmp1633 * _tmp1833;
+  const Scalar _tmp1835 = -_tmp1018 * _tmp1786 + _tmp1510;
+  const Scalar _tmp1836 = _tmp1613 * _tmp1835;
+  const Scalar _tmp1837 = -_tmp1033 * _tmp1804 + _tmp1525;
+  const Scalar _tmp1838 = _tmp1617 * _tmp1837;
+  const Scalar _tmp1839 = -_tmp1024 * _tmp1795 + _tmp1516;
+  const Scalar _tmp1840 = _tmp1629 * _tmp1839;
+  const Scalar _tmp1841 = -_tmp1035 * _tmp1806 + _tmp1527;
+  const Scalar _tmp1842 = _tmp1626 * _tmp1841;
+  const Scalar _tmp1843 = -_tmp1030 * _tmp1801 + _tmp1522;
+  const Scalar _tmp1844 = _tmp1634 * _tmp1843;
+  const Scalar _tmp1845 = -_tmp1031 * _tmp1802 + _tmp1523;
+  const Scalar _tmp1846 = _tmp1630 * _tmp1845;
+  const Scalar _tmp1847 = -_tmp1042 * _tmp1817 + _tmp1534;
+  const Scalar _tmp1848 = _tmp1614 * _tmp1847;
+  const Scalar _tmp1849 = -_tmp1023 * _tmp1794 + _tmp1515;
+  const Scalar _tmp1850 = _tmp1619 * _tmp1849;
+  const Scalar _tmp1851 = -_tmp1028 * _tmp1799 + _tmp1520;
+  const Scalar _tmp1852 = _tmp1631 * _tmp1851;
+  const Scalar _tmp1853 = -_tmp1037 * _tmp1808 + _tmp1529;
+  const Scalar _tmp1854 = _tmp1622 * _tmp1853;
+  const Scalar _tmp1855 = -_tmp1017 * _tmp1785 + _tmp1509;
+  const Scalar _tmp1856 = _tmp1610 * _tmp1855;
+  const Scalar _tmp1857 = -_tmp1034 * _tmp1805 + _tmp1526;
+  const Scalar _tmp1858 = _tmp1616 * _tmp1857;
+  const Scalar _tmp1859 = -_tmp1022 * _tmp1793 + _tmp1514;
+  const Scalar _tmp1860 = _tmp1620 * _tmp1859;
+  const Scalar _tmp1861 = -_tmp1039 * _tmp1810 + _tmp1531;
+  const Scalar _tmp1862 = _tmp1625 * _tmp1861;
+  const Scalar _tmp1863 = -_tmp1026 * _tmp1797 + _tmp1518;
+  const Scalar _tmp1864 = _tmp1632 * _tmp1863;
+  const Scalar _tmp1865 = -_tmp1016 * _tmp1784 + _tmp1508;
+  const Scalar _tmp1866 = _tmp1607 * _tmp1865;
+  const Scalar _tmp1867 = -_tmp1019 * _tmp1787 + _tmp1511;
+  const Scalar _tmp1868 = _tmp1611 * _tmp1867;
+  const Scalar _tmp1869 = -_tmp1041 * _tmp1816 + _tmp1533;
+  const Scalar _tmp1870 = _tmp1624 * _tmp1869;
+  const Scalar _tmp1871 = -_tmp1027 * _tmp1798 + _tmp1519;
+  const Scalar _tmp1872 = _tmp1628 * _tmp1871;
+  const Scalar _tmp1873 = _tmp1609 * _tmp1789 + _tmp1618 * _tmp1829 + _tmp1635 * _tmp1832 +
+                          _tmp1792 + _tmp1813 + _tmp1815 + _tmp1820 + _tmp1822 + _tmp1824 +
+                          _tmp1826 + _tmp1828 + _tmp1831 + _tmp1834 + _tmp1836 + _tmp1838 +
+                          _tmp1840 + _tmp1842 + _tmp1844 + _tmp1846 + _tmp1848 + _tmp1850 +
+                          _tmp1852 + _tmp1854 + _tmp1856 + _tmp1858 + _tmp1860 + _tmp1862 +
+                          _tmp1864 + _tmp1866 + _tmp1868 + _tmp1870 + _tmp1872;
+  const Scalar _tmp1874 = -_tmp1685 * _tmp1818 - _tmp1873 * imu_noise(2, 0);
+  const Scalar _tmp1875 = _tmp1535 * _tmp1647 + _tmp1874;
+  const Scalar _tmp1876 = -_tmp1202 * _tmp1782 + _tmp1538;
+  const Scalar _tmp1877 = _tmp1605 * _tmp1876;
+  const Scalar _tmp1878 = -_tmp1231 * _tmp1818 + _tmp1567;
+  const Scalar _tmp1879 = -_tmp1229 * _tmp1816 + _tmp1565;
+  const Scalar _tmp1880 = -_tmp1220 * _tmp1803 + _tmp1556;
+  const Scalar _tmp1881 = _tmp1618 * _tmp1880;
+  const Scalar _tmp1882 = -_tmp1208 * _tmp1788 + _tmp1544;
+  const Scalar _tmp1883 = _tmp1609 * _tmp1882;
+  const Scalar _tmp1884 = -_tmp1221 * _tmp1804 + _tmp1557;
+  const Scalar _tmp1885 = -_tmp1215 * _tmp1798 + _tmp1551;
+  const Scalar _tmp1886 = _tmp1628 * _tmp1885;
+  const Scalar _tmp1887 = -_tmp1216 * _tmp1799 + _tmp1552;
+  const Scalar _tmp1888 = -_tmp1213 * _tmp1796 + _tmp1549;
+  const Scalar _tmp1889 = -_tmp1207 * _tmp1787 + _tmp1543;
+  const Scalar _tmp1890 = -_tmp1200 * dt(0, 0) + _tmp1536;
+  const Scalar _tmp1891 = _tmp1604 * _tmp1890;
+  const Scalar _tmp1892 = -_tmp1226 * _tmp1809 + _tmp1562;
+  const Scalar _tmp1893 = _tmp1623 * _tmp1892;
+  const Scalar _tmp1894 = -_tmp1210 * _tmp1793 + _tmp1546;
+  const Scalar _tmp1895 = _tmp1620 * _tmp1894;
+  const Scalar _tmp1896 = -_tmp1206 * _tmp1786 + _tmp1542;
+  const Scalar _tmp1897 = _tmp1613 * _tmp1896;
+  const Scalar _tmp1898 = -_tmp1204 * _tmp1784 + _tmp1540;
+  const Scalar _tmp1899 = _tmp1607 * _tmp1898;
+  const Scalar _tmp1900 = -_tmp1201 * _tmp1781 + _tmp1537;
+  const Scalar _tmp1901 = _tmp1606 * _tmp1900;
+  const Scalar _tmp1902 = -_tmp1222 * _tmp1805 + _tmp1558;
+  const Scalar _tmp1903 = _tmp1616 * _tmp1902;
+  const Scalar _tmp1904 = -_tmp1218 * _tmp1801 + _tmp1554;
+  const Scalar _tmp1905 = _tmp1634 * _tmp1904;
+  const Scalar _tmp1906 = -_tmp1224 * _tmp1807 + _tmp1560;
+  const Scalar _tmp1907 = _tmp1627 * _tmp1906;
+  const Scalar _tmp1908 = -_tmp1219 * _tmp1802 + _tmp1555;
+  const Scalar _tmp1909 = _tmp1630 * _tmp1908;
+  const Scalar _tmp1910 = -_tmp1217 * _tmp1800 + _tmp1553;
+  const Scalar _tmp1911 = _tmp1635 * _tmp1910;
+  const Scalar _tmp1912 = -_tmp1205 * _tmp1785 + _tmp1541;
+  const Scalar _tmp1913 = _tmp1610 * _tmp1912;
+  const Scalar _tmp1914 = -_tmp1223 * _tmp1806 + _tmp1559;
+  const Scalar _tmp1915 = _tmp1626 * _tmp1914;
+  const Scalar _tmp1916 = -_tmp1227 * _tmp1810 + _tmp1563;
+  const Scalar _tmp1917 = _tmp1625 * _tmp1916;
+  const Scalar _tmp1918 = -_tmp1211 * _tmp1794 + _tmp1547;
+  const Scalar _tmp1919 = _tmp1619 * _tmp1918;
+  const Scalar _tmp1920 = -_tmp1203 * _tmp1783 + _tmp1539;
+  const Scalar _tmp1921 = _tmp1608 * _tmp1920;
+  const Scalar _tmp1922 = -_tmp1228 * _tmp1811 + _tmp1564;
+  const Scalar _tmp1923 = _tmp1621 * _tmp1922;
+  const Scalar _tmp1924 = -_tmp1214 * _tmp1797 + _tmp1550;
+  const Scalar _tmp1925 = _tmp1632 * _tmp1924;
+  const Scalar _tmp1926 = -_tmp1209 * _tmp1790 + _tmp1545;
+  const Scalar _tmp1927 = _tmp1612 * _tmp1926;
+  const Scalar _tmp1928 = -_tmp1225 * _tmp1808 + _tmp1561;
+  const Scalar _tmp1929 = _tmp1622 * _tmp1928;
+  const Scalar _tmp1930 = -_tmp1230 * _tmp1817 + _tmp1566;
+  const Scalar _tmp1931 = _tmp1614 * _tmp1930;
+  const Scalar _tmp1932 = -_tmp1212 * _tmp1795 + _tmp1548;
+  const Scalar _tmp1933 = _tmp1629 * _tmp1932;
+  const Scalar _tmp1934 =
+      _tmp1611 * _tmp1889 + _tmp1615 * _tmp1878 + _tmp1617 * _tmp1884 + _tmp1624 * _tmp1879 +
+      _tmp1631 * _tmp1887 + _tmp1633 * _tmp1888 + _tmp1877 + _tmp1881 + _tmp1883 + _tmp1886 +
+      _tmp1891 + _tmp1893 + _tmp1895 + _tmp1897 + _tmp1899 + _tmp1901 + _tmp1903 + _tmp1905 +
+      _tmp1907 + _tmp1909 + _tmp1911 + _tmp1913 + _tmp1915 + _tmp1917 + _tmp1919 + _tmp1921 +
+      _tmp1923 + _tmp1925 + _tmp1927 + _tmp1929 + _tmp1931 + _tmp1933;
+  const Scalar _tmp1935 = _tmp1713 * _tmp1818 + _tmp1934 * imu_noise(2, 0);
+  const Scalar _tmp1936 = -_tmp1567 * _tmp1647 + _tmp1935;
+  const Scalar _tmp1937 = _tmp1603 * _tmp1936 + _tmp1642 * _tmp1875;
+  const Scalar _tmp1938 = -_tmp1341 * _tmp1798 + _tmp1583;
+  const Scalar _tmp1939 = _tmp1628 * _tmp1938;
+  const Scalar _tmp1940 = -_tmp1328 * _tmp1782 + _tmp1570;
+  const Scalar _tmp1941 = _tmp1605 * _tmp1940;
+  const Scalar _tmp1942 = -_tmp1346 * _tmp1803 + _tmp1588;
+  const Scalar _tmp1943 = _tmp1618 * _tmp1942;
+  const Scalar _tmp1944 = -_tmp1336 * _tmp1793 + _tmp1578;
+  const Scalar _tmp1945 = _tmp1620 * _tmp1944;
+  const Scalar _tmp1946 = -_tmp1333 * _tmp1787 + _tmp1575;
+  const Scalar _tmp1947 = _tmp1611 * _tmp1946;
+  const Scalar _tmp1948 = -_tmp1343 * _tmp1800 + _tmp1585;
+  const Scalar _tmp1949 = _tmp1635 * _tmp1948;
+  const Scalar _tmp1950 = -_tmp1352 * _tmp1809 + _tmp1594;
+  const Scalar _tmp1951 = _tmp1623 * _tmp1950;
+  const Scalar _tmp1952 = -_tmp1353 * _tmp1810 + _tmp1595;
+  const Scalar _tmp1953 = _tmp1625 * _tmp1952;
+  const Scalar _tmp1954 = -_tmp1340 * _tmp1797 + _tmp1582;
+  const Scalar _tmp1955 = -_tmp1326 * dt(0, 0) + _tmp1568;
+  const Scalar _tmp1956 = _tmp1604 * _tmp1955;
+  const Scalar _tmp1957 = -_tmp1347 * _tmp1804 + _tmp1589;
+  const Scalar _tmp1958 = _tmp1617 * _tmp1957;
+  const Scalar _tmp1959 = -_tmp1329 * _tmp1783 + _tmp1571;
+  const Scalar _tmp1960 = -_tmp1356 * _tmp1817 + _tmp1598;
+  const Scalar _tmp1961 = -_tmp1327 * _tmp1781 + _tmp1569;
+  const Scalar _tmp1962 = _tmp1606 * _tmp1961;
+  const Scalar _tmp1963 = -_tmp1354 * _tmp1811 + _tmp1596;
+  const Scalar _tmp1964 = _tmp1621 * _tmp1963;
+  const Scalar _tmp1965 = -_tmp1338 * _tmp1795 + _tmp1580;
+  const Scalar _tmp1966 = _tmp1629 * _tmp1965;
+  const Scalar _tmp1967 = -_tmp1332 * _tmp1786 + _tmp1574;
+  const Scalar _tmp1968 = _tmp1613 * _tmp1967;
+  const Scalar _tmp1969 = -_tmp1348 * _tmp1805 + _tmp1590;
+  const Scalar _tmp1970 = _tmp1616 * _tmp1969;
+  const Scalar _tmp1971 = -_tmp1331 * _tmp1785 + _tmp1573;
+  const Scalar _tmp1972 = _tmp1610 * _tmp1971;
+  const Scalar _tmp1973 = -_tmp1357 * _tmp1818 + _tmp1599;
+  const Scalar _tmp1974 = _tmp1615 * _tmp1973;
+  const Scalar _tmp1975 = -_tmp1355 * _tmp1816 + _tmp1597;
+  const Scalar _tmp1976 = _tmp1624 * _tmp1975;
+  const Scalar _tmp1977 = -_tmp1337 * _tmp1794 + _tmp1579;
+  const Scalar _tmp1978 = _tmp1619 * _tmp1977;
+  const Scalar _tmp1979 = -_tmp1334 * _tmp1788 + _tmp1576;
+  const Scalar _tmp1980 = _tmp1609 * _tmp1979;
+  const Scalar _tmp1981 = -_tmp1330 * _tmp1784 + _tmp1572;
+  const Scalar _tmp1982 = _tmp1607 * _tmp1981;
+  const Scalar _tmp1983 = -_tmp1351 * _tmp1808 + _tmp1593;
+  const Scalar _tmp1984 = _tmp1622 * _tmp1983;
+  const Scalar _tmp1985 = -_tmp1345 * _tmp1802 + _tmp1587;
+  const Scalar _tmp1986 = _tmp1630 * _tmp1985;
+  const Scalar _tmp1987 = -_tmp1339 * _tmp1796 + _tmp1581;
+  const Scalar _tmp1988 = _tmp1633 * _tmp1987;
+  const Scalar _tmp1989 = -_tmp1335 * _tmp1790 + _tmp1577;
+  const Scalar _tmp1990 = _tmp1612 * _tmp1989;
+  const Scalar _tmp1991 = -_tmp1349 * _tmp1806 + _tmp1591;
+  const Scalar _tmp1992 = _tmp1626 * _tmp1991;
+  const Scalar _tmp1993 = -_tmp1344 * _tmp1801 + _tmp1586;
+  const Scalar _tmp1994 = _tmp1634 * _tmp1993;
+  const Scalar _tmp1995 = -_tmp1350 * _tmp1807 + _tmp1592;
+  const Scalar _tmp1996 = _tmp1627 * _tmp1995;
+  const Scalar _tmp1997 = -_tmp1342 * _tmp1799 + _tmp1584;
+  const Scalar _tmp1998 = _tmp1631 * _tmp1997;
+  const Scalar _tmp1999 = _tmp1608 * _tmp1959 + _tmp1614 * _tmp1960 + _tmp1632 * _tmp1954 +
+                          _tmp1939 + _tmp1941 + _tmp1943 + _tmp1945 + _tmp1947 + _tmp1949 +
+                          _tmp1951 + _tmp1953 + _tmp1956 + _tmp1958 + _tmp1962 + _tmp1964 +
+                          _tmp1966 + _tmp1968 + _tmp1970 + _tmp1972 + _tmp1974 + _tmp1976 +
+                          _tmp1978 + _tmp1980 + _tmp1982 + _tmp1984 + _tmp1986 + _tmp1988 +
+                          _tmp1990 + _tmp1992 + _tmp1994 + _tmp1996 + _tmp1998;
+  const Scalar _tmp2000 = -_tmp1744 * _tmp1818 - _tmp1999 * imu_noise(1, 0);
+  const Scalar _tmp2001 = _tmp1599 * _tmp1643 + _tmp2000;
+  const Scalar _tmp2002 = _tmp1746 * _tmp1818 + _tmp1873 * imu_noise(1, 0);
+  const Scalar _tmp2003 = -_tmp1535 * _tmp1643 + _tmp2002;
+  const Scalar _tmp2004 = _tmp1603 * _tmp2001 + _tmp1646 * _tmp2003;
+  const Scalar _tmp2005 = -_tmp1751 * _tmp1818 - _tmp1934 * imu_noise(0, 0);
+  const Scalar _tmp2006 = _tmp1567 * _tmp1637 + _tmp2005;
+  const Scalar _tmp2007 = _tmp1749 * _tmp1818 + _tmp1999 * imu_noise(0, 0);
+  const Scalar _tmp2008 = -_tmp1599 * _tmp1637 + _tmp2007;
+  const Scalar _tmp2009 = _tmp1642 * _tmp2008 + _tmp1646 * _tmp2006;
+  const Scalar _tmp2010 = -_tmp1760 * _tmp1818;
+  const Scalar _tmp2011 =
+      _tmp2010 -
+      imu_noise(2, 0) *
+          (_tmp1204 * _tmp1866 + _tmp1205 * _tmp1856 + _tmp1207 * _tmp1868 + _tmp1211 * _tmp1850 +
+           _tmp1212 * _tmp1840 + _tmp1213 * _tmp1834 + _tmp1215 * _tmp1872 + _tmp1216 * _tmp1852 +
+           _tmp1218 * _tmp1844 + _tmp1219 * _tmp1846 + _tmp1222 * _tmp1858 + _tmp1223 * _tmp1842 +
+           _tmp1226 * _tmp1828 + _tmp1227 * _tmp1862 + _tmp1229 * _tmp1870 + _tmp1230 * _tmp1848 +
+           _tmp1688 * _tmp1791 + _tmp1692 * _tmp1825 + _tmp1694 * _tmp1830 + _tmp1696 * _tmp1863 +
+           _tmp1698 * _tmp1837 + _tmp1699 * _tmp1832 + _tmp1700 * _tmp1814 + _tmp1701 * _tmp1789 +
+           _tmp1702 * _tmp1835 + _tmp1703 * _tmp1819 + _tmp1704 * _tmp1823 + _tmp1705 * _tmp1812 +
+           _tmp1706 * _tmp1859 + _tmp1708 * _tmp1853 + _tmp1710 * _tmp1821 + _tmp1711 * _tmp1829);
+  const Scalar _tmp2012 = -_tmp1231 * _tmp1875 + _tmp1535 * _tmp1713 + _tmp2011;
+  const Scalar _tmp2013 = -_tmp1762 * _tmp1818;
+  const Scalar _tmp2014 =
+      _tmp2013 -
+      imu_noise(1, 0) *
+          (_tmp1331 * _tmp1856 + _tmp1332 * _tmp1836 + _tmp1333 * _tmp1868 + _tmp1336 * _tmp1860 +
+           _tmp1337 * _tmp1850 + _tmp1339 * _tmp1834 + _tmp1340 * _tmp1864 + _tmp1341 * _tmp1872 +
+           _tmp1342 * _tmp1852 + _tmp1344 * _tmp1844 + _tmp1345 * _tmp1846 + _tmp1347 * _tmp1838 +
+           _tmp1348 * _tmp1858 + _tmp1349 * _tmp1842 + _tmp1351 * _tmp1854 + _tmp1353 * _tmp1862 +
+           _tmp1354 * _tmp1813 + _tmp1356 * _tmp1848 + _tmp1717 * _tmp1832 + _tmp1721 * _tmp1789 +
+           _tmp1723 * _tmp1791 + _tmp1724 * _tmp1819 + _tmp1725 * _tmp1865 + _tmp1726 * _tmp1823 +
+           _tmp1727 * _tmp1869 + _tmp1728 * _tmp1839 + _tmp1729 * _tmp1830 + _tmp1731 * _tmp1829 +
+           _tmp1732 * _tmp1814 + _tmp1733 * _tmp1821 + _tmp1734 * _tmp1827 + _tmp1740 * _tmp1825);
+  const Scalar _tmp2015 = _tmp1357 * _tmp2003 + _tmp1535 * _tmp1744 + _tmp2014;
+  const Scalar _tmp2016 = -_tmp1795 + _tmp733;
+  const Scalar _tmp2017 = -_tmp1797 + _tmp691;
+  const Scalar _tmp2018 = -_tmp1811 + _tmp367;
+  const Scalar _tmp2019 = -_tmp1809 + _tmp413;
+  const Scalar _tmp2020 = -_tmp1807 + _tmp459;
+  const Scalar _tmp2021 = -_tmp1801 + _tmp595;
+  const Scalar _tmp2022 = -_tmp1799 + _tmp645;
+  const Scalar _tmp2023 = -_tmp1817 + _tmp321;
+  const Scalar _tmp2024 = -_tmp1803 + _tmp549;
+  const Scalar _tmp2025 = -_tmp1805 + _tmp508;
+  const Scalar _tmp2026 = -_tmp1793 + _tmp779;
+  const Scalar _tmp2027 = -_tmp1818 + _tmp302;
+  const Scalar _tmp2028 = -_tmp1794 + _tmp760;
+  const Scalar _tmp2029 = -_tmp1804 + _tmp526;
+  const Scalar _tmp2030 = -_tmp1808 + _tmp439;
+  const Scalar _tmp2031 = -_tmp1806 + _tmp481;
+  const Scalar _tmp2032 = -_tmp1810 + _tmp394;
+  const Scalar _tmp2033 = -_tmp1816 + _tmp348;
+  const Scalar _tmp2034 = -_tmp1802 + _tmp572;
+  const Scalar _tmp2035 = -_tmp1796 + _tmp710;
+  const Scalar _tmp2036 = -_tmp1800 + _tmp618;
+  const Scalar _tmp2037 = -_tmp1798 + _tmp664;
+  const Scalar _tmp2038 = -_tmp1784 + _tmp923;
+  const Scalar _tmp2039 = -_tmp1782 + _tmp966;
+  const Scalar _tmp2040 = -_tmp1788 + _tmp829;
+  const Scalar _tmp2041 = -_tmp1786 + _tmp872;
+  const Scalar _tmp2042 = -_tmp1785 + _tmp896;
+  const Scalar _tmp2043 = -_tmp1787 + _tmp849;
+  const Scalar _tmp2044 = -_tmp1790 + _tmp806;
+  const Scalar _tmp2045 = -_tmp1781 + _tmp994;
+  const Scalar _tmp2046 = -_tmp1783 + _tmp946;
+  const Scalar _tmp2047 =
+      _tmp1605 * _tmp2039 + _tmp1606 * _tmp2045 + _tmp1607 * _tmp2038 + _tmp1608 * _tmp2046 +
+      _tmp1609 * _tmp2040 + _tmp1610 * _tmp2042 + _tmp1611 * _tmp2043 + _tmp1612 * _tmp2044 +
+      _tmp1613 * _tmp2041 + _tmp1614 * _tmp2023 + _tmp1615 * _tmp2027 + _tmp1616 * _tmp2025 +
+      _tmp1617 * _tmp2029 + _tmp1618 * _tmp2024 + _tmp1619 * _tmp2028 + _tmp1620 * _tmp2026 +
+      _tmp1621 * _tmp2018 + _tmp1622 * _tmp2030 + _tmp1623 * _tmp2019 + _tmp1624 * _tmp2033 +
+      _tmp1625 * _tmp2032 + _tmp1626 * _tmp2031 + _tmp1627 * _tmp2020 + _tmp1628 * _tmp2037 +
+      _tmp1629 * _tmp2016 + _tmp1630 * _tmp2034 + _tmp1631 * _tmp2022 + _tmp1632 * _tmp2017 +
+      _tmp1633 * _tmp2035 + _tmp1634 * _tmp2021 + _tmp1635 * _tmp2036 -
+      Scalar(1) / Scalar(2) * std::pow(dt(0, 0), Scalar(4));
+  const Scalar _tmp2048 =
+      _tmp1331 * _tmp1972 + _tmp1332 * _tmp1968 + _tmp1334 * _tmp1980 + _tmp1335 * _tmp1990 +
+      _tmp1336 * _tmp1945 + _tmp1339 * _tmp1988 + _tmp1341 * _tmp1939 + _tmp1342 * _tmp1998 +
+      _tmp1345 * _tmp1986 + _tmp1348 * _tmp1970 + _tmp1349 * _tmp1992 + _tmp1350 * _tmp1996 +
+      _tmp1351 * _tmp1984 + _tmp1353 * _tmp1953 + _tmp1354 * _tmp1964 + _tmp1355 * _tmp1976 +
+      _tmp1717 * _tmp1948 + _tmp1718 * _tmp1946 + _tmp1722 * _tmp1960 + _tmp1724 * _tmp1973 +
+      _tmp1725 * _tmp1981 + _tmp1726 * _tmp1955 + _tmp1728 * _tmp1965 + _tmp1729 * _tmp1959 +
+      _tmp1730 * _tmp1993 + _tmp1731 * _tmp1942 + _tmp1732 * _tmp1961 + _tmp1734 * _tmp1950 +
+      _tmp1735 * _tmp1977 + _tmp1739 * _tmp1957 + _tmp1740 * _tmp1940 + _tmp1741 * _tmp1954;
+  const Scalar _tmp2049 =
+      _tmp1201 * _tmp1901 + _tmp1203 * _tmp1921 + _tmp1204 * _tmp1899 + _tmp1205 * _tmp1913 +
+      _tmp1206 * _tmp1897 + _tmp1209 * _tmp1927 + _tmp1210 * _tmp1895 + _tmp1211 * _tmp1919 +
+      _tmp1212 * _tmp1933 + _tmp1218 * _tmp1905 + _tmp1222 * _tmp1903 + _tmp1225 * _tmp1929 +
+      _tmp1226 * _tmp1893 + _tmp1227 * _tmp1917 + _tmp1230 * _tmp1931 + _tmp1687 * _tmp1887 +
+      _tmp1689 * _tmp1888 + _tmp1692 * _tmp1876 + _tmp1693 * _tmp1889 + _tmp1695 * _tmp1914 +
+      _tmp1696 * _tmp1924 + _tmp1697 * _tmp1908 + _tmp1698 * _tmp1884 + _tmp1699 * _tmp1910 +
+      _tmp1701 * _tmp1882 + _tmp1703 * _tmp1878 + _tmp1704 * _tmp1890 + _tmp1705 * _tmp1922 +
+      _tmp1707 * _tmp1885 + _tmp1709 * _tmp1879 + _tmp1710 * _tmp1906 + _tmp1711 * _tmp1880;
+  const Scalar _tmp2050 =
+      _tmp2047 * imu_noise(3, 0) + _tmp2048 * imu_noise(1, 0) + _tmp2049 * imu_noise(2, 0);
+  const Scalar _tmp2051 = _tmp1765 * _tmp1818 + _tmp2050;
+  const Scalar _tmp2052 = -_tmp1231 * _tmp1936 + _tmp1357 * _tmp2001 - _tmp1567 * _tmp1713 -
+                          _tmp1599 * _tmp1744 + _tmp2051;
+  const Scalar _tmp2053 = _tmp1603 * _tmp2052 + _tmp1642 * _tmp2012 + _tmp1646 * _tmp2015;
+  const Scalar _tmp2054 = -_tmp1758 * _tmp1818;
+  const Scalar _tmp2055 =
+      imu_noise(0, 0) *
+      (_tmp1204 * _tmp1982 + _tmp1205 * _tmp1972 + _tmp1207 * _tmp1947 + _tmp1209 * _tmp1990 +
+       _tmp1211 * _tmp1978 + _tmp1212 * _tmp1966 + _tmp1213 * _tmp1988 + _tmp1216 * _tmp1998 +
+       _tmp1218 * _tmp1994 + _tmp1222 * _tmp1970 + _tmp1225 * _tmp1984 + _tmp1226 * _tmp1951 +
+       _tmp1227 * _tmp1953 + _tmp1229 * _tmp1976 + _tmp1690 * _tmp1960 + _tmp1692 * _tmp1940 +
+       _tmp1694 * _tmp1959 + _tmp1695 * _tmp1991 + _tmp1696 * _tmp1954 + _tmp1697 * _tmp1985 +
+       _tmp1698 * _tmp1957 + _tmp1699 * _tmp1948 + _tmp1700 * _tmp1961 + _tmp1701 * _tmp1979 +
+       _tmp1702 * _tmp1967 + _tmp1703 * _tmp1973 + _tmp1704 * _tmp1955 + _tmp1705 * _tmp1963 +
+       _tmp1706 * _tmp1944 + _tmp1707 * _tmp1938 + _tmp1710 * _tmp1995 + _tmp1711 * _tmp1942);
+  const Scalar _tmp2056 = _tmp1231 * _tmp2008 + _tmp1599 * _tmp1751 + _tmp2054 - _tmp2055;
+  const Scalar _tmp2057 =
+      _tmp1012 * _tmp1824 + _tmp1013 * _tmp1815 + _tmp1014 * _tmp1826 + _tmp1018 * _tmp1836 +
+      _tmp1019 * _tmp1868 + _tmp1021 * _tmp1792 + _tmp1023 * _tmp1850 + _tmp1024 * _tmp1840 +
+      _tmp1025 * _tmp1834 + _tmp1030 * _tmp1844 + _tmp1031 * _tmp1846 + _tmp1033 * _tmp1838 +
+      _tmp1034 * _tmp1858 + _tmp1035 * _tmp1842 + _tmp1036 * _tmp1822 + _tmp1037 * _tmp1854 +
+      _tmp1042 * _tmp1848 + _tmp1664 * _tmp1789 + _tmp1665 * _tmp1829 + _tmp1668 * _tmp1859 +
+      _tmp1669 * _tmp1855 + _tmp1670 * _tmp1869 + _tmp1671 * _tmp1812 + _tmp1672 * _tmp1851 +
+      _tmp1673 * _tmp1830 + _tmp1674 * _tmp1871 + _tmp1675 * _tmp1865 + _tmp1676 * _tmp1861 +
+      _tmp1679 * _tmp1827 + _tmp1681 * _tmp1863 + _tmp1682 * _tmp1819 + _tmp1683 * _tmp1832;
+  const Scalar _tmp2058 =
+      _tmp2047 * imu_noise(5, 0) + _tmp2049 * imu_noise(0, 0) + _tmp2057 * imu_noise(1, 0);
+  const Scalar _tmp2059 = _tmp1767 * _tmp1818 + _tmp2058;
+  const Scalar _tmp2060 = -_tmp1043 * _tmp2003 + _tmp1231 * _tmp2006 - _tmp1535 * _tmp1746 -
+                          _tmp1567 * _tmp1751 + _tmp2059;
+  const Scalar _tmp2061 =
+      imu_noise(1, 0) *
+      (_tmp1012 * _tmp1956 + _tmp1013 * _tmp1962 + _tmp1014 * _tmp1941 + _tmp1018 * _tmp1968 +
+       _tmp1019 * _tmp1947 + _tmp1020 * _tmp1980 + _tmp1021 * _tmp1990 + _tmp1024 * _tmp1966 +
+       _tmp1025 * _tmp1988 + _tmp1030 * _tmp1994 + _tmp1031 * _tmp1986 + _tmp1034 * _tmp1970 +
+       _tmp1035 * _tmp1992 + _tmp1036 * _tmp1996 + _tmp1037 * _tmp1984 + _tmp1041 * _tmp1976 +
+       _tmp1043 * _tmp1974 + _tmp1665 * _tmp1942 + _tmp1667 * _tmp1960 + _tmp1668 * _tmp1944 +
+       _tmp1669 * _tmp1971 + _tmp1671 * _tmp1963 + _tmp1672 * _tmp1997 + _tmp1673 * _tmp1959 +
+       _tmp1674 * _tmp1938 + _tmp1675 * _tmp1981 + _tmp1676 * _tmp1952 + _tmp1677 * _tmp1957 +
+       _tmp1678 * _tmp1977 + _tmp1679 * _tmp1950 + _tmp1681 * _tmp1954 + _tmp1683 * _tmp1948);
+  const Scalar _tmp2062 = -_tmp1043 * _tmp2001 + _tmp1599 * _tmp1746 + _tmp2013 - _tmp2061;
+  const Scalar _tmp2063 = _tmp1603 * _tmp2062 + _tmp1642 * _tmp2056 + _tmp1646 * _tmp2060;
+  const Scalar _tmp2064 =
+      imu_noise(2, 0) *
+      (_tmp1012 * _tmp1891 + _tmp1013 * _tmp1901 + _tmp1014 * _tmp1877 + _tmp1016 * _tmp1899 +
+       _tmp1018 * _tmp1897 + _tmp1021 * _tmp1927 + _tmp1023 * _tmp1919 + _tmp1024 * _tmp1933 +
+       _tmp1030 * _tmp1905 + _tmp1031 * _tmp1909 + _tmp1034 * _tmp1903 + _tmp1035 * _tmp1915 +
+       _tmp1036 * _tmp1907 + _tmp1037 * _tmp1929 + _tmp1038 * _tmp1893 + _tmp1042 * _tmp1931 +
+       _tmp1661 * _tmp1888 + _tmp1662 * _tmp1889 + _tmp1664 * _tmp1882 + _tmp1665 * _tmp1880 +
+       _tmp1668 * _tmp1894 + _tmp1669 * _tmp1912 + _tmp1670 * _tmp1879 + _tmp1671 * _tmp1922 +
+       _tmp1672 * _tmp1887 + _tmp1673 * _tmp1920 + _tmp1674 * _tmp1885 + _tmp1676 * _tmp1916 +
+       _tmp1677 * _tmp1884 + _tmp1681 * _tmp1924 + _tmp1682 * _tmp1878 + _tmp1683 * _tmp1910);
+  const Scalar _tmp2065 = _tmp1043 * _tmp1936 + _tmp1567 * _tmp1685 + _tmp2010 - _tmp2064;
+  const Scalar _tmp2066 =
+      _tmp2047 * imu_noise(4, 0) + _tmp2048 * imu_noise(0, 0) + _tmp2057 * imu_noise(2, 0);
+  const Scalar _tmp2067 = _tmp1756 * _tmp1818 + _tmp2066;
+  const Scalar _tmp2068 = _tmp1043 * _tmp1875 - _tmp1357 * _tmp2008 - _tmp1535 * _tmp1685 -
+                          _tmp1599 * _tmp1749 + _tmp2067;
+  const Scalar _tmp2069 =
+      _tmp2054 -
+      imu_noise(0, 0) *
+          (_tmp1327 * _tmp1901 + _tmp1330 * _tmp1899 + _tmp1331 * _tmp1913 + _tmp1332 * _tmp1897 +
+           _tmp1334 * _tmp1883 + _tmp1335 * _tmp1927 + _tmp1336 * _tmp1895 + _tmp1337 * _tmp1919 +
+           _tmp1340 * _tmp1925 + _tmp1341 * _tmp1886 + _tmp1343 * _tmp1911 + _tmp1345 * _tmp1909 +
+           _tmp1348 * _tmp1903 + _tmp1349 * _tmp1915 + _tmp1350 * _tmp1907 + _tmp1351 * _tmp1929 +
+           _tmp1352 * _tmp1893 + _tmp1353 * _tmp1917 + _tmp1354 * _tmp1923 + _tmp1356 * _tmp1931 +
+           _tmp1718 * _tmp1889 + _tmp1719 * _tmp1887 + _tmp1724 * _tmp1878 + _tmp1726 * _tmp1890 +
+           _tmp1727 * _tmp1879 + _tmp1728 * _tmp1932 + _tmp1729 * _tmp1920 + _tmp1730 * _tmp1904 +
+           _tmp1731 * _tmp1880 + _tmp1739 * _tmp1884 + _tmp1740 * _tmp1876 + _tmp1742 * _tmp1888);
+  const Scalar _tmp2070 = -_tmp1357 * _tmp2006 + _tmp1567 * _tmp1749 + _tmp2069;
+  const Scalar _tmp2071 = _tmp1603 * _tmp2065 + _tmp1642 * _tmp2068 + _tmp1646 * _tmp2070;
+  const Scalar _tmp2072 =
+      _tmp1535 * _tmp1935 - _tmp1567 * _tmp1875 + _tmp1818 * _tmp2011 - _tmp1818 * _tmp2064 -
+      imu_noise(2, 0) *
+          (_tmp1789 * _tmp1883 + _tmp1791 * _tmp1927 + _tmp1812 * _tmp1923 + _tmp1814 * _tmp1901 +
+           _tmp1820 * _tmp1878 + _tmp1821 * _tmp1907 + _tmp1824 * _tmp1890 + _tmp1826 * _tmp1876 +
+           _tmp1827 * _tmp1893 + _tmp1829 * _tmp1881 + _tmp1830 * _tmp1921 + _tmp1832 * _tmp1911 +
+           _tmp1834 * _tmp1888 + _tmp1835 * _tmp1897 + _tmp1838 * _tmp1884 + _tmp1840 * _tmp1932 +
+           _tmp1842 * _tmp1914 + _tmp1844 * _tmp1904 + _tmp1846 * _tmp1908 + _tmp1848 * _tmp1930 +
+           _tmp1850 * _tmp1918 + _tmp1852 * _tmp1887 + _tmp1853 * _tmp1929 + _tmp1855 * _tmp1913 +
+           _tmp1857 * _tmp1903 + _tmp1859 * _tmp1895 + _tmp1862 * _tmp1916 + _tmp1864 * _tmp1924 +
+           _tmp1865 * _tmp1899 + _tmp1868 * _tmp1889 + _tmp1870 * _tmp1879 + _tmp1872 * _tmp1885);
+  const Scalar _tmp2073 =
+      -_tmp1535 * _tmp2000 + _tmp1599 * _tmp2003 + _tmp1818 * _tmp2014 - _tmp1818 * _tmp2061 -
+      imu_noise(1, 0) *
+          (_tmp1789 * _tmp1980 + _tmp1791 * _tmp1990 + _tmp1813 * _tmp1963 + _tmp1815 * _tmp1961 +
+           _tmp1819 * _tmp1974 + _tmp1821 * _tmp1996 + _tmp1824 * _tmp1955 + _tmp1826 * _tmp1940 +
+           _tmp1828 * _tmp1950 + _tmp1829 * _tmp1943 + _tmp1831 * _tmp1959 + _tmp1832 * _tmp1949 +
+           _tmp1834 * _tmp1987 + _tmp1835 * _tmp1968 + _tmp1838 * _tmp1957 + _tmp1839 * _tmp1966 +
+           _tmp1842 * _tmp1991 + _tmp1844 * _tmp1993 + _tmp1846 * _tmp1985 + _tmp1848 * _tmp1960 +
+           _tmp1850 * _tmp1977 + _tmp1852 * _tmp1997 + _tmp1853 * _tmp1984 + _tmp1855 * _tmp1972 +
+           _tmp1857 * _tmp1970 + _tmp1860 * _tmp1944 + _tmp1862 * _tmp1952 + _tmp1864 * _tmp1954 +
+           _tmp1865 * _tmp1982 + _tmp1868 * _tmp1946 + _tmp1869 * _tmp1976 + _tmp1872 * _tmp1938);
+  const Scalar _tmp2074 =
+      _tmp1605 * std::pow(_tmp2039, Scalar(2)) + _tmp1606 * std::pow(_tmp2045, Scalar(2)) +
+      _tmp1607 * std::pow(_tmp2038, Scalar(2)) + _tmp1608 * std::pow(_tmp2046, Scalar(2)) +
+      _tmp1609 * std::pow(_tmp2040, Scalar(2)) + _tmp1610 * std::pow(_tmp2042, Scalar(2)) +
+      _tmp1611 * std::pow(_tmp2043, Scalar(2)) + _tmp1612 * std::pow(_tmp2044, Scalar(2)) +
+      _tmp1613 * std::pow(_tmp2041, Scalar(2)) + _tmp1614 * std::pow(_tmp2023, Scalar(2)) +
+      _tmp1615 * std::pow(_tmp2027, Scalar(2)) + _tmp1616 * std::pow(_tmp2025, Scalar(2)) +
+      _tmp1617 * std::pow(_tmp2029, Scalar(2)) + _tmp1618 * std::pow(_tmp2024, Scalar(2)) +
+      _tmp1619 * std::pow(_tmp2028, Scalar(2)) + _tmp1620 * std::pow(_tmp2026, Scalar(2)) +
+      _tmp1621 * std::pow(_tmp2018, Scalar(2)) + _tmp1622 * std::pow(_tmp2030, Scalar(2)) +
+      _tmp1623 * std::pow(_tmp2019, Scalar(2)) + _tmp1624 * std::pow(_tmp2033, Scalar(2)) +
+      _tmp1625 * std::pow(_tmp2032, Scalar(2)) + _tmp1626 * std::pow(_tmp2031, Scalar(2)) +
+      _tmp1627 * std::pow(_tmp2020, Scalar(2)) + _tmp1628 * std::pow(_tmp2037, Scalar(2)) +
+      _tmp1629 * std::pow(_tmp2016, Scalar(2)) + _tmp1630 * std::pow(_tmp2034, Scalar(2)) +
+      _tmp1631 * std::pow(_tmp2022, Scalar(2)) + _tmp1632 * std::pow(_tmp2017, Scalar(2)) +
+      _tmp1633 * std::pow(_tmp2035, Scalar(2)) + _tmp1634 * std::pow(_tmp2021, Scalar(2)) +
+      _tmp1635 * std::pow(_tmp2036, Scalar(2)) +
+      (Scalar(1) / Scalar(4)) * std::pow(dt(0, 0), Scalar(5));
+  const Scalar _tmp2075 =
+      _tmp1604 * std::pow(_tmp1890, Scalar(2)) + _tmp1605 * std::pow(_tmp1876, Scalar(2)) +
+      _tmp1606 * std::pow(_tmp1900, Scalar(2)) + _tmp1607 * std::pow(_tmp1898, Scalar(2)) +
+      _tmp1608 * std::pow(_tmp1920, Scalar(2)) + _tmp1609 * std::pow(_tmp1882, Scalar(2)) +
+      _tmp1610 * std::pow(_tmp1912, Scalar(2)) + _tmp1611 * std::pow(_tmp1889, Scalar(2)) +
+      _tmp1612 * std::pow(_tmp1926, Scalar(2)) + _tmp1613 * std::pow(_tmp1896, Scalar(2)) +
+      _tmp1614 * std::pow(_tmp1930, Scalar(2)) + _tmp1615 * std::pow(_tmp1878, Scalar(2)) +
+      _tmp1616 * std::pow(_tmp1902, Scalar(2)) + _tmp1617 * std::pow(_tmp1884, Scalar(2)) +
+      _tmp1618 * std::pow(_tmp1880, Scalar(2)) + _tmp1619 * std::pow(_tmp1918, Scalar(2)) +
+      _tmp1620 * std::pow(_tmp1894, Scalar(2)) + _tmp1621 * std::pow(_tmp1922, Scalar(2)) +
+      _tmp1622 * std::pow(_tmp1928, Scalar(2)) + _tmp1623 * std::pow(_tmp1892, Scalar(2)) +
+      _tmp1624 * std::pow(_tmp1879, Scalar(2)) + _tmp1625 * std::pow(_tmp1916, Scalar(2)) +
+      _tmp1626 * std::pow(_tmp1914, Scalar(2)) + _tmp1627 * std::pow(_tmp1906, Scalar(2)) +
+      _tmp1628 * std::pow(_tmp1885, Scalar(2)) + _tmp1629 * std::pow(_tmp1932, Scalar(2)) +
+      _tmp1630 * std::pow(_tmp1908, Scalar(2)) + _tmp1631 * std::pow(_tmp1887, Scalar(2)) +
+      _tmp1632 * std::pow(_tmp1924, Scalar(2)) + _tmp1633 * std::pow(_tmp1888, Scalar(2)) +
+      _tmp1634 * std::pow(_tmp1904, Scalar(2)) + _tmp1635 * std::pow(_tmp1910, Scalar(2));
+  const Scalar _tmp2076 =
+      _tmp1604 * std::pow(_tmp1955, Scalar(2)) + _tmp1605 * std::pow(_tmp1940, Scalar(2)) +
+      _tmp1606 * std::pow(_tmp1961, Scalar(2)) + _tmp1607 * std::pow(_tmp1981, Scalar(2)) +
+      _tmp1608 * std::pow(_tmp1959, Scalar(2)) + _tmp1609 * std::pow(_tmp1979, Scalar(2)) +
+      _tmp1610 * std::pow(_tmp1971, Scalar(2)) + _tmp1611 * std::pow(_tmp1946, Scalar(2)) +
+      _tmp1612 * std::pow(_tmp1989, Scalar(2)) + _tmp1613 * std::pow(_tmp1967, Scalar(2)) +
+      _tmp1614 * std::pow(_tmp1960, Scalar(2)) + _tmp1615 * std::pow(_tmp1973, Scalar(2)) +
+      _tmp1616 * std::pow(_tmp1969, Scalar(2)) + _tmp1617 * std::pow(_tmp1957, Scalar(2)) +
+      _tmp1618 * std::pow(_tmp1942, Scalar(2)) + _tmp1619 * std::pow(_tmp1977, Scalar(2)) +
+      _tmp1620 * std::pow(_tmp1944, Scalar(2)) + _tmp1621 * std::pow(_tmp1963, Scalar(2)) +
+      _tmp1622 * std::pow(_tmp1983, Scalar(2)) + _tmp1623 * std::pow(_tmp1950, Scalar(2)) +
+      _tmp1624 * std::pow(_tmp1975, Scalar(2)) + _tmp1625 * std::pow(_tmp1952, Scalar(2)) +
+      _tmp1626 * std::pow(_tmp1991, Scalar(2)) + _tmp1627 * std::pow(_tmp1995, Scalar(2)) +
+      _tmp1628 * std::pow(_tmp1938, Scalar(2)) + _tmp1629 * std::pow(_tmp1965, Scalar(2)) +
+      _tmp1630 * std::pow(_tmp1985, Scalar(2)) + _tmp1631 * std::pow(_tmp1997, Scalar(2)) +
+      _tmp1632 * std::pow(_tmp1954, Scalar(2)) + _tmp1633 * std::pow(_tmp1987, Scalar(2)) +
+      _tmp1634 * std::pow(_tmp1993, Scalar(2)) + _tmp1635 * std::pow(_tmp1948, Scalar(2));
+  const Scalar _tmp2077 = -_tmp1567 * _tmp1935 - _tmp1567 * _tmp1936 + _tmp1599 * _tmp2000 +
+                          _tmp1599 * _tmp2001 + _tmp1818 * _tmp2050 + _tmp1818 * _tmp2051 +
+                          _tmp2074 * imu_noise(3, 0) + _tmp2075 * imu_noise(2, 0) +
+                          _tmp2076 * imu_noise(1, 0);
+  const Scalar _tmp2078 =
+      _tmp1604 * std::pow(_tmp1823, Scalar(2)) + _tmp1605 * std::pow(_tmp1825, Scalar(2)) +
+      _tmp1606 * std::pow(_tmp1814, Scalar(2)) + _tmp1607 * std::pow(_tmp1865, Scalar(2)) +
+      _tmp1608 * std::pow(_tmp1830, Scalar(2)) + _tmp1609 * std::pow(_tmp1789, Scalar(2)) +
+      _tmp1610 * std::pow(_tmp1855, Scalar(2)) + _tmp1611 * std::pow(_tmp1867, Scalar(2)) +
+      _tmp1612 * std::pow(_tmp1791, Scalar(2)) + _tmp1613 * std::pow(_tmp1835, Scalar(2)) +
+      _tmp1614 * std::pow(_tmp1847, Scalar(2)) + _tmp1615 * std::pow(_tmp1819, Scalar(2)) +
+      _tmp1616 * std::pow(_tmp1857, Scalar(2)) + _tmp1617 * std::pow(_tmp1837, Scalar(2)) +
+      _tmp1618 * std::pow(_tmp1829, Scalar(2)) + _tmp1619 * std::pow(_tmp1849, Scalar(2)) +
+      _tmp1620 * std::pow(_tmp1859, Scalar(2)) + _tmp1621 * std::pow(_tmp1812, Scalar(2)) +
+      _tmp1622 * std::pow(_tmp1853, Scalar(2)) + _tmp1623 * std::pow(_tmp1827, Scalar(2)) +
+      _tmp1624 * std::pow(_tmp1869, Scalar(2)) + _tmp1625 * std::pow(_tmp1861, Scalar(2)) +
+      _tmp1626 * std::pow(_tmp1841, Scalar(2)) + _tmp1627 * std::pow(_tmp1821, Scalar(2)) +
+      _tmp1628 * std::pow(_tmp1871, Scalar(2)) + _tmp1629 * std::pow(_tmp1839, Scalar(2)) +
+      _tmp1630 * std::pow(_tmp1845, Scalar(2)) + _tmp1631 * std::pow(_tmp1851, Scalar(2)) +
+      _tmp1632 * std::pow(_tmp1863, Scalar(2)) + _tmp1633 * std::pow(_tmp1833, Scalar(2)) +
+      _tmp1634 * std::pow(_tmp1843, Scalar(2)) + _tmp1635 * std::pow(_tmp1832, Scalar(2));
+  const Scalar _tmp2079 = -_tmp1535 * _tmp2002 - _tmp1535 * _tmp2003 + _tmp1567 * _tmp2005 +
+                          _tmp1567 * _tmp2006 + _tmp1818 * _tmp2058 + _tmp1818 * _tmp2059 +
+                          _tmp2074 * imu_noise(5, 0) + _tmp2075 * imu_noise(0, 0) +
+                          _tmp2078 * imu_noise(1, 0);
+  const Scalar _tmp2080 =
+      _tmp1567 * _tmp2007 - _tmp1599 * _tmp2006 - _tmp1818 * _tmp2055 + _tmp1818 * _tmp2069 -
+      imu_noise(0, 0) *
+          (_tmp1876 * _tmp1941 + _tmp1878 * _tmp1974 + _tmp1879 * _tmp1976 + _tmp1880 * _tmp1943 +
+           _tmp1882 * _tmp1980 + _tmp1884 * _tmp1958 + _tmp1886 * _tmp1938 + _tmp1887 * _tmp1998 +
+           _tmp1888 * _tmp1988 + _tmp1889 * _tmp1947 + _tmp1890 * _tmp1956 + _tmp1893 * _tmp1950 +
+           _tmp1895 * _tmp1944 + _tmp1897 * _tmp1967 + _tmp1899 * _tmp1981 + _tmp1901 * _tmp1961 +
+           _tmp1903 * _tmp1969 + _tmp1905 * _tmp1993 + _tmp1906 * _tmp1996 + _tmp1908 * _tmp1986 +
+           _tmp1911 * _tmp1948 + _tmp1912 * _tmp1972 + _tmp1914 * _tmp1992 + _tmp1917 * _tmp1952 +
+           _tmp1919 * _tmp1977 + _tmp1921 * _tmp1959 + _tmp1923 * _tmp1963 + _tmp1925 * _tmp1954 +
+           _tmp1926 * _tmp1990 + _tmp1928 * _tmp1984 + _tmp1931 * _tmp1960 + _tmp1932 * _tmp1966);
+  const Scalar _tmp2081 = _tmp1535 * _tmp1874 + _tmp1535 * _tmp1875 - _tmp1599 * _tmp2007 -
+                          _tmp1599 * _tmp2008 + _tmp1818 * _tmp2066 + _tmp1818 * _tmp2067 +
+                          _tmp2074 * imu_noise(4, 0) + _tmp2076 * imu_noise(0, 0) +
+                          _tmp2078 * imu_noise(2, 0);
+  const Scalar _tmp2082 = _tmp1648 * _tmp1936 + _tmp1654 * _tmp1875;
+  const Scalar _tmp2083 = _tmp1648 * _tmp2001 + _tmp1651 * _tmp2003;
+  const Scalar _tmp2084 = _tmp1651 * _tmp2006 + _tmp1654 * _tmp2008;
+  const Scalar _tmp2085 = _tmp1648 * _tmp2052 + _tmp1651 * _tmp2015 + _tmp1654 * _tmp2012;
+  const Scalar _tmp2086 = _tmp1648 * _tmp2065 + _tmp1651 * _tmp2070 + _tmp1654 * _tmp2068;
+  const Scalar _tmp2087 = _tmp1648 * _tmp2062 + _tmp1651 * _tmp2060 + _tmp1654 * _tmp2056;
+  const Scalar _tmp2088 = _tmp1648 * _tmp2072 + _tmp1651 * _tmp2080 + _tmp1654 * _tmp2081;
+  const Scalar _tmp2089 = _tmp1648 * _tmp2077 + _tmp1651 * _tmp2073 + _tmp1654 * _tmp2072;
+  const Scalar _tmp2090 = _tmp1648 * _tmp2073 + _tmp1651 * _tmp2079 + _tmp1654 * _tmp2080;
+  const Scalar _tmp2091 = _tmp1655 * _tmp1875 + _tmp1658 * _tmp1936;
+  const Scalar _tmp2092 = _tmp1657 * _tmp2003 + _tmp1658 * _tmp2001;
+  const Scalar _tmp2093 = _tmp1655 * _tmp2008 + _tmp1657 * _tmp2006;
+  const Scalar _tmp2094 = _tmp1655 * _tmp2012 + _tmp1657 * _tmp2015 + _tmp1658 * _tmp2052;
+  const Scalar _tmp2095 = _tmp1655 * _tmp2056 + _tmp1657 * _tmp2060 + _tmp1658 * _tmp2062;
+  const Scalar _tmp2096 = _tmp1655 * _tmp2068 + _tmp1657 * _tmp2070 + _tmp1658 * _tmp2065;
+  const Scalar _tmp2097 = _tmp1655 * _tmp2072 + _tmp1657 * _tmp2073 + _tmp1658 * _tmp2077;
+  const Scalar _tmp2098 = _tmp1655 * _tmp2080 + _tmp1657 * _tmp2079 + _tmp1658 * _tmp2073;
+  const Scalar _tmp2099 = _tmp1655 * _tmp2081 + _tmp1657 * _tmp2080 + _tmp1658 * _tmp2072;
+
+  // Output terms (2)
+  if (delta != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _delta = (*delta);
+
+    _delta(0, 0) = _tmp287;
+    _delta(1, 0) = _tmp288;
+    _delta(2, 0) = _tmp289;
+    _delta(3, 0) = _tmp290;
+    _delta(4, 0) = _tmp1043;
+    _delta(5, 0) = _tmp1231;
+    _delta(6, 0) = _tmp1357;
+    _delta(7, 0) = _tmp1535;
+    _delta(8, 0) = _tmp1567;
+    _delta(9, 0) = _tmp1599;
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = std::pow(_tmp1603, Scalar(2)) * _tmp1637 +
+                 std::pow(_tmp1642, Scalar(2)) * _tmp1643 +
+                 std::pow(_tmp1646, Scalar(2)) * _tmp1647;
+    _cov(1, 0) =
+        _tmp1603 * _tmp1637 * _tmp1648 + _tmp1642 * _tmp1643 * _tmp1654 + _tmp1646 * _tmp1652;
+    _cov(2, 0) = _tmp1637 * std::pow(_tmp1648, Scalar(2)) +
+                 _tmp1643 * std::pow(_tmp1654, Scalar(2)) +
+                 _tmp1647 * std::pow(_tmp1651, Scalar(2));
+    _cov(3, 0) = _tmp1603 * _tmp1659 + _tmp1642 * _tmp1656 + _tmp1646 * _tmp1647 * _tmp1657;
+    _cov(4, 0) = _tmp1648 * _tmp1659 + _tmp1652 * _tmp1657 + _tmp1654 * _tmp1656;
+    _cov(5, 0) = _tmp1637 * std::pow(_tmp1658, Scalar(2)) +
+                 _tmp1643 * std::pow(_tmp1655, Scalar(2)) +
+                 _tmp1647 * std::pow(_tmp1657, Scalar(2));
+    _cov(6, 0) = _tmp1603 * _tmp1753 + _tmp1642 * _tmp1748 + _tmp1646 * _tmp1715;
+    _cov(7, 0) = _tmp1648 * _tmp1753 + _tmp1651 * _tmp1715 + _tmp1654 * _tmp1748;
+    _cov(8, 0) = _tmp1655 * _tmp1748 + _tmp1657 * _tmp1715 + _tmp1658 * _tmp1753;
+    _cov(9, 0) = _tmp1603 * (_tmp1603 * _tmp1766 + _tmp1642 * _tmp1761 + _tmp1646 * _tmp1763) +
+                 _tmp1642 * (_tmp1603 * _tmp1761 + _tmp1642 * _tmp1757 + _tmp1646 * _tmp1759) +
+                 _tmp1646 * (_tmp1603 * _tmp1763 + _tmp1642 * _tmp1759 + _tmp1646 * _tmp1768);
+    _cov(10, 0) = _tmp1603 * _tmp1771 + _tmp1642 * _tmp1769 + _tmp1646 * _tmp1770;
+    _cov(11, 0) = _tmp1648 * _tmp1771 + _tmp1651 * _tmp1770 + _tmp1654 * _tmp1769;
+    _cov(12, 0) = _tmp1655 * _tmp1769 + _tmp1657 * _tmp1770 + _tmp1658 * _tmp1771;
+    _cov(13, 0) = _tmp1603 * _tmp1772 + _tmp1642 * _tmp1774 + _tmp1646 * _tmp1773;
+    _cov(14, 0) = _tmp1648 * _tmp1772 + _tmp1651 * _tmp1773 + _tmp1654 * _tmp1774;
+    _cov(15, 0) = _tmp1603 * _tmp1777 + _tmp1642 * _tmp1775 + _tmp1646 * _tmp1776;
+    _cov(16, 0) = _tmp1648 * _tmp1777 + _tmp1651 * _tmp1776 + _tmp1654 * _tmp1775;
+    _cov(17, 0) = _tmp1655 * _tmp1775 + _tmp1657 * _tmp1776 + _tmp1658 * _tmp1777;
+    _cov(18, 0) = _tmp1603 * _tmp1780 + _tmp1642 * _tmp1778 + _tmp1646 * _tmp1779;
+    _cov(19, 0) = _tmp1648 * _tmp1780 + _tmp1651 * _tmp1779 + _tmp1654 * _tmp1778;
+    _cov(20, 0) = _tmp1655 * _tmp1778 + _tmp1657 * _tmp1779 + _tmp1658 * _tmp1780;
+    _cov(21, 0) = _tmp1603 * _tmp2009 + _tmp1642 * _tmp2004 + _tmp1646 * _tmp1937;
+    _cov(22, 0) = _tmp1648 * _tmp2009 + _tmp1651 * _tmp1937 + _tmp1654 * _tmp2004;
+    _cov(23, 0) = _tmp1655 * _tmp2004 + _tmp1657 * _tmp1937 + _tmp1658 * _tmp2009;
+    _cov(24, 0) = _tmp1603 * _tmp2053 + _tmp1642 * _tmp2071 + _tmp1646 * _tmp2063;
+    _cov(25, 0) = _tmp1648 * _tmp2053 + _tmp1651 * _tmp2063 + _tmp1654 * _tmp2071;
+    _cov(26, 0) = _tmp1655 * _tmp2071 + _tmp1657 * _tmp2063 + _tmp1658 * _tmp2053;
+    _cov(27, 0) = _tmp1603 * (_tmp1603 * _tmp2077 + _tmp1642 * _tmp2072 + _tmp1646 * _tmp2073) +
+                  _tmp1642 * (_tmp1603 * _tmp2072 + _tmp1642 * _tmp2081 + _tmp1646 * _tmp2080) +
+                  _tmp1646 * (_tmp1603 * _tmp2073 + _tmp1642 * _tmp2080 + _tmp1646 * _tmp2079);
+    _cov(28, 0) = _tmp1603 * _tmp2084 + _tmp1642 * _tmp2083 + _tmp1646 * _tmp2082;
+    _cov(29, 0) = _tmp1648 * _tmp2084 + _tmp1651 * _tmp2082 + _tmp1654 * _tmp2083;
+    _cov(30, 0) = _tmp1655 * _tmp2083 + _tmp1657 * _tmp2082 + _tmp1658 * _tmp2084;
+    _cov(31, 0) = _tmp1603 * _tmp2085 + _tmp1642 * _tmp2086 + _tmp1646 * _tmp2087;
+    _cov(32, 0) = _tmp1648 * _tmp2085 + _tmp1651 * _tmp2087 + _tmp1654 * _tmp2086;
+    _cov(33, 0) = _tmp1655 * _tmp2086 + _tmp1657 * _tmp2087 + _tmp1658 * _tmp2085;
+    _cov(34, 0) = _tmp1603 * _tmp2089 + _tmp1642 * _tmp2088 + _tmp1646 * _tmp2090;
+    _cov(35, 0) = _tmp1648 * _tmp2089 + _tmp1651 * _tmp2090 + _tmp1654 * _tmp2088;
+    _cov(36, 0) = _tmp1603 * _tmp2093 + _tmp1642 * _tmp2092 + _tmp1646 * _tmp2091;
+    _cov(37, 0) = _tmp1648 * _tmp2093 + _tmp1651 * _tmp2091 + _tmp1654 * _tmp2092;
+    _cov(38, 0) = _tmp1655 * _tmp2092 + _tmp1657 * _tmp2091 + _tmp1658 * _tmp2093;
+    _cov(39, 0) = _tmp1603 * _tmp2094 + _tmp1642 * _tmp2096 + _tmp1646 * _tmp2095;
+    _cov(40, 0) = _tmp1648 * _tmp2094 + _tmp1651 * _tmp2095 + _tmp1654 * _tmp2096;
+    _cov(41, 0) = _tmp1655 * _tmp2096 + _tmp1657 * _tmp2095 + _tmp1658 * _tmp2094;
+    _cov(42, 0) = _tmp1603 * _tmp2097 + _tmp1642 * _tmp2099 + _tmp1646 * _tmp2098;
+    _cov(43, 0) = _tmp1648 * _tmp2097 + _tmp1651 * _tmp2098 + _tmp1654 * _tmp2099;
+    _cov(44, 0) = _tmp1655 * _tmp2099 + _tmp1657 * _tmp2098 + _tmp1658 * _tmp2097;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
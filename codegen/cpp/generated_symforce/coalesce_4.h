@@ -0,0 +1,585 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     imu_noise: Matrix61
+ *     samples: Matrix64
+ *     dt: Matrix41
+ *
+ * Outputs:
+ *     delta: Matrix10_1
+ *     cov: Matrix45_1
+ */
+template <typename Scalar>
+void Coalesce4(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+               const Eigen::Matrix<Scalar, 6, 4>& samples, const Eigen::Matrix<Scalar, 4, 1>& dt,
+               Eigen::Matrix<Scalar, 10, 1>* const delta = nullptr,
+               Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 1516
+
+  // Input arrays
+
+  // Intermediate terms (374)
+  const Scalar _tmp0 = dt(2, 0) * samples(2, 2);
+  const Scalar _tmp1 = dt(0, 0) * samples(2, 0);
+  const Scalar _tmp2 = dt(1, 0) * samples(2, 1);
+  const Scalar _tmp3 = _tmp1 + _tmp2;
+  const Scalar _tmp4 = _tmp0 + _tmp3;
+  const Scalar _tmp5 = dt(3, 0) * samples(1, 3);
+  const Scalar _tmp6 = dt(2, 0) * samples(1, 2);
+  const Scalar _tmp7 = dt(1, 0) * samples(1, 1);
+  const Scalar _tmp8 = dt(0, 0) * samples(1, 0);
+  const Scalar _tmp9 = _tmp7 + _tmp8;
+  const Scalar _tmp10 = _tmp6 + _tmp9;
+  const Scalar _tmp11 = dt(3, 0) * samples(2, 3);
+  const Scalar _tmp12 = dt(3, 0) * samples(0, 3);
+  const Scalar _tmp13 = dt(2, 0) * samples(0, 2);
+  const Scalar _tmp14 = dt(0, 0) * samples(0, 0);
+  const Scalar _tmp15 = dt(1, 0) * samples(0, 1);
+  const Scalar _tmp16 = _tmp14 + _tmp15;
+  const Scalar _tmp17 =
+      -Scalar(1) / Scalar(2) * _tmp1 * _tmp7 + _tmp16 + (Scalar(1) / Scalar(2)) * _tmp2 * _tmp8;
+  const Scalar _tmp18 = (Scalar(1) / Scalar(2)) * _tmp0 * _tmp9 + _tmp13 + _tmp17 -
+                        Scalar(1) / Scalar(2) * _tmp3 * _tmp6;
+  const Scalar _tmp19 = (Scalar(1) / Scalar(2)) * _tmp10 * _tmp11 + _tmp12 + _tmp18 -
+                        Scalar(1) / Scalar(2) * _tmp4 * _tmp5;
+  const Scalar _tmp20 = _tmp13 + _tmp16;
+  const Scalar _tmp21 =
+      (Scalar(1) / Scalar(2)) * _tmp14 * _tmp7 - Scalar(1) / Scalar(2) * _tmp15 * _tmp8 + _tmp3;
+  const Scalar _tmp22 = _tmp0 - Scalar(1) / Scalar(2) * _tmp13 * _tmp9 +
+                        (Scalar(1) / Scalar(2)) * _tmp16 * _tmp6 + _tmp21;
+  const Scalar _tmp23 = -Scalar(1) / Scalar(2) * _tmp10 * _tmp12 + _tmp11 +
+                        (Scalar(1) / Scalar(2)) * _tmp20 * _tmp5 + _tmp22;
+  const Scalar _tmp24 = std::pow(_tmp23, Scalar(2));
+  const Scalar _tmp25 = std::pow(_tmp19, Scalar(2));
+  const Scalar _tmp26 =
+      (Scalar(1) / Scalar(2)) * _tmp1 * _tmp15 - Scalar(1) / Scalar(2) * _tmp14 * _tmp2 + _tmp9;
+  const Scalar _tmp27 = -Scalar(1) / Scalar(2) * _tmp0 * _tmp16 +
+                        (Scalar(1) / Scalar(2)) * _tmp13 * _tmp3 + _tmp26 + _tmp6;
+  const Scalar _tmp28 = -Scalar(1) / Scalar(2) * _tmp11 * _tmp20 +
+                        (Scalar(1) / Scalar(2)) * _tmp12 * _tmp4 + _tmp27 + _tmp5;
+  const Scalar _tmp29 = std::pow(_tmp28, Scalar(2));
+  const Scalar _tmp30 = _tmp24 + _tmp25 + _tmp29 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp31 = std::sqrt(_tmp30);
+  const Scalar _tmp32 = (Scalar(1) / Scalar(2)) * _tmp31;
+  const Scalar _tmp33 = std::sin(_tmp32);
+  const Scalar _tmp34 = _tmp33 / _tmp31;
+  const Scalar _tmp35 = _tmp19 * _tmp34;
+  const Scalar _tmp36 = _tmp28 * _tmp34;
+  const Scalar _tmp37 = _tmp23 * _tmp34;
+  const Scalar _tmp38 = std::cos(_tmp32);
+  const Scalar _tmp39 = (Scalar(1) / Scalar(2)) * _tmp18 * _tmp27;
+  const Scalar _tmp40 = -_tmp22 + _tmp39;
+  const Scalar _tmp41 = std::pow(dt(3, 0), Scalar(2));
+  const Scalar _tmp42 = _tmp41 * samples(1, 3);
+  const Scalar _tmp43 = _tmp41 * samples(2, 3);
+  const Scalar _tmp44 = _tmp42 * samples(5, 3) - _tmp43 * samples(4, 3);
+  const Scalar _tmp45 = _tmp41 * samples(0, 3);
+  const Scalar _tmp46 = -_tmp42 * samples(3, 3) + _tmp45 * samples(4, 3);
+  const Scalar _tmp47 = _tmp43 * samples(3, 3) - _tmp45 * samples(5, 3);
+  const Scalar _tmp48 =
+      (Scalar(1) / Scalar(2)) * _tmp11 * _tmp44 - Scalar(1) / Scalar(2) * _tmp12 * _tmp46 + _tmp47;
+  const Scalar _tmp49 = (Scalar(1) / Scalar(2)) * dt(3, 0);
+  const Scalar _tmp50 = _tmp48 * _tmp49 + dt(3, 0) * samples(4, 3);
+  const Scalar _tmp51 =
+      -Scalar(1) / Scalar(2) * _tmp11 * _tmp47 + _tmp44 + (Scalar(1) / Scalar(2)) * _tmp46 * _tmp5;
+  const Scalar _tmp52 = _tmp49 * _tmp51 + dt(3, 0) * samples(3, 3);
+  const Scalar _tmp53 = -std::pow(_tmp27, Scalar(2));
+  const Scalar _tmp54 = -std::pow(_tmp22, Scalar(2));
+  const Scalar _tmp55 = (Scalar(1) / Scalar(2)) * _tmp53 + (Scalar(1) / Scalar(2)) * _tmp54 + 1;
+  const Scalar _tmp56 = (Scalar(1) / Scalar(2)) * _tmp22;
+  const Scalar _tmp57 = _tmp18 * _tmp56;
+  const Scalar _tmp58 = _tmp27 + _tmp57;
+  const Scalar _tmp59 =
+      (Scalar(1) / Scalar(2)) * _tmp12 * _tmp47 - Scalar(1) / Scalar(2) * _tmp44 * _tmp5 + _tmp46;
+  const Scalar _tmp60 = _tmp49 * _tmp59 + dt(3, 0) * samples(5, 3);
+  const Scalar _tmp61 = std::pow(dt(2, 0), Scalar(2));
+  const Scalar _tmp62 = _tmp61 * samples(0, 2);
+  const Scalar _tmp63 = _tmp61 * samples(1, 2);
+  const Scalar _tmp64 = _tmp62 * samples(4, 2) - _tmp63 * samples(3, 2);
+  const Scalar _tmp65 = _tmp61 * samples(2, 2);
+  const Scalar _tmp66 = -_tmp62 * samples(5, 2) + _tmp65 * samples(3, 2);
+  const Scalar _tmp67 = _tmp63 * samples(5, 2) - _tmp65 * samples(4, 2);
+  const Scalar _tmp68 =
+      -Scalar(1) / Scalar(2) * _tmp0 * _tmp66 + (Scalar(1) / Scalar(2)) * _tmp6 * _tmp64 + _tmp67;
+  const Scalar _tmp69 = (Scalar(1) / Scalar(2)) * dt(2, 0);
+  const Scalar _tmp70 = _tmp68 * _tmp69 + dt(2, 0) * samples(3, 2);
+  const Scalar _tmp71 = -std::pow(_tmp21, Scalar(2));
+  const Scalar _tmp72 = -std::pow(_tmp26, Scalar(2));
+  const Scalar _tmp73 = (Scalar(1) / Scalar(2)) * _tmp71 + (Scalar(1) / Scalar(2)) * _tmp72 + 1;
+  const Scalar _tmp74 =
+      (Scalar(1) / Scalar(2)) * _tmp0 * _tmp67 - Scalar(1) / Scalar(2) * _tmp13 * _tmp64 + _tmp66;
+  const Scalar _tmp75 = _tmp69 * _tmp74 + dt(2, 0) * samples(4, 2);
+  const Scalar _tmp76 = (Scalar(1) / Scalar(2)) * _tmp26;
+  const Scalar _tmp77 = _tmp17 * _tmp76;
+  const Scalar _tmp78 = -_tmp21 + _tmp77;
+  const Scalar _tmp79 =
+      (Scalar(1) / Scalar(2)) * _tmp13 * _tmp66 - Scalar(1) / Scalar(2) * _tmp6 * _tmp67 + _tmp64;
+  const Scalar _tmp80 = _tmp69 * _tmp79 + dt(2, 0) * samples(5, 2);
+  const Scalar _tmp81 = (Scalar(1) / Scalar(2)) * _tmp17 * _tmp21;
+  const Scalar _tmp82 = _tmp26 + _tmp81;
+  const Scalar _tmp83 = std::pow(dt(0, 0), Scalar(2));
+  const Scalar _tmp84 = _tmp83 * samples(0, 0);
+  const Scalar _tmp85 = (Scalar(1) / Scalar(2)) * _tmp84;
+  const Scalar _tmp86 = _tmp85 * samples(2, 0);
+  const Scalar _tmp87 = _tmp8 + _tmp86;
+  const Scalar _tmp88 = std::pow(dt(1, 0), Scalar(2));
+  const Scalar _tmp89 = _tmp88 * samples(2, 1);
+  const Scalar _tmp90 = _tmp88 * samples(1, 1);
+  const Scalar _tmp91 = -_tmp89 * samples(4, 1) + _tmp90 * samples(5, 1);
+  const Scalar _tmp92 = _tmp88 * samples(0, 1);
+  const Scalar _tmp93 = _tmp89 * samples(3, 1) - _tmp92 * samples(5, 1);
+  const Scalar _tmp94 = -_tmp90 * samples(3, 1) + _tmp92 * samples(4, 1);
+  const Scalar _tmp95 =
+      (Scalar(1) / Scalar(2)) * _tmp15 * _tmp93 - Scalar(1) / Scalar(2) * _tmp7 * _tmp91 + _tmp94;
+  const Scalar _tmp96 = (Scalar(1) / Scalar(2)) * dt(1, 0);
+  const Scalar _tmp97 = _tmp95 * _tmp96 + dt(1, 0) * samples(5, 1);
+  const Scalar _tmp98 = -_tmp83 * std::pow(samples(2, 0), Scalar(2));
+  const Scalar _tmp99 = -_tmp83 * std::pow(samples(1, 0), Scalar(2));
+  const Scalar _tmp100 = (Scalar(1) / Scalar(2)) * _tmp98 + (Scalar(1) / Scalar(2)) * _tmp99 + 1;
+  const Scalar _tmp101 =
+      -Scalar(1) / Scalar(2) * _tmp2 * _tmp93 + (Scalar(1) / Scalar(2)) * _tmp7 * _tmp94 + _tmp91;
+  const Scalar _tmp102 = _tmp101 * _tmp96 + dt(1, 0) * samples(3, 1);
+  const Scalar _tmp103 = _tmp85 * samples(1, 0);
+  const Scalar _tmp104 = -_tmp1 + _tmp103;
+  const Scalar _tmp105 =
+      -Scalar(1) / Scalar(2) * _tmp15 * _tmp94 + (Scalar(1) / Scalar(2)) * _tmp2 * _tmp91 + _tmp93;
+  const Scalar _tmp106 = _tmp105 * _tmp96 + dt(1, 0) * samples(4, 1);
+  const Scalar _tmp107 = _tmp83 * samples(1, 0);
+  const Scalar _tmp108 = -_tmp107 * samples(3, 0) + _tmp84 * samples(4, 0);
+  const Scalar _tmp109 = _tmp83 * samples(2, 0);
+  const Scalar _tmp110 = _tmp109 * samples(3, 0) - _tmp84 * samples(5, 0);
+  const Scalar _tmp111 = _tmp107 * samples(5, 0) - _tmp109 * samples(4, 0);
+  const Scalar _tmp112 = -Scalar(1) / Scalar(2) * _tmp1 * _tmp110 +
+                         (Scalar(1) / Scalar(2)) * _tmp108 * _tmp8 + _tmp111;
+  const Scalar _tmp113 = (Scalar(1) / Scalar(2)) * dt(0, 0);
+  const Scalar _tmp114 = _tmp112 * _tmp113 + dt(0, 0) * samples(3, 0);
+  const Scalar _tmp115 = _tmp100 * _tmp102 + _tmp104 * _tmp106 + _tmp114 + _tmp87 * _tmp97;
+  const Scalar _tmp116 = _tmp115 + _tmp70 * _tmp73 + _tmp75 * _tmp78 + _tmp80 * _tmp82;
+  const Scalar _tmp117 = _tmp116 + _tmp40 * _tmp50 + _tmp52 * _tmp55 + _tmp58 * _tmp60;
+  const Scalar _tmp118 = _tmp27 * _tmp56;
+  const Scalar _tmp119 = _tmp118 - _tmp18;
+  const Scalar _tmp120 = -std::pow(_tmp18, Scalar(2));
+  const Scalar _tmp121 = (Scalar(1) / Scalar(2)) * _tmp120 + (Scalar(1) / Scalar(2)) * _tmp54 + 1;
+  const Scalar _tmp122 = _tmp22 + _tmp39;
+  const Scalar _tmp123 = _tmp21 * _tmp76;
+  const Scalar _tmp124 = _tmp123 - _tmp17;
+  const Scalar _tmp125 = -std::pow(_tmp17, Scalar(2));
+  const Scalar _tmp126 = (Scalar(1) / Scalar(2)) * _tmp125 + (Scalar(1) / Scalar(2)) * _tmp71 + 1;
+  const Scalar _tmp127 = _tmp21 + _tmp77;
+  const Scalar _tmp128 = _tmp1 + _tmp103;
+  const Scalar _tmp129 = (Scalar(1) / Scalar(2)) * _tmp107 * samples(2, 0);
+  const Scalar _tmp130 = _tmp129 - _tmp14;
+  const Scalar _tmp131 = -_tmp83 * std::pow(samples(0, 0), Scalar(2));
+  const Scalar _tmp132 = (Scalar(1) / Scalar(2)) * _tmp131 + (Scalar(1) / Scalar(2)) * _tmp98 + 1;
+  const Scalar _tmp133 = (Scalar(1) / Scalar(2)) * _tmp1 * _tmp111 -
+                         Scalar(1) / Scalar(2) * _tmp108 * _tmp14 + _tmp110;
+  const Scalar _tmp134 = _tmp113 * _tmp133 + dt(0, 0) * samples(4, 0);
+  const Scalar _tmp135 = _tmp102 * _tmp128 + _tmp106 * _tmp132 + _tmp130 * _tmp97 + _tmp134;
+  const Scalar _tmp136 = _tmp124 * _tmp80 + _tmp126 * _tmp75 + _tmp127 * _tmp70 + _tmp135;
+  const Scalar _tmp137 = _tmp119 * _tmp60 + _tmp121 * _tmp50 + _tmp122 * _tmp52 + _tmp136;
+  const Scalar _tmp138 = -_tmp27 + _tmp57;
+  const Scalar _tmp139 = (Scalar(1) / Scalar(2)) * _tmp120 + (Scalar(1) / Scalar(2)) * _tmp53 + 1;
+  const Scalar _tmp140 = _tmp118 + _tmp18;
+  const Scalar _tmp141 = _tmp123 + _tmp17;
+  const Scalar _tmp142 = (Scalar(1) / Scalar(2)) * _tmp125 + (Scalar(1) / Scalar(2)) * _tmp72 + 1;
+  const Scalar _tmp143 = -_tmp26 + _tmp81;
+  const Scalar _tmp144 = -_tmp8 + _tmp86;
+  const Scalar _tmp145 = (Scalar(1) / Scalar(2)) * _tmp131 + (Scalar(1) / Scalar(2)) * _tmp99 + 1;
+  const Scalar _tmp146 = _tmp129 + _tmp14;
+  const Scalar _tmp147 = _tmp108 + (Scalar(1) / Scalar(2)) * _tmp110 * _tmp14 -
+                         Scalar(1) / Scalar(2) * _tmp111 * _tmp8;
+  const Scalar _tmp148 = _tmp113 * _tmp147 + dt(0, 0) * samples(5, 0);
+  const Scalar _tmp149 = _tmp102 * _tmp144 + _tmp106 * _tmp146 + _tmp145 * _tmp97 + _tmp148;
+  const Scalar _tmp150 = _tmp141 * _tmp75 + _tmp142 * _tmp80 + _tmp143 * _tmp70 + _tmp149;
+  const Scalar _tmp151 = _tmp138 * _tmp52 + _tmp139 * _tmp60 + _tmp140 * _tmp50 + _tmp150;
+  const Scalar _tmp152 = (Scalar(1) / Scalar(6)) * _tmp41;
+  const Scalar _tmp153 = (Scalar(1) / Scalar(2)) * _tmp41;
+  const Scalar _tmp154 = _tmp152 * _tmp48 + _tmp153 * samples(4, 3);
+  const Scalar _tmp155 = _tmp152 * _tmp51 + _tmp153 * samples(3, 3);
+  const Scalar _tmp156 = _tmp152 * _tmp59 + _tmp153 * samples(5, 3);
+  const Scalar _tmp157 = (Scalar(1) / Scalar(6)) * _tmp61;
+  const Scalar _tmp158 = (Scalar(1) / Scalar(2)) * _tmp61;
+  const Scalar _tmp159 = _tmp157 * _tmp68 + _tmp158 * samples(3, 2);
+  const Scalar _tmp160 = _tmp157 * _tmp74 + _tmp158 * samples(4, 2);
+  const Scalar _tmp161 = _tmp157 * _tmp79 + _tmp158 * samples(5, 2);
+  const Scalar _tmp162 = (Scalar(1) / Scalar(6)) * _tmp88;
+  const Scalar _tmp163 = (Scalar(1) / Scalar(2)) * _tmp88;
+  const Scalar _tmp164 = _tmp162 * _tmp95 + _tmp163 * samples(5, 1);
+  const Scalar _tmp165 = _tmp101 * _tmp162 + _tmp163 * samples(3, 1);
+  const Scalar _tmp166 = _tmp105 * _tmp162 + _tmp163 * samples(4, 1);
+  const Scalar _tmp167 = (Scalar(1) / Scalar(2)) * _tmp83;
+  const Scalar _tmp168 = (Scalar(1) / Scalar(6)) * _tmp83;
+  const Scalar _tmp169 = _tmp112 * _tmp168 + _tmp167 * samples(3, 0);
+  const Scalar _tmp170 =
+      _tmp100 * _tmp165 + _tmp104 * _tmp166 + _tmp114 * dt(1, 0) + _tmp164 * _tmp87 + _tmp169;
+  const Scalar _tmp171 =
+      _tmp115 * dt(2, 0) + _tmp159 * _tmp73 + _tmp160 * _tmp78 + _tmp161 * _tmp82 + _tmp170;
+  const Scalar _tmp172 =
+      _tmp116 * dt(3, 0) + _tmp154 * _tmp40 + _tmp155 * _tmp55 + _tmp156 * _tmp58 + _tmp171;
+  const Scalar _tmp173 = _tmp133 * _tmp168 + _tmp167 * samples(4, 0);
+  const Scalar _tmp174 =
+      _tmp128 * _tmp165 + _tmp130 * _tmp164 + _tmp132 * _tmp166 + _tmp134 * dt(1, 0) + _tmp173;
+  const Scalar _tmp175 =
+      _tmp124 * _tmp161 + _tmp126 * _tmp160 + _tmp127 * _tmp159 + _tmp135 * dt(2, 0) + _tmp174;
+  const Scalar _tmp176 =
+      _tmp119 * _tmp156 + _tmp121 * _tmp154 + _tmp122 * _tmp155 + _tmp136 * dt(3, 0) + _tmp175;
+  const Scalar _tmp177 = _tmp147 * _tmp168 + _tmp167 * samples(5, 0);
+  const Scalar _tmp178 =
+      _tmp144 * _tmp165 + _tmp145 * _tmp164 + _tmp146 * _tmp166 + _tmp148 * dt(1, 0) + _tmp177;
+  const Scalar _tmp179 =
+      _tmp141 * _tmp160 + _tmp142 * _tmp161 + _tmp143 * _tmp159 + _tmp149 * dt(2, 0) + _tmp178;
+  const Scalar _tmp180 =
+      _tmp138 * _tmp155 + _tmp139 * _tmp156 + _tmp140 * _tmp154 + _tmp150 * dt(3, 0) + _tmp179;
+  const Scalar _tmp181 = 2 * std::pow(_tmp33, Scalar(2)) / _tmp30;
+  const Scalar _tmp182 = _tmp181 * _tmp19;
+  const Scalar _tmp183 = _tmp182 * _tmp23;
+  const Scalar _tmp184 = 2 * _tmp38;
+  const Scalar _tmp185 = _tmp184 * _tmp36;
+  const Scalar _tmp186 = _tmp183 - _tmp185;
+  const Scalar _tmp187 = [&]() {
+    const Scalar base = dt(0, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp188 = [&]() {
+    const Scalar base = dt(2, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp189 = [&]() {
+    const Scalar base = dt(1, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp190 = [&]() {
+    const Scalar base = dt(3, 0);
+    return base * base * base;
+  }();
+  const Scalar _tmp191 = _tmp187 + _tmp188 + _tmp189 + _tmp190;
+  const Scalar _tmp192 = _tmp191 * imu_noise(2, 0);
+  const Scalar _tmp193 = _tmp184 * _tmp37;
+  const Scalar _tmp194 = _tmp182 * _tmp28;
+  const Scalar _tmp195 = _tmp193 + _tmp194;
+  const Scalar _tmp196 = _tmp191 * imu_noise(1, 0);
+  const Scalar _tmp197 = -_tmp181 * _tmp24;
+  const Scalar _tmp198 = -_tmp181 * _tmp29;
+  const Scalar _tmp199 = _tmp197 + _tmp198 + 1;
+  const Scalar _tmp200 = _tmp191 * imu_noise(0, 0);
+  const Scalar _tmp201 = -_tmp181 * _tmp25 + 1;
+  const Scalar _tmp202 = _tmp197 + _tmp201;
+  const Scalar _tmp203 = _tmp196 * _tmp202;
+  const Scalar _tmp204 = _tmp181 * _tmp23 * _tmp28;
+  const Scalar _tmp205 = _tmp184 * _tmp35;
+  const Scalar _tmp206 = _tmp204 + _tmp205;
+  const Scalar _tmp207 = _tmp186 * _tmp192;
+  const Scalar _tmp208 = -_tmp193 + _tmp194;
+  const Scalar _tmp209 = _tmp204 - _tmp205;
+  const Scalar _tmp210 = _tmp198 + _tmp201;
+  const Scalar _tmp211 = _tmp183 + _tmp185;
+  const Scalar _tmp212 = _tmp200 * _tmp211;
+  const Scalar _tmp213 = _tmp116 * _tmp188;
+  const Scalar _tmp214 = _tmp115 * _tmp189;
+  const Scalar _tmp215 = _tmp114 * _tmp187;
+  const Scalar _tmp216 = _tmp117 * _tmp190;
+  const Scalar _tmp217 = _tmp213 + _tmp214 + _tmp215 + _tmp216;
+  const Scalar _tmp218 = _tmp217 * imu_noise(2, 0);
+  const Scalar _tmp219 = _tmp117 * _tmp192 - _tmp218;
+  const Scalar _tmp220 = _tmp136 * _tmp188;
+  const Scalar _tmp221 = _tmp137 * _tmp190;
+  const Scalar _tmp222 = _tmp135 * _tmp189;
+  const Scalar _tmp223 = _tmp134 * _tmp187;
+  const Scalar _tmp224 = _tmp220 + _tmp221 + _tmp222 + _tmp223;
+  const Scalar _tmp225 = _tmp224 * imu_noise(2, 0);
+  const Scalar _tmp226 = -_tmp137 * _tmp192 + _tmp225;
+  const Scalar _tmp227 = _tmp195 * _tmp219 + _tmp199 * _tmp226;
+  const Scalar _tmp228 = _tmp148 * _tmp187;
+  const Scalar _tmp229 = _tmp151 * _tmp190;
+  const Scalar _tmp230 = _tmp149 * _tmp189;
+  const Scalar _tmp231 = _tmp150 * _tmp188;
+  const Scalar _tmp232 = _tmp228 + _tmp229 + _tmp230 + _tmp231;
+  const Scalar _tmp233 = _tmp232 * imu_noise(0, 0);
+  const Scalar _tmp234 = -_tmp151 * _tmp200 + _tmp233;
+  const Scalar _tmp235 = _tmp224 * imu_noise(0, 0);
+  const Scalar _tmp236 = _tmp137 * _tmp200 - _tmp235;
+  const Scalar _tmp237 = _tmp186 * _tmp236 + _tmp195 * _tmp234;
+  const Scalar _tmp238 = _tmp232 * imu_noise(1, 0);
+  const Scalar _tmp239 = _tmp151 * _tmp196 - _tmp238;
+  const Scalar _tmp240 = _tmp217 * imu_noise(1, 0);
+  const Scalar _tmp241 = -_tmp117 * _tmp196 + _tmp240;
+  const Scalar _tmp242 = _tmp186 * _tmp241 + _tmp199 * _tmp239;
+  const Scalar _tmp243 = imu_noise(0, 0) * (_tmp136 * _tmp231 + _tmp137 * _tmp229 +
+                                            _tmp148 * _tmp223 + _tmp149 * _tmp222);
+  const Scalar _tmp244 = _tmp137 * _tmp233 - _tmp151 * _tmp236 - _tmp243;
+  const Scalar _tmp245 =
+      std::pow(_tmp114, Scalar(2)) * _tmp187 + std::pow(_tmp115, Scalar(2)) * _tmp189 +
+      std::pow(_tmp116, Scalar(2)) * _tmp188 + std::pow(_tmp117, Scalar(2)) * _tmp190;
+  const Scalar _tmp246 =
+      std::pow(_tmp134, Scalar(2)) * _tmp187 + std::pow(_tmp135, Scalar(2)) * _tmp189 +
+      std::pow(_tmp136, Scalar(2)) * _tmp188 + std::pow(_tmp137, Scalar(2)) * _tmp190;
+  const Scalar _tmp247 =
+      _tmp191 * imu_noise(5, 0) + _tmp245 * imu_noise(1, 0) + _tmp246 * imu_noise(0, 0);
+  const Scalar _tmp248 =
+      -_tmp117 * _tmp240 - _tmp117 * _tmp241 - _tmp137 * _tmp235 + _tmp137 * _tmp236 + _tmp247;
+  const Scalar _tmp249 = imu_noise(1, 0) * (_tmp114 * _tmp228 + _tmp115 * _tmp230 +
+                                            _tmp116 * _tmp231 + _tmp117 * _tmp229);
+  const Scalar _tmp250 = _tmp117 * _tmp238 + _tmp151 * _tmp241 - _tmp249;
+  const Scalar _tmp251 =
+      std::pow(_tmp148, Scalar(2)) * _tmp187 + std::pow(_tmp149, Scalar(2)) * _tmp189 +
+      std::pow(_tmp150, Scalar(2)) * _tmp188 + std::pow(_tmp151, Scalar(2)) * _tmp190;
+  const Scalar _tmp252 =
+      _tmp191 * imu_noise(4, 0) + _tmp245 * imu_noise(2, 0) + _tmp251 * imu_noise(0, 0);
+  const Scalar _tmp253 =
+      -_tmp117 * _tmp218 + _tmp117 * _tmp219 - _tmp151 * _tmp233 - _tmp151 * _tmp234 + _tmp252;
+  const Scalar _tmp254 = imu_noise(2, 0) * (_tmp114 * _tmp223 + _tmp115 * _tmp222 +
+                                            _tmp136 * _tmp213 + _tmp137 * _tmp216);
+  const Scalar _tmp255 = _tmp117 * _tmp225 - _tmp137 * _tmp219 - _tmp254;
+  const Scalar _tmp256 =
+      _tmp191 * imu_noise(3, 0) + _tmp246 * imu_noise(2, 0) + _tmp251 * imu_noise(1, 0);
+  const Scalar _tmp257 =
+      -_tmp137 * _tmp225 - _tmp137 * _tmp226 - _tmp151 * _tmp238 + _tmp151 * _tmp239 + _tmp256;
+  const Scalar _tmp258 = _tmp202 * _tmp234 + _tmp206 * _tmp236;
+  const Scalar _tmp259 = _tmp206 * _tmp241 + _tmp208 * _tmp239;
+  const Scalar _tmp260 = _tmp202 * _tmp219 + _tmp208 * _tmp226;
+  const Scalar _tmp261 = _tmp202 * _tmp255 + _tmp206 * _tmp250 + _tmp208 * _tmp257;
+  const Scalar _tmp262 = _tmp202 * _tmp253 + _tmp206 * _tmp244 + _tmp208 * _tmp255;
+  const Scalar _tmp263 = _tmp202 * _tmp244 + _tmp206 * _tmp248 + _tmp208 * _tmp250;
+  const Scalar _tmp264 = _tmp209 * _tmp234 + _tmp210 * _tmp236;
+  const Scalar _tmp265 = _tmp210 * _tmp241 + _tmp211 * _tmp239;
+  const Scalar _tmp266 = _tmp209 * _tmp219 + _tmp211 * _tmp226;
+  const Scalar _tmp267 = _tmp209 * _tmp253 + _tmp210 * _tmp244 + _tmp211 * _tmp255;
+  const Scalar _tmp268 = _tmp209 * _tmp255 + _tmp210 * _tmp250 + _tmp211 * _tmp257;
+  const Scalar _tmp269 = _tmp209 * _tmp244 + _tmp210 * _tmp248 + _tmp211 * _tmp250;
+  const Scalar _tmp270 = _tmp176 * _tmp191;
+  const Scalar _tmp271 = dt(0, 0) + dt(1, 0);
+  const Scalar _tmp272 = _tmp271 + dt(2, 0);
+  const Scalar _tmp273 = -_tmp136 * _tmp272 + _tmp175;
+  const Scalar _tmp274 = _tmp188 * _tmp273;
+  const Scalar _tmp275 = -_tmp134 * dt(0, 0) + _tmp173;
+  const Scalar _tmp276 = -_tmp135 * _tmp271 + _tmp174;
+  const Scalar _tmp277 = _tmp189 * _tmp276;
+  const Scalar _tmp278 = _tmp272 + dt(3, 0);
+  const Scalar _tmp279 = -_tmp137 * _tmp278 + _tmp176;
+  const Scalar _tmp280 = _tmp190 * _tmp279;
+  const Scalar _tmp281 = _tmp187 * _tmp275 + _tmp274 + _tmp277 + _tmp280;
+  const Scalar _tmp282 = _tmp225 * _tmp278 + _tmp281 * imu_noise(2, 0);
+  const Scalar _tmp283 = -_tmp270 * imu_noise(2, 0) + _tmp282;
+  const Scalar _tmp284 = -_tmp115 * _tmp271 + _tmp170;
+  const Scalar _tmp285 = _tmp189 * _tmp284;
+  const Scalar _tmp286 = -_tmp114 * dt(0, 0) + _tmp169;
+  const Scalar _tmp287 = _tmp187 * _tmp286;
+  const Scalar _tmp288 = -_tmp116 * _tmp272 + _tmp171;
+  const Scalar _tmp289 = -_tmp117 * _tmp278 + _tmp172;
+  const Scalar _tmp290 = _tmp188 * _tmp288 + _tmp190 * _tmp289 + _tmp285 + _tmp287;
+  const Scalar _tmp291 = -_tmp218 * _tmp278 - _tmp290 * imu_noise(2, 0);
+  const Scalar _tmp292 = _tmp172 * _tmp192 + _tmp291;
+  const Scalar _tmp293 = _tmp195 * _tmp292 + _tmp199 * _tmp283;
+  const Scalar _tmp294 = -_tmp150 * _tmp272 + _tmp179;
+  const Scalar _tmp295 = _tmp188 * _tmp294;
+  const Scalar _tmp296 = -_tmp148 * dt(0, 0) + _tmp177;
+  const Scalar _tmp297 = _tmp187 * _tmp296;
+  const Scalar _tmp298 = -_tmp151 * _tmp278 + _tmp180;
+  const Scalar _tmp299 = _tmp190 * _tmp298;
+  const Scalar _tmp300 = -_tmp149 * _tmp271 + _tmp178;
+  const Scalar _tmp301 = _tmp189 * _tmp300 + _tmp295 + _tmp297 + _tmp299;
+  const Scalar _tmp302 = _tmp233 * _tmp278 + _tmp301 * imu_noise(0, 0);
+  const Scalar _tmp303 = -_tmp180 * _tmp200 + _tmp302;
+  const Scalar _tmp304 = -_tmp235 * _tmp278 - _tmp281 * imu_noise(0, 0);
+  const Scalar _tmp305 = _tmp270 * imu_noise(0, 0) + _tmp304;
+  const Scalar _tmp306 = _tmp186 * _tmp305 + _tmp195 * _tmp303;
+  const Scalar _tmp307 = _tmp240 * _tmp278 + _tmp290 * imu_noise(1, 0);
+  const Scalar _tmp308 = -_tmp172 * _tmp196 + _tmp307;
+  const Scalar _tmp309 = -_tmp238 * _tmp278 - _tmp301 * imu_noise(1, 0);
+  const Scalar _tmp310 = _tmp180 * _tmp196 + _tmp309;
+  const Scalar _tmp311 = _tmp186 * _tmp308 + _tmp199 * _tmp310;
+  const Scalar _tmp312 = -_tmp254 * _tmp278;
+  const Scalar _tmp313 = imu_noise(2, 0) * (_tmp115 * _tmp277 + _tmp213 * _tmp273 +
+                                            _tmp215 * _tmp275 + _tmp216 * _tmp279);
+  const Scalar _tmp314 = _tmp117 * _tmp283 + _tmp176 * _tmp218 + _tmp312 - _tmp313;
+  const Scalar _tmp315 =
+      _tmp228 * _tmp296 + _tmp229 * _tmp298 + _tmp230 * _tmp300 + _tmp231 * _tmp294;
+  const Scalar _tmp316 =
+      _tmp114 * _tmp287 + _tmp115 * _tmp285 + _tmp213 * _tmp288 + _tmp216 * _tmp289;
+  const Scalar _tmp317 = -_tmp272 + _tmp69;
+  const Scalar _tmp318 = -_tmp271 + _tmp96;
+  const Scalar _tmp319 = -_tmp278 + _tmp49;
+  const Scalar _tmp320 = _tmp188 * _tmp317 + _tmp189 * _tmp318 + _tmp190 * _tmp319 -
+                         Scalar(1) / Scalar(2) * std::pow(dt(0, 0), Scalar(4));
+  const Scalar _tmp321 =
+      _tmp315 * imu_noise(0, 0) + _tmp316 * imu_noise(2, 0) + _tmp320 * imu_noise(4, 0);
+  const Scalar _tmp322 = _tmp252 * _tmp278 + _tmp321;
+  const Scalar _tmp323 =
+      _tmp117 * _tmp292 - _tmp151 * _tmp303 - _tmp172 * _tmp218 - _tmp180 * _tmp233 + _tmp322;
+  const Scalar _tmp324 = -_tmp243 * _tmp278;
+  const Scalar _tmp325 = _tmp324 - imu_noise(0, 0) * (_tmp149 * _tmp277 + _tmp228 * _tmp275 +
+                                                      _tmp229 * _tmp279 + _tmp231 * _tmp273);
+  const Scalar _tmp326 = -_tmp151 * _tmp305 + _tmp176 * _tmp233 + _tmp325;
+  const Scalar _tmp327 = _tmp186 * _tmp326 + _tmp195 * _tmp323 + _tmp199 * _tmp314;
+  const Scalar _tmp328 = imu_noise(1, 0) * (_tmp114 * _tmp297 + _tmp116 * _tmp295 +
+                                            _tmp214 * _tmp300 + _tmp216 * _tmp298);
+  const Scalar _tmp329 = -_tmp249 * _tmp278;
+  const Scalar _tmp330 = -_tmp117 * _tmp310 + _tmp180 * _tmp240 - _tmp328 + _tmp329;
+  const Scalar _tmp331 =
+      _tmp135 * _tmp277 + _tmp136 * _tmp274 + _tmp137 * _tmp280 + _tmp223 * _tmp275;
+  const Scalar _tmp332 =
+      _tmp316 * imu_noise(1, 0) + _tmp320 * imu_noise(5, 0) + _tmp331 * imu_noise(0, 0);
+  const Scalar _tmp333 = _tmp247 * _tmp278 + _tmp332;
+  const Scalar _tmp334 =
+      -_tmp117 * _tmp308 + _tmp137 * _tmp305 - _tmp172 * _tmp240 - _tmp176 * _tmp235 + _tmp333;
+  const Scalar _tmp335 = imu_noise(0, 0) * (_tmp136 * _tmp295 + _tmp137 * _tmp299 +
+                                            _tmp222 * _tmp300 + _tmp223 * _tmp296);
+  const Scalar _tmp336 = _tmp137 * _tmp303 + _tmp180 * _tmp235 + _tmp324 - _tmp335;
+  const Scalar _tmp337 = _tmp186 * _tmp334 + _tmp195 * _tmp336 + _tmp199 * _tmp330;
+  const Scalar _tmp338 =
+      _tmp315 * imu_noise(1, 0) + _tmp320 * imu_noise(3, 0) + _tmp331 * imu_noise(2, 0);
+  const Scalar _tmp339 = _tmp256 * _tmp278 + _tmp338;
+  const Scalar _tmp340 =
+      -_tmp137 * _tmp283 + _tmp151 * _tmp310 - _tmp176 * _tmp225 - _tmp180 * _tmp238 + _tmp339;
+  const Scalar _tmp341 = _tmp312 - imu_noise(2, 0) * (_tmp220 * _tmp288 + _tmp221 * _tmp289 +
+                                                      _tmp222 * _tmp284 + _tmp223 * _tmp286);
+  const Scalar _tmp342 = -_tmp137 * _tmp292 + _tmp172 * _tmp225 + _tmp341;
+  const Scalar _tmp343 = _tmp329 - imu_noise(1, 0) * (_tmp228 * _tmp286 + _tmp229 * _tmp289 +
+                                                      _tmp230 * _tmp284 + _tmp231 * _tmp288);
+  const Scalar _tmp344 = _tmp151 * _tmp308 + _tmp172 * _tmp238 + _tmp343;
+  const Scalar _tmp345 = _tmp186 * _tmp344 + _tmp195 * _tmp342 + _tmp199 * _tmp340;
+  const Scalar _tmp346 =
+      _tmp176 * _tmp302 - _tmp180 * _tmp305 + _tmp278 * _tmp325 - _tmp278 * _tmp335 -
+      imu_noise(0, 0) *
+          (_tmp273 * _tmp295 + _tmp275 * _tmp297 + _tmp277 * _tmp300 + _tmp280 * _tmp298);
+  const Scalar _tmp347 =
+      -_tmp172 * _tmp309 + _tmp180 * _tmp308 - _tmp278 * _tmp328 + _tmp278 * _tmp343 -
+      imu_noise(1, 0) *
+          (_tmp285 * _tmp300 + _tmp287 * _tmp296 + _tmp288 * _tmp295 + _tmp289 * _tmp299);
+  const Scalar _tmp348 =
+      _tmp187 * std::pow(_tmp275, Scalar(2)) + _tmp188 * std::pow(_tmp273, Scalar(2)) +
+      _tmp189 * std::pow(_tmp276, Scalar(2)) + _tmp190 * std::pow(_tmp279, Scalar(2));
+  const Scalar _tmp349 =
+      _tmp187 * std::pow(_tmp286, Scalar(2)) + _tmp188 * std::pow(_tmp288, Scalar(2)) +
+      _tmp189 * std::pow(_tmp284, Scalar(2)) + _tmp190 * std::pow(_tmp289, Scalar(2));
+  const Scalar _tmp350 = _tmp188 * std::pow(_tmp317, Scalar(2)) +
+                         _tmp189 * std::pow(_tmp318, Scalar(2)) +
+                         _tmp190 * std::pow(_tmp319, Scalar(2)) +
+                         (Scalar(1) / Scalar(4)) * std::pow(dt(0, 0), Scalar(5));
+  const Scalar _tmp351 = -_tmp172 * _tmp307 - _tmp172 * _tmp308 + _tmp176 * _tmp304 +
+                         _tmp176 * _tmp305 + _tmp278 * _tmp332 + _tmp278 * _tmp333 +
+                         _tmp348 * imu_noise(0, 0) + _tmp349 * imu_noise(1, 0) +
+                         _tmp350 * imu_noise(5, 0);
+  const Scalar _tmp352 =
+      _tmp172 * _tmp282 - _tmp176 * _tmp292 - _tmp278 * _tmp313 + _tmp278 * _tmp341 -
+      imu_noise(2, 0) *
+          (_tmp274 * _tmp288 + _tmp275 * _tmp287 + _tmp277 * _tmp284 + _tmp280 * _tmp289);
+  const Scalar _tmp353 =
+      _tmp187 * std::pow(_tmp296, Scalar(2)) + _tmp188 * std::pow(_tmp294, Scalar(2)) +
+      _tmp189 * std::pow(_tmp300, Scalar(2)) + _tmp190 * std::pow(_tmp298, Scalar(2));
+  const Scalar _tmp354 = -_tmp176 * _tmp282 - _tmp176 * _tmp283 + _tmp180 * _tmp309 +
+                         _tmp180 * _tmp310 + _tmp278 * _tmp338 + _tmp278 * _tmp339 +
+                         _tmp348 * imu_noise(2, 0) + _tmp350 * imu_noise(3, 0) +
+                         _tmp353 * imu_noise(1, 0);
+  const Scalar _tmp355 = _tmp172 * _tmp291 + _tmp172 * _tmp292 - _tmp180 * _tmp302 -
+                         _tmp180 * _tmp303 + _tmp278 * _tmp321 + _tmp278 * _tmp322 +
+                         _tmp349 * imu_noise(2, 0) + _tmp350 * imu_noise(4, 0) +
+                         _tmp353 * imu_noise(0, 0);
+  const Scalar _tmp356 = _tmp202 * _tmp292 + _tmp208 * _tmp283;
+  const Scalar _tmp357 = _tmp202 * _tmp303 + _tmp206 * _tmp305;
+  const Scalar _tmp358 = _tmp206 * _tmp308 + _tmp208 * _tmp310;
+  const Scalar _tmp359 = _tmp202 * _tmp342 + _tmp206 * _tmp344 + _tmp208 * _tmp340;
+  const Scalar _tmp360 = _tmp202 * _tmp336 + _tmp206 * _tmp334 + _tmp208 * _tmp330;
+  const Scalar _tmp361 = _tmp202 * _tmp323 + _tmp206 * _tmp326 + _tmp208 * _tmp314;
+  const Scalar _tmp362 = _tmp202 * _tmp355 + _tmp206 * _tmp346 + _tmp208 * _tmp352;
+  const Scalar _tmp363 = _tmp202 * _tmp352 + _tmp206 * _tmp347 + _tmp208 * _tmp354;
+  const Scalar _tmp364 = _tmp202 * _tmp346 + _tmp206 * _tmp351 + _tmp208 * _tmp347;
+  const Scalar _tmp365 = _tmp209 * _tmp292 + _tmp211 * _tmp283;
+  const Scalar _tmp366 = _tmp210 * _tmp308 + _tmp211 * _tmp310;
+  const Scalar _tmp367 = _tmp209 * _tmp303 + _tmp210 * _tmp305;
+  const Scalar _tmp368 = _tmp209 * _tmp336 + _tmp210 * _tmp334 + _tmp211 * _tmp330;
+  const Scalar _tmp369 = _tmp209 * _tmp342 + _tmp210 * _tmp344 + _tmp211 * _tmp340;
+  const Scalar _tmp370 = _tmp209 * _tmp323 + _tmp210 * _tmp326 + _tmp211 * _tmp314;
+  const Scalar _tmp371 = _tmp209 * _tmp346 + _tmp210 * _tmp351 + _tmp211 * _tmp347;
+  const Scalar _tmp372 = _tmp209 * _tmp352 + _tmp210 * _tmp347 + _tmp211 * _tmp354;
+  const Scalar _tmp373 = _tmp209 * _tmp355 + _tmp210 * _tmp346 + _tmp211 * _tmp352;
+
+  // Output terms (2)
+  if (delta != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _delta = (*delta);
+
+    _delta(0, 0) = _tmp35;
+    _delta(1, 0) = _tmp36;
+    _delta(2, 0) = _tmp37;
+    _delta(3, 0) = _tmp38;
+    _delta(4, 0) = _tmp117;
+    _delta(5, 0) = _tmp137;
+    _delta(6, 0) = _tmp151;
+    _delta(7, 0) = _tmp172;
+    _delta(8, 0) = _tmp176;
+    _delta(9, 0) = _tmp180;
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = std::pow(_tmp186, Scalar(2)) * _tmp192 + std::pow(_tmp195, Scalar(2)) * _tmp196 +
+                 std::pow(_tmp199, Scalar(2)) * _tmp200;
+    _cov(1, 0) = _tmp195 * _tmp203 + _tmp199 * _tmp200 * _tmp208 + _tmp206 * _tmp207;
+    _cov(2, 0) = _tmp192 * std::pow(_tmp206, Scalar(2)) + _tmp196 * std::pow(_tmp202, Scalar(2)) +
+                 _tmp200 * std::pow(_tmp208, Scalar(2));
+    _cov(3, 0) = _tmp195 * _tmp196 * _tmp209 + _tmp199 * _tmp212 + _tmp207 * _tmp210;
+    _cov(4, 0) = _tmp192 * _tmp206 * _tmp210 + _tmp203 * _tmp209 + _tmp208 * _tmp212;
+    _cov(5, 0) = _tmp192 * std::pow(_tmp210, Scalar(2)) + _tmp196 * std::pow(_tmp209, Scalar(2)) +
+                 _tmp200 * std::pow(_tmp211, Scalar(2));
+    _cov(6, 0) = _tmp186 * _tmp227 + _tmp195 * _tmp242 + _tmp199 * _tmp237;
+    _cov(7, 0) = _tmp202 * _tmp242 + _tmp206 * _tmp227 + _tmp208 * _tmp237;
+    _cov(8, 0) = _tmp209 * _tmp242 + _tmp210 * _tmp227 + _tmp211 * _tmp237;
+    _cov(9, 0) = _tmp186 * (_tmp186 * _tmp248 + _tmp195 * _tmp244 + _tmp199 * _tmp250) +
+                 _tmp195 * (_tmp186 * _tmp244 + _tmp195 * _tmp253 + _tmp199 * _tmp255) +
+                 _tmp199 * (_tmp186 * _tmp250 + _tmp195 * _tmp255 + _tmp199 * _tmp257);
+    _cov(10, 0) = _tmp186 * _tmp260 + _tmp195 * _tmp259 + _tmp199 * _tmp258;
+    _cov(11, 0) = _tmp202 * _tmp259 + _tmp206 * _tmp260 + _tmp208 * _tmp258;
+    _cov(12, 0) = _tmp209 * _tmp259 + _tmp210 * _tmp260 + _tmp211 * _tmp258;
+    _cov(13, 0) = _tmp186 * _tmp263 + _tmp195 * _tmp262 + _tmp199 * _tmp261;
+    _cov(14, 0) = _tmp202 * _tmp262 + _tmp206 * _tmp263 + _tmp208 * _tmp261;
+    _cov(15, 0) = _tmp186 * _tmp266 + _tmp195 * _tmp265 + _tmp199 * _tmp264;
+    _cov(16, 0) = _tmp202 * _tmp265 + _tmp206 * _tmp266 + _tmp208 * _tmp264;
+    _cov(17, 0) = _tmp209 * _tmp265 + _tmp210 * _tmp266 + _tmp211 * _tmp264;
+    _cov(18, 0) = _tmp186 * _tmp269 + _tmp195 * _tmp267 + _tmp199 * _tmp268;
+    _cov(19, 0) = _tmp202 * _tmp267 + _tmp206 * _tmp269 + _tmp208 * _tmp268;
+    _cov(20, 0) = _tmp209 * _tmp267 + _tmp210 * _tmp269 + _tmp211 * _tmp268;
+    _cov(21, 0) = _tmp186 * _tmp293 + _tmp195 * _tmp311 + _tmp199 * _tmp306;
+    _cov(22, 0) = _tmp202 * _tmp311 + _tmp206 * _tmp293 + _tmp208 * _tmp306;
+    _cov(23, 0) = _tmp209 * _tmp311 + _tmp210 * _tmp293 + _tmp211 * _tmp306;
+    _cov(24, 0) = _tmp186 * _tmp337 + _tmp195 * _tmp327 + _tmp199 * _tmp345;
+    _cov(25, 0) = _tmp202 * _tmp327 + _tmp206 * _tmp337 + _tmp208 * _tmp345;
+    _cov(26, 0) = _tmp209 * _tmp327 + _tmp210 * _tmp337 + _tmp211 * _tmp345;
+    _cov(27, 0) = _tmp186 * (_tmp186 * _tmp351 + _tmp195 * _tmp346 + _tmp199 * _tmp347) +
+                  _tmp195 * (_tmp186 * _tmp346 + _tmp195 * _tmp355 + _tmp199 * _tmp352) +
+                  _tmp199 * (_tmp186 * _tmp347 + _tmp195 * _tmp352 + _tmp199 * _tmp354);
+    _cov(28, 0) = _tmp186 * _tmp356 + _tmp195 * _tmp358 + _tmp199 * _tmp357;
+    _cov(29, 0) = _tmp202 * _tmp358 + _tmp206 * _tmp356 + _tmp208 * _tmp357;
+    _cov(30, 0) = _tmp209 * _tmp358 + _tmp210 * _tmp356 + _tmp211 * _tmp357;
+    _cov(31, 0) = _tmp186 * _tmp360 + _tmp195 * _tmp361 + _tmp199 * _tmp359;
+    _cov(32, 0) = _tmp202 * _tmp361 + _tmp206 * _tmp360 + _tmp208 * _tmp359;
+    _cov(33, 0) = _tmp209 * _tmp361 + _tmp210 * _tmp360 + _tmp211 * _tmp359;
+    _cov(34, 0) = _tmp186 * _tmp364 + _tmp195 * _tmp362 + _tmp199 * _tmp363;
+    _cov(35, 0) = _tmp202 * _tmp362 + _tmp206 * _tmp364 + _tmp208 * _tmp363;
+    _cov(36, 0) = _tmp186 * _tmp365 + _tmp195 * _tmp366 + _tmp199 * _tmp367;
+    _cov(37, 0) = _tmp202 * _tmp366 + _tmp206 * _tmp365 + _tmp208 * _tmp367;
+    _cov(38, 0) = _tmp209 * _tmp366 + _tmp210 * _tmp365 + _tmp211 * _tmp367;
+    _cov(39, 0) = _tmp186 * _tmp368 + _tmp195 * _tmp370 + _tmp199 * _tmp369;
+    _cov(40, 0) = _tmp202 * _tmp370 + _tmp206 * _tmp368 + _tmp208 * _tmp369;
+    _cov(41, 0) = _tmp209 * _tmp370 + _tmp210 * _tmp368 + _tmp211 * _tmp369;
+    _cov(42, 0) = _tmp186 * _tmp371 + _tmp195 * _tmp373 + _tmp199 * _tmp372;
+    _cov(43, 0) = _tmp202 * _tmp373 + _tmp206 * _tmp371 + _tmp208 * _tmp372;
+    _cov(44, 0) = _tmp209 * _tmp373 + _tmp210 * _tmp371 + _tmp211 * _tmp372;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -0,0 +1,441 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     state: Matrix61_1
+ *     imu_noise: Matrix61
+ *     z_imu_raw: Matrix61
+ *     dt: Scalar
+ *     gravity: Matrix31
+ *
+ * Outputs:
+ *     nom: Matrix10_1
+ *     err_cov: Matrix45_1
+ *     imu_bias: Matrix61
+ */
+template <typename Scalar>
+void EskfPropagate(const Eigen::Matrix<Scalar, 61, 1>& state,
+                   const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+                   const Eigen::Matrix<Scalar, 6, 1>& z_imu_raw, const Scalar dt,
+                   const Eigen::Matrix<Scalar, 3, 1>& gravity,
+                   Eigen::Matrix<Scalar, 10, 1>* const nom = nullptr,
+                   Eigen::Matrix<Scalar, 45, 1>* const err_cov = nullptr,
+                   Eigen::Matrix<Scalar, 6, 1>* const imu_bias = nullptr) {
+  // Total ops: 1237
+
+  // Input arrays
+
+  // Intermediate terms (251)
+  const Scalar _tmp0 = -state(55, 0) + z_imu_raw(0, 0);
+  const Scalar _tmp1 = std::pow(dt, Scalar(2));
+  const Scalar _tmp2 = -state(57, 0) + z_imu_raw(2, 0);
+  const Scalar _tmp3 = _tmp1 * std::pow(_tmp2, Scalar(2));
+  const Scalar _tmp4 = -state(56, 0) + z_imu_raw(1, 0);
+  const Scalar _tmp5 = _tmp1 * std::pow(_tmp4, Scalar(2));
+  const Scalar _tmp6 = std::pow(_tmp0, Scalar(2)) * _tmp1;
+  const Scalar _tmp7 = _tmp3 + _tmp5 + _tmp6 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp8 = std::sqrt(_tmp7);
+  const Scalar _tmp9 = (Scalar(1) / Scalar(2)) * _tmp8;
+  const Scalar _tmp10 = std::sin(_tmp9);
+  const Scalar _tmp11 = _tmp10 * dt / _tmp8;
+  const Scalar _tmp12 = _tmp0 * _tmp11;
+  const Scalar _tmp13 = _tmp11 * _tmp4;
+  const Scalar _tmp14 = _tmp11 * _tmp2;
+  const Scalar _tmp15 = std::cos(_tmp9);
+  const Scalar _tmp16 = 2 * state(1, 0);
+  const Scalar _tmp17 = _tmp16 * state(0, 0);
+  const Scalar _tmp18 = 2 * state(2, 0);
+  const Scalar _tmp19 = _tmp18 * state(3, 0);
+  const Scalar _tmp20 = _tmp17 - _tmp19;
+  const Scalar _tmp21 = -state(59, 0) + z_imu_raw(4, 0);
+  const Scalar _tmp22 = -state(58, 0) + z_imu_raw(3, 0);
+  const Scalar _tmp23 = 2 * _tmp15;
+  const Scalar _tmp24 = _tmp14 * _tmp23;
+  const Scalar _tmp25 = _tmp0 * _tmp1 * _tmp4;
+  const Scalar _tmp26 = 2 * std::pow(_tmp10, Scalar(2)) / _tmp7;
+  const Scalar _tmp27 = _tmp25 * _tmp26;
+  const Scalar _tmp28 = _tmp24 + _tmp27;
+  const Scalar _tmp29 = -state(60, 0) + z_imu_raw(5, 0);
+  const Scalar _tmp30 = _tmp1 * _tmp2;
+  const Scalar _tmp31 = _tmp26 * _tmp30;
+  const Scalar _tmp32 = _tmp31 * _tmp4;
+  const Scalar _tmp33 = _tmp12 * _tmp23;
+  const Scalar _tmp34 = _tmp32 - _tmp33;
+  const Scalar _tmp35 = -_tmp26 * _tmp6;
+  const Scalar _tmp36 = -_tmp26 * _tmp3;
+  const Scalar _tmp37 = _tmp35 + _tmp36 + 1;
+  const Scalar _tmp38 = _tmp21 * _tmp37 - _tmp21 + _tmp22 * _tmp28 + _tmp29 * _tmp34;
+  const Scalar _tmp39 = (Scalar(1) / Scalar(2)) * _tmp1;
+  const Scalar _tmp40 = _tmp21 * dt + _tmp38 * _tmp39;
+  const Scalar _tmp41 = _tmp16 * state(3, 0);
+  const Scalar _tmp42 = _tmp18 * state(0, 0);
+  const Scalar _tmp43 = _tmp41 + _tmp42;
+  const Scalar _tmp44 = -_tmp26 * _tmp5 + 1;
+  const Scalar _tmp45 = _tmp35 + _tmp44;
+  const Scalar _tmp46 = _tmp32 + _tmp33;
+  const Scalar _tmp47 = _tmp0 * _tmp31;
+  const Scalar _tmp48 = _tmp13 * _tmp23;
+  const Scalar _tmp49 = _tmp47 - _tmp48;
+  const Scalar _tmp50 = _tmp21 * _tmp46 + _tmp22 * _tmp49 + _tmp29 * _tmp45 - _tmp29;
+  const Scalar _tmp51 = _tmp29 * dt + _tmp39 * _tmp50;
+  const Scalar _tmp52 = -2 * std::pow(state(1, 0), Scalar(2));
+  const Scalar _tmp53 = -2 * std::pow(state(2, 0), Scalar(2));
+  const Scalar _tmp54 = _tmp52 + _tmp53 + 1;
+  const Scalar _tmp55 = -_tmp24 + _tmp27;
+  const Scalar _tmp56 = _tmp47 + _tmp48;
+  const Scalar _tmp57 = _tmp36 + _tmp44;
+  const Scalar _tmp58 = _tmp21 * _tmp55 + _tmp22 * _tmp57 - _tmp22 + _tmp29 * _tmp56;
+  const Scalar _tmp59 = _tmp22 * dt + _tmp39 * _tmp58;
+  const Scalar _tmp60 = 1 - 2 * std::pow(state(0, 0), Scalar(2));
+  const Scalar _tmp61 = _tmp53 + _tmp60;
+  const Scalar _tmp62 = _tmp18 * state(1, 0);
+  const Scalar _tmp63 = 2 * state(0, 0) * state(3, 0);
+  const Scalar _tmp64 = _tmp62 - _tmp63;
+  const Scalar _tmp65 = _tmp17 + _tmp19;
+  const Scalar _tmp66 = _tmp62 + _tmp63;
+  const Scalar _tmp67 = _tmp52 + _tmp60;
+  const Scalar _tmp68 = -_tmp41 + _tmp42;
+  const Scalar _tmp69 = [&]() {
+    const Scalar base = dt;
+    return base * base * base;
+  }();
+  const Scalar _tmp70 = (Scalar(1) / Scalar(6)) * _tmp69;
+  const Scalar _tmp71 = _tmp21 * _tmp39 + _tmp38 * _tmp70;
+  const Scalar _tmp72 = _tmp29 * _tmp39 + _tmp50 * _tmp70;
+  const Scalar _tmp73 = _tmp22 * _tmp39 + _tmp58 * _tmp70;
+  const Scalar _tmp74 = (Scalar(1) / Scalar(2)) * dt;
+  const Scalar _tmp75 = _tmp4 * _tmp74;
+  const Scalar _tmp76 = Scalar(0.050000000000000003) - _tmp8;
+  const Scalar _tmp77 = std::max<Scalar>(0, (((_tmp76) > 0) - ((_tmp76) < 0)));
+  const Scalar _tmp78 = _tmp76 * _tmp77 + _tmp8;
+  const Scalar _tmp79 = (Scalar(1) / Scalar(2)) * _tmp78;
+  const Scalar _tmp80 =
+      (-_tmp79 * std::cos(_tmp79) / std::sin(_tmp79) + 1) / std::pow(_tmp78, Scalar(2));
+  const Scalar _tmp81 =
+      _tmp77 * (Scalar(3.3068783068783071e-5) * std::pow(_tmp7, Scalar(2)) +
+                Scalar(0.0013888888888888889) * _tmp7 - _tmp80 + Scalar(0.083333333333333329)) +
+      _tmp80;
+  const Scalar _tmp82 = _tmp30 * _tmp81;
+  const Scalar _tmp83 = _tmp0 * _tmp82;
+  const Scalar _tmp84 = -_tmp75 + _tmp83;
+  const Scalar _tmp85 = _tmp69 * imu_noise(2, 0);
+  const Scalar _tmp86 = -_tmp5 * _tmp81;
+  const Scalar _tmp87 = -_tmp3 * _tmp81 + 1;
+  const Scalar _tmp88 = _tmp86 + _tmp87;
+  const Scalar _tmp89 = _tmp69 * imu_noise(0, 0);
+  const Scalar _tmp90 = _tmp2 * _tmp74;
+  const Scalar _tmp91 = _tmp25 * _tmp81;
+  const Scalar _tmp92 = _tmp90 + _tmp91;
+  const Scalar _tmp93 = _tmp69 * imu_noise(1, 0);
+  const Scalar _tmp94 = _tmp37 * state(11, 0) + _tmp46 * state(13, 0) + _tmp55 * state(10, 0);
+  const Scalar _tmp95 = _tmp37 * state(14, 0) + _tmp46 * state(15, 0) + _tmp55 * state(13, 0);
+  const Scalar _tmp96 = _tmp0 * _tmp74;
+  const Scalar _tmp97 = _tmp4 * _tmp82;
+  const Scalar _tmp98 = _tmp96 + _tmp97;
+  const Scalar _tmp99 = _tmp85 * _tmp98;
+  const Scalar _tmp100 = -_tmp90 + _tmp91;
+  const Scalar _tmp101 = _tmp100 * _tmp89;
+  const Scalar _tmp102 = -_tmp6 * _tmp81;
+  const Scalar _tmp103 = _tmp102 + _tmp87;
+  const Scalar _tmp104 = _tmp37 * state(12, 0) + _tmp46 * state(14, 0) + _tmp55 * state(11, 0);
+  const Scalar _tmp105 = _tmp75 + _tmp83;
+  const Scalar _tmp106 = -_tmp96 + _tmp97;
+  const Scalar _tmp107 = _tmp106 * _tmp93;
+  const Scalar _tmp108 = _tmp34 * state(11, 0) + _tmp45 * state(13, 0) + _tmp56 * state(10, 0);
+  const Scalar _tmp109 = _tmp34 * state(12, 0) + _tmp45 * state(14, 0) + _tmp56 * state(11, 0);
+  const Scalar _tmp110 = _tmp34 * state(14, 0) + _tmp45 * state(15, 0) + _tmp56 * state(13, 0);
+  const Scalar _tmp111 = _tmp102 + _tmp86 + 1;
+  const Scalar _tmp112 = _tmp51 * state(11, 0);
+  const Scalar _tmp113 = _tmp40 * state(13, 0);
+  const Scalar _tmp114 = _tmp112 - _tmp113 + state(16, 0);
+  const Scalar _tmp115 = _tmp40 * state(10, 0) - _tmp59 * state(11, 0) + state(25, 0);
+  const Scalar _tmp116 = -_tmp51 * state(10, 0) + _tmp59 * state(13, 0) + state(20, 0);
+  const Scalar _tmp117 = _tmp114 * _tmp57 + _tmp115 * _tmp49 + _tmp116 * _tmp28;
+  const Scalar _tmp118 = _tmp40 * state(11, 0) - _tmp59 * state(12, 0) + state(26, 0);
+  const Scalar _tmp119 = _tmp59 * state(14, 0);
+  const Scalar _tmp120 = -_tmp112 + _tmp119 + state(21, 0);
+  const Scalar _tmp121 = -_tmp40 * state(14, 0) + _tmp51 * state(12, 0) + state(17, 0);
+  const Scalar _tmp122 = _tmp118 * _tmp49 + _tmp120 * _tmp28 + _tmp121 * _tmp57;
+  const Scalar _tmp123 = -_tmp40 * state(15, 0) + _tmp51 * state(14, 0) + state(18, 0);
+  const Scalar _tmp124 = -_tmp51 * state(13, 0) + _tmp59 * state(15, 0) + state(22, 0);
+  const Scalar _tmp125 = _tmp113 - _tmp119 + state(27, 0);
+  const Scalar _tmp126 = _tmp123 * _tmp57 + _tmp124 * _tmp28 + _tmp125 * _tmp49;
+  const Scalar _tmp127 = std::pow(_tmp28, Scalar(2));
+  const Scalar _tmp128 = _tmp69 * imu_noise(4, 0);
+  const Scalar _tmp129 = -_tmp116 * _tmp51 + _tmp124 * _tmp59 - _tmp51 * state(20, 0) +
+                         _tmp59 * state(22, 0) + state(24, 0);
+  const Scalar _tmp130 = _tmp120 * _tmp51 - _tmp124 * _tmp40 - _tmp51 * state(16, 0) +
+                         _tmp59 * state(18, 0) + state(23, 0);
+  const Scalar _tmp131 = -_tmp115 * _tmp51 + _tmp125 * _tmp59 + _tmp40 * state(20, 0) -
+                         _tmp59 * state(21, 0) + state(29, 0);
+  const Scalar _tmp132 = std::pow(_tmp49, Scalar(2));
+  const Scalar _tmp133 = _tmp69 * imu_noise(5, 0);
+  const Scalar _tmp134 = _tmp118 * _tmp51 - _tmp125 * _tmp40 + _tmp40 * state(16, 0) -
+                         _tmp59 * state(17, 0) + state(28, 0);
+  const Scalar _tmp135 = _tmp115 * _tmp40 - _tmp118 * _tmp59 + _tmp40 * state(25, 0) -
+                         _tmp59 * state(26, 0) + state(30, 0);
+  const Scalar _tmp136 = std::pow(_tmp57, Scalar(2));
+  const Scalar _tmp137 = _tmp69 * imu_noise(3, 0);
+  const Scalar _tmp138 = _tmp121 * _tmp51 - _tmp123 * _tmp40 - _tmp40 * state(18, 0) +
+                         _tmp51 * state(17, 0) + state(19, 0);
+  const Scalar _tmp139 = _tmp123 * _tmp55 + _tmp124 * _tmp37 + _tmp125 * _tmp46;
+  const Scalar _tmp140 = _tmp118 * _tmp46 + _tmp120 * _tmp37 + _tmp121 * _tmp55;
+  const Scalar _tmp141 = _tmp114 * _tmp55 + _tmp115 * _tmp46 + _tmp116 * _tmp37;
+  const Scalar _tmp142 = _tmp131 * _tmp37 + _tmp134 * _tmp55 + _tmp135 * _tmp46;
+  const Scalar _tmp143 = _tmp129 * _tmp37 + _tmp130 * _tmp55 + _tmp131 * _tmp46;
+  const Scalar _tmp144 = _tmp130 * _tmp37 + _tmp134 * _tmp46 + _tmp138 * _tmp55;
+  const Scalar _tmp145 = _tmp133 * _tmp49;
+  const Scalar _tmp146 = _tmp137 * _tmp57;
+  const Scalar _tmp147 = _tmp128 * _tmp37;
+  const Scalar _tmp148 = std::pow(_tmp55, Scalar(2));
+  const Scalar _tmp149 = std::pow(_tmp37, Scalar(2));
+  const Scalar _tmp150 = std::pow(_tmp46, Scalar(2));
+  const Scalar _tmp151 = _tmp123 * _tmp56 + _tmp124 * _tmp34 + _tmp125 * _tmp45;
+  const Scalar _tmp152 = _tmp118 * _tmp45 + _tmp120 * _tmp34 + _tmp121 * _tmp56;
+  const Scalar _tmp153 = _tmp114 * _tmp56 + _tmp115 * _tmp45 + _tmp116 * _tmp34;
+  const Scalar _tmp154 = _tmp28 * _tmp34;
+  const Scalar _tmp155 = _tmp129 * _tmp34 + _tmp130 * _tmp56 + _tmp131 * _tmp45;
+  const Scalar _tmp156 = _tmp130 * _tmp34 + _tmp134 * _tmp45 + _tmp138 * _tmp56;
+  const Scalar _tmp157 = _tmp131 * _tmp34 + _tmp134 * _tmp56 + _tmp135 * _tmp45;
+  const Scalar _tmp158 = _tmp55 * _tmp56;
+  const Scalar _tmp159 = _tmp45 * _tmp46;
+  const Scalar _tmp160 = std::pow(_tmp45, Scalar(2));
+  const Scalar _tmp161 = std::pow(_tmp56, Scalar(2));
+  const Scalar _tmp162 = std::pow(_tmp34, Scalar(2));
+  const Scalar _tmp163 = _tmp73 * state(14, 0);
+  const Scalar _tmp164 = _tmp72 * state(11, 0);
+  const Scalar _tmp165 = dt * state(21, 0) + state(39, 0);
+  const Scalar _tmp166 = _tmp163 - _tmp164 + _tmp165;
+  const Scalar _tmp167 = dt * state(26, 0) + state(47, 0);
+  const Scalar _tmp168 = _tmp167 + _tmp71 * state(11, 0) - _tmp73 * state(12, 0);
+  const Scalar _tmp169 = dt * state(17, 0) + state(32, 0);
+  const Scalar _tmp170 = _tmp169 - _tmp71 * state(14, 0) + _tmp72 * state(12, 0);
+  const Scalar _tmp171 = _tmp166 * _tmp28 + _tmp168 * _tmp49 + _tmp170 * _tmp57;
+  const Scalar _tmp172 = _tmp71 * state(13, 0);
+  const Scalar _tmp173 = -_tmp163 + _tmp172 + dt * state(27, 0) + state(48, 0);
+  const Scalar _tmp174 = dt * state(22, 0) + state(40, 0);
+  const Scalar _tmp175 = _tmp174 - _tmp72 * state(13, 0) + _tmp73 * state(15, 0);
+  const Scalar _tmp176 = dt * state(18, 0) + state(33, 0);
+  const Scalar _tmp177 = _tmp176 - _tmp71 * state(15, 0) + _tmp72 * state(14, 0);
+  const Scalar _tmp178 = _tmp173 * _tmp49 + _tmp175 * _tmp28 + _tmp177 * _tmp57;
+  const Scalar _tmp179 = dt * state(20, 0) + state(38, 0);
+  const Scalar _tmp180 = _tmp179 - _tmp72 * state(10, 0) + _tmp73 * state(13, 0);
+  const Scalar _tmp181 = dt * state(16, 0) + state(31, 0);
+  const Scalar _tmp182 = _tmp164 - _tmp172 + _tmp181;
+  const Scalar _tmp183 = dt * state(25, 0) + state(46, 0);
+  const Scalar _tmp184 = _tmp183 + _tmp71 * state(10, 0) - _tmp73 * state(11, 0);
+  const Scalar _tmp185 = _tmp180 * _tmp28 + _tmp182 * _tmp57 + _tmp184 * _tmp49;
+  const Scalar _tmp186 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(4));
+  const Scalar _tmp187 = _tmp186 * imu_noise(4, 0);
+  const Scalar _tmp188 = _tmp186 * imu_noise(5, 0);
+  const Scalar _tmp189 = dt * state(23, 0);
+  const Scalar _tmp190 = _tmp189 + state(41, 0);
+  const Scalar _tmp191 =
+      _tmp166 * _tmp51 - _tmp175 * _tmp40 + _tmp190 - _tmp72 * state(16, 0) + _tmp73 * state(18, 0);
+  const Scalar _tmp192 = dt * state(19, 0) + state(34, 0);
+  const Scalar _tmp193 =
+      _tmp170 * _tmp51 - _tmp177 * _tmp40 + _tmp192 - _tmp71 * state(18, 0) + _tmp72 * state(17, 0);
+  const Scalar _tmp194 = dt * state(28, 0);
+  const Scalar _tmp195 = _tmp194 + state(49, 0);
+  const Scalar _tmp196 =
+      _tmp168 * _tmp51 - _tmp173 * _tmp40 + _tmp195 + _tmp71 * state(16, 0) - _tmp73 * state(17, 0);
+  const Scalar _tmp197 = _tmp191 * _tmp28 + _tmp193 * _tmp57 + _tmp196 * _tmp49;
+  const Scalar _tmp198 = _tmp136 * imu_noise(3, 0);
+  const Scalar _tmp199 = dt * state(24, 0) + state(42, 0);
+  const Scalar _tmp200 =
+      _tmp175 * _tmp59 - _tmp180 * _tmp51 + _tmp199 - _tmp72 * state(20, 0) + _tmp73 * state(22, 0);
+  const Scalar _tmp201 = dt * state(29, 0);
+  const Scalar _tmp202 = _tmp201 + state(50, 0);
+  const Scalar _tmp203 =
+      _tmp173 * _tmp59 - _tmp184 * _tmp51 + _tmp202 + _tmp71 * state(20, 0) - _tmp73 * state(21, 0);
+  const Scalar _tmp204 = _tmp177 * _tmp59 - _tmp182 * _tmp51 + _tmp189 - _tmp71 * state(22, 0) +
+                         _tmp72 * state(21, 0) + state(35, 0);
+  const Scalar _tmp205 = _tmp200 * _tmp28 + _tmp203 * _tmp49 + _tmp204 * _tmp57;
+  const Scalar _tmp206 = -_tmp166 * _tmp59 + _tmp180 * _tmp40 + _tmp201 - _tmp72 * state(25, 0) +
+                         _tmp73 * state(27, 0) + state(43, 0);
+  const Scalar _tmp207 = -_tmp170 * _tmp59 + _tmp182 * _tmp40 + _tmp194 - _tmp71 * state(27, 0) +
+                         _tmp72 * state(26, 0) + state(36, 0);
+  const Scalar _tmp208 = dt * state(30, 0) + state(51, 0);
+  const Scalar _tmp209 = -_tmp168 * _tmp59 + _tmp184 * _tmp40 + _tmp208 + _tmp71 * state(25, 0) -
+                         _tmp73 * state(26, 0);
+  const Scalar _tmp210 = _tmp206 * _tmp28 + _tmp207 * _tmp57 + _tmp209 * _tmp49;
+  const Scalar _tmp211 = _tmp46 * _tmp49;
+  const Scalar _tmp212 = _tmp57 * imu_noise(3, 0);
+  const Scalar _tmp213 = _tmp212 * _tmp55;
+  const Scalar _tmp214 = _tmp187 * _tmp37;
+  const Scalar _tmp215 = _tmp186 * _tmp213 + _tmp188 * _tmp211 + _tmp214 * _tmp28;
+  const Scalar _tmp216 = _tmp212 * _tmp56;
+  const Scalar _tmp217 = _tmp45 * _tmp49;
+  const Scalar _tmp218 = _tmp154 * _tmp187 + _tmp186 * _tmp216 + _tmp188 * _tmp217;
+  const Scalar _tmp219 = (Scalar(1) / Scalar(4)) * std::pow(dt, Scalar(5));
+  const Scalar _tmp220 = _tmp219 * imu_noise(4, 0);
+  const Scalar _tmp221 = _tmp168 * _tmp72 - _tmp169 * _tmp73 - _tmp173 * _tmp71 + _tmp181 * _tmp71 +
+                         _tmp195 * dt + dt * state(36, 0) + state(52, 0);
+  const Scalar _tmp222 = _tmp166 * _tmp72 - _tmp175 * _tmp71 + _tmp176 * _tmp73 - _tmp181 * _tmp72 +
+                         _tmp190 * dt + dt * state(35, 0) + state(44, 0);
+  const Scalar _tmp223 = _tmp169 * _tmp72 + _tmp170 * _tmp72 - _tmp176 * _tmp71 - _tmp177 * _tmp71 +
+                         _tmp192 * dt + dt * state(34, 0) + state(37, 0);
+  const Scalar _tmp224 = _tmp219 * imu_noise(5, 0);
+  const Scalar _tmp225 = -_tmp167 * _tmp73 - _tmp168 * _tmp73 + _tmp183 * _tmp71 +
+                         _tmp184 * _tmp71 + _tmp208 * dt + dt * state(51, 0) + state(54, 0);
+  const Scalar _tmp226 = -_tmp165 * _tmp73 + _tmp173 * _tmp73 + _tmp179 * _tmp71 -
+                         _tmp184 * _tmp72 + _tmp202 * dt + dt * state(43, 0) + state(53, 0);
+  const Scalar _tmp227 = _tmp174 * _tmp73 + _tmp175 * _tmp73 - _tmp179 * _tmp72 - _tmp180 * _tmp72 +
+                         _tmp199 * dt + dt * state(42, 0) + state(45, 0);
+  const Scalar _tmp228 = _tmp180 * _tmp37 + _tmp182 * _tmp55 + _tmp184 * _tmp46;
+  const Scalar _tmp229 = _tmp166 * _tmp37 + _tmp168 * _tmp46 + _tmp170 * _tmp55;
+  const Scalar _tmp230 = _tmp173 * _tmp46 + _tmp175 * _tmp37 + _tmp177 * _tmp55;
+  const Scalar _tmp231 = _tmp200 * _tmp37 + _tmp203 * _tmp46 + _tmp204 * _tmp55;
+  const Scalar _tmp232 = _tmp191 * _tmp37 + _tmp193 * _tmp55 + _tmp196 * _tmp46;
+  const Scalar _tmp233 = _tmp206 * _tmp37 + _tmp207 * _tmp55 + _tmp209 * _tmp46;
+  const Scalar _tmp234 = _tmp148 * imu_noise(3, 0);
+  const Scalar _tmp235 = _tmp158 * imu_noise(3, 0);
+  const Scalar _tmp236 = _tmp159 * _tmp188 + _tmp186 * _tmp235 + _tmp214 * _tmp34;
+  const Scalar _tmp237 = _tmp221 * _tmp55 + _tmp225 * _tmp46 + _tmp226 * _tmp37;
+  const Scalar _tmp238 = _tmp221 * _tmp46 + _tmp222 * _tmp37 + _tmp223 * _tmp55;
+  const Scalar _tmp239 = _tmp222 * _tmp55 + _tmp226 * _tmp46 + _tmp227 * _tmp37;
+  const Scalar _tmp240 = _tmp220 * _tmp37;
+  const Scalar _tmp241 = _tmp173 * _tmp45 + _tmp175 * _tmp34 + _tmp177 * _tmp56;
+  const Scalar _tmp242 = _tmp166 * _tmp34 + _tmp168 * _tmp45 + _tmp170 * _tmp56;
+  const Scalar _tmp243 = _tmp180 * _tmp34 + _tmp182 * _tmp56 + _tmp184 * _tmp45;
+  const Scalar _tmp244 = _tmp191 * _tmp34 + _tmp193 * _tmp56 + _tmp196 * _tmp45;
+  const Scalar _tmp245 = _tmp200 * _tmp34 + _tmp203 * _tmp45 + _tmp204 * _tmp56;
+  const Scalar _tmp246 = _tmp206 * _tmp34 + _tmp207 * _tmp56 + _tmp209 * _tmp45;
+  const Scalar _tmp247 = _tmp161 * imu_noise(3, 0);
+  const Scalar _tmp248 = _tmp221 * _tmp56 + _tmp225 * _tmp45 + _tmp226 * _tmp34;
+  const Scalar _tmp249 = _tmp221 * _tmp45 + _tmp222 * _tmp34 + _tmp223 * _tmp56;
+  const Scalar _tmp250 = _tmp222 * _tmp56 + _tmp226 * _tmp45 + _tmp227 * _tmp34;
+
+  // Output terms (3)
+  if (nom != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _nom = (*nom);
+
+    _nom(0, 0) =
+        _tmp12 * state(3, 0) - _tmp13 * state(2, 0) + _tmp14 * state(1, 0) + _tmp15 * state(0, 0);
+    _nom(1, 0) =
+        _tmp12 * state(2, 0) + _tmp13 * state(3, 0) - _tmp14 * state(0, 0) + _tmp15 * state(1, 0);
+    _nom(2, 0) =
+        -_tmp12 * state(1, 0) + _tmp13 * state(0, 0) + _tmp14 * state(3, 0) + _tmp15 * state(2, 0);
+    _nom(3, 0) =
+        -_tmp12 * state(0, 0) - _tmp13 * state(1, 0) - _tmp14 * state(2, 0) + _tmp15 * state(3, 0);
+    _nom(4, 0) =
+        _tmp20 * _tmp40 + _tmp43 * _tmp51 + _tmp54 * _tmp59 + dt * gravity(0, 0) + state(4, 0);
+    _nom(5, 0) =
+        _tmp40 * _tmp61 + _tmp51 * _tmp64 + _tmp59 * _tmp65 + dt * gravity(1, 0) + state(5, 0);
+    _nom(6, 0) =
+        _tmp40 * _tmp66 + _tmp51 * _tmp67 + _tmp59 * _tmp68 + dt * gravity(2, 0) + state(6, 0);
+    _nom(7, 0) = _tmp20 * _tmp71 + _tmp39 * gravity(0, 0) + _tmp43 * _tmp72 + _tmp54 * _tmp73 +
+                 dt * state(4, 0) + state(7, 0);
+    _nom(8, 0) = _tmp39 * gravity(1, 0) + _tmp61 * _tmp71 + _tmp64 * _tmp72 + _tmp65 * _tmp73 +
+                 dt * state(5, 0) + state(8, 0);
+    _nom(9, 0) = _tmp39 * gravity(2, 0) + _tmp66 * _tmp71 + _tmp67 * _tmp72 + _tmp68 * _tmp73 +
+                 dt * state(6, 0) + state(9, 0);
+  }
+
+  if (err_cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _err_cov = (*err_cov);
+
+    _err_cov(0, 0) =
+        _tmp28 * (_tmp28 * state(12, 0) + _tmp49 * state(14, 0) + _tmp57 * state(11, 0)) +
+        _tmp49 * (_tmp28 * state(14, 0) + _tmp49 * state(15, 0) + _tmp57 * state(13, 0)) +
+        _tmp57 * (_tmp28 * state(11, 0) + _tmp49 * state(13, 0) + _tmp57 * state(10, 0)) +
+        std::pow(_tmp84, Scalar(2)) * _tmp85 + std::pow(_tmp88, Scalar(2)) * _tmp89 +
+        std::pow(_tmp92, Scalar(2)) * _tmp93;
+    _err_cov(1, 0) = _tmp101 * _tmp88 + _tmp103 * _tmp92 * _tmp93 + _tmp104 * _tmp28 +
+                     _tmp49 * _tmp95 + _tmp57 * _tmp94 + _tmp84 * _tmp99;
+    _err_cov(2, 0) = std::pow(_tmp100, Scalar(2)) * _tmp89 + std::pow(_tmp103, Scalar(2)) * _tmp93 +
+                     _tmp104 * _tmp37 + _tmp46 * _tmp95 + _tmp55 * _tmp94 +
+                     _tmp85 * std::pow(_tmp98, Scalar(2));
+    _err_cov(3, 0) = _tmp105 * _tmp88 * _tmp89 + _tmp107 * _tmp92 + _tmp108 * _tmp57 +
+                     _tmp109 * _tmp28 + _tmp110 * _tmp49 + _tmp111 * _tmp84 * _tmp85;
+    _err_cov(4, 0) = _tmp101 * _tmp105 + _tmp103 * _tmp107 + _tmp108 * _tmp55 + _tmp109 * _tmp37 +
+                     _tmp110 * _tmp46 + _tmp111 * _tmp99;
+    _err_cov(5, 0) = std::pow(_tmp105, Scalar(2)) * _tmp89 + std::pow(_tmp106, Scalar(2)) * _tmp93 +
+                     _tmp108 * _tmp56 + _tmp109 * _tmp34 + _tmp110 * _tmp45 +
+                     std::pow(_tmp111, Scalar(2)) * _tmp85;
+    _err_cov(6, 0) = _tmp117 * _tmp57 + _tmp122 * _tmp28 + _tmp126 * _tmp49;
+    _err_cov(7, 0) = _tmp117 * _tmp55 + _tmp122 * _tmp37 + _tmp126 * _tmp46;
+    _err_cov(8, 0) = _tmp117 * _tmp56 + _tmp122 * _tmp34 + _tmp126 * _tmp45;
+    _err_cov(9, 0) = _tmp127 * _tmp128 + _tmp132 * _tmp133 + _tmp136 * _tmp137 +
+                     _tmp28 * (_tmp129 * _tmp28 + _tmp130 * _tmp57 + _tmp131 * _tmp49) +
+                     _tmp49 * (_tmp131 * _tmp28 + _tmp134 * _tmp57 + _tmp135 * _tmp49) +
+                     _tmp57 * (_tmp130 * _tmp28 + _tmp134 * _tmp49 + _tmp138 * _tmp57);
+    _err_cov(10, 0) = _tmp139 * _tmp49 + _tmp140 * _tmp28 + _tmp141 * _tmp57;
+    _err_cov(11, 0) = _tmp139 * _tmp46 + _tmp140 * _tmp37 + _tmp141 * _tmp55;
+    _err_cov(12, 0) = _tmp139 * _tmp45 + _tmp140 * _tmp34 + _tmp141 * _tmp56;
+    _err_cov(13, 0) = _tmp142 * _tmp49 + _tmp143 * _tmp28 + _tmp144 * _tmp57 + _tmp145 * _tmp46 +
+                      _tmp146 * _tmp55 + _tmp147 * _tmp28;
+    _err_cov(14, 0) = _tmp128 * _tmp149 + _tmp133 * _tmp150 + _tmp137 * _tmp148 + _tmp142 * _tmp46 +
+                      _tmp143 * _tmp37 + _tmp144 * _tmp55;
+    _err_cov(15, 0) = _tmp151 * _tmp49 + _tmp152 * _tmp28 + _tmp153 * _tmp57;
+    _err_cov(16, 0) = _tmp151 * _tmp46 + _tmp152 * _tmp37 + _tmp153 * _tmp55;
+    _err_cov(17, 0) = _tmp151 * _tmp45 + _tmp152 * _tmp34 + _tmp153 * _tmp56;
+    _err_cov(18, 0) = _tmp128 * _tmp154 + _tmp145 * _tmp45 + _tmp146 * _tmp56 + _tmp155 * _tmp28 +
+                      _tmp156 * _tmp57 + _tmp157 * _tmp49;
+    _err_cov(19, 0) = _tmp133 * _tmp159 + _tmp137 * _tmp158 + _tmp147 * _tmp34 + _tmp155 * _tmp37 +
+                      _tmp156 * _tmp55 + _tmp157 * _tmp46;
+    _err_cov(20, 0) = _tmp128 * _tmp162 + _tmp133 * _tmp160 + _tmp137 * _tmp161 + _tmp155 * _tmp34 +
+                      _tmp156 * _tmp56 + _tmp157 * _tmp45;
+    _err_cov(21, 0) = _tmp171 * _tmp28 + _tmp178 * _tmp49 + _tmp185 * _tmp57;
+    _err_cov(22, 0) = _tmp171 * _tmp37 + _tmp178 * _tmp46 + _tmp185 * _tmp55;
+    _err_cov(23, 0) = _tmp171 * _tmp34 + _tmp178 * _tmp45 + _tmp185 * _tmp56;
+    _err_cov(24, 0) = _tmp127 * _tmp187 + _tmp132 * _tmp188 + _tmp186 * _tmp198 + _tmp197 * _tmp57 +
+                      _tmp205 * _tmp28 + _tmp210 * _tmp49;
+    _err_cov(25, 0) = _tmp197 * _tmp55 + _tmp205 * _tmp37 + _tmp210 * _tmp46 + _tmp215;
+    _err_cov(26, 0) = _tmp197 * _tmp56 + _tmp205 * _tmp34 + _tmp210 * _tmp45 + _tmp218;
+    _err_cov(27, 0) = _tmp127 * _tmp220 + _tmp132 * _tmp224 + _tmp198 * _tmp219 +
+                      _tmp28 * (_tmp222 * _tmp57 + _tmp226 * _tmp49 + _tmp227 * _tmp28) +
+                      _tmp49 * (_tmp221 * _tmp57 + _tmp225 * _tmp49 + _tmp226 * _tmp28) +
+                      _tmp57 * (_tmp221 * _tmp49 + _tmp222 * _tmp28 + _tmp223 * _tmp57);
+    _err_cov(28, 0) = _tmp228 * _tmp57 + _tmp229 * _tmp28 + _tmp230 * _tmp49;
+    _err_cov(29, 0) = _tmp228 * _tmp55 + _tmp229 * _tmp37 + _tmp230 * _tmp46;
+    _err_cov(30, 0) = _tmp228 * _tmp56 + _tmp229 * _tmp34 + _tmp230 * _tmp45;
+    _err_cov(31, 0) = _tmp215 + _tmp231 * _tmp28 + _tmp232 * _tmp57 + _tmp233 * _tmp49;
+    _err_cov(32, 0) = _tmp149 * _tmp187 + _tmp150 * _tmp188 + _tmp186 * _tmp234 + _tmp231 * _tmp37 +
+                      _tmp232 * _tmp55 + _tmp233 * _tmp46;
+    _err_cov(33, 0) = _tmp231 * _tmp34 + _tmp232 * _tmp56 + _tmp233 * _tmp45 + _tmp236;
+    _err_cov(34, 0) = _tmp211 * _tmp224 + _tmp213 * _tmp219 + _tmp237 * _tmp49 + _tmp238 * _tmp57 +
+                      _tmp239 * _tmp28 + _tmp240 * _tmp28;
+    _err_cov(35, 0) = _tmp149 * _tmp220 + _tmp150 * _tmp224 + _tmp219 * _tmp234 + _tmp237 * _tmp46 +
+                      _tmp238 * _tmp55 + _tmp239 * _tmp37;
+    _err_cov(36, 0) = _tmp241 * _tmp49 + _tmp242 * _tmp28 + _tmp243 * _tmp57;
+    _err_cov(37, 0) = _tmp241 * _tmp46 + _tmp242 * _tmp37 + _tmp243 * _tmp55;
+    _err_cov(38, 0) = _tmp241 * _tmp45 + _tmp242 * _tmp34 + _tmp243 * _tmp56;
+    _err_cov(39, 0) = _tmp218 + _tmp244 * _tmp57 + _tmp245 * _tmp28 + _tmp246 * _tmp49;
+    _err_cov(40, 0) = _tmp236 + _tmp244 * _tmp55 + _tmp245 * _tmp37 + _tmp246 * _tmp46;
+    _err_cov(41, 0) = _tmp160 * _tmp188 + _tmp162 * _tmp187 + _tmp186 * _tmp247 + _tmp244 * _tmp56 +
+                      _tmp245 * _tmp34 + _tmp246 * _tmp45;
+    _err_cov(42, 0) = _tmp154 * _tmp220 + _tmp216 * _tmp219 + _tmp217 * _tmp224 + _tmp248 * _tmp49 +
+                      _tmp249 * _tmp57 + _tmp250 * _tmp28;
+    _err_cov(43, 0) = _tmp159 * _tmp224 + _tmp219 * _tmp235 + _tmp240 * _tmp34 + _tmp248 * _tmp46 +
+                      _tmp249 * _tmp55 + _tmp250 * _tmp37;
+    _err_cov(44, 0) = _tmp160 * _tmp224 + _tmp162 * _tmp220 + _tmp219 * _tmp247 + _tmp248 * _tmp45 +
+                      _tmp249 * _tmp56 + _tmp250 * _tmp34;
+  }
+
+  if (imu_bias != nullptr) {
+    Eigen::Matrix<Scalar, 6, 1>& _imu_bias = (*imu_bias);
+
+    _imu_bias(0, 0) = state(55, 0);
+    _imu_bias(1, 0) = state(56, 0);
+    _imu_bias(2, 0) = state(57, 0);
+    _imu_bias(3, 0) = state(58, 0);
+    _imu_bias(4, 0) = state(59, 0);
+    _imu_bias(5, 0) = state(60, 0);
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
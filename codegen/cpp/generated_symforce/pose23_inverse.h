@@ -0,0 +1,166 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     a: Matrix10_1
+ *
+ * Outputs:
+ *     pose: Matrix10_1
+ *     D_a: Matrix99
+ */
+template <typename Scalar>
+void Pose23Inverse(const Eigen::Matrix<Scalar, 10, 1>& a,
+                   Eigen::Matrix<Scalar, 10, 1>* const pose = nullptr,
+                   Eigen::Matrix<Scalar, 9, 9>* const D_a = nullptr) {
+  // Total ops: 130
+
+  // Input arrays
+
+  // Intermediate terms (29)
+  const Scalar _tmp0 = 2 * a(0, 0);
+  const Scalar _tmp1 = _tmp0 * a(1, 0);
+  const Scalar _tmp2 = 2 * a(3, 0);
+  const Scalar _tmp3 = _tmp2 * a(2, 0);
+  const Scalar _tmp4 = _tmp1 + _tmp3;
+  const Scalar _tmp5 = _tmp0 * a(2, 0);
+  const Scalar _tmp6 = _tmp2 * a(1, 0);
+  const Scalar _tmp7 = _tmp5 - _tmp6;
+  const Scalar _tmp8 = -2 * std::pow(a(2, 0), Scalar(2));
+  const Scalar _tmp9 = 1 - 2 * std::pow(a(1, 0), Scalar(2));
+  const Scalar _tmp10 = _tmp8 + _tmp9;
+  const Scalar _tmp11 = _tmp1 - _tmp3;
+  const Scalar _tmp12 = 2 * a(1, 0) * a(2, 0);
+  const Scalar _tmp13 = _tmp0 * a(3, 0);
+  const Scalar _tmp14 = _tmp12 + _tmp13;
+  const Scalar _tmp15 = -2 * std::pow(a(0, 0), Scalar(2));
+  const Scalar _tmp16 = _tmp15 + _tmp8 + 1;
+  const Scalar _tmp17 = _tmp5 + _tmp6;
+  const Scalar _tmp18 = _tmp12 - _tmp13;
+  const Scalar _tmp19 = _tmp15 + _tmp9;
+  const Scalar _tmp20 = -_tmp10;
+  const Scalar _tmp21 = -_tmp4;
+  const Scalar _tmp22 = -_tmp7;
+  const Scalar _tmp23 = -_tmp11;
+  const Scalar _tmp24 = -_tmp16;
+  const Scalar _tmp25 = -_tmp14;
+  const Scalar _tmp26 = -_tmp17;
+  const Scalar _tmp27 = -_tmp18;
+  const Scalar _tmp28 = -_tmp19;
+
+  // Output terms (2)
+  if (pose != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _pose = (*pose);
+
+    _pose(0, 0) = -a(0, 0);
+    _pose(1, 0) = -a(1, 0);
+    _pose(2, 0) = -a(2, 0);
+    _pose(3, 0) = a(3, 0);
+    _pose(4, 0) = -_tmp10 * a(4, 0) - _tmp4 * a(5, 0) - _tmp7 * a(6, 0);
+    _pose(5, 0) = -_tmp11 * a(4, 0) - _tmp14 * a(6, 0) - _tmp16 * a(5, 0);
+    _pose(6, 0) = -_tmp17 * a(4, 0) - _tmp18 * a(5, 0) - _tmp19 * a(6, 0);
+    _pose(7, 0) = -_tmp10 * a(7, 0) - _tmp4 * a(8, 0) - _tmp7 * a(9, 0);
+    _pose(8, 0) = -_tmp11 * a(7, 0) - _tmp14 * a(9, 0) - _tmp16 * a(8, 0);
+    _pose(9, 0) = -_tmp17 * a(7, 0) - _tmp18 * a(8, 0) - _tmp19 * a(9, 0);
+  }
+
+  if (D_a != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_a = (*D_a);
+
+    _D_a(0, 0) = _tmp20;
+    _D_a(1, 0) = _tmp21;
+    _D_a(2, 0) = _tmp22;
+    _D_a(3, 0) = _tmp4 * a(6, 0) - _tmp7 * a(5, 0);
+    _D_a(4, 0) = -_tmp10 * a(6, 0) + _tmp7 * a(4, 0);
+    _D_a(5, 0) = _tmp10 * a(5, 0) - _tmp4 * a(4, 0);
+    _D_a(6, 0) = _tmp4 * a(9, 0) - _tmp7 * a(8, 0);
+    _D_a(7, 0) = -_tmp10 * a(9, 0) + _tmp7 * a(7, 0);
+    _D_a(8, 0) = _tmp10 * a(8, 0) - _tmp4 * a(7, 0);
+    _D_a(0, 1) = _tmp23;
+    _D_a(1, 1) = _tmp24;
+    _D_a(2, 1) = _tmp25;
+    _D_a(3, 1) = -_tmp14 * a(5, 0) + _tmp16 * a(6, 0);
+    _D_a(4, 1) = -_tmp11 * a(6, 0) + _tmp14 * a(4, 0);
+    _D_a(5, 1) = _tmp11 * a(5, 0) - _tmp16 * a(4, 0);
+    _D_a(6, 1) = -_tmp14 * a(8, 0) + _tmp16 * a(9, 0);
+    _D_a(7, 1) = -_tmp11 * a(9, 0) + _tmp14 * a(7, 0);
+    _D_a(8, 1) = _tmp11 * a(8, 0) - _tmp16 * a(7, 0);
+    _D_a(0, 2) = _tmp26;
+    _D_a(1, 2) = _tmp27;
+    _D_a(2, 2) = _tmp28;
+    _D_a(3, 2) = _tmp18 * a(6, 0) - _tmp19 * a(5, 0);
+    _D_a(4, 2) = -_tmp17 * a(6, 0) + _tmp19 * a(4, 0);
+    _D_a(5, 2) = _tmp17 * a(5, 0) - _tmp18 * a(4, 0);
+    _D_a(6, 2) = _tmp18 * a(9, 0) - _tmp19 * a(8, 0);
+    _D_a(7, 2) = -_tmp17 * a(9, 0) + _tmp19 * a(7, 0);
+    _D_a(8, 2) = _tmp17 * a(8, 0) - _tmp18 * a(7, 0);
+    _D_a(0, 3) = 0;
+    _D_a(1, 3) = 0;
+    _D_a(2, 3) = 0;
+    _D_a(3, 3) = _tmp20;
+    _D_a(4, 3) = _tmp21;
+    _D_a(5, 3) = _tmp22;
+    _D_a(6, 3) = 0;
+    _D_a(7, 3) = 0;
+    _D_a(8, 3) = 0;
+    _D_a(0, 4) = 0;
+    _D_a(1, 4) = 0;
+    _D_a(2, 4) = 0;
+    _D_a(3, 4) = _tmp23;
+    _D_a(4, 4) = _tmp24;
+    _D_a(5, 4) = _tmp25;
+    _D_a(6, 4) = 0;
+    _D_a(7, 4) = 0;
+    _D_a(8, 4) = 0;
+    _D_a(0, 5) = 0;
+    _D_a(1, 5) = 0;
+    _D_a(2, 5) = 0;
+    _D_a(3, 5) = _tmp26;
+    _D_a(4, 5) = _tmp27;
+    _D_a(5, 5) = _tmp28;
+    _D_a(6, 5) = 0;
+    _D_a(7, 5) = 0;
+    _D_a(8, 5) = 0;
+    _D_a(0, 6) = 0;
+    _D_a(1, 6) = 0;
+    _D_a(2, 6) = 0;
+    _D_a(3, 6) = 0;
+    _D_a(4, 6) = 0;
+    _D_a(5, 6) = 0;
+    _D_a(6, 6) = _tmp20;
+    _D_a(7, 6) = _tmp21;
+    _D_a(8, 6) = _tmp22;
+    _D_a(0, 7) = 0;
+    _D_a(1, 7) = 0;
+    _D_a(2, 7) = 0;
+    _D_a(3, 7) = 0;
+    _D_a(4, 7) = 0;
+    _D_a(5, 7) = 0;
+    _D_a(6, 7) = _tmp23;
+    _D_a(7, 7) = _tmp24;
+    _D_a(8, 7) = _tmp25;
+    _D_a(0, 8) = 0;
+    _D_a(1, 8) = 0;
+    _D_a(2, 8) = 0;
+    _D_a(3, 8) = 0;
+    _D_a(4, 8) = 0;
+    _D_a(5, 8) = 0;
+    _D_a(6, 8) = _tmp26;
+    _D_a(7, 8) = _tmp27;
+    _D_a(8, 8) = _tmp28;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
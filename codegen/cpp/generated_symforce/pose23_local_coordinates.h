@@ -0,0 +1,581 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     a: Matrix10_1
+ *     b: Matrix10_1
+ *
+ * Outputs:
+ *     tangent: Matrix91
+ *     D_a: Matrix99
+ *     D_b: Matrix99
+ */
+template <typename Scalar>
+void Pose23LocalCoordinates(const Eigen::Matrix<Scalar, 10, 1>& a,
+                            const Eigen::Matrix<Scalar, 10, 1>& b,
+                            Eigen::Matrix<Scalar, 9, 1>* const tangent = nullptr,
+                            Eigen::Matrix<Scalar, 9, 9>* const D_a = nullptr,
+                            Eigen::Matrix<Scalar, 9, 9>* const D_b = nullptr) {
+  // Total ops: 1240
+
+  // Input arrays
+
+  // Intermediate terms (306)
+  const Scalar _tmp0 =
+      -a(0, 0) * b(3, 0) - a(1, 0) * b(2, 0) + a(2, 0) * b(1, 0) + a(3, 0) * b(0, 0);
+  const Scalar _tmp1 = -a(0, 0) * b(0, 0) - a(1, 0) * b(1, 0) - a(2, 0) * b(2, 0);
+  const Scalar _tmp2 = a(3, 0) * b(3, 0);
+  const Scalar _tmp3 = std::min<Scalar>(Scalar(0.99999899999999997), std::fabs(_tmp1 - _tmp2));
+  const Scalar _tmp4 = 1 - std::pow(_tmp3, Scalar(2));
+  const Scalar _tmp5 = std::copysign(Scalar(1.0), -_tmp1 + _tmp2);
+  const Scalar _tmp6 = std::acos(_tmp3);
+  const Scalar _tmp7 = _tmp5 * _tmp6 / std::sqrt(_tmp4);
+  const Scalar _tmp8 = _tmp0 * _tmp7;
+  const Scalar _tmp9 = 2 * _tmp8;
+  const Scalar _tmp10 =
+      a(0, 0) * b(2, 0) - a(1, 0) * b(3, 0) - a(2, 0) * b(0, 0) + a(3, 0) * b(1, 0);
+  const Scalar _tmp11 = _tmp10 * _tmp7;
+  const Scalar _tmp12 = 2 * _tmp11;
+  const Scalar _tmp13 =
+      -a(0, 0) * b(1, 0) + a(1, 0) * b(0, 0) - a(2, 0) * b(3, 0) + a(3, 0) * b(2, 0);
+  const Scalar _tmp14 = _tmp13 * _tmp7;
+  const Scalar _tmp15 = 2 * _tmp14;
+  const Scalar _tmp16 = 2 * a(1, 0);
+  const Scalar _tmp17 = _tmp16 * a(0, 0);
+  const Scalar _tmp18 = 2 * a(2, 0);
+  const Scalar _tmp19 = _tmp18 * a(3, 0);
+  const Scalar _tmp20 = _tmp17 - _tmp19;
+  const Scalar _tmp21 = _tmp16 * a(2, 0);
+  const Scalar _tmp22 = 2 * a(0, 0) * a(3, 0);
+  const Scalar _tmp23 = _tmp21 + _tmp22;
+  const Scalar _tmp24 = -2 * std::pow(a(0, 0), Scalar(2));
+  const Scalar _tmp25 = 1 - 2 * std::pow(a(2, 0), Scalar(2));
+  const Scalar _tmp26 = _tmp24 + _tmp25;
+  const Scalar _tmp27 = -_tmp20 * a(4, 0) + _tmp20 * b(4, 0) - _tmp23 * a(6, 0) + _tmp23 * b(6, 0) -
+                        _tmp26 * a(5, 0) + _tmp26 * b(5, 0);
+  const Scalar _tmp28 = 4 * std::pow(_tmp5, Scalar(2)) * std::pow(_tmp6, Scalar(2)) / _tmp4;
+  const Scalar _tmp29 = std::pow(_tmp13, Scalar(2)) * _tmp28;
+  const Scalar _tmp30 = std::pow(_tmp0, Scalar(2)) * _tmp28;
+  const Scalar _tmp31 = std::pow(_tmp10, Scalar(2)) * _tmp28;
+  const Scalar _tmp32 = _tmp29 + _tmp30 + _tmp31 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp33 = std::sqrt(_tmp32);
+  const Scalar _tmp34 = Scalar(0.050000000000000003) - _tmp33;
+  const Scalar _tmp35 = std::max<Scalar>(0, (((_tmp34) > 0) - ((_tmp34) < 0)));
+  const Scalar _tmp36 = _tmp33 + _tmp34 * _tmp35;
+  const Scalar _tmp37 = std::pow(_tmp36, Scalar(2));
+  const Scalar _tmp38 = (Scalar(1) / Scalar(2)) * _tmp36;
+  const Scalar _tmp39 = (-_tmp38 * std::cos(_tmp38) / std::sin(_tmp38) + 1) / _tmp37;
+  const Scalar _tmp40 = Scalar(0.0013888888888888889) * _tmp32;
+  const Scalar _tmp41 = std::pow(_tmp32, Scalar(2));
+  const Scalar _tmp42 = _tmp35 * (-_tmp39 + _tmp40 + Scalar(3.3068783068783071e-5) * _tmp41 +
+                                  Scalar(0.083333333333333329)) +
+                        _tmp39;
+  const Scalar _tmp43 = _tmp10 * _tmp28;
+  const Scalar _tmp44 = _tmp0 * _tmp43;
+  const Scalar _tmp45 = _tmp42 * _tmp44;
+  const Scalar _tmp46 = _tmp14 + _tmp45;
+  const Scalar _tmp47 = -_tmp29 * _tmp42;
+  const Scalar _tmp48 = -_tmp31 * _tmp42;
+  const Scalar _tmp49 = _tmp47 + _tmp48 + 1;
+  const Scalar _tmp50 = _tmp18 * a(0, 0);
+  const Scalar _tmp51 = _tmp16 * a(3, 0);
+  const Scalar _tmp52 = _tmp50 - _tmp51;
+  const Scalar _tmp53 = _tmp17 + _tmp19;
+  const Scalar _tmp54 = -2 * std::pow(a(1, 0), Scalar(2));
+  const Scalar _tmp55 = _tmp25 + _tmp54;
+  const Scalar _tmp56 = -_tmp52 * a(6, 0) + _tmp52 * b(6, 0) - _tmp53 * a(5, 0) + _tmp53 * b(5, 0) -
+                        _tmp55 * a(4, 0) + _tmp55 * b(4, 0);
+  const Scalar _tmp57 = _tmp50 + _tmp51;
+  const Scalar _tmp58 = _tmp21 - _tmp22;
+  const Scalar _tmp59 = _tmp24 + _tmp54 + 1;
+  const Scalar _tmp60 = -_tmp57 * a(4, 0) + _tmp57 * b(4, 0) - _tmp58 * a(5, 0) + _tmp58 * b(5, 0) -
+                        _tmp59 * a(6, 0) + _tmp59 * b(6, 0);
+  const Scalar _tmp61 = _tmp0 * _tmp13 * _tmp28;
+  const Scalar _tmp62 = _tmp42 * _tmp61;
+  const Scalar _tmp63 = -_tmp11 + _tmp62;
+  const Scalar _tmp64 = _tmp27 * _tmp46 + _tmp49 * _tmp56 + _tmp60 * _tmp63;
+  const Scalar _tmp65 = _tmp13 * _tmp43;
+  const Scalar _tmp66 = _tmp42 * _tmp65;
+  const Scalar _tmp67 = _tmp66 + _tmp8;
+  const Scalar _tmp68 = -_tmp30 * _tmp42 + 1;
+  const Scalar _tmp69 = _tmp47 + _tmp68;
+  const Scalar _tmp70 = -_tmp14 + _tmp45;
+  const Scalar _tmp71 = _tmp27 * _tmp69 + _tmp56 * _tmp70 + _tmp60 * _tmp67;
+  const Scalar _tmp72 = _tmp66 - _tmp8;
+  const Scalar _tmp73 = _tmp48 + _tmp68;
+  const Scalar _tmp74 = _tmp11 + _tmp62;
+  const Scalar _tmp75 = _tmp27 * _tmp72 + _tmp56 * _tmp74 + _tmp60 * _tmp73;
+  const Scalar _tmp76 = -_tmp57 * a(7, 0) + _tmp57 * b(7, 0) - _tmp58 * a(8, 0) + _tmp58 * b(8, 0) -
+                        _tmp59 * a(9, 0) + _tmp59 * b(9, 0);
+  const Scalar _tmp77 = -_tmp52 * a(9, 0) + _tmp52 * b(9, 0) - _tmp53 * a(8, 0) + _tmp53 * b(8, 0) -
+                        _tmp55 * a(7, 0) + _tmp55 * b(7, 0);
+  const Scalar _tmp78 = -_tmp20 * a(7, 0) + _tmp20 * b(7, 0) - _tmp23 * a(9, 0) + _tmp23 * b(9, 0) -
+                        _tmp26 * a(8, 0) + _tmp26 * b(8, 0);
+  const Scalar _tmp79 = _tmp46 * _tmp78 + _tmp49 * _tmp77 + _tmp63 * _tmp76;
+  const Scalar _tmp80 = _tmp67 * _tmp76 + _tmp69 * _tmp78 + _tmp70 * _tmp77;
+  const Scalar _tmp81 = _tmp72 * _tmp78 + _tmp73 * _tmp76 + _tmp74 * _tmp77;
+  const Scalar _tmp82 = -_tmp49;
+  const Scalar _tmp83 = -_tmp70;
+  const Scalar _tmp84 = -_tmp74;
+  const Scalar _tmp85 = _tmp44 * _tmp64;
+  const Scalar _tmp86 = -_tmp12 * _tmp71;
+  const Scalar _tmp87 = -_tmp15 * _tmp75;
+  const Scalar _tmp88 = _tmp86 + _tmp87;
+  const Scalar _tmp89 = _tmp12 * _tmp88;
+  const Scalar _tmp90 = -_tmp85 + _tmp89;
+  const Scalar _tmp91 = _tmp15 * _tmp64 + _tmp75 * _tmp9;
+  const Scalar _tmp92 = std::sin(_tmp36);
+  const Scalar _tmp93 = (_tmp36 - _tmp92) / [&]() {
+    const Scalar base = _tmp36;
+    return base * base * base;
+  }();
+  const Scalar _tmp94 =
+      _tmp35 * (-Scalar(0.0083333333333333332) * _tmp32 + Scalar(0.00019841269841269841) * _tmp41 -
+                _tmp93 + Scalar(0.16666666666666666)) +
+      _tmp93;
+  const Scalar _tmp95 = (Scalar(1) / Scalar(2)) * _tmp71;
+  const Scalar _tmp96 = std::cos(_tmp36);
+  const Scalar _tmp97 =
+      (Scalar(1) / Scalar(2)) * (_tmp37 + 2 * _tmp96 - 2) / std::pow(_tmp36, Scalar(4));
+  const Scalar _tmp98 = _tmp35 * (-_tmp40 + Scalar(2.4801587301587302e-5) * _tmp41 - _tmp97 +
+                                  Scalar(0.041666666666666664)) +
+                        _tmp97;
+  const Scalar _tmp99 = -_tmp29;
+  const Scalar _tmp100 = -_tmp31;
+  const Scalar _tmp101 = _tmp100 + _tmp99;
+  const Scalar _tmp102 = _tmp101 * _tmp71;
+  const Scalar _tmp103 = _tmp30 * _tmp71;
+  const Scalar _tmp104 = _tmp15 * _tmp88;
+  const Scalar _tmp105 = _tmp61 * _tmp64;
+  const Scalar _tmp106 = -_tmp104 + _tmp105;
+  const Scalar _tmp107 = _tmp44 * _tmp71;
+  const Scalar _tmp108 = -_tmp64 * _tmp9;
+  const Scalar _tmp109 = _tmp108 + _tmp87;
+  const Scalar _tmp110 = _tmp109 * _tmp9;
+  const Scalar _tmp111 = _tmp107 - _tmp110;
+  const Scalar _tmp112 = (Scalar(1) / Scalar(2)) * (_tmp36 * _tmp96 + 2 * _tmp36 - 3 * _tmp92) /
+                         std::pow(_tmp36, Scalar(5));
+  const Scalar _tmp113 =
+      _tmp112 + _tmp35 * (-_tmp112 - Scalar(0.00039682539682539683) * _tmp32 +
+                          Scalar(8.2671957671957678e-6) * _tmp41 + Scalar(0.0083333333333333332));
+  const Scalar _tmp114 = _tmp113 * (-_tmp106 * _tmp9 - _tmp111 * _tmp15) +
+                         _tmp94 * (_tmp90 + _tmp91) + _tmp95 +
+                         _tmp98 * (_tmp102 - _tmp103 - 2 * _tmp90);
+  const Scalar _tmp115 = _tmp65 * _tmp71;
+  const Scalar _tmp116 = _tmp109 * _tmp15;
+  const Scalar _tmp117 = -_tmp115 + _tmp116;
+  const Scalar _tmp118 = (Scalar(1) / Scalar(2)) * _tmp64;
+  const Scalar _tmp119 = -_tmp118;
+  const Scalar _tmp120 = _tmp12 * _tmp75 + _tmp15 * _tmp71;
+  const Scalar _tmp121 = _tmp31 * _tmp64;
+  const Scalar _tmp122 = -_tmp30;
+  const Scalar _tmp123 = _tmp122 + _tmp99;
+  const Scalar _tmp124 = _tmp123 * _tmp64;
+  const Scalar _tmp125 = _tmp113 * (_tmp117 * _tmp12 + _tmp15 * _tmp90) + _tmp119 +
+                         _tmp94 * (_tmp111 + _tmp120) + _tmp98 * (-2 * _tmp111 + _tmp121 - _tmp124);
+  const Scalar _tmp126 = 4 * _tmp11;
+  const Scalar _tmp127 = -_tmp126 * _tmp71;
+  const Scalar _tmp128 = 4 * _tmp8;
+  const Scalar _tmp129 = -_tmp128 * _tmp64;
+  const Scalar _tmp130 = _tmp94 * (_tmp127 + _tmp129);
+  const Scalar _tmp131 = _tmp65 * _tmp75;
+  const Scalar _tmp132 = _tmp108 + _tmp86;
+  const Scalar _tmp133 = _tmp12 * _tmp132;
+  const Scalar _tmp134 = _tmp131 - _tmp133;
+  const Scalar _tmp135 = _tmp12 * _tmp134 - _tmp12 * _tmp90;
+  const Scalar _tmp136 = _tmp61 * _tmp75;
+  const Scalar _tmp137 = _tmp132 * _tmp9;
+  const Scalar _tmp138 = -_tmp136 + _tmp137;
+  const Scalar _tmp139 = _tmp111 * _tmp9 - _tmp138 * _tmp9;
+  const Scalar _tmp140 = _tmp113 * (_tmp135 + _tmp139) + _tmp130;
+  const Scalar _tmp141 = -_tmp114 * _tmp49 - _tmp125 * _tmp46 - _tmp140 * _tmp63;
+  const Scalar _tmp142 = _tmp12 * _tmp64 + _tmp71 * _tmp9;
+  const Scalar _tmp143 = (Scalar(1) / Scalar(2)) * _tmp75;
+  const Scalar _tmp144 = _tmp31 * _tmp75;
+  const Scalar _tmp145 = _tmp123 * _tmp75;
+  const Scalar _tmp146 = _tmp113 * (-_tmp111 * _tmp12 - _tmp134 * _tmp9) + _tmp143 +
+                         _tmp94 * (_tmp117 + _tmp142) + _tmp98 * (-2 * _tmp117 - _tmp144 + _tmp145);
+  const Scalar _tmp147 = _tmp106 * _tmp15 - _tmp117 * _tmp15;
+  const Scalar _tmp148 = 4 * _tmp14;
+  const Scalar _tmp149 = -_tmp148 * _tmp75;
+  const Scalar _tmp150 = _tmp94 * (_tmp127 + _tmp149);
+  const Scalar _tmp151 = _tmp113 * (_tmp135 + _tmp147) + _tmp150;
+  const Scalar _tmp152 = _tmp29 * _tmp71;
+  const Scalar _tmp153 = _tmp100 + _tmp122;
+  const Scalar _tmp154 = _tmp153 * _tmp71;
+  const Scalar _tmp155 = -_tmp95;
+  const Scalar _tmp156 = _tmp113 * (_tmp117 * _tmp9 + _tmp138 * _tmp15) + _tmp155 +
+                         _tmp94 * (_tmp134 + _tmp91) + _tmp98 * (-2 * _tmp134 + _tmp152 - _tmp154);
+  const Scalar _tmp157 = -_tmp146 * _tmp46 - _tmp151 * _tmp49 - _tmp156 * _tmp63;
+  const Scalar _tmp158 = _tmp30 * _tmp75;
+  const Scalar _tmp159 = _tmp101 * _tmp75;
+  const Scalar _tmp160 = -_tmp143;
+  const Scalar _tmp161 = _tmp113 * (_tmp12 * _tmp138 + _tmp9 * _tmp90) + _tmp160 +
+                         _tmp94 * (_tmp106 + _tmp142) + _tmp98 * (-2 * _tmp106 + _tmp158 - _tmp159);
+  const Scalar _tmp162 = _tmp29 * _tmp64;
+  const Scalar _tmp163 = _tmp153 * _tmp64;
+  const Scalar _tmp164 = _tmp113 * (-_tmp106 * _tmp12 - _tmp134 * _tmp15) + _tmp118 +
+                         _tmp94 * (_tmp120 + _tmp138) + _tmp98 * (-2 * _tmp138 - _tmp162 + _tmp163);
+  const Scalar _tmp165 = _tmp94 * (_tmp129 + _tmp149);
+  const Scalar _tmp166 = _tmp113 * (_tmp139 + _tmp147) + _tmp165;
+  const Scalar _tmp167 = -_tmp161 * _tmp49 - _tmp164 * _tmp63 - _tmp166 * _tmp46;
+  const Scalar _tmp168 = -_tmp161 * _tmp70 - _tmp164 * _tmp67 - _tmp166 * _tmp69;
+  const Scalar _tmp169 = -_tmp114 * _tmp70 - _tmp125 * _tmp69 - _tmp140 * _tmp67;
+  const Scalar _tmp170 = -_tmp146 * _tmp69 - _tmp151 * _tmp70 - _tmp156 * _tmp67;
+  const Scalar _tmp171 = -_tmp161 * _tmp74 - _tmp164 * _tmp73 - _tmp166 * _tmp72;
+  const Scalar _tmp172 = -_tmp146 * _tmp72 - _tmp151 * _tmp74 - _tmp156 * _tmp73;
+  const Scalar _tmp173 = -_tmp114 * _tmp74 - _tmp125 * _tmp72 - _tmp140 * _tmp73;
+  const Scalar _tmp174 = (Scalar(1) / Scalar(2)) * _tmp81;
+  const Scalar _tmp175 = -_tmp174;
+  const Scalar _tmp176 = _tmp101 * _tmp81;
+  const Scalar _tmp177 = _tmp30 * _tmp81;
+  const Scalar _tmp178 = _tmp61 * _tmp79;
+  const Scalar _tmp179 = -_tmp12 * _tmp80;
+  const Scalar _tmp180 = -_tmp15 * _tmp81;
+  const Scalar _tmp181 = _tmp179 + _tmp180;
+  const Scalar _tmp182 = _tmp15 * _tmp181;
+  const Scalar _tmp183 = _tmp178 - _tmp182;
+  const Scalar _tmp184 = -_tmp79 * _tmp9;
+  const Scalar _tmp185 = _tmp179 + _tmp184;
+  const Scalar _tmp186 = _tmp185 * _tmp9;
+  const Scalar _tmp187 = _tmp61 * _tmp81;
+  const Scalar _tmp188 = _tmp186 - _tmp187;
+  const Scalar _tmp189 = _tmp12 * _tmp181;
+  const Scalar _tmp190 = _tmp44 * _tmp79;
+  const Scalar _tmp191 = _tmp189 - _tmp190;
+  const Scalar _tmp192 = _tmp12 * _tmp79 + _tmp80 * _tmp9;
+  const Scalar _tmp193 = _tmp113 * (_tmp12 * _tmp188 + _tmp191 * _tmp9) + _tmp175 +
+                         _tmp94 * (_tmp183 + _tmp192) + _tmp98 * (-_tmp176 + _tmp177 - 2 * _tmp183);
+  const Scalar _tmp194 = (Scalar(1) / Scalar(2)) * _tmp79;
+  const Scalar _tmp195 = _tmp12 * _tmp81 + _tmp15 * _tmp80;
+  const Scalar _tmp196 = _tmp12 * _tmp185;
+  const Scalar _tmp197 = _tmp65 * _tmp81;
+  const Scalar _tmp198 = -_tmp196 + _tmp197;
+  const Scalar _tmp199 = _tmp29 * _tmp79;
+  const Scalar _tmp200 = _tmp153 * _tmp79;
+  const Scalar _tmp201 = _tmp113 * (-_tmp12 * _tmp183 - _tmp15 * _tmp198) + _tmp194 +
+                         _tmp94 * (_tmp188 + _tmp195) + _tmp98 * (-2 * _tmp188 - _tmp199 + _tmp200);
+  const Scalar _tmp202 = _tmp44 * _tmp80;
+  const Scalar _tmp203 = _tmp180 + _tmp184;
+  const Scalar _tmp204 = _tmp203 * _tmp9;
+  const Scalar _tmp205 = _tmp202 - _tmp204;
+  const Scalar _tmp206 = -_tmp188 * _tmp9 + _tmp205 * _tmp9;
+  const Scalar _tmp207 = _tmp15 * _tmp203;
+  const Scalar _tmp208 = _tmp65 * _tmp80;
+  const Scalar _tmp209 = _tmp207 - _tmp208;
+  const Scalar _tmp210 = _tmp15 * _tmp183 - _tmp15 * _tmp209;
+  const Scalar _tmp211 = -_tmp148 * _tmp81;
+  const Scalar _tmp212 = -_tmp128 * _tmp79;
+  const Scalar _tmp213 = _tmp94 * (_tmp211 + _tmp212);
+  const Scalar _tmp214 = _tmp113 * (_tmp206 + _tmp210) + _tmp213;
+  const Scalar _tmp215 = -_tmp193 * _tmp49 - _tmp201 * _tmp63 - _tmp214 * _tmp46;
+  const Scalar _tmp216 = _tmp123 * _tmp81;
+  const Scalar _tmp217 = _tmp31 * _tmp81;
+  const Scalar _tmp218 = _tmp113 * (-_tmp12 * _tmp205 - _tmp198 * _tmp9) + _tmp174 +
+                         _tmp94 * (_tmp192 + _tmp209) + _tmp98 * (-2 * _tmp209 + _tmp216 - _tmp217);
+  const Scalar _tmp219 = (Scalar(1) / Scalar(2)) * _tmp80;
+  const Scalar _tmp220 = -_tmp219;
+  const Scalar _tmp221 = _tmp153 * _tmp80;
+  const Scalar _tmp222 = _tmp29 * _tmp80;
+  const Scalar _tmp223 = _tmp15 * _tmp79 + _tmp81 * _tmp9;
+  const Scalar _tmp224 = _tmp113 * (_tmp15 * _tmp188 + _tmp209 * _tmp9) + _tmp220 +
+                         _tmp94 * (_tmp198 + _tmp223) + _tmp98 * (-2 * _tmp198 - _tmp221 + _tmp222);
+  const Scalar _tmp225 = -_tmp12 * _tmp191 + _tmp12 * _tmp198;
+  const Scalar _tmp226 = -_tmp126 * _tmp80;
+  const Scalar _tmp227 = _tmp94 * (_tmp211 + _tmp226);
+  const Scalar _tmp228 = _tmp113 * (_tmp210 + _tmp225) + _tmp227;
+  const Scalar _tmp229 = -_tmp218 * _tmp46 - _tmp224 * _tmp63 - _tmp228 * _tmp49;
+  const Scalar _tmp230 = -_tmp194;
+  const Scalar _tmp231 = _tmp31 * _tmp79;
+  const Scalar _tmp232 = _tmp123 * _tmp79;
+  const Scalar _tmp233 = _tmp113 * (_tmp12 * _tmp209 + _tmp15 * _tmp191) + _tmp230 +
+                         _tmp94 * (_tmp195 + _tmp205) + _tmp98 * (-2 * _tmp205 + _tmp231 - _tmp232);
+  const Scalar _tmp234 = _tmp94 * (_tmp212 + _tmp226);
+  const Scalar _tmp235 = _tmp113 * (_tmp206 + _tmp225) + _tmp234;
+  const Scalar _tmp236 = _tmp101 * _tmp80;
+  const Scalar _tmp237 = _tmp30 * _tmp80;
+  const Scalar _tmp238 = _tmp113 * (-_tmp15 * _tmp205 - _tmp183 * _tmp9) + _tmp219 +
+                         _tmp94 * (_tmp191 + _tmp223) + _tmp98 * (-2 * _tmp191 + _tmp236 - _tmp237);
+  const Scalar _tmp239 = -_tmp233 * _tmp46 - _tmp235 * _tmp63 - _tmp238 * _tmp49;
+  const Scalar _tmp240 = -_tmp193 * _tmp70 - _tmp201 * _tmp67 - _tmp214 * _tmp69;
+  const Scalar _tmp241 = -_tmp218 * _tmp69 - _tmp224 * _tmp67 - _tmp228 * _tmp70;
+  const Scalar _tmp242 = -_tmp233 * _tmp69 - _tmp235 * _tmp67 - _tmp238 * _tmp70;
+  const Scalar _tmp243 = -_tmp233 * _tmp72 - _tmp235 * _tmp73 - _tmp238 * _tmp74;
+  const Scalar _tmp244 = -_tmp218 * _tmp72 - _tmp224 * _tmp73 - _tmp228 * _tmp74;
+  const Scalar _tmp245 = -_tmp193 * _tmp74 - _tmp201 * _tmp73 - _tmp214 * _tmp72;
+  const Scalar _tmp246 = -_tmp46;
+  const Scalar _tmp247 = -_tmp69;
+  const Scalar _tmp248 = -_tmp72;
+  const Scalar _tmp249 = -_tmp63;
+  const Scalar _tmp250 = -_tmp67;
+  const Scalar _tmp251 = -_tmp73;
+  const Scalar _tmp252 = _tmp85 - _tmp89;
+  const Scalar _tmp253 = _tmp104 - _tmp105;
+  const Scalar _tmp254 = -_tmp107 + _tmp110;
+  const Scalar _tmp255 = _tmp113 * (_tmp15 * _tmp254 + _tmp253 * _tmp9) + _tmp155 +
+                         _tmp94 * (_tmp252 + _tmp91) + _tmp98 * (-_tmp102 + _tmp103 - 2 * _tmp252);
+  const Scalar _tmp256 = _tmp115 - _tmp116;
+  const Scalar _tmp257 = _tmp113 * (-_tmp12 * _tmp256 - _tmp15 * _tmp252) + _tmp118 +
+                         _tmp94 * (_tmp120 + _tmp254) + _tmp98 * (-_tmp121 + _tmp124 - 2 * _tmp254);
+  const Scalar _tmp258 = -_tmp131 + _tmp133;
+  const Scalar _tmp259 = _tmp12 * _tmp252 - _tmp12 * _tmp258;
+  const Scalar _tmp260 = _tmp136 - _tmp137;
+  const Scalar _tmp261 = -_tmp254 * _tmp9 + _tmp260 * _tmp9;
+  const Scalar _tmp262 = _tmp113 * (_tmp259 + _tmp261) + _tmp130;
+  const Scalar _tmp263 = -_tmp255 * _tmp49 - _tmp257 * _tmp70 - _tmp262 * _tmp74;
+  const Scalar _tmp264 = -_tmp15 * _tmp253 + _tmp15 * _tmp256;
+  const Scalar _tmp265 = _tmp113 * (_tmp261 + _tmp264) + _tmp165;
+  const Scalar _tmp266 = _tmp113 * (_tmp12 * _tmp253 + _tmp15 * _tmp258) + _tmp119 +
+                         _tmp94 * (_tmp120 + _tmp260) + _tmp98 * (_tmp162 - _tmp163 - 2 * _tmp260);
+  const Scalar _tmp267 = _tmp113 * (-_tmp12 * _tmp260 - _tmp252 * _tmp9) + _tmp143 +
+                         _tmp94 * (_tmp142 + _tmp253) + _tmp98 * (-_tmp158 + _tmp159 - 2 * _tmp253);
+  const Scalar _tmp268 = -_tmp265 * _tmp70 - _tmp266 * _tmp74 - _tmp267 * _tmp49;
+  const Scalar _tmp269 = _tmp113 * (_tmp259 + _tmp264) + _tmp150;
+  const Scalar _tmp270 = _tmp113 * (-_tmp15 * _tmp260 - _tmp256 * _tmp9) +
+                         _tmp94 * (_tmp258 + _tmp91) + _tmp95 +
+                         _tmp98 * (-_tmp152 + _tmp154 - 2 * _tmp258);
+  const Scalar _tmp271 = _tmp113 * (_tmp12 * _tmp254 + _tmp258 * _tmp9) + _tmp160 +
+                         _tmp94 * (_tmp142 + _tmp256) + _tmp98 * (_tmp144 - _tmp145 - 2 * _tmp256);
+  const Scalar _tmp272 = -_tmp269 * _tmp49 - _tmp270 * _tmp74 - _tmp271 * _tmp70;
+  const Scalar _tmp273 = -_tmp265 * _tmp69 - _tmp266 * _tmp72 - _tmp267 * _tmp46;
+  const Scalar _tmp274 = -_tmp255 * _tmp46 - _tmp257 * _tmp69 - _tmp262 * _tmp72;
+  const Scalar _tmp275 = -_tmp269 * _tmp46 - _tmp270 * _tmp72 - _tmp271 * _tmp69;
+  const Scalar _tmp276 = -_tmp265 * _tmp67 - _tmp266 * _tmp73 - _tmp267 * _tmp63;
+  const Scalar _tmp277 = -_tmp269 * _tmp63 - _tmp270 * _tmp73 - _tmp271 * _tmp67;
+  const Scalar _tmp278 = -_tmp255 * _tmp63 - _tmp257 * _tmp67 - _tmp262 * _tmp73;
+  const Scalar _tmp279 = -_tmp178 + _tmp182;
+  const Scalar _tmp280 = -_tmp186 + _tmp187;
+  const Scalar _tmp281 = -_tmp189 + _tmp190;
+  const Scalar _tmp282 = _tmp113 * (-_tmp12 * _tmp280 - _tmp281 * _tmp9) + _tmp174 +
+                         _tmp94 * (_tmp192 + _tmp279) + _tmp98 * (_tmp176 - _tmp177 - 2 * _tmp279);
+  const Scalar _tmp283 = -_tmp202 + _tmp204;
+  const Scalar _tmp284 = _tmp280 * _tmp9 - _tmp283 * _tmp9;
+  const Scalar _tmp285 = -_tmp207 + _tmp208;
+  const Scalar _tmp286 = -_tmp15 * _tmp279 + _tmp15 * _tmp285;
+  const Scalar _tmp287 = _tmp113 * (_tmp284 + _tmp286) + _tmp213;
+  const Scalar _tmp288 = _tmp196 - _tmp197;
+  const Scalar _tmp289 = _tmp113 * (_tmp12 * _tmp279 + _tmp15 * _tmp288) + _tmp230 +
+                         _tmp94 * (_tmp195 + _tmp280) + _tmp98 * (_tmp199 - _tmp200 - 2 * _tmp280);
+  const Scalar _tmp290 = -_tmp282 * _tmp49 - _tmp287 * _tmp70 - _tmp289 * _tmp74;
+  const Scalar _tmp291 = _tmp113 * (_tmp15 * _tmp283 + _tmp279 * _tmp9) + _tmp220 +
+                         _tmp94 * (_tmp223 + _tmp281) + _tmp98 * (-_tmp236 + _tmp237 - 2 * _tmp281);
+  const Scalar _tmp292 = _tmp113 * (-_tmp12 * _tmp285 - _tmp15 * _tmp281) + _tmp194 +
+                         _tmp94 * (_tmp195 + _tmp283) + _tmp98 * (-_tmp231 + _tmp232 - 2 * _tmp283);
+  const Scalar _tmp293 = _tmp12 * _tmp281 - _tmp12 * _tmp288;
+  const Scalar _tmp294 = _tmp113 * (_tmp284 + _tmp293) + _tmp234;
+  const Scalar _tmp295 = -_tmp291 * _tmp49 - _tmp292 * _tmp70 - _tmp294 * _tmp74;
+  const Scalar _tmp296 = _tmp113 * (_tmp12 * _tmp283 + _tmp288 * _tmp9) + _tmp175 +
+                         _tmp94 * (_tmp192 + _tmp285) + _tmp98 * (-_tmp216 + _tmp217 - 2 * _tmp285);
+  const Scalar _tmp297 = _tmp113 * (_tmp286 + _tmp293) + _tmp227;
+  const Scalar _tmp298 = _tmp113 * (-_tmp15 * _tmp280 - _tmp285 * _tmp9) + _tmp219 +
+                         _tmp94 * (_tmp223 + _tmp288) + _tmp98 * (_tmp221 - _tmp222 - 2 * _tmp288);
+  const Scalar _tmp299 = -_tmp296 * _tmp70 - _tmp297 * _tmp49 - _tmp298 * _tmp74;
+  const Scalar _tmp300 = -_tmp291 * _tmp46 - _tmp292 * _tmp69 - _tmp294 * _tmp72;
+  const Scalar _tmp301 = -_tmp282 * _tmp46 - _tmp287 * _tmp69 - _tmp289 * _tmp72;
+  const Scalar _tmp302 = -_tmp296 * _tmp69 - _tmp297 * _tmp46 - _tmp298 * _tmp72;
+  const Scalar _tmp303 = -_tmp282 * _tmp63 - _tmp287 * _tmp67 - _tmp289 * _tmp73;
+  const Scalar _tmp304 = -_tmp291 * _tmp63 - _tmp292 * _tmp67 - _tmp294 * _tmp73;
+  const Scalar _tmp305 = -_tmp296 * _tmp67 - _tmp297 * _tmp63 - _tmp298 * _tmp73;
+
+  // Output terms (3)
+  if (tangent != nullptr) {
+    Eigen::Matrix<Scalar, 9, 1>& _tangent = (*tangent);
+
+    _tangent(0, 0) = _tmp9;
+    _tangent(1, 0) = _tmp12;
+    _tangent(2, 0) = _tmp15;
+    _tangent(3, 0) = _tmp64;
+    _tangent(4, 0) = _tmp71;
+    _tangent(5, 0) = _tmp75;
+    _tangent(6, 0) = _tmp79;
+    _tangent(7, 0) = _tmp80;
+    _tangent(8, 0) = _tmp81;
+  }
+
+  if (D_a != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_a = (*D_a);
+
+    _D_a(0, 0) = _tmp82;
+    _D_a(1, 0) = _tmp83;
+    _D_a(2, 0) = _tmp84;
+    _D_a(3, 0) = -_tmp141 * _tmp74 - _tmp157 * _tmp49 - _tmp167 * _tmp70;
+    _D_a(4, 0) = -_tmp168 * _tmp70 - _tmp169 * _tmp74 - _tmp170 * _tmp49;
+    _D_a(5, 0) = -_tmp171 * _tmp70 - _tmp172 * _tmp49 - _tmp173 * _tmp74;
+    _D_a(6, 0) = -_tmp215 * _tmp70 - _tmp229 * _tmp49 - _tmp239 * _tmp74;
+    _D_a(7, 0) = -_tmp240 * _tmp70 - _tmp241 * _tmp49 - _tmp242 * _tmp74;
+    _D_a(8, 0) = -_tmp243 * _tmp74 - _tmp244 * _tmp49 - _tmp245 * _tmp70;
+    _D_a(0, 1) = _tmp246;
+    _D_a(1, 1) = _tmp247;
+    _D_a(2, 1) = _tmp248;
+    _D_a(3, 1) = -_tmp141 * _tmp72 - _tmp157 * _tmp46 - _tmp167 * _tmp69;
+    _D_a(4, 1) = -_tmp168 * _tmp69 - _tmp169 * _tmp72 - _tmp170 * _tmp46;
+    _D_a(5, 1) = -_tmp171 * _tmp69 - _tmp172 * _tmp46 - _tmp173 * _tmp72;
+    _D_a(6, 1) = -_tmp215 * _tmp69 - _tmp229 * _tmp46 - _tmp239 * _tmp72;
+    _D_a(7, 1) = -_tmp240 * _tmp69 - _tmp241 * _tmp46 - _tmp242 * _tmp72;
+    _D_a(8, 1) = -_tmp243 * _tmp72 - _tmp244 * _tmp46 - _tmp245 * _tmp69;
+    _D_a(0, 2) = _tmp249;
+    _D_a(1, 2) = _tmp250;
+    _D_a(2, 2) = _tmp251;
+    _D_a(3, 2) = -_tmp141 * _tmp73 - _tmp157 * _tmp63 - _tmp167 * _tmp67;
+    _D_a(4, 2) = -_tmp168 * _tmp67 - _tmp169 * _tmp73 - _tmp170 * _tmp63;
+    _D_a(5, 2) = -_tmp171 * _tmp67 - _tmp172 * _tmp63 - _tmp173 * _tmp73;
+    _D_a(6, 2) = -_tmp215 * _tmp67 - _tmp229 * _tmp63 - _tmp239 * _tmp73;
+    _D_a(7, 2) = -_tmp240 * _tmp67 - _tmp241 * _tmp63 - _tmp242 * _tmp73;
+    _D_a(8, 2) = -_tmp243 * _tmp73 - _tmp244 * _tmp63 - _tmp245 * _tmp67;
+    _D_a(0, 3) = 0;
+    _D_a(1, 3) = 0;
+    _D_a(2, 3) = 0;
+    _D_a(3, 3) = _tmp82;
+    _D_a(4, 3) = _tmp83;
+    _D_a(5, 3) = _tmp84;
+    _D_a(6, 3) = 0;
+    _D_a(7, 3) = 0;
+    _D_a(8, 3) = 0;
+    _D_a(0, 4) = 0;
+    _D_a(1, 4) = 0;
+    _D_a(2, 4) = 0;
+    _D_a(3, 4) = _tmp246;
+    _D_a(4, 4) = _tmp247;
+    _D_a(5, 4) = _tmp248;
+    _D_a(6, 4) = 0;
+    _D_a(7, 4) = 0;
+    _D_a(8, 4) = 0;
+    _D_a(0, 5) = 0;
+    _D_a(1, 5) = 0;
+    _D_a(2, 5) = 0;
+    _D_a(3, 5) = _tmp249;
+    _D_a(4, 5) = _tmp250;
+    _D_a(5, 5) = _tmp251;
+    _D_a(6, 5) = 0;
+    _D_a(7, 5) = 0;
+    _D_a(8, 5) = 0;
+    _D_a(0, 6) = 0;
+    _D_a(1, 6) = 0;
+    _D_a(2, 6) = 0;
+    _D_a(3, 6) = 0;
+    _D_a(4, 6) = 0;
+    _D_a(5, 6) = 0;
+    _D_a(6, 6) = _tmp82;
+    _D_a(7, 6) = _tmp83;
+    _D_a(8, 6) = _tmp84;
+    _D_a(0, 7) = 0;
+    _D_a(1, 7) = 0;
+    _D_a(2, 7) = 0;
+    _D_a(3, 7) = 0;
+    _D_a(4, 7) = 0;
+    _D_a(5, 7) = 0;
+    _D_a(6, 7) = _tmp246;
+    _D_a(7, 7) = _tmp247;
+    _D_a(8, 7) = _tmp248;
+    _D_a(0, 8) = 0;
+    _D_a(1, 8) = 0;
+    _D_a(2, 8) = 0;
+    _D_a(3, 8) = 0;
+    _D_a(4, 8) = 0;
+    _D_a(5, 8) = 0;
+    _D_a(6, 8) = _tmp249;
+    _D_a(7, 8) = _tmp250;
+    _D_a(8, 8) = _tmp251;
+  }
+
+  if (D_b != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_b = (*D_b);
+
+    _D_b(0, 0) = _tmp49;
+    _D_b(1, 0) = _tmp46;
+    _D_b(2, 0) = _tmp63;
+    _D_b(3, 0) = _tmp263 * _tmp63 + _tmp268 * _tmp46 + _tmp272 * _tmp49;
+    _D_b(4, 0) = _tmp273 * _tmp46 + _tmp274 * _tmp63 + _tmp275 * _tmp49;
+    _D_b(5, 0) = _tmp276 * _tmp46 + _tmp277 * _tmp49 + _tmp278 * _tmp63;
+    _D_b(6, 0) = _tmp290 * _tmp46 + _tmp295 * _tmp63 + _tmp299 * _tmp49;
+    _D_b(7, 0) = _tmp300 * _tmp63 + _tmp301 * _tmp46 + _tmp302 * _tmp49;
+    _D_b(8, 0) = _tmp303 * _tmp46 + _tmp304 * _tmp63 + _tmp305 * _tmp49;
+    _D_b(0, 1) = _tmp70;
+    _D_b(1, 1) = _tmp69;
+    _D_b(2, 1) = _tmp67;
+    _D_b(3, 1) = _tmp263 * _tmp67 + _tmp268 * _tmp69 + _tmp272 * _tmp70;
+    _D_b(4, 1) = _tmp273 * _tmp69 + _tmp274 * _tmp67 + _tmp275 * _tmp70;
+    _D_b(5, 1) = _tmp276 * _tmp69 + _tmp277 * _tmp70 + _tmp278 * _tmp67;
+    _D_b(6, 1) = _tmp290 * _tmp69 + _tmp295 * _tmp67 + _tmp299 * _tmp70;
+    _D_b(7, 1) = _tmp300 * _tmp67 + _tmp301 * _tmp69 + _tmp302 * _tmp70;
+    _D_b(8, 1) = _tmp303 * _tmp69 + _tmp304 * _tmp67 + _tmp305 * _tmp70;
+    _D_b(0, 2) = _tmp74;
+    _D_b(1, 2) = _tmp72;
+    _D_b(2, 2) = _tmp73;
+    _D_b(3, 2) = _tmp263 * _tmp73 + _tmp268 * _tmp72 + _tmp272 * _tmp74;
+    _D_b(4, 2) = _tmp273 * _tmp72 + _tmp274 * _tmp73 + _tmp275 * _tmp74;
+    _D_b(5, 2) = _tmp276 * _tmp72 + _tmp277 * _tmp74 + _tmp278 * _tmp73;
+    _D_b(6, 2) = _tmp290 * _tmp72 + _tmp295 * _tmp73 + _tmp299 * _tmp74;
+    _D_b(7, 2) = _tmp300 * _tmp73 + _tmp301 * _tmp72 + _tmp302 * _tmp74;
+    _D_b(8, 2) = _tmp303 * _tmp72 + _tmp304 * _tmp73 + _tmp305 * _tmp74;
+    _D_b(0, 3) = 0;
+    _D_b(1, 3) = 0;
+    _D_b(2, 3) = 0;
+    _D_b(3, 3) = _tmp49;
+    _D_b(4, 3) = _tmp46;
+    _D_b(5, 3) = _tmp63;
+    _D_b(6, 3) = 0;
+    _D_b(7, 3) = 0;
+    _D_b(8, 3) = 0;
+    _D_b(0, 4) = 0;
+    _D_b(1, 4) = 0;
+    _D_b(2, 4) = 0;
+    _D_b(3, 4) = _tmp70;
+    _D_b(4, 4) = _tmp69;
+    _D_b(5, 4) = _tmp67;
+    _D_b(6, 4) = 0;
+    _D_b(7, 4) = 0;
+    _D_b(8, 4) = 0;
+    _D_b(0, 5) = 0;
+    _D_b(1, 5) = 0;
+    _D_b(2, 5) = 0;
+    _D_b(3, 5) = _tmp74;
+    _D_b(4, 5) = _tmp72;
+    _D_b(5, 5) = _tmp73;
+    _D_b(6, 5) = 0;
+    _D_b(7, 5) = 0;
+    _D_b(8, 5) = 0;
+    _D_b(0, 6) = 0;
+    _D_b(1, 6) = 0;
+    _D_b(2, 6) = 0;
+    _D_b(3, 6) = 0;
+    _D_b(4, 6) = 0;
+    _D_b(5, 6) = 0;
+    _D_b(6, 6) = _tmp49;
+    _D_b(7, 6) = _tmp46;
+    _D_b(8, 6) = _tmp63;
+    _D_b(0, 7) = 0;
+    _D_b(1, 7) = 0;
+    _D_b(2, 7) = 0;
+    _D_b(3, 7) = 0;
+    _D_b(4, 7) = 0;
+    _D_b(5, 7) = 0;
+    _D_b(6, 7) = _tmp70;
+    _D_b(7, 7) = _tmp69;
+    _D_b(8, 7) = _tmp67;
+    _D_b(0, 8) = 0;
+    _D_b(1, 8) = 0;
+    _D_b(2, 8) = 0;
+    _D_b(3, 8) = 0;
+    _D_b(4, 8) = 0;
+    _D_b(5, 8) = 0;
+    _D_b(6, 8) = _tmp74;
+    _D_b(7, 8) = _tmp72;
+    _D_b(8, 8) = _tmp73;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -0,0 +1,429 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     a: Matrix10_1
+ *     vec: Matrix91
+ *
+ * Outputs:
+ *     pose: Matrix10_1
+ *     D_a: Matrix99
+ *     D_b: Matrix99
+ */
+template <typename Scalar>
+void Pose23Retract(const Eigen::Matrix<Scalar, 10, 1>& a, const Eigen::Matrix<Scalar, 9, 1>& vec,
+                   Eigen::Matrix<Scalar, 10, 1>* const pose = nullptr,
+                   Eigen::Matrix<Scalar, 9, 9>* const D_a = nullptr,
+                   Eigen::Matrix<Scalar, 9, 9>* const D_b = nullptr) {
+  // Total ops: 657
+
+  // Input arrays
+
+  // Intermediate terms (165)
+  const Scalar _tmp0 = std::pow(vec(2, 0), Scalar(2));
+  const Scalar _tmp1 = std::pow(vec(1, 0), Scalar(2));
+  const Scalar _tmp2 = std::pow(vec(0, 0), Scalar(2));
+  const Scalar _tmp3 = _tmp0 + _tmp1 + _tmp2 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp4 = std::sqrt(_tmp3);
+  const Scalar _tmp5 = (Scalar(1) / Scalar(2)) * _tmp4;
+  const Scalar _tmp6 = std::cos(_tmp5);
+  const Scalar _tmp7 = std::sin(_tmp5);
+  const Scalar _tmp8 = _tmp7 / _tmp4;
+  const Scalar _tmp9 = _tmp8 * vec(1, 0);
+  const Scalar _tmp10 = _tmp8 * vec(2, 0);
+  const Scalar _tmp11 = _tmp8 * vec(0, 0);
+  const Scalar _tmp12 = -2 * std::pow(a(1, 0), Scalar(2));
+  const Scalar _tmp13 = 1 - 2 * std::pow(a(2, 0), Scalar(2));
+  const Scalar _tmp14 = _tmp12 + _tmp13;
+  const Scalar _tmp15 = Scalar(0.050000000000000003) - _tmp4;
+  const Scalar _tmp16 = std::max<Scalar>(0, (((_tmp15) > 0) - ((_tmp15) < 0)));
+  const Scalar _tmp17 = std::pow(_tmp3, Scalar(2));
+  const Scalar _tmp18 = _tmp15 * _tmp16 + _tmp4;
+  const Scalar _tmp19 = std::pow(_tmp18, Scalar(2));
+  const Scalar _tmp20 = std::cos(_tmp18);
+  const Scalar _tmp21 = (1 - _tmp20) / _tmp19;
+  const Scalar _tmp22 = _tmp16 * (Scalar(0.0013888888888888889) * _tmp17 - _tmp21 -
+                                  Scalar(0.041666666666666664) * _tmp3 + Scalar(0.5)) +
+                        _tmp21;
+  const Scalar _tmp23 = _tmp22 * vec(2, 0);
+  const Scalar _tmp24 = std::sin(_tmp18);
+  const Scalar _tmp25 = (_tmp18 - _tmp24) / [&]() {
+    const Scalar base = _tmp18;
+    return base * base * base;
+  }();
+  const Scalar _tmp26 =
+      _tmp16 * (Scalar(0.00019841269841269841) * _tmp17 - _tmp25 -
+                Scalar(0.0083333333333333332) * _tmp3 + Scalar(0.16666666666666666)) +
+      _tmp25;
+  const Scalar _tmp27 = _tmp26 * vec(1, 0);
+  const Scalar _tmp28 = _tmp27 * vec(0, 0);
+  const Scalar _tmp29 = -_tmp23 + _tmp28;
+  const Scalar _tmp30 = _tmp22 * vec(1, 0);
+  const Scalar _tmp31 = vec(0, 0) * vec(2, 0);
+  const Scalar _tmp32 = _tmp26 * _tmp31;
+  const Scalar _tmp33 = _tmp30 + _tmp32;
+  const Scalar _tmp34 = -_tmp1 * _tmp26;
+  const Scalar _tmp35 = -_tmp0 * _tmp26;
+  const Scalar _tmp36 = _tmp34 + _tmp35 + 1;
+  const Scalar _tmp37 = _tmp29 * vec(4, 0) + _tmp33 * vec(5, 0) + _tmp36 * vec(3, 0);
+  const Scalar _tmp38 = 2 * a(2, 0);
+  const Scalar _tmp39 = _tmp38 * a(0, 0);
+  const Scalar _tmp40 = 2 * a(1, 0);
+  const Scalar _tmp41 = _tmp40 * a(3, 0);
+  const Scalar _tmp42 = _tmp39 + _tmp41;
+  const Scalar _tmp43 = _tmp22 * vec(0, 0);
+  const Scalar _tmp44 = _tmp27 * vec(2, 0);
+  const Scalar _tmp45 = _tmp43 + _tmp44;
+  const Scalar _tmp46 = -_tmp30 + _tmp32;
+  const Scalar _tmp47 = -_tmp2 * _tmp26 + 1;
+  const Scalar _tmp48 = _tmp34 + _tmp47;
+  const Scalar _tmp49 = _tmp45 * vec(4, 0) + _tmp46 * vec(3, 0) + _tmp48 * vec(5, 0);
+  const Scalar _tmp50 = _tmp40 * a(0, 0);
+  const Scalar _tmp51 = _tmp38 * a(3, 0);
+  const Scalar _tmp52 = _tmp50 - _tmp51;
+  const Scalar _tmp53 = _tmp23 + _tmp28;
+  const Scalar _tmp54 = -_tmp43 + _tmp44;
+  const Scalar _tmp55 = _tmp35 + _tmp47;
+  const Scalar _tmp56 = _tmp53 * vec(3, 0) + _tmp54 * vec(5, 0) + _tmp55 * vec(4, 0);
+  const Scalar _tmp57 = _tmp50 + _tmp51;
+  const Scalar _tmp58 = _tmp38 * a(1, 0);
+  const Scalar _tmp59 = 2 * a(0, 0) * a(3, 0);
+  const Scalar _tmp60 = _tmp58 - _tmp59;
+  const Scalar _tmp61 = -2 * std::pow(a(0, 0), Scalar(2));
+  const Scalar _tmp62 = _tmp13 + _tmp61;
+  const Scalar _tmp63 = _tmp39 - _tmp41;
+  const Scalar _tmp64 = _tmp12 + _tmp61 + 1;
+  const Scalar _tmp65 = _tmp58 + _tmp59;
+  const Scalar _tmp66 = _tmp29 * vec(7, 0) + _tmp33 * vec(8, 0) + _tmp36 * vec(6, 0);
+  const Scalar _tmp67 = _tmp45 * vec(7, 0) + _tmp46 * vec(6, 0) + _tmp48 * vec(8, 0);
+  const Scalar _tmp68 = _tmp53 * vec(6, 0) + _tmp54 * vec(8, 0) + _tmp55 * vec(7, 0);
+  const Scalar _tmp69 = 2 * std::pow(_tmp7, Scalar(2)) / _tmp3;
+  const Scalar _tmp70 = -_tmp1 * _tmp69;
+  const Scalar _tmp71 = -_tmp0 * _tmp69 + 1;
+  const Scalar _tmp72 = _tmp70 + _tmp71;
+  const Scalar _tmp73 = 2 * _tmp6;
+  const Scalar _tmp74 = _tmp10 * _tmp73;
+  const Scalar _tmp75 = _tmp69 * vec(1, 0);
+  const Scalar _tmp76 = _tmp75 * vec(0, 0);
+  const Scalar _tmp77 = -_tmp74 + _tmp76;
+  const Scalar _tmp78 = _tmp73 * _tmp9;
+  const Scalar _tmp79 = _tmp31 * _tmp69;
+  const Scalar _tmp80 = _tmp78 + _tmp79;
+  const Scalar _tmp81 = -_tmp2 * _tmp69;
+  const Scalar _tmp82 = _tmp70 + _tmp81 + 1;
+  const Scalar _tmp83 = _tmp11 * _tmp73;
+  const Scalar _tmp84 = _tmp75 * vec(2, 0);
+  const Scalar _tmp85 = -_tmp83 + _tmp84;
+  const Scalar _tmp86 = _tmp37 * _tmp80 + _tmp49 * _tmp82 + _tmp56 * _tmp85;
+  const Scalar _tmp87 = _tmp83 + _tmp84;
+  const Scalar _tmp88 = _tmp71 + _tmp81;
+  const Scalar _tmp89 = _tmp37 * _tmp77 + _tmp49 * _tmp87 + _tmp56 * _tmp88;
+  const Scalar _tmp90 = -_tmp78 + _tmp79;
+  const Scalar _tmp91 = _tmp74 + _tmp76;
+  const Scalar _tmp92 = _tmp37 * _tmp72 + _tmp49 * _tmp90 + _tmp56 * _tmp91;
+  const Scalar _tmp93 = _tmp66 * _tmp80 + _tmp67 * _tmp82 + _tmp68 * _tmp85;
+  const Scalar _tmp94 = _tmp66 * _tmp77 + _tmp67 * _tmp87 + _tmp68 * _tmp88;
+  const Scalar _tmp95 = _tmp66 * _tmp72 + _tmp67 * _tmp90 + _tmp68 * _tmp91;
+  const Scalar _tmp96 = vec(1, 0) * vec(4, 0);
+  const Scalar _tmp97 = -2 * _tmp96;
+  const Scalar _tmp98 = vec(2, 0) * vec(5, 0);
+  const Scalar _tmp99 = -2 * _tmp98;
+  const Scalar _tmp100 = (Scalar(1) / Scalar(2)) * (_tmp18 * _tmp20 + 2 * _tmp18 - 3 * _tmp24) /
+                         std::pow(_tmp18, Scalar(5));
+  const Scalar _tmp101 =
+      _tmp100 + _tmp16 * (-_tmp100 + Scalar(8.2671957671957678e-6) * _tmp17 -
+                          Scalar(0.00039682539682539683) * _tmp3 + Scalar(0.0083333333333333332));
+  const Scalar _tmp102 = vec(1, 0) * vec(5, 0);
+  const Scalar _tmp103 = vec(0, 0) * vec(3, 0);
+  const Scalar _tmp104 = -_tmp103;
+  const Scalar _tmp105 = -_tmp96;
+  const Scalar _tmp106 = _tmp104 + _tmp105;
+  const Scalar _tmp107 = -_tmp102 * vec(2, 0) + _tmp106 * vec(1, 0);
+  const Scalar _tmp108 = vec(1, 0) * vec(3, 0);
+  const Scalar _tmp109 = -_tmp98;
+  const Scalar _tmp110 = _tmp105 + _tmp109;
+  const Scalar _tmp111 = _tmp108 * vec(0, 0) - _tmp110 * vec(1, 0);
+  const Scalar _tmp112 = -_tmp107 * vec(1, 0) + _tmp111 * vec(1, 0);
+  const Scalar _tmp113 = _tmp104 + _tmp109;
+  const Scalar _tmp114 = -_tmp113 * vec(2, 0) + _tmp96 * vec(2, 0);
+  const Scalar _tmp115 = -_tmp103 * vec(2, 0) + _tmp110 * vec(2, 0);
+  const Scalar _tmp116 = _tmp114 * vec(2, 0) - _tmp115 * vec(2, 0);
+  const Scalar _tmp117 =
+      (Scalar(1) / Scalar(2)) * (_tmp19 + 2 * _tmp20 - 2) / std::pow(_tmp18, Scalar(4));
+  const Scalar _tmp118 =
+      _tmp117 + _tmp16 * (-_tmp117 + Scalar(2.4801587301587302e-5) * _tmp17 -
+                          Scalar(0.0013888888888888889) * _tmp3 + Scalar(0.041666666666666664));
+  const Scalar _tmp119 = -_tmp0;
+  const Scalar _tmp120 = -_tmp2;
+  const Scalar _tmp121 = _tmp119 + _tmp120;
+  const Scalar _tmp122 = (Scalar(1) / Scalar(2)) * vec(5, 0);
+  const Scalar _tmp123 = _tmp113 * vec(0, 0) - _tmp96 * vec(0, 0);
+  const Scalar _tmp124 = _tmp108 + vec(0, 0) * vec(4, 0);
+  const Scalar _tmp125 = (Scalar(1) / Scalar(2)) * vec(4, 0);
+  const Scalar _tmp126 = -_tmp1;
+  const Scalar _tmp127 = _tmp120 + _tmp126;
+  const Scalar _tmp128 = vec(0, 0) * vec(5, 0) + vec(2, 0) * vec(3, 0);
+  const Scalar _tmp129 = -_tmp106 * vec(0, 0) + _tmp98 * vec(0, 0);
+  const Scalar _tmp130 = vec(1, 0) * vec(7, 0);
+  const Scalar _tmp131 = -2 * _tmp130;
+  const Scalar _tmp132 = vec(2, 0) * vec(8, 0);
+  const Scalar _tmp133 = -2 * _tmp132;
+  const Scalar _tmp134 = vec(2, 0) * vec(7, 0);
+  const Scalar _tmp135 = vec(0, 0) * vec(6, 0);
+  const Scalar _tmp136 = -_tmp135;
+  const Scalar _tmp137 = -_tmp132;
+  const Scalar _tmp138 = _tmp136 + _tmp137;
+  const Scalar _tmp139 = _tmp134 * vec(1, 0) - _tmp138 * vec(2, 0);
+  const Scalar _tmp140 = vec(2, 0) * vec(6, 0);
+  const Scalar _tmp141 = -_tmp130;
+  const Scalar _tmp142 = _tmp137 + _tmp141;
+  const Scalar _tmp143 = -_tmp140 * vec(0, 0) + _tmp142 * vec(2, 0);
+  const Scalar _tmp144 = _tmp139 * vec(2, 0) - _tmp143 * vec(2, 0);
+  const Scalar _tmp145 = _tmp136 + _tmp141;
+  const Scalar _tmp146 = -_tmp132 * vec(1, 0) + _tmp145 * vec(1, 0);
+  const Scalar _tmp147 = vec(1, 0) * vec(6, 0);
+  const Scalar _tmp148 = -_tmp142 * vec(1, 0) + _tmp147 * vec(0, 0);
+  const Scalar _tmp149 = -_tmp146 * vec(1, 0) + _tmp148 * vec(1, 0);
+  const Scalar _tmp150 = (Scalar(1) / Scalar(2)) * vec(8, 0);
+  const Scalar _tmp151 = -_tmp130 * vec(0, 0) + _tmp138 * vec(0, 0);
+  const Scalar _tmp152 = _tmp147 + vec(0, 0) * vec(7, 0);
+  const Scalar _tmp153 = (Scalar(1) / Scalar(2)) * vec(7, 0);
+  const Scalar _tmp154 = _tmp132 * vec(0, 0) - _tmp145 * vec(0, 0);
+  const Scalar _tmp155 = _tmp140 + vec(0, 0) * vec(8, 0);
+  const Scalar _tmp156 = _tmp119 + _tmp126;
+  const Scalar _tmp157 = -2 * _tmp103;
+  const Scalar _tmp158 = -_tmp123 * vec(0, 0) + _tmp129 * vec(0, 0);
+  const Scalar _tmp159 = (Scalar(1) / Scalar(2)) * vec(3, 0);
+  const Scalar _tmp160 = _tmp102 + vec(2, 0) * vec(4, 0);
+  const Scalar _tmp161 = -2 * _tmp135;
+  const Scalar _tmp162 = -_tmp151 * vec(0, 0) + _tmp154 * vec(0, 0);
+  const Scalar _tmp163 = (Scalar(1) / Scalar(2)) * vec(6, 0);
+  const Scalar _tmp164 = _tmp134 + vec(1, 0) * vec(8, 0);
+
+  // Output terms (3)
+  if (pose != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _pose = (*pose);
+
+    _pose(0, 0) = _tmp10 * a(1, 0) + _tmp11 * a(3, 0) + _tmp6 * a(0, 0) - _tmp9 * a(2, 0);
+    _pose(1, 0) = -_tmp10 * a(0, 0) + _tmp11 * a(2, 0) + _tmp6 * a(1, 0) + _tmp9 * a(3, 0);
+    _pose(2, 0) = _tmp10 * a(3, 0) - _tmp11 * a(1, 0) + _tmp6 * a(2, 0) + _tmp9 * a(0, 0);
+    _pose(3, 0) = -_tmp10 * a(2, 0) - _tmp11 * a(0, 0) + _tmp6 * a(3, 0) - _tmp9 * a(1, 0);
+    _pose(4, 0) = _tmp14 * _tmp37 + _tmp42 * _tmp49 + _tmp52 * _tmp56 + a(4, 0);
+    _pose(5, 0) = _tmp37 * _tmp57 + _tmp49 * _tmp60 + _tmp56 * _tmp62 + a(5, 0);
+    _pose(6, 0) = _tmp37 * _tmp63 + _tmp49 * _tmp64 + _tmp56 * _tmp65 + a(6, 0);
+    _pose(7, 0) = _tmp14 * _tmp66 + _tmp42 * _tmp67 + _tmp52 * _tmp68 + a(7, 0);
+    _pose(8, 0) = _tmp57 * _tmp66 + _tmp60 * _tmp67 + _tmp62 * _tmp68 + a(8, 0);
+    _pose(9, 0) = _tmp63 * _tmp66 + _tmp64 * _tmp67 + _tmp65 * _tmp68 + a(9, 0);
+  }
+
+  if (D_a != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_a = (*D_a);
+
+    _D_a(0, 0) = _tmp72;
+    _D_a(1, 0) = _tmp77;
+    _D_a(2, 0) = _tmp80;
+    _D_a(3, 0) = _tmp77 * _tmp86 - _tmp80 * _tmp89;
+    _D_a(4, 0) = -_tmp72 * _tmp86 + _tmp80 * _tmp92;
+    _D_a(5, 0) = _tmp72 * _tmp89 - _tmp77 * _tmp92;
+    _D_a(6, 0) = _tmp77 * _tmp93 - _tmp80 * _tmp94;
+    _D_a(7, 0) = -_tmp72 * _tmp93 + _tmp80 * _tmp95;
+    _D_a(8, 0) = _tmp72 * _tmp94 - _tmp77 * _tmp95;
+    _D_a(0, 1) = _tmp91;
+    _D_a(1, 1) = _tmp88;
+    _D_a(2, 1) = _tmp85;
+    _D_a(3, 1) = -_tmp85 * _tmp89 + _tmp86 * _tmp88;
+    _D_a(4, 1) = _tmp85 * _tmp92 - _tmp86 * _tmp91;
+    _D_a(5, 1) = -_tmp88 * _tmp92 + _tmp89 * _tmp91;
+    _D_a(6, 1) = -_tmp85 * _tmp94 + _tmp88 * _tmp93;
+    _D_a(7, 1) = _tmp85 * _tmp95 - _tmp91 * _tmp93;
+    _D_a(8, 1) = -_tmp88 * _tmp95 + _tmp91 * _tmp94;
+    _D_a(0, 2) = _tmp90;
+    _D_a(1, 2) = _tmp87;
+    _D_a(2, 2) = _tmp82;
+    _D_a(3, 2) = -_tmp82 * _tmp89 + _tmp86 * _tmp87;
+    _D_a(4, 2) = _tmp82 * _tmp92 - _tmp86 * _tmp90;
+    _D_a(5, 2) = -_tmp87 * _tmp92 + _tmp89 * _tmp90;
+    _D_a(6, 2) = -_tmp82 * _tmp94 + _tmp87 * _tmp93;
+    _D_a(7, 2) = _tmp82 * _tmp95 - _tmp90 * _tmp93;
+    _D_a(8, 2) = -_tmp87 * _tmp95 + _tmp90 * _tmp94;
+    _D_a(0, 3) = 0;
+    _D_a(1, 3) = 0;
+    _D_a(2, 3) = 0;
+    _D_a(3, 3) = _tmp72;
+    _D_a(4, 3) = _tmp77;
+    _D_a(5, 3) = _tmp80;
+    _D_a(6, 3) = 0;
+    _D_a(7, 3) = 0;
+    _D_a(8, 3) = 0;
+    _D_a(0, 4) = 0;
+    _D_a(1, 4) = 0;
+    _D_a(2, 4) = 0;
+    _D_a(3, 4) = _tmp91;
+    _D_a(4, 4) = _tmp88;
+    _D_a(5, 4) = _tmp85;
+    _D_a(6, 4) = 0;
+    _D_a(7, 4) = 0;
+    _D_a(8, 4) = 0;
+    _D_a(0, 5) = 0;
+    _D_a(1, 5) = 0;
+    _D_a(2, 5) = 0;
+    _D_a(3, 5) = _tmp90;
+    _D_a(4, 5) = _tmp87;
+    _D_a(5, 5) = _tmp82;
+    _D_a(6, 5) = 0;
+    _D_a(7, 5) = 0;
+    _D_a(8, 5) = 0;
+    _D_a(0, 6) = 0;
+    _D_a(1, 6) = 0;
+    _D_a(2, 6) = 0;
+    _D_a(3, 6) = 0;
+    _D_a(4, 6) = 0;
+    _D_a(5, 6) = 0;
+    _D_a(6, 6) = _tmp72;
+    _D_a(7, 6) = _tmp77;
+    _D_a(8, 6) = _tmp80;
+    _D_a(0, 7) = 0;
+    _D_a(1, 7) = 0;
+    _D_a(2, 7) = 0;
+    _D_a(3, 7) = 0;
+    _D_a(4, 7) = 0;
+    _D_a(5, 7) = 0;
+    _D_a(6, 7) = _tmp91;
+    _D_a(7, 7) = _tmp88;
+    _D_a(8, 7) = _tmp85;
+    _D_a(0, 8) = 0;
+    _D_a(1, 8) = 0;
+    _D_a(2, 8) = 0;
+    _D_a(3, 8) = 0;
+    _D_a(4, 8) = 0;
+    _D_a(5, 8) = 0;
+    _D_a(6, 8) = _tmp90;
+    _D_a(7, 8) = _tmp87;
+    _D_a(8, 8) = _tmp82;
+  }
+
+  if (D_b != nullptr) {
+    Eigen::Matrix<Scalar, 9, 9>& _D_b = (*D_b);
+
+    _D_b(0, 0) = _tmp36;
+    _D_b(1, 0) = _tmp29;
+    _D_b(2, 0) = _tmp33;
+    _D_b(3, 0) = _tmp101 * (_tmp112 + _tmp116) + _tmp26 * (_tmp97 + _tmp99);
+    _D_b(4, 0) = _tmp101 * (_tmp107 * vec(0, 0) + _tmp123 * vec(1, 0)) +
+                 _tmp118 * (_tmp1 * vec(5, 0) - 2 * _tmp114 - _tmp121 * vec(5, 0)) - _tmp122 +
+                 _tmp26 * (_tmp114 + _tmp124);
+    _D_b(5, 0) = _tmp101 * (-_tmp114 * vec(0, 0) - _tmp129 * vec(2, 0)) +
+                 _tmp118 * (-_tmp0 * vec(4, 0) - 2 * _tmp107 + _tmp127 * vec(4, 0)) + _tmp125 +
+                 _tmp26 * (_tmp107 + _tmp128);
+    _D_b(6, 0) = _tmp101 * (_tmp144 + _tmp149) + _tmp26 * (_tmp131 + _tmp133);
+    _D_b(7, 0) = _tmp101 * (_tmp146 * vec(0, 0) + _tmp151 * vec(1, 0)) +
+                 _tmp118 * (_tmp1 * vec(8, 0) - _tmp121 * vec(8, 0) - 2 * _tmp139) - _tmp150 +
+                 _tmp26 * (_tmp139 + _tmp152);
+    _D_b(8, 0) = _tmp101 * (-_tmp139 * vec(0, 0) - _tmp154 * vec(2, 0)) +
+                 _tmp118 * (-_tmp0 * vec(7, 0) + _tmp127 * vec(7, 0) - 2 * _tmp146) + _tmp153 +
+                 _tmp26 * (_tmp146 + _tmp155);
+    _D_b(0, 1) = _tmp53;
+    _D_b(1, 1) = _tmp55;
+    _D_b(2, 1) = _tmp54;
+    _D_b(3, 1) = _tmp101 * (-_tmp111 * vec(0, 0) - _tmp129 * vec(1, 0)) +
+                 _tmp118 * (-2 * _tmp115 + _tmp156 * vec(5, 0) - _tmp2 * vec(5, 0)) + _tmp122 +
+                 _tmp26 * (_tmp115 + _tmp124);
+    _D_b(4, 1) = _tmp101 * (_tmp116 + _tmp158) + _tmp26 * (_tmp157 + _tmp99);
+    _D_b(5, 1) = _tmp101 * (_tmp107 * vec(2, 0) + _tmp115 * vec(1, 0)) +
+                 _tmp118 * (_tmp0 * vec(3, 0) - _tmp127 * vec(3, 0) - 2 * _tmp129) - _tmp159 +
+                 _tmp26 * (_tmp129 + _tmp160);
+    _D_b(6, 1) = _tmp101 * (-_tmp148 * vec(0, 0) - _tmp154 * vec(1, 0)) +
+                 _tmp118 * (-2 * _tmp143 + _tmp156 * vec(8, 0) - _tmp2 * vec(8, 0)) + _tmp150 +
+                 _tmp26 * (_tmp143 + _tmp152);
+    _D_b(7, 1) = _tmp101 * (_tmp144 + _tmp162) + _tmp26 * (_tmp133 + _tmp161);
+    _D_b(8, 1) = _tmp101 * (_tmp143 * vec(1, 0) + _tmp146 * vec(2, 0)) +
+                 _tmp118 * (_tmp0 * vec(6, 0) - _tmp127 * vec(6, 0) - 2 * _tmp154) - _tmp163 +
+                 _tmp26 * (_tmp154 + _tmp164);
+    _D_b(0, 2) = _tmp46;
+    _D_b(1, 2) = _tmp45;
+    _D_b(2, 2) = _tmp48;
+    _D_b(3, 2) = _tmp101 * (_tmp115 * vec(0, 0) + _tmp123 * vec(2, 0)) +
+                 _tmp118 * (-2 * _tmp111 - _tmp156 * vec(4, 0) + _tmp2 * vec(4, 0)) - _tmp125 +
+                 _tmp26 * (_tmp111 + _tmp128);
+    _D_b(4, 2) = _tmp101 * (-_tmp111 * vec(2, 0) - _tmp114 * vec(1, 0)) +
+                 _tmp118 * (-_tmp1 * vec(3, 0) + _tmp121 * vec(3, 0) - 2 * _tmp123) + _tmp159 +
+                 _tmp26 * (_tmp123 + _tmp160);
+    _D_b(5, 2) = _tmp101 * (_tmp112 + _tmp158) + _tmp26 * (_tmp157 + _tmp97);
+    _D_b(6, 2) = _tmp101 * (_tmp143 * vec(0, 0) + _tmp151 * vec(2, 0)) +
+                 _tmp118 * (-2 * _tmp148 - _tmp156 * vec(7, 0) + _tmp2 * vec(7, 0)) - _tmp153 +
+                 _tmp26 * (_tmp148 + _tmp155);
+    _D_b(7, 2) = _tmp101 * (-_tmp139 * vec(1, 0) - _tmp148 * vec(2, 0)) +
+                 _tmp118 * (-_tmp1 * vec(6, 0) + _tmp121 * vec(6, 0) - 2 * _tmp151) + _tmp163 +
+                 _tmp26 * (_tmp151 + _tmp164);
+    _D_b(8, 2) = _tmp101 * (_tmp149 + _tmp162) + _tmp26 * (_tmp131 + _tmp161);
+    _D_b(0, 3) = 0;
+    _D_b(1, 3) = 0;
+    _D_b(2, 3) = 0;
+    _D_b(3, 3) = _tmp36;
+    _D_b(4, 3) = _tmp29;
+    _D_b(5, 3) = _tmp33;
+    _D_b(6, 3) = 0;
+    _D_b(7, 3) = 0;
+    _D_b(8, 3) = 0;
+    _D_b(0, 4) = 0;
+    _D_b(1, 4) = 0;
+    _D_b(2, 4) = 0;
+    _D_b(3, 4) = _tmp53;
+    _D_b(4, 4) = _tmp55;
+    _D_b(5, 4) = _tmp54;
+    _D_b(6, 4) = 0;
+    _D_b(7, 4) = 0;
+    _D_b(8, 4) = 0;
+    _D_b(0, 5) = 0;
+    _D_b(1, 5) = 0;
+    _D_b(2, 5) = 0;
+    _D_b(3, 5) = _tmp46;
+    _D_b(4, 5) = _tmp45;
+    _D_b(5, 5) = _tmp48;
+    _D_b(6, 5) = 0;
+    _D_b(7, 5) = 0;
+    _D_b(8, 5) = 0;
+    _D_b(0, 6) = 0;
+    _D_b(1, 6) = 0;
+    _D_b(2, 6) = 0;
+    _D_b(3, 6) = 0;
+    _D_b(4, 6) = 0;
+    _D_b(5, 6) = 0;
+    _D_b(6, 6) = _tmp36;
+    _D_b(7, 6) = _tmp29;
+    _D_b(8, 6) = _tmp33;
+    _D_b(0, 7) = 0;
+    _D_b(1, 7) = 0;
+    _D_b(2, 7) = 0;
+    _D_b(3, 7) = 0;
+    _D_b(4, 7) = 0;
+    _D_b(5, 7) = 0;
+    _D_b(6, 7) = _tmp53;
+    _D_b(7, 7) = _tmp55;
+    _D_b(8, 7) = _tmp54;
+    _D_b(0, 8) = 0;
+    _D_b(1, 8) = 0;
+    _D_b(2, 8) = 0;
+    _D_b(3, 8) = 0;
+    _D_b(4, 8) = 0;
+    _D_b(5, 8) = 0;
+    _D_b(6, 8) = _tmp46;
+    _D_b(7, 8) = _tmp45;
+    _D_b(8, 8) = _tmp48;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
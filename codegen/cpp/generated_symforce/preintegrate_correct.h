@@ -0,0 +1,206 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     preint: Matrix109_1
+ *     bias_delta: Matrix61
+ *
+ * Outputs:
+ *     upsilon: Matrix10_1
+ *     cov: Matrix45_1
+ */
+template <typename Scalar>
+void PreintegrateCorrect(const Eigen::Matrix<Scalar, 109, 1>& preint,
+                         const Eigen::Matrix<Scalar, 6, 1>& bias_delta,
+                         Eigen::Matrix<Scalar, 10, 1>* const upsilon = nullptr,
+                         Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr) {
+  // Total ops: 287
+
+  // Input arrays
+
+  // Intermediate terms (73)
+  const Scalar _tmp0 = bias_delta(0, 0) * preint(55, 0) + bias_delta(1, 0) * preint(64, 0) +
+                       bias_delta(2, 0) * preint(73, 0) + bias_delta(3, 0) * preint(82, 0) +
+                       bias_delta(4, 0) * preint(91, 0) + bias_delta(5, 0) * preint(100, 0);
+  const Scalar _tmp1 = std::pow(_tmp0, Scalar(2));
+  const Scalar _tmp2 = bias_delta(0, 0) * preint(57, 0) + bias_delta(1, 0) * preint(66, 0) +
+                       bias_delta(2, 0) * preint(75, 0) + bias_delta(3, 0) * preint(84, 0) +
+                       bias_delta(4, 0) * preint(93, 0) + bias_delta(5, 0) * preint(102, 0);
+  const Scalar _tmp3 = std::pow(_tmp2, Scalar(2));
+  const Scalar _tmp4 = bias_delta(0, 0) * preint(56, 0) + bias_delta(1, 0) * preint(65, 0) +
+                       bias_delta(2, 0) * preint(74, 0) + bias_delta(3, 0) * preint(83, 0) +
+                       bias_delta(4, 0) * preint(92, 0) + bias_delta(5, 0) * preint(101, 0);
+  const Scalar _tmp5 = std::pow(_tmp4, Scalar(2));
+  const Scalar _tmp6 = _tmp1 + _tmp3 + _tmp5 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp7 = std::sqrt(_tmp6);
+  const Scalar _tmp8 = (Scalar(1) / Scalar(2)) * _tmp7;
+  const Scalar _tmp9 = std::cos(_tmp8);
+  const Scalar _tmp10 = std::sin(_tmp8) / _tmp7;
+  const Scalar _tmp11 = _tmp0 * _tmp10;
+  const Scalar _tmp12 = _tmp10 * _tmp4;
+  const Scalar _tmp13 = _tmp10 * _tmp2;
+  const Scalar _tmp14 = 2 * preint(0, 0);
+  const Scalar _tmp15 = _tmp14 * preint(2, 0);
+  const Scalar _tmp16 = 2 * preint(3, 0);
+  const Scalar _tmp17 = _tmp16 * preint(1, 0);
+  const Scalar _tmp18 = _tmp15 + _tmp17;
+  const Scalar _tmp19 = bias_delta(0, 0) * preint(60, 0) + bias_delta(1, 0) * preint(69, 0) +
+                        bias_delta(2, 0) * preint(78, 0) + bias_delta(3, 0) * preint(87, 0) +
+                        bias_delta(4, 0) * preint(96, 0) + bias_delta(5, 0) * preint(105, 0);
+  const Scalar _tmp20 = Scalar(0.050000000000000003) - _tmp7;
+  const Scalar _tmp21 = std::max<Scalar>(0, (((_tmp20) > 0) - ((_tmp20) < 0)));
+  const Scalar _tmp22 = _tmp20 * _tmp21 + _tmp7;
+  const Scalar _tmp23 = (_tmp22 - std::sin(_tmp22)) / [&]() {
+    const Scalar base = _tmp22;
+    return base * base * base;
+  }();
+  const Scalar _tmp24 = std::pow(_tmp6, Scalar(2));
+  const Scalar _tmp25 =
+      _tmp21 * (-_tmp23 + Scalar(0.00019841269841269841) * _tmp24 -
+                Scalar(0.0083333333333333332) * _tmp6 + Scalar(0.16666666666666666)) +
+      _tmp23;
+  const Scalar _tmp26 = -_tmp1 * _tmp25;
+  const Scalar _tmp27 = -_tmp25 * _tmp5 + 1;
+  const Scalar _tmp28 = _tmp26 + _tmp27;
+  const Scalar _tmp29 = _tmp25 * _tmp4;
+  const Scalar _tmp30 = _tmp2 * _tmp29;
+  const Scalar _tmp31 = (1 - std::cos(_tmp22)) / std::pow(_tmp22, Scalar(2));
+  const Scalar _tmp32 = _tmp21 * (Scalar(0.0013888888888888889) * _tmp24 - _tmp31 -
+                                  Scalar(0.041666666666666664) * _tmp6 + Scalar(0.5)) +
+                        _tmp31;
+  const Scalar _tmp33 = _tmp0 * _tmp32;
+  const Scalar _tmp34 = _tmp30 + _tmp33;
+  const Scalar _tmp35 = bias_delta(0, 0) * preint(59, 0) + bias_delta(1, 0) * preint(68, 0) +
+                        bias_delta(2, 0) * preint(77, 0) + bias_delta(3, 0) * preint(86, 0) +
+                        bias_delta(4, 0) * preint(95, 0) + bias_delta(5, 0) * preint(104, 0);
+  const Scalar _tmp36 = _tmp0 * _tmp2 * _tmp25;
+  const Scalar _tmp37 = _tmp32 * _tmp4;
+  const Scalar _tmp38 = _tmp36 - _tmp37;
+  const Scalar _tmp39 = bias_delta(0, 0) * preint(58, 0) + bias_delta(1, 0) * preint(67, 0) +
+                        bias_delta(2, 0) * preint(76, 0) + bias_delta(3, 0) * preint(85, 0) +
+                        bias_delta(4, 0) * preint(94, 0) + bias_delta(5, 0) * preint(103, 0);
+  const Scalar _tmp40 = _tmp19 * _tmp28 + _tmp34 * _tmp35 + _tmp38 * _tmp39;
+  const Scalar _tmp41 = _tmp16 * preint(2, 0);
+  const Scalar _tmp42 = _tmp14 * preint(1, 0);
+  const Scalar _tmp43 = -_tmp41 + _tmp42;
+  const Scalar _tmp44 = _tmp2 * _tmp32;
+  const Scalar _tmp45 = _tmp0 * _tmp29;
+  const Scalar _tmp46 = _tmp44 + _tmp45;
+  const Scalar _tmp47 = _tmp30 - _tmp33;
+  const Scalar _tmp48 = -_tmp25 * _tmp3;
+  const Scalar _tmp49 = _tmp26 + _tmp48 + 1;
+  const Scalar _tmp50 = _tmp19 * _tmp47 + _tmp35 * _tmp49 + _tmp39 * _tmp46;
+  const Scalar _tmp51 = -2 * std::pow(preint(2, 0), Scalar(2));
+  const Scalar _tmp52 = 1 - 2 * std::pow(preint(1, 0), Scalar(2));
+  const Scalar _tmp53 = _tmp51 + _tmp52;
+  const Scalar _tmp54 = -_tmp44 + _tmp45;
+  const Scalar _tmp55 = _tmp27 + _tmp48;
+  const Scalar _tmp56 = _tmp36 + _tmp37;
+  const Scalar _tmp57 = _tmp19 * _tmp56 + _tmp35 * _tmp54 + _tmp39 * _tmp55;
+  const Scalar _tmp58 = 2 * preint(1, 0) * preint(2, 0);
+  const Scalar _tmp59 = _tmp16 * preint(0, 0);
+  const Scalar _tmp60 = _tmp58 - _tmp59;
+  const Scalar _tmp61 = -2 * std::pow(preint(0, 0), Scalar(2));
+  const Scalar _tmp62 = _tmp51 + _tmp61 + 1;
+  const Scalar _tmp63 = _tmp41 + _tmp42;
+  const Scalar _tmp64 = _tmp52 + _tmp61;
+  const Scalar _tmp65 = _tmp58 + _tmp59;
+  const Scalar _tmp66 = _tmp15 - _tmp17;
+  const Scalar _tmp67 = bias_delta(0, 0) * preint(61, 0) + bias_delta(1, 0) * preint(70, 0) +
+                        bias_delta(2, 0) * preint(79, 0) + bias_delta(3, 0) * preint(88, 0) +
+                        bias_delta(4, 0) * preint(97, 0) + bias_delta(5, 0) * preint(106, 0);
+  const Scalar _tmp68 = bias_delta(0, 0) * preint(63, 0) + bias_delta(1, 0) * preint(72, 0) +
+                        bias_delta(2, 0) * preint(81, 0) + bias_delta(3, 0) * preint(90, 0) +
+                        bias_delta(4, 0) * preint(99, 0) + bias_delta(5, 0) * preint(108, 0);
+  const Scalar _tmp69 = bias_delta(0, 0) * preint(62, 0) + bias_delta(1, 0) * preint(71, 0) +
+                        bias_delta(2, 0) * preint(80, 0) + bias_delta(3, 0) * preint(89, 0) +
+                        bias_delta(4, 0) * preint(98, 0) + bias_delta(5, 0) * preint(107, 0);
+  const Scalar _tmp70 = _tmp28 * _tmp68 + _tmp34 * _tmp69 + _tmp38 * _tmp67;
+  const Scalar _tmp71 = _tmp46 * _tmp67 + _tmp47 * _tmp68 + _tmp49 * _tmp69;
+  const Scalar _tmp72 = _tmp54 * _tmp69 + _tmp55 * _tmp67 + _tmp56 * _tmp68;
+
+  // Output terms (2)
+  if (upsilon != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _upsilon = (*upsilon);
+
+    _upsilon(0, 0) = _tmp11 * preint(3, 0) - _tmp12 * preint(2, 0) + _tmp13 * preint(1, 0) +
+                     _tmp9 * preint(0, 0);
+    _upsilon(1, 0) = _tmp11 * preint(2, 0) + _tmp12 * preint(3, 0) - _tmp13 * preint(0, 0) +
+                     _tmp9 * preint(1, 0);
+    _upsilon(2, 0) = -_tmp11 * preint(1, 0) + _tmp12 * preint(0, 0) + _tmp13 * preint(3, 0) +
+                     _tmp9 * preint(2, 0);
+    _upsilon(3, 0) = -_tmp11 * preint(0, 0) - _tmp12 * preint(1, 0) - _tmp13 * preint(2, 0) +
+                     _tmp9 * preint(3, 0);
+    _upsilon(4, 0) = _tmp18 * _tmp40 + _tmp43 * _tmp50 + _tmp53 * _tmp57 + preint(4, 0);
+    _upsilon(5, 0) = _tmp40 * _tmp60 + _tmp50 * _tmp62 + _tmp57 * _tmp63 + preint(5, 0);
+    _upsilon(6, 0) = _tmp40 * _tmp64 + _tmp50 * _tmp65 + _tmp57 * _tmp66 + preint(6, 0);
+    _upsilon(7, 0) = _tmp18 * _tmp70 + _tmp43 * _tmp71 + _tmp53 * _tmp72 + preint(7, 0);
+    _upsilon(8, 0) = _tmp60 * _tmp70 + _tmp62 * _tmp71 + _tmp63 * _tmp72 + preint(8, 0);
+    _upsilon(9, 0) = _tmp64 * _tmp70 + _tmp65 * _tmp71 + _tmp66 * _tmp72 + preint(9, 0);
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = preint(10, 0);
+    _cov(1, 0) = preint(11, 0);
+    _cov(2, 0) = preint(12, 0);
+    _cov(3, 0) = preint(13, 0);
+    _cov(4, 0) = preint(14, 0);
+    _cov(5, 0) = preint(15, 0);
+    _cov(6, 0) = preint(16, 0);
+    _cov(7, 0) = preint(17, 0);
+    _cov(8, 0) = preint(18, 0);
+    _cov(9, 0) = preint(19, 0);
+    _cov(10, 0) = preint(20, 0);
+    _cov(11, 0) = preint(21, 0);
+    _cov(12, 0) = preint(22, 0);
+    _cov(13, 0) = preint(23, 0);
+    _cov(14, 0) = preint(24, 0);
+    _cov(15, 0) = preint(25, 0);
+    _cov(16, 0) = preint(26, 0);
+    _cov(17, 0) = preint(27, 0);
+    _cov(18, 0) = preint(28, 0);
+    _cov(19, 0) = preint(29, 0);
+    _cov(20, 0) = preint(30, 0);
+    _cov(21, 0) = preint(31, 0);
+    _cov(22, 0) = preint(32, 0);
+    _cov(23, 0) = preint(33, 0);
+    _cov(24, 0) = preint(34, 0);
+    _cov(25, 0) = preint(35, 0);
+    _cov(26, 0) = preint(36, 0);
+    _cov(27, 0) = preint(37, 0);
+    _cov(28, 0) = preint(38, 0);
+    _cov(29, 0) = preint(39, 0);
+    _cov(30, 0) = preint(40, 0);
+    _cov(31, 0) = preint(41, 0);
+    _cov(32, 0) = preint(42, 0);
+    _cov(33, 0) = preint(43, 0);
+    _cov(34, 0) = preint(44, 0);
+    _cov(35, 0) = preint(45, 0);
+    _cov(36, 0) = preint(46, 0);
+    _cov(37, 0) = preint(47, 0);
+    _cov(38, 0) = preint(48, 0);
+    _cov(39, 0) = preint(49, 0);
+    _cov(40, 0) = preint(50, 0);
+    _cov(41, 0) = preint(51, 0);
+    _cov(42, 0) = preint(52, 0);
+    _cov(43, 0) = preint(53, 0);
+    _cov(44, 0) = preint(54, 0);
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
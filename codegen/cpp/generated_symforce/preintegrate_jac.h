@@ -0,0 +1,668 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     imu_noise: Matrix61
+ *     preint_prev: Matrix109_1
+ *     z_imu_est: Matrix61
+ *     dt: Scalar
+ *
+ * Outputs:
+ *     upsilon: Matrix10_1
+ *     cov: Matrix45_1
+ *     jac_gyro: Matrix93
+ *     jac_accl: Matrix93
+ */
+template <typename Scalar>
+void PreintegrateJac(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+                     const Eigen::Matrix<Scalar, 109, 1>& preint_prev,
+                     const Eigen::Matrix<Scalar, 6, 1>& z_imu_est, const Scalar dt,
+                     Eigen::Matrix<Scalar, 10, 1>* const upsilon = nullptr,
+                     Eigen::Matrix<Scalar, 45, 1>* const cov = nullptr,
+                     Eigen::Matrix<Scalar, 9, 3>* const jac_gyro = nullptr,
+                     Eigen::Matrix<Scalar, 9, 3>* const jac_accl = nullptr) {
+  // Total ops: 1864
+
+  // Input arrays
+
+  // Intermediate terms (327)
+  const Scalar _tmp0 = std::pow(dt, Scalar(2));
+  const Scalar _tmp1 = _tmp0 * std::pow(z_imu_est(1, 0), Scalar(2));
+  const Scalar _tmp2 = _tmp0 * std::pow(z_imu_est(0, 0), Scalar(2));
+  const Scalar _tmp3 = _tmp0 * std::pow(z_imu_est(2, 0), Scalar(2));
+  const Scalar _tmp4 = _tmp1 + _tmp2 + _tmp3 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp5 = std::sqrt(_tmp4);
+  const Scalar _tmp6 = (Scalar(1) / Scalar(2)) * _tmp5;
+  const Scalar _tmp7 = std::sin(_tmp6);
+  const Scalar _tmp8 = _tmp7 * dt / _tmp5;
+  const Scalar _tmp9 = _tmp8 * preint_prev(2, 0);
+  const Scalar _tmp10 = _tmp8 * preint_prev(1, 0);
+  const Scalar _tmp11 = _tmp8 * preint_prev(3, 0);
+  const Scalar _tmp12 = std::cos(_tmp6);
+  const Scalar _tmp13 = _tmp8 * preint_prev(0, 0);
+  const Scalar _tmp14 = -2 * std::pow(preint_prev(1, 0), Scalar(2));
+  const Scalar _tmp15 = -2 * std::pow(preint_prev(2, 0), Scalar(2));
+  const Scalar _tmp16 = _tmp14 + _tmp15 + 1;
+  const Scalar _tmp17 = dt * z_imu_est(3, 0);
+  const Scalar _tmp18 = 2 * std::pow(_tmp7, Scalar(2)) / _tmp4;
+  const Scalar _tmp19 = -_tmp18 * _tmp3;
+  const Scalar _tmp20 = -_tmp1 * _tmp18 + 1;
+  const Scalar _tmp21 = _tmp19 + _tmp20;
+  const Scalar _tmp22 = 2 * _tmp12 * _tmp8;
+  const Scalar _tmp23 = _tmp22 * z_imu_est(2, 0);
+  const Scalar _tmp24 = _tmp0 * z_imu_est(0, 0);
+  const Scalar _tmp25 = _tmp18 * z_imu_est(1, 0);
+  const Scalar _tmp26 = _tmp24 * _tmp25;
+  const Scalar _tmp27 = -_tmp23 + _tmp26;
+  const Scalar _tmp28 = _tmp22 * z_imu_est(1, 0);
+  const Scalar _tmp29 = _tmp24 * z_imu_est(2, 0);
+  const Scalar _tmp30 = _tmp18 * _tmp29;
+  const Scalar _tmp31 = _tmp28 + _tmp30;
+  const Scalar _tmp32 = _tmp21 * z_imu_est(3, 0) + _tmp27 * z_imu_est(4, 0) +
+                        _tmp31 * z_imu_est(5, 0) - z_imu_est(3, 0);
+  const Scalar _tmp33 = (Scalar(1) / Scalar(2)) * _tmp0;
+  const Scalar _tmp34 = _tmp17 + _tmp32 * _tmp33;
+  const Scalar _tmp35 = 2 * preint_prev(1, 0);
+  const Scalar _tmp36 = _tmp35 * preint_prev(3, 0);
+  const Scalar _tmp37 = 2 * preint_prev(2, 0);
+  const Scalar _tmp38 = _tmp37 * preint_prev(0, 0);
+  const Scalar _tmp39 = _tmp36 + _tmp38;
+  const Scalar _tmp40 = dt * z_imu_est(5, 0);
+  const Scalar _tmp41 = -_tmp18 * _tmp2;
+  const Scalar _tmp42 = _tmp20 + _tmp41;
+  const Scalar _tmp43 = _tmp22 * z_imu_est(0, 0);
+  const Scalar _tmp44 = _tmp0 * z_imu_est(2, 0);
+  const Scalar _tmp45 = _tmp25 * _tmp44;
+  const Scalar _tmp46 = _tmp43 + _tmp45;
+  const Scalar _tmp47 = -_tmp28 + _tmp30;
+  const Scalar _tmp48 = _tmp42 * z_imu_est(5, 0) + _tmp46 * z_imu_est(4, 0) +
+                        _tmp47 * z_imu_est(3, 0) - z_imu_est(5, 0);
+  const Scalar _tmp49 = _tmp33 * _tmp48 + _tmp40;
+  const Scalar _tmp50 = _tmp37 * preint_prev(3, 0);
+  const Scalar _tmp51 = _tmp35 * preint_prev(0, 0);
+  const Scalar _tmp52 = -_tmp50 + _tmp51;
+  const Scalar _tmp53 = dt * z_imu_est(4, 0);
+  const Scalar _tmp54 = _tmp19 + _tmp41 + 1;
+  const Scalar _tmp55 = _tmp23 + _tmp26;
+  const Scalar _tmp56 = -_tmp43 + _tmp45;
+  const Scalar _tmp57 = _tmp54 * z_imu_est(4, 0) + _tmp55 * z_imu_est(3, 0) +
+                        _tmp56 * z_imu_est(5, 0) - z_imu_est(4, 0);
+  const Scalar _tmp58 = _tmp33 * _tmp57 + _tmp53;
+  const Scalar _tmp59 = _tmp50 + _tmp51;
+  const Scalar _tmp60 = 2 * preint_prev(0, 0) * preint_prev(3, 0);
+  const Scalar _tmp61 = _tmp35 * preint_prev(2, 0);
+  const Scalar _tmp62 = -_tmp60 + _tmp61;
+  const Scalar _tmp63 = 1 - 2 * std::pow(preint_prev(0, 0), Scalar(2));
+  const Scalar _tmp64 = _tmp15 + _tmp63;
+  const Scalar _tmp65 = -_tmp36 + _tmp38;
+  const Scalar _tmp66 = _tmp14 + _tmp63;
+  const Scalar _tmp67 = _tmp60 + _tmp61;
+  const Scalar _tmp68 = [&]() {
+    const Scalar base = dt;
+    return base * base * base;
+  }();
+  const Scalar _tmp69 = (Scalar(1) / Scalar(6)) * _tmp68;
+  const Scalar _tmp70 = _tmp32 * _tmp69 + _tmp33 * z_imu_est(3, 0);
+  const Scalar _tmp71 = _tmp33 * z_imu_est(5, 0) + _tmp48 * _tmp69;
+  const Scalar _tmp72 = _tmp33 * z_imu_est(4, 0) + _tmp57 * _tmp69;
+  const Scalar _tmp73 = Scalar(0.050000000000000003) - _tmp5;
+  const Scalar _tmp74 = std::max<Scalar>(0, (((_tmp73) > 0) - ((_tmp73) < 0)));
+  const Scalar _tmp75 = _tmp5 + _tmp73 * _tmp74;
+  const Scalar _tmp76 = std::pow(_tmp75, Scalar(-2));
+  const Scalar _tmp77 = (Scalar(1) / Scalar(2)) * _tmp75;
+  const Scalar _tmp78 = _tmp76 * (-_tmp77 * std::cos(_tmp77) / std::sin(_tmp77) + 1);
+  const Scalar _tmp79 = std::pow(_tmp4, Scalar(2));
+  const Scalar _tmp80 =
+      _tmp74 * (Scalar(0.0013888888888888889) * _tmp4 - _tmp78 +
+                Scalar(3.3068783068783071e-5) * _tmp79 + Scalar(0.083333333333333329)) +
+      _tmp78;
+  const Scalar _tmp81 = -_tmp1 * _tmp80;
+  const Scalar _tmp82 = -_tmp3 * _tmp80 + 1;
+  const Scalar _tmp83 = _tmp81 + _tmp82;
+  const Scalar _tmp84 = _tmp68 * imu_noise(0, 0);
+  const Scalar _tmp85 = _tmp29 * _tmp80;
+  const Scalar _tmp86 = (Scalar(1) / Scalar(2)) * dt;
+  const Scalar _tmp87 = _tmp86 * z_imu_est(1, 0);
+  const Scalar _tmp88 = _tmp85 - _tmp87;
+  const Scalar _tmp89 = _tmp68 * imu_noise(2, 0);
+  const Scalar _tmp90 = _tmp80 * z_imu_est(1, 0);
+  const Scalar _tmp91 = _tmp24 * _tmp90;
+  const Scalar _tmp92 = _tmp86 * z_imu_est(2, 0);
+  const Scalar _tmp93 = _tmp91 + _tmp92;
+  const Scalar _tmp94 = _tmp68 * imu_noise(1, 0);
+  const Scalar _tmp95 = _tmp44 * _tmp90;
+  const Scalar _tmp96 = _tmp86 * z_imu_est(0, 0);
+  const Scalar _tmp97 = _tmp95 + _tmp96;
+  const Scalar _tmp98 = _tmp88 * _tmp89;
+  const Scalar _tmp99 =
+      _tmp27 * preint_prev(10, 0) + _tmp46 * preint_prev(13, 0) + _tmp54 * preint_prev(11, 0);
+  const Scalar _tmp100 =
+      _tmp27 * preint_prev(11, 0) + _tmp46 * preint_prev(14, 0) + _tmp54 * preint_prev(12, 0);
+  const Scalar _tmp101 = _tmp91 - _tmp92;
+  const Scalar _tmp102 =
+      _tmp27 * preint_prev(13, 0) + _tmp46 * preint_prev(15, 0) + _tmp54 * preint_prev(14, 0);
+  const Scalar _tmp103 = -_tmp2 * _tmp80;
+  const Scalar _tmp104 = _tmp103 + _tmp82;
+  const Scalar _tmp105 = _tmp104 * _tmp94;
+  const Scalar _tmp106 =
+      _tmp31 * preint_prev(10, 0) + _tmp42 * preint_prev(13, 0) + _tmp56 * preint_prev(11, 0);
+  const Scalar _tmp107 = _tmp103 + _tmp81 + 1;
+  const Scalar _tmp108 = _tmp85 + _tmp87;
+  const Scalar _tmp109 = _tmp108 * _tmp84;
+  const Scalar _tmp110 =
+      _tmp31 * preint_prev(13, 0) + _tmp42 * preint_prev(15, 0) + _tmp56 * preint_prev(14, 0);
+  const Scalar _tmp111 =
+      _tmp31 * preint_prev(11, 0) + _tmp42 * preint_prev(14, 0) + _tmp56 * preint_prev(12, 0);
+  const Scalar _tmp112 = _tmp95 - _tmp96;
+  const Scalar _tmp113 =
+      _tmp34 * preint_prev(15, 0) - _tmp49 * preint_prev(13, 0) + preint_prev(22, 0);
+  const Scalar _tmp114 =
+      _tmp49 * preint_prev(14, 0) - _tmp58 * preint_prev(15, 0) + preint_prev(18, 0);
+  const Scalar _tmp115 = _tmp34 * preint_prev(14, 0);
+  const Scalar _tmp116 = _tmp58 * preint_prev(13, 0);
+  const Scalar _tmp117 = -_tmp115 + _tmp116 + preint_prev(27, 0);
+  const Scalar _tmp118 = _tmp113 * _tmp55 + _tmp114 * _tmp21 + _tmp117 * _tmp47;
+  const Scalar _tmp119 =
+      _tmp34 * preint_prev(13, 0) - _tmp49 * preint_prev(10, 0) + preint_prev(20, 0);
+  const Scalar _tmp120 = _tmp49 * preint_prev(11, 0);
+  const Scalar _tmp121 = -_tmp116 + _tmp120 + preint_prev(16, 0);
+  const Scalar _tmp122 =
+      -_tmp34 * preint_prev(11, 0) + _tmp58 * preint_prev(10, 0) + preint_prev(25, 0);
+  const Scalar _tmp123 = _tmp119 * _tmp55 + _tmp121 * _tmp21 + _tmp122 * _tmp47;
+  const Scalar _tmp124 =
+      -_tmp34 * preint_prev(12, 0) + _tmp58 * preint_prev(11, 0) + preint_prev(26, 0);
+  const Scalar _tmp125 =
+      _tmp49 * preint_prev(12, 0) - _tmp58 * preint_prev(14, 0) + preint_prev(17, 0);
+  const Scalar _tmp126 = _tmp115 - _tmp120 + preint_prev(21, 0);
+  const Scalar _tmp127 = _tmp124 * _tmp47 + _tmp125 * _tmp21 + _tmp126 * _tmp55;
+  const Scalar _tmp128 = _tmp117 * _tmp34 - _tmp122 * _tmp49 - _tmp34 * preint_prev(21, 0) +
+                         _tmp58 * preint_prev(20, 0) + preint_prev(29, 0);
+  const Scalar _tmp129 = _tmp122 * _tmp58 - _tmp124 * _tmp34 - _tmp34 * preint_prev(26, 0) +
+                         _tmp58 * preint_prev(25, 0) + preint_prev(30, 0);
+  const Scalar _tmp130 = -_tmp117 * _tmp58 + _tmp124 * _tmp49 - _tmp34 * preint_prev(17, 0) +
+                         _tmp58 * preint_prev(16, 0) + preint_prev(28, 0);
+  const Scalar _tmp131 = std::pow(_tmp47, Scalar(2));
+  const Scalar _tmp132 = _tmp68 * imu_noise(5, 0);
+  const Scalar _tmp133 = std::pow(_tmp55, Scalar(2));
+  const Scalar _tmp134 = _tmp68 * imu_noise(4, 0);
+  const Scalar _tmp135 = std::pow(_tmp21, Scalar(2));
+  const Scalar _tmp136 = _tmp68 * imu_noise(3, 0);
+  const Scalar _tmp137 = -_tmp113 * _tmp58 + _tmp126 * _tmp49 + _tmp34 * preint_prev(18, 0) -
+                         _tmp49 * preint_prev(16, 0) + preint_prev(23, 0);
+  const Scalar _tmp138 = -_tmp114 * _tmp58 + _tmp125 * _tmp49 + _tmp49 * preint_prev(17, 0) -
+                         _tmp58 * preint_prev(18, 0) + preint_prev(19, 0);
+  const Scalar _tmp139 = _tmp113 * _tmp34 - _tmp119 * _tmp49 + _tmp34 * preint_prev(22, 0) -
+                         _tmp49 * preint_prev(20, 0) + preint_prev(24, 0);
+  const Scalar _tmp140 = _tmp119 * _tmp54 + _tmp121 * _tmp27 + _tmp122 * _tmp46;
+  const Scalar _tmp141 = _tmp124 * _tmp46 + _tmp125 * _tmp27 + _tmp126 * _tmp54;
+  const Scalar _tmp142 = _tmp113 * _tmp54 + _tmp114 * _tmp27 + _tmp117 * _tmp46;
+  const Scalar _tmp143 = _tmp134 * _tmp54;
+  const Scalar _tmp144 = _tmp130 * _tmp46 + _tmp137 * _tmp54 + _tmp138 * _tmp27;
+  const Scalar _tmp145 = _tmp128 * _tmp54 + _tmp129 * _tmp46 + _tmp130 * _tmp27;
+  const Scalar _tmp146 = _tmp132 * _tmp47;
+  const Scalar _tmp147 = _tmp136 * _tmp21;
+  const Scalar _tmp148 = _tmp128 * _tmp46 + _tmp137 * _tmp27 + _tmp139 * _tmp54;
+  const Scalar _tmp149 = std::pow(_tmp46, Scalar(2));
+  const Scalar _tmp150 = std::pow(_tmp27, Scalar(2));
+  const Scalar _tmp151 = std::pow(_tmp54, Scalar(2));
+  const Scalar _tmp152 = _tmp113 * _tmp56 + _tmp114 * _tmp31 + _tmp117 * _tmp42;
+  const Scalar _tmp153 = _tmp119 * _tmp56 + _tmp121 * _tmp31 + _tmp122 * _tmp42;
+  const Scalar _tmp154 = _tmp124 * _tmp42 + _tmp125 * _tmp31 + _tmp126 * _tmp56;
+  const Scalar _tmp155 = _tmp55 * _tmp56;
+  const Scalar _tmp156 = _tmp130 * _tmp42 + _tmp137 * _tmp56 + _tmp138 * _tmp31;
+  const Scalar _tmp157 = _tmp128 * _tmp56 + _tmp129 * _tmp42 + _tmp130 * _tmp31;
+  const Scalar _tmp158 = _tmp128 * _tmp42 + _tmp137 * _tmp31 + _tmp139 * _tmp56;
+  const Scalar _tmp159 = _tmp27 * _tmp31;
+  const Scalar _tmp160 = _tmp42 * _tmp46;
+  const Scalar _tmp161 = std::pow(_tmp56, Scalar(2));
+  const Scalar _tmp162 = std::pow(_tmp31, Scalar(2));
+  const Scalar _tmp163 = std::pow(_tmp42, Scalar(2));
+  const Scalar _tmp164 = _tmp71 * preint_prev(11, 0);
+  const Scalar _tmp165 = _tmp70 * preint_prev(14, 0);
+  const Scalar _tmp166 = dt * preint_prev(21, 0) + preint_prev(39, 0);
+  const Scalar _tmp167 = -_tmp164 + _tmp165 + _tmp166;
+  const Scalar _tmp168 = dt * preint_prev(26, 0) + preint_prev(47, 0);
+  const Scalar _tmp169 = _tmp168 - _tmp70 * preint_prev(12, 0) + _tmp72 * preint_prev(11, 0);
+  const Scalar _tmp170 = dt * preint_prev(17, 0) + preint_prev(32, 0);
+  const Scalar _tmp171 = _tmp170 + _tmp71 * preint_prev(12, 0) - _tmp72 * preint_prev(14, 0);
+  const Scalar _tmp172 = _tmp167 * _tmp55 + _tmp169 * _tmp47 + _tmp171 * _tmp21;
+  const Scalar _tmp173 = dt * preint_prev(20, 0) + preint_prev(38, 0);
+  const Scalar _tmp174 = _tmp173 + _tmp70 * preint_prev(13, 0) - _tmp71 * preint_prev(10, 0);
+  const Scalar _tmp175 = dt * preint_prev(25, 0) + preint_prev(46, 0);
+  const Scalar _tmp176 = _tmp175 - _tmp70 * preint_prev(11, 0) + _tmp72 * preint_prev(10, 0);
+  const Scalar _tmp177 = _tmp72 * preint_prev(13, 0);
+  const Scalar _tmp178 = dt * preint_prev(16, 0) + preint_prev(31, 0);
+  const Scalar _tmp179 = _tmp164 - _tmp177 + _tmp178;
+  const Scalar _tmp180 = _tmp174 * _tmp55 + _tmp176 * _tmp47 + _tmp179 * _tmp21;
+  const Scalar _tmp181 = dt * preint_prev(22, 0) + preint_prev(40, 0);
+  const Scalar _tmp182 = _tmp181 + _tmp70 * preint_prev(15, 0) - _tmp71 * preint_prev(13, 0);
+  const Scalar _tmp183 = -_tmp165 + _tmp177 + dt * preint_prev(27, 0) + preint_prev(48, 0);
+  const Scalar _tmp184 = dt * preint_prev(18, 0) + preint_prev(33, 0);
+  const Scalar _tmp185 = _tmp184 + _tmp71 * preint_prev(14, 0) - _tmp72 * preint_prev(15, 0);
+  const Scalar _tmp186 = _tmp182 * _tmp55 + _tmp183 * _tmp47 + _tmp185 * _tmp21;
+  const Scalar _tmp187 = dt * preint_prev(28, 0);
+  const Scalar _tmp188 = -_tmp171 * _tmp34 + _tmp179 * _tmp58 + _tmp187 +
+                         _tmp71 * preint_prev(26, 0) - _tmp72 * preint_prev(27, 0) +
+                         preint_prev(36, 0);
+  const Scalar _tmp189 = dt * preint_prev(29, 0);
+  const Scalar _tmp190 = -_tmp167 * _tmp34 + _tmp174 * _tmp58 + _tmp189 +
+                         _tmp70 * preint_prev(27, 0) - _tmp71 * preint_prev(25, 0) +
+                         preint_prev(43, 0);
+  const Scalar _tmp191 = dt * preint_prev(30, 0) + preint_prev(51, 0);
+  const Scalar _tmp192 = -_tmp169 * _tmp34 + _tmp176 * _tmp58 + _tmp191 -
+                         _tmp70 * preint_prev(26, 0) + _tmp72 * preint_prev(25, 0);
+  const Scalar _tmp193 = _tmp188 * _tmp21 + _tmp190 * _tmp55 + _tmp192 * _tmp47;
+  const Scalar _tmp194 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(4));
+  const Scalar _tmp195 = _tmp194 * imu_noise(5, 0);
+  const Scalar _tmp196 = _tmp194 * imu_noise(4, 0);
+  const Scalar _tmp197 = _tmp194 * imu_noise(3, 0);
+  const Scalar _tmp198 = dt * preint_prev(19, 0) + preint_prev(34, 0);
+  const Scalar _tmp199 = _tmp171 * _tmp49 - _tmp185 * _tmp58 + _tmp198 +
+                         _tmp71 * preint_prev(17, 0) - _tmp72 * preint_prev(18, 0);
+  const Scalar _tmp200 = dt * preint_prev(23, 0);
+  const Scalar _tmp201 = _tmp200 + preint_prev(41, 0);
+  const Scalar _tmp202 = _tmp167 * _tmp49 - _tmp182 * _tmp58 + _tmp201 +
+                         _tmp70 * preint_prev(18, 0) - _tmp71 * preint_prev(16, 0);
+  const Scalar _tmp203 = _tmp187 + preint_prev(49, 0);
+  const Scalar _tmp204 = _tmp169 * _tmp49 - _tmp183 * _tmp58 + _tmp203 -
+                         _tmp70 * preint_prev(17, 0) + _tmp72 * preint_prev(16, 0);
+  const Scalar _tmp205 = _tmp199 * _tmp21 + _tmp202 * _tmp55 + _tmp204 * _tmp47;
+  const Scalar _tmp206 = dt * preint_prev(24, 0) + preint_prev(42, 0);
+  const Scalar _tmp207 = -_tmp174 * _tmp49 + _tmp182 * _tmp34 + _tmp206 +
+                         _tmp70 * preint_prev(22, 0) - _tmp71 * preint_prev(20, 0);
+  const Scalar _tmp208 = -_tmp179 * _tmp49 + _tmp185 * _tmp34 + _tmp200 +
+                         _tmp71 * preint_prev(21, 0) - _tmp72 * preint_prev(22, 0) +
+                         preint_prev(35, 0);
+  const Scalar _tmp209 = _tmp189 + preint_prev(50, 0);
+  const Scalar _tmp210 = -_tmp176 * _tmp49 + _tmp183 * _tmp34 + _tmp209 -
+                         _tmp70 * preint_prev(21, 0) + _tmp72 * preint_prev(20, 0);
+  const Scalar _tmp211 = _tmp207 * _tmp55 + _tmp208 * _tmp21 + _tmp210 * _tmp47;
+  const Scalar _tmp212 = _tmp196 * _tmp54;
+  const Scalar _tmp213 = _tmp46 * _tmp47;
+  const Scalar _tmp214 = _tmp197 * _tmp21;
+  const Scalar _tmp215 = _tmp195 * _tmp213 + _tmp212 * _tmp55 + _tmp214 * _tmp27;
+  const Scalar _tmp216 = _tmp42 * _tmp47;
+  const Scalar _tmp217 = _tmp155 * _tmp196 + _tmp195 * _tmp216 + _tmp214 * _tmp31;
+  const Scalar _tmp218 = _tmp170 * _tmp71 + _tmp171 * _tmp71 - _tmp184 * _tmp72 - _tmp185 * _tmp72 +
+                         _tmp198 * dt + dt * preint_prev(34, 0) + preint_prev(37, 0);
+  const Scalar _tmp219 = _tmp167 * _tmp71 - _tmp178 * _tmp71 - _tmp182 * _tmp72 + _tmp184 * _tmp70 +
+                         _tmp201 * dt + dt * preint_prev(35, 0) + preint_prev(44, 0);
+  const Scalar _tmp220 = _tmp169 * _tmp71 - _tmp170 * _tmp70 + _tmp178 * _tmp72 - _tmp183 * _tmp72 +
+                         _tmp203 * dt + dt * preint_prev(36, 0) + preint_prev(52, 0);
+  const Scalar _tmp221 = (Scalar(1) / Scalar(4)) * std::pow(dt, Scalar(5));
+  const Scalar _tmp222 = _tmp221 * imu_noise(5, 0);
+  const Scalar _tmp223 = _tmp221 * imu_noise(4, 0);
+  const Scalar _tmp224 = _tmp221 * imu_noise(3, 0);
+  const Scalar _tmp225 = -_tmp168 * _tmp70 - _tmp169 * _tmp70 + _tmp175 * _tmp72 +
+                         _tmp176 * _tmp72 + _tmp191 * dt + dt * preint_prev(51, 0) +
+                         preint_prev(54, 0);
+  const Scalar _tmp226 = -_tmp166 * _tmp70 + _tmp173 * _tmp72 - _tmp176 * _tmp71 +
+                         _tmp183 * _tmp70 + _tmp209 * dt + dt * preint_prev(43, 0) +
+                         preint_prev(53, 0);
+  const Scalar _tmp227 = -_tmp173 * _tmp71 - _tmp174 * _tmp71 + _tmp181 * _tmp70 +
+                         _tmp182 * _tmp70 + _tmp206 * dt + dt * preint_prev(42, 0) +
+                         preint_prev(45, 0);
+  const Scalar _tmp228 = _tmp182 * _tmp54 + _tmp183 * _tmp46 + _tmp185 * _tmp27;
+  const Scalar _tmp229 = _tmp174 * _tmp54 + _tmp176 * _tmp46 + _tmp179 * _tmp27;
+  const Scalar _tmp230 = _tmp167 * _tmp54 + _tmp169 * _tmp46 + _tmp171 * _tmp27;
+  const Scalar _tmp231 = _tmp207 * _tmp54 + _tmp208 * _tmp27 + _tmp210 * _tmp46;
+  const Scalar _tmp232 = _tmp188 * _tmp27 + _tmp190 * _tmp54 + _tmp192 * _tmp46;
+  const Scalar _tmp233 = _tmp199 * _tmp27 + _tmp202 * _tmp54 + _tmp204 * _tmp46;
+  const Scalar _tmp234 = _tmp151 * imu_noise(4, 0);
+  const Scalar _tmp235 = _tmp159 * _tmp197 + _tmp160 * _tmp195 + _tmp212 * _tmp56;
+  const Scalar _tmp236 = _tmp223 * _tmp54;
+  const Scalar _tmp237 = _tmp218 * _tmp27 + _tmp219 * _tmp54 + _tmp220 * _tmp46;
+  const Scalar _tmp238 = _tmp21 * _tmp224;
+  const Scalar _tmp239 = _tmp219 * _tmp27 + _tmp226 * _tmp46 + _tmp227 * _tmp54;
+  const Scalar _tmp240 = _tmp220 * _tmp27 + _tmp225 * _tmp46 + _tmp226 * _tmp54;
+  const Scalar _tmp241 = _tmp167 * _tmp56 + _tmp169 * _tmp42 + _tmp171 * _tmp31;
+  const Scalar _tmp242 = _tmp182 * _tmp56 + _tmp183 * _tmp42 + _tmp185 * _tmp31;
+  const Scalar _tmp243 = _tmp174 * _tmp56 + _tmp176 * _tmp42 + _tmp179 * _tmp31;
+  const Scalar _tmp244 = _tmp188 * _tmp31 + _tmp190 * _tmp56 + _tmp192 * _tmp42;
+  const Scalar _tmp245 = _tmp199 * _tmp31 + _tmp202 * _tmp56 + _tmp204 * _tmp42;
+  const Scalar _tmp246 = _tmp207 * _tmp56 + _tmp208 * _tmp31 + _tmp210 * _tmp42;
+  const Scalar _tmp247 = _tmp220 * _tmp31 + _tmp225 * _tmp42 + _tmp226 * _tmp56;
+  const Scalar _tmp248 = _tmp218 * _tmp31 + _tmp219 * _tmp56 + _tmp220 * _tmp42;
+  const Scalar _tmp249 = _tmp219 * _tmp31 + _tmp226 * _tmp42 + _tmp227 * _tmp56;
+  const Scalar _tmp250 = (_tmp75 - std::sin(_tmp75)) / [&]() {
+    const Scalar base = _tmp75;
+    return base * base * base;
+  }();
+  const Scalar _tmp251 =
+      _tmp250 + _tmp74 * (-_tmp250 - Scalar(0.0083333333333333332) * _tmp4 +
+                          Scalar(0.00019841269841269841) * _tmp79 + Scalar(0.16666666666666666));
+  const Scalar _tmp252 = -_tmp1 * _tmp251;
+  const Scalar _tmp253 = -_tmp251 * _tmp3 + 1;
+  const Scalar _tmp254 = _tmp252 + _tmp253;
+  const Scalar _tmp255 = _tmp251 * z_imu_est(1, 0);
+  const Scalar _tmp256 = _tmp24 * _tmp255;
+  const Scalar _tmp257 = _tmp76 * (1 - std::cos(_tmp75));
+  const Scalar _tmp258 =
+      dt * (_tmp257 + _tmp74 * (-_tmp257 - Scalar(0.041666666666666664) * _tmp4 +
+                                Scalar(0.0013888888888888889) * _tmp79 + Scalar(0.5)));
+  const Scalar _tmp259 = _tmp258 * z_imu_est(2, 0);
+  const Scalar _tmp260 = dt * (_tmp256 - _tmp259);
+  const Scalar _tmp261 = _tmp251 * _tmp29;
+  const Scalar _tmp262 = _tmp258 * z_imu_est(1, 0);
+  const Scalar _tmp263 = dt * (_tmp261 + _tmp262);
+  const Scalar _tmp264 =
+      _tmp49 * preint_prev(56, 0) - _tmp58 * preint_prev(57, 0) + preint_prev(58, 0);
+  const Scalar _tmp265 =
+      -_tmp34 * preint_prev(56, 0) + _tmp58 * preint_prev(55, 0) + preint_prev(60, 0);
+  const Scalar _tmp266 = -_tmp260 * z_imu_est(5, 0) + _tmp263 * z_imu_est(4, 0);
+  const Scalar _tmp267 =
+      _tmp34 * preint_prev(57, 0) - _tmp49 * preint_prev(55, 0) + preint_prev(59, 0);
+  const Scalar _tmp268 = _tmp254 * _tmp40 - _tmp263 * z_imu_est(3, 0);
+  const Scalar _tmp269 = -_tmp254 * _tmp53 + _tmp260 * z_imu_est(3, 0);
+  const Scalar _tmp270 = _tmp70 * preint_prev(57, 0) - _tmp71 * preint_prev(55, 0) +
+                         dt * preint_prev(59, 0) + preint_prev(62, 0);
+  const Scalar _tmp271 = -_tmp70 * preint_prev(56, 0) + _tmp72 * preint_prev(55, 0) +
+                         dt * preint_prev(60, 0) + preint_prev(63, 0);
+  const Scalar _tmp272 = _tmp71 * preint_prev(56, 0) - _tmp72 * preint_prev(57, 0) +
+                         dt * preint_prev(58, 0) + preint_prev(61, 0);
+  const Scalar _tmp273 = dt * (_tmp256 + _tmp259);
+  const Scalar _tmp274 = -_tmp2 * _tmp251;
+  const Scalar _tmp275 = _tmp253 + _tmp274;
+  const Scalar _tmp276 = _tmp255 * _tmp44;
+  const Scalar _tmp277 = _tmp258 * z_imu_est(0, 0);
+  const Scalar _tmp278 = dt * (_tmp276 - _tmp277);
+  const Scalar _tmp279 =
+      _tmp49 * preint_prev(65, 0) - _tmp58 * preint_prev(66, 0) + preint_prev(67, 0);
+  const Scalar _tmp280 =
+      -_tmp34 * preint_prev(65, 0) + _tmp58 * preint_prev(64, 0) + preint_prev(69, 0);
+  const Scalar _tmp281 =
+      _tmp34 * preint_prev(66, 0) - _tmp49 * preint_prev(64, 0) + preint_prev(68, 0);
+  const Scalar _tmp282 = -_tmp275 * _tmp40 + _tmp278 * z_imu_est(4, 0);
+  const Scalar _tmp283 = _tmp273 * z_imu_est(5, 0) - _tmp278 * z_imu_est(3, 0);
+  const Scalar _tmp284 = _tmp17 * _tmp275 - _tmp273 * z_imu_est(4, 0);
+  const Scalar _tmp285 = _tmp70 * preint_prev(66, 0) - _tmp71 * preint_prev(64, 0) +
+                         dt * preint_prev(68, 0) + preint_prev(71, 0);
+  const Scalar _tmp286 = -_tmp70 * preint_prev(65, 0) + _tmp72 * preint_prev(64, 0) +
+                         dt * preint_prev(69, 0) + preint_prev(72, 0);
+  const Scalar _tmp287 = _tmp71 * preint_prev(65, 0) - _tmp72 * preint_prev(66, 0) +
+                         dt * preint_prev(67, 0) + preint_prev(70, 0);
+  const Scalar _tmp288 = dt * (_tmp261 - _tmp262);
+  const Scalar _tmp289 = dt * (_tmp276 + _tmp277);
+  const Scalar _tmp290 = _tmp252 + _tmp274 + 1;
+  const Scalar _tmp291 =
+      _tmp49 * preint_prev(74, 0) - _tmp58 * preint_prev(75, 0) + preint_prev(76, 0);
+  const Scalar _tmp292 =
+      -_tmp34 * preint_prev(74, 0) + _tmp58 * preint_prev(73, 0) + preint_prev(78, 0);
+  const Scalar _tmp293 = -_tmp289 * z_imu_est(5, 0) + _tmp290 * _tmp53;
+  const Scalar _tmp294 =
+      _tmp34 * preint_prev(75, 0) - _tmp49 * preint_prev(73, 0) + preint_prev(77, 0);
+  const Scalar _tmp295 = -_tmp17 * _tmp290 + _tmp288 * z_imu_est(5, 0);
+  const Scalar _tmp296 = -_tmp288 * z_imu_est(4, 0) + _tmp289 * z_imu_est(3, 0);
+  const Scalar _tmp297 = _tmp70 * preint_prev(75, 0) - _tmp71 * preint_prev(73, 0) +
+                         dt * preint_prev(77, 0) + preint_prev(80, 0);
+  const Scalar _tmp298 = -_tmp70 * preint_prev(74, 0) + _tmp72 * preint_prev(73, 0) +
+                         dt * preint_prev(78, 0) + preint_prev(81, 0);
+  const Scalar _tmp299 = _tmp71 * preint_prev(74, 0) - _tmp72 * preint_prev(75, 0) +
+                         dt * preint_prev(76, 0) + preint_prev(79, 0);
+  const Scalar _tmp300 =
+      _tmp34 * preint_prev(84, 0) - _tmp49 * preint_prev(82, 0) + preint_prev(86, 0);
+  const Scalar _tmp301 = 1 - _tmp21;
+  const Scalar _tmp302 =
+      -_tmp34 * preint_prev(83, 0) + _tmp58 * preint_prev(82, 0) + preint_prev(87, 0);
+  const Scalar _tmp303 =
+      _tmp49 * preint_prev(83, 0) - _tmp58 * preint_prev(84, 0) + preint_prev(85, 0);
+  const Scalar _tmp304 = _tmp27 * _tmp33;
+  const Scalar _tmp305 = _tmp31 * _tmp33;
+  const Scalar _tmp306 = -_tmp70 * preint_prev(83, 0) + _tmp72 * preint_prev(82, 0) +
+                         dt * preint_prev(87, 0) + preint_prev(90, 0);
+  const Scalar _tmp307 = _tmp70 * preint_prev(84, 0) - _tmp71 * preint_prev(82, 0) +
+                         dt * preint_prev(86, 0) + preint_prev(89, 0);
+  const Scalar _tmp308 = _tmp71 * preint_prev(83, 0) - _tmp72 * preint_prev(84, 0) +
+                         dt * preint_prev(85, 0) + preint_prev(88, 0);
+  const Scalar _tmp309 = _tmp33 * _tmp55;
+  const Scalar _tmp310 =
+      -_tmp34 * preint_prev(92, 0) + _tmp58 * preint_prev(91, 0) + preint_prev(96, 0);
+  const Scalar _tmp311 =
+      _tmp34 * preint_prev(93, 0) - _tmp49 * preint_prev(91, 0) + preint_prev(95, 0);
+  const Scalar _tmp312 =
+      _tmp49 * preint_prev(92, 0) - _tmp58 * preint_prev(93, 0) + preint_prev(94, 0);
+  const Scalar _tmp313 = 1 - _tmp54;
+  const Scalar _tmp314 = _tmp33 * _tmp56;
+  const Scalar _tmp315 = -_tmp70 * preint_prev(92, 0) + _tmp72 * preint_prev(91, 0) +
+                         dt * preint_prev(96, 0) + preint_prev(99, 0);
+  const Scalar _tmp316 = _tmp70 * preint_prev(93, 0) - _tmp71 * preint_prev(91, 0) +
+                         dt * preint_prev(95, 0) + preint_prev(98, 0);
+  const Scalar _tmp317 = _tmp71 * preint_prev(92, 0) - _tmp72 * preint_prev(93, 0) +
+                         dt * preint_prev(94, 0) + preint_prev(97, 0);
+  const Scalar _tmp318 = _tmp33 * _tmp47;
+  const Scalar _tmp319 =
+      -_tmp34 * preint_prev(101, 0) + _tmp58 * preint_prev(100, 0) + preint_prev(105, 0);
+  const Scalar _tmp320 =
+      _tmp34 * preint_prev(102, 0) - _tmp49 * preint_prev(100, 0) + preint_prev(104, 0);
+  const Scalar _tmp321 =
+      _tmp49 * preint_prev(101, 0) - _tmp58 * preint_prev(102, 0) + preint_prev(103, 0);
+  const Scalar _tmp322 = _tmp33 * _tmp46;
+  const Scalar _tmp323 = 1 - _tmp42;
+  const Scalar _tmp324 = -_tmp70 * preint_prev(101, 0) + _tmp72 * preint_prev(100, 0) +
+                         dt * preint_prev(105, 0) + preint_prev(108, 0);
+  const Scalar _tmp325 = _tmp70 * preint_prev(102, 0) - _tmp71 * preint_prev(100, 0) +
+                         dt * preint_prev(104, 0) + preint_prev(107, 0);
+  const Scalar _tmp326 = _tmp71 * preint_prev(101, 0) - _tmp72 * preint_prev(102, 0) +
+                         dt * preint_prev(103, 0) + preint_prev(106, 0);
+
+  // Output terms (4)
+  if (upsilon != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _upsilon = (*upsilon);
+
+    _upsilon(0, 0) = _tmp10 * z_imu_est(2, 0) + _tmp11 * z_imu_est(0, 0) +
+                     _tmp12 * preint_prev(0, 0) - _tmp9 * z_imu_est(1, 0);
+    _upsilon(1, 0) = _tmp11 * z_imu_est(1, 0) + _tmp12 * preint_prev(1, 0) -
+                     _tmp13 * z_imu_est(2, 0) + _tmp9 * z_imu_est(0, 0);
+    _upsilon(2, 0) = -_tmp10 * z_imu_est(0, 0) + _tmp11 * z_imu_est(2, 0) +
+                     _tmp12 * preint_prev(2, 0) + _tmp13 * z_imu_est(1, 0);
+    _upsilon(3, 0) = -_tmp10 * z_imu_est(1, 0) + _tmp12 * preint_prev(3, 0) -
+                     _tmp13 * z_imu_est(0, 0) - _tmp9 * z_imu_est(2, 0);
+    _upsilon(4, 0) = _tmp16 * _tmp34 + _tmp39 * _tmp49 + _tmp52 * _tmp58 + preint_prev(4, 0);
+    _upsilon(5, 0) = _tmp34 * _tmp59 + _tmp49 * _tmp62 + _tmp58 * _tmp64 + preint_prev(5, 0);
+    _upsilon(6, 0) = _tmp34 * _tmp65 + _tmp49 * _tmp66 + _tmp58 * _tmp67 + preint_prev(6, 0);
+    _upsilon(7, 0) = _tmp16 * _tmp70 + _tmp39 * _tmp71 + _tmp52 * _tmp72 + dt * preint_prev(4, 0) +
+                     preint_prev(7, 0);
+    _upsilon(8, 0) = _tmp59 * _tmp70 + _tmp62 * _tmp71 + _tmp64 * _tmp72 + dt * preint_prev(5, 0) +
+                     preint_prev(8, 0);
+    _upsilon(9, 0) = _tmp65 * _tmp70 + _tmp66 * _tmp71 + _tmp67 * _tmp72 + dt * preint_prev(6, 0) +
+                     preint_prev(9, 0);
+  }
+
+  if (cov != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov = (*cov);
+
+    _cov(0, 0) = _tmp21 * (_tmp21 * preint_prev(10, 0) + _tmp47 * preint_prev(13, 0) +
+                           _tmp55 * preint_prev(11, 0)) +
+                 _tmp47 * (_tmp21 * preint_prev(13, 0) + _tmp47 * preint_prev(15, 0) +
+                           _tmp55 * preint_prev(14, 0)) +
+                 _tmp55 * (_tmp21 * preint_prev(11, 0) + _tmp47 * preint_prev(14, 0) +
+                           _tmp55 * preint_prev(12, 0)) +
+                 std::pow(_tmp83, Scalar(2)) * _tmp84 + std::pow(_tmp88, Scalar(2)) * _tmp89 +
+                 std::pow(_tmp93, Scalar(2)) * _tmp94;
+    _cov(1, 0) = _tmp100 * _tmp55 + _tmp101 * _tmp83 * _tmp84 + _tmp102 * _tmp47 +
+                 _tmp105 * _tmp93 + _tmp21 * _tmp99 + _tmp97 * _tmp98;
+    _cov(2, 0) = _tmp100 * _tmp54 + std::pow(_tmp101, Scalar(2)) * _tmp84 + _tmp102 * _tmp46 +
+                 std::pow(_tmp104, Scalar(2)) * _tmp94 + _tmp27 * _tmp99 +
+                 _tmp89 * std::pow(_tmp97, Scalar(2));
+    _cov(3, 0) = _tmp106 * _tmp21 + _tmp107 * _tmp98 + _tmp109 * _tmp83 + _tmp110 * _tmp47 +
+                 _tmp111 * _tmp55 + _tmp112 * _tmp93 * _tmp94;
+    _cov(4, 0) = _tmp101 * _tmp109 + _tmp105 * _tmp112 + _tmp106 * _tmp27 +
+                 _tmp107 * _tmp89 * _tmp97 + _tmp110 * _tmp46 + _tmp111 * _tmp54;
+    _cov(5, 0) = _tmp106 * _tmp31 + std::pow(_tmp107, Scalar(2)) * _tmp89 +
+                 std::pow(_tmp108, Scalar(2)) * _tmp84 + _tmp110 * _tmp42 + _tmp111 * _tmp56 +
+                 std::pow(_tmp112, Scalar(2)) * _tmp94;
+    _cov(6, 0) = _tmp118 * _tmp47 + _tmp123 * _tmp21 + _tmp127 * _tmp55;
+    _cov(7, 0) = _tmp118 * _tmp46 + _tmp123 * _tmp27 + _tmp127 * _tmp54;
+    _cov(8, 0) = _tmp118 * _tmp42 + _tmp123 * _tmp31 + _tmp127 * _tmp56;
+    _cov(9, 0) = _tmp131 * _tmp132 + _tmp133 * _tmp134 + _tmp135 * _tmp136 +
+                 _tmp21 * (_tmp130 * _tmp47 + _tmp137 * _tmp55 + _tmp138 * _tmp21) +
+                 _tmp47 * (_tmp128 * _tmp55 + _tmp129 * _tmp47 + _tmp130 * _tmp21) +
+                 _tmp55 * (_tmp128 * _tmp47 + _tmp137 * _tmp21 + _tmp139 * _tmp55);
+    _cov(10, 0) = _tmp140 * _tmp21 + _tmp141 * _tmp55 + _tmp142 * _tmp47;
+    _cov(11, 0) = _tmp140 * _tmp27 + _tmp141 * _tmp54 + _tmp142 * _tmp46;
+    _cov(12, 0) = _tmp140 * _tmp31 + _tmp141 * _tmp56 + _tmp142 * _tmp42;
+    _cov(13, 0) = _tmp143 * _tmp55 + _tmp144 * _tmp21 + _tmp145 * _tmp47 + _tmp146 * _tmp46 +
+                  _tmp147 * _tmp27 + _tmp148 * _tmp55;
+    _cov(14, 0) = _tmp132 * _tmp149 + _tmp134 * _tmp151 + _tmp136 * _tmp150 + _tmp144 * _tmp27 +
+                  _tmp145 * _tmp46 + _tmp148 * _tmp54;
+    _cov(15, 0) = _tmp152 * _tmp47 + _tmp153 * _tmp21 + _tmp154 * _tmp55;
+    _cov(16, 0) = _tmp152 * _tmp46 + _tmp153 * _tmp27 + _tmp154 * _tmp54;
+    _cov(17, 0) = _tmp152 * _tmp42 + _tmp153 * _tmp31 + _tmp154 * _tmp56;
+    _cov(18, 0) = _tmp134 * _tmp155 + _tmp146 * _tmp42 + _tmp147 * _tmp31 + _tmp156 * _tmp21 +
+                  _tmp157 * _tmp47 + _tmp158 * _tmp55;
+    _cov(19, 0) = _tmp132 * _tmp160 + _tmp136 * _tmp159 + _tmp143 * _tmp56 + _tmp156 * _tmp27 +
+                  _tmp157 * _tmp46 + _tmp158 * _tmp54;
+    _cov(20, 0) = _tmp132 * _tmp163 + _tmp134 * _tmp161 + _tmp136 * _tmp162 + _tmp156 * _tmp31 +
+                  _tmp157 * _tmp42 + _tmp158 * _tmp56;
+    _cov(21, 0) = _tmp172 * _tmp55 + _tmp180 * _tmp21 + _tmp186 * _tmp47;
+    _cov(22, 0) = _tmp172 * _tmp54 + _tmp180 * _tmp27 + _tmp186 * _tmp46;
+    _cov(23, 0) = _tmp172 * _tmp56 + _tmp180 * _tmp31 + _tmp186 * _tmp42;
+    _cov(24, 0) = _tmp131 * _tmp195 + _tmp133 * _tmp196 + _tmp135 * _tmp197 + _tmp193 * _tmp47 +
+                  _tmp205 * _tmp21 + _tmp211 * _tmp55;
+    _cov(25, 0) = _tmp193 * _tmp46 + _tmp205 * _tmp27 + _tmp211 * _tmp54 + _tmp215;
+    _cov(26, 0) = _tmp193 * _tmp42 + _tmp205 * _tmp31 + _tmp211 * _tmp56 + _tmp217;
+    _cov(27, 0) = _tmp131 * _tmp222 + _tmp133 * _tmp223 + _tmp135 * _tmp224 +
+                  _tmp21 * (_tmp21 * _tmp218 + _tmp219 * _tmp55 + _tmp220 * _tmp47) +
+                  _tmp47 * (_tmp21 * _tmp220 + _tmp225 * _tmp47 + _tmp226 * _tmp55) +
+                  _tmp55 * (_tmp21 * _tmp219 + _tmp226 * _tmp47 + _tmp227 * _tmp55);
+    _cov(28, 0) = _tmp21 * _tmp229 + _tmp228 * _tmp47 + _tmp230 * _tmp55;
+    _cov(29, 0) = _tmp228 * _tmp46 + _tmp229 * _tmp27 + _tmp230 * _tmp54;
+    _cov(30, 0) = _tmp228 * _tmp42 + _tmp229 * _tmp31 + _tmp230 * _tmp56;
+    _cov(31, 0) = _tmp21 * _tmp233 + _tmp215 + _tmp231 * _tmp55 + _tmp232 * _tmp47;
+    _cov(32, 0) = _tmp149 * _tmp195 + _tmp150 * _tmp197 + _tmp194 * _tmp234 + _tmp231 * _tmp54 +
+                  _tmp232 * _tmp46 + _tmp233 * _tmp27;
+    _cov(33, 0) = _tmp231 * _tmp56 + _tmp232 * _tmp42 + _tmp233 * _tmp31 + _tmp235;
+    _cov(34, 0) = _tmp21 * _tmp237 + _tmp213 * _tmp222 + _tmp236 * _tmp55 + _tmp238 * _tmp27 +
+                  _tmp239 * _tmp55 + _tmp240 * _tmp47;
+    _cov(35, 0) = _tmp149 * _tmp222 + _tmp150 * _tmp224 + _tmp221 * _tmp234 + _tmp237 * _tmp27 +
+                  _tmp239 * _tmp54 + _tmp240 * _tmp46;
+    _cov(36, 0) = _tmp21 * _tmp243 + _tmp241 * _tmp55 + _tmp242 * _tmp47;
+    _cov(37, 0) = _tmp241 * _tmp54 + _tmp242 * _tmp46 + _tmp243 * _tmp27;
+    _cov(38, 0) = _tmp241 * _tmp56 + _tmp242 * _tmp42 + _tmp243 * _tmp31;
+    _cov(39, 0) = _tmp21 * _tmp245 + _tmp217 + _tmp244 * _tmp47 + _tmp246 * _tmp55;
+    _cov(40, 0) = _tmp235 + _tmp244 * _tmp46 + _tmp245 * _tmp27 + _tmp246 * _tmp54;
+    _cov(41, 0) = _tmp161 * _tmp196 + _tmp162 * _tmp197 + _tmp163 * _tmp195 + _tmp244 * _tmp42 +
+                  _tmp245 * _tmp31 + _tmp246 * _tmp56;
+    _cov(42, 0) = _tmp155 * _tmp223 + _tmp21 * _tmp248 + _tmp216 * _tmp222 + _tmp238 * _tmp31 +
+                  _tmp247 * _tmp47 + _tmp249 * _tmp55;
+    _cov(43, 0) = _tmp159 * _tmp224 + _tmp160 * _tmp222 + _tmp236 * _tmp56 + _tmp247 * _tmp46 +
+                  _tmp248 * _tmp27 + _tmp249 * _tmp54;
+    _cov(44, 0) = _tmp161 * _tmp223 + _tmp162 * _tmp224 + _tmp163 * _tmp222 + _tmp247 * _tmp42 +
+                  _tmp248 * _tmp31 + _tmp249 * _tmp56;
+  }
+
+  if (jac_gyro != nullptr) {
+    Eigen::Matrix<Scalar, 9, 3>& _jac_gyro = (*jac_gyro);
+
+    _jac_gyro(0, 0) = _tmp21 * preint_prev(55, 0) - _tmp254 * dt + _tmp47 * preint_prev(57, 0) +
+                      _tmp55 * preint_prev(56, 0);
+    _jac_gyro(1, 0) = -_tmp260 + _tmp27 * preint_prev(55, 0) + _tmp46 * preint_prev(57, 0) +
+                      _tmp54 * preint_prev(56, 0);
+    _jac_gyro(2, 0) = -_tmp263 + _tmp31 * preint_prev(55, 0) + _tmp42 * preint_prev(57, 0) +
+                      _tmp56 * preint_prev(56, 0);
+    _jac_gyro(3, 0) = _tmp21 * _tmp264 + _tmp265 * _tmp47 + _tmp266 * _tmp33 + _tmp267 * _tmp55;
+    _jac_gyro(4, 0) = _tmp264 * _tmp27 + _tmp265 * _tmp46 + _tmp267 * _tmp54 + _tmp268 * _tmp33;
+    _jac_gyro(5, 0) = _tmp264 * _tmp31 + _tmp265 * _tmp42 + _tmp267 * _tmp56 + _tmp269 * _tmp33;
+    _jac_gyro(6, 0) = _tmp21 * _tmp272 + _tmp266 * _tmp69 + _tmp270 * _tmp55 + _tmp271 * _tmp47;
+    _jac_gyro(7, 0) = _tmp268 * _tmp69 + _tmp27 * _tmp272 + _tmp270 * _tmp54 + _tmp271 * _tmp46;
+    _jac_gyro(8, 0) = _tmp269 * _tmp69 + _tmp270 * _tmp56 + _tmp271 * _tmp42 + _tmp272 * _tmp31;
+    _jac_gyro(0, 1) = _tmp21 * preint_prev(64, 0) - _tmp273 + _tmp47 * preint_prev(66, 0) +
+                      _tmp55 * preint_prev(65, 0);
+    _jac_gyro(1, 1) = _tmp27 * preint_prev(64, 0) - _tmp275 * dt + _tmp46 * preint_prev(66, 0) +
+                      _tmp54 * preint_prev(65, 0);
+    _jac_gyro(2, 1) = -_tmp278 + _tmp31 * preint_prev(64, 0) + _tmp42 * preint_prev(66, 0) +
+                      _tmp56 * preint_prev(65, 0);
+    _jac_gyro(3, 1) = _tmp21 * _tmp279 + _tmp280 * _tmp47 + _tmp281 * _tmp55 + _tmp282 * _tmp33;
+    _jac_gyro(4, 1) = _tmp27 * _tmp279 + _tmp280 * _tmp46 + _tmp281 * _tmp54 + _tmp283 * _tmp33;
+    _jac_gyro(5, 1) = _tmp279 * _tmp31 + _tmp280 * _tmp42 + _tmp281 * _tmp56 + _tmp284 * _tmp33;
+    _jac_gyro(6, 1) = _tmp21 * _tmp287 + _tmp282 * _tmp69 + _tmp285 * _tmp55 + _tmp286 * _tmp47;
+    _jac_gyro(7, 1) = _tmp27 * _tmp287 + _tmp283 * _tmp69 + _tmp285 * _tmp54 + _tmp286 * _tmp46;
+    _jac_gyro(8, 1) = _tmp284 * _tmp69 + _tmp285 * _tmp56 + _tmp286 * _tmp42 + _tmp287 * _tmp31;
+    _jac_gyro(0, 2) = _tmp21 * preint_prev(73, 0) - _tmp288 + _tmp47 * preint_prev(75, 0) +
+                      _tmp55 * preint_prev(74, 0);
+    _jac_gyro(1, 2) = _tmp27 * preint_prev(73, 0) - _tmp289 + _tmp46 * preint_prev(75, 0) +
+                      _tmp54 * preint_prev(74, 0);
+    _jac_gyro(2, 2) = -_tmp290 * dt + _tmp31 * preint_prev(73, 0) + _tmp42 * preint_prev(75, 0) +
+                      _tmp56 * preint_prev(74, 0);
+    _jac_gyro(3, 2) = _tmp21 * _tmp291 + _tmp292 * _tmp47 + _tmp293 * _tmp33 + _tmp294 * _tmp55;
+    _jac_gyro(4, 2) = _tmp27 * _tmp291 + _tmp292 * _tmp46 + _tmp294 * _tmp54 + _tmp295 * _tmp33;
+    _jac_gyro(5, 2) = _tmp291 * _tmp31 + _tmp292 * _tmp42 + _tmp294 * _tmp56 + _tmp296 * _tmp33;
+    _jac_gyro(6, 2) = _tmp21 * _tmp299 + _tmp293 * _tmp69 + _tmp297 * _tmp55 + _tmp298 * _tmp47;
+    _jac_gyro(7, 2) = _tmp27 * _tmp299 + _tmp295 * _tmp69 + _tmp297 * _tmp54 + _tmp298 * _tmp46;
+    _jac_gyro(8, 2) = _tmp296 * _tmp69 + _tmp297 * _tmp56 + _tmp298 * _tmp42 + _tmp299 * _tmp31;
+  }
+
+  if (jac_accl != nullptr) {
+    Eigen::Matrix<Scalar, 9, 3>& _jac_accl = (*jac_accl);
+
+    _jac_accl(0, 0) =
+        _tmp21 * preint_prev(82, 0) + _tmp47 * preint_prev(84, 0) + _tmp55 * preint_prev(83, 0);
+    _jac_accl(1, 0) =
+        _tmp27 * preint_prev(82, 0) + _tmp46 * preint_prev(84, 0) + _tmp54 * preint_prev(83, 0);
+    _jac_accl(2, 0) =
+        _tmp31 * preint_prev(82, 0) + _tmp42 * preint_prev(84, 0) + _tmp56 * preint_prev(83, 0);
+    _jac_accl(3, 0) =
+        _tmp21 * _tmp303 - _tmp21 * dt + _tmp300 * _tmp55 - _tmp301 * _tmp33 + _tmp302 * _tmp47;
+    _jac_accl(4, 0) =
+        _tmp27 * _tmp303 - _tmp27 * dt + _tmp300 * _tmp54 + _tmp302 * _tmp46 + _tmp304;
+    _jac_accl(5, 0) =
+        _tmp300 * _tmp56 + _tmp302 * _tmp42 + _tmp303 * _tmp31 + _tmp305 - _tmp31 * dt;
+    _jac_accl(6, 0) =
+        _tmp21 * _tmp308 - _tmp21 * _tmp33 - _tmp301 * _tmp69 + _tmp306 * _tmp47 + _tmp307 * _tmp55;
+    _jac_accl(7, 0) =
+        _tmp27 * _tmp308 + _tmp27 * _tmp69 - _tmp304 + _tmp306 * _tmp46 + _tmp307 * _tmp54;
+    _jac_accl(8, 0) =
+        -_tmp305 + _tmp306 * _tmp42 + _tmp307 * _tmp56 + _tmp308 * _tmp31 + _tmp31 * _tmp69;
+    _jac_accl(0, 1) =
+        _tmp21 * preint_prev(91, 0) + _tmp47 * preint_prev(93, 0) + _tmp55 * preint_prev(92, 0);
+    _jac_accl(1, 1) =
+        _tmp27 * preint_prev(91, 0) + _tmp46 * preint_prev(93, 0) + _tmp54 * preint_prev(92, 0);
+    _jac_accl(2, 1) =
+        _tmp31 * preint_prev(91, 0) + _tmp42 * preint_prev(93, 0) + _tmp56 * preint_prev(92, 0);
+    _jac_accl(3, 1) =
+        _tmp21 * _tmp312 + _tmp309 + _tmp310 * _tmp47 + _tmp311 * _tmp55 - _tmp55 * dt;
+    _jac_accl(4, 1) =
+        _tmp27 * _tmp312 + _tmp310 * _tmp46 + _tmp311 * _tmp54 - _tmp313 * _tmp33 - _tmp54 * dt;
+    _jac_accl(5, 1) =
+        _tmp31 * _tmp312 + _tmp310 * _tmp42 + _tmp311 * _tmp56 + _tmp314 - _tmp56 * dt;
+    _jac_accl(6, 1) =
+        _tmp21 * _tmp317 - _tmp309 + _tmp315 * _tmp47 + _tmp316 * _tmp55 + _tmp55 * _tmp69;
+    _jac_accl(7, 1) =
+        _tmp27 * _tmp317 - _tmp313 * _tmp69 + _tmp315 * _tmp46 + _tmp316 * _tmp54 - _tmp33 * _tmp54;
+    _jac_accl(8, 1) =
+        _tmp31 * _tmp317 - _tmp314 + _tmp315 * _tmp42 + _tmp316 * _tmp56 + _tmp56 * _tmp69;
+    _jac_accl(0, 2) =
+        _tmp21 * preint_prev(100, 0) + _tmp47 * preint_prev(102, 0) + _tmp55 * preint_prev(101, 0);
+    _jac_accl(1, 2) =
+        _tmp27 * preint_prev(100, 0) + _tmp46 * preint_prev(102, 0) + _tmp54 * preint_prev(101, 0);
+    _jac_accl(2, 2) =
+        _tmp31 * preint_prev(100, 0) + _tmp42 * preint_prev(102, 0) + _tmp56 * preint_prev(101, 0);
+    _jac_accl(3, 2) =
+        _tmp21 * _tmp321 + _tmp318 + _tmp319 * _tmp47 + _tmp320 * _tmp55 - _tmp47 * dt;
+    _jac_accl(4, 2) =
+        _tmp27 * _tmp321 + _tmp319 * _tmp46 + _tmp320 * _tmp54 + _tmp322 - _tmp46 * dt;
+    _jac_accl(5, 2) =
+        _tmp31 * _tmp321 + _tmp319 * _tmp42 + _tmp320 * _tmp56 - _tmp323 * _tmp33 - _tmp42 * dt;
+    _jac_accl(6, 2) =
+        _tmp21 * _tmp326 - _tmp318 + _tmp324 * _tmp47 + _tmp325 * _tmp55 + _tmp47 * _tmp69;
+    _jac_accl(7, 2) =
+        _tmp27 * _tmp326 - _tmp322 + _tmp324 * _tmp46 + _tmp325 * _tmp54 + _tmp46 * _tmp69;
+    _jac_accl(8, 2) =
+        _tmp31 * _tmp326 - _tmp323 * _tmp69 + _tmp324 * _tmp42 + _tmp325 * _tmp56 - _tmp33 * _tmp42;
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -0,0 +1,905 @@
+// -----------------------------------------------------------------------------
+// This file was autogenerated by symforce from template:
+//     function/FUNCTION.h.jinja
+// Do NOT modify by hand.
+// -----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+
+namespace sym {
+
+/**
+ * This function was autogenerated. Do not modify by hand.
+ *
+ * Args:
+ *     imu_noise: Matrix61
+ *     preint_prev: Matrix55_1
+ *     z_imu_est: Matrix61
+ *     dt: Scalar
+ *
+ * Outputs:
+ *     upsilon: Matrix10_1
+ *     cov_sqrt: Matrix45_1
+ */
+template <typename Scalar>
+void PreintegrateSqrt(const Eigen::Matrix<Scalar, 6, 1>& imu_noise,
+                      const Eigen::Matrix<Scalar, 55, 1>& preint_prev,
+                      const Eigen::Matrix<Scalar, 6, 1>& z_imu_est, const Scalar dt,
+                      Eigen::Matrix<Scalar, 10, 1>* const upsilon = nullptr,
+                      Eigen::Matrix<Scalar, 45, 1>* const cov_sqrt = nullptr) {
+  // Total ops: 2088
+
+  // Input arrays
+
+  // Intermediate terms (646)
+  const Scalar _tmp0 = std::pow(dt, Scalar(2));
+  const Scalar _tmp1 = _tmp0 * std::pow(z_imu_est(1, 0), Scalar(2));
+  const Scalar _tmp2 = _tmp0 * std::pow(z_imu_est(0, 0), Scalar(2));
+  const Scalar _tmp3 = _tmp0 * std::pow(z_imu_est(2, 0), Scalar(2));
+  const Scalar _tmp4 = _tmp1 + _tmp2 + _tmp3 + Scalar(9.9999999999999998e-13);
+  const Scalar _tmp5 = std::sqrt(_tmp4);
+  const Scalar _tmp6 = (Scalar(1) / Scalar(2)) * _tmp5;
+  const Scalar _tmp7 = std::sin(_tmp6);
+  const Scalar _tmp8 = _tmp7 * dt / _tmp5;
+  const Scalar _tmp9 = _tmp8 * preint_prev(2, 0);
+  const Scalar _tmp10 = _tmp8 * preint_prev(1, 0);
+  const Scalar _tmp11 = _tmp8 * preint_prev(3, 0);
+  const Scalar _tmp12 = std::cos(_tmp6);
+  const Scalar _tmp13 = _tmp8 * preint_prev(0, 0);
+  const Scalar _tmp14 = -2 * std::pow(preint_prev(1, 0), Scalar(2));
+  const Scalar _tmp15 = -2 * std::pow(preint_prev(2, 0), Scalar(2));
+  const Scalar _tmp16 = _tmp14 + _tmp15 + 1;
+  const Scalar _tmp17 = 2 * std::pow(_tmp7, Scalar(2)) / _tmp4;
+  const Scalar _tmp18 = -_tmp17 * _tmp3;
+  const Scalar _tmp19 = -_tmp1 * _tmp17 + 1;
+  const Scalar _tmp20 = _tmp18 + _tmp19;
+  const Scalar _tmp21 = 2 * _tmp12 * _tmp8;
+  const Scalar _tmp22 = _tmp21 * z_imu_est(2, 0);
+  const Scalar _tmp23 = _tmp0 * z_imu_est(0, 0);
+  const Scalar _tmp24 = _tmp23 * z_imu_est(1, 0);
+  const Scalar _tmp25 = _tmp17 * _tmp24;
+  const Scalar _tmp26 = -_tmp22 + _tmp25;
+  const Scalar _tmp27 = _tmp21 * z_imu_est(1, 0);
+  const Scalar _tmp28 = _tmp17 * z_imu_est(2, 0);
+  const Scalar _tmp29 = _tmp23 * _tmp28;
+  const Scalar _tmp30 = _tmp27 + _tmp29;
+  const Scalar _tmp31 = _tmp20 * z_imu_est(3, 0) + _tmp26 * z_imu_est(4, 0) +
+                        _tmp30 * z_imu_est(5, 0) - z_imu_est(3, 0);
+  const Scalar _tmp32 = (Scalar(1) / Scalar(2)) * _tmp0;
+  const Scalar _tmp33 = _tmp31 * _tmp32 + dt * z_imu_est(3, 0);
+  const Scalar _tmp34 = 2 * preint_prev(3, 0);
+  const Scalar _tmp35 = _tmp34 * preint_prev(1, 0);
+  const Scalar _tmp36 = 2 * preint_prev(0, 0) * preint_prev(2, 0);
+  const Scalar _tmp37 = _tmp35 + _tmp36;
+  const Scalar _tmp38 = -_tmp17 * _tmp2;
+  const Scalar _tmp39 = _tmp19 + _tmp38;
+  const Scalar _tmp40 = _tmp21 * z_imu_est(0, 0);
+  const Scalar _tmp41 = _tmp0 * z_imu_est(1, 0);
+  const Scalar _tmp42 = _tmp28 * _tmp41;
+  const Scalar _tmp43 = _tmp40 + _tmp42;
+  const Scalar _tmp44 = -_tmp27 + _tmp29;
+  const Scalar _tmp45 = _tmp39 * z_imu_est(5, 0) + _tmp43 * z_imu_est(4, 0) +
+                        _tmp44 * z_imu_est(3, 0) - z_imu_est(5, 0);
+  const Scalar _tmp46 = _tmp32 * _tmp45 + dt * z_imu_est(5, 0);
+  const Scalar _tmp47 = _tmp34 * preint_prev(2, 0);
+  const Scalar _tmp48 = 2 * preint_prev(1, 0);
+  const Scalar _tmp49 = _tmp48 * preint_prev(0, 0);
+  const Scalar _tmp50 = -_tmp47 + _tmp49;
+  const Scalar _tmp51 = _tmp18 + _tmp38 + 1;
+  const Scalar _tmp52 = _tmp22 + _tmp25;
+  const Scalar _tmp53 = -_tmp40 + _tmp42;
+  const Scalar _tmp54 = _tmp51 * z_imu_est(4, 0) + _tmp52 * z_imu_est(3, 0) +
+                        _tmp53 * z_imu_est(5, 0) - z_imu_est(4, 0);
+  const Scalar _tmp55 = _tmp32 * _tmp54 + dt * z_imu_est(4, 0);
+  const Scalar _tmp56 = _tmp47 + _tmp49;
+  const Scalar _tmp57 = _tmp34 * preint_prev(0, 0);
+  const Scalar _tmp58 = _tmp48 * preint_prev(2, 0);
+  const Scalar _tmp59 = -_tmp57 + _tmp58;
+  const Scalar _tmp60 = 1 - 2 * std::pow(preint_prev(0, 0), Scalar(2));
+  const Scalar _tmp61 = _tmp15 + _tmp60;
+  const Scalar _tmp62 = -_tmp35 + _tmp36;
+  const Scalar _tmp63 = _tmp14 + _tmp60;
+  const Scalar _tmp64 = _tmp57 + _tmp58;
+  const Scalar _tmp65 = [&]() {
+    const Scalar base = dt;
+    return base * base * base;
+  }();
+  const Scalar _tmp66 = (Scalar(1) / Scalar(6)) * _tmp65;
+  const Scalar _tmp67 = _tmp31 * _tmp66 + _tmp32 * z_imu_est(3, 0);
+  const Scalar _tmp68 = _tmp32 * z_imu_est(5, 0) + _tmp45 * _tmp66;
+  const Scalar _tmp69 = _tmp32 * z_imu_est(4, 0) + _tmp54 * _tmp66;
+  const Scalar _tmp70 =
+      _tmp20 * preint_prev(10, 0) + _tmp44 * preint_prev(13, 0) + _tmp52 * preint_prev(11, 0);
+  const Scalar _tmp71 = std::pow(preint_prev(15, 0), Scalar(2));
+  const Scalar _tmp72 = std::pow(_tmp44, Scalar(2));
+  const Scalar _tmp73 = _tmp44 * preint_prev(14, 0) + _tmp52 * preint_prev(12, 0);
+  const Scalar _tmp74 = Scalar(0.050000000000000003) - _tmp5;
+  const Scalar _tmp75 = std::max<Scalar>(0, (((_tmp74) > 0) - ((_tmp74) < 0)));
+  const Scalar _tmp76 = _tmp5 + _tmp74 * _tmp75;
+  const Scalar _tmp77 = (Scalar(1) / Scalar(2)) * _tmp76;
+  const Scalar _tmp78 =
+      (-_tmp77 * std::cos(_tmp77) / std::sin(_tmp77) + 1) / std::pow(_tmp76, Scalar(2));
+  const Scalar _tmp79 =
+      _tmp75 * (Scalar(3.3068783068783071e-5) * std::pow(_tmp4, Scalar(2)) +
+                Scalar(0.0013888888888888889) * _tmp4 - _tmp78 + Scalar(0.083333333333333329)) +
+      _tmp78;
+  const Scalar _tmp80 = -_tmp3 * _tmp79;
+  const Scalar _tmp81 = -_tmp1 * _tmp79 + 1;
+  const Scalar _tmp82 = _tmp80 + _tmp81;
+  const Scalar _tmp83 = _tmp65 * imu_noise(0, 0);
+  const Scalar _tmp84 = _tmp79 * z_imu_est(2, 0);
+  const Scalar _tmp85 = _tmp23 * _tmp84;
+  const Scalar _tmp86 = (Scalar(1) / Scalar(2)) * dt;
+  const Scalar _tmp87 = _tmp86 * z_imu_est(1, 0);
+  const Scalar _tmp88 = _tmp85 - _tmp87;
+  const Scalar _tmp89 = _tmp65 * imu_noise(2, 0);
+  const Scalar _tmp90 = _tmp24 * _tmp79;
+  const Scalar _tmp91 = _tmp86 * z_imu_est(2, 0);
+  const Scalar _tmp92 = _tmp90 + _tmp91;
+  const Scalar _tmp93 = _tmp65 * imu_noise(1, 0);
+  const Scalar _tmp94 =
+      std::sqrt(Scalar(std::pow(_tmp70, Scalar(2)) + _tmp71 * _tmp72 + std::pow(_tmp73, Scalar(2)) +
+                       std::pow(_tmp82, Scalar(2)) * _tmp83 + std::pow(_tmp88, Scalar(2)) * _tmp89 +
+                       std::pow(_tmp92, Scalar(2)) * _tmp93 + Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp95 = _tmp90 - _tmp91;
+  const Scalar _tmp96 = Scalar(1.0) / (_tmp94);
+  const Scalar _tmp97 = _tmp82 * _tmp96;
+  const Scalar _tmp98 = _tmp83 * _tmp97;
+  const Scalar _tmp99 = _tmp44 * _tmp96;
+  const Scalar _tmp100 = _tmp71 * _tmp99;
+  const Scalar _tmp101 = -_tmp2 * _tmp79;
+  const Scalar _tmp102 = _tmp101 + _tmp80 + 1;
+  const Scalar _tmp103 = _tmp92 * _tmp93 * _tmp96;
+  const Scalar _tmp104 =
+      _tmp26 * preint_prev(10, 0) + _tmp43 * preint_prev(13, 0) + _tmp51 * preint_prev(11, 0);
+  const Scalar _tmp105 = _tmp70 * _tmp96;
+  const Scalar _tmp106 = _tmp43 * preint_prev(14, 0) + _tmp51 * preint_prev(12, 0);
+  const Scalar _tmp107 = _tmp73 * _tmp96;
+  const Scalar _tmp108 = _tmp41 * _tmp84;
+  const Scalar _tmp109 = _tmp86 * z_imu_est(0, 0);
+  const Scalar _tmp110 = _tmp108 + _tmp109;
+  const Scalar _tmp111 = _tmp88 * _tmp96;
+  const Scalar _tmp112 = _tmp111 * _tmp89;
+  const Scalar _tmp113 = _tmp100 * _tmp43 + _tmp102 * _tmp103 + _tmp104 * _tmp105 +
+                         _tmp106 * _tmp107 + _tmp110 * _tmp112 + _tmp95 * _tmp98;
+  const Scalar _tmp114 = (dt * std::sqrt(dt));
+  const Scalar _tmp115 = _tmp114 * std::sqrt(imu_noise(0, 0));
+  const Scalar _tmp116 = _tmp115 * _tmp97;
+  const Scalar _tmp117 = _tmp113 * _tmp116 - _tmp115 * _tmp95;
+  const Scalar _tmp118 = _tmp104 - _tmp105 * _tmp113;
+  const Scalar _tmp119 = _tmp114 * std::sqrt(imu_noise(2, 0));
+  const Scalar _tmp120 = _tmp111 * _tmp119;
+  const Scalar _tmp121 = -_tmp110 * _tmp119 + _tmp113 * _tmp120;
+  const Scalar _tmp122 = _tmp99 * preint_prev(15, 0);
+  const Scalar _tmp123 = -_tmp113 * _tmp122 + _tmp43 * preint_prev(15, 0);
+  const Scalar _tmp124 = _tmp106 - _tmp107 * _tmp113;
+  const Scalar _tmp125 = _tmp114 * std::sqrt(imu_noise(1, 0));
+  const Scalar _tmp126 = _tmp125 * _tmp92;
+  const Scalar _tmp127 = _tmp126 * _tmp96;
+  const Scalar _tmp128 = -_tmp102 * _tmp125 + _tmp113 * _tmp127;
+  const Scalar _tmp129 = std::sqrt(Scalar(
+      std::pow(_tmp117, Scalar(2)) + std::pow(_tmp118, Scalar(2)) + std::pow(_tmp121, Scalar(2)) +
+      std::pow(_tmp123, Scalar(2)) + std::pow(_tmp124, Scalar(2)) + std::pow(_tmp128, Scalar(2)) +
+      Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp130 = _tmp108 - _tmp109;
+  const Scalar _tmp131 =
+      _tmp30 * preint_prev(10, 0) + _tmp39 * preint_prev(13, 0) + _tmp53 * preint_prev(11, 0);
+  const Scalar _tmp132 = _tmp101 + _tmp81;
+  const Scalar _tmp133 = _tmp85 + _tmp87;
+  const Scalar _tmp134 = _tmp39 * preint_prev(14, 0) + _tmp53 * preint_prev(12, 0);
+  const Scalar _tmp135 = _tmp100 * _tmp39 + _tmp103 * _tmp130 + _tmp105 * _tmp131 +
+                         _tmp107 * _tmp134 + _tmp112 * _tmp132 + _tmp133 * _tmp98;
+  const Scalar _tmp136 = -_tmp122 * _tmp135 + _tmp39 * preint_prev(15, 0);
+  const Scalar _tmp137 = Scalar(1.0) / (_tmp129);
+  const Scalar _tmp138 = _tmp123 * _tmp137;
+  const Scalar _tmp139 = -_tmp125 * _tmp130 + _tmp127 * _tmp135;
+  const Scalar _tmp140 = _tmp128 * _tmp137;
+  const Scalar _tmp141 = -_tmp105 * _tmp135 + _tmp131;
+  const Scalar _tmp142 = _tmp118 * _tmp137;
+  const Scalar _tmp143 = -_tmp115 * _tmp133 + _tmp116 * _tmp135;
+  const Scalar _tmp144 = _tmp117 * _tmp137;
+  const Scalar _tmp145 = -_tmp107 * _tmp135 + _tmp134;
+  const Scalar _tmp146 = _tmp124 * _tmp137;
+  const Scalar _tmp147 = -_tmp119 * _tmp132 + _tmp120 * _tmp135;
+  const Scalar _tmp148 = _tmp121 * _tmp137;
+  const Scalar _tmp149 = _tmp136 * _tmp138 + _tmp139 * _tmp140 + _tmp141 * _tmp142 +
+                         _tmp143 * _tmp144 + _tmp145 * _tmp146 + _tmp147 * _tmp148;
+  const Scalar _tmp150 = _tmp141 - _tmp142 * _tmp149;
+  const Scalar _tmp151 = _tmp147 - _tmp148 * _tmp149;
+  const Scalar _tmp152 = _tmp145 - _tmp146 * _tmp149;
+  const Scalar _tmp153 = _tmp143 - _tmp144 * _tmp149;
+  const Scalar _tmp154 = _tmp139 - _tmp140 * _tmp149;
+  const Scalar _tmp155 = _tmp136 - _tmp138 * _tmp149;
+  const Scalar _tmp156 = std::sqrt(Scalar(
+      std::pow(_tmp150, Scalar(2)) + std::pow(_tmp151, Scalar(2)) + std::pow(_tmp152, Scalar(2)) +
+      std::pow(_tmp153, Scalar(2)) + std::pow(_tmp154, Scalar(2)) + std::pow(_tmp155, Scalar(2)) +
+      Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp157 = _tmp33 * preint_prev(15, 0) + preint_prev(22, 0);
+  const Scalar _tmp158 = -_tmp55 * preint_prev(15, 0) + preint_prev(18, 0);
+  const Scalar _tmp159 = _tmp157 * _tmp52 + _tmp158 * _tmp20 + _tmp44 * preint_prev(27, 0);
+  const Scalar _tmp160 = _tmp33 * preint_prev(14, 0) + preint_prev(21, 0);
+  const Scalar _tmp161 =
+      _tmp46 * preint_prev(12, 0) - _tmp55 * preint_prev(14, 0) + preint_prev(17, 0);
+  const Scalar _tmp162 = -_tmp33 * preint_prev(12, 0) + preint_prev(26, 0);
+  const Scalar _tmp163 = _tmp160 * _tmp52 + _tmp161 * _tmp20 + _tmp162 * _tmp44;
+  const Scalar _tmp164 =
+      _tmp46 * preint_prev(11, 0) - _tmp55 * preint_prev(13, 0) + preint_prev(16, 0);
+  const Scalar _tmp165 =
+      -_tmp33 * preint_prev(11, 0) + _tmp55 * preint_prev(10, 0) + preint_prev(25, 0);
+  const Scalar _tmp166 =
+      _tmp33 * preint_prev(13, 0) - _tmp46 * preint_prev(10, 0) + preint_prev(20, 0);
+  const Scalar _tmp167 = _tmp164 * _tmp20 + _tmp165 * _tmp44 + _tmp166 * _tmp52;
+  const Scalar _tmp168 = _tmp105 * _tmp167 + _tmp107 * _tmp163 + _tmp122 * _tmp159;
+  const Scalar _tmp169 = -_tmp105 * _tmp168 + _tmp167;
+  const Scalar _tmp170 = -_tmp122 * _tmp168 + _tmp159;
+  const Scalar _tmp171 = _tmp168 * _tmp96;
+  const Scalar _tmp172 = _tmp126 * _tmp171;
+  const Scalar _tmp173 = _tmp116 * _tmp168;
+  const Scalar _tmp174 = -_tmp107 * _tmp168 + _tmp163;
+  const Scalar _tmp175 = _tmp119 * _tmp88;
+  const Scalar _tmp176 = _tmp171 * _tmp175;
+  const Scalar _tmp177 = _tmp138 * _tmp170 + _tmp140 * _tmp172 + _tmp142 * _tmp169 +
+                         _tmp144 * _tmp173 + _tmp146 * _tmp174 + _tmp148 * _tmp176;
+  const Scalar _tmp178 = -_tmp138 * _tmp177 + _tmp170;
+  const Scalar _tmp179 = Scalar(1.0) / (_tmp156);
+  const Scalar _tmp180 = _tmp155 * _tmp179;
+  const Scalar _tmp181 = -_tmp140 * _tmp177 + _tmp172;
+  const Scalar _tmp182 = _tmp154 * _tmp179;
+  const Scalar _tmp183 = -_tmp148 * _tmp177 + _tmp176;
+  const Scalar _tmp184 = _tmp151 * _tmp179;
+  const Scalar _tmp185 = -_tmp144 * _tmp177 + _tmp173;
+  const Scalar _tmp186 = _tmp153 * _tmp179;
+  const Scalar _tmp187 = -_tmp146 * _tmp177 + _tmp174;
+  const Scalar _tmp188 = _tmp152 * _tmp179;
+  const Scalar _tmp189 = -_tmp142 * _tmp177 + _tmp169;
+  const Scalar _tmp190 = _tmp150 * _tmp179;
+  const Scalar _tmp191 = _tmp178 * _tmp180 + _tmp181 * _tmp182 + _tmp183 * _tmp184 +
+                         _tmp185 * _tmp186 + _tmp187 * _tmp188 + _tmp189 * _tmp190;
+  const Scalar _tmp192 = _tmp189 - _tmp190 * _tmp191;
+  const Scalar _tmp193 = _tmp181 - _tmp182 * _tmp191;
+  const Scalar _tmp194 = _tmp178 - _tmp180 * _tmp191;
+  const Scalar _tmp195 = _tmp183 - _tmp184 * _tmp191;
+  const Scalar _tmp196 =
+      _tmp20 * preint_prev(19, 0) + _tmp44 * preint_prev(28, 0) + _tmp52 * preint_prev(23, 0);
+  const Scalar _tmp197 = _tmp187 - _tmp188 * _tmp191;
+  const Scalar _tmp198 = _tmp185 - _tmp186 * _tmp191;
+  const Scalar _tmp199 = _tmp44 * preint_prev(29, 0) + _tmp52 * preint_prev(24, 0);
+  const Scalar _tmp200 = _tmp65 * imu_noise(5, 0);
+  const Scalar _tmp201 = std::pow(_tmp52, Scalar(2));
+  const Scalar _tmp202 = _tmp65 * imu_noise(4, 0);
+  const Scalar _tmp203 = std::pow(_tmp20, Scalar(2)) * imu_noise(3, 0);
+  const Scalar _tmp204 = std::pow(preint_prev(30, 0), Scalar(2));
+  const Scalar _tmp205 = std::sqrt(Scalar(
+      std::pow(_tmp192, Scalar(2)) + std::pow(_tmp193, Scalar(2)) + std::pow(_tmp194, Scalar(2)) +
+      std::pow(_tmp195, Scalar(2)) + std::pow(_tmp196, Scalar(2)) + std::pow(_tmp197, Scalar(2)) +
+      std::pow(_tmp198, Scalar(2)) + std::pow(_tmp199, Scalar(2)) + _tmp200 * _tmp72 +
+      _tmp201 * _tmp202 + _tmp203 * _tmp65 + _tmp204 * _tmp72 + Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp206 = _tmp164 * _tmp26 + _tmp165 * _tmp43 + _tmp166 * _tmp51;
+  const Scalar _tmp207 = _tmp157 * _tmp51 + _tmp158 * _tmp26 + _tmp43 * preint_prev(27, 0);
+  const Scalar _tmp208 = _tmp160 * _tmp51 + _tmp161 * _tmp26 + _tmp162 * _tmp43;
+  const Scalar _tmp209 = _tmp105 * _tmp206 + _tmp107 * _tmp208 + _tmp122 * _tmp207;
+  const Scalar _tmp210 = -_tmp122 * _tmp209 + _tmp207;
+  const Scalar _tmp211 = -_tmp105 * _tmp209 + _tmp206;
+  const Scalar _tmp212 = _tmp120 * _tmp209;
+  const Scalar _tmp213 = _tmp127 * _tmp209;
+  const Scalar _tmp214 = _tmp116 * _tmp209;
+  const Scalar _tmp215 = -_tmp107 * _tmp209 + _tmp208;
+  const Scalar _tmp216 = _tmp138 * _tmp210 + _tmp140 * _tmp213 + _tmp142 * _tmp211 +
+                         _tmp144 * _tmp214 + _tmp146 * _tmp215 + _tmp148 * _tmp212;
+  const Scalar _tmp217 = -_tmp146 * _tmp216 + _tmp215;
+  const Scalar _tmp218 = -_tmp140 * _tmp216 + _tmp213;
+  const Scalar _tmp219 = -_tmp148 * _tmp216 + _tmp212;
+  const Scalar _tmp220 = -_tmp144 * _tmp216 + _tmp214;
+  const Scalar _tmp221 = -_tmp138 * _tmp216 + _tmp210;
+  const Scalar _tmp222 = -_tmp142 * _tmp216 + _tmp211;
+  const Scalar _tmp223 = _tmp180 * _tmp221 + _tmp182 * _tmp218 + _tmp184 * _tmp219 +
+                         _tmp186 * _tmp220 + _tmp188 * _tmp217 + _tmp190 * _tmp222;
+  const Scalar _tmp224 = -_tmp186 * _tmp223 + _tmp220;
+  const Scalar _tmp225 = Scalar(1.0) / (_tmp205);
+  const Scalar _tmp226 = _tmp198 * _tmp225;
+  const Scalar _tmp227 = -_tmp188 * _tmp223 + _tmp217;
+  const Scalar _tmp228 = _tmp197 * _tmp225;
+  const Scalar _tmp229 = -_tmp184 * _tmp223 + _tmp219;
+  const Scalar _tmp230 = _tmp195 * _tmp225;
+  const Scalar _tmp231 = _tmp43 * preint_prev(29, 0) + _tmp51 * preint_prev(24, 0);
+  const Scalar _tmp232 = _tmp199 * _tmp225;
+  const Scalar _tmp233 = -_tmp190 * _tmp223 + _tmp222;
+  const Scalar _tmp234 = _tmp192 * _tmp225;
+  const Scalar _tmp235 = _tmp51 * _tmp52;
+  const Scalar _tmp236 = _tmp202 * _tmp225;
+  const Scalar _tmp237 = _tmp225 * _tmp44;
+  const Scalar _tmp238 = _tmp204 * _tmp237;
+  const Scalar _tmp239 = _tmp225 * _tmp65;
+  const Scalar _tmp240 = _tmp20 * imu_noise(3, 0);
+  const Scalar _tmp241 = _tmp240 * _tmp26;
+  const Scalar _tmp242 =
+      _tmp26 * preint_prev(19, 0) + _tmp43 * preint_prev(28, 0) + _tmp51 * preint_prev(23, 0);
+  const Scalar _tmp243 = _tmp196 * _tmp225;
+  const Scalar _tmp244 = -_tmp182 * _tmp223 + _tmp218;
+  const Scalar _tmp245 = _tmp193 * _tmp225;
+  const Scalar _tmp246 = -_tmp180 * _tmp223 + _tmp221;
+  const Scalar _tmp247 = _tmp194 * _tmp225;
+  const Scalar _tmp248 = _tmp200 * _tmp237;
+  const Scalar _tmp249 = _tmp224 * _tmp226 + _tmp227 * _tmp228 + _tmp229 * _tmp230 +
+                         _tmp231 * _tmp232 + _tmp233 * _tmp234 + _tmp235 * _tmp236 +
+                         _tmp238 * _tmp43 + _tmp239 * _tmp241 + _tmp242 * _tmp243 +
+                         _tmp244 * _tmp245 + _tmp246 * _tmp247 + _tmp248 * _tmp43;
+  const Scalar _tmp250 = std::sqrt(imu_noise(5, 0));
+  const Scalar _tmp251 = _tmp114 * _tmp250;
+  const Scalar _tmp252 = _tmp237 * _tmp251;
+  const Scalar _tmp253 = _tmp249 * _tmp252 - _tmp251 * _tmp43;
+  const Scalar _tmp254 = _tmp237 * preint_prev(30, 0);
+  const Scalar _tmp255 = -_tmp249 * _tmp254 + _tmp43 * preint_prev(30, 0);
+  const Scalar _tmp256 = _tmp233 - _tmp234 * _tmp249;
+  const Scalar _tmp257 = _tmp246 - _tmp247 * _tmp249;
+  const Scalar _tmp258 = std::sqrt(imu_noise(4, 0));
+  const Scalar _tmp259 = _tmp114 * _tmp258;
+  const Scalar _tmp260 = _tmp259 * _tmp52;
+  const Scalar _tmp261 = _tmp225 * _tmp260;
+  const Scalar _tmp262 = _tmp249 * _tmp261 - _tmp259 * _tmp51;
+  const Scalar _tmp263 = _tmp227 - _tmp228 * _tmp249;
+  const Scalar _tmp264 = _tmp224 - _tmp226 * _tmp249;
+  const Scalar _tmp265 = _tmp231 - _tmp232 * _tmp249;
+  const Scalar _tmp266 = std::sqrt(imu_noise(3, 0));
+  const Scalar _tmp267 = _tmp114 * _tmp266;
+  const Scalar _tmp268 = _tmp20 * _tmp267;
+  const Scalar _tmp269 = _tmp225 * _tmp268;
+  const Scalar _tmp270 = _tmp249 * _tmp269 - _tmp26 * _tmp267;
+  const Scalar _tmp271 = _tmp229 - _tmp230 * _tmp249;
+  const Scalar _tmp272 = _tmp242 - _tmp243 * _tmp249;
+  const Scalar _tmp273 = _tmp244 - _tmp245 * _tmp249;
+  const Scalar _tmp274 = std::sqrt(Scalar(
+      std::pow(_tmp253, Scalar(2)) + std::pow(_tmp255, Scalar(2)) + std::pow(_tmp256, Scalar(2)) +
+      std::pow(_tmp257, Scalar(2)) + std::pow(_tmp262, Scalar(2)) + std::pow(_tmp263, Scalar(2)) +
+      std::pow(_tmp264, Scalar(2)) + std::pow(_tmp265, Scalar(2)) + std::pow(_tmp270, Scalar(2)) +
+      std::pow(_tmp271, Scalar(2)) + std::pow(_tmp272, Scalar(2)) + std::pow(_tmp273, Scalar(2)) +
+      Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp275 = _tmp164 * _tmp30 + _tmp165 * _tmp39 + _tmp166 * _tmp53;
+  const Scalar _tmp276 = _tmp157 * _tmp53 + _tmp158 * _tmp30 + _tmp39 * preint_prev(27, 0);
+  const Scalar _tmp277 = _tmp160 * _tmp53 + _tmp161 * _tmp30 + _tmp162 * _tmp39;
+  const Scalar _tmp278 = _tmp105 * _tmp275 + _tmp107 * _tmp277 + _tmp122 * _tmp276;
+  const Scalar _tmp279 = _tmp127 * _tmp278;
+  const Scalar _tmp280 = _tmp116 * _tmp278;
+  const Scalar _tmp281 = -_tmp122 * _tmp278 + _tmp276;
+  const Scalar _tmp282 = -_tmp105 * _tmp278 + _tmp275;
+  const Scalar _tmp283 = -_tmp107 * _tmp278 + _tmp277;
+  const Scalar _tmp284 = _tmp120 * _tmp278;
+  const Scalar _tmp285 = _tmp138 * _tmp281 + _tmp140 * _tmp279 + _tmp142 * _tmp282 +
+                         _tmp144 * _tmp280 + _tmp146 * _tmp283 + _tmp148 * _tmp284;
+  const Scalar _tmp286 = -_tmp146 * _tmp285 + _tmp283;
+  const Scalar _tmp287 = -_tmp144 * _tmp285 + _tmp280;
+  const Scalar _tmp288 = -_tmp142 * _tmp285 + _tmp282;
+  const Scalar _tmp289 = -_tmp148 * _tmp285 + _tmp284;
+  const Scalar _tmp290 = -_tmp138 * _tmp285 + _tmp281;
+  const Scalar _tmp291 = -_tmp140 * _tmp285 + _tmp279;
+  const Scalar _tmp292 = _tmp180 * _tmp290 + _tmp182 * _tmp291 + _tmp184 * _tmp289 +
+                         _tmp186 * _tmp287 + _tmp188 * _tmp286 + _tmp190 * _tmp288;
+  const Scalar _tmp293 = -_tmp182 * _tmp292 + _tmp291;
+  const Scalar _tmp294 = -_tmp188 * _tmp292 + _tmp286;
+  const Scalar _tmp295 = -_tmp180 * _tmp292 + _tmp290;
+  const Scalar _tmp296 = _tmp240 * _tmp30;
+  const Scalar _tmp297 =
+      _tmp30 * preint_prev(19, 0) + _tmp39 * preint_prev(28, 0) + _tmp53 * preint_prev(23, 0);
+  const Scalar _tmp298 = -_tmp184 * _tmp292 + _tmp289;
+  const Scalar _tmp299 = -_tmp190 * _tmp292 + _tmp288;
+  const Scalar _tmp300 = _tmp52 * _tmp53;
+  const Scalar _tmp301 = -_tmp186 * _tmp292 + _tmp287;
+  const Scalar _tmp302 = _tmp39 * preint_prev(29, 0) + _tmp53 * preint_prev(24, 0);
+  const Scalar _tmp303 = _tmp226 * _tmp301 + _tmp228 * _tmp294 + _tmp230 * _tmp298 +
+                         _tmp232 * _tmp302 + _tmp234 * _tmp299 + _tmp236 * _tmp300 +
+                         _tmp238 * _tmp39 + _tmp239 * _tmp296 + _tmp243 * _tmp297 +
+                         _tmp245 * _tmp293 + _tmp247 * _tmp295 + _tmp248 * _tmp39;
+  const Scalar _tmp304 = -_tmp267 * _tmp30 + _tmp269 * _tmp303;
+  const Scalar _tmp305 = Scalar(1.0) / (_tmp274);
+  const Scalar _tmp306 = _tmp270 * _tmp305;
+  const Scalar _tmp307 = -_tmp259 * _tmp53 + _tmp261 * _tmp303;
+  const Scalar _tmp308 = _tmp262 * _tmp305;
+  const Scalar _tmp309 = -_tmp228 * _tmp303 + _tmp294;
+  const Scalar _tmp310 = _tmp263 * _tmp305;
+  const Scalar _tmp311 = -_tmp232 * _tmp303 + _tmp302;
+  const Scalar _tmp312 = _tmp265 * _tmp305;
+  const Scalar _tmp313 = -_tmp230 * _tmp303 + _tmp298;
+  const Scalar _tmp314 = _tmp271 * _tmp305;
+  const Scalar _tmp315 = -_tmp234 * _tmp303 + _tmp299;
+  const Scalar _tmp316 = _tmp256 * _tmp305;
+  const Scalar _tmp317 = -_tmp245 * _tmp303 + _tmp293;
+  const Scalar _tmp318 = _tmp273 * _tmp305;
+  const Scalar _tmp319 = -_tmp251 * _tmp39 + _tmp252 * _tmp303;
+  const Scalar _tmp320 = _tmp253 * _tmp305;
+  const Scalar _tmp321 = -_tmp254 * _tmp303 + _tmp39 * preint_prev(30, 0);
+  const Scalar _tmp322 = _tmp255 * _tmp305;
+  const Scalar _tmp323 = -_tmp247 * _tmp303 + _tmp295;
+  const Scalar _tmp324 = _tmp257 * _tmp305;
+  const Scalar _tmp325 = -_tmp226 * _tmp303 + _tmp301;
+  const Scalar _tmp326 = _tmp264 * _tmp305;
+  const Scalar _tmp327 = -_tmp243 * _tmp303 + _tmp297;
+  const Scalar _tmp328 = _tmp272 * _tmp305;
+  const Scalar _tmp329 = _tmp304 * _tmp306 + _tmp307 * _tmp308 + _tmp309 * _tmp310 +
+                         _tmp311 * _tmp312 + _tmp313 * _tmp314 + _tmp315 * _tmp316 +
+                         _tmp317 * _tmp318 + _tmp319 * _tmp320 + _tmp321 * _tmp322 +
+                         _tmp323 * _tmp324 + _tmp325 * _tmp326 + _tmp327 * _tmp328;
+  const Scalar _tmp330 = _tmp315 - _tmp316 * _tmp329;
+  const Scalar _tmp331 = _tmp325 - _tmp326 * _tmp329;
+  const Scalar _tmp332 = _tmp317 - _tmp318 * _tmp329;
+  const Scalar _tmp333 = _tmp319 - _tmp320 * _tmp329;
+  const Scalar _tmp334 = _tmp321 - _tmp322 * _tmp329;
+  const Scalar _tmp335 = _tmp311 - _tmp312 * _tmp329;
+  const Scalar _tmp336 = _tmp309 - _tmp310 * _tmp329;
+  const Scalar _tmp337 = _tmp313 - _tmp314 * _tmp329;
+  const Scalar _tmp338 = _tmp327 - _tmp328 * _tmp329;
+  const Scalar _tmp339 = _tmp307 - _tmp308 * _tmp329;
+  const Scalar _tmp340 = _tmp304 - _tmp306 * _tmp329;
+  const Scalar _tmp341 = _tmp323 - _tmp324 * _tmp329;
+  const Scalar _tmp342 = std::sqrt(Scalar(
+      std::pow(_tmp330, Scalar(2)) + std::pow(_tmp331, Scalar(2)) + std::pow(_tmp332, Scalar(2)) +
+      std::pow(_tmp333, Scalar(2)) + std::pow(_tmp334, Scalar(2)) + std::pow(_tmp335, Scalar(2)) +
+      std::pow(_tmp336, Scalar(2)) + std::pow(_tmp337, Scalar(2)) + std::pow(_tmp338, Scalar(2)) +
+      std::pow(_tmp339, Scalar(2)) + std::pow(_tmp340, Scalar(2)) + std::pow(_tmp341, Scalar(2)) +
+      Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp343 = _tmp68 * preint_prev(12, 0) - _tmp69 * preint_prev(14, 0) +
+                         dt * preint_prev(17, 0) + preint_prev(32, 0);
+  const Scalar _tmp344 = _tmp67 * preint_prev(14, 0) + dt * preint_prev(21, 0) + preint_prev(39, 0);
+  const Scalar _tmp345 =
+      -_tmp67 * preint_prev(12, 0) + dt * preint_prev(26, 0) + preint_prev(47, 0);
+  const Scalar _tmp346 = _tmp20 * _tmp343 + _tmp344 * _tmp52 + _tmp345 * _tmp44;
+  const Scalar _tmp347 = _tmp67 * preint_prev(15, 0) + dt * preint_prev(22, 0) + preint_prev(40, 0);
+  const Scalar _tmp348 = dt * preint_prev(27, 0) + preint_prev(48, 0);
+  const Scalar _tmp349 =
+      -_tmp69 * preint_prev(15, 0) + dt * preint_prev(18, 0) + preint_prev(33, 0);
+  const Scalar _tmp350 = _tmp20 * _tmp349 + _tmp347 * _tmp52 + _tmp348 * _tmp44;
+  const Scalar _tmp351 = -_tmp67 * preint_prev(11, 0) + _tmp69 * preint_prev(10, 0) +
+                         dt * preint_prev(25, 0) + preint_prev(46, 0);
+  const Scalar _tmp352 = _tmp68 * preint_prev(11, 0) - _tmp69 * preint_prev(13, 0) +
+                         dt * preint_prev(16, 0) + preint_prev(31, 0);
+  const Scalar _tmp353 = _tmp67 * preint_prev(13, 0) - _tmp68 * preint_prev(10, 0) +
+                         dt * preint_prev(20, 0) + preint_prev(38, 0);
+  const Scalar _tmp354 = _tmp20 * _tmp352 + _tmp351 * _tmp44 + _tmp353 * _tmp52;
+  const Scalar _tmp355 = _tmp105 * _tmp354 + _tmp107 * _tmp346 + _tmp122 * _tmp350;
+  const Scalar _tmp356 = -_tmp107 * _tmp355 + _tmp346;
+  const Scalar _tmp357 = _tmp116 * _tmp355;
+  const Scalar _tmp358 = _tmp355 * _tmp96;
+  const Scalar _tmp359 = _tmp126 * _tmp358;
+  const Scalar _tmp360 = -_tmp105 * _tmp355 + _tmp354;
+  const Scalar _tmp361 = _tmp175 * _tmp358;
+  const Scalar _tmp362 = -_tmp122 * _tmp355 + _tmp350;
+  const Scalar _tmp363 = _tmp138 * _tmp362 + _tmp140 * _tmp359 + _tmp142 * _tmp360 +
+                         _tmp144 * _tmp357 + _tmp146 * _tmp356 + _tmp148 * _tmp361;
+  const Scalar _tmp364 = -_tmp138 * _tmp363 + _tmp362;
+  const Scalar _tmp365 = -_tmp146 * _tmp363 + _tmp356;
+  const Scalar _tmp366 = -_tmp140 * _tmp363 + _tmp359;
+  const Scalar _tmp367 = -_tmp142 * _tmp363 + _tmp360;
+  const Scalar _tmp368 = -_tmp144 * _tmp363 + _tmp357;
+  const Scalar _tmp369 = -_tmp148 * _tmp363 + _tmp361;
+  const Scalar _tmp370 = _tmp180 * _tmp364 + _tmp182 * _tmp366 + _tmp184 * _tmp369 +
+                         _tmp186 * _tmp368 + _tmp188 * _tmp365 + _tmp190 * _tmp367;
+  const Scalar _tmp371 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(4));
+  const Scalar _tmp372 = _tmp225 * _tmp371;
+  const Scalar _tmp373 = _tmp372 * imu_noise(4, 0);
+  const Scalar _tmp374 = -_tmp184 * _tmp370 + _tmp369;
+  const Scalar _tmp375 = -_tmp180 * _tmp370 + _tmp364;
+  const Scalar _tmp376 = dt * preint_prev(29, 0) + preint_prev(50, 0);
+  const Scalar _tmp377 = dt * preint_prev(24, 0) + preint_prev(42, 0);
+  const Scalar _tmp378 = _tmp20 * preint_prev(35, 0) + _tmp376 * _tmp44 + _tmp377 * _tmp52;
+  const Scalar _tmp379 = -_tmp186 * _tmp370 + _tmp368;
+  const Scalar _tmp380 = dt * preint_prev(19, 0) + preint_prev(34, 0);
+  const Scalar _tmp381 = dt * preint_prev(28, 0) + preint_prev(49, 0);
+  const Scalar _tmp382 = dt * preint_prev(23, 0) + preint_prev(41, 0);
+  const Scalar _tmp383 = _tmp20 * _tmp380 + _tmp381 * _tmp44 + _tmp382 * _tmp52;
+  const Scalar _tmp384 = -_tmp190 * _tmp370 + _tmp367;
+  const Scalar _tmp385 = -_tmp188 * _tmp370 + _tmp365;
+  const Scalar _tmp386 = dt * preint_prev(30, 0) + preint_prev(51, 0);
+  const Scalar _tmp387 =
+      _tmp20 * preint_prev(36, 0) + _tmp386 * _tmp44 + _tmp52 * preint_prev(43, 0);
+  const Scalar _tmp388 = -_tmp182 * _tmp370 + _tmp366;
+  const Scalar _tmp389 = _tmp201 * _tmp373 + _tmp203 * _tmp372 + _tmp226 * _tmp379 +
+                         _tmp228 * _tmp385 + _tmp230 * _tmp374 + _tmp232 * _tmp378 +
+                         _tmp234 * _tmp384 + _tmp243 * _tmp383 + _tmp245 * _tmp388 +
+                         _tmp247 * _tmp375 + _tmp254 * _tmp387 + _tmp372 * _tmp72 * imu_noise(5, 0);
+  const Scalar _tmp390 = (Scalar(1) / Scalar(2)) * std::pow(dt, Scalar(Scalar(5) / Scalar(2)));
+  const Scalar _tmp391 = _tmp266 * _tmp390;
+  const Scalar _tmp392 = -_tmp20 * _tmp391 + _tmp269 * _tmp389;
+  const Scalar _tmp393 = -_tmp226 * _tmp389 + _tmp379;
+  const Scalar _tmp394 = -_tmp232 * _tmp389 + _tmp378;
+  const Scalar _tmp395 = _tmp250 * _tmp390;
+  const Scalar _tmp396 = _tmp252 * _tmp389 - _tmp395 * _tmp44;
+  const Scalar _tmp397 = -_tmp247 * _tmp389 + _tmp375;
+  const Scalar _tmp398 = -_tmp243 * _tmp389 + _tmp383;
+  const Scalar _tmp399 = _tmp258 * _tmp390;
+  const Scalar _tmp400 = _tmp261 * _tmp389 - _tmp399 * _tmp52;
+  const Scalar _tmp401 = -_tmp234 * _tmp389 + _tmp384;
+  const Scalar _tmp402 = -_tmp254 * _tmp389 + _tmp387;
+  const Scalar _tmp403 = -_tmp230 * _tmp389 + _tmp374;
+  const Scalar _tmp404 = -_tmp245 * _tmp389 + _tmp388;
+  const Scalar _tmp405 = -_tmp228 * _tmp389 + _tmp385;
+  const Scalar _tmp406 = _tmp306 * _tmp392 + _tmp308 * _tmp400 + _tmp310 * _tmp405 +
+                         _tmp312 * _tmp394 + _tmp314 * _tmp403 + _tmp316 * _tmp401 +
+                         _tmp318 * _tmp404 + _tmp320 * _tmp396 + _tmp322 * _tmp402 +
+                         _tmp324 * _tmp397 + _tmp326 * _tmp393 + _tmp328 * _tmp398;
+  const Scalar _tmp407 = _tmp305 * _tmp406;
+  const Scalar _tmp408 = -_tmp256 * _tmp407 + _tmp401;
+  const Scalar _tmp409 = Scalar(1.0) / (_tmp342);
+  const Scalar _tmp410 = _tmp330 * _tmp409;
+  const Scalar _tmp411 = -_tmp271 * _tmp407 + _tmp403;
+  const Scalar _tmp412 = _tmp337 * _tmp409;
+  const Scalar _tmp413 = -_tmp270 * _tmp407 + _tmp392;
+  const Scalar _tmp414 = _tmp340 * _tmp409;
+  const Scalar _tmp415 = -_tmp257 * _tmp407 + _tmp397;
+  const Scalar _tmp416 = _tmp341 * _tmp409;
+  const Scalar _tmp417 = -_tmp255 * _tmp407 + _tmp402;
+  const Scalar _tmp418 = _tmp334 * _tmp409;
+  const Scalar _tmp419 = -_tmp263 * _tmp407 + _tmp405;
+  const Scalar _tmp420 = _tmp336 * _tmp409;
+  const Scalar _tmp421 = -_tmp253 * _tmp407 + _tmp396;
+  const Scalar _tmp422 = _tmp333 * _tmp409;
+  const Scalar _tmp423 = -_tmp262 * _tmp407 + _tmp400;
+  const Scalar _tmp424 = _tmp339 * _tmp409;
+  const Scalar _tmp425 = -_tmp272 * _tmp407 + _tmp398;
+  const Scalar _tmp426 = _tmp338 * _tmp409;
+  const Scalar _tmp427 = -_tmp264 * _tmp407 + _tmp393;
+  const Scalar _tmp428 = _tmp331 * _tmp409;
+  const Scalar _tmp429 = -_tmp265 * _tmp407 + _tmp394;
+  const Scalar _tmp430 = _tmp335 * _tmp409;
+  const Scalar _tmp431 = -_tmp273 * _tmp407 + _tmp404;
+  const Scalar _tmp432 = _tmp332 * _tmp409;
+  const Scalar _tmp433 = _tmp408 * _tmp410 + _tmp411 * _tmp412 + _tmp413 * _tmp414 +
+                         _tmp415 * _tmp416 + _tmp417 * _tmp418 + _tmp419 * _tmp420 +
+                         _tmp421 * _tmp422 + _tmp423 * _tmp424 + _tmp425 * _tmp426 +
+                         _tmp427 * _tmp428 + _tmp429 * _tmp430 + _tmp431 * _tmp432;
+  const Scalar _tmp434 = _tmp423 - _tmp424 * _tmp433;
+  const Scalar _tmp435 = _tmp417 - _tmp418 * _tmp433;
+  const Scalar _tmp436 = _tmp421 - _tmp422 * _tmp433;
+  const Scalar _tmp437 = _tmp415 - _tmp416 * _tmp433;
+  const Scalar _tmp438 = std::pow(preint_prev(54, 0), Scalar(2));
+  const Scalar _tmp439 = _tmp419 - _tmp420 * _tmp433;
+  const Scalar _tmp440 = _tmp425 - _tmp426 * _tmp433;
+  const Scalar _tmp441 = _tmp413 - _tmp414 * _tmp433;
+  const Scalar _tmp442 = _tmp429 - _tmp430 * _tmp433;
+  const Scalar _tmp443 = _tmp427 - _tmp428 * _tmp433;
+  const Scalar _tmp444 = _tmp431 - _tmp432 * _tmp433;
+  const Scalar _tmp445 = _tmp411 - _tmp412 * _tmp433;
+  const Scalar _tmp446 =
+      _tmp20 * preint_prev(37, 0) + _tmp44 * preint_prev(52, 0) + _tmp52 * preint_prev(44, 0);
+  const Scalar _tmp447 = _tmp44 * preint_prev(53, 0) + _tmp52 * preint_prev(45, 0);
+  const Scalar _tmp448 = _tmp408 - _tmp410 * _tmp433;
+  const Scalar _tmp449 = std::sqrt(Scalar(
+      std::pow(_tmp434, Scalar(2)) + std::pow(_tmp435, Scalar(2)) + std::pow(_tmp436, Scalar(2)) +
+      std::pow(_tmp437, Scalar(2)) + _tmp438 * _tmp72 + std::pow(_tmp439, Scalar(2)) +
+      std::pow(_tmp440, Scalar(2)) + std::pow(_tmp441, Scalar(2)) + std::pow(_tmp442, Scalar(2)) +
+      std::pow(_tmp443, Scalar(2)) + std::pow(_tmp444, Scalar(2)) + std::pow(_tmp445, Scalar(2)) +
+      std::pow(_tmp446, Scalar(2)) + std::pow(_tmp447, Scalar(2)) + std::pow(_tmp448, Scalar(2)) +
+      Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp450 = _tmp26 * _tmp343 + _tmp344 * _tmp51 + _tmp345 * _tmp43;
+  const Scalar _tmp451 = _tmp26 * _tmp349 + _tmp347 * _tmp51 + _tmp348 * _tmp43;
+  const Scalar _tmp452 = _tmp26 * _tmp352 + _tmp351 * _tmp43 + _tmp353 * _tmp51;
+  const Scalar _tmp453 = _tmp105 * _tmp452 + _tmp107 * _tmp450 + _tmp122 * _tmp451;
+  const Scalar _tmp454 = _tmp127 * _tmp453;
+  const Scalar _tmp455 = _tmp120 * _tmp453;
+  const Scalar _tmp456 = -_tmp105 * _tmp453 + _tmp452;
+  const Scalar _tmp457 = -_tmp122 * _tmp453 + _tmp451;
+  const Scalar _tmp458 = -_tmp107 * _tmp453 + _tmp450;
+  const Scalar _tmp459 = _tmp116 * _tmp453;
+  const Scalar _tmp460 = _tmp138 * _tmp457 + _tmp140 * _tmp454 + _tmp142 * _tmp456 +
+                         _tmp144 * _tmp459 + _tmp146 * _tmp458 + _tmp148 * _tmp455;
+  const Scalar _tmp461 = -_tmp140 * _tmp460 + _tmp454;
+  const Scalar _tmp462 = -_tmp146 * _tmp460 + _tmp458;
+  const Scalar _tmp463 = -_tmp142 * _tmp460 + _tmp456;
+  const Scalar _tmp464 = -_tmp148 * _tmp460 + _tmp455;
+  const Scalar _tmp465 = -_tmp138 * _tmp460 + _tmp457;
+  const Scalar _tmp466 = -_tmp144 * _tmp460 + _tmp459;
+  const Scalar _tmp467 = _tmp180 * _tmp465 + _tmp182 * _tmp461 + _tmp184 * _tmp464 +
+                         _tmp186 * _tmp466 + _tmp188 * _tmp462 + _tmp190 * _tmp463;
+  const Scalar _tmp468 = _tmp26 * preint_prev(35, 0) + _tmp376 * _tmp43 + _tmp377 * _tmp51;
+  const Scalar _tmp469 = _tmp26 * _tmp380 + _tmp381 * _tmp43 + _tmp382 * _tmp51;
+  const Scalar _tmp470 = -_tmp180 * _tmp467 + _tmp465;
+  const Scalar _tmp471 = -_tmp184 * _tmp467 + _tmp464;
+  const Scalar _tmp472 =
+      _tmp26 * preint_prev(36, 0) + _tmp386 * _tmp43 + _tmp51 * preint_prev(43, 0);
+  const Scalar _tmp473 = _tmp237 * _tmp371 * imu_noise(5, 0);
+  const Scalar _tmp474 = -_tmp190 * _tmp467 + _tmp463;
+  const Scalar _tmp475 = -_tmp182 * _tmp467 + _tmp461;
+  const Scalar _tmp476 = -_tmp186 * _tmp467 + _tmp466;
+  const Scalar _tmp477 = -_tmp188 * _tmp467 + _tmp462;
+  const Scalar _tmp478 = _tmp226 * _tmp476 + _tmp228 * _tmp477 + _tmp230 * _tmp471 +
+                         _tmp232 * _tmp468 + _tmp234 * _tmp474 + _tmp235 * _tmp373 +
+                         _tmp241 * _tmp372 + _tmp243 * _tmp469 + _tmp245 * _tmp475 +
+                         _tmp247 * _tmp470 + _tmp254 * _tmp472 + _tmp43 * _tmp473;
+  const Scalar _tmp479 = -_tmp243 * _tmp478 + _tmp469;
+  const Scalar _tmp480 = -_tmp247 * _tmp478 + _tmp470;
+  const Scalar _tmp481 = -_tmp228 * _tmp478 + _tmp477;
+  const Scalar _tmp482 = -_tmp254 * _tmp478 + _tmp472;
+  const Scalar _tmp483 = -_tmp226 * _tmp478 + _tmp476;
+  const Scalar _tmp484 = _tmp225 * _tmp478;
+  const Scalar _tmp485 = _tmp260 * _tmp484 - _tmp399 * _tmp51;
+  const Scalar _tmp486 = -_tmp232 * _tmp478 + _tmp468;
+  const Scalar _tmp487 = -_tmp245 * _tmp478 + _tmp475;
+  const Scalar _tmp488 = -_tmp234 * _tmp478 + _tmp474;
+  const Scalar _tmp489 = -_tmp26 * _tmp391 + _tmp268 * _tmp484;
+  const Scalar _tmp490 = -_tmp230 * _tmp478 + _tmp471;
+  const Scalar _tmp491 = _tmp252 * _tmp478 - _tmp395 * _tmp43;
+  const Scalar _tmp492 = _tmp306 * _tmp489 + _tmp308 * _tmp485 + _tmp310 * _tmp481 +
+                         _tmp312 * _tmp486 + _tmp314 * _tmp490 + _tmp316 * _tmp488 +
+                         _tmp318 * _tmp487 + _tmp320 * _tmp491 + _tmp322 * _tmp482 +
+                         _tmp324 * _tmp480 + _tmp326 * _tmp483 + _tmp328 * _tmp479;
+  const Scalar _tmp493 = -_tmp316 * _tmp492 + _tmp488;
+  const Scalar _tmp494 = -_tmp312 * _tmp492 + _tmp486;
+  const Scalar _tmp495 = -_tmp306 * _tmp492 + _tmp489;
+  const Scalar _tmp496 = -_tmp326 * _tmp492 + _tmp483;
+  const Scalar _tmp497 = -_tmp308 * _tmp492 + _tmp485;
+  const Scalar _tmp498 = -_tmp318 * _tmp492 + _tmp487;
+  const Scalar _tmp499 = -_tmp314 * _tmp492 + _tmp490;
+  const Scalar _tmp500 = -_tmp324 * _tmp492 + _tmp480;
+  const Scalar _tmp501 = -_tmp322 * _tmp492 + _tmp482;
+  const Scalar _tmp502 = -_tmp320 * _tmp492 + _tmp491;
+  const Scalar _tmp503 = -_tmp328 * _tmp492 + _tmp479;
+  const Scalar _tmp504 = -_tmp310 * _tmp492 + _tmp481;
+  const Scalar _tmp505 = _tmp410 * _tmp493 + _tmp412 * _tmp499 + _tmp414 * _tmp495 +
+                         _tmp416 * _tmp500 + _tmp418 * _tmp501 + _tmp420 * _tmp504 +
+                         _tmp422 * _tmp502 + _tmp424 * _tmp497 + _tmp426 * _tmp503 +
+                         _tmp428 * _tmp496 + _tmp430 * _tmp494 + _tmp432 * _tmp498;
+  const Scalar _tmp506 = _tmp409 * _tmp505;
+  const Scalar _tmp507 = -_tmp336 * _tmp506 + _tmp504;
+  const Scalar _tmp508 = Scalar(1.0) / (_tmp449);
+  const Scalar _tmp509 = _tmp439 * _tmp508;
+  const Scalar _tmp510 = _tmp438 * _tmp44 * _tmp508;
+  const Scalar _tmp511 = -_tmp332 * _tmp506 + _tmp498;
+  const Scalar _tmp512 = _tmp444 * _tmp508;
+  const Scalar _tmp513 = -_tmp340 * _tmp506 + _tmp495;
+  const Scalar _tmp514 = _tmp441 * _tmp508;
+  const Scalar _tmp515 = _tmp43 * preint_prev(53, 0) + _tmp51 * preint_prev(45, 0);
+  const Scalar _tmp516 = _tmp447 * _tmp508;
+  const Scalar _tmp517 = -_tmp339 * _tmp506 + _tmp497;
+  const Scalar _tmp518 = _tmp434 * _tmp508;
+  const Scalar _tmp519 = -_tmp422 * _tmp505 + _tmp502;
+  const Scalar _tmp520 = _tmp436 * _tmp508;
+  const Scalar _tmp521 =
+      _tmp26 * preint_prev(37, 0) + _tmp43 * preint_prev(52, 0) + _tmp51 * preint_prev(44, 0);
+  const Scalar _tmp522 = _tmp446 * _tmp508;
+  const Scalar _tmp523 = -_tmp330 * _tmp506 + _tmp493;
+  const Scalar _tmp524 = _tmp448 * _tmp508;
+  const Scalar _tmp525 = -_tmp337 * _tmp506 + _tmp499;
+  const Scalar _tmp526 = _tmp445 * _tmp508;
+  const Scalar _tmp527 = -_tmp331 * _tmp506 + _tmp496;
+  const Scalar _tmp528 = _tmp443 * _tmp508;
+  const Scalar _tmp529 = -_tmp430 * _tmp505 + _tmp494;
+  const Scalar _tmp530 = _tmp442 * _tmp508;
+  const Scalar _tmp531 = -_tmp426 * _tmp505 + _tmp503;
+  const Scalar _tmp532 = _tmp440 * _tmp508;
+  const Scalar _tmp533 = -_tmp341 * _tmp506 + _tmp500;
+  const Scalar _tmp534 = _tmp437 * _tmp508;
+  const Scalar _tmp535 = -_tmp334 * _tmp506 + _tmp501;
+  const Scalar _tmp536 = _tmp435 * _tmp508;
+  const Scalar _tmp537 = _tmp43 * _tmp510 + _tmp507 * _tmp509 + _tmp511 * _tmp512 +
+                         _tmp513 * _tmp514 + _tmp515 * _tmp516 + _tmp517 * _tmp518 +
+                         _tmp519 * _tmp520 + _tmp521 * _tmp522 + _tmp523 * _tmp524 +
+                         _tmp525 * _tmp526 + _tmp527 * _tmp528 + _tmp529 * _tmp530 +
+                         _tmp531 * _tmp532 + _tmp533 * _tmp534 + _tmp535 * _tmp536;
+  const Scalar _tmp538 = _tmp527 - _tmp528 * _tmp537;
+  const Scalar _tmp539 = _tmp519 - _tmp520 * _tmp537;
+  const Scalar _tmp540 = _tmp529 - _tmp530 * _tmp537;
+  const Scalar _tmp541 = _tmp508 * _tmp537;
+  const Scalar _tmp542 = -_tmp434 * _tmp541 + _tmp517;
+  const Scalar _tmp543 = _tmp511 - _tmp512 * _tmp537;
+  const Scalar _tmp544 = -_tmp448 * _tmp541 + _tmp523;
+  const Scalar _tmp545 = _tmp535 - _tmp536 * _tmp537;
+  const Scalar _tmp546 = -_tmp441 * _tmp541 + _tmp513;
+  const Scalar _tmp547 = -_tmp445 * _tmp541 + _tmp525;
+  const Scalar _tmp548 = -_tmp446 * _tmp541 + _tmp521;
+  const Scalar _tmp549 = _tmp533 - _tmp534 * _tmp537;
+  const Scalar _tmp550 = _tmp531 - _tmp532 * _tmp537;
+  const Scalar _tmp551 = _tmp515 - _tmp516 * _tmp537;
+  const Scalar _tmp552 = _tmp507 - _tmp509 * _tmp537;
+  const Scalar _tmp553 = _tmp44 * preint_prev(54, 0);
+  const Scalar _tmp554 = _tmp43 * preint_prev(54, 0) - _tmp541 * _tmp553;
+  const Scalar _tmp555 = std::sqrt(Scalar(
+      std::pow(_tmp538, Scalar(2)) + std::pow(_tmp539, Scalar(2)) + std::pow(_tmp540, Scalar(2)) +
+      std::pow(_tmp542, Scalar(2)) + std::pow(_tmp543, Scalar(2)) + std::pow(_tmp544, Scalar(2)) +
+      std::pow(_tmp545, Scalar(2)) + std::pow(_tmp546, Scalar(2)) + std::pow(_tmp547, Scalar(2)) +
+      std::pow(_tmp548, Scalar(2)) + std::pow(_tmp549, Scalar(2)) + std::pow(_tmp550, Scalar(2)) +
+      std::pow(_tmp551, Scalar(2)) + std::pow(_tmp552, Scalar(2)) + std::pow(_tmp554, Scalar(2)) +
+      Scalar(9.9999999999999998e-13)));
+  const Scalar _tmp556 = _tmp30 * _tmp343 + _tmp344 * _tmp53 + _tmp345 * _tmp39;
+  const Scalar _tmp557 = _tmp30 * _tmp349 + _tmp347 * _tmp53 + _tmp348 * _tmp39;
+  const Scalar _tmp558 = _tmp30 * _tmp352 + _tmp351 * _tmp39 + _tmp353 * _tmp53;
+  const Scalar _tmp559 = _tmp105 * _tmp558 + _tmp107 * _tmp556 + _tmp122 * _tmp557;
+  const Scalar _tmp560 = -_tmp122 * _tmp559 + _tmp557;
+  const Scalar _tmp561 = _tmp116 * _tmp559;
+  const Scalar _tmp562 = _tmp120 * _tmp559;
+  const Scalar _tmp563 = _tmp127 * _tmp559;
+  const Scalar _tmp564 = -_tmp105 * _tmp559 + _tmp558;
+  const Scalar _tmp565 = -_tmp107 * _tmp559 + _tmp556;
+  const Scalar _tmp566 = _tmp138 * _tmp560 + _tmp140 * _tmp563 + _tmp142 * _tmp564 +
+                         _tmp144 * _tmp561 + _tmp146 * _tmp565 + _tmp148 * _tmp562;
+  const Scalar _tmp567 = -_tmp138 * _tmp566 + _tmp560;
+  const Scalar _tmp568 = -_tmp146 * _tmp566 + _tmp565;
+  const Scalar _tmp569 = -_tmp142 * _tmp566 + _tmp564;
+  const Scalar _tmp570 = -_tmp148 * _tmp566 + _tmp562;
+  const Scalar _tmp571 = -_tmp144 * _tmp566 + _tmp561;
+  const Scalar _tmp572 = -_tmp140 * _tmp566 + _tmp563;
+  const Scalar _tmp573 = _tmp180 * _tmp567 + _tmp182 * _tmp572 + _tmp184 * _tmp570 +
+                         _tmp186 * _tmp571 + _tmp188 * _tmp568 + _tmp190 * _tmp569;
+  const Scalar _tmp574 = _tmp30 * preint_prev(35, 0) + _tmp376 * _tmp39 + _tmp377 * _tmp53;
+  const Scalar _tmp575 = -_tmp184 * _tmp573 + _tmp570;
+  const Scalar _tmp576 =
+      _tmp30 * preint_prev(36, 0) + _tmp386 * _tmp39 + _tmp53 * preint_prev(43, 0);
+  const Scalar _tmp577 = -_tmp186 * _tmp573 + _tmp571;
+  const Scalar _tmp578 = _tmp30 * _tmp380 + _tmp381 * _tmp39 + _tmp382 * _tmp53;
+  const Scalar _tmp579 = -_tmp188 * _tmp573 + _tmp568;
+  const Scalar _tmp580 = -_tmp180 * _tmp573 + _tmp567;
+  const Scalar _tmp581 = -_tmp182 * _tmp573 + _tmp572;
+  const Scalar _tmp582 = -_tmp190 * _tmp573 + _tmp569;
+  const Scalar _tmp583 = _tmp226 * _tmp577 + _tmp228 * _tmp579 + _tmp230 * _tmp575 +
+                         _tmp232 * _tmp574 + _tmp234 * _tmp582 + _tmp243 * _tmp578 +
+                         _tmp245 * _tmp581 + _tmp247 * _tmp580 + _tmp254 * _tmp576 +
+                         _tmp296 * _tmp372 + _tmp300 * _tmp373 + _tmp39 * _tmp473;
+  const Scalar _tmp584 = -_tmp234 * _tmp583 + _tmp582;
+  const Scalar _tmp585 = -_tmp247 * _tmp583 + _tmp580;
+  const Scalar _tmp586 = -_tmp245 * _tmp583 + _tmp581;
+  const Scalar _tmp587 = _tmp252 * _tmp583 - _tmp39 * _tmp395;
+  const Scalar _tmp588 = _tmp261 * _tmp583 - _tmp399 * _tmp53;
+  const Scalar _tmp589 = -_tmp230 * _tmp583 + _tmp575;
+  const Scalar _tmp590 = -_tmp243 * _tmp583 + _tmp578;
+  const Scalar _tmp591 = _tmp269 * _tmp583 - _tmp30 * _tmp391;
+  const Scalar _tmp592 = -_tmp232 * _tmp583 + _tmp574;
+  const Scalar _tmp593 = -_tmp226 * _tmp583 + _tmp577;
+  const Scalar _tmp594 = -_tmp228 * _tmp583 + _tmp579;
+  const Scalar _tmp595 = -_tmp254 * _tmp583 + _tmp576;
+  const Scalar _tmp596 = _tmp306 * _tmp591 + _tmp308 * _tmp588 + _tmp310 * _tmp594 +
+                         _tmp312 * _tmp592 + _tmp314 * _tmp589 + _tmp316 * _tmp584 +
+                         _tmp318 * _tmp586 + _tmp320 * _tmp587 + _tmp322 * _tmp595 +
+                         _tmp324 * _tmp585 + _tmp326 * _tmp593 + _tmp328 * _tmp590;
+  const Scalar _tmp597 = _tmp305 * _tmp596;
+  const Scalar _tmp598 = -_tmp263 * _tmp597 + _tmp594;
+  const Scalar _tmp599 = -_tmp328 * _tmp596 + _tmp590;
+  const Scalar _tmp600 = -_tmp318 * _tmp596 + _tmp586;
+  const Scalar _tmp601 = -_tmp326 * _tmp596 + _tmp593;
+  const Scalar _tmp602 = -_tmp270 * _tmp597 + _tmp591;
+  const Scalar _tmp603 = -_tmp312 * _tmp596 + _tmp592;
+  const Scalar _tmp604 = -_tmp320 * _tmp596 + _tmp587;
+  const Scalar _tmp605 = -_tmp255 * _tmp597 + _tmp595;
+  const Scalar _tmp606 = -_tmp316 * _tmp596 + _tmp584;
+  const Scalar _tmp607 = -_tmp271 * _tmp597 + _tmp589;
+  const Scalar _tmp608 = -_tmp308 * _tmp596 + _tmp588;
+  const Scalar _tmp609 = -_tmp324 * _tmp596 + _tmp585;
+  const Scalar _tmp610 = _tmp410 * _tmp606 + _tmp412 * _tmp607 + _tmp414 * _tmp602 +
+                         _tmp416 * _tmp609 + _tmp418 * _tmp605 + _tmp420 * _tmp598 +
+                         _tmp422 * _tmp604 + _tmp424 * _tmp608 + _tmp426 * _tmp599 +
+                         _tmp428 * _tmp601 + _tmp430 * _tmp603 + _tmp432 * _tmp600;
+  const Scalar _tmp611 = -_tmp426 * _tmp610 + _tmp599;
+  const Scalar _tmp612 =
+      _tmp30 * preint_prev(37, 0) + _tmp39 * preint_prev(52, 0) + _tmp53 * preint_prev(44, 0);
+  const Scalar _tmp613 = _tmp409 * _tmp610;
+  const Scalar _tmp614 = -_tmp330 * _tmp613 + _tmp606;
+  const Scalar _tmp615 = -_tmp412 * _tmp610 + _tmp607;
+  const Scalar _tmp616 = -_tmp414 * _tmp610 + _tmp602;
+  const Scalar _tmp617 = -_tmp331 * _tmp613 + _tmp601;
+  const Scalar _tmp618 = -_tmp422 * _tmp610 + _tmp604;
+  const Scalar _tmp619 = -_tmp336 * _tmp613 + _tmp598;
+  const Scalar _tmp620 = -_tmp332 * _tmp613 + _tmp600;
+  const Scalar _tmp621 = -_tmp334 * _tmp613 + _tmp605;
+  const Scalar _tmp622 = -_tmp430 * _tmp610 + _tmp603;
+  const Scalar _tmp623 = -_tmp341 * _tmp613 + _tmp609;
+  const Scalar _tmp624 = -_tmp339 * _tmp613 + _tmp608;
+  const Scalar _tmp625 = _tmp39 * preint_prev(53, 0) + _tmp53 * preint_prev(45, 0);
+  const Scalar _tmp626 = _tmp39 * _tmp510 + _tmp509 * _tmp619 + _tmp512 * _tmp620 +
+                         _tmp514 * _tmp616 + _tmp516 * _tmp625 + _tmp518 * _tmp624 +
+                         _tmp520 * _tmp618 + _tmp522 * _tmp612 + _tmp524 * _tmp614 +
+                         _tmp526 * _tmp615 + _tmp528 * _tmp617 + _tmp530 * _tmp622 +
+                         _tmp532 * _tmp611 + _tmp534 * _tmp623 + _tmp536 * _tmp621;
+  const Scalar _tmp627 = _tmp508 * _tmp626;
+  const Scalar _tmp628 = -_tmp446 * _tmp627 + _tmp612;
+  const Scalar _tmp629 = Scalar(1.0) / (_tmp555);
+  const Scalar _tmp630 = -_tmp435 * _tmp627 + _tmp621;
+  const Scalar _tmp631 = -_tmp437 * _tmp627 + _tmp623;
+  const Scalar _tmp632 = -_tmp441 * _tmp627 + _tmp616;
+  const Scalar _tmp633 = -_tmp442 * _tmp627 + _tmp622;
+  const Scalar _tmp634 = -_tmp443 * _tmp627 + _tmp617;
+  const Scalar _tmp635 = -_tmp434 * _tmp627 + _tmp624;
+  const Scalar _tmp636 = -_tmp444 * _tmp627 + _tmp620;
+  const Scalar _tmp637 = -_tmp448 * _tmp627 + _tmp614;
+  const Scalar _tmp638 = _tmp39 * preint_prev(54, 0) - _tmp553 * _tmp627;
+  const Scalar _tmp639 = -_tmp447 * _tmp627 + _tmp625;
+  const Scalar _tmp640 = -_tmp439 * _tmp627 + _tmp619;
+  const Scalar _tmp641 = -_tmp440 * _tmp627 + _tmp611;
+  const Scalar _tmp642 = -_tmp445 * _tmp627 + _tmp615;
+  const Scalar _tmp643 = -_tmp436 * _tmp627 + _tmp618;
+  const Scalar _tmp644 =
+      _tmp538 * _tmp629 * _tmp634 + _tmp539 * _tmp629 * _tmp643 + _tmp540 * _tmp629 * _tmp633 +
+      _tmp542 * _tmp629 * _tmp635 + _tmp543 * _tmp629 * _tmp636 + _tmp544 * _tmp629 * _tmp637 +
+      _tmp545 * _tmp629 * _tmp630 + _tmp546 * _tmp629 * _tmp632 + _tmp547 * _tmp629 * _tmp642 +
+      _tmp548 * _tmp628 * _tmp629 + _tmp549 * _tmp629 * _tmp631 + _tmp550 * _tmp629 * _tmp641 +
+      _tmp551 * _tmp629 * _tmp639 + _tmp552 * _tmp629 * _tmp640 + _tmp554 * _tmp629 * _tmp638;
+  const Scalar _tmp645 = _tmp629 * _tmp644;
+
+  // Output terms (2)
+  if (upsilon != nullptr) {
+    Eigen::Matrix<Scalar, 10, 1>& _upsilon = (*upsilon);
+
+    _upsilon(0, 0) = _tmp10 * z_imu_est(2, 0) + _tmp11 * z_imu_est(0, 0) +
+                     _tmp12 * preint_prev(0, 0) - _tmp9 * z_imu_est(1, 0);
+    _upsilon(1, 0) = _tmp11 * z_imu_est(1, 0) + _tmp12 * preint_prev(1, 0) -
+                     _tmp13 * z_imu_est(2, 0) + _tmp9 * z_imu_est(0, 0);
+    _upsilon(2, 0) = -_tmp10 * z_imu_est(0, 0) + _tmp11 * z_imu_est(2, 0) +
+                     _tmp12 * preint_prev(2, 0) + _tmp13 * z_imu_est(1, 0);
+    _upsilon(3, 0) = -_tmp10 * z_imu_est(1, 0) + _tmp12 * preint_prev(3, 0) -
+                     _tmp13 * z_imu_est(0, 0) - _tmp9 * z_imu_est(2, 0);
+    _upsilon(4, 0) = _tmp16 * _tmp33 + _tmp37 * _tmp46 + _tmp50 * _tmp55 + preint_prev(4, 0);
+    _upsilon(5, 0) = _tmp33 * _tmp56 + _tmp46 * _tmp59 + _tmp55 * _tmp61 + preint_prev(5, 0);
+    _upsilon(6, 0) = _tmp33 * _tmp62 + _tmp46 * _tmp63 + _tmp55 * _tmp64 + preint_prev(6, 0);
+    _upsilon(7, 0) = _tmp16 * _tmp67 + _tmp37 * _tmp68 + _tmp50 * _tmp69 + dt * preint_prev(4, 0) +
+                     preint_prev(7, 0);
+    _upsilon(8, 0) = _tmp56 * _tmp67 + _tmp59 * _tmp68 + _tmp61 * _tmp69 + dt * preint_prev(5, 0) +
+                     preint_prev(8, 0);
+    _upsilon(9, 0) = _tmp62 * _tmp67 + _tmp63 * _tmp68 + _tmp64 * _tmp69 + dt * preint_prev(6, 0) +
+                     preint_prev(9, 0);
+  }
+
+  if (cov_sqrt != nullptr) {
+    Eigen::Matrix<Scalar, 45, 1>& _cov_sqrt = (*cov_sqrt);
+
+    _cov_sqrt(0, 0) = _tmp94;
+    _cov_sqrt(1, 0) = _tmp113;
+    _cov_sqrt(2, 0) = _tmp129;
+    _cov_sqrt(3, 0) = _tmp135;
+    _cov_sqrt(4, 0) = _tmp149;
+    _cov_sqrt(5, 0) = _tmp156;
+    _cov_sqrt(6, 0) = _tmp168;
+    _cov_sqrt(7, 0) = _tmp177;
+    _cov_sqrt(8, 0) = _tmp191;
+    _cov_sqrt(9, 0) = _tmp205;
+    _cov_sqrt(10, 0) = _tmp209;
+    _cov_sqrt(11, 0) = _tmp216;
+    _cov_sqrt(12, 0) = _tmp223;
+    _cov_sqrt(13, 0) = _tmp249;
+    _cov_sqrt(14, 0) = _tmp274;
+    _cov_sqrt(15, 0) = _tmp278;
+    _cov_sqrt(16, 0) = _tmp285;
+    _cov_sqrt(17, 0) = _tmp292;
+    _cov_sqrt(18, 0) = _tmp303;
+    _cov_sqrt(19, 0) = _tmp329;
+    _cov_sqrt(20, 0) = _tmp342;
+    _cov_sqrt(21, 0) = _tmp355;
+    _cov_sqrt(22, 0) = _tmp363;
+    _cov_sqrt(23, 0) = _tmp370;
+    _cov_sqrt(24, 0) = _tmp389;
+    _cov_sqrt(25, 0) = _tmp406;
+    _cov_sqrt(26, 0) = _tmp433;
+    _cov_sqrt(27, 0) = _tmp449;
+    _cov_sqrt(28, 0) = _tmp453;
+    _cov_sqrt(29, 0) = _tmp460;
+    _cov_sqrt(30, 0) = _tmp467;
+    _cov_sqrt(31, 0) = _tmp478;
+    _cov_sqrt(32, 0) = _tmp492;
+    _cov_sqrt(33, 0) = _tmp505;
+    _cov_sqrt(34, 0) = _tmp537;
+    _cov_sqrt(35, 0) = _tmp555;
+    _cov_sqrt(36, 0) = _tmp559;
+    _cov_sqrt(37, 0) = _tmp566;
+    _cov_sqrt(38, 0) = _tmp573;
+    _cov_sqrt(39, 0) = _tmp583;
+    _cov_sqrt(40, 0) = _tmp596;
+    _cov_sqrt(41, 0) = _tmp610;
+    _cov_sqrt(42, 0) = _tmp626;
+    _cov_sqrt(43, 0) = _tmp644;
+    _cov_sqrt(44, 0) = std::sqrt(Scalar(std::pow(Scalar(-_tmp538 * _tmp645 + _tmp634), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp539 * _tmp645 + _tmp643), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp540 * _tmp645 + _tmp633), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp542 * _tmp645 + _tmp635), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp543 * _tmp645 + _tmp636), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp544 * _tmp645 + _tmp637), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp545 * _tmp645 + _tmp630), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp546 * _tmp645 + _tmp632), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp547 * _tmp645 + _tmp642), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp548 * _tmp645 + _tmp628), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp549 * _tmp645 + _tmp631), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp550 * _tmp645 + _tmp641), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp551 * _tmp645 + _tmp639), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp552 * _tmp645 + _tmp640), Scalar(2)) +
+                                        std::pow(Scalar(-_tmp554 * _tmp645 + _tmp638), Scalar(2)) +
+                                        Scalar(9.9999999999999998e-13)));
+  }
+}  // NOLINT(readability/fn_size)
+
+// NOLINTNEXTLINE(readability/fn_size)
+}  // namespace sym
@@ -1,29 +1,73 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 import inspect
 from pathlib import Path
 from importlib.util import spec_from_file_location, module_from_spec
 import sys
 from shutil import copyfile
-from functools import partial, wraps
+from functools import partial, wraps, cached_property
+import hashlib
+import os
+import json
 import inspect
 import sys
 from typing import ClassVar, TypeVar, Generic, ParamSpec, Callable
 import numpy as np
 
+import symforce
 from symforce import symbolic as sf, codegen
 from symforce.values import Values
 from symforce import python_util
 from symforce.geo import Matrix
-from states import SymState
+from states import SymState, NumericState
+from se23.pose23_SE23 import SMALL_ANGLE, small_angle_threshold
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
 import jinja2
 import re
 
 CPP_DIR = Path(__file__).parent / "cpp"
+# headers, signatures and libraries by cache key, safe to delete. Stale entries
+# of the registered functions are removed by FuncWrapper.prune_cache
+CACHE_DIR = CPP_DIR / "cache"
+PROJECT_DIR = Path(__file__).parents[1]
+
+
+def is_project_module(obj) -> bool:
+    """Whether obj is, or is defined in, a module of the project"""
+    module = obj if inspect.ismodule(obj) else inspect.getmodule(obj)
+    file = getattr(module, "__file__", None)
+    return file is not None and Path(file).resolve().is_relative_to(
+        PROJECT_DIR.resolve()
+    )
+
+
+def source_files(obj, found: set[Path] = None) -> set[Path]:
+    """Files defining obj, its base classes and the types of its dataclass
+    fields, and of the project modules referenced by the globals of those
+    files, so a helper called from a function body is part of its key"""
+    found = set() if found is None else found
+    for cls in getattr(obj, "__mro__", (obj,)):
+        module = inspect.getmodule(cls)
+        file = getattr(module, "__file__", None)
+        if file is None or Path(file) in found:
+            continue
+        found.add(Path(file))
+        if is_dataclass(cls):
+            for att in fields(cls):
+                source_files(att.type, found)
+        if is_project_module(module):
+            for value in list(vars(module).values()):
+                if is_project_module(value):
+                    source_files(value, found)
+    return found
 
 
 Params = ParamSpec("Params")
 RetVal = TypeVar("RetVal")
+
+
 # Function = TypeVar("RetVal", bound=Callable[Params, RetVal])
 @dataclass
 class jinjafunc:
@@ -41,18 +85,35 @@ class FuncWrapper(Generic[Params, RetVal]):
 
     _registered: ClassVar[set["FuncWrapper"]] = set()
     _cmodule: ClassVar = None
-
-    def __init__(self, func: Callable[Params, RetVal]):
+    # every kernel is bound once per scalar type, pybind11 picks the overload
+    # whose buffers match the dtype of the arrays without conversion
+    SCALARS: ClassVar[dict[str, type]] = {"double": np.float64, "float": np.float32}
+
+    def __init__(
+        self,
+        func: Callable[Params, RetVal],
+        carry: str = None,
+        small_angle: float = SMALL_ANGLE,
+    ):
+        """carry names the input that the outputs are fed back into by the
+        generated <name>_scan loop, the outputs must match its storage.
+        small_angle is the threshold of the Lie group coefficients in the
+        generated code, see se23.pose23_SE23.small_angle_blend"""
         self.__class__._registered.add(self)
         self.func = func
+        self.carry = carry
+        self.small_angle = small_angle
 
     @classmethod
     def wrap(
-        cls, func: Callable[Params, RetVal]
+        cls,
+        func: Callable[Params, RetVal],
+        carry: str = None,
+        small_angle: float = SMALL_ANGLE,
     ) -> "FuncWrapper[Params, RetVal]" | Callable[Params, RetVal]:
         """Remove this for python 11 and use Params in __call__ like here
         https://rednafi.github.io/reflections/static-typing-python-decorators.html"""
-        return cls(func)
+        return cls(func, carry, small_angle)
 
     def __call__(self, *args, **kwargs):
         return self.func(**kwargs)
@@ -65,13 +126,141 @@ class FuncWrapper(Generic[Params, RetVal]):
     def name_cpp(self):
         return python_util.snakecase_to_camelcase(self.name)
 
+    @cached_property
+    def cache_key(self) -> str:
+        """Hash of the function source, its input/output layout, the small angle
+        threshold and the symforce version, everything the generated code
+        depends on"""
+        signature = inspect.signature(self.func)
+        annotations = {k: v.annotation for k, v in signature.parameters.items()}
+        annotations["return"] = signature.return_annotation
+
+        files = source_files(self.func)
+        for annotation in annotations.values():
+            source_files(annotation, files)
+
+        hasher = hashlib.sha256()
+        for part in (
+            symforce.__version__,
+            symforce.get_symbolic_api(),
+            repr(sf.epsilon()),
+            repr(self.small_angle),
+            self.name,
+            repr(annotations),
+            *(file.read_text() for file in sorted(files)),
+        ):
+            hasher.update(part.encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()[:16]
+
+    @property
+    def cache_path(self) -> Path:
+        return CACHE_DIR / f"{self.name}_{self.cache_key}"
+
+    @property
+    def is_cached(self) -> bool:
+        return all(
+            self.cache_path.with_suffix(suffix).is_file() for suffix in (".h", ".json")
+        )
+
+    def write_cache(self, header: str, signatures: dict[str, dict[str, str]]):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.cache_path.with_suffix(".h").write_text(header)
+        self.cache_path.with_suffix(".json").write_text(
+            json.dumps(signatures, indent=4)
+        )
+
+    @cached_property
+    def cpp_signatures(self) -> dict[str, dict[str, str]]:
+        """Input and output signatures, read from the cache if possible so the
+        bindings can be generated without symbolic evaluation"""
+        if not self.is_cached:
+            self.write_cache(*self.generate_cpp_func())
+        return json.loads(self.cache_path.with_suffix(".json").read_text())
+
+    def generate_cpp_func(self) -> tuple[str, dict[str, dict[str, str]]]:
+        """Symbolic evaluation and codegen, returns the header and cpp signatures"""
+        inputs_cpp = self.cpp_input()
+        outputs_cpp = self.cpp_output()
+        signatures = dict(
+            inputs=self.get_cpp_signatures(inputs_cpp),
+            outputs=self.get_cpp_signatures(outputs_cpp),
+        )
+        preint_cgen = codegen.Codegen(
+            inputs=inputs_cpp,
+            outputs=outputs_cpp,
+            config=codegen.CppConfig(),
+            name=self.name,
+        )
+        with TemporaryDirectory() as tmpdir:
+            info = preint_cgen.generate_function(
+                output_dir=Path(tmpdir), skip_directory_nesting=True
+            )
+            header = info.generated_files[0].read_text()
+        return header, signatures
+
+    @property
+    def header(self) -> str:
+        """The generated header, read from the cache if possible"""
+        if not self.is_cached:
+            self.write_cache(*self.generate_cpp_func())
+        return self.cache_path.with_suffix(".h").read_text()
+
+    @property
+    def op_count(self) -> int:
+        """Ops of the generated code, after common subexpression elimination"""
+        return int(re.search(r"// Total ops: (\d+)", self.header).group(1))
+
+    def expression_op_counts(self) -> tuple[int, int]:
+        """Ops of the outputs as expression trees, and with every distinct
+        subexpression counted once. Every node of n args counts as max(n - 1, 1)
+        ops, so the numbers are close to but not the same as the Total ops of
+        symforce, whose cse also shares subsets of the args of Adds and Muls."""
+        exprs = []
+        for v in self.cpp_output().values():
+            exprs.extend(v.to_flat_list() if isinstance(v, Matrix) else [v])
+
+        tree_ops = {}
+        stack = list(exprs)
+        while stack:
+            expr = stack[-1]
+            if expr in tree_ops:
+                stack.pop()
+                continue
+            pending = [arg for arg in expr.args if arg not in tree_ops]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            own = max(len(expr.args) - 1, 1) if expr.args else 0
+            tree_ops[expr] = own + sum(tree_ops[arg] for arg in expr.args)
+
+        unique_ops = sum(max(len(expr.args) - 1, 1) for expr in tree_ops if expr.args)
+        return sum(tree_ops[expr] for expr in exprs), unique_ops
+
+    @classmethod
+    def ops_report(cls) -> str:
+        """Table of the ops of every registered function as expression trees,
+        with distinct subexpressions counted once and in the generated code"""
+        lines = [f"{'function':<28} {'tree':>12} {'unique':>8} {'generated':>10}"]
+        for func in cls.registered():
+            tree, unique = func.expression_op_counts()
+            lines.append(
+                f"{func.name:<28} {tree:>12.3g} {unique:>8} {func.op_count:>10}"
+            )
+        return "\n".join(lines)
+
     def symbolic_input(self):
+        """Symbols for every parameter, options with defaults that are not states
+        or scalars are left at their default in the generated code"""
         inputs = Values()
         for k, v in inspect.signature(self.func).parameters.items():
             if hasattr(v.annotation, "symbolic"):
                 inputs[k] = v.annotation.symbolic(k)
             elif v.annotation is sf.Scalar:
                 inputs[k] = sf.symbols(k)
+            elif v.default is not inspect.Parameter.empty:
+                continue
             else:
                 raise ValueError(f"Unknown state type {v.annotation}")
         return inputs
@@ -91,8 +280,9 @@ class FuncWrapper(Generic[Params, RetVal]):
         return input_cpp
 
     def symbolic_output(self):
-        output = self.func(**self.symbolic_input())
-        assert isinstance(output, (SymState, Matrix, sf.Scalar))
+        with small_angle_threshold(self.small_angle):
+            output = self.func(**self.symbolic_input())
+        assert isinstance(output, (SymState, Matrix, sf.Expr))
         return output
 
     def cpp_output(self):
@@ -102,7 +292,7 @@ class FuncWrapper(Generic[Params, RetVal]):
             for k, v in output.items():
                 if isinstance(v, Matrix):
                     output_cpp[k] = v
-                elif isinstance(v, sf.Symbol):
+                elif isinstance(v, sf.Expr):
                     output_cpp[k] = v
                 elif hasattr(v, "to_storage"):
                     output_cpp[k] = Matrix(v.to_storage())
@@ -113,7 +303,7 @@ class FuncWrapper(Generic[Params, RetVal]):
         elif isinstance(output, Matrix):
             return Values(output=Matrix(output.to_storage()))
 
-        elif isinstance(output, sf.Scalar):
+        elif isinstance(output, sf.Expr):
             return Values(output=output)
 
         elif hasattr(output, "to_storage"):
@@ -126,54 +316,168 @@ class FuncWrapper(Generic[Params, RetVal]):
         for k, v in values.items():
             if isinstance(v, Matrix):
                 signatures[k] = sig_eigen.format(*v.shape)
-            elif isinstance(v, sf.Symbol):
+            elif isinstance(v, sf.Expr):
                 signatures[k] = sig_scalar
             else:
                 raise ValueError(f"Unknown state type {type(v)}")
         return signatures
 
     def cpp_input_signatures(self):
-        return self.get_cpp_signatures(self.cpp_input())
+        return self.cpp_signatures["inputs"]
 
     def cpp_output_signatures(self):
-        return self.get_cpp_signatures(self.cpp_output())
+        return self.cpp_signatures["outputs"]
+
+    @staticmethod
+    def signature_shape(signature: str) -> tuple[int, ...]:
+        """Shape of an Eigen signature, () for Scalar"""
+        return tuple(int(dim) for dim in re.findall(r"\d+", signature))
 
     def cpp_input_string(self):
-        return ",".join(
-            f"{v}* {k}" if v != "Scalar" else f"{v} {k}"
-            for k, v in [
-                *self.cpp_input_signatures().items(),
-                *self.cpp_output_signatures().items(),
-            ]
+        inputs = (
+            f"const Buffer<Scalar>& {k}" if v != "Scalar" else f"{v} {k}"
+            for k, v in self.cpp_input_signatures().items()
         )
+        outputs = (f"Buffer<Scalar>& {k}" for k in self.cpp_output_signatures())
+        return ", ".join((*inputs, *outputs))
 
     def cpp_call_string(self):
-        inputs = ",".join(
-            f"*reinterpret_cast<{v}*>({k})" if v != "Scalar" else f"{k}"
+        inputs = (
+            f"as_input<{v}>({k})" if v != "Scalar" else f"{k}"
             for k, v in self.cpp_input_signatures().items()
         )
-        outputs = ",".join(f"{k}" for k in self.cpp_output_signatures())
-        return f"{inputs}, {outputs}"
+        outputs = (
+            (
+                f"as_output<{v}>({k})"
+                if v != "Scalar"
+                else f"as_output<Eigen::Matrix<Scalar, 1, 1>>({k})->data()"
+            )
+            for k, v in self.cpp_output_signatures().items()
+        )
+        return ", ".join((*inputs, *outputs))
 
-    @classmethod
-    def generate_cpp_funcs(cls):
-        for func in cls._registered:
-            inputs_cpp = func.cpp_input()
-            outputs_cpp = func.cpp_output()
-
-            preint_cgen = codegen.Codegen(
-                inputs=inputs_cpp,
-                outputs=outputs_cpp,
-                config=codegen.CppConfig(),
-                name=func.name,
+    def cpp_args_string(self):
+        """Outputs are written in place, so they must never be converted"""
+        inputs = (f'py::arg("{k}")' for k in self.cpp_input_signatures())
+        outputs = (f'py::arg("{k}").noconvert()' for k in self.cpp_output_signatures())
+        return ", ".join((*inputs, *outputs))
+
+    def cpp_batch_signatures(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Input and output signatures with scalars as 1x1 matrices"""
+
+        def as_matrix(signature: str) -> str:
+            return signature if signature != "Scalar" else "Eigen::Matrix<Scalar, 1, 1>"
+
+        return (
+            {k: as_matrix(v) for k, v in self.cpp_input_signatures().items()},
+            {k: as_matrix(v) for k, v in self.cpp_output_signatures().items()},
+        )
+
+    def cpp_batch_input_string(self):
+        inputs = (
+            f"const BatchBuffer<Scalar>& {k}" for k in self.cpp_input_signatures()
+        )
+        outputs = (f"BatchBuffer<Scalar>& {k}" for k in self.cpp_output_signatures())
+        return ", ".join((*inputs, *outputs, "bool parallel"))
+
+    def cpp_batch_call_string(self):
+        inputs = (
+            f"{k}_[i]" if v != "Scalar" else f"{k}_[i](0, 0)"
+            for k, v in self.cpp_input_signatures().items()
+        )
+        outputs = (
+            f"&{k}_[i]" if v != "Scalar" else f"{k}_[i].data()"
+            for k, v in self.cpp_output_signatures().items()
+        )
+        return ", ".join((*inputs, *outputs))
+
+    def cpp_scan_input_string(self):
+        inputs = (
+            (
+                f"const Buffer<Scalar>& {k}"
+                if k == self.carry
+                else f"const BatchBuffer<Scalar>& {k}"
             )
-            info = preint_cgen.generate_function(
-                output_dir=CPP_DIR / "generated_symforce", skip_directory_nesting=True
+            for k in self.cpp_input_signatures()
+        )
+        return ", ".join(
+            (
+                *inputs,
+                "py::ssize_t n",
+                "Buffer<Scalar>& out",
+                "std::optional<BatchBuffer<Scalar>> states",
+            )
+        )
+
+    def cpp_scan_call_string(self):
+        inputs = (
+            (
+                "carry"
+                if k == self.carry
+                else f"{k}_[i]" if v != "Scalar" else f"{k}_[i](0, 0)"
+            )
+            for k, v in self.cpp_input_signatures().items()
+        )
+        outputs = []
+        offset = 0
+        for v in self.cpp_output_signatures().values():
+            outputs.append(f"reinterpret_cast<{v}*>(next.data() + {offset})")
+            offset += np.prod(self.signature_shape(v), dtype=int)
+        carry_size = np.prod(
+            self.signature_shape(self.cpp_input_signatures()[self.carry])
+        )
+        if offset != carry_size:
+            raise ValueError(
+                f"The outputs of {self.name} do not match the storage of {self.carry}"
             )
-            oldfile = info.generated_files[0]
-            newfile = CPP_DIR / "generated" / oldfile.name
-            if not newfile.is_file() or oldfile.read_bytes() != newfile.read_bytes():
-                copyfile(oldfile, newfile)
+        return ", ".join((*inputs, *outputs))
+
+    def cpp_scan_args_string(self):
+        inputs = (f'py::arg("{k}")' for k in self.cpp_input_signatures())
+        outputs = (
+            'py::arg("n")',
+            'py::arg("out").noconvert()',
+            'py::arg("states").noconvert() = py::none()',
+        )
+        return ", ".join((*inputs, *outputs))
+
+    @classmethod
+    def registered(cls) -> list["FuncWrapper"]:
+        """Registered functions in a deterministic order"""
+        return sorted(cls._registered, key=lambda func: func.name)
+
+    @classmethod
+    def generate_cpp_funcs(cls, max_workers: int = None):
+        """Generate the header of every registered function, symbolic evaluation
+        and codegen is skipped for functions found in the cache. The remaining
+        functions are generated in parallel by max_workers processes, by default
+        one per function up to the number of cpus."""
+        todo = [func for func in cls.registered() if not func.is_cached]
+        max_workers = max_workers or min(len(todo), os.cpu_count() or 1)
+        if len(todo) > 1 and max_workers > 1:
+            # fork so the workers inherit the registry, the wrapped functions
+            # can not be pickled when FuncWrapper.wrap is used as a decorator
+            with ProcessPoolExecutor(
+                max_workers, mp_context=get_context("fork")
+            ) as executor:
+                results = list(
+                    executor.map(_generate_registered, [func.name for func in todo])
+                )
+        else:
+            results = [func.generate_cpp_func() for func in todo]
+
+        for func, result in zip(todo, results):
+            func.write_cache(*result)
+        cls.prune_cache()
+
+        for func in cls.registered():
+            cached = func.cache_path.with_suffix(".h")
+            for newfile in (
+                CPP_DIR / "generated_symforce" / f"{func.name}.h",
+                CPP_DIR / "generated" / f"{func.name}.h",
+            ):
+                if not newfile.is_file() or cached.read_bytes() != newfile.read_bytes():
+                    copyfile(cached, newfile)
 
     @classmethod
     def generate_bindings(cls):
@@ -185,16 +489,28 @@ class FuncWrapper(Generic[Params, RetVal]):
         )
         template = env.get_template("main.cpp.jinja")
         content = template.render(
-            functions=cls._registered,
+            functions=cls.registered(),
+            scalars=cls.SCALARS,
         )
         outfile = CPP_DIR / "generated/bindings.cpp"
         if not outfile.is_file() or content != outfile.read_text():
             outfile.write_text(content)
 
+    @classmethod
+    def library_key(cls) -> str:
+        """Hash of all registered functions and the binding template"""
+        hasher = hashlib.sha256()
+        for func in cls.registered():
+            hasher.update(f"{func.cache_key} {func.carry}".encode())
+        hasher.update(" ".join(cls.SCALARS).encode())
+        hasher.update((CPP_DIR / "templates/main.cpp.jinja").read_bytes())
+        hasher.update((CPP_DIR / "CMakeLists.txt").read_bytes())
+        return hasher.hexdigest()[:16]
+
     @classmethod
     def compile_cpplib(cls):
-        for func in cls._registered:
-            func.create_cfunc()
+        cls.generate_cpp_funcs()
+        cls.generate_bindings()
 
         subprocess.run(
             "cmake -DCMAKE_BUILD_TYPE=Release ..",
@@ -205,9 +521,9 @@ class FuncWrapper(Generic[Params, RetVal]):
         subprocess.run("make", cwd=CPP_DIR / "build", check=True)
 
     @classmethod
-    def import_cpplib(cls):
+    def import_cpplib(cls, path: Path = CPP_DIR / "build/mylib.so"):
         module_name = "mylib"
-        spec = spec_from_file_location(module_name, CPP_DIR / "build/mylib.so")
+        spec = spec_from_file_location(module_name, path)
         module = module_from_spec(spec)
         sys.modules[module_name] = module
         spec.loader.exec_module(module)
@@ -215,20 +531,200 @@ class FuncWrapper(Generic[Params, RetVal]):
 
     @classmethod
     def compile_and_import(cls):
-        cls.compile_cpplib()
-        cls.import_cpplib()
+        """Import the cached library if nothing changed, otherwise build and cache it"""
+        cached = CACHE_DIR / f"mylib_{cls.library_key()}.so"
+        if not cached.is_file():
+            cls.compile_cpplib()
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            copyfile(CPP_DIR / "build/mylib.so", cached)
+        cls.import_cpplib(cached)
+        cls.prune_cache(library=True)
+
+    @classmethod
+    def prune_cache(cls, library: bool = False) -> list[Path]:
+        """Remove the cache entries of registered functions whose key is not the
+        current one, and with library every library but the one of the
+        registered functions. Entries of functions that are not registered are
+        kept. Called after generating and after importing, returns the removed
+        files."""
+        if not cls._registered:
+            return []
+        current = {func.cache_path.name for func in cls._registered}
+        names = "|".join(re.escape(func.name) for func in cls._registered)
+        entry = re.compile(rf"({names})_[0-9a-f]{{16}}")
+        stale = [
+            path
+            for path in CACHE_DIR.glob("*")
+            if path.suffix in (".h", ".json")
+            and entry.fullmatch(path.stem)
+            and path.stem not in current
+        ]
+        if library:
+            keep = f"mylib_{cls.library_key()}.so"
+            stale.extend(
+                path for path in CACHE_DIR.glob("mylib_*.so") if path.name != keep
+            )
+        for path in stale:
+            path.unlink()
+        return stale
 
     @property
     def cfunc(self):
-        return getattr(self._cmodule, self.fname)
+        return getattr(self._cmodule, self.name)
+
+    def output_buffers(self, dtype=np.float64) -> dict[str, np.ndarray]:
+        """Preallocated outputs in the column major layout of the kernel, reuse
+        them as out= in call_c to avoid allocations"""
+        buffers = {}
+        for k, v in self.cpp_output_signatures().items():
+            shape = self.signature_shape(v)
+            shape = shape[:1] if shape[1:] == (1,) else shape
+            buffers[k] = np.empty(shape, dtype=dtype, order="F")
+        return buffers
+
+    def call_c(
+        self,
+        *args,
+        out: dict[str, np.ndarray] | NumericState = None,
+        dtype=None,
+        **kwargs,
+    ):
+        """Call the compiled kernel. Contiguous arrays of the kernel dtype are
+        handed to C++ without copies, the outputs are written into out, which
+        is returned. out can be a NumericState of the output, see output_state"""
+        inputs = dict(zip(self.cpp_input_signatures(), args), **kwargs)
+        dtype = dtype or self.kernel_dtype(inputs)
+        out = self.output_buffers(dtype) if out is None else out
+        self.cfunc(**self.to_cpp_inputs(inputs, dtype), **self.output_views(out, dtype))
+        return out
+
+    def output_state(self, n: int = None) -> NumericState:
+        """Zeroed NumericState of the SymState the function returns, (n, DIM) if
+        n is given, to be passed as out= and read back without conversion"""
+        output = inspect.signature(self.func).return_annotation
+        if not (isinstance(output, type) and issubclass(output, SymState)):
+            raise TypeError(f"{self.name} does not return a SymState")
+        return output.numeric().zeros(*(() if n is None else (n,)))
+
+    def output_views(
+        self, out: dict[str, np.ndarray] | NumericState, dtype=np.float64
+    ) -> dict[str, np.ndarray]:
+        """The output buffers of out, views into its buffer for a NumericState"""
+        if not isinstance(out, NumericState):
+            return out
+        if dtype != np.float64:
+            raise ValueError(f"A NumericState output needs float64, not {dtype}")
+        views = {k: getattr(out, k) for k in self.cpp_output_signatures()}
+        return {
+            k: v.buffer if isinstance(v, NumericState) else v for k, v in views.items()
+        }
+
+    def batch_output_buffers(self, n: int, dtype=np.float64) -> dict[str, np.ndarray]:
+        """Preallocated outputs of n items, (n,) for scalars, (n, rows) for
+        vectors and (n, rows, cols) views of column major storage for matrices"""
+        buffers = {}
+        for k, v in self.cpp_output_signatures().items():
+            shape = self.signature_shape(v)
+            if shape[1:] in ((), (1,)):
+                buffers[k] = np.empty((n, *shape[:1]), dtype=dtype)
+            else:
+                rows, cols = shape
+                buffers[k] = np.empty((n, cols, rows), dtype=dtype).transpose(0, 2, 1)
+        return buffers
+
+    def call_c_batch(
+        self,
+        *args,
+        out: dict[str, np.ndarray] | NumericState = None,
+        parallel=True,
+        dtype=None,
+        **kwargs,
+    ):
+        """Evaluate the kernel over a batch in C++. Array inputs hold one item per
+        row, everything else is broadcast over the batch"""
+        inputs = dict(zip(self.cpp_input_signatures(), args), **kwargs)
+        dtype = dtype or self.kernel_dtype(inputs)
+        n, cpp_inputs = self.to_cpp_batch_inputs(inputs, dtype=dtype)
+        out = self.batch_output_buffers(n, dtype) if out is None else out
+        getattr(self._cmodule, f"{self.name}_batch")(
+            **cpp_inputs, **self.output_views(out, dtype), parallel=parallel
+        )
+        return out
+
+    def call_c_scan(
+        self,
+        *args,
+        out: np.ndarray | NumericState = None,
+        states: np.ndarray | NumericState = None,
+        dtype=None,
+        **kwargs,
+    ) -> np.ndarray | NumericState:
+        """Fold the kernel over a batch in C++, the outputs of every step are the
+        carry input of the next. Returns the final carry storage, and writes every
+        intermediate one into states, (N, storage_dim), if given. out and states
+        can be NumericStates of the carry, out is then returned as is"""
+        inputs = dict(zip(self.cpp_input_signatures(), args), **kwargs)
+        dtype = dtype or self.kernel_dtype(inputs)
+        n, cpp_inputs = self.to_cpp_batch_inputs(
+            inputs, single=(self.carry,), dtype=dtype
+        )
+        if out is None:
+            carry_signature = self.cpp_input_signatures()[self.carry]
+            out = np.empty(np.prod(self.signature_shape(carry_signature)), dtype)
+        getattr(self._cmodule, f"{self.name}_scan")(
+            **cpp_inputs,
+            n=n,
+            out=out.buffer if isinstance(out, NumericState) else out,
+            states=states.buffer if isinstance(states, NumericState) else states,
+        )
+        return out
+
+    def to_cpp_batch_inputs(
+        self, inputs: Values, single: tuple[str, ...] = (), dtype=np.float64
+    ) -> tuple[int, dict]:
+        """Batch size and inputs, inputs in single are never batched"""
+        cpp_inputs = {}
+        n = 1
+        for k, v in self.to_cpp_inputs(inputs, dtype).items():
+            if not isinstance(v, np.ndarray):
+                v = np.array([v], dtype=dtype)
+            if k not in single and (
+                self.cpp_input_signatures()[k] == "Scalar" or v.ndim > 1
+            ):
+                n = max(n, len(v))
+            cpp_inputs[k] = v
+        return n, cpp_inputs
 
-    def call_c(self, inputs):
-        return getattr(self._cmodule, self.fname)(inputs)
+    @classmethod
+    def kernel_dtype(cls, inputs: Values) -> np.dtype:
+        """float32 if every array input is float32, float64 otherwise"""
+        arrays = [
+            v.buffer if isinstance(v, NumericState) else v
+            for v in inputs.values()
+            if isinstance(v, (np.ndarray, NumericState))
+        ]
+        if arrays and all(v.dtype == np.float32 for v in arrays):
+            return np.dtype(np.float32)
+        return np.dtype(np.float64)
 
     @staticmethod
     def to_cpp_inputs(inputs: Values, dtype=np.float64):
+        """Arrays are only copied if they are not of dtype already, NumericStates
+        are passed as their buffer"""
         cpp_inputs = {}
         for k, v in inputs.items():
-            assert isinstance(v, SymState)
-            cpp_inputs[k] = np.array(v.to_storage(), dtype=dtype)
+            if isinstance(v, NumericState):
+                cpp_inputs[k] = np.asarray(v.buffer, dtype=dtype)
+            elif isinstance(v, np.ndarray):
+                cpp_inputs[k] = np.asarray(v, dtype=dtype)
+            elif hasattr(v, "to_storage"):
+                cpp_inputs[k] = np.array(v.to_storage(), dtype=dtype)
+            else:
+                cpp_inputs[k] = v
         return cpp_inputs
+
+
+def _generate_registered(name: str) -> tuple[str, dict[str, dict[str, str]]]:
+    """Process pool entry point of FuncWrapper.generate_cpp_funcs"""
+    (func,) = (func for func in FuncWrapper._registered if func.name == name)
+    return func.generate_cpp_func()
@@ -0,0 +1 @@
+import config  # pylint: disable=unused-import
@@ -0,0 +1,244 @@
+"""Numeric, numpy vectorized version of se23.integration.preintegrate
+
+Everything that only depends on the imu samples (rotation increments, the
+velocity/position increments, SO3_ljac_inv, the transition matrices A and the
+G/Q_i noise terms) is computed for all samples at once, only the quaternion
+product and the covariance recurrence are folded sequentially.
+"""
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+
+from se23 import pose23_SE23
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ImuPreint, Cov, Cov99
+
+
+def hat(phi: np.ndarray) -> np.ndarray:
+    """(N, 3) -> (N, 3, 3)"""
+    out = np.zeros(phi.shape[:-1] + (3, 3))
+    out[..., 0, 1] = -phi[..., 2]
+    out[..., 0, 2] = phi[..., 1]
+    out[..., 1, 0] = phi[..., 2]
+    out[..., 1, 2] = -phi[..., 0]
+    out[..., 2, 0] = -phi[..., 1]
+    out[..., 2, 1] = phi[..., 0]
+    return out
+
+
+def quat_from_tangent(phi: np.ndarray, epsilon: float) -> np.ndarray:
+    """Same as Rot3.from_tangent, quaternions are stored as xyzw"""
+    theta = np.sqrt(np.sum(phi**2, axis=-1) + epsilon**2)
+    quat = np.empty(phi.shape[:-1] + (4,))
+    quat[..., :3] = (np.sin(theta / 2) / theta)[..., None] * phi
+    quat[..., 3] = np.cos(theta / 2)
+    return quat
+
+
+def quat_to_tangent(quat: np.ndarray, epsilon: float) -> np.ndarray:
+    """Same as Rot3.to_tangent"""
+    w_safe = np.minimum(1 - epsilon, np.abs(quat[..., 3]))
+    sign = np.where(quat[..., 3] < 0, -1.0, 1.0)
+    scale = sign * 2 * np.arccos(w_safe) / np.sqrt(1 - w_safe**2)
+    return scale[..., None] * quat[..., :3]
+
+
+def quat_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Same as Quaternion.compose"""
+    out = np.empty(np.broadcast_shapes(a.shape, b.shape))
+    out[..., :3] = (
+        b[..., :3] * a[..., 3:]
+        + a[..., :3] * b[..., 3:]
+        + np.cross(a[..., :3], b[..., :3])
+    )
+    out[..., 3] = a[..., 3] * b[..., 3] - np.sum(a[..., :3] * b[..., :3], axis=-1)
+    return out
+
+
+def quat_right_matrix(quat: np.ndarray) -> np.ndarray:
+    """Matrix M such that quat_multiply(p, quat) == M @ p"""
+    out = np.empty(quat.shape[:-1] + (4, 4))
+    out[..., :3, :3] = quat[..., 3, None, None] * np.eye(3) - hat(quat[..., :3])
+    out[..., :3, 3] = quat[..., :3]
+    out[..., 3, :3] = -quat[..., :3]
+    out[..., 3, 3] = quat[..., 3]
+    return out
+
+
+def quat_to_rotation_matrix(quat: np.ndarray) -> np.ndarray:
+    """Same as Rot3.to_rotation_matrix"""
+    x, y, z, w = (quat[..., i] for i in range(4))
+    out = np.empty(quat.shape[:-1] + (3, 3))
+    out[..., 0, 0] = 1 - 2 * y**2 - 2 * z**2
+    out[..., 0, 1] = 2 * x * y - 2 * z * w
+    out[..., 0, 2] = 2 * x * z + 2 * y * w
+    out[..., 1, 0] = 2 * x * y + 2 * z * w
+    out[..., 1, 1] = 1 - 2 * x**2 - 2 * z**2
+    out[..., 1, 2] = 2 * y * z - 2 * x * w
+    out[..., 2, 0] = 2 * x * z - 2 * y * w
+    out[..., 2, 1] = 2 * y * z + 2 * x * w
+    out[..., 2, 2] = 1 - 2 * x**2 - 2 * y**2
+    return out
+
+
+def SO3_ljac(phi: np.ndarray, epsilon: float) -> np.ndarray:
+    """Same as se23.pose23_SE23.SO3_ljac"""
+    theta = np.sqrt(np.sum(phi**2, axis=-1) + epsilon**2)
+    R_hat = hat(phi)
+    small = theta < pose23_SE23.SMALL_ANGLE
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(
+            small,
+            1 / 2 - theta**2 / 24 + theta**4 / 720,
+            (1 - np.cos(theta)) / theta**2,
+        )
+        b = np.where(
+            small,
+            1 / 6 - theta**2 / 120 + theta**4 / 5040,
+            (theta - np.sin(theta)) / theta**3,
+        )
+    return np.eye(3) + a[..., None, None] * R_hat + b[..., None, None] * (R_hat @ R_hat)
+
+
+def SO3_ljac_inv(phi: np.ndarray, epsilon: float) -> np.ndarray:
+    """Same as se23.pose23_SE23.SO3_ljac_inv"""
+    theta = np.sqrt(np.sum(phi**2, axis=-1) + epsilon**2)
+    R_hat = hat(phi)
+    half_theta = 0.5 * theta
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exact = (1 - half_theta * np.cos(half_theta) / np.sin(half_theta)) / theta**2
+    series = 1 / 12 + theta**2 / 720 + theta**4 / 30240
+    coeff = np.where(theta < pose23_SE23.SMALL_ANGLE, series, exact)
+    return np.eye(3) - 0.5 * R_hat + coeff[..., None, None] * (R_hat @ R_hat)
+
+
+def adjoint(R: np.ndarray, v: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Same as Pose23.adjoint, (N, 3, 3), (N, 3), (N, 3) -> (N, 9, 9)"""
+    out = np.zeros(R.shape[:-2] + (9, 9))
+    out[..., 0:3, 0:3] = R
+    out[..., 3:6, 0:3] = hat(v) @ R
+    out[..., 3:6, 3:6] = R
+    out[..., 6:9, 0:3] = hat(t) @ R
+    out[..., 6:9, 6:9] = R
+    return out
+
+
+def imu_increments(
+    gyro: np.ndarray, accl: np.ndarray, dt: np.ndarray, epsilon: float
+) -> T.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Rotation (as quaternion), velocity and position increment of every sample"""
+    dt = dt[:, None]
+    delta_q = quat_from_tangent(gyro * dt, epsilon)
+    a_0 = accl
+    a_1 = np.einsum("nij,nj->ni", quat_to_rotation_matrix(delta_q), accl)
+    delta_v = a_0 * dt + (a_1 - a_0) * dt**2 / 2
+    delta_t = a_0 * dt**2 / 2 + (a_1 - a_0) * dt**3 / 6
+    return delta_q, delta_v, delta_t
+
+
+def noise_increments(
+    noise_diag: np.ndarray, gyro: np.ndarray, dt: np.ndarray, epsilon: float
+) -> np.ndarray:
+    """The Q_i term of every sample, (N, 9, 9)"""
+    J_inv = SO3_ljac_inv(gyro * dt[:, None], epsilon)
+    R = quat_to_rotation_matrix(quat_from_tangent(-gyro * dt[:, None], epsilon))
+    dt = dt[:, None, None]
+    G = np.zeros((len(gyro), 9, 6))
+    G[:, 0:3, 0:3] = -J_inv * dt
+    G[:, 3:6, 3:6] = -R * dt
+    G[:, 6:9, 3:6] = -R * dt**2 / 2
+    return (G * (noise_diag * dt)) @ G.transpose(0, 2, 1)
+
+
+def fold_upsilon(
+    quat: np.ndarray,
+    v: np.ndarray,
+    t: np.ndarray,
+    delta_q: np.ndarray,
+    delta_v: np.ndarray,
+    delta_t: np.ndarray,
+    dt: np.ndarray,
+) -> T.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """All N + 1 upsilons of upsilon_new = Phi(upsilon, dt).compose(delta)
+
+    Only the quaternion product is sequential, v and t are cumulative sums.
+    """
+    quats = np.empty((len(dt) + 1, 4))
+    quats[0] = quat
+    for i, M in enumerate(quat_right_matrix(delta_q)):
+        quats[i + 1] = M @ quats[i]
+    Rs = quat_to_rotation_matrix(quats)
+
+    vs = np.empty((len(dt) + 1, 3))
+    vs[0] = v
+    vs[1:] = np.einsum("nij,nj->ni", Rs[:-1], delta_v)
+    vs = np.cumsum(vs, axis=0)
+
+    ts = np.empty((len(dt) + 1, 3))
+    ts[0] = t
+    ts[1:] = np.einsum("nij,nj->ni", Rs[:-1], delta_t) + dt[:, None] * vs[:-1]
+    ts = np.cumsum(ts, axis=0)
+    return quats, vs, ts
+
+
+def transition_matrices(
+    delta_q: np.ndarray, delta_v: np.ndarray, delta_t: np.ndarray, dt: np.ndarray
+) -> np.ndarray:
+    """The A = Ad(delta^-1) * F term of every sample, (N, 9, 9)"""
+    R_inv = quat_to_rotation_matrix(delta_q * [-1, -1, -1, 1])
+    v_inv = -np.einsum("nij,nj->ni", R_inv, delta_v)
+    t_inv = -np.einsum("nij,nj->ni", R_inv, delta_t)
+    A = adjoint(R_inv, v_inv, t_inv)
+    A[:, :, 3:6] += dt[:, None, None] * A[:, :, 6:9]
+    return A
+
+
+def fold_cov(cov: np.ndarray, A: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    """cov_new = A * cov * A.T + Q_i over all samples"""
+    for A_i, Q_i in zip(A, Q):
+        cov = A_i @ cov @ A_i.T + Q_i
+    return cov
+
+
+def cov_to_numpy(cov: T.Union[Cov, sf.Matrix]) -> np.ndarray:
+    if isinstance(cov, Cov):
+        return cov.to_numpy()
+    return np.array(cov.to_numpy(), dtype=np.float64)
+
+
+def preintegrate_batch(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreint,
+    gyro: np.ndarray,
+    accl: np.ndarray,
+    dt: T.Union[float, np.ndarray],
+    epsilon: T.Scalar = sf.epsilon(),
+) -> ImuPreint:
+    """Numeric preintegrate over N bias corrected imu samples
+
+    Args:
+        gyro: (N, 3) angular velocities
+        accl: (N, 3) specific forces
+        dt: scalar or (N,) sample intervals
+    """
+    epsilon = float(epsilon)
+    gyro = np.asarray(gyro, dtype=np.float64).reshape(-1, 3)
+    accl = np.asarray(accl, dtype=np.float64).reshape(-1, 3)
+    dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), gyro.shape[:1])
+    noise_diag = np.array(imu_noise.to_storage(), dtype=np.float64)
+
+    upsilon = np.array(preint_prev.upsilon.to_storage(), dtype=np.float64)
+    delta_q, delta_v, delta_t = imu_increments(gyro, accl, dt, epsilon)
+    quats, vs, ts = fold_upsilon(
+        upsilon[:4], upsilon[4:7], upsilon[7:10], delta_q, delta_v, delta_t, dt
+    )
+
+    A = transition_matrices(delta_q, delta_v, delta_t, dt)
+    Q = noise_increments(noise_diag, gyro, dt, epsilon)
+    cov = fold_cov(cov_to_numpy(preint_prev.cov), A, Q)
+
+    upsilon_new = Pose23_SE23.from_storage(
+        [*quats[-1].tolist(), *vs[-1].tolist(), *ts[-1].tolist()]
+    )
+    return ImuPreint(upsilon_new, Cov99(cov))
@@ -0,0 +1,176 @@
+"""Block sparse Cholesky factorization of normal equations
+
+A smoother over keyframes has a Hessian of b x b blocks, b = 9 for
+Pose23_SE23 or 15 with the bias, that is block tridiagonal or banded: block
+(i, j) is nonzero only if a factor links keyframes i and j. BlockCholesky
+factors H = L L.T block by block, in O(n b^3) for a band instead of the
+O((n b)^3) of a dense solve.
+
+The symbolic factorization, the pattern of L with its fill in and for every
+block column the gather indices of the blocks that update it, only depends on
+the pattern of H and is done once in __init__. factor and solve then run on
+numpy block arrays and can be repeated for every Gauss-Newton iteration:
+
+    cholesky = BlockCholesky.banded(n, 9, 1)
+    x = cholesky.factor(blocks).solve(g)
+
+blocks are the (m, b, b) lower blocks of H in the order of cholesky.pairs,
+the (row, col) with row >= col, and vectors are (n, b) or (n * b,). schur
+eliminates the leading block columns only, which gives the Schur complement
+of the trailing keyframes, the dense prior of marginalization.
+"""
+
+import numpy as np
+from symforce import typing as T
+
+
+class BlockCholesky:
+    """Symbolic factorization of the n x n block pattern pairs, blocks b x b,
+    see the module docstring. The order of the keyframes is kept, it has no
+    fill in for a band."""
+
+    def __init__(self, n: int, block: int, pairs: T.Sequence[T.Tuple[int, int]]):
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        if np.any(pairs[:, 0] < pairs[:, 1]) or np.any(pairs >= n):
+            raise ValueError("pairs must be (row, col) with n > row >= col")
+        self.n = n
+        self.block = block
+        self.pairs = pairs
+
+        # rows of every column of L, the column of H merged with the columns
+        # of its children in the elimination tree
+        struct = [set() for _ in range(n)]
+        for i, j in pairs:
+            if i != j:
+                struct[j].add(int(i))
+        for j in range(n):
+            if struct[j]:
+                parent = min(struct[j])
+                struct[parent] |= struct[j] - {parent}
+        self.rows = [np.array(sorted(rows), dtype=np.int64) for rows in struct]
+
+        # slots of L, the diagonal blocks first, the last slot is a zero block
+        slot = {(j, j): j for j in range(n)}
+        for j, rows in enumerate(self.rows):
+            for i in rows:
+                slot[(int(i), j)] = len(slot)
+        self.slots = len(slot)
+        self.zero = self.slots
+        self.column_slots = [
+            np.array([slot[(int(i), j)] for i in rows], dtype=np.int64)
+            for j, rows in enumerate(self.rows)
+        ]
+        self.index = np.array([slot[(int(i), int(j))] for i, j in pairs])
+
+        # column j is updated by the columns k < j that have a block in row j,
+        # target t of column j by L[t, k] L[j, k].T
+        cols = [[] for _ in range(n)]
+        for k, rows in enumerate(self.rows):
+            for i in rows:
+                cols[i].append(k)
+        self.updates = []
+        for j in range(n):
+            targets = [j, *self.rows[j].tolist()]
+            gather = np.array(
+                [[slot.get((t, k), self.zero) for k in cols[j]] for t in targets],
+                dtype=np.int64,
+            ).reshape(len(targets), len(cols[j]))
+            own = np.array([slot[(j, k)] for k in cols[j]], dtype=np.int64)
+            self.updates.append((np.array(cols[j], dtype=np.int64), gather, own))
+
+        # blocks of L and the inverses of its diagonal blocks, which turn the
+        # triangular solves into products
+        self.L = np.zeros((self.slots + 1, block, block))
+        self.L_inv = np.zeros((n, block, block))
+
+    @classmethod
+    def banded(cls, n: int, block: int, bandwidth: int) -> "BlockCholesky":
+        """Pattern of blocks (i, j) with i - j <= bandwidth, 1 is tridiagonal"""
+        pairs = [
+            (j + d, j) for j in range(n) for d in range(bandwidth + 1) if j + d < n
+        ]
+        return cls(n, block, pairs)
+
+    @property
+    def fill_in(self) -> int:
+        """Blocks of L that are not in the pattern of H"""
+        return self.slots - len(np.unique(self.index))
+
+    def scatter(self, blocks: np.ndarray) -> None:
+        blocks = np.asarray(blocks, dtype=np.float64)
+        if blocks.shape != (len(self.pairs), self.block, self.block):
+            raise ValueError(
+                f"Expected blocks of shape {(len(self.pairs), self.block, self.block)}"
+                f", got {blocks.shape}"
+            )
+        self.L[:] = 0
+        np.add.at(self.L, self.index, blocks)
+
+    def factor(self, blocks: np.ndarray) -> "BlockCholesky":
+        """Numeric factorization of the blocks of H, raises
+        np.linalg.LinAlgError if H is not positive definite"""
+        self.scatter(blocks)
+        self.eliminate(self.n)
+        return self
+
+    def eliminate(self, stop: int) -> None:
+        """Left looking factorization of the columns before stop, the columns
+        from stop on only get the updates of those and hold their Schur
+        complement"""
+        L = self.L
+        for j, (cols, gather, own) in enumerate(self.updates):
+            targets = np.concatenate([[j], self.column_slots[j]])
+            if j >= stop:
+                cols = np.searchsorted(cols, stop)
+                gather, own = gather[:, :cols], own[:cols]
+            if len(own):
+                L[targets] -= np.einsum("tkab,kcb->tac", L[gather], L[own])
+            if j >= stop:
+                continue
+            L[j] = np.linalg.cholesky(L[j])
+            self.L_inv[j] = np.linalg.inv(L[j])
+            if len(targets) > 1:
+                # L[i, j] = B[i] L[j, j]^-T
+                L[targets[1:]] = L[targets[1:]] @ self.L_inv[j].T
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """x of H x = rhs with the last factorization, (n, b)"""
+        L = self.L
+        x = np.array(rhs, dtype=np.float64).reshape(self.n, self.block)
+        for j in range(self.n):
+            x[j] = self.L_inv[j] @ x[j]
+            rows = self.rows[j]
+            if len(rows):
+                x[rows] -= L[self.column_slots[j]] @ x[j]
+        for j in reversed(range(self.n)):
+            rows = self.rows[j]
+            if len(rows):
+                x[j] -= np.einsum("iab,ia->b", L[self.column_slots[j]], x[rows])
+            x[j] = self.L_inv[j].T @ x[j]
+        return x
+
+    def schur(
+        self, blocks: np.ndarray, eliminate: int
+    ) -> T.Tuple[np.ndarray, np.ndarray]:
+        """Schur complement of the leading eliminate block columns of H, as the
+        (row, col) pairs and lower blocks of the trailing keyframes"""
+        self.scatter(blocks)
+        self.eliminate(eliminate)
+        pairs, slots = [], []
+        for j in range(eliminate, self.n):
+            pairs.append((j, j))
+            slots.append(j)
+            for i, s in zip(self.rows[j], self.column_slots[j]):
+                pairs.append((int(i), j))
+                slots.append(int(s))
+        return np.array(pairs, dtype=np.int64) - eliminate, self.L[slots].copy()
+
+
+def to_dense(n: int, block: int, pairs: np.ndarray, blocks: np.ndarray) -> np.ndarray:
+    """Symmetric dense matrix of lower blocks"""
+    dense = np.zeros((n, block, n, block))
+    for (i, j), value in zip(pairs, blocks):
+        dense[i, :, j, :] += value
+        if i != j:
+            dense[j, :, i, :] += value.T
+    return dense.reshape(n * block, n * block)
@@ -0,0 +1,293 @@
+"""Coalescing of K imu samples into one increment in front of preintegrate
+
+A group of samples with total interval tau moves upsilon exactly like a single
+ZImuDelta, upsilon_new = Phi(upsilon, tau).compose(delta), with the transition
+matrix Ad(delta^-1) * F(tau) of one step, so only the increment and the noise
+accumulated inside the group are needed and preintegrate_delta runs once per
+group instead of once per sample.
+
+The increment is built without per sample trigonometry: the rotation vector of
+the group is the sum of the gyro increments alpha_k plus the coning terms
+1/2 * (alpha_1 + ... + alpha_k-1) x alpha_k, and the velocity and position
+increments are rotated into the frame at the start of the group with the second
+order expansion of Exp(phi_k-1) (sculling and scrolling). The errors are third
+order in the rotation over a group. The noise of the group is summed from
+moments of the partial increments, see se23.integration.coalesce, which is
+exact for isotropic gyro and accl noise.
+
+coalesce_batch is the numpy version of the generated
+se23.integration.coalesce_kernel(k) kernels, both take an interval per sample.
+"""
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+
+from codegen.get_code import FuncWrapper
+from se23.pose23_SE23 import Pose23_SE23
+from se23.batch_integration import (
+    hat,
+    quat_from_tangent,
+    fold_upsilon,
+    transition_matrices,
+    fold_cov,
+    cov_to_numpy,
+)
+from states import ImuNoise, ImuBias, ImuPreint, Cov99
+
+STORAGE_DIM = Pose23_SE23.storage_dim() + Cov99.storage_dim()
+# hat(e_m)[i, l] = -epsilon[i, l, m]
+LEVI_CIVITA = -hat(np.eye(3)).transpose(1, 2, 0)
+Deltas = T.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def rotate(phi: np.ndarray, vec: np.ndarray) -> np.ndarray:
+    """Exp(phi) * vec to second order in phi"""
+    phi_vec = np.cross(phi, vec)
+    return vec + phi_vec + 0.5 * np.cross(phi, phi_vec)
+
+
+def exclusive_cumsum(x: np.ndarray, axis: int = 1) -> np.ndarray:
+    return np.cumsum(x, axis=axis) - x
+
+
+def coalesce_batch(
+    gyro: np.ndarray,
+    accl: np.ndarray,
+    dt: np.ndarray,
+    noise_diag: np.ndarray,
+    epsilon: float,
+) -> Deltas:
+    """Coalesce M groups of K bias corrected samples
+
+    Args:
+        gyro: (M, K, 3) angular velocities
+        accl: (M, K, 3) specific forces
+        dt: (M, K) sample intervals
+        noise_diag: ImuNoise storage
+
+    Returns:
+        delta_q (M, 4), delta_v (M, 3), delta_t (M, 3), tau (M,) and the
+        (M, 9, 9) covariance of the right perturbation of each increment
+    """
+    dt_3 = dt[..., None]
+    alpha = gyro * dt_3
+    nu = accl * dt_3
+
+    # coning, phi_k = phi_k-1 + alpha_k + 1/2 * sum(alpha_1:k-1) x alpha_k
+    sum_before = exclusive_cumsum(alpha)
+    coning = 0.5 * np.cross(sum_before, alpha)
+    phi = np.cumsum(alpha + coning, axis=1)
+    phi_before = phi - alpha - coning
+
+    # increments of every sample in its own frame as in preintegrate_terms,
+    # with (a_1 - a_0) * dt = alpha x nu + 1/2 * alpha x (alpha x nu)
+    alpha_nu = np.cross(alpha, nu)
+    a_diff_dt = alpha_nu + 0.5 * np.cross(alpha, alpha_nu)
+    dv = nu + a_diff_dt * dt_3 / 2
+    dp = nu * dt_3 / 2 + a_diff_dt * dt_3**2 / 6
+
+    # sculling and scrolling, into the frame at the start of the group
+    dv = rotate(phi_before, dv)
+    v = np.cumsum(dv, axis=1)
+    dp = rotate(phi_before, dp) + (v - dv) * dt_3
+    p = np.cumsum(dp, axis=1)
+    tau = np.cumsum(dt, axis=1)
+
+    delta_q = quat_from_tangent(phi[:, -1], epsilon)
+    noise = group_noise(v, p, tau, dt, noise_diag)
+    A = transition_matrices(delta_q, v[:, -1], p[:, -1], tau[:, -1])
+    cov = A @ noise @ np.swapaxes(A, -1, -2)
+    return delta_q, v[:, -1], p[:, -1], tau[:, -1], cov
+
+
+def hat_congruence(M: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """Same as se23.integration.hat_congruence, (..., 3, 3), (3,) -> (..., 3, 3)"""
+    return np.einsum("ilm,jln,l,...mn->...ij", LEVI_CIVITA, LEVI_CIVITA, d, M)
+
+
+def group_noise(
+    v: np.ndarray,
+    p: np.ndarray,
+    tau: np.ndarray,
+    dt: np.ndarray,
+    noise_diag: np.ndarray,
+) -> np.ndarray:
+    """Noise of the groups at their start, from the partial increments (v, p)
+    and times tau up to and including every sample, see se23.integration.coalesce
+    """
+    w = dt**3
+    s = p - tau[..., None] * v
+    c = dt / 2 - tau
+
+    def weighted_sum(x: np.ndarray) -> np.ndarray:
+        return np.einsum("mk,mk...->m...", w, x)
+
+    sum_w, sum_c, sum_cc = (
+        weighted_sum(x)[:, None, None] for x in (np.ones_like(w), c, c**2)
+    )
+    M_vv, M_sv, M_ss = (
+        weighted_sum(x[..., :, None] * y[..., None, :])
+        for x, y in ((v, v), (s, v), (s, s))
+    )
+    N_g, N_a = noise_diag[:3], noise_diag[3:]
+
+    noise = np.zeros(v.shape[:1] + (9, 9))
+    noise[:, 0:3, 0:3] = sum_w * np.diag(N_g)
+    noise[:, 3:6, 0:3] = hat(weighted_sum(v)) * N_g
+    noise[:, 6:9, 0:3] = hat(weighted_sum(s)) * N_g
+    noise[:, 3:6, 3:6] = hat_congruence(M_vv, N_g) + sum_w * np.diag(N_a)
+    noise[:, 6:9, 3:6] = hat_congruence(M_sv, N_g) + sum_c * np.diag(N_a)
+    noise[:, 6:9, 6:9] = hat_congruence(M_ss, N_g) + sum_cc * np.diag(N_a)
+    for rows, cols in ((slice(3, 6), slice(0, 3)), (slice(6, 9), slice(0, 6))):
+        noise[:, cols, rows] = np.swapaxes(noise[:, rows, cols], -1, -2)
+    return noise
+
+
+def coalesce_stream(
+    gyro: np.ndarray,
+    accl: np.ndarray,
+    dt: np.ndarray,
+    k: int,
+    noise_diag: np.ndarray,
+    epsilon: float,
+) -> Deltas:
+    """coalesce_batch over groups of k consecutive samples, the last group holds the
+    remaining len(gyro) % k samples if there are any"""
+    n = len(gyro) // k * k
+    bounds = [(0, n, k), (n, len(gyro), len(gyro) - n)]
+    groups = [
+        coalesce_batch(
+            gyro[start:stop].reshape(-1, size, 3),
+            accl[start:stop].reshape(-1, size, 3),
+            dt[start:stop].reshape(-1, size),
+            noise_diag,
+            epsilon,
+        )
+        for start, stop, size in bounds
+        if stop > start
+    ]
+    return tuple(np.concatenate(e) for e in zip(*groups))
+
+
+def to_storage(deltas: Deltas) -> T.Tuple[np.ndarray, np.ndarray]:
+    """(M, STORAGE_DIM) ZImuDelta storage and (M,) intervals of the increments,
+    the z_imu_delta and dt inputs of the preintegrate_delta kernel"""
+    delta_q, delta_v, delta_t, tau, cov = deltas
+    rows, cols = Cov99.tril_indices()
+    return np.hstack([delta_q, delta_v, delta_t, cov[:, rows, cols]]), tau
+
+
+class ImuDecimator:
+    """Streaming pre-stage of preintegrate_delta, coalesces every k raw samples
+
+    Raw samples are bias corrected with imu_bias when they are pushed, so a new
+    bias applies from the next push on. Samples that do not fill a group of k
+    are held back for the next push.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        imu_noise: ImuNoise,
+        imu_bias: ImuBias,
+        epsilon: T.Scalar = sf.epsilon(),
+        kernel: T.Optional[FuncWrapper] = None,
+    ) -> None:
+        """
+        Args:
+            kernel: compiled FuncWrapper of se23.integration.coalesce_kernel(k),
+                used for the groups of k samples instead of coalesce_batch
+        """
+        if k < 1:
+            raise ValueError(f"k must be positive, not {k}")
+        self.k = k
+        self.noise_diag = np.array(imu_noise.to_storage(), dtype=np.float64)
+        self.imu_bias = imu_bias
+        self.epsilon = float(epsilon)
+        self.kernel = kernel
+        self.pending_z = np.empty((0, 6))
+        self.pending_dt = np.empty(0)
+
+    def push(
+        self, z_imu_raw: np.ndarray, dt: T.Union[float, np.ndarray]
+    ) -> T.Tuple[np.ndarray, np.ndarray]:
+        """Add (N, 6) raw gyro and accl samples with scalar or (N,) intervals
+
+        Returns the storage and intervals of every group completed by them, see
+        to_storage.
+        """
+        z_imu_raw = np.asarray(z_imu_raw, dtype=np.float64).reshape(-1, 6)
+        dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), z_imu_raw.shape[:1])
+        z_imu_est = z_imu_raw - np.array(self.imu_bias.to_storage(), dtype=np.float64)
+        if len(self.pending_z):
+            z_imu_est = np.concatenate([self.pending_z, z_imu_est])
+            dt = np.concatenate([self.pending_dt, dt])
+        n = len(z_imu_est) // self.k * self.k
+        self.pending_z, self.pending_dt = z_imu_est[n:], dt[n:]
+        return self.coalesce_samples(z_imu_est[:n], dt[:n])
+
+    def flush(self) -> T.Tuple[np.ndarray, np.ndarray]:
+        """Coalesce the held back samples into one shorter group"""
+        z_imu_est, dt = self.pending_z, self.pending_dt
+        self.pending_z, self.pending_dt = np.empty((0, 6)), np.empty(0)
+        return self.coalesce_samples(z_imu_est, dt)
+
+    def coalesce_samples(
+        self, z_imu_est: np.ndarray, dt: np.ndarray
+    ) -> T.Tuple[np.ndarray, np.ndarray]:
+        if not len(z_imu_est):
+            return np.empty((0, STORAGE_DIM)), np.empty(0)
+        if self.kernel is not None and len(z_imu_est) % self.k == 0:
+            # the columns of the (6, k) kernel input are consecutive samples
+            dt = dt.reshape(-1, self.k)
+            storage = np.empty((len(dt), STORAGE_DIM))
+            self.kernel.call_c_batch(
+                self.noise_diag,
+                z_imu_est.reshape(-1, 6 * self.k),
+                dt,
+                out={"delta": storage[:, :10], "cov": storage[:, 10:]},
+            )
+            return storage, dt.sum(axis=1)
+        deltas = coalesce_stream(
+            z_imu_est[:, 0:3],
+            z_imu_est[:, 3:6],
+            dt,
+            self.k,
+            self.noise_diag,
+            self.epsilon,
+        )
+        return to_storage(deltas)
+
+
+def preintegrate_decimated(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreint,
+    gyro: np.ndarray,
+    accl: np.ndarray,
+    dt: T.Union[float, np.ndarray],
+    k: int,
+    epsilon: T.Scalar = sf.epsilon(),
+) -> ImuPreint:
+    """Numeric preintegrate_delta over N bias corrected samples coalesced k at a
+    time, the counterpart of se23.batch_integration.preintegrate_batch"""
+    epsilon = float(epsilon)
+    gyro = np.asarray(gyro, dtype=np.float64).reshape(-1, 3)
+    accl = np.asarray(accl, dtype=np.float64).reshape(-1, 3)
+    dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), gyro.shape[:1])
+    noise_diag = np.array(imu_noise.to_storage(), dtype=np.float64)
+
+    delta_q, delta_v, delta_t, tau, Q = coalesce_stream(
+        gyro, accl, dt, k, noise_diag, epsilon
+    )
+    upsilon = np.array(preint_prev.upsilon.to_storage(), dtype=np.float64)
+    quats, vs, ts = fold_upsilon(
+        upsilon[:4], upsilon[4:7], upsilon[7:10], delta_q, delta_v, delta_t, tau
+    )
+    A = transition_matrices(delta_q, delta_v, delta_t, tau)
+    cov = fold_cov(cov_to_numpy(preint_prev.cov), A, Q)
+
+    upsilon_new = Pose23_SE23.from_storage(
+        [*quats[-1].tolist(), *vs[-1].tolist(), *ts[-1].tolist()]
+    )
+    return ImuPreint(upsilon_new, Cov99(cov))
@@ -0,0 +1,206 @@
+"""Error state Kalman filter on State
+
+The nominal state nom is a Pose23_SE23 in the world frame and err_cov the
+covariance of its right perturbation nom * Exp(xi), the same convention as the
+covariance of ImuPreint, so propagate is preintegrate with gravity:
+
+    nom_new = Gamma(g, dt) * Phi(nom, dt) * delta(z_imu_raw - imu_bias)
+
+Gamma multiplies from the left and leaves the right perturbation alone, so the
+transition and noise jacobians are those of preintegrate_terms. The bias is
+part of State but not of the error state, it is subtracted and carried along.
+
+An update takes a measurement model h(nom) -> z of m <= 9 elements. Its
+jacobian wrt xi is taken symbolically at xi = 0, the covariance update is the
+Joseph form (I - K H) P (I - K H).T + K R K.T, which stays symmetric and
+positive definite in floating point, and the correction is applied as
+nom.retract(K (z - h(nom))). The reset jacobian of the correction is left out.
+
+propagate_kernel, update_kernel and cycle_kernel make functions of fixed
+signatures for FuncWrapper. Wrapped with carry="state" their scan updates a
+State buffer in place, which ErrorStateFilter does for every step.
+"""
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+from symforce.geo import Matrix, Vector3, Vector9
+from symforce.geo.matrix import matrix_type_from_shape
+
+from codegen.get_code import FuncWrapper
+from se23.integration import Gamma, preintegrate_terms
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ZImuRaw, State, Cov, NumericState
+
+MeasurementModel = T.Callable[[Pose23_SE23], Matrix]
+
+
+def position(nom: Pose23_SE23) -> Vector3:
+    """Position in the world frame, e.g. gnss"""
+    return nom.t
+
+
+def velocity(nom: Pose23_SE23) -> Vector3:
+    """Velocity in the world frame"""
+    return nom.v
+
+
+def propagate(
+    imu_noise: ImuNoise,
+    state: State,
+    z_imu_raw: ZImuRaw,
+    dt: sf.Scalar,
+    gravity: Vector3,
+) -> State:
+    """nom and err_cov one imu sample of dt later"""
+    upsilon_new, A, G = preintegrate_terms(state.nom, z_imu_raw - state.imu_bias, dt)
+    nom = Gamma(gravity, dt).compose(upsilon_new)
+    err_cov = state.err_cov.congruence(*A) + (imu_noise.cov * dt).congruence(G)
+    return State(nom, err_cov, state.imu_bias)
+
+
+def measurement_jacobian(
+    h: MeasurementModel, nom: Pose23_SE23, epsilon: T.Scalar = sf.epsilon()
+) -> T.Tuple[Matrix, Matrix]:
+    """h(nom) and its derivative wrt xi of nom * Exp(xi) at xi = 0"""
+    xi = Vector9.symbolic("xi")
+    perturbed = Matrix(h(nom.retract(xi.to_flat_list(), epsilon)))
+    H = perturbed.jacobian(xi).subs({e: 0 for e in xi})
+    return Matrix(h(nom)), H
+
+
+def update(
+    state: State,
+    z: Matrix,
+    R: Cov,
+    h: MeasurementModel,
+    epsilon: T.Scalar = sf.epsilon(),
+) -> State:
+    """Joseph form update with the measurement z ~ h(nom) of covariance R"""
+    z_pred, H = measurement_jacobian(h, state.nom, epsilon)
+    PHt = state.err_cov.mat * H.T
+    S = H * PHt + R.mat
+    K = PHt * S.inv()
+    xi = K * (z - z_pred)
+    nom = state.nom.retract(xi.to_flat_list(), epsilon)
+    err_cov = state.err_cov.congruence(Matrix.eye(9) - K * H) + R.congruence(K)
+    return State(nom, err_cov, state.imu_bias)
+
+
+def measurement_dim(h: MeasurementModel) -> int:
+    return Matrix(h(Pose23_SE23.symbolic("nom"))).shape[0]
+
+
+def propagate_kernel() -> T.Callable:
+    def eskf_propagate(
+        state: State,
+        imu_noise: ImuNoise,
+        z_imu_raw: ZImuRaw,
+        dt: sf.Scalar,
+        gravity: Vector3,
+    ) -> State:
+        """propagate with the state as the first input, the carry of the scan"""
+        return propagate(imu_noise, state, z_imu_raw, dt, gravity)
+
+    return eskf_propagate
+
+
+def update_kernel(h: MeasurementModel) -> T.Callable:
+    m = measurement_dim(h)
+    Z, R_type = matrix_type_from_shape((m, 1)), Cov.sized(m)
+
+    def kernel(state: State, z: Z, R: R_type) -> State:
+        return update(state, z, R, h)
+
+    kernel.__name__ = f"eskf_update_{h.__name__}"
+    kernel.__doc__ = f"update with the {h.__name__} measurement model"
+    return kernel
+
+
+def cycle_kernel(h: MeasurementModel) -> T.Callable:
+    m = measurement_dim(h)
+    Z, R_type = matrix_type_from_shape((m, 1)), Cov.sized(m)
+
+    def kernel(
+        state: State,
+        imu_noise: ImuNoise,
+        z_imu_raw: ZImuRaw,
+        dt: sf.Scalar,
+        gravity: Vector3,
+        z: Z,
+        R: R_type,
+    ) -> State:
+        state = propagate(imu_noise, state, z_imu_raw, dt, gravity)
+        return update(state, z, R, h)
+
+    kernel.__name__ = f"eskf_cycle_{h.__name__}"
+    kernel.__doc__ = f"propagate followed by an update with {h.__name__}"
+    return kernel
+
+
+class ErrorStateFilter:
+    """Numeric filter on a State buffer, every step is one kernel call
+
+    The kernels are FuncWrappers of propagate_kernel, update_kernel and
+    cycle_kernel with carry="state", the propagate kernel is required and the
+    update and cycle kernels are optional. Their scans copy the carry in before
+    writing it out, so the state buffer is updated in place, and a batch of imu
+    samples or measurements is folded in one call.
+    """
+
+    def __init__(
+        self,
+        state: T.Union[State, NumericState],
+        imu_noise: ImuNoise,
+        gravity: T.Sequence[float] = (0.0, 0.0, -9.81),
+        *,
+        propagate: FuncWrapper,
+        updates: T.Optional[T.Dict[str, FuncWrapper]] = None,
+        cycles: T.Optional[T.Dict[str, FuncWrapper]] = None,
+    ) -> None:
+        if isinstance(state, State):
+            state = state.to_numeric()
+        self.state = state
+        self.imu_noise = np.array(imu_noise.to_storage(), dtype=np.float64)
+        self.gravity = np.array(gravity, dtype=np.float64)
+        self.kernels = {"propagate": propagate, **(updates or {})}
+        self.cycles = cycles or {}
+
+    def propagate(self, z_imu_raw: np.ndarray, dt: T.Union[float, np.ndarray]) -> None:
+        """(6,) or (N, 6) raw samples"""
+        self.kernels["propagate"].call_c_scan(
+            self.state,
+            self.imu_noise,
+            np.asarray(z_imu_raw, dtype=np.float64).reshape(-1, 6),
+            np.broadcast_to(dt, np.shape(z_imu_raw)[:-1] or (1,)),
+            self.gravity,
+            out=self.state,
+        )
+
+    def update(self, model: str, z: np.ndarray, R: np.ndarray) -> None:
+        """z (m,) or (N, m) and R (m, m) of the measurement model model"""
+        self.kernels[model].call_c_scan(
+            self.state, *self.measurement(z, R), out=self.state
+        )
+
+    def cycle(
+        self, model: str, z_imu_raw: np.ndarray, dt: float, z: np.ndarray, R: np.ndarray
+    ) -> None:
+        """propagate with one sample and update, in one kernel call"""
+        self.cycles[model].call_c_scan(
+            self.state,
+            self.imu_noise,
+            np.asarray(z_imu_raw, dtype=np.float64),
+            dt,
+            self.gravity,
+            *self.measurement(z, R),
+            out=self.state,
+        )
+
+    @staticmethod
+    def measurement(z: np.ndarray, R: np.ndarray) -> T.Tuple[np.ndarray, np.ndarray]:
+        """z and R as the packed lower triangle"""
+        z = np.asarray(z, dtype=np.float64)
+        R = np.asarray(R, dtype=np.float64)
+        cov = Cov.sized(len(R))
+        return z.reshape(-1, len(R)), R[cov.tril_indices()]
@@ -0,0 +1,217 @@
+"""Banks of independent filters advanced in lockstep
+
+A FilterBank holds M states of one SymState, e.g. State for M error state
+filters or ImuPreint for M preintegrations, as the rows of one (M, DIM)
+NumericState, the structure of arrays layout the batch kernels read and write
+without copies. Every step advances all of them with one batched kernel call:
+
+    bank = FilterBank(State.numeric().zeros(M), steps, imu_noise=noise)
+    bank.step("propagate", z_imu_raw=z_imu_raw, dt=dt, gravity=gravity)
+
+A step is made from a FuncWrapper with a carry, kernel_step calls its batch
+kernel and python_step evaluates the wrapped function item by item, for use
+without the compiled kernels. Inputs of the kernel are passed by name, either
+as constants of the bank or to step. An array input with ndim >= 2 holds one
+item per filter, a per filter scalar is (M, 1), everything else is shared by
+all filters, like the samples of a common imu log.
+
+ShardedFilterBank keeps the buffers in shared memory and has worker processes
+advance contiguous shards of the filters, for banks too large for one core.
+"""
+
+import inspect
+import mmap
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+
+from codegen.get_code import FuncWrapper
+from states import NumericState
+
+Input = T.Union[np.ndarray, NumericState, float]
+Step = T.Callable[..., None]
+
+
+def per_filter(value: Input) -> bool:
+    """Whether value holds one item per filter"""
+    if isinstance(value, NumericState):
+        value = value.buffer
+    return np.ndim(value) >= 2
+
+
+def take(value: Input, item: T.Union[int, slice]) -> Input:
+    """Item or shard of a per filter value, other values are shared"""
+    return value[item] if per_filter(value) else value
+
+
+def kernel_step(func: FuncWrapper, parallel: bool = True) -> Step:
+    """Step with the batch kernel of func, the carry input of func is the state
+    of the filters"""
+
+    def step(states: NumericState, out: NumericState, **inputs: Input) -> None:
+        func.call_c_batch(**{func.carry: states}, **inputs, out=out, parallel=parallel)
+
+    step.inputs = tuple(func.cpp_input_signatures())
+    return step
+
+
+def python_step(func: FuncWrapper) -> Step:
+    """Step evaluating the function of func one filter at a time"""
+    params = inspect.signature(func.func).parameters
+    params = {k: v.annotation for k, v in params.items()}
+
+    def as_type(typ: T.Type, value: Input) -> T.Any:
+        if typ is sf.Scalar:
+            return float(np.ravel(value)[0])
+        if isinstance(value, NumericState):
+            return value.to_state()
+        if hasattr(typ, "numeric"):
+            return typ.numeric()(value).to_state()
+        return typ.from_storage(np.ravel(value).tolist())
+
+    def step(states: NumericState, out: NumericState, **inputs: Input) -> None:
+        for i in range(len(states)):
+            args = {k: as_type(params[k], take(v, i)) for k, v in inputs.items()}
+            args[func.carry] = states[i].to_state()
+            out.buffer[i] = np.array(func.func(**args).to_storage(), dtype=np.float64)
+
+    step.inputs = tuple(params)
+    return step
+
+
+class FilterBank:
+    """M states in one (M, DIM) NumericState, advanced by named steps
+
+    constants are inputs passed to every step that takes them, e.g. the
+    ImuNoise of every filter as (M, 6). The inputs a step takes are listed in
+    its inputs attribute. A step writes the next states into a second buffer,
+    since the kernels do not support outputs aliasing their inputs, and the
+    rows it wrote are copied back.
+    """
+
+    def __init__(
+        self, states: NumericState, steps: T.Dict[str, Step], **constants: Input
+    ) -> None:
+        if states.buffer.ndim != 2:
+            raise ValueError("A bank needs a batch of states, (M, DIM)")
+        self.states = states
+        self.steps = steps
+        self.constants = constants
+        self._next = states.copy()
+        for k, v in constants.items():
+            self.check(k, v)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def check(self, name: str, value: Input) -> None:
+        if per_filter(value) and len(value) != len(self):
+            raise ValueError(f"{name} has {len(value)} items, the bank {len(self)}")
+
+    def step(self, name: str, **inputs: Input) -> None:
+        """Advance every filter with the step name"""
+        for k, v in inputs.items():
+            self.check(k, v)
+        self.advance(name, slice(None), inputs)
+
+    def advance(self, name: str, shard: slice, inputs: T.Dict[str, Input]) -> None:
+        """Advance the filters of shard, per filter inputs hold only the shard"""
+        step = self.steps[name]
+        names = getattr(step, "inputs", self.constants)
+        constants = {k: take(v, shard) for k, v in self.constants.items() if k in names}
+        step(self.states[shard], self._next[shard], **constants, **inputs)
+        self.states.buffer[shard] = self._next.buffer[shard]
+
+
+def shared_array(array: np.ndarray) -> np.ndarray:
+    """Copy of array in anonymous shared memory, seen by forked processes"""
+    array = np.asarray(array)
+    buffer = mmap.mmap(-1, max(array.nbytes, 1))
+    shared = np.frombuffer(buffer, dtype=array.dtype, count=array.size)
+    shared = shared.reshape(array.shape)
+    shared[...] = array
+    return shared
+
+
+def serve(bank: FilterBank, shard: slice, conn: Connection) -> None:
+    """Worker loop, advances shard for every (name, inputs) until None"""
+    while (message := conn.recv()) is not None:
+        name, inputs = message
+        try:
+            bank.advance(name, shard, inputs)
+            conn.send(None)
+        except Exception as error:  # pylint: disable=broad-except
+            conn.send(error)
+
+
+class ShardedFilterBank(FilterBank):
+    """FilterBank whose steps run in worker processes, one contiguous shard of
+    the filters each
+
+    The states and the per filter constants are moved to shared memory before
+    the workers are forked, so only the per filter inputs of a step are sent to
+    them. Use steps with parallel=False, the workers are the parallelism and
+    OpenMP does not survive a fork of a process that used it. close() or a with
+    block stops the workers.
+    """
+
+    def __init__(
+        self,
+        states: NumericState,
+        steps: T.Dict[str, Step],
+        workers: int,
+        **constants: Input,
+    ) -> None:
+        states = type(states)(shared_array(states.buffer))
+        constants = {
+            k: self.to_shared(v) if per_filter(v) else v for k, v in constants.items()
+        }
+        super().__init__(states, steps, **constants)
+        self._next = type(states)(shared_array(self._next.buffer))
+        bounds = np.linspace(0, len(self), min(workers, len(self)) + 1).astype(int)
+        self.shards = [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+        context = get_context("fork")
+        self.conns, self.workers = [], []
+        for shard in self.shards:
+            conn, worker_conn = context.Pipe()
+            worker = context.Process(
+                target=serve, args=(self, shard, worker_conn), daemon=True
+            )
+            worker.start()
+            self.conns.append(conn)
+            self.workers.append(worker)
+
+    @staticmethod
+    def to_shared(value: Input) -> Input:
+        if isinstance(value, NumericState):
+            return type(value)(shared_array(value.buffer))
+        return shared_array(value)
+
+    def step(self, name: str, **inputs: Input) -> None:
+        for k, v in inputs.items():
+            self.check(k, v)
+        # NumericState classes are made at runtime and can not be pickled
+        inputs = {
+            k: v.buffer if isinstance(v, NumericState) else v for k, v in inputs.items()
+        }
+        for conn, shard in zip(self.conns, self.shards):
+            conn.send((name, {k: take(v, shard) for k, v in inputs.items()}))
+        errors = [conn.recv() for conn in self.conns]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def close(self) -> None:
+        for conn, worker in zip(self.conns, self.workers):
+            conn.send(None)
+            worker.join()
+        self.conns, self.workers = [], []
+
+    def __enter__(self) -> "ShardedFilterBank":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
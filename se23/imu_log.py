@@ -0,0 +1,170 @@
+"""Memory mapped, columnar log of timestamped imu samples
+
+The file is a fixed size header followed by one column per quantity, each
+aligned to ALIGN bytes:
+
+    time    (N,) float64    sample timestamps, strictly increasing
+    z_imu   (N, 6) float64  raw gyro and accl, the layout of ZImuRaw storage
+    dt      (N,) float64    time to the next sample, the last one repeats the
+                            previous interval
+    index   (ceil(N / stride),) float64  time[::stride]
+
+Every sample is a fixed width record of its columns, so sample i of a column is
+at a fixed offset and a range of samples is a contiguous slice of each column.
+The index is small enough to stay in memory; a time is located by a search in
+the index and then in one stride of the time column, so only a page or two of
+the time column is touched. ImuLog hands out views of the mapped columns, the
+z_imu and dt of an interval go to the preintegration kernels without a copy.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from symforce import typing as T
+
+MAGIC = b"SFIMULOG"
+VERSION = 1
+ALIGN = 64
+HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("stride", "<u4"),
+        ("count", "<u8"),
+    ]
+)
+COLUMNS = (("time", ()), ("z_imu", (6,)), ("dt", ()))
+
+
+class ImuInterval(T.NamedTuple):
+    """Samples of one interval, views into the log"""
+
+    time: np.ndarray
+    z_imu: np.ndarray
+    dt: np.ndarray
+
+
+def aligned(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
+
+
+def layout(count: int, stride: int) -> T.Dict[str, T.Tuple[int, T.Tuple[int, ...]]]:
+    """Byte offset and shape of every column"""
+    columns, offset = {}, aligned(HEADER.itemsize)
+    shapes = [(name, (count, *shape)) for name, shape in COLUMNS]
+    shapes.append(("index", (-(-count // stride),)))
+    for name, shape in shapes:
+        columns[name] = (offset, shape)
+        offset = aligned(offset + int(np.prod(shape)) * 8)
+    columns["end"] = (offset, ())
+    return columns
+
+
+def write_imu_log(
+    path: T.Union[str, Path],
+    time: np.ndarray,
+    z_imu: np.ndarray,
+    stride: int = 4096,
+    chunk: int = 1 << 20,
+) -> None:
+    """Write (N,) timestamps and (N, 6) raw gyro and accl samples
+
+    The inputs can be memory mapped themselves, they are copied chunk by chunk.
+    The log is written next to path and renamed into place once complete, so
+    invalid input or a failed write leaves an existing log untouched.
+    """
+    path = Path(path)
+    time, z_imu = np.asarray(time), np.asarray(z_imu)
+    count = len(time)
+    if count < 2 or z_imu.shape != (count, 6):
+        raise ValueError("Need at least two samples, time (N,) and z_imu (N, 6)")
+    for start in range(0, count - 1, chunk):
+        if not np.all(np.diff(time[start : start + chunk + 1]) > 0):
+            raise ValueError("time must be strictly increasing")
+    columns = layout(count, stride)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        mm = np.memmap(tmp, dtype=np.uint8, mode="w+", shape=columns["end"][0])
+        header = np.zeros((), HEADER)
+        header["magic"], header["version"] = MAGIC, VERSION
+        header["stride"], header["count"] = stride, count
+        mm[: HEADER.itemsize] = np.frombuffer(header.tobytes(), np.uint8)
+        out = {
+            name: np.ndarray(shape, np.float64, mm, offset)
+            for name, (offset, shape) in columns.items()
+            if name != "end"
+        }
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            out["time"][start:stop] = time[start:stop]
+            out["z_imu"][start:stop] = z_imu[start:stop]
+            out["dt"][start : stop - 1] = np.diff(time[start:stop])
+            if stop < count:
+                out["dt"][stop - 1] = time[stop] - time[stop - 1]
+        out["dt"][-1] = out["dt"][-2]
+        out["index"][:] = out["time"][::stride]
+        mm.flush()
+        del mm, out
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ImuLog:
+    """Read only view of a log written by write_imu_log"""
+
+    def __init__(self, path: T.Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._mm = np.memmap(self.path, dtype=np.uint8, mode="r")
+        header = np.frombuffer(self._mm, HEADER, count=1)[0]
+        if header["magic"] != MAGIC or header["version"] != VERSION:
+            raise ValueError(f"{self.path} is not an imu log of version {VERSION}")
+        self.stride = int(header["stride"])
+        count = int(header["count"])
+        columns = layout(count, self.stride)
+        if len(self._mm) < columns["end"][0]:
+            raise ValueError(f"{self.path} is truncated")
+        self.time, self.z_imu, self.dt, self.index = (
+            np.ndarray(shape, np.float64, self._mm, offset)
+            for offset, shape in (
+                columns[name] for name in ("time", "z_imu", "dt", "index")
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, item: slice) -> ImuInterval:
+        return ImuInterval(self.time[item], self.z_imu[item], self.dt[item])
+
+    def search(self, t: T.Union[float, np.ndarray]) -> T.Union[int, np.ndarray]:
+        """Offset of the first sample at or after t, same as
+        np.searchsorted(self.time, t) without scanning the time column"""
+        t = np.asarray(t, dtype=np.float64)
+        block = np.searchsorted(self.index, t, side="right") - 1
+        offsets = np.empty(t.shape, dtype=np.int64)
+        for i, (t_i, block_i) in enumerate(zip(t.flat, block.flat)):
+            if block_i < 0:
+                offsets.flat[i] = 0
+                continue
+            start = block_i * self.stride
+            times = self.time[start : start + self.stride]
+            offsets.flat[i] = start + np.searchsorted(times, t_i)
+        return int(offsets) if offsets.ndim == 0 else offsets
+
+    def interval(self, t_start: float, t_stop: float) -> ImuInterval:
+        """Samples with t_start <= time < t_stop"""
+        return self[self.search(t_start) : self.search(t_stop)]
+
+    def intervals(self, keyframe_times: np.ndarray) -> T.Iterator[ImuInterval]:
+        """Samples between consecutive keyframe times, every sample belongs to
+        exactly one interval and its dt reaches the next sample"""
+        offsets = self.search(np.asarray(keyframe_times, dtype=np.float64))
+        for start, stop in zip(offsets[:-1], offsets[1:]):
+            yield self[start:stop]
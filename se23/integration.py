@@ -1,29 +1,25 @@
+import itertools
+
 from symforce.geo import Matrix, Matrix33, Vector3, Rot3, Matrix99, Matrix66
+from symforce.geo.matrix import matrix_type_from_shape
 from se23.pose23 import Pose23
 
-from se23.pose23_SE23 import Pose23_SE23
+from se23.pose23_SE23 import Pose23_SE23, SO3_ljac, SO3_ljac_inv
 import symforce.symbolic as sf
 from symforce import typing as T
 
-from states import ImuNoise, ZImuEst, ImuPreint, State
-
-
-def SO3_ljac_inv(phi: Vector3, epsilon: T.Scalar = sf.epsilon()) -> Matrix33:
-    """Left jacobian inverse"""
-    theta = sf.sqrt(phi.squared_norm() + epsilon)
-    R_hat = Rot3.hat(phi)
-    half_theta = 0.5 * theta
-
-    V_inv = (
-        Matrix.eye(3)
-        - 0.5 * R_hat
-        + (
-            (1 - theta * sf.cos(half_theta) / (2 * sf.sin(half_theta)))
-            / (theta * theta)
-        )
-        * (R_hat * R_hat)
-    )
-    return V_inv
+from states import (
+    ImuNoise,
+    ZImuEst,
+    ZImuDelta,
+    ImuPreint,
+    ImuPreintSqrt,
+    ImuPreintJac,
+    ImuBias,
+    State,
+    Cov99,
+    CovSqrt99,
+)
 
 
 def Phi(pose: Pose23_SE23, dt: sf.Scalar) -> Pose23_SE23:
@@ -34,13 +30,24 @@ def Gamma(g: Vector3, dt: sf.Scalar) -> Pose23_SE23:
     return Pose23_SE23(Rot3.identity(), g * dt, g * dt**2 / 2)
 
 
-def preintegrate(
-    imu_noise: ImuNoise,
-    preint_prev: ImuPreint,
-    z_imu_est: ZImuEst,
-    dt: sf.Scalar,
-) -> Matrix99:
-    """[se23(39)]"""
+def transition_factors(delta: Pose23_SE23, dt: sf.Scalar) -> T.Tuple[Matrix99, ...]:
+    """Sparse factors of A = Ad(delta^-1) * F, the transition matrix of
+    upsilon_new = Phi(upsilon, dt).compose(delta)"""
+    F = Matrix.eye(9, 9)
+    F[6:9, 3:6] = dt * Matrix.eye(3, 3)
+    return (*delta.inverse_adjoint_factors(), F)
+
+
+def preintegrate_terms(
+    upsilon: Pose23_SE23, z_imu_est: ZImuEst, dt: sf.Scalar
+) -> T.Tuple[Pose23_SE23, T.Tuple[Matrix99, ...], Matrix]:
+    """upsilon_new, the transition matrix A and the noise jacobian G
+
+    The covariance is that of the right perturbation upsilon * Exp(xi), which
+    the increment delta moves by A = Ad(delta^-1) * F. A is returned as its
+    sparse factors, the block diagonal rotation, the shear of Ad(delta^-1) and
+    F, so it is never multiplied out.
+    """
     delta_R = Rot3.from_tangent((z_imu_est.gyro) * dt)
 
     a_0 = z_imu_est.accl
@@ -48,9 +55,8 @@ def preintegrate(
     delta_v = a_0 * dt + (a_1 - a_0) * dt**2 / 2
     delta_t = a_0 * dt**2 / 2 + (a_1 - a_0) * dt**3 / 6
 
-    upsilon_new = Phi(preint_prev.upsilon, dt).compose(
-        Pose23_SE23(R=delta_R, v=delta_v, t=delta_t)
-    )
+    delta = Pose23_SE23(R=delta_R, v=delta_v, t=delta_t)
+    upsilon_new = Phi(upsilon, dt).compose(delta)
 
     J_inv = SO3_ljac_inv(z_imu_est.gyro * dt)
     rot_from_omega_dt = Rot3.from_tangent(-z_imu_est.gyro * dt)
@@ -62,11 +68,266 @@ def preintegrate(
             [Matrix.zeros(3, 3), R * dt**2 / 2],
         ]
     )
-    Q_i = G * (imu_noise.cov * dt) * G.T
 
-    F = Matrix.eye(9, 9)
-    F[6:9, 3:6] = dt * Matrix.eye(3, 3)
-    A = preint_prev.upsilon.inverse().adjoint() * F
+    return upsilon_new, transition_factors(delta, dt), G
+
+
+def op1(A: Matrix33) -> Matrix33:
+    """<<A>> = -tr(A) * I + A"""
+    return -sum(A[i, i] for i in range(3)) * Matrix.eye(3) + A
+
+
+def op2(A: Matrix33, B: Matrix33) -> Matrix33:
+    """<<A, B>> = <<A>> * <<B>> + <<B * A>>"""
+    return op1(A) * op1(B) + op1(B * A)
 
-    cov_new = A * preint_prev.cov * A.T + Q_i
+
+def fourth_order_terms(Sigma: Cov99, Q: Cov99) -> Cov99:
+    """The fourth order terms of the covariance of Log(Exp(a) * Exp(b)) with
+    a ~ N(0, Sigma) and b ~ N(0, Q)
+
+    Barfoot and Furgale, Associating Uncertainty With Three-Dimensional Poses
+    for Use in Estimation Problems, with the SE(3) blocks repeated for v and t
+    of SE2(3) in the (rot, v, t) order.
+    """
+    S = Sigma.mat
+    S_pp, S_vp, S_rp = S[0:3, 0:3], S[3:6, 0:3], S[6:9, 0:3]
+    S_vv, S_vr, S_rr = S[3:6, 3:6], S[3:6, 6:9], S[6:9, 6:9]
+    P = Q.mat
+    Q_pp, Q_vp, Q_rp = P[0:3, 0:3], P[3:6, 0:3], P[6:9, 0:3]
+    Q_vv, Q_vr, Q_rr = P[3:6, 3:6], P[3:6, 6:9], P[6:9, 6:9]
+
+    def A_of(pp: Matrix33, vp: Matrix33, rp: Matrix33) -> Matrix99:
+        A = Matrix.zeros(9, 9)
+        A[0:3, 0:3] = A[3:6, 3:6] = A[6:9, 6:9] = op1(pp)
+        A[3:6, 0:3] = op1(vp + vp.T)
+        A[6:9, 0:3] = op1(rp + rp.T)
+        return A
+
+    A_1 = A_of(S_pp, S_vp, S_rp)
+    A_2 = A_of(Q_pp, Q_vp, Q_rp)
+
+    # only the lower blocks, the result is symmetric
+    B = Matrix.zeros(9, 9)
+    B[0:3, 0:3] = op2(S_pp, Q_pp)
+    B[3:6, 0:3] = op2(S_pp, Q_vp.T) + op2(S_vp.T, Q_pp)
+    B[6:9, 0:3] = op2(S_pp, Q_rp.T) + op2(S_rp.T, Q_pp)
+    B[3:6, 3:6] = (
+        op2(S_pp, Q_vv) + op2(S_vp.T, Q_vp) + op2(S_vp, Q_vp.T) + op2(S_vv, Q_pp)
+    )
+    B[6:9, 3:6] = (
+        op2(S_pp, Q_vr) + op2(S_vp.T, Q_rp) + op2(S_rp, Q_vp.T) + op2(S_vr, Q_pp)
+    ).T
+    B[6:9, 6:9] = (
+        op2(S_pp, Q_rr) + op2(S_rp.T, Q_rp) + op2(S_rp, Q_rp.T) + op2(S_rr, Q_pp)
+    )
+
+    A_1Q = A_1 * P
+    A_2S = A_2 * S
+    terms = (A_1Q + A_1Q.T + A_2S + A_2S.T) / 12 + B / 4
+    return Cov99(terms)
+
+
+def preintegrate(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreint,
+    z_imu_est: ZImuEst,
+    dt: sf.Scalar,
+    order: int = 2,
+) -> ImuPreint:
+    """[se23(39)], except for the transition of the covariance
+
+    [se23(39)] moves the covariance with Ad(upsilon^-1) * F. This propagates
+    it with A = Ad(delta^-1) * F of preintegrate_terms, the transition of the
+    right perturbation upsilon * Exp(xi), for both orders. test_monte_carlo
+    checks it against sampled imu noise.
+
+    Args:
+        order: 2 propagates the covariance as A * cov * A.T + Q_i, 4 adds the
+            fourth order terms of compounding the two, which matter once the
+            rotation uncertainty reaches a few tenths of a radian
+    """
+    if order not in (2, 4):
+        raise ValueError(f"order must be 2 or 4, not {order}")
+    upsilon_new, A, G = preintegrate_terms(preint_prev.upsilon, z_imu_est, dt)
+    Q_i = (imu_noise.cov * dt).congruence(G)
+    Sigma = preint_prev.cov.congruence(*A)
+    cov_new = Sigma + Q_i
+    if order == 4:
+        cov_new = cov_new + fourth_order_terms(Sigma, Q_i)
     return ImuPreint(upsilon_new, cov_new)
+
+
+def preintegrate_fourth_order(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreint,
+    z_imu_est: ZImuEst,
+    dt: sf.Scalar,
+) -> ImuPreint:
+    """preintegrate with order=4, as a function of its own for code generation"""
+    return preintegrate(imu_noise, preint_prev, z_imu_est, dt, order=4)
+
+
+def preintegrate_delta(
+    preint_prev: ImuPreint,
+    z_imu_delta: ZImuDelta,
+    dt: sf.Scalar,
+) -> ImuPreint:
+    """preintegrate with samples coalesced into one increment over dt
+
+    Same recurrence as preintegrate, with the increment and its noise taken from
+    z_imu_delta instead of a single ZImuEst, see se23.decimation.
+    """
+    upsilon_new = Phi(preint_prev.upsilon, dt).compose(z_imu_delta.delta)
+    A = transition_factors(z_imu_delta.delta, dt)
+    return ImuPreint(upsilon_new, preint_prev.cov.congruence(*A) + z_imu_delta.cov)
+
+
+def exp_second_order(phi: Vector3) -> Matrix33:
+    """Exp(phi) to second order in phi, without trigonometry"""
+    phi_hat = Rot3.hat(phi)
+    return Matrix.eye(3) + phi_hat + phi_hat * phi_hat / 2
+
+
+def hat_congruence(M: Matrix33, d: Vector3) -> Matrix33:
+    """sum_k hat(x_k) * diag(d) * hat(y_k).T from M = sum_k x_k * y_k.T"""
+    out = Matrix.zeros(3, 3)
+    for i, j, l in itertools.product(range(3), repeat=3):
+        if l not in (i, j):
+            sign = (1 if (l - i) % 3 == 1 else -1) * (1 if (l - j) % 3 == 1 else -1)
+            out[i, j] += sign * d[l] * M[3 - i - l, 3 - j - l]
+    return out
+
+
+def coalesce(imu_noise: ImuNoise, samples: Matrix, dt: Matrix) -> ZImuDelta:
+    """Bias corrected samples coalesced into one increment for preintegrate_delta
+
+    samples holds gyro and accl of one sample per column, and dt the interval
+    of every sample. The rotation vector of the group sums the gyro increments
+    alpha_k with the coning terms 1/2 * (alpha_1 + ... + alpha_k-1) x alpha_k,
+    and the velocity and position increments of every sample (the same as in
+    preintegrate_terms) are rotated into the start of the group with the second
+    order Exp(phi), so only the rotation of the whole group needs trigonometry.
+
+    The noise of sample k reaches the end of the group through
+    Ad(delta^-1) * F(tau) * F(-tau_k) * Ad(delta_k), with delta_k = (R, v, p)
+    the increment up to and including sample k. The rotation R only enters as
+    R * N * R.T, so with the noise jacobians to zeroth order in alpha the noise
+    of the group only needs sums of v, p - tau_k * v and their outer products,
+    weighted by dt_k**3, which is exact for isotropic gyro and accl noise.
+    """
+    phi = alpha_sum = v = p = sum_v = sum_s = Vector3.zero()
+    M_vv = M_sv = M_ss = Matrix.zeros(3, 3)
+    tau = sum_w = sum_c = sum_cc = 0
+    for k in range(samples.shape[1]):
+        gyro, accl, dt_k = samples[0:3, k], samples[3:6, k], dt[k]
+        alpha, nu = gyro * dt_k, accl * dt_k
+
+        # (a_1 - a_0) * dt of preintegrate_terms
+        alpha_nu = alpha.cross(nu)
+        a_diff_dt = alpha_nu + alpha.cross(alpha_nu) / 2
+        R = exp_second_order(phi)
+        dv = R * (nu + a_diff_dt * dt_k / 2)
+        dp = R * (nu * dt_k / 2 + a_diff_dt * dt_k**2 / 6) + v * dt_k
+        phi = phi + alpha + alpha_sum.cross(alpha) / 2
+        alpha_sum = alpha_sum + alpha
+        v, p, tau = v + dv, p + dp, tau + dt_k
+
+        w, s, c = dt_k**3, p - tau * v, dt_k / 2 - tau
+        sum_w, sum_v, sum_s = sum_w + w, sum_v + w * v, sum_s + w * s
+        M_vv, M_sv, M_ss = M_vv + w * v * v.T, M_sv + w * s * v.T, M_ss + w * s * s.T
+        sum_c, sum_cc = sum_c + w * c, sum_cc + w * c**2
+
+    # sum_k dt_k**3 * L_k * diag(N_g, N_a) * L_k.T, L_k = [[I, 0], [v^, I], [s^, c I]]
+    N_g, N_a = imu_noise.gyro, imu_noise.accl
+    noise = Matrix.zeros(9, 9)
+    noise[0:3, 0:3] = sum_w * Matrix.diag(N_g)
+    noise[3:6, 0:3] = Rot3.hat(sum_v) * Matrix.diag(N_g)
+    noise[6:9, 0:3] = Rot3.hat(sum_s) * Matrix.diag(N_g)
+    noise[3:6, 3:6] = hat_congruence(M_vv, N_g) + sum_w * Matrix.diag(N_a)
+    noise[6:9, 3:6] = hat_congruence(M_sv, N_g) + sum_c * Matrix.diag(N_a)
+    noise[6:9, 6:9] = hat_congruence(M_ss, N_g) + sum_cc * Matrix.diag(N_a)
+
+    delta = Pose23_SE23(R=Rot3.from_tangent(phi), v=v, t=p)
+    cov = Cov99(noise).congruence(*transition_factors(delta, tau))
+    return ZImuDelta(delta, cov)
+
+
+def coalesce_kernel(k: int) -> T.Callable[[ImuNoise, Matrix, Matrix], ZImuDelta]:
+    """coalesce of k samples, with samples typed (6, k) and dt (k, 1) for code
+    generation"""
+
+    def kernel(
+        imu_noise: ImuNoise,
+        samples: matrix_type_from_shape((6, k)),
+        dt: matrix_type_from_shape((k, 1)),
+    ) -> ZImuDelta:
+        return coalesce(imu_noise, samples, dt)
+
+    kernel.__name__ = f"coalesce_{k}"
+    kernel.__doc__ = coalesce.__doc__
+    return kernel
+
+
+def preintegrate_sqrt(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreintSqrt,
+    z_imu_est: ZImuEst,
+    dt: sf.Scalar,
+) -> ImuPreintSqrt:
+    """preintegrate with the covariance propagated as a Cholesky factor
+
+    cov_new = [A L, G S] * [A L, G S].T with S * S.T = imu_noise.cov * dt, the
+    new factor comes from an LQ decomposition of [A L, G S] so A P A.T is never
+    formed and the factor stays triangular with a positive diagonal.
+    """
+    upsilon_new, A, G = preintegrate_terms(preint_prev.upsilon, z_imu_est, dt)
+    S = imu_noise.cov_sqrt.mat * sf.sqrt(dt)
+    AL = preint_prev.cov_sqrt.mat
+    for factor in reversed(A):
+        AL = factor * AL
+    cov_sqrt = CovSqrt99.qr_update(AL, G * S)
+    return ImuPreintSqrt(upsilon_new, cov_sqrt)
+
+
+def increment_jacobian(z_imu_est: ZImuEst, dt: sf.Scalar) -> Matrix:
+    """Derivative of the right perturbation of the increment delta of
+    preintegrate_terms wrt z_imu_est, (rot, v, t) by (gyro, accl)"""
+    omega_dt = z_imu_est.gyro * dt
+    R = Rot3.from_tangent(omega_dt).to_rotation_matrix()
+    J_r = SO3_ljac(-omega_dt) * dt
+    a_hat_J_r = Matrix.skew_symmetric(z_imu_est.accl) * J_r
+    I = Matrix.eye(3)
+    return Matrix.block_matrix(
+        [
+            [J_r, Matrix.zeros(3, 3)],
+            [-a_hat_J_r * dt**2 / 2, R.T * dt + (I - R.T) * dt**2 / 2],
+            [-a_hat_J_r * dt**3 / 6, R.T * dt**2 / 2 + (I - R.T) * dt**3 / 6],
+        ]
+    )
+
+
+def preintegrate_jac(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreintJac,
+    z_imu_est: ZImuEst,
+    dt: sf.Scalar,
+) -> ImuPreintJac:
+    """preintegrate that also carries the jacobians of upsilon wrt the bias
+
+    z_imu_est = z_imu_raw - bias, so the jacobians follow the covariance,
+    J_new = A * J - D with D the jacobian of the increment wrt z_imu_est, and
+    ImuPreintJac.correct moves upsilon to a new bias in O(1).
+    """
+    upsilon_new, A, G = preintegrate_terms(preint_prev.upsilon, z_imu_est, dt)
+    cov_new = preint_prev.cov.congruence(*A) + (imu_noise.cov * dt).congruence(G)
+    jac = preint_prev.jac_gyro.row_join(preint_prev.jac_accl)
+    for factor in reversed(A):
+        jac = factor * jac
+    jac = jac - increment_jacobian(z_imu_est, dt)
+    return ImuPreintJac(upsilon_new, cov_new, jac[:, 0:3], jac[:, 3:6])
+
+
+def preintegrate_correct(preint: ImuPreintJac, bias_delta: ImuBias) -> ImuPreint:
+    """ImuPreintJac.correct, as a function of its own for code generation"""
+    return preint.correct(bias_delta)
@@ -0,0 +1,141 @@
+"""Associative (parallel scan) version of se23.batch_integration.preintegrate_batch
+
+With Psi(dt) = [[I, 0, 0], [0, 1, dt], [0, 0, 1]] we have
+Phi(upsilon, dt) = Psi(dt)^-1 * upsilon * Psi(dt), so V_k = Psi(tau_k) * upsilon_k
+follows the plain product V_k = V_k-1 * Psi(dt_k) * delta_k. Elements of that
+product are stored as (quat, v, t, tau) and combined with compose_increments.
+
+The covariance update P -> A P A^T + Q is an affine map, and two of them combine
+to (A2 A1, A2 Q1 A2^T + Q2), so it is tree reduced as well. A and Q only depend
+on the sample, so the chunks do not need each other for it.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+import functools
+import os
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+
+from se23.pose23_SE23 import Pose23_SE23
+from se23.batch_integration import (
+    quat_multiply,
+    quat_to_rotation_matrix,
+    imu_increments,
+    noise_increments,
+    transition_matrices,
+    cov_to_numpy,
+)
+from states import ImuNoise, ImuPreint, Cov99
+
+Increment = T.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+CovMap = T.Tuple[np.ndarray, np.ndarray]
+
+
+def compose_increments(a: Increment, b: Increment) -> Increment:
+    """(quat, v, t, tau) product, broadcasts over leading axes"""
+    q_a, v_a, t_a, tau_a = a
+    q_b, v_b, t_b, tau_b = b
+    R_a = quat_to_rotation_matrix(q_a)
+    return (
+        quat_multiply(q_a, q_b),
+        np.einsum("...ij,...j->...i", R_a, v_b) + v_a,
+        np.einsum("...ij,...j->...i", R_a, t_b) + t_a + tau_b[..., None] * v_a,
+        tau_a + tau_b,
+    )
+
+
+def compose_cov_maps(a: CovMap, b: CovMap) -> CovMap:
+    """Apply a then b"""
+    A_a, Q_a = a
+    A_b, Q_b = b
+    return A_b @ A_a, A_b @ Q_a @ np.swapaxes(A_b, -1, -2) + Q_b
+
+
+def tree_reduce(combine: T.Callable, elems: T.Tuple[np.ndarray, ...]) -> T.Tuple:
+    """Ordered reduction along axis 0 in O(log N) batched steps"""
+    if len(elems[0]) == 0:
+        raise ValueError("Can not reduce an empty sequence")
+    while len(elems[0]) > 1:
+        n = len(elems[0]) // 2 * 2
+        merged = combine(tuple(e[0:n:2] for e in elems), tuple(e[1:n:2] for e in elems))
+        if n < len(elems[0]):
+            merged = tuple(np.concatenate([m, e[n:]]) for m, e in zip(merged, elems))
+        elems = merged
+    return tuple(e[0] for e in elems)
+
+
+def chunk_maps(
+    gyro: np.ndarray,
+    accl: np.ndarray,
+    dt: np.ndarray,
+    noise_diag: np.ndarray,
+    epsilon: float,
+) -> T.Tuple[Increment, CovMap]:
+    """The product of all increments in a chunk and its combined covariance map"""
+    delta_q, delta_v, delta_t = imu_increments(gyro, accl, dt, epsilon)
+    product = tree_reduce(compose_increments, (delta_q, delta_v, delta_t, dt))
+    A = transition_matrices(delta_q, delta_v, delta_t, dt)
+    Q = noise_increments(noise_diag, gyro, dt, epsilon)
+    return product, tree_reduce(compose_cov_maps, (A, Q))
+
+
+@functools.lru_cache(maxsize=None)
+def process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Pool shared by the calls with max_workers, started on first use"""
+    return ProcessPoolExecutor(max_workers)
+
+
+def preintegrate_parallel(
+    imu_noise: ImuNoise,
+    preint_prev: ImuPreint,
+    gyro: np.ndarray,
+    accl: np.ndarray,
+    dt: T.Union[float, np.ndarray],
+    epsilon: T.Scalar = sf.epsilon(),
+    max_workers: T.Optional[int] = None,
+    chunks: T.Optional[int] = None,
+    executor: T.Optional[Executor] = None,
+) -> ImuPreint:
+    """Same as preintegrate_batch, but with O(log N) depth over a process pool
+
+    Args:
+        max_workers: processes to use, defaults to os.cpu_count(), 1 runs inline
+        chunks: number of chunks the samples are split into, defaults to max_workers
+        executor: runs the chunks instead of the pool shared by the calls with
+            max_workers
+    """
+    epsilon = float(epsilon)
+    gyro = np.asarray(gyro, dtype=np.float64).reshape(-1, 3)
+    accl = np.asarray(accl, dtype=np.float64).reshape(-1, 3)
+    dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), gyro.shape[:1])
+    if len(gyro) == 0:
+        return preint_prev
+    noise_diag = np.array(imu_noise.to_storage(), dtype=np.float64)
+    max_workers = max_workers or os.cpu_count()
+    chunks = min(chunks or max_workers, len(gyro))
+
+    bounds = np.linspace(0, len(gyro), chunks + 1).astype(int)
+    parts = [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+
+    upsilon = np.array(preint_prev.upsilon.to_storage(), dtype=np.float64)
+    initial = (upsilon[:4], upsilon[4:7], upsilon[7:10], np.zeros(()))
+
+    if executor is None and max_workers > 1:
+        executor = process_pool(max_workers)
+    mapper = executor.map if executor else map
+    results = list(
+        mapper(
+            chunk_maps,
+            *zip(*((gyro[p], accl[p], dt[p], noise_diag, epsilon) for p in parts)),
+        )
+    )
+    products, cov_maps = zip(*results)
+
+    A, Q = tree_reduce(compose_cov_maps, tuple(np.stack(m) for m in zip(*cov_maps)))
+    cov = Cov99(cov_to_numpy(preint_prev.cov)).congruence(A) + Cov99(Q)
+
+    quat, v, t, _ = functools.reduce(compose_increments, products, initial)
+    upsilon_new = Pose23_SE23.from_storage([*quat.tolist(), *v.tolist(), *t.tolist()])
+    return ImuPreint(upsilon_new, cov)
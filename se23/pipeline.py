@@ -0,0 +1,331 @@
+"""Asyncio pipeline from a live imu stream to preintegrated keyframes
+
+    source -> ingest -> [chunks] -> preintegrate -> [keyframes] -> keyframes()
+
+The source yields ImuChunks, timestamped raw samples as a driver delivers them.
+The ingest stage puts them on a bounded queue, the preintegrate stage
+subtracts the current bias and folds them into the ImuPreint of the open
+keyframe with a scan function, normally the compiled preintegrate kernel, and
+puts a Keyframe on a second bounded queue whenever the KeyframeTrigger fires.
+
+A full queue blocks the stage feeding it, so a slow consumer slows down the
+ingest instead of growing memory. The source then delivers the samples it
+buffered meanwhile as one larger chunk, or with drop=True the ingest drops
+chunks and counts them. The chunk after a drop is marked with gap, the open
+keyframe is closed at the last sample before it and the next one starts at
+the first sample after it, so no dt spans the dropped samples. Every chunk carries the wall clock time it was
+received at, and each stage records the latency since then in a
+LatencyHistogram.
+
+The dt of a sample is the time to the next one, so the last sample received is
+held back until the next chunk arrives, and a keyframe ends at the timestamp
+of the first sample of the next one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from time import perf_counter
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+
+from codegen.get_code import FuncWrapper
+from se23.batch_integration import preintegrate_batch
+from se23.pose23_SE23 import Pose23_SE23
+from states import ImuNoise, ImuBias, ImuPreint, Cov99, NumericState
+
+Scan = T.Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+class LatencyHistogram:
+    """Counts of latencies in log spaced bins from low to high seconds"""
+
+    def __init__(
+        self, low: float = 1e-6, high: float = 10.0, bins_per_decade: int = 10
+    ) -> None:
+        self.low = low
+        self.bins_per_decade = bins_per_decade
+        n_bins = int(np.ceil(np.log10(high / low) * bins_per_decade))
+        self.counts = np.zeros(n_bins + 1, dtype=np.int64)
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def mean(self) -> float:
+        return self.total / max(self.count, 1)
+
+    def record(self, latency: float) -> None:
+        i = int(np.log10(max(latency, self.low) / self.low) * self.bins_per_decade)
+        self.counts[min(i, len(self.counts) - 1)] += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def upper_edge(self, i: int) -> float:
+        return self.low * 10 ** ((i + 1) / self.bins_per_decade)
+
+    def quantile(self, q: float) -> float:
+        """Upper edge of the bin holding the q quantile"""
+        if not self.count:
+            return 0.0
+        i = int(np.searchsorted(np.cumsum(self.counts), q * self.count))
+        return min(self.upper_edge(i), self.max)
+
+    def __str__(self) -> str:
+        return (
+            f"n={self.count} mean={self.mean * 1e6:.0f}us"
+            f" p50={self.quantile(0.5) * 1e6:.0f}us"
+            f" p99={self.quantile(0.99) * 1e6:.0f}us max={self.max * 1e6:.0f}us"
+        )
+
+
+class ImuChunk(T.NamedTuple):
+    """(n,) timestamps and (n, 6) raw gyro and accl, received at a wall clock
+    time of perf_counter, gap if samples before it were dropped"""
+
+    time: np.ndarray
+    z_imu: np.ndarray
+    received: float
+    gap: bool = False
+
+
+class Keyframe(T.NamedTuple):
+    """Samples from t_start to t_stop preintegrated from the identity, with the
+    bias they were corrected with, received is that of the last chunk"""
+
+    t_start: float
+    t_stop: float
+    samples: int
+    preint: NumericState
+    imu_bias: np.ndarray
+    received: float
+
+
+class SimulatedImu:
+    """Imu source of smooth motion and white noise at rate Hz
+
+    With realtime the samples become available with the wall clock and are
+    delivered every chunk_period, whatever was not consumed yet comes as one
+    larger chunk, the way a driver buffers them. Otherwise chunks of
+    chunk_period are produced as fast as they are consumed.
+    """
+
+    def __init__(
+        self,
+        rate: float = 4000.0,
+        duration: float = 1.0,
+        chunk_period: float = 1e-3,
+        realtime: bool = True,
+        noise_std: T.Sequence[float] = (1e-2,) * 3 + (1e-1,) * 3,
+        seed: int = 0,
+    ) -> None:
+        self.rate = rate
+        self.count = int(duration * rate)
+        self.chunk_period = chunk_period
+        self.realtime = realtime
+        self.noise_std = np.asarray(noise_std, dtype=np.float64)
+        self.rng = np.random.default_rng(seed)
+
+    def samples(self, start: int, stop: int) -> T.Tuple[np.ndarray, np.ndarray]:
+        time = np.arange(start, stop) / self.rate
+        phase = 2 * np.pi * time[:, None] * [0.5, 0.7, 1.1]
+        z_imu = np.hstack([np.sin(phase), np.cos(phase) + [0, 0, 9.81]])
+        z_imu += self.noise_std * self.rng.normal(size=z_imu.shape)
+        return time, z_imu
+
+    async def __aiter__(self) -> T.AsyncIterator[ImuChunk]:
+        produced, start = 0, perf_counter()
+        per_chunk = max(int(round(self.chunk_period * self.rate)), 1)
+        while produced < self.count:
+            if self.realtime:
+                await asyncio.sleep(self.chunk_period)
+                due = int((perf_counter() - start) * self.rate)
+            else:
+                await asyncio.sleep(0)
+                due = produced + per_chunk
+            due = min(due, self.count)
+            if due > produced:
+                time, z_imu = self.samples(produced, due)
+                produced = due
+                yield ImuChunk(time, z_imu, perf_counter())
+
+
+@dataclass
+class KeyframeTrigger:
+    """A keyframe is closed after period seconds or max_samples samples"""
+
+    period: float = 0.1
+    max_samples: T.Optional[int] = None
+
+    def split(self, t_start: float, samples: int, time: np.ndarray) -> int:
+        """Number of the samples at time that still belong to the keyframe that
+        started at t_start with samples samples already"""
+        stop = int(np.searchsorted(time, t_start + self.period))
+        if self.max_samples is not None:
+            stop = min(stop, max(self.max_samples - samples, 0))
+        return stop
+
+
+def kernel_scan(func: FuncWrapper, imu_noise: ImuNoise) -> Scan:
+    """Scan with a preintegrate kernel wrapped with carry="preint_prev", the
+    carry is updated in place"""
+    noise = np.array(imu_noise.to_storage(), dtype=np.float64)
+
+    def scan(carry: np.ndarray, z_imu_est: np.ndarray, dt: np.ndarray) -> np.ndarray:
+        return func.call_c_scan(noise, carry, z_imu_est, dt, out=carry)
+
+    return scan
+
+
+def batch_scan(imu_noise: ImuNoise, epsilon: T.Scalar = sf.epsilon()) -> Scan:
+    """Scan with preintegrate_batch, for use without the compiled kernels"""
+
+    def scan(carry: np.ndarray, z_imu_est: np.ndarray, dt: np.ndarray) -> np.ndarray:
+        preint = ImuPreint.numeric()(carry).to_state()
+        preint = preintegrate_batch(
+            imu_noise, preint, z_imu_est[:, :3], z_imu_est[:, 3:], dt, epsilon
+        )
+        carry[:] = preint.to_storage()
+        return carry
+
+    return scan
+
+
+class ImuPipeline:
+    """Bounded queue pipeline from an imu source to keyframes, see the module
+    docstring. run() drives the ingest and preintegrate stages until the source
+    is exhausted, keyframes() consumes the output concurrently."""
+
+    STAGES = ("ingest", "preintegrate", "emit")
+
+    def __init__(
+        self,
+        source: T.AsyncIterable[ImuChunk],
+        scan: Scan,
+        imu_bias: ImuBias,
+        trigger: KeyframeTrigger = KeyframeTrigger(),
+        queue_size: int = 64,
+        drop: bool = False,
+    ) -> None:
+        self.source = source
+        self.scan = scan
+        self.imu_bias = imu_bias
+        self.trigger = trigger
+        self.drop = drop
+        self.chunks: asyncio.Queue = asyncio.Queue(queue_size)
+        self.keyframe_queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.latency = {stage: LatencyHistogram() for stage in self.STAGES}
+        self.dropped = 0
+        self.stalled = 0.0
+        self.samples = 0
+        self.max_depth = 0
+
+    @property
+    def imu_bias(self) -> ImuBias:
+        return ImuBias.numeric()(self._bias).to_state()
+
+    @imu_bias.setter
+    def imu_bias(self, imu_bias: ImuBias) -> None:
+        """Used for every sample preintegrated from now on"""
+        self._bias = np.array(imu_bias.to_storage(), dtype=np.float64)
+
+    @staticmethod
+    def identity() -> np.ndarray:
+        preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+        return np.array(preint.to_storage(), dtype=np.float64)
+
+    async def run(self) -> None:
+        await asyncio.gather(self.ingest(), self.preintegrate())
+
+    async def ingest(self) -> None:
+        gap = False
+        async for chunk in self.source:
+            if gap:
+                chunk = chunk._replace(gap=True)
+            if not self.chunks.full():
+                self.chunks.put_nowait(chunk)
+            elif self.drop:
+                self.dropped += len(chunk.time)
+                gap = True
+                continue
+            else:
+                start = perf_counter()
+                await self.chunks.put(chunk)
+                self.stalled += perf_counter() - start
+            gap = False
+            self.max_depth = max(self.max_depth, self.chunks.qsize())
+            self.latency["ingest"].record(perf_counter() - chunk.received)
+        await self.chunks.put(None)
+
+    async def preintegrate(self) -> None:
+        carry = self.identity()
+        held: T.Optional[ImuChunk] = None
+        t_start, samples, bias = None, 0, self._bias
+        while (chunk := await self.chunks.get()) is not None:
+            if chunk.gap and held is not None:
+                # the dt of the held sample is unknown, it ends the keyframe
+                if samples:
+                    await self.emit(t_start, held.time[0], samples, carry, bias, held)
+                carry, t_start, samples, held = self.identity(), None, 0, None
+                self.dropped += 1
+            if held is not None:
+                chunk = ImuChunk(
+                    np.concatenate([held.time, chunk.time]),
+                    np.concatenate([held.z_imu, chunk.z_imu]),
+                    chunk.received,
+                )
+            held = ImuChunk(chunk.time[-1:], chunk.z_imu[-1:], chunk.received)
+            time, z_imu, dt = chunk.time, chunk.z_imu, np.diff(chunk.time)
+            t_start = time[0] if t_start is None else t_start
+            pos = 0
+            while pos < len(dt):
+                if samples == 0:
+                    # a keyframe holds at least one sample and uses one bias
+                    bias = self._bias
+                    stop = pos + max(self.trigger.split(t_start, 0, time[pos:-1]), 1)
+                else:
+                    stop = pos + self.trigger.split(t_start, samples, time[pos:-1])
+                if stop > pos:
+                    self.scan(carry, z_imu[pos:stop] - bias, dt[pos:stop])
+                    samples += stop - pos
+                    pos = stop
+                if pos < len(dt):
+                    await self.emit(t_start, time[pos], samples, carry, bias, chunk)
+                    carry, t_start, samples = self.identity(), time[pos], 0
+            self.samples += len(dt)
+            self.latency["preintegrate"].record(perf_counter() - chunk.received)
+        if samples:
+            await self.emit(t_start, held.time[0], samples, carry, bias, held)
+        await self.keyframe_queue.put(None)
+
+    async def emit(
+        self,
+        t_start: float,
+        t_stop: float,
+        samples: int,
+        carry: np.ndarray,
+        bias: np.ndarray,
+        chunk: ImuChunk,
+    ) -> None:
+        preint = ImuPreint.numeric()(carry)
+        keyframe = Keyframe(t_start, t_stop, samples, preint, bias, chunk.received)
+        await self.keyframe_queue.put(keyframe)
+
+    async def keyframes(self) -> T.AsyncIterator[Keyframe]:
+        while (keyframe := await self.keyframe_queue.get()) is not None:
+            self.latency["emit"].record(perf_counter() - keyframe.received)
+            yield keyframe
+
+    def report(self) -> str:
+        lines = [f"{stage:<13} {self.latency[stage]}" for stage in self.STAGES]
+        lines.append(
+            f"samples={self.samples} dropped={self.dropped}"
+            f" stalled={self.stalled * 1e3:.1f}ms max depth={self.max_depth}"
+        )
+        return "\n".join(lines)
@@ -264,6 +264,21 @@ class Pose23(LieGroup):
             ]
         )
 
+    def inverse_adjoint_factors(self) -> T.Tuple[Matrix99, Matrix99]:
+        """
+        Block diagonal rotation and shear with
+        self.inverse().adjoint() = rotation * shear, products with the factors
+        only touch their structural nonzeros.
+        """
+        R_inv = self.R.inverse().to_rotation_matrix()
+        rotation = Matrix.zeros(9, 9)
+        for i in range(0, 9, 3):
+            rotation[i : i + 3, i : i + 3] = R_inv
+        shear = Matrix.eye(9, 9)
+        shear[3:6, 0:3] = -Rot3.hat(self.v)
+        shear[6:9, 0:3] = -Rot3.hat(self.t)
+        return rotation, shear
+
     @classmethod
     def hat(cls, vec: T.Sequence[T.Scalar]) -> Matrix55:
         """Get the lie algebra element corresponding to the given tangent
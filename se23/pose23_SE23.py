@@ -5,14 +5,113 @@
 
 from __future__ import annotations
 
+import math
+from contextlib import contextmanager
+
 import symforce.internal.symbolic as sf
 from symforce import typing as T
 from symforce.ops.interfaces.lie_group import LieGroup
 
-from symforce.geo.matrix import Matrix, Matrix55, Matrix31, Vector3
+from symforce.geo.matrix import Matrix, Matrix33, Matrix55, Matrix31, Matrix99, Vector3
 from symforce.geo import Rot3
 from .pose23 import Pose23
 
+# below this angle the Lie group coefficients are evaluated as Taylor series,
+# the closed forms divide differences of nearly equal numbers by up to theta**5.
+# 0 always uses the closed forms and math.inf always the series, both without
+# the ops of the other, anything else blends them without branches. This is the
+# default, a kernel generated with FuncWrapper(small_angle=...) uses its own
+SMALL_ANGLE = 0.05
+_small_angle = SMALL_ANGLE
+
+
+@contextmanager
+def small_angle_threshold(threshold: float) -> T.Iterator[None]:
+    """Evaluate the coefficients with threshold instead of SMALL_ANGLE in the
+    block, FuncWrapper(small_angle=...) generates its kernel in one"""
+    global _small_angle  # pylint: disable=global-statement
+    previous, _small_angle = _small_angle, threshold
+    try:
+        yield
+    finally:
+        _small_angle = previous
+
+
+def small_angle_blend(
+    theta: T.Scalar,
+    exact: T.Callable[[T.Scalar], T.Scalar],
+    series: T.Sequence[T.Scalar],
+) -> T.Scalar:
+    """exact(theta), or the series in theta**2 with the coefficients series if
+    theta is below the threshold. The blend evaluates exact at the threshold
+    instead of a small theta, so it stays finite even for theta = 0. The closed
+    forms alone, a threshold of 0, need a positive epsilon in theta."""
+    taylor = sum(c * theta ** (2 * i) for i, c in enumerate(series))
+    if _small_angle == 0:
+        return exact(theta)
+    if _small_angle == math.inf:
+        return taylor
+    small = sf.is_positive(_small_angle - theta)
+    safe = theta + small * (_small_angle - theta)
+    exact_safe = exact(safe)
+    return exact_safe + small * (taylor - exact_safe)
+
+
+def SO3_ljac(phi: Vector3, epsilon: T.Scalar = sf.epsilon()) -> Matrix33:
+    """Left jacobian of SO3 exp"""
+    theta = sf.sqrt(phi.squared_norm() + epsilon**2)
+    phi_hat = Rot3.hat(phi)
+    a = small_angle_blend(
+        theta, lambda t: (1 - sf.cos(t)) / t**2, (1 / 2, -1 / 24, 1 / 720)
+    )
+    b = small_angle_blend(
+        theta, lambda t: (t - sf.sin(t)) / t**3, (1 / 6, -1 / 120, 1 / 5040)
+    )
+    return Matrix.eye(3) + a * phi_hat + b * phi_hat * phi_hat
+
+
+def SO3_ljac_inv_coefficient(theta: T.Scalar) -> T.Scalar:
+    """c of SO3_ljac_inv = I - phi_hat / 2 + c * phi_hat**2"""
+    return small_angle_blend(
+        theta,
+        lambda t: (1 - t / 2 * sf.cos(t / 2) / sf.sin(t / 2)) / t**2,
+        (1 / 12, 1 / 720, 1 / 30240),
+    )
+
+
+def SO3_ljac_inv(phi: Vector3, epsilon: T.Scalar = sf.epsilon()) -> Matrix33:
+    """Inverse of SO3_ljac"""
+    theta = sf.sqrt(phi.squared_norm() + epsilon**2)
+    phi_hat = Rot3.hat(phi)
+    c = SO3_ljac_inv_coefficient(theta)
+    return Matrix.eye(3) - phi_hat / 2 + c * phi_hat * phi_hat
+
+
+def SE23_Q(phi: Vector3, rho: Vector3, epsilon: T.Scalar = sf.epsilon()) -> Matrix33:
+    """Off diagonal block of the SE2(3) left jacobian, Barfoot (7.86)"""
+    theta = sf.sqrt(phi.squared_norm() + epsilon**2)
+    p, r = Rot3.hat(phi), Rot3.hat(rho)
+    b = small_angle_blend(
+        theta, lambda t: (t - sf.sin(t)) / t**3, (1 / 6, -1 / 120, 1 / 5040)
+    )
+    c = small_angle_blend(
+        theta,
+        lambda t: (t**2 + 2 * sf.cos(t) - 2) / (2 * t**4),
+        (1 / 24, -1 / 720, 1 / 40320),
+    )
+    d = small_angle_blend(
+        theta,
+        lambda t: (2 * t - 3 * sf.sin(t) + t * sf.cos(t)) / (2 * t**5),
+        (1 / 120, -1 / 2520, 1 / 120960),
+    )
+    prp = p * r * p
+    return (
+        r / 2
+        + b * (p * r + r * p + prp)
+        + c * (p * p * r + r * p * p - 3 * prp)
+        + d * (prp * p + p * prp)
+    )
+
 
 class Pose23_SE23(Pose23):
     """
@@ -28,34 +127,12 @@ class Pose23_SE23(Pose23):
         v_tancent_vector = Vector3(vec[6], vec[7], vec[8])
 
         R = Rot3.from_tangent(R_tangent, epsilon=epsilon)
-        R_hat = Rot3.hat(R_tangent)
-        R_hat_sq = R_hat * R_hat
-        R_tangent_vector = Vector3(R_tangent)
-        theta = sf.sqrt(R_tangent_vector.squared_norm() + epsilon**2)
-
-        V = (
-            Matrix.eye(3)
-            + (1 - sf.cos(theta)) / (theta**2) * R_hat
-            + (theta - sf.sin(theta)) / (theta**3) * R_hat_sq
-        )
+        V = SO3_ljac(Vector3(R_tangent), epsilon)
         return cls(R, V * t_tangent_vector, V * v_tancent_vector)
 
     def to_tangent(self, epsilon: T.Scalar = sf.epsilon()) -> T.List[T.Scalar]:
-        R_tangent = self.R.to_tangent(epsilon=epsilon)
-        R_tangent_vector = Vector3(R_tangent)
-
-        theta = sf.sqrt(R_tangent_vector.squared_norm() + epsilon)
-        R_hat = Rot3.hat(R_tangent)
-
-        half_theta = 0.5 * theta
-
-        V_inv = (
-            Matrix.eye(3)
-            - 0.5 * R_hat
-            + (1 - theta * sf.cos(half_theta) / (2 * sf.sin(half_theta)))
-            / (theta * theta)
-            * (R_hat * R_hat)
-        )
+        R_tangent_vector = Vector3(self.R.to_tangent(epsilon=epsilon))
+        V_inv = SO3_ljac_inv(R_tangent_vector, epsilon)
         t_tangent = V_inv * self.t
         v_tangent = V_inv * self.v
         return R_tangent_vector.col_join(v_tangent).col_join(t_tangent).to_flat_list()
@@ -100,6 +177,88 @@ class Pose23_SE23(Pose23):
     ) -> T.List[T.Scalar]:
         return LieGroup.local_coordinates(self, b, epsilon)
 
+    # -------------------------------------------------------------------------
+    # Jacobians, tangent order (R, v, t) and right perturbations X * exp(d)
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def tangent_ljac(
+        cls, vec: T.Sequence[T.Scalar], epsilon: T.Scalar = sf.epsilon()
+    ) -> Matrix99:
+        """Left jacobian of from_tangent at vec"""
+        phi, v, t = Vector3(vec[0:3]), Vector3(vec[3:6]), Vector3(vec[6:9])
+        J = SO3_ljac(phi, epsilon)
+        Z = Matrix.zeros(3, 3)
+        return Matrix.block_matrix(
+            [
+                [J, Z, Z],
+                [SE23_Q(phi, v, epsilon), J, Z],
+                [SE23_Q(phi, t, epsilon), Z, J],
+            ]
+        )
+
+    @classmethod
+    def tangent_ljac_inv(
+        cls, vec: T.Sequence[T.Scalar], epsilon: T.Scalar = sf.epsilon()
+    ) -> Matrix99:
+        """Inverse of tangent_ljac, using its block triangular structure"""
+        phi, v, t = Vector3(vec[0:3]), Vector3(vec[3:6]), Vector3(vec[6:9])
+        J_inv = SO3_ljac_inv(phi, epsilon)
+        Z = Matrix.zeros(3, 3)
+        return Matrix.block_matrix(
+            [
+                [J_inv, Z, Z],
+                [-J_inv * SE23_Q(phi, v, epsilon) * J_inv, J_inv, Z],
+                [-J_inv * SE23_Q(phi, t, epsilon) * J_inv, Z, J_inv],
+            ]
+        )
+
+    @classmethod
+    def tangent_rjac(
+        cls, vec: T.Sequence[T.Scalar], epsilon: T.Scalar = sf.epsilon()
+    ) -> Matrix99:
+        """Right jacobian of from_tangent at vec"""
+        return cls.tangent_ljac([-e for e in vec], epsilon)
+
+    @classmethod
+    def tangent_rjac_inv(
+        cls, vec: T.Sequence[T.Scalar], epsilon: T.Scalar = sf.epsilon()
+    ) -> Matrix99:
+        return cls.tangent_ljac_inv([-e for e in vec], epsilon)
+
+    def compose_jacobians(self, other: Pose23_SE23) -> T.Tuple[Matrix99, Matrix99]:
+        """Derivatives of self.compose(other) wrt self and other"""
+        return other.inverse().adjoint(), Matrix.eye(9)
+
+    def inverse_jacobian(self) -> Matrix99:
+        """Derivative of self.inverse() wrt self"""
+        return -self.adjoint()
+
+    @classmethod
+    def from_tangent_jacobian(
+        cls, vec: T.Sequence[T.Scalar], epsilon: T.Scalar = sf.epsilon()
+    ) -> Matrix99:
+        """Derivative of from_tangent(vec) wrt vec"""
+        return cls.tangent_rjac(vec, epsilon)
+
+    def to_tangent_jacobian(self, epsilon: T.Scalar = sf.epsilon()) -> Matrix99:
+        """Derivative of self.to_tangent() wrt self"""
+        return self.tangent_rjac_inv(self.to_tangent(epsilon), epsilon)
+
+    def retract_jacobians(
+        self, vec: T.Sequence[T.Scalar], epsilon: T.Scalar = sf.epsilon()
+    ) -> T.Tuple[Matrix99, Matrix99]:
+        """Derivatives of self.retract(vec) wrt self and vec"""
+        delta = self.from_tangent(vec, epsilon)
+        return delta.inverse().adjoint(), self.tangent_rjac(vec, epsilon)
+
+    def local_coordinates_jacobians(
+        self, b: Pose23_SE23, epsilon: T.Scalar = sf.epsilon()
+    ) -> T.Tuple[Matrix99, Matrix99]:
+        """Derivatives of self.local_coordinates(b) wrt self and b"""
+        vec = self.inverse().compose(b).to_tangent(epsilon)
+        return -self.tangent_ljac_inv(vec, epsilon), self.tangent_rjac_inv(vec, epsilon)
+
     # -------------------------------------------------------------------------
     # Helper methods
     # -------------------------------------------------------------------------
@@ -0,0 +1,212 @@
+"""NumPy backed, vectorized versions of Pose23 and Pose23_SE23
+
+Pose23Array holds N poses as R (N, 4) xyzw quaternions, v (N, 3) and t (N, 3),
+so to_storage is the (N, 10) stack of Pose23.to_storage. The group and Lie
+group operations follow the symbolic classes formula by formula, including how
+epsilon is used, and broadcast so a single pose can be combined with N poses.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+
+from se23.pose23 import Pose23
+from se23.pose23_SE23 import Pose23_SE23
+from se23.batch_integration import (
+    SO3_ljac,
+    SO3_ljac_inv,
+    adjoint,
+    quat_from_tangent,
+    quat_multiply,
+    quat_to_rotation_matrix,
+    quat_to_tangent,
+)
+
+
+def quat_rotate(quat: np.ndarray, vec: np.ndarray) -> np.ndarray:
+    """Same as Rot3 * Vector3, without forming the rotation matrix"""
+    xyz, w = quat[..., :3], quat[..., 3:]
+    uv = 2 * np.cross(xyz, vec)
+    return vec + w * uv + np.cross(xyz, uv)
+
+
+class Pose23Array:
+    """N Pose23, the tangent space is the product manifold SO3 x R3 x R3"""
+
+    SYMBOLIC: T.ClassVar[T.Type[Pose23]] = Pose23
+    Pose23ArrayT = T.TypeVar("Pose23ArrayT", bound="Pose23Array")
+
+    def __init__(self, R: np.ndarray, v: np.ndarray, t: np.ndarray) -> None:
+        self.R = np.asarray(R, dtype=np.float64).reshape(-1, 4)
+        self.v = np.asarray(v, dtype=np.float64).reshape(-1, 3)
+        self.t = np.asarray(t, dtype=np.float64).reshape(-1, 3)
+
+    def __len__(self) -> int:
+        return max(len(self.R), len(self.v), len(self.t))
+
+    def __getitem__(self: Pose23ArrayT, item) -> Pose23ArrayT:
+        return self.__class__(self.R[item], self.v[item], self.t[item])
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} N={len(self)}>"
+
+    # -------------------------------------------------------------------------
+    # Storage, same layout as the symbolic class
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def storage_dim(cls) -> int:
+        return cls.SYMBOLIC.storage_dim()
+
+    def to_storage(self) -> np.ndarray:
+        """(N, 10)"""
+        n = len(self)
+        return np.hstack(
+            [np.broadcast_to(e, (n, e.shape[1])) for e in (self.R, self.v, self.t)]
+        )
+
+    @classmethod
+    def from_storage(cls: T.Type[Pose23ArrayT], elements: np.ndarray) -> Pose23ArrayT:
+        """From (N, 10) or (10,)"""
+        elements = np.asarray(elements, dtype=np.float64).reshape(-1, 10)
+        return cls(elements[:, 0:4], elements[:, 4:7], elements[:, 7:10])
+
+    @classmethod
+    def from_poses(
+        cls: T.Type[Pose23ArrayT], poses: T.Sequence[Pose23]
+    ) -> Pose23ArrayT:
+        return cls.from_storage([pose.to_storage() for pose in poses])
+
+    def to_poses(self) -> T.List[Pose23]:
+        return [self.SYMBOLIC.from_storage(row.tolist()) for row in self.to_storage()]
+
+    # -------------------------------------------------------------------------
+    # Group operations
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def identity(cls: T.Type[Pose23ArrayT], n: int = 1) -> Pose23ArrayT:
+        return cls(
+            np.tile([0.0, 0.0, 0.0, 1.0], (n, 1)), np.zeros((n, 3)), np.zeros((n, 3))
+        )
+
+    def rotation_matrix(self) -> np.ndarray:
+        """(N, 3, 3)"""
+        return quat_to_rotation_matrix(self.R)
+
+    def compose(self: Pose23ArrayT, other: Pose23ArrayT) -> Pose23ArrayT:
+        assert isinstance(other, self.__class__)
+        return self.__class__(
+            quat_multiply(self.R, other.R),
+            quat_rotate(self.R, other.v) + self.v,
+            quat_rotate(self.R, other.t) + self.t,
+        )
+
+    def inverse(self: Pose23ArrayT) -> Pose23ArrayT:
+        R_inv = self.R * [-1, -1, -1, 1]
+        return self.__class__(
+            R_inv, -quat_rotate(R_inv, self.v), -quat_rotate(R_inv, self.t)
+        )
+
+    def __mul__(self, right):
+        """Compose with poses or transform (N, 3) points"""
+        if isinstance(right, Pose23Array):
+            return self.compose(right)
+        right = np.asarray(right, dtype=np.float64).reshape(-1, 3)
+        return quat_rotate(self.R, right) + self.t
+
+    def adjoint(self) -> np.ndarray:
+        """(N, 9, 9)"""
+        return adjoint(self.rotation_matrix(), self.v, self.t)
+
+    def to_homogenous_matrix(self) -> np.ndarray:
+        """(N, 5, 5)"""
+        out = np.zeros((len(self), 5, 5))
+        out[:, :3, :3] = self.rotation_matrix()
+        out[:, :3, 3] = self.v
+        out[:, :3, 4] = self.t
+        out[:, 3, 3] = out[:, 4, 4] = 1
+        return out
+
+    # -------------------------------------------------------------------------
+    # Lie group operations
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def tangent_dim(cls) -> int:
+        return 9
+
+    @classmethod
+    def from_tangent(
+        cls: T.Type[Pose23ArrayT], vec: np.ndarray, epsilon: T.Scalar = sf.epsilon()
+    ) -> Pose23ArrayT:
+        """From (N, 9) or (9,)"""
+        vec = np.asarray(vec, dtype=np.float64).reshape(-1, 9)
+        return cls(
+            quat_from_tangent(vec[:, :3], float(epsilon)), vec[:, 3:6], vec[:, 6:9]
+        )
+
+    def to_tangent(self, epsilon: T.Scalar = sf.epsilon()) -> np.ndarray:
+        """(N, 9)"""
+        return np.hstack([quat_to_tangent(self.R, float(epsilon)), self.v, self.t])
+
+    def retract(
+        self: Pose23ArrayT, vec: np.ndarray, epsilon: T.Scalar = sf.epsilon()
+    ) -> Pose23ArrayT:
+        vec = np.asarray(vec, dtype=np.float64).reshape(-1, 9)
+        return self.__class__(
+            quat_multiply(self.R, quat_from_tangent(vec[:, :3], float(epsilon))),
+            self.v + vec[:, 3:6],
+            self.t + vec[:, 6:9],
+        )
+
+    def local_coordinates(
+        self: Pose23ArrayT, b: Pose23ArrayT, epsilon: T.Scalar = sf.epsilon()
+    ) -> np.ndarray:
+        R_delta = quat_multiply(self.R * [-1, -1, -1, 1], b.R)
+        return np.hstack(
+            [quat_to_tangent(R_delta, float(epsilon)), b.v - self.v, b.t - self.t]
+        )
+
+
+class Pose23_SE23Array(Pose23Array):
+    """N Pose23_SE23, the tangent space is the one of SE2(3)"""
+
+    SYMBOLIC = Pose23_SE23
+
+    @classmethod
+    def from_tangent(
+        cls, vec: np.ndarray, epsilon: T.Scalar = sf.epsilon()
+    ) -> Pose23_SE23Array:
+        vec = np.asarray(vec, dtype=np.float64).reshape(-1, 9)
+        epsilon = float(epsilon)
+        R_tangent = vec[:, :3]
+        V = SO3_ljac(R_tangent, epsilon)
+        return cls(
+            quat_from_tangent(R_tangent, epsilon),
+            (V @ vec[:, 3:6, None])[..., 0],
+            (V @ vec[:, 6:9, None])[..., 0],
+        )
+
+    def to_tangent(self, epsilon: T.Scalar = sf.epsilon()) -> np.ndarray:
+        R_tangent = quat_to_tangent(self.R, float(epsilon))
+        V_inv = SO3_ljac_inv(R_tangent, float(epsilon))
+        return np.hstack(
+            [
+                R_tangent,
+                (V_inv @ self.v[..., None])[..., 0],
+                (V_inv @ self.t[..., None])[..., 0],
+            ]
+        )
+
+    def retract(
+        self, vec: np.ndarray, epsilon: T.Scalar = sf.epsilon()
+    ) -> Pose23_SE23Array:
+        return self.compose(self.from_tangent(vec, epsilon))
+
+    def local_coordinates(
+        self, b: Pose23_SE23Array, epsilon: T.Scalar = sf.epsilon()
+    ) -> np.ndarray:
+        return self.inverse().compose(b).to_tangent(epsilon)
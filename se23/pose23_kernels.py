@@ -0,0 +1,69 @@
+"""Pose23_SE23 group operations together with their closed form jacobians
+
+Every function returns the value and its jacobians wrt each input, in the
+tangent space with right perturbations, so they can be wrapped by FuncWrapper
+and generated as a single kernel each.
+"""
+
+from dataclasses import dataclass
+
+from symforce.geo import Matrix99, Vector9
+
+from se23.pose23_SE23 import Pose23_SE23
+from states import SymState
+
+KWARGS = dict(init=False, repr=False)
+
+
+@dataclass(**KWARGS)
+class PoseJacobian(SymState):
+    pose: Pose23_SE23
+    D_a: Matrix99
+
+
+@dataclass(**KWARGS)
+class PoseJacobians(SymState):
+    pose: Pose23_SE23
+    D_a: Matrix99
+    D_b: Matrix99
+
+
+@dataclass(**KWARGS)
+class TangentJacobian(SymState):
+    tangent: Vector9
+    D_a: Matrix99
+
+
+@dataclass(**KWARGS)
+class TangentJacobians(SymState):
+    tangent: Vector9
+    D_a: Matrix99
+    D_b: Matrix99
+
+
+def pose23_compose(a: Pose23_SE23, b: Pose23_SE23) -> PoseJacobians:
+    return PoseJacobians(a.compose(b), *a.compose_jacobians(b))
+
+
+def pose23_inverse(a: Pose23_SE23) -> PoseJacobian:
+    return PoseJacobian(a.inverse(), a.inverse_jacobian())
+
+
+def pose23_exp(vec: Vector9) -> PoseJacobian:
+    return PoseJacobian(
+        Pose23_SE23.from_tangent(vec), Pose23_SE23.from_tangent_jacobian(vec)
+    )
+
+
+def pose23_log(a: Pose23_SE23) -> TangentJacobian:
+    return TangentJacobian(Vector9(a.to_tangent()), a.to_tangent_jacobian())
+
+
+def pose23_retract(a: Pose23_SE23, vec: Vector9) -> PoseJacobians:
+    return PoseJacobians(a.retract(vec), *a.retract_jacobians(vec))
+
+
+def pose23_local_coordinates(a: Pose23_SE23, b: Pose23_SE23) -> TangentJacobians:
+    return TangentJacobians(
+        Vector9(a.local_coordinates(b)), *a.local_coordinates_jacobians(b)
+    )
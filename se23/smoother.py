@@ -0,0 +1,350 @@
+"""Fixed lag smoother over keyframe poses linked by preintegrated imu factors
+
+The window holds the Pose23_SE23 of the last lag keyframes. Consecutive
+keyframes i, j, dt apart, are linked by the ImuPreint of the samples between
+them, the prediction of X_j is
+
+    X_j = Gamma(g, dt) * Phi(X_i, dt) * upsilon
+
+and the factor residual is Log(prediction^-1 * X_j) whitened by the cov of the
+preintegration. Phi is an automorphism and Gamma multiplies from the left, so
+the jacobian wrt the right perturbation of X_i is -Jr^-1(r) Ad(E^-1) A with
+E the error pose and A = Ad(upsilon^-1) F, the transition of preintegrate_terms
+with the whole preintegration upsilon as the increment.
+Keyframes can also have a position measurement, e.g. gnss, and the oldest
+keyframe carries a prior, from the initial estimate and then from
+marginalization.
+
+Everything is linearized around a linearization point per keyframe and the
+estimate is lin.retract(delta). Gauss-Newton solves the linear model for delta
+and only keyframes whose delta grew beyond threshold are relinearized, the
+factors touching them are evaluated again and the others keep their cached
+jacobians, with residual r0 + J delta. threshold=0 is plain Gauss-Newton.
+
+The oldest keyframe is marginalized when the window is full, the Schur
+complement of its linear model onto the next keyframe becomes the dense prior
+of that one. The normal equations are block tridiagonal and solved with a
+BlockCholesky whose symbolic factorization is kept while the window size is.
+"""
+
+import numpy as np
+import symforce.symbolic as sf
+from symforce import typing as T
+
+from se23.batch_integration import hat
+from se23.block_cholesky import BlockCholesky
+from se23.pose23_array import Pose23_SE23Array
+from states import Cov99, ImuPreint, NumericState
+
+
+def ad(xi: np.ndarray) -> np.ndarray:
+    """(N, 9) -> (N, 9, 9), ad(a) b is the tangent of the Lie bracket [a, b]"""
+    out = np.zeros(xi.shape[:-1] + (9, 9))
+    phi_hat = hat(xi[..., 0:3])
+    out[..., 0:3, 0:3] = out[..., 3:6, 3:6] = out[..., 6:9, 6:9] = phi_hat
+    out[..., 3:6, 0:3] = hat(xi[..., 3:6])
+    out[..., 6:9, 0:3] = hat(xi[..., 6:9])
+    return out
+
+
+def right_jacobian_inv(xi: np.ndarray, terms: int = 20) -> np.ndarray:
+    """Jr^-1(xi), Log(Exp(xi) Exp(d)) = xi + Jr^-1(xi) d + O(d^2)
+
+    Jr is the series sum (-ad(xi))^k / (k + 1)! over k, which converges for
+    every xi, and is inverted numerically.
+    """
+    minus_ad = -ad(xi)
+    term = np.broadcast_to(np.eye(9), minus_ad.shape).copy()
+    jac = term.copy()
+    for k in range(1, terms):
+        term = term @ minus_ad / (k + 1)
+        jac += term
+    return np.linalg.inv(jac)
+
+
+def predict(
+    nom: Pose23_SE23Array,
+    upsilon: Pose23_SE23Array,
+    dt: np.ndarray,
+    gravity: np.ndarray,
+) -> Pose23_SE23Array:
+    """Gamma(g, dt) * Phi(nom, dt) * upsilon"""
+    dt = np.asarray(dt, dtype=np.float64).reshape(-1, 1)
+    phi = Pose23_SE23Array(nom.R, nom.v, nom.t + dt * nom.v).compose(upsilon)
+    return Pose23_SE23Array(phi.R, phi.v + gravity * dt, phi.t + gravity * dt**2 / 2)
+
+
+def imu_factors(
+    nom_i: Pose23_SE23Array,
+    nom_j: Pose23_SE23Array,
+    upsilon: Pose23_SE23Array,
+    dt: np.ndarray,
+    gravity: np.ndarray,
+    epsilon: T.Scalar = sf.epsilon(),
+) -> T.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unwhitened residuals (N, 9) and jacobians (N, 9, 9) wrt nom_i and nom_j"""
+    error = predict(nom_i, upsilon, dt, gravity).inverse().compose(nom_j)
+    r = error.to_tangent(epsilon)
+    F = np.broadcast_to(np.eye(9), (len(r), 9, 9)).copy()
+    F[:, 6:9, 3:6] = np.eye(3) * np.asarray(dt).reshape(-1, 1, 1)
+    jac_j = right_jacobian_inv(r)
+    A = upsilon.inverse().adjoint() @ F
+    jac_i = -jac_j @ error.inverse().adjoint() @ A
+    return r, jac_i, jac_j
+
+
+def position_factors(
+    nom: Pose23_SE23Array, z: np.ndarray
+) -> T.Tuple[np.ndarray, np.ndarray]:
+    """Unwhitened residuals (N, 3) and jacobians (N, 3, 9) of position z"""
+    jac = np.zeros((len(nom), 3, 9))
+    jac[:, :, 6:9] = nom.rotation_matrix()
+    return nom.t - z, jac
+
+
+def whitening(cov: np.ndarray) -> np.ndarray:
+    """W with W.T W = cov^-1, for residuals W r of unit covariance"""
+    L = np.linalg.cholesky(cov)
+    return np.linalg.inv(L)
+
+
+def preint_arrays(preint: T.Union[ImuPreint, NumericState]):
+    """upsilon and the full 9x9 cov of an ImuPreint"""
+    if isinstance(preint, ImuPreint):
+        preint = preint.to_numeric()
+    cov = np.zeros((9, 9))
+    cov[Cov99.tril_indices()] = preint.cov
+    cov = cov + np.tril(cov, -1).T
+    return Pose23_SE23Array.from_storage(preint.upsilon), cov
+
+
+class FixedLagSmoother:
+    """Smoother over the last lag keyframes, see the module docstring
+
+    nom and cov are the initial estimate of the first keyframe and its
+    covariance. Every add_keyframe appends the prediction of the new keyframe,
+    marginalizes the oldest one if the window is full and optimizes.
+    """
+
+    def __init__(
+        self,
+        nom: T.Union[Pose23_SE23Array, np.ndarray],
+        cov: np.ndarray,
+        lag: int = 10,
+        gravity: T.Sequence[float] = (0.0, 0.0, -9.81),
+        threshold: float = 1e-3,
+        iterations: int = 10,
+        tolerance: float = 1e-9,
+        epsilon: T.Scalar = sf.epsilon(),
+    ) -> None:
+        if lag < 2:
+            raise ValueError("The window needs at least two keyframes")
+        if not isinstance(nom, Pose23_SE23Array):
+            nom = Pose23_SE23Array.from_storage(nom)
+        self.lag = lag
+        self.gravity = np.asarray(gravity, dtype=np.float64)
+        self.threshold = threshold
+        self.iterations = iterations
+        self.tolerance = tolerance
+        self.epsilon = epsilon
+
+        self.lin = nom
+        self.delta = np.zeros((1, 9))
+        # imu factor k links keyframe k and k + 1
+        self.upsilon = Pose23_SE23Array.identity(0)
+        self.dt = np.zeros(0)
+        self.imu_W = np.zeros((0, 9, 9))
+        self.imu_r0 = np.zeros((0, 9))
+        self.imu_jac = np.zeros((0, 9, 18))
+        self.imu_stale = np.zeros(0, dtype=bool)
+        # position factors, keyframes without one have W = 0
+        self.z = np.zeros((1, 3))
+        self.pos_W = np.zeros((1, 3, 3))
+        self.pos_r0 = np.zeros((1, 3))
+        self.pos_jac = np.zeros((1, 3, 9))
+        self.pos_stale = np.ones(1, dtype=bool)
+        # prior on keyframe 0, residual R (prior_nom.local_coordinates(X)) + e
+        self.prior_nom = nom
+        self.prior_R = whitening(cov)
+        self.prior_e = np.zeros(9)
+        self.prior_r0 = np.zeros(9)
+        self.prior_jac = np.zeros((9, 9))
+        self.prior_stale = True
+
+        # keyframes relinearized and imu factors evaluated
+        self.relinearized = 0
+        self.evaluated = 0
+        self._cholesky: T.Optional[BlockCholesky] = None
+
+    def __len__(self) -> int:
+        return len(self.lin)
+
+    @property
+    def estimate(self) -> Pose23_SE23Array:
+        return self.lin.retract(self.delta, self.epsilon)
+
+    def add_keyframe(
+        self,
+        preint: T.Union[ImuPreint, NumericState],
+        dt: float,
+        position: T.Optional[np.ndarray] = None,
+        position_cov: T.Optional[np.ndarray] = None,
+    ) -> int:
+        """Add the keyframe dt after the newest one, preint holds the samples
+        in between. Returns the number of Gauss-Newton iterations"""
+        upsilon, cov = preint_arrays(preint)
+        nom = predict(self.estimate[-1:], upsilon, dt, self.gravity)
+        self.lin = Pose23_SE23Array.from_storage(
+            np.vstack([self.lin.to_storage(), nom.to_storage()])
+        )
+        self.delta = np.vstack([self.delta, np.zeros((1, 9))])
+
+        self.upsilon = Pose23_SE23Array.from_storage(
+            np.vstack([self.upsilon.to_storage(), upsilon.to_storage()])
+        )
+        self.dt = np.append(self.dt, dt)
+        self.imu_W = np.concatenate([self.imu_W, whitening(cov)[None]])
+        self.imu_r0 = np.vstack([self.imu_r0, np.zeros((1, 9))])
+        self.imu_jac = np.concatenate([self.imu_jac, np.zeros((1, 9, 18))])
+        self.imu_stale = np.append(self.imu_stale, True)
+
+        z, W = np.zeros(3), np.zeros((3, 3))
+        if position is not None:
+            z, W = np.asarray(position, dtype=np.float64), whitening(position_cov)
+        self.z = np.vstack([self.z, z])
+        self.pos_W = np.concatenate([self.pos_W, W[None]])
+        self.pos_r0 = np.vstack([self.pos_r0, np.zeros((1, 3))])
+        self.pos_jac = np.concatenate([self.pos_jac, np.zeros((1, 3, 9))])
+        self.pos_stale = np.append(self.pos_stale, True)
+
+        if len(self) > self.lag:
+            self.marginalize()
+        return self.optimize()
+
+    def relinearize(self) -> bool:
+        """Move the linearization point of keyframes whose delta exceeds
+        threshold to the estimate and evaluate the factors that are stale.
+        Returns whether anything was relinearized"""
+        moved = np.linalg.norm(self.delta, axis=1) > self.threshold
+        if moved.any():
+            estimate = self.estimate
+            storage = self.lin.to_storage()
+            storage[moved] = estimate.to_storage()[moved]
+            self.lin = Pose23_SE23Array.from_storage(storage)
+            self.delta[moved] = 0
+            self.imu_stale |= moved[:-1] | moved[1:]
+            self.pos_stale |= moved
+            self.prior_stale |= bool(moved[0])
+        self.relinearized += int(moved.sum())
+
+        changed = bool(moved.any() or self.imu_stale.any() or self.pos_stale.any())
+        if self.imu_stale.any():
+            k = np.flatnonzero(self.imu_stale)
+            r, jac_i, jac_j = imu_factors(
+                self.lin[k],
+                self.lin[k + 1],
+                self.upsilon[k],
+                self.dt[k],
+                self.gravity,
+                self.epsilon,
+            )
+            self.evaluated += len(k)
+            W = self.imu_W[k]
+            self.imu_r0[k] = (W @ r[..., None])[..., 0]
+            self.imu_jac[k] = W @ np.concatenate([jac_i, jac_j], axis=2)
+            self.imu_stale[:] = False
+        if self.pos_stale.any():
+            k = np.flatnonzero(self.pos_stale)
+            r, jac = position_factors(self.lin[k], self.z[k])
+            self.pos_r0[k] = (self.pos_W[k] @ r[..., None])[..., 0]
+            self.pos_jac[k] = self.pos_W[k] @ jac
+            self.pos_stale[:] = False
+        if self.prior_stale:
+            xi = self.prior_nom.local_coordinates(self.lin[:1], self.epsilon)
+            self.prior_r0 = self.prior_R @ xi[0] + self.prior_e
+            self.prior_jac = self.prior_R @ right_jacobian_inv(xi)[0]
+            self.prior_stale = False
+            changed = True
+        return changed
+
+    def residuals(self) -> T.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Whitened residuals of the linear model at delta, imu, position and
+        prior"""
+        delta_ij = np.concatenate([self.delta[:-1], self.delta[1:]], axis=1)
+        imu = self.imu_r0 + (self.imu_jac @ delta_ij[..., None])[..., 0]
+        pos = self.pos_r0 + (self.pos_jac @ self.delta[..., None])[..., 0]
+        prior = self.prior_r0 + self.prior_jac @ self.delta[0]
+        return imu, pos, prior
+
+    def normal_equations(self) -> T.Tuple[np.ndarray, np.ndarray]:
+        """Lower blocks (2n - 1, 9, 9) of the block tridiagonal Hessian, in the
+        order of BlockCholesky.banded(n, 9, 1), and the gradient (n, 9) of the
+        linear model at delta"""
+        n = len(self)
+        imu, pos, prior = self.residuals()
+        diag = np.zeros((n, 9, 9))
+        g = np.zeros((n, 9))
+        JtJ = self.imu_jac.transpose(0, 2, 1) @ self.imu_jac
+        Jtr = (self.imu_jac.transpose(0, 2, 1) @ imu[..., None])[..., 0]
+        diag[:-1] += JtJ[:, :9, :9]
+        diag[1:] += JtJ[:, 9:, 9:]
+        g[:-1] += Jtr[:, :9]
+        g[1:] += Jtr[:, 9:]
+        pos_jac_t = self.pos_jac.transpose(0, 2, 1)
+        diag += pos_jac_t @ self.pos_jac
+        g += (pos_jac_t @ pos[..., None])[..., 0]
+        diag[0] += self.prior_jac.T @ self.prior_jac
+        g[0] += self.prior_jac.T @ prior
+        blocks = np.empty((2 * n - 1, 9, 9))
+        blocks[0::2] = diag
+        blocks[1::2] = JtJ[:, 9:, :9]
+        return blocks, g
+
+    def cholesky(self) -> BlockCholesky:
+        """Symbolic factorization of the window, reused while its size stays"""
+        if self._cholesky is None or self._cholesky.n != len(self):
+            self._cholesky = BlockCholesky.banded(len(self), 9, 1)
+        return self._cholesky
+
+    def optimize(self) -> int:
+        """Gauss-Newton until the step is below tolerance or nothing is
+        relinearized after a solve, returns the number of solves"""
+        for iteration in range(self.iterations):
+            if not self.relinearize() and iteration > 0:
+                return iteration
+            blocks, g = self.normal_equations()
+            step = self.cholesky().factor(blocks).solve(-g)
+            self.delta += step
+            if np.abs(step).max() < self.tolerance:
+                return iteration + 1
+        return self.iterations
+
+    def marginalize(self) -> None:
+        """Replace keyframe 0 and its factors by a dense prior on keyframe 1"""
+        self.relinearize()
+        imu, pos, prior = self.residuals()
+        J = np.zeros((9 + 3 + 9, 18))
+        J[:9] = self.imu_jac[0]
+        J[9:12, :9] = self.pos_jac[0]
+        J[12:, :9] = self.prior_jac
+        r = np.concatenate([imu[0], pos[0], prior])
+        H, g = J.T @ J, J.T @ r
+        A, B, C = H[:9, :9], H[:9, 9:], H[9:, 9:]
+        A_inv_B = np.linalg.solve(A, B)
+        H_marginal = C - B.T @ A_inv_B
+        g_marginal = g[9:] - A_inv_B.T @ g[:9]
+
+        # 1/2 |R x + e|^2 = 1/2 x.T H x + g.T x + const, x = prior_nom (-) X_1
+        R = np.linalg.cholesky(H_marginal).T
+        self.prior_nom = self.estimate[1:2]
+        self.prior_R = R
+        self.prior_e = np.linalg.solve(R.T, g_marginal)
+        self.prior_stale = True
+
+        self.lin, self.delta = self.lin[1:], self.delta[1:]
+        self.upsilon, self.dt = self.upsilon[1:], self.dt[1:]
+        self.imu_W, self.imu_r0 = self.imu_W[1:], self.imu_r0[1:]
+        self.imu_jac, self.imu_stale = self.imu_jac[1:], self.imu_stale[1:]
+        self.z, self.pos_W = self.z[1:], self.pos_W[1:]
+        self.pos_r0, self.pos_jac = self.pos_r0[1:], self.pos_jac[1:]
+        self.pos_stale = self.pos_stale[1:]
@@ -10,11 +10,22 @@ symforce.set_symbolic_api("symengine")  # pylint: disable=wrong-import-position
 symforce.set_epsilon_to_number(1e-6)  # pylint: disable=wrong-import-position
 
 from symforce import symbolic as sf
-from symforce.geo import Matrix
+from symforce.geo import Matrix, Vector3
 from symforce.values import Values
 
-from se23.pose23_SE23 import Pose23_SE23
-from se23.integration import preintegrate, Phi, Gamma
+from se23.pose23_SE23 import Pose23_SE23, SO3_ljac_inv_coefficient
+from se23.integration import (
+    preintegrate,
+    preintegrate_fourth_order,
+    preintegrate_sqrt,
+    preintegrate_delta,
+    preintegrate_jac,
+    preintegrate_correct,
+    coalesce_kernel,
+    Phi,
+    Gamma,
+)
+from se23 import pose23_kernels, eskf
 from states import ImuNoise, ZImuRaw, ZImuEst, ImuPreint, State, SymState, Cov99
 from codegen.get_code import FuncWrapper
 import sympy as sp
@@ -34,10 +45,39 @@ def myfunc(inputs: Pose23_SE23):
     return inputs.rotation().to_rotation_matrix()
 
 
-preintegrate = FuncWrapper.wrap(preintegrate)
+@FuncWrapper.wrap
+def so3_ljac_inv_coefficient(phi: Vector3) -> sf.Scalar:
+    """c of SO3_ljac_inv, to test the small angle handling and scalar outputs
+    of the kernels"""
+    theta = sf.sqrt(phi.squared_norm() + sf.epsilon() ** 2)
+    return SO3_ljac_inv_coefficient(theta)
+
+
+preintegrate = FuncWrapper.wrap(preintegrate, carry="preint_prev")
+preintegrate_sqrt = FuncWrapper.wrap(preintegrate_sqrt, carry="preint_prev")
+preintegrate_fourth_order = FuncWrapper.wrap(
+    preintegrate_fourth_order, carry="preint_prev"
+)
+preintegrate_delta = FuncWrapper.wrap(preintegrate_delta, carry="preint_prev")
+preintegrate_jac = FuncWrapper.wrap(preintegrate_jac, carry="preint_prev")
+preintegrate_correct = FuncWrapper.wrap(preintegrate_correct)
+coalesce_kernels = {k: FuncWrapper.wrap(coalesce_kernel(k)) for k in (4, 8, 16, 32)}
+FuncWrapper.wrap(eskf.propagate_kernel(), carry="state")
+for h in (eskf.position, eskf.velocity):
+    FuncWrapper.wrap(eskf.update_kernel(h), carry="state")
+FuncWrapper.wrap(eskf.cycle_kernel(eskf.position), carry="state")
+for kernel in (
+    pose23_kernels.pose23_compose,
+    pose23_kernels.pose23_inverse,
+    pose23_kernels.pose23_exp,
+    pose23_kernels.pose23_log,
+    pose23_kernels.pose23_retract,
+    pose23_kernels.pose23_local_coordinates,
+):
+    FuncWrapper.wrap(kernel)
 
-FuncWrapper.generate_bindings()
 FuncWrapper.generate_cpp_funcs()
+FuncWrapper.generate_bindings()
 
 # FuncWrapper.compile_and_import()
 
@@ -1,2 +1,3 @@
 from .imu import *
 from .covariance import *
+from .symstate import SymState, NumericState
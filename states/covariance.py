@@ -1,84 +1,261 @@
+import functools
+
+import numpy as np
+import symforce.symbolic as sf
 from symforce import typing as T
 from symforce.geo import Matrix
 from symforce.ops.interfaces import Storage
 
 
-class Cov(Storage):
-    mat: Matrix
+def structural_nonzeros(A: Matrix) -> T.List[T.List[T.Tuple[int, T.Scalar]]]:
+    """(column, element) of every element of every row of A that is not
+    identically zero"""
+    return [
+        [(k, A[i, k]) for k in range(A.shape[1]) if A[i, k] != 0]
+        for i in range(A.shape[0])
+    ]
+
+
+class PackedLower(Storage):
+    """Square matrix stored as its packed lower triangle
+
+    The elements are ordered (i, j <= i) row by row, which is also the storage
+    order. They are either a list of (symbolic) scalars or, when constructed from
+    an ndarray, a 1-D float ndarray, and the arithmetic of the subclasses is done
+    on the packed elements in the matching backend.
+    """
+
+    elements: T.Union[T.List[T.Scalar], np.ndarray]
     SHAPE: T.Tuple[int, int]
+    SYMMETRIC: bool
 
-    def __init__(self, *args, _mat=None, **kwargs):
-        mat = self.symmetrize(_mat or Matrix(*args, **kwargs))
-        self.mat = mat
+    def __init__(self, *args, **kwargs):
+        if len(args) == 1 and isinstance(args[0], np.ndarray) and not kwargs:
+            self.elements = args[0][self.tril_indices()].astype(np.float64)
+        else:
+            mat = Matrix(*args, **kwargs)
+            self.elements = [mat[i, j] for i, j in self.packed_indices()]
 
     @classmethod
     def symbolic(cls, name, **kwargs):
-        obj = object.__new__(cls)
-        obj.mat = cls.symmetrize(Matrix(*cls.SHAPE).symbolic(name))
-        return obj
+        return cls(Matrix(*cls.SHAPE).symbolic(name, **kwargs))
 
     @classmethod
     def diag(cls, *args):
-        obj = object.__new__(cls)
-        obj.mat = Matrix.diag(*args)
-        return obj
+        values = args[0] if len(args) == 1 else args
+        return cls.from_storage(
+            [values[i] if i == j else 0 for i, j in cls.packed_indices()]
+        )
 
-    @staticmethod
-    def symmetrize(mat: Matrix):
-        for i in range(mat.shape[0]):
-            for j in range(i + 1, mat.shape[0]):
-                mat[i, j] = mat[j, i]
-        return mat
+    @classmethod
+    @functools.cache
+    def tril_indices(cls) -> T.Tuple[np.ndarray, np.ndarray]:
+        """Row and column of every packed element"""
+        return np.tril_indices(cls.SHAPE[0])
+
+    @classmethod
+    @functools.cache
+    def packed_indices(cls) -> T.List[T.Tuple[int, int]]:
+        """(i, j) of every packed element"""
+        return [(i, j) for i in range(cls.SHAPE[0]) for j in range(i + 1)]
+
+    @classmethod
+    def sized(cls, rows: int) -> T.Type["PackedLower"]:
+        """The subclass of the same family (Cov, CovSqrt) with shape (rows, rows)"""
+        family = next(c for c in cls.__mro__ if PackedLower in c.__bases__)
+        for sub in family.__subclasses__():
+            if sub.SHAPE == (rows, rows):
+                return sub
+        raise ValueError(f"No {family.__name__} subclass of shape ({rows}, {rows})")
 
     @property
     def shape(self):
         return self.SHAPE
 
+    @property
+    def is_numpy(self) -> bool:
+        return isinstance(self.elements, np.ndarray)
+
+    @property
+    def mat(self) -> T.Union[Matrix, np.ndarray]:
+        """The full matrix, mirrored if SYMMETRIC else lower triangular
+
+        It is built from the packed elements on every access and is read only,
+        writes raise. Single elements are read and written with self[i, j].
+        """
+        if self.is_numpy:
+            mat = self.to_numpy()
+            mat.flags.writeable = False
+            return mat
+        mat = Matrix.zeros(*self.SHAPE)
+        for e, (i, j) in zip(self.elements, self.packed_indices()):
+            mat[i, j] = e
+            if self.SYMMETRIC:
+                mat[j, i] = e
+        mat.mat = mat.mat.as_immutable()
+        return mat
+
+    def to_numpy(self) -> np.ndarray:
+        if not self.is_numpy:
+            return np.array(self.mat.to_numpy(), dtype=np.float64)
+        rows, cols = self.tril_indices()
+        mat = np.zeros(self.SHAPE)
+        mat[rows, cols] = self.elements
+        if self.SYMMETRIC:
+            mat[cols, rows] = self.elements
+        return mat
+
     @classmethod
     def storage_dim(cls) -> int:
         return cls.SHAPE[0] * (cls.SHAPE[1] + 1) // 2
 
     def to_storage(self) -> T.List[T.Scalar]:
-        storage = []
-        rows = self.shape[0]
-        for i, j in ((i, j) for i in range(rows) for j in range(i + 1)):
-            storage.append(self.mat[i, j])
-        return storage
+        if self.is_numpy:
+            return self.elements.tolist()
+        return list(self.elements)
 
     @classmethod
-    def from_storage(cls, elements: T.Sequence[T.Scalar]) -> Matrix:
+    def from_storage(cls, elements: T.Sequence[T.Scalar]) -> "PackedLower":
         obj = object.__new__(cls)
+        obj.elements = list(elements)
+        return obj
 
-        mat = Matrix.zeros(*cls.SHAPE)
-        rows = cls.SHAPE[0]
-        for e, (i, j) in enumerate(((i, j) for i in range(rows) for j in range(i + 1))):
-            mat[i, j] = mat[j, i] = elements[e]
-        obj.mat = mat
+    def _new(self, elements, cls: T.Type["PackedLower"] = None) -> "PackedLower":
+        obj = object.__new__(cls or type(self))
+        obj.elements = elements
         return obj
 
+    def packed_index(self, item) -> T.Optional[int]:
+        """Position of element (i, j) in elements, None above the diagonal of
+        a triangular matrix"""
+        rows = self.SHAPE[0]
+        if not all(-rows <= k < rows for k in item):
+            raise IndexError(f"{item} is out of range for shape {self.SHAPE}")
+        i, j = (int(k) % rows for k in item)
+        if i < j:
+            if not self.SYMMETRIC:
+                return None
+            i, j = j, i
+        return i * (i + 1) // 2 + j
+
+    @staticmethod
+    def is_element(item) -> bool:
+        return (
+            isinstance(item, tuple)
+            and len(item) == 2
+            and all(isinstance(k, (int, np.integer)) for k in item)
+        )
+
+    def __getitem__(self, item):
+        if not self.is_element(item):
+            return self.mat[item]
+        k = self.packed_index(item)
+        return 0 if k is None else self.elements[k]
+
+    def __setitem__(self, item, value) -> None:
+        """Set element (i, j), and (j, i) with it if SYMMETRIC"""
+        k = self.packed_index(item) if self.is_element(item) else None
+        if k is None:
+            raise IndexError(f"{item} is not an element of the lower triangle")
+        self.elements[k] = value
+
+
+class Cov(PackedLower):
+    """Symmetric covariance matrix
+
+    Sums and differences of two Cov, and products with a scalar, are Cov of
+    the same shape. Any other operand makes them the dense Matrix or ndarray.
+    """
+
+    SYMMETRIC = True
+    # ndarray operators defer to the reflected ones below instead of
+    # broadcasting over the Cov as an object
+    __array_ufunc__ = None
+
+    def congruence(self, *factors: T.Union[Matrix, np.ndarray]) -> "Cov":
+        """A * self * A.T with A = factors[0] * factors[1] * ...
+
+        Only the lower triangle of the result is computed. Symbolically the
+        factors are applied one at a time from the right and only their
+        structural nonzeros are multiplied, so a sparse factorization of A costs
+        less than A itself, and every intermediate is a covariance the cse can
+        share.
+        """
+        if self.is_numpy or any(isinstance(A, np.ndarray) for A in factors):
+            A = functools.reduce(
+                np.matmul,
+                (
+                    np.asarray(A.to_numpy() if isinstance(A, Matrix) else A, np.float64)
+                    for A in factors
+                ),
+            )
+            cls = self.sized(A.shape[0])
+            return self._new((A @ self.to_numpy() @ A.T)[cls.tril_indices()], cls)
+
+        cov = self
+        for A in reversed(factors):
+            cls = cov.sized(A.shape[0])
+            rows = structural_nonzeros(A)
+            P = cov.mat
+            AP = [
+                [sum((a * P[k, l] for k, a in row), 0) for l in range(P.shape[1])]
+                for row in rows
+            ]
+            cov = cov._new(
+                [
+                    sum((AP[i][k] * a for k, a in rows[j]), 0)
+                    for i, j in cls.packed_indices()
+                ],
+                cls,
+            )
+        return cov
+
     def inv(self):
+        if self.is_numpy:
+            return np.linalg.inv(self.mat)
         return self.mat.inv()
 
     def __mul__(self, other):
-        return self.mat * other
+        if isinstance(other, np.ndarray):
+            return self.to_numpy() @ other
+        if isinstance(other, Matrix):
+            return self.mat * other
+        if self.is_numpy:
+            return self._new(self.elements * other)
+        return self._new([e * other for e in self.elements])
+
+    def __rmul__(self, other):
+        if isinstance(other, np.ndarray):
+            return other @ self.to_numpy()
+        if isinstance(other, Matrix):
+            return other * self.mat
+        return self * other
 
     def __add__(self, other):
+        if isinstance(other, Cov):
+            return self._new(self._zip(other, lambda a, b: a + b))
         return self.mat + other
 
     def __radd__(self, other):
         return self.mat + other
 
-    def __rmul__(self, other):
-        return self.mat * other
-
     def __sub__(self, other):
+        if isinstance(other, Cov):
+            return self._new(self._zip(other, lambda a, b: a - b))
         return self.mat - other
 
     def __rsub__(self, other):
         return other - self.mat
 
-    def __getitem__(self, item):
-        return self.mat[item]
+    def _zip(self, other: "Cov", op: T.Callable):
+        if other.SHAPE != self.SHAPE:
+            raise ValueError(f"Shape mismatch {self.SHAPE} and {other.SHAPE}")
+        if self.is_numpy or other.is_numpy:
+            return op(
+                np.asarray(self.elements, np.float64),
+                np.asarray(other.elements, np.float64),
+            )
+        return [op(a, b) for a, b in zip(self.elements, other.elements)]
 
 
 class Cov99(Cov):
@@ -91,3 +268,90 @@ class Cov66(Cov):
 
 class Cov33(Cov):
     SHAPE = (3, 3)
+
+
+class CovSqrt(PackedLower):
+    """Lower triangular factor L of a covariance P = L * L.T"""
+
+    SYMMETRIC = False
+
+    def to_cov(self) -> Cov:
+        """P = L * L.T"""
+        cls = Cov.sized(self.SHAPE[0])
+        L = self.mat
+        if self.is_numpy:
+            return cls(L @ L.T)
+        return cls.from_storage(
+            [
+                sum((L[i, k] * L[j, k] for k in range(j + 1)), 0)
+                for i, j in cls.packed_indices()
+            ]
+        )
+
+    @classmethod
+    def from_cov(cls, cov: Cov, epsilon: T.Scalar = sf.epsilon()) -> "CovSqrt":
+        """Cholesky factor of cov + epsilon**2 * I"""
+        rows = cov.SHAPE[0]
+        sqrt_cls = cls.sized(rows)
+        if cov.is_numpy:
+            regularized = cov.to_numpy() + float(epsilon) ** 2 * np.eye(rows)
+            return sqrt_cls(np.linalg.cholesky(regularized))
+
+        P = cov.mat
+        L = Matrix.zeros(rows, rows)
+        for j in range(rows):
+            diag = P[j, j] - sum((L[j, k] ** 2 for k in range(j)), 0)
+            L[j, j] = sf.sqrt(diag + epsilon**2)
+            for i in range(j + 1, rows):
+                off_diag = P[i, j] - sum((L[i, k] * L[j, k] for k in range(j)), 0)
+                L[i, j] = off_diag / L[j, j]
+        return sqrt_cls(L)
+
+    @classmethod
+    def qr_update(
+        cls, *blocks: T.Union[Matrix, np.ndarray], epsilon: T.Scalar = sf.epsilon()
+    ) -> "CovSqrt":
+        """Factor L of M * M.T with M = [blocks[0], blocks[1], ...]
+
+        With M = L * Q (an LQ decomposition, the QR decomposition of M.T) the
+        product M * M.T = L * L.T is never formed. The rows of M are
+        orthogonalized with modified Gram-Schmidt, which is branch free and so
+        can be generated, and epsilon keeps the diagonal positive for rank
+        deficient M.
+        """
+        if all(isinstance(block, np.ndarray) for block in blocks):
+            M = np.hstack(blocks).astype(np.float64)
+            sqrt = np.sqrt
+            epsilon = float(epsilon)
+        else:
+            M = np.array(Matrix.block_matrix([list(blocks)]).to_list(), dtype=object)
+            sqrt = sf.sqrt
+
+        rows = M.shape[0]
+        L = np.zeros((rows, rows), dtype=M.dtype)
+        Q = np.zeros_like(M)
+        for i, w in enumerate(M):
+            for j in range(i):
+                L[i, j] = w @ Q[j]
+                w = w - L[i, j] * Q[j]
+            L[i, i] = sqrt(w @ w + epsilon**2)
+            Q[i] = w / L[i, i]
+
+        sqrt_cls = cls.sized(rows)
+        if M.dtype == object:
+            return sqrt_cls.from_storage(
+                [L[i, j] for i, j in sqrt_cls.packed_indices()]
+            )
+        return sqrt_cls(L)
+
+
+class CovSqrt99(CovSqrt):
+    SHAPE = (9, 9)
+
+
+class CovSqrt66(CovSqrt):
+    SHAPE = (6, 6)
+
+
+class CovSqrt33(CovSqrt):
+    SHAPE = (3, 3)
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from symforce.geo import Vector3
+import symforce.symbolic as sf
+from symforce.geo import Vector3, Matrix93
 from se23.pose23_SE23 import Pose23_SE23
 
-from .covariance import Cov99, Cov66
+from .covariance import Cov99, Cov66, CovSqrt99, CovSqrt66
 from .symstate import SymState
 
 
@@ -18,6 +19,10 @@ class ImuNoise(SymState):
     def cov(self):
         return Cov66.diag([*self.gyro, *self.accl])
 
+    @property
+    def cov_sqrt(self):
+        return CovSqrt66.diag([sf.sqrt(e) for e in (*self.gyro, *self.accl)])
+
 
 @dataclass(**KWARGS)
 class ImuBias(SymState):
@@ -41,12 +46,64 @@ class ZImuRaw(SymState):
         return ZImuEst(self.gyro - other.gyro, self.accl - other.accl)
 
 
+@dataclass(**KWARGS)
+class ZImuDelta(SymState):
+    """Imu samples coalesced into one increment, delta and the covariance of
+    its right perturbation"""
+
+    delta: Pose23_SE23
+    cov: Cov99
+
+
 @dataclass(**KWARGS)
 class ImuPreint(SymState):
     upsilon: Pose23_SE23
     cov: Cov99
 
 
+@dataclass(**KWARGS)
+class ImuPreintSqrt(SymState):
+    """ImuPreint with the covariance carried as its Cholesky factor"""
+
+    upsilon: Pose23_SE23
+    cov_sqrt: CovSqrt99
+
+    @classmethod
+    def from_preint(
+        cls, preint: ImuPreint, epsilon: sf.Scalar = sf.epsilon()
+    ) -> "ImuPreintSqrt":
+        return cls(preint.upsilon, CovSqrt99.from_cov(preint.cov, epsilon))
+
+    def to_preint(self) -> ImuPreint:
+        return ImuPreint(self.upsilon, self.cov_sqrt.to_cov())
+
+
+@dataclass(**KWARGS)
+class ImuPreintJac(SymState):
+    """ImuPreint with the jacobians of upsilon wrt the gyro and accl bias the
+    samples were corrected with, in the tangent space of its right perturbation"""
+
+    upsilon: Pose23_SE23
+    cov: Cov99
+    jac_gyro: Matrix93
+    jac_accl: Matrix93
+
+    @classmethod
+    def from_preint(cls, preint: ImuPreint) -> "ImuPreintJac":
+        return cls(preint.upsilon, preint.cov, Matrix93.zero(), Matrix93.zero())
+
+    def to_preint(self) -> ImuPreint:
+        return ImuPreint(self.upsilon, self.cov)
+
+    def correct(
+        self, bias_delta: ImuBias, epsilon: sf.Scalar = sf.epsilon()
+    ) -> ImuPreint:
+        """upsilon to first order for the bias moved by bias_delta, without
+        integrating the samples again"""
+        xi = self.jac_gyro * bias_delta.gyro + self.jac_accl * bias_delta.accl
+        return ImuPreint(self.upsilon.retract(xi.to_flat_list(), epsilon), self.cov)
+
+
 @dataclass(**KWARGS)
 class State(SymState):
     nom: Pose23_SE23
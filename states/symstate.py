@@ -1,5 +1,8 @@
 from dataclasses import fields, dataclass
+import functools
 from symforce.values import Values
+from symforce import typing as T
+from symforce.geo import Matrix
 import symforce.symbolic as sf
 from typing import TypeVar
 import numpy as np
@@ -7,10 +10,15 @@ import numpy as np
 Class = TypeVar("Class", bound="SymState")
 
 
+def field_getter(name: str, state: "SymState") -> T.Any:
+    return state.dict[name]
+
+
 class SymState(Values):
     """TODO311 use dataclass_transform"""
 
     def __init__(self, *args, **kwargs):
+        type(self).field_index()
         super().__init__()
         for i, att in enumerate(fields(self)):
             if i < len(args):
@@ -20,7 +28,7 @@ class SymState(Values):
             else:
                 val = att.type()
             kwargs[att.name] = val
-            self[att.name] = val
+            self.dict[att.name] = val
 
     @classmethod
     def symbolic(cls, name=""):  # pylint: disable=arguments-differ
@@ -35,13 +43,168 @@ class SymState(Values):
                 raise ValueError(f"Unknown state type {att.type}")
         return cls(**kwargs)
 
+    @classmethod
+    @functools.cache
+    def field_index(cls) -> T.Dict[str, int]:
+        """Position of every field, computed once per class
+
+        A property per field is added to the class at the same time, so reading
+        a field is a normal attribute lookup instead of a miss that ends up in
+        __getattr__.
+        """
+        index = {att.name: i for i, att in enumerate(fields(cls))}
+        for name in index:
+            setattr(cls, name, property(functools.partial(field_getter, name)))
+        return index
+
+    @classmethod
+    @functools.cache
+    def field_layout(cls) -> T.Dict[str, T.Tuple[slice, T.Type]]:
+        """Slice and type of every field in the storage"""
+        layout, offset = {}, 0
+        for att in fields(cls):
+            if att.type == sf.Scalar:
+                dim = 1
+            elif issubclass(att.type, SymState):
+                dim = att.type.numeric_dim()
+            else:
+                dim = att.type.storage_dim()
+            layout[att.name] = (slice(offset, offset + dim), att.type)
+            offset += dim
+        return layout
+
+    @classmethod
+    def numeric_dim(cls) -> int:
+        return sum(s.stop - s.start for s, _ in cls.field_layout().values())
+
+    @classmethod
+    @functools.cache
+    def numeric(cls) -> T.Type["NumericState"]:
+        """The NumericState of this class"""
+        namespace = {"__slots__": (), "STATE": cls, "DIM": cls.numeric_dim()}
+        for name, (index, typ) in cls.field_layout().items():
+            namespace[name] = NumericState.field_view(index, typ)
+        return type(f"Numeric{cls.__name__}", (NumericState,), namespace)
+
+    def to_numeric(self) -> "NumericState":
+        return self.numeric()(np.array(self.to_storage(), dtype=np.float64))
+
     def __getattr__(self, item):
-        if item in (f.name for f in fields(self)):
-            return self[item]
+        if item in type(self).field_index():
+            return self.dict[item]
         raise AttributeError(item)
 
     def __setattr__(self, key, value):
-        if key in (f.name for f in fields(self)):
-            self[key] = value
+        if key in type(self).field_index():
+            self.dict[key] = value
         else:
             super().__setattr__(key, value)
+
+
+class NumericState:
+    """Numeric SymState in one contiguous float64 buffer
+
+    The buffer has the storage layout of the SymState and every field is a
+    numpy view into it, so reading or writing a field never copies and a
+    buffer handed in, like a row of a kernel output, is used as is. Matrix
+    fields are (rows, cols) views of their column major storage, scalars 0-d
+    views, SymState fields NumericStates on their part of the buffer and the
+    other fields views of their storage.
+
+    A buffer of shape (..., DIM) holds a batch, the fields are then views with
+    the same leading dimensions and items are taken with [].
+    """
+
+    __slots__ = ("buffer",)
+    STATE: T.ClassVar[T.Type[SymState]]
+    DIM: T.ClassVar[int]
+
+    def __init__(self, buffer: T.Optional[np.ndarray] = None) -> None:
+        if buffer is None:
+            buffer = np.zeros(self.DIM)
+        buffer = np.asarray(buffer, dtype=np.float64)
+        if buffer.shape[-1:] != (self.DIM,):
+            raise ValueError(
+                f"{type(self).__name__} needs a buffer of shape (..., {self.DIM}),"
+                f" not {buffer.shape}"
+            )
+        self.buffer = buffer
+
+    @classmethod
+    def zeros(cls, *batch: int) -> "NumericState":
+        return cls(np.zeros((*batch, cls.DIM)))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, batch: bool = False) -> "NumericState":
+        """Read only state on data, see to_bytes. data holds a single item,
+        (DIM,), or with batch a batch of any length, (N, DIM)"""
+        buffer = np.frombuffer(data, dtype=np.float64)
+        return cls(buffer.reshape(-1, cls.DIM) if batch else buffer)
+
+    def to_bytes(self) -> bytes:
+        return self.buffer.tobytes()
+
+    @staticmethod
+    def field_view(index: slice, typ: T.Type) -> property:
+        if typ == sf.Scalar:
+
+            def view(self):
+                return self.buffer[..., index.start]
+
+        elif issubclass(typ, SymState):
+
+            def view(self):
+                return typ.numeric()(self.buffer[..., index])
+
+        elif issubclass(typ, Matrix) and typ.SHAPE[1] > 1:
+
+            def view(self):
+                storage = self.buffer[..., index]
+                shape = (*storage.shape[:-1], *typ.SHAPE[::-1])
+                return storage.reshape(shape).swapaxes(-1, -2)
+
+        else:
+
+            def view(self):
+                return self.buffer[..., index]
+
+        def set_view(self, value):
+            if isinstance(value, NumericState):
+                self.buffer[..., index] = value.buffer
+            elif hasattr(value, "to_storage"):
+                self.buffer[..., index] = value.to_storage()
+            else:
+                view(self)[...] = value
+
+        return property(view, set_view)
+
+    @classmethod
+    def from_state(cls, state: SymState) -> "NumericState":
+        return cls(np.array(state.to_storage(), dtype=np.float64))
+
+    def to_state(self) -> SymState:
+        if self.buffer.ndim != 1:
+            raise ValueError("Only a single item can be converted to a SymState")
+        values = []
+        for index, typ in self.STATE.field_layout().values():
+            if typ == sf.Scalar:
+                values.append(float(self.buffer[index.start]))
+            elif issubclass(typ, SymState):
+                values.append(typ.numeric()(self.buffer[index]).to_state())
+            else:
+                values.append(typ.from_storage(self.buffer[index].tolist()))
+        return self.STATE(*values)
+
+    def copy(self) -> "NumericState":
+        return type(self)(self.buffer.copy())
+
+    def __len__(self) -> int:
+        return len(self.buffer) if self.buffer.ndim > 1 else 1
+
+    def __getitem__(self, item) -> "NumericState":
+        if self.buffer.ndim == 1:
+            raise TypeError(f"{type(self).__name__} is a single item")
+        return type(self)(self.buffer[item])
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} shape={self.buffer.shape}>"
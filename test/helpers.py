@@ -0,0 +1,81 @@
+"""Problems, states and the kernel library shared by the test modules"""
+
+import importlib
+import subprocess
+import sys
+
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from codegen.get_code import FuncWrapper
+from se23.batch_integration import cov_to_numpy
+from se23.integration import preintegrate
+from se23.pose23_SE23 import Pose23_SE23
+from states import Cov99, ImuBias, ImuNoise, ImuPreint, State, ZImuEst
+
+EPS = 1e-12
+BUILD_ERROR = None
+
+
+def random_problem(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    gyro = rng.normal(size=(n, 3))
+    accl = rng.normal(scale=3.0, size=(n, 3))
+    dt = rng.uniform(0.001, 0.05, n)
+    imu_noise = ImuNoise(Vector3(1e-3, 2e-3, 3e-3), Vector3(1e-2, 2e-2, 3e-2))
+    preint = ImuPreint(
+        Pose23_SE23.from_tangent(rng.normal(size=9).tolist()),
+        Cov99.diag(rng.uniform(0.1, 1.0, 9).tolist()),
+    )
+    return imu_noise, preint, gyro, accl, dt
+
+
+def symbolic_loop(imu_noise, preint, gyro, accl, dt):
+    for gyro_i, accl_i, dt_i in zip(gyro, accl, dt):
+        z_imu_est = ZImuEst(Vector3(gyro_i), Vector3(accl_i))
+        preint = preintegrate(imu_noise, preint, z_imu_est, float(dt_i))
+    return preint
+
+
+def random_state(seed: int) -> State:
+    rng = np.random.default_rng(seed)
+    L = rng.normal(scale=0.1, size=(9, 9))
+    return State(
+        Pose23_SE23.from_tangent(rng.normal(size=9).tolist(), EPS),
+        Cov99((L @ L.T + 1e-3 * np.eye(9)).tolist()),
+        ImuBias(Vector3(rng.normal(size=3)), Vector3(rng.normal(size=3))),
+    )
+
+
+def import_kernels(test: TestCase) -> None:
+    """Import the library of the kernels registered in se23_testing, built and
+    cached on first use, skips test if it can not be built"""
+    global BUILD_ERROR  # pylint: disable=global-statement
+    if FuncWrapper._cmodule is None and BUILD_ERROR is None:
+        registered = FuncWrapper._registered
+        FuncWrapper._registered = set()
+        try:
+            if "se23_testing" in sys.modules:
+                importlib.reload(sys.modules["se23_testing"])
+            else:
+                importlib.import_module("se23_testing")
+            FuncWrapper.compile_and_import()
+        except (OSError, subprocess.CalledProcessError) as error:
+            BUILD_ERROR = error
+        finally:
+            FuncWrapper._registered = registered
+    if FuncWrapper._cmodule is None:
+        test.skipTest(f"The kernels can not be built: {BUILD_ERROR}")
+
+
+class PreintAssertions:
+    """assertPreintNear for TestCase subclasses"""
+
+    def assertPreintNear(self, a: ImuPreint, b: ImuPreint) -> None:
+        ups_a = np.array(a.upsilon.to_storage(), dtype=float)
+        ups_b = np.array(b.upsilon.to_storage(), dtype=float)
+        np.testing.assert_allclose(ups_a, ups_b, rtol=0, atol=1e-9)
+        cov_a = cov_to_numpy(a.cov)
+        np.testing.assert_allclose(cov_a, cov_to_numpy(b.cov), rtol=1e-9, atol=1e-9)
@@ -0,0 +1,67 @@
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from se23.pose23_SE23 import Pose23_SE23
+from se23.batch_integration import preintegrate_batch, cov_to_numpy, imu_increments
+from se23.pose23_array import Pose23_SE23Array
+from states import ImuNoise, ImuPreint, Cov99
+from helpers import PreintAssertions, random_problem, symbolic_loop
+
+EPS = 1e-12
+
+
+class BatchIntegrationTest(PreintAssertions, TestCase):
+    def test_matches_symbolic(self) -> None:
+        problem = random_problem(25)
+        self.assertPreintNear(symbolic_loop(*problem), preintegrate_batch(*problem))
+
+    def test_scalar_dt(self) -> None:
+        imu_noise, preint, gyro, accl, _ = random_problem(10, seed=1)
+        dt = np.full(len(gyro), 0.01)
+        self.assertPreintNear(
+            symbolic_loop(imu_noise, preint, gyro, accl, dt),
+            preintegrate_batch(imu_noise, preint, gyro, accl, 0.01),
+        )
+
+    def test_chunked(self) -> None:
+        imu_noise, preint, gyro, accl, dt = random_problem(40, seed=2)
+        full = preintegrate_batch(imu_noise, preint, gyro, accl, dt)
+        half = preintegrate_batch(imu_noise, preint, gyro[:17], accl[:17], dt[:17])
+        half = preintegrate_batch(imu_noise, half, gyro[17:], accl[17:], dt[17:])
+        self.assertPreintNear(full, half)
+
+    def test_monte_carlo(self) -> None:
+        """cov is the covariance of xi with upsilon_true = upsilon * Exp(xi)"""
+        rng = np.random.default_rng(3)
+        n, samples, dt = 20, 5000, 0.01
+        imu_noise = ImuNoise(Vector3(300.0, 300.0, 300.0), Vector3(30.0, 30.0, 30.0))
+        preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+        gyro = np.tile([0.5, -0.3, 0.8], (n, 1))
+        accl = np.tile([1.0, 0.5, 9.81], (n, 1))
+        mean = preintegrate_batch(imu_noise, preint, gyro, accl, dt, epsilon=EPS)
+
+        noise = np.sqrt(np.array(imu_noise.to_storage(), dtype=float) * dt)
+        noise = noise * rng.normal(size=(samples, n, 6))
+        increments = imu_increments(
+            (gyro + noise[..., :3]).reshape(-1, 3),
+            (accl + noise[..., 3:]).reshape(-1, 3),
+            np.full(samples * n, dt),
+            EPS,
+        )
+        delta_q, delta_v, delta_t = (e.reshape(samples, n, -1) for e in increments)
+        upsilon = Pose23_SE23Array.identity(samples)
+        for i in range(n):
+            upsilon = Pose23_SE23Array(
+                upsilon.R, upsilon.v, upsilon.t + dt * upsilon.v
+            ).compose(Pose23_SE23Array(delta_q[:, i], delta_v[:, i], delta_t[:, i]))
+
+        xi = Pose23_SE23Array.from_poses([mean.upsilon]).local_coordinates(upsilon, EPS)
+        cov = cov_to_numpy(mean.cov)
+        error = np.linalg.norm(np.cov(xi.T) - cov) / np.linalg.norm(cov)
+        self.assertLess(error, 0.05)
+
+
+if __name__ == "__main__":
+    TestCase.main()
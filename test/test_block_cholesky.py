@@ -0,0 +1,68 @@
+import numpy as np
+
+from symforce.test_util import TestCase
+
+from se23.block_cholesky import BlockCholesky, to_dense
+
+
+def random_blocks(cholesky: BlockCholesky, rng: np.random.Generator) -> np.ndarray:
+    """Blocks of a positive definite matrix of the pattern of cholesky"""
+    n, b = cholesky.n, cholesky.block
+    J = rng.normal(size=(len(cholesky.pairs), b, b))
+    blocks = 0.1 * J @ J.transpose(0, 2, 1)
+    diagonal = cholesky.pairs[:, 0] == cholesky.pairs[:, 1]
+    blocks[diagonal] += n * b * np.eye(b)
+    return blocks
+
+
+class BlockCholeskyTest(TestCase):
+    def test_solve(self) -> None:
+        """Banded and general patterns, the factorization is reused"""
+        rng = np.random.default_rng(25)
+        general = [(j + d, j) for j in range(12) for d in (0, 1) if j + d < 12]
+        general += [(11, 0), (7, 3)]
+        cases = (
+            (BlockCholesky.banded(20, 9, 1), 0),
+            (BlockCholesky.banded(10, 15, 2), 0),
+            (BlockCholesky(12, 15, general), 11),
+        )
+        for cholesky, fill_in in cases:
+            self.assertEqual(cholesky.fill_in, fill_in)
+            n, b = cholesky.n, cholesky.block
+            for _ in range(2):
+                blocks = random_blocks(cholesky, rng)
+                H = to_dense(n, b, cholesky.pairs, blocks)
+                g = rng.normal(size=n * b)
+                x = cholesky.factor(blocks).solve(g)
+                self.assertEqual(x.shape, (n, b))
+                np.testing.assert_allclose(x.ravel(), np.linalg.solve(H, g), atol=1e-12)
+
+    def test_schur(self) -> None:
+        rng = np.random.default_rng(26)
+        general = [(j + d, j) for j in range(8) for d in (0, 1) if j + d < 8]
+        cholesky = BlockCholesky(8, 9, general + [(7, 0), (5, 1)])
+        blocks = random_blocks(cholesky, rng)
+        H = to_dense(8, 9, cholesky.pairs, blocks)
+        for m in (1, 3):
+            pairs, schur = cholesky.schur(blocks, m)
+            A, B, C = H[: 9 * m, : 9 * m], H[: 9 * m, 9 * m :], H[9 * m :, 9 * m :]
+            np.testing.assert_allclose(
+                to_dense(8 - m, 9, pairs, schur),
+                C - B.T @ np.linalg.solve(A, B),
+                atol=1e-12,
+            )
+
+    def test_errors(self) -> None:
+        cholesky = BlockCholesky.banded(3, 9, 1)
+        with self.assertRaises(ValueError):
+            BlockCholesky(3, 9, [(0, 1)])
+        with self.assertRaises(ValueError):
+            cholesky.factor(np.zeros((4, 9, 9)))
+        blocks = np.zeros((5, 9, 9))
+        blocks[0::2] = -np.eye(9)
+        with self.assertRaises(np.linalg.LinAlgError):
+            cholesky.factor(blocks)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,137 @@
+import numpy as np
+
+from symforce.geo import Matrix
+from symforce.test_util import TestCase
+
+from states import Cov, Cov33, Cov66, Cov99, CovSqrt, CovSqrt33, CovSqrt99
+
+
+def random_cov(n: int, rng: np.random.Generator) -> np.ndarray:
+    L = rng.normal(size=(n, n))
+    return L @ L.T
+
+
+class CovarianceTest(TestCase):
+    def test_storage(self) -> None:
+        P = random_cov(3, np.random.default_rng(0))
+        for cov in (Cov33(P), Cov33(P.tolist())):
+            self.assertEqual(len(cov.to_storage()), Cov33.storage_dim())
+            np.testing.assert_allclose(cov.to_numpy(), P)
+            np.testing.assert_allclose(
+                Cov33.from_storage(cov.to_storage()).to_numpy(), P
+            )
+        self.assertEqual(Cov.sized(9), Cov99)
+        self.assertEqual(Cov33.symbolic("P")[2, 0], Cov33.symbolic("P")[0, 2])
+
+    def test_diag(self) -> None:
+        np.testing.assert_allclose(
+            Cov66.diag(list(range(6))).to_numpy(), np.diag(np.arange(6.0))
+        )
+
+    def test_congruence(self) -> None:
+        rng = np.random.default_rng(1)
+        P = random_cov(6, rng)
+        A = rng.normal(size=(9, 6))
+        expected = A @ P @ A.T
+
+        numeric = Cov66(P).congruence(A)
+        self.assertIsInstance(numeric, Cov99)
+        self.assertTrue(numeric.is_numpy)
+        np.testing.assert_allclose(numeric.to_numpy(), expected)
+
+        symbolic = Cov66(P.tolist()).congruence(Matrix(A.tolist()))
+        self.assertIsInstance(symbolic, Cov99)
+        self.assertFalse(symbolic.is_numpy)
+        np.testing.assert_allclose(symbolic.to_numpy(), expected)
+
+    def test_congruence_factors(self) -> None:
+        rng = np.random.default_rng(5)
+        P = random_cov(6, rng)
+        A_0, A_1 = rng.normal(size=(9, 9)), rng.normal(size=(9, 6))
+        A_0[rng.random((9, 9)) < 0.5] = 0
+        A_1[:6] = np.eye(6)
+        expected = A_0 @ A_1 @ P @ A_1.T @ A_0.T
+
+        numeric = Cov66(P).congruence(A_0, A_1)
+        np.testing.assert_allclose(numeric.to_numpy(), expected)
+
+        symbolic = Cov66(P.tolist()).congruence(
+            Matrix(A_0.tolist()), Matrix(A_1.tolist())
+        )
+        self.assertIsInstance(symbolic, Cov99)
+        np.testing.assert_allclose(symbolic.to_numpy(), expected)
+
+    def test_arithmetic(self) -> None:
+        rng = np.random.default_rng(2)
+        P, Q = random_cov(3, rng), random_cov(3, rng)
+        for a, b in ((Cov33(P), Cov33(Q)), (Cov33(P.tolist()), Cov33(Q.tolist()))):
+            np.testing.assert_allclose((a + b).to_numpy(), P + Q)
+            np.testing.assert_allclose((a - b).to_numpy(), P - Q)
+            np.testing.assert_allclose((2.0 * a).to_numpy(), 2 * P)
+            self.assertIsInstance(a + b, Cov33)
+        with self.assertRaises(ValueError):
+            Cov33(P) + Cov66(np.eye(6))
+
+    def test_elements(self) -> None:
+        """Elements are read and written in the packed storage, mat is read only"""
+        P = random_cov(3, np.random.default_rng(7))
+        for cov in (Cov33(P), Cov33(P.tolist())):
+            self.assertEqual(cov[0, 2], cov[2, 0])
+            self.assertEqual(cov[-1, 1], P[2, 1])
+            cov[0, 2] = 5.0
+            self.assertEqual(cov[2, 0], 5.0)
+            self.assertEqual(cov.mat[0, 2], 5.0)
+            with self.assertRaises((ValueError, TypeError)):
+                cov.mat[1, 1] = 0.0
+            with self.assertRaises(IndexError):
+                cov[3, 0]  # pylint: disable=pointless-statement
+        sqrt = CovSqrt33(np.linalg.cholesky(P))
+        self.assertEqual(sqrt[0, 2], 0)
+        with self.assertRaises(IndexError):
+            sqrt[0, 2] = 1.0
+
+    def test_products(self) -> None:
+        rng = np.random.default_rng(6)
+        P, A = random_cov(3, rng), rng.normal(size=(3, 2))
+        numeric, symbolic = Cov33(P), Cov33(P.tolist())
+        np.testing.assert_allclose(numeric * A, P @ A)
+        np.testing.assert_allclose(A.T * numeric, A.T @ P)
+        np.testing.assert_allclose(symbolic * A, P @ A)
+        np.testing.assert_allclose(numeric.inv(), np.linalg.inv(P))
+        np.testing.assert_allclose(
+            np.array(symbolic.inv().to_numpy(), dtype=float), np.linalg.inv(P)
+        )
+
+    def test_cholesky(self) -> None:
+        P = random_cov(3, np.random.default_rng(3))
+        for cov in (Cov33(P), Cov33(P.tolist())):
+            sqrt = CovSqrt.from_cov(cov, epsilon=0.0)
+            self.assertIsInstance(sqrt, CovSqrt33)
+            L = sqrt.to_numpy()
+            np.testing.assert_allclose(L, np.tril(L))
+            np.testing.assert_allclose(L @ L.T, P)
+            np.testing.assert_allclose(sqrt.to_cov().to_numpy(), P)
+
+    def test_qr_update(self) -> None:
+        rng = np.random.default_rng(4)
+        blocks = rng.normal(size=(9, 9)), rng.normal(size=(9, 6))
+        M = np.hstack(blocks)
+
+        numeric = CovSqrt.qr_update(*blocks, epsilon=0.0)
+        self.assertIsInstance(numeric, CovSqrt99)
+        np.testing.assert_allclose(numeric.to_cov().to_numpy(), M @ M.T)
+        self.assertTrue(np.all(np.diag(numeric.to_numpy()) > 0))
+
+        symbolic = CovSqrt.qr_update(*(Matrix(b.tolist()) for b in blocks), epsilon=0.0)
+        np.testing.assert_allclose(symbolic.to_numpy(), numeric.to_numpy())
+
+    def test_qr_update_rank_deficient(self) -> None:
+        G = np.random.default_rng(5).normal(size=(9, 6))
+        sqrt = CovSqrt.qr_update(np.zeros((9, 9)), G, epsilon=1e-6)
+        self.assertTrue(np.all(np.isfinite(sqrt.to_numpy())))
+        self.assertTrue(np.all(np.diag(sqrt.to_numpy()) > 0))
+        np.testing.assert_allclose(sqrt.to_cov().to_numpy(), G @ G.T, atol=1e-9)
+
+
+if __name__ == "__main__":
+    TestCase.main()
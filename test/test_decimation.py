@@ -0,0 +1,123 @@
+import importlib
+
+import numpy as np
+
+from symforce.geo import Matrix, Vector3
+from symforce.test_util import TestCase
+
+from se23.pose23_SE23 import Pose23_SE23
+from se23.integration import coalesce, preintegrate_delta
+from se23.batch_integration import preintegrate_batch
+from se23.decimation import (
+    STORAGE_DIM,
+    ImuDecimator,
+    coalesce_batch,
+    preintegrate_decimated,
+    to_storage,
+)
+from states import ImuBias, ZImuDelta, Cov99
+from helpers import PreintAssertions, import_kernels, random_problem
+
+EPS = 1e-12
+
+
+class DecimationTest(PreintAssertions, TestCase):
+
+    def test_single_sample_groups(self) -> None:
+        """Only the expansions of the sample rotations differ from the full rate"""
+        imu_noise, preint, gyro, accl, _ = random_problem(30, seed=7)
+        problem = (imu_noise, preint, gyro, accl, np.full(len(gyro), 1e-3))
+        self.assertPreintNear(
+            preintegrate_decimated(*problem, k=1, epsilon=EPS),
+            preintegrate_batch(*problem, epsilon=EPS),
+        )
+
+    def test_matches_full_rate(self) -> None:
+        """One second at 4 kHz stays within 1e-7 of the full rate for k <= 32,
+        with a fixed rate and with jittered timestamps"""
+        imu_noise, preint, gyro, accl, _ = random_problem(4000, seed=8)
+        jitter = np.random.default_rng(8).uniform(0.5, 1.5, len(gyro))
+        for dt, rtol in ((np.full(len(gyro), 2.5e-4), 2e-5), (2.5e-4 * jitter, 1e-4)):
+            expected = preintegrate_batch(imu_noise, preint, gyro, accl, dt, EPS)
+            for k in (2, 7, 16, 32):
+                result = preintegrate_decimated(
+                    imu_noise, preint, gyro, accl, dt, k, EPS
+                )
+                np.testing.assert_allclose(
+                    np.array(
+                        result.upsilon.local_coordinates(expected.upsilon, EPS), float
+                    ),
+                    0,
+                    atol=1e-7,
+                )
+                np.testing.assert_allclose(
+                    result.cov.to_numpy(), expected.cov.to_numpy(), rtol=rtol
+                )
+
+    def test_coalesce(self) -> None:
+        """The symbolic coalesce of the kernels against coalesce_batch, with an
+        interval per sample"""
+        imu_noise, _, gyro, accl, _ = random_problem(4, seed=10)
+        dt = 1e-3 * np.random.default_rng(10).uniform(0.5, 1.5, len(gyro))
+        noise_diag = np.array(imu_noise.to_storage(), float)
+        storage, tau = to_storage(
+            coalesce_batch(gyro[None], accl[None], dt[None], noise_diag, EPS)
+        )
+        z_imu_delta = coalesce(imu_noise, Matrix(np.hstack([gyro, accl]).T), Matrix(dt))
+        np.testing.assert_allclose(
+            np.array(z_imu_delta.to_storage(), float), storage[0], rtol=1e-12
+        )
+        self.assertAlmostEqual(tau[0], dt.sum(), delta=1e-18)
+
+    def test_kernel(self) -> None:
+        """The compiled coalesce kernel against coalesce_batch with jittered
+        timestamps"""
+        import_kernels(self)
+        kernel = importlib.import_module("se23_testing").coalesce_kernels[8]
+        imu_noise, _, gyro, accl, _ = random_problem(60, seed=11)
+        dt = 1e-3 * np.random.default_rng(11).uniform(0.5, 1.5, len(gyro))
+        z_imu_raw = np.hstack([gyro, accl])
+        bias = ImuBias(Vector3.zero(), Vector3.zero())
+        storage, tau = ImuDecimator(8, imu_noise, bias, EPS).push(z_imu_raw, dt)
+        result = ImuDecimator(8, imu_noise, bias, EPS, kernel=kernel).push(
+            z_imu_raw, dt
+        )
+        self.assertEqual(storage.shape, (7, STORAGE_DIM))
+        np.testing.assert_allclose(result[0], storage, rtol=1e-9, atol=1e-15)
+        np.testing.assert_allclose(result[1], tau, rtol=1e-15)
+
+    def test_stream(self) -> None:
+        """Uneven pushes, a bias and a flushed remainder through the symbolic
+        preintegrate_delta"""
+        imu_noise, preint, gyro, accl, dt = random_problem(23, seed=9)
+        bias = np.random.default_rng(9).normal(size=6)
+        decimator = ImuDecimator(
+            4, imu_noise, ImuBias(*map(Vector3, np.split(bias, 2)))
+        )
+        z_imu_raw = np.hstack([gyro, accl]) + bias
+        outputs = [
+            decimator.push(z_imu_raw[a:b], dt[a:b])
+            for a, b in ((0, 3), (3, 3), (3, 13), (13, 23))
+        ]
+        outputs.append(decimator.flush())
+        storage = np.concatenate([out[0] for out in outputs])
+        tau = np.concatenate([out[1] for out in outputs])
+        self.assertEqual(storage.shape, (6, STORAGE_DIM))
+
+        result = preint
+        for row, tau_i in zip(storage, tau):
+            z_imu_delta = ZImuDelta(
+                Pose23_SE23.from_storage(row[:10].tolist()),
+                Cov99.from_storage(row[10:].tolist()),
+            )
+            result = preintegrate_delta(result, z_imu_delta, float(tau_i))
+        self.assertPreintNear(
+            result,
+            preintegrate_decimated(
+                imu_noise, preint, gyro, accl, dt, k=4, epsilon=decimator.epsilon
+            ),
+        )
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,139 @@
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from codegen.get_code import FuncWrapper
+from se23 import eskf
+from se23.eskf import (
+    ErrorStateFilter,
+    measurement_jacobian,
+    position,
+    propagate,
+    update,
+    velocity,
+)
+from se23.integration import preintegrate
+from se23.pose23_SE23 import Pose23_SE23
+from states import Cov33, Cov99, ImuBias, ImuNoise, ImuPreint, State, ZImuRaw
+from helpers import import_kernels, random_problem, random_state
+
+EPS = 1e-12
+
+
+class EskfTest(TestCase):
+    def test_propagate(self) -> None:
+        """preintegrate with the bias subtracted, and gravity on top"""
+        imu_noise, _, gyro, accl, dt = random_problem(1, seed=16)
+        state = random_state(16)
+        z_imu_raw = ZImuRaw(Vector3(gyro[0]), Vector3(accl[0]))
+        result = propagate(imu_noise, state, z_imu_raw, dt[0], Vector3(0, 0, 0))
+        expected = preintegrate(
+            imu_noise,
+            ImuPreint(state.nom, state.err_cov),
+            z_imu_raw - state.imu_bias,
+            dt[0],
+        )
+        self.assertEqual(result.nom.to_storage(), expected.upsilon.to_storage())
+        self.assertEqual(result.err_cov.to_storage(), expected.cov.to_storage())
+
+        at_rest = State(Pose23_SE23.identity(), Cov99.diag([0.0] * 9), ImuBias())
+        z_imu_raw = ZImuRaw(Vector3(0, 0, 0), Vector3(0, 0, 9.81))
+        result = propagate(imu_noise, at_rest, z_imu_raw, 0.1, Vector3(0, 0, -9.81))
+        np.testing.assert_allclose(
+            np.array(result.nom.to_storage(), float), [0, 0, 0, 1] + [0] * 6, atol=1e-12
+        )
+
+    def test_measurement_jacobian(self) -> None:
+        nom = random_state(17).nom
+        for h in (position, velocity):
+            z, H = measurement_jacobian(h, nom, EPS)
+            H = np.array(H.to_numpy(), float)
+            for i in range(9):
+                xi = np.zeros(9)
+                xi[i] = 1e-6
+                perturbed = np.array(h(nom.retract(xi.tolist(), EPS)).to_numpy(), float)
+                np.testing.assert_allclose(
+                    (perturbed - np.array(z.to_numpy(), float)).ravel() / 1e-6,
+                    H[:, i],
+                    atol=1e-5,
+                )
+
+    def test_update(self) -> None:
+        """The Joseph form equals (I - K H) P for the optimal gain"""
+        state = random_state(18)
+        R = np.diag([0.1, 0.2, 0.3])
+        z = np.array([0.3, -0.2, 0.1])
+        result = update(state, Vector3(z), Cov33(R), position, EPS)
+
+        z_pred, H = measurement_jacobian(position, state.nom, EPS)
+        H = np.array(H.to_numpy(), float)
+        P = state.err_cov.to_numpy()
+        K = P @ H.T @ np.linalg.inv(H @ P @ H.T + R)
+        xi = K @ (z - np.array(z_pred.to_numpy(), float).ravel())
+        np.testing.assert_allclose(
+            result.err_cov.to_numpy(), (np.eye(9) - K @ H) @ P, atol=1e-12
+        )
+        np.testing.assert_allclose(
+            np.array(state.nom.local_coordinates(result.nom, EPS), float),
+            xi,
+            atol=1e-12,
+        )
+        self.assertEqual(result.imu_bias.to_storage(), state.imu_bias.to_storage())
+
+    def test_requires_propagate(self) -> None:
+        imu_noise = random_problem(1, seed=20)[0]
+        with self.assertRaises(TypeError):
+            ErrorStateFilter(
+                random_state(20), imu_noise
+            )  # pylint: disable=missing-kwoa
+
+    def test_kernels(self) -> None:
+        """ErrorStateFilter on the compiled kernels against the python steps"""
+        import_kernels(self)
+        rng = np.random.default_rng(19)
+        imu_noise, _, gyro, accl, dt = random_problem(6, seed=19)
+        z_imu_raw = np.hstack([gyro, accl])
+        gravity = np.array([0, 0, -9.81])
+        R = np.diag([0.1, 0.2, 0.3])
+        R_sym = Cov33(R.tolist())
+        z = rng.normal(size=(3, 3))
+
+        expected = random_state(19)
+        esf = ErrorStateFilter(
+            expected,
+            imu_noise,
+            gravity,
+            propagate=FuncWrapper(eskf.propagate_kernel(), carry="state"),
+            updates={
+                h.__name__: FuncWrapper(eskf.update_kernel(h), carry="state")
+                for h in (position, velocity)
+            },
+            cycles={
+                "position": FuncWrapper(eskf.cycle_kernel(position), carry="state")
+            },
+        )
+
+        def python_propagate(state: State, i: int) -> State:
+            sample = ZImuRaw(Vector3(gyro[i]), Vector3(accl[i]))
+            return propagate(imu_noise, state, sample, dt[i], Vector3(gravity))
+
+        esf.propagate(z_imu_raw[:4], dt[:4])
+        for i in range(4):
+            expected = python_propagate(expected, i)
+        esf.update("position", z[0], R)
+        expected = update(expected, Vector3(z[0]), R_sym, position)
+        esf.cycle("position", z_imu_raw[4], dt[4], z[1], R)
+        expected = update(python_propagate(expected, 4), Vector3(z[1]), R_sym, position)
+        esf.propagate(z_imu_raw[5], dt[5])
+        expected = python_propagate(expected, 5)
+        esf.update("velocity", z[2], R)
+        expected = update(expected, Vector3(z[2]), R_sym, velocity)
+
+        np.testing.assert_allclose(
+            esf.state.buffer, np.array(expected.to_storage(), float), atol=1e-10
+        )
+
+
+if __name__ == "__main__":
+    TestCase.main()
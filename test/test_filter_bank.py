@@ -0,0 +1,105 @@
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from codegen.get_code import FuncWrapper
+from se23 import eskf
+from se23.filter_bank import FilterBank, ShardedFilterBank, kernel_step, python_step
+from se23.integration import preintegrate
+from se23.pose23_SE23 import Pose23_SE23
+from states import Cov99, ImuNoise, ImuPreint, State, ZImuRaw
+from helpers import import_kernels, random_state
+
+M = 5
+GRAVITY = np.array([0, 0, -9.81])
+
+
+def noises(rng: np.random.Generator) -> np.ndarray:
+    return np.abs(rng.normal(scale=1e-2, size=(M, 6)))
+
+
+class FilterBankTest(TestCase):
+    def test_state_bank(self) -> None:
+        """Every filter is propagated with its own noise and sample"""
+        rng = np.random.default_rng(23)
+        states = [random_state(seed) for seed in range(M)]
+        noise, z_imu_raw = noises(rng), rng.normal(size=(M, 6))
+        propagate = FuncWrapper.wrap(eskf.propagate_kernel(), carry="state")
+        bank = FilterBank(
+            State.numeric()(np.array([s.to_storage() for s in states], float)),
+            {"propagate": python_step(propagate)},
+            imu_noise=noise,
+        )
+        bank.step("propagate", z_imu_raw=z_imu_raw, dt=0.01, gravity=GRAVITY)
+        for i, state in enumerate(states):
+            expected = eskf.propagate(
+                ImuNoise.numeric()(noise[i]).to_state(),
+                state,
+                ZImuRaw(Vector3(z_imu_raw[i, :3]), Vector3(z_imu_raw[i, 3:])),
+                0.01,
+                Vector3(GRAVITY),
+            )
+            np.testing.assert_allclose(
+                bank.states.buffer[i], np.array(expected.to_storage(), float)
+            )
+
+        with self.assertRaises(ValueError):
+            bank.step("propagate", z_imu_raw=z_imu_raw[1:], dt=0.01, gravity=GRAVITY)
+
+    def test_sharded(self) -> None:
+        """Workers advance their shards of the shared buffers in place"""
+        rng = np.random.default_rng(24)
+        preint = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+        states = ImuPreint.numeric()(np.tile(preint.to_storage(), (M, 1)).astype(float))
+        steps = {
+            "preintegrate": python_step(
+                FuncWrapper.wrap(preintegrate, carry="preint_prev")
+            )
+        }
+        noise = noises(rng)
+        bank = FilterBank(states.copy(), steps, imu_noise=noise)
+        with ShardedFilterBank(states, steps, 2, imu_noise=noise) as sharded:
+            self.assertEqual([s.stop - s.start for s in sharded.shards], [2, 3])
+            for _ in range(2):
+                inputs = dict(
+                    z_imu_est=rng.normal(size=(M, 6)),
+                    dt=rng.uniform(1e-3, 1e-2, size=(M, 1)),
+                )
+                bank.step("preintegrate", **inputs)
+                sharded.step("preintegrate", **inputs)
+            np.testing.assert_array_equal(sharded.states.buffer, bank.states.buffer)
+            with self.assertRaises(KeyError):
+                sharded.step("propagate", **inputs)
+        self.assertEqual(sharded.workers, [])
+
+    def test_kernel_step(self) -> None:
+        """The batch kernel advances a bank like the python step, also sharded"""
+        import_kernels(self)
+        rng = np.random.default_rng(25)
+        states = State.numeric()(
+            np.array([random_state(seed).to_storage() for seed in range(M)])
+        )
+        propagate = FuncWrapper(eskf.propagate_kernel(), carry="state")
+        noise = noises(rng)
+        banks = [
+            FilterBank(states.copy(), {"propagate": step(propagate)}, imu_noise=noise)
+            for step in (python_step, kernel_step)
+        ]
+        steps = {"propagate": kernel_step(propagate, parallel=False)}
+        with ShardedFilterBank(states, steps, 2, imu_noise=noise) as sharded:
+            for _ in range(2):
+                inputs = dict(
+                    z_imu_raw=rng.normal(size=(M, 6)),
+                    dt=rng.uniform(1e-3, 1e-2, size=(M, 1)),
+                    gravity=GRAVITY,
+                )
+                for bank in (*banks, sharded):
+                    bank.step("propagate", **inputs)
+            python, kernel = (bank.states.buffer for bank in banks)
+            np.testing.assert_allclose(kernel, python, rtol=1e-12, atol=1e-12)
+            np.testing.assert_array_equal(sharded.states.buffer, kernel)
+
+
+if __name__ == "__main__":
+    TestCase.main()
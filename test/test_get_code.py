@@ -0,0 +1,344 @@
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+import importlib
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import numpy as np
+
+import symforce.symbolic as sf
+from symforce.geo import Matrix33, Rot3, Vector3
+from symforce.test_util import TestCase
+
+from codegen import get_code
+from codegen.get_code import FuncWrapper, source_files, _generate_registered
+from se23 import eskf
+from se23.integration import preintegrate
+from se23.pose23_SE23 import Pose23_SE23
+from states import SymState, ZImuEst
+from helpers import import_kernels, random_problem
+
+
+def preint_storage(preint) -> np.ndarray:
+    return np.array([*preint.upsilon.to_storage(), *preint.cov.to_storage()], float)
+
+
+def rotation(pose: Pose23_SE23):
+    return pose.rotation().to_rotation_matrix()
+
+
+def velocity(pose: Pose23_SE23):
+    return pose.velocity()
+
+
+def speed(pose: Pose23_SE23) -> sf.Scalar:
+    return pose.velocity().norm()
+
+
+@dataclass(init=False, repr=False)
+class Skew(SymState):
+    mat: Matrix33
+
+
+def skew(pose: Pose23_SE23) -> Skew:
+    return Skew(Rot3.hat(pose.velocity()))
+
+
+class GetCodeTest(TestCase):
+    def setUp(self) -> None:
+        self.registered = set(FuncWrapper._registered)
+
+    def tearDown(self) -> None:
+        FuncWrapper._registered = self.registered
+
+    def test_source_files(self) -> None:
+        names = {file.name for file in source_files(preintegrate)}
+        self.assertIn("integration.py", names)
+        names = {file.name for file in source_files(Pose23_SE23)}
+        self.assertIn("pose23.py", names)
+        self.assertIn("pose23_SE23.py", names)
+        names = {file.name for file in source_files(eskf.propagate_kernel())}
+        self.assertIn("integration.py", names)
+
+    def test_cache_key(self) -> None:
+        key = FuncWrapper(preintegrate).cache_key
+        self.assertEqual(key, FuncWrapper(preintegrate).cache_key)
+        self.assertNotEqual(FuncWrapper(rotation).cache_key, key)
+        self.assertNotEqual(
+            FuncWrapper(rotation).cache_key, FuncWrapper(velocity).cache_key
+        )
+        self.assertNotEqual(FuncWrapper(preintegrate, small_angle=0).cache_key, key)
+
+    def test_cache_key_helper(self) -> None:
+        """Editing a module that is only called from the body changes the key"""
+        with TemporaryDirectory() as tmp:
+            helper = Path(tmp) / "helper.py"
+            helper.write_text("def scale(v):\n    return 2 * v\n")
+            (Path(tmp) / "kernel.py").write_text(
+                "import helper\n\n\ndef kernel(pose):\n"
+                "    return helper.scale(pose.velocity())\n"
+            )
+            sys.path.insert(0, tmp)
+            try:
+                with mock.patch.object(get_code, "PROJECT_DIR", Path(tmp)):
+                    kernel = importlib.import_module("kernel").kernel
+                    key = FuncWrapper(kernel).cache_key
+                    helper.write_text("def scale(v):\n    return 3 * v\n")
+                    self.assertNotEqual(FuncWrapper(kernel).cache_key, key)
+            finally:
+                sys.path.remove(tmp)
+                sys.modules.pop("kernel", None)
+                sys.modules.pop("helper", None)
+
+    def test_generate_in_worker(self) -> None:
+        func = FuncWrapper(rotation)
+        with ProcessPoolExecutor(1, mp_context=get_context("fork")) as executor:
+            header, signatures = executor.submit(
+                _generate_registered, "rotation"
+            ).result()
+        self.assertEqual((header, signatures), func.generate_cpp_func())
+        self.assertEqual(signatures["inputs"], {"pose": "Eigen::Matrix<Scalar, 10, 1>"})
+        self.assertIn("void Rotation(", header)
+
+    def test_workers(self) -> None:
+        """One worker per uncached function, at most one per cpu"""
+        FuncWrapper._registered = set()
+        for func in (rotation, velocity, skew):
+            FuncWrapper(func)
+        with TemporaryDirectory() as tmp, mock.patch.object(
+            get_code, "CACHE_DIR", Path(tmp)
+        ), mock.patch.object(get_code, "CPP_DIR", Path(tmp)), mock.patch.object(
+            get_code.os, "cpu_count", return_value=2
+        ), mock.patch.object(
+            get_code, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool:
+            for generated in ("generated", "generated_symforce"):
+                (Path(tmp) / generated).mkdir()
+            FuncWrapper.generate_cpp_funcs()
+        self.assertEqual(pool.call_args.args[0], 2)
+
+    def test_prune_cache(self) -> None:
+        """Stale entries of registered functions go, everything else stays"""
+        FuncWrapper._registered = set()
+        func = FuncWrapper(rotation)
+        with TemporaryDirectory() as tmp, mock.patch.object(
+            get_code, "CACHE_DIR", Path(tmp)
+        ):
+            names = [
+                f"{func.cache_path.name}.h",
+                "rotation_0123456789abcdef.h",
+                "rotation_0123456789abcdef.json",
+                "velocity_0123456789abcdef.h",
+                "rotation_matrix_0123456789abcdef.h",
+                f"mylib_{FuncWrapper.library_key()}.so",
+                "mylib_0123456789abcdef.so",
+            ]
+            for name in names:
+                (Path(tmp) / name).touch()
+            removed = FuncWrapper.prune_cache()
+            self.assertEqual(sorted(path.name for path in removed), names[1:3])
+            removed = FuncWrapper.prune_cache(library=True)
+            self.assertEqual([path.name for path in removed], names[-1:])
+            self.assertEqual(
+                sorted(path.name for path in Path(tmp).iterdir()),
+                sorted(names[:1] + names[3:-1]),
+            )
+
+    def test_op_counts(self) -> None:
+        func = FuncWrapper(rotation)
+        tree, unique = func.expression_op_counts()
+        self.assertGreaterEqual(tree, unique)
+        self.assertGreater(func.op_count, 0)
+        self.assertIn("rotation", FuncWrapper.ops_report())
+
+    def test_bindings(self) -> None:
+        func = FuncWrapper(rotation)
+        self.assertEqual(
+            func.cpp_input_string(),
+            "const Buffer<Scalar>& pose, Buffer<Scalar>& output",
+        )
+        self.assertEqual(
+            func.cpp_call_string(),
+            "as_input<Eigen::Matrix<Scalar, 10, 1>>(pose), "
+            "as_output<Eigen::Matrix<Scalar, 9, 1>>(output)",
+        )
+        self.assertEqual(
+            func.cpp_args_string(), 'py::arg("pose"), py::arg("output").noconvert()'
+        )
+
+    def test_batch_bindings(self) -> None:
+        func = FuncWrapper(preintegrate)
+        inputs, outputs = func.cpp_batch_signatures()
+        self.assertEqual(inputs["dt"], "Eigen::Matrix<Scalar, 1, 1>")
+        self.assertEqual(outputs["cov"], "Eigen::Matrix<Scalar, 45, 1>")
+        self.assertEqual(
+            func.cpp_batch_call_string(),
+            "imu_noise_[i], preint_prev_[i], z_imu_est_[i], dt_[i](0, 0), "
+            "&upsilon_[i], &cov_[i]",
+        )
+        self.assertTrue(func.cpp_batch_input_string().endswith("bool parallel"))
+
+        buffers = func.batch_output_buffers(4)
+        self.assertEqual(buffers["upsilon"].shape, (4, 10))
+        self.assertEqual(buffers["cov"].shape, (4, 45))
+
+        buffers = FuncWrapper(skew).batch_output_buffers(4)
+        self.assertEqual(buffers["mat"].shape, (4, 3, 3))
+        self.assertEqual(buffers["mat"].strides, (72, 8, 24))
+
+    def test_scan_bindings(self) -> None:
+        func = FuncWrapper(preintegrate, carry="preint_prev")
+        self.assertIn("const Buffer<Scalar>& preint_prev", func.cpp_scan_input_string())
+        self.assertEqual(
+            func.cpp_scan_call_string(),
+            "imu_noise_[i], carry, z_imu_est_[i], dt_[i](0, 0), "
+            "reinterpret_cast<Eigen::Matrix<Scalar, 10, 1>*>(next.data() + 0), "
+            "reinterpret_cast<Eigen::Matrix<Scalar, 45, 1>*>(next.data() + 10)",
+        )
+        with self.assertRaises(ValueError):
+            FuncWrapper(preintegrate, carry="imu_noise").cpp_scan_call_string()
+
+    def test_buffers(self) -> None:
+        func = FuncWrapper(preintegrate)
+        buffers = func.output_buffers()
+        self.assertEqual(buffers["upsilon"].shape, (10,))
+        self.assertEqual(buffers["cov"].shape, (45,))
+        self.assertTrue(FuncWrapper(skew).output_buffers()["mat"].flags.f_contiguous)
+        self.assertEqual(FuncWrapper(speed).output_buffers()["output"].shape, ())
+        self.assertEqual(
+            FuncWrapper(speed).batch_output_buffers(4)["output"].shape, (4,)
+        )
+        self.assertEqual(
+            FuncWrapper(skew).batch_output_buffers(4)["mat"].shape, (4, 3, 3)
+        )
+
+        pose = Pose23_SE23.identity()
+        array = np.zeros(10)
+        inputs = FuncWrapper.to_cpp_inputs(dict(a=pose, b=array, c=0.1))
+        np.testing.assert_equal(inputs["a"], [0, 0, 0, 1, 0, 0, 0, 0, 0, 0])
+        self.assertIs(inputs["b"], array)
+        self.assertEqual(inputs["c"], 0.1)
+
+    def test_dtype(self) -> None:
+        pose = Pose23_SE23.identity()
+        single, double = np.zeros(10, np.float32), np.zeros(10)
+        self.assertEqual(FuncWrapper.kernel_dtype(dict(a=pose, b=0.1)), np.float64)
+        self.assertEqual(FuncWrapper.kernel_dtype(dict(a=pose, b=single)), np.float32)
+        self.assertEqual(FuncWrapper.kernel_dtype(dict(a=double, b=single)), np.float64)
+
+        inputs = FuncWrapper.to_cpp_inputs(dict(a=pose, b=single), np.float32)
+        self.assertEqual(inputs["a"].dtype, np.float32)
+        self.assertIs(inputs["b"], single)
+        inputs = FuncWrapper.to_cpp_inputs(dict(b=single), np.float64)
+        self.assertEqual(inputs["b"].dtype, np.float64)
+
+        func = FuncWrapper(preintegrate)
+        self.assertEqual(func.output_buffers(np.float32)["cov"].dtype, np.float32)
+        n, batch = func.to_cpp_batch_inputs(dict(dt=0.1), dtype=np.float32)
+        self.assertEqual(batch["dt"].dtype, np.float32)
+
+    def test_numeric_state(self) -> None:
+        """NumericStates go to C++ as their buffer, outputs as views into it"""
+        state = FuncWrapper(skew).output_state()
+        views = FuncWrapper(skew).output_views(state)
+        self.assertTrue(views["mat"].flags.f_contiguous)
+        self.assertTrue(np.shares_memory(views["mat"], state.buffer))
+        self.assertEqual(FuncWrapper(skew).output_state(4).mat.shape, (4, 3, 3))
+        with self.assertRaises(ValueError):
+            FuncWrapper(skew).output_views(state, np.float32)
+        with self.assertRaises(TypeError):
+            FuncWrapper(rotation).output_state()
+
+        inputs = FuncWrapper.to_cpp_inputs(dict(a=Skew(Matrix33.eye()).to_numeric()))
+        np.testing.assert_equal(inputs["a"], np.eye(3).ravel())
+
+        func = FuncWrapper(preintegrate)
+        state = func.output_state(4)
+        views = func.output_views(state)
+        self.assertEqual(views["cov"].shape, (4, 45))
+        self.assertEqual(views["cov"].strides, (55 * 8, 8))
+
+    def test_call_c(self) -> None:
+        """Both overloads of the compiled kernel against the python function"""
+        import_kernels(self)
+        imu_noise, preint, gyro, accl, dt = random_problem(3, seed=6)
+        func = FuncWrapper(preintegrate)
+        for i in range(3):
+            z_imu_est = ZImuEst(Vector3(gyro[i]), Vector3(accl[i]))
+            expected = preint_storage(preintegrate(imu_noise, preint, z_imu_est, dt[i]))
+            for dtype, rtol in ((np.float64, 1e-12), (np.float32, 1e-5)):
+                out = func.call_c(imu_noise, preint, z_imu_est, dt[i], dtype=dtype)
+                self.assertEqual(out["cov"].dtype, dtype)
+                np.testing.assert_allclose(
+                    np.concatenate([out["upsilon"], out["cov"]]),
+                    expected,
+                    rtol=rtol,
+                    atol=rtol,
+                )
+
+    def test_call_c_batch(self) -> None:
+        import_kernels(self)
+        imu_noise, _, gyro, accl, dt = random_problem(5, seed=7)
+        preints = [random_problem(1, seed=seed)[1] for seed in range(5)]
+        expected = np.stack(
+            [
+                preint_storage(
+                    preintegrate(
+                        imu_noise,
+                        preints[i],
+                        ZImuEst(Vector3(gyro[i]), Vector3(accl[i])),
+                        dt[i],
+                    )
+                )
+                for i in range(5)
+            ]
+        )
+        preints = np.stack([preint_storage(preint) for preint in preints])
+        func = FuncWrapper(preintegrate)
+        z_imu_est = np.hstack([gyro, accl])
+        noise = np.array(imu_noise.to_storage(), float)
+        for dtype, rtol in ((np.float64, 1e-12), (np.float32, 1e-5)):
+            for parallel in (True, False):
+                out = func.call_c_batch(
+                    *(a.astype(dtype) for a in (noise, preints, z_imu_est, dt)),
+                    parallel=parallel,
+                )
+                self.assertEqual(out["cov"].dtype, dtype)
+                np.testing.assert_allclose(
+                    np.hstack([out["upsilon"], out["cov"]]),
+                    expected,
+                    rtol=rtol,
+                    atol=rtol,
+                )
+
+    def test_call_c_scan(self) -> None:
+        """The fused loop against preintegrate applied sample by sample"""
+        import_kernels(self)
+        imu_noise, start, gyro, accl, dt = random_problem(20, seed=8)
+        preint, expected = start, []
+        for gyro_i, accl_i, dt_i in zip(gyro, accl, dt):
+            z_imu_est = ZImuEst(Vector3(gyro_i), Vector3(accl_i))
+            preint = preintegrate(imu_noise, preint, z_imu_est, dt_i)
+            expected.append(preint_storage(preint))
+        expected = np.stack(expected)
+
+        func = FuncWrapper(preintegrate, carry="preint_prev")
+        inputs = (
+            np.array(imu_noise.to_storage(), float),
+            preint_storage(start),
+            np.hstack([gyro, accl]),
+            dt,
+        )
+        for dtype, rtol in ((np.float64, 1e-12), (np.float32, 1e-4)):
+            states = np.empty((20, 55), dtype)
+            out = func.call_c_scan(*(a.astype(dtype) for a in inputs), states=states)
+            self.assertEqual(out.dtype, dtype)
+            np.testing.assert_allclose(out, expected[-1], rtol=rtol, atol=rtol)
+            np.testing.assert_allclose(states, expected, rtol=rtol, atol=rtol)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,105 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from symforce.test_util import TestCase
+
+from se23.batch_integration import preintegrate_batch
+from se23.imu_log import ImuLog, write_imu_log
+from helpers import random_problem
+
+EPS = 1e-12
+
+
+class ImuLogTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "imu.log"
+        rng = np.random.default_rng(13)
+        self.time = 100 + np.cumsum(rng.uniform(0.5e-3, 1.5e-3, 5000))
+        self.z_imu = rng.normal(size=(5000, 6))
+        write_imu_log(self.path, self.time, self.z_imu, stride=64, chunk=777)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_columns(self) -> None:
+        log = ImuLog(self.path)
+        self.assertEqual(len(log), 5000)
+        np.testing.assert_equal(log.time, self.time)
+        np.testing.assert_equal(log.z_imu, self.z_imu)
+        np.testing.assert_equal(log.dt[:-1], np.diff(self.time))
+        self.assertEqual(log.dt[-1], log.dt[-2])
+
+    def test_write(self) -> None:
+        """Invalid input leaves the existing log untouched, lists are accepted"""
+        time = self.time.copy()
+        time[3000] = time[2999]
+        for bad_time in (self.time[::-1], time):
+            with self.assertRaises(ValueError):
+                write_imu_log(self.path, bad_time, self.z_imu, chunk=777)
+        np.testing.assert_equal(ImuLog(self.path).time, self.time)
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+        write_imu_log(self.path, self.time[:10].tolist(), self.z_imu[:10].tolist())
+        np.testing.assert_equal(ImuLog(self.path).z_imu, self.z_imu[:10])
+
+    def test_search(self) -> None:
+        log = ImuLog(self.path)
+        t = np.random.default_rng(14).uniform(99, 107, 1000)
+        t = np.concatenate([t, self.time[::50], log.index])
+        np.testing.assert_equal(log.search(t), np.searchsorted(self.time, t))
+        self.assertEqual(log.search(self.time[1234]), 1234)
+
+    def test_intervals(self) -> None:
+        """Zero copy slices that partition the samples"""
+        log = ImuLog(self.path)
+        keyframe_times = np.linspace(self.time[0], self.time[-1] + 1e-3, 13)
+        intervals = list(log.intervals(keyframe_times))
+        self.assertEqual(len(intervals), 12)
+        np.testing.assert_equal(
+            np.concatenate([interval.time for interval in intervals]), self.time
+        )
+        for interval, t_start, t_stop in zip(
+            intervals, keyframe_times[:-1], keyframe_times[1:]
+        ):
+            self.assertTrue(
+                np.all((interval.time >= t_start) & (interval.time < t_stop))
+            )
+            self.assertTrue(np.shares_memory(interval.z_imu, log.z_imu))
+            self.assertTrue(interval.z_imu.flags.c_contiguous)
+
+        interval = log.interval(keyframe_times[2], keyframe_times[3])
+        np.testing.assert_equal(interval.z_imu, intervals[2].z_imu)
+
+    def test_preintegrate(self) -> None:
+        imu_noise, preint, _, _, _ = random_problem(1, seed=15)
+        log = ImuLog(self.path)
+        interval = log.interval(self.time[100], self.time[140])
+        result = preintegrate_batch(
+            imu_noise,
+            preint,
+            interval.z_imu[:, :3],
+            interval.z_imu[:, 3:],
+            interval.dt,
+            EPS,
+        )
+        expected = preintegrate_batch(
+            imu_noise,
+            preint,
+            self.z_imu[100:140, :3],
+            self.z_imu[100:140, 3:],
+            np.diff(self.time[100:141]),
+            EPS,
+        )
+        self.assertEqual(result.to_storage(), expected.to_storage())
+
+    def test_invalid(self) -> None:
+        self.path.write_bytes(b"not a log" * 10)
+        with self.assertRaises(ValueError):
+            ImuLog(self.path)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,54 @@
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from se23.integration import preintegrate, preintegrate_jac
+from states import ImuBias, ImuPreintJac, ZImuRaw
+from helpers import random_problem
+
+EPS = 1e-12
+
+
+def integrate(problem, bias: ImuBias) -> ImuPreintJac:
+    imu_noise, preint, gyro, accl, dt = problem
+    preint = ImuPreintJac.from_preint(preint)
+    for gyro_i, accl_i, dt_i in zip(gyro, accl, dt):
+        z_imu_est = ZImuRaw(Vector3(gyro_i), Vector3(accl_i)) - bias
+        preint = preintegrate_jac(imu_noise, preint, z_imu_est, float(dt_i))
+    return preint
+
+
+def bias_of(vec: np.ndarray) -> ImuBias:
+    return ImuBias(Vector3(vec[:3]), Vector3(vec[3:]))
+
+
+class IntegrationBiasTest(TestCase):
+    def test_matches_preintegrate(self) -> None:
+        problem = random_problem(10, seed=10)
+        imu_noise, preint, gyro, accl, dt = problem
+        result = integrate(problem, bias_of(np.zeros(6)))
+        for gyro_i, accl_i, dt_i in zip(gyro, accl, dt):
+            z_imu_est = ZImuRaw(Vector3(gyro_i), Vector3(accl_i)) - bias_of(np.zeros(6))
+            preint = preintegrate(imu_noise, preint, z_imu_est, float(dt_i))
+        self.assertEqual(result.to_preint().to_storage(), preint.to_storage())
+
+    def test_correct(self) -> None:
+        """The error of the correction is second order in the bias change"""
+        problem = random_problem(20, seed=11)
+        bias = np.random.default_rng(11).normal(scale=0.1, size=6)
+        preint = integrate(problem, bias_of(bias))
+        bias_delta = np.random.default_rng(12).normal(scale=1e-2, size=6)
+        errors = []
+        for scale in (1.0, 0.5):
+            expected = integrate(problem, bias_of(bias + scale * bias_delta))
+            corrected = preint.correct(bias_of(scale * bias_delta), EPS)
+            xi = corrected.upsilon.local_coordinates(expected.upsilon, EPS)
+            errors.append(np.linalg.norm(np.array(xi, float)))
+        uncorrected = preint.upsilon.local_coordinates(expected.upsilon, EPS)
+        self.assertLess(errors[1], np.linalg.norm(np.array(uncorrected, float)) / 100)
+        self.assertLess(errors[1], errors[0] / 3)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,64 @@
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from se23.integration import preintegrate, fourth_order_terms
+from se23.batch_integration import cov_to_numpy
+from se23.pose23_array import Pose23_SE23Array
+from states import Cov99, ZImuEst
+from helpers import random_problem
+
+EPS = 1e-12
+
+
+def random_cov(scales: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    L = rng.normal(size=(9, 9)) * scales[:, None]
+    return L @ L.T / 9
+
+
+class IntegrationFourthOrderTest(TestCase):
+    def test_order(self) -> None:
+        imu_noise, preint, gyro, accl, dt = random_problem(1, seed=4)
+        z_imu_est = ZImuEst(Vector3(gyro[0]), Vector3(accl[0]))
+        second = preintegrate(imu_noise, preint, z_imu_est, float(dt[0]))
+        fourth = preintegrate(imu_noise, preint, z_imu_est, float(dt[0]), order=4)
+        self.assertEqual(second.upsilon.to_storage(), fourth.upsilon.to_storage())
+        self.assertGreater(
+            np.abs(cov_to_numpy(fourth.cov) - cov_to_numpy(second.cov)).max(), 0
+        )
+        with self.assertRaises(ValueError):
+            preintegrate(imu_noise, preint, z_imu_est, float(dt[0]), order=3)
+
+    def test_vanish(self) -> None:
+        Sigma = Cov99(random_cov(np.ones(9), np.random.default_rng(5)).tolist())
+        zero = Cov99.diag([0.0] * 9)
+        for terms in (fourth_order_terms(Sigma, zero), fourth_order_terms(zero, Sigma)):
+            np.testing.assert_allclose(terms.to_numpy(), 0)
+
+    def test_monte_carlo(self) -> None:
+        """Covariance of xi = Log(Exp(a) * Exp(b)) with large covariances of a, b"""
+        rng = np.random.default_rng(6)
+        scales = np.array([0.3] * 3 + [1.0] * 6)
+        Sigma, Q = random_cov(scales, rng), random_cov(scales, rng)
+        samples = 200000
+        a = rng.multivariate_normal(np.zeros(9), Sigma, samples)
+        b = rng.multivariate_normal(np.zeros(9), Q, samples)
+        xi = (
+            Pose23_SE23Array.from_tangent(a, EPS)
+            .compose(Pose23_SE23Array.from_tangent(b, EPS))
+            .to_tangent(EPS)
+        )
+        expected = np.cov(xi.T)
+
+        second = Sigma + Q
+        terms = fourth_order_terms(Cov99(Sigma.tolist()), Cov99(Q.tolist()))
+        errors = [
+            np.linalg.norm(cov - expected) / np.linalg.norm(expected)
+            for cov in (second, second + terms.to_numpy())
+        ]
+        self.assertLess(errors[1], errors[0] / 2)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,36 @@
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from se23.integration import preintegrate_sqrt
+from se23.batch_integration import cov_to_numpy
+from states import ImuPreintSqrt, ZImuEst
+from helpers import random_problem, symbolic_loop
+
+
+class IntegrationSqrtTest(TestCase):
+    def test_matches_preintegrate(self) -> None:
+        imu_noise, preint, gyro, accl, dt = random_problem(15, seed=3)
+        expected = symbolic_loop(imu_noise, preint, gyro, accl, dt)
+
+        preint_sqrt = ImuPreintSqrt.from_preint(preint)
+        for gyro_i, accl_i, dt_i in zip(gyro, accl, dt):
+            z_imu_est = ZImuEst(Vector3(gyro_i), Vector3(accl_i))
+            preint_sqrt = preintegrate_sqrt(
+                imu_noise, preint_sqrt, z_imu_est, float(dt_i)
+            )
+        result = preint_sqrt.to_preint()
+
+        np.testing.assert_allclose(
+            np.array(result.upsilon.to_storage(), dtype=float),
+            np.array(expected.upsilon.to_storage(), dtype=float),
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            cov_to_numpy(result.cov), cov_to_numpy(expected.cov), rtol=1e-6, atol=1e-9
+        )
+
+
+if __name__ == "__main__":
+    TestCase.main()
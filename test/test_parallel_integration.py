@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from symforce.test_util import TestCase
+
+from se23.batch_integration import preintegrate_batch, cov_to_numpy
+from se23.parallel_integration import preintegrate_parallel
+from helpers import random_problem
+
+
+class ParallelIntegrationTest(TestCase):
+    def check(self, n: int, **kwargs) -> None:
+        problem = random_problem(n, seed=n)
+        expected = preintegrate_batch(*problem)
+        result = preintegrate_parallel(*problem, **kwargs)
+        np.testing.assert_allclose(
+            np.array(result.upsilon.to_storage(), dtype=float),
+            np.array(expected.upsilon.to_storage(), dtype=float),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            cov_to_numpy(result.cov), cov_to_numpy(expected.cov), rtol=1e-9
+        )
+
+    def test_inline(self) -> None:
+        for n in (1, 2, 3, 37):
+            self.check(n, max_workers=1)
+            self.check(n, max_workers=1, chunks=5)
+
+    def test_process_pool(self) -> None:
+        self.check(200, max_workers=2, chunks=7)
+
+    def test_executor(self) -> None:
+        with ThreadPoolExecutor(2) as executor:
+            self.check(50, chunks=3, executor=executor)
+            self.check(60, chunks=3, executor=executor)
+
+    def test_empty(self) -> None:
+        imu_noise, preint_prev, *_ = random_problem(1, seed=0)
+        empty = np.zeros((0, 3))
+        result = preintegrate_parallel(imu_noise, preint_prev, empty, empty, 0.01)
+        self.assertIs(result, preint_prev)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,145 @@
+import asyncio
+
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from se23.batch_integration import preintegrate_batch
+from se23.pipeline import (
+    ImuPipeline,
+    KeyframeTrigger,
+    LatencyHistogram,
+    SimulatedImu,
+    batch_scan,
+)
+from states import ImuBias, ImuNoise, ImuPreint
+
+EPS = 1e-12
+imu_noise = ImuNoise(Vector3(1e-3, 1e-3, 1e-3), Vector3(1e-2, 1e-2, 1e-2))
+
+
+def run(pipeline: ImuPipeline, consumer_delay: float = 0.0) -> list:
+    keyframes = []
+
+    async def consume():
+        async for keyframe in pipeline.keyframes():
+            keyframes.append(keyframe)
+            await asyncio.sleep(consumer_delay)
+
+    async def main():
+        await asyncio.gather(pipeline.run(), consume())
+
+    asyncio.run(main())
+    return keyframes
+
+
+class PipelineTest(TestCase):
+    def test_keyframes(self) -> None:
+        """Keyframes partition the stream and match preintegrate_batch"""
+        bias = np.array([1e-2, -2e-2, 3e-2, 0.1, -0.2, 0.3])
+        source = SimulatedImu(400, 1.0, chunk_period=7 / 400, realtime=False, seed=1)
+        pipeline = ImuPipeline(
+            source,
+            batch_scan(imu_noise, EPS),
+            ImuBias(Vector3(bias[:3]), Vector3(bias[3:])),
+            KeyframeTrigger(period=0.1, max_samples=30),
+            queue_size=2,
+        )
+        keyframes = run(pipeline)
+        time, z_imu = SimulatedImu(400, 1.0, seed=1).samples(0, 400)
+        self.assertEqual(sum(keyframe.samples for keyframe in keyframes), 399)
+        self.assertEqual(pipeline.samples, 399)
+        self.assertEqual(keyframes[0].t_start, time[0])
+        self.assertEqual(keyframes[-1].t_stop, time[-1])
+
+        start = 0
+        for keyframe, next_keyframe in zip(keyframes, keyframes[1:] + [None]):
+            self.assertLessEqual(keyframe.samples, 30)
+            self.assertLessEqual(keyframe.t_stop - keyframe.t_start, 0.1 + 1e-9)
+            if next_keyframe is not None:
+                self.assertEqual(keyframe.t_stop, next_keyframe.t_start)
+            stop = start + keyframe.samples
+            z_imu_est = z_imu[start:stop] - bias
+            expected = preintegrate_batch(
+                imu_noise,
+                ImuPreint.numeric()(ImuPipeline.identity()).to_state(),
+                z_imu_est[:, :3],
+                z_imu_est[:, 3:],
+                np.diff(time[start : stop + 1]),
+                EPS,
+            )
+            np.testing.assert_allclose(
+                keyframe.preint.buffer,
+                np.array(expected.to_storage(), float),
+                rtol=1e-12,
+                atol=1e-15,
+            )
+            start = stop
+
+    def test_backpressure(self) -> None:
+        """A slow consumer blocks the ingest, or drops chunks with drop=True"""
+        for drop in (False, True):
+            source = SimulatedImu(4000, 0.05, chunk_period=1e-3, realtime=False)
+            pipeline = ImuPipeline(
+                source,
+                batch_scan(imu_noise, EPS),
+                ImuBias(),
+                KeyframeTrigger(max_samples=4),
+                queue_size=1,
+                drop=drop,
+            )
+            keyframes = run(pipeline, consumer_delay=1e-3)
+            self.assertLessEqual(pipeline.max_depth, 1)
+            self.assertEqual(pipeline.samples + pipeline.dropped, 199)
+            self.assertEqual(pipeline.dropped > 0, drop)
+            self.assertEqual(pipeline.stalled > 0, not drop)
+            self.assertEqual(pipeline.latency["emit"].count, len(keyframes))
+            self.assertGreater(pipeline.latency["ingest"].count, 0)
+
+    def test_drop_gap(self) -> None:
+        """No dt spans the samples of dropped chunks"""
+        source = SimulatedImu(4000, 0.05, chunk_period=1e-3, realtime=False)
+        pipeline = ImuPipeline(
+            source,
+            batch_scan(imu_noise, EPS),
+            ImuBias(),
+            KeyframeTrigger(max_samples=8),
+            queue_size=1,
+            drop=True,
+        )
+        keyframes = run(pipeline, consumer_delay=1e-3)
+        self.assertGreater(pipeline.dropped, 0)
+        time, z_imu = SimulatedImu(4000, 0.05).samples(0, 200)
+        for keyframe in keyframes:
+            start = int(round(keyframe.t_start * 4000))
+            stop = start + keyframe.samples
+            self.assertAlmostEqual(keyframe.t_stop, time[stop])
+            expected = preintegrate_batch(
+                imu_noise,
+                ImuPreint.numeric()(ImuPipeline.identity()).to_state(),
+                z_imu[start:stop, :3],
+                z_imu[start:stop, 3:],
+                np.diff(time[start : stop + 1]),
+                EPS,
+            )
+            np.testing.assert_allclose(
+                keyframe.preint.buffer,
+                np.array(expected.to_storage(), float),
+                rtol=1e-12,
+                atol=1e-15,
+            )
+
+    def test_histogram(self) -> None:
+        histogram = LatencyHistogram(low=1e-6, high=1.0, bins_per_decade=10)
+        for latency in np.geomspace(1e-5, 1e-2, 1000):
+            histogram.record(latency)
+        self.assertEqual(histogram.count, 1000)
+        self.assertLess(abs(np.log10(histogram.quantile(0.5) / 3.2e-4)), 0.15)
+        self.assertEqual(histogram.quantile(1.0), histogram.max)
+        histogram.record(100.0)
+        self.assertEqual(histogram.counts[-1], 1)
+
+
+if __name__ == "__main__":
+    TestCase.main()
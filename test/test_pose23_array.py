@@ -0,0 +1,105 @@
+import numpy as np
+
+from symforce import typing as T
+from symforce.geo import Rot3
+from symforce.test_util import TestCase
+
+from se23.pose23 import Pose23
+from se23.pose23_SE23 import Pose23_SE23
+from se23.pose23_array import Pose23Array, Pose23_SE23Array
+
+
+def to_numpy(values) -> np.ndarray:
+    if hasattr(values, "to_numpy"):
+        return np.array(values.to_numpy(), dtype=float)
+    return np.array(values, dtype=float)
+
+
+class Pose23ArrayTest(TestCase):
+    def check(self, cls: type, n: int = 8) -> None:
+        rng = np.random.default_rng(0)
+        a_sym = [
+            cls.SYMBOLIC.from_tangent(rng.normal(size=9).tolist()) for _ in range(n)
+        ]
+        b_sym = [
+            cls.SYMBOLIC.from_tangent(rng.normal(size=9).tolist()) for _ in range(n)
+        ]
+        a, b = cls.from_poses(a_sym), cls.from_poses(b_sym)
+
+        def assert_rows(result: np.ndarray, expected: T.List) -> None:
+            np.testing.assert_allclose(
+                result, np.stack([to_numpy(e) for e in expected]), atol=1e-10
+            )
+
+        assert_rows(a.to_storage(), [p.to_storage() for p in a_sym])
+        self.assertEqual(a.to_poses()[0].to_storage(), a_sym[0].to_storage())
+        assert_rows(
+            a.compose(b).to_storage(),
+            [p.compose(q).to_storage() for p, q in zip(a_sym, b_sym)],
+        )
+        assert_rows(a.inverse().to_storage(), [p.inverse().to_storage() for p in a_sym])
+        assert_rows(a.adjoint(), [p.adjoint() for p in a_sym])
+        assert_rows(a.to_homogenous_matrix(), [p.to_homogenous_matrix() for p in a_sym])
+        assert_rows(a.to_tangent(), [p.to_tangent() for p in a_sym])
+
+        vecs = rng.normal(size=(n, 9))
+        assert_rows(
+            cls.from_tangent(vecs).to_storage(),
+            [cls.SYMBOLIC.from_tangent(vec.tolist()).to_storage() for vec in vecs],
+        )
+        assert_rows(
+            a.retract(vecs).to_storage(),
+            [p.retract(vec.tolist()).to_storage() for p, vec in zip(a_sym, vecs)],
+        )
+        assert_rows(
+            a.local_coordinates(b),
+            [p.local_coordinates(q) for p, q in zip(a_sym, b_sym)],
+        )
+
+        # a single pose broadcasts over the others
+        assert_rows(
+            a[:1].compose(b).to_storage(),
+            [a_sym[0].compose(q).to_storage() for q in b_sym],
+        )
+
+    def test_pose23(self) -> None:
+        self.check(Pose23Array)
+
+    def test_pose23_SE23(self) -> None:
+        self.check(Pose23_SE23Array)
+
+    def test_exp_log(self) -> None:
+        vecs = np.random.default_rng(1).normal(size=(100, 9))
+        vecs[:, :3] *= np.pi / 2 / np.linalg.norm(vecs[:, :3], axis=1, keepdims=True)
+        poses = Pose23_SE23Array.from_tangent(vecs)
+        np.testing.assert_allclose(poses.to_tangent(), vecs, atol=1e-6)
+        identity = Pose23_SE23Array.identity(3)
+        np.testing.assert_allclose(
+            identity.compose(identity.inverse()).to_storage(), identity.to_storage()
+        )
+
+    def test_exp_small_angle(self) -> None:
+        """from_tangent stays accurate where the closed forms cancel"""
+        vec = np.array([0.48, 0.6, 0.64, 1.0, -2.0, 0.5, 0.3, 0.2, -0.1])
+        vecs = np.stack([vec, vec])
+        vecs[:, :3] *= np.array([[1e-8], [1e-4]])
+        poses = Pose23_SE23Array.from_tangent(vecs, epsilon=0.0)
+        for vec, v, t in zip(vecs, poses.v, poses.t):
+            phi_hat = to_numpy(Rot3.hat(vec[:3].tolist()))
+            theta_sq = np.sum(vec[:3] ** 2)
+            a, b = 1 / 2 - theta_sq / 24, 1 / 6 - theta_sq / 120
+            V = np.eye(3) + a * phi_hat + b * phi_hat @ phi_hat
+            np.testing.assert_allclose(v, V @ vec[3:6], rtol=1e-15)
+            np.testing.assert_allclose(t, V @ vec[6:9], rtol=1e-15)
+        np.testing.assert_allclose(
+            poses.to_storage(),
+            [
+                to_numpy(Pose23_SE23.from_tangent(vec.tolist(), 0.0).to_storage())
+                for vec in vecs
+            ],
+            rtol=1e-15,
+        )
+
+
+if __name__ == "__main__":
+    TestCase.main()
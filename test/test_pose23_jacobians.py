@@ -0,0 +1,161 @@
+import importlib
+
+import mpmath
+import numpy as np
+
+import symforce.symbolic as sf
+from symforce.geo import Rot3, Vector3
+from symforce.test_util import TestCase
+
+from se23 import batch_integration
+from se23.pose23_SE23 import SMALL_ANGLE, SE23_Q, SO3_ljac, SO3_ljac_inv, Pose23_SE23
+from se23.pose23_array import Pose23_SE23Array
+from helpers import import_kernels
+
+# the epsilon of Rot3.to_tangent scales small rotations by 1 + epsilon / 3,
+# finite differences are taken with a smaller one
+EPS = 1e-12
+STEP = 1e-5
+
+
+def numerical(f, x: Pose23_SE23Array) -> np.ndarray:
+    """Derivative of the tangent valued f(x) wrt right perturbations of x"""
+    return np.stack(
+        [
+            (f(x.retract(STEP * e, EPS)) - f(x.retract(-STEP * e, EPS))) / (2 * STEP)
+            for e in np.eye(9)
+        ],
+        axis=1,
+    )
+
+
+def numerical_vec(f, vec: np.ndarray) -> np.ndarray:
+    return np.stack(
+        [(f(vec + STEP * e) - f(vec - STEP * e)) / (2 * STEP) for e in np.eye(9)],
+        axis=1,
+    )
+
+
+def to_numpy(mat) -> np.ndarray:
+    return np.array(mat.to_numpy(), dtype=float)
+
+
+class Pose23JacobiansTest(TestCase):
+    def check(self, rotation_scale: float) -> None:
+        rng = np.random.default_rng(int(rotation_scale * 100))
+        vec_a, vec_b = rng.normal(size=(2, 9))
+        vec_a[:3] *= rotation_scale
+        vec_b[:3] *= rotation_scale
+        a, b = Pose23_SE23Array.from_tangent(vec_a), Pose23_SE23Array.from_tangent(
+            vec_b
+        )
+        (a_sym,), (b_sym,) = a.to_poses(), b.to_poses()
+
+        def assert_near(result, expected):
+            np.testing.assert_allclose(to_numpy(result), expected, atol=1e-6)
+
+        D_a, D_b = a_sym.compose_jacobians(b_sym)
+        ab = a.compose(b)
+        assert_near(
+            D_a, numerical(lambda x: ab.local_coordinates(x.compose(b), EPS)[0], a)
+        )
+        assert_near(
+            D_b, numerical(lambda x: ab.local_coordinates(a.compose(x), EPS)[0], b)
+        )
+
+        a_inv = a.inverse()
+        assert_near(
+            a_sym.inverse_jacobian(),
+            numerical(lambda x: a_inv.local_coordinates(x.inverse(), EPS)[0], a),
+        )
+
+        exp_b = Pose23_SE23Array.from_tangent(vec_b, EPS)
+        assert_near(
+            Pose23_SE23.from_tangent_jacobian(vec_b.tolist()),
+            numerical_vec(
+                lambda v: exp_b.local_coordinates(
+                    Pose23_SE23Array.from_tangent(v, EPS), EPS
+                )[0],
+                vec_b,
+            ),
+        )
+        assert_near(
+            a_sym.to_tangent_jacobian(), numerical(lambda x: x.to_tangent(EPS)[0], a)
+        )
+
+        D_a, D_vec = a_sym.retract_jacobians(vec_b.tolist())
+        r = a.retract(vec_b, EPS)
+        assert_near(
+            D_a,
+            numerical(lambda x: r.local_coordinates(x.retract(vec_b, EPS), EPS)[0], a),
+        )
+        assert_near(
+            D_vec,
+            numerical_vec(
+                lambda v: r.local_coordinates(a.retract(v, EPS), EPS)[0], vec_b
+            ),
+        )
+
+        D_a, D_b = a_sym.local_coordinates_jacobians(b_sym)
+        assert_near(D_a, numerical(lambda x: x.local_coordinates(b, EPS)[0], a))
+        assert_near(D_b, numerical(lambda x: a.local_coordinates(x, EPS)[0], b))
+
+    def test_jacobians(self) -> None:
+        self.check(1.0)
+
+    def test_jacobians_small_angle(self) -> None:
+        self.check(1e-3)
+
+    def test_jacobians_zero_angle(self) -> None:
+        self.check(0.0)
+
+    def test_small_angle_continuous(self) -> None:
+        direction = np.array([0.48, 0.6, 0.64])
+        rho = Vector3(1.0, -2.0, 0.5)
+        below, above = (
+            to_numpy(SE23_Q(Vector3(direction * theta), rho))
+            for theta in (SMALL_ANGLE * (1 - 1e-9), SMALL_ANGLE * (1 + 1e-9))
+        )
+        np.testing.assert_allclose(below, above, atol=1e-12)
+
+    def test_zero_angle_without_epsilon(self) -> None:
+        """The blend stays finite where the closed forms divide by zero"""
+        zero, rho = Vector3.zero(), Vector3(1.0, -2.0, 0.5)
+        np.testing.assert_allclose(to_numpy(SO3_ljac(zero, 0)), np.eye(3))
+        np.testing.assert_allclose(to_numpy(SO3_ljac_inv(zero, 0)), np.eye(3))
+        np.testing.assert_allclose(
+            to_numpy(SE23_Q(zero, rho, 0)), to_numpy(Rot3.hat(rho)) / 2
+        )
+
+    def test_ljac_inv_small_angle(self) -> None:
+        direction = np.array([0.48, 0.6, 0.64])
+        for theta in (1e-8, 1e-4, SMALL_ANGLE * (1 - 1e-9), SMALL_ANGLE * 1.1, 1.0):
+            phi = direction * theta
+            expected = to_numpy(SO3_ljac_inv(Vector3(phi), EPS))
+            ljac = to_numpy(SO3_ljac(Vector3(phi), EPS))
+            np.testing.assert_allclose(expected @ ljac, np.eye(3), atol=1e-13)
+            np.testing.assert_allclose(
+                batch_integration.SO3_ljac_inv(phi, EPS), expected, atol=1e-14
+            )
+
+    def test_ljac_inv_kernel(self) -> None:
+        """The coefficient of SO3_ljac_inv in the compiled kernels against the
+        exact form near 0 and on both sides of SMALL_ANGLE"""
+        import_kernels(self)
+        se23_testing = importlib.import_module("se23_testing")
+        func = se23_testing.so3_ljac_inv_coefficient
+        direction = np.array([0.48, 0.6, 0.64])
+        thetas = [0.0, 1e-8, 1e-4, SMALL_ANGLE * (1 - 1e-9), SMALL_ANGLE * 1.1]
+        phis = np.outer(thetas, direction)
+        coefficients = func.call_c_batch(phis)["output"]
+        self.assertEqual(coefficients.shape, (5,))
+        self.assertEqual(func.call_c(phis[2])["output"], coefficients[2])
+        for theta, c in zip(thetas, coefficients):
+            with mpmath.workdps(50):
+                theta = mpmath.sqrt(mpmath.mpf(theta) ** 2 + float(sf.epsilon()) ** 2)
+                expected = float((1 - theta / 2 * mpmath.cot(theta / 2)) / theta**2)
+            self.assertAlmostEqual(c / expected, 1, delta=1e-12)
+
+
+if __name__ == "__main__":
+    TestCase.main()
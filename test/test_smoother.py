@@ -0,0 +1,127 @@
+import numpy as np
+
+from symforce.geo import Vector3
+from symforce.test_util import TestCase
+
+from se23.batch_integration import preintegrate_batch
+from se23.pose23_SE23 import Pose23_SE23
+from se23.pose23_array import Pose23_SE23Array
+from se23.smoother import (
+    FixedLagSmoother,
+    imu_factors,
+    position_factors,
+    predict,
+)
+from states import Cov99, ImuNoise, ImuPreint
+
+EPS = 1e-12
+GRAVITY = np.array([0, 0, -9.81])
+PERIOD = 0.1
+imu_noise = ImuNoise(Vector3(1e-4, 1e-4, 1e-4), Vector3(1e-3, 1e-3, 1e-3))
+zero = ImuPreint(Pose23_SE23.identity(), Cov99.diag([0.0] * 9))
+
+
+def simulate(n: int, rate: int = 100, seed: int = 0):
+    """Keyframes PERIOD apart, the true poses, noisy preintegrations and noisy
+    positions"""
+    rng = np.random.default_rng(seed)
+    std = np.sqrt(np.array(imu_noise.to_storage(), dtype=float) * rate)
+    truth, preints, positions = [Pose23_SE23Array.identity()], [], []
+    for k in range(n):
+        time = (k * PERIOD * rate + np.arange(PERIOD * rate)) / rate
+        gyro = np.stack([np.sin(time + f) for f in (0, 1, 2)], 1) * 0.5
+        accl = np.stack([np.cos(time + f) for f in (0, 1, 2)], 1) + [0, 0, 9.81]
+        exact = preintegrate_batch(imu_noise, zero, gyro, accl, 1 / rate, EPS)
+        upsilon = Pose23_SE23Array.from_storage(exact.upsilon.to_storage())
+        truth.append(predict(truth[-1], upsilon, PERIOD, GRAVITY))
+        gyro = gyro + std[:3] * rng.normal(size=gyro.shape)
+        accl = accl + std[3:] * rng.normal(size=accl.shape)
+        preints.append(preintegrate_batch(imu_noise, zero, gyro, accl, 1 / rate, EPS))
+        positions.append(truth[-1].t[0] + rng.normal(scale=0.1, size=3))
+    return truth, preints, positions
+
+
+def run(n: int, **kwargs) -> FixedLagSmoother:
+    truth, preints, positions = simulate(n)
+    smoother = FixedLagSmoother(
+        truth[0], np.eye(9) * 1e-2, gravity=GRAVITY, epsilon=EPS, **kwargs
+    )
+    for preint, position in zip(preints, positions):
+        smoother.add_keyframe(preint, PERIOD, position, np.eye(3) * 1e-2)
+    return smoother
+
+
+def numeric_jacobian(func, pose: Pose23_SE23Array, h: float = 1e-6) -> np.ndarray:
+    columns = []
+    for d in np.eye(9) * h:
+        plus, minus = func(pose.retract(d, EPS)), func(pose.retract(-d, EPS))
+        columns.append((plus - minus)[0] / (2 * h))
+    return np.stack(columns, axis=1)
+
+
+class SmootherTest(TestCase):
+    def test_factor_jacobians(self) -> None:
+        rng = np.random.default_rng(24)
+        nom_i, nom_j, upsilon = (
+            Pose23_SE23Array.from_tangent(rng.normal(scale=scale, size=9), EPS)
+            for scale in (1.0, 1.0, 0.3)
+        )
+        dt = np.array([0.2])
+        _, jac_i, jac_j = imu_factors(nom_i, nom_j, upsilon, dt, GRAVITY, EPS)
+        residual_i = lambda x: imu_factors(x, nom_j, upsilon, dt, GRAVITY, EPS)[0]
+        residual_j = lambda x: imu_factors(nom_i, x, upsilon, dt, GRAVITY, EPS)[0]
+        np.testing.assert_allclose(
+            jac_i[0], numeric_jacobian(residual_i, nom_i), atol=1e-8
+        )
+        np.testing.assert_allclose(
+            jac_j[0], numeric_jacobian(residual_j, nom_j), atol=1e-8
+        )
+
+        z = rng.normal(size=(1, 3))
+        _, jac = position_factors(nom_i, z)
+        residual = lambda x: position_factors(x, z)[0]
+        np.testing.assert_allclose(jac[0], numeric_jacobian(residual, nom_i), atol=1e-8)
+
+    def test_predict(self) -> None:
+        """Predicting over a whole preintegration equals predicting sample by
+        sample"""
+        rng = np.random.default_rng(25)
+        gyro, accl = rng.normal(size=(10, 3)), rng.normal(scale=3.0, size=(10, 3))
+        nom = Pose23_SE23Array.from_tangent(rng.normal(size=9), EPS)
+        expected = nom
+        for gyro_i, accl_i in zip(gyro, accl):
+            delta = preintegrate_batch(imu_noise, zero, gyro_i, accl_i, 0.01, EPS)
+            upsilon = Pose23_SE23Array.from_storage(delta.upsilon.to_storage())
+            expected = predict(expected, upsilon, 0.01, GRAVITY)
+        preint = preintegrate_batch(imu_noise, zero, gyro, accl, 0.01, EPS)
+        upsilon = Pose23_SE23Array.from_storage(preint.upsilon.to_storage())
+        result = predict(nom, upsilon, 0.1, GRAVITY)
+        np.testing.assert_allclose(
+            result.to_storage(), expected.to_storage(), atol=1e-12
+        )
+
+    def test_marginalize(self) -> None:
+        """The prior keeps the optimum of the remaining keyframes, and a short
+        window stays close to the full smoother"""
+        smoother = run(6, lag=10, threshold=0.0)
+        expected = smoother.estimate[1:]
+        smoother.marginalize()
+        self.assertEqual(smoother.optimize(), 1)
+        xi = expected.local_coordinates(smoother.estimate, EPS)
+        np.testing.assert_allclose(xi, 0, atol=1e-9)
+
+        full, window = run(12, lag=20, threshold=0.0), run(12, lag=5, threshold=0.0)
+        self.assertEqual(len(window), 5)
+        xi = full.estimate[-5:].local_coordinates(window.estimate, EPS)
+        np.testing.assert_allclose(xi, 0, atol=2e-3)
+
+    def test_relinearization(self) -> None:
+        """A threshold evaluates fewer factors for nearly the same estimate"""
+        exact, incremental = (run(12, lag=5, threshold=t) for t in (0.0, 1e-2))
+        self.assertLess(incremental.evaluated, exact.evaluated / 2)
+        xi = exact.estimate.local_coordinates(incremental.estimate, EPS)
+        np.testing.assert_allclose(xi, 0, atol=2e-3)
+
+
+if __name__ == "__main__":
+    TestCase.main()
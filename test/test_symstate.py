@@ -0,0 +1,73 @@
+import numpy as np
+
+from symforce.geo import Matrix93
+from symforce.test_util import TestCase
+
+from states import ImuPreint, ImuPreintJac, Cov99
+
+
+class SymStateTest(TestCase):
+    def test_attributes(self) -> None:
+        preint = ImuPreint.symbolic("preint")
+        self.assertIs(preint.upsilon, preint["upsilon"])
+        preint.cov = Cov99.diag([1.0] * 9)
+        self.assertIs(preint["cov"], preint.cov)
+        self.assertEqual(list(preint.keys()), ["upsilon", "cov"])
+        with self.assertRaises(AttributeError):
+            preint.bias  # pylint: disable=pointless-statement
+
+    def test_numeric_layout(self) -> None:
+        """The buffer is the storage of the state"""
+        dim = ImuPreintJac.numeric_dim()
+        state = ImuPreintJac.numeric()(np.arange(dim, dtype=np.float64)).to_state()
+        np.testing.assert_equal(np.array(state.to_storage(), float), np.arange(dim))
+        numeric = state.to_numeric()
+        np.testing.assert_equal(numeric.buffer, np.arange(dim))
+        np.testing.assert_equal(numeric.cov, state.cov.to_storage())
+        np.testing.assert_equal(numeric.jac_gyro, state.jac_gyro.to_numpy())
+
+    def test_numeric_views(self) -> None:
+        NumericImuPreintJac = ImuPreintJac.numeric()
+        self.assertIs(NumericImuPreintJac, ImuPreintJac.numeric())
+        buffer = np.zeros(NumericImuPreintJac.DIM)
+        numeric = NumericImuPreintJac(buffer)
+        numeric.jac_accl[2, 1] = 1.0
+        numeric.cov = Cov99.diag([2.0] * 9)
+        self.assertEqual(buffer[ImuPreintJac.field_layout()["jac_accl"][0]][11], 1.0)
+        self.assertEqual(numeric.to_state().cov.to_numpy()[4, 4], 2.0)
+        numeric.jac_gyro = Matrix93(np.ones((9, 3)).tolist())
+        np.testing.assert_equal(numeric.jac_gyro, 1.0)
+        self.assertFalse(hasattr(numeric, "__dict__"))
+        with self.assertRaises(ValueError):
+            NumericImuPreintJac(np.zeros(3))
+
+    def test_numeric_batch(self) -> None:
+        buffer = np.arange(4 * ImuPreintJac.numeric_dim(), dtype=np.float64)
+        batch = ImuPreintJac.numeric()(buffer.reshape(4, -1))
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.jac_gyro.shape, (4, 9, 3))
+        self.assertEqual(batch.cov.shape, (4, 45))
+        np.testing.assert_equal(batch.jac_gyro[2], batch[2].jac_gyro)
+        batch.cov[1] = 0.0
+        self.assertEqual(batch[1].to_state().cov.to_numpy().max(), 0.0)
+        with self.assertRaises(ValueError):
+            batch.to_state()
+
+        item = batch[3]
+        copy = type(item).from_bytes(item.to_bytes())
+        np.testing.assert_equal(copy.buffer, item.buffer)
+        self.assertFalse(np.shares_memory(copy.buffer, buffer))
+        self.assertTrue(np.shares_memory(item.buffer, buffer))
+
+        copy = type(batch).from_bytes(batch[2:5].to_bytes(), batch=True)
+        np.testing.assert_equal(copy.buffer, batch.buffer[2:5])
+        copy = type(batch).from_bytes(batch[2:3].to_bytes(), batch=True)
+        self.assertEqual(copy.buffer.shape, (1, item.DIM))
+        copy = type(batch).from_bytes(batch[2:2].to_bytes(), batch=True)
+        self.assertEqual(copy.buffer.shape, (0, item.DIM))
+        with self.assertRaises(ValueError):
+            type(batch).from_bytes(batch[2:4].to_bytes())
+
+
+if __name__ == "__main__":
+    TestCase.main()